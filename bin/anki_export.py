@@ -0,0 +1,439 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass, field
+import argparse
+import csv
+import hashlib
+import html
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import typing
+import zipfile
+
+import common
+import data_files
+import regenerate_index
+import taxonomy
+import thumbnail_store
+
+OUTPUT_DIR = 'anki'
+DECK_NAME = 'Phylogeny'
+TSV_FILENAME = 'phylogeny.tsv'
+APKG_FILENAME = 'phylogeny.apkg'
+
+# Rows are inserted with `executemany` in batches of this size, each in its own transaction.
+_BATCH_SIZE = 5000
+
+# Fixed IDs so a re-import updates the note type and decks rather than adding new ones.
+_MODEL_ID = 1607392319
+_FIELD_SEPARATOR = '\x1f'
+
+_CSS = """.card {
+  font-family: arial;
+  font-size: 20px;
+  text-align: center;
+  color: black;
+  background-color: white;
+}
+.cloze {
+  font-weight: bold;
+  color: blue;
+}
+img {
+  max-height: 120px;
+}
+"""
+
+# The legacy collection schema, which every version of Anki can import.
+_SCHEMA = """
+CREATE TABLE col (
+  id integer primary key, crt integer not null, mod integer not null, scm integer not null,
+  ver integer not null, dty integer not null, usn integer not null, ls integer not null,
+  conf text not null, models text not null, decks text not null, dconf text not null,
+  tags text not null
+);
+CREATE TABLE notes (
+  id integer primary key, guid text not null, mid integer not null, mod integer not null,
+  usn integer not null, tags text not null, flds text not null, sfld integer not null,
+  csum integer not null, flags integer not null, data text not null
+);
+CREATE TABLE cards (
+  id integer primary key, nid integer not null, did integer not null, ord integer not null,
+  mod integer not null, usn integer not null, type integer not null, queue integer not null,
+  due integer not null, ivl integer not null, factor integer not null, reps integer not null,
+  lapses integer not null, left integer not null, odue integer not null, odid integer not null,
+  flags integer not null, data text not null
+);
+CREATE TABLE revlog (
+  id integer primary key, cid integer not null, usn integer not null, ease integer not null,
+  ivl integer not null, lastIvl integer not null, factor integer not null, time integer not null,
+  type integer not null
+);
+CREATE TABLE graves (usn integer not null, oid integer not null, type integer not null);
+"""
+# Built once the rows are in, which is much faster than updating them on every insert.
+_INDEXES = """
+CREATE INDEX ix_notes_usn on notes (usn);
+CREATE INDEX ix_cards_usn on cards (usn);
+CREATE INDEX ix_revlog_usn on revlog (usn);
+CREATE INDEX ix_cards_nid on cards (nid);
+CREATE INDEX ix_cards_sched on cards (did, queue, due);
+CREATE INDEX ix_revlog_cid on revlog (cid);
+CREATE INDEX ix_notes_csum on notes (csum);
+"""
+
+
+@dataclass(kw_only=True)
+class ClozeNote:
+  guid: str
+  deck: str
+  # The parent of the siblings, which Anki sorts the notes by.
+  sort_field: str
+  text: str
+  extra: str
+  tags: list[str]
+  cloze_count: int
+  # Filenames in the thumbnails directory used by `extra`.
+  media: list[str] = field(default_factory=list)
+
+
+def _get_id(key: str) -> int:
+  # Stable across exports and small enough for the 53 bits JavaScript and Anki are happy with.
+  return int(hashlib.sha256(key.encode('utf8')).hexdigest()[:12], 16)
+
+
+def _get_media_name(served: str) -> str:
+  # Anki keeps every media file in one directory.
+  return served.replace('/', '_')
+
+
+def get_deck_names(model: taxonomy.Taxonomy) -> dict[str, str]:
+  # The decks nest in the same way as the trees on the site.
+  file_to_parent_file = regenerate_index.get_parent_files(model)
+  file_to_metadata = {file_metadata.file: file_metadata for file_metadata in data_files.DATA_LIST}
+
+  def get_deck_name(file: str) -> str:
+    names: list[str] = []
+    current: str | None = file
+    # The top level trees are decks of their own rather than nested in the overview.
+    while current in file_to_metadata and len(names) < len(file_to_metadata):
+      file_metadata = file_to_metadata[current]
+      names.append(file_metadata.taxa)
+      if file_metadata.level == 0:
+        break
+      current = file_to_parent_file.get(current)
+    return '::'.join([DECK_NAME] + names[::-1])
+
+  return {file: get_deck_name(file) for file in file_to_metadata}
+
+
+def _get_cloze(index: int, n: common.NodeRaw) -> str:
+  # The hint shows what to recall, which is the common name when there is one.
+  hint = next((common_name for common_name in (n.common or []) if common_name), n.rank)
+  # Cloze markers can not contain the separators Anki looks for.
+  name = html.escape(n.name).replace('::', ':')
+  hint = html.escape(str(hint)).replace('::', ':').replace('}}', '')
+  return f'{{{{c{index}::{name}::{hint}}}}}'
+
+
+def iter_notes(
+    model: taxonomy.Taxonomy, thumbnail_map: dict[str, str]
+) -> typing.Iterator[ClozeNote]:
+  deck_names = get_deck_names(model)
+
+  for file_metadata in data_files.DATA_LIST:
+    # One note for the children of each parent on each card, in the order of the data file.
+    sibling_groups: dict[tuple[int, str], list[common.NodeRaw]] = {}
+    for n in model.file_to_nodes.get(file_metadata.file, []):
+      if n.card is not None:
+        sibling_groups.setdefault((n.card, n.parent), []).append(n)
+
+    for ((card, parent), siblings) in sibling_groups.items():
+      lines = [f'<b>{html.escape(parent)}</b>']
+      extras = []
+      media = []
+      for (i, n) in enumerate(siblings):
+        lines.append(_get_cloze(i + 1, n))
+
+        extra = f'<b>{html.escape(n.name)}</b>'
+        if n.tag:
+          extra += f': {html.escape(n.tag)}'
+        images = n.image_list
+        if images:
+          served = thumbnail_map.get(images[0].local_filename, images[0].local_filename)
+          media.append(served)
+          extra += f'<br><img src="{html.escape(_get_media_name(served))}">'
+        extras.append(extra)
+
+      key = '\0'.join([file_metadata.file, str(card), parent])
+      yield ClozeNote(
+          guid=f'{_get_id(key):x}',
+          deck=deck_names[file_metadata.file],
+          sort_field=parent,
+          text='<br>'.join(lines),
+          extra='<br><br>'.join(extras),
+          tags=[DECK_NAME.lower(), file_metadata.domain or 'overview', f'card_{card}'],
+          cloze_count=len(siblings),
+          media=media,
+      )
+
+
+def write_tsv_rows(
+    notes: typing.Iterable[ClozeNote], tsv_file: typing.TextIO
+) -> typing.Iterator[ClozeNote]:
+  # Passes each note on once it is written so the notes are only built once for both outputs.
+  # The header lines tell Anki how to import the file without any questions.
+  tsv_file.write('#separator:tab\n#html:true\n#notetype:Cloze\n')
+  tsv_file.write('#guid column:1\n#deck column:2\n#tags column:5\n')
+  writer = csv.writer(tsv_file, delimiter='\t', lineterminator='\n')
+  for note in notes:
+    writer.writerow([note.guid, note.deck, note.text, note.extra, ' '.join(note.tags)])
+    yield note
+
+
+def _get_collection_json(deck_names: list[str], now: int) -> dict[str, str]:
+  field_json = {'sticky': False, 'rtl': False, 'font': 'Arial', 'size': 20, 'media': []}
+  models = {
+      str(_MODEL_ID): {
+          'id': _MODEL_ID,
+          'name': f'{DECK_NAME} Cloze',
+          'type': 1,
+          'mod': now,
+          'usn': -1,
+          'sortf': 0,
+          'did': 1,
+          'tmpls': [{
+              'name': 'Cloze',
+              'ord': 0,
+              'qfmt': '{{cloze:Text}}',
+              'afmt': '{{cloze:Text}}<br>\n{{Extra}}',
+              'did': None,
+              'bqfmt': '',
+              'bafmt': '',
+          }],
+          'flds': [
+              field_json | {'name': 'Text', 'ord': 0},
+              field_json | {'name': 'Extra', 'ord': 1},
+          ],
+          'css': _CSS,
+          'latexPre': '\\documentclass[12pt]{article}\n\\begin{document}\n',
+          'latexPost': '\\end{document}',
+          'latexsvg': False,
+          'req': [[0, 'any', [0]]],
+          'tags': [],
+          'vers': [],
+      }
+  }
+
+  def get_deck_json(deck_id: int, name: str) -> dict[str, typing.Any]:
+    return {
+        'id': deck_id,
+        'name': name,
+        'mod': now,
+        'usn': -1,
+        'desc': '',
+        'dyn': 0,
+        'conf': 1,
+        'collapsed': False,
+        'extendNew': 10,
+        'extendRev': 50,
+        'newToday': [0, 0],
+        'revToday': [0, 0],
+        'lrnToday': [0, 0],
+        'timeToday': [0, 0],
+    }
+
+  decks = {'1': get_deck_json(1, 'Default')}
+  for name in deck_names:
+    decks[str(_get_id(name))] = get_deck_json(_get_id(name), name)
+
+  dconf = {
+      '1': {
+          'id': 1,
+          'name': 'Default',
+          'mod': 0,
+          'usn': 0,
+          'maxTaken': 60,
+          'autoplay': True,
+          'timer': 0,
+          'replayq': True,
+          'new': {
+              'bury': True,
+              'delays': [1, 10],
+              'initialFactor': 2500,
+              'ints': [1, 4, 7],
+              'order': 1,
+              'perDay': 20,
+              'separate': True,
+          },
+          'lapse': {'delays': [10], 'leechAction': 0, 'leechFails': 8, 'minInt': 1, 'mult': 0},
+          'rev': {
+              'bury': True,
+              'ease4': 1.3,
+              'fuzz': 0.05,
+              'ivlFct': 1,
+              'maxIvl': 36500,
+              'minSpace': 1,
+              'perDay': 100,
+          },
+      }
+  }
+  conf = {
+      'activeDecks': [1],
+      'curDeck': 1,
+      'newSpread': 0,
+      'collapseTime': 1200,
+      'timeLim': 0,
+      'estTimes': True,
+      'dueCounts': True,
+      'curModel': str(_MODEL_ID),
+      'nextPos': 1,
+      'sortType': 'noteFld',
+      'sortBackwards': False,
+      'addToCur': True,
+  }
+  return {
+      'conf': json.dumps(conf),
+      'models': json.dumps(models),
+      'decks': json.dumps(decks),
+      'dconf': json.dumps(dconf),
+  }
+
+
+def _get_checksum(sort_field: str) -> int:
+  return int(hashlib.sha1(sort_field.encode('utf8')).hexdigest()[:8], 16)
+
+
+def write_collection(
+    notes: typing.Iterable[ClozeNote], path: str, deck_names: list[str]
+) -> tuple[int, int, set[str]]:
+  now = int(time.time())
+  connection = sqlite3.connect(path)
+  try:
+    # The file is only read once the export is complete, so there is nothing to protect mid-write.
+    connection.execute('PRAGMA journal_mode = OFF')
+    connection.execute('PRAGMA synchronous = OFF')
+    connection.executescript(_SCHEMA)
+    collection = _get_collection_json(deck_names, now)
+    connection.execute(
+        'INSERT INTO col VALUES (1, ?, ?, ?, 11, 0, 0, 0, ?, ?, ?, ?, ?)',
+        (
+            now, now * 1000, now * 1000, collection['conf'], collection['models'],
+            collection['decks'], collection['dconf'], '{}'
+        ),
+    )
+
+    note_rows: list[tuple[typing.Any, ...]] = []
+    card_rows: list[tuple[typing.Any, ...]] = []
+    (note_count, card_count) = (0, 0)
+    media: set[str] = set()
+
+    def flush() -> None:
+      with connection:
+        connection.executemany(
+            'INSERT INTO notes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', note_rows
+        )
+        connection.executemany(
+            'INSERT INTO cards VALUES (?, ?, ?, ?, ?, ?, 0, 0, ?, 0, 0, 0, 0, 0, 0, 0, 0, ?)',
+            card_rows,
+        )
+      note_rows.clear()
+      card_rows.clear()
+
+    for note in notes:
+      note_id = _get_id(note.guid)
+      deck_id = _get_id(note.deck)
+      note_rows.append((
+          note_id, note.guid, _MODEL_ID, now, -1, f' {" ".join(note.tags)} ',
+          note.text + _FIELD_SEPARATOR + note.extra, note.sort_field,
+          _get_checksum(note.sort_field), 0, ''
+      ))
+      for cloze_index in range(note.cloze_count):
+        card_rows.append((
+            _get_id(f'{note.guid}\0{cloze_index}'), note_id, deck_id, cloze_index, now, -1,
+            note_count, ''
+        ))
+      note_count += 1
+      card_count += note.cloze_count
+      media.update(note.media)
+
+      if len(card_rows) >= _BATCH_SIZE:
+        flush()
+    flush()
+    connection.executescript(_INDEXES)
+  finally:
+    connection.close()
+
+  return (note_count, card_count, media)
+
+
+def write_apkg(
+    notes: typing.Iterable[ClozeNote], path: str, deck_names: list[str], include_media: bool = True
+) -> tuple[int, int]:
+  with tempfile.TemporaryDirectory() as temp_dir:
+    collection_path = os.path.join(temp_dir, 'collection.anki2')
+    (note_count, card_count, media) = write_collection(notes, collection_path, deck_names)
+
+    temp_path = f'{path}.tmp'
+    # The fastest compression level since the collection is mostly unique text.
+    with zipfile.ZipFile(
+        temp_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1
+    ) as apkg:
+      apkg.write(collection_path, 'collection.anki2')
+
+      # Media files are stored by number with a JSON map back to their names.
+      media_map: dict[str, str] = {}
+      if include_media:
+        for served in sorted(media):
+          media_path = os.path.join(regenerate_index.THUMBNAIL_DIR, served)
+          if not os.path.isfile(media_path):
+            continue
+          # Images are already compressed.
+          apkg.write(media_path, str(len(media_map)), compress_type=zipfile.ZIP_STORED)
+          media_map[str(len(media_map))] = _get_media_name(served)
+      apkg.writestr('media', json.dumps(media_map))
+    os.replace(temp_path, path)
+
+  return (note_count, card_count)
+
+
+def main(
+    model: taxonomy.Taxonomy | None = None,
+    output_dir: str = OUTPUT_DIR,
+    include_media: bool = True,
+):
+
+  if model is None:
+    model = taxonomy.load()
+
+  thumbnail_map = thumbnail_store.read_thumbnail_map(regenerate_index.THUMBNAIL_DIR)
+  os.makedirs(output_dir, exist_ok=True)
+
+  tsv_path = os.path.join(output_dir, TSV_FILENAME)
+  apkg_path = os.path.join(output_dir, APKG_FILENAME)
+  deck_names = sorted({DECK_NAME} | set(get_deck_names(model).values()))
+  with open(tsv_path, 'w', encoding='utf8', newline='') as tsv_file:
+    notes = write_tsv_rows(iter_notes(model, thumbnail_map), tsv_file)
+    (note_count, card_count) = write_apkg(
+        notes, apkg_path, deck_names, include_media=include_media
+    )
+
+  print(f'Anki notes ({note_count}) written to: {tsv_path}')
+  print(f'Anki deck with {note_count} notes and {card_count} cards written to: {apkg_path}')
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Export cloze notes for each group of siblings on each card to Anki.'
+  )
+  parser.add_argument('--output-dir', default=OUTPUT_DIR)
+  parser.add_argument(
+      '--no-media',
+      action='store_true',
+      help='Leave the thumbnails out of the .apkg to keep it small.',
+  )
+  args = parser.parse_args()
+  main(output_dir=args.output_dir, include_media=not args.no_media)
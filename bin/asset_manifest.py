@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+import glob
+import hashlib
+import json
+import os
+
+import build_cache
+import profiler
+import regenerate_index
+import sprite_atlas
+import taxonomy
+import thumbnail_store
+
+ASSET_MANIFEST_FILENAME = 'asset_manifest.json'
+
+# The app files the service worker keeps up to date, along with the generated tree data.
+APP_ASSET_GLOBS = [
+    'manifest.json',
+    'cacher.js',
+    'favicon_tree_*.png',
+    regenerate_index.HTML_OUT_FILENAME,
+    os.path.join('js', '*.js'),
+    os.path.join('css', '*.css'),
+    os.path.join('screenshots', '*'),
+]
+_ICON_GLOB = os.path.join(regenerate_index.THUMBNAIL_DIR, 'icon_*')
+
+_HASH_LENGTH = 16
+
+
+def get_app_asset_paths() -> list[str]:
+  paths = [path for pattern in APP_ASSET_GLOBS for path in sorted(glob.glob(pattern))]
+  return paths + regenerate_index.get_chunk_paths()
+
+
+def get_thumbnail_paths(model: taxonomy.Taxonomy) -> list[str]:
+  thumbnail_map = thumbnail_store.read_thumbnail_map(regenerate_index.THUMBNAIL_DIR)
+  served = {thumbnail_map.get(img.local_filename, img.local_filename) for img in model.images}
+  paths = sorted(glob.glob(_ICON_GLOB))
+  for filename in sorted(served):
+    path = os.path.join(regenerate_index.THUMBNAIL_DIR, filename)
+    # Thumbnails that failed to download are fetched from the network as usual.
+    if os.path.isfile(path):
+      paths.append(path)
+  return paths + [path for path in sprite_atlas.get_atlas_paths() if os.path.isfile(path)]
+
+
+def _get_url_path(path: str) -> str:
+  # Relative to the site root, which the service worker prefixes with the scope when needed.
+  return '/' + path.replace(os.sep, '/')
+
+
+def build(model: taxonomy.Taxonomy, cache: build_cache.BuildCache | None = None) -> dict[str, object]:
+  # The build cache avoids re-reading unchanged files, which matters for the thumbnails.
+  if cache is None:
+    cache = build_cache.BuildCache()
+
+  def get_hashes(paths: list[str]) -> dict[str, str]:
+    hashes: dict[str, str] = {}
+    for path in paths:
+      digest = cache.file_hash(path)
+      if digest is None:
+        raise ValueError(f'Missing asset for the manifest: {path}')
+      hashes[_get_url_path(path)] = digest[:_HASH_LENGTH]
+    return hashes
+
+  assets = get_hashes(get_app_asset_paths())
+  # The site root serves the index.
+  assets['/'] = assets[_get_url_path(regenerate_index.HTML_OUT_FILENAME)]
+  thumbnails = get_hashes(get_thumbnail_paths(model))
+
+  version_hash = hashlib.sha256()
+  for entries in (assets, thumbnails):
+    for (url_path, digest) in sorted(entries.items()):
+      version_hash.update(f'{url_path}\0{digest}\0'.encode('utf8'))
+
+  return {
+      'version': version_hash.hexdigest()[:_HASH_LENGTH],
+      'assets': dict(sorted(assets.items())),
+      'thumbnails': thumbnails,
+  }
+
+
+def main(model: taxonomy.Taxonomy | None = None, cache: build_cache.BuildCache | None = None):
+
+  if model is None:
+    model = taxonomy.load()
+
+  manifest = build(model, cache)
+
+  temp_filename = f'{ASSET_MANIFEST_FILENAME}.tmp'
+  with open(temp_filename, 'w', encoding='utf8') as manifest_file:
+    json.dump(manifest, manifest_file, indent=2, ensure_ascii=False)
+  os.replace(temp_filename, ASSET_MANIFEST_FILENAME)
+  profiler.add_written(ASSET_MANIFEST_FILENAME)
+
+  print(
+      f'Asset manifest ({manifest["version"]}) built at: {ASSET_MANIFEST_FILENAME} with '
+      f'{len(manifest["assets"])} app assets and {len(manifest["thumbnails"])} thumbnails'
+  )
+
+
+if __name__ == '__main__':
+  main()
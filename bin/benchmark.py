@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+
+from dataclasses import asdict, dataclass
+import argparse
+import contextlib
+import datetime
+import gc
+import hashlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+import typing
+
+import asset_manifest
+import common
+import compiled_tree
+import data_files
+import regenerate_index
+import search_index
+import taxonomy
+import validate_inputs
+
+RESULTS_DIR = '.benchmarks'
+
+# Roughly the number of nodes in the data files today, so a scale of 10 is ten times the tree.
+_BASE_NODE_COUNT = 1000
+
+_SYLLABLES = [
+    'ae', 'an', 'ar', 'ba', 'ce', 'da', 'el', 'er', 'fo', 'ga', 'hy', 'id', 'ka', 'la', 'lo', 'ma',
+    'ne', 'no', 'or', 'pa', 'ph', 'ra', 'ro', 'sa', 'si', 'ta', 'th', 'to', 'ul', 'us', 've', 'yx'
+]
+_RANKS = ['Clade', 'Division', 'Class', 'Order', 'Family', 'Genus', 'Species']
+
+# A stage slower than this times the baseline is reported as a regression.
+_REGRESSION_RATIO = 1.25
+# Stages faster than this are mostly noise so they are not compared.
+_MIN_COMPARED_SECONDS = 0.05
+# Anything above linear (1.0) plus some noise is reported when comparing scales.
+_MAX_SCALING_EXPONENT = 1.3
+
+
+@dataclass(kw_only=True)
+class SyntheticConfig:
+  scale: int
+  # The levels of nodes in each data file and the children per node.
+  depth: int = 3
+  branching: int = 3
+  images: int = 2
+  seed: int = 0
+
+
+@dataclass(kw_only=True)
+class StageResult:
+  seconds: float
+  peak_kib: int
+
+
+def _get_word(n: int, rng: random.Random) -> str:
+  # Names are built from the digits of `n` so they are unique but still look like words.
+  syllables = [_SYLLABLES[rng.randrange(len(_SYLLABLES))]]
+  while True:
+    syllables.append(_SYLLABLES[n % len(_SYLLABLES)])
+    n //= len(_SYLLABLES)
+    if not n:
+      break
+  return ''.join(syllables)
+
+
+def _get_image_url(n: int) -> str:
+  filename = f'Synthetic_{n}.jpg'
+  digest = hashlib.md5(filename.encode('utf8')).hexdigest()
+  if n % 2:
+    return f'{common.IMG_PREFIX}thumb/{digest[0]}/{digest[:2]}/{filename}/250px-{filename}'
+  return f'{common.IMG_PREFIX}{digest[0]}/{digest[:2]}/{filename}'
+
+
+def generate(config: SyntheticConfig, data_dir: str) -> list[data_files.JsonDataFile]:
+  rng = random.Random(config.seed)
+  nodes_per_file = sum(config.branching**level for level in range(config.depth))
+  file_count = max(1, math.ceil(config.scale * _BASE_NODE_COUNT / nodes_per_file))
+
+  data_list: list[data_files.JsonDataFile] = []
+  # The leaves of each file, where the next files are attached.
+  file_leaves: list[list[str]] = []
+  node_count = 0
+  image_count = 0
+
+  os.makedirs(data_dir, exist_ok=True)
+  for file_index in range(file_count):
+    if file_index == 0:
+      (parent, level) = ('LUCA', 0)
+    else:
+      # The files form a tree too, with each one hanging off a leaf of an earlier file.
+      parent_index = (file_index - 1) // config.branching
+      parent = rng.choice(file_leaves[parent_index])
+      level = data_list[parent_index].level + 1
+
+    nodes: list[dict[str, typing.Any]] = []
+    current_level = [parent]
+    for depth in range(config.depth):
+      next_level: list[str] = []
+      for parent_name in current_level:
+        for _ in range(1 if depth == 0 else config.branching):
+          name = _get_word(node_count, rng).capitalize()
+          node_count += 1
+          imgs = [_get_image_url(image_count + i) for i in range(config.images)]
+          image_count += config.images
+          nodes.append({
+              'name': name,
+              'parent': parent_name,
+              'rank': _RANKS[min(depth + level, len(_RANKS) - 1)],
+              'tag': ' '.join(_get_word(rng.randrange(node_count), rng) for _ in range(12)),
+              'common': [f'{_get_word(rng.randrange(node_count), rng)} {_get_word(node_count, rng)}'],
+              'imgs': imgs,
+              'card': 1,
+          })
+          next_level.append(name)
+      current_level = next_level
+
+    file_metadata = data_files.JsonDataFile(
+        file=f'synthetic_{file_index}',
+        domain='synthetic',
+        taxa=nodes[0]['name'],
+        tag=f'Synthetic tree {file_index}.',
+        level=level,
+    )
+    with open(data_files.get_full_filename(file_metadata), 'w', encoding='utf8') as f:
+      # The comment keeps the JSONC handling in the measurements.
+      f.write(f'// Generated by bin/benchmark.py with {config}\n')
+      json.dump(nodes, f, indent=2, ensure_ascii=False)
+
+    data_list.append(file_metadata)
+    file_leaves.append(current_level)
+
+  return data_list
+
+
+@contextlib.contextmanager
+def _synthetic_tree(config: SyntheticConfig) -> typing.Iterator[list[data_files.JsonDataFile]]:
+  # Every stage writes relative to the current directory, so the outputs stay out of the repo.
+  original_dir = os.getcwd()
+  original_data_list = data_files.DATA_LIST
+  with tempfile.TemporaryDirectory(prefix='phylogeny_benchmark_') as temp_dir:
+    os.chdir(temp_dir)
+    try:
+      data_list = generate(config, data_files.DATA_DIR)
+      data_files.update_index()
+      data_files.DATA_LIST = data_list
+      yield data_list
+    finally:
+      data_files.DATA_LIST = original_data_list
+      os.chdir(original_dir)
+
+
+def _get_stages() -> dict[str, typing.Callable[[taxonomy.Taxonomy], typing.Any]]:
+  # Each stage runs from the loaded model so they can be timed on their own.
+  return {
+      # Lists the data directory again, which is mostly served from the cached index.
+      'discover': lambda _: data_files.discover(),
+      'validate': validate_inputs.get_violations,
+      'search_index': search_index.build,
+      'index': regenerate_index.main,
+      'compiled_tree': compiled_tree.compile_tree,
+      'asset_manifest': asset_manifest.build,
+  }
+
+
+def _measure(function: typing.Callable[[], typing.Any], repeat: int) -> StageResult:
+  # The stages print progress which would swamp the results.
+  with contextlib.redirect_stdout(io.StringIO()):
+    seconds = math.inf
+    for _ in range(repeat):
+      # Like `timeit`, collections are kept out of the timings since they depend on earlier runs.
+      gc.collect()
+      gc.disable()
+      try:
+        start = time.perf_counter()
+        function()
+        seconds = min(seconds, time.perf_counter() - start)
+      finally:
+        gc.enable()
+
+    # Measured in a separate run since tracing slows everything down.
+    tracemalloc.start()
+    try:
+      function()
+      (_, peak) = tracemalloc.get_traced_memory()
+    finally:
+      tracemalloc.stop()
+
+  return StageResult(seconds=seconds, peak_kib=peak // 1024)
+
+
+def _get_json_kib(value: typing.Any) -> int:
+  return len(json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf8')) // 1024
+
+
+def run(config: SyntheticConfig, repeat: int) -> dict[str, typing.Any]:
+  with _synthetic_tree(config) as data_list:
+    with contextlib.redirect_stdout(io.StringIO()):
+      model = taxonomy.load()
+
+    stages = {'load': _measure(taxonomy.load, repeat)}
+    for (name, stage) in _get_stages().items():
+      stages[name] = _measure(lambda stage=stage: stage(model), repeat)
+
+    # The compiled tree against the same nodes serialised one object each.
+    sizes_kib = {
+        'compiled_tree': _get_json_kib(compiled_tree.compile_tree(model).to_json()),
+        'node_json': _get_json_kib([n.to_json() for n in model.nodes]),
+    }
+
+  return {
+      'config': asdict(config),
+      'files': len(data_list),
+      'nodes': len(model.nodes),
+      'stages': {name: asdict(result) for (name, result) in stages.items()},
+      'sizes_kib': sizes_kib,
+  }
+
+
+def print_results(results: list[dict[str, typing.Any]]) -> None:
+  for result in results:
+    print(f'Scale {result["config"]["scale"]}: {result["nodes"]} nodes in {result["files"]} files')
+    for (name, stage) in result['stages'].items():
+      print(f'  {name:<16}{stage["seconds"] * 1000:>10.1f}ms{stage["peak_kib"]:>12}KiB peak')
+    for (name, kib) in result.get('sizes_kib', {}).items():
+      print(f'  {name + " size":<20}{kib:>6}KiB')
+
+
+def get_scaling_problems(results: list[dict[str, typing.Any]]) -> list[str]:
+  # Compares each scale with the one before it. A linear stage has an exponent of about one.
+  problems: list[str] = []
+  ordered = sorted(results, key=lambda result: result['nodes'])
+  for (smaller, larger) in zip(ordered, ordered[1:]):
+    node_ratio = larger['nodes'] / smaller['nodes']
+    if node_ratio <= 1:
+      continue
+    for (name, stage) in larger['stages'].items():
+      before = smaller['stages'].get(name)
+      if not before or stage['seconds'] < _MIN_COMPARED_SECONDS or before['seconds'] <= 0:
+        continue
+      exponent = math.log(stage['seconds'] / before['seconds']) / math.log(node_ratio)
+      if exponent > _MAX_SCALING_EXPONENT:
+        problems.append(
+            f'{name} grows super-linearly (n^{exponent:.2f}) from {smaller["nodes"]} to '
+            f'{larger["nodes"]} nodes'
+        )
+  return problems
+
+
+def get_regressions(
+    results: list[dict[str, typing.Any]], baseline: list[dict[str, typing.Any]]
+) -> list[str]:
+  regressions: list[str] = []
+  baseline_by_config = {json.dumps(result['config'], sort_keys=True): result for result in baseline}
+  for result in results:
+    previous = baseline_by_config.get(json.dumps(result['config'], sort_keys=True))
+    if not previous:
+      continue
+    for (name, stage) in result['stages'].items():
+      before = previous['stages'].get(name)
+      if not before or stage['seconds'] < _MIN_COMPARED_SECONDS:
+        continue
+      ratio = stage['seconds'] / before['seconds'] if before['seconds'] > 0 else math.inf
+      if ratio > _REGRESSION_RATIO:
+        regressions.append(
+            f'{name} at scale {result["config"]["scale"]} is {ratio:.2f}x slower '
+            f'({before["seconds"] * 1000:.1f}ms -> {stage["seconds"] * 1000:.1f}ms)'
+        )
+  return regressions
+
+
+def get_results_path(name: str) -> str:
+  return os.path.join(RESULTS_DIR, f'{name}.json')
+
+
+def main():
+  parser = argparse.ArgumentParser(
+      description='Time and memory profile each build stage on synthetic trees.'
+  )
+  parser.add_argument(
+      '--scales',
+      type=int,
+      nargs='+',
+      default=[1, 10, 100],
+      help='Multiples of the current tree size to generate. 1000 needs several GB of memory.',
+  )
+  parser.add_argument('--depth', type=int, default=3, help='Levels of nodes in each data file.')
+  parser.add_argument('--branching', type=int, default=3, help='Children for each node.')
+  parser.add_argument('--images', type=int, default=2, help='Images for each node.')
+  parser.add_argument('--seed', type=int, default=0)
+  parser.add_argument('--repeat', type=int, default=3, help='Runs of each stage, keeping the fastest.')
+  parser.add_argument('--save', help=f'Store the results as {RESULTS_DIR}/SAVE.json.')
+  parser.add_argument('--compare', help=f'Compare with the results in {RESULTS_DIR}/COMPARE.json.')
+  args = parser.parse_args()
+
+  baseline = None
+  if args.compare:
+    with open(get_results_path(args.compare), 'r', encoding='utf8') as f:
+      baseline = json.load(f)['results']
+
+  results = []
+  for scale in args.scales:
+    config = SyntheticConfig(
+        scale=scale, depth=args.depth, branching=args.branching, images=args.images, seed=args.seed
+    )
+    print(f'Benchmarking {config}...')
+    results.append(run(config, args.repeat))
+
+  print_results(results)
+
+  if args.save:
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(get_results_path(args.save), 'w', encoding='utf8') as f:
+      json.dump(
+          {
+              'created': datetime.datetime.now().isoformat(timespec='seconds'),
+              'python': platform.python_version(),
+              'machine': platform.machine(),
+              'results': results,
+          },
+          f,
+          indent=2,
+      )
+    print(f'Results saved to: {get_results_path(args.save)}')
+
+  problems = get_scaling_problems(results)
+  if baseline is not None:
+    problems += get_regressions(results, baseline)
+  for problem in problems:
+    print(problem)
+  if problems:
+    raise SystemError(f'Found {len(problems)} performance problems.')
+
+
+if __name__ == '__main__':
+  main()
@@ -1,9 +1,225 @@
 #!/usr/bin/env python
 
+from dataclasses import asdict
+
+import argparse
+import glob
+import json
+import os
+import typing
+
+import asset_manifest
+import build_cache
+import compiled_tree
+import data_files
+import profiler
 import regenerate_index
+import sprite_atlas
+import taxonomy
+import taxonomy_db
+import thumbnail_store
+import transcode_thumbnails
 import validate_inputs
-import cache_thumbnails
 
-validate_inputs.main()
-regenerate_index.main()
-cache_thumbnails.main()
+_CODE_GLOB = os.path.join('bin', '*.py')
+_ATTRIBUTIONS_PATH = os.path.join('thumbnails', 'Attributions.md')
+_THUMBNAIL_MAP_PATH = thumbnail_store.get_thumbnail_map_path('thumbnails')
+_IMAGE_INFO_PATH = thumbnail_store.get_image_info_path('thumbnails')
+_SPRITE_MAP_PATH = sprite_atlas.get_sprite_map_path()
+
+
+def main():
+  parser = argparse.ArgumentParser(description='Validate the data, build the index and cache thumbnails.')
+  parser.add_argument(
+      '--workers',
+      type=int,
+      default=1,
+      help='Processes used to parse the data files. Use 0 for one per CPU.',
+  )
+  parser.add_argument(
+      '--force',
+      action='store_true',
+      help=f'Ignore {build_cache.MANIFEST_FILENAME} and run every stage.',
+  )
+  parser.add_argument('--download-workers', type=int, help='Concurrent thumbnail downloads.')
+  parser.add_argument(
+      '--requests-per-second',
+      type=float,
+      help='Sustained request rate allowed for each image host.',
+  )
+  parser.add_argument(
+      '--transcode',
+      choices=transcode_thumbnails.FORMATS,
+      help='Resize the downloaded thumbnails and re-encode them to this format.',
+  )
+  parser.add_argument(
+      '--refresh-thumbnails',
+      action='store_true',
+      help='Check each cached thumbnail with a conditional request and download the changed ones.',
+  )
+  parser.add_argument(
+      '--retry-failures',
+      action='store_true',
+      help='Only download the thumbnails that failed to download in the last build.',
+  )
+  parser.add_argument(
+      '--sprites',
+      action='store_true',
+      help='Pack the thumbnails for each tree into sprite atlases so it loads in a few requests.',
+  )
+  parser.add_argument(
+      '--release',
+      action='store_true',
+      help='Minify the index and tree data and write .gz and .br copies of each generated asset.',
+  )
+  parser.add_argument(
+      '--profile',
+      metavar='PATH',
+      help='Write the time, memory and bytes used by each stage and data file to this file.',
+  )
+  parser.add_argument(
+      '--profile-format',
+      choices=profiler.FORMATS,
+      default='json',
+      help='A JSON summary, or a Chrome trace that can be opened as a flame graph in Perfetto.',
+  )
+  args = parser.parse_args()
+
+  if args.profile:
+    profiler.enable()
+  try:
+    _build(args)
+  finally:
+    if args.profile:
+      profiler.write(args.profile, args.profile_format)
+
+
+def _build(args: argparse.Namespace) -> None:
+  workers = args.workers or os.cpu_count() or 1
+
+  cache = build_cache.BuildCache()
+  # So the next import of `data_files` only reads the data files that changed since this build.
+  data_files.update_index()
+
+  # Any change to the build code or the list of data files invalidates every stage.
+  data_paths = [data_files.get_full_filename(file_metadata) for file_metadata in data_files.DATA_LIST]
+  code_paths = sorted(glob.glob(_CODE_GLOB))
+  data_list_key = json.dumps(data_files.DATA_LIST, default=asdict)
+
+  changed_paths = cache.changed_files(data_paths + code_paths)
+
+  model: taxonomy.Taxonomy | None = None
+
+  def get_model() -> taxonomy.Taxonomy:
+    nonlocal model
+    if model is None:
+      # Parse the data files once and share the result across every stage.
+      with profiler.span('load', 'stage') as profile_args:
+        model = taxonomy.load(workers=workers)
+        profile_args['nodes'] = len(model.nodes)
+    return model
+
+  def run_stage(
+      stage: str,
+      outputs: list[str] | typing.Callable[[], list[str]],
+      stage_main,
+      extra_inputs: list[str] | None = None,
+      options_key: str = '',
+      force: bool = False,
+  ) -> None:
+    inputs_digest = cache.get_inputs_digest(
+        data_paths + code_paths + (extra_inputs or []), extra=data_list_key + options_key
+    )
+    # Stages that name their outputs by content list them once they have run.
+    get_outputs = outputs if callable(outputs) else lambda: outputs
+    if not (args.force or force) and cache.is_fresh(stage, inputs_digest, get_outputs()):
+      print(f'Skipping {stage}: inputs are unchanged.')
+      return
+
+    # Loaded first so the parse is not counted in the first stage.
+    get_model()
+    with profiler.span(stage, 'stage'):
+      stage_main(get_model())
+    cache.record(stage, inputs_digest, get_outputs())
+    cache.save()
+
+  if changed_paths:
+    print(f'Changed since the last build: {", ".join(changed_paths)}')
+
+  run_stage('validate', [], validate_inputs.main)
+
+  def cache_thumbnails_main(model: taxonomy.Taxonomy) -> None:
+    # Imported here since `requests` is slow to import and most builds skip this stage.
+    import cache_thumbnails  #pylint: disable=import-outside-toplevel
+
+    download_options = {}
+    if args.download_workers is not None:
+      download_options['workers'] = args.download_workers
+    if args.requests_per_second is not None:
+      download_options['requests_per_second'] = args.requests_per_second
+    cache_thumbnails.main(
+        model,
+        retry_failures=args.retry_failures,
+        transcode_format=args.transcode,
+        refresh=args.refresh_thumbnails,
+        **download_options,
+    )
+
+  thumbnail_outputs = [_ATTRIBUTIONS_PATH, _THUMBNAIL_MAP_PATH, _IMAGE_INFO_PATH]
+
+  # The thumbnails run before the index since the index points at the transcoded files. A failed
+  # download still lets the index build before the error is raised.
+  thumbnails_error: SystemError | None = None
+  try:
+    # A refresh or retry always runs since the remote files can change without any local change.
+    run_stage(
+        'thumbnails',
+        thumbnail_outputs,
+        cache_thumbnails_main,
+        options_key=args.transcode or '',
+        force=args.refresh_thumbnails or args.retry_failures,
+    )
+  except SystemError as e:
+    thumbnails_error = e
+
+  if args.sprites:
+    run_stage(
+        'sprites',
+        lambda: [_SPRITE_MAP_PATH] + sprite_atlas.get_atlas_paths(),
+        sprite_atlas.main,
+        extra_inputs=[_THUMBNAIL_MAP_PATH],
+        force=args.refresh_thumbnails,
+    )
+  else:
+    # The page would keep using atlases that no longer match the thumbnails.
+    sprite_atlas.remove()
+
+  run_stage(
+      'index',
+      lambda: regenerate_index.get_output_paths(release=args.release),
+      lambda model: regenerate_index.main(model, release=args.release),
+      extra_inputs=[_THUMBNAIL_MAP_PATH, _IMAGE_INFO_PATH, _SPRITE_MAP_PATH],
+      options_key='release' if args.release else '',
+  )
+
+  run_stage('compiled_tree', [compiled_tree.COMPILED_TREE_FILENAME], compiled_tree.main)
+  run_stage('taxonomy_db', [taxonomy_db.DB_FILENAME], taxonomy_db.main)
+
+  # Any thumbnail that changed on disk needs to be refreshed by the service worker.
+  thumbnail_paths = sorted(
+      path for path in glob.glob(os.path.join('thumbnails', '**'), recursive=True)
+      if os.path.isfile(path)
+  )
+  run_stage(
+      'asset_manifest',
+      [asset_manifest.ASSET_MANIFEST_FILENAME],
+      lambda model: asset_manifest.main(model, cache),
+      extra_inputs=asset_manifest.get_app_asset_paths() + thumbnail_paths,
+  )
+
+  if thumbnails_error:
+    raise thumbnails_error
+
+
+if __name__ == '__main__':
+  main()
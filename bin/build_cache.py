@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+import typing
+
+MANIFEST_FILENAME = '.build_manifest.json'
+
+# Bump this when the manifest layout changes so old manifests are ignored.
+_MANIFEST_VERSION = 1
+
+
+def _hash_file(path: str) -> str:
+  with open(path, 'rb') as f:
+    return hashlib.sha256(f.read()).hexdigest()
+
+
+class BuildCache:
+
+  def __init__(self, filename: str = MANIFEST_FILENAME) -> None:
+    self._filename = filename
+    # Maps a path to [mtime_ns, size, sha256].
+    self._files: dict[str, list[typing.Any]] = {}
+    self._previous_files: dict[str, list[typing.Any]] = {}
+    # Maps a stage name to the digest of its inputs and the hashes of its outputs.
+    self._stages: dict[str, dict[str, typing.Any]] = {}
+
+    if not os.path.isfile(filename):
+      return
+
+    try:
+      with open(filename, 'r', encoding='utf8') as manifest_file:
+        manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+      print(f'Ignoring unreadable build manifest: {filename}')
+      return
+
+    if manifest.get('version') != _MANIFEST_VERSION:
+      return
+
+    self._files = manifest['files']
+    self._previous_files = dict(self._files)
+    self._stages = manifest['stages']
+
+  def file_hash(self, path: str) -> str | None:
+    try:
+      stat = os.stat(path)
+    except FileNotFoundError:
+      return None
+
+    # Only re-read the file when the stat changed since the last build.
+    cached = self._files.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+      return cached[2]
+
+    digest = _hash_file(path)
+    self._files[path] = [stat.st_mtime_ns, stat.st_size, digest]
+    return digest
+
+  def get_inputs_digest(self, paths: list[str], extra: str = '') -> str:
+    inputs_hash = hashlib.sha256(extra.encode('utf8'))
+    for path in paths:
+      inputs_hash.update(f'\0{path}\0{self.file_hash(path)}'.encode('utf8'))
+    return inputs_hash.hexdigest()
+
+  def changed_files(self, paths: list[str]) -> list[str]:
+    changed: list[str] = []
+    for path in paths:
+      previous = self._previous_files.get(path)
+      if not previous or previous[2] != self.file_hash(path):
+        changed.append(path)
+    return changed
+
+  def is_fresh(self, stage: str, inputs_digest: str, outputs: list[str]) -> bool:
+    recorded = self._stages.get(stage)
+    if not recorded or recorded['inputs'] != inputs_digest:
+      return False
+
+    # Outputs that were deleted or edited by hand are rebuilt.
+    recorded_outputs: dict[str, str] = recorded['outputs']
+    if sorted(recorded_outputs) != sorted(outputs):
+      return False
+    return all(self.file_hash(path) == recorded_outputs[path] for path in outputs)
+
+  def record(self, stage: str, inputs_digest: str, outputs: list[str]) -> None:
+    output_hashes: dict[str, str] = {}
+    for path in outputs:
+      digest = self.file_hash(path)
+      if digest is None:
+        raise ValueError(f'Stage "{stage}" did not write the expected output "{path}".')
+      output_hashes[path] = digest
+
+    self._stages[stage] = {'inputs': inputs_digest, 'outputs': output_hashes}
+
+  def save(self) -> None:
+    manifest = {'version': _MANIFEST_VERSION, 'files': self._files, 'stages': self._stages}
+    temp_filename = f'{self._filename}.tmp'
+    with open(temp_filename, 'w', encoding='utf8') as manifest_file:
+      json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    os.replace(temp_filename, self._filename)
@@ -1,18 +1,107 @@
 #!/usr/bin/env python
 
+from dataclasses import asdict, dataclass
+
+import argparse
+import concurrent.futures
+import contextlib
+import datetime
+import email.utils
+import json
 import os
 import random
+import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
 import requests
+import requests.adapters
 
-import common
-import data_files
+import profiler
+import taxonomy
+import thumbnail_store
+import transcode_thumbnails
+import validate_inputs
 
 _THUMBNAIL_DIR = 'thumbnails'
 _ATTRIBUTIONS_FILE = 'Attributions.md'
 
+DEFAULT_DOWNLOAD_WORKERS = 4
+# The sustained and burst number of requests sent to each host.
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_BURST = 4.0
+DEFAULT_MAX_RETRIES = 4
+
+_PARTIAL_SUFFIX = '.part'
+# Holds the ETag or Last-Modified of a partial file, sent as If-Range so a resume never appends
+# the bytes of a changed image to the old ones.
+_PARTIAL_VALIDATOR_SUFFIX = '.part.validator'
+_FAILURES_FILE = 'download_failures.json'
+_DOWNLOAD_TIMEOUT_SEC = 30
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_BACKOFF_BASE_SEC = 1.0
+_BACKOFF_MAX_SEC = 60.0
+_RETRY_AFTER_MAX_SEC = 600.0
+# Statuses worth retrying. A 416 is only retried after a resume, once the stale partial file is
+# deleted.
+_RETRYABLE_STATUS_CODES = frozenset([408, 425, 429, 500, 502, 503, 504])
+
+_HEADERS = {
+    'Accept':
+        'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Encoding':
+        'gzip, deflate, br',
+    'Accept-Language':
+        'en-AU,en;q=0.9',
+    'Cache-Control':
+        'no-cache',
+    'Pragma':
+        'no-cache',
+    'Priority':
+        'u=0, i',
+    'Referer':
+        'https://www.google.com/',
+    'Sec-Fetch-Dest':
+        'document',
+    'Sec-Fetch-Mode':
+        'navigate',
+    'Sec-Fetch-Site':
+        'none',
+    'User-Agent':
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.6 Safari/605.1.15'
+}
+
+
+class DownloadError(SystemError):
+
+  def __init__(
+      self,
+      message: str,
+      status: int | None = None,
+      retry_after_sec: float | None = None,
+      retryable: bool | None = None,
+  ) -> None:
+    super().__init__(message)
+    self.status = status
+    self.retry_after_sec = retry_after_sec
+    self._retryable = retryable
+
+  @property
+  def retryable(self) -> bool:
+    if self._retryable is not None:
+      return self._retryable
+    # Connection errors, timeouts and short reads have no status and are always retried.
+    return self.status is None or self.status in _RETRYABLE_STATUS_CODES
+
+
+@dataclass(kw_only=True)
+class DownloadFailure:
+  local: str
+  remote: str
+  status: int | None
+  error: str
+
 
 def save_thumbnail_naive_urlretrieve(image_local_path: str, remote: str) -> None:
   try:
@@ -21,71 +110,505 @@ def save_thumbnail_naive_urlretrieve(image_local_path: str, remote: str) -> None
     raise SystemError(f'Failed to download "{remote}" to "{image_local_path}".') from e
 
 
-def save_thumbnail_request_with_headers(image_local_path: str, remote: str) -> None:
-  try:
-    headers = {
-        'Accept':
-            'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Encoding':
-            'gzip, deflate, br',
-        'Accept-Language':
-            'en-AU,en;q=0.9',
-        'Cache-Control':
-            'no-cache',
-        'Pragma':
-            'no-cache',
-        'Priority':
-            'u=0, i',
-        'Referer':
-            'https://www.google.com/',
-        'Sec-Fetch-Dest':
-            'document',
-        'Sec-Fetch-Mode':
-            'navigate',
-        'Sec-Fetch-Site':
-            'none',
-        'User-Agent':
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.6 Safari/605.1.15'
-    }
-    response = requests.get(remote, headers=headers)
-    with open(image_local_path, 'wb') as local_image_file:
-      local_image_file.write(response.content)
-  except urllib.error.URLError as e:
-    raise SystemError(f'Failed to download "{remote}" to "{image_local_path}".') from e
-
+class TokenBucket:
+
+  def __init__(self, rate_per_sec: float, capacity: float) -> None:
+    if rate_per_sec <= 0 or capacity < 1:
+      raise ValueError(f'Invalid token bucket rate ({rate_per_sec}) or capacity ({capacity}).')
+    self._rate_per_sec = rate_per_sec
+    self._capacity = capacity
+    self._tokens = capacity
+    self._last_refill = time.monotonic()
+    self._lock = threading.Lock()
+
+  def acquire(self) -> None:
+    while True:
+      with self._lock:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last_refill) * self._rate_per_sec
+        )
+        self._last_refill = now
+        if self._tokens >= 1:
+          self._tokens -= 1
+          return
+        wait_in_sec = (1 - self._tokens) / self._rate_per_sec
+      time.sleep(wait_in_sec)
+
+  def pause(self, delay_sec: float) -> None:
+    with self._lock:
+      # Refilling starts again once the delay has passed.
+      self._tokens = 0
+      self._last_refill = max(self._last_refill, time.monotonic() + delay_sec)
+
+
+class HostRateLimiter:
+
+  def __init__(self, rate_per_sec: float, burst: float) -> None:
+    self._rate_per_sec = rate_per_sec
+    self._burst = burst
+    self._host_to_bucket: dict[str, TokenBucket] = {}
+    self._lock = threading.Lock()
+
+  def _get_bucket(self, url: str) -> TokenBucket:
+    host = urllib.parse.urlsplit(url).netloc
+    with self._lock:
+      if host not in self._host_to_bucket:
+        self._host_to_bucket[host] = TokenBucket(self._rate_per_sec, self._burst)
+      return self._host_to_bucket[host]
+
+  def acquire(self, url: str) -> None:
+    self._get_bucket(url).acquire()
+
+  def pause(self, url: str, delay_sec: float) -> None:
+    self._get_bucket(url).pause(delay_sec)
+
+
+class DownloadStats:
+  _REPORT_INTERVAL_SEC = 2
+
+  def __init__(self, total_items: int) -> None:
+    self.total_items = total_items
+    self.completed_items = 0
+    self.downloaded_items = 0
+    self.bytes_so_far = 0
+    self.failures: list[DownloadFailure] = []
+    self._start = time.monotonic()
+    self._last_report = self._start
+    self._lock = threading.Lock()
+
+  def add(self, downloaded_size: int) -> None:
+    with self._lock:
+      self.completed_items += 1
+      if downloaded_size:
+        self.downloaded_items += 1
+        self.bytes_so_far += downloaded_size
+      self._maybe_report()
+
+  def add_failure(self, failure: DownloadFailure) -> None:
+    with self._lock:
+      self.completed_items += 1
+      self.failures.append(failure)
+      self._maybe_report()
+
+  def _maybe_report(self) -> None:
+    now = time.monotonic()
+    if now - self._last_report >= self._REPORT_INTERVAL_SEC:
+      self._last_report = now
+      print(self.summary())
+
+  def summary(self) -> str:
+    elapsed_sec = max(time.monotonic() - self._start, 1e-9)
+    mib = self.bytes_so_far / 1024 / 1024
+    return (
+        f'Saved {self.completed_items} / {self.total_items} using {mib:.2f}MiB '
+        f'({self.downloaded_items / elapsed_sec:.1f} files/s, {mib / elapsed_sec:.2f}MiB/s, '
+        f'{len(self.failures)} failed)'
+    )
+
+
+class SessionPool:
+
+  def __init__(self, pool_size: int) -> None:
+    self._pool_size = pool_size
+    self._local = threading.local()
+
+  def get(self) -> requests.Session:
+    # Sessions are not thread safe so each worker keeps its own keep-alive connections.
+    session = getattr(self._local, 'session', None)
+    if session is None:
+      session = requests.Session()
+      session.headers.update(_HEADERS)
+      adapter = requests.adapters.HTTPAdapter(
+          pool_connections=self._pool_size, pool_maxsize=self._pool_size
+      )
+      session.mount('http://', adapter)
+      session.mount('https://', adapter)
+      self._local.session = session
+    return session
+
+
+def _get_retry_after_sec(response: requests.Response) -> float | None:
+  retry_after = response.headers.get('Retry-After')
+  if not retry_after:
+    return None
+
+  if retry_after.isdigit():
+    return float(retry_after)
 
-def maybe_save_thumbnail(local: str, remote: str) -> int:
-  image_local_path = os.path.join(_THUMBNAIL_DIR, local)
+  try:
+    retry_at = email.utils.parsedate_to_datetime(retry_after)
+  except (TypeError, ValueError):
+    return None
+  if retry_at.tzinfo is None:
+    retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+  return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+def _get_expected_size(response: requests.Response) -> int | None:
+  if response.status_code == 206:
+    # For example "bytes 100-199/200".
+    content_range = response.headers.get('Content-Range', '')
+    total = content_range.rsplit('/', 1)[-1]
+    return int(total) if total.isdigit() else None
+
+  # The length of an encoded body does not match the decoded bytes written to disk.
+  if response.headers.get('Content-Encoding', 'identity') != 'identity':
+    return None
+  content_length = response.headers.get('Content-Length', '')
+  return int(content_length) if content_length.isdigit() else None
+
+
+def _get_conditional_headers(
+    image_local_path: str, validators: thumbnail_store.Validators | None
+) -> dict[str, str]:
+  (etag, last_modified) = validators or (None, None)
+  if not last_modified:
+    # Older downloads have no validators, but the file is at least as new as its download.
+    last_modified = email.utils.formatdate(os.path.getmtime(image_local_path), usegmt=True)
+
+  headers = {'If-Modified-Since': last_modified}
+  if etag:
+    headers['If-None-Match'] = etag
+  return headers
+
+
+def _read_partial_validator(partial_validator_path: str) -> str | None:
+  try:
+    with open(partial_validator_path, 'r', encoding='utf8') as validator_file:
+      return validator_file.read().strip() or None
+  except FileNotFoundError:
+    return None
+
+
+def _write_partial_validator(
+    partial_validator_path: str, validators: thumbnail_store.Validators
+) -> None:
+  (etag, last_modified) = validators
+  # If-Range only accepts a strong ETag.
+  validator = etag if etag and not etag.startswith('W/') else last_modified
+  if not validator:
+    with contextlib.suppress(FileNotFoundError):
+      os.remove(partial_validator_path)
+    return
+  with open(partial_validator_path, 'w', encoding='utf8') as validator_file:
+    validator_file.write(validator)
+
+
+def _remove_partial(partial_path: str, partial_validator_path: str) -> None:
+  for path in (partial_path, partial_validator_path):
+    with contextlib.suppress(FileNotFoundError):
+      os.remove(path)
+
+
+def save_thumbnail_request_with_headers(
+    image_local_path: str,
+    remote: str,
+    session: requests.Session | None = None,
+    conditional_headers: dict[str, str] | None = None,
+) -> thumbnail_store.Validators | None:
+  # Returns the validators for the saved file, or None when a conditional request found the file
+  # is unchanged.
+
+  # Download to a temporary file so an interrupted run never leaves a truncated image behind.
+  partial_path = image_local_path + _PARTIAL_SUFFIX
+  partial_validator_path = image_local_path + _PARTIAL_VALIDATOR_SUFFIX
+  resume_from = os.path.getsize(partial_path) if os.path.isfile(partial_path) else 0
+  partial_validator = _read_partial_validator(partial_validator_path) if resume_from else None
+  if not partial_validator:
+    # Without a validator there is no way to tell if the partial file is still the same image.
+    resume_from = 0
+
+  headers = {} if session else dict(_HEADERS)
+  if resume_from and partial_validator:
+    headers['Range'] = f'bytes={resume_from}-'
+    headers['If-Range'] = partial_validator
+    # Byte ranges only line up with the file on disk if the body is not re-encoded.
+    headers['Accept-Encoding'] = 'identity'
+  elif conditional_headers:
+    headers.update(conditional_headers)
+
+  get = session.get if session else requests.get
+  try:
+    with get(remote, headers=headers, stream=True, timeout=_DOWNLOAD_TIMEOUT_SEC) as response:
+      if response.status_code == 416 and resume_from:
+        # The partial file does not match the remote file any more so start again.
+        _remove_partial(partial_path, partial_validator_path)
+
+      if response.status_code == 304:
+        return None
+
+      if not response.ok:
+        raise DownloadError(
+            f'Failed to download "{remote}" to "{image_local_path}" '
+            f'with status {response.status_code}.',
+            status=response.status_code,
+            retry_after_sec=_get_retry_after_sec(response),
+            retryable=bool(resume_from) if response.status_code == 416 else None,
+        )
+
+      # A 200 for a resume means the image changed or ranges are not supported, so the partial
+      # file is replaced rather than appended to.
+      resumed = bool(resume_from) and response.status_code == 206
+      mode = 'ab' if resumed else 'wb'
+      expected_size = _get_expected_size(response)
+      validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+      if not resumed:
+        _write_partial_validator(partial_validator_path, validators)
+      with open(partial_path, mode) as local_image_file:
+        for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+          local_image_file.write(chunk)
+
+  except requests.RequestException as e:
+    raise DownloadError(f'Failed to download "{remote}" to "{image_local_path}": {e}') from e
+
+  # Keep short downloads as partial files so the next attempt resumes them.
+  downloaded_size = os.path.getsize(partial_path)
+  if expected_size is not None and downloaded_size != expected_size:
+    raise DownloadError(
+        f'Incomplete download of "{remote}" ({downloaded_size} of {expected_size} bytes).'
+    )
+
+  # Replaced rather than written in place since duplicate thumbnails are hard linked together.
+  os.replace(partial_path, image_local_path)
+  with contextlib.suppress(FileNotFoundError):
+    os.remove(partial_validator_path)
+  return validators
+
+
+def save_thumbnail_with_retries(
+    image_local_path: str,
+    remote: str,
+    session: requests.Session | None = None,
+    rate_limiter: HostRateLimiter | None = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    conditional_headers: dict[str, str] | None = None,
+) -> thumbnail_store.Validators | None:
+  for attempt in range(max_retries + 1):
+    if rate_limiter:
+      rate_limiter.acquire(remote)
+
+    try:
+      return save_thumbnail_request_with_headers(
+          image_local_path=image_local_path,
+          remote=remote,
+          session=session,
+          conditional_headers=conditional_headers,
+      )
+    except DownloadError as e:
+      if not e.retryable or attempt == max_retries:
+        raise
+
+      if e.retry_after_sec is not None:
+        delay_sec = min(e.retry_after_sec, _RETRY_AFTER_MAX_SEC)
+      else:
+        # Exponential backoff with full jitter.
+        delay_sec = random.uniform(0, min(_BACKOFF_MAX_SEC, _BACKOFF_BASE_SEC * 2**attempt))
+      print(f'Retrying in {delay_sec:.1f}s (attempt {attempt + 1} of {max_retries}): {e}')
 
-  # If the file already exists, continue.
+      if rate_limiter and e.retry_after_sec is not None:
+        # The server asked the whole host to slow down, not just this request.
+        rate_limiter.pause(remote, delay_sec)
+      else:
+        time.sleep(delay_sec)
+  raise SystemError(f'Ran out of retries for "{remote}".')
+
+
+def maybe_save_thumbnail(
+    local: str,
+    remote: str,
+    session: requests.Session | None = None,
+    thumbnail_dir: str = _THUMBNAIL_DIR,
+    rate_limiter: HostRateLimiter | None = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    refresh: bool = False,
+    validators: thumbnail_store.Validators | None = None,
+) -> tuple[int, thumbnail_store.Validators | None]:
+  # Returns the bytes downloaded and the validators for a new download.
+  image_local_path = os.path.join(thumbnail_dir, local)
+
+  # Downloads are renamed into place once complete, so an existing file is never truncated.
+  conditional_headers = None
   if os.path.isfile(image_local_path):
-    return 0
-
-  save_thumbnail_request_with_headers(image_local_path=image_local_path, remote=remote)
+    if not refresh:
+      return (0, None)
+    conditional_headers = _get_conditional_headers(image_local_path, validators)
+
+  new_validators = save_thumbnail_with_retries(
+      image_local_path=image_local_path,
+      remote=remote,
+      session=session,
+      rate_limiter=rate_limiter,
+      max_retries=max_retries,
+      conditional_headers=conditional_headers,
+  )
+  if new_validators is None:
+    return (0, None)
 
   file_size = os.path.getsize(image_local_path)
-  return file_size
-
-
-def download_thumbnails(local_to_remote: dict[str, str]) -> None:
-  total_items = len(local_to_remote)
-  completed_items = 0
-  bytes_so_far = 0
+  return (file_size, new_validators)
+
+
+def get_failures_path(thumbnail_dir: str = _THUMBNAIL_DIR) -> str:
+  return os.path.join(thumbnail_dir, _FAILURES_FILE)
+
+
+def write_failures_file(failures: list[DownloadFailure], thumbnail_dir: str) -> None:
+  failures_path = get_failures_path(thumbnail_dir)
+  if not failures:
+    if os.path.isfile(failures_path):
+      os.remove(failures_path)
+    return
+
+  with open(failures_path, 'w', encoding='utf8') as failures_file:
+    json.dump(
+        [asdict(failure) for failure in sorted(failures, key=lambda f: f.local)],
+        failures_file,
+        indent=2,
+    )
+
+
+def read_failures_file(thumbnail_dir: str = _THUMBNAIL_DIR) -> list[DownloadFailure]:
+  failures_path = get_failures_path(thumbnail_dir)
+  if not os.path.isfile(failures_path):
+    return []
+
+  with open(failures_path, 'r', encoding='utf8') as failures_file:
+    return [DownloadFailure(**failure) for failure in json.load(failures_file)]
+
+
+def download_thumbnails(
+    local_to_remote: dict[str, str],
+    workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    burst: float = DEFAULT_BURST,
+    thumbnail_dir: str = _THUMBNAIL_DIR,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    refresh: bool = False,
+) -> DownloadStats:
+  missing = {
+      local: remote
+      for (local, remote) in local_to_remote.items()
+      if not os.path.isfile(os.path.join(thumbnail_dir, local))
+  }
+
+  if refresh:
+    # Every cached file is checked with a conditional request, which is cheap when unchanged.
+    pending = local_to_remote
+    print(f'Revalidating {len(local_to_remote) - len(missing)} cached thumbnails.')
+    print(f'Beginning download of {len(missing)} missing thumbnails.')
+  else:
+    pending = missing
+    print(f'Beginning download of {len(local_to_remote)} thumbnails.')
+    print(f'Skipped {len(local_to_remote) - len(missing)} already downloaded files.')
+
+  stats = DownloadStats(total_items=len(pending))
+  if not pending:
+    write_failures_file(failures=[], thumbnail_dir=thumbnail_dir)
+    return stats
+
+  rate_limiter = HostRateLimiter(rate_per_sec=requests_per_second, burst=burst)
+  sessions = SessionPool(pool_size=workers)
+  local_to_validators = thumbnail_store.read_validators(thumbnail_dir)
+  validators_lock = threading.Lock()
+
+  def download(local: str, remote: str) -> None:
+    with profiler.span(local, 'download') as profile_args:
+      try:
+        (downloaded_size, validators) = maybe_save_thumbnail(
+            local=local,
+            remote=remote,
+            session=sessions.get(),
+            thumbnail_dir=thumbnail_dir,
+            rate_limiter=rate_limiter,
+            max_retries=max_retries,
+            refresh=refresh,
+            validators=local_to_validators.get(local),
+        )
+      except DownloadError as e:
+        # Record the failure and carry on so one bad image does not abort a large sync.
+        stats.add_failure(
+            DownloadFailure(local=local, remote=remote, status=e.status, error=str(e))
+        )
+        profile_args['failed'] = True
+        return
+      profile_args['bytes'] = downloaded_size
+    if validators is not None:
+      with validators_lock:
+        local_to_validators[local] = validators
+    stats.add(downloaded_size)
+    profiler.add('bytes_downloaded', downloaded_size)
 
-  print(f'Beginning download of {total_items} thumbnails.')
-
-  for (local, remote) in local_to_remote.items():
-    downloaded_size = maybe_save_thumbnail(local=local, remote=remote)
-    if bytes_so_far == 0 and downloaded_size > 0:
-      print(f'Skipped {completed_items} already downloaded files.')
-    bytes_so_far += downloaded_size
-    completed_items += 1
-
-    # If we just hit the server, then give a status then wait a little before continuing.
-    if downloaded_size:
-      print(f'Saved {completed_items} / {total_items} using {bytes_so_far / 1024 / 1024:.2f}MiB')
-      sleep_in_sec = random.random() * 3  # Get a sleep of less than three seconds.
-      time.sleep(sleep_in_sec)
+  try:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+      futures = [executor.submit(download, local, remote) for (local, remote) in pending.items()]
+      try:
+        for future in concurrent.futures.as_completed(futures):
+          future.result()
+      except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+  finally:
+    # Kept even after an interruption so the finished downloads are not fetched in full again.
+    thumbnail_store.write_validators(
+        thumbnail_dir,
+        {
+            local: validators
+            for (local, validators) in local_to_validators.items()
+            if os.path.isfile(os.path.join(thumbnail_dir, local))
+        },
+    )
+
+  print(stats.summary())
+  if refresh:
+    unchanged = stats.completed_items - stats.downloaded_items - len(stats.failures)
+    print(f'{unchanged} thumbnails were unchanged.')
+  write_failures_file(failures=stats.failures, thumbnail_dir=thumbnail_dir)
+  return stats
+
+
+def update_thumbnail_map(
+    local_filenames: list[str],
+    transcode_format: str | None = None,
+    thumbnail_dir: str = _THUMBNAIL_DIR,
+) -> None:
+  local_to_digest = thumbnail_store.index_content(local_filenames, thumbnail_dir)
+  local_to_canonical = thumbnail_store.deduplicate(local_to_digest, thumbnail_dir)
+
+  previous_settings = thumbnail_store.read_thumbnail_map_file(thumbnail_dir)['settings']
+  if transcode_format:
+    settings = asdict(transcode_thumbnails.TranscodeSettings(image_format=transcode_format))
+  else:
+    # Keep transcoding once it is turned on so the optimised files already built stay in use.
+    settings = previous_settings
+
+  digest_to_served: dict[str, str] = {}
+  if settings:
+    digest_to_served = transcode_thumbnails.transcode_thumbnails(
+        digest_to_local={
+            digest: local_to_canonical[local] for (local, digest) in local_to_digest.items()
+        },
+        thumbnail_dir=thumbnail_dir,
+        settings=transcode_thumbnails.TranscodeSettings(**settings),
+        previous_settings=previous_settings,
+    )
+
+  # Only images served from a different file need an entry.
+  thumbnail_map: dict[str, str] = {}
+  for (local, digest) in local_to_digest.items():
+    served = digest_to_served.get(digest, local_to_canonical[local])
+    if served != local:
+      thumbnail_map[local] = served
+
+  thumbnail_store.write_thumbnail_map(thumbnail_dir, thumbnail_map, settings)
+
+  # Lets the page lay out each image and show a placeholder before it loads.
+  with profiler.span('update_image_info'):
+    thumbnail_store.update_image_info(
+        {thumbnail_map.get(local, local): digest for (local, digest) in local_to_digest.items()},
+        thumbnail_dir,
+        settings,
+    )
 
 
 def build_attributions_file(local_to_attribution: dict[str, str]) -> None:
@@ -97,42 +620,106 @@ def build_attributions_file(local_to_attribution: dict[str, str]) -> None:
       os.path.join(_THUMBNAIL_DIR, _ATTRIBUTIONS_FILE), 'w', encoding='utf8'
   ) as attributions_file:
     attributions_file.write(attributions)
+  profiler.add_written(os.path.join(_THUMBNAIL_DIR, _ATTRIBUTIONS_FILE))
 
 
-def main():
+def main(
+    model: taxonomy.Taxonomy | None = None,
+    workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    retry_failures: bool = False,
+    transcode_format: str | None = None,
+    refresh: bool = False,
+):
+
+  if model is None:
+    model = taxonomy.load()
+    # The build validates the model before this stage, so only a standalone run checks it here.
+    validate_inputs.main(model)
 
   local_to_attribution: dict[str, str] = {}
   local_to_remote: dict[str, str] = {}
 
-  def node_callback(n: common.NodeRaw) -> None:
+  for image in model.images:
 
-    n.validate()
+    local = image.local_filename
+    remote = image.remote_url
 
-    # Abort early if there are no images.
-    if not n.imgs:
-      return
+    if local not in local_to_remote:
+      local_to_remote[local] = remote
+    else:
+      if local_to_remote[local] != remote:
+        raise ValueError(
+            f'The same local URL ({local}) maps to duplicate remote URLs '
+            f'({local_to_remote[local]}, {remote})'
+        )
 
-    for image in n.image_list:
+    local_to_attribution[local] = image.attribution_url
 
-      local = image.local_filename
-      remote = image.remote_url
+  build_attributions_file(local_to_attribution=local_to_attribution)
 
-      if local not in local_to_remote:
-        local_to_remote[local] = remote
-      else:
-        if local_to_remote[local] != remote:
-          raise ValueError(
-              f'The same local URL ({local}) maps to duplicate remote URLs '
-              f'({local_to_remote[local]}, {remote})'
-          )
+  if retry_failures:
+    previous_failures = {failure.local for failure in read_failures_file()}
+    local_to_remote = {
+        local: remote for (local, remote) in local_to_remote.items() if local in previous_failures
+    }
 
-      local_to_attribution[local] = image.attribution_url
+  with profiler.span('download_thumbnails') as profile_args:
+    stats = download_thumbnails(
+        local_to_remote=local_to_remote,
+        workers=workers,
+        requests_per_second=requests_per_second,
+        refresh=refresh,
+    )
+    profile_args['downloaded'] = stats.downloaded_items
+    profile_args['failed'] = len(stats.failures)
 
-  data_files.process_nodes(node_callback)
+  with profiler.span('update_thumbnail_map'):
+    update_thumbnail_map(
+        local_filenames=list(local_to_attribution.keys()), transcode_format=transcode_format
+    )
 
-  build_attributions_file(local_to_attribution=local_to_attribution)
-  download_thumbnails(local_to_remote=local_to_remote)
+  if stats.failures:
+    raise SystemError(
+        f'Failed to download {len(stats.failures)} thumbnails. '
+        f'Rerun with --retry-failures to retry the ones listed in "{get_failures_path()}".'
+    )
 
 
 if __name__ == '__main__':
-  main()
+  parser = argparse.ArgumentParser(description='Download the thumbnails used by the data files.')
+  parser.add_argument(
+      '--download-workers',
+      type=int,
+      default=DEFAULT_DOWNLOAD_WORKERS,
+      help='Concurrent thumbnail downloads.',
+  )
+  parser.add_argument(
+      '--requests-per-second',
+      type=float,
+      default=DEFAULT_REQUESTS_PER_SECOND,
+      help='Sustained request rate allowed for each image host.',
+  )
+  parser.add_argument(
+      '--retry-failures',
+      action='store_true',
+      help=f'Only download the thumbnails listed in {get_failures_path()}.',
+  )
+  parser.add_argument(
+      '--transcode',
+      choices=transcode_thumbnails.FORMATS,
+      help='Resize the downloaded thumbnails and re-encode them to this format.',
+  )
+  parser.add_argument(
+      '--refresh',
+      action='store_true',
+      help='Check each cached thumbnail with a conditional request and download the changed ones.',
+  )
+  args = parser.parse_args()
+  main(
+      workers=args.download_workers,
+      requests_per_second=args.requests_per_second,
+      retry_failures=args.retry_failures,
+      transcode_format=args.transcode,
+      refresh=args.refresh,
+  )
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+import functools
 import re
 import typing
 import urllib.parse
@@ -66,10 +67,22 @@ def _get_attribution_link_from_image_url(url: str) -> str:
   return f'https://commons.wikimedia.org/wiki/File:{remote_filename}'
 
 
+def _is_empty(value: typing.Any) -> bool:
+  if isinstance(value, str):
+    return not value
+  if isinstance(value, list):
+    return not any(value)
+  return False
+
+
 class Image:
+  __slots__ = ('_url', '_local_filename', '_attribution_url')
 
   def __init__(self, url: str) -> None:
     self._url = url
+    # Computed on first use since every stage reads these and the regexes are slow.
+    self._local_filename: str | None = None
+    self._attribution_url: str | None = None
 
   @property
   def remote_url(self) -> str:
@@ -77,14 +90,24 @@ class Image:
 
   @property
   def local_filename(self) -> str:
-    return _get_local_filename_from_remote(self._url)
+    if self._local_filename is None:
+      self._local_filename = _get_local_filename_from_remote(self._url)
+    return self._local_filename
 
   @property
   def attribution_url(self) -> str:
-    return _get_attribution_link_from_image_url(self._url)
+    if self._attribution_url is None:
+      self._attribution_url = _get_attribution_link_from_image_url(self._url)
+    return self._attribution_url
+
 
+@functools.cache
+def get_image(url: str) -> Image:
+  # Shared so an image used by several taxa is only parsed once.
+  return Image(url)
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class NodeRaw:  #pylint: disable=too-many-instance-attributes
 
   name: str
@@ -107,7 +130,15 @@ class NodeRaw:  #pylint: disable=too-many-instance-attributes
     if not self.imgs:
       return []
 
-    return [Image(img_url) for img_url in self.imgs]
+    return [get_image(img_url) for img_url in self.imgs]
+
+  def to_json(self, drop_empty: bool = False) -> dict[str, typing.Any]:
+    # Only keep the fields that were set in the data file.
+    fields = {key: value for (key, value) in asdict(self).items() if value is not None}
+    if drop_empty:
+      # Blank strings and lists of blank strings are placeholders in the data files.
+      fields = {key: value for (key, value) in fields.items() if not _is_empty(value)}
+    return fields
 
   def _validate_common(self) -> None:
     if not self.common:
@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass, field
+import array
+import json
+import os
+import typing
+
+import common
+import data_files
+import profiler
+import taxonomy
+
+COMPILED_TREE_FILENAME = os.path.join('tree_data', 'compiled_tree.json')
+
+# Bump this when the layout changes so readers can reject old files.
+_FORMAT_VERSION = 1
+
+# Used in the index arrays for a missing node, string or number.
+NONE = -1
+
+_ATTRIBUTION_PREFIX = 'https://commons.wikimedia.org/wiki/File:'
+
+# The arrays with one entry per node, plus the offsets into the flat lists which have one extra.
+_NODE_ARRAYS = (
+    'name',
+    'rank',
+    'parent',
+    'first_child',
+    'next_sibling',
+    'file',
+    'ipa',
+    'etymology',
+    'tag',
+    'species',
+    'card',
+)
+_OFFSET_ARRAYS = ('ipa_alt_start', 'common_start', 'image_start')
+# Flat lists of string or image IDs that the offsets point into.
+_FLAT_ARRAYS = ('ipa_alt', 'common', 'images')
+# One entry per distinct image. Negative filenames are a segment of the URL counted from the end,
+# which avoids storing most filenames twice.
+_IMAGE_ARRAYS = ('image_url', 'image_local_filename', 'image_remote_filename')
+
+
+def _new_array() -> array.array:
+  return array.array('i')
+
+
+@dataclass(kw_only=True)
+class CompiledTree:  #pylint: disable=too-many-instance-attributes
+  # Every name, rank, tag and URL is stored once and referenced by its index.
+  strings: list[str] = field(default_factory=list)
+  files: list[str] = field(default_factory=list)
+  arrays: dict[str, array.array] = field(
+      default_factory=lambda: {
+          name: _new_array() for name in _NODE_ARRAYS + _OFFSET_ARRAYS + _FLAT_ARRAYS + _IMAGE_ARRAYS
+      }
+  )
+  _string_ids: dict[str, int] = field(default_factory=dict, repr=False)
+
+  def intern(self, value: str | None) -> int:
+    if value is None:
+      return NONE
+    if not self._string_ids and self.strings:
+      # Only built when adding to a tree that was read from a file.
+      self._string_ids = {string: string_id for (string_id, string) in enumerate(self.strings)}
+    string_id = self._string_ids.get(value)
+    if string_id is None:
+      string_id = len(self.strings)
+      self.strings.append(value)
+      self._string_ids[value] = string_id
+    return string_id
+
+  def _get_image_filename(self, url: str, string_id: int) -> str:
+    if string_id < 0:
+      return url.split('/')[string_id]
+    return self.strings[string_id]
+
+  def get_string(self, string_id: int) -> str | None:
+    return None if string_id == NONE else self.strings[string_id]
+
+  @property
+  def node_count(self) -> int:
+    return len(self.arrays['name'])
+
+  def get_name(self, node_id: int) -> str:
+    return self.strings[self.arrays['name'][node_id]]
+
+  def iter_children(self, node_id: int) -> typing.Iterator[int]:
+    child_id = self.arrays['first_child'][node_id]
+    while child_id != NONE:
+      yield child_id
+      child_id = self.arrays['next_sibling'][child_id]
+
+  def _get_strings(self, node_id: int, start_name: str, flat_name: str) -> list[str]:
+    start = self.arrays[start_name][node_id]
+    end = self.arrays[start_name][node_id + 1]
+    return [self.strings[string_id] for string_id in self.arrays[flat_name][start:end]]
+
+  def get_images(self, node_id: int) -> list[tuple[str, str, str]]:
+    # Returns the remote URL, local filename and attribution URL for each image.
+    start = self.arrays['image_start'][node_id]
+    end = self.arrays['image_start'][node_id + 1]
+    images: list[tuple[str, str, str]] = []
+    for image_id in self.arrays['images'][start:end]:
+      url = common.IMG_PREFIX + self.strings[self.arrays['image_url'][image_id]]
+      local_filename = self._get_image_filename(url, self.arrays['image_local_filename'][image_id])
+      remote_filename = self._get_image_filename(url, self.arrays['image_remote_filename'][image_id])
+      images.append((url, local_filename, _ATTRIBUTION_PREFIX + remote_filename))
+    return images
+
+  def get_node(self, node_id: int) -> common.NodeRaw:
+    a = self.arrays
+    parent_id = a['parent'][node_id]
+
+    def get_number(name: str) -> int | None:
+      return None if a[name][node_id] == NONE else a[name][node_id]
+
+    return common.NodeRaw(
+        name=self.get_name(node_id),
+        parent='LUCA' if parent_id == NONE else self.get_name(parent_id),
+        rank=typing.cast(common.Rank, self.get_string(a['rank'][node_id])),
+        ipa=self.get_string(a['ipa'][node_id]),
+        ipa_alt=self._get_strings(node_id, 'ipa_alt_start', 'ipa_alt') or None,
+        etymology=self.get_string(a['etymology'][node_id]),
+        common=self._get_strings(node_id, 'common_start', 'common') or None,
+        tag=self.get_string(a['tag'][node_id]),
+        imgs=[url for (url, _, _) in self.get_images(node_id)] or None,
+        species=get_number('species'),
+        card=get_number('card'),
+    )
+
+  def to_json(self) -> dict[str, typing.Any]:
+    # Plain lists of small numbers are shorter than base64 and load with `Int32Array.from`.
+    return {
+        'version': _FORMAT_VERSION,
+        'node_count': self.node_count,
+        'files': self.files,
+        'strings': self.strings,
+        'arrays': {name: values.tolist() for (name, values) in self.arrays.items()},
+    }
+
+  @classmethod
+  def from_json(cls, compiled: dict[str, typing.Any]) -> 'CompiledTree':
+    if compiled.get('version') != _FORMAT_VERSION:
+      raise ValueError(f'Unsupported compiled tree version: {compiled.get("version")}')
+
+    arrays = {name: array.array('i', values) for (name, values) in compiled['arrays'].items()}
+    return cls(strings=compiled['strings'], files=compiled['files'], arrays=arrays)
+
+
+def _as_list(values: list[str] | str | None) -> list[str]:
+  # A few data files have a single string where a list is expected.
+  if isinstance(values, str):
+    return [values]
+  return values or []
+
+
+def _get_image_filename_id(tree: CompiledTree, url: str, filename: str) -> int:
+  segments = url.split('/')
+  for segment_id in (-1, -2):
+    if segments[segment_id] == filename:
+      return segment_id
+  return tree.intern(filename)
+
+
+def compile_tree(model: taxonomy.Taxonomy) -> CompiledTree:
+  tree = CompiledTree()
+  a = tree.arrays
+  taxa_to_id: dict[str, int] = {}
+  # The last child added to each node so siblings are linked in data file order.
+  last_child: list[int] = []
+  image_url_to_id: dict[str, int] = {}
+
+  for n in model.nodes:
+    taxa_to_id[n.name] = len(taxa_to_id)
+
+  for offsets in _OFFSET_ARRAYS:
+    a[offsets].append(0)
+
+  for file_metadata in data_files.DATA_LIST:
+    file_id = len(tree.files)
+    tree.files.append(file_metadata.file)
+
+    for n in model.file_to_nodes.get(file_metadata.file, []):
+      node_id = len(a['name'])
+      parent_id = taxa_to_id.get(n.parent, NONE)
+
+      a['name'].append(tree.intern(n.name))
+      a['rank'].append(tree.intern(n.rank))
+      a['parent'].append(parent_id)
+      a['first_child'].append(NONE)
+      a['next_sibling'].append(NONE)
+      last_child.append(NONE)
+      a['file'].append(file_id)
+      a['ipa'].append(tree.intern(n.ipa))
+      a['etymology'].append(tree.intern(n.etymology))
+      a['tag'].append(tree.intern(n.tag))
+      a['species'].append(NONE if n.species is None else n.species)
+      a['card'].append(NONE if n.card is None else n.card)
+
+      if parent_id != NONE:
+        if last_child[parent_id] == NONE:
+          a['first_child'][parent_id] = node_id
+        else:
+          a['next_sibling'][last_child[parent_id]] = node_id
+        last_child[parent_id] = node_id
+
+      a['ipa_alt'].extend(tree.intern(value) for value in _as_list(n.ipa_alt))
+      a['ipa_alt_start'].append(len(a['ipa_alt']))
+      a['common'].extend(tree.intern(value) for value in _as_list(n.common))
+      a['common_start'].append(len(a['common']))
+
+      for img in n.image_list:
+        image_id = image_url_to_id.get(img.remote_url)
+        if image_id is None:
+          image_id = len(image_url_to_id)
+          image_url_to_id[img.remote_url] = image_id
+          # The shared prefixes are added back when the image is read.
+          a['image_url'].append(tree.intern(img.remote_url.removeprefix(common.IMG_PREFIX)))
+          a['image_local_filename'].append(
+              _get_image_filename_id(tree, img.remote_url, img.local_filename)
+          )
+          a['image_remote_filename'].append(
+              _get_image_filename_id(
+                  tree, img.remote_url, img.attribution_url.removeprefix(_ATTRIBUTION_PREFIX)
+              )
+          )
+        a['images'].append(image_id)
+      a['image_start'].append(len(a['images']))
+
+  return tree
+
+
+def read(filename: str = COMPILED_TREE_FILENAME) -> CompiledTree:
+  with open(filename, 'r', encoding='utf8') as compiled_file:
+    return CompiledTree.from_json(json.load(compiled_file))
+
+
+def main(model: taxonomy.Taxonomy | None = None):
+
+  if model is None:
+    model = taxonomy.load()
+
+  compiled = json.dumps(compile_tree(model).to_json(), separators=(',', ':'), ensure_ascii=False)
+
+  os.makedirs(os.path.dirname(COMPILED_TREE_FILENAME), exist_ok=True)
+  temp_filename = f'{COMPILED_TREE_FILENAME}.tmp'
+  with open(temp_filename, 'w', encoding='utf8') as compiled_file:
+    compiled_file.write(compiled)
+  os.replace(temp_filename, COMPILED_TREE_FILENAME)
+  profiler.add_written(COMPILED_TREE_FILENAME)
+
+  print(
+      f'Compiled tree built at: {COMPILED_TREE_FILENAME} '
+      f'({len(compiled.encode("utf8")) / 1024:.0f}KiB)'
+  )
+
+
+if __name__ == '__main__':
+  main()
@@ -1,11 +1,21 @@
 from dataclasses import dataclass
+import concurrent.futures
 import json
 import os
+import time
 import typing
 
 import common
+import jsonc
+import profiler
 
 DATA_DIR = 'data'
+# Caches the root of each data file in the data directory, so only new or changed files are read
+# to build `DATA_LIST`. Only the build writes it, so importing this module never writes files.
+INDEX_FILENAME = '.data_index.json'
+_DATA_SUFFIX = '.jsonc'
+# The overview that every other data file hangs off.
+_ROOT_FILE = 'luca'
 
 
 @dataclass(kw_only=True)
@@ -14,296 +24,403 @@ class JsonDataFile:
   domain: str
   taxa: str
   tag: str
-  # TODO: Make this a parent to create a tree instead of being lazy + would help with filtering.
+  # The number of data files above this one, not counting the overview at the top.
   level: int
 
 
-DATA_LIST = [
-    JsonDataFile(
+@dataclass(kw_only=True)
+class DataFileOverride:
+  # Curated metadata for a data file in `DATA_DIR`. Fields left as None are derived from the file.
+  file: str
+  domain: str | None = None
+  taxa: str | None = None
+  tag: str | None = None
+
+
+# Only files in `DATA_DIR` are used, so an override for a file that does not exist does nothing.
+# The order here is also the order of siblings in the menu, with other files after them by name.
+DATA_OVERRIDES = [
+    DataFileOverride(
         file="luca",
-        domain="",
         taxa="Overview",
         tag="Early life and how the main domains formed.",
-        level=0,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia",
-        domain="animalia",
-        taxa="Animalia",
         tag="The main evolutionary branches for animals.",
-        level=0,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_cnidaria",
-        domain="animalia",
-        taxa="Cnidaria",
         tag="Jellyfish, corals and sea anemones.",
-        level=1,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_mollusca",
-        domain="animalia",
-        taxa="Mollusca",
         tag="Snails, bivalves, squids and nudibranchs.",
-        level=1,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_arthropoda",
-        domain="animalia",
-        taxa="Arthropoda",
         tag="Crabs, insects and arachnids.",
-        level=1,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_arthropoda_insecta",
-        domain="animalia",
-        taxa="Insecta",
         tag="The insects.",
-        level=2,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_arthropoda_insecta_hymenoptera",
-        domain="animalia",
-        taxa="Hymenoptera",
         tag="The narrow waisted insects: wasps, bees and ants.",
-        level=3,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_arthropoda_arachnida",
-        domain="animalia",
-        taxa="Arachnida",
         tag="The arachnids: includes spiders, scorpions and mites.",
-        level=2,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata",
-        domain="animalia",
-        taxa="Chordata",
         tag="From early spinal cords to animals leaving the oceans.",
-        level=1,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_elasmobranchii",
-        domain="animalia",
-        taxa="Elasmobranchii",
         tag="The cartilaginous fish. They lack true bones. Mostly sharks and rays.",
-        level=2,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_actinopterygii",
-        domain="animalia",
-        taxa="Actinopterygii",
         tag="The ray finned fish. Most known fish.",
-        level=2,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_actinopterygii_acanthomorpha",
-        domain="animalia",
-        taxa="Acanthomorpha",
         tag="A large group nested in the ray finned fish. They have fins on their back that can be extended or retracted.",
-        level=3,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda",
-        domain="animalia",
-        taxa="Tetrapoda",
         tag="Four-limbed vertebrates. The tree starts with early land life and stops at birds and mammals.",
-        level=2,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_aves",
-        domain="animalia",
-        taxa="Aves",
         tag="An overview of birds.",
-        level=3,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_aves_passeriformes",
-        domain="animalia",
-        taxa="Passeriformes",
         tag="The perching birds. Literally sparrow-shaped.",
-        level=4,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_aves_passeriformes_passeri",
-        domain="animalia",
-        taxa="Passeri",
         tag="A large group of perching birds known as the songbirds.",
-        level=5,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_aves_passeriformes_passeri_core_passerides",
-        domain="animalia",
-        taxa="Core Passerides",
         tag="A large group of songbirds.",
-        level=6,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_mammalia",
-        domain="animalia",
-        taxa="Mammalia",
         tag="Most of the animals we think of.",
-        level=3,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_mammalia_carnivora",
-        domain="animalia",
-        taxa="Carnivora",
         tag="The carnivorans, the carnivorous mammals.",
-        level=4,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_mammalia_carnivora_felidae",
-        domain="animalia",
-        taxa="Felidae",
         tag="The cat-like carnivorans.",
-        level=5,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_mammalia_carnivora_canidae",
-        domain="animalia",
-        taxa="Canidae",
         tag="The dog-like carnivorans.",
-        level=5,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_mammalia_artiodactyla",
-        domain="animalia",
-        taxa="Artiodactyla",
         tag="The ungulates and their descendants. Many of the herbivores we think of... and whales.",
-        level=4,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_mammalia_artiodactyla_cetacea",
-        domain="animalia",
-        taxa="Cetacea",
         tag="The whales, dolphins and porpoises.",
-        level=5,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_mammalia_primates",
-        domain="animalia",
-        taxa="Primates",
         tag="The monkeys and apes.",
-        level=4,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_mammalia_primates_platyrrhini",
-        domain="animalia",
-        taxa="Platyrrhini",
         tag="The new world monkeys.",
-        level=5,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_mammalia_primates_cercopithecidae",
-        domain="animalia",
-        taxa="Cercopithecidae",
         tag="The old world monkeys.",
-        level=5,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_animalia_chordata_tetrapoda_mammalia_primates_homo",
-        domain="animalia",
-        taxa="Homo",
         tag="Humans and their close ancestors.",
-        level=5,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_plantae",
-        domain="plantae",
-        taxa="Plantae",
         tag="The main evolutionary branches for plants.",
-        level=0,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_plantae_rhodophyta",
-        domain="plantae",
-        taxa="Rhodophyta",
         tag="The red algae... but often green in colour and includes some seaweeds.",
-        level=1,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_plantae_chlorophyta",
-        domain="plantae",
-        taxa="Chlorophyta",
         tag="The green algae that branched off before the land plants including some seaweeds.",
-        level=1,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_plantae_pinophyta",
-        domain="plantae",
-        taxa="Pinophyta",
         tag="The conifers",
-        level=1,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_plantae_angiosperms",
-        domain="plantae",
-        taxa="Angiosperms",
         tag="The flowering plants",
-        level=1,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_plantae_angiosperms_monocots",
-        domain="plantae",
-        taxa="Monocots",
         tag="This includes the grasses and many of the plants used in large-scale farming.",
-        level=2,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_plantae_angiosperms_eudicots",
-        domain="plantae",
-        taxa="Eudicots",
         tag="Dicots show two leaves seed leaves during germination and this is the true dicots.",
-        level=2,
     ),
-    JsonDataFile(
+    DataFileOverride(
+        file="luca_plantae_angiosperms_eudicots_fagales",
+        tag="Beeches, oaks, walnuts and birches.",
+    ),
+    DataFileOverride(
+        file="luca_plantae_angiosperms_eudicots_myrtales",
+        tag="Myrtles, eucalyptus, cloves, guavas and fuchsias.",
+    ),
+    DataFileOverride(
+        file="luca_plantae_angiosperms_eudicots_rosales",
+        tag="Roses and many fruit trees, along with elms, figs and hemp.",
+    ),
+    DataFileOverride(
         file="luca_fungi",
-        domain="fungi",
-        taxa="Fungi",
         tag="The main evolutionary branches for fungi.",
-        level=0,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_fungi_basidiomycota",
-        domain="fungi",
-        taxa="Basidiomycota",
         tag="The higher fungi.",
-        level=1,
     ),
-    JsonDataFile(
+    DataFileOverride(
         file="luca_fungi_ascomycota",
-        domain="fungi",
-        taxa="Ascomycota",
         tag="The sac fungi",
-        level=1,
     ),
 ]
 
 
-def process_nodes(
-    per_node_function: typing.Callable[[common.NodeRaw], None]
+def get_parent_file(file: str, files: typing.Container[str]) -> str | None:
+  # Each data file is named after the one it hangs off, like "luca_plantae" and "luca_plantae_X".
+  parts = file.split('_')
+  for end in range(len(parts) - 1, 0, -1):
+    parent_file = '_'.join(parts[:end])
+    if parent_file in files:
+      return parent_file
+  return None
+
+
+def _read_root_parent(full_filename: str) -> str | None:
+  # Only the first node is parsed since its parent is the root the file hangs off.
+  items = jsonc.iter_items(full_filename)
+  try:
+    for (_, item) in items:
+      return item.get('parent') if isinstance(item, dict) else None
+  except ValueError:
+    # The build reports the problem with the line it is on when the file is validated.
+    return None
+  finally:
+    items.close()
+  return None
+
+
+def get_index_path(data_dir: str = DATA_DIR) -> str:
+  return os.path.join(data_dir, INDEX_FILENAME)
+
+
+def _read_index(index_path: str) -> dict[str, list[typing.Any]]:
+  if not os.path.isfile(index_path):
+    return {}
+  try:
+    with open(index_path, 'r', encoding='utf8') as index_file:
+      return json.load(index_file)
+  except (OSError, ValueError):
+    return {}
+
+
+def _scan(data_dir: str, previous: dict[str, list[typing.Any]]) -> dict[str, list[typing.Any]]:
+  # Maps each file to [mtime_ns, size, root parent] so only new or changed files are read.
+  index: dict[str, list[typing.Any]] = {}
+  with os.scandir(data_dir) as entries:
+    for entry in entries:
+      if not entry.name.endswith(_DATA_SUFFIX):
+        continue
+      file = entry.name[:-len(_DATA_SUFFIX)]
+      stat = entry.stat()
+      cached = previous.get(file)
+      if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        index[file] = cached
+      else:
+        index[file] = [stat.st_mtime_ns, stat.st_size, _read_root_parent(entry.path)]
+  return index
+
+
+def update_index(data_dir: str = DATA_DIR) -> None:
+  if not os.path.isdir(data_dir):
+    return
+  index_path = get_index_path(data_dir)
+  previous = _read_index(index_path)
+  index = _scan(data_dir, previous)
+  if index == previous:
+    return
+
+  # Written to a temporary file first since another build can update it at the same time.
+  temp_path = f'{index_path}.{os.getpid()}.tmp'
+  try:
+    with open(temp_path, 'w', encoding='utf8') as index_file:
+      json.dump(index, index_file, indent=2, sort_keys=True, ensure_ascii=False)
+    os.replace(temp_path, index_path)
+  except OSError as e:
+    # Only a cache, so a read-only checkout still works by reading each file's first node.
+    print(f'Could not write the data file index "{index_path}": {e}')
+
+
+def _get_file_metadata(
+    file: str, level: int, root_parent: str | None, override: DataFileOverride | None
+) -> JsonDataFile:
+  parts = file.split('_')
+  file_metadata = JsonDataFile(
+      file=file,
+      # Files below the overview are named after their domain, like "luca_fungi_ascomycota".
+      domain=parts[1] if parts[0] == _ROOT_FILE and len(parts) > 1 else '',
+      taxa=root_parent or parts[-1].capitalize(),
+      tag='',
+      level=level,
+  )
+  if override:
+    for field_name in ('domain', 'taxa', 'tag'):
+      value = getattr(override, field_name)
+      if value is not None:
+        setattr(file_metadata, field_name, value)
+  return file_metadata
+
+
+def discover(
+    data_dir: str = DATA_DIR, overrides: list[DataFileOverride] | None = None
+) -> list[JsonDataFile]:
+  # Read only, with files missing from the index or changed since it was written read again.
+  if not os.path.isdir(data_dir):
+    return []
+  if overrides is None:
+    overrides = DATA_OVERRIDES
+
+  index = _scan(data_dir, _read_index(get_index_path(data_dir)))
+  root_parents = {file: entry[2] for (file, entry) in index.items()}
+  files = sorted(root_parents)
+
+  file_to_override = {override.file: override for override in overrides}
+  file_to_order = {override.file: i for (i, override) in enumerate(overrides)}
+  file_set = set(files)
+  children: dict[str | None, list[str]] = {}
+  for file in files:
+    children.setdefault(get_parent_file(file, file_set), []).append(file)
+  for siblings in children.values():
+    siblings.sort(key=lambda file: (file_to_order.get(file, len(overrides)), file))
+
+  # Depth first so each file directly follows its parent, which the menu in compiler.js needs.
+  data_list: list[JsonDataFile] = []
+  stack = [(file, 0) for file in reversed(children.get(None, []))]
+  while stack:
+    (file, depth) = stack.pop()
+    # The overview and the domains below it are all shown at the top of the menu.
+    level = max(0, depth - 1)
+    data_list.append(
+        _get_file_metadata(file, level, root_parents.get(file), file_to_override.get(file))
+    )
+    stack.extend((child, depth + 1) for child in reversed(children.get(file, [])))
+  return data_list
+
+
+DATA_LIST = discover()
+
+
+def get_full_filename(file_metadata: JsonDataFile) -> str:
+  return os.path.join(DATA_DIR, f'{file_metadata.file}{_DATA_SUFFIX}')
+
+
+def _read_json_items(full_filename: str) -> list[tuple[int, typing.Any]]:
+  return list(jsonc.iter_items(full_filename))
+
+
+def _iter_json_items(
+    workers: int
+) -> typing.Iterator[tuple[JsonDataFile, typing.Iterable[tuple[int, typing.Any]]]]:
+  full_filenames = [get_full_filename(file_metadata) for file_metadata in DATA_LIST]
+
+  if workers <= 1:
+    # Items are parsed one at a time as they are used so only one node is held in memory.
+    for (file_metadata, full_filename) in zip(DATA_LIST, full_filenames):
+      yield (file_metadata, jsonc.iter_items(full_filename))
+    return
+
+  # The files are parsed out of order but `map` returns them in `DATA_LIST` order.
+  with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+    yield from zip(DATA_LIST, executor.map(_read_json_items, full_filenames))
+
+
+def _process_file(
+    file_metadata: JsonDataFile,
+    json_data: typing.Iterable[tuple[int, typing.Any]],
+    per_node_function: typing.Callable[[JsonDataFile, common.NodeRaw], None],
+) -> None:
+  full_filename = get_full_filename(file_metadata)
+  print(f'Validating: {full_filename}')
+  with profiler.span(file_metadata.file, 'file') as profile_args:
+    start_ns = time.perf_counter_ns()
+    node_ns = 0
+    node_count = 0
+    try:
+      for (line, item) in json_data:
+        try:
+          n = common.NodeRaw(**item)  # pyright: ignore[reportCallIssue]
+
+          node_start_ns = time.perf_counter_ns()
+          per_node_function(file_metadata, n)
+          node_ns += time.perf_counter_ns() - node_start_ns
+          node_count += 1
+        except Exception as e:
+          raise ValueError(f'Error building node from JSON on line {line}: "{item}"') from e
+
+    except jsonc.JsoncError:
+      raise
+    except Exception as e:
+      raise ValueError(f'Invalid data in file "{full_filename}" thowing error: {e}') from e
+
+    if profiler.is_enabled():
+      # With workers this is the wait for the file to be parsed rather than the parse itself.
+      parse_ns = time.perf_counter_ns() - start_ns - node_ns
+      profile_args['parse_seconds'] = round(parse_ns / 1e9, 6)
+      profile_args['nodes'] = node_count
+      profile_args['bytes'] = os.path.getsize(full_filename)
+      profiler.add('bytes_read', profile_args['bytes'])
+
+
+def process_file(
+    file_metadata: JsonDataFile,
+    per_node_function: typing.Callable[[JsonDataFile, common.NodeRaw], None],
+) -> None:
+  # For rereading a single file that changed.
+  _process_file(
+      file_metadata, jsonc.iter_items(get_full_filename(file_metadata)), per_node_function
+  )
+
+
+def process_files(
+    per_node_function: typing.Callable[[JsonDataFile, common.NodeRaw], None],
+    workers: int = 1,
 ) -> None:  # type: ignore
-  for file_metadata in DATA_LIST:
-    full_filename = os.path.join(DATA_DIR, f'{file_metadata.file}.jsonc')
-    print(f'Validating: {full_filename}')
-    with open(full_filename, 'r', encoding='utf8') as json_file:
-      json_file_comment_stripped: str = ''.join(
-        l if not l.lstrip().startswith('//') else '' for l in list(json_file)
-      )
-      try:
-        json_data: list[object] = json.loads(json_file_comment_stripped)
-
-        for item in json_data:
-          try:
-            n = common.NodeRaw(**item)  # pyright: ignore[reportCallIssue]
-
-            per_node_function(n)
-          except Exception as e:
-            raise ValueError(f'Error building node from JSON: "{item}"') from e
-
-      except Exception as e:
-        print(json_file_comment_stripped)
-        raise ValueError(f'Invalid data in file "{full_filename}" thowing error: {e}') from e
+  for (file_metadata, json_data) in _iter_json_items(workers):
+    _process_file(file_metadata, json_data, per_node_function)
 
   print('Data files are valid')
+
+
+def process_nodes(
+    per_node_function: typing.Callable[[common.NodeRaw], None],
+    workers: int = 1,
+) -> None:  # type: ignore
+  process_files(lambda _, n: per_node_function(n), workers=workers)
@@ -0,0 +1,109 @@
+import struct
+import typing
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_GIF_SIGNATURES = (b'GIF87a', b'GIF89a')
+_HEADER_SIZE = 32
+
+# Start of frame markers hold the size. DHT, JPG and DAC share the range but do not.
+_JPEG_SOF_MARKERS = frozenset(range(0xc0, 0xd0)) - {0xc4, 0xc8, 0xcc}
+# Markers that are not followed by a segment length.
+_JPEG_STANDALONE_MARKERS = frozenset(range(0xd0, 0xda)) | {0x01}
+_EXIF_ORIENTATION_TAG = 0x0112
+# Orientations 5 to 8 are rotated by 90 degrees, which browsers apply when drawing the image.
+_TRANSPOSED_ORIENTATIONS = frozenset([5, 6, 7, 8])
+
+
+def _get_webp_size(header: bytes) -> tuple[int, int] | None:
+  chunk_type = header[12:16]
+  if chunk_type == b'VP8 ' and header[23:26] == b'\x9d\x01\x2a':
+    (width, height) = struct.unpack('<HH', header[26:30])
+    return (width & 0x3fff, height & 0x3fff)
+  if chunk_type == b'VP8L' and header[20] == 0x2f:
+    bits = int.from_bytes(header[21:25], 'little')
+    return ((bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1)
+  if chunk_type == b'VP8X':
+    width = int.from_bytes(header[24:27], 'little') + 1
+    height = int.from_bytes(header[27:30], 'little') + 1
+    return (width, height)
+  return None
+
+
+def _get_exif_orientation(segment: bytes) -> int | None:
+  if not segment.startswith(b'Exif\0\0'):
+    return None
+  tiff = segment[6:]
+  byte_order = {b'II': '<', b'MM': '>'}.get(tiff[:2])
+  if byte_order is None or len(tiff) < 8:
+    return None
+
+  (ifd_offset,) = struct.unpack(byte_order + 'I', tiff[4:8])
+  if ifd_offset + 2 > len(tiff):
+    return None
+  (entry_count,) = struct.unpack(byte_order + 'H', tiff[ifd_offset:ifd_offset + 2])
+  for i in range(entry_count):
+    entry_start = ifd_offset + 2 + 12 * i
+    entry = tiff[entry_start:entry_start + 12]
+    if len(entry) < 12:
+      return None
+    (tag,) = struct.unpack(byte_order + 'H', entry[:2])
+    if tag == _EXIF_ORIENTATION_TAG:
+      (orientation,) = struct.unpack(byte_order + 'H', entry[8:10])
+      return orientation
+  return None
+
+
+def _get_jpeg_size(image_file: typing.BinaryIO) -> tuple[int, int] | None:
+  # Walks the segments from the start of the file, skipping over their contents.
+  orientation = None
+  while True:
+    byte = image_file.read(1)
+    if not byte:
+      return None
+    if byte != b'\xff':
+      continue
+    marker = image_file.read(1)
+    # Any number of 0xFF bytes can pad before the marker.
+    while marker == b'\xff':
+      marker = image_file.read(1)
+    if not marker:
+      return None
+    marker_id = marker[0]
+    if marker_id in _JPEG_STANDALONE_MARKERS or marker_id == 0x00:
+      continue
+
+    length_bytes = image_file.read(2)
+    if len(length_bytes) < 2:
+      return None
+    (length,) = struct.unpack('>H', length_bytes)
+    if marker_id in _JPEG_SOF_MARKERS:
+      frame = image_file.read(5)
+      if len(frame) < 5:
+        return None
+      (height, width) = struct.unpack('>HH', frame[1:5])
+      if orientation in _TRANSPOSED_ORIENTATIONS:
+        return (height, width)
+      return (width, height)
+    if marker_id == 0xe1 and orientation is None:
+      orientation = _get_exif_orientation(image_file.read(length - 2))
+      continue
+    if marker_id == 0xda:
+      # The compressed data starts, so there was no frame header.
+      return None
+    image_file.seek(length - 2, 1)
+
+
+def get_image_size(path: str) -> tuple[int, int] | None:
+  # Only the headers are read, so this is quick and does not need Pillow.
+  with open(path, 'rb') as image_file:
+    header = image_file.read(_HEADER_SIZE)
+    if header.startswith(_PNG_SIGNATURE) and header[12:16] == b'IHDR':
+      return typing.cast(tuple[int, int], struct.unpack('>II', header[16:24]))
+    if header[:6] in _GIF_SIGNATURES:
+      return typing.cast(tuple[int, int], struct.unpack('<HH', header[6:10]))
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP' and len(header) >= 30:
+      return _get_webp_size(header)
+    if header[:2] == b'\xff\xd8':
+      image_file.seek(2)
+      return _get_jpeg_size(image_file)
+  return None
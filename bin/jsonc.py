@@ -0,0 +1,210 @@
+import json
+import re
+import typing
+
+# Strings can not span lines in JSON so the data is tokenized one line at a time.
+_TOKEN_REGEX = re.compile(
+    r'(?P<string>"(?:[^"\\\n]|\\.)*")'
+    r'|(?P<unterminated>")'
+    r'|(?P<comment>//|/\*)'
+    r'|(?P<space>\s+)'
+    r'|(?P<punctuation>[\[\]{},:])'
+    r'|(?P<literal>[^"/\[\]{},:\s]+|/)'
+)
+# Lines without these characters can not open or close a value or start a comment.
+_STRUCTURE_REGEX = re.compile(r'[/\[\]{}]')
+
+
+class JsoncError(ValueError):
+
+  def __init__(self, message: str, filename: str, line: int, column: int) -> None:
+    super().__init__(f'{filename}:{line}:{column}: {message}')
+    self.message = message
+    self.filename = filename
+    self.line = line
+    self.column = column
+
+  def __reduce__(self) -> tuple[typing.Any, ...]:
+    # Rebuilt from its fields so errors in worker processes reach the caller with their position.
+    return (JsoncError, (self.message, self.filename, self.line, self.column))
+
+
+def _blank(text: str) -> str:
+  # Comments are replaced with spaces so columns in the element still match the file.
+  if text.endswith('\n'):
+    return ' ' * (len(text) - 1) + '\n'
+  return ' ' * len(text)
+
+
+class _ItemReader:  #pylint: disable=too-many-instance-attributes
+
+  def __init__(self, filename: str) -> None:
+    self._filename = filename
+    self._depth = 0
+    self._started = False
+    self._finished = False
+    self._block_comment_start: tuple[int, int] | None = None
+    self._expect_comma = False
+    # The text of the top level item being read, its start position and the index in `_parts` of a
+    # comma that is dropped if it turns out to be a trailing comma.
+    self._parts: list[str] = []
+    self._item_start: tuple[int, int] | None = None
+    self._pending_comma: int | None = None
+
+  def _error(self, message: str, line: int, column: int) -> JsoncError:
+    return JsoncError(message, self._filename, line, column)
+
+  def _start_item(self, token: str, line: int, column: int) -> None:
+    if self._expect_comma:
+      raise self._error('Expected "," between items', line, column)
+    self._parts = [token]
+    self._item_start = (line, column)
+    self._pending_comma = None
+
+  def _finish_item(self) -> tuple[int, typing.Any]:
+    assert self._item_start is not None
+    (start_line, start_column) = self._item_start
+    text = ''.join(self._parts)
+    self._parts = []
+    self._item_start = None
+    self._expect_comma = True
+    try:
+      return (start_line, json.loads(text))
+    except json.JSONDecodeError as e:
+      column = e.colno + (start_column - 1 if e.lineno == 1 else 0)
+      raise self._error(e.msg, start_line + e.lineno - 1, column) from e
+
+  def read_line(self, text: str, line: int) -> typing.Iterator[tuple[int, typing.Any]]:
+    in_item = self._item_start is not None
+    position = 0
+    length = len(text)
+
+    if self._depth > 1 and not self._block_comment_start and not _STRUCTURE_REGEX.search(text):
+      # Most lines are a key and value inside a node, which only need the trailing comma tracked.
+      content = text.rstrip()
+      if content.endswith(','):
+        self._parts.append(content[:-1])
+        self._parts.append(',')
+        self._pending_comma = len(self._parts) - 1
+        self._parts.append(text[len(content):])
+      else:
+        self._parts.append(text)
+        if content.strip():
+          self._pending_comma = None
+      return
+
+    while position < length:
+      if self._block_comment_start:
+        end = text.find('*/', position)
+        comment_end = length if end < 0 else end + 2
+        if in_item:
+          self._parts.append(_blank(text[position:comment_end]))
+        if end >= 0:
+          self._block_comment_start = None
+        position = comment_end
+        continue
+
+      column = position + 1
+      m = _TOKEN_REGEX.match(text, position)
+      assert m is not None
+      token = m.group()
+      kind = m.lastgroup
+      position = m.end()
+
+      if kind == 'space':
+        if in_item:
+          self._parts.append(token)
+        continue
+
+      if kind == 'comment':
+        if token == '//':
+          if in_item:
+            self._parts.append(_blank(text[m.start():]))
+          break
+        self._block_comment_start = (line, column)
+        if in_item:
+          self._parts.append('  ')
+        continue
+
+      if kind == 'unterminated':
+        raise self._error('Unterminated string', line, column)
+
+      if self._finished:
+        raise self._error('Unexpected data after the closing "]"', line, column)
+
+      if self._depth == 0:
+        if token != '[':
+          raise self._error('Expected the data to be a list starting with "["', line, column)
+        self._depth = 1
+        self._started = True
+        continue
+
+      if self._depth == 1:
+        if token == ',':
+          if not self._expect_comma:
+            raise self._error('Unexpected ","', line, column)
+          if in_item:
+            yield self._finish_item()
+            in_item = False
+          self._expect_comma = False
+          continue
+
+        if token == ']':
+          if in_item:
+            yield self._finish_item()
+            in_item = False
+          self._depth = 0
+          self._finished = True
+          continue
+
+        if token in '}:':
+          raise self._error(f'Unexpected "{token}"', line, column)
+
+        self._start_item(token, line, column)
+        if token in '[{':
+          self._depth += 1
+          in_item = True
+        else:
+          # A string or literal is the whole item.
+          yield self._finish_item()
+        continue
+
+      # Inside a top level item.
+      if token in ']}':
+        if self._pending_comma is not None:
+          # Drop the trailing comma.
+          self._parts[self._pending_comma] = ' '
+        self._pending_comma = None
+        self._parts.append(token)
+        self._depth -= 1
+        if self._depth == 1:
+          yield self._finish_item()
+          in_item = False
+        continue
+
+      self._parts.append(token)
+      if token == ',':
+        self._pending_comma = len(self._parts) - 1
+        continue
+
+      self._pending_comma = None
+      if token in '[{':
+        self._depth += 1
+
+  def finish(self, line: int) -> None:
+    if self._block_comment_start:
+      raise self._error('Unterminated block comment', *self._block_comment_start)
+    if not self._started:
+      raise self._error('Expected the data to be a list starting with "["', line, 1)
+    if not self._finished:
+      raise self._error('Unexpected end of file before the closing "]"', line, 1)
+
+
+def iter_items(full_filename: str) -> typing.Iterator[tuple[int, typing.Any]]:
+  # Yields the line each top level item starts on along with the parsed item.
+  reader = _ItemReader(full_filename)
+  line = 0
+  with open(full_filename, 'r', encoding='utf8') as jsonc_file:
+    for (line, text) in enumerate(jsonc_file, start=1):
+      yield from reader.read_line(text, line)
+  reader.finish(max(line, 1))
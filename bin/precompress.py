@@ -0,0 +1,60 @@
+import gzip
+import os
+
+import profiler
+
+GZIP_SUFFIX = '.gz'
+BROTLI_SUFFIX = '.br'
+
+
+def brotli_available() -> bool:
+  try:
+    import brotli  #pylint: disable=import-outside-toplevel,unused-import
+  except ImportError:
+    return False
+  return True
+
+
+def get_sibling_paths(path: str) -> list[str]:
+  suffixes = [GZIP_SUFFIX, BROTLI_SUFFIX] if brotli_available() else [GZIP_SUFFIX]
+  return [path + suffix for suffix in suffixes]
+
+
+def _is_up_to_date(path: str, sibling_path: str) -> bool:
+  return os.path.isfile(sibling_path) and os.path.getmtime(sibling_path) >= os.path.getmtime(path)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+  temp_path = f'{path}.tmp'
+  with open(temp_path, 'wb') as f:
+    f.write(data)
+  os.replace(temp_path, path)
+  profiler.add('bytes_written', len(data))
+
+
+def write_compressed_siblings(path: str) -> list[str]:
+  # Static hosts can serve these as they are rather than compressing on every request.
+  with open(path, 'rb') as f:
+    data = f.read()
+
+  sibling_paths = get_sibling_paths(path)
+  for sibling_path in sibling_paths:
+    if _is_up_to_date(path, sibling_path):
+      continue
+
+    if sibling_path.endswith(BROTLI_SUFFIX):
+      import brotli  #pylint: disable=import-outside-toplevel
+
+      compressed = brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+    else:
+      # A fixed mtime keeps the output the same for the same input.
+      compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    _write_atomic(sibling_path, compressed)
+
+  return sibling_paths
+
+
+def remove_compressed_siblings(path: str) -> None:
+  for suffix in (GZIP_SUFFIX, BROTLI_SUFFIX):
+    if os.path.isfile(path + suffix):
+      os.remove(path + suffix)
@@ -0,0 +1,272 @@
+from dataclasses import dataclass, field
+import functools
+import html
+import os
+import typing
+import urllib.parse
+
+import common
+import data_files
+import image_size
+import sprite_atlas
+import taxonomy
+
+# Matches `QueryParams._DEFAULT_ROOT` in compiler.js, so the page opens on the tree it includes.
+DEFAULT_TREE_RANGE = 'animalia'
+
+_LUCA = 'LUCA'
+_LUCA_TAG = 'The theoretical Last Universal Common Ancestor.'
+
+_WIKIPEDIA_PREFIX = 'https://en.wikipedia.org/wiki/'
+_INATURALIST_PREFIX = 'https://www.inaturalist.org/search?source%5B%5D=taxa&q='
+_EOL_PREFIX = 'https://eol.org/search?utf8=%E2%9C%93&q='
+_ANIMALDIVERSITY_PREFIX = 'https://animaldiversity.org/accounts/'
+_NCSTATE_PREFIX = 'https://genent.cals.ncsu.edu/insect-identification/order-'
+_IPA_READER_PREFIX = 'https://ipa-reader.com/?voice=Russell&text='
+
+
+def get_tree_range(file_metadata: data_files.JsonDataFile) -> str:
+  return file_metadata.taxa.lower()
+
+
+@functools.cache
+def _get_cached_image_size(path: str, mtime_ns: int, size: int) -> tuple[int, int] | None:
+  del mtime_ns, size  # Only part of the cache key.
+  return image_size.get_image_size(path)
+
+
+def get_image_size(path: str) -> tuple[int, int] | None:
+  try:
+    stat = os.stat(path)
+  except FileNotFoundError:
+    return None
+  return _get_cached_image_size(path, stat.st_mtime_ns, stat.st_size)
+
+
+def _escape(value: str) -> str:
+  return html.escape(value, quote=True)
+
+
+@dataclass(kw_only=True)
+class TreeRenderer:
+  # Renders the same HTML as `TreeBuilderAsTreeList` in compiler.js, so the page can show a tree
+  # without building it node by node. Changes to either need to be made to both.
+  model: taxonomy.Taxonomy
+  # The served thumbnail paths from `regenerate_index.get_thumbnail_map`, already URL escaped.
+  thumbnail_map: dict[str, str]
+  file_to_parent_file: dict[str, str | None]
+  thumbnail_dir: str
+  # From `regenerate_index.get_image_info`, the size and placeholder colour of each thumbnail.
+  image_info: dict[str, list[typing.Any]] = field(default_factory=dict)
+  # From `regenerate_index.get_sprite_map`, for the trees that have sprite atlases.
+  sprite_map: dict[str, dict[str, typing.Any]] = field(default_factory=dict)
+  _taxa_to_file_metadata: dict[str, data_files.JsonDataFile] = field(default_factory=dict)
+
+  def __post_init__(self) -> None:
+    self._taxa_to_file_metadata = {
+        get_tree_range(file_metadata): file_metadata for file_metadata in data_files.DATA_LIST
+    }
+
+  def _get_img_src_and_path(self, img: common.Image) -> tuple[str, str]:
+    if img.local_filename in self.thumbnail_map:
+      served = self.thumbnail_map[img.local_filename]
+      served_path = os.path.join(self.thumbnail_dir, urllib.parse.unquote(served))
+      return ('thumbnails/' + served, served_path)
+    return (
+        'thumbnails/' + img.remote_url.rsplit('/', 1)[1],
+        os.path.join(self.thumbnail_dir, img.local_filename),
+    )
+
+  def _render_icon_button(self, prefix: str, icon_path: str, name: str) -> str:
+    return (
+        f'<a href="{_escape(prefix + name)}" target="_blank" class="icon-button">'
+        f'<img src="{_escape(icon_path)}"></a>'
+    )
+
+  def _render_name(self, n: common.NodeRaw, tree_range: str, domain: str) -> str:
+    parts = [f'<span><span>{_escape(n.name)}</span>']
+    parts.append(
+        self._render_icon_button(_WIKIPEDIA_PREFIX, './thumbnails/icon_wikipedia.jpg', n.name)
+    )
+    parts.append(
+        self._render_icon_button(_INATURALIST_PREFIX, './thumbnails/icon_inaturalist.png', n.name)
+    )
+    parts.append(self._render_icon_button(_EOL_PREFIX, './thumbnails/icon_eol.png', n.name))
+    if domain == 'animalia':
+      parts.append(
+          self._render_icon_button(
+              _ANIMALDIVERSITY_PREFIX, './thumbnails/icon_animaldiversity.png', n.name
+          )
+      )
+    if n.rank == 'Order' and tree_range == 'insecta':
+      parts.append(
+          self._render_icon_button(_NCSTATE_PREFIX, './thumbnails/icon_ncstate.png', n.name)
+      )
+    if n.ipa:
+      parts.append(
+          f'<span> (/<a href="{_escape(_IPA_READER_PREFIX + n.ipa)}" target="_blank">'
+          f'{_escape(n.ipa)}</a>/)</span>'
+      )
+    parts.append('</span>')
+    return ''.join(parts)
+
+  def _render_float_right(self, n: common.NodeRaw, parent_tree_range: str | None) -> str:
+    parts = ['<span class="float-right">']
+    taxa_as_id = n.name.lower()
+    # The page opens the tree named by the button with a single listener on the tree.
+    if parent_tree_range:
+      parts.append(f'<button data-open-tree="{_escape(parent_tree_range)}">See parent</button>')
+    elif taxa_as_id in self._taxa_to_file_metadata:
+      parts.append(f'<button data-open-tree="{_escape(taxa_as_id)}">See children</button>')
+    if n.rank:
+      parts.append(f'<span class="badge">{_escape(n.rank)}</span>')
+    parts.append('</span>')
+    return ''.join(parts)
+
+  def _render_img(self, img: common.Image, sprites: dict[str, typing.Any] | None) -> str:
+    info = self.image_info.get(img.local_filename)
+    # Shown until the image loads, which matters most on slow connections.
+    placeholder_style = f'background-color:{info[2]}' if info and info[2] else ''
+
+    sprite = sprites['images'].get(img.local_filename) if sprites else None
+    if sprite:
+      # Every image in the tree shares a few atlas requests instead of one request each.
+      style = sprite_atlas.get_sprite_style(sprites['atlases'][sprite[0]], sprite)
+      if placeholder_style:
+        style += ';' + placeholder_style
+      return f'<span class="taxa-sprite" role="img" style="{_escape(style)}"></span>'
+
+    (src, path) = self._get_img_src_and_path(img)
+    attributes = f'src="{_escape(src)}" class="taxa-img" loading="lazy"'
+    size = (info[0], info[1]) if info else get_image_size(path)
+    if size:
+      # Lets the page reserve the space before the image loads.
+      attributes += f' width="{size[0]}" height="{size[1]}"'
+    if placeholder_style:
+      attributes += f' style="{_escape(placeholder_style)}"'
+    return f'<img {attributes}>'
+
+  def _render_images(self, imgs: list[str], sprites: dict[str, typing.Any] | None = None) -> str:
+    parts = ['<div>']
+    for img_url in imgs:
+      if not img_url:
+        continue
+      img = common.get_image(img_url)
+      img_html = self._render_img(img, sprites)
+      try:
+        attribution_url = img.attribution_url
+      except ValueError:
+        parts.append(img_html)
+        continue
+      parts.append(f'<a href="{_escape(attribution_url)}" target="_blank">{img_html}</a>')
+    parts.append('</div>')
+    return ''.join(parts)
+
+  def _render_tree_box(
+      self,
+      n: common.NodeRaw,
+      tree_range: str,
+      domain: str,
+      parent_tree_range: str | None = None,
+      sprites: dict[str, typing.Any] | None = None,
+  ) -> str:
+    parts = [
+        '<div class="outer_tree_box">',
+        f'<div id="{_escape(tree_range)}_{_escape(n.name.lower())}" class="tree_box">',
+        self._render_name(n, tree_range, domain),
+        self._render_float_right(n, parent_tree_range),
+    ]
+    if n.common:
+      parts.append(f'<span class="common_names">({_escape(", ".join(n.common))})</span>')
+    if n.tag:
+      parts.append(f'<p class="tag">{_escape(n.tag)}</p>')
+    if n.imgs is not None:
+      parts.append(self._render_images(n.imgs, sprites))
+    parts.append('</div></div>')
+    return ''.join(parts)
+
+  def render(self, file_metadata: data_files.JsonDataFile) -> str:
+    nodes = self.model.file_to_nodes.get(file_metadata.file, [])
+    if not nodes:
+      return ''
+
+    tree_range = get_tree_range(file_metadata)
+    sprites = self.sprite_map.get(file_metadata.file)
+    root_name = nodes[0].parent
+    root_file_metadata = self._taxa_to_file_metadata.get(root_name.lower())
+    domain = root_file_metadata.domain if root_file_metadata else ''
+
+    parent_to_children: dict[str, list[common.NodeRaw]] = {}
+    for n in nodes:
+      parent_to_children.setdefault(n.parent, []).append(n)
+
+    if root_name == _LUCA:
+      # The page makes up a node for LUCA, and its missing parent shows up as "undefined" in the ID.
+      root = common.NodeRaw(name=_LUCA, parent='undefined', rank='', tag=_LUCA_TAG)
+    else:
+      root = self.model.taxa_to_node[root_name]
+
+    # The root is listed in the tree above, which its button opens.
+    parent_tree_range = None
+    parent_file = self.file_to_parent_file.get(file_metadata.file)
+    if root_name.lower() in self._taxa_to_file_metadata and parent_file:
+      parent_tree_range = next(
+          get_tree_range(parent_metadata)
+          for parent_metadata in data_files.DATA_LIST
+          if parent_metadata.file == parent_file
+      )
+
+    # Each entry is a node to open, or the closing tags once its children are done.
+    parts = [f'<ul class="tree" data-tree-range="{_escape(tree_range)}">']
+    stack: list[tuple[common.NodeRaw, str | None] | str] = [(root, parent_tree_range)]
+    while stack:
+      entry = stack.pop()
+      if isinstance(entry, str):
+        parts.append(entry)
+        continue
+
+      (n, button_parent_tree_range) = entry
+      tree_box = self._render_tree_box(
+          n, tree_range, domain, parent_tree_range=button_parent_tree_range, sprites=sprites
+      )
+      children = parent_to_children.get(n.name)
+      if not children:
+        parts.append(f'<li><div class="tree_label"></div>{tree_box}</li>')
+        continue
+
+      expander_id = _escape(f'{n.parent}_{n.name}')
+      parts.append(
+          f'<li><input type="checkbox" checked id="{expander_id}">'
+          f'<label class="tree_label" for="{expander_id}"></label>{tree_box}<ul>'
+      )
+      stack.append('</ul></li>')
+      stack.extend((child, None) for child in reversed(children))
+    parts.append('</ul>')
+    return ''.join(parts)
+
+
+def render_trees(
+    model: taxonomy.Taxonomy,
+    thumbnail_map: dict[str, str],
+    file_to_parent_file: dict[str, str | None],
+    thumbnail_dir: str,
+    image_info: dict[str, list[typing.Any]] | None = None,
+    sprite_map: dict[str, dict[str, typing.Any]] | None = None,
+    reuse: dict[str, str] | None = None,
+) -> dict[str, str]:
+  # Files in `reuse` are known to be unchanged so their HTML is not rendered again.
+  renderer = TreeRenderer(
+      model=model,
+      thumbnail_map=thumbnail_map,
+      file_to_parent_file=file_to_parent_file,
+      thumbnail_dir=thumbnail_dir,
+      image_info=image_info or {},
+      sprite_map=sprite_map or {},
+  )
+  file_to_html: dict[str, str] = {}
+  for file_metadata in data_files.DATA_LIST:
+    if reuse and file_metadata.file in reuse:
+      file_to_html[file_metadata.file] = reuse[file_metadata.file]
+    else:
+      file_to_html[file_metadata.file] = renderer.render(file_metadata)
+  return file_to_html
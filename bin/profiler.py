@@ -0,0 +1,158 @@
+from dataclasses import dataclass, field
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import typing
+
+FORMATS = ['json', 'trace']
+
+
+@dataclass(kw_only=True)
+class Span:
+  name: str
+  category: str
+  start_ns: int
+  duration_ns: int
+  thread_id: int
+  args: dict[str, typing.Any]
+
+
+@dataclass(kw_only=True)
+class Profile:
+  start_ns: int = field(default_factory=time.perf_counter_ns)
+  spans: list[Span] = field(default_factory=list)
+  counters: dict[str, int] = field(default_factory=dict)
+  _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+  def add_span(self, span: Span) -> None:
+    with self._lock:
+      self.spans.append(span)
+
+  def add(self, counter: str, amount: int) -> None:
+    with self._lock:
+      self.counters[counter] = self.counters.get(counter, 0) + amount
+
+  def to_json(self) -> dict[str, typing.Any]:
+    by_category: dict[str, list[dict[str, typing.Any]]] = {}
+    for span in sorted(self.spans, key=lambda s: s.start_ns):
+      by_category.setdefault(span.category, []).append({
+          'name': span.name,
+          'seconds': round(span.duration_ns / 1e9, 6),
+      } | span.args)
+
+    return {
+        'seconds': round((time.perf_counter_ns() - self.start_ns) / 1e9, 6),
+        **get_memory_args(),
+        'counters': dict(sorted(self.counters.items())),
+        'spans': by_category,
+    }
+
+  def to_trace(self) -> dict[str, typing.Any]:
+    # The Chrome trace event format, which chrome://tracing, Perfetto and speedscope can show as a
+    # flame graph.
+    thread_ids: dict[int, int] = {}
+    pid = os.getpid()
+    events: list[dict[str, typing.Any]] = []
+    for span in sorted(self.spans, key=lambda s: s.start_ns):
+      events.append({
+          'name': span.name,
+          'cat': span.category,
+          'ph': 'X',
+          'ts': (span.start_ns - self.start_ns) / 1000,
+          'dur': span.duration_ns / 1000,
+          'pid': pid,
+          'tid': thread_ids.setdefault(span.thread_id, len(thread_ids)),
+          'args': span.args,
+      })
+    events.append({
+        'name': 'counters',
+        'ph': 'C',
+        'ts': (time.perf_counter_ns() - self.start_ns) / 1000,
+        'pid': pid,
+        'args': self.counters | get_memory_args(),
+    })
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+# Only set when profiling is turned on, so the hooks cost almost nothing in a normal build.
+_PROFILE: Profile | None = None
+
+
+def enable() -> Profile:
+  global _PROFILE  #pylint: disable=global-statement
+  _PROFILE = Profile()
+  return _PROFILE
+
+
+def is_enabled() -> bool:
+  return _PROFILE is not None
+
+
+def get_peak_rss_kib(children: bool = False) -> int | None:
+  # The main process alone, or with `children` the largest of the finished worker processes such as
+  # the pools that parse, transcode and pack sprites. They are not added together.
+  try:
+    import resource  #pylint: disable=import-outside-toplevel
+  except ImportError:
+    # Not available on Windows.
+    return None
+  who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+  peak = resource.getrusage(who).ru_maxrss
+  # Linux reports KiB and macOS reports bytes.
+  return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def get_memory_args() -> dict[str, int | None]:
+  return {
+      'peak_rss_kib': get_peak_rss_kib(),
+      'peak_child_rss_kib': get_peak_rss_kib(children=True),
+  }
+
+
+@contextlib.contextmanager
+def span(name: str,
+         category: str = 'step',
+         **args: typing.Any) -> typing.Iterator[dict[str, typing.Any]]:
+  # Callers can add to the yielded args, such as counts only known at the end.
+  if _PROFILE is None:
+    yield args
+    return
+
+  profile = _PROFILE
+  start_ns = time.perf_counter_ns()
+  try:
+    yield args
+  finally:
+    profile.add_span(
+        Span(
+            name=name,
+            category=category,
+            start_ns=start_ns,
+            duration_ns=time.perf_counter_ns() - start_ns,
+            thread_id=threading.get_ident(),
+            args=args | get_memory_args(),
+        )
+    )
+
+
+def add(counter: str, amount: int) -> None:
+  if _PROFILE is not None:
+    _PROFILE.add(counter, amount)
+
+
+def add_written(path: str) -> None:
+  if _PROFILE is not None:
+    _PROFILE.add('bytes_written', os.path.getsize(path))
+
+
+def write(path: str, profile_format: str = 'json') -> None:
+  if _PROFILE is None:
+    raise ValueError('Profiling was not enabled.')
+
+  profile = _PROFILE.to_trace() if profile_format == 'trace' else _PROFILE.to_json()
+  with open(path, 'w', encoding='utf8') as profile_file:
+    json.dump(profile, profile_file, indent=2)
+  print(f'Profile written to: {path}')
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+
+import argparse
+import os
+import sys
+import typing
+
+import compiled_tree
+
+ROOT_NAME = 'LUCA'
+
+# Lines are written in blocks of this many rather than one `print` per node.
+_WRITE_BATCH_SIZE = 1000
+
+
+def get_node_ids(tree: compiled_tree.CompiledTree, name: str) -> list[int]:
+  # `LUCA` is not a node, so it stands for every root.
+  if name == ROOT_NAME:
+    return [
+        node_id for node_id in range(tree.node_count)
+        if tree.arrays['parent'][node_id] == compiled_tree.NONE
+    ]
+
+  lower_name = name.lower()
+  return [
+      node_id for node_id in range(tree.node_count) if tree.get_name(node_id).lower() == lower_name
+  ]
+
+
+def iter_subtree(
+    tree: compiled_tree.CompiledTree, root_id: int, max_depth: int | None = None
+) -> typing.Iterator[tuple[int, int]]:
+  # Yields each node ID and its depth below the root, depth first in data file order. An explicit
+  # stack avoids the recursion limit on deep trees.
+  stack = [(root_id, 0)]
+  while stack:
+    (node_id, depth) = stack.pop()
+    yield (node_id, depth)
+    if max_depth is not None and depth >= max_depth:
+      continue
+    children = list(tree.iter_children(node_id))
+    stack.extend((child_id, depth + 1) for child_id in reversed(children))
+
+
+def iter_lineage(tree: compiled_tree.CompiledTree, node_id: int) -> list[int]:
+  # From the root down to the node.
+  lineage: list[int] = []
+  current = node_id
+  # The data is validated to have no loops, but a bad file should not hang the query.
+  while current != compiled_tree.NONE and len(lineage) <= tree.node_count:
+    lineage.append(current)
+    current = tree.arrays['parent'][current]
+  return lineage[::-1]
+
+
+def format_node(tree: compiled_tree.CompiledTree, node_id: int, depth: int = 0) -> str:
+  line = '  ' * depth + f' - {tree.get_string(tree.arrays["rank"][node_id])} - '
+  line += tree.get_name(node_id)
+  ipa = tree.get_string(tree.arrays['ipa'][node_id])
+  if ipa:
+    line += f' ({ipa})'
+  return line
+
+
+def write_lines(
+    lines: typing.Iterable[str], limit: int | None = None, out: typing.TextIO | None = None
+) -> int:
+  if out is None:
+    out = sys.stdout
+  written = 0
+  batch: list[str] = []
+  for line in lines:
+    if limit is not None and written >= limit:
+      break
+    batch.append(line)
+    written += 1
+    if len(batch) >= _WRITE_BATCH_SIZE:
+      out.write('\n'.join(batch) + '\n')
+      batch.clear()
+  if batch:
+    out.write('\n'.join(batch) + '\n')
+  return written
+
+
+def iter_subtree_lines(
+    tree: compiled_tree.CompiledTree,
+    root_ids: list[int],
+    max_depth: int | None = None,
+    rank: str | None = None,
+) -> typing.Iterator[str]:
+  rank_id = None
+  if rank is not None:
+    lower_rank = rank.lower()
+    rank_id = next(
+        (
+            string_id for (string_id, value) in enumerate(tree.strings)
+            if value.lower() == lower_rank
+        ),
+        compiled_tree.NONE,
+    )
+
+  for root_id in root_ids:
+    for (node_id, depth) in iter_subtree(tree, root_id, max_depth):
+      if rank_id is None:
+        yield format_node(tree, node_id, depth)
+      elif tree.arrays['rank'][node_id] == rank_id:
+        # A flat list since the nodes in between are hidden.
+        yield format_node(tree, node_id)
+
+
+def iter_lineage_lines(tree: compiled_tree.CompiledTree,
+                       node_ids: list[int]) -> typing.Iterator[str]:
+  for node_id in node_ids:
+    file = tree.files[tree.arrays['file'][node_id]]
+    yield f'{tree.get_name(node_id)} in file "{file}"'
+    for (depth, ancestor_id) in enumerate(iter_lineage(tree, node_id)):
+      yield format_node(tree, ancestor_id, depth)
+
+
+def main(
+    command: str,
+    name: str = ROOT_NAME,
+    max_depth: int | None = None,
+    rank: str | None = None,
+    limit: int | None = None,
+    tree: compiled_tree.CompiledTree | None = None,
+):
+
+  if tree is None:
+    if not os.path.isfile(compiled_tree.COMPILED_TREE_FILENAME):
+      raise ValueError(
+          f'Missing compiled tree "{compiled_tree.COMPILED_TREE_FILENAME}". '
+          'Run bin/build.py to build it.'
+      )
+    tree = compiled_tree.read()
+
+  node_ids = get_node_ids(tree, name)
+  if not node_ids:
+    raise ValueError(f'No taxa named "{name}".')
+
+  if command == 'lineage':
+    lines = iter_lineage_lines(tree, node_ids)
+  else:
+    lines = iter_subtree_lines(tree, node_ids, max_depth=max_depth, rank=rank)
+
+  try:
+    write_lines(lines, limit=limit)
+    sys.stdout.flush()
+  except BrokenPipeError:
+    # Piped into something like `head` that stopped reading, which is not an error.
+    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Print part of the tree from the compiled tree built by bin/build.py.'
+  )
+  parser.add_argument(
+      'command',
+      choices=['subtree', 'lineage'],
+      help='The descendants of a taxa, or the ancestors from the root down to it.',
+  )
+  parser.add_argument(
+      'name', nargs='?', default=ROOT_NAME, help=f'A taxa name, or {ROOT_NAME} for every root.'
+  )
+  parser.add_argument('--depth', type=int, help='Only show this many levels below the taxa.')
+  parser.add_argument('--rank', help='Only show the taxa with this rank, such as Genus.')
+  parser.add_argument('--limit', type=int, help='Stop after this many lines.')
+  args = parser.parse_args()
+  main(args.command, args.name, max_depth=args.depth, rank=args.rank, limit=args.limit)
@@ -2,27 +2,291 @@
 
 from dataclasses import asdict
 
+import argparse
+import hashlib
 import json
 import os
+import re
+import typing
+import urllib.parse
 
+import common
 import data_files
+import precompress
+import prerender
+import profiler
+import search_index
+import sprite_atlas
+import taxonomy
+import thumbnail_store
 
-HTML_OUT_FILENAME = 'index.html'
+THUMBNAIL_DIR = 'thumbnails'
 
+HTML_OUT_FILENAME = 'index.html'
 
-def get_script_vars() -> str:
-  output: str = 'var data_files = ' + json.dumps(
-      data_files.DATA_LIST, default=asdict, indent=2
-  ) + '\n'
+# Each tree is written to its own chunk that the page only loads when the tree is opened.
+TREE_DATA_DIR = 'tree_data'
+_CHUNK_SUFFIX = '.js'
+
+
+def get_chunk_paths() -> list[str]:
+  if not os.path.isdir(TREE_DATA_DIR):
+    return []
+  return sorted(
+      os.path.join(TREE_DATA_DIR, filename)
+      for filename in os.listdir(TREE_DATA_DIR)
+      if filename.endswith(_CHUNK_SUFFIX)
+  )
+
+
+def _get_compact_json(value: typing.Any) -> str:
+  return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+def get_chunk(
+    nodes: list[common.NodeRaw],
+    file: str,
+    thumbnail_map: dict[str, str],
+    release: bool = False,
+    image_info: dict[str, list[typing.Any]] | None = None,
+    sprites: dict[str, typing.Any] | None = None,
+) -> str:
+  # Only the served paths and sizes for this tree's images are sent with the tree.
+  chunk_thumbnail_map: dict[str, str] = {}
+  chunk_image_info: dict[str, list[typing.Any]] = {}
+  for n in nodes:
+    for img in n.image_list:
+      if img.local_filename in thumbnail_map:
+        chunk_thumbnail_map[img.local_filename] = thumbnail_map[img.local_filename]
+      if image_info and img.local_filename in image_info:
+        chunk_image_info[img.local_filename] = image_info[img.local_filename]
+
+  # A script rather than a JSON file so the page can still load it from `file://`.
+  nodes_json = _get_compact_json([n.to_json(drop_empty=release) for n in nodes])
+  thumbnail_map_json = _get_compact_json(dict(sorted(chunk_thumbnail_map.items())))
+  image_info_json = _get_compact_json(dict(sorted(chunk_image_info.items())))
+  args = f'{_get_compact_json(file)},{nodes_json},{thumbnail_map_json},{image_info_json}'
+  if sprites:
+    args += f',{_get_compact_json(sprites)}'
+  return f'TreeData.register({args})\n'
+
+
+def get_html_chunk(file: str, tree_html: str) -> str:
+  return f'TreeData.register_html({_get_compact_json(file)},{_get_compact_json(tree_html)})\n'
+
+
+def get_search_index_chunk(
+    model: taxonomy.Taxonomy,
+    file_to_search_entries: dict[str, search_index.FileEntries] | None = None,
+) -> str:
+  index = search_index.build(model, file_to_entries=file_to_search_entries)
+  return f'SearchIndex.register({_get_compact_json(index)})\n'
+
+
+def write_chunk(name: str, chunk: str) -> str:
+  os.makedirs(TREE_DATA_DIR, exist_ok=True)
+
+  # Named by content so browsers and the service worker can cache them forever.
+  chunk_bytes = chunk.encode('utf8')
+  digest = hashlib.sha256(chunk_bytes).hexdigest()[:16]
+  chunk_path = os.path.join(TREE_DATA_DIR, f'{name}.{digest}{_CHUNK_SUFFIX}')
+  if not os.path.isfile(chunk_path):
+    # Readers only ever see a complete chunk at its final path.
+    temp_path = f'{chunk_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as chunk_file:
+      chunk_file.write(chunk_bytes)
+    os.replace(temp_path, chunk_path)
+    profiler.add('bytes_written', len(chunk_bytes))
+  return chunk_path
+
+
+def get_thumbnail_map() -> dict[str, str]:
+  # The values are used as URLs by the page so escape them here.
+  return {
+      local: urllib.parse.quote(served)
+      for (local, served) in thumbnail_store.read_thumbnail_map(THUMBNAIL_DIR).items()
+  }
+
+
+def get_image_info(model: taxonomy.Taxonomy) -> dict[str, list[typing.Any]]:
+  # Keyed by `Image.local_filename` like the thumbnail map, since that is what the page looks up.
+  thumbnail_map = thumbnail_store.read_thumbnail_map(THUMBNAIL_DIR)
+  served_to_info = thumbnail_store.read_image_info(THUMBNAIL_DIR)
+  local_to_info: dict[str, list[typing.Any]] = {}
+  for img in model.images:
+    info = served_to_info.get(thumbnail_map.get(img.local_filename, img.local_filename))
+    if info:
+      local_to_info[img.local_filename] = list(info)
+  return local_to_info
+
+
+def get_sprite_map() -> dict[str, dict[str, typing.Any]]:
+  # Only has the trees with atlases from `sprite_atlas.py`, with the atlases as page URLs.
+  sprite_url_prefix = f'thumbnails/{sprite_atlas.SPRITE_DIR}/'
+  return {
+      file: {
+          'atlases': [
+              [sprite_url_prefix + urllib.parse.quote(filename), width, height]
+              for (filename, width, height) in tree['atlases']
+          ],
+          'images': tree['images'],
+      } for (file, tree) in sprite_atlas.read_sprite_map(THUMBNAIL_DIR)['trees'].items()
+  }
+
+
+def write_chunks(
+    model: taxonomy.Taxonomy,
+    thumbnail_map: dict[str, str],
+    release: bool = False,
+    reuse: dict[str, str] | None = None,
+) -> dict[str, str]:
+  # Files in `reuse` are known to be unchanged so their chunks are not built again.
+  file_to_chunk_path: dict[str, str] = {}
+  image_info = get_image_info(model)
+  sprite_map = get_sprite_map()
   for file_metadata in data_files.DATA_LIST:
-    json_filename = f'{file_metadata.file}.jsonc'
-    with open(os.path.join(data_files.DATA_DIR, json_filename), 'r', encoding='utf8') as json_file:
-      prefix_spaces = '    '
-      output += f'{prefix_spaces}var {file_metadata.file} = {prefix_spaces.join(json_file.readlines())}\n'
+    if reuse and file_metadata.file in reuse and os.path.isfile(reuse[file_metadata.file]):
+      file_to_chunk_path[file_metadata.file] = reuse[file_metadata.file]
+      continue
+    nodes = model.file_to_nodes.get(file_metadata.file, [])
+    chunk = get_chunk(
+        nodes,
+        file_metadata.file,
+        thumbnail_map,
+        release=release,
+        image_info=image_info,
+        sprites=sprite_map.get(file_metadata.file),
+    )
+    file_to_chunk_path[file_metadata.file] = write_chunk(file_metadata.file, chunk)
+  return file_to_chunk_path
+
+
+def remove_unused_chunks(used: set[str]) -> None:
+  for chunk_path in get_chunk_paths():
+    if chunk_path not in used:
+      os.remove(chunk_path)
+      precompress.remove_compressed_siblings(chunk_path)
+
+
+def get_output_paths(release: bool = False) -> list[str]:
+  paths = [HTML_OUT_FILENAME] + get_chunk_paths()
+  if not release:
+    return paths
+  return paths + [sibling for path in paths for sibling in precompress.get_sibling_paths(path)]
+
+
+def _minify_html(html: str) -> str:
+  # There are no `pre` or `textarea` elements so whitespace only needs to separate words.
+  return re.sub(r'\s+', ' ', html).strip()
+
+
+def _get_url(path: str) -> str:
+  return path.replace(os.sep, '/')
+
+
+def get_parent_files(model: taxonomy.Taxonomy) -> dict[str, str | None]:
+  taxa_to_file: dict[str, str] = {}
+  for (file, nodes) in model.file_to_nodes.items():
+    for n in nodes:
+      taxa_to_file.setdefault(n.name, file)
+
+  # The root of each tree is shown from its metadata in the tree that lists it as a child.
+  file_to_parent_file: dict[str, str | None] = {}
+  for (file, nodes) in model.file_to_nodes.items():
+    file_to_parent_file[file] = taxa_to_file.get(nodes[0].parent) if nodes else None
+  return file_to_parent_file
+
+
+def render_trees(model: taxonomy.Taxonomy, reuse: dict[str, str] | None = None) -> dict[str, str]:
+  # Files in `reuse` are known to be unchanged, along with the root each tree shows from the tree
+  # above it, so their HTML is not rendered again.
+  with profiler.span('prerender') as profile_args:
+    file_to_html = prerender.render_trees(
+        model,
+        get_thumbnail_map(),
+        get_parent_files(model),
+        THUMBNAIL_DIR,
+        image_info=get_image_info(model),
+        sprite_map=get_sprite_map(),
+        reuse=reuse,
+    )
+    profile_args['rendered'] = len(file_to_html) - len(reuse or {})
+    profile_args['bytes'] = sum(len(tree_html) for tree_html in file_to_html.values())
+  return file_to_html
+
+
+def get_script_vars(
+    model: taxonomy.Taxonomy,
+    release: bool = False,
+    file_to_chunk_path: dict[str, str] | None = None,
+    file_to_html: dict[str, str] | None = None,
+    file_to_search_entries: dict[str, search_index.FileEntries] | None = None,
+) -> str:
+  thumbnail_map = get_thumbnail_map()
+  if file_to_chunk_path is None:
+    with profiler.span('write_chunks') as profile_args:
+      file_to_chunk_path = write_chunks(model, thumbnail_map, release=release)
+      profile_args['chunks'] = len(file_to_chunk_path)
+  if file_to_html is None:
+    file_to_html = render_trees(model)
+  # Separate from the data so opening a tree does not also fetch the HTML for its parent tree.
+  file_to_html_chunk_path = {
+      file: write_chunk(f'{file}.html', get_html_chunk(file, tree_html))
+      for (file, tree_html) in file_to_html.items()
+  }
+  with profiler.span('search_index'):
+    search_index_path = write_chunk(
+        'search_index', get_search_index_chunk(model, file_to_search_entries)
+    )
+  remove_unused_chunks(
+      set(file_to_chunk_path.values()) | set(file_to_html_chunk_path.values()) |
+      {search_index_path}
+  )
+  file_to_parent_file = get_parent_files(model)
+
+  manifest = []
+  for file_metadata in data_files.DATA_LIST:
+    manifest.append(
+        asdict(file_metadata) | {
+            'chunk': _get_url(file_to_chunk_path[file_metadata.file]),
+            'html_chunk': _get_url(file_to_html_chunk_path[file_metadata.file]),
+            'parent_file': file_to_parent_file.get(file_metadata.file),
+        }
+    )
+
+  served_thumbnails = {
+      thumbnail_map[img.local_filename]
+      if img.local_filename in thumbnail_map else urllib.parse.quote(img.local_filename)
+      for img in model.images
+  }
+  # The atlases are cached for offline use along with the thumbnails they were built from.
+  served_thumbnails.update(
+      atlas[0] for tree in get_sprite_map().values() for atlas in tree['atlases']
+  )
+
+  script_vars = {
+      'data_files': manifest,
+      'thumbnail_count': len(served_thumbnails),
+      'search_index_chunk': _get_url(search_index_path),
+  }
+  if release:
+    return ';'.join(
+        f'var {name}={_get_compact_json(value)}' for (name, value) in script_vars.items()
+    )
+
+  output: str = 'var data_files = ' + json.dumps(manifest, indent=2) + '\n'
+  output += f'    var thumbnail_count = {len(served_thumbnails)}\n'
+  output += f'    var search_index_chunk = {json.dumps(_get_url(search_index_path))}\n'
   return output
 
 
-def get_html() -> str:
+def get_html(
+    model: taxonomy.Taxonomy,
+    release: bool = False,
+    file_to_chunk_path: dict[str, str] | None = None,
+    file_to_html: dict[str, str] | None = None,
+    file_to_search_entries: dict[str, search_index.FileEntries] | None = None,
+) -> str:
   html_wrapper_start = """
 <!DOCTYPE html>
 <html lang="en">
@@ -266,7 +530,8 @@ def get_html() -> str:
 
     </div>
 
-    <div id="tree_root"></div>
+    <div id="tree_root">"""
+  html_tree_end = """</div>
 
   </div>
 
@@ -283,18 +548,78 @@ def get_html() -> str:
 
 </html>
 """
-  return html_wrapper_start + get_script_vars() + html_wrapper_end
-
-
-def main():
-
-  html = get_html()
+  if file_to_html is None:
+    file_to_html = render_trees(model)
+  # The default tree is part of the page so it shows before any script has run.
+  default_tree_html = next(
+      (
+          file_to_html[file_metadata.file]
+          for file_metadata in data_files.DATA_LIST
+          if prerender.get_tree_range(file_metadata) == prerender.DEFAULT_TREE_RANGE
+      ),
+      '',
+  )
+  script_vars = get_script_vars(
+      model,
+      release=release,
+      file_to_chunk_path=file_to_chunk_path,
+      file_to_html=file_to_html,
+      file_to_search_entries=file_to_search_entries,
+  )
+  if release:
+    return (
+        _minify_html(html_wrapper_start) + default_tree_html + _minify_html(html_tree_end) +
+        script_vars + _minify_html(html_wrapper_end)
+    )
+  return html_wrapper_start + default_tree_html + html_tree_end + script_vars + html_wrapper_end
+
+
+def main(
+    model: taxonomy.Taxonomy | None = None,
+    release: bool = False,
+    file_to_chunk_path: dict[str, str] | None = None,
+    file_to_html: dict[str, str] | None = None,
+    file_to_search_entries: dict[str, search_index.FileEntries] | None = None,
+):
+
+  if model is None:
+    model = taxonomy.load()
+
+  html = get_html(
+      model,
+      release=release,
+      file_to_chunk_path=file_to_chunk_path,
+      file_to_html=file_to_html,
+      file_to_search_entries=file_to_search_entries,
+  )
 
   with open(HTML_OUT_FILENAME, 'w', encoding='utf8') as html_file:
     html_file.write(html)
+  profiler.add_written(HTML_OUT_FILENAME)
 
   print(f'Index successfully built at: {HTML_OUT_FILENAME}')
 
+  if not release:
+    # Compressed copies from a release build would be served instead of the new assets.
+    for path in [HTML_OUT_FILENAME] + get_chunk_paths():
+      precompress.remove_compressed_siblings(path)
+    return
+
+  if not precompress.brotli_available():
+    print('Skipping the .br files since brotli is not installed: pip install brotli')
+  compressed_bytes = 0
+  with profiler.span('precompress'):
+    for path in [HTML_OUT_FILENAME] + get_chunk_paths():
+      for sibling_path in precompress.write_compressed_siblings(path):
+        compressed_bytes += os.path.getsize(sibling_path)
+  print(f'Wrote compressed copies of the generated assets ({compressed_bytes / 1024:.0f}KiB).')
+
 
 if __name__ == '__main__':
-  main()
+  parser = argparse.ArgumentParser(description='Build index.html and the tree data chunks.')
+  parser.add_argument(
+      '--release',
+      action='store_true',
+      help='Minify the output, drop empty fields and write .gz and .br copies of each asset.',
+  )
+  main(release=parser.parse_args().release)
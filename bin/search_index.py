@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+import functools
+import re
+import typing
+
+import common
+import data_files
+import taxonomy
+
+# Must match the word pattern in `SearchIndex` in `js/compiler.js`.
+_WORD_REGEX = re.compile(r'\w+')
+_NGRAM_LENGTH = 3
+
+
+def _delta_encode(sorted_ids: list[int]) -> list[int]:
+  # Small gaps keep the posting lists short once they are serialised.
+  return [current - previous for (previous, current) in zip([0] + sorted_ids, sorted_ids)]
+
+
+@functools.cache
+def get_ngrams(word: str) -> frozenset[str]:
+  # Cached since the watcher builds the index again after every edit from mostly the same words.
+  return frozenset(word[i:i + _NGRAM_LENGTH] for i in range(len(word) - _NGRAM_LENGTH + 1))
+
+
+@dataclass(kw_only=True)
+class FileEntries:
+  # The entries for one data file, so they can be reused while the file is unchanged. Each entry is
+  # [name, tag, common names] and the postings are positions in `entries`.
+  entries: list[list[typing.Any]]
+  word_to_entries: dict[str, list[int]]
+  # Exact matches on a lower case taxa or a common name as it is written.
+  exact: dict[str, list[int]]
+
+
+def get_file_entries(nodes: list[common.NodeRaw]) -> FileEntries:
+  file_entries = FileEntries(entries=[], word_to_entries={}, exact={})
+  for (entry_id, n) in enumerate(nodes):
+    common_names = [common_name for common_name in (n.common or []) if common_name]
+    file_entries.entries.append([n.name, n.tag or '', common_names])
+
+    text = '\n'.join([n.name, n.tag or ''] + common_names).lower()
+    for word in set(_WORD_REGEX.findall(text)):
+      file_entries.word_to_entries.setdefault(word, []).append(entry_id)
+
+    for key in dict.fromkeys([n.name.lower()] + common_names):
+      file_entries.exact.setdefault(key, []).append(entry_id)
+  return file_entries
+
+
+def _add_postings(to: dict[str, list[int]], postings: dict[str, list[int]], offset: int) -> None:
+  for (key, entry_ids) in postings.items():
+    if offset:
+      entry_ids = [offset + entry_id for entry_id in entry_ids]
+    if key in to:
+      to[key].extend(entry_ids)
+    else:
+      to[key] = list(entry_ids)
+
+
+def build(
+    model: taxonomy.Taxonomy, file_to_entries: dict[str, FileEntries] | None = None
+) -> dict[str, typing.Any]:
+  # Files in `file_to_entries` are known to be unchanged so their nodes are not read again.
+  # Each entry is [name, index in `data_files.DATA_LIST`, tag, common names].
+  entries: list[list[typing.Any]] = []
+  word_to_entries: dict[str, list[int]] = {}
+  exact: dict[str, list[int]] = {}
+
+  for (file_index, file_metadata) in enumerate(data_files.DATA_LIST):
+    file_entries = file_to_entries.get(file_metadata.file) if file_to_entries else None
+    if file_entries is None:
+      file_entries = get_file_entries(model.file_to_nodes.get(file_metadata.file, []))
+
+    # Files are added in order so every posting list stays sorted.
+    offset = len(entries)
+    entries.extend(
+        [name, file_index, tag, common_names]
+        for (name, tag, common_names) in file_entries.entries
+    )
+    _add_postings(word_to_entries, file_entries.word_to_entries, offset)
+    _add_postings(exact, file_entries.exact, offset)
+
+  words = sorted(word_to_entries)
+  ngram_to_words: dict[str, list[int]] = {}
+  for (word_id, word) in enumerate(words):
+    for ngram in get_ngrams(word):
+      ngram_to_words.setdefault(ngram, []).append(word_id)
+
+  return {
+      'entries': entries,
+      'words': words,
+      'word_entries': [_delta_encode(word_to_entries[word]) for word in words],
+      'ngrams': {ngram: _delta_encode(ids) for (ngram, ids) in sorted(ngram_to_words.items())},
+      # Sorted so the keys can be used as the autocomplete list as they are.
+      'exact': dict(sorted(exact.items())),
+  }
@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+
+from dataclasses import asdict, dataclass
+
+import argparse
+import concurrent.futures
+import hashlib
+import io
+import json
+import math
+import os
+import shutil
+import typing
+
+import common
+import data_files
+import profiler
+import taxonomy
+import thumbnail_store
+
+THUMBNAIL_DIR = 'thumbnails'
+SPRITE_DIR = 'sprites'
+SPRITE_MAP_FILE = 'sprite_map.json'
+
+FORMATS = ('webp', 'png')
+DEFAULT_FORMAT = 'webp'
+
+# Matches the max-height of `.taxa-img` in css/tree_view.css.
+DISPLAY_HEIGHT_PX = 43
+
+# A tree with more images than fit in one atlas is split over several.
+_MAX_ATLAS_WIDTH_PX = 2048
+_MAX_ATLAS_HEIGHT_PX = 2048
+_QUALITY = 75
+
+
+@dataclass(kw_only=True)
+class SpriteSettings:
+  image_format: str = DEFAULT_FORMAT
+  # Twice the display height for high density screens.
+  sprite_height_px: int = 2 * DISPLAY_HEIGHT_PX
+  max_atlas_width_px: int = _MAX_ATLAS_WIDTH_PX
+  max_atlas_height_px: int = _MAX_ATLAS_HEIGHT_PX
+  quality: int = _QUALITY
+
+
+def _import_pillow() -> None:
+  try:
+    import PIL  #pylint: disable=import-outside-toplevel,unused-import
+  except ImportError as e:
+    raise SystemError('Building sprite atlases needs Pillow: pip install Pillow') from e
+
+
+def get_sprite_dir(thumbnail_dir: str = THUMBNAIL_DIR) -> str:
+  return os.path.join(thumbnail_dir, SPRITE_DIR)
+
+
+def get_sprite_map_path(thumbnail_dir: str = THUMBNAIL_DIR) -> str:
+  return os.path.join(get_sprite_dir(thumbnail_dir), SPRITE_MAP_FILE)
+
+
+def read_sprite_map(thumbnail_dir: str = THUMBNAIL_DIR) -> dict[str, typing.Any]:
+  # Each tree has a list of [filename, width, height] for its atlases, relative to the sprite dir,
+  # and maps an `Image.local_filename` to [atlas index, x, y, width, height] within them.
+  sprite_map_path = get_sprite_map_path(thumbnail_dir)
+  if not os.path.isfile(sprite_map_path):
+    return {'settings': None, 'trees': {}}
+
+  with open(sprite_map_path, 'r', encoding='utf8') as sprite_map_file:
+    return json.load(sprite_map_file)
+
+
+def get_atlas_paths(thumbnail_dir: str = THUMBNAIL_DIR) -> list[str]:
+  sprite_dir = get_sprite_dir(thumbnail_dir)
+  return [
+      os.path.join(sprite_dir, filename)
+      for tree in read_sprite_map(thumbnail_dir)['trees'].values()
+      for (filename, _, _) in tree['atlases']
+  ]
+
+
+def _format_px(value: float) -> str:
+  # Rounds half up and drops a trailing ".0" to match `get_sprite_style` in compiler.js.
+  text = repr(math.floor(value * 100 + 0.5) / 100 + 0.0)
+  return (text[:-2] if text.endswith('.0') else text) + 'px'
+
+
+def get_sprite_style(atlas: list[typing.Any], sprite: list[int]) -> str:
+  # Sprites are stored at up to twice the display height, so scale them down like `.taxa-img`.
+  (atlas_url, atlas_width, atlas_height) = atlas
+  (_, x, y, width, height) = sprite
+  scale = min(height, DISPLAY_HEIGHT_PX) / height
+  return (
+      f'background-image:url("{atlas_url}");'
+      f'background-position:{_format_px(-x * scale)} {_format_px(-y * scale)};'
+      f'background-size:{_format_px(atlas_width * scale)} {_format_px(atlas_height * scale)};'
+      f'width:{_format_px(width * scale)};height:{_format_px(height * scale)}'
+  )
+
+
+def get_tree_images(model: taxonomy.Taxonomy, file: str) -> list[common.Image]:
+  # The root of a tree is shown with it, so its images are packed with the tree's own.
+  nodes = model.file_to_nodes.get(file, [])
+  if not nodes:
+    return []
+  root = model.taxa_to_node.get(nodes[0].parent)
+  local_to_image: dict[str, common.Image] = {}
+  for n in ([root] if root else []) + nodes:
+    for img in n.image_list:
+      local_to_image.setdefault(img.local_filename, img)
+  return list(local_to_image.values())
+
+
+def pack(
+    sizes: list[tuple[int, int]], settings: SpriteSettings
+) -> tuple[list[tuple[int, int, int]], list[tuple[int, int]]]:
+  # Every sprite is at most `sprite_height_px` high, so they are laid out in rows of that height.
+  # Returns the atlas index and position for each sprite, and the size of each atlas.
+  positions: list[tuple[int, int, int]] = []
+  atlas_sizes: list[tuple[int, int]] = []
+  (x, y, atlas_width) = (0, 0, 0)
+  for (width, _) in sizes:
+    if x and x + width > settings.max_atlas_width_px:
+      (x, y) = (0, y + settings.sprite_height_px)
+    if not atlas_sizes or y + settings.sprite_height_px > settings.max_atlas_height_px:
+      if atlas_sizes:
+        atlas_sizes[-1] = (atlas_width, y)
+      atlas_sizes.append((0, 0))
+      (x, y, atlas_width) = (0, 0, 0)
+    positions.append((len(atlas_sizes) - 1, x, y))
+    x += width
+    atlas_width = max(atlas_width, x)
+  if atlas_sizes:
+    atlas_sizes[-1] = (atlas_width, y + settings.sprite_height_px)
+  return (positions, atlas_sizes)
+
+
+def _load_sprite(path: str, settings: SpriteSettings):
+  from PIL import Image, ImageOps  #pylint: disable=import-outside-toplevel
+
+  with Image.open(path) as source_image:
+    image = ImageOps.exif_transpose(source_image).convert('RGBA')
+
+  # Never scaled up, so small images are shown at the same size as before.
+  scale = min(
+      1.0, settings.sprite_height_px / image.height, settings.max_atlas_width_px / image.width
+  )
+  if scale < 1.0:
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    image = image.resize(size, Image.Resampling.LANCZOS)
+  return image
+
+
+def build_tree_atlases(
+    file: str,
+    local_to_path: dict[str, str],
+    settings: SpriteSettings,
+    sprite_dir: str,
+) -> dict[str, typing.Any]:
+  from PIL import Image  #pylint: disable=import-outside-toplevel
+
+  locals_and_sprites = []
+  for (local, path) in local_to_path.items():
+    try:
+      locals_and_sprites.append((local, _load_sprite(path, settings)))
+    except (OSError, ValueError) as e:
+      # The page shows the thumbnail on its own instead.
+      print(f'Leaving "{path}" out of the sprite atlas for {file}: {e}')
+
+  (positions, atlas_sizes) = pack(
+      [sprite.size for (_, sprite) in locals_and_sprites], settings
+  )
+  atlases = [Image.new('RGBA', size, (0, 0, 0, 0)) for size in atlas_sizes]
+  images: dict[str, list[int]] = {}
+  for ((local, sprite), (atlas_index, x, y)) in zip(locals_and_sprites, positions):
+    atlases[atlas_index].paste(sprite, (x, y))
+    images[local] = [atlas_index, x, y, sprite.width, sprite.height]
+
+  atlas_entries = []
+  for (atlas_index, atlas) in enumerate(atlases):
+    buffer = io.BytesIO()
+    atlas.save(buffer, format=settings.image_format.upper(), quality=settings.quality)
+    encoded = buffer.getvalue()
+    # Named by content so browsers and the service worker can cache them forever.
+    digest = hashlib.sha256(encoded).hexdigest()[:16]
+    filename = f'{file}.{atlas_index}.{digest}.{settings.image_format}'
+    with open(os.path.join(sprite_dir, filename), 'wb') as atlas_file:
+      atlas_file.write(encoded)
+    atlas_entries.append([filename, atlas.width, atlas.height])
+
+  return {'atlases': atlas_entries, 'images': images}
+
+
+def _build_job(job: tuple[str, dict[str, str], SpriteSettings, str]) -> dict[str, typing.Any]:
+  return build_tree_atlases(*job)
+
+
+def _get_tree_key(local_to_path: dict[str, str], settings: SpriteSettings) -> str:
+  key = hashlib.sha256(json.dumps(asdict(settings), sort_keys=True).encode('utf8'))
+  for (local, path) in local_to_path.items():
+    stat = os.stat(path)
+    key.update(f'\0{local}\0{path}\0{stat.st_mtime_ns}\0{stat.st_size}'.encode('utf8'))
+  return key.hexdigest()[:16]
+
+
+def remove(thumbnail_dir: str = THUMBNAIL_DIR) -> None:
+  sprite_dir = get_sprite_dir(thumbnail_dir)
+  if os.path.isdir(sprite_dir):
+    shutil.rmtree(sprite_dir)
+    print(f'Removed the sprite atlases in: {sprite_dir}')
+
+
+def main(
+    model: taxonomy.Taxonomy | None = None,
+    settings: SpriteSettings | None = None,
+    thumbnail_dir: str = THUMBNAIL_DIR,
+    workers: int | None = None,
+):
+  _import_pillow()
+
+  if model is None:
+    model = taxonomy.load()
+  if settings is None:
+    settings = SpriteSettings()
+  if settings.image_format not in FORMATS:
+    raise ValueError(f'Unknown sprite format "{settings.image_format}", expected one of {FORMATS}.')
+
+  sprite_dir = get_sprite_dir(thumbnail_dir)
+  os.makedirs(sprite_dir, exist_ok=True)
+  previous_trees = read_sprite_map(thumbnail_dir)['trees']
+  thumbnail_map = thumbnail_store.read_thumbnail_map(thumbnail_dir)
+
+  trees: dict[str, dict[str, typing.Any]] = {}
+  jobs: list[tuple[str, dict[str, str], SpriteSettings, str]] = []
+  job_keys: list[str] = []
+  for file_metadata in data_files.DATA_LIST:
+    local_to_path: dict[str, str] = {}
+    for img in get_tree_images(model, file_metadata.file):
+      # The transcoded copy is used when there is one since it is already small.
+      path = os.path.join(
+          thumbnail_dir, thumbnail_map.get(img.local_filename, img.local_filename)
+      )
+      if os.path.isfile(path):
+        local_to_path[img.local_filename] = path
+
+    key = _get_tree_key(local_to_path, settings)
+    previous = previous_trees.get(file_metadata.file)
+    if previous and previous['key'] == key and all(
+        os.path.isfile(os.path.join(sprite_dir, filename))
+        for (filename, _, _) in previous['atlases']
+    ):
+      trees[file_metadata.file] = previous
+      continue
+    jobs.append((file_metadata.file, local_to_path, settings, sprite_dir))
+    job_keys.append(key)
+
+  print(f'Building sprite atlases for {len(jobs)} trees.')
+  with profiler.span('build_atlases') as profile_args:
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+      for (job, key, tree) in zip(jobs, job_keys, executor.map(_build_job, jobs)):
+        trees[job[0]] = {'key': key} | tree
+    profile_args['trees'] = len(jobs)
+
+  used = {SPRITE_MAP_FILE}
+  used.update(filename for tree in trees.values() for (filename, _, _) in tree['atlases'])
+  for filename in os.listdir(sprite_dir):
+    if filename not in used:
+      os.remove(os.path.join(sprite_dir, filename))
+
+  sprite_map_path = get_sprite_map_path(thumbnail_dir)
+  with open(sprite_map_path, 'w', encoding='utf8') as sprite_map_file:
+    json.dump(
+        {'settings': asdict(settings), 'trees': trees},
+        sprite_map_file,
+        indent=2,
+        ensure_ascii=False,
+    )
+  profiler.add_written(sprite_map_path)
+
+  atlas_paths = get_atlas_paths(thumbnail_dir)
+  atlas_bytes = sum(os.path.getsize(path) for path in atlas_paths)
+  sprite_count = sum(len(tree['images']) for tree in trees.values())
+  print(
+      f'Sprite atlases built at: {sprite_dir} ({len(atlas_paths)} atlases holding {sprite_count} '
+      f'thumbnails, {atlas_bytes / 1024:.0f}KiB)'
+  )
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Pack the thumbnails for each tree into a few sprite atlases.'
+  )
+  parser.add_argument(
+      '--format', choices=FORMATS, default=DEFAULT_FORMAT, help='The atlas image format.'
+  )
+  parser.add_argument(
+      '--remove', action='store_true', help='Delete the atlases so the page uses each thumbnail.'
+  )
+  args = parser.parse_args()
+  if args.remove:
+    remove()
+  else:
+    main(settings=SpriteSettings(image_format=args.format))
@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+
+import common
+import data_files
+
+
+@dataclass(kw_only=True)
+class Taxonomy:
+  # All nodes in the order they appear in `data_files.DATA_LIST`.
+  nodes: list[common.NodeRaw] = field(default_factory=list)
+  taxa_to_node: dict[str, common.NodeRaw] = field(default_factory=dict)
+  children: dict[str, list[common.NodeRaw]] = field(default_factory=lambda: {'LUCA': []})
+  # Keyed by `JsonDataFile.file`.
+  file_to_nodes: dict[str, list[common.NodeRaw]] = field(default_factory=dict)
+  images: list[common.Image] = field(default_factory=list)
+
+  def add_node(self, file_metadata: data_files.JsonDataFile, n: common.NodeRaw) -> None:
+    self.nodes.append(n)
+    self.file_to_nodes.setdefault(file_metadata.file, []).append(n)
+
+    # Duplicates and missing parents are reported by `validate_inputs`.
+    self.taxa_to_node.setdefault(n.name, n)
+    self.children.setdefault(n.parent, []).append(n)
+    self.children.setdefault(n.name, [])
+
+    self.images.extend(n.image_list)
+
+
+def load(workers: int = 1) -> Taxonomy:
+  taxonomy = Taxonomy()
+  data_files.process_files(taxonomy.add_node, workers=workers)
+  return taxonomy
+
+
+def from_files(file_to_nodes: dict[str, list[common.NodeRaw]]) -> Taxonomy:
+  # Rebuilds the lookups from nodes that were already parsed, without reading any files.
+  taxonomy = Taxonomy()
+  for file_metadata in data_files.DATA_LIST:
+    for n in file_to_nodes.get(file_metadata.file, []):
+      taxonomy.add_node(file_metadata, n)
+  return taxonomy
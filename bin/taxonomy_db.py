@@ -0,0 +1,339 @@
+#!/usr/bin/env python
+
+import argparse
+import os
+import re
+import sqlite3
+import time
+import typing
+
+import common
+import data_files
+import taxonomy
+
+DB_FILENAME = os.path.join('tree_data', 'taxonomy.sqlite')
+
+# Bump this when the schema changes so queries fail clearly on an old database.
+_SCHEMA_VERSION = 1
+
+_BATCH_SIZE = 5000
+
+_SCHEMA = """
+CREATE TABLE metadata (key text primary key, value text not null);
+CREATE TABLE files (
+  id integer primary key, file text not null, domain text not null, taxa text not null,
+  tag text not null, level integer not null
+);
+CREATE TABLE nodes (
+  id integer primary key, name text not null, parent text not null, parent_id integer,
+  rank text, ipa text, etymology text, tag text, species integer, card integer,
+  file_id integer not null references files (id)
+);
+CREATE TABLE common_names (node_id integer not null references nodes (id), name text not null);
+CREATE TABLE images (
+  node_id integer not null references nodes (id), position integer not null, url text not null,
+  local_filename text not null, attribution_url text not null
+);
+-- Every ancestor of each node, including the node itself at depth 0.
+CREATE TABLE ancestors (
+  ancestor_id integer not null, descendant_id integer not null, depth integer not null,
+  PRIMARY KEY (ancestor_id, descendant_id)
+) WITHOUT ROWID;
+"""
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE node_search USING fts5(
+  name, common, tag, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+# Built once the rows are in, which is much faster than updating them on every insert.
+_INDEXES = """
+CREATE INDEX ix_nodes_name ON nodes (name COLLATE NOCASE);
+CREATE INDEX ix_nodes_parent_id ON nodes (parent_id);
+CREATE INDEX ix_common_names_name ON common_names (name COLLATE NOCASE);
+CREATE INDEX ix_common_names_node_id ON common_names (node_id);
+CREATE INDEX ix_images_node_id ON images (node_id);
+CREATE INDEX ix_ancestors_descendant ON ancestors (descendant_id, depth);
+"""
+
+_SEARCH_WORD_REGEX = re.compile(r'\w+')
+
+
+def _insert_batches(
+    connection: sqlite3.Connection, sql: str, rows: typing.Iterable[tuple[typing.Any, ...]]
+) -> None:
+  batch: list[tuple[typing.Any, ...]] = []
+  for row in rows:
+    batch.append(row)
+    if len(batch) >= _BATCH_SIZE:
+      connection.executemany(sql, batch)
+      batch.clear()
+  connection.executemany(sql, batch)
+
+
+def _as_list(values: list[str] | str | None) -> list[str]:
+  # A few data files have a single string where a list is expected.
+  if isinstance(values, str):
+    return [values]
+  return [value for value in values or [] if value]
+
+
+def write_db(model: taxonomy.Taxonomy, filename: str) -> bool:
+  # Returns if full text search is available in this build of SQLite.
+  connection = sqlite3.connect(filename)
+  try:
+    # The file is swapped into place once complete, so there is nothing to protect mid-write.
+    connection.execute('PRAGMA journal_mode = OFF')
+    connection.execute('PRAGMA synchronous = OFF')
+    connection.executescript(_SCHEMA)
+    try:
+      connection.executescript(_FTS_SCHEMA)
+      has_fts = True
+    except sqlite3.OperationalError:
+      has_fts = False
+
+    file_ids = {file_metadata.file: i for (i, file_metadata) in enumerate(data_files.DATA_LIST)}
+    # Nodes are numbered in file order, which is also parent before child.
+    nodes: list[tuple[common.NodeRaw, int]] = [
+        (n, file_ids[file_metadata.file])
+        for file_metadata in data_files.DATA_LIST
+        for n in model.file_to_nodes.get(file_metadata.file, [])
+    ]
+    name_to_id: dict[str, int] = {}
+    for (node_id, (n, _)) in enumerate(nodes):
+      name_to_id.setdefault(n.name, node_id)
+
+    # The ancestors of each node are its parent's plus the parent itself.
+    node_ancestors: list[list[int]] = []
+    for (n, _) in nodes:
+      parent_id = name_to_id.get(n.parent)
+      if parent_id is None or parent_id >= len(node_ancestors):
+        node_ancestors.append([])
+      else:
+        node_ancestors.append([parent_id] + node_ancestors[parent_id])
+
+    with connection:
+      connection.executemany(
+          'INSERT INTO metadata VALUES (?, ?)',
+          [('version', str(_SCHEMA_VERSION)), ('built', str(int(time.time())))],
+      )
+      connection.executemany(
+          'INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)',
+          [(
+              file_ids[file_metadata.file], file_metadata.file, file_metadata.domain,
+              file_metadata.taxa, file_metadata.tag, file_metadata.level
+          ) for file_metadata in data_files.DATA_LIST],
+      )
+      _insert_batches(
+          connection,
+          'INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+          ((
+              node_id, n.name, n.parent, name_to_id.get(n.parent), n.rank, n.ipa or None,
+              n.etymology or None, n.tag or None, n.species, n.card, file_id
+          ) for (node_id, (n, file_id)) in enumerate(nodes)),
+      )
+      _insert_batches(
+          connection,
+          'INSERT INTO common_names VALUES (?, ?)',
+          ((node_id, common_name)
+           for (node_id, (n, _)) in enumerate(nodes)
+           for common_name in _as_list(n.common)),
+      )
+      _insert_batches(
+          connection,
+          'INSERT INTO images VALUES (?, ?, ?, ?, ?)',
+          ((node_id, position, img.remote_url, img.local_filename, img.attribution_url)
+           for (node_id, (n, _)) in enumerate(nodes)
+           for (position, img) in enumerate(n.image_list)),
+      )
+      _insert_batches(
+          connection,
+          'INSERT INTO ancestors VALUES (?, ?, ?)',
+          ((ancestor_id, node_id, depth)
+           for (node_id, ancestor_ids) in enumerate(node_ancestors)
+           for (depth, ancestor_id) in enumerate([node_id] + ancestor_ids)),
+      )
+      if has_fts:
+        _insert_batches(
+            connection,
+            'INSERT INTO node_search (rowid, name, common, tag) VALUES (?, ?, ?, ?)',
+            ((node_id, n.name, '\n'.join(_as_list(n.common)), n.tag or '')
+             for (node_id, (n, _)) in enumerate(nodes)),
+        )
+
+    connection.executescript(_INDEXES)
+    connection.execute('ANALYZE')
+  finally:
+    connection.close()
+
+  return has_fts
+
+
+def connect(filename: str = DB_FILENAME) -> sqlite3.Connection:
+  if not os.path.isfile(filename):
+    raise ValueError(f'Missing taxonomy database "{filename}". Run bin/build.py to build it.')
+
+  # Read only so a query can never change the build output.
+  connection = sqlite3.connect(f'file:{filename}?mode=ro', uri=True)
+  connection.row_factory = sqlite3.Row
+  version = connection.execute("SELECT value FROM metadata WHERE key = 'version'").fetchone()
+  if version is None or int(version['value']) != _SCHEMA_VERSION:
+    raise ValueError(f'Outdated taxonomy database "{filename}". Run bin/build.py to rebuild it.')
+  return connection
+
+
+def find_nodes(connection: sqlite3.Connection, name: str) -> list[sqlite3.Row]:
+  # Taxa names take priority over common names, and neither is case sensitive.
+  rows = connection.execute(
+      'SELECT nodes.*, files.file FROM nodes JOIN files ON files.id = nodes.file_id '
+      'WHERE nodes.name = ? COLLATE NOCASE ORDER BY nodes.id',
+      (name,),
+  ).fetchall()
+  if rows:
+    return rows
+  return connection.execute(
+      'SELECT DISTINCT nodes.*, files.file FROM common_names '
+      'JOIN nodes ON nodes.id = common_names.node_id JOIN files ON files.id = nodes.file_id '
+      'WHERE common_names.name = ? COLLATE NOCASE ORDER BY nodes.id',
+      (name,),
+  ).fetchall()
+
+
+def get_lineage(connection: sqlite3.Connection, node_id: int) -> list[sqlite3.Row]:
+  # From the root down to the node.
+  return connection.execute(
+      'SELECT nodes.id, nodes.name, nodes.rank FROM ancestors '
+      'JOIN nodes ON nodes.id = ancestors.ancestor_id '
+      'WHERE ancestors.descendant_id = ? ORDER BY ancestors.depth DESC',
+      (node_id,),
+  ).fetchall()
+
+
+def get_subtree(
+    connection: sqlite3.Connection, node_id: int, max_depth: int | None = None
+) -> list[sqlite3.Row]:
+  sql = (
+      'SELECT nodes.id, nodes.name, nodes.rank, nodes.parent_id, ancestors.depth FROM ancestors '
+      'JOIN nodes ON nodes.id = ancestors.descendant_id WHERE ancestors.ancestor_id = ?'
+  )
+  params = [node_id]
+  if max_depth is not None:
+    sql += ' AND ancestors.depth <= ?'
+    params.append(max_depth)
+  # In data file order, which lists each parent before its children.
+  return connection.execute(sql + ' ORDER BY nodes.id', params).fetchall()
+
+
+def search(connection: sqlite3.Connection, query: str, limit: int = 20) -> list[sqlite3.Row]:
+  words = _SEARCH_WORD_REGEX.findall(query)
+  if not words:
+    return []
+
+  try:
+    # Every word has to match the start of a word in the name, common names or tag.
+    match = ' '.join(f'"{word}"*' for word in words)
+    return connection.execute(
+        'SELECT nodes.id, nodes.name, nodes.rank, files.file FROM node_search '
+        'JOIN nodes ON nodes.id = node_search.rowid JOIN files ON files.id = nodes.file_id '
+        'WHERE node_search MATCH ? ORDER BY bm25(node_search, 10.0, 5.0, 1.0) LIMIT ?',
+        (match, limit),
+    ).fetchall()
+  except sqlite3.OperationalError:
+    # SQLite was built without FTS5, so fall back to a scan.
+    condition = (
+        '(nodes.name LIKE ? OR nodes.tag LIKE ? OR EXISTS (SELECT 1 FROM common_names '
+        'WHERE common_names.node_id = nodes.id AND common_names.name LIKE ?))'
+    )
+    params: list[typing.Any] = [f'%{word}%' for word in words for _ in range(3)]
+    return connection.execute(
+        'SELECT nodes.id, nodes.name, nodes.rank, files.file FROM nodes '
+        'JOIN files ON files.id = nodes.file_id '
+        f'WHERE {" AND ".join([condition] * len(words))} ORDER BY nodes.id LIMIT ?',
+        params + [limit],
+    ).fetchall()
+
+
+def _get_common_names(connection: sqlite3.Connection, node_id: int) -> list[str]:
+  return [
+      row['name'] for row in
+      connection.execute('SELECT name FROM common_names WHERE node_id = ?', (node_id,))
+  ]
+
+
+def _format_node(connection: sqlite3.Connection, row: sqlite3.Row) -> str:
+  common_names = _get_common_names(connection, row['id'])
+  text = f'{row["name"]} ({row["rank"]})'
+  if common_names:
+    text += f': {", ".join(common_names)}'
+  return text
+
+
+def main(model: taxonomy.Taxonomy | None = None, filename: str = DB_FILENAME):
+
+  if model is None:
+    model = taxonomy.load()
+
+  os.makedirs(os.path.dirname(filename), exist_ok=True)
+  temp_filename = f'{filename}.tmp'
+  if os.path.isfile(temp_filename):
+    os.remove(temp_filename)
+  has_fts = write_db(model, temp_filename)
+  os.replace(temp_filename, filename)
+
+  print(f'Taxonomy database built at: {filename} ({os.path.getsize(filename) / 1024:.0f}KiB)')
+  if not has_fts:
+    print('SQLite was built without FTS5 so searches will scan every node.')
+
+
+def _iter_printed_matches(connection: sqlite3.Connection,
+                          name: str) -> typing.Iterator[sqlite3.Row]:
+  # Falls back to the closest matches when nothing has exactly this name.
+  rows = find_nodes(connection, name) or search(connection, name, limit=5)
+  if not rows:
+    raise ValueError(f'No taxa or common name matches "{name}".')
+  for row in rows:
+    print(f'{_format_node(connection, row)} in file "{row["file"]}"')
+    yield row
+
+
+def run_query(args: argparse.Namespace) -> None:
+  connection = connect(args.db)
+  try:
+    if args.command == 'lineage':
+      for row in _iter_printed_matches(connection, args.name):
+        print('  ' + ' > '.join(ancestor['name'] for ancestor in get_lineage(connection, row['id'])))
+
+    elif args.command == 'subtree':
+      for row in _iter_printed_matches(connection, args.name):
+        for descendant in get_subtree(connection, row['id'], args.depth)[1:]:
+          print('  ' * descendant['depth'] + _format_node(connection, descendant))
+
+    elif args.command == 'search':
+      for row in search(connection, args.query, args.limit):
+        print(f'{_format_node(connection, row)} in file "{row["file"]}"')
+  finally:
+    connection.close()
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Build or query the taxonomy database.')
+  parser.add_argument('--db', default=DB_FILENAME, help='The database file.')
+  subparsers = parser.add_subparsers(dest='command', required=True)
+  subparsers.add_parser('build', help='Build the database from the data files.')
+  lineage_parser = subparsers.add_parser(
+      'lineage', help='Show the file and ancestors of a taxa or common name.'
+  )
+  lineage_parser.add_argument('name')
+  subtree_parser = subparsers.add_parser('subtree', help='Show every descendant of a taxa.')
+  subtree_parser.add_argument('name')
+  subtree_parser.add_argument('--depth', type=int, help='Only show this many levels down.')
+  search_parser = subparsers.add_parser(
+      'search', help='Find taxa by the start of words in their name, common names or tag.'
+  )
+  search_parser.add_argument('query')
+  search_parser.add_argument('--limit', type=int, default=20)
+  parsed_args = parser.parse_args()
+
+  if parsed_args.command == 'build':
+    main(filename=parsed_args.db)
+  else:
+    run_query(parsed_args)
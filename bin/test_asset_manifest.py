@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+
+from unittest import mock
+
+import json
+import os
+import tempfile
+import unittest
+
+import asset_manifest
+import build_cache
+import data_files
+import taxonomy
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class AssetManifestTest(unittest.TestCase):
+
+  def setUp(self) -> None:
+    self._temp_dir = tempfile.TemporaryDirectory()  #pylint: disable=consider-using-with
+    self.addCleanup(self._temp_dir.cleanup)
+    self.addCleanup(os.chdir, os.getcwd())
+    os.chdir(_ROOT_DIR)
+
+  def test_committed_manifest_is_current(self) -> None:
+    # The service worker installs what the committed manifest lists, so it must match the assets.
+    with mock.patch.object(data_files, 'DATA_LIST', data_files.discover()):
+      model = taxonomy.load()
+      # A cache of its own so the test never touches the build manifest.
+      cache = build_cache.BuildCache(os.path.join(self._temp_dir.name, 'build_manifest.json'))
+      manifest = asset_manifest.build(model, cache)
+    with open(asset_manifest.ASSET_MANIFEST_FILENAME, encoding='utf8') as manifest_file:
+      committed = json.load(manifest_file)
+    self.assertEqual(
+        committed, manifest, 'The asset manifest is out of date. Run bin/build.py to update it.'
+    )
+
+
+if __name__ == '__main__':
+  unittest.main()
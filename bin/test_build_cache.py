@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+from unittest import mock
+
+import os
+import tempfile
+import unittest
+
+import build_cache
+
+
+class BuildCacheTest(unittest.TestCase):
+
+  def setUp(self) -> None:
+    self._temp_dir = tempfile.TemporaryDirectory()  #pylint: disable=consider-using-with
+    self.addCleanup(self._temp_dir.cleanup)
+    self._manifest_path = self._path(build_cache.MANIFEST_FILENAME)
+    self._input_path = self._write('input.jsonc', '[]')
+    self._output_path = self._write('output.js', 'var data = []')
+
+  def _path(self, filename: str) -> str:
+    return os.path.join(self._temp_dir.name, filename)
+
+  def _write(self, filename: str, text: str, mtime_ns: int | None = None) -> str:
+    path = self._path(filename)
+    with open(path, 'w', encoding='utf8') as f:
+      f.write(text)
+    if mtime_ns is not None:
+      os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+  def _record_and_reload(self) -> build_cache.BuildCache:
+    cache = build_cache.BuildCache(self._manifest_path)
+    cache.record('index', cache.get_inputs_digest([self._input_path]), [self._output_path])
+    cache.save()
+    return build_cache.BuildCache(self._manifest_path)
+
+  def _is_fresh(self, cache: build_cache.BuildCache) -> bool:
+    return cache.is_fresh('index', cache.get_inputs_digest([self._input_path]), [self._output_path])
+
+  def test_unchanged_stage_is_fresh_without_reading_files(self) -> None:
+    cache = self._record_and_reload()
+    with mock.patch.object(build_cache, '_hash_file') as hash_file:
+      self.assertTrue(self._is_fresh(cache))
+    hash_file.assert_not_called()
+
+  def test_touched_but_identical_input_is_fresh(self) -> None:
+    cache = self._record_and_reload()
+    self._write('input.jsonc', '[]', mtime_ns=os.stat(self._input_path).st_mtime_ns + 10**9)
+    self.assertTrue(self._is_fresh(cache))
+
+  def test_changed_input_is_stale(self) -> None:
+    cache = self._record_and_reload()
+    self._write('input.jsonc', '[{}]', mtime_ns=os.stat(self._input_path).st_mtime_ns + 10**9)
+    self.assertFalse(self._is_fresh(cache))
+    self.assertEqual(cache.changed_files([self._input_path]), [self._input_path])
+
+  def test_deleted_output_is_stale(self) -> None:
+    cache = self._record_and_reload()
+    os.remove(self._output_path)
+    self.assertFalse(self._is_fresh(cache))
+
+  def test_edited_output_is_stale(self) -> None:
+    cache = self._record_and_reload()
+    self._write('output.js', 'var data = [1]')
+    self.assertFalse(self._is_fresh(cache))
+
+  def test_missing_output_is_not_recorded(self) -> None:
+    cache = build_cache.BuildCache(self._manifest_path)
+    os.remove(self._output_path)
+    with self.assertRaisesRegex(ValueError, 'did not write the expected output'):
+      cache.record('index', cache.get_inputs_digest([self._input_path]), [self._output_path])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+
+from unittest import mock
+
+import contextlib
+import http.server
+import io
+import os
+import tempfile
+import threading
+import time
+import typing
+import unittest
+
+import cache_thumbnails
+import thumbnail_store
+
+
+class _ImageServer(http.server.ThreadingHTTPServer):
+  # Serves `files` by path and records each request, standing in for the image hosts.
+
+  def __init__(self) -> None:
+    super().__init__(('127.0.0.1', 0), _ImageHandler)
+    self.files: dict[str, bytes] = {}
+    self.etags: dict[str, str] = {}
+    # Paths that always answer with this status.
+    self.statuses: dict[str, int] = {}
+    self.delay_sec = 0.0
+    self.requests: list[tuple[float, str, dict[str, str]]] = []
+    self.in_flight = 0
+    self.max_in_flight = 0
+    self.lock = threading.Lock()
+
+  def url(self, path: str, host: str = '127.0.0.1') -> str:
+    return f'http://{host}:{self.server_address[1]}/{path}'
+
+
+class _ImageHandler(http.server.BaseHTTPRequestHandler):
+  server: _ImageServer
+
+  def log_message(self, format: str, *args: typing.Any) -> None:  #pylint: disable=redefined-builtin
+    del format, args
+
+  def do_GET(self) -> None:  #pylint: disable=invalid-name
+    server = self.server
+    path = self.path.lstrip('/')
+    with server.lock:
+      server.requests.append((time.monotonic(), path, dict(self.headers.items())))
+      server.in_flight += 1
+      server.max_in_flight = max(server.max_in_flight, server.in_flight)
+    try:
+      time.sleep(server.delay_sec)
+      self._respond(path)
+    finally:
+      with server.lock:
+        server.in_flight -= 1
+
+  def _respond(self, path: str) -> None:
+    server = self.server
+    if path in server.statuses or path not in server.files:
+      self.send_response(server.statuses.get(path, 404))
+      self.send_header('Content-Length', '0')
+      self.end_headers()
+      return
+
+    body = server.files[path]
+    etag = server.etags.get(path, '')
+    (status, start) = (200, 0)
+    range_header = self.headers.get('Range')
+    if_range = self.headers.get('If-Range')
+    if range_header and (if_range is None or if_range == etag):
+      start = int(range_header.removeprefix('bytes=').rstrip('-'))
+      if start >= len(body):
+        self.send_response(416)
+        self.send_header('Content-Range', f'bytes */{len(body)}')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        return
+      status = 206
+
+    self.send_response(status)
+    if status == 206:
+      self.send_header('Content-Range', f'bytes {start}-{len(body) - 1}/{len(body)}')
+    if etag:
+      self.send_header('ETag', etag)
+    self.send_header('Content-Length', str(len(body) - start))
+    self.end_headers()
+    self.wfile.write(body[start:])
+
+
+class DownloadThumbnailsTest(unittest.TestCase):
+
+  def setUp(self) -> None:
+    self._temp_dir = tempfile.TemporaryDirectory()  #pylint: disable=consider-using-with
+    self.addCleanup(self._temp_dir.cleanup)
+    self.thumbnail_dir = self._temp_dir.name
+
+    self.server = _ImageServer()
+    thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    thread.start()
+    self.addCleanup(thread.join)
+    self.addCleanup(self.server.server_close)
+    self.addCleanup(self.server.shutdown)
+
+  def _add_images(self, count: int, host: str = '127.0.0.1') -> dict[str, str]:
+    local_to_remote: dict[str, str] = {}
+    for i in range(len(self.server.files), len(self.server.files) + count):
+      self.server.files[f'{i}.jpg'] = f'image {i}'.encode('utf8') * 100
+      local_to_remote[f'{i}.jpg'] = self.server.url(f'{i}.jpg', host)
+    return local_to_remote
+
+  def _download(self, local_to_remote: dict[str, str],
+                **kwargs: typing.Any) -> cache_thumbnails.DownloadStats:
+    kwargs.setdefault('requests_per_second', 1000.0)
+    kwargs.setdefault('burst', 1000.0)
+    with contextlib.redirect_stdout(io.StringIO()):
+      return cache_thumbnails.download_thumbnails(
+          local_to_remote=local_to_remote, thumbnail_dir=self.thumbnail_dir, **kwargs
+      )
+
+  def _read(self, local: str) -> bytes:
+    with open(os.path.join(self.thumbnail_dir, local), 'rb') as image_file:
+      return image_file.read()
+
+  def test_downloads_concurrently(self) -> None:
+    self.server.delay_sec = 0.1
+    local_to_remote = self._add_images(8)
+    stats = self._download(local_to_remote, workers=4)
+
+    self.assertEqual(stats.downloaded_items, 8)
+    self.assertGreater(self.server.max_in_flight, 1)
+    self.assertLessEqual(self.server.max_in_flight, 4)
+    for local in local_to_remote:
+      self.assertEqual(self._read(local), self.server.files[local])
+    self.assertFalse([f for f in os.listdir(self.thumbnail_dir) if f.endswith('.part')])
+
+  def test_rate_limits_each_host(self) -> None:
+    # Two hosts for the same server, each with its own bucket.
+    local_to_remote = self._add_images(4) | self._add_images(4, host='localhost')
+    start = time.monotonic()
+    self._download(local_to_remote, workers=8, requests_per_second=10.0, burst=1.0)
+    elapsed_sec = time.monotonic() - start
+
+    # Three waits of 0.1s on each host side by side, rather than seven with one shared bucket.
+    self.assertGreaterEqual(elapsed_sec, 0.28)
+    self.assertLess(elapsed_sec, 0.6)
+    host_to_times: dict[str, list[float]] = {}
+    for (request_time, _, headers) in self.server.requests:
+      host_to_times.setdefault(headers['Host'].split(':')[0], []).append(request_time)
+    self.assertEqual(sorted(host_to_times), ['127.0.0.1', 'localhost'])
+    for times in host_to_times.values():
+      gaps = [later - earlier for (earlier, later) in zip(times, times[1:])]
+      # Measured when the server reads each request, so allow for scheduling jitter.
+      self.assertGreaterEqual(min(gaps), 0.06)
+
+  def test_stats(self) -> None:
+    local_to_remote = self._add_images(3)
+    with open(os.path.join(self.thumbnail_dir, '0.jpg'), 'wb') as image_file:
+      image_file.write(b'cached')
+    local_to_remote['missing.jpg'] = self.server.url('missing.jpg')
+
+    stats = self._download(local_to_remote, workers=2)
+    self.assertEqual(stats.total_items, 3)
+    self.assertEqual(stats.completed_items, 3)
+    self.assertEqual(stats.downloaded_items, 2)
+    self.assertEqual(stats.bytes_so_far, len(self.server.files['1.jpg']) * 2)
+    self.assertEqual([(f.local, f.status) for f in stats.failures], [('missing.jpg', 404)])
+    # Cached files are not requested again.
+    self.assertNotIn('0.jpg', [path for (_, path, _) in self.server.requests])
+
+  def _write_partial(self, local: str, data: bytes, validator: str | None) -> None:
+    path = os.path.join(self.thumbnail_dir, local)
+    with open(path + '.part', 'wb') as partial_file:
+      partial_file.write(data)
+    if validator:
+      with open(path + '.part.validator', 'w', encoding='utf8') as validator_file:
+        validator_file.write(validator)
+
+  def _save(self, local: str, **kwargs: typing.Any) -> thumbnail_store.Validators | None:
+    with contextlib.redirect_stdout(io.StringIO()):
+      return cache_thumbnails.save_thumbnail_with_retries(
+          image_local_path=os.path.join(self.thumbnail_dir, local),
+          remote=self.server.url(local),
+          **kwargs,
+      )
+
+  def test_resumes_unchanged_image(self) -> None:
+    self._add_images(1)
+    self.server.etags['0.jpg'] = '"v1"'
+    body = self.server.files['0.jpg']
+    self._write_partial('0.jpg', body[:100], '"v1"')
+
+    self._save('0.jpg')
+    self.assertEqual(self._read('0.jpg'), body)
+    (_, _, headers) = self.server.requests[-1]
+    self.assertEqual((headers['Range'], headers['If-Range']), ('bytes=100-', '"v1"'))
+    self.assertEqual(os.listdir(self.thumbnail_dir), ['0.jpg'])
+
+  def test_restarts_changed_image(self) -> None:
+    self._add_images(1)
+    self.server.etags['0.jpg'] = '"v2"'
+    self._write_partial('0.jpg', b'old image bytes', '"v1"')
+
+    self._save('0.jpg')
+    # The server ignores the range for a different ETag, so the old bytes are dropped.
+    self.assertEqual(self._read('0.jpg'), self.server.files['0.jpg'])
+
+  def test_partial_without_validator_is_not_resumed(self) -> None:
+    self._add_images(1)
+    self._write_partial('0.jpg', b'unknown bytes', None)
+
+    self._save('0.jpg')
+    self.assertEqual(self._read('0.jpg'), self.server.files['0.jpg'])
+    self.assertNotIn('Range', self.server.requests[-1][2])
+
+  def test_416_on_resume_starts_again(self) -> None:
+    self._add_images(1)
+    self.server.etags['0.jpg'] = '"v1"'
+    body = self.server.files['0.jpg']
+    self._write_partial('0.jpg', body + b'extra', '"v1"')
+
+    with mock.patch.object(cache_thumbnails, '_BACKOFF_BASE_SEC', 0.01):
+      self._save('0.jpg', max_retries=1)
+    self.assertEqual(self._read('0.jpg'), body)
+    self.assertEqual(len(self.server.requests), 2)
+
+  def test_416_without_range_is_not_retried(self) -> None:
+    self.server.statuses['0.jpg'] = 416
+    with self.assertRaises(cache_thumbnails.DownloadError) as context:
+      self._save('0.jpg', max_retries=3)
+    self.assertEqual(context.exception.status, 416)
+    self.assertEqual(len(self.server.requests), 1)
+
+  def test_failures_file(self) -> None:
+    local_to_remote = self._add_images(2)
+    self.server.statuses['1.jpg'] = 403
+    self._download(local_to_remote)
+    self.assertEqual(
+        cache_thumbnails.read_failures_file(self.thumbnail_dir),
+        [
+            cache_thumbnails.DownloadFailure(
+                local='1.jpg',
+                remote=local_to_remote['1.jpg'],
+                status=403,
+                error=f'Failed to download "{local_to_remote["1.jpg"]}" to '
+                f'"{os.path.join(self.thumbnail_dir, "1.jpg")}" with status 403.',
+            )
+        ],
+    )
+
+    # The failures file is removed once every thumbnail is downloaded.
+    del self.server.statuses['1.jpg']
+    stats = self._download(local_to_remote)
+    self.assertEqual((stats.downloaded_items, stats.failures), (1, []))
+    self.assertFalse(os.path.exists(cache_thumbnails.get_failures_path(self.thumbnail_dir)))
+
+
+class TokenBucketTest(unittest.TestCase):
+
+  def test_burst_then_rate(self) -> None:
+    bucket = cache_thumbnails.TokenBucket(rate_per_sec=20.0, capacity=3)
+    start = time.monotonic()
+    for _ in range(3):
+      bucket.acquire()
+    self.assertLess(time.monotonic() - start, 0.03)
+    for _ in range(2):
+      bucket.acquire()
+    self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+  def test_pause(self) -> None:
+    bucket = cache_thumbnails.TokenBucket(rate_per_sec=1000.0, capacity=1)
+    bucket.pause(0.1)
+    start = time.monotonic()
+    bucket.acquire()
+    self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+if __name__ == '__main__':
+  unittest.main()
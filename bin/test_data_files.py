@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+from unittest import mock
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import data_files
+
+_BIN_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class DiscoverTest(unittest.TestCase):
+
+  def setUp(self) -> None:
+    self._temp_dir = tempfile.TemporaryDirectory()  #pylint: disable=consider-using-with
+    self.addCleanup(self._temp_dir.cleanup)
+    self.data_dir = os.path.join(self._temp_dir.name, data_files.DATA_DIR)
+    os.makedirs(self.data_dir)
+    # Written out of order so the order cannot come from the directory listing.
+    self._write('luca_b', 'B')
+    self._write('luca_a_x', 'X')
+    self._write('luca', 'LUCA')
+    # The file it is named after is missing, so it hangs off the overview.
+    self._write('luca_c_y', 'Y')
+    self._write('luca_a', 'A')
+
+  def _write(self, file: str, root_parent: str) -> None:
+    with open(os.path.join(self.data_dir, f'{file}.jsonc'), 'w', encoding='utf8') as data_file:
+      data_file.write(f'[{{"name": "{file}", "parent": "{root_parent}", "rank": "Clade"}}]')
+
+  def _list_data_dir(self) -> dict[str, int]:
+    return {entry.name: entry.stat().st_mtime_ns for entry in os.scandir(self.data_dir)}
+
+  def _discover(self, overrides: list[data_files.DataFileOverride] | None = None) -> list[str]:
+    data_list = data_files.discover(data_dir=self.data_dir, overrides=overrides or [])
+    return [file_metadata.file for file_metadata in data_list]
+
+  def test_parents_before_children(self) -> None:
+    data_list = data_files.discover(data_dir=self.data_dir, overrides=[])
+    self.assertEqual(
+        [(f.file, f.level, f.taxa) for f in data_list],
+        [
+            ('luca', 0, 'LUCA'),
+            ('luca_a', 0, 'A'),
+            ('luca_a_x', 1, 'X'),
+            ('luca_b', 0, 'B'),
+            ('luca_c_y', 0, 'Y'),
+        ],
+    )
+
+  def test_override_order_and_fields(self) -> None:
+    overrides = [
+        data_files.DataFileOverride(file='luca_b', tag='Tag for B'),
+        data_files.DataFileOverride(file='luca_missing', tag='Unused'),
+    ]
+    data_list = data_files.discover(data_dir=self.data_dir, overrides=overrides)
+    self.assertEqual(
+        [(f.file, f.tag) for f in data_list],
+        [('luca', ''), ('luca_b', 'Tag for B'), ('luca_a', ''), ('luca_a_x', ''), ('luca_c_y', '')],
+    )
+
+  def test_discover_is_read_only(self) -> None:
+    before = self._list_data_dir()
+    self._discover()
+    self.assertEqual(self._list_data_dir(), before)
+    self.assertFalse(os.path.exists(data_files.get_index_path(self.data_dir)))
+
+  def test_discover_reads_index_written_by_update_index(self) -> None:
+    data_files.update_index(self.data_dir)
+    index_path = data_files.get_index_path(self.data_dir)
+    self.assertTrue(os.path.isfile(index_path))
+    with mock.patch.object(data_files, '_read_root_parent') as read_root_parent:
+      self.assertEqual(len(self._discover()), 5)
+    read_root_parent.assert_not_called()
+
+    # Changed files are read again without the index being written.
+    before = self._list_data_dir()
+    self._write('luca_a', 'Changed root')
+    os.utime(
+        os.path.join(self.data_dir, 'luca_a.jsonc'),
+        ns=(before['luca_a.jsonc'] + 10**9, before['luca_a.jsonc'] + 10**9),
+    )
+    data_list = data_files.discover(data_dir=self.data_dir, overrides=[])
+    self.assertEqual([f.taxa for f in data_list if f.file == 'luca_a'], ['Changed root'])
+    self.assertEqual(os.stat(index_path).st_mtime_ns, before[data_files.INDEX_FILENAME])
+
+  def test_import_is_read_only(self) -> None:
+    # A new process so `DATA_LIST` is discovered from the temporary directory on import.
+    before = self._list_data_dir()
+    result = subprocess.run(
+        [sys.executable, '-c', 'import data_files; print(len(data_files.DATA_LIST))'],
+        cwd=self._temp_dir.name,
+        env=os.environ | {'PYTHONPATH': _BIN_DIR},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    self.assertEqual(result.stdout.strip(), '5')
+    self.assertEqual(self._list_data_dir(), before)
+
+
+if __name__ == '__main__':
+  unittest.main()
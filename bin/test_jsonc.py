@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+from unittest import mock
+
+import os
+import pickle
+import tempfile
+import unittest
+
+import data_files
+import jsonc
+
+
+class JsoncTest(unittest.TestCase):
+
+  def setUp(self) -> None:
+    self._temp_dir = tempfile.TemporaryDirectory()  #pylint: disable=consider-using-with
+    self.addCleanup(self._temp_dir.cleanup)
+
+  def _write(self, file: str, text: str) -> str:
+    full_filename = os.path.join(self._temp_dir.name, f'{file}.jsonc')
+    with open(full_filename, 'w', encoding='utf8') as jsonc_file:
+      jsonc_file.write(text)
+    return full_filename
+
+  def _parse(self, text: str) -> list[tuple[int, object]]:
+    return list(jsonc.iter_items(self._write('data', text)))
+
+  def test_comments_and_trailing_commas(self) -> None:
+    items = self._parse(
+        '// The overview.\n'
+        '[\n'
+        '  {\n'
+        '    "taxa": "A", /* inline */\n'
+        '    "imgs": ["a.jpg",],\n'
+        '  },\n'
+        '  /* A block\n'
+        '     comment. */\n'
+        '  {"taxa": "B"},\n'
+        ']\n'
+    )
+    self.assertEqual(items, [(3, {'taxa': 'A', 'imgs': ['a.jpg']}), (9, {'taxa': 'B'})])
+
+  def test_scalar_items(self) -> None:
+    self.assertEqual(self._parse('[1,2,\n"three"]'), [(1, 1), (1, 2), (2, 'three')])
+
+  def test_missing_comma_between_scalars(self) -> None:
+    with self.assertRaisesRegex(jsonc.JsoncError, r':1:4: Expected "," between items'):
+      self._parse('[1 2]')
+
+  def test_missing_comma_after_scalar(self) -> None:
+    with self.assertRaisesRegex(jsonc.JsoncError, r':2:1: Expected "," between items'):
+      self._parse('["junk"\n{"taxa": "A"}]')
+
+  def test_missing_comma_between_objects(self) -> None:
+    with self.assertRaisesRegex(jsonc.JsoncError, r':1:16: Expected "," between items'):
+      self._parse('[{"taxa": "A"} {"taxa": "B"}]')
+
+  def test_invalid_literal(self) -> None:
+    with self.assertRaisesRegex(jsonc.JsoncError, r':2:3: Expecting value'):
+      self._parse('[\n  nope\n]')
+
+  def test_unterminated(self) -> None:
+    with self.assertRaisesRegex(jsonc.JsoncError, r'before the closing "\]"'):
+      self._parse('[{"taxa": "A"},\n')
+
+  def test_error_pickles(self) -> None:
+    error = jsonc.JsoncError('Unexpected ","', 'data.jsonc', 3, 7)
+    copy = pickle.loads(pickle.dumps(error))
+    self.assertEqual(str(copy), str(error))
+    self.assertEqual((copy.filename, copy.line, copy.column), ('data.jsonc', 3, 7))
+
+  def test_error_from_worker_process(self) -> None:
+    self._write('luca', '[\n  {"name": "A", "parent": "Root", "rank": "clade"}\n]\n')
+    self._write(
+        'luca_b', '[\n  {"name": "B", "parent": "A", "rank": "clade"}\n  {"name": "C"}\n]\n'
+    )
+    data_list = data_files.discover(data_dir=self._temp_dir.name, overrides=[])
+    with (
+        mock.patch.object(data_files, 'DATA_DIR', self._temp_dir.name),
+        mock.patch.object(data_files, 'DATA_LIST', data_list),
+    ):
+      with self.assertRaises(jsonc.JsoncError) as context:
+        data_files.process_nodes(lambda _: None, workers=2)
+    self.assertTrue(context.exception.filename.endswith('luca_b.jsonc'))
+    self.assertEqual((context.exception.line, context.exception.column), (3, 3))
+
+
+if __name__ == '__main__':
+  unittest.main()
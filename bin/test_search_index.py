@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+
+from unittest import mock
+
+import typing
+import unittest
+
+import common
+import data_files
+import search_index
+import taxonomy
+
+_NODES = {
+    'luca': [
+        common.NodeRaw(name='Eukaryota', parent='LUCA', rank='Domain'),
+        common.NodeRaw(name='Bacteria', parent='LUCA', rank='Domain', tag='Not a eukaryote'),
+    ],
+    'luca_eukaryota': [
+        common.NodeRaw(name='Opisthokonta', parent='Eukaryota', rank='Clade'),
+        common.NodeRaw(name='Homo sapiens', parent='Opisthokonta', rank='Species',
+                       common=['Human', 'Modern human']),
+        common.NodeRaw(name='Drosophila melanogaster', parent='Opisthokonta', rank='Species',
+                       common=['Common fruit fly', '']),
+        common.NodeRaw(name='Homo neanderthalensis', parent='Opisthokonta', rank='Species',
+                       tag='Extinct', common=['Neanderthal']),
+    ],
+    'luca_bacteria': [
+        common.NodeRaw(name='Escherichia coli', parent='Bacteria', rank='Species',
+                       common=['E. coli']),
+        common.NodeRaw(name='Bacillus subtilis', parent='Bacteria', rank='Species',
+                       common=['Hay bacillus', 'Grass bacillus']),
+    ],
+}
+
+
+def _decode(deltas: list[int]) -> list[int]:
+  ids: list[int] = []
+  previous = 0
+  for delta in deltas:
+    previous += delta
+    ids.append(previous)
+  return ids
+
+
+def _get_word_ids_including(index: dict[str, typing.Any], token: str) -> list[int]:
+  # The same steps as `SearchIndex` in `js/compiler.js`.
+  words = index['words']
+  if len(token) < search_index._NGRAM_LENGTH:  #pylint: disable=protected-access
+    candidates = list(range(len(words)))
+  else:
+    posting_lists = []
+    for ngram in search_index.get_ngrams(token):
+      if ngram not in index['ngrams']:
+        return []
+      posting_lists.append(index['ngrams'][ngram])
+    candidates = _decode(min(posting_lists, key=len))
+  return [word_id for word_id in candidates if token in words[word_id]]
+
+
+def _search(index: dict[str, typing.Any], query: str) -> list[str]:
+  candidates: set[int] | None = None
+  for token in search_index._WORD_REGEX.findall(query):  #pylint: disable=protected-access
+    token_entries: set[int] = set()
+    for word_id in _get_word_ids_including(index, token):
+      token_entries.update(_decode(index['word_entries'][word_id]))
+    candidates = token_entries if candidates is None else candidates & token_entries
+  if candidates is None:
+    candidates = set(range(len(index['entries'])))
+
+  names = []
+  for entry_id in sorted(candidates):
+    (name, _, tag, common_names) = index['entries'][entry_id]
+    if query in '\n'.join([name, tag] + common_names).lower():
+      names.append(name)
+  return names
+
+
+def _scan(query: str) -> list[str]:
+  # The search before the index: every name, tag and common name of every tree.
+  names = []
+  for nodes in _NODES.values():
+    for n in nodes:
+      texts = [n.name, n.tag or ''] + (n.common or [])
+      if any(query in text.lower() for text in texts):
+        names.append(n.name)
+  return names
+
+
+class SearchIndexTest(unittest.TestCase):
+
+  def setUp(self) -> None:
+    data_list = [
+        data_files.JsonDataFile(file=file, domain='', taxa=file, tag='', level=0)
+        for file in _NODES
+    ]
+    patcher = mock.patch.object(data_files, 'DATA_LIST', data_list)
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+    self.model = taxonomy.Taxonomy()
+    for file_metadata in data_list:
+      for n in _NODES[file_metadata.file]:
+        self.model.add_node(file_metadata, n)
+    self.index = search_index.build(self.model)
+
+  def test_matches_linear_scan(self) -> None:
+    queries = [
+        'homo', 'omo', 'ho', 'h', 'sapiens', 'apie', 'fruit fly', 'uit fl', 'modern human',
+        'human', 'extinct', 'bacillus', 'hay bac', 'e. coli', 'coli', 'not a', 'eukaryo',
+        'homo sapiens', 'sapiens homo', 'zebra', 'fly fruit', 'xyz',
+    ]
+    for query in queries:
+      with self.subTest(query=query):
+        self.assertEqual(_search(self.index, query), _scan(query))
+
+  def test_multi_word_query_matches_within_one_name(self) -> None:
+    self.assertEqual(_search(self.index, 'fruit fly'), ['Drosophila melanogaster'])
+    # Both words appear in the entry but not next to each other.
+    self.assertEqual(_search(self.index, 'fly fruit'), [])
+
+  def test_ngram_candidates(self) -> None:
+    words = self.index['words']
+    word_ids = _decode(self.index['ngrams']['ill'])
+    self.assertEqual([words[word_id] for word_id in word_ids], ['bacillus'])
+    self.assertEqual(_get_word_ids_including(self.index, 'qqq'), [])
+
+  def test_postings_are_delta_encoded(self) -> None:
+    word_entries = self.index['word_entries'][self.index['words'].index('homo')]
+    # "Homo sapiens" and "Homo neanderthalensis" are entries 3 and 5.
+    self.assertEqual(word_entries, [3, 2])
+    self.assertEqual(_decode(word_entries), [3, 5])
+
+  def test_reused_file_entries(self) -> None:
+    file_to_entries = {
+        file: search_index.get_file_entries(nodes) for (file, nodes) in _NODES.items()
+    }
+    self.assertEqual(search_index.build(taxonomy.Taxonomy(), file_to_entries), self.index)
+
+
+if __name__ == '__main__':
+  unittest.main()
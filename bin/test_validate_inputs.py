@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+import unittest
+
+import common
+import data_files
+import taxonomy
+import validate_inputs
+
+
+def _get_model(file_to_nodes: dict[str, list[tuple[str, str]]]) -> taxonomy.Taxonomy:
+  # Each node is a (name, parent) pair, with files added in order.
+  model = taxonomy.Taxonomy()
+  for (file, nodes) in file_to_nodes.items():
+    file_metadata = data_files.JsonDataFile(file=file, domain='', taxa=file, tag='', level=0)
+    for (name, parent) in nodes:
+      model.add_node(file_metadata, common.NodeRaw(name=name, parent=parent, rank='Clade'))
+  return model
+
+
+class FindLoopsTest(unittest.TestCase):
+
+  def test_no_loops(self) -> None:
+    self.assertEqual(validate_inputs.find_loops({'A': 'LUCA', 'B': 'A', 'C': 'B'}), [])
+
+  def test_loops(self) -> None:
+    parents = {'A': 'LUCA', 'B': 'C', 'C': 'D', 'D': 'B', 'E': 'D', 'F': 'F'}
+    self.assertEqual(validate_inputs.find_loops(parents), [['B', 'C', 'D'], ['F']])
+
+
+class GetViolationsTest(unittest.TestCase):
+
+  def test_valid(self) -> None:
+    model = _get_model({'luca': [('A', 'LUCA'), ('B', 'A')], 'luca_b': [('C', 'B')]})
+    self.assertEqual(validate_inputs.get_violations(model), [])
+
+  def test_missing_parent(self) -> None:
+    model = _get_model({'luca': [('A', 'LUCA'), ('B', 'Missing')]})
+    self.assertEqual(
+        validate_inputs.get_violations(model),
+        ['Node (B) in file "luca" has a parent (Missing) that does not exist.'],
+    )
+
+  def test_parent_defined_later(self) -> None:
+    model = _get_model({'luca': [('A', 'LUCA'), ('B', 'C')], 'luca_c': [('C', 'A')]})
+    self.assertEqual(
+        validate_inputs.get_violations(model),
+        [
+            'Node (B) in file "luca" has a parent (C) that is only defined later in file '
+            '"luca_c".'
+        ],
+    )
+
+  def test_loop(self) -> None:
+    model = _get_model({'luca': [('A', 'LUCA'), ('B', 'C'), ('C', 'B')]})
+    self.assertIn('Loop in nodes: B -> C -> B', validate_inputs.get_violations(model))
+
+  def test_reports_every_violation(self) -> None:
+    model = _get_model({
+        'luca': [('A', 'LUCA'), ('B', 'Missing'), ('C', 'D'), ('D', 'C')],
+        'luca_b': [('A', 'LUCA'), ('E', 'Also missing')],
+    })
+    self.assertEqual(
+        validate_inputs.get_violations(model),
+        [
+            'Duplicate node (A) in file "luca_b", first defined in file "luca".',
+            'Node (B) in file "luca" has a parent (Missing) that does not exist.',
+            'Node (C) in file "luca" has a parent (D) that is only defined later in file "luca".',
+            'Node (E) in file "luca_b" has a parent (Also missing) that does not exist.',
+            'Loop in nodes: C -> D -> C',
+        ],
+    )
+
+  def test_invalid_node_only_checked_in_files(self) -> None:
+    model = _get_model({'luca': [('A', 'LUCA')], 'luca_b': [('B', 'A')]})
+    model.file_to_nodes['luca_b'][0].common = ['']
+    self.assertEqual(validate_inputs.get_violations(model, files={'luca'}), [])
+    self.assertEqual(len(validate_inputs.get_violations(model, files={'luca_b'})), 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
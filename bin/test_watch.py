@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+from unittest import mock
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import data_files
+import watch
+
+_FILE_TO_NODES = {
+    'luca': [('Fungi', 'LUCA')],
+    'luca_fungi': [('Ascomycota', 'Fungi'), ('Basidiomycota', 'Fungi')],
+    'luca_fungi_ascomycota': [('Pezizomycotina', 'Ascomycota')],
+    'luca_fungi_basidiomycota': [('Agaricomycotina', 'Basidiomycota')],
+}
+
+
+class WatcherTest(unittest.TestCase):
+
+  def setUp(self) -> None:
+    self._temp_dir = tempfile.TemporaryDirectory()  #pylint: disable=consider-using-with
+    self.addCleanup(self._temp_dir.cleanup)
+    # Every output is written relative to the current directory.
+    self.addCleanup(os.chdir, os.getcwd())
+    os.chdir(self._temp_dir.name)
+
+    for (file, nodes) in _FILE_TO_NODES.items():
+      self._write(file, json.dumps([
+          {'name': name, 'parent': parent, 'rank': 'Clade'} for (name, parent) in nodes
+      ]))
+    patcher = mock.patch.object(data_files, 'DATA_LIST', data_files.discover(overrides=[]))
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+    self.watcher = watch.Watcher()
+    self.assertIn('Rebuilt', self._rebuild(set(_FILE_TO_NODES)))
+
+  def _write(self, file: str, text: str) -> None:
+    os.makedirs(data_files.DATA_DIR, exist_ok=True)
+    with open(os.path.join(data_files.DATA_DIR, f'{file}.jsonc'), 'w', encoding='utf8') as f:
+      f.write(text)
+
+  def _rebuild(self, changed_files: set[str]) -> str:
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+      self.watcher.rebuild(changed_files)
+    return output.getvalue()
+
+  def test_broken_file_is_read_again_after_another_change(self) -> None:
+    self._write('luca_fungi_ascomycota', '[{"name": "Pezizomycotina", "parent": "Ascomycota"')
+    output = self._rebuild({'luca_fungi_ascomycota'})
+    self.assertIn('Waiting for the next change.', output)
+    self.assertNotIn('luca_fungi_ascomycota', self.watcher.file_to_nodes)
+
+    # The old nodes of the broken file must not be used to build the change to another file.
+    self._write('luca_fungi_basidiomycota', '[{"name": "Agaricomycotina", "parent": "Basidiomycota"'
+                ', "rank": "Subdivision"}]')
+    output = self._rebuild({'luca_fungi_basidiomycota'})
+    self.assertNotIn('Rebuilt', output)
+    self.assertIn('Waiting for the next change.', output)
+
+    self._write('luca_fungi_ascomycota', '[{"name": "Pezizomycotina", "parent": "Ascomycota", '
+                '"rank": "Subdivision"}]')
+    output = self._rebuild({'luca_fungi_ascomycota'})
+    self.assertIn('Rebuilt luca_fungi_ascomycota, luca_fungi_basidiomycota', output)
+    self.assertEqual(self.watcher.stale_files, set())
+    self.assertEqual(
+        self.watcher.file_to_nodes['luca_fungi_basidiomycota'][0].rank, 'Subdivision'
+    )
+
+  def test_invalid_file_stays_stale(self) -> None:
+    self._write('luca_fungi_ascomycota', '[{"name": "Pezizomycotina", "parent": "Missing", '
+                '"rank": "Clade"}]')
+    output = self._rebuild({'luca_fungi_ascomycota'})
+    self.assertIn('has a parent (Missing) that does not exist', output)
+    self.assertNotIn('Rebuilt', self._rebuild({'luca_fungi_basidiomycota'}))
+    self.assertEqual(
+        self.watcher.stale_files, {'luca_fungi_ascomycota', 'luca_fungi_basidiomycota'}
+    )
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,248 @@
+import hashlib
+import json
+import os
+import typing
+
+import image_size
+
+THUMBNAIL_MAP_FILE = 'thumbnail_map.json'
+CONTENT_INDEX_FILE = 'content_index.json'
+VALIDATORS_FILE = 'validators.json'
+IMAGE_INFO_FILE = 'image_info.json'
+
+# The ETag and Last-Modified headers sent with a downloaded thumbnail, either of which can be None.
+Validators: typing.TypeAlias = tuple[str | None, str | None]
+
+# The width, height and placeholder colour of a served thumbnail. There is no colour for images
+# with transparency, or when Pillow is not installed.
+ImageInfo: typing.TypeAlias = tuple[int, int, str | None]
+
+
+def get_thumbnail_map_path(thumbnail_dir: str) -> str:
+  return os.path.join(thumbnail_dir, THUMBNAIL_MAP_FILE)
+
+
+def read_thumbnail_map_file(thumbnail_dir: str) -> dict[str, typing.Any]:
+  thumbnail_map_path = get_thumbnail_map_path(thumbnail_dir)
+  if not os.path.isfile(thumbnail_map_path):
+    return {'settings': None, 'images': {}}
+
+  with open(thumbnail_map_path, 'r', encoding='utf8') as thumbnail_map_file:
+    return json.load(thumbnail_map_file)
+
+
+def read_thumbnail_map(thumbnail_dir: str) -> dict[str, str]:
+  # Maps an `Image.local_filename` to the file to serve instead, relative to the thumbnail dir.
+  return read_thumbnail_map_file(thumbnail_dir)['images']
+
+
+def write_thumbnail_map(
+    thumbnail_dir: str, thumbnail_map: dict[str, str], settings: dict[str, typing.Any] | None
+) -> None:
+  with open(get_thumbnail_map_path(thumbnail_dir), 'w', encoding='utf8') as thumbnail_map_file:
+    json.dump(
+        {'settings': settings, 'images': thumbnail_map},
+        thumbnail_map_file,
+        indent=2,
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+
+
+def read_validators(thumbnail_dir: str) -> dict[str, Validators]:
+  validators_path = os.path.join(thumbnail_dir, VALIDATORS_FILE)
+  if not os.path.isfile(validators_path):
+    return {}
+
+  with open(validators_path, 'r', encoding='utf8') as validators_file:
+    return {
+        local: (etag, last_modified)
+        for (local, [etag, last_modified]) in json.load(validators_file).items()
+    }
+
+
+def _get_compact_json(value: typing.Any) -> str:
+  return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+def write_validators(thumbnail_dir: str, local_to_validators: dict[str, Validators]) -> None:
+  # One thumbnail per line keeps the file small while changes still diff cleanly.
+  lines = [
+      f'{json.dumps(local, ensure_ascii=False)}:{_get_compact_json(list(validators))}'
+      for (local, validators) in sorted(local_to_validators.items())
+  ]
+  with open(os.path.join(thumbnail_dir, VALIDATORS_FILE), 'w', encoding='utf8') as validators_file:
+    validators_file.write('{\n' + ',\n'.join(lines) + '\n}\n')
+
+
+def get_image_info_path(thumbnail_dir: str) -> str:
+  return os.path.join(thumbnail_dir, IMAGE_INFO_FILE)
+
+
+def read_image_info_file(thumbnail_dir: str) -> dict[str, typing.Any]:
+  image_info_path = get_image_info_path(thumbnail_dir)
+  if not os.path.isfile(image_info_path):
+    return {'settings': None, 'images': {}}
+
+  with open(image_info_path, 'r', encoding='utf8') as image_info_file:
+    return json.load(image_info_file)
+
+
+def read_image_info(thumbnail_dir: str) -> dict[str, ImageInfo]:
+  # Maps a served thumbnail, relative to the thumbnail dir, to its size and placeholder colour.
+  images = read_image_info_file(thumbnail_dir)['images']
+  return {
+      served: (width, height, colour) for (served, [_, width, height, colour]) in images.items()
+  }
+
+
+def _pillow_available() -> bool:
+  try:
+    import PIL  #pylint: disable=import-outside-toplevel,unused-import
+  except ImportError:
+    return False
+  return True
+
+
+def get_placeholder_colour(path: str) -> str | None:
+  from PIL import Image  #pylint: disable=import-outside-toplevel
+
+  with Image.open(path) as image:
+    # A JPEG decoded at a fraction of its size is much quicker and still gives the same colour.
+    image.draft('RGB', (16, 16))
+    if image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info:
+      (min_alpha, _) = image.convert('RGBA').getchannel('A').getextrema()
+      if min_alpha < 255:
+        # The colour would show through the transparent parts once the image loads.
+        return None
+    (red, green, blue) = image.convert('RGB').resize((1, 1), Image.Resampling.BOX).getpixel((0, 0))
+  return f'#{red:02x}{green:02x}{blue:02x}'
+
+
+def update_image_info(
+    served_to_digest: dict[str, str],
+    thumbnail_dir: str,
+    transcode_settings: dict[str, typing.Any] | None,
+) -> dict[str, ImageInfo]:
+  placeholders = _pillow_available()
+  if not placeholders:
+    print('Skipping the placeholder colours since Pillow is not installed: pip install Pillow')
+
+  # Entries are reused while the served file is built from the same download the same way.
+  settings = {'transcode': transcode_settings, 'placeholders': placeholders}
+  previous = read_image_info_file(thumbnail_dir)
+  previous_images = previous['images'] if previous['settings'] == settings else {}
+
+  images: dict[str, list[typing.Any]] = {}
+  measured = 0
+  for (served, digest) in sorted(served_to_digest.items()):
+    digest = digest[:16]
+    cached = previous_images.get(served)
+    if cached and cached[0] == digest:
+      images[served] = cached
+      continue
+
+    path = os.path.join(thumbnail_dir, served)
+    try:
+      size = image_size.get_image_size(path)
+    except FileNotFoundError:
+      continue
+    if size is None:
+      print(f'Could not read the size of "{path}".')
+      continue
+
+    colour = None
+    if placeholders:
+      try:
+        colour = get_placeholder_colour(path)
+      except (OSError, ValueError) as e:
+        print(f'Could not find a placeholder colour for "{path}": {e}')
+    images[served] = [digest, size[0], size[1], colour]
+    measured += 1
+
+  # One thumbnail per line keeps the file small while changes still diff cleanly.
+  lines = [
+      f'{json.dumps(served, ensure_ascii=False)}:{_get_compact_json(entry)}'
+      for (served, entry) in images.items()
+  ]
+  with open(get_image_info_path(thumbnail_dir), 'w', encoding='utf8') as image_info_file:
+    image_info_file.write(
+        f'{{"settings":{_get_compact_json(settings)},"images":{{\n' + ',\n'.join(lines) + '\n}}\n'
+    )
+  if measured:
+    print(f'Measured {measured} thumbnails for their size and placeholder colour.')
+
+  return {served: (entry[1], entry[2], entry[3]) for (served, entry) in images.items()}
+
+
+def _hash_file(path: str) -> str:
+  with open(path, 'rb') as f:
+    return hashlib.sha256(f.read()).hexdigest()
+
+
+def index_content(local_filenames: typing.Iterable[str], thumbnail_dir: str) -> dict[str, str]:
+  content_index_path = os.path.join(thumbnail_dir, CONTENT_INDEX_FILE)
+  # Maps a local filename to [mtime_ns, size, sha256] so unchanged files are not re-read.
+  previous: dict[str, list[typing.Any]] = {}
+  if os.path.isfile(content_index_path):
+    with open(content_index_path, 'r', encoding='utf8') as content_index_file:
+      previous = json.load(content_index_file)
+
+  content_index: dict[str, list[typing.Any]] = {}
+  for local in sorted(set(local_filenames)):
+    path = os.path.join(thumbnail_dir, local)
+    try:
+      stat = os.stat(path)
+    except FileNotFoundError:
+      continue
+
+    cached = previous.get(local)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+      content_index[local] = cached
+    else:
+      content_index[local] = [stat.st_mtime_ns, stat.st_size, _hash_file(path)]
+
+  with open(content_index_path, 'w', encoding='utf8') as content_index_file:
+    json.dump(content_index, content_index_file, indent=2, sort_keys=True, ensure_ascii=False)
+
+  return {local: entry[2] for (local, entry) in content_index.items()}
+
+
+def deduplicate(local_to_digest: dict[str, str], thumbnail_dir: str) -> dict[str, str]:
+  digest_to_locals: dict[str, list[str]] = {}
+  for (local, digest) in local_to_digest.items():
+    digest_to_locals.setdefault(digest, []).append(local)
+
+  # Maps every local filename to the one file with the same bytes that the page should use.
+  local_to_canonical: dict[str, str] = {}
+  duplicate_bytes = 0
+  for locals_with_digest in digest_to_locals.values():
+    canonical = min(locals_with_digest)
+    canonical_path = os.path.join(thumbnail_dir, canonical)
+    for local in locals_with_digest:
+      local_to_canonical[local] = canonical
+      if local != canonical:
+        duplicate_bytes += _link_to_canonical(os.path.join(thumbnail_dir, local), canonical_path)
+
+  duplicates = len(local_to_canonical) - len(digest_to_locals)
+  if duplicates:
+    print(f'Found {duplicates} duplicate thumbnails.')
+  if duplicate_bytes:
+    print(f'Hard linking duplicate thumbnails saved {duplicate_bytes / 1024 / 1024:.2f}MiB.')
+
+  return local_to_canonical
+
+
+def _link_to_canonical(path: str, canonical_path: str) -> int:
+  if os.path.samefile(path, canonical_path):
+    return 0
+
+  size = os.path.getsize(path)
+  temp_path = f'{path}.link'
+  try:
+    os.link(canonical_path, temp_path)
+  except OSError:
+    # Some file systems do not support hard links. The page still only uses the canonical file.
+    return 0
+  os.replace(temp_path, path)
+  return size
@@ -0,0 +1,143 @@
+from dataclasses import asdict, dataclass
+
+import concurrent.futures
+import io
+import os
+import typing
+
+OPTIMISED_DIR = 'optimised'
+
+FORMATS = ('webp', 'avif')
+DEFAULT_FORMAT = 'webp'
+
+# The page shows thumbnails at most 43px high so this leaves room for high density screens.
+_MAX_WIDTH_PX = 320
+_MAX_HEIGHT_PX = 160
+_SIZE_BUDGET_BYTES = 16 * 1024
+_QUALITY_STEPS = (80, 70, 60, 50, 40, 30)
+
+
+@dataclass(kw_only=True)
+class TranscodeSettings:
+  image_format: str = DEFAULT_FORMAT
+  max_width_px: int = _MAX_WIDTH_PX
+  max_height_px: int = _MAX_HEIGHT_PX
+  size_budget_bytes: int = _SIZE_BUDGET_BYTES
+
+
+def get_optimised_filename(digest: str, image_format: str) -> str:
+  # Named by content so identical images are only transcoded and served once.
+  return f'{OPTIMISED_DIR}/{digest[:16]}.{image_format}'
+
+
+def _import_pillow() -> None:
+  try:
+    import PIL  #pylint: disable=import-outside-toplevel,unused-import
+  except ImportError as e:
+    raise SystemError('Transcoding thumbnails needs Pillow: pip install Pillow') from e
+
+
+def _check_format_supported(image_format: str) -> None:
+  _import_pillow()
+  from PIL import features  #pylint: disable=import-outside-toplevel
+
+  if image_format not in FORMATS:
+    raise ValueError(f'Unknown thumbnail format "{image_format}", expected one of {FORMATS}.')
+  if not features.check(image_format):
+    raise SystemError(f'This build of Pillow cannot write "{image_format}" images.')
+
+
+def transcode_image(source_path: str, output_path: str, settings: TranscodeSettings) -> int:
+  from PIL import Image, ImageOps  #pylint: disable=import-outside-toplevel
+
+  with Image.open(source_path) as source_image:
+    image = ImageOps.exif_transpose(source_image)
+
+    has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+    if image.mode not in ('RGB', 'RGBA'):
+      image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    image.thumbnail(
+        (settings.max_width_px, settings.max_height_px), Image.Resampling.LANCZOS
+    )
+
+  # Step the quality down until the image fits the budget, keeping the last attempt if none do.
+  encoded = b''
+  for quality in _QUALITY_STEPS:
+    buffer = io.BytesIO()
+    image.save(buffer, format=settings.image_format.upper(), quality=quality)
+    encoded = buffer.getvalue()
+    if len(encoded) <= settings.size_budget_bytes:
+      break
+
+  temp_path = f'{output_path}.tmp'
+  with open(temp_path, 'wb') as output_file:
+    output_file.write(encoded)
+  os.replace(temp_path, output_path)
+
+  return len(encoded)
+
+
+def _transcode_job(job: tuple[str, str, TranscodeSettings]) -> tuple[int, str | None]:
+  (source_path, output_path, settings) = job
+  try:
+    return (transcode_image(source_path, output_path, settings), None)
+  except Exception as e:  #pylint: disable=broad-exception-caught
+    return (0, f'{type(e).__name__}: {e}')
+
+
+def transcode_thumbnails(
+    digest_to_local: dict[str, str],
+    thumbnail_dir: str,
+    settings: TranscodeSettings,
+    previous_settings: dict[str, typing.Any] | None = None,
+    workers: int | None = None,
+) -> dict[str, str]:
+  _check_format_supported(settings.image_format)
+
+  settings_unchanged = previous_settings == asdict(settings)
+  os.makedirs(os.path.join(thumbnail_dir, OPTIMISED_DIR), exist_ok=True)
+
+  digest_to_optimised: dict[str, str] = {}
+  jobs: list[tuple[str, str, TranscodeSettings]] = []
+  job_digests: list[str] = []
+
+  for (digest, local) in sorted(digest_to_local.items()):
+    optimised = get_optimised_filename(digest, settings.image_format)
+    output_path = os.path.join(thumbnail_dir, optimised)
+    if settings_unchanged and os.path.isfile(output_path):
+      digest_to_optimised[digest] = optimised
+      continue
+
+    jobs.append((os.path.join(thumbnail_dir, local), output_path, settings))
+    job_digests.append(digest)
+
+  print(f'Transcoding {len(jobs)} thumbnails to {settings.image_format}.')
+
+  bytes_before = 0
+  bytes_after = 0
+  with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+    for (digest, job, (size, error)) in zip(job_digests, jobs, executor.map(_transcode_job, jobs)):
+      if error:
+        print(f'Keeping the original "{job[0]}" since transcoding failed: {error}')
+        continue
+      bytes_before += os.path.getsize(job[0])
+      bytes_after += size
+      digest_to_optimised[digest] = get_optimised_filename(digest, settings.image_format)
+
+  if jobs:
+    print(
+        f'Transcoded {len(jobs)} thumbnails from {bytes_before / 1024 / 1024:.2f}MiB '
+        f'to {bytes_after / 1024 / 1024:.2f}MiB'
+    )
+
+  _remove_unused_optimised_files(thumbnail_dir, set(digest_to_optimised.values()))
+
+  return digest_to_optimised
+
+
+def _remove_unused_optimised_files(thumbnail_dir: str, used: set[str]) -> None:
+  optimised_dir = os.path.join(thumbnail_dir, OPTIMISED_DIR)
+  for filename in os.listdir(optimised_dir):
+    if f'{OPTIMISED_DIR}/{filename}' not in used:
+      os.remove(os.path.join(optimised_dir, filename))
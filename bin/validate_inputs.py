@@ -2,69 +2,102 @@
 
 import common
 import data_files
+import profiler
+import taxonomy
 
 JSON_DATA_LIST = data_files.DATA_LIST
 DATA_DIR = data_files.DATA_DIR
 
 
-def print_node(
-    n: common.NodeRaw | str, children_map: dict[str, list[common.NodeRaw]], level: int = 0
-) -> None:
-  leading_spaces = 2 * level
-  if isinstance(n, str):
-    name = n
-    msg = f' - {name}'
-  else:
-    name = n.name
-    msg = (' ' * leading_spaces) + f' - {n.rank} - {name}'
-    if n.ipa:
-      msg += f' ({n.ipa})'
-  print(msg)
-  if name in children_map:
-    children = children_map[name]
-    for child in children:
-      print_node(child, children_map, level + 1)
-
-
-def validate_no_loop(n: common.NodeRaw, taxa_to_metadata: dict[str, common.NodeRaw]) -> None:
-
-  seen_node_names: set[str] = set()
-  current_node = n
-
-  while current_node.parent != 'LUCA':
-    if current_node.name in seen_node_names:
-      raise ValueError(f'Loop in nodes: {seen_node_names}')
-
-    seen_node_names.add(current_node.name)
-
-    current_node = taxa_to_metadata[current_node.parent]
-
-
-def main():
-
-  children: dict[str, list[common.NodeRaw]] = {}
-  children['LUCA'] = []
-  taxa_to_metadata: dict[str, common.NodeRaw] = {}
-
-  def validate_node(n: common.NodeRaw) -> None:
-    n.validate()
-
-    if n.parent not in children:
-      raise ValueError(f'Node ({n.name}) has a parent ({n.parent}) that does not already exist.')
-
-    children[n.parent].append(n)
-    children[n.name] = []
-
-    if n.name in taxa_to_metadata:
-      raise ValueError(f'Duplicate node ({n.name}).')
-
-    taxa_to_metadata[n.name] = n
-
-  data_files.process_nodes(validate_node)
-
-  print('Testing node data does not have a loop...')
-  for n in taxa_to_metadata.values():
-    validate_no_loop(n, taxa_to_metadata)
+_UNVISITED = 0
+_VISITING = 1
+_VISITED = 2
+
+
+def find_loops(parents: dict[str, str]) -> list[list[str]]:
+  # Each node is coloured once so walking up from every node is O(n) overall. A walk that reaches a
+  # node still being visited has found a loop, while reaching a visited node stops early.
+  colours = dict.fromkeys(parents, _UNVISITED)
+  loops: list[list[str]] = []
+
+  for name in parents:
+    path: list[str] = []
+    current = name
+    while colours.get(current) == _UNVISITED:
+      colours[current] = _VISITING
+      path.append(current)
+      current = parents[current]
+
+    if colours.get(current) == _VISITING:
+      loops.append(path[path.index(current):])
+
+    for visited in path:
+      colours[visited] = _VISITED
+
+  return loops
+
+
+def get_violations(model: taxonomy.Taxonomy, files: set[str] | None = None) -> list[str]:
+  # The nodes are only checked in `files` when given. The checks across files always run.
+  violations: list[str] = []
+  # The first node with each name, where it is and its position in file order.
+  taxa_to_file: dict[str, str] = {}
+  taxa_to_index: dict[str, int] = {}
+  parents: dict[str, str] = {}
+
+  index = 0
+  for (file, nodes) in model.file_to_nodes.items():
+    for n in nodes:
+      index += 1
+      if files is None or file in files:
+        try:
+          n.validate()
+        except Exception as e:  #pylint: disable=broad-exception-caught
+          violations.append(f'Invalid node ({n.name}) in file "{file}": {e}')
+
+      if n.name in taxa_to_file:
+        violations.append(
+            f'Duplicate node ({n.name}) in file "{file}", first defined in file '
+            f'"{taxa_to_file[n.name]}".'
+        )
+        continue
+
+      taxa_to_file[n.name] = file
+      taxa_to_index[n.name] = index
+      parents[n.name] = n.parent
+
+  for (name, parent) in parents.items():
+    if parent == 'LUCA':
+      continue
+    if parent not in parents:
+      violations.append(
+          f'Node ({name}) in file "{taxa_to_file[name]}" has a parent ({parent}) that does not exist.'
+      )
+    elif taxa_to_index[parent] > taxa_to_index[name]:
+      violations.append(
+          f'Node ({name}) in file "{taxa_to_file[name]}" has a parent ({parent}) that is only '
+          f'defined later in file "{taxa_to_file[parent]}".'
+      )
+
+  for loop in find_loops(parents):
+    violations.append(f'Loop in nodes: {" -> ".join(loop + [loop[0]])}')
+
+  return violations
+
+
+def main(model: taxonomy.Taxonomy | None = None):
+
+  if model is None:
+    model = taxonomy.load()
+
+  print('Testing node data for duplicates, missing parents and loops...')
+  with profiler.span('get_violations') as profile_args:
+    violations = get_violations(model)
+    profile_args['violations'] = len(violations)
+  if violations:
+    for violation in violations:
+      print(violation)
+    raise ValueError(f'Found {len(violations)} problems in the data files.')
 
   print('Data files are valid')
 
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass, field
+import argparse
+import glob
+import os
+import sys
+import time
+import typing
+
+import asset_manifest
+import build_cache
+import common
+import compiled_tree
+import data_files
+import regenerate_index
+import search_index
+import taxonomy
+import taxonomy_db
+import validate_inputs
+
+_CODE_GLOB = os.path.join('bin', '*.py')
+_DATA_GLOB = os.path.join(data_files.DATA_DIR, '*.jsonc')
+
+DEFAULT_INTERVAL_SEC = 0.5
+
+
+def _get_stat(path: str) -> tuple[int, int] | None:
+  try:
+    stat = os.stat(path)
+  except FileNotFoundError:
+    return None
+  return (stat.st_mtime_ns, stat.st_size)
+
+
+def _get_data_paths() -> dict[str, str]:
+  return {
+      data_files.get_full_filename(file_metadata): file_metadata.file
+      for file_metadata in data_files.DATA_LIST
+  }
+
+
+def snapshot() -> dict[str, tuple[int, int] | None]:
+  # Polling the stats works everywhere without inotify or any other service. Every data file is
+  # included so new ones are noticed.
+  paths = sorted(glob.glob(_DATA_GLOB)) + list(_get_data_paths()) + sorted(glob.glob(_CODE_GLOB))
+  return {path: _get_stat(path) for path in paths}
+
+
+def _read_file(file_metadata: data_files.JsonDataFile) -> list[common.NodeRaw]:
+  nodes: list[common.NodeRaw] = []
+  data_files.process_file(file_metadata, lambda _, n: nodes.append(n))
+  return nodes
+
+
+@dataclass(kw_only=True)
+class Watcher:
+  release: bool = False
+  # The parsed nodes for each data file, so only the files that change are read again.
+  file_to_nodes: dict[str, list[common.NodeRaw]] = field(default_factory=dict)
+  file_to_chunk_path: dict[str, str] = field(default_factory=dict)
+  file_to_html: dict[str, str] = field(default_factory=dict)
+  file_to_parent_file: dict[str, str | None] = field(default_factory=dict)
+  file_to_search_entries: dict[str, search_index.FileEntries] = field(default_factory=dict)
+  # Files whose chunks have not been written since they changed, such as after an error.
+  stale_files: set[str] = field(default_factory=set)
+  cache: build_cache.BuildCache = field(default_factory=build_cache.BuildCache)
+  # The last valid model, for the outputs only written when watching stops.
+  model: taxonomy.Taxonomy | None = None
+  query_outputs_stale: bool = False
+
+  def _print_missing_thumbnails(self, files: set[str]) -> None:
+    thumbnail_map = regenerate_index.get_thumbnail_map()
+    missing = {
+        img.local_filename
+        for file in files
+        for n in self.file_to_nodes.get(file, [])
+        for img in n.image_list
+        if img.local_filename not in thumbnail_map and
+        not os.path.isfile(os.path.join(regenerate_index.THUMBNAIL_DIR, img.local_filename))
+    }
+    if missing:
+      print(f'Thumbnails not cached yet: {len(missing)}. Run bin/build.py to download them.')
+
+  def rebuild(self, changed_files: set[str]) -> None:
+    start = time.perf_counter()
+    self.stale_files |= changed_files
+
+    # Files that failed to parse before are still stale, so they are read again too.
+    parse_failed = False
+    for file_metadata in data_files.DATA_LIST:
+      if file_metadata.file not in self.stale_files:
+        continue
+      try:
+        self.file_to_nodes[file_metadata.file] = _read_file(file_metadata)
+      except ValueError as e:
+        # The nodes from before the edit must not be built while the file is broken.
+        self.file_to_nodes.pop(file_metadata.file, None)
+        print(e)
+        parse_failed = True
+    if parse_failed:
+      print('Waiting for the next change.')
+      return
+
+    model = taxonomy.from_files(self.file_to_nodes)
+    violations = validate_inputs.get_violations(model, files=self.stale_files)
+    if violations:
+      for violation in violations:
+        print(violation)
+      print(f'Found {len(violations)} problems in the data files. Waiting for the next change.')
+      return
+
+    reuse = {
+        file: chunk_path
+        for (file, chunk_path) in self.file_to_chunk_path.items()
+        if file not in self.stale_files
+    }
+    self.file_to_chunk_path = regenerate_index.write_chunks(
+        model, regenerate_index.get_thumbnail_map(), release=self.release, reuse=reuse
+    )
+
+    # Each tree shows its root from the tree above it, so it is rendered again when that changes.
+    file_to_parent_file = regenerate_index.get_parent_files(model)
+    html_reuse = {
+        file: tree_html
+        for (file, tree_html) in self.file_to_html.items()
+        if file not in self.stale_files and
+        file_to_parent_file.get(file) not in self.stale_files and
+        file_to_parent_file.get(file) == self.file_to_parent_file.get(file)
+    }
+    self.file_to_html = regenerate_index.render_trees(model, reuse=html_reuse)
+    self.file_to_parent_file = file_to_parent_file
+    for file in self.stale_files:
+      self.file_to_search_entries[file] = search_index.get_file_entries(
+          model.file_to_nodes.get(file, [])
+      )
+
+    regenerate_index.main(
+        model,
+        release=self.release,
+        file_to_chunk_path=self.file_to_chunk_path,
+        file_to_html=self.file_to_html,
+        file_to_search_entries=self.file_to_search_entries,
+    )
+    asset_manifest.main(model, self.cache)
+    self.model = model
+    self.query_outputs_stale = True
+
+    self._print_missing_thumbnails(self.stale_files)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    rebuilt = sorted(self.stale_files)
+    if len(rebuilt) > 3:
+      rebuilt = [f'{len(rebuilt)} data files']
+    print(f'Rebuilt {", ".join(rebuilt)} in {elapsed_ms:.0f}ms')
+    self.stale_files.clear()
+
+  def write_query_outputs(self) -> None:
+    # Only the query tools read these and they are rebuilt in full, so they are not written after
+    # every edit.
+    if self.model is None or not self.query_outputs_stale:
+      return
+    compiled_tree.main(self.model)
+    taxonomy_db.main(self.model)
+    self.query_outputs_stale = False
+
+
+def _restart(watcher: Watcher, message: str) -> typing.NoReturn:
+  print(message)
+  watcher.write_query_outputs()
+  os.execv(sys.executable, [sys.executable] + sys.argv)
+
+
+def _watch(watcher: Watcher, interval_sec: float) -> None:
+  previous = snapshot()
+  print(
+      f'Watching {len(previous)} files for changes. Press Ctrl+C to stop, which also writes '
+      f'{compiled_tree.COMPILED_TREE_FILENAME} and {taxonomy_db.DB_FILENAME}.'
+  )
+  while True:
+    time.sleep(interval_sec)
+    current = snapshot()
+    changed_paths = sorted(
+        path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path)
+    )
+    previous = current
+    if not changed_paths:
+      continue
+
+    if any(path.endswith('.py') for path in changed_paths):
+      # The build code and `DATA_LIST` can only be reloaded by starting again.
+      _restart(watcher, f'Build code changed ({", ".join(changed_paths)}), restarting...')
+
+    data_paths = _get_data_paths()
+    if any(path not in data_paths or current.get(path) is None for path in changed_paths):
+      _restart(
+          watcher, f'Data files were added or removed ({", ".join(changed_paths)}), restarting...'
+      )
+
+    watcher.rebuild({data_paths[path] for path in changed_paths if path in data_paths})
+
+
+def main(interval_sec: float = DEFAULT_INTERVAL_SEC, release: bool = False):
+  watcher = Watcher(release=release)
+  watcher.rebuild({file_metadata.file for file_metadata in data_files.DATA_LIST})
+
+  try:
+    _watch(watcher, interval_sec)
+  finally:
+    watcher.write_query_outputs()
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Rebuild the tree data for each data file as it is edited.'
+  )
+  parser.add_argument(
+      '--interval',
+      type=float,
+      default=DEFAULT_INTERVAL_SEC,
+      help='Seconds between checks for changed files.',
+  )
+  parser.add_argument(
+      '--release',
+      action='store_true',
+      help='Minify the output and write .gz and .br copies like build.py --release.',
+  )
+  args = parser.parse_args()
+  try:
+    main(interval_sec=args.interval, release=args.release)
+  except KeyboardInterrupt:
+    pass
@@ -1,26 +1,12 @@
 
-const cache_name_versioned = 'porcoesphino_pt_v24.10.08.1';
+// The app files are kept fresh with the hashes in `asset_manifest.json` so this no longer needs a
+// version bump for each release.
+const cache_name_versioned = 'porcoesphino_pt_app';
 const cache_name_thumbnails = 'porcoesphino_pt_thumbnails';
 
 class AppData {
-  static PRECACHED_RESOURCES = Object.freeze([
-    '/',
-    '/manifest.json',
-    '/cacher.js',
-    '/favicon_tree_192.png',
-    '/favicon_tree_512.png',
-    '/index.html',
-    '/js/compiler.js',
-    '/css/reset-2.0.min.css',
-    '/css/collapsible_block.css',
-    '/css/controls.css',
-    '/css/layout.css',
-    '/css/radio_nav.css',
-    '/css/tree_view.css',
-    '/css/typography.css',
-    '/screenshots/chrome_screenshot.png',
-    '/screenshots/iphone_screenshot.png',
-  ])
+  // Written by `bin/asset_manifest.py`.
+  static ASSET_MANIFEST = '/asset_manifest.json'
 
   static url_is_remote(url) {
     return url.startsWith('https://porcoesphino.github.io')
@@ -35,17 +21,57 @@ class AppData {
     return url.endsWith('favicon_tree_192.png') || url.endsWith('favicon_tree_512.png')
   }
 
-  static get_resource_list_for_event(event) {
+  static get_prefix_for_event(event) {
     if (AppData.is_remote(event)) {
-      var prefix = '/phylogeny'
-    } else {
-      var prefix = ''
+      return '/phylogeny'
+    }
+    return ''
+  }
+}
+
+class AssetManifest {
+
+  static async fetch_latest(prefix) {
+    // Skip the HTTP cache since this is the one request that checks for an update.
+    const response = await fetch(prefix + AppData.ASSET_MANIFEST, { 'cache': 'no-cache' })
+    if (!response.ok) {
+      throw Error(`Failed to fetch the asset manifest: ${response.status}`)
+    }
+    return await response.json()
+  }
+
+  static async get_installed(prefix) {
+    const cache = await caches.open(cache_name_versioned)
+    const response = await cache.match(prefix + AppData.ASSET_MANIFEST)
+    if (!response) {
+      return { 'version': null, 'assets': {}, 'thumbnails': {} }
     }
-    const resources_with_correct_prefix = []
-    for (var i = 0; i < AppData.PRECACHED_RESOURCES.length; i++) {
-      resources_with_correct_prefix.push(prefix + AppData.PRECACHED_RESOURCES[i])
+    return await response.json()
+  }
+
+  static async set_installed(prefix, manifest) {
+    const cache = await caches.open(cache_name_versioned)
+    await cache.put(
+      prefix + AppData.ASSET_MANIFEST,
+      new Response(JSON.stringify(manifest), { 'headers': { 'Content-Type': 'application/json' } })
+    )
+  }
+
+  // Returns the paths with a new hash and the paths that are no longer used.
+  static diff(old_entries, new_entries) {
+    const changed = []
+    const removed = []
+    for (const [path, digest] of Object.entries(new_entries)) {
+      if (old_entries[path] != digest) {
+        changed.push(path)
+      }
     }
-    return resources_with_correct_prefix
+    for (const path of Object.keys(old_entries)) {
+      if (!new_entries.hasOwnProperty(path)) {
+        removed.push(path)
+      }
+    }
+    return [changed, removed]
   }
 }
 
@@ -119,39 +145,37 @@ class Fetcher {
     return fetch_response
   }
 
-  static async add_and_return_if_different(cache_name, url) {
+  static async refresh(cache_name, url) {
     const cache = await caches.open(cache_name)
     const request = new Request(url)
-
-    const cache_response = await cache.match(request)
-    const fetch_response = await fetch(request)
-
-    // If the response failed. Don't update the cache or force a reload.
+    const fetch_response = await fetch(request, { 'cache': 'no-cache' })
     if (!fetch_response.ok) {
-      return true
+      throw Error(`Failed to refresh "${url}": ${fetch_response.status}`)
     }
+    await cache.put(request, fetch_response)
+  }
 
-    let cache_and_fetch_are_equal = true
-    if (!cache_response) {
-      // If the cache doesn't have the item yet update the cache and return that they different.
-      cache_and_fetch_are_equal = false
-    } else {
-      const cache_text = await cache_response.clone().text()
-      const fetch_text = await fetch_response.clone().text()
-      cache_and_fetch_are_equal = (cache_text == fetch_text)
+  // Thumbnail requests are URL encoded by the page so compare the decoded paths.
+  static async delete_or_refresh_thumbnails(prefix, changed, removed) {
+    if (changed.length == 0 && removed.length == 0) {
+      return
     }
-
-    if (!cache_and_fetch_are_equal) {
-      console.log(`Updating cache (${cache_name}) with file that changed: ${url}`)
-      await cache.put(request, fetch_response)
+    const changed_set = new Set(changed)
+    const removed_set = new Set(removed)
+    const cache = await caches.open(cache_name_thumbnails)
+    for (const request of await cache.keys()) {
+      const path = decodeURIComponent(new URL(request.url).pathname).substring(prefix.length)
+      if (removed_set.has(path)) {
+        await cache.delete(request)
+      } else if (changed_set.has(path)) {
+        // Only thumbnails that were installed are refreshed, the rest are fetched when shown.
+        await Fetcher.refresh(cache_name_thumbnails, request.url)
+      }
     }
-
-    return cache_and_fetch_are_equal
   }
 
   static fault_tolerant_add_all = async (cache_name, list_or_set, only_add_on_cache_miss = false) => {
     const url_list = [...list_or_set]
-    let changed_files = []
 
     const clientList = await self.clients.matchAll({ 'type': 'window' })
 
@@ -160,10 +184,7 @@ class Fetcher {
       if (only_add_on_cache_miss) {
         await Fetcher.cache_match_with_fetch_fallback(cache_name, url, true /* put_on_success */)
       } else {
-        const this_response_unchanged = await this.add_and_return_if_different(cache_name, url)
-        if (!this_response_unchanged) {
-          changed_files.push(url)
-        }
+        await Fetcher.refresh(cache_name, url)
       }
 
       for (const client of clientList) {
@@ -178,14 +199,7 @@ class Fetcher {
         )
       }
     }
-    console.log(`Finished ensuring the cache is fresh for ${url_list.length} items. (cache_name = ${cache_name}, only_add_on_cache_miss = ${only_add_on_cache_miss}; changed_files = ${changed_files})`, url_list)
-    if (changed_files.length) {
-      console.log('Changed files: ', changed_files)
-    }
-    if (!only_add_on_cache_miss) {
-      console.log('Fetch complete and these files are changed: ', changed_files)
-      return changed_files
-    }
+    console.log(`Finished ensuring the cache is fresh for ${url_list.length} items. (cache_name = ${cache_name}, only_add_on_cache_miss = ${only_add_on_cache_miss})`, url_list)
   }
 
   static async fetch(request) {
@@ -236,10 +250,38 @@ class Cacher {
       }
     }
     this.precache_started = true
-    const resources = AppData.get_resource_list_for_event(event)
-    const only_add_on_cache_miss = false
-    const changed_files = await Fetcher.fault_tolerant_add_all(cache_name_versioned, resources, only_add_on_cache_miss)
-    if (changed_files.length > 0) {
+    const prefix = AppData.get_prefix_for_event(event)
+
+    // Only the manifest is downloaded when nothing changed.
+    try {
+      var latest = await AssetManifest.fetch_latest(prefix)
+    } catch (error) {
+      console.warn('Skipping the app update check, probably since this is offline.', error)
+      return []
+    }
+    const installed = await AssetManifest.get_installed(prefix)
+    if (latest.version == installed.version) {
+      console.log(`App files are up to date (${latest.version}).`)
+      return []
+    }
+
+    const [changed_assets, removed_assets] = AssetManifest.diff(installed.assets, latest.assets)
+    const changed_files = changed_assets.map((path) => prefix + path)
+    await Fetcher.fault_tolerant_add_all(cache_name_versioned, changed_files)
+    const app_cache = await caches.open(cache_name_versioned)
+    for (const path of removed_assets) {
+      await app_cache.delete(prefix + path)
+    }
+
+    const [changed_thumbnails, removed_thumbnails] = AssetManifest.diff(installed.thumbnails, latest.thumbnails)
+    await Fetcher.delete_or_refresh_thumbnails(prefix, changed_thumbnails, removed_thumbnails)
+
+    // Only record the new manifest once every changed file was stored.
+    await AssetManifest.set_installed(prefix, latest)
+    console.log(`Updated app files from ${installed.version} to ${latest.version}:`, changed_files)
+
+    // A first install has nothing on the page that is out of date.
+    if (installed.version != null && changed_files.length > 0) {
       console.warn('A message will be sent to refresh all tabs using this service worker since this data has changed:', changed_files)
       await self.clients.matchAll({ 'type': 'window' }).then(async (clientList) => {
         for (const client of clientList) {
@@ -192,6 +192,23 @@ function clear_child_nodes(parent_el) {
   }
 }
 
+// A script tag rather than `fetch` so this also works when the page is opened from a file.
+function load_script(src) {
+  return new Promise((resolve, reject) => {
+    var script_el = document.createElement('script')
+    script_el.src = src
+    script_el.addEventListener('load', () => {
+      script_el.remove()
+      resolve()
+    })
+    script_el.addEventListener('error', () => {
+      script_el.remove()
+      reject(new Error('Failed to load script: ' + src))
+    })
+    document.head.appendChild(script_el)
+  })
+}
+
 class QueryParams {
   static _MISSING_ROOT_FOR_LUCA = 'overview'
   static _KEY_CONTROLS = 'controls'
@@ -310,7 +327,7 @@ class QueryParams {
       }
     }
     if (params.has(QueryParams._KEY_ROOT)) {
-      if (this.root != QueryParams._MISSING_ROOT_FOR_LUCA && !state.data_map.has_taxa(this.root)) {
+      if (this.root != QueryParams._MISSING_ROOT_FOR_LUCA && !state.menu_map.has_taxa(this.root)) {
         params.delete(QueryParams._KEY_ROOT)
       }
     }
@@ -334,6 +351,280 @@ class QueryParams {
   }
 }
 
+// Matches `DISPLAY_HEIGHT_PX` in `bin/sprite_atlas.py` and the max-height of `.taxa-img`.
+const SPRITE_DISPLAY_HEIGHT_PX = 43
+
+// Must match `sprite_atlas.get_sprite_style` so the pre-rendered trees look the same.
+function get_sprite_style(atlas, sprite) {
+  const [atlas_url, atlas_width, atlas_height] = atlas
+  const [, x, y, width, height] = sprite
+  const scale = Math.min(height, SPRITE_DISPLAY_HEIGHT_PX) / height
+  const px = (value) => String(Math.floor(value * scale * 100 + 0.5) / 100) + 'px'
+  return (
+    `background-image:url("${atlas_url}");` +
+    `background-position:${px(-x)} ${px(-y)};` +
+    `background-size:${px(atlas_width)} ${px(atlas_height)};` +
+    `width:${px(width)};height:${px(height)}`
+  )
+}
+
+// Each tree is built into its own chunk script that is only loaded when it is needed.
+class TreeData {
+  static _file_to_nodes = new Map()
+  static _file_to_html = new Map()
+  static _file_to_sprites = new Map()
+  static _chunk_to_loading = new Map()
+
+  // Called by each chunk script in `tree_data/` once it has been parsed. Only trees built with
+  // `bin/sprite_atlas.py` have sprites.
+  static register(file, nodes, thumbnail_map, image_info, sprites) {
+    if (!window.thumbnail_map) {
+      window.thumbnail_map = {}
+    }
+    Object.assign(window.thumbnail_map, thumbnail_map)
+    if (!window.image_info) {
+      window.image_info = {}
+    }
+    Object.assign(window.image_info, image_info)
+    TreeData._file_to_nodes.set(file, nodes)
+    if (!!sprites) {
+      TreeData._file_to_sprites.set(file, sprites)
+    }
+  }
+
+  static get_sprites(file) {
+    return TreeData._file_to_sprites.get(file)
+  }
+
+  static get atlas_urls() {
+    var atlas_urls = []
+    for (const sprites of TreeData._file_to_sprites.values()) {
+      sprites.atlases.forEach((atlas) => {
+        atlas_urls.push(atlas[0])
+      })
+    }
+    return atlas_urls
+  }
+
+  // Called by the chunk with the tree already rendered to HTML by `bin/prerender.py`.
+  static register_html(file, html) {
+    TreeData._file_to_html.set(file, html)
+  }
+
+  static get_file_metadata(file) {
+    for (var i = 0; i < window.data_files.length; i++) {
+      if (window.data_files[i].file == file) {
+        return window.data_files[i]
+      }
+    }
+    throw new Error('Unknown data file: ' + file)
+  }
+
+  static is_loaded(file) {
+    return TreeData._file_to_nodes.has(file)
+  }
+
+  static get(file) {
+    if (!TreeData.is_loaded(file)) {
+      throw new Error('Data missing: ' + file)
+    }
+    return TreeData._file_to_nodes.get(file)
+  }
+
+  static has_html(file) {
+    return TreeData._file_to_html.has(file)
+  }
+
+  static get_html(file) {
+    return TreeData._file_to_html.get(file)
+  }
+
+  static _load_chunk(chunk, is_loaded, get) {
+    if (is_loaded()) {
+      return Promise.resolve(get())
+    }
+    if (TreeData._chunk_to_loading.has(chunk)) {
+      return TreeData._chunk_to_loading.get(chunk)
+    }
+
+    const loading = load_script(chunk).then(() => {
+      if (!is_loaded()) {
+        throw new Error('Tree data chunk did not register: ' + chunk)
+      }
+      return get()
+    }).finally(() => {
+      TreeData._chunk_to_loading.delete(chunk)
+    })
+    TreeData._chunk_to_loading.set(chunk, loading)
+    return loading
+  }
+
+  static load(file) {
+    return TreeData._load_chunk(
+      TreeData.get_file_metadata(file).chunk,
+      () => TreeData.is_loaded(file),
+      () => TreeData.get(file)
+    )
+  }
+
+  static load_html(file) {
+    return TreeData._load_chunk(
+      TreeData.get_file_metadata(file).html_chunk,
+      () => TreeData.has_html(file),
+      () => TreeData.get_html(file)
+    )
+  }
+
+  // Loads a tree along with the tree that has the metadata for its root.
+  static load_with_parent(file) {
+    const parent_file = TreeData.get_file_metadata(file).parent_file
+    if (!parent_file) {
+      return TreeData.load(file)
+    }
+    return Promise.all([TreeData.load(file), TreeData.load(parent_file)])
+  }
+
+  static load_all() {
+    return Promise.all(window.data_files.map((file_metadata) => TreeData.load(file_metadata.file)))
+  }
+
+  static all_loaded() {
+    return window.data_files.every((file_metadata) => TreeData.is_loaded(file_metadata.file))
+  }
+}
+
+// The inverted index over taxa names, tags and common names from `bin/search_index.py`.
+class SearchIndex {
+  // Must match the word pattern in `bin/search_index.py`.
+  static WORD_REGEX = /[\p{L}\p{N}_]+/gu
+  static NGRAM_LENGTH = 3
+
+  static _index = null
+  static _loading = null
+  static _entry_text = []
+
+  static register(index) {
+    SearchIndex._index = index
+  }
+
+  static is_loaded() {
+    return !!SearchIndex._index
+  }
+
+  static load() {
+    if (SearchIndex.is_loaded()) {
+      return Promise.resolve()
+    }
+    if (!SearchIndex._loading) {
+      SearchIndex._loading = load_script(window.search_index_chunk).finally(() => {
+        SearchIndex._loading = null
+      })
+    }
+    return SearchIndex._loading
+  }
+
+  static _decode(deltas) {
+    const ids = new Array(deltas.length)
+    var previous = 0
+    for (var i = 0; i < deltas.length; i++) {
+      previous += deltas[i]
+      ids[i] = previous
+    }
+    return ids
+  }
+
+  static _get_entry_text(entry_id) {
+    if (SearchIndex._entry_text[entry_id] === undefined) {
+      const [name, _file_index, tag, common_names] = SearchIndex._index.entries[entry_id]
+      SearchIndex._entry_text[entry_id] = [name, tag, ...common_names].join('\n').toLowerCase()
+    }
+    return SearchIndex._entry_text[entry_id]
+  }
+
+  static _get_word_ids_including(token) {
+    const words = SearchIndex._index.words
+    if (token.length < SearchIndex.NGRAM_LENGTH) {
+      var candidates = words.keys()
+    } else {
+      // Start from the shortest posting list and only keep the words that have every n-gram.
+      const posting_lists = []
+      for (var i = 0; i + SearchIndex.NGRAM_LENGTH <= token.length; i++) {
+        const ngram = token.substr(i, SearchIndex.NGRAM_LENGTH)
+        if (!SearchIndex._index.ngrams.hasOwnProperty(ngram)) {
+          return []
+        }
+        posting_lists.push(SearchIndex._index.ngrams[ngram])
+      }
+      posting_lists.sort((a, b) => a.length - b.length)
+      var candidates = SearchIndex._decode(posting_lists[0])
+    }
+
+    const word_ids = []
+    for (const word_id of candidates) {
+      if (words[word_id].includes(token)) {
+        word_ids.push(word_id)
+      }
+    }
+    return word_ids
+  }
+
+  // Returns the ID of every entry with a name, tag or common name that includes the search.
+  static search(search_input_lowercase) {
+    const tokens = search_input_lowercase.match(SearchIndex.WORD_REGEX) || []
+
+    // Every word in the search must be part of a word in the entry.
+    var candidates = null
+    for (const token of tokens) {
+      const token_entries = new Set()
+      for (const word_id of SearchIndex._get_word_ids_including(token)) {
+        for (const entry_id of SearchIndex._decode(SearchIndex._index.word_entries[word_id])) {
+          if (candidates == null || candidates.has(entry_id)) {
+            token_entries.add(entry_id)
+          }
+        }
+      }
+      candidates = token_entries
+      if (candidates.size == 0) {
+        return []
+      }
+    }
+    if (candidates == null) {
+      candidates = SearchIndex._index.entries.keys()
+    }
+
+    const matches = []
+    for (const entry_id of candidates) {
+      if (SearchIndex._get_entry_text(entry_id).includes(search_input_lowercase)) {
+        matches.push(entry_id)
+      }
+    }
+    return matches
+  }
+
+  static get_matching_files(search_input_lowercase) {
+    const files = new Set()
+    for (const entry_id of SearchIndex.search(search_input_lowercase)) {
+      files.add(window.data_files[SearchIndex._index.entries[entry_id][1]].file)
+    }
+    return files
+  }
+
+  // Returns [root, taxa, tag] for a search that is a taxa or a common name.
+  static get_exact_matches(search_input_raw) {
+    if (!SearchIndex._index.exact.hasOwnProperty(search_input_raw)) {
+      return []
+    }
+    return SearchIndex._index.exact[search_input_raw].map((entry_id) => {
+      const [name, file_index, tag, _common_names] = SearchIndex._index.entries[entry_id]
+      return [window.data_files[file_index].taxa.toLowerCase(), name.toLowerCase(), tag]
+    })
+  }
+
+  static get_autocomplete_list() {
+    return Object.keys(SearchIndex._index.exact)
+  }
+}
+
 class MenuMap {
   constructor() {
     this._menu_mapped_by_taxa = null
@@ -366,56 +657,43 @@ class DataMap {
   constructor() {
     this._taxa_to_root = null
     this._taxa_to_metadata = null
-    this._common_name_to_root_taxa_list = null
+    this._indexed_files = new Set()
   }
 
   static get_data_for_file(metadata_file) {
-    if (!window.hasOwnProperty(metadata_file)) {
-      throw new Error('Data missing: ' + metadata_file)
-    }
-    return window[metadata_file]
+    return TreeData.get(metadata_file)
   }
 
+  // Only the trees that have been loaded are in the maps, so they grow as more trees are opened.
   _build_maps() {
-    if (this._data_mapped_by_taxa == null) {
+    if (this._taxa_to_root == null) {
       // The value is name of the tree that includes this taxa.
       this._taxa_to_root = new Map()
       this._taxa_to_metadata = new Map()
-      this._common_name_to_root_taxa_list = new Map()
-      for (var file_i = 0; file_i < window.data_files.length; file_i++) {
-        var menu_metadata = window.data_files[file_i]
-        var tree_as_list = DataMap.get_data_for_file(menu_metadata.file)
-        var root = menu_metadata.taxa.toLowerCase()
-        for (var taxa_i = 0; taxa_i < tree_as_list.length; taxa_i++) {
-          var taxa_metadata = tree_as_list[taxa_i]
-          var id = taxa_metadata.name.toLowerCase()
-          if (this._taxa_to_root.has(id) || this._taxa_to_metadata.has(id)) {
-            throw new Error(`Duplicate taxa ID in source data (${id}).`)
-          }
-          this._taxa_to_root.set(id, root)
-          this._taxa_to_metadata.set(id, taxa_metadata)
-
-          if (!!taxa_metadata.common) {
-            for (var common_i = 0; common_i < taxa_metadata.common.length; common_i++) {
-              const common_name = taxa_metadata.common[common_i]
-              if (!this._common_name_to_root_taxa_list.has(common_name)) {
-                this._common_name_to_root_taxa_list.set(common_name, [])
-              }
-              var root_for_common_names = this._common_name_to_root_taxa_list.get(common_name)
-              root_for_common_names.push([root, id])
-            }
-          }
+    }
+    for (var file_i = 0; file_i < window.data_files.length; file_i++) {
+      var menu_metadata = window.data_files[file_i]
+      if (this._indexed_files.has(menu_metadata.file) || !TreeData.is_loaded(menu_metadata.file)) {
+        continue
+      }
+      this._indexed_files.add(menu_metadata.file)
+      var tree_as_list = DataMap.get_data_for_file(menu_metadata.file)
+      var root = menu_metadata.taxa.toLowerCase()
+      for (var taxa_i = 0; taxa_i < tree_as_list.length; taxa_i++) {
+        var taxa_metadata = tree_as_list[taxa_i]
+        var id = taxa_metadata.name.toLowerCase()
+        if (this._taxa_to_root.has(id) || this._taxa_to_metadata.has(id)) {
+          throw new Error(`Duplicate taxa ID in source data (${id}).`)
         }
+        this._taxa_to_root.set(id, root)
+        this._taxa_to_metadata.set(id, taxa_metadata)
       }
     }
-    return this._data_mapped_by_taxa
   }
 
   // The value is name of the tree that includes this taxa.
   get taxa_to_root() {
-    if (this._taxa_to_root == null) {
-      this._build_maps()
-    }
+    this._build_maps()
     return this._taxa_to_root
   }
 
@@ -428,29 +706,27 @@ class DataMap {
   }
 
   get taxa_to_metadata() {
-    if (this._taxa_to_metadata == null) {
-      this._build_maps()
-    }
+    this._build_maps()
     return this._taxa_to_metadata
   }
 
   get_metadata(taxa) {
     return this.taxa_to_metadata.get(taxa.toLowerCase())
   }
-
-  get common_name_to_root_taxa_list() {
-    if (!this._common_name_to_root_taxa_list) {
-      this._build_maps()
-    }
-    return this._common_name_to_root_taxa_list
-  }
 }
 
 class State {
 
   static get_img_relative_path_from_remote(remote_url) {
     const split_path = remote_url.split('/')
-    return 'thumbnails/' + split_path[split_path.length - 1]
+    const url_encoded_filename = split_path[split_path.length - 1]
+
+    // Use the resized copy from the build when there is one.
+    const local_filename = decodeURIComponent(url_encoded_filename)
+    if (!!window.thumbnail_map && window.thumbnail_map.hasOwnProperty(local_filename)) {
+      return 'thumbnails/' + window.thumbnail_map[local_filename]
+    }
+    return 'thumbnails/' + url_encoded_filename
   }
 
   constructor(tree_range, card = 'all') {
@@ -459,7 +735,6 @@ class State {
     this._clear_cache()
     this.menu_map = new MenuMap()
     this.data_map = new DataMap()
-    this._autocomplete_list = null
     this._img_set = null
   }
 
@@ -469,11 +744,7 @@ class State {
         var all_data = []
         for (var i = 0; i < window.data_files.length; i++) {
           var file_metadata = window.data_files[i]
-          var var_name_for_file = file_metadata.file
-          if (!window.hasOwnProperty(var_name_for_file)) {
-            throw new Error('State missing: ' + var_name_for_file)
-          }
-          var data_from_file = window[var_name_for_file]
+          var data_from_file = DataMap.get_data_for_file(file_metadata.file)
           all_data = all_data.concat(data_from_file)
         }
         return all_data
@@ -483,6 +754,22 @@ class State {
     }
   }
 
+  async load_tree_for_root_id(root_id) {
+    if (root_id == 'all') {
+      await TreeData.load_all()
+      return
+    }
+    var metadata = this.menu_map.get_metadata(root_id)
+    if (!metadata) {
+      throw new Error('Unknown tree: ' + root_id)
+    }
+    await Promise.all([TreeData.load_with_parent(metadata.file), TreeData.load_html(metadata.file)])
+  }
+
+  async load_all_trees() {
+    await TreeData.load_all()
+  }
+
   _clear_cache() {
     this._displayed_tree_raw_data = null
     this._parent_to_child_list = null
@@ -611,16 +898,6 @@ class State {
     return menu_metadata.domain
   }
 
-  get autocomplete_list() {
-    if (!this._autocomplete_list) {
-      var taxa_list = this.data_map.taxa_to_root.keys()
-      var common_name_list = this.data_map.common_name_to_root_taxa_list.keys()
-      this._autocomplete_list = [...taxa_list, ...common_name_list].sort()
-
-    }
-    return this._autocomplete_list
-  }
-
   get img_urls() {
     if (!this._img_set) {
       var img_list = []
@@ -631,7 +908,7 @@ class State {
           })
         }
       }
-      this._img_set = new Set(img_list)
+      this._img_set = new Set(img_list.concat(TreeData.atlas_urls))
     }
     return this._img_set
   }
@@ -743,37 +1020,21 @@ class Search {
     }
   }
 
-  _menu_el_matches_search(el, search_input_lowercase) {
+  _menu_el_matches_search(el, matching_files) {
     var input_el = el.getElementsByTagName('input')[0];
-    var id = input_el.id
-    var data_for_menu_item = this._state.get_tree_for_root_id(id)
-    for (var data_i = 0; data_i < data_for_menu_item.length; data_i++) {
-      var taxa_metadata = data_for_menu_item[data_i]
-      if (taxa_metadata.name.toLowerCase().includes(search_input_lowercase)) {
-        return true
-      }
-
-      if (!!taxa_metadata.tag && taxa_metadata.tag.toLowerCase().includes(search_input_lowercase)) {
-        return true
-      }
-
-      if (!taxa_metadata.common) {
-        continue
-      }
-      var common_names = taxa_metadata.common
-      for (var name_i = 0; name_i < common_names.length; name_i++) {
-        if (common_names[name_i].toLowerCase().includes(search_input_lowercase)) {
-          return true
-        }
-      }
-    }
-
-    return false
+    var menu_metadata = this._state.menu_map.get_metadata(input_el.id)
+    return !!menu_metadata && matching_files.has(menu_metadata.file)
   }
 
-  _search_callback() {
+  async _search_callback() {
     var search_el = document.getElementById(Search.ID)
     const search_input_raw = search_el.value
+    if (!!search_input_raw) {
+      await SearchIndex.load()
+      if (search_el.value != search_input_raw) {
+        return  // A newer search will update the page.
+      }
+    }
     const search_input_lowercase = search_input_raw.toLowerCase()
 
     var matches = []
@@ -799,13 +1060,14 @@ class Search {
       return
     }
 
+    const matching_files = SearchIndex.get_matching_files(search_input_lowercase)
     for (var i = 0; i < menu_items.length; i++) {
       var menu_el = menu_items[i]
 
       var innerText_lowercase = menu_items[i].innerText.toLowerCase()
       if (
         innerText_lowercase.includes(search_input_lowercase) ||
-        this._menu_el_matches_search(menu_el, search_input_lowercase)
+        this._menu_el_matches_search(menu_el, matching_files)
       ) {
         matches.push(menu_el)
       }
@@ -833,14 +1095,7 @@ class Search {
       // Add a `mark` tag.
       Search.add_mark_for_text(search_input_raw)
 
-      var root_taxa_pairs = []
-      if (this._state.data_map.taxa_to_root.has(search_input_raw)) {
-        root_taxa_pairs.push([this._state.data_map.taxa_to_root.get(search_input_raw), search_input_raw])
-      }
-      if (this._state.data_map.common_name_to_root_taxa_list.has(search_input_raw)) {
-        const root_taxa_pairs_for_common_name = this._state.data_map.common_name_to_root_taxa_list.get(search_input_raw)
-        root_taxa_pairs = root_taxa_pairs.concat(root_taxa_pairs_for_common_name)
-      }
+      const root_taxa_pairs = SearchIndex.get_exact_matches(search_input_raw)
 
       if (root_taxa_pairs.length == 0) {
         exact_match_fieldset_el.style.display = 'none'
@@ -853,7 +1108,7 @@ class Search {
 
       const fragment = document.createDocumentFragment();
       for (var i = 0; i < root_taxa_pairs.length; i++) {
-        const [root, taxa] = root_taxa_pairs[i]
+        const [root, taxa, tag] = root_taxa_pairs[i]
         const callback = () => {
           window.page.select_new_tree_range(root, true /* select_menu */, false /* scroll_menu */, taxa)
         }
@@ -874,14 +1129,13 @@ class Search {
         var label = `${capitalizeFirstLetter(taxa)} as part of the ${capitalizeFirstLetter(root)} tree`
         inner_div_el.innerText = label
 
-        const metadata = this._state.data_map.get_metadata(taxa)
-        if (!!metadata.tag) {
+        if (!!tag) {
           var br_el = document.createElement('br')
           inner_div_el.appendChild(br_el)
           var small_el = document.createElement('small')
           const max_summary_length = 150
-          var summary = metadata.tag.substr(0, max_summary_length)
-          if (metadata.tag.length > max_summary_length) {
+          var summary = tag.substr(0, max_summary_length)
+          if (tag.length > max_summary_length) {
             summary += '…'
           }
           small_el.innerText = summary
@@ -908,13 +1162,19 @@ class Search {
 
   add_callback() {
     var process_typing = this._debounce(() => this._search_callback());
-    document.getElementById(Search.ID).addEventListener('input', process_typing)
+    const search_el = document.getElementById(Search.ID)
+    search_el.addEventListener('input', process_typing)
+    // The options need every tree so only add them once someone starts a search.
+    search_el.addEventListener('focus', async () => {
+      await SearchIndex.load()
+      this.add_autocomplete_options()
+    }, { once: true })
   }
 
   add_autocomplete_options() {
     const fragment = document.createDocumentFragment();
-    const autocomplete_list = this._state.autocomplete_list
-    for (const autocomplete_value of autocomplete_list.values()) {
+    const autocomplete_list = SearchIndex.get_autocomplete_list()
+    for (const autocomplete_value of autocomplete_list) {
       const option_el = document.createElement("option");
       option_el.value = autocomplete_value
       fragment.appendChild(option_el);
@@ -1114,17 +1374,52 @@ class TreeBuilderAsTreeList {
         parent_el.appendChild(tag_el)
       }
     }
+    const get_img_el = (img_remote_src, sprites) => {
+      const split_path = img_remote_src.split('/')
+      const local_filename = decodeURIComponent(split_path[split_path.length - 1])
+      const info = !!window.image_info ? window.image_info[local_filename] : null
+      // Shown until the image loads, which matters most on slow connections.
+      const placeholder_style = (!!info && !!info[2]) ? 'background-color:' + info[2] : ''
+
+      if (!!sprites && sprites.images.hasOwnProperty(local_filename)) {
+        // Every image in the tree shares a few atlas requests instead of one request each.
+        const sprite = sprites.images[local_filename]
+        var style = get_sprite_style(sprites.atlases[sprite[0]], sprite)
+        if (placeholder_style) {
+          style += ';' + placeholder_style
+        }
+        var sprite_el = document.createElement('span')
+        sprite_el.classList.add('taxa-sprite')
+        sprite_el.setAttribute('role', 'img')
+        sprite_el.setAttribute('style', style)
+        return sprite_el
+      }
+      var img_el = document.createElement('img')
+      img_el.src = State.get_img_relative_path_from_remote(img_remote_src)
+      img_el.classList.add('taxa-img')
+      img_el.loading = 'lazy'
+      if (!!info) {
+        // Lets the page reserve the space before the image loads.
+        img_el.width = info[0]
+        img_el.height = info[1]
+      }
+      if (placeholder_style) {
+        img_el.setAttribute('style', placeholder_style)
+      }
+      return img_el
+    }
+
     const maybe_append_images = (node, parent_el) => {
       if (node.hasOwnProperty('imgs') && !!node.imgs) {
+        const metadata = this._state.menu_map.get_metadata(this._state.tree_range)
+        const sprites = !!metadata ? TreeData.get_sprites(metadata.file) : null
         var wrapper_el = document.createElement('div')
         for (var i = 0; i < node.imgs.length; i++) {
           var img_remote_src = node.imgs[i]
           if (!img_remote_src) {
             continue
           }
-          var img_el = document.createElement('img')
-          img_el.src = State.get_img_relative_path_from_remote(img_remote_src)
-          img_el.classList.add('taxa-img')
+          var img_el = get_img_el(img_remote_src, sprites)
 
           if (img_remote_src.startsWith('https://upload.wikimedia.org/wikipedia/commons/thumb')) {
             var re = /https\:\/\/upload.wikimedia.org\/wikipedia\/commons\/thumb\/[^/]+\/[^/]+\/([^/]+)\//
@@ -1206,12 +1501,34 @@ class TreeBuilderAsTreeList {
     return li_el
   }
 
+  // The build renders each whole tree to HTML, which is much faster to parse than building here.
+  _get_prerendered_tree() {
+    if (this._state.card != 'all') {
+      return null
+    }
+    const metadata = this._state.menu_map.get_metadata(this._state.tree_range)
+    if (!metadata || metadata.taxa.toLowerCase() != this._state.tree_range) {
+      return null
+    }
+    if (!TreeData.has_html(metadata.file)) {
+      return null
+    }
+    var template_el = document.createElement('template')
+    template_el.innerHTML = TreeData.get_html(metadata.file)
+    return template_el.content.firstElementChild
+  }
+
   get_html_for_tree_range() {
 
     if (!this._state.tree_range) {
       throw Error('Trying to build the taxa tree before initialisation completes.')
     }
 
+    const prerendered_el = this._get_prerendered_tree()
+    if (!!prerendered_el) {
+      return prerendered_el
+    }
+
     var root_name = this._state.root_name
     var dict = this._state.parent_to_child_list
 
@@ -1395,7 +1712,7 @@ class Settings {
   static ID_INSTALLED_ASSETS = 'installed-assets'
   static ID_UNINSTALLED_BADGE = 'uninstalled-badge'
 
-  static async get_missing_thumbnails(state) {
+  static async get_cached_thumbnail_urls() {
     const cache_name_thumbnails = 'porcoesphino_pt_thumbnails';
     const thumbnail_cache = await window.caches.open(cache_name_thumbnails)
     const thumbnail_requests = await thumbnail_cache.keys()
@@ -1408,6 +1725,12 @@ class Settings {
       const trimmed_url = request.url.substring(request_prefix.length)
       thumbnail_urls.add(decodeURIComponent(trimmed_url))
     }
+    return thumbnail_urls
+  }
+
+  static async get_missing_thumbnails(state) {
+    const thumbnail_urls = await Settings.get_cached_thumbnail_urls()
+    await state.load_all_trees()
 
     const missing_thumbnails = new Set()
     const all_imgs = state.img_urls
@@ -1421,15 +1744,24 @@ class Settings {
   }
 
   static async update_assets_progress(state) {
-    const missing_thumbnails = await Settings.get_missing_thumbnails(state)
-    const all_imgs = state.img_urls
+    // Avoid loading every tree when nothing is installed, which is the common case.
+    const nothing_installed = (
+      (await Settings.get_cached_thumbnail_urls()).size == 0 && !TreeData.all_loaded()
+    )
+    if (nothing_installed) {
+      var missing_count = window.thumbnail_count
+      var total_count = window.thumbnail_count
+    } else {
+      var missing_count = (await Settings.get_missing_thumbnails(state)).size
+      var total_count = state.img_urls.size
+    }
 
-    const installed_assets = all_imgs.size - missing_thumbnails.size
+    const installed_assets = total_count - missing_count
 
     var installed_assets_el = document.getElementById(Settings.ID_INSTALLED_ASSETS)
-    installed_assets_el.innerHTML = `(${installed_assets} / ${all_imgs.size})`
+    installed_assets_el.innerHTML = `(${installed_assets} / ${total_count})`
 
-    if (missing_thumbnails.size > 0) {
+    if (missing_count > 0) {
       const uninstalled_badge_indicator = document.getElementById(Settings.ID_UNINSTALLED_BADGE)
       uninstalled_badge_indicator.style.visibility = 'visible'
     } else {
@@ -1516,6 +1848,7 @@ class Settings {
 }
 
 class Page {
+  static ID_LOAD_ERROR = 'tree-load-error'
 
   constructor() {
     this._tree_range_select = document.getElementById('tree-range-select-buttons');
@@ -1533,6 +1866,21 @@ class Page {
 
     this._tree_range_builder = new TreeBuilderAsTreeList(this.state)
 
+    // The page includes the default tree, which is only kept if it is the tree being opened.
+    const prerendered_tree_range = this._get_rendered_tree_range()
+    if (!!prerendered_tree_range && prerendered_tree_range != (this.query_params.root || this.state.tree_range)) {
+      clear_child_nodes(this._tree_root)
+    }
+
+    // Buttons in the pre-rendered trees only name the tree to open.
+    this._tree_root.addEventListener('click', (event) => {
+      const button_el = event.target.closest('button[data-open-tree]')
+      if (!button_el) {
+        return
+      }
+      this.select_new_tree_range(button_el.dataset.openTree, true /* select_menu */, true /* scroll_menu */)
+    })
+
     this._update_tree_range_view = () => {
       var root_list_el = this._tree_range_builder.get_html_for_tree_range()
 
@@ -1549,8 +1897,16 @@ class Page {
       tree_root.appendChild(root_list_el)
     }
 
-    this.select_new_tree_range = (new_value, select_menu = true, scroll_menu = true, new_taxa = '') => {
+    this.select_new_tree_range = async (new_value, select_menu = true, scroll_menu = true, new_taxa = '') => {
       if (!new_value) { new_value = '' }
+      try {
+        await this.state.load_tree_for_root_id(new_value)
+      } catch (error) {
+        // Keep the current tree so another click can try again.
+        this._show_load_error(error)
+        return
+      }
+      this._clear_load_error()
       this.state.tree_range = new_value
       this.state.card = 'all'
       this.state.taxa = new_taxa
@@ -1624,16 +1980,11 @@ class Page {
     }
     window.addEventListener('resize', this._set_state_based_on_width, true);
 
-    var page_load_callback = () => {
-      this.page_load_callback()
+    var page_load_callback = async () => {
+      await this.page_load_callback()
     }
     setTimeout(() => {
       page_load_callback()
-      // Add the autocomplete options after releasing this thread.
-      // These are low priority and could be put in another thread but this is simpler for now.
-      setTimeout(() => {
-        this.search.add_autocomplete_options()
-      })
     })
 
     window.addEventListener("popstate", (e) => {
@@ -1644,6 +1995,36 @@ class Page {
 
   }
 
+  // Shows why a tree could not be loaded above the tree that is still displayed.
+  _show_load_error(error) {
+    console.error('Failed to load the tree:', error)
+    var error_el = document.getElementById(Page.ID_LOAD_ERROR)
+    if (!error_el) {
+      error_el = document.createElement('p')
+      error_el.id = Page.ID_LOAD_ERROR
+      error_el.setAttribute('role', 'alert')
+      this._tree_root.before(error_el)
+    }
+    error_el.innerText = navigator.onLine
+      ? 'Could not load this tree. Please try again.'
+      : 'Could not load this tree while offline. Please try again once connected.'
+  }
+
+  _clear_load_error() {
+    var error_el = document.getElementById(Page.ID_LOAD_ERROR)
+    if (!!error_el) {
+      error_el.remove()
+    }
+  }
+
+  _get_rendered_tree_range() {
+    const tree_el = this._tree_root.firstElementChild
+    if (!tree_el) {
+      return null
+    }
+    return tree_el.dataset.treeRange
+  }
+
   scroll_tree_to_top() {
     if (!tree_root.firstChild || !tree_root.firstChild.firstChild) {
       return
@@ -1678,7 +2059,7 @@ class Page {
     }
   }
 
-  page_load_callback() {
+  async page_load_callback() {
 
     OfflineCaching.register_cacher()
     // On every refresh, forcibly reload the app code stored in the cache.
@@ -1707,6 +2088,15 @@ class Page {
       document.title = 'Phylogentic tree - ' + menu_metadata.taxa
     }
 
+    var tree_loaded = true
+    try {
+      await this.state.load_tree_for_root_id(this.state.tree_range)
+      this._clear_load_error()
+    } catch (error) {
+      this._show_load_error(error)
+      tree_loaded = false
+    }
+
     // this.add_card_select_options()
     // var card = this.query_params.card
     // if (!!card) {
@@ -1717,7 +2107,10 @@ class Page {
     //   this.state.card = 'all'
     // }
 
-    this._update_tree_range_view()
+    // Skip rebuilding the tree that was included in the page.
+    if (tree_loaded && this._get_rendered_tree_range() != this.state.tree_range) {
+      this._update_tree_range_view()
+    }
 
     var controls_are_open = this.query_params.controls
     this._controls.set_state(controls_are_open)
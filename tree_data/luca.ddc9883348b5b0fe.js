@@ -0,0 +1 @@
+TreeData.register("luca",[{"name":"Bacteria","parent":"LUCA","rank":"Domain","ipa":"bækˈtɪəriə","tag":"Single celled organisms that do not have organelles or a true nucleus. They appear in most habitats on earth, including larger life forms. Sometimes living in mutualistic, commensal and parasitic relationships. Their DNA is typically typically a single circular chromosome.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/3a/E._coli_Bacteria_%287316101966%29.jpg/330px-E._coli_Bacteria_%287316101966%29.jpg","https://upload.wikimedia.org/wikipedia/commons/7/79/Gram_Stain_Anthrax.jpg"]},{"name":"Archaea","parent":"LUCA","rank":"Domain","ipa":"ɑːrˈkiːə","tag":"Early cellular life with one branch evolving into eukaryota. They are often found in extreme environments like hydrothermal vents, highly acidic soils, and salt lakes. Some are methanogens. Their cell walls lack peptidoglycan; use ether bonds to connect fatty acids and glycerol; have multiple RNA polymerases; metabolism can include nitrogen fixation, denitrification, chemolithotrophy, and hyperthermophilic growth.","imgs":["https://upload.wikimedia.org/wikipedia/commons/d/dc/Urzwerg.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a1/Halobacteria.jpg"]},{"name":"Eukaryota","parent":"Archaea","rank":"Domain","ipa":"yuˈkæriˌoʊtə","tag":"Organisms with cells have a membrane-bound nucleus and organelles, including a nucleus, mitochondria, endoplasmic reticulum, and Golgi apparatus.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/Chaos_carolinense.jpg/330px-Chaos_carolinense.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Equus_quagga_burchellii_-_Etosha%2C_2014.jpg/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e0/%28Gemeine_Steinpilz%29_Boletus_edulis.jpg/330px-%28Gemeine_Steinpilz%29_Boletus_edulis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Larix_decidua_Aletschwald.jpg/250px-Larix_decidua_Aletschwald.jpg"]},{"name":"Amorphea","parent":"Eukaryota","rank":"Clade","ipa":"","tag":"","imgs":[]},{"name":"Amoebozoa","parent":"Amorphea","rank":"Amoebozoa","ipa":"","common":["amoebas","giant amoebas","insect-egg slime molds"],"tag":"Protists with the ability to alter its shape, primarily by extending and retracting pseudopods. They often possess blunt, fingerlike, lobose pseudopods and tubular mitochondrial cristae. Some live as parasites or symbionts of other organisms, and some are known to cause disease in humans and other organisms.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Amoeba_proteus_with_many_pseudopodia.jpg/330px-Amoeba_proteus_with_many_pseudopodia.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/62/Pelomyxa_palustris.jpg/330px-Pelomyxa_palustris.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/Entamoeba_histolytica.jpg/250px-Entamoeba_histolytica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/Chaos_carolinense.jpg/330px-Chaos_carolinense.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f7/Insect-egg_slime_imported_from_iNaturalist_photo_347082767_on_29_February_2024.jpg/250px-Insect-egg_slime_imported_from_iNaturalist_photo_347082767_on_29_February_2024.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ce/Leocarpus_fragilis_10649909.jpg/330px-Leocarpus_fragilis_10649909.jpg"]},{"name":"Fungi","parent":"Amorphea","rank":"Kingdom","ipa":"ˈfʌŋɡi","tag":"The primary decomposers in many ecological systems. Their cell walls contain chitin.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/67/Scarlet_elf_cap_cadnant_dingle.jpg/330px-Scarlet_elf_cap_cadnant_dingle.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b9/Caloplaca_thallincola.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e0/%28Gemeine_Steinpilz%29_Boletus_edulis.jpg/330px-%28Gemeine_Steinpilz%29_Boletus_edulis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d0/Flavoparmelia_caperata_240112.jpg/330px-Flavoparmelia_caperata_240112.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg/330px-Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg"]},{"name":"Holozoa","parent":"Amorphea","rank":"Clade","ipa":"","tag":"","imgs":[]},{"name":"Choanoflagellata","parent":"Holozoa","rank":"Class","ipa":"","common":["choanoflagellates"],"tag":"A group of free-living unicellular and colonial flagellate eukaryotes considered to be the closest living relatives of animals. They bear morphological similarities to the choanocyte, a type of cell in sponges. Some are colonial, believed to be a stage from unicellular to multicellular, and this ability seems to have arisen independently several times within the group.","imgs":["https://upload.wikimedia.org/wikipedia/commons/1/12/1singlelate.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/58/Salpingoeca_sp..jpg/250px-Salpingoeca_sp..jpg","https://upload.wikimedia.org/wikipedia/commons/e/eb/0803col.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f3/Desmarella_moniliformis.jpg/330px-Desmarella_moniliformis.jpg","https://upload.wikimedia.org/wikipedia/commons/1/12/Sphaeroeca-colony.jpg"]},{"name":"Animalia","parent":"Holozoa","rank":"Kingdom","ipa":"ˌænɪˈmeɪliə","common":["animals"],"tag":"Most species consume organic material, breathe oxygen, have myocytes and are able to move, can reproduce sexually, and grow from a hollow sphere of cells, the blastula, during embryonic development.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/European_wasp_white_bg02.jpg/330px-European_wasp_white_bg02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Hertshoon.jpg/330px-Hertshoon.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4c/Phyllorhiza_punctata_macro_II.jpg/330px-Phyllorhiza_punctata_macro_II.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Equus_quagga_burchellii_-_Etosha%2C_2014.jpg/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg"]},{"name":"Diaphoretickes","parent":"Eukaryota","rank":"Clade","ipa":"","tag":"","imgs":[]},{"name":"SAR","parent":"Diaphoretickes","rank":"Clade","ipa":"","common":["diatoms","radiolarians","dinoflagellates","brown alga","kelps"],"tag":"","imgs":[]},{"name":"Rhizaria","parent":"SAR","rank":"Clade","ipa":"","common":["radiolarians"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Spongotrochus_rhabdostylus_Ehrenberg_-_160x_-_Radiolarian_%2830981567494%29.jpg/250px-Spongotrochus_rhabdostylus_Ehrenberg_-_160x_-_Radiolarian_%2830981567494%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9a/Hiastriatum_quaternarium_Ehrenberg_-_Radiolarian_%2834470658441%29.jpg/250px-Hiastriatum_quaternarium_Ehrenberg_-_Radiolarian_%2834470658441%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/27/Radiolarian_-_Heliodiscus_umbonatus_%28Ehr.%29%2C_Haeckel_%2828187768550%29.jpg/250px-Radiolarian_-_Heliodiscus_umbonatus_%28Ehr.%29%2C_Haeckel_%2828187768550%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Radiolarian_-_Lychnocanium_ventricosum_Ehrenberg_%2828749275976%29.jpg/250px-Radiolarian_-_Lychnocanium_ventricosum_Ehrenberg_%2828749275976%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8e/Lithochytris_pyramidalis_Ehrenberg_-_Radiolarian_%2830866628421%29.jpg/250px-Lithochytris_pyramidalis_Ehrenberg_-_Radiolarian_%2830866628421%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/09/Radiolarian.jpg/250px-Radiolarian.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/40/Radiolarian_-_Podocyrtis_%28Lampterium%29_mitra_Ehrenberg_-_160x.jpg/250px-Radiolarian_-_Podocyrtis_%28Lampterium%29_mitra_Ehrenberg_-_160x.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/95/Thyrsocyrtis_sp._-_Radiolarian_%2830442423343%29.jpg/250px-Thyrsocyrtis_sp._-_Radiolarian_%2830442423343%29.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a6/Ammonia_tepida.jpg","https://upload.wikimedia.org/wikipedia/commons/6/62/Euglypha_sp.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3a/Binary_and_quaternary_cell_divisions_of_a_chlorarachniophyte%2C_Lotharella_globosa.png/250px-Binary_and_quaternary_cell_divisions_of_a_chlorarachniophyte%2C_Lotharella_globosa.png","https://upload.wikimedia.org/wikipedia/commons/e/ec/Chlorarachnion_reptans.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Sporosori.jpg/330px-Sporosori.jpg"]},{"name":"Alveolate","parent":"SAR","rank":"Clade","ipa":"","common":["dinoflagellates"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/5/5a/Stentor_roeseli_composite_image.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Abg4102.F1.large.jpg/250px-Abg4102.F1.large.jpg","https://upload.wikimedia.org/wikipedia/commons/0/08/Vitrella_brassicaformis_LM_Michalek_2020.png","https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/Динофитовая_микроводоросль%2C_выделенная_из_осадков_Амурского_залива_в_2020_году.jpg/330px-Динофитовая_микроводоросль%2C_выделенная_из_осадков_Амурского_залива_в_2020_году.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Algal_bloom%28akasio%29_by_Noctiluca_in_Nagasaki.jpg/330px-Algal_bloom%28akasio%29_by_Noctiluca_in_Nagasaki.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f2/Noctiluca_scintillans.jpg/330px-Noctiluca_scintillans.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c8/Dinovorax_pyriformis_PMC5609580_fig1c.png"]},{"name":"Stramenopile","parent":"SAR","rank":"Clade","ipa":"","common":["diatoms","brown alga","kelps"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/7/73/Thalassiosira_pseudonana.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bf/Phaeodactylum_tricornutum.png/330px-Phaeodactylum_tricornutum.png","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/Diatom_-_Isthmia_nervosa_-_400x_%2816237138292%29.jpg/250px-Diatom_-_Isthmia_nervosa_-_400x_%2816237138292%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f1/CSIRO_ScienceImage_7233_diatom.jpg/330px-CSIRO_ScienceImage_7233_diatom.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/Detail%2C_CSIRO_ScienceImage_7632_SEM_diatom_%28cropped%29.jpg/250px-Detail%2C_CSIRO_ScienceImage_7632_SEM_diatom_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Diatomeas_w.jpg/330px-Diatomeas_w.jpg","https://upload.wikimedia.org/wikipedia/commons/9/95/Thalassiosira_pseudonana.png","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8e/Kelp-forest-Monterey.jpg/250px-Kelp-forest-Monterey.jpg","https://upload.wikimedia.org/wikipedia/commons/8/80/Bladder_Wrack_%28Fucus_vesiculosus%29_-_geograph.org.uk_-_224125.jpg","https://upload.wikimedia.org/wikipedia/commons/0/0b/Capo_Gallo_Dicotoma.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Mikrofoto.de-Dinobryon_divergens.jpg/250px-Mikrofoto.de-Dinobryon_divergens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/Botrydium_sp_kz03.jpg/330px-Botrydium_sp_kz03.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Protozelleriella_devilliersi_from_Capensibufo_rosei_%28South_Africa%29.jpg/330px-Protozelleriella_devilliersi_from_Capensibufo_rosei_%28South_Africa%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Ränivetikas_Tabellaria_fenestrata.jpg/330px-Ränivetikas_Tabellaria_fenestrata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/28/Kelp_In_Freycinet_Tasmania.jpg/330px-Kelp_In_Freycinet_Tasmania.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/Vaucheria_sp_thallus_01.jpg/330px-Vaucheria_sp_thallus_01.jpg"]},{"name":"Plantae","parent":"Diaphoretickes","rank":"Kingdom","ipa":"ˈplænti","common":["plants"],"tag":"The primary producers in most terrestrial ecosystems using organelles specialised for photosynthesis. Their cell walls contain cellulose.","imgs":["https://upload.wikimedia.org/wikipedia/commons/f/fb/Chondrus_crispus_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-034_%28single%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Tionesta-ac-moss2.jpg/330px-Tionesta-ac-moss2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Senecio_angulatus_003.jpg/330px-Senecio_angulatus_003.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg/330px-Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Jungermannia_hyalina_%28a%2C_113308-471324%29_2392.JPG/330px-Jungermannia_hyalina_%28a%2C_113308-471324%29_2392.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/44/Tree_Fern_%2848717210587%29.jpg/330px-Tree_Fern_%2848717210587%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Larix_decidua_Aletschwald.jpg/250px-Larix_decidua_Aletschwald.jpg"]}],{},{"0803col.jpg":[498,480,"#768189"],"1singlelate.jpg":[326,320,"#6e857c"],"250px-Abg4102.F1.large.jpg":[250,250,"#989193"],"250px-Binary_and_quaternary_cell_divisions_of_a_chlorarachniophyte,_Lotharella_globosa.png":[250,267,"#678f9c"],"250px-Detail,_CSIRO_ScienceImage_7632_SEM_diatom_(cropped).jpg":[250,250,"#767472"],"250px-Diatom_-_Isthmia_nervosa_-_400x_(16237138292).jpg":[250,250,"#2c2c2c"],"250px-Entamoeba_histolytica.jpg":[250,333,"#c2cbcc"],"250px-Hiastriatum_quaternarium_Ehrenberg_-_Radiolarian_(34470658441).jpg":[250,341,"#0c0c0c"],"250px-Insect-egg_slime_imported_from_iNaturalist_photo_347082767_on_29_February_2024.jpg":[250,333,"#746752"],"250px-Kelp-forest-Monterey.jpg":[250,395,"#557a6d"],"250px-Larix_decidua_Aletschwald.jpg":[250,333,"#889872"],"250px-Lithochytris_pyramidalis_Ehrenberg_-_Radiolarian_(30866628421).jpg":[250,250,"#141414"],"250px-Mikrofoto.de-Dinobryon_divergens.jpg":[250,375,"#a4a7aa"],"250px-Radiolarian.jpg":[250,249,"#5f5f5f"],"250px-Radiolarian_-_Heliodiscus_umbonatus_(Ehr.),_Haeckel_(28187768550).jpg":[250,253,"#1e1e1e"],"250px-Radiolarian_-_Lychnocanium_ventricosum_Ehrenberg_(28749275976).jpg":[250,250,"#090909"],"250px-Radiolarian_-_Podocyrtis_(Lampterium)_mitra_Ehrenberg_-_160x.jpg":[250,250,"#111111"],"250px-Salpingoeca_sp..jpg":[250,431,"#d4d4d4"],"250px-Spongotrochus_rhabdostylus_Ehrenberg_-_160x_-_Radiolarian_(30981567494).jpg":[250,250,"#111111"],"250px-Thyrsocyrtis_sp._-_Radiolarian_(30442423343).jpg":[250,382,"#141414"],"330px-(Gemeine_Steinpilz)_Boletus_edulis.jpg":[330,220,"#69674f"],"330px-Algal_bloom(akasio)_by_Noctiluca_in_Nagasaki.jpg":[330,248,"#947977"],"330px-Amoeba_proteus_with_many_pseudopodia.jpg":[330,253,"#7c7b7a"],"330px-Botrydium_sp_kz03.jpg":[330,247,"#5d5c3b"],"330px-CSIRO_ScienceImage_7233_diatom.jpg":[330,215,"#737d7b"],"330px-Chaos_carolinense.jpg":[330,247,"#7d9c8e"],"330px-Desmarella_moniliformis.jpg":[330,244,"#747474"],"330px-Diatomeas_w.jpg":[330,242,"#b1afa7"],"330px-E._coli_Bacteria_(7316101966).jpg":[330,278,"#4d4d4d"],"330px-Equus_quagga_burchellii_-_Etosha,_2014.jpg":[330,220,"#626660"],"330px-European_wasp_white_bg02.jpg":[330,198,"#e3ded8"],"330px-Flavoparmelia_caperata_240112.jpg":[330,247,"#656b52"],"330px-Hertshoon.jpg":[330,221,"#334953"],"330px-Jungermannia_hyalina_(a,_113308-471324)_2392.JPG":[330,220,"#657b30"],"330px-Kelp_In_Freycinet_Tasmania.jpg":[330,232,"#a06c0c"],"330px-Klebsormidium_bilatum_Belgium_(14759117646).jpg":[330,248,"#b5aa87"],"330px-Leocarpus_fragilis_10649909.jpg":[330,247,"#92826a"],"330px-Noctiluca_scintillans.jpg":[330,247,"#1e162b"],"330px-Pelomyxa_palustris.jpg":[330,210,"#9da688"],"330px-Penicillium_на_мандарине.jpg":[330,247,"#a17e3f"],"330px-Phaeodactylum_tricornutum.png":[330,311,"#9ba3b3"],"330px-Phyllorhiza_punctata_macro_II.jpg":[330,224,"#232775"],"330px-Protozelleriella_devilliersi_from_Capensibufo_rosei_(South_Africa).jpg":[330,275,"#939ba9"],"330px-Ränivetikas_Tabellaria_fenestrata.jpg":[330,247,"#8c827d"],"330px-Scarlet_elf_cap_cadnant_dingle.jpg":[330,254,"#825a4b"],"330px-Senecio_angulatus_003.jpg":[330,219,"#3f492d"],"330px-Sporosori.jpg":[330,270,"#797d7f"],"330px-Tionesta-ac-moss2.jpg":[330,248,"#324330"],"330px-Tree_Fern_(48717210587).jpg":[330,219,"#848466"],"330px-Vaucheria_sp_thallus_01.jpg":[330,247,"#686c45"],"330px-Динофитовая_микроводоросль,_выделенная_из_осадков_Амурского_залива_в_2020_году.jpg":[330,258,"#1d1d1d"],"Ammonia_tepida.jpg":[459,309,"#6b4520"],"Bladder_Wrack_(Fucus_vesiculosus)_-_geograph.org.uk_-_224125.jpg":[640,427,"#66543e"],"Caloplaca_thallincola.jpg":[800,600,"#828164"],"Capo_Gallo_Dicotoma.jpg":[640,427,"#737d3b"],"Chlorarachnion_reptans.jpg":[640,480,"#8b98aa"],"Chondrus_crispus_-_Köhler–s_Medizinal-Pflanzen-034_(single).jpg":[332,256,"#d3c4c9"],"Dinovorax_pyriformis_PMC5609580_fig1c.png":[503,508,"#a4a3a6"],"Euglypha_sp.jpg":[640,480,"#515151"],"Gram_Stain_Anthrax.jpg":[600,405,"#b295e9"],"Halobacteria.jpg":[280,251,"#222222"],"Sphaeroeca-colony.jpg":[600,450,"#8f8f8b"],"Stentor_roeseli_composite_image.jpg":[576,359,"#a3b9ab"],"Thalassiosira_pseudonana.jpg":[210,210,"#9b99a6"],"Thalassiosira_pseudonana.png":[276,274,"#565656"],"Urzwerg.jpg":[220,184,"#b0b0b0"],"Vitrella_brassicaformis_LM_Michalek_2020.png":[663,575,"#a7a37e"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca","<ul class=\"tree\" data-tree-range=\"overview\"><li><input type=\"checkbox\" checked id=\"undefined_LUCA\"><label class=\"tree_label\" for=\"undefined_LUCA\"></label><div class=\"outer_tree_box\"><div id=\"overview_luca\" class=\"tree_box\"><span><span>LUCA</span><a href=\"https://en.wikipedia.org/wiki/LUCA\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=LUCA\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=LUCA\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"></span><p class=\"tag\">The theoretical Last Universal Common Ancestor.</p></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"overview_bacteria\" class=\"tree_box\"><span><span>Bacteria</span><a href=\"https://en.wikipedia.org/wiki/Bacteria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Bacteria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Bacteria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=bækˈtɪəriə\" target=\"_blank\">bækˈtɪəriə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Domain</span></span><p class=\"tag\">Single celled organisms that do not have organelles or a true nucleus. They appear in most habitats on earth, including larger life forms. Sometimes living in mutualistic, commensal and parasitic relationships. Their DNA is typically typically a single circular chromosome.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:E._coli_Bacteria_%287316101966%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-E._coli_Bacteria_%287316101966%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"278\" style=\"background-color:#4d4d4d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gram_Stain_Anthrax.jpg\" target=\"_blank\"><img src=\"thumbnails/Gram_Stain_Anthrax.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"405\" style=\"background-color:#b295e9\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"LUCA_Archaea\"><label class=\"tree_label\" for=\"LUCA_Archaea\"></label><div class=\"outer_tree_box\"><div id=\"overview_archaea\" class=\"tree_box\"><span><span>Archaea</span><a href=\"https://en.wikipedia.org/wiki/Archaea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Archaea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Archaea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ɑːrˈkiːə\" target=\"_blank\">ɑːrˈkiːə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Domain</span></span><p class=\"tag\">Early cellular life with one branch evolving into eukaryota. They are often found in extreme environments like hydrothermal vents, highly acidic soils, and salt lakes. Some are methanogens. Their cell walls lack peptidoglycan; use ether bonds to connect fatty acids and glycerol; have multiple RNA polymerases; metabolism can include nitrogen fixation, denitrification, chemolithotrophy, and hyperthermophilic growth.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Urzwerg.jpg\" target=\"_blank\"><img src=\"thumbnails/Urzwerg.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"220\" height=\"184\" style=\"background-color:#b0b0b0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Halobacteria.jpg\" target=\"_blank\"><img src=\"thumbnails/Halobacteria.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"280\" height=\"251\" style=\"background-color:#222222\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Archaea_Eukaryota\"><label class=\"tree_label\" for=\"Archaea_Eukaryota\"></label><div class=\"outer_tree_box\"><div id=\"overview_eukaryota\" class=\"tree_box\"><span><span>Eukaryota</span><a href=\"https://en.wikipedia.org/wiki/Eukaryota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eukaryota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eukaryota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=yuˈkæriˌoʊtə\" target=\"_blank\">yuˈkæriˌoʊtə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Domain</span></span><p class=\"tag\">Organisms with cells have a membrane-bound nucleus and organelles, including a nucleus, mitochondria, endoplasmic reticulum, and Golgi apparatus.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chaos_carolinense.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chaos_carolinense.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7d9c8e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#626660\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%28Gemeine_Steinpilz%29_Boletus_edulis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%28Gemeine_Steinpilz%29_Boletus_edulis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#69674f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Larix_decidua_Aletschwald.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Larix_decidua_Aletschwald.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#889872\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Eukaryota_Amorphea\"><label class=\"tree_label\" for=\"Eukaryota_Amorphea\"></label><div class=\"outer_tree_box\"><div id=\"overview_amorphea\" class=\"tree_box\"><span><span>Amorphea</span><a href=\"https://en.wikipedia.org/wiki/Amorphea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Amorphea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Amorphea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"overview_amoebozoa\" class=\"tree_box\"><span><span>Amoebozoa</span><a href=\"https://en.wikipedia.org/wiki/Amoebozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Amoebozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Amoebozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Amoebozoa</span></span><span class=\"common_names\">(amoebas, giant amoebas, insect-egg slime molds)</span><p class=\"tag\">Protists with the ability to alter its shape, primarily by extending and retracting pseudopods. They often possess blunt, fingerlike, lobose pseudopods and tubular mitochondrial cristae. Some live as parasites or symbionts of other organisms, and some are known to cause disease in humans and other organisms.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Amoeba_proteus_with_many_pseudopodia.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amoeba_proteus_with_many_pseudopodia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"253\" style=\"background-color:#7c7b7a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pelomyxa_palustris.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pelomyxa_palustris.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"210\" style=\"background-color:#9da688\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Entamoeba_histolytica.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Entamoeba_histolytica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#c2cbcc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chaos_carolinense.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chaos_carolinense.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7d9c8e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Insect-egg_slime_imported_from_iNaturalist_photo_347082767_on_29_February_2024.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Insect-egg_slime_imported_from_iNaturalist_photo_347082767_on_29_February_2024.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#746752\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leocarpus_fragilis_10649909.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leocarpus_fragilis_10649909.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#92826a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"overview_fungi\" class=\"tree_box\"><span><span>Fungi</span><a href=\"https://en.wikipedia.org/wiki/Fungi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Fungi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Fungi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈfʌŋɡi\" target=\"_blank\">ˈfʌŋɡi</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"fungi\">See children</button><span class=\"badge\">Kingdom</span></span><p class=\"tag\">The primary decomposers in many ecological systems. Their cell walls contain chitin.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Scarlet_elf_cap_cadnant_dingle.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scarlet_elf_cap_cadnant_dingle.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"254\" style=\"background-color:#825a4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caloplaca_thallincola.jpg\" target=\"_blank\"><img src=\"thumbnails/Caloplaca_thallincola.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#828164\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%28Gemeine_Steinpilz%29_Boletus_edulis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%28Gemeine_Steinpilz%29_Boletus_edulis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#69674f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flavoparmelia_caperata_240112.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Flavoparmelia_caperata_240112.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#656b52\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a17e3f\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Amorphea_Holozoa\"><label class=\"tree_label\" for=\"Amorphea_Holozoa\"></label><div class=\"outer_tree_box\"><div id=\"overview_holozoa\" class=\"tree_box\"><span><span>Holozoa</span><a href=\"https://en.wikipedia.org/wiki/Holozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Holozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Holozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"overview_choanoflagellata\" class=\"tree_box\"><span><span>Choanoflagellata</span><a href=\"https://en.wikipedia.org/wiki/Choanoflagellata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Choanoflagellata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Choanoflagellata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(choanoflagellates)</span><p class=\"tag\">A group of free-living unicellular and colonial flagellate eukaryotes considered to be the closest living relatives of animals. They bear morphological similarities to the choanocyte, a type of cell in sponges. Some are colonial, believed to be a stage from unicellular to multicellular, and this ability seems to have arisen independently several times within the group.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:1singlelate.jpg\" target=\"_blank\"><img src=\"thumbnails/1singlelate.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"326\" height=\"320\" style=\"background-color:#6e857c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Salpingoeca_sp..jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Salpingoeca_sp..jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"431\" style=\"background-color:#d4d4d4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:0803col.jpg\" target=\"_blank\"><img src=\"thumbnails/0803col.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"498\" height=\"480\" style=\"background-color:#768189\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Desmarella_moniliformis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Desmarella_moniliformis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"244\" style=\"background-color:#747474\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sphaeroeca-colony.jpg\" target=\"_blank\"><img src=\"thumbnails/Sphaeroeca-colony.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"450\" style=\"background-color:#8f8f8b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"overview_animalia\" class=\"tree_box\"><span><span>Animalia</span><a href=\"https://en.wikipedia.org/wiki/Animalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Animalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Animalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌænɪˈmeɪliə\" target=\"_blank\">ˌænɪˈmeɪliə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"animalia\">See children</button><span class=\"badge\">Kingdom</span></span><span class=\"common_names\">(animals)</span><p class=\"tag\">Most species consume organic material, breathe oxygen, have myocytes and are able to move, can reproduce sexually, and grow from a hollow sphere of cells, the blastula, during embryonic development.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:European_wasp_white_bg02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-European_wasp_white_bg02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"198\" style=\"background-color:#e3ded8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hertshoon.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hertshoon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#334953\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phyllorhiza_punctata_macro_II.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phyllorhiza_punctata_macro_II.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#232775\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#626660\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Eukaryota_Diaphoretickes\"><label class=\"tree_label\" for=\"Eukaryota_Diaphoretickes\"></label><div class=\"outer_tree_box\"><div id=\"overview_diaphoretickes\" class=\"tree_box\"><span><span>Diaphoretickes</span><a href=\"https://en.wikipedia.org/wiki/Diaphoretickes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Diaphoretickes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Diaphoretickes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Diaphoretickes_SAR\"><label class=\"tree_label\" for=\"Diaphoretickes_SAR\"></label><div class=\"outer_tree_box\"><div id=\"overview_sar\" class=\"tree_box\"><span><span>SAR</span><a href=\"https://en.wikipedia.org/wiki/SAR\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=SAR\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=SAR\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(diatoms, radiolarians, dinoflagellates, brown alga, kelps)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"overview_rhizaria\" class=\"tree_box\"><span><span>Rhizaria</span><a href=\"https://en.wikipedia.org/wiki/Rhizaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rhizaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rhizaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(radiolarians)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Spongotrochus_rhabdostylus_Ehrenberg_-_160x_-_Radiolarian_%2830981567494%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Spongotrochus_rhabdostylus_Ehrenberg_-_160x_-_Radiolarian_%2830981567494%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#111111\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hiastriatum_quaternarium_Ehrenberg_-_Radiolarian_%2834470658441%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hiastriatum_quaternarium_Ehrenberg_-_Radiolarian_%2834470658441%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"341\" style=\"background-color:#0c0c0c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Radiolarian_-_Heliodiscus_umbonatus_%28Ehr.%29%2C_Haeckel_%2828187768550%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Radiolarian_-_Heliodiscus_umbonatus_%28Ehr.%29%2C_Haeckel_%2828187768550%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"253\" style=\"background-color:#1e1e1e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Radiolarian_-_Lychnocanium_ventricosum_Ehrenberg_%2828749275976%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Radiolarian_-_Lychnocanium_ventricosum_Ehrenberg_%2828749275976%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#090909\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lithochytris_pyramidalis_Ehrenberg_-_Radiolarian_%2830866628421%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lithochytris_pyramidalis_Ehrenberg_-_Radiolarian_%2830866628421%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#141414\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Radiolarian.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Radiolarian.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"249\" style=\"background-color:#5f5f5f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Radiolarian_-_Podocyrtis_%28Lampterium%29_mitra_Ehrenberg_-_160x.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Radiolarian_-_Podocyrtis_%28Lampterium%29_mitra_Ehrenberg_-_160x.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#111111\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thyrsocyrtis_sp._-_Radiolarian_%2830442423343%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Thyrsocyrtis_sp._-_Radiolarian_%2830442423343%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"382\" style=\"background-color:#141414\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ammonia_tepida.jpg\" target=\"_blank\"><img src=\"thumbnails/Ammonia_tepida.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"459\" height=\"309\" style=\"background-color:#6b4520\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Euglypha_sp.jpg\" target=\"_blank\"><img src=\"thumbnails/Euglypha_sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#515151\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Binary_and_quaternary_cell_divisions_of_a_chlorarachniophyte%2C_Lotharella_globosa.png\" target=\"_blank\"><img src=\"thumbnails/250px-Binary_and_quaternary_cell_divisions_of_a_chlorarachniophyte%2C_Lotharella_globosa.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"267\" style=\"background-color:#678f9c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chlorarachnion_reptans.jpg\" target=\"_blank\"><img src=\"thumbnails/Chlorarachnion_reptans.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#8b98aa\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sporosori.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sporosori.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"270\" style=\"background-color:#797d7f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"overview_alveolate\" class=\"tree_box\"><span><span>Alveolate</span><a href=\"https://en.wikipedia.org/wiki/Alveolate\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Alveolate\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Alveolate\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(dinoflagellates)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Stentor_roeseli_composite_image.jpg\" target=\"_blank\"><img src=\"thumbnails/Stentor_roeseli_composite_image.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"576\" height=\"359\" style=\"background-color:#a3b9ab\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abg4102.F1.large.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Abg4102.F1.large.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#989193\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vitrella_brassicaformis_LM_Michalek_2020.png\" target=\"_blank\"><img src=\"thumbnails/Vitrella_brassicaformis_LM_Michalek_2020.png\" class=\"taxa-img\" loading=\"lazy\" width=\"663\" height=\"575\" style=\"background-color:#a7a37e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Динофитовая_микроводоросль%2C_выделенная_из_осадков_Амурского_залива_в_2020_году.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Динофитовая_микроводоросль%2C_выделенная_из_осадков_Амурского_залива_в_2020_году.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"258\" style=\"background-color:#1d1d1d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Algal_bloom%28akasio%29_by_Noctiluca_in_Nagasaki.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Algal_bloom%28akasio%29_by_Noctiluca_in_Nagasaki.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#947977\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Noctiluca_scintillans.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Noctiluca_scintillans.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#1e162b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dinovorax_pyriformis_PMC5609580_fig1c.png\" target=\"_blank\"><img src=\"thumbnails/Dinovorax_pyriformis_PMC5609580_fig1c.png\" class=\"taxa-img\" loading=\"lazy\" width=\"503\" height=\"508\" style=\"background-color:#a4a3a6\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"overview_stramenopile\" class=\"tree_box\"><span><span>Stramenopile</span><a href=\"https://en.wikipedia.org/wiki/Stramenopile\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Stramenopile\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Stramenopile\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(diatoms, brown alga, kelps)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Thalassiosira_pseudonana.jpg\" target=\"_blank\"><img src=\"thumbnails/Thalassiosira_pseudonana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"210\" height=\"210\" style=\"background-color:#9b99a6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phaeodactylum_tricornutum.png\" target=\"_blank\"><img src=\"thumbnails/330px-Phaeodactylum_tricornutum.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"311\" style=\"background-color:#9ba3b3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diatom_-_Isthmia_nervosa_-_400x_%2816237138292%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Diatom_-_Isthmia_nervosa_-_400x_%2816237138292%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#2c2c2c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CSIRO_ScienceImage_7233_diatom.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-CSIRO_ScienceImage_7233_diatom.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#737d7b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Detail%2C_CSIRO_ScienceImage_7632_SEM_diatom_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Detail%2C_CSIRO_ScienceImage_7632_SEM_diatom_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#767472\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diatomeas_w.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Diatomeas_w.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"242\" style=\"background-color:#b1afa7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thalassiosira_pseudonana.png\" target=\"_blank\"><img src=\"thumbnails/Thalassiosira_pseudonana.png\" class=\"taxa-img\" loading=\"lazy\" width=\"276\" height=\"274\" style=\"background-color:#565656\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kelp-forest-Monterey.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Kelp-forest-Monterey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"395\" style=\"background-color:#557a6d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bladder_Wrack_%28Fucus_vesiculosus%29_-_geograph.org.uk_-_224125.jpg\" target=\"_blank\"><img src=\"thumbnails/Bladder_Wrack_%28Fucus_vesiculosus%29_-_geograph.org.uk_-_224125.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"427\" style=\"background-color:#66543e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Capo_Gallo_Dicotoma.jpg\" target=\"_blank\"><img src=\"thumbnails/Capo_Gallo_Dicotoma.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"427\" style=\"background-color:#737d3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mikrofoto.de-Dinobryon_divergens.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Mikrofoto.de-Dinobryon_divergens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#a4a7aa\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Botrydium_sp_kz03.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Botrydium_sp_kz03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5d5c3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Protozelleriella_devilliersi_from_Capensibufo_rosei_%28South_Africa%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Protozelleriella_devilliersi_from_Capensibufo_rosei_%28South_Africa%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"275\" style=\"background-color:#939ba9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ränivetikas_Tabellaria_fenestrata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ränivetikas_Tabellaria_fenestrata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8c827d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kelp_In_Freycinet_Tasmania.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Kelp_In_Freycinet_Tasmania.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"232\" style=\"background-color:#a06c0c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vaucheria_sp_thallus_01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vaucheria_sp_thallus_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#686c45\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"overview_plantae\" class=\"tree_box\"><span><span>Plantae</span><a href=\"https://en.wikipedia.org/wiki/Plantae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Plantae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Plantae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈplænti\" target=\"_blank\">ˈplænti</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"plantae\">See children</button><span class=\"badge\">Kingdom</span></span><span class=\"common_names\">(plants)</span><p class=\"tag\">The primary producers in most terrestrial ecosystems using organelles specialised for photosynthesis. Their cell walls contain cellulose.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chondrus_crispus_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-034_%28single%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Chondrus_crispus_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-034_%28single%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"332\" height=\"256\" style=\"background-color:#d3c4c9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tionesta-ac-moss2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tionesta-ac-moss2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#324330\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Senecio_angulatus_003.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Senecio_angulatus_003.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#3f492d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#b5aa87\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jungermannia_hyalina_%28a%2C_113308-471324%29_2392.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Jungermannia_hyalina_%28a%2C_113308-471324%29_2392.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#657b30\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tree_Fern_%2848717210587%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tree_Fern_%2848717210587%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#848466\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Larix_decidua_Aletschwald.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Larix_decidua_Aletschwald.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#889872\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_animalia",[{"name":"Ctenophora","parent":"Animalia","rank":"Phylum","ipa":"təˈnɒfərə","etymology":"'comb'-'carrying'","common":["comb jellies"],"tag":"A medusa that swims with groups of cilia. It's the largest animals to swim with the help of cilia. Their bodies consist of a mass of jelly, with a layer two cells thick on the outside, and another lining the internal cavity. Almost all ctenophores are predators.","imgs":["https://upload.wikimedia.org/wikipedia/commons/c/ca/Pelagic_ctenophores.png","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a8/Comb_jelly.jpg/250px-Comb_jelly.jpg","https://upload.wikimedia.org/wikipedia/commons/2/2a/Juvenile_Bolinopsis_ctenophore.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/LightRefractsOf_comb-rows_of_ctenophore_Mertensia_ovum.jpg/250px-LightRefractsOf_comb-rows_of_ctenophore_Mertensia_ovum.jpg","https://upload.wikimedia.org/wikipedia/commons/9/9d/Ctenophore.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Lobate_ctenophore.jpg/330px-Lobate_ctenophore.jpg"],"card":1},{"name":"Porifera","parent":"Animalia","rank":"Phylum","ipa":"pəˈrɪfərəˌ","etymology":"latin 'pore-bearing'","common":["sea sponges"],"tag":"Sessile filter feeders that are bound to the seabed with many being important reef-building organisms. They are multicellular organisms with tube-like bodies full of pores that circulate water usually with the help of flagella movements of 'collar cells'. They do not have complex nervous, digestive or circulatory systems. Their bodies consist of a non-living jelly-like mass sandwiched between two main layers of cells. They have unspecialized cells that can transform into other types and do not have tissues that derive from embryonic germ layers. Some are radially symmetrical, but most are asymmetrical.","imgs":["https://upload.wikimedia.org/wikipedia/commons/a/a7/Euplectella_aspergillum_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Aplysina_archeri_%28Stove-pipe_Sponge-pink_variation%29.jpg/250px-Aplysina_archeri_%28Stove-pipe_Sponge-pink_variation%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b6/Reef3859_-_Flickr_-_NOAA_Photo_Library.jpg/330px-Reef3859_-_Flickr_-_NOAA_Photo_Library.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Spongilla_lacustris.jpg/330px-Spongilla_lacustris.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/Euplectella_aspergillum_Okeanos.jpg/330px-Euplectella_aspergillum_Okeanos.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a6/Chondrocladia_lampadiglobus.jpg"],"card":1},{"name":"ParaHoxozoa","parent":"Animalia","rank":"Clade","ipa":"","tag":"Named to include all of the animal phyla that have Hox and/or ParaHox genes.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4c/Phyllorhiza_punctata_macro_II.jpg/330px-Phyllorhiza_punctata_macro_II.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Equus_quagga_burchellii_-_Etosha%2C_2014.jpg/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg"],"card":1},{"name":"Placozoa","parent":"ParaHoxozoa","rank":"Phylum","ipa":"ˌplækəˈzoʊə","etymology":"'flat animals'","tag":"Blob-like animals composed of aggregations of cells. They move in water by ciliary motion, eat food by engulfment and reproduce by fission or budding. An individual body measures about 0.55 mm in diameter. They have three tissue layers: the upper, intermediate and lower epithelia. There are at least six different cell types.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/Trichoplax_adhaerens_photograph.png/330px-Trichoplax_adhaerens_photograph.png","https://upload.wikimedia.org/wikipedia/commons/7/71/Placozoan.webp"],"card":1},{"name":"Cnidaria","parent":"ParaHoxozoa","rank":"Phylum","ipa":"nɪˈdɛəriə","common":["jellyfish","hydroids","sea anemones","corals"],"tag":"Aquatic invertebrates found both in freshwater and marine environment. They usually have two basic body forms (swimming medusae and sessile polyps) and both are radially symmetrical with mouths surrounded by tentacles. They have an uncentralized nervous system distributed throughout a gelatinous body and specialized cells with ejectable flagella used mainly for envenomation and capturing prey. They have no organs or organ systems and include some of the smallest marine parasites. They can reproduce both sexually and asexually.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4c/Phyllorhiza_punctata_macro_II.jpg/330px-Phyllorhiza_punctata_macro_II.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Hertshoon.jpg/330px-Hertshoon.jpg","https://upload.wikimedia.org/wikipedia/commons/8/84/Chrysaora_jelly.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/00/Annella_mollis_Maldives.JPG/330px-Annella_mollis_Maldives.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Colonial_anemone_zebra.jpg/250px-Colonial_anemone_zebra.jpg"],"card":1},{"name":"Bilateria","parent":"ParaHoxozoa","rank":"Clade","ipa":"ˌbaɪləˈtɪəriə","tag":"Characterised by bilateral symmetry during embryonic development. Most maintain a bilaterally symmetrical body as adults. Embryos are triploblastic. They have complete digestive tracts with a separate mouth and anus.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Equus_quagga_burchellii_-_Etosha%2C_2014.jpg/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cc/Snail.jpg/330px-Snail.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Scolopendra_cataracta_from_Zookeys.jpg/330px-Scolopendra_cataracta_from_Zookeys.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/Clown_fish_in_the_Andaman_Coral_Reef.jpg/330px-Clown_fish_in_the_Andaman_Coral_Reef.jpg"],"card":1},{"name":"Protostomia","parent":"Bilateria","rank":"Clade","ipa":"ˌproʊtəˈstoʊmi.ə","etymology":"first-mouth'","tag":"Named for they way many species form the organism's mouth before its anus during embryonic development. Cell fates become fixed at the first cleavage of the early embryo. Coeloms generally form out of a solid mass of embryonic tissue splitting away from the rest.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Scolopendra_cataracta_from_Zookeys.jpg/330px-Scolopendra_cataracta_from_Zookeys.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Pseudobiceros_hancockanus.jpg/330px-Pseudobiceros_hancockanus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cc/Snail.jpg/330px-Snail.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Lumbricus_terrestris_%2826559560801%29.jpg/330px-Lumbricus_terrestris_%2826559560801%29.jpg"],"card":2},{"name":"Spiralia","parent":"Protostomia","rank":"Clade","ipa":"","tag":"Named for the spiral cleavage that many species exhibit during embryonic development.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Lumbricus_terrestris_%2826559560801%29.jpg/330px-Lumbricus_terrestris_%2826559560801%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cc/Snail.jpg/330px-Snail.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Pseudobiceros_hancockanus.jpg/330px-Pseudobiceros_hancockanus.jpg"],"card":2},{"name":"Platyhelminthes","parent":"Spiralia","rank":"Phylum","ipa":"","etymology":"greek 'flat worm'","common":["flatworms","flukes","tapeworms","ribbon worms"],"tag":"Relatively simple bilaterian, unsegmented, soft-bodied invertebrates commonly called flatworms. Free-living flatworms are mostly predators. The parasitic forms live in the digestive systems of fish or land vertebrates with intermediate stages transfering the parasites from one host to another. They are acoelomates with no specialised circulatory and respiratory organs so they are restricted to a flattened body layout. The digestive cavity has only one opening for both ingestion and egestion so food can not be processed continuously.","imgs":["https://upload.wikimedia.org/wikipedia/commons/e/ea/New_Zealand_flatworm_2.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Pseudobiceros_hancockanus.jpg/330px-Pseudobiceros_hancockanus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Fasciola_hepatica_%28Linnaeus%2C_1758%29_2013_000-2.jpg/330px-Fasciola_hepatica_%28Linnaeus%2C_1758%29_2013_000-2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ac/Dugesia_subtentaculata_1.jpg/330px-Dugesia_subtentaculata_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Platydemus_manokwari_in_Florida_PeerJ2015_fig-1-full.png/330px-Platydemus_manokwari_in_Florida_PeerJ2015_fig-1-full.png","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ee/Strongylostoma_elongatum_spinosum.jpg/330px-Strongylostoma_elongatum_spinosum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/76/Bedford%27s_Flatworm.jpg/330px-Bedford%27s_Flatworm.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c7/Taenia_scolex_cropped.jpg/330px-Taenia_scolex_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Gorgonorhynchus_repens.jpg/330px-Gorgonorhynchus_repens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Stenostomum_simplex.jpg/330px-Stenostomum_simplex.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fd/Catenula_lemnae.jpg/330px-Catenula_lemnae.jpg"],"card":3},{"name":"Annelida","parent":"Spiralia","rank":"Phylum","ipa":"əˈnɛlɪdə","etymology":"latin 'little ring'","common":["earthworms","leeches","ragworms","feather duster worms","fan worms","bristle worms"],"tag":"The segmented worms. They are bilaterally symmetrical, triploblastic, coelomate, invertebrate organisms with a parapodia for locomotion. Their bodies are long, with segments visible by ring-like constrictions called annuli and each segment has the same sets of organs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/Polychaeta_%28no%29_2.jpg/330px-Polychaeta_%28no%29_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Lumbricus_terrestris_%2826559560801%29.jpg/330px-Lumbricus_terrestris_%2826559560801%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d6/Eunice_aphroditois.jpg/250px-Eunice_aphroditois.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ee/Earthworm_01.jpg/330px-Earthworm_01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Urechiscaupo_%28cropped_and_mirrored%29.jpg/330px-Urechiscaupo_%28cropped_and_mirrored%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d7/Christmas_tree_worm_%28Spirobranchus_giganteus%29.jpg/330px-Christmas_tree_worm_%28Spirobranchus_giganteus%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Marphysa_sanguinea.jpg/330px-Marphysa_sanguinea.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Riftia_tube_worms_Galapagos_2011.jpg/330px-Riftia_tube_worms_Galapagos_2011.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Bispira_sp._%28Tubeworm%29.jpg/330px-Bispira_sp._%28Tubeworm%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5f/Alitta_succinea_%28epitoke%29.jpg/330px-Alitta_succinea_%28epitoke%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/77/Sucking_leech.jpg/330px-Sucking_leech.jpg"],"card":3},{"name":"Mollusca","parent":"Spiralia","rank":"Phylum","ipa":"","common":["snails","sea slugs","bivalves","cockles","octopuses","squids","cuttlefish","nudibranchs"],"tag":"Extant species have a soft body composed almost entirely of muscle, a mantle with a significant cavity used for breathing and excretion, the presence of a radula (except for bivalves), and the structure of the nervous system.","imgs":["https://upload.wikimedia.org/wikipedia/commons/6/69/Grapevinesnail_01.jpg","https://upload.wikimedia.org/wikipedia/commons/4/41/Bivalve_Sea_Shell.png","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e1/Sepioteuthis_sepioidea_%28Caribbean_Reef_Squid%29.jpg/330px-Sepioteuthis_sepioidea_%28Caribbean_Reef_Squid%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Tonicella-lineata.jpg/330px-Tonicella-lineata.jpg"],"card":3},{"name":"Ecdysozoa","parent":"Protostomia","rank":"Clade","ipa":"","common":["tardigrades","roundworms","crabs","insects","arachnids","centipedes"],"tag":"Characterised by a cuticle composed of organic material that is periodically molted as the animal grows. Their embryos do not undergo spiral cleavage. A respiratory and circulatory system is only present in some species.","imgs":["https://upload.wikimedia.org/wikipedia/commons/6/6a/CelegansGoldsteinLabUNC.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Scolopendra_cataracta_from_Zookeys.jpg/330px-Scolopendra_cataracta_from_Zookeys.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d3/Echiniscus_insularis_%2810.3897-evolsyst.5.59997%29_Figure_6_%28white_background%29.jpg/330px-Echiniscus_insularis_%2810.3897-evolsyst.5.59997%29_Figure_6_%28white_background%29.jpg"],"card":2},{"name":"Nematoda","parent":"Ecdysozoa","rank":"Phylum","ipa":"ˌɛkdɪsoʊˈzoʊə","etymology":"'thread'-'like'","common":["roundworms"],"tag":"They are bilaterally symmetrical, elongated, and usually tapered at both ends. Most species are free-living, feeding on microorganisms, but many are parasitic. They secrete an external cuticle that is periodically molted and have a tubular digestive system with openings at both ends. Some cause of soil-transmitted helminthiases. Some species have a pseudocoel.","imgs":["https://upload.wikimedia.org/wikipedia/commons/6/6a/CelegansGoldsteinLabUNC.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bf/Hookworms.JPG/330px-Hookworms.JPG","https://upload.wikimedia.org/wikipedia/commons/f/fb/Roundworm.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/Mermis_nigrescens_beentree.jpg/330px-Mermis_nigrescens_beentree.jpg"],"card":4},{"name":"Arthropoda","parent":"Ecdysozoa","rank":"Phylum","ipa":"","etymology":"jointed leg","common":["crabs","insects","arachnids","centipedes"],"tag":"Possess an exoskeleton with a cuticle made of chitin, often mineralised with calcium carbonate, a body with differentiated (metameric) segments, and paired jointed appendages. While growing they moult their exoskeleton. They have an open circulatory system with a body cavity called a haemocoel through which haemolymph circulates to the interior organs. Their internal organs are generally built of repeated segments.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a1/Apis_mellifera_carnica_worker_hive_entrance_3.jpg/330px-Apis_mellifera_carnica_worker_hive_entrance_3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5b/Ocypode-ceratophthalma-horned-ghost-crab-krabi-thailand.jpg/330px-Ocypode-ceratophthalma-horned-ghost-crab-krabi-thailand.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Araneus_diadematus%2C_Livorno_1.JPG/250px-Araneus_diadematus%2C_Livorno_1.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2e/CSIRO_ScienceImage_2992_The_Giant_Tiger_Prawn.jpg/330px-CSIRO_ScienceImage_2992_The_Giant_Tiger_Prawn.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c6/Limulus_polyphemus_%28aq.%29.jpg/330px-Limulus_polyphemus_%28aq.%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Scolopendra_cataracta_from_Zookeys.jpg/330px-Scolopendra_cataracta_from_Zookeys.jpg"],"card":4},{"name":"Deuterostomia","parent":"Bilateria","rank":"Clade","ipa":"ˌdjuːtərəˈstoʊmi.ə","etymology":"greek 'second mouth'","tag":"Characterized by their anus forming before the mouth during embryonic development. Blastula divisions occur as radial cleavage; most deuterostomes display indeterminate cleavage; and the coelom develops from buds off the embryonic gut.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f3/Expn7526_%2838827990315%29.jpg/330px-Expn7526_%2838827990315%29.jpg","https://upload.wikimedia.org/wikipedia/commons/2/20/Rhabdopleuratubes.png","https://upload.wikimedia.org/wikipedia/commons/b/ba/Fromia_indica_HI09-0187.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Equus_quagga_burchellii_-_Etosha%2C_2014.jpg/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg"],"card":2},{"name":"Echinodermata","parent":"Deuterostomia","rank":"Phylum","ipa":"ɪˌkaɪnoʊˈdɜːrmətə","etymology":"greek 'porcupine, hedgehog'-'skin'","common":["starfish","sea urchins","sea stars","brittle stars","sea lillies","sea cucumbers","sand dollars"],"tag":"Adults have five-pointed radial symmetry (pentamerous symmetry), and are found on the sea bed at every ocean depth from the intertidal zone to the abyssal zone, but the larvae are bilaterally symmetrical. Most are able to reproduce asexually and regenerate tissue, organs and limbs. Their ossified dermal endoskeletons are major contributors to many limestone formations.","imgs":["https://upload.wikimedia.org/wikipedia/commons/b/ba/Fromia_indica_HI09-0187.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/71/Ophionereis_reticulata_1.jpg/330px-Ophionereis_reticulata_1.jpg","https://upload.wikimedia.org/wikipedia/commons/0/07/Sea_cucumber_at_Pulau_Redang.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e9/Nerr0878.jpg/330px-Nerr0878.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Strongylocentrotus_purpuratus_1.jpg/330px-Strongylocentrotus_purpuratus_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Crinoid_on_the_reef_of_Batu_Moncho_Island.JPG/250px-Crinoid_on_the_reef_of_Batu_Moncho_Island.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/Clypeaster_reticulatus.jpg/330px-Clypeaster_reticulatus.jpg"],"card":5},{"name":"Chordata","parent":"Deuterostomia","rank":"Phylum","ipa":"kɔːrˈdeɪtə","common":["lancelets","sea squirts","vertibrates"],"tag":"Possess at some point during their larval or adult stages a notochord, a hollow dorsal nerve cord, an endostyle or thyroid, pharyngeal slits, and a post-anal tail.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Equus_quagga_burchellii_-_Etosha%2C_2014.jpg/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cd/Tunicate_komodo.jpg/330px-Tunicate_komodo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/47/Branchiostoma_lanceolatum.jpg/330px-Branchiostoma_lanceolatum.jpg"],"card":5}],{},{"250px-Aplysina_archeri_(Stove-pipe_Sponge-pink_variation).jpg":[250,334,"#2f586a"],"250px-Araneus_diadematus,_Livorno_1.JPG":[250,281,"#5b6c29"],"250px-Colonial_anemone_zebra.jpg":[250,318,"#201b19"],"250px-Comb_jelly.jpg":[250,343,"#413c5c"],"250px-Crinoid_on_the_reef_of_Batu_Moncho_Island.JPG":[250,333,"#2b6b9a"],"250px-Eunice_aphroditois.jpg":[250,296,"#3a3614"],"250px-LightRefractsOf_comb-rows_of_ctenophore_Mertensia_ovum.jpg":[250,344,"#0c0f10"],"330px-Alitta_succinea_(epitoke).jpg":[330,221,"#664422"],"330px-Annella_mollis_Maldives.JPG":[330,247,"#4a4530"],"330px-Apis_mellifera_carnica_worker_hive_entrance_3.jpg":[330,215,"#846746"],"330px-Bedford's_Flatworm.jpg":[330,247,"#6d786f"],"330px-Bispira_sp._(Tubeworm).jpg":[330,247,"#49533e"],"330px-Branchiostoma_lanceolatum.jpg":[330,261,"#0c0b0a"],"330px-CSIRO_ScienceImage_2992_The_Giant_Tiger_Prawn.jpg":[330,211,"#323c6c"],"330px-Catenula_lemnae.jpg":[330,248,"#c4cccd"],"330px-Christmas_tree_worm_(Spirobranchus_giganteus).jpg":[330,219,"#9f6859"],"330px-Clown_fish_in_the_Andaman_Coral_Reef.jpg":[330,221,"#644a24"],"330px-Clypeaster_reticulatus.jpg":[330,247,"#817f66"],"330px-Dugesia_subtentaculata_1.jpg":[330,274,"#222220"],"330px-Earthworm_01.jpg":[330,247,"#868684"],"330px-Echiniscus_insularis_(10.3897-evolsyst.5.59997)_Figure_6_(white_background).jpg":[330,231,"#c7c4bf"],"330px-Equus_quagga_burchellii_-_Etosha,_2014.jpg":[330,220,"#626660"],"330px-Euplectella_aspergillum_Okeanos.jpg":[330,186,"#647184"],"330px-Expn7526_(38827990315).jpg":[330,186,"#6f7067"],"330px-Fasciola_hepatica_(Linnaeus,_1758)_2013_000-2.jpg":[330,136,"#cf7a7c"],"330px-Gorgonorhynchus_repens.jpg":[330,239,"#929f9d"],"330px-Hertshoon.jpg":[330,221,"#334953"],"330px-Hookworms.JPG":[330,220,"#642f25"],"330px-Limulus_polyphemus_(aq.).jpg":[330,247,"#856a4b"],"330px-Lobate_ctenophore.jpg":[330,302,"#1c4159"],"330px-Lumbricus_terrestris_(26559560801).jpg":[330,220,"#956b4c"],"330px-Marphysa_sanguinea.jpg":[330,248,"#271f17"],"330px-Mermis_nigrescens_beentree.jpg":[330,247,"#7e796d"],"330px-Nerr0878.jpg":[330,227,"#726963"],"330px-Ocypode-ceratophthalma-horned-ghost-crab-krabi-thailand.jpg":[330,220,"#99a298"],"330px-Ophionereis_reticulata_1.jpg":[330,218,"#797168"],"330px-Phyllorhiza_punctata_macro_II.jpg":[330,224,"#232775"],"330px-Platydemus_manokwari_in_Florida_PeerJ2015_fig-1-full.png":[330,314,"#6b715f"],"330px-Polychaeta_(no)_2.jpg":[330,212,"#efe4de"],"330px-Pseudobiceros_hancockanus.jpg":[330,208,"#7c6e66"],"330px-Reef3859_-_Flickr_-_NOAA_Photo_Library.jpg":[330,247,"#4d8a8e"],"330px-Riftia_tube_worms_Galapagos_2011.jpg":[330,186,"#514b48"],"330px-Scolopendra_cataracta_from_Zookeys.jpg":[330,226,"#b7814f"],"330px-Sepioteuthis_sepioidea_(Caribbean_Reef_Squid).jpg":[330,247,"#a8c3bd"],"330px-Snail.jpg":[330,247,"#7e7b7a"],"330px-Spongilla_lacustris.jpg":[330,247,"#86814b"],"330px-Stenostomum_simplex.jpg":[330,248,"#808478"],"330px-Strongylocentrotus_purpuratus_1.jpg":[330,273,"#5b514e"],"330px-Strongylostoma_elongatum_spinosum.jpg":[330,247,"#ababaa"],"330px-Sucking_leech.jpg":[330,248,"#b59a7f"],"330px-Taenia_scolex_cropped.jpg":[330,314,"#886b45"],"330px-Tonicella-lineata.jpg":[330,200,"#785c4b"],"330px-Trichoplax_adhaerens_photograph.png":[330,282,"#385e5d"],"330px-Tunicate_komodo.jpg":[330,247,"#5a5950"],"330px-Urechiscaupo_(cropped_and_mirrored).jpg":[330,220,"#5d523b"],"Bivalve_Sea_Shell.png":[473,436,null],"CelegansGoldsteinLabUNC.jpg":[350,297,"#6d8a80"],"Chondrocladia_lampadiglobus.jpg":[515,515,"#797e75"],"Chrysaora_jelly.jpg":[600,450,"#162a41"],"Ctenophore.jpg":[440,560,"#291b1b"],"Euplectella_aspergillum_(cropped).jpg":[800,640,"#5f6460"],"Fromia_indica_HI09-0187.JPG":[800,532,"#130602"],"Grapevinesnail_01.jpg":[1024,604,"#d6cec7"],"Juvenile_Bolinopsis_ctenophore.jpg":[600,450,"#10110e"],"New_Zealand_flatworm_2.JPG":[480,360,"#7d7979"],"Pelagic_ctenophores.png":[709,478,"#32343b"],"Placozoan.webp":[617,432,"#959595"],"Rhabdopleuratubes.png":[361,505,"#787878"],"Roundworm.jpg":[236,152,"#ceb499"],"Sea_cucumber_at_Pulau_Redang.jpg":[640,480,"#5a767b"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia","<ul class=\"tree\" data-tree-range=\"animalia\"><li><input type=\"checkbox\" checked id=\"Holozoa_Animalia\"><label class=\"tree_label\" for=\"Holozoa_Animalia\"></label><div class=\"outer_tree_box\"><div id=\"animalia_animalia\" class=\"tree_box\"><span><span>Animalia</span><a href=\"https://en.wikipedia.org/wiki/Animalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Animalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Animalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Animalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌænɪˈmeɪliə\" target=\"_blank\">ˌænɪˈmeɪliə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"overview\">See parent</button><span class=\"badge\">Kingdom</span></span><span class=\"common_names\">(animals)</span><p class=\"tag\">Most species consume organic material, breathe oxygen, have myocytes and are able to move, can reproduce sexually, and grow from a hollow sphere of cells, the blastula, during embryonic development.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:European_wasp_white_bg02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-European_wasp_white_bg02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"198\" style=\"background-color:#e3ded8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hertshoon.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hertshoon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#334953\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phyllorhiza_punctata_macro_II.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phyllorhiza_punctata_macro_II.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#232775\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#626660\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"animalia_ctenophora\" class=\"tree_box\"><span><span>Ctenophora</span><a href=\"https://en.wikipedia.org/wiki/Ctenophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ctenophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ctenophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ctenophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=təˈnɒfərə\" target=\"_blank\">təˈnɒfərə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(comb jellies)</span><p class=\"tag\">A medusa that swims with groups of cilia. It&#x27;s the largest animals to swim with the help of cilia. Their bodies consist of a mass of jelly, with a layer two cells thick on the outside, and another lining the internal cavity. Almost all ctenophores are predators.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pelagic_ctenophores.png\" target=\"_blank\"><img src=\"thumbnails/Pelagic_ctenophores.png\" class=\"taxa-img\" loading=\"lazy\" width=\"709\" height=\"478\" style=\"background-color:#32343b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Comb_jelly.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Comb_jelly.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"343\" style=\"background-color:#413c5c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Juvenile_Bolinopsis_ctenophore.jpg\" target=\"_blank\"><img src=\"thumbnails/Juvenile_Bolinopsis_ctenophore.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"450\" style=\"background-color:#10110e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:LightRefractsOf_comb-rows_of_ctenophore_Mertensia_ovum.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-LightRefractsOf_comb-rows_of_ctenophore_Mertensia_ovum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"344\" style=\"background-color:#0c0f10\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ctenophore.jpg\" target=\"_blank\"><img src=\"thumbnails/Ctenophore.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"440\" height=\"560\" style=\"background-color:#291b1b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lobate_ctenophore.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lobate_ctenophore.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"302\" style=\"background-color:#1c4159\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"animalia_porifera\" class=\"tree_box\"><span><span>Porifera</span><a href=\"https://en.wikipedia.org/wiki/Porifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Porifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Porifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Porifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=pəˈrɪfərəˌ\" target=\"_blank\">pəˈrɪfərəˌ</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(sea sponges)</span><p class=\"tag\">Sessile filter feeders that are bound to the seabed with many being important reef-building organisms. They are multicellular organisms with tube-like bodies full of pores that circulate water usually with the help of flagella movements of &#x27;collar cells&#x27;. They do not have complex nervous, digestive or circulatory systems. Their bodies consist of a non-living jelly-like mass sandwiched between two main layers of cells. They have unspecialized cells that can transform into other types and do not have tissues that derive from embryonic germ layers. Some are radially symmetrical, but most are asymmetrical.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Euplectella_aspergillum_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Euplectella_aspergillum_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"640\" style=\"background-color:#5f6460\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aplysina_archeri_%28Stove-pipe_Sponge-pink_variation%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aplysina_archeri_%28Stove-pipe_Sponge-pink_variation%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"334\" style=\"background-color:#2f586a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Reef3859_-_Flickr_-_NOAA_Photo_Library.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Reef3859_-_Flickr_-_NOAA_Photo_Library.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4d8a8e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spongilla_lacustris.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Spongilla_lacustris.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#86814b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Euplectella_aspergillum_Okeanos.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Euplectella_aspergillum_Okeanos.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#647184\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chondrocladia_lampadiglobus.jpg\" target=\"_blank\"><img src=\"thumbnails/Chondrocladia_lampadiglobus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"515\" height=\"515\" style=\"background-color:#797e75\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Animalia_ParaHoxozoa\"><label class=\"tree_label\" for=\"Animalia_ParaHoxozoa\"></label><div class=\"outer_tree_box\"><div id=\"animalia_parahoxozoa\" class=\"tree_box\"><span><span>ParaHoxozoa</span><a href=\"https://en.wikipedia.org/wiki/ParaHoxozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=ParaHoxozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=ParaHoxozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/ParaHoxozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Named to include all of the animal phyla that have Hox and/or ParaHox genes.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Phyllorhiza_punctata_macro_II.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phyllorhiza_punctata_macro_II.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#232775\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#626660\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"animalia_placozoa\" class=\"tree_box\"><span><span>Placozoa</span><a href=\"https://en.wikipedia.org/wiki/Placozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Placozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Placozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Placozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌplækəˈzoʊə\" target=\"_blank\">ˌplækəˈzoʊə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">Blob-like animals composed of aggregations of cells. They move in water by ciliary motion, eat food by engulfment and reproduce by fission or budding. An individual body measures about 0.55 mm in diameter. They have three tissue layers: the upper, intermediate and lower epithelia. There are at least six different cell types.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Trichoplax_adhaerens_photograph.png\" target=\"_blank\"><img src=\"thumbnails/330px-Trichoplax_adhaerens_photograph.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#385e5d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Placozoan.webp\" target=\"_blank\"><img src=\"thumbnails/Placozoan.webp\" class=\"taxa-img\" loading=\"lazy\" width=\"617\" height=\"432\" style=\"background-color:#959595\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"animalia_cnidaria\" class=\"tree_box\"><span><span>Cnidaria</span><a href=\"https://en.wikipedia.org/wiki/Cnidaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cnidaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cnidaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cnidaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=nɪˈdɛəriə\" target=\"_blank\">nɪˈdɛəriə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"cnidaria\">See children</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(jellyfish, hydroids, sea anemones, corals)</span><p class=\"tag\">Aquatic invertebrates found both in freshwater and marine environment. They usually have two basic body forms (swimming medusae and sessile polyps) and both are radially symmetrical with mouths surrounded by tentacles. They have an uncentralized nervous system distributed throughout a gelatinous body and specialized cells with ejectable flagella used mainly for envenomation and capturing prey. They have no organs or organ systems and include some of the smallest marine parasites. They can reproduce both sexually and asexually.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Phyllorhiza_punctata_macro_II.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phyllorhiza_punctata_macro_II.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#232775\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hertshoon.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hertshoon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#334953\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chrysaora_jelly.jpg\" target=\"_blank\"><img src=\"thumbnails/Chrysaora_jelly.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"450\" style=\"background-color:#162a41\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Annella_mollis_Maldives.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Annella_mollis_Maldives.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4a4530\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Colonial_anemone_zebra.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Colonial_anemone_zebra.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"318\" style=\"background-color:#201b19\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"ParaHoxozoa_Bilateria\"><label class=\"tree_label\" for=\"ParaHoxozoa_Bilateria\"></label><div class=\"outer_tree_box\"><div id=\"animalia_bilateria\" class=\"tree_box\"><span><span>Bilateria</span><a href=\"https://en.wikipedia.org/wiki/Bilateria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Bilateria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Bilateria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Bilateria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌbaɪləˈtɪəriə\" target=\"_blank\">ˌbaɪləˈtɪəriə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Characterised by bilateral symmetry during embryonic development. Most maintain a bilaterally symmetrical body as adults. Embryos are triploblastic. They have complete digestive tracts with a separate mouth and anus.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#626660\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Snail.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Snail.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7e7b7a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scolopendra_cataracta_from_Zookeys.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scolopendra_cataracta_from_Zookeys.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#b7814f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clown_fish_in_the_Andaman_Coral_Reef.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Clown_fish_in_the_Andaman_Coral_Reef.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#644a24\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Bilateria_Protostomia\"><label class=\"tree_label\" for=\"Bilateria_Protostomia\"></label><div class=\"outer_tree_box\"><div id=\"animalia_protostomia\" class=\"tree_box\"><span><span>Protostomia</span><a href=\"https://en.wikipedia.org/wiki/Protostomia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Protostomia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Protostomia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Protostomia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌproʊtəˈstoʊmi.ə\" target=\"_blank\">ˌproʊtəˈstoʊmi.ə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Named for they way many species form the organism&#x27;s mouth before its anus during embryonic development. Cell fates become fixed at the first cleavage of the early embryo. Coeloms generally form out of a solid mass of embryonic tissue splitting away from the rest.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Scolopendra_cataracta_from_Zookeys.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scolopendra_cataracta_from_Zookeys.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#b7814f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pseudobiceros_hancockanus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudobiceros_hancockanus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"208\" style=\"background-color:#7c6e66\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Snail.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Snail.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7e7b7a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lumbricus_terrestris_%2826559560801%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lumbricus_terrestris_%2826559560801%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#956b4c\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Protostomia_Spiralia\"><label class=\"tree_label\" for=\"Protostomia_Spiralia\"></label><div class=\"outer_tree_box\"><div id=\"animalia_spiralia\" class=\"tree_box\"><span><span>Spiralia</span><a href=\"https://en.wikipedia.org/wiki/Spiralia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Spiralia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Spiralia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Spiralia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Named for the spiral cleavage that many species exhibit during embryonic development.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lumbricus_terrestris_%2826559560801%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lumbricus_terrestris_%2826559560801%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#956b4c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Snail.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Snail.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7e7b7a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pseudobiceros_hancockanus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudobiceros_hancockanus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"208\" style=\"background-color:#7c6e66\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"animalia_platyhelminthes\" class=\"tree_box\"><span><span>Platyhelminthes</span><a href=\"https://en.wikipedia.org/wiki/Platyhelminthes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Platyhelminthes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Platyhelminthes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Platyhelminthes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(flatworms, flukes, tapeworms, ribbon worms)</span><p class=\"tag\">Relatively simple bilaterian, unsegmented, soft-bodied invertebrates commonly called flatworms. Free-living flatworms are mostly predators. The parasitic forms live in the digestive systems of fish or land vertebrates with intermediate stages transfering the parasites from one host to another. They are acoelomates with no specialised circulatory and respiratory organs so they are restricted to a flattened body layout. The digestive cavity has only one opening for both ingestion and egestion so food can not be processed continuously.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:New_Zealand_flatworm_2.JPG\" target=\"_blank\"><img src=\"thumbnails/New_Zealand_flatworm_2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"480\" height=\"360\" style=\"background-color:#7d7979\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pseudobiceros_hancockanus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudobiceros_hancockanus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"208\" style=\"background-color:#7c6e66\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fasciola_hepatica_%28Linnaeus%2C_1758%29_2013_000-2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fasciola_hepatica_%28Linnaeus%2C_1758%29_2013_000-2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"136\" style=\"background-color:#cf7a7c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dugesia_subtentaculata_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dugesia_subtentaculata_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"274\" style=\"background-color:#222220\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Platydemus_manokwari_in_Florida_PeerJ2015_fig-1-full.png\" target=\"_blank\"><img src=\"thumbnails/330px-Platydemus_manokwari_in_Florida_PeerJ2015_fig-1-full.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"314\" style=\"background-color:#6b715f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Strongylostoma_elongatum_spinosum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Strongylostoma_elongatum_spinosum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#ababaa\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bedford%27s_Flatworm.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bedford%27s_Flatworm.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6d786f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Taenia_scolex_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Taenia_scolex_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"314\" style=\"background-color:#886b45\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gorgonorhynchus_repens.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gorgonorhynchus_repens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"239\" style=\"background-color:#929f9d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stenostomum_simplex.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stenostomum_simplex.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#808478\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Catenula_lemnae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Catenula_lemnae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#c4cccd\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"animalia_annelida\" class=\"tree_box\"><span><span>Annelida</span><a href=\"https://en.wikipedia.org/wiki/Annelida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Annelida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Annelida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Annelida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=əˈnɛlɪdə\" target=\"_blank\">əˈnɛlɪdə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(earthworms, leeches, ragworms, feather duster worms, fan worms, bristle worms)</span><p class=\"tag\">The segmented worms. They are bilaterally symmetrical, triploblastic, coelomate, invertebrate organisms with a parapodia for locomotion. Their bodies are long, with segments visible by ring-like constrictions called annuli and each segment has the same sets of organs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Polychaeta_%28no%29_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Polychaeta_%28no%29_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"212\" style=\"background-color:#efe4de\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lumbricus_terrestris_%2826559560801%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lumbricus_terrestris_%2826559560801%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#956b4c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eunice_aphroditois.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eunice_aphroditois.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"296\" style=\"background-color:#3a3614\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Earthworm_01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Earthworm_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#868684\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Urechiscaupo_%28cropped_and_mirrored%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Urechiscaupo_%28cropped_and_mirrored%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5d523b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Christmas_tree_worm_%28Spirobranchus_giganteus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Christmas_tree_worm_%28Spirobranchus_giganteus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#9f6859\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Marphysa_sanguinea.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Marphysa_sanguinea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#271f17\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Riftia_tube_worms_Galapagos_2011.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Riftia_tube_worms_Galapagos_2011.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#514b48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bispira_sp._%28Tubeworm%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bispira_sp._%28Tubeworm%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#49533e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Alitta_succinea_%28epitoke%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Alitta_succinea_%28epitoke%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#664422\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sucking_leech.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sucking_leech.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#b59a7f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"animalia_mollusca\" class=\"tree_box\"><span><span>Mollusca</span><a href=\"https://en.wikipedia.org/wiki/Mollusca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mollusca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mollusca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mollusca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"mollusca\">See children</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(snails, sea slugs, bivalves, cockles, octopuses, squids, cuttlefish, nudibranchs)</span><p class=\"tag\">Extant species have a soft body composed almost entirely of muscle, a mantle with a significant cavity used for breathing and excretion, the presence of a radula (except for bivalves), and the structure of the nervous system.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Grapevinesnail_01.jpg\" target=\"_blank\"><img src=\"thumbnails/Grapevinesnail_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"1024\" height=\"604\" style=\"background-color:#d6cec7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bivalve_Sea_Shell.png\" target=\"_blank\"><img src=\"thumbnails/Bivalve_Sea_Shell.png\" class=\"taxa-img\" loading=\"lazy\" width=\"473\" height=\"436\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sepioteuthis_sepioidea_%28Caribbean_Reef_Squid%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sepioteuthis_sepioidea_%28Caribbean_Reef_Squid%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a8c3bd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tonicella-lineata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tonicella-lineata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"200\" style=\"background-color:#785c4b\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Protostomia_Ecdysozoa\"><label class=\"tree_label\" for=\"Protostomia_Ecdysozoa\"></label><div class=\"outer_tree_box\"><div id=\"animalia_ecdysozoa\" class=\"tree_box\"><span><span>Ecdysozoa</span><a href=\"https://en.wikipedia.org/wiki/Ecdysozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ecdysozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ecdysozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ecdysozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(tardigrades, roundworms, crabs, insects, arachnids, centipedes)</span><p class=\"tag\">Characterised by a cuticle composed of organic material that is periodically molted as the animal grows. Their embryos do not undergo spiral cleavage. A respiratory and circulatory system is only present in some species.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:CelegansGoldsteinLabUNC.jpg\" target=\"_blank\"><img src=\"thumbnails/CelegansGoldsteinLabUNC.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"350\" height=\"297\" style=\"background-color:#6d8a80\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scolopendra_cataracta_from_Zookeys.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scolopendra_cataracta_from_Zookeys.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#b7814f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Echiniscus_insularis_%2810.3897-evolsyst.5.59997%29_Figure_6_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Echiniscus_insularis_%2810.3897-evolsyst.5.59997%29_Figure_6_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#c7c4bf\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"animalia_nematoda\" class=\"tree_box\"><span><span>Nematoda</span><a href=\"https://en.wikipedia.org/wiki/Nematoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Nematoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Nematoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Nematoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌɛkdɪsoʊˈzoʊə\" target=\"_blank\">ˌɛkdɪsoʊˈzoʊə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(roundworms)</span><p class=\"tag\">They are bilaterally symmetrical, elongated, and usually tapered at both ends. Most species are free-living, feeding on microorganisms, but many are parasitic. They secrete an external cuticle that is periodically molted and have a tubular digestive system with openings at both ends. Some cause of soil-transmitted helminthiases. Some species have a pseudocoel.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:CelegansGoldsteinLabUNC.jpg\" target=\"_blank\"><img src=\"thumbnails/CelegansGoldsteinLabUNC.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"350\" height=\"297\" style=\"background-color:#6d8a80\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hookworms.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Hookworms.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#642f25\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Roundworm.jpg\" target=\"_blank\"><img src=\"thumbnails/Roundworm.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"236\" height=\"152\" style=\"background-color:#ceb499\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mermis_nigrescens_beentree.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mermis_nigrescens_beentree.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7e796d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"animalia_arthropoda\" class=\"tree_box\"><span><span>Arthropoda</span><a href=\"https://en.wikipedia.org/wiki/Arthropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Arthropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Arthropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Arthropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"arthropoda\">See children</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(crabs, insects, arachnids, centipedes)</span><p class=\"tag\">Possess an exoskeleton with a cuticle made of chitin, often mineralised with calcium carbonate, a body with differentiated (metameric) segments, and paired jointed appendages. While growing they moult their exoskeleton. They have an open circulatory system with a body cavity called a haemocoel through which haemolymph circulates to the interior organs. Their internal organs are generally built of repeated segments.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Apis_mellifera_carnica_worker_hive_entrance_3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apis_mellifera_carnica_worker_hive_entrance_3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#846746\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ocypode-ceratophthalma-horned-ghost-crab-krabi-thailand.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ocypode-ceratophthalma-horned-ghost-crab-krabi-thailand.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#99a298\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Araneus_diadematus%2C_Livorno_1.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Araneus_diadematus%2C_Livorno_1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"281\" style=\"background-color:#5b6c29\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CSIRO_ScienceImage_2992_The_Giant_Tiger_Prawn.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-CSIRO_ScienceImage_2992_The_Giant_Tiger_Prawn.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"211\" style=\"background-color:#323c6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Limulus_polyphemus_%28aq.%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Limulus_polyphemus_%28aq.%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#856a4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scolopendra_cataracta_from_Zookeys.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scolopendra_cataracta_from_Zookeys.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#b7814f\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Bilateria_Deuterostomia\"><label class=\"tree_label\" for=\"Bilateria_Deuterostomia\"></label><div class=\"outer_tree_box\"><div id=\"animalia_deuterostomia\" class=\"tree_box\"><span><span>Deuterostomia</span><a href=\"https://en.wikipedia.org/wiki/Deuterostomia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Deuterostomia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Deuterostomia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Deuterostomia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌdjuːtərəˈstoʊmi.ə\" target=\"_blank\">ˌdjuːtərəˈstoʊmi.ə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Characterized by their anus forming before the mouth during embryonic development. Blastula divisions occur as radial cleavage; most deuterostomes display indeterminate cleavage; and the coelom develops from buds off the embryonic gut.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Expn7526_%2838827990315%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Expn7526_%2838827990315%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#6f7067\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhabdopleuratubes.png\" target=\"_blank\"><img src=\"thumbnails/Rhabdopleuratubes.png\" class=\"taxa-img\" loading=\"lazy\" width=\"361\" height=\"505\" style=\"background-color:#787878\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fromia_indica_HI09-0187.JPG\" target=\"_blank\"><img src=\"thumbnails/Fromia_indica_HI09-0187.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"532\" style=\"background-color:#130602\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#626660\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"animalia_echinodermata\" class=\"tree_box\"><span><span>Echinodermata</span><a href=\"https://en.wikipedia.org/wiki/Echinodermata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Echinodermata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Echinodermata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Echinodermata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ɪˌkaɪnoʊˈdɜːrmətə\" target=\"_blank\">ɪˌkaɪnoʊˈdɜːrmətə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(starfish, sea urchins, sea stars, brittle stars, sea lillies, sea cucumbers, sand dollars)</span><p class=\"tag\">Adults have five-pointed radial symmetry (pentamerous symmetry), and are found on the sea bed at every ocean depth from the intertidal zone to the abyssal zone, but the larvae are bilaterally symmetrical. Most are able to reproduce asexually and regenerate tissue, organs and limbs. Their ossified dermal endoskeletons are major contributors to many limestone formations.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Fromia_indica_HI09-0187.JPG\" target=\"_blank\"><img src=\"thumbnails/Fromia_indica_HI09-0187.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"532\" style=\"background-color:#130602\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ophionereis_reticulata_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ophionereis_reticulata_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"218\" style=\"background-color:#797168\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sea_cucumber_at_Pulau_Redang.jpg\" target=\"_blank\"><img src=\"thumbnails/Sea_cucumber_at_Pulau_Redang.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#5a767b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nerr0878.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nerr0878.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"227\" style=\"background-color:#726963\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Strongylocentrotus_purpuratus_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Strongylocentrotus_purpuratus_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"273\" style=\"background-color:#5b514e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crinoid_on_the_reef_of_Batu_Moncho_Island.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Crinoid_on_the_reef_of_Batu_Moncho_Island.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#2b6b9a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clypeaster_reticulatus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Clypeaster_reticulatus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#817f66\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"animalia_chordata\" class=\"tree_box\"><span><span>Chordata</span><a href=\"https://en.wikipedia.org/wiki/Chordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Chordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=kɔːrˈdeɪtə\" target=\"_blank\">kɔːrˈdeɪtə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"chordata\">See children</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(lancelets, sea squirts, vertibrates)</span><p class=\"tag\">Possess at some point during their larval or adult stages a notochord, a hollow dorsal nerve cord, an endostyle or thyroid, pharyngeal slits, and a post-anal tail.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#626660\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tunicate_komodo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tunicate_komodo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5a5950\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Branchiostoma_lanceolatum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Branchiostoma_lanceolatum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"261\" style=\"background-color:#0c0b0a\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_animalia_arthropoda",[{"name":"Mandibulata","parent":"Arthropoda","rank":"Clade","ipa":"","card":1},{"name":"Pancrustacea","parent":"Mandibulata","rank":"Clade","ipa":"","common":["crustaceans","hexapods"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Lobster_png_by_absurdwordpreferred_d2xqhvd.png/330px-Lobster_png_by_absurdwordpreferred_d2xqhvd.png","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a1/Apis_mellifera_carnica_worker_hive_entrance_3.jpg/330px-Apis_mellifera_carnica_worker_hive_entrance_3.jpg"],"card":1},{"name":"Multicrustacea","parent":"Pancrustacea","rank":"Clade","ipa":"","common":[],"imgs":[],"card":4},{"name":"Malacostraca","parent":"Multicrustacea","rank":"Class","ipa":"","common":["crabs","lobsters","shrimp","isopods"],"imgs":[],"card":5},{"name":"Stomatopoda","parent":"Malacostraca","rank":"Order","ipa":"","common":["mantis shrimp"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/39/OdontodactylusScyllarus2.jpg/330px-OdontodactylusScyllarus2.jpg"],"card":6},{"name":"Isopoda","parent":"Malacostraca","rank":"Order","ipa":"","common":["isopods","pill bug/slater/roly-poly","tongue eating louse"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Armadillidium_vulgare_001.jpg/330px-Armadillidium_vulgare_001.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Eurydice_pulchra.jpg/330px-Eurydice_pulchra.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0a/Cymothoa_exigua_parassita_Lithognathus_mormyrus.JPG/330px-Cymothoa_exigua_parassita_Lithognathus_mormyrus.JPG"],"card":6},{"name":"Amphipoda","parent":"Malacostraca","rank":"Order","ipa":"","common":["landhoppers","sandhoppers","scud"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Megalorchestia_californiana.jpg/330px-Megalorchestia_californiana.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Lepidepecreum_longicornis.jpg/330px-Lepidepecreum_longicornis.jpg"],"card":6},{"name":"Euphausiacea","parent":"Malacostraca","rank":"Order","ipa":"","common":["krill"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Meganyctiphanes_norvegica2.jpg/330px-Meganyctiphanes_norvegica2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/Krill_swarm.jpg/330px-Krill_swarm.jpg"],"card":6},{"name":"Decapoda","parent":"Malacostraca","rank":"Order","ipa":"","common":["crabs","lobsters","crayfish","shrimp","prawns","Moreton Bay bugs","crawdad","mudbug","yabbies"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5d/Lobster_NSRW_rotated2.jpg/330px-Lobster_NSRW_rotated2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/16/CoenobitaVariabilis2.jpg/330px-CoenobitaVariabilis2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3e/Blue_crab_on_market_in_Piraeus_-_Callinectes_sapidus_Rathbun_20020819-317.jpg/330px-Blue_crab_on_market_in_Piraeus_-_Callinectes_sapidus_Rathbun_20020819-317.jpg"],"card":6},{"name":"Thecostraca","parent":"Multicrustacea","rank":"Class","ipa":"","common":[],"imgs":[],"card":5},{"name":"Cirripedia","parent":"Thecostraca","rank":"Subclass","ipa":"","common":["barnacles"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/bf/Anim1032_-_Flickr_-_NOAA_Photo_Library.jpg/330px-Anim1032_-_Flickr_-_NOAA_Photo_Library.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/59/Giant_Acorn_Barnacle%2C_Embarcadero%2C_Morro_Bay%2C_CA%2C_US_imported_from_iNaturalist_photo_149595197.jpg/330px-Giant_Acorn_Barnacle%2C_Embarcadero%2C_Morro_Bay%2C_CA%2C_US_imported_from_iNaturalist_photo_149595197.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/47/Balanus_improvisus_on_Mya_arenaria_shell.jpg/330px-Balanus_improvisus_on_Mya_arenaria_shell.jpg"],"card":5},{"name":"Branchiopoda","parent":"Multicrustacea","rank":"Class","ipa":"","common":[],"imgs":[]},{"name":"Anostraca","parent":"Branchiopoda","rank":"Order","ipa":"","common":["fairy shrimp inc/ sea monkeys"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/c/cc/Artemia_monica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/Artemia_salina_4.jpg/330px-Artemia_salina_4.jpg"]},{"name":"Hexapoda","parent":"Pancrustacea","rank":"Clade","ipa":"","common":[],"imgs":[],"card":4},{"name":"Insecta","parent":"Hexapoda","rank":"Class","ipa":"","common":[],"tag":"The insects. They have a segmented body supported by an hard chitin exoskeleton with three segments: the head, thorax and abdomen. The head supports a pair of sensory antennae, usually a pair of compound eyes, zero to three simple eyes, and three sets of variously modified appendages that form the mouthparts. The thorax carries the three pairs of legs and up to two pairs of wings. The abdomen contains most of the digestive, respiratory, excretory and reproductive structures. Most have paired appendages on the rear-most segments called the cerci.","imgs":["https://upload.wikimedia.org/wikipedia/commons/4/48/Thermobia_domestica1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Rock_bristletail.JPG/330px-Rock_bristletail.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Ephemeroptera_2.jpg/330px-Ephemeroptera_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Bed_bug%2C_Cimex_lectularius.jpg/330px-Bed_bug%2C_Cimex_lectularius.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d3/Miramella_alpina_male_%283788740982%29.jpg/330px-Miramella_alpina_male_%283788740982%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Fesoj_-_Papilio_machaon_%28by%29.jpg/250px-Fesoj_-_Papilio_machaon_%28by%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Red_Ant_-_March_2025.jpg/330px-Red_Ant_-_March_2025.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Aeshna_cyanea_female_1.jpg/330px-Aeshna_cyanea_female_1.jpg"],"card":4},{"name":"Myriapoda","parent":"Mandibulata","rank":"Subphylum","ipa":"","common":["centipedes","millipedes","allies"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Scolopendra_cataracta_from_Zookeys.jpg/330px-Scolopendra_cataracta_from_Zookeys.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Nemasomatidae_%28Julida%29_2012-10-16-15.jpg/330px-Nemasomatidae_%28Julida%29_2012-10-16-15.jpg"],"card":1},{"name":"Chilopoda","parent":"Myriapoda","rank":"Class","ipa":"","etymology":"greek 'lip'-'foot'","common":["centipedes"],"tag":"Fast moving with one leg per segment that extends away from the body. Their front legs are pincer like and inject venom. Usually predators.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Scolopendra_cataracta_from_Zookeys.jpg/330px-Scolopendra_cataracta_from_Zookeys.jpg"],"card":3},{"name":"Diplopoda","parent":"Myriapoda","rank":"Class","ipa":"","etymology":"greek 'double'-'foot'","common":["centipedes","millipedes","allies"],"tag":"Slow moving with two legs per segment (besides the first three segments) that are underneath the body. Usually scavengers.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Nemasomatidae_%28Julida%29_2012-10-16-15.jpg/330px-Nemasomatidae_%28Julida%29_2012-10-16-15.jpg"],"card":3},{"name":"Chelicerata","parent":"Arthropoda","rank":"Subphylum","ipa":"","etymology":"greek 'jaw'-'horn'","common":["sea spiders","horseshoe crabs","arachnids"],"tag":"Named for the fang/pincer appendages that appear before the mouth.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/Nymphon_maculatum_2011-721_%281%29_%28cropped%29.jpg/330px-Nymphon_maculatum_2011-721_%281%29_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c6/Limulus_polyphemus_%28aq.%29.jpg/330px-Limulus_polyphemus_%28aq.%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Araneus_diadematus%2C_Livorno_1.JPG/250px-Araneus_diadematus%2C_Livorno_1.JPG"],"card":1},{"name":"Pycnogonida","parent":"Chelicerata","rank":"Class","ipa":"","common":["sea spiders"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/Nymphon_maculatum_2011-721_%281%29_%28cropped%29.jpg/330px-Nymphon_maculatum_2011-721_%281%29_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/1909_The_Cambridge_natural_history_volume_IV_p531_Fig._282.jpg/330px-1909_The_Cambridge_natural_history_volume_IV_p531_Fig._282.jpg"],"card":2},{"name":"Xiphosura","parent":"Chelicerata","rank":"Class","ipa":"","common":["horseshoe crabs"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Tachypleus_gigas.JPG/330px-Tachypleus_gigas.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/Limulus_polyphemus_397145247.jpg/330px-Limulus_polyphemus_397145247.jpg"],"card":2},{"name":"Arachnida","parent":"Chelicerata","rank":"Class","ipa":"","common":["spiders","scorpions","pseudoscorpions","harvestmen","camel spiders","whip spiders","vinegaroons","ticks","mites","chiggers"],"tag":"They have eight legs attached to the cephalothorax. In some species the frontmost pair of legs has converted to a sensory function, while in others, different appendages can grow large enough to take on the appearance of extra pairs of legs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Opiliones_harvestman.jpg/330px-Opiliones_harvestman.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/Plexippus_paykulli_-_50959617953.jpg/330px-Plexippus_paykulli_-_50959617953.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2b/Buthus_mariefranceae_%2810.3897-zookeys.686.12206%29_Figure_1.jpg/330px-Buthus_mariefranceae_%2810.3897-zookeys.686.12206%29_Figure_1.jpg","https://upload.wikimedia.org/wikipedia/commons/8/81/Neobisium_sylvaticum_03.jpg"],"card":2}],{},{"250px-Araneus_diadematus,_Livorno_1.JPG":[250,281,"#5b6c29"],"250px-Fesoj_-_Papilio_machaon_(by).jpg":[250,250,"#755c39"],"330px-1909_The_Cambridge_natural_history_volume_IV_p531_Fig._282.jpg":[330,301,"#ececec"],"330px-Aeshna_cyanea_female_1.jpg":[330,229,"#657668"],"330px-Anim1032_-_Flickr_-_NOAA_Photo_Library.jpg":[330,220,"#555555"],"330px-Apis_mellifera_carnica_worker_hive_entrance_3.jpg":[330,215,"#846746"],"330px-Armadillidium_vulgare_001.jpg":[330,247,"#897f67"],"330px-Artemia_salina_4.jpg":[330,247,"#14120e"],"330px-Balanus_improvisus_on_Mya_arenaria_shell.jpg":[330,247,"#a38d7b"],"330px-Bed_bug,_Cimex_lectularius.jpg":[330,231,"#a17055"],"330px-Blue_crab_on_market_in_Piraeus_-_Callinectes_sapidus_Rathbun_20020819-317.jpg":[330,248,"#635a51"],"330px-Buthus_mariefranceae_(10.3897-zookeys.686.12206)_Figure_1.jpg":[330,290,"#e1d5c7"],"330px-CoenobitaVariabilis2.jpg":[330,247,"#5a5c3f"],"330px-Cymothoa_exigua_parassita_Lithognathus_mormyrus.JPG":[330,248,"#90714a"],"330px-Ephemeroptera_2.jpg":[330,206,"#bbb5b1"],"330px-Eurydice_pulchra.jpg":[330,247,"#201810"],"330px-Giant_Acorn_Barnacle,_Embarcadero,_Morro_Bay,_CA,_US_imported_from_iNaturalist_photo_149595197.jpg":[330,271,"#90958b"],"330px-Krill_swarm.jpg":[330,226,"#48454a"],"330px-Lepidepecreum_longicornis.jpg":[330,247,"#27231e"],"330px-Limulus_polyphemus_(aq.).jpg":[330,247,"#856a4b"],"330px-Limulus_polyphemus_397145247.jpg":[330,247,"#775747"],"330px-Lobster_NSRW_rotated2.jpg":[330,222,"#c4c1be"],"330px-Lobster_png_by_absurdwordpreferred_d2xqhvd.png":[330,210,null],"330px-Megalorchestia_californiana.jpg":[330,210,"#9e856a"],"330px-Meganyctiphanes_norvegica2.jpg":[330,189,"#527385"],"330px-Miramella_alpina_male_(3788740982).jpg":[330,221,"#b0ab9d"],"330px-Nemasomatidae_(Julida)_2012-10-16-15.jpg":[330,185,"#423e3b"],"330px-Nymphon_maculatum_2011-721_(1)_(cropped).jpg":[330,257,"#131210"],"330px-OdontodactylusScyllarus2.jpg":[330,163,"#5d4242"],"330px-Opiliones_harvestman.jpg":[330,240,"#607d1d"],"330px-Plexippus_paykulli_-_50959617953.jpg":[330,220,"#a0592e"],"330px-Red_Ant_-_March_2025.jpg":[330,233,"#9d8f8f"],"330px-Rock_bristletail.JPG":[330,247,"#b28e68"],"330px-Scolopendra_cataracta_from_Zookeys.jpg":[330,226,"#b7814f"],"330px-Tachypleus_gigas.JPG":[330,248,"#aba18c"],"Artemia_monica.jpg":[800,507,"#241912"],"Neobisium_sylvaticum_03.jpg":[640,505,"#dcd4d2"],"Thermobia_domestica1.jpg":[565,300,"#5c5e50"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_arthropoda","<ul class=\"tree\" data-tree-range=\"arthropoda\"><li><input type=\"checkbox\" checked id=\"Ecdysozoa_Arthropoda\"><label class=\"tree_label\" for=\"Ecdysozoa_Arthropoda\"></label><div class=\"outer_tree_box\"><div id=\"arthropoda_arthropoda\" class=\"tree_box\"><span><span>Arthropoda</span><a href=\"https://en.wikipedia.org/wiki/Arthropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Arthropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Arthropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Arthropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"animalia\">See parent</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(crabs, insects, arachnids, centipedes)</span><p class=\"tag\">Possess an exoskeleton with a cuticle made of chitin, often mineralised with calcium carbonate, a body with differentiated (metameric) segments, and paired jointed appendages. While growing they moult their exoskeleton. They have an open circulatory system with a body cavity called a haemocoel through which haemolymph circulates to the interior organs. Their internal organs are generally built of repeated segments.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Apis_mellifera_carnica_worker_hive_entrance_3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apis_mellifera_carnica_worker_hive_entrance_3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#846746\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ocypode-ceratophthalma-horned-ghost-crab-krabi-thailand.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ocypode-ceratophthalma-horned-ghost-crab-krabi-thailand.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#99a298\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Araneus_diadematus%2C_Livorno_1.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Araneus_diadematus%2C_Livorno_1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"281\" style=\"background-color:#5b6c29\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CSIRO_ScienceImage_2992_The_Giant_Tiger_Prawn.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-CSIRO_ScienceImage_2992_The_Giant_Tiger_Prawn.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"211\" style=\"background-color:#323c6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Limulus_polyphemus_%28aq.%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Limulus_polyphemus_%28aq.%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#856a4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scolopendra_cataracta_from_Zookeys.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scolopendra_cataracta_from_Zookeys.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#b7814f\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Arthropoda_Mandibulata\"><label class=\"tree_label\" for=\"Arthropoda_Mandibulata\"></label><div class=\"outer_tree_box\"><div id=\"arthropoda_mandibulata\" class=\"tree_box\"><span><span>Mandibulata</span><a href=\"https://en.wikipedia.org/wiki/Mandibulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mandibulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mandibulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mandibulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span></div></div><ul><li><input type=\"checkbox\" checked id=\"Mandibulata_Pancrustacea\"><label class=\"tree_label\" for=\"Mandibulata_Pancrustacea\"></label><div class=\"outer_tree_box\"><div id=\"arthropoda_pancrustacea\" class=\"tree_box\"><span><span>Pancrustacea</span><a href=\"https://en.wikipedia.org/wiki/Pancrustacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pancrustacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pancrustacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pancrustacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(crustaceans, hexapods)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Lobster_png_by_absurdwordpreferred_d2xqhvd.png\" target=\"_blank\"><img src=\"thumbnails/330px-Lobster_png_by_absurdwordpreferred_d2xqhvd.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"210\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apis_mellifera_carnica_worker_hive_entrance_3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apis_mellifera_carnica_worker_hive_entrance_3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#846746\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Pancrustacea_Multicrustacea\"><label class=\"tree_label\" for=\"Pancrustacea_Multicrustacea\"></label><div class=\"outer_tree_box\"><div id=\"arthropoda_multicrustacea\" class=\"tree_box\"><span><span>Multicrustacea</span><a href=\"https://en.wikipedia.org/wiki/Multicrustacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Multicrustacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Multicrustacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Multicrustacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Multicrustacea_Malacostraca\"><label class=\"tree_label\" for=\"Multicrustacea_Malacostraca\"></label><div class=\"outer_tree_box\"><div id=\"arthropoda_malacostraca\" class=\"tree_box\"><span><span>Malacostraca</span><a href=\"https://en.wikipedia.org/wiki/Malacostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Malacostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Malacostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Malacostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(crabs, lobsters, shrimp, isopods)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_stomatopoda\" class=\"tree_box\"><span><span>Stomatopoda</span><a href=\"https://en.wikipedia.org/wiki/Stomatopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Stomatopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Stomatopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Stomatopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(mantis shrimp)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:OdontodactylusScyllarus2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-OdontodactylusScyllarus2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"163\" style=\"background-color:#5d4242\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_isopoda\" class=\"tree_box\"><span><span>Isopoda</span><a href=\"https://en.wikipedia.org/wiki/Isopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Isopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Isopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Isopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(isopods, pill bug/slater/roly-poly, tongue eating louse)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Armadillidium_vulgare_001.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Armadillidium_vulgare_001.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#897f67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eurydice_pulchra.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eurydice_pulchra.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#201810\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cymothoa_exigua_parassita_Lithognathus_mormyrus.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Cymothoa_exigua_parassita_Lithognathus_mormyrus.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#90714a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_amphipoda\" class=\"tree_box\"><span><span>Amphipoda</span><a href=\"https://en.wikipedia.org/wiki/Amphipoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Amphipoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Amphipoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Amphipoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(landhoppers, sandhoppers, scud)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Megalorchestia_californiana.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Megalorchestia_californiana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"210\" style=\"background-color:#9e856a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lepidepecreum_longicornis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lepidepecreum_longicornis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#27231e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_euphausiacea\" class=\"tree_box\"><span><span>Euphausiacea</span><a href=\"https://en.wikipedia.org/wiki/Euphausiacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Euphausiacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Euphausiacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Euphausiacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(krill)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Meganyctiphanes_norvegica2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Meganyctiphanes_norvegica2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"189\" style=\"background-color:#527385\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Krill_swarm.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Krill_swarm.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#48454a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_decapoda\" class=\"tree_box\"><span><span>Decapoda</span><a href=\"https://en.wikipedia.org/wiki/Decapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Decapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Decapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Decapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(crabs, lobsters, crayfish, shrimp, prawns, Moreton Bay bugs, crawdad, mudbug, yabbies)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Lobster_NSRW_rotated2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lobster_NSRW_rotated2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"222\" style=\"background-color:#c4c1be\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CoenobitaVariabilis2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-CoenobitaVariabilis2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5a5c3f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blue_crab_on_market_in_Piraeus_-_Callinectes_sapidus_Rathbun_20020819-317.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Blue_crab_on_market_in_Piraeus_-_Callinectes_sapidus_Rathbun_20020819-317.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#635a51\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Multicrustacea_Thecostraca\"><label class=\"tree_label\" for=\"Multicrustacea_Thecostraca\"></label><div class=\"outer_tree_box\"><div id=\"arthropoda_thecostraca\" class=\"tree_box\"><span><span>Thecostraca</span><a href=\"https://en.wikipedia.org/wiki/Thecostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Thecostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Thecostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Thecostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_cirripedia\" class=\"tree_box\"><span><span>Cirripedia</span><a href=\"https://en.wikipedia.org/wiki/Cirripedia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cirripedia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cirripedia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cirripedia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><span class=\"common_names\">(barnacles)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Anim1032_-_Flickr_-_NOAA_Photo_Library.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Anim1032_-_Flickr_-_NOAA_Photo_Library.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#555555\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Giant_Acorn_Barnacle%2C_Embarcadero%2C_Morro_Bay%2C_CA%2C_US_imported_from_iNaturalist_photo_149595197.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Giant_Acorn_Barnacle%2C_Embarcadero%2C_Morro_Bay%2C_CA%2C_US_imported_from_iNaturalist_photo_149595197.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"271\" style=\"background-color:#90958b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Balanus_improvisus_on_Mya_arenaria_shell.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Balanus_improvisus_on_Mya_arenaria_shell.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a38d7b\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Multicrustacea_Branchiopoda\"><label class=\"tree_label\" for=\"Multicrustacea_Branchiopoda\"></label><div class=\"outer_tree_box\"><div id=\"arthropoda_branchiopoda\" class=\"tree_box\"><span><span>Branchiopoda</span><a href=\"https://en.wikipedia.org/wiki/Branchiopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Branchiopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Branchiopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Branchiopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_anostraca\" class=\"tree_box\"><span><span>Anostraca</span><a href=\"https://en.wikipedia.org/wiki/Anostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Anostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Anostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Anostraca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(fairy shrimp inc/ sea monkeys)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Artemia_monica.jpg\" target=\"_blank\"><img src=\"thumbnails/Artemia_monica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"507\" style=\"background-color:#241912\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Artemia_salina_4.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Artemia_salina_4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#14120e\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Pancrustacea_Hexapoda\"><label class=\"tree_label\" for=\"Pancrustacea_Hexapoda\"></label><div class=\"outer_tree_box\"><div id=\"arthropoda_hexapoda\" class=\"tree_box\"><span><span>Hexapoda</span><a href=\"https://en.wikipedia.org/wiki/Hexapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hexapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hexapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hexapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_insecta\" class=\"tree_box\"><span><span>Insecta</span><a href=\"https://en.wikipedia.org/wiki/Insecta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Insecta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Insecta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Insecta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"insecta\">See children</button><span class=\"badge\">Class</span></span><p class=\"tag\">The insects. They have a segmented body supported by an hard chitin exoskeleton with three segments: the head, thorax and abdomen. The head supports a pair of sensory antennae, usually a pair of compound eyes, zero to three simple eyes, and three sets of variously modified appendages that form the mouthparts. The thorax carries the three pairs of legs and up to two pairs of wings. The abdomen contains most of the digestive, respiratory, excretory and reproductive structures. Most have paired appendages on the rear-most segments called the cerci.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Thermobia_domestica1.jpg\" target=\"_blank\"><img src=\"thumbnails/Thermobia_domestica1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"565\" height=\"300\" style=\"background-color:#5c5e50\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rock_bristletail.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Rock_bristletail.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#b28e68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ephemeroptera_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ephemeroptera_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#bbb5b1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bed_bug%2C_Cimex_lectularius.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bed_bug%2C_Cimex_lectularius.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#a17055\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Miramella_alpina_male_%283788740982%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Miramella_alpina_male_%283788740982%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#b0ab9d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fesoj_-_Papilio_machaon_%28by%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fesoj_-_Papilio_machaon_%28by%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#755c39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_Ant_-_March_2025.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red_Ant_-_March_2025.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#9d8f8f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aeshna_cyanea_female_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aeshna_cyanea_female_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#657668\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Mandibulata_Myriapoda\"><label class=\"tree_label\" for=\"Mandibulata_Myriapoda\"></label><div class=\"outer_tree_box\"><div id=\"arthropoda_myriapoda\" class=\"tree_box\"><span><span>Myriapoda</span><a href=\"https://en.wikipedia.org/wiki/Myriapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Myriapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Myriapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Myriapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subphylum</span></span><span class=\"common_names\">(centipedes, millipedes, allies)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Scolopendra_cataracta_from_Zookeys.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scolopendra_cataracta_from_Zookeys.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#b7814f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nemasomatidae_%28Julida%29_2012-10-16-15.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nemasomatidae_%28Julida%29_2012-10-16-15.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"185\" style=\"background-color:#423e3b\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_chilopoda\" class=\"tree_box\"><span><span>Chilopoda</span><a href=\"https://en.wikipedia.org/wiki/Chilopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chilopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chilopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Chilopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(centipedes)</span><p class=\"tag\">Fast moving with one leg per segment that extends away from the body. Their front legs are pincer like and inject venom. Usually predators.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Scolopendra_cataracta_from_Zookeys.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scolopendra_cataracta_from_Zookeys.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#b7814f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_diplopoda\" class=\"tree_box\"><span><span>Diplopoda</span><a href=\"https://en.wikipedia.org/wiki/Diplopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Diplopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Diplopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Diplopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(centipedes, millipedes, allies)</span><p class=\"tag\">Slow moving with two legs per segment (besides the first three segments) that are underneath the body. Usually scavengers.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Nemasomatidae_%28Julida%29_2012-10-16-15.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nemasomatidae_%28Julida%29_2012-10-16-15.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"185\" style=\"background-color:#423e3b\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Arthropoda_Chelicerata\"><label class=\"tree_label\" for=\"Arthropoda_Chelicerata\"></label><div class=\"outer_tree_box\"><div id=\"arthropoda_chelicerata\" class=\"tree_box\"><span><span>Chelicerata</span><a href=\"https://en.wikipedia.org/wiki/Chelicerata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chelicerata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chelicerata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Chelicerata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subphylum</span></span><span class=\"common_names\">(sea spiders, horseshoe crabs, arachnids)</span><p class=\"tag\">Named for the fang/pincer appendages that appear before the mouth.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Nymphon_maculatum_2011-721_%281%29_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nymphon_maculatum_2011-721_%281%29_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"257\" style=\"background-color:#131210\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Limulus_polyphemus_%28aq.%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Limulus_polyphemus_%28aq.%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#856a4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Araneus_diadematus%2C_Livorno_1.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Araneus_diadematus%2C_Livorno_1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"281\" style=\"background-color:#5b6c29\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_pycnogonida\" class=\"tree_box\"><span><span>Pycnogonida</span><a href=\"https://en.wikipedia.org/wiki/Pycnogonida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pycnogonida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pycnogonida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pycnogonida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(sea spiders)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Nymphon_maculatum_2011-721_%281%29_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nymphon_maculatum_2011-721_%281%29_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"257\" style=\"background-color:#131210\"></a><a href=\"https://commons.wikimedia.org/wiki/File:1909_The_Cambridge_natural_history_volume_IV_p531_Fig._282.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-1909_The_Cambridge_natural_history_volume_IV_p531_Fig._282.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"301\" style=\"background-color:#ececec\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_xiphosura\" class=\"tree_box\"><span><span>Xiphosura</span><a href=\"https://en.wikipedia.org/wiki/Xiphosura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Xiphosura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Xiphosura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Xiphosura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(horseshoe crabs)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Tachypleus_gigas.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Tachypleus_gigas.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#aba18c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Limulus_polyphemus_397145247.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Limulus_polyphemus_397145247.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#775747\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arthropoda_arachnida\" class=\"tree_box\"><span><span>Arachnida</span><a href=\"https://en.wikipedia.org/wiki/Arachnida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Arachnida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Arachnida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Arachnida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"arachnida\">See children</button><span class=\"badge\">Class</span></span><span class=\"common_names\">(spiders, scorpions, pseudoscorpions, harvestmen, camel spiders, whip spiders, vinegaroons, ticks, mites, chiggers)</span><p class=\"tag\">They have eight legs attached to the cephalothorax. In some species the frontmost pair of legs has converted to a sensory function, while in others, different appendages can grow large enough to take on the appearance of extra pairs of legs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Opiliones_harvestman.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Opiliones_harvestman.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"240\" style=\"background-color:#607d1d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Plexippus_paykulli_-_50959617953.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Plexippus_paykulli_-_50959617953.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a0592e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Buthus_mariefranceae_%2810.3897-zookeys.686.12206%29_Figure_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Buthus_mariefranceae_%2810.3897-zookeys.686.12206%29_Figure_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"290\" style=\"background-color:#e1d5c7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neobisium_sylvaticum_03.jpg\" target=\"_blank\"><img src=\"thumbnails/Neobisium_sylvaticum_03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"505\" style=\"background-color:#dcd4d2\"></a></div></div></div></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_animalia_arthropoda_arachnida",[{"name":"Acariformes","parent":"Arachnida","rank":"Superorder","ipa":"","etymology":"","common":["mites","house dust mites","rust mites","gall mites"],"tag":"The more diverse of the two superorders of mites. Members ingest solid food, being mainly microherbivores, fungivores and detritivores. Some are plant parasite species. Many species are also predators, fungivores, and animal parasites.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/8d/Trombidium_holosericeum_%28aka%29.jpg/250px-Trombidium_holosericeum_%28aka%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5f/Yellow_mite_%28Tydeidae%29%2C_Lorryia_formosa.jpg/330px-Yellow_mite_%28Tydeidae%29%2C_Lorryia_formosa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0b/Glycyphagus-spp-mite.jpg/250px-Glycyphagus-spp-mite.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/Phthiracarid.jpg/330px-Phthiracarid.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9a/Tetranychus_urticae_with_silk_threads.jpg/330px-Tetranychus_urticae_with_silk_threads.jpg"]},{"name":"Opiliones","parent":"Arachnida","rank":"Order","ipa":"","etymology":"","common":["harvestmen","harvesters","daddy long legs"],"tag":"Known for having exceptionally long legs relative to their body size (but this is not true of all species). The connection between the cephalothorax and abdomen is broad, so that the body appears to be a single oval structure. They have no venom glands or silk glands. They can swallow chunks of solid food, not only liquids. They tend to have a single pair of camera-type eyes in the middle of the head.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Opiliones_harvestman.jpg/330px-Opiliones_harvestman.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Pseudo-araña_nocturna_%28opilion%29.jpg/330px-Pseudo-araña_nocturna_%28opilion%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b9/Harvester_body_close_up.jpg/330px-Harvester_body_close_up.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/39/Harvestman_Opiliones_grooming_2016-05-15.jpg/330px-Harvestman_Opiliones_grooming_2016-05-15.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Opiliones_20100626.jpg/330px-Opiliones_20100626.jpg"]},{"name":"Ricinulei","parent":"Arachnida","rank":"Order","ipa":"","etymology":"","common":["hooded tickspiders"],"tag":"They inhabit the leaf litter of rainforest floors, as well as caves, where they search for prey with their elongate sensory second, longer, leg pair. They are predatory; eating small arthropods. Extant species have no eyes. They have a \"hood\" which can be raised and lowered over the head. When lowered, it covers the mouth and the chelicerae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cd/Cryptocellus_goodnighti.jpg/330px-Cryptocellus_goodnighti.jpg","https://upload.wikimedia.org/wikipedia/commons/8/8c/Ricinulei_from_Fernandez_%26_Giribet%2C_nymph_of_Ricinoides_atewa_%282015%29_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/a/ac/Ricinulei_from_Fernandez_%26_Giribet%2C_male_Ricinoides_karschii_from_Campo_Reserve%2C_Cameroon_%282015%29_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/2/28/Ricinulei_from_Fernandez_%26_Giribet%2C_male_Pseudocellus_pearsei_from_Grutas_Tzabnah%2C_Yucatán%2C_Mexico_%282015%29_%28cropped%29.jpg"]},{"name":"Solifugae","parent":"Arachnida","rank":"Order","ipa":"","etymology":"","common":["solifuges","sun spiders","camel spiders","wind scorpions"],"tag":"Most species live in dry climates and are carnivores that feed opportunistically on ground-dwelling arthropods and other small animals. They hunt their prey using three main hunting-strategies: Stalking, chasing, and ambushing. They lack both spinnerets and silk. The chelicerae serve as jaws, and in many species also are used for stridulation. They have a pair of large central eyes. The smaller males often have longer legs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Sunspider.jpg/250px-Sunspider.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Solpugidae_showing_eyes_with_presumably_protective_bristles_2012_01_24_1019s.JPG/330px-Solpugidae_showing_eyes_with_presumably_protective_bristles_2012_01_24_1019s.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/76/Solfugid_in_veld_near_Uniondale_%28Western_Cape%29_1600.jpg/330px-Solfugid_in_veld_near_Uniondale_%28Western_Cape%29_1600.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/Gluvia4.jpg/250px-Gluvia4.jpg"]},{"name":"Parasitiformes","parent":"Arachnida","rank":"Superorder","ipa":"","etymology":"","common":["mites","red mites","ticks"],"tag":"The less diverse of the two superorders of mites. Many species are parasitic. About half of the species are predatory and cryptozoan, living in soil-litter, rotting wood, dung, carrion, nests or house dust. A few species have switched to grazing on fungi or ingesting spores or pollen.","imgs":["https://upload.wikimedia.org/wikipedia/commons/b/b3/Opilioacarus_baeticus_2_%28cropped%29.png","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2b/Varroa_destructor%2C_1_2019-09-06-19.12.07_ZS_PMax_UDR_%2848697155713%29.jpg/330px-Varroa_destructor%2C_1_2019-09-06-19.12.07_ZS_PMax_UDR_%2848697155713%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a8/Dermanyssus_cfr_gallinae_%285021757436%29.jpg/330px-Dermanyssus_cfr_gallinae_%285021757436%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ee/Sternothyrus_braueri_62962027_cropped.jpg/330px-Sternothyrus_braueri_62962027_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/13/Ixodus_ricinus_5x.jpg/330px-Ixodus_ricinus_5x.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/df/Tick_in_amber_carrying_spirochetes.jpg/330px-Tick_in_amber_carrying_spirochetes.jpg","https://upload.wikimedia.org/wikipedia/commons/2/29/Amblyomma_americanum_tick.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/17/Argas_spec_columbidae.jpg/330px-Argas_spec_columbidae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2b/Klopa_med_parjenjem-fotoBlazVerbic.jpg/250px-Klopa_med_parjenjem-fotoBlazVerbic.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b6/Ixodes_hexagonus_%28aka%29.jpg/250px-Ixodes_hexagonus_%28aka%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7a/Nuttalliella_namaqua_cropped.png/250px-Nuttalliella_namaqua_cropped.png"]},{"name":"Pseudoscorpiones","parent":"Arachnida","rank":"Order","ipa":"","etymology":"","common":["false scorpions","book scorpions"],"tag":"They are small arachnids with a flat, pear-shaped body, and pincer-like pedipalps that resemble those of scorpions. They usually range from 2 to 8 mm in length. They have eight legs with five to seven segments each. They spin silk from a gland in their jaws to make disk-shaped cocoons for mating, molting, or waiting out cold weather. Some species are arboreal, while others are phagophiles, eating parasites in an example of cleaning symbiosis.","imgs":["https://upload.wikimedia.org/wikipedia/commons/8/81/Neobisium_sylvaticum_03.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/72/Ar_1.jpg/330px-Ar_1.jpg"]},{"name":"Scorpiones","parent":"Arachnida","rank":"Order","ipa":"","etymology":"","common":["scorpions"],"tag":"They are predatory arachnids with eight legs, a pair of grasping pincers and a narrow, segmented tail, often carried in a characteristic forward curve over the back and always ending with a stinger. They primarily prey on insects and other invertebrates, but some species hunt vertebrates. They use their pincers to restrain and kill prey, or to prevent their own predation.","imgs":["https://upload.wikimedia.org/wikipedia/commons/f/fe/Scorpion_Photograph_By_Shantanu_Kuveskar.jpg","https://upload.wikimedia.org/wikipedia/commons/f/fe/Odonturus_dentatus.png","https://upload.wikimedia.org/wikipedia/commons/thumb/6/60/Cercophonius_squama.jpg/330px-Cercophonius_squama.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4a/Paravaejovis_spinigerus_002.jpg/330px-Paravaejovis_spinigerus_002.jpg","https://upload.wikimedia.org/wikipedia/commons/2/23/Scorpionwithyoung.JPG"]},{"name":"Tetrapulmonata","parent":"Arachnida","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"They have a set of paired book lungs occupying the second and third opisthosomal segments; a large postcerebral pharynx; prosomal endosternite with four segmental components; and a complex coxotrochanteral joint in the walking legs.","imgs":[]},{"name":"Araneae","parent":"Tetrapulmonata","rank":"Order","ipa":"","etymology":"","common":[],"tag":"They are air-breathing arthropods that have eight limbs, chelicerae with fangs generally able to inject venom, and spinnerets that extrude silk. The eye count can vary from 8, 6, 4, 2 and 0. The usual body segments found in arthropods are fused into two tagmata, the cephalothorax (prosoma) and the opisthosoma (abdomen) that is joined by a small, cylindrical pedicel.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f3/Aptostichus_simus_Monterey_County.jpg/120px-Aptostichus_simus_Monterey_County.jpg"]},{"name":"Mygalomorphae","parent":"Araneae","rank":"Infraorder","ipa":"","etymology":"","common":["tarantulas","Australian funnel web spiders","mouse spiders","trapdoor spiders"],"tag":"They have chelicerae (fangs) that point straight down, parallel to the long axis of the spider's body, and only have one orientation they can employ during prey capture. Many members are known as trapdoor spiders. Many are well adapted to killing other large arthropods and will also sometimes kill small mammals, birds, and reptiles.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Brachypelma_vagans_p1.jpg/330px-Brachypelma_vagans_p1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Lasiodora_parahybana_2009_G03.jpg/330px-Lasiodora_parahybana_2009_G03.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d3/Mojave_Tarantula.jpg/330px-Mojave_Tarantula.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/Lasiodora_parahybana%2C_claws.JPG/330px-Lasiodora_parahybana%2C_claws.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/74/Tarantula%2C_Attacking_Position%2C_Photo_by_Sascha_Grabow.jpg/250px-Tarantula%2C_Attacking_Position%2C_Photo_by_Sascha_Grabow.jpg","https://upload.wikimedia.org/wikipedia/commons/5/54/Cyclosternum_fasciatum%2C_eye_region.jpg","https://upload.wikimedia.org/wikipedia/commons/9/9f/Atrax_robustus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b5/Male_Missulena_occatoria_spider_-_cropped.JPG/250px-Male_Missulena_occatoria_spider_-_cropped.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/Mouse_spider02.jpg/330px-Mouse_spider02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/17/Male_Mouse_Spider.jpg/330px-Male_Mouse_Spider.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/Trittame_loki_471756472.jpg/250px-Trittame_loki_471756472.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Idiops_castaneus_298356289_537412358.jpg/330px-Idiops_castaneus_298356289_537412358.jpg"]},{"name":"Araneomorphae","parent":"Araneae","rank":"Infraorder","ipa":"","etymology":"","common":[],"tag":"They have chelicerae (fangs) that point diagonally forward and cross in a pinching action.","imgs":[]},{"name":"Synspermiata","parent":"Araneomorphae","rank":"Clade","ipa":"","etymology":"","common":["coneweb spiders","false violin spiders","woodlouse hunters","sowbug-eating spiders","cell spiders","goblin spiders","cellar spiders","daddy long-legs spiders","carpenter spiders","vibrating spiders","gyrating spiders","long daddies","angel spiders","plectreurid spiders","tube-dwelling spiders","recluse spiders","violin spiders","brown recluse spiders","sand spiders","assassin spiders","long-legged cave spiders","armored spiders"],"tag":"United by having simpler genitalia than other araneomorph spiders, lacking a cribellum, and sharing an evolutionary history of synspermia – a particular way in which spermatozoa are grouped together when transferred to the female. There is unusual in the degree to which the eye number varies being either 8, 6, 4, or 2. Some species exhibit presocial behaviour, in which mature spiders live together and assist the young with food.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Orthonops_lapanus_535351835.jpg/330px-Orthonops_lapanus_535351835.jpg","https://upload.wikimedia.org/wikipedia/commons/c/ce/Diguetia_canities.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Drymusa.jpg/250px-Drymusa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2d/Izithunzi_capense_171403079.jpg/330px-Izithunzi_capense_171403079.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c9/Dysdera_crocata_458284237.jpg/330px-Dysdera_crocata_458284237.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/Dysdera_fg03.jpg/250px-Dysdera_fg03.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/Tapinesthis_inermis_female_D.jpg/250px-Tapinesthis_inermis_female_D.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/Azanialobus_lawrencei_307210059_554091822.jpg/330px-Azanialobus_lawrencei_307210059_554091822.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/Periegops_suterii_311469976.jpg/330px-Periegops_suterii_311469976.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/Cellar_Spider_preying_upon_house_spider.jpg/330px-Cellar_Spider_preying_upon_house_spider.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ce/Female_Crossopriza_lyoni_-_Mindanao%2C_Philippines_1.jpg/330px-Female_Crossopriza_lyoni_-_Mindanao%2C_Philippines_1.jpg","https://upload.wikimedia.org/wikipedia/commons/2/28/Physocyclus.globosus.female.2.-.tanikawa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a7/Micropholcus_fauroti.jpg/330px-Micropholcus_fauroti.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/65/Modisimus_texanus.jpg/330px-Modisimus_texanus.jpg","https://upload.wikimedia.org/wikipedia/commons/9/93/Male_plectreurid_%28Marshal_Hedin%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/58/Scytodes_thoracica_%28aka%29.jpg/330px-Scytodes_thoracica_%28aka%29.jpg","https://upload.wikimedia.org/wikipedia/commons/8/8c/Scytodes.fusca.female.-.tanikawa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Scytodes_glabula_3.jpg/330px-Scytodes_glabula_3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2d/Araña_Mandaio.07-0-2006.jpg/250px-Araña_Mandaio.07-0-2006.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Segestria_bavarica_male.jpg/250px-Segestria_bavarica_male.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/99/Brown_recluse_spider%2C_Loxosceles_reclusa.jpg/330px-Brown_recluse_spider%2C_Loxosceles_reclusa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/76/Hexophthalma_hahni_305451503_550742892.jpg/330px-Hexophthalma_hahni_305451503_550742892.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f5/Hexophthalma_hahni_305451503_550744608.jpg/330px-Hexophthalma_hahni_305451503_550744608.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Unidentified_Sicarius%2C_female.jpg/250px-Unidentified_Sicarius%2C_female.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/Telema_tenella.jpg/330px-Telema_tenella.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/82/Ablemma_contrita_female_1.jpg/250px-Ablemma_contrita_female_1.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c7/Trogloraptor_marchingtoni_%28Female%29%3B_captive_specimen.jpg"]},{"name":"Palpimanoidea","parent":"Araneomorphae","rank":"Superfamily","ipa":"","etymology":"","common":["assassin spiders","palp-footed spiders"],"tag":"Many specialize in preying on other spiders. They often have enlarged front legs, which enable them to both seize and manipulate prey. Their heads are raised up on a \"neck\" with long chelicerae (\"jaws\").","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Huttonia_sp._male.jpg/250px-Huttonia_sp._male.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f2/Zearchaea_clypeata_female.jpg/330px-Zearchaea_clypeata_female.jpg","https://upload.wikimedia.org/wikipedia/commons/1/1f/Diaphorocellus_biplagiatus_297526137_535836028.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/39/Austrarchaea_raveni_353492909.jpg/330px-Austrarchaea_raveni_353492909.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/40/Zephyrarchaea.jpg/250px-Zephyrarchaea.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/58/Eriauchenius_pauliani_%2810.3897-zookeys.727.20222%29_Figure_18.jpg/250px-Eriauchenius_pauliani_%2810.3897-zookeys.727.20222%29_Figure_18.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Palpimanus_transvaalicus_308353429_556306020.jpg/330px-Palpimanus_transvaalicus_308353429_556306020.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c9/Palpimanus_paroculus_305448567_550738457.jpg/330px-Palpimanus_paroculus_305448567_550738457.jpg"]},{"name":"Entelegynae","parent":"Araneomorphae","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"Females have a genital plate and three external openings in the female's body. Sperm is injected via one or other of the two separate copulatory openings and then enters the spermathecae. The other external opening is where the fertilized egg emerges. Males have complex palpal bulbs.","imgs":[]},{"name":"Araneoidea","parent":"Entelegynae","rank":"Superfamily","ipa":"","etymology":"","common":["araneoids","tangle-web spiders","cobweb spiders","comb-footed spiders","widow spiders","redback spiders","orb-weaver spiders","pirate spiders","ray spiders","sheet weavers","money spiders","triangular spiders"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Argiope_catenulata_at_Kadavoor.jpg/250px-Argiope_catenulata_at_Kadavoor.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a5/Orb_weaver_spiderlings.jpg/330px-Orb_weaver_spiderlings.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d6/Araneus_apricus_29825863.jpg/250px-Araneus_apricus_29825863.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/58/Arrow-shaped_Micrathena_-_Micrathena_sagittata%2C_Julie_Metz_Wetlands%2C_Woodbridge%2C_Virginia_-_8004905359.jpg/250px-Arrow-shaped_Micrathena_-_Micrathena_sagittata%2C_Julie_Metz_Wetlands%2C_Woodbridge%2C_Virginia_-_8004905359.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fd/Argiope_sp.jpg/330px-Argiope_sp.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d0/Eriophora_sp_2.jpg/330px-Eriophora_sp_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0d/Dippenaaria_luxurians_dorsal_view.jpg/330px-Dippenaaria_luxurians_dorsal_view.jpg","https://upload.wikimedia.org/wikipedia/commons/e/ee/Conoculus.lyugadinus.female.-.tanikawa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Arkys_cornutus_1.jpg/250px-Arkys_cornutus_1.jpg","https://upload.wikimedia.org/wikipedia/commons/2/2c/Arkys.sp.new.guinea.-.tanikawa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ef/Matilda_australia_450296949.jpg/330px-Matilda_australia_450296949.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Drapetisca_alteranda.JPG/330px-Drapetisca_alteranda.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/65/Ero_aphana_female_side.jpg/250px-Ero_aphana_female_side.jpg","https://upload.wikimedia.org/wikipedia/commons/d/d4/Mimetus.ryukyus.female.-.takinawa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/Mysmena_80038039.jpg/330px-Mysmena_80038039.jpg","https://upload.wikimedia.org/wikipedia/commons/4/4c/Male_Nesticus_sp._%28Marshal_Hedin%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/Crassignatha_danaugirangensis_female%2C_dorsal_view.jpg/330px-Crassignatha_danaugirangensis_female%2C_dorsal_view.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a9/Cepheia_longiseta_359150569.jpg/330px-Cepheia_longiseta_359150569.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/28/Metellina_mengei_%28aka%29.jpg/250px-Metellina_mengei_%28aka%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Long-jawed_orb-weaver_spider_%28Tetragnatha_montana%29_female.jpg/330px-Long-jawed_orb-weaver_spider_%28Tetragnatha_montana%29_female.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dc/Redback_vers_Lizard.jpg/330px-Redback_vers_Lizard.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a5/Latrodectus_hasselti_-Sydney%2C_Australia-8.jpg/330px-Latrodectus_hasselti_-Sydney%2C_Australia-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/%28MHNT%29_Enoplognatha_ovata_on_Daucus_carota.jpg/250px-%28MHNT%29_Enoplognatha_ovata_on_Daucus_carota.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c3/Chrysso.pulcherrima.male.-.tanikawa.jpg","https://upload.wikimedia.org/wikipedia/commons/f/ff/Dipoena.martinae.female.-.tanikawa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/Black_Widow_Spider_07-04-20.jpg/330px-Black_Widow_Spider_07-04-20.jpg","https://upload.wikimedia.org/wikipedia/commons/7/71/Wendilgarda.sp.female.-.tanikawa.jpg","https://upload.wikimedia.org/wikipedia/commons/9/96/Zookeys.753.20805.figure3_%28A%29.jpg"]},{"name":"Eresidae","parent":"Entelegynae","rank":"Family","ipa":"","etymology":"","common":["velvet spiders","ladybird spiders"],"tag":"They can look quite smooth and velvety and usually live in silken tubes under objects, or underground, with some species building silken nests. They are almost entirely limited to the Old World, with the exception of one species known from Brazil.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c2/Colonial_Spiders_%28Stegodyphus_dumicola%29_%286607372243%29%2C_crop1.jpg/330px-Colonial_Spiders_%28Stegodyphus_dumicola%29_%286607372243%29%2C_crop1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Eresus_fg03.jpg/330px-Eresus_fg03.jpg","https://upload.wikimedia.org/wikipedia/commons/2/23/Dresserus_colsoni_302560865_545286026.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Gandanameno_purcelli_313759681_566637883.jpg/330px-Gandanameno_purcelli_313759681_566637883.jpg","https://upload.wikimedia.org/wikipedia/commons/9/90/Loureedia_annulipes_male1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Adonea_eye_group.svg/330px-Adonea_eye_group.svg.png"]},{"name":"Titanoecidae","parent":"Entelegynae","rank":"Family","ipa":"","etymology":"","common":[],"tag":"They are mostly dark-colored builders of \"woolly\" (cribellate) silk webs. Several species are found at relatively high altitudes in mountain ranges and may be very common in such habitats.","imgs":["https://upload.wikimedia.org/wikipedia/commons/d/db/Goeldia_patellaris_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0a/Nurscia_albomaculata.jpg/330px-Nurscia_albomaculata.jpg","https://upload.wikimedia.org/wikipedia/commons/9/94/Pandava.laminata.female.-.tanikawa.jpg","https://upload.wikimedia.org/wikipedia/commons/1/1f/Titanoeca_americana_2.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c9/Titanoeca_quadriguttata.jpg"]},{"name":"RTA clade","parent":"Entelegynae","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"They have a backward-facing projection on the tibia of the male pedipalp.","imgs":[]},{"name":"Zodariidae","parent":"RTA clade","rank":"Family","ipa":"","etymology":"","common":["ant spiders"],"tag":"Most species are daytime hunters and live together with ants, mimicking their behavior and sometimes even their chemical traits.","imgs":["https://upload.wikimedia.org/wikipedia/commons/4/4e/Mallinella.fulvipes.female.-.tanikawa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Caesetius_-_Rudolph_Steenkamp_-_176367867.jpeg/330px-Caesetius_-_Rudolph_Steenkamp_-_176367867.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a8/Psammorygma_aculeatum_336191094.jpg/330px-Psammorygma_aculeatum_336191094.jpg","https://upload.wikimedia.org/wikipedia/commons/2/21/Mallinella.shimojanai.female.-.tanikawa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/Diores_russelli_308129210_555876139.jpg/330px-Diores_russelli_308129210_555876139.jpg"]},{"name":"Sparassidae","parent":"RTA clade","rank":"Family","ipa":"","etymology":"","common":["huntsman spiders","giant crab spiders","wood spiders","rain spiders","lizard-eating spiders"],"tag":"Many species grow very large. Their legs bear fairly prominent spines. They tend to live under rocks, bark and similar shelters. They hunt and forage for food with a diet consisting primarily of insects and other invertebrates, and occasionally small skinks and geckos. They are able to travel extremely quickly.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f7/Sparassidae_Palystes_castaneus_mature_female_9923s.jpg/330px-Sparassidae_Palystes_castaneus_mature_female_9923s.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ad/Olios_argelasius_MHNT.jpg/330px-Olios_argelasius_MHNT.jpg","https://upload.wikimedia.org/wikipedia/commons/a/ac/Huntsman-Spider-Delena-cancerides.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bd/Huntsman_spider_with_meal.jpg/330px-Huntsman_spider_with_meal.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/Huntsman_Spider_feeding_Grasshopper.jpg/330px-Huntsman_Spider_feeding_Grasshopper.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Huntsman_spider_on_log.jpg/330px-Huntsman_spider_on_log.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Huntsman_spider_%28Sparassidae_sp.%29_Ankasa.jpg/330px-Huntsman_spider_%28Sparassidae_sp.%29_Ankasa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Huntsman_Spider_egg_sac_hatching_23_Jan_11.JPG/250px-Huntsman_Spider_egg_sac_hatching_23_Jan_11.JPG"]},{"name":"Lycosidae","parent":"RTA clade","rank":"Family","ipa":"","etymology":"","common":["wolf spiders","wandering spiders","lynx spiders","nursery web spiders","flower crab spiders","ant mimicking crab spiders"],"tag":"Traditionally defined as having a \"grate-shaped\" reflective layer at the back of the eye but phylogenetic studies shuffle these species somewhat.","imgs":["https://upload.wikimedia.org/wikipedia/commons/1/14/Wandering_spider.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Ctenus_caligineus_302557374_545280326.jpg/250px-Ctenus_caligineus_302557374_545280326.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/df/Wolf_spider_tunnel.jpg/330px-Wolf_spider_tunnel.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Wolf_eyes_for_guide.jpg/330px-Wolf_eyes_for_guide.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8b/Oxyopes_salticus_Kaldari_02.jpg/330px-Oxyopes_salticus_Kaldari_02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c1/LynxSpider_Hunt_macrogiants_E.jpg/250px-LynxSpider_Hunt_macrogiants_E.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/LynxSpider_Hunt_macrogiants_F.jpg/250px-LynxSpider_Hunt_macrogiants_F.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Peucetia-formosensis-female.jpg/250px-Peucetia-formosensis-female.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dc/Nursery_web_spider_%28Nilus_albocinctus%29_female.jpg/330px-Nursery_web_spider_%28Nilus_albocinctus%29_female.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/Nursery_web_spider_%28Pisaura_mirabilis%29_2.jpg/250px-Nursery_web_spider_%28Pisaura_mirabilis%29_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/05/Bytom_Pisaura_mirabilis_female_tent.jpg/330px-Bytom_Pisaura_mirabilis_female_tent.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Dolomedes_fimbriatus_1.jpg/330px-Dolomedes_fimbriatus_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Afropisaura_ducis_-_Jonathan_Whitaker_-_168768862.jpeg/250px-Afropisaura_ducis_-_Jonathan_Whitaker_-_168768862.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e5/Hygropoda_tangana_165771712.jpg/250px-Hygropoda_tangana_165771712.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Fecenia_cylindrata.png/330px-Fecenia_cylindrata.png","https://upload.wikimedia.org/wikipedia/commons/8/8c/Fecenia_protensa.png","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Crab_Spider_6299.jpg/330px-Crab_Spider_6299.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Food_chain_2023.jpg/250px-Food_chain_2023.jpg","https://upload.wikimedia.org/wikipedia/commons/2/27/Camaricus_sp.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7f/Misumena_vatia_female_Luc_Viatour_1.jpg/330px-Misumena_vatia_female_Luc_Viatour_1.jpg","https://upload.wikimedia.org/wikipedia/commons/4/43/Phyrnarachne_sp.jpg","https://upload.wikimedia.org/wikipedia/commons/9/97/Amyciaea_sp..jpg"]},{"name":"Dionycha","parent":"RTA clade","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"Characterized by the possession of two tarsal claws with tufts of hairs (setae) beside them, which produce strong adhesion, enabling some species to climb glass.","imgs":[]},{"name":"Clubionidae","parent":"Dionycha","rank":"Family","ipa":"","etymology":"","common":["sac spiders"],"tag":"They are nocturnal, sac-building hunting spiders with a near-worldwide distribution.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b9/Clubiona_trivialis2.jpg/330px-Clubiona_trivialis2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Clubiona_durbana_315168323_569327015.jpg/330px-Clubiona_durbana_315168323_569327015.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Elaver_excepta_297602220.jpg/250px-Elaver_excepta_297602220.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Porrhoclubiona_leucaspis.jpg/250px-Porrhoclubiona_leucaspis.jpg"]},{"name":"Gnaphosidae","parent":"Dionycha","rank":"Family","ipa":"","etymology":"","common":["ground spiders"],"tag":"Generally characterized by having barrel-shaped anterior spinnerets that are one spinneret diameter apart. The main exception are some ant-mimicking species. All species lack a prey-capture web and generally run prey down on the surface. They entangle their prey in swathing attacks, often applying their webbing to their prey's legs and mouths. They hunt at night and spend the day in a silken retreat.","imgs":["https://upload.wikimedia.org/wikipedia/commons/e/e2/Callilepis_nocturna.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Ammoxenus_amphalodes_301149800_542654034.jpg/330px-Ammoxenus_amphalodes_301149800_542654034.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/ba/Ammoxenus_amphalodes_301149489_542653466.jpg/330px-Ammoxenus_amphalodes_301149489_542653466.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d0/Asemesthes_flavipes_297522781_535830530.jpg/250px-Asemesthes_flavipes_297522781_535830530.jpg"]},{"name":"Corinnidae","parent":"Dionycha","rank":"Family","ipa":"","etymology":"","common":["corinnid sac spiders"],"tag":"Phylogenetic studies have made the group stricter but the group was known for having eight eyes arranged in two rows, conical anterior spinnerets that touch and for being wandering predators that build silken retreats, or sacs, usually on plant terminals, between leaves, under bark or under rocks. Some species mimic ants and velvet ants.","imgs":["https://upload.wikimedia.org/wikipedia/commons/3/3d/Copa_flavoplumosa_male_-_ZooKeys-276-001-g001-3.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/25/Graptartia_granulosa_438844712.jpg/330px-Graptartia_granulosa_438844712.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Pronophaea_natalica_-_Sunčana_Bradley_-_353831943.jpeg/330px-Pronophaea_natalica_-_Sunčana_Bradley_-_353831943.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Coenoptychus_mutillicus_177260866.jpg/330px-Coenoptychus_mutillicus_177260866.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Ant-mimic_Spider_-_Castianeira_longipalpa%2C_SERC%2C_Edgewater%2C_Maryland.jpg/330px-Ant-mimic_Spider_-_Castianeira_longipalpa%2C_SERC%2C_Edgewater%2C_Maryland.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e7/Castianeira_longipalpa%2C_Woodbridge%2C_Virginia.jpg/250px-Castianeira_longipalpa%2C_Woodbridge%2C_Virginia.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e5/Battalus_wallum_176745825.jpg/330px-Battalus_wallum_176745825.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a1/Merenius_alberti_299747383_540037796.jpg/250px-Merenius_alberti_299747383_540037796.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Nyssus_coloripes_74386182.jpg/250px-Nyssus_coloripes_74386182.jpg"]},{"name":"Philodromidae","parent":"Dionycha","rank":"Family","ipa":"","etymology":"","common":["philodromid crab spiders","running crab spiders"],"tag":"They have a crab-like shape due to the first two pairs of legs being oriented sideways (laterigrade) but are not closely related to garden crab spiders (Thomisidae). They have scopula only at the tips of the tarsi and their eyes are in two curved rows with the posterior row wider than the anterior row. They are active ambush predators and are often found on the stems and leaves of plants.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/7f/Ebo_pepinensis%2C_female_%28F_Philodromidae%29_%284131858085%29.jpg/330px-Ebo_pepinensis%2C_female_%28F_Philodromidae%29_%284131858085%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bf/Gephyrota_glauca_2024_06_30_15_49_46_iN_227105452.jpg/330px-Gephyrota_glauca_2024_06_30_15_49_46_iN_227105452.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/44/Hirriusa_bidentata_298372205_537443454.jpg/330px-Hirriusa_bidentata_298372205_537443454.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Paracleocnemis%2C_Puerto_Madero%2C_CABA%2C_Argentina_imported_from_iNaturalist_photo_91152209.jpg/330px-Paracleocnemis%2C_Puerto_Madero%2C_CABA%2C_Argentina_imported_from_iNaturalist_photo_91152209.jpg","https://upload.wikimedia.org/wikipedia/commons/b/bc/Petrichus_sp.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/Metallic_Crab_Spider_-_Philodromus_marxi%2C_Leesylvania_State_Park%2C_Woodbridge%2C_Virginia.jpg/250px-Metallic_Crab_Spider_-_Philodromus_marxi%2C_Leesylvania_State_Park%2C_Woodbridge%2C_Virginia.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Philodromus.aureolus.male.6.jpg/330px-Philodromus.aureolus.male.6.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/ff/Philodromidae_-_Philodromus_sp..jpg/330px-Philodromidae_-_Philodromus_sp..jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Philodromidae_-_Tibellus_sp..JPG/330px-Philodromidae_-_Tibellus_sp..JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/23/Philodromid-crab-spider-frontal-mze.jpg/330px-Philodromid-crab-spider-frontal-mze.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Running_crab_spider_%28Philodromidae%29_on_Norfolk_Island_pine_leaf_%28Araucaria_heterophylla%2C_Jardim_da_Praça_de_Londres%2C_Lisbon%2C_Portugal_julesvernex2.jpg/330px-Running_crab_spider_%28Philodromidae%29_on_Norfolk_Island_pine_leaf_%28Araucaria_heterophylla%2C_Jardim_da_Praça_de_Londres%2C_Lisbon%2C_Portugal_julesvernex2.jpg"]},{"name":"Salticidae","parent":"Dionycha","rank":"Family","ipa":"","etymology":"","common":["jumping spiders"],"tag":"They have some of the best vision among arthropods and are capable of stereoptic color vision. Most species are capable of very agile jumps. Both their book lungs and tracheal system are well-developed, and they use both systems (bimodal breathing). All species have four pairs of eyes, with the anterior median pair (the two front middle eyes) being particularly large.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/PlatycryptusUndatusFemale.jpg/330px-PlatycryptusUndatusFemale.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/60/Jumping_spider_vision_David_Hill.svg/250px-Jumping_spider_vision_David_Hill.svg.png","https://upload.wikimedia.org/wikipedia/commons/thumb/0/01/Telamonia_dimidiata_female.jpg/250px-Telamonia_dimidiata_female.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Phidippus_audax_male.jpg/330px-Phidippus_audax_male.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1b/Unidentified_Salticid_Jumping_with_Trailing_Dragline.jpg/330px-Unidentified_Salticid_Jumping_with_Trailing_Dragline.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a1/Saitis_barbipes_signaling.jpg/330px-Saitis_barbipes_signaling.jpg"]},{"name":"Amblypygi","parent":"Tetrapulmonata","rank":"Order","ipa":"","etymology":"","common":["whip-spiders","tailless whip-scorpions"],"tag":"They possess no silk glands or venom. They are found in tropical and subtropical regions worldwide, mainly in warm and humid environments. They like to stay protected and hidden within leaf litter, caves, or underneath bark. Some species are subterranean; all are nocturnal. They have eight legs, but use only six for walking, often in a crab-like, sideways fashion. The front pair of legs are modified for use as antennae-like feelers. They mostly eat arthropod prey, but sometimes feed on vertebrates. They grind and chew the prey prior to ingestion.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Heterophrynus_02.jpg/330px-Heterophrynus_02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0b/AmblypygiDorsal.jpg/330px-AmblypygiDorsal.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Damon_diadema_female.jpg/250px-Damon_diadema_female.jpg"]},{"name":"Uropygi","parent":"Tetrapulmonata","rank":"Order","ipa":"","etymology":"","common":["whip scorpions","vinegaroons"],"tag":"They resemble true scorpions, with a whiplike tail, and when attacked can discharge an offensive, vinegar-smelling liquid. They use only six legs for walking, with the first two legs serving as antennae-like sensory organs. All species also have large scorpion-like pedipalps (pincers). They have one pair of median eyes at the front of the cephalothorax and up till five pairs of lateral eyes on each side of the head. They are carnivorous, nocturnal hunters feeding mostly on insects, millipedes, scorpions, and terrestrial isopods, but sometimes on worms and slugs. The prey is crushed between special teeth while eating.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/72/Thelyphonidae_-_Hypoctonus_formosus.JPG/250px-Thelyphonidae_-_Hypoctonus_formosus.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/28/Labochirus_tauricornis.jpg/330px-Labochirus_tauricornis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8e/Vinegaroon_-_Whip_Spider_%28Mastigoproctus_baracoensis%29_%288576421119%29.jpg/330px-Vinegaroon_-_Whip_Spider_%28Mastigoproctus_baracoensis%29_%288576421119%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7e/Thelyphonellus_amazonicus_178761753.jpg/330px-Thelyphonellus_amazonicus_178761753.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1b/Malaysian_Vinegaroon_%28Thelyphonus_sp.%29_%288723019285%29.jpg/330px-Malaysian_Vinegaroon_%28Thelyphonus_sp.%29_%288723019285%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Typopeltis_crucifer_at_Fuxing%2C_Taoyuan_2022-06-12_%28cropped%29.jpg/330px-Typopeltis_crucifer_at_Fuxing%2C_Taoyuan_2022-06-12_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/6/60/Vinegaroon_-_Mastigoproctus_giganteus_with_Slate_Millipede.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Mastigoproctus_giganteus_0008_L.D.jpg/330px-Mastigoproctus_giganteus_0008_L.D.jpg"]}],{},{"120px-Aptostichus_simus_Monterey_County.jpg":[120,86,"#dfdad5"],"250px-(MHNT)_Enoplognatha_ovata_on_Daucus_carota.jpg":[250,395,"#5e564c"],"250px-Ablemma_contrita_female_1.jpg":[250,424,"#d79e68"],"250px-Afropisaura_ducis_-_Jonathan_Whitaker_-_168768862.jpeg":[250,250,"#bd8d87"],"250px-Araneus_apricus_29825863.jpg":[250,375,"#1d1b0f"],"250px-Araña_Mandaio.07-0-2006.jpg":[250,373,"#a29786"],"250px-Argiope_catenulata_at_Kadavoor.jpg":[250,333,"#7e864b"],"250px-Arkys_cornutus_1.jpg":[250,250,"#759156"],"250px-Arrow-shaped_Micrathena_-_Micrathena_sagittata,_Julie_Metz_Wetlands,_Woodbridge,_Virginia_-_8004905359.jpg":[250,373,"#79861a"],"250px-Asemesthes_flavipes_297522781_535830530.jpg":[250,284,"#915a3e"],"250px-Castianeira_longipalpa,_Woodbridge,_Virginia.jpg":[250,375,"#dfdbd8"],"250px-Ctenus_caligineus_302557374_545280326.jpg":[250,248,"#69422c"],"250px-Damon_diadema_female.jpg":[250,333,"#505057"],"250px-Drymusa.jpg":[250,268,"#cfccc1"],"250px-Dysdera_fg03.jpg":[250,325,"#714738"],"250px-Elaver_excepta_297602220.jpg":[250,333,"#d2ba97"],"250px-Eriauchenius_pauliani_(10.3897-zookeys.727.20222)_Figure_18.jpg":[250,281,"#dac7b9"],"250px-Ero_aphana_female_side.jpg":[250,365,"#b38c6d"],"250px-Food_chain_2023.jpg":[250,250,"#a9b947"],"250px-Gluvia4.jpg":[250,372,"#a6a7a7"],"250px-Glycyphagus-spp-mite.jpg":[250,344,"#cdc4bf"],"250px-Huntsman_Spider_egg_sac_hatching_23_Jan_11.JPG":[250,333,"#828981"],"250px-Huttonia_sp._male.jpg":[250,308,"#cabfba"],"250px-Hygropoda_tangana_165771712.jpg":[250,313,"#5f8735"],"250px-Ixodes_hexagonus_(aka).jpg":[250,298,"#d2c4bf"],"250px-Jumping_spider_vision_David_Hill.svg.png":[250,243,null],"250px-Klopa_med_parjenjem-fotoBlazVerbic.jpg":[250,326,"#dad3ce"],"250px-LynxSpider_Hunt_macrogiants_E.jpg":[250,312,"#968049"],"250px-LynxSpider_Hunt_macrogiants_F.jpg":[250,355,"#6f6a44"],"250px-Male_Missulena_occatoria_spider_-_cropped.JPG":[250,256,"#776e69"],"250px-Merenius_alberti_299747383_540037796.jpg":[250,250,"#ac7556"],"250px-Metallic_Crab_Spider_-_Philodromus_marxi,_Leesylvania_State_Park,_Woodbridge,_Virginia.jpg":[250,368,"#ad6d36"],"250px-Metellina_mengei_(aka).jpg":[250,250,"#4f4c2c"],"250px-Nursery_web_spider_(Pisaura_mirabilis)_2.jpg":[250,250,"#59672f"],"250px-Nuttalliella_namaqua_cropped.png":[250,259,"#999884"],"250px-Nyssus_coloripes_74386182.jpg":[250,250,"#a4a2a1"],"250px-Peucetia-formosensis-female.jpg":[250,334,"#60674c"],"250px-Porrhoclubiona_leucaspis.jpg":[250,250,"#beb8b3"],"250px-Segestria_bavarica_male.jpg":[250,250,"#e6e3e1"],"250px-Sunspider.jpg":[250,376,"#433935"],"250px-Tapinesthis_inermis_female_D.jpg":[250,309,"#ac9c8d"],"250px-Tarantula,_Attacking_Position,_Photo_by_Sascha_Grabow.jpg":[250,250,"#b2b2ab"],"250px-Telamonia_dimidiata_female.jpg":[250,250,"#8b8260"],"250px-Thelyphonidae_-_Hypoctonus_formosus.JPG":[250,250,"#d7cfca"],"250px-Trittame_loki_471756472.jpg":[250,333,"#8d806d"],"250px-Trombidium_holosericeum_(aka).jpg":[250,284,"#cbbabc"],"250px-Unidentified_Sicarius,_female.jpg":[250,305,"#c9b08d"],"250px-Zephyrarchaea.jpg":[250,301,"#8d816a"],"330px-Adonea_eye_group.svg.png":[330,274,null],"330px-AmblypygiDorsal.jpg":[330,227,"#73675e"],"330px-Ammoxenus_amphalodes_301149489_542653466.jpg":[330,210,"#b4927a"],"330px-Ammoxenus_amphalodes_301149800_542654034.jpg":[330,200,"#ae7352"],"330px-Ant-mimic_Spider_-_Castianeira_longipalpa,_SERC,_Edgewater,_Maryland.jpg":[330,220,"#42571e"],"330px-Ar_1.jpg":[330,252,"#c0ab9b"],"330px-Argas_spec_columbidae.jpg":[330,217,"#a58b7a"],"330px-Argiope_sp.jpg":[330,220,"#7a6752"],"330px-Austrarchaea_raveni_353492909.jpg":[330,283,"#6b633a"],"330px-Azanialobus_lawrencei_307210059_554091822.jpg":[330,260,"#a4684c"],"330px-Battalus_wallum_176745825.jpg":[330,234,"#b5b586"],"330px-Black_Widow_Spider_07-04-20.jpg":[330,238,"#826c59"],"330px-Brachypelma_vagans_p1.jpg":[330,235,"#d7d7d6"],"330px-Brown_recluse_spider,_Loxosceles_reclusa.jpg":[330,217,"#b0bea5"],"330px-Bytom_Pisaura_mirabilis_female_tent.jpg":[330,220,"#495020"],"330px-Caesetius_-_Rudolph_Steenkamp_-_176367867.jpeg":[330,235,"#ba7447"],"330px-Cellar_Spider_preying_upon_house_spider.jpg":[330,219,"#aaa29c"],"330px-Cepheia_longiseta_359150569.jpg":[330,247,"#a09c98"],"330px-Cercophonius_squama.jpg":[330,268,"#ece8e6"],"330px-Clubiona_durbana_315168323_569327015.jpg":[330,258,"#5bc76c"],"330px-Clubiona_trivialis2.jpg":[330,220,"#5f7240"],"330px-Coenoptychus_mutillicus_177260866.jpg":[330,186,"#b0ad13"],"330px-Colonial_Spiders_(Stegodyphus_dumicola)_(6607372243),_crop1.jpg":[330,299,"#5d6b50"],"330px-Crab_Spider_6299.jpg":[330,220,"#5b5a30"],"330px-Crassignatha_danaugirangensis_female,_dorsal_view.jpg":[330,222,"#c5bfbd"],"330px-Cryptocellus_goodnighti.jpg":[330,234,"#76513c"],"330px-Dermanyssus_cfr_gallinae_(5021757436).jpg":[330,221,"#312a28"],"330px-Diores_russelli_308129210_555876139.jpg":[330,288,"#a7694b"],"330px-Dippenaaria_luxurians_dorsal_view.jpg":[330,186,"#7c8a39"],"330px-Dolomedes_fimbriatus_1.jpg":[330,243,"#b2ad9d"],"330px-Drapetisca_alteranda.JPG":[330,298,"#866545"],"330px-Dysdera_crocata_458284237.jpg":[330,220,"#f8eeec"],"330px-Ebo_pepinensis,_female_(F_Philodromidae)_(4131858085).jpg":[330,212,"#ab9a8d"],"330px-Eresus_fg03.jpg":[330,268,"#dad4d4"],"330px-Eriophora_sp_2.jpg":[330,240,"#8b8339"],"330px-Fecenia_cylindrata.png":[330,132,"#d5d2d0"],"330px-Female_Crossopriza_lyoni_-_Mindanao,_Philippines_1.jpg":[330,262,"#a38d63"],"330px-Gandanameno_purcelli_313759681_566637883.jpg":[330,251,"#8b7054"],"330px-Gephyrota_glauca_2024_06_30_15_49_46_iN_227105452.jpg":[330,274,"#898b49"],"330px-Graptartia_granulosa_438844712.jpg":[330,247,"#6d707d"],"330px-Harvester_body_close_up.jpg":[330,220,"#997f45"],"330px-Harvestman_Opiliones_grooming_2016-05-15.jpg":[330,220,"#c29e73"],"330px-Heterophrynus_02.jpg":[330,232,"#865d45"],"330px-Hexophthalma_hahni_305451503_550742892.jpg":[330,251,"#ce9d6e"],"330px-Hexophthalma_hahni_305451503_550744608.jpg":[330,221,"#b1743f"],"330px-Hirriusa_bidentata_298372205_537443454.jpg":[330,221,"#926c50"],"330px-Huntsman_Spider_feeding_Grasshopper.jpg":[330,277,"#88492c"],"330px-Huntsman_spider_(Sparassidae_sp.)_Ankasa.jpg":[330,220,"#645f5d"],"330px-Huntsman_spider_on_log.jpg":[330,220,"#846d58"],"330px-Huntsman_spider_with_meal.jpg":[330,220,"#d3ccc8"],"330px-Idiops_castaneus_298356289_537412358.jpg":[330,249,"#89614e"],"330px-Ixodus_ricinus_5x.jpg":[330,225,"#786b56"],"330px-Izithunzi_capense_171403079.jpg":[330,247,"#6a605b"],"330px-Labochirus_tauricornis.jpg":[330,248,"#7f7766"],"330px-Lasiodora_parahybana,_claws.JPG":[330,247,"#7f7d79"],"330px-Lasiodora_parahybana_2009_G03.jpg":[330,247,"#a98e69"],"330px-Latrodectus_hasselti_-Sydney,_Australia-8.jpg":[330,238,"#d4d0cc"],"330px-Long-jawed_orb-weaver_spider_(Tetragnatha_montana)_female.jpg":[330,220,"#64772f"],"330px-Malaysian_Vinegaroon_(Thelyphonus_sp.)_(8723019285).jpg":[330,197,"#675446"],"330px-Male_Mouse_Spider.jpg":[330,262,"#b3b2ae"],"330px-Mastigoproctus_giganteus_0008_L.D.jpg":[330,227,"#947958"],"330px-Matilda_australia_450296949.jpg":[330,264,"#a7a49e"],"330px-Micropholcus_fauroti.jpg":[330,220,"#e6e1e7"],"330px-Misumena_vatia_female_Luc_Viatour_1.jpg":[330,251,"#807965"],"330px-Modisimus_texanus.jpg":[330,247,"#666050"],"330px-Mojave_Tarantula.jpg":[330,220,"#a08b79"],"330px-Mouse_spider02.jpg":[330,220,"#c5c4c5"],"330px-Mysmena_80038039.jpg":[330,247,"#eceae8"],"330px-Nurscia_albomaculata.jpg":[330,255,"#8c8172"],"330px-Nursery_web_spider_(Nilus_albocinctus)_female.jpg":[330,220,"#384d1b"],"330px-Olios_argelasius_MHNT.jpg":[330,278,"#f7f3ee"],"330px-Opiliones_20100626.jpg":[330,232,"#6d6e74"],"330px-Opiliones_harvestman.jpg":[330,240,"#607d1d"],"330px-Orb_weaver_spiderlings.jpg":[330,220,"#615c3a"],"330px-Orthonops_lapanus_535351835.jpg":[330,247,"#5d4a43"],"330px-Oxyopes_salticus_Kaldari_02.jpg":[330,220,"#859c85"],"330px-Palpimanus_paroculus_305448567_550738457.jpg":[330,207,"#8b745b"],"330px-Palpimanus_transvaalicus_308353429_556306020.jpg":[330,266,"#b77d59"],"330px-Paracleocnemis,_Puerto_Madero,_CABA,_Argentina_imported_from_iNaturalist_photo_91152209.jpg":[330,220,"#515e2c"],"330px-Paravaejovis_spinigerus_002.jpg":[330,219,"#816048"],"330px-Periegops_suterii_311469976.jpg":[330,186,"#5e534d"],"330px-Phidippus_audax_male.jpg":[330,252,"#677354"],"330px-Philodromid-crab-spider-frontal-mze.jpg":[330,247,"#605941"],"330px-Philodromidae_-_Philodromus_sp..jpg":[330,247,"#8f8c65"],"330px-Philodromidae_-_Tibellus_sp..JPG":[330,248,"#4f7511"],"330px-Philodromus.aureolus.male.6.jpg":[330,217,"#f4f0ef"],"330px-Phthiracarid.jpg":[330,247,"#9c949b"],"330px-PlatycryptusUndatusFemale.jpg":[330,217,"#dad3ce"],"330px-Pronophaea_natalica_-_Sunčana_Bradley_-_353831943.jpeg":[330,263,"#544332"],"330px-Psammorygma_aculeatum_336191094.jpg":[330,306,"#91674c"],"330px-Pseudo-araña_nocturna_(opilion).jpg":[330,247,"#9b7943"],"330px-Redback_vers_Lizard.jpg":[330,236,"#847c68"],"330px-Running_crab_spider_(Philodromidae)_on_Norfolk_Island_pine_leaf_(Araucaria_heterophylla,_Jardim_da_Praça_de_Londres,_Lisbon,_Portugal_julesvernex2.jpg":[330,260,"#434c25"],"330px-Saitis_barbipes_signaling.jpg":[330,247,"#61782c"],"330px-Scytodes_glabula_3.jpg":[330,275,"#a28a73"],"330px-Scytodes_thoracica_(aka).jpg":[330,263,"#e8e5e2"],"330px-Solfugid_in_veld_near_Uniondale_(Western_Cape)_1600.jpg":[330,235,"#76695a"],"330px-Solpugidae_showing_eyes_with_presumably_protective_bristles_2012_01_24_1019s.JPG":[330,229,"#d18a66"],"330px-Sparassidae_Palystes_castaneus_mature_female_9923s.jpg":[330,256,"#dbd5ce"],"330px-Sternothyrus_braueri_62962027_cropped.jpg":[330,247,"#ccbaad"],"330px-Telema_tenella.jpg":[330,221,"#a2997e"],"330px-Tetranychus_urticae_with_silk_threads.jpg":[330,221,"#838d56"],"330px-Thelyphonellus_amazonicus_178761753.jpg":[330,220,"#6a3725"],"330px-Tick_in_amber_carrying_spirochetes.jpg":[330,262,"#d4a644"],"330px-Typopeltis_crucifer_at_Fuxing,_Taoyuan_2022-06-12_(cropped).jpg":[330,220,"#7a7958"],"330px-Unidentified_Salticid_Jumping_with_Trailing_Dragline.jpg":[330,220,"#3b3b13"],"330px-Varroa_destructor,_1_2019-09-06-19.12.07_ZS_PMax_UDR_(48697155713).jpg":[330,297,"#361b0e"],"330px-Vinegaroon_-_Whip_Spider_(Mastigoproctus_baracoensis)_(8576421119).jpg":[330,220,"#664527"],"330px-Wolf_eyes_for_guide.jpg":[330,199,"#614536"],"330px-Wolf_spider_tunnel.jpg":[330,307,"#7e6e65"],"330px-Yellow_mite_(Tydeidae),_Lorryia_formosa.jpg":[330,225,"#494227"],"330px-Zearchaea_clypeata_female.jpg":[330,247,"#e8e4dd"],"Amblyomma_americanum_tick.jpg":[575,546,"#45563a"],"Amyciaea_sp..jpg":[600,400,"#94734e"],"Arkys.sp.new.guinea.-.tanikawa.jpg":[640,482,"#516439"],"Atrax_robustus.jpg":[504,434,"#928e81"],"Callilepis_nocturna.jpg":[640,425,"#d8d6d4"],"Camaricus_sp.jpg":[600,400,"#91724d"],"Chrysso.pulcherrima.male.-.tanikawa.jpg":[383,255,"#88b47f"],"Conoculus.lyugadinus.female.-.tanikawa.jpg":[369,267,"#5d5e4f"],"Copa_flavoplumosa_male_-_ZooKeys-276-001-g001-3.jpeg":[703,515,"#948f8d"],"Cyclosternum_fasciatum,_eye_region.jpg":[720,537,"#4a3e37"],"Diaphorocellus_biplagiatus_297526137_535836028.jpg":[314,199,"#7e513a"],"Diguetia_canities.jpg":[432,324,"#5c6150"],"Dipoena.martinae.female.-.tanikawa.jpg":[346,267,"#486750"],"Dresserus_colsoni_302560865_545286026.jpg":[770,549,"#795643"],"Fecenia_protensa.png":[780,475,"#d8d5d2"],"Goeldia_patellaris_1.jpg":[640,361,"#afaead"],"Huntsman-Spider-Delena-cancerides.jpg":[640,426,"#dfdcd9"],"Loureedia_annulipes_male1.jpg":[352,211,"#67615a"],"Male_Nesticus_sp._(Marshal_Hedin).jpg":[639,427,"#6a5847"],"Male_plectreurid_(Marshal_Hedin).jpg":[640,426,"#9a8879"],"Mallinella.fulvipes.female.-.tanikawa.jpg":[343,267,"#7a685c"],"Mallinella.shimojanai.female.-.tanikawa.jpg":[343,267,"#77614b"],"Mimetus.ryukyus.female.-.takinawa.jpg":[358,266,"#958883"],"Neobisium_sylvaticum_03.jpg":[640,505,"#dcd4d2"],"Odonturus_dentatus.png":[640,480,"#af9282"],"Opilioacarus_baeticus_2_(cropped).png":[586,407,"#adb5c4"],"Pandava.laminata.female.-.tanikawa.jpg":[363,267,"#73a577"],"Petrichus_sp.jpg":[680,511,"#bea3a0"],"Phyrnarachne_sp.jpg":[600,400,"#7f8f4e"],"Physocyclus.globosus.female.2.-.tanikawa.jpg":[368,266,"#d1c4c8"],"Ricinulei_from_Fernandez_&_Giribet,_male_Pseudocellus_pearsei_from_Grutas_Tzabnah,_Yucatán,_Mexico_(2015)_(cropped).jpg":[507,470,"#7a6152"],"Ricinulei_from_Fernandez_&_Giribet,_male_Ricinoides_karschii_from_Campo_Reserve,_Cameroon_(2015)_(cropped).jpg":[502,272,"#6d713f"],"Ricinulei_from_Fernandez_&_Giribet,_nymph_of_Ricinoides_atewa_(2015)_(cropped).jpg":[743,526,"#b98f74"],"Scorpion_Photograph_By_Shantanu_Kuveskar.jpg":[640,457,"#88806e"],"Scorpionwithyoung.JPG":[722,520,"#827b79"],"Scytodes.fusca.female.-.tanikawa.jpg":[344,267,"#9b877c"],"Titanoeca_americana_2.jpg":[640,480,"#c2b8b1"],"Titanoeca_quadriguttata.jpg":[639,474,"#9ca1ad"],"Trogloraptor_marchingtoni_(Female);_captive_specimen.jpg":[691,484,"#99725f"],"Vinegaroon_-_Mastigoproctus_giganteus_with_Slate_Millipede.jpg":[504,378,"#9b9994"],"Wandering_spider.jpg":[600,422,"#a08d71"],"Wendilgarda.sp.female.-.tanikawa.jpg":[363,267,"#577d64"],"Zookeys.753.20805.figure3_(A).jpg":[554,551,"#a06d3f"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_arthropoda_arachnida","<ul class=\"tree\" data-tree-range=\"arachnida\"><li><input type=\"checkbox\" checked id=\"Chelicerata_Arachnida\"><label class=\"tree_label\" for=\"Chelicerata_Arachnida\"></label><div class=\"outer_tree_box\"><div id=\"arachnida_arachnida\" class=\"tree_box\"><span><span>Arachnida</span><a href=\"https://en.wikipedia.org/wiki/Arachnida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Arachnida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Arachnida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Arachnida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"arthropoda\">See parent</button><span class=\"badge\">Class</span></span><span class=\"common_names\">(spiders, scorpions, pseudoscorpions, harvestmen, camel spiders, whip spiders, vinegaroons, ticks, mites, chiggers)</span><p class=\"tag\">They have eight legs attached to the cephalothorax. In some species the frontmost pair of legs has converted to a sensory function, while in others, different appendages can grow large enough to take on the appearance of extra pairs of legs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Opiliones_harvestman.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Opiliones_harvestman.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"240\" style=\"background-color:#607d1d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Plexippus_paykulli_-_50959617953.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Plexippus_paykulli_-_50959617953.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a0592e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Buthus_mariefranceae_%2810.3897-zookeys.686.12206%29_Figure_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Buthus_mariefranceae_%2810.3897-zookeys.686.12206%29_Figure_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"290\" style=\"background-color:#e1d5c7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neobisium_sylvaticum_03.jpg\" target=\"_blank\"><img src=\"thumbnails/Neobisium_sylvaticum_03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"505\" style=\"background-color:#dcd4d2\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_acariformes\" class=\"tree_box\"><span><span>Acariformes</span><a href=\"https://en.wikipedia.org/wiki/Acariformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Acariformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Acariformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Acariformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><span class=\"common_names\">(mites, house dust mites, rust mites, gall mites)</span><p class=\"tag\">The more diverse of the two superorders of mites. Members ingest solid food, being mainly microherbivores, fungivores and detritivores. Some are plant parasite species. Many species are also predators, fungivores, and animal parasites.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Trombidium_holosericeum_%28aka%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Trombidium_holosericeum_%28aka%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"284\" style=\"background-color:#cbbabc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Yellow_mite_%28Tydeidae%29%2C_Lorryia_formosa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Yellow_mite_%28Tydeidae%29%2C_Lorryia_formosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"225\" style=\"background-color:#494227\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Glycyphagus-spp-mite.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Glycyphagus-spp-mite.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"344\" style=\"background-color:#cdc4bf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phthiracarid.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phthiracarid.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9c949b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tetranychus_urticae_with_silk_threads.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tetranychus_urticae_with_silk_threads.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#838d56\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_opiliones\" class=\"tree_box\"><span><span>Opiliones</span><a href=\"https://en.wikipedia.org/wiki/Opiliones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Opiliones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Opiliones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Opiliones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(harvestmen, harvesters, daddy long legs)</span><p class=\"tag\">Known for having exceptionally long legs relative to their body size (but this is not true of all species). The connection between the cephalothorax and abdomen is broad, so that the body appears to be a single oval structure. They have no venom glands or silk glands. They can swallow chunks of solid food, not only liquids. They tend to have a single pair of camera-type eyes in the middle of the head.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Opiliones_harvestman.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Opiliones_harvestman.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"240\" style=\"background-color:#607d1d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pseudo-araña_nocturna_%28opilion%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudo-araña_nocturna_%28opilion%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9b7943\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Harvester_body_close_up.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Harvester_body_close_up.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#997f45\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Harvestman_Opiliones_grooming_2016-05-15.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Harvestman_Opiliones_grooming_2016-05-15.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#c29e73\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Opiliones_20100626.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Opiliones_20100626.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"232\" style=\"background-color:#6d6e74\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_ricinulei\" class=\"tree_box\"><span><span>Ricinulei</span><a href=\"https://en.wikipedia.org/wiki/Ricinulei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ricinulei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ricinulei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ricinulei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(hooded tickspiders)</span><p class=\"tag\">They inhabit the leaf litter of rainforest floors, as well as caves, where they search for prey with their elongate sensory second, longer, leg pair. They are predatory; eating small arthropods. Extant species have no eyes. They have a &quot;hood&quot; which can be raised and lowered over the head. When lowered, it covers the mouth and the chelicerae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cryptocellus_goodnighti.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cryptocellus_goodnighti.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#76513c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ricinulei_from_Fernandez_%26_Giribet%2C_nymph_of_Ricinoides_atewa_%282015%29_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Ricinulei_from_Fernandez_%26_Giribet%2C_nymph_of_Ricinoides_atewa_%282015%29_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"743\" height=\"526\" style=\"background-color:#b98f74\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ricinulei_from_Fernandez_%26_Giribet%2C_male_Ricinoides_karschii_from_Campo_Reserve%2C_Cameroon_%282015%29_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Ricinulei_from_Fernandez_%26_Giribet%2C_male_Ricinoides_karschii_from_Campo_Reserve%2C_Cameroon_%282015%29_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"502\" height=\"272\" style=\"background-color:#6d713f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ricinulei_from_Fernandez_%26_Giribet%2C_male_Pseudocellus_pearsei_from_Grutas_Tzabnah%2C_Yucatán%2C_Mexico_%282015%29_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Ricinulei_from_Fernandez_%26_Giribet%2C_male_Pseudocellus_pearsei_from_Grutas_Tzabnah%2C_Yucatán%2C_Mexico_%282015%29_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"507\" height=\"470\" style=\"background-color:#7a6152\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_solifugae\" class=\"tree_box\"><span><span>Solifugae</span><a href=\"https://en.wikipedia.org/wiki/Solifugae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Solifugae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Solifugae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Solifugae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(solifuges, sun spiders, camel spiders, wind scorpions)</span><p class=\"tag\">Most species live in dry climates and are carnivores that feed opportunistically on ground-dwelling arthropods and other small animals. They hunt their prey using three main hunting-strategies: Stalking, chasing, and ambushing. They lack both spinnerets and silk. The chelicerae serve as jaws, and in many species also are used for stridulation. They have a pair of large central eyes. The smaller males often have longer legs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Sunspider.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sunspider.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#433935\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Solpugidae_showing_eyes_with_presumably_protective_bristles_2012_01_24_1019s.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Solpugidae_showing_eyes_with_presumably_protective_bristles_2012_01_24_1019s.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#d18a66\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Solfugid_in_veld_near_Uniondale_%28Western_Cape%29_1600.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Solfugid_in_veld_near_Uniondale_%28Western_Cape%29_1600.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"235\" style=\"background-color:#76695a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gluvia4.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gluvia4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"372\" style=\"background-color:#a6a7a7\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_parasitiformes\" class=\"tree_box\"><span><span>Parasitiformes</span><a href=\"https://en.wikipedia.org/wiki/Parasitiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Parasitiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Parasitiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Parasitiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><span class=\"common_names\">(mites, red mites, ticks)</span><p class=\"tag\">The less diverse of the two superorders of mites. Many species are parasitic. About half of the species are predatory and cryptozoan, living in soil-litter, rotting wood, dung, carrion, nests or house dust. A few species have switched to grazing on fungi or ingesting spores or pollen.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Opilioacarus_baeticus_2_%28cropped%29.png\" target=\"_blank\"><img src=\"thumbnails/Opilioacarus_baeticus_2_%28cropped%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"586\" height=\"407\" style=\"background-color:#adb5c4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Varroa_destructor%2C_1_2019-09-06-19.12.07_ZS_PMax_UDR_%2848697155713%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Varroa_destructor%2C_1_2019-09-06-19.12.07_ZS_PMax_UDR_%2848697155713%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"297\" style=\"background-color:#361b0e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dermanyssus_cfr_gallinae_%285021757436%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dermanyssus_cfr_gallinae_%285021757436%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#312a28\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sternothyrus_braueri_62962027_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sternothyrus_braueri_62962027_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#ccbaad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ixodus_ricinus_5x.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ixodus_ricinus_5x.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"225\" style=\"background-color:#786b56\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tick_in_amber_carrying_spirochetes.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tick_in_amber_carrying_spirochetes.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"262\" style=\"background-color:#d4a644\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amblyomma_americanum_tick.jpg\" target=\"_blank\"><img src=\"thumbnails/Amblyomma_americanum_tick.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"575\" height=\"546\" style=\"background-color:#45563a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Argas_spec_columbidae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Argas_spec_columbidae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#a58b7a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Klopa_med_parjenjem-fotoBlazVerbic.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Klopa_med_parjenjem-fotoBlazVerbic.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"326\" style=\"background-color:#dad3ce\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ixodes_hexagonus_%28aka%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ixodes_hexagonus_%28aka%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"298\" style=\"background-color:#d2c4bf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nuttalliella_namaqua_cropped.png\" target=\"_blank\"><img src=\"thumbnails/250px-Nuttalliella_namaqua_cropped.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"259\" style=\"background-color:#999884\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_pseudoscorpiones\" class=\"tree_box\"><span><span>Pseudoscorpiones</span><a href=\"https://en.wikipedia.org/wiki/Pseudoscorpiones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pseudoscorpiones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pseudoscorpiones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pseudoscorpiones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(false scorpions, book scorpions)</span><p class=\"tag\">They are small arachnids with a flat, pear-shaped body, and pincer-like pedipalps that resemble those of scorpions. They usually range from 2 to 8 mm in length. They have eight legs with five to seven segments each. They spin silk from a gland in their jaws to make disk-shaped cocoons for mating, molting, or waiting out cold weather. Some species are arboreal, while others are phagophiles, eating parasites in an example of cleaning symbiosis.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Neobisium_sylvaticum_03.jpg\" target=\"_blank\"><img src=\"thumbnails/Neobisium_sylvaticum_03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"505\" style=\"background-color:#dcd4d2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ar_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ar_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"252\" style=\"background-color:#c0ab9b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_scorpiones\" class=\"tree_box\"><span><span>Scorpiones</span><a href=\"https://en.wikipedia.org/wiki/Scorpiones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Scorpiones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Scorpiones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Scorpiones\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(scorpions)</span><p class=\"tag\">They are predatory arachnids with eight legs, a pair of grasping pincers and a narrow, segmented tail, often carried in a characteristic forward curve over the back and always ending with a stinger. They primarily prey on insects and other invertebrates, but some species hunt vertebrates. They use their pincers to restrain and kill prey, or to prevent their own predation.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Scorpion_Photograph_By_Shantanu_Kuveskar.jpg\" target=\"_blank\"><img src=\"thumbnails/Scorpion_Photograph_By_Shantanu_Kuveskar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"457\" style=\"background-color:#88806e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Odonturus_dentatus.png\" target=\"_blank\"><img src=\"thumbnails/Odonturus_dentatus.png\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#af9282\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cercophonius_squama.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cercophonius_squama.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"268\" style=\"background-color:#ece8e6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Paravaejovis_spinigerus_002.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Paravaejovis_spinigerus_002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#816048\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scorpionwithyoung.JPG\" target=\"_blank\"><img src=\"thumbnails/Scorpionwithyoung.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"722\" height=\"520\" style=\"background-color:#827b79\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Arachnida_Tetrapulmonata\"><label class=\"tree_label\" for=\"Arachnida_Tetrapulmonata\"></label><div class=\"outer_tree_box\"><div id=\"arachnida_tetrapulmonata\" class=\"tree_box\"><span><span>Tetrapulmonata</span><a href=\"https://en.wikipedia.org/wiki/Tetrapulmonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tetrapulmonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tetrapulmonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tetrapulmonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">They have a set of paired book lungs occupying the second and third opisthosomal segments; a large postcerebral pharynx; prosomal endosternite with four segmental components; and a complex coxotrochanteral joint in the walking legs.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Tetrapulmonata_Araneae\"><label class=\"tree_label\" for=\"Tetrapulmonata_Araneae\"></label><div class=\"outer_tree_box\"><div id=\"arachnida_araneae\" class=\"tree_box\"><span><span>Araneae</span><a href=\"https://en.wikipedia.org/wiki/Araneae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Araneae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Araneae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Araneae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">They are air-breathing arthropods that have eight limbs, chelicerae with fangs generally able to inject venom, and spinnerets that extrude silk. The eye count can vary from 8, 6, 4, 2 and 0. The usual body segments found in arthropods are fused into two tagmata, the cephalothorax (prosoma) and the opisthosoma (abdomen) that is joined by a small, cylindrical pedicel.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Aptostichus_simus_Monterey_County.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Aptostichus_simus_Monterey_County.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"86\" style=\"background-color:#dfdad5\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_mygalomorphae\" class=\"tree_box\"><span><span>Mygalomorphae</span><a href=\"https://en.wikipedia.org/wiki/Mygalomorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mygalomorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mygalomorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mygalomorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraorder</span></span><span class=\"common_names\">(tarantulas, Australian funnel web spiders, mouse spiders, trapdoor spiders)</span><p class=\"tag\">They have chelicerae (fangs) that point straight down, parallel to the long axis of the spider&#x27;s body, and only have one orientation they can employ during prey capture. Many members are known as trapdoor spiders. Many are well adapted to killing other large arthropods and will also sometimes kill small mammals, birds, and reptiles.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Brachypelma_vagans_p1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Brachypelma_vagans_p1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"235\" style=\"background-color:#d7d7d6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lasiodora_parahybana_2009_G03.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lasiodora_parahybana_2009_G03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a98e69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mojave_Tarantula.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mojave_Tarantula.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a08b79\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lasiodora_parahybana%2C_claws.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Lasiodora_parahybana%2C_claws.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7f7d79\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tarantula%2C_Attacking_Position%2C_Photo_by_Sascha_Grabow.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tarantula%2C_Attacking_Position%2C_Photo_by_Sascha_Grabow.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#b2b2ab\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cyclosternum_fasciatum%2C_eye_region.jpg\" target=\"_blank\"><img src=\"thumbnails/Cyclosternum_fasciatum%2C_eye_region.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"720\" height=\"537\" style=\"background-color:#4a3e37\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Atrax_robustus.jpg\" target=\"_blank\"><img src=\"thumbnails/Atrax_robustus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"504\" height=\"434\" style=\"background-color:#928e81\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Male_Missulena_occatoria_spider_-_cropped.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Male_Missulena_occatoria_spider_-_cropped.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"256\" style=\"background-color:#776e69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mouse_spider02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mouse_spider02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#c5c4c5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Male_Mouse_Spider.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Male_Mouse_Spider.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"262\" style=\"background-color:#b3b2ae\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trittame_loki_471756472.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Trittame_loki_471756472.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#8d806d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Idiops_castaneus_298356289_537412358.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Idiops_castaneus_298356289_537412358.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#89614e\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Araneae_Araneomorphae\"><label class=\"tree_label\" for=\"Araneae_Araneomorphae\"></label><div class=\"outer_tree_box\"><div id=\"arachnida_araneomorphae\" class=\"tree_box\"><span><span>Araneomorphae</span><a href=\"https://en.wikipedia.org/wiki/Araneomorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Araneomorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Araneomorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Araneomorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraorder</span></span><p class=\"tag\">They have chelicerae (fangs) that point diagonally forward and cross in a pinching action.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_synspermiata\" class=\"tree_box\"><span><span>Synspermiata</span><a href=\"https://en.wikipedia.org/wiki/Synspermiata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Synspermiata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Synspermiata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Synspermiata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(coneweb spiders, false violin spiders, woodlouse hunters, sowbug-eating spiders, cell spiders, goblin spiders, cellar spiders, daddy long-legs spiders, carpenter spiders, vibrating spiders, gyrating spiders, long daddies, angel spiders, plectreurid spiders, tube-dwelling spiders, recluse spiders, violin spiders, brown recluse spiders, sand spiders, assassin spiders, long-legged cave spiders, armored spiders)</span><p class=\"tag\">United by having simpler genitalia than other araneomorph spiders, lacking a cribellum, and sharing an evolutionary history of synspermia – a particular way in which spermatozoa are grouped together when transferred to the female. There is unusual in the degree to which the eye number varies being either 8, 6, 4, or 2. Some species exhibit presocial behaviour, in which mature spiders live together and assist the young with food.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Orthonops_lapanus_535351835.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Orthonops_lapanus_535351835.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5d4a43\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diguetia_canities.jpg\" target=\"_blank\"><img src=\"thumbnails/Diguetia_canities.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"432\" height=\"324\" style=\"background-color:#5c6150\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Drymusa.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Drymusa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"268\" style=\"background-color:#cfccc1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Izithunzi_capense_171403079.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Izithunzi_capense_171403079.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6a605b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dysdera_crocata_458284237.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dysdera_crocata_458284237.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#f8eeec\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dysdera_fg03.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dysdera_fg03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"325\" style=\"background-color:#714738\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tapinesthis_inermis_female_D.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tapinesthis_inermis_female_D.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"309\" style=\"background-color:#ac9c8d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Azanialobus_lawrencei_307210059_554091822.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Azanialobus_lawrencei_307210059_554091822.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"260\" style=\"background-color:#a4684c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Periegops_suterii_311469976.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Periegops_suterii_311469976.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#5e534d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cellar_Spider_preying_upon_house_spider.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cellar_Spider_preying_upon_house_spider.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#aaa29c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Female_Crossopriza_lyoni_-_Mindanao%2C_Philippines_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Female_Crossopriza_lyoni_-_Mindanao%2C_Philippines_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"262\" style=\"background-color:#a38d63\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Physocyclus.globosus.female.2.-.tanikawa.jpg\" target=\"_blank\"><img src=\"thumbnails/Physocyclus.globosus.female.2.-.tanikawa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"368\" height=\"266\" style=\"background-color:#d1c4c8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Micropholcus_fauroti.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Micropholcus_fauroti.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#e6e1e7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Modisimus_texanus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Modisimus_texanus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#666050\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Male_plectreurid_%28Marshal_Hedin%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Male_plectreurid_%28Marshal_Hedin%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"426\" style=\"background-color:#9a8879\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scytodes_thoracica_%28aka%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scytodes_thoracica_%28aka%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"263\" style=\"background-color:#e8e5e2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scytodes.fusca.female.-.tanikawa.jpg\" target=\"_blank\"><img src=\"thumbnails/Scytodes.fusca.female.-.tanikawa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"344\" height=\"267\" style=\"background-color:#9b877c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scytodes_glabula_3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scytodes_glabula_3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"275\" style=\"background-color:#a28a73\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Araña_Mandaio.07-0-2006.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Araña_Mandaio.07-0-2006.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"373\" style=\"background-color:#a29786\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Segestria_bavarica_male.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Segestria_bavarica_male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#e6e3e1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brown_recluse_spider%2C_Loxosceles_reclusa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Brown_recluse_spider%2C_Loxosceles_reclusa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#b0bea5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hexophthalma_hahni_305451503_550742892.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hexophthalma_hahni_305451503_550742892.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#ce9d6e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hexophthalma_hahni_305451503_550744608.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hexophthalma_hahni_305451503_550744608.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#b1743f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Unidentified_Sicarius%2C_female.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Unidentified_Sicarius%2C_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"305\" style=\"background-color:#c9b08d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Telema_tenella.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Telema_tenella.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#a2997e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ablemma_contrita_female_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ablemma_contrita_female_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"424\" style=\"background-color:#d79e68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trogloraptor_marchingtoni_%28Female%29%3B_captive_specimen.jpg\" target=\"_blank\"><img src=\"thumbnails/Trogloraptor_marchingtoni_%28Female%29%3B_captive_specimen.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"691\" height=\"484\" style=\"background-color:#99725f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_palpimanoidea\" class=\"tree_box\"><span><span>Palpimanoidea</span><a href=\"https://en.wikipedia.org/wiki/Palpimanoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Palpimanoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Palpimanoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Palpimanoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><span class=\"common_names\">(assassin spiders, palp-footed spiders)</span><p class=\"tag\">Many specialize in preying on other spiders. They often have enlarged front legs, which enable them to both seize and manipulate prey. Their heads are raised up on a &quot;neck&quot; with long chelicerae (&quot;jaws&quot;).</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Huttonia_sp._male.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Huttonia_sp._male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"308\" style=\"background-color:#cabfba\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zearchaea_clypeata_female.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Zearchaea_clypeata_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#e8e4dd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diaphorocellus_biplagiatus_297526137_535836028.jpg\" target=\"_blank\"><img src=\"thumbnails/Diaphorocellus_biplagiatus_297526137_535836028.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"314\" height=\"199\" style=\"background-color:#7e513a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Austrarchaea_raveni_353492909.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Austrarchaea_raveni_353492909.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"283\" style=\"background-color:#6b633a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zephyrarchaea.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Zephyrarchaea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"301\" style=\"background-color:#8d816a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eriauchenius_pauliani_%2810.3897-zookeys.727.20222%29_Figure_18.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eriauchenius_pauliani_%2810.3897-zookeys.727.20222%29_Figure_18.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"281\" style=\"background-color:#dac7b9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Palpimanus_transvaalicus_308353429_556306020.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Palpimanus_transvaalicus_308353429_556306020.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"266\" style=\"background-color:#b77d59\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Palpimanus_paroculus_305448567_550738457.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Palpimanus_paroculus_305448567_550738457.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"207\" style=\"background-color:#8b745b\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Araneomorphae_Entelegynae\"><label class=\"tree_label\" for=\"Araneomorphae_Entelegynae\"></label><div class=\"outer_tree_box\"><div id=\"arachnida_entelegynae\" class=\"tree_box\"><span><span>Entelegynae</span><a href=\"https://en.wikipedia.org/wiki/Entelegynae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Entelegynae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Entelegynae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Entelegynae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Females have a genital plate and three external openings in the female&#x27;s body. Sperm is injected via one or other of the two separate copulatory openings and then enters the spermathecae. The other external opening is where the fertilized egg emerges. Males have complex palpal bulbs.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_araneoidea\" class=\"tree_box\"><span><span>Araneoidea</span><a href=\"https://en.wikipedia.org/wiki/Araneoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Araneoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Araneoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Araneoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><span class=\"common_names\">(araneoids, tangle-web spiders, cobweb spiders, comb-footed spiders, widow spiders, redback spiders, orb-weaver spiders, pirate spiders, ray spiders, sheet weavers, money spiders, triangular spiders)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Argiope_catenulata_at_Kadavoor.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Argiope_catenulata_at_Kadavoor.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7e864b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Orb_weaver_spiderlings.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Orb_weaver_spiderlings.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#615c3a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Araneus_apricus_29825863.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Araneus_apricus_29825863.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#1d1b0f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Arrow-shaped_Micrathena_-_Micrathena_sagittata%2C_Julie_Metz_Wetlands%2C_Woodbridge%2C_Virginia_-_8004905359.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Arrow-shaped_Micrathena_-_Micrathena_sagittata%2C_Julie_Metz_Wetlands%2C_Woodbridge%2C_Virginia_-_8004905359.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"373\" style=\"background-color:#79861a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Argiope_sp.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Argiope_sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7a6752\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eriophora_sp_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eriophora_sp_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"240\" style=\"background-color:#8b8339\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dippenaaria_luxurians_dorsal_view.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dippenaaria_luxurians_dorsal_view.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#7c8a39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Conoculus.lyugadinus.female.-.tanikawa.jpg\" target=\"_blank\"><img src=\"thumbnails/Conoculus.lyugadinus.female.-.tanikawa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"369\" height=\"267\" style=\"background-color:#5d5e4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Arkys_cornutus_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Arkys_cornutus_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#759156\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Arkys.sp.new.guinea.-.tanikawa.jpg\" target=\"_blank\"><img src=\"thumbnails/Arkys.sp.new.guinea.-.tanikawa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"482\" style=\"background-color:#516439\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Matilda_australia_450296949.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Matilda_australia_450296949.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#a7a49e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Drapetisca_alteranda.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Drapetisca_alteranda.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"298\" style=\"background-color:#866545\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ero_aphana_female_side.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ero_aphana_female_side.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"365\" style=\"background-color:#b38c6d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mimetus.ryukyus.female.-.takinawa.jpg\" target=\"_blank\"><img src=\"thumbnails/Mimetus.ryukyus.female.-.takinawa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"358\" height=\"266\" style=\"background-color:#958883\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mysmena_80038039.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mysmena_80038039.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#eceae8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Male_Nesticus_sp._%28Marshal_Hedin%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Male_Nesticus_sp._%28Marshal_Hedin%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"639\" height=\"427\" style=\"background-color:#6a5847\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crassignatha_danaugirangensis_female%2C_dorsal_view.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Crassignatha_danaugirangensis_female%2C_dorsal_view.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"222\" style=\"background-color:#c5bfbd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cepheia_longiseta_359150569.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cepheia_longiseta_359150569.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a09c98\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Metellina_mengei_%28aka%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Metellina_mengei_%28aka%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#4f4c2c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Long-jawed_orb-weaver_spider_%28Tetragnatha_montana%29_female.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Long-jawed_orb-weaver_spider_%28Tetragnatha_montana%29_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#64772f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Redback_vers_Lizard.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Redback_vers_Lizard.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#847c68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Latrodectus_hasselti_-Sydney%2C_Australia-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Latrodectus_hasselti_-Sydney%2C_Australia-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#d4d0cc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%28MHNT%29_Enoplognatha_ovata_on_Daucus_carota.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-%28MHNT%29_Enoplognatha_ovata_on_Daucus_carota.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"395\" style=\"background-color:#5e564c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chrysso.pulcherrima.male.-.tanikawa.jpg\" target=\"_blank\"><img src=\"thumbnails/Chrysso.pulcherrima.male.-.tanikawa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"383\" height=\"255\" style=\"background-color:#88b47f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dipoena.martinae.female.-.tanikawa.jpg\" target=\"_blank\"><img src=\"thumbnails/Dipoena.martinae.female.-.tanikawa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"346\" height=\"267\" style=\"background-color:#486750\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black_Widow_Spider_07-04-20.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Black_Widow_Spider_07-04-20.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#826c59\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wendilgarda.sp.female.-.tanikawa.jpg\" target=\"_blank\"><img src=\"thumbnails/Wendilgarda.sp.female.-.tanikawa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"363\" height=\"267\" style=\"background-color:#577d64\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zookeys.753.20805.figure3_%28A%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Zookeys.753.20805.figure3_%28A%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"554\" height=\"551\" style=\"background-color:#a06d3f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_eresidae\" class=\"tree_box\"><span><span>Eresidae</span><a href=\"https://en.wikipedia.org/wiki/Eresidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eresidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eresidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Eresidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(velvet spiders, ladybird spiders)</span><p class=\"tag\">They can look quite smooth and velvety and usually live in silken tubes under objects, or underground, with some species building silken nests. They are almost entirely limited to the Old World, with the exception of one species known from Brazil.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Colonial_Spiders_%28Stegodyphus_dumicola%29_%286607372243%29%2C_crop1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Colonial_Spiders_%28Stegodyphus_dumicola%29_%286607372243%29%2C_crop1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"299\" style=\"background-color:#5d6b50\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eresus_fg03.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eresus_fg03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"268\" style=\"background-color:#dad4d4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dresserus_colsoni_302560865_545286026.jpg\" target=\"_blank\"><img src=\"thumbnails/Dresserus_colsoni_302560865_545286026.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"770\" height=\"549\" style=\"background-color:#795643\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gandanameno_purcelli_313759681_566637883.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gandanameno_purcelli_313759681_566637883.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#8b7054\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Loureedia_annulipes_male1.jpg\" target=\"_blank\"><img src=\"thumbnails/Loureedia_annulipes_male1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"352\" height=\"211\" style=\"background-color:#67615a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Adonea_eye_group.svg\" target=\"_blank\"><img src=\"thumbnails/330px-Adonea_eye_group.svg.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"274\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_titanoecidae\" class=\"tree_box\"><span><span>Titanoecidae</span><a href=\"https://en.wikipedia.org/wiki/Titanoecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Titanoecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Titanoecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Titanoecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">They are mostly dark-colored builders of &quot;woolly&quot; (cribellate) silk webs. Several species are found at relatively high altitudes in mountain ranges and may be very common in such habitats.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Goeldia_patellaris_1.jpg\" target=\"_blank\"><img src=\"thumbnails/Goeldia_patellaris_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"361\" style=\"background-color:#afaead\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nurscia_albomaculata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nurscia_albomaculata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#8c8172\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pandava.laminata.female.-.tanikawa.jpg\" target=\"_blank\"><img src=\"thumbnails/Pandava.laminata.female.-.tanikawa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"363\" height=\"267\" style=\"background-color:#73a577\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Titanoeca_americana_2.jpg\" target=\"_blank\"><img src=\"thumbnails/Titanoeca_americana_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#c2b8b1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Titanoeca_quadriguttata.jpg\" target=\"_blank\"><img src=\"thumbnails/Titanoeca_quadriguttata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"639\" height=\"474\" style=\"background-color:#9ca1ad\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Entelegynae_RTA clade\"><label class=\"tree_label\" for=\"Entelegynae_RTA clade\"></label><div class=\"outer_tree_box\"><div id=\"arachnida_rta clade\" class=\"tree_box\"><span><span>RTA clade</span><a href=\"https://en.wikipedia.org/wiki/RTA clade\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=RTA clade\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=RTA clade\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/RTA clade\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">They have a backward-facing projection on the tibia of the male pedipalp.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_zodariidae\" class=\"tree_box\"><span><span>Zodariidae</span><a href=\"https://en.wikipedia.org/wiki/Zodariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Zodariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Zodariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Zodariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(ant spiders)</span><p class=\"tag\">Most species are daytime hunters and live together with ants, mimicking their behavior and sometimes even their chemical traits.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Mallinella.fulvipes.female.-.tanikawa.jpg\" target=\"_blank\"><img src=\"thumbnails/Mallinella.fulvipes.female.-.tanikawa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"343\" height=\"267\" style=\"background-color:#7a685c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caesetius_-_Rudolph_Steenkamp_-_176367867.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Caesetius_-_Rudolph_Steenkamp_-_176367867.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"235\" style=\"background-color:#ba7447\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Psammorygma_aculeatum_336191094.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Psammorygma_aculeatum_336191094.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"306\" style=\"background-color:#91674c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mallinella.shimojanai.female.-.tanikawa.jpg\" target=\"_blank\"><img src=\"thumbnails/Mallinella.shimojanai.female.-.tanikawa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"343\" height=\"267\" style=\"background-color:#77614b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diores_russelli_308129210_555876139.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Diores_russelli_308129210_555876139.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"288\" style=\"background-color:#a7694b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_sparassidae\" class=\"tree_box\"><span><span>Sparassidae</span><a href=\"https://en.wikipedia.org/wiki/Sparassidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sparassidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sparassidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Sparassidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(huntsman spiders, giant crab spiders, wood spiders, rain spiders, lizard-eating spiders)</span><p class=\"tag\">Many species grow very large. Their legs bear fairly prominent spines. They tend to live under rocks, bark and similar shelters. They hunt and forage for food with a diet consisting primarily of insects and other invertebrates, and occasionally small skinks and geckos. They are able to travel extremely quickly.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Sparassidae_Palystes_castaneus_mature_female_9923s.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sparassidae_Palystes_castaneus_mature_female_9923s.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#dbd5ce\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Olios_argelasius_MHNT.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Olios_argelasius_MHNT.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"278\" style=\"background-color:#f7f3ee\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Huntsman-Spider-Delena-cancerides.jpg\" target=\"_blank\"><img src=\"thumbnails/Huntsman-Spider-Delena-cancerides.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"426\" style=\"background-color:#dfdcd9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Huntsman_spider_with_meal.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Huntsman_spider_with_meal.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#d3ccc8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Huntsman_Spider_feeding_Grasshopper.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Huntsman_Spider_feeding_Grasshopper.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"277\" style=\"background-color:#88492c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Huntsman_spider_on_log.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Huntsman_spider_on_log.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#846d58\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Huntsman_spider_%28Sparassidae_sp.%29_Ankasa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Huntsman_spider_%28Sparassidae_sp.%29_Ankasa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#645f5d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Huntsman_Spider_egg_sac_hatching_23_Jan_11.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Huntsman_Spider_egg_sac_hatching_23_Jan_11.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#828981\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_lycosidae\" class=\"tree_box\"><span><span>Lycosidae</span><a href=\"https://en.wikipedia.org/wiki/Lycosidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lycosidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lycosidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lycosidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(wolf spiders, wandering spiders, lynx spiders, nursery web spiders, flower crab spiders, ant mimicking crab spiders)</span><p class=\"tag\">Traditionally defined as having a &quot;grate-shaped&quot; reflective layer at the back of the eye but phylogenetic studies shuffle these species somewhat.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Wandering_spider.jpg\" target=\"_blank\"><img src=\"thumbnails/Wandering_spider.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"422\" style=\"background-color:#a08d71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ctenus_caligineus_302557374_545280326.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ctenus_caligineus_302557374_545280326.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"248\" style=\"background-color:#69422c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wolf_spider_tunnel.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wolf_spider_tunnel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"307\" style=\"background-color:#7e6e65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wolf_eyes_for_guide.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wolf_eyes_for_guide.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"199\" style=\"background-color:#614536\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oxyopes_salticus_Kaldari_02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Oxyopes_salticus_Kaldari_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#859c85\"></a><a href=\"https://commons.wikimedia.org/wiki/File:LynxSpider_Hunt_macrogiants_E.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-LynxSpider_Hunt_macrogiants_E.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"312\" style=\"background-color:#968049\"></a><a href=\"https://commons.wikimedia.org/wiki/File:LynxSpider_Hunt_macrogiants_F.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-LynxSpider_Hunt_macrogiants_F.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"355\" style=\"background-color:#6f6a44\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Peucetia-formosensis-female.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Peucetia-formosensis-female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"334\" style=\"background-color:#60674c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nursery_web_spider_%28Nilus_albocinctus%29_female.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nursery_web_spider_%28Nilus_albocinctus%29_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#384d1b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nursery_web_spider_%28Pisaura_mirabilis%29_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nursery_web_spider_%28Pisaura_mirabilis%29_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#59672f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bytom_Pisaura_mirabilis_female_tent.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bytom_Pisaura_mirabilis_female_tent.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#495020\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dolomedes_fimbriatus_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dolomedes_fimbriatus_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"243\" style=\"background-color:#b2ad9d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Afropisaura_ducis_-_Jonathan_Whitaker_-_168768862.jpeg\" target=\"_blank\"><img src=\"thumbnails/250px-Afropisaura_ducis_-_Jonathan_Whitaker_-_168768862.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#bd8d87\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hygropoda_tangana_165771712.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hygropoda_tangana_165771712.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"313\" style=\"background-color:#5f8735\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fecenia_cylindrata.png\" target=\"_blank\"><img src=\"thumbnails/330px-Fecenia_cylindrata.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"132\" style=\"background-color:#d5d2d0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fecenia_protensa.png\" target=\"_blank\"><img src=\"thumbnails/Fecenia_protensa.png\" class=\"taxa-img\" loading=\"lazy\" width=\"780\" height=\"475\" style=\"background-color:#d8d5d2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crab_Spider_6299.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Crab_Spider_6299.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5b5a30\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Food_chain_2023.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Food_chain_2023.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#a9b947\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Camaricus_sp.jpg\" target=\"_blank\"><img src=\"thumbnails/Camaricus_sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"400\" style=\"background-color:#91724d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Misumena_vatia_female_Luc_Viatour_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Misumena_vatia_female_Luc_Viatour_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#807965\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phyrnarachne_sp.jpg\" target=\"_blank\"><img src=\"thumbnails/Phyrnarachne_sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"400\" style=\"background-color:#7f8f4e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amyciaea_sp..jpg\" target=\"_blank\"><img src=\"thumbnails/Amyciaea_sp..jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"400\" style=\"background-color:#94734e\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"RTA clade_Dionycha\"><label class=\"tree_label\" for=\"RTA clade_Dionycha\"></label><div class=\"outer_tree_box\"><div id=\"arachnida_dionycha\" class=\"tree_box\"><span><span>Dionycha</span><a href=\"https://en.wikipedia.org/wiki/Dionycha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dionycha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dionycha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Dionycha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Characterized by the possession of two tarsal claws with tufts of hairs (setae) beside them, which produce strong adhesion, enabling some species to climb glass.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_clubionidae\" class=\"tree_box\"><span><span>Clubionidae</span><a href=\"https://en.wikipedia.org/wiki/Clubionidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Clubionidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Clubionidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Clubionidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(sac spiders)</span><p class=\"tag\">They are nocturnal, sac-building hunting spiders with a near-worldwide distribution.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Clubiona_trivialis2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Clubiona_trivialis2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5f7240\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clubiona_durbana_315168323_569327015.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Clubiona_durbana_315168323_569327015.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"258\" style=\"background-color:#5bc76c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Elaver_excepta_297602220.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Elaver_excepta_297602220.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#d2ba97\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Porrhoclubiona_leucaspis.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Porrhoclubiona_leucaspis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#beb8b3\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_gnaphosidae\" class=\"tree_box\"><span><span>Gnaphosidae</span><a href=\"https://en.wikipedia.org/wiki/Gnaphosidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gnaphosidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gnaphosidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gnaphosidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(ground spiders)</span><p class=\"tag\">Generally characterized by having barrel-shaped anterior spinnerets that are one spinneret diameter apart. The main exception are some ant-mimicking species. All species lack a prey-capture web and generally run prey down on the surface. They entangle their prey in swathing attacks, often applying their webbing to their prey&#x27;s legs and mouths. They hunt at night and spend the day in a silken retreat.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Callilepis_nocturna.jpg\" target=\"_blank\"><img src=\"thumbnails/Callilepis_nocturna.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#d8d6d4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ammoxenus_amphalodes_301149800_542654034.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ammoxenus_amphalodes_301149800_542654034.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"200\" style=\"background-color:#ae7352\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ammoxenus_amphalodes_301149489_542653466.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ammoxenus_amphalodes_301149489_542653466.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"210\" style=\"background-color:#b4927a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Asemesthes_flavipes_297522781_535830530.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Asemesthes_flavipes_297522781_535830530.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"284\" style=\"background-color:#915a3e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_corinnidae\" class=\"tree_box\"><span><span>Corinnidae</span><a href=\"https://en.wikipedia.org/wiki/Corinnidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Corinnidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Corinnidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Corinnidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(corinnid sac spiders)</span><p class=\"tag\">Phylogenetic studies have made the group stricter but the group was known for having eight eyes arranged in two rows, conical anterior spinnerets that touch and for being wandering predators that build silken retreats, or sacs, usually on plant terminals, between leaves, under bark or under rocks. Some species mimic ants and velvet ants.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Copa_flavoplumosa_male_-_ZooKeys-276-001-g001-3.jpeg\" target=\"_blank\"><img src=\"thumbnails/Copa_flavoplumosa_male_-_ZooKeys-276-001-g001-3.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"703\" height=\"515\" style=\"background-color:#948f8d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Graptartia_granulosa_438844712.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Graptartia_granulosa_438844712.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6d707d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pronophaea_natalica_-_Sunčana_Bradley_-_353831943.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Pronophaea_natalica_-_Sunčana_Bradley_-_353831943.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"263\" style=\"background-color:#544332\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coenoptychus_mutillicus_177260866.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Coenoptychus_mutillicus_177260866.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#b0ad13\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ant-mimic_Spider_-_Castianeira_longipalpa%2C_SERC%2C_Edgewater%2C_Maryland.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ant-mimic_Spider_-_Castianeira_longipalpa%2C_SERC%2C_Edgewater%2C_Maryland.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#42571e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Castianeira_longipalpa%2C_Woodbridge%2C_Virginia.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Castianeira_longipalpa%2C_Woodbridge%2C_Virginia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#dfdbd8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Battalus_wallum_176745825.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Battalus_wallum_176745825.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#b5b586\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Merenius_alberti_299747383_540037796.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Merenius_alberti_299747383_540037796.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#ac7556\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nyssus_coloripes_74386182.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nyssus_coloripes_74386182.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#a4a2a1\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_philodromidae\" class=\"tree_box\"><span><span>Philodromidae</span><a href=\"https://en.wikipedia.org/wiki/Philodromidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Philodromidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Philodromidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Philodromidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(philodromid crab spiders, running crab spiders)</span><p class=\"tag\">They have a crab-like shape due to the first two pairs of legs being oriented sideways (laterigrade) but are not closely related to garden crab spiders (Thomisidae). They have scopula only at the tips of the tarsi and their eyes are in two curved rows with the posterior row wider than the anterior row. They are active ambush predators and are often found on the stems and leaves of plants.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ebo_pepinensis%2C_female_%28F_Philodromidae%29_%284131858085%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ebo_pepinensis%2C_female_%28F_Philodromidae%29_%284131858085%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"212\" style=\"background-color:#ab9a8d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gephyrota_glauca_2024_06_30_15_49_46_iN_227105452.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gephyrota_glauca_2024_06_30_15_49_46_iN_227105452.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"274\" style=\"background-color:#898b49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hirriusa_bidentata_298372205_537443454.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hirriusa_bidentata_298372205_537443454.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#926c50\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Paracleocnemis%2C_Puerto_Madero%2C_CABA%2C_Argentina_imported_from_iNaturalist_photo_91152209.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Paracleocnemis%2C_Puerto_Madero%2C_CABA%2C_Argentina_imported_from_iNaturalist_photo_91152209.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#515e2c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Petrichus_sp.jpg\" target=\"_blank\"><img src=\"thumbnails/Petrichus_sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"680\" height=\"511\" style=\"background-color:#bea3a0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Metallic_Crab_Spider_-_Philodromus_marxi%2C_Leesylvania_State_Park%2C_Woodbridge%2C_Virginia.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Metallic_Crab_Spider_-_Philodromus_marxi%2C_Leesylvania_State_Park%2C_Woodbridge%2C_Virginia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"368\" style=\"background-color:#ad6d36\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Philodromus.aureolus.male.6.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Philodromus.aureolus.male.6.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#f4f0ef\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Philodromidae_-_Philodromus_sp..jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Philodromidae_-_Philodromus_sp..jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8f8c65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Philodromidae_-_Tibellus_sp..JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Philodromidae_-_Tibellus_sp..JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4f7511\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Philodromid-crab-spider-frontal-mze.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Philodromid-crab-spider-frontal-mze.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#605941\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Running_crab_spider_%28Philodromidae%29_on_Norfolk_Island_pine_leaf_%28Araucaria_heterophylla%2C_Jardim_da_Praça_de_Londres%2C_Lisbon%2C_Portugal_julesvernex2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Running_crab_spider_%28Philodromidae%29_on_Norfolk_Island_pine_leaf_%28Araucaria_heterophylla%2C_Jardim_da_Praça_de_Londres%2C_Lisbon%2C_Portugal_julesvernex2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"260\" style=\"background-color:#434c25\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_salticidae\" class=\"tree_box\"><span><span>Salticidae</span><a href=\"https://en.wikipedia.org/wiki/Salticidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Salticidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Salticidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Salticidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(jumping spiders)</span><p class=\"tag\">They have some of the best vision among arthropods and are capable of stereoptic color vision. Most species are capable of very agile jumps. Both their book lungs and tracheal system are well-developed, and they use both systems (bimodal breathing). All species have four pairs of eyes, with the anterior median pair (the two front middle eyes) being particularly large.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:PlatycryptusUndatusFemale.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-PlatycryptusUndatusFemale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#dad3ce\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jumping_spider_vision_David_Hill.svg\" target=\"_blank\"><img src=\"thumbnails/250px-Jumping_spider_vision_David_Hill.svg.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"243\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Telamonia_dimidiata_female.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Telamonia_dimidiata_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#8b8260\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phidippus_audax_male.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phidippus_audax_male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"252\" style=\"background-color:#677354\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Unidentified_Salticid_Jumping_with_Trailing_Dragline.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Unidentified_Salticid_Jumping_with_Trailing_Dragline.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#3b3b13\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saitis_barbipes_signaling.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saitis_barbipes_signaling.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#61782c\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_amblypygi\" class=\"tree_box\"><span><span>Amblypygi</span><a href=\"https://en.wikipedia.org/wiki/Amblypygi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Amblypygi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Amblypygi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Amblypygi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(whip-spiders, tailless whip-scorpions)</span><p class=\"tag\">They possess no silk glands or venom. They are found in tropical and subtropical regions worldwide, mainly in warm and humid environments. They like to stay protected and hidden within leaf litter, caves, or underneath bark. Some species are subterranean; all are nocturnal. They have eight legs, but use only six for walking, often in a crab-like, sideways fashion. The front pair of legs are modified for use as antennae-like feelers. They mostly eat arthropod prey, but sometimes feed on vertebrates. They grind and chew the prey prior to ingestion.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Heterophrynus_02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Heterophrynus_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"232\" style=\"background-color:#865d45\"></a><a href=\"https://commons.wikimedia.org/wiki/File:AmblypygiDorsal.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-AmblypygiDorsal.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"227\" style=\"background-color:#73675e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Damon_diadema_female.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Damon_diadema_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#505057\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"arachnida_uropygi\" class=\"tree_box\"><span><span>Uropygi</span><a href=\"https://en.wikipedia.org/wiki/Uropygi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Uropygi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Uropygi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Uropygi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(whip scorpions, vinegaroons)</span><p class=\"tag\">They resemble true scorpions, with a whiplike tail, and when attacked can discharge an offensive, vinegar-smelling liquid. They use only six legs for walking, with the first two legs serving as antennae-like sensory organs. All species also have large scorpion-like pedipalps (pincers). They have one pair of median eyes at the front of the cephalothorax and up till five pairs of lateral eyes on each side of the head. They are carnivorous, nocturnal hunters feeding mostly on insects, millipedes, scorpions, and terrestrial isopods, but sometimes on worms and slugs. The prey is crushed between special teeth while eating.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Thelyphonidae_-_Hypoctonus_formosus.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Thelyphonidae_-_Hypoctonus_formosus.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#d7cfca\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Labochirus_tauricornis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Labochirus_tauricornis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#7f7766\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vinegaroon_-_Whip_Spider_%28Mastigoproctus_baracoensis%29_%288576421119%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vinegaroon_-_Whip_Spider_%28Mastigoproctus_baracoensis%29_%288576421119%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#664527\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thelyphonellus_amazonicus_178761753.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Thelyphonellus_amazonicus_178761753.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6a3725\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Malaysian_Vinegaroon_%28Thelyphonus_sp.%29_%288723019285%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Malaysian_Vinegaroon_%28Thelyphonus_sp.%29_%288723019285%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"197\" style=\"background-color:#675446\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Typopeltis_crucifer_at_Fuxing%2C_Taoyuan_2022-06-12_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Typopeltis_crucifer_at_Fuxing%2C_Taoyuan_2022-06-12_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7a7958\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vinegaroon_-_Mastigoproctus_giganteus_with_Slate_Millipede.jpg\" target=\"_blank\"><img src=\"thumbnails/Vinegaroon_-_Mastigoproctus_giganteus_with_Slate_Millipede.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"504\" height=\"378\" style=\"background-color:#9b9994\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mastigoproctus_giganteus_0008_L.D.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mastigoproctus_giganteus_0008_L.D.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"227\" style=\"background-color:#947958\"></a></div></div></div></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_animalia_arthropoda_insecta",[{"name":"Archaeognatha","parent":"Insecta","rank":"Order","ipa":"","etymology":"","common":["jumping bristletails"],"tag":"Their abdomen ends in three long tail-like structures with a longer the medial filament. They have elongated bodies and backs that are arched. They easily dehydrate and must remain in moist air.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Rock_bristletail.JPG/330px-Rock_bristletail.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/Jumping_Bristletails_%2815567941692%29.jpg/330px-Jumping_Bristletails_%2815567941692%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1b/T%C3%AAte_de_Trigoniophthalmus_alternatus.jpg/330px-T%C3%AAte_de_Trigoniophthalmus_alternatus.jpg"],"card":1},{"name":"Zygentoma","parent":"Insecta","rank":"Order","ipa":"","etymology":"","common":["silverfish","firebrat"],"tag":"Their abdomen ends in three long tail-like structures of similar lengths. Their scales have a silvery glitter. They feed on organic detritus.","imgs":["https://upload.wikimedia.org/wikipedia/commons/c/c9/Atelura_formicaria_18180053.jpg","https://upload.wikimedia.org/wikipedia/commons/4/48/Thermobia_domestica1.jpg"],"card":1},{"name":"Pterygota","parent":"Insecta","rank":"Subclass","ipa":"ˌtɛrəˈɡoʊtə","etymology":"'winged'","common":[],"tag":"The winged insects. They have veined wings on their second and third thoracic segments. Some species are have lost their wings when they have become a disadvantage, like in parasites or cave dwellers. Flight in insects is believed to have evolved from a single common ancestor.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Ephemeroptera_2.jpg/330px-Ephemeroptera_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Bed_bug%2C_Cimex_lectularius.jpg/330px-Bed_bug%2C_Cimex_lectularius.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/American-cockroach.jpg/330px-American-cockroach.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Mantis_%28European%29.jpg/330px-Mantis_%28European%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d3/Miramella_alpina_male_%283788740982%29.jpg/330px-Miramella_alpina_male_%283788740982%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Fesoj_-_Papilio_machaon_%28by%29.jpg/250px-Fesoj_-_Papilio_machaon_%28by%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Red_Ant_-_March_2025.jpg/330px-Red_Ant_-_March_2025.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Aeshna_cyanea_female_1.jpg/330px-Aeshna_cyanea_female_1.jpg"],"card":1},{"name":"Ephemeroptera","parent":"Pterygota","rank":"Order","ipa":"","etymology":"","common":["mayflies"],"tag":"They have long tails and wings that do not fold flat over the abdomen. Their immature stages are aquatic fresh water nymphs that emerge as adults together in large swarms. Adults do not feed and have only vestigial mouthparts.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Rhithrogena_germanica_subimago_on_Equisetum_hyemale.jpg/250px-Rhithrogena_germanica_subimago_on_Equisetum_hyemale.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/Mayfly_nymph_dorsal_view_wing_buds_paired_gills.JPG/120px-Mayfly_nymph_dorsal_view_wing_buds_paired_gills.JPG","https://upload.wikimedia.org/wikipedia/commons/1/12/Shadfly01.jpg","https://upload.wikimedia.org/wikipedia/commons/d/dd/Eendagsvlieg_%28257301115%29.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/61/Spiny_crawler_mayfly%2C_Drunella_coloradensis_%289638196107%29.jpg/330px-Spiny_crawler_mayfly%2C_Drunella_coloradensis_%289638196107%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Ephemeroptera_2.jpg/330px-Ephemeroptera_2.jpg"],"card":2},{"name":"Odonata","parent":"Pterygota","rank":"Order","ipa":"","etymology":"","common":["dragonflies","damselfiles","darners","clubtails","skimmers"],"tag":"Predatory flying insects have aquatic larvae. The adults have two pairs of long, transparent wings that move independently, large compound eyes, short bristle-like antennae, and elongated abdomens. They are carnivorous and are almost entirely insectivorous. Damselflies have narrow wings as they join the thorax and dragonflies hind wings are wider near the base.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b9/Common_blue_damselfly02.jpg/250px-Common_blue_damselfly02.jpg","https://upload.wikimedia.org/wikipedia/commons/2/2d/Aeshna_juncea_hovering.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Beautiful_demoiselle_%28Calopteryx_virgo%29_male_3.jpg/330px-Beautiful_demoiselle_%28Calopteryx_virgo%29_male_3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bd/Ischnura_heterosticta02.jpg/330px-Ischnura_heterosticta02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Aeshna_cyanea_female_1.jpg/330px-Aeshna_cyanea_female_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Anotogaster_sieboldii_on_wall.jpg/330px-Anotogaster_sieboldii_on_wall.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/de/Lesser_Tasmanian_Darner_Austroaeschna_hardyi_female.jpg/330px-Lesser_Tasmanian_Darner_Austroaeschna_hardyi_female.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/Common_Clubtail_%28Ictinogomphus_rapax%29_W_IMG_0224.jpg/330px-Common_Clubtail_%28Ictinogomphus_rapax%29_W_IMG_0224.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Desert_Whitetail_-_Plathemis_subornata%2C_Bitter_Lakes_National_Wildlife_Refuge%2C_Roswell%2C_New_Mexico_-_7299714954.jpg/330px-Desert_Whitetail_-_Plathemis_subornata%2C_Bitter_Lakes_National_Wildlife_Refuge%2C_Roswell%2C_New_Mexico_-_7299714954.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Celithemis_eponina_%28Halloween_Pennant%29.jpg/250px-Celithemis_eponina_%28Halloween_Pennant%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/92/Darter_August_2007-20.jpg/330px-Darter_August_2007-20.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/99/Trithemis_annulata.jpg/330px-Trithemis_annulata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/91/Anisoptera_Ana_Cotta_3022296333.jpg/330px-Anisoptera_Ana_Cotta_3022296333.jpg"],"card":2},{"name":"Neoptera","parent":"Pterygota","rank":"Clade","ipa":"","etymology":"'new'-'wings'","common":[],"tag":"They have a wing-flexing mechanism that enables the wings to be folded back to rest on the surface of the abdomen. This has been lost in the butterflies.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/92/Body_lice.jpg/250px-Body_lice.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Bed_bug%2C_Cimex_lectularius.jpg/330px-Bed_bug%2C_Cimex_lectularius.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/09/Ovatus_sp._-_Guelph%2C_Ontario_2017-06-13_%2802%29.jpg/330px-Ovatus_sp._-_Guelph%2C_Ontario_2017-06-13_%2802%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/American-cockroach.jpg/330px-American-cockroach.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Mantis_%28European%29.jpg/330px-Mantis_%28European%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d3/Miramella_alpina_male_%283788740982%29.jpg/330px-Miramella_alpina_male_%283788740982%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Fesoj_-_Papilio_machaon_%28by%29.jpg/250px-Fesoj_-_Papilio_machaon_%28by%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Red_Ant_-_March_2025.jpg/330px-Red_Ant_-_March_2025.jpg"],"card":2},{"name":"Psocodea","parent":"Neoptera","rank":"Order","ipa":"","etymology":"'gnawing-order'","common":["bark lice","book lice","parasitic lice"],"tag":"Small, scavenging insects that feed primarily on fungi, algae, lichen, and organic detritus. Some are parasitic on warm-blooded hosts feeding on skin, debris or blood. Non-parasitic species have a neck-like constriction between head and thorax.","imgs":["https://upload.wikimedia.org/wikipedia/commons/f/f5/Psocoptera_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/67/Lipeurus_forficulatus_f.png/250px-Lipeurus_forficulatus_f.png","https://upload.wikimedia.org/wikipedia/commons/thumb/9/92/Body_lice.jpg/250px-Body_lice.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Abelopsocus_basipunctatus_live.jpg/330px-Abelopsocus_basipunctatus_live.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Green-eyed_Barklouse_-_Flickr_-_treegrow.jpg/330px-Green-eyed_Barklouse_-_Flickr_-_treegrow.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Liposcelis.jpg/250px-Liposcelis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Trogium_pulsatorium.jpg/250px-Trogium_pulsatorium.jpg"],"card":3},{"name":"Hemiptera","parent":"Neoptera","rank":"Order","ipa":"hɛˈmɪptərə","etymology":"greek 'different'-'wings'","common":["cicadas","aphids","stink bugs","bed bugs","assassin bugs","shield bugs","plant hoppers","leaf hoppers","moss bugs","bat bugs"],"tag":"The true bugs. Named because the the texture of the front wings is different near the base (leathery) than at the apex (membranous). Other distinguishing features are the way the front wings cross over to form “X”-pattern on back and the tubular proboscis (beak) used as piercing-sucking mouthparts. They range in size from 1 mm (0.04 in) to around 15 cm (6 in). They can be terrestrial, aquatic and semi-aquatic. Most feed on plant sap but some are bloodsucking, and others are predators.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/39/Neotibicen_linnei.jpg/330px-Neotibicen_linnei.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/Aphids_September_2008-1.jpg/250px-Aphids_September_2008-1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4c/Schizaphis_graminum_usda_%28cropped%29.jpg/250px-Schizaphis_graminum_usda_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ef/Flatid_leaf_bugs_and_nymphs_%28Phromnia_rosea%29.jpg/330px-Flatid_leaf_bugs_and_nymphs_%28Phromnia_rosea%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/88/Lantern_bug.jpg/330px-Lantern_bug.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Flickr_-_ggallice_-_Fulgorid.jpg/250px-Flickr_-_ggallice_-_Fulgorid.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Graphocephala_coccinea_6.jpg/330px-Graphocephala_coccinea_6.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/Gminatus_australis_dorsal_view.jpg/330px-Gminatus_australis_dorsal_view.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Bed_bug%2C_Cimex_lectularius.jpg/330px-Bed_bug%2C_Cimex_lectularius.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/69/Pentatomidae_spec.jpg/250px-Pentatomidae_spec.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/09/Ovatus_sp._-_Guelph%2C_Ontario_2017-06-13_%2802%29.jpg/330px-Ovatus_sp._-_Guelph%2C_Ontario_2017-06-13_%2802%29.jpg"],"card":3},{"name":"Thysanoptera","parent":"Neoptera","rank":"Order","ipa":"","etymology":"'fringe-wings'","common":["thrips"],"tag":"Slender insects, widest in middle, with wings fringed with long hairs and unique asymmetrical 'piercing-sucking' mouthparts mouthparts that are concealed within head capsule. They are usually less than 1 mm long. Many species are fungivorous and many are pollinators.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/74/Thrips_%28PSF%29_%28white_background%29.png/250px-Thrips_%28PSF%29_%28white_background%29.png","https://upload.wikimedia.org/wikipedia/commons/f/f5/Frankadult.jpg","https://upload.wikimedia.org/wikipedia/commons/8/8b/Phlaeothripidae_-_fungus_feeding_thrip.jpg","https://upload.wikimedia.org/wikipedia/commons/4/4f/Thrips_nymph.jpg"],"card":3},{"name":"Polyneoptera","parent":"Neoptera","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"They have chewing mouthparts and incomplete development so instead of a pupal stage they develop through a series of nymphal instars that gradually acquire adult features. Some adults are secondarily wingless but if not they have four wings and the front wings are usually thickened or leathery with the front and hind wings operating independently of one another.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d3/Miramella_alpina_male_%283788740982%29.jpg/330px-Miramella_alpina_male_%283788740982%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Phyllium_bilobatum%2C_male_larva.jpg/250px-Phyllium_bilobatum%2C_male_larva.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3c/Perlidae_P1400217a.jpg/330px-Perlidae_P1400217a.jpg","https://upload.wikimedia.org/wikipedia/commons/f/f7/Forficula.auricularia.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Zorotypus_from_Los_Bancos%2C_Pichincha%2C_Ecuador.jpg/330px-Zorotypus_from_Los_Bancos%2C_Pichincha%2C_Ecuador.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Mantis_%28European%29.jpg/330px-Mantis_%28European%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/American-cockroach.jpg/330px-American-cockroach.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fe/Grylloblatta_scudderi%2C_Squamish-Lillooet%2C_British_Columbia_2.jpg/330px-Grylloblatta_scudderi%2C_Squamish-Lillooet%2C_British_Columbia_2.jpg"],"card":3},{"name":"Orthoptera","parent":"Polyneoptera","rank":"Order","ipa":"","etymology":"greek 'straight'-'wing'","common":["grasshoppers","locusts","crickets"],"tag":"Grasshoppers, crickets, and allies. Named by having thickened front wings that are parallel-sided. Other distinguishing factors are hind legs modified for jumping; and antennae segments that are cylindrical and uniform in size. Many species have the ability to make and detect sounds.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d3/Miramella_alpina_male_%283788740982%29.jpg/330px-Miramella_alpina_male_%283788740982%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/09/Gryllomorpha_dalmatina01.jpg/330px-Gryllomorpha_dalmatina01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/25/Locusta-migratoria-wanderheuschrecke.jpg/330px-Locusta-migratoria-wanderheuschrecke.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Locusts_Saad.jpg/330px-Locusts_Saad.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/28/Pachyrhamma_waitomoensis_aggregation.jpg/330px-Pachyrhamma_waitomoensis_aggregation.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/75/Schizodactylus_monstrosus_Rajasthan.jpg/330px-Schizodactylus_monstrosus_Rajasthan.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/23/Jerusalemcricket.jpg/250px-Jerusalemcricket.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0e/Leaf_Grasshopper_%28Systella_sp.%29_%288742072742%29.jpg/330px-Leaf_Grasshopper_%28Systella_sp.%29_%288742072742%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e1/Eumastax_zumuniana.jpg/330px-Eumastax_zumuniana.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ac/Horsehead_Grasshopper_%28Pseudoproscopia_scabra%29%2C_Tambopata_Lodge.jpg/330px-Horsehead_Grasshopper_%28Pseudoproscopia_scabra%29%2C_Tambopata_Lodge.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/09/Grouse_Locust_%28Potua_sp.%29_%2823289516379%29.jpg/330px-Grouse_Locust_%28Potua_sp.%29_%2823289516379%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Gryllus_campestris_female_%284724690375%29.jpg/330px-Gryllus_campestris_female_%284724690375%29.jpg"],"card":4},{"name":"Phasmatodea","parent":"Polyneoptera","rank":"Order","ipa":"","etymology":"'phantom'-'order'","common":["stick instects"],"tag":"Nocturnal herbivors known for having either cylindrical stick-like shapes or flattened leaflike shapes and camouflage well and the first of their three segments in their thorax is being shorter. They have chewing mandibles, long and slender legs, and long and slender antennae. Wings are reduced when present and then the thorax is longer to accomodate the the flight muscles.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Ctenomorpha_chronus02.jpg/330px-Ctenomorpha_chronus02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Cryptophyllium_celebicum_2.jpg/330px-Cryptophyllium_celebicum_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Acanthomenexenus_polyacanthus_-_even_adult_male1.JPG/330px-Acanthomenexenus_polyacanthus_-_even_adult_male1.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c7/Stick_Insect_%28Parectatosoma_sp.%29%2C_Vohimana_reserve%2C_Madagascar_%2812264302936%29.jpg/330px-Stick_Insect_%28Parectatosoma_sp.%29%2C_Vohimana_reserve%2C_Madagascar_%2812264302936%29.jpg","https://upload.wikimedia.org/wikipedia/commons/d/de/Agathemera_maculafulgens_%288388995384%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Phyllium_bilobatum%2C_male_larva.jpg/250px-Phyllium_bilobatum%2C_male_larva.jpg","https://upload.wikimedia.org/wikipedia/commons/b/bb/Fl%C3%BCgel_Peruphasma_schultei.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d6/Haaniella_dehaanii-subadult_threaten_female.JPG/330px-Haaniella_dehaanii-subadult_threaten_female.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/56/Dares_ulula_P%C3%A4rchen.jpg/250px-Dares_ulula_P%C3%A4rchen.jpg"],"card":4},{"name":"Embioptera","parent":"Polyneoptera","rank":"Order","ipa":"","etymology":"'lively-wings'","common":["webspinners"],"tag":"They have long, flexible bodies and short legs with the lower segment of the front limbs enlarged and modified for silk production. They males do not feed and die soon after mating. Only the males have wings but not in all species. They live subsocially in galleries spun of silk. They are generalist herbivores.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/ba/Notoligotoma_nitens.jpg/330px-Notoligotoma_nitens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/af/Metoligotoma_tasmanica.jpg/330px-Metoligotoma_tasmanica.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c6/Diradius_vandykei.jpg"],"card":4},{"name":"Plecoptera","parent":"Polyneoptera","rank":"Order","ipa":"","etymology":"'braided'-'wings'","common":["stoneflies"],"tag":"Named for the braided ladder-like pattern their veins make across their wings. They have long antennae and cerci; and their wings fold flat and extend past tip of abdomen. The nymphs are aquatic; usually herbivorous with some being hunters;  and live in the floor of well-oxygenated lakes and streams. Some adults do not feed at all, but those that do are herbivorous.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/3c/Perlidae_P1400217a.jpg/330px-Perlidae_P1400217a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/75/Chloroperlidae.jpg/330px-Chloroperlidae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/27/Soliperla_sierra.jpg/330px-Soliperla_sierra.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Amphinemura.jpg/330px-Amphinemura.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a6/Small_Winter_Stonefly_-_Allocapnia_species%3F%2C_Riverbend_Park%2C_Great_Falls%2C_Virginia_-_13007749435.jpg/250px-Small_Winter_Stonefly_-_Allocapnia_species%3F%2C_Riverbend_Park%2C_Great_Falls%2C_Virginia_-_13007749435.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Plecoptera_-_exuvia.jpg/330px-Plecoptera_-_exuvia.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e1/Thaumatoperla_robusta.jpg/330px-Thaumatoperla_robusta.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/14/Stenoperla_prasina.jpg/330px-Stenoperla_prasina.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/SteinfliegenLarve2.JPG/330px-SteinfliegenLarve2.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4c/Eusthenia_sp.jpg/250px-Eusthenia_sp.jpg"],"card":4},{"name":"Dermaptera","parent":"Polyneoptera","rank":"Order","ipa":"","etymology":"'skin-wings'","common":["earwigs"],"tag":"They have a pair of forceps-like pincers on their abdomen, and membranous wings folded underneath short, rarely used forewings. Some groups are tiny parasites on mammals and lack the typical pincers. They are mostly scavengers or herbivores that are mostly nocturnal and oten hide during the day.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Forficula_auricularia.jpg/250px-Forficula_auricularia.jpg","https://upload.wikimedia.org/wikipedia/commons/f/f7/Forficula.auricularia.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/de/Nesting_Earwig_Chester_UK_2.jpg/330px-Nesting_Earwig_Chester_UK_2.jpg","https://upload.wikimedia.org/wikipedia/commons/3/36/Adiathetus_tenebrator_iruppu.jpg"],"card":4},{"name":"Zoraptera","parent":"Polyneoptera","rank":"Order","ipa":"","etymology":"","common":["angel insects"],"tag":"Small and soft bodied insects with two forms: winged with wings sheddable as in termites, dark and with eyes and ocelli; or wingless, pale and without eyes or ocelli. They have a characteristic nine-segmented beaded antenna. They have mouthparts adapted for chewing and are mostly found under bark, in dry wood or in leaf litter.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Zorotypus_from_Los_Bancos%2C_Pichincha%2C_Ecuador.jpg/330px-Zorotypus_from_Los_Bancos%2C_Pichincha%2C_Ecuador.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/Zorotypus.jpg/330px-Zorotypus.jpg"],"card":4},{"name":"Mantodea","parent":"Polyneoptera","rank":"Order","ipa":"","etymology":"","common":["mantises"],"tag":"They have triangular heads with bulging eyes supported on flexible necks, raptorial front legs for catching and gripping prey, an upright posture and elongated bodies. They are mostly ambush predators. Females sometimes practice sexual cannibalism.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Mantis_%28European%29.jpg/330px-Mantis_%28European%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ac/Wandering_Violin_Mantis_%28Gongylus_gongylodes%29_Photograph_By_Shantanu_Kuveskar.jpg/250px-Wandering_Violin_Mantis_%28Gongylus_gongylodes%29_Photograph_By_Shantanu_Kuveskar.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/Gottesanbeterin_Abwehr.JPG/330px-Gottesanbeterin_Abwehr.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Choeradodis_stalii_MHNT_dos.jpg/330px-Choeradodis_stalii_MHNT_dos.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Large_brown_mantid_close_up_nohair.jpg/330px-Large_brown_mantid_close_up_nohair.jpg"],"card":4},{"name":"Blattodea","parent":"Polyneoptera","rank":"Order","ipa":"","etymology":"","common":["cockroaches","termites"],"tag":"The cockroaches and termites. Cockroaches are flattened dorsolaterally and are roughly oval with a shield-like plate covering the thorax and posterior region of the head, long thread-like antennae, and two short, multi-segmented protrusions from the rear.","imgs":["https://upload.wikimedia.org/wikipedia/commons/7/7d/Termites_marked_with_traceable_protiens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/American-cockroach.jpg/330px-American-cockroach.jpg","https://upload.wikimedia.org/wikipedia/commons/9/91/Cryptocercus_clevelandi.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/Blatta_orientalis_male_from_Botevgrad%2C_Bulgaria_01.jpg/330px-Blatta_orientalis_male_from_Botevgrad%2C_Bulgaria_01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1e/Domino_cockroach_Therea_petiveriana.jpg/250px-Domino_cockroach_Therea_petiveriana.jpg"],"card":4},{"name":"Termitoidae","parent":"Blattodea","rank":"Epifamily","ipa":"","etymology":"'equal-wings'","common":["termites"],"tag":"Detritophagous eusocial cockroaches that consume a variety of decaying plant material. They have antennae that resemble a string of beads and a wide junction between thorax and abdomen. The worker caste is a soft-bodied, unpigmented, often blind and are diploid individuals of both sexes that develop from fertilised eggs. The soldier class have larger heads with prominent mandibles and are often blind. The winged males and females usually have eyes and will pair to create a new colony after a nuptial flight.","imgs":["https://upload.wikimedia.org/wikipedia/commons/7/7d/Termites_marked_with_traceable_protiens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/71/Isoptera.jpg/330px-Isoptera.jpg","https://upload.wikimedia.org/wikipedia/commons/e/e8/Flying_Termites_after_rain.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Termitenh%C3%BCgel_Namibia.jpg/330px-Termitenh%C3%BCgel_Namibia.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c3/K8085-21.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/Workers_%26_Soldiers.jpg/330px-Workers_%26_Soldiers.jpg"],"card":4},{"name":"Notoptera","parent":"Polyneoptera","rank":"Clade","ipa":"","etymology":"","common":["ice crawlers","gladiators"],"tag":"They have long antennae but no wings, even as adults. They have mandibles adapted for biting with the lower jaw longer than the upper jaw.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/Grylloblattidae_%28cropped%29.jpg/330px-Grylloblattidae_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Mantophasma_zephyra_Zompro_et_al_2002.jpg/330px-Mantophasma_zephyra_Zompro_et_al_2002.jpg"],"card":4},{"name":"Grylloblattodea","parent":"Notoptera","rank":"Order","ipa":"","etymology":"'cricket'-'cockroach'","common":["ice crawlers"],"tag":"They live in the cold on top of mountains and the edges of glaciers or in caves, have long cerci, their eyes are either missing or reduced, and most species are less than 3 cm long. Most are nocturnal and feed primarily on dead arthropods and carrion but can survive on plant material. Their optimal living temperature is usually between 1–4 °C and most will die with temperatures above 10 °C so they in colder temperatures they live under snow pack near the soil.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Galloisiana_kiyosawai.jpg/330px-Galloisiana_kiyosawai.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/Grylloblattidae_%28cropped%29.jpg/330px-Grylloblattidae_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fe/Grylloblatta_scudderi%2C_Squamish-Lillooet%2C_British_Columbia_2.jpg/330px-Grylloblatta_scudderi%2C_Squamish-Lillooet%2C_British_Columbia_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Endemic_Grylloblattid_%2810334180636%29.jpg/330px-Endemic_Grylloblattid_%2810334180636%29.jpg"],"card":5},{"name":"Mantophasmatodea","parent":"Notoptera","rank":"Order","ipa":"","etymology":"'mantid'-'stick-insect'","common":["gladiators"],"tag":"Nocturnal carnivores with short cerci that live in rock crevices. They are rate and only found in parts of southern Africa. During courtship, they communicate using vibrations transmitted through the ground or substrate","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Mantophasma_zephyra_Zompro_et_al_2002.jpg/330px-Mantophasma_zephyra_Zompro_et_al_2002.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c0/Karoophasma_biedouwensis_15669932.jpg/330px-Karoophasma_biedouwensis_15669932.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Kuboesphasma_compactum_%2810.3897-zookeys.746.14885%29_Figure_2.jpg/250px-Kuboesphasma_compactum_%2810.3897-zookeys.746.14885%29_Figure_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/86/Minutophasma_richtersveldense_%2810.3897-zookeys.746.14885%29_Figure_10.jpg/330px-Minutophasma_richtersveldense_%2810.3897-zookeys.746.14885%29_Figure_10.jpg"],"card":5},{"name":"Holometabola","parent":"Neoptera","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"They undergo complete metamorphosis and go through distinctive life stages: egg, larva, pupa, and adult. Larval traits maximize feeding, growth, and development. Adult traits enable dispersal, mating, and egg laying. The pupa is usually a quiescent, non-feeding developmental stage and most move very little, sometimes enclosed in other structures like cocoons, nests, or shells.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Fesoj_-_Papilio_machaon_%28by%29.jpg/250px-Fesoj_-_Papilio_machaon_%28by%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Apis_mellifera_Western_honey_bee.jpg/330px-Apis_mellifera_Western_honey_bee.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Red_Ant_-_March_2025.jpg/330px-Red_Ant_-_March_2025.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Coleoptera_collage.png/330px-Coleoptera_collage.png","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/A_pupa_of_Euploea_core_%28Cramer%2C_1780%29_-_Common_Crow_WLB.jpg/330px-A_pupa_of_Euploea_core_%28Cramer%2C_1780%29_-_Common_Crow_WLB.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2f/Dwarf_birch_spinner_%28Eriogaster_arbusculae%29_cocoon_Dovrefjell.jpg/330px-Dwarf_birch_spinner_%28Eriogaster_arbusculae%29_cocoon_Dovrefjell.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/Nacimiento_de_una_Dryas_iulia%2C_Mariposario_de_Icod_de_los_Vinos%2C_Tenerife%2C_Espa%C3%B1a%2C_2012-12-13%2C_DD_03.jpg/250px-Nacimiento_de_una_Dryas_iulia%2C_Mariposario_de_Icod_de_los_Vinos%2C_Tenerife%2C_Espa%C3%B1a%2C_2012-12-13%2C_DD_03.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/79/Ontwikkelstadia_wespenpoppen.jpg/120px-Ontwikkelstadia_wespenpoppen.jpg"],"card":3},{"name":"Neuroptera","parent":"Holometabola","rank":"Clade","ipa":"","etymology":"'nerve'-'wing'","common":["lacewings","mantidflies","antlions"],"tag":"The net-winged insects. Adults have two pairs of membranous wings with an extensive pattern of veins and crossveins that give them a lacy appearance. The larvae are specialised predators, with elongated mandibles adapted for piercing and sucking. Adults of many groups are also predatory, but some do not feed, or consume only nectar.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e0/Crisopid_July_2013-9a.jpg/330px-Crisopid_July_2013-9a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Mantispa_styriaca_%289566952168%29.jpg/330px-Mantispa_styriaca_%289566952168%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ac/Distoleon_tetragrammicus01.jpg/330px-Distoleon_tetragrammicus01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/86/Common_Antlion_Myrmeleon_immaculatus_mature_nymph.jpg/330px-Common_Antlion_Myrmeleon_immaculatus_mature_nymph.jpg","https://upload.wikimedia.org/wikipedia/commons/f/fd/Antlion_trap.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/Pleasing_Lacewing_Female_-_Flickr_-_treegrow_%282%29.jpg/250px-Pleasing_Lacewing_Female_-_Flickr_-_treegrow_%282%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Pseudomallada_edwardsi_AF_2.jpg/330px-Pseudomallada_edwardsi_AF_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Zeugomantispa_minuta_P1030119a.jpg/250px-Zeugomantispa_minuta_P1030119a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Brown_Lacewing_Larva_%2830941270143%29.jpg/330px-Brown_Lacewing_Larva_%2830941270143%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/14/Rapisma_tamilanum_India.jpg/330px-Rapisma_tamilanum_India.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Nemoptera_sp._MHNT.ZOO.2004.0.736.jpg/330px-Nemoptera_sp._MHNT.ZOO.2004.0.736.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Owlfly_%28Libelloides_macaronius%29_female_Istria.jpg/250px-Owlfly_%28Libelloides_macaronius%29_female_Istria.jpg"],"card":6},{"name":"Strepsiptera","parent":"Holometabola","rank":"Order","ipa":"","etymology":"'twisted-wing'","common":[],"tag":"The twisted-wing insects. They are endoparasites of other insects with a parasitic larval stage. In most species the female does not leave its host and remains larviform (legless and wingless), protruding between segments of the host's abdomen. The adult males hindwings are generally fan-shaped; their forewings are modified to be small and club-shaped; their mouthparts cannot be used for feeding; their eyes have a blackberry-like appearance; and their antennae are often branched.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/Stylops_melittae_m3.JPG/250px-Stylops_melittae_m3.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Stylops_melittae_f1.jpg/250px-Stylops_melittae_f1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/Xenos_peckii_head_closeup.png/330px-Xenos_peckii_head_closeup.png","https://upload.wikimedia.org/wikipedia/commons/thumb/7/72/Andrena_nivalis%2C_stylopid%2C_U%2C_Cocos_Co.%2C_NH%2C_back_2015-07-13-15.57.01_ZS_PMax_%28cropped2%29.jpg/250px-Andrena_nivalis%2C_stylopid%2C_U%2C_Cocos_Co.%2C_NH%2C_back_2015-07-13-15.57.01_ZS_PMax_%28cropped2%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/Strepsiptera.png/250px-Strepsiptera.png"],"card":6},{"name":"Megaloptera","parent":"Holometabola","rank":"Order","ipa":"","etymology":"'large-wing'","common":["alderflies","dobsonflies","fishflies"],"tag":"Adults have large, nearly equal sized wings with crossveins near leading edge and a pleated region on their hindwings to help them fold over the abdomen; their antennae are prominent; and they have strong mandibles apparently adapted for chewing but many species do not eat as adults. The larvae live in fresh water; have large heads and elongated bodies; possess strong jaws that they use to capture their prey; and are carnivorous feeding on small invertebrates.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/62/Corydalus_affinis%2C_Pacaraima_-_RR%2C_69345-000%2C_Brasil_imported_from_iNaturalist_photo_203073948.jpg/330px-Corydalus_affinis%2C_Pacaraima_-_RR%2C_69345-000%2C_Brasil_imported_from_iNaturalist_photo_203073948.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Protosialis_americana_PCCA20050708-9036A.jpg/330px-Protosialis_americana_PCCA20050708-9036A.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/06/Other_Wondrous_Things_Dark_Fishfly_%2847947964738%29.jpg/250px-Other_Wondrous_Things_Dark_Fishfly_%2847947964738%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/65/Taeniochauliodes.jpg/330px-Taeniochauliodes.jpg","https://upload.wikimedia.org/wikipedia/commons/1/16/Chloronia_osae.jpg","https://upload.wikimedia.org/wikipedia/commons/3/30/Platyneuromus_soror.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Sialis_lutaria_larva_%28aka%29.jpg/330px-Sialis_lutaria_larva_%28aka%29.jpg","https://upload.wikimedia.org/wikipedia/commons/3/35/Dobsonfly_Corydalus_cornutus_larvae.jpg"],"card":6},{"name":"Raphidioptera","parent":"Holometabola","rank":"Order","ipa":"","etymology":"'needle-wing'","common":["snakeflies"],"tag":"The adults body is long and slender, has a mobile head and two pairs of long, membranous wings that are prominently veined. Females usually have a long ovipositor that is used to deposit eggs into crevices or under bark. The larvae develop under the bark of trees and have large heads with projecting mandibles with long bodies. Both adults and larvae are predators of soft-bodied arthropods.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Dichrostigma_flavipes_beentree.jpg/330px-Dichrostigma_flavipes_beentree.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Raphidia_ophiopsis_M_NL-Doorwerth-19540617_right_wing_-_collection_Naturalis.jpg/330px-Raphidia_ophiopsis_M_NL-Doorwerth-19540617_right_wing_-_collection_Naturalis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/Rhaphidioptera-larva.jpg/330px-Rhaphidioptera-larva.jpg"],"card":6},{"name":"Trichoptera","parent":"Holometabola","rank":"Order","ipa":"","etymology":"","common":["caddisflies"],"tag":"The adult is a medium-sized insect with membranous, hairy wings, which are held in a tent-wise fashion when the insect is at rest. The antennae are fairly long and threadlike, the mouthparts are reduced in size and the legs have five lower leg joints. The larvae are aquatic and may be predators, leaf shredders, algal grazers, or collectors of particles from the water column and benthos. The larvae of many species use silk to make protective cases, which are often strengthened with gravel, sand, twigs, or other debris. Most adults have short lives during which they do not feed.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9a/RHYACOPHILA_DORSALIS_Male_Pont_Forge_de_Sailly_Watigny_02_MHNT.jpg/330px-RHYACOPHILA_DORSALIS_Male_Pont_Forge_de_Sailly_Watigny_02_MHNT.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/Caddisfly_Larva.jpg/330px-Caddisfly_Larva.jpg","https://upload.wikimedia.org/wikipedia/commons/8/83/Trichoptera_larvenbau.jpeg","https://upload.wikimedia.org/wikipedia/commons/8/81/Philopotamidae_Notch.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1e/Tinodes_assimilis%2C_Psychomyiidae%2C_Glaslyn_marsh%2C_North_Wales%2C_July_2014_%281%29_%2818035673942%29.jpg/330px-Tinodes_assimilis%2C_Psychomyiidae%2C_Glaslyn_marsh%2C_North_Wales%2C_July_2014_%281%29_%2818035673942%29.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a6/Notidobia.ciliaris.jpg"],"card":6},{"name":"Mecoptera","parent":"Holometabola","rank":"Order","ipa":"","etymology":"'long-wings'","common":["scorpionflies","hangingflies","earwigflies"],"tag":"Adults are small to medium-sized insects with long beaklike rostra; an elongated head with chewing mouthparts; membranous wings that extend beyond abdomen; slender, elongated bodies; and are mostly scavengers, feeding on decaying vegetation and dead invertebrates. The larvae are caterpillar-like and mostly feed on vegetable matter. Both larvae and adults are omnivorous. Males of the scorpionfly group have enlarged genitals raised over the body that look similar to the stingers of scorpions.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Scorpionfly_%28white_background%29.jpg/330px-Scorpionfly_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/Skorpionsfliege_Panorpa_communis_male_full_%28cropped%29.jpg/330px-Skorpionsfliege_Panorpa_communis_male_full_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/00/Bittacidae_fg1.jpg/250px-Bittacidae_fg1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/Skorpionsfliege_Panorpa_communis_male_genital.jpg/330px-Skorpionsfliege_Panorpa_communis_male_genital.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Boreus_hyemalis_female.jpg/330px-Boreus_hyemalis_female.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Scorpionfly_%285584476733%29.jpg/250px-Scorpionfly_%285584476733%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/67/Notiothauma_reedi.jpg/330px-Notiothauma_reedi.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/Merope_tuber_dorsal_view_-_ZooKeys-269-051-g007A.jpeg/330px-Merope_tuber_dorsal_view_-_ZooKeys-269-051-g007A.jpeg"],"card":6},{"name":"Siphonaptera","parent":"Holometabola","rank":"Order","ipa":"","etymology":"'pipe-wingless'","common":["fleas","jiggers"],"tag":"Small flightless insects that live as external parasites of mammals and birds feeding on the blood of their hosts. They grow to be 3 millimetres long, and have bodies that are narrow to better move through their hosts' fur or feathers. Their hind legs are extremely well adapted for jumping.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f9/Flea_Scanning_Electron_Micrograph_False_Color.jpg/250px-Flea_Scanning_Electron_Micrograph_False_Color.jpg","https://upload.wikimedia.org/wikipedia/commons/d/d7/Vogelfloehe.2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/74/Tunga_penetrans_%281%29.JPG/330px-Tunga_penetrans_%281%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/57/Flea_Larva.jpg/250px-Flea_Larva.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9d/%D0%9A%D0%BE%D1%88%D0%B0%D1%87%D1%8C%D1%8F_%D0%B1%D0%BB%D0%BE%D1%85%D0%B0.jpg/330px-%D0%9A%D0%BE%D1%88%D0%B0%D1%87%D1%8C%D1%8F_%D0%B1%D0%BB%D0%BE%D1%85%D0%B0.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/A_dog_flea_%28Ctenocephalides_canis%29%3B_adult%2C_pupa%2C_egg_and_lar_Wellcome_V0022501EL.jpg/250px-A_dog_flea_%28Ctenocephalides_canis%29%3B_adult%2C_pupa%2C_egg_and_lar_Wellcome_V0022501EL.jpg"],"card":6},{"name":"Hymenoptera","parent":"Holometabola","rank":"Order","ipa":"","etymology":"'membrane-wings'","common":["sawflies","wasps","ants","bees"],"tag":"Adults range from very small to large insects; have well-developed mandibles adapted for chewing; many species have a long proboscis for drinking nector; and hindwings connected to the forewings by a series of hooks. Many of the species are parasitic. Females typically have an ovipositor for inserting eggs into hosts and this is often modified into a stinger. A large sub group are known for their 'wasp-waist'.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/97/Wasp_March_2008-3.jpg/330px-Wasp_March_2008-3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Apis_mellifera_Western_honey_bee.jpg/330px-Apis_mellifera_Western_honey_bee.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a6/Meat_eater_ant_feeding_on_honey02.jpg/330px-Meat_eater_ant_feeding_on_honey02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8d/XN_Tenthredo_mesomela.jpg/330px-XN_Tenthredo_mesomela.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/37/Bienenwabe_mit_Eiern_und_Brut_5.jpg/330px-Bienenwabe_mit_Eiern_und_Brut_5.jpg","https://upload.wikimedia.org/wikipedia/commons/9/92/Ants_and_Eggs_-_geograph.org.uk_-_726733.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Pupae_of_an_S._invicta_queen.png/330px-Pupae_of_an_S._invicta_queen.png"],"card":6},{"name":"Lepidoptera","parent":"Holometabola","rank":"Order","ipa":"ˌlɛpɪˈdɒptərə","etymology":"'scale-wings'","common":["butterflies","moths","caterpillars"],"tag":"Characterised by scales that cover the bodies, large triangular wings, and a coiled proboscis for siphoning nectars. The scales are modified hairs and give them their wide variety of colors and patterns. Mating and the laying of eggs is normally performed near or on host plants for the larvae. The larvae, caterpillars, have a cylindrical body with a well-developed head, mandible mouth parts, three pairs of thoracic legs and from none up to five pairs of prolegs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Fesoj_-_Papilio_machaon_%28by%29.jpg/250px-Fesoj_-_Papilio_machaon_%28by%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Giant_grey_moth.png/330px-Giant_grey_moth.png","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/RhetusButterfly.jpg/330px-RhetusButterfly.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/28/Deilephila_elpenor_04.jpg/330px-Deilephila_elpenor_04.jpg","https://upload.wikimedia.org/wikipedia/commons/7/73/Chrysalis5504.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Group_of_Melitaea_athalia_near_Warka%2C_Poland.PNG/330px-Group_of_Melitaea_athalia_near_Warka%2C_Poland.PNG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4b/Hummingbird_hawkmoth_a.jpg/250px-Hummingbird_hawkmoth_a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a6/Peacock_butterfly_%28Aglais_io%29_2.jpg/330px-Peacock_butterfly_%28Aglais_io%29_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Arctiidae_caterpillar_edit.jpg/250px-Arctiidae_caterpillar_edit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0a/Heliconius_mimicry.png/250px-Heliconius_mimicry.png","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Chenille_de_Grand_porte_queue_%28macaon%29_Fausses_pattes.jpg/330px-Chenille_de_Grand_porte_queue_%28macaon%29_Fausses_pattes.jpg","https://upload.wikimedia.org/wikipedia/commons/e/e5/Caterpillar_face_close_up.jpg"],"card":6},{"name":"Diptera","parent":"Holometabola","rank":"Order","ipa":"","etymology":"'two-wings'","common":["true flies","lovebugs","midges","mosquitoes","wireworms","metallic flat-headed wood borers"],"tag":"Adults only use a single pair of wings to fly since the hindwings have evolved into sensory orgrans to perform advanced aerobatics; have a mobile head; a pair of large compound eyes; and mouthparts designed eithern for piercing and sucking, or for lapping and sucking. The eggs are often laid on the larval food-source and the larvae, which lack true limbs, develop in a protected environment, often inside their food source. Other species opportunistically deposit hatched or hatching larvae instead of eggs on carrion, dung, decaying material, or open wounds of mammals.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Musca_domestica_housefly.jpg/330px-Musca_domestica_housefly.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/Klegg_%2835325924364%29.jpg/330px-Klegg_%2835325924364%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/69/Ctenophora_pectinicornis_bl.jpg/330px-Ctenophora_pectinicornis_bl.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/11/Mosquito_Tasmania_crop.jpg/330px-Mosquito_Tasmania_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a0/Prionocera_turcica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/Maggia_fg34.jpg/330px-Maggia_fg34.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Robber_Fly_with_prey_%28Holcocephala_fusca%29_by_Thomas_Shahan.jpg/330px-Robber_Fly_with_prey_%28Holcocephala_fusca%29_by_Thomas_Shahan.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/97/Grosser_Wollschweber_Bombylius_major.jpg/330px-Grosser_Wollschweber_Bombylius_major.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/Mydas_sp..JPG/330px-Mydas_sp..JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/59/Stomoxys-stable-fly-life-cycle-2.jpg/250px-Stomoxys-stable-fly-life-cycle-2.jpg"],"card":6},{"name":"Coleoptera","parent":"Holometabola","rank":"Order","ipa":"koʊliːˈɒptɛrə","etymology":"'sheath-wings'","common":["beetles","Maybug","ladybugs","scarabs","weevils","fireflies","glowworms","grubs"],"tag":"Adults front pair of wings are hardened into wing-cases that meet in a straight line down the center of the back; typically have a particularly hard exoskeleton; most have mandibles that move in a horizontal plane; They feed on plants and fungi, break down animal and plant debris, or eat other invertebrates. The larvae are commonly called grubs; and typically have elongated bodies with chewing mouthparts and poorly developed eyes.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Coleoptera_collage.png/330px-Coleoptera_collage.png","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c0/Coleoptera_SMNK.jpg/250px-Coleoptera_SMNK.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ad/Cetonia-aurata.jpg/330px-Cetonia-aurata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0e/Dynastes_hercules_ecuatorianus_MHNT.jpg/330px-Dynastes_hercules_ecuatorianus_MHNT.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Scarabaeus_laticollis_2.jpg/330px-Scarabaeus_laticollis_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Temognatha_alternata_Jewel_Beetle_Cooktown.jpg/330px-Temognatha_alternata_Jewel_Beetle_Cooktown.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cc/BIEDRONA_mirrored%2C_cropped.png/250px-BIEDRONA_mirrored%2C_cropped.png","https://upload.wikimedia.org/wikipedia/commons/thumb/1/11/Weevil3.jpg/330px-Weevil3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/Head_of_the_Weaver_Beetle_%28Lamia_textor%29.jpg/330px-Head_of_the_Weaver_Beetle_%28Lamia_textor%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/13/Polyphylla_fullo_up.jpg/330px-Polyphylla_fullo_up.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2d/Hercules_beetle_%28larva%29.jpg/250px-Hercules_beetle_%28larva%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Photuris_lucicrescens.jpg/330px-Photuris_lucicrescens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/Phengodes_species%2C_U%2C_Right%2C_U_2013-07-18-15.54.20_ZS_PMax_%289335901793%29.jpg/330px-Phengodes_species%2C_U%2C_Right%2C_U_2013-07-18-15.54.20_ZS_PMax_%289335901793%29.jpg"],"card":6}],{},{"120px-Mayfly_nymph_dorsal_view_wing_buds_paired_gills.JPG":[120,255,"#b3afa6"],"120px-Ontwikkelstadia_wespenpoppen.jpg":[120,349,"#b5ad9a"],"250px-A_dog_flea_(Ctenocephalides_canis);_adult,_pupa,_egg_and_lar_Wellcome_V0022501EL.jpg":[250,426,"#b6aea4"],"250px-Andrena_nivalis,_stylopid,_U,_Cocos_Co.,_NH,_back_2015-07-13-15.57.01_ZS_PMax_(cropped2).jpg":[250,250,"#715a44"],"250px-Aphids_September_2008-1.jpg":[250,296,"#8a5d3e"],"250px-Arctiidae_caterpillar_edit.jpg":[250,375,"#715d4d"],"250px-BIEDRONA_mirrored,_cropped.png":[250,243,"#606215"],"250px-Bittacidae_fg1.jpg":[250,307,"#737771"],"250px-Body_lice.jpg":[250,344,"#291b13"],"250px-Celithemis_eponina_(Halloween_Pennant).jpg":[250,333,"#a39381"],"250px-Coleoptera_SMNK.jpg":[250,364,"#6a694f"],"250px-Common_blue_damselfly02.jpg":[250,300,"#a59d68"],"250px-Dares_ulula_Pärchen.jpg":[250,318,"#767573"],"250px-Domino_cockroach_Therea_petiveriana.jpg":[250,333,"#7e5d3e"],"250px-Eusthenia_sp.jpg":[250,375,"#6a6a5a"],"250px-Fesoj_-_Papilio_machaon_(by).jpg":[250,250,"#755c39"],"250px-Flea_Larva.jpg":[250,270,"#afa298"],"250px-Flea_Scanning_Electron_Micrograph_False_Color.jpg":[250,323,"#836948"],"250px-Flickr_-_ggallice_-_Fulgorid.jpg":[250,375,"#6b7560"],"250px-Forficula_auricularia.jpg":[250,317,"#e2e6e5"],"250px-Heliconius_mimicry.png":[250,251,"#b9a790"],"250px-Hercules_beetle_(larva).jpg":[250,445,"#8b7894"],"250px-Hummingbird_hawkmoth_a.jpg":[250,250,"#d2666a"],"250px-Jerusalemcricket.jpg":[250,320,"#7e6b5e"],"250px-Kuboesphasma_compactum_(10.3897-zookeys.746.14885)_Figure_2.jpg":[250,265,"#25241b"],"250px-Lipeurus_forficulatus_f.png":[250,318,"#ebeceb"],"250px-Liposcelis.jpg":[250,435,"#aaab9b"],"250px-Nacimiento_de_una_Dryas_iulia,_Mariposario_de_Icod_de_los_Vinos,_Tenerife,_España,_2012-12-13,_DD_03.jpg":[250,332,"#897c71"],"250px-Other_Wondrous_Things_Dark_Fishfly_(47947964738).jpg":[250,293,"#adaaa5"],"250px-Owlfly_(Libelloides_macaronius)_female_Istria.jpg":[250,250,"#9c936e"],"250px-Pentatomidae_spec.jpg":[250,283,"#c4ad7d"],"250px-Phyllium_bilobatum,_male_larva.jpg":[250,294,"#838a6b"],"250px-Pleasing_Lacewing_Female_-_Flickr_-_treegrow_(2).jpg":[250,250,"#926430"],"250px-Rhithrogena_germanica_subimago_on_Equisetum_hyemale.jpg":[250,308,"#d6ccbf"],"250px-Schizaphis_graminum_usda_(cropped).jpg":[250,254,"#78a335"],"250px-Scorpionfly_(5584476733).jpg":[250,335,"#8d7d4d"],"250px-Small_Winter_Stonefly_-_Allocapnia_species?,_Riverbend_Park,_Great_Falls,_Virginia_-_13007749435.jpg":[250,397,"#b4a18c"],"250px-Stomoxys-stable-fly-life-cycle-2.jpg":[250,243,"#886c4f"],"250px-Strepsiptera.png":[250,245,"#d5cabd"],"250px-Stylops_melittae_f1.jpg":[250,250,"#575454"],"250px-Stylops_melittae_m3.JPG":[250,333,"#b2967f"],"250px-Thrips_(PSF)_(white_background).png":[250,271,"#e5e5e5"],"250px-Trogium_pulsatorium.jpg":[250,302,"#bbb29c"],"250px-Wandering_Violin_Mantis_(Gongylus_gongylodes)_Photograph_By_Shantanu_Kuveskar.jpg":[250,285,"#69863a"],"250px-Zeugomantispa_minuta_P1030119a.jpg":[250,247,"#72574f"],"330px-A_pupa_of_Euploea_core_(Cramer,_1780)_-_Common_Crow_WLB.jpg":[330,220,"#688315"],"330px-Abelopsocus_basipunctatus_live.jpg":[330,157,"#aea5a3"],"330px-Acanthomenexenus_polyacanthus_-_even_adult_male1.JPG":[330,220,"#9cb075"],"330px-Aeshna_cyanea_female_1.jpg":[330,229,"#657668"],"330px-American-cockroach.jpg":[330,200,"#cdc7c6"],"330px-Amphinemura.jpg":[330,296,"#928e87"],"330px-Anisoptera_Ana_Cotta_3022296333.jpg":[330,237,"#7c8261"],"330px-Anotogaster_sieboldii_on_wall.jpg":[330,248,"#8c8d8b"],"330px-Apis_mellifera_Western_honey_bee.jpg":[330,274,"#68711d"],"330px-Beautiful_demoiselle_(Calopteryx_virgo)_male_3.jpg":[330,220,"#7e7257"],"330px-Bed_bug,_Cimex_lectularius.jpg":[330,231,"#a17055"],"330px-Bienenwabe_mit_Eiern_und_Brut_5.jpg":[330,248,"#a06d21"],"330px-Blatta_orientalis_male_from_Botevgrad,_Bulgaria_01.jpg":[330,247,"#c3c4c3"],"330px-Boreus_hyemalis_female.jpg":[330,221,"#bcb573"],"330px-Brown_Lacewing_Larva_(30941270143).jpg":[330,247,"#7e8740"],"330px-Caddisfly_Larva.jpg":[330,217,"#c1c0be"],"330px-Cetonia-aurata.jpg":[330,275,"#928c63"],"330px-Chenille_de_Grand_porte_queue_(macaon)_Fausses_pattes.jpg":[330,282,"#323222"],"330px-Chloroperlidae.jpg":[330,264,"#1d150a"],"330px-Choeradodis_stalii_MHNT_dos.jpg":[330,210,"#2f321e"],"330px-Coleoptera_collage.png":[330,315,"#d7d2cc"],"330px-Common_Antlion_Myrmeleon_immaculatus_mature_nymph.jpg":[330,246,"#695c4b"],"330px-Common_Clubtail_(Ictinogomphus_rapax)_W_IMG_0224.jpg":[330,221,"#757669"],"330px-Corydalus_affinis,_Pacaraima_-_RR,_69345-000,_Brasil_imported_from_iNaturalist_photo_203073948.jpg":[330,210,"#b8a592"],"330px-Crisopid_July_2013-9a.jpg":[330,169,"#c0c5c9"],"330px-Cryptophyllium_celebicum_2.jpg":[330,247,"#7b7e6e"],"330px-Ctenomorpha_chronus02.jpg":[330,307,"#9f9182"],"330px-Ctenophora_pectinicornis_bl.jpg":[330,247,"#706860"],"330px-Darter_August_2007-20.jpg":[330,258,"#a48c73"],"330px-Deilephila_elpenor_04.jpg":[330,256,"#5e4c34"],"330px-Desert_Whitetail_-_Plathemis_subornata,_Bitter_Lakes_National_Wildlife_Refuge,_Roswell,_New_Mexico_-_7299714954.jpg":[330,220,"#75755a"],"330px-Dichrostigma_flavipes_beentree.jpg":[330,268,"#829854"],"330px-Distoleon_tetragrammicus01.jpg":[330,239,"#ca9857"],"330px-Dwarf_birch_spinner_(Eriogaster_arbusculae)_cocoon_Dovrefjell.jpg":[330,179,"#64674f"],"330px-Dynastes_hercules_ecuatorianus_MHNT.jpg":[330,217,"#b9b3b1"],"330px-Endemic_Grylloblattid_(10334180636).jpg":[330,220,"#906545"],"330px-Ephemeroptera_2.jpg":[330,206,"#bbb5b1"],"330px-Eumastax_zumuniana.jpg":[330,206,"#303518"],"330px-Flatid_leaf_bugs_and_nymphs_(Phromnia_rosea).jpg":[330,220,"#2b1d17"],"330px-Galloisiana_kiyosawai.jpg":[330,248,"#7e766f"],"330px-Giant_grey_moth.png":[330,259,"#cfcac8"],"330px-Gminatus_australis_dorsal_view.jpg":[330,243,"#758826"],"330px-Gottesanbeterin_Abwehr.JPG":[330,256,"#9c998a"],"330px-Graphocephala_coccinea_6.jpg":[330,264,"#7da45b"],"330px-Green-eyed_Barklouse_-_Flickr_-_treegrow.jpg":[330,247,"#394e14"],"330px-Grosser_Wollschweber_Bombylius_major.jpg":[330,297,"#c5b39d"],"330px-Group_of_Melitaea_athalia_near_Warka,_Poland.PNG":[330,239,"#837c70"],"330px-Grouse_Locust_(Potua_sp.)_(23289516379).jpg":[330,220,"#705d22"],"330px-Grylloblatta_scudderi,_Squamish-Lillooet,_British_Columbia_2.jpg":[330,220,"#c7aa9a"],"330px-Grylloblattidae_(cropped).jpg":[330,178,"#dfddda"],"330px-Gryllomorpha_dalmatina01.jpg":[330,252,"#b4b2aa"],"330px-Gryllus_campestris_female_(4724690375).jpg":[330,221,"#78644d"],"330px-Haaniella_dehaanii-subadult_threaten_female.JPG":[330,220,"#63493a"],"330px-Head_of_the_Weaver_Beetle_(Lamia_textor).jpg":[330,222,"#666f48"],"330px-Horsehead_Grasshopper_(Pseudoproscopia_scabra),_Tambopata_Lodge.jpg":[330,264,"#314014"],"330px-Ischnura_heterosticta02.jpg":[330,220,"#595f27"],"330px-Isoptera.jpg":[330,220,"#7e6555"],"330px-Jumping_Bristletails_(15567941692).jpg":[330,247,"#a9753f"],"330px-Karoophasma_biedouwensis_15669932.jpg":[330,236,"#b3b5da"],"330px-Klegg_(35325924364).jpg":[330,209,"#bbbcb1"],"330px-Lantern_bug.jpg":[330,219,"#706751"],"330px-Large_brown_mantid_close_up_nohair.jpg":[330,220,"#2c241d"],"330px-Leaf_Grasshopper_(Systella_sp.)_(8742072742).jpg":[330,199,"#36341d"],"330px-Lesser_Tasmanian_Darner_Austroaeschna_hardyi_female.jpg":[330,220,"#907a58"],"330px-Locusta-migratoria-wanderheuschrecke.jpg":[330,231,"#9a8d54"],"330px-Locusts_Saad.jpg":[330,220,"#919191"],"330px-Maggia_fg34.jpg":[330,222,"#4e3f29"],"330px-Mantis_(European).jpg":[330,220,"#18251a"],"330px-Mantispa_styriaca_(9566952168).jpg":[330,219,"#a2935f"],"330px-Mantophasma_zephyra_Zompro_et_al_2002.jpg":[330,234,"#d4d4c8"],"330px-Meat_eater_ant_feeding_on_honey02.jpg":[330,220,"#d8d5d5"],"330px-Merope_tuber_dorsal_view_-_ZooKeys-269-051-g007A.jpeg":[330,246,"#9b978f"],"330px-Metoligotoma_tasmanica.jpg":[330,220,"#ca6d18"],"330px-Minutophasma_richtersveldense_(10.3897-zookeys.746.14885)_Figure_10.jpg":[330,287,"#99926a"],"330px-Miramella_alpina_male_(3788740982).jpg":[330,221,"#b0ab9d"],"330px-Mosquito_Tasmania_crop.jpg":[330,249,"#9b7651"],"330px-Musca_domestica_housefly.jpg":[330,220,"#b47b65"],"330px-Mydas_sp..JPG":[330,247,"#cd8f67"],"330px-Nemoptera_sp._MHNT.ZOO.2004.0.736.jpg":[330,221,"#dcd4d2"],"330px-Neotibicen_linnei.jpg":[330,296,"#8a7c6d"],"330px-Nesting_Earwig_Chester_UK_2.jpg":[330,255,"#7b736b"],"330px-Notiothauma_reedi.jpg":[330,296,"#c38762"],"330px-Notoligotoma_nitens.jpg":[330,186,"#dddcd9"],"330px-Ovatus_sp._-_Guelph,_Ontario_2017-06-13_(02).jpg":[330,185,"#a57871"],"330px-Pachyrhamma_waitomoensis_aggregation.jpg":[330,247,"#b38444"],"330px-Peacock_butterfly_(Aglais_io)_2.jpg":[330,220,"#5e4c3f"],"330px-Perlidae_P1400217a.jpg":[330,191,"#7c7e7d"],"330px-Phengodes_species,_U,_Right,_U_2013-07-18-15.54.20_ZS_PMax_(9335901793).jpg":[330,231,"#23170d"],"330px-Photuris_lucicrescens.jpg":[330,248,"#869a57"],"330px-Plecoptera_-_exuvia.jpg":[330,247,"#a6987a"],"330px-Polyphylla_fullo_up.jpg":[330,284,"#827459"],"330px-Protosialis_americana_PCCA20050708-9036A.jpg":[330,208,"#627c12"],"330px-Pseudomallada_edwardsi_AF_2.jpg":[330,222,"#626b51"],"330px-Pupae_of_an_S._invicta_queen.png":[330,220,"#656e5a"],"330px-RHYACOPHILA_DORSALIS_Male_Pont_Forge_de_Sailly_Watigny_02_MHNT.jpg":[330,279,"#f2efe9"],"330px-Raphidia_ophiopsis_M_NL-Doorwerth-19540617_right_wing_-_collection_Naturalis.jpg":[330,247,"#9c7d60"],"330px-Rapisma_tamilanum_India.jpg":[330,219,"#5b6822"],"330px-Red_Ant_-_March_2025.jpg":[330,233,"#9d8f8f"],"330px-Rhaphidioptera-larva.jpg":[330,226,"#aba39f"],"330px-RhetusButterfly.jpg":[330,288,"#694734"],"330px-Robber_Fly_with_prey_(Holcocephala_fusca)_by_Thomas_Shahan.jpg":[330,241,"#a1b749"],"330px-Rock_bristletail.JPG":[330,247,"#b28e68"],"330px-Scarabaeus_laticollis_2.jpg":[330,233,"#8f8068"],"330px-Schizodactylus_monstrosus_Rajasthan.jpg":[330,233,"#ad955e"],"330px-Scorpionfly_(white_background).jpg":[330,209,"#dad4d2"],"330px-Sialis_lutaria_larva_(aka).jpg":[330,211,"#b29677"],"330px-Skorpionsfliege_Panorpa_communis_male_full_(cropped).jpg":[330,197,"#869b6b"],"330px-Skorpionsfliege_Panorpa_communis_male_genital.jpg":[330,206,"#666310"],"330px-Soliperla_sierra.jpg":[330,243,"#546c2e"],"330px-Spiny_crawler_mayfly,_Drunella_coloradensis_(9638196107).jpg":[330,203,"#dacfbc"],"330px-SteinfliegenLarve2.JPG":[330,219,"#b5a688"],"330px-Stenoperla_prasina.jpg":[330,247,"#7c7e78"],"330px-Stick_Insect_(Parectatosoma_sp.),_Vohimana_reserve,_Madagascar_(12264302936).jpg":[330,248,"#121108"],"330px-Taeniochauliodes.jpg":[330,147,"#a07054"],"330px-Temognatha_alternata_Jewel_Beetle_Cooktown.jpg":[330,235,"#bec38f"],"330px-Termitenhügel_Namibia.jpg":[330,219,"#d8ab8b"],"330px-Thaumatoperla_robusta.jpg":[330,249,"#3a451f"],"330px-Tinodes_assimilis,_Psychomyiidae,_Glaslyn_marsh,_North_Wales,_July_2014_(1)_(18035673942).jpg":[330,152,"#8f8a80"],"330px-Trithemis_annulata.jpg":[330,220,"#4d443b"],"330px-Tunga_penetrans_(1).JPG":[330,186,"#94634f"],"330px-Tête_de_Trigoniophthalmus_alternatus.jpg":[330,239,"#83654b"],"330px-Wasp_March_2008-3.jpg":[330,236,"#5a5d41"],"330px-Weevil3.jpg":[330,272,"#c4c0bf"],"330px-Workers_&_Soldiers.jpg":[330,156,"#9a8572"],"330px-XN_Tenthredo_mesomela.jpg":[330,182,"#aad40b"],"330px-Xenos_peckii_head_closeup.png":[330,222,"#454545"],"330px-Zorotypus.jpg":[330,220,"#7c4d39"],"330px-Zorotypus_from_Los_Bancos,_Pichincha,_Ecuador.jpg":[330,220,"#3f3023"],"330px-Кошачья_блоха.jpg":[330,231,"#3b270a"],"Adiathetus_tenebrator_iruppu.jpg":[537,420,"#7b7969"],"Aeshna_juncea_hovering.jpg":[693,520,"#6a6b2c"],"Agathemera_maculafulgens_(8388995384).jpg":[640,430,"#c9a18f"],"Antlion_trap.jpg":[640,480,"#7b6e65"],"Ants_and_Eggs_-_geograph.org.uk_-_726733.jpg":[640,480,"#6e6559"],"Atelura_formicaria_18180053.jpg":[503,503,"#7d6759"],"Caterpillar_face_close_up.jpg":[682,554,"#7c6e41"],"Chloronia_osae.jpg":[378,500,"#777041"],"Chrysalis5504.jpg":[300,461,"#717869"],"Cryptocercus_clevelandi.jpg":[696,391,"#8d8582"],"Diradius_vandykei.jpg":[1316,987,"#9a847d"],"Dobsonfly_Corydalus_cornutus_larvae.jpg":[220,139,"#8a8563"],"Eendagsvlieg_(257301115).jpeg":[1946,732,"#76735e"],"Flying_Termites_after_rain.jpg":[800,532,"#26231f"],"Flügel_Peruphasma_schultei.jpg":[243,220,"#453639"],"Forficula.auricularia.-.lindsey.jpg":[640,426,"#a99e28"],"Frankadult.jpg":[376,382,"#b9c2b3"],"K8085-21.jpg":[640,408,"#6fa9af"],"Notidobia.ciliaris.jpg":[640,427,"#a7b47c"],"Philopotamidae_Notch.jpg":[640,480,"#b06658"],"Phlaeothripidae_-_fungus_feeding_thrip.jpg":[358,540,"#919891"],"Platyneuromus_soror.jpg":[520,300,"#d1baaf"],"Prionocera_turcica.jpg":[600,420,"#848b84"],"Psocoptera_(white_background).jpg":[237,225,"#e4dedb"],"Shadfly01.jpg":[576,432,"#493425"],"Termites_marked_with_traceable_protiens.jpg":[252,167,"#53474c"],"Thermobia_domestica1.jpg":[565,300,"#5c5e50"],"Thrips_nymph.jpg":[640,480,"#507740"],"Trichoptera_larvenbau.jpeg":[627,528,"#91abb5"],"Vogelfloehe.2.jpg":[412,404,"#c0bbae"]})
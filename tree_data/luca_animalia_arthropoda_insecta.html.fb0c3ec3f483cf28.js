@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_arthropoda_insecta","<ul class=\"tree\" data-tree-range=\"insecta\"><li><input type=\"checkbox\" checked id=\"Hexapoda_Insecta\"><label class=\"tree_label\" for=\"Hexapoda_Insecta\"></label><div class=\"outer_tree_box\"><div id=\"insecta_insecta\" class=\"tree_box\"><span><span>Insecta</span><a href=\"https://en.wikipedia.org/wiki/Insecta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Insecta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Insecta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Insecta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"arthropoda\">See parent</button><span class=\"badge\">Class</span></span><p class=\"tag\">The insects. They have a segmented body supported by an hard chitin exoskeleton with three segments: the head, thorax and abdomen. The head supports a pair of sensory antennae, usually a pair of compound eyes, zero to three simple eyes, and three sets of variously modified appendages that form the mouthparts. The thorax carries the three pairs of legs and up to two pairs of wings. The abdomen contains most of the digestive, respiratory, excretory and reproductive structures. Most have paired appendages on the rear-most segments called the cerci.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Thermobia_domestica1.jpg\" target=\"_blank\"><img src=\"thumbnails/Thermobia_domestica1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"565\" height=\"300\" style=\"background-color:#5c5e50\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rock_bristletail.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Rock_bristletail.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#b28e68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ephemeroptera_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ephemeroptera_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#bbb5b1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bed_bug%2C_Cimex_lectularius.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bed_bug%2C_Cimex_lectularius.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#a17055\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Miramella_alpina_male_%283788740982%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Miramella_alpina_male_%283788740982%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#b0ab9d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fesoj_-_Papilio_machaon_%28by%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fesoj_-_Papilio_machaon_%28by%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#755c39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_Ant_-_March_2025.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red_Ant_-_March_2025.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#9d8f8f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aeshna_cyanea_female_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aeshna_cyanea_female_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#657668\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_archaeognatha\" class=\"tree_box\"><span><span>Archaeognatha</span><a href=\"https://en.wikipedia.org/wiki/Archaeognatha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Archaeognatha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Archaeognatha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Archaeognatha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Archaeognatha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(jumping bristletails)</span><p class=\"tag\">Their abdomen ends in three long tail-like structures with a longer the medial filament. They have elongated bodies and backs that are arched. They easily dehydrate and must remain in moist air.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Rock_bristletail.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Rock_bristletail.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#b28e68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jumping_Bristletails_%2815567941692%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Jumping_Bristletails_%2815567941692%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a9753f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:T%C3%AAte_de_Trigoniophthalmus_alternatus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-T%C3%AAte_de_Trigoniophthalmus_alternatus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"239\" style=\"background-color:#83654b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_zygentoma\" class=\"tree_box\"><span><span>Zygentoma</span><a href=\"https://en.wikipedia.org/wiki/Zygentoma\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Zygentoma\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Zygentoma\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Zygentoma\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Zygentoma\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(silverfish, firebrat)</span><p class=\"tag\">Their abdomen ends in three long tail-like structures of similar lengths. Their scales have a silvery glitter. They feed on organic detritus.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Atelura_formicaria_18180053.jpg\" target=\"_blank\"><img src=\"thumbnails/Atelura_formicaria_18180053.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"503\" height=\"503\" style=\"background-color:#7d6759\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thermobia_domestica1.jpg\" target=\"_blank\"><img src=\"thumbnails/Thermobia_domestica1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"565\" height=\"300\" style=\"background-color:#5c5e50\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Insecta_Pterygota\"><label class=\"tree_label\" for=\"Insecta_Pterygota\"></label><div class=\"outer_tree_box\"><div id=\"insecta_pterygota\" class=\"tree_box\"><span><span>Pterygota</span><a href=\"https://en.wikipedia.org/wiki/Pterygota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pterygota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pterygota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pterygota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌtɛrəˈɡoʊtə\" target=\"_blank\">ˌtɛrəˈɡoʊtə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><p class=\"tag\">The winged insects. They have veined wings on their second and third thoracic segments. Some species are have lost their wings when they have become a disadvantage, like in parasites or cave dwellers. Flight in insects is believed to have evolved from a single common ancestor.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ephemeroptera_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ephemeroptera_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#bbb5b1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bed_bug%2C_Cimex_lectularius.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bed_bug%2C_Cimex_lectularius.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#a17055\"></a><a href=\"https://commons.wikimedia.org/wiki/File:American-cockroach.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-American-cockroach.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"200\" style=\"background-color:#cdc7c6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mantis_%28European%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mantis_%28European%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#18251a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Miramella_alpina_male_%283788740982%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Miramella_alpina_male_%283788740982%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#b0ab9d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fesoj_-_Papilio_machaon_%28by%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fesoj_-_Papilio_machaon_%28by%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#755c39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_Ant_-_March_2025.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red_Ant_-_March_2025.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#9d8f8f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aeshna_cyanea_female_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aeshna_cyanea_female_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#657668\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_ephemeroptera\" class=\"tree_box\"><span><span>Ephemeroptera</span><a href=\"https://en.wikipedia.org/wiki/Ephemeroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ephemeroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ephemeroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ephemeroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Ephemeroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(mayflies)</span><p class=\"tag\">They have long tails and wings that do not fold flat over the abdomen. Their immature stages are aquatic fresh water nymphs that emerge as adults together in large swarms. Adults do not feed and have only vestigial mouthparts.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Rhithrogena_germanica_subimago_on_Equisetum_hyemale.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Rhithrogena_germanica_subimago_on_Equisetum_hyemale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"308\" style=\"background-color:#d6ccbf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mayfly_nymph_dorsal_view_wing_buds_paired_gills.JPG\" target=\"_blank\"><img src=\"thumbnails/120px-Mayfly_nymph_dorsal_view_wing_buds_paired_gills.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"255\" style=\"background-color:#b3afa6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Shadfly01.jpg\" target=\"_blank\"><img src=\"thumbnails/Shadfly01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"576\" height=\"432\" style=\"background-color:#493425\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eendagsvlieg_%28257301115%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/Eendagsvlieg_%28257301115%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"1946\" height=\"732\" style=\"background-color:#76735e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spiny_crawler_mayfly%2C_Drunella_coloradensis_%289638196107%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Spiny_crawler_mayfly%2C_Drunella_coloradensis_%289638196107%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"203\" style=\"background-color:#dacfbc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ephemeroptera_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ephemeroptera_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#bbb5b1\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_odonata\" class=\"tree_box\"><span><span>Odonata</span><a href=\"https://en.wikipedia.org/wiki/Odonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Odonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Odonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Odonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Odonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(dragonflies, damselfiles, darners, clubtails, skimmers)</span><p class=\"tag\">Predatory flying insects have aquatic larvae. The adults have two pairs of long, transparent wings that move independently, large compound eyes, short bristle-like antennae, and elongated abdomens. They are carnivorous and are almost entirely insectivorous. Damselflies have narrow wings as they join the thorax and dragonflies hind wings are wider near the base.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Common_blue_damselfly02.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Common_blue_damselfly02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"300\" style=\"background-color:#a59d68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aeshna_juncea_hovering.jpg\" target=\"_blank\"><img src=\"thumbnails/Aeshna_juncea_hovering.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"693\" height=\"520\" style=\"background-color:#6a6b2c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Beautiful_demoiselle_%28Calopteryx_virgo%29_male_3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Beautiful_demoiselle_%28Calopteryx_virgo%29_male_3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7e7257\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ischnura_heterosticta02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ischnura_heterosticta02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#595f27\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aeshna_cyanea_female_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aeshna_cyanea_female_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#657668\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anotogaster_sieboldii_on_wall.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Anotogaster_sieboldii_on_wall.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8c8d8b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lesser_Tasmanian_Darner_Austroaeschna_hardyi_female.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lesser_Tasmanian_Darner_Austroaeschna_hardyi_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#907a58\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Common_Clubtail_%28Ictinogomphus_rapax%29_W_IMG_0224.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Common_Clubtail_%28Ictinogomphus_rapax%29_W_IMG_0224.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#757669\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Desert_Whitetail_-_Plathemis_subornata%2C_Bitter_Lakes_National_Wildlife_Refuge%2C_Roswell%2C_New_Mexico_-_7299714954.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Desert_Whitetail_-_Plathemis_subornata%2C_Bitter_Lakes_National_Wildlife_Refuge%2C_Roswell%2C_New_Mexico_-_7299714954.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#75755a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Celithemis_eponina_%28Halloween_Pennant%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Celithemis_eponina_%28Halloween_Pennant%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#a39381\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Darter_August_2007-20.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Darter_August_2007-20.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"258\" style=\"background-color:#a48c73\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trithemis_annulata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Trithemis_annulata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#4d443b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anisoptera_Ana_Cotta_3022296333.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Anisoptera_Ana_Cotta_3022296333.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#7c8261\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Pterygota_Neoptera\"><label class=\"tree_label\" for=\"Pterygota_Neoptera\"></label><div class=\"outer_tree_box\"><div id=\"insecta_neoptera\" class=\"tree_box\"><span><span>Neoptera</span><a href=\"https://en.wikipedia.org/wiki/Neoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Neoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Neoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Neoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">They have a wing-flexing mechanism that enables the wings to be folded back to rest on the surface of the abdomen. This has been lost in the butterflies.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Body_lice.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Body_lice.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"344\" style=\"background-color:#291b13\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bed_bug%2C_Cimex_lectularius.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bed_bug%2C_Cimex_lectularius.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#a17055\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ovatus_sp._-_Guelph%2C_Ontario_2017-06-13_%2802%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ovatus_sp._-_Guelph%2C_Ontario_2017-06-13_%2802%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"185\" style=\"background-color:#a57871\"></a><a href=\"https://commons.wikimedia.org/wiki/File:American-cockroach.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-American-cockroach.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"200\" style=\"background-color:#cdc7c6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mantis_%28European%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mantis_%28European%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#18251a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Miramella_alpina_male_%283788740982%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Miramella_alpina_male_%283788740982%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#b0ab9d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fesoj_-_Papilio_machaon_%28by%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fesoj_-_Papilio_machaon_%28by%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#755c39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_Ant_-_March_2025.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red_Ant_-_March_2025.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#9d8f8f\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_psocodea\" class=\"tree_box\"><span><span>Psocodea</span><a href=\"https://en.wikipedia.org/wiki/Psocodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Psocodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Psocodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Psocodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Psocodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(bark lice, book lice, parasitic lice)</span><p class=\"tag\">Small, scavenging insects that feed primarily on fungi, algae, lichen, and organic detritus. Some are parasitic on warm-blooded hosts feeding on skin, debris or blood. Non-parasitic species have a neck-like constriction between head and thorax.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Psocoptera_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Psocoptera_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"237\" height=\"225\" style=\"background-color:#e4dedb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lipeurus_forficulatus_f.png\" target=\"_blank\"><img src=\"thumbnails/250px-Lipeurus_forficulatus_f.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"318\" style=\"background-color:#ebeceb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Body_lice.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Body_lice.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"344\" style=\"background-color:#291b13\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abelopsocus_basipunctatus_live.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Abelopsocus_basipunctatus_live.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"157\" style=\"background-color:#aea5a3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Green-eyed_Barklouse_-_Flickr_-_treegrow.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Green-eyed_Barklouse_-_Flickr_-_treegrow.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#394e14\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Liposcelis.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Liposcelis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"435\" style=\"background-color:#aaab9b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trogium_pulsatorium.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Trogium_pulsatorium.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"302\" style=\"background-color:#bbb29c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_hemiptera\" class=\"tree_box\"><span><span>Hemiptera</span><a href=\"https://en.wikipedia.org/wiki/Hemiptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hemiptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hemiptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hemiptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Hemiptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=hɛˈmɪptərə\" target=\"_blank\">hɛˈmɪptərə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(cicadas, aphids, stink bugs, bed bugs, assassin bugs, shield bugs, plant hoppers, leaf hoppers, moss bugs, bat bugs)</span><p class=\"tag\">The true bugs. Named because the the texture of the front wings is different near the base (leathery) than at the apex (membranous). Other distinguishing features are the way the front wings cross over to form “X”-pattern on back and the tubular proboscis (beak) used as piercing-sucking mouthparts. They range in size from 1 mm (0.04 in) to around 15 cm (6 in). They can be terrestrial, aquatic and semi-aquatic. Most feed on plant sap but some are bloodsucking, and others are predators.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Neotibicen_linnei.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Neotibicen_linnei.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"296\" style=\"background-color:#8a7c6d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aphids_September_2008-1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aphids_September_2008-1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"296\" style=\"background-color:#8a5d3e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Schizaphis_graminum_usda_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Schizaphis_graminum_usda_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"254\" style=\"background-color:#78a335\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flatid_leaf_bugs_and_nymphs_%28Phromnia_rosea%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Flatid_leaf_bugs_and_nymphs_%28Phromnia_rosea%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#2b1d17\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lantern_bug.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lantern_bug.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#706751\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flickr_-_ggallice_-_Fulgorid.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Flickr_-_ggallice_-_Fulgorid.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#6b7560\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Graphocephala_coccinea_6.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Graphocephala_coccinea_6.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#7da45b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gminatus_australis_dorsal_view.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gminatus_australis_dorsal_view.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"243\" style=\"background-color:#758826\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bed_bug%2C_Cimex_lectularius.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bed_bug%2C_Cimex_lectularius.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#a17055\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pentatomidae_spec.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pentatomidae_spec.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"283\" style=\"background-color:#c4ad7d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ovatus_sp._-_Guelph%2C_Ontario_2017-06-13_%2802%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ovatus_sp._-_Guelph%2C_Ontario_2017-06-13_%2802%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"185\" style=\"background-color:#a57871\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_thysanoptera\" class=\"tree_box\"><span><span>Thysanoptera</span><a href=\"https://en.wikipedia.org/wiki/Thysanoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Thysanoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Thysanoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Thysanoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Thysanoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(thrips)</span><p class=\"tag\">Slender insects, widest in middle, with wings fringed with long hairs and unique asymmetrical &#x27;piercing-sucking&#x27; mouthparts mouthparts that are concealed within head capsule. They are usually less than 1 mm long. Many species are fungivorous and many are pollinators.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Thrips_%28PSF%29_%28white_background%29.png\" target=\"_blank\"><img src=\"thumbnails/250px-Thrips_%28PSF%29_%28white_background%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"271\" style=\"background-color:#e5e5e5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Frankadult.jpg\" target=\"_blank\"><img src=\"thumbnails/Frankadult.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"376\" height=\"382\" style=\"background-color:#b9c2b3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phlaeothripidae_-_fungus_feeding_thrip.jpg\" target=\"_blank\"><img src=\"thumbnails/Phlaeothripidae_-_fungus_feeding_thrip.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"358\" height=\"540\" style=\"background-color:#919891\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thrips_nymph.jpg\" target=\"_blank\"><img src=\"thumbnails/Thrips_nymph.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#507740\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Neoptera_Polyneoptera\"><label class=\"tree_label\" for=\"Neoptera_Polyneoptera\"></label><div class=\"outer_tree_box\"><div id=\"insecta_polyneoptera\" class=\"tree_box\"><span><span>Polyneoptera</span><a href=\"https://en.wikipedia.org/wiki/Polyneoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Polyneoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Polyneoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Polyneoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">They have chewing mouthparts and incomplete development so instead of a pupal stage they develop through a series of nymphal instars that gradually acquire adult features. Some adults are secondarily wingless but if not they have four wings and the front wings are usually thickened or leathery with the front and hind wings operating independently of one another.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Miramella_alpina_male_%283788740982%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Miramella_alpina_male_%283788740982%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#b0ab9d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phyllium_bilobatum%2C_male_larva.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Phyllium_bilobatum%2C_male_larva.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"294\" style=\"background-color:#838a6b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Perlidae_P1400217a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Perlidae_P1400217a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"191\" style=\"background-color:#7c7e7d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Forficula.auricularia.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Forficula.auricularia.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"426\" style=\"background-color:#a99e28\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zorotypus_from_Los_Bancos%2C_Pichincha%2C_Ecuador.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Zorotypus_from_Los_Bancos%2C_Pichincha%2C_Ecuador.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#3f3023\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mantis_%28European%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mantis_%28European%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#18251a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:American-cockroach.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-American-cockroach.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"200\" style=\"background-color:#cdc7c6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grylloblatta_scudderi%2C_Squamish-Lillooet%2C_British_Columbia_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grylloblatta_scudderi%2C_Squamish-Lillooet%2C_British_Columbia_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#c7aa9a\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_orthoptera\" class=\"tree_box\"><span><span>Orthoptera</span><a href=\"https://en.wikipedia.org/wiki/Orthoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Orthoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Orthoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Orthoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Orthoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(grasshoppers, locusts, crickets)</span><p class=\"tag\">Grasshoppers, crickets, and allies. Named by having thickened front wings that are parallel-sided. Other distinguishing factors are hind legs modified for jumping; and antennae segments that are cylindrical and uniform in size. Many species have the ability to make and detect sounds.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Miramella_alpina_male_%283788740982%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Miramella_alpina_male_%283788740982%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#b0ab9d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gryllomorpha_dalmatina01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gryllomorpha_dalmatina01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"252\" style=\"background-color:#b4b2aa\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Locusta-migratoria-wanderheuschrecke.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Locusta-migratoria-wanderheuschrecke.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#9a8d54\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Locusts_Saad.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Locusts_Saad.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#919191\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pachyrhamma_waitomoensis_aggregation.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pachyrhamma_waitomoensis_aggregation.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#b38444\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Schizodactylus_monstrosus_Rajasthan.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Schizodactylus_monstrosus_Rajasthan.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#ad955e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jerusalemcricket.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Jerusalemcricket.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"320\" style=\"background-color:#7e6b5e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leaf_Grasshopper_%28Systella_sp.%29_%288742072742%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leaf_Grasshopper_%28Systella_sp.%29_%288742072742%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"199\" style=\"background-color:#36341d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eumastax_zumuniana.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eumastax_zumuniana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#303518\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Horsehead_Grasshopper_%28Pseudoproscopia_scabra%29%2C_Tambopata_Lodge.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Horsehead_Grasshopper_%28Pseudoproscopia_scabra%29%2C_Tambopata_Lodge.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#314014\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grouse_Locust_%28Potua_sp.%29_%2823289516379%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grouse_Locust_%28Potua_sp.%29_%2823289516379%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#705d22\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gryllus_campestris_female_%284724690375%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gryllus_campestris_female_%284724690375%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#78644d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_phasmatodea\" class=\"tree_box\"><span><span>Phasmatodea</span><a href=\"https://en.wikipedia.org/wiki/Phasmatodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Phasmatodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Phasmatodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Phasmatodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Phasmatodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(stick instects)</span><p class=\"tag\">Nocturnal herbivors known for having either cylindrical stick-like shapes or flattened leaflike shapes and camouflage well and the first of their three segments in their thorax is being shorter. They have chewing mandibles, long and slender legs, and long and slender antennae. Wings are reduced when present and then the thorax is longer to accomodate the the flight muscles.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ctenomorpha_chronus02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ctenomorpha_chronus02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"307\" style=\"background-color:#9f9182\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cryptophyllium_celebicum_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cryptophyllium_celebicum_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7b7e6e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acanthomenexenus_polyacanthus_-_even_adult_male1.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Acanthomenexenus_polyacanthus_-_even_adult_male1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#9cb075\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stick_Insect_%28Parectatosoma_sp.%29%2C_Vohimana_reserve%2C_Madagascar_%2812264302936%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stick_Insect_%28Parectatosoma_sp.%29%2C_Vohimana_reserve%2C_Madagascar_%2812264302936%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#121108\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Agathemera_maculafulgens_%288388995384%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Agathemera_maculafulgens_%288388995384%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"430\" style=\"background-color:#c9a18f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phyllium_bilobatum%2C_male_larva.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Phyllium_bilobatum%2C_male_larva.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"294\" style=\"background-color:#838a6b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fl%C3%BCgel_Peruphasma_schultei.jpg\" target=\"_blank\"><img src=\"thumbnails/Fl%C3%BCgel_Peruphasma_schultei.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"243\" height=\"220\" style=\"background-color:#453639\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Haaniella_dehaanii-subadult_threaten_female.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Haaniella_dehaanii-subadult_threaten_female.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#63493a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dares_ulula_P%C3%A4rchen.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dares_ulula_P%C3%A4rchen.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"318\" style=\"background-color:#767573\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_embioptera\" class=\"tree_box\"><span><span>Embioptera</span><a href=\"https://en.wikipedia.org/wiki/Embioptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Embioptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Embioptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Embioptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Embioptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(webspinners)</span><p class=\"tag\">They have long, flexible bodies and short legs with the lower segment of the front limbs enlarged and modified for silk production. They males do not feed and die soon after mating. Only the males have wings but not in all species. They live subsocially in galleries spun of silk. They are generalist herbivores.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Notoligotoma_nitens.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Notoligotoma_nitens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#dddcd9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Metoligotoma_tasmanica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Metoligotoma_tasmanica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#ca6d18\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diradius_vandykei.jpg\" target=\"_blank\"><img src=\"thumbnails/Diradius_vandykei.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"1316\" height=\"987\" style=\"background-color:#9a847d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_plecoptera\" class=\"tree_box\"><span><span>Plecoptera</span><a href=\"https://en.wikipedia.org/wiki/Plecoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Plecoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Plecoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Plecoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Plecoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(stoneflies)</span><p class=\"tag\">Named for the braided ladder-like pattern their veins make across their wings. They have long antennae and cerci; and their wings fold flat and extend past tip of abdomen. The nymphs are aquatic; usually herbivorous with some being hunters;  and live in the floor of well-oxygenated lakes and streams. Some adults do not feed at all, but those that do are herbivorous.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Perlidae_P1400217a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Perlidae_P1400217a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"191\" style=\"background-color:#7c7e7d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chloroperlidae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chloroperlidae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#1d150a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Soliperla_sierra.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Soliperla_sierra.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"243\" style=\"background-color:#546c2e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amphinemura.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amphinemura.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"296\" style=\"background-color:#928e87\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Small_Winter_Stonefly_-_Allocapnia_species%3F%2C_Riverbend_Park%2C_Great_Falls%2C_Virginia_-_13007749435.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Small_Winter_Stonefly_-_Allocapnia_species%3F%2C_Riverbend_Park%2C_Great_Falls%2C_Virginia_-_13007749435.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"397\" style=\"background-color:#b4a18c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Plecoptera_-_exuvia.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Plecoptera_-_exuvia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a6987a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thaumatoperla_robusta.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Thaumatoperla_robusta.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#3a451f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stenoperla_prasina.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stenoperla_prasina.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7c7e78\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SteinfliegenLarve2.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-SteinfliegenLarve2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#b5a688\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eusthenia_sp.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eusthenia_sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#6a6a5a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_dermaptera\" class=\"tree_box\"><span><span>Dermaptera</span><a href=\"https://en.wikipedia.org/wiki/Dermaptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dermaptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dermaptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Dermaptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Dermaptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(earwigs)</span><p class=\"tag\">They have a pair of forceps-like pincers on their abdomen, and membranous wings folded underneath short, rarely used forewings. Some groups are tiny parasites on mammals and lack the typical pincers. They are mostly scavengers or herbivores that are mostly nocturnal and oten hide during the day.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Forficula_auricularia.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Forficula_auricularia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"317\" style=\"background-color:#e2e6e5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Forficula.auricularia.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Forficula.auricularia.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"426\" style=\"background-color:#a99e28\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nesting_Earwig_Chester_UK_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nesting_Earwig_Chester_UK_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#7b736b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Adiathetus_tenebrator_iruppu.jpg\" target=\"_blank\"><img src=\"thumbnails/Adiathetus_tenebrator_iruppu.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"537\" height=\"420\" style=\"background-color:#7b7969\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_zoraptera\" class=\"tree_box\"><span><span>Zoraptera</span><a href=\"https://en.wikipedia.org/wiki/Zoraptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Zoraptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Zoraptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Zoraptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Zoraptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(angel insects)</span><p class=\"tag\">Small and soft bodied insects with two forms: winged with wings sheddable as in termites, dark and with eyes and ocelli; or wingless, pale and without eyes or ocelli. They have a characteristic nine-segmented beaded antenna. They have mouthparts adapted for chewing and are mostly found under bark, in dry wood or in leaf litter.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Zorotypus_from_Los_Bancos%2C_Pichincha%2C_Ecuador.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Zorotypus_from_Los_Bancos%2C_Pichincha%2C_Ecuador.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#3f3023\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zorotypus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Zorotypus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7c4d39\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_mantodea\" class=\"tree_box\"><span><span>Mantodea</span><a href=\"https://en.wikipedia.org/wiki/Mantodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mantodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mantodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mantodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Mantodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(mantises)</span><p class=\"tag\">They have triangular heads with bulging eyes supported on flexible necks, raptorial front legs for catching and gripping prey, an upright posture and elongated bodies. They are mostly ambush predators. Females sometimes practice sexual cannibalism.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Mantis_%28European%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mantis_%28European%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#18251a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wandering_Violin_Mantis_%28Gongylus_gongylodes%29_Photograph_By_Shantanu_Kuveskar.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Wandering_Violin_Mantis_%28Gongylus_gongylodes%29_Photograph_By_Shantanu_Kuveskar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"285\" style=\"background-color:#69863a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gottesanbeterin_Abwehr.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Gottesanbeterin_Abwehr.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#9c998a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Choeradodis_stalii_MHNT_dos.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Choeradodis_stalii_MHNT_dos.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"210\" style=\"background-color:#2f321e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Large_brown_mantid_close_up_nohair.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Large_brown_mantid_close_up_nohair.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#2c241d\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Polyneoptera_Blattodea\"><label class=\"tree_label\" for=\"Polyneoptera_Blattodea\"></label><div class=\"outer_tree_box\"><div id=\"insecta_blattodea\" class=\"tree_box\"><span><span>Blattodea</span><a href=\"https://en.wikipedia.org/wiki/Blattodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Blattodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Blattodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Blattodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Blattodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(cockroaches, termites)</span><p class=\"tag\">The cockroaches and termites. Cockroaches are flattened dorsolaterally and are roughly oval with a shield-like plate covering the thorax and posterior region of the head, long thread-like antennae, and two short, multi-segmented protrusions from the rear.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Termites_marked_with_traceable_protiens.jpg\" target=\"_blank\"><img src=\"thumbnails/Termites_marked_with_traceable_protiens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"252\" height=\"167\" style=\"background-color:#53474c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:American-cockroach.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-American-cockroach.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"200\" style=\"background-color:#cdc7c6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cryptocercus_clevelandi.jpg\" target=\"_blank\"><img src=\"thumbnails/Cryptocercus_clevelandi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"696\" height=\"391\" style=\"background-color:#8d8582\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blatta_orientalis_male_from_Botevgrad%2C_Bulgaria_01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Blatta_orientalis_male_from_Botevgrad%2C_Bulgaria_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#c3c4c3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Domino_cockroach_Therea_petiveriana.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Domino_cockroach_Therea_petiveriana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7e5d3e\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_termitoidae\" class=\"tree_box\"><span><span>Termitoidae</span><a href=\"https://en.wikipedia.org/wiki/Termitoidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Termitoidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Termitoidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Termitoidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Epifamily</span></span><span class=\"common_names\">(termites)</span><p class=\"tag\">Detritophagous eusocial cockroaches that consume a variety of decaying plant material. They have antennae that resemble a string of beads and a wide junction between thorax and abdomen. The worker caste is a soft-bodied, unpigmented, often blind and are diploid individuals of both sexes that develop from fertilised eggs. The soldier class have larger heads with prominent mandibles and are often blind. The winged males and females usually have eyes and will pair to create a new colony after a nuptial flight.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Termites_marked_with_traceable_protiens.jpg\" target=\"_blank\"><img src=\"thumbnails/Termites_marked_with_traceable_protiens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"252\" height=\"167\" style=\"background-color:#53474c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Isoptera.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Isoptera.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7e6555\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flying_Termites_after_rain.jpg\" target=\"_blank\"><img src=\"thumbnails/Flying_Termites_after_rain.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"532\" style=\"background-color:#26231f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Termitenh%C3%BCgel_Namibia.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Termitenh%C3%BCgel_Namibia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#d8ab8b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:K8085-21.jpg\" target=\"_blank\"><img src=\"thumbnails/K8085-21.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"408\" style=\"background-color:#6fa9af\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Workers_%26_Soldiers.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Workers_%26_Soldiers.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"156\" style=\"background-color:#9a8572\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Polyneoptera_Notoptera\"><label class=\"tree_label\" for=\"Polyneoptera_Notoptera\"></label><div class=\"outer_tree_box\"><div id=\"insecta_notoptera\" class=\"tree_box\"><span><span>Notoptera</span><a href=\"https://en.wikipedia.org/wiki/Notoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Notoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Notoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Notoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(ice crawlers, gladiators)</span><p class=\"tag\">They have long antennae but no wings, even as adults. They have mandibles adapted for biting with the lower jaw longer than the upper jaw.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Grylloblattidae_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grylloblattidae_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"178\" style=\"background-color:#dfddda\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mantophasma_zephyra_Zompro_et_al_2002.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mantophasma_zephyra_Zompro_et_al_2002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#d4d4c8\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_grylloblattodea\" class=\"tree_box\"><span><span>Grylloblattodea</span><a href=\"https://en.wikipedia.org/wiki/Grylloblattodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Grylloblattodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Grylloblattodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Grylloblattodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Grylloblattodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(ice crawlers)</span><p class=\"tag\">They live in the cold on top of mountains and the edges of glaciers or in caves, have long cerci, their eyes are either missing or reduced, and most species are less than 3 cm long. Most are nocturnal and feed primarily on dead arthropods and carrion but can survive on plant material. Their optimal living temperature is usually between 1–4 °C and most will die with temperatures above 10 °C so they in colder temperatures they live under snow pack near the soil.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Galloisiana_kiyosawai.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Galloisiana_kiyosawai.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#7e766f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grylloblattidae_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grylloblattidae_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"178\" style=\"background-color:#dfddda\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grylloblatta_scudderi%2C_Squamish-Lillooet%2C_British_Columbia_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grylloblatta_scudderi%2C_Squamish-Lillooet%2C_British_Columbia_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#c7aa9a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Endemic_Grylloblattid_%2810334180636%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Endemic_Grylloblattid_%2810334180636%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#906545\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_mantophasmatodea\" class=\"tree_box\"><span><span>Mantophasmatodea</span><a href=\"https://en.wikipedia.org/wiki/Mantophasmatodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mantophasmatodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mantophasmatodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mantophasmatodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Mantophasmatodea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(gladiators)</span><p class=\"tag\">Nocturnal carnivores with short cerci that live in rock crevices. They are rate and only found in parts of southern Africa. During courtship, they communicate using vibrations transmitted through the ground or substrate</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Mantophasma_zephyra_Zompro_et_al_2002.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mantophasma_zephyra_Zompro_et_al_2002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#d4d4c8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Karoophasma_biedouwensis_15669932.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Karoophasma_biedouwensis_15669932.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#b3b5da\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kuboesphasma_compactum_%2810.3897-zookeys.746.14885%29_Figure_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Kuboesphasma_compactum_%2810.3897-zookeys.746.14885%29_Figure_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"265\" style=\"background-color:#25241b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Minutophasma_richtersveldense_%2810.3897-zookeys.746.14885%29_Figure_10.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Minutophasma_richtersveldense_%2810.3897-zookeys.746.14885%29_Figure_10.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"287\" style=\"background-color:#99926a\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Neoptera_Holometabola\"><label class=\"tree_label\" for=\"Neoptera_Holometabola\"></label><div class=\"outer_tree_box\"><div id=\"insecta_holometabola\" class=\"tree_box\"><span><span>Holometabola</span><a href=\"https://en.wikipedia.org/wiki/Holometabola\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Holometabola\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Holometabola\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Holometabola\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">They undergo complete metamorphosis and go through distinctive life stages: egg, larva, pupa, and adult. Larval traits maximize feeding, growth, and development. Adult traits enable dispersal, mating, and egg laying. The pupa is usually a quiescent, non-feeding developmental stage and most move very little, sometimes enclosed in other structures like cocoons, nests, or shells.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Fesoj_-_Papilio_machaon_%28by%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fesoj_-_Papilio_machaon_%28by%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#755c39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apis_mellifera_Western_honey_bee.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apis_mellifera_Western_honey_bee.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"274\" style=\"background-color:#68711d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_Ant_-_March_2025.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red_Ant_-_March_2025.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#9d8f8f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coleoptera_collage.png\" target=\"_blank\"><img src=\"thumbnails/330px-Coleoptera_collage.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"315\" style=\"background-color:#d7d2cc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:A_pupa_of_Euploea_core_%28Cramer%2C_1780%29_-_Common_Crow_WLB.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-A_pupa_of_Euploea_core_%28Cramer%2C_1780%29_-_Common_Crow_WLB.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#688315\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dwarf_birch_spinner_%28Eriogaster_arbusculae%29_cocoon_Dovrefjell.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dwarf_birch_spinner_%28Eriogaster_arbusculae%29_cocoon_Dovrefjell.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"179\" style=\"background-color:#64674f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nacimiento_de_una_Dryas_iulia%2C_Mariposario_de_Icod_de_los_Vinos%2C_Tenerife%2C_Espa%C3%B1a%2C_2012-12-13%2C_DD_03.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nacimiento_de_una_Dryas_iulia%2C_Mariposario_de_Icod_de_los_Vinos%2C_Tenerife%2C_Espa%C3%B1a%2C_2012-12-13%2C_DD_03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"332\" style=\"background-color:#897c71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ontwikkelstadia_wespenpoppen.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Ontwikkelstadia_wespenpoppen.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"349\" style=\"background-color:#b5ad9a\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_neuroptera\" class=\"tree_box\"><span><span>Neuroptera</span><a href=\"https://en.wikipedia.org/wiki/Neuroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Neuroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Neuroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Neuroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(lacewings, mantidflies, antlions)</span><p class=\"tag\">The net-winged insects. Adults have two pairs of membranous wings with an extensive pattern of veins and crossveins that give them a lacy appearance. The larvae are specialised predators, with elongated mandibles adapted for piercing and sucking. Adults of many groups are also predatory, but some do not feed, or consume only nectar.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Crisopid_July_2013-9a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Crisopid_July_2013-9a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"169\" style=\"background-color:#c0c5c9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mantispa_styriaca_%289566952168%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mantispa_styriaca_%289566952168%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#a2935f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Distoleon_tetragrammicus01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Distoleon_tetragrammicus01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"239\" style=\"background-color:#ca9857\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Common_Antlion_Myrmeleon_immaculatus_mature_nymph.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Common_Antlion_Myrmeleon_immaculatus_mature_nymph.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"246\" style=\"background-color:#695c4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Antlion_trap.jpg\" target=\"_blank\"><img src=\"thumbnails/Antlion_trap.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#7b6e65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pleasing_Lacewing_Female_-_Flickr_-_treegrow_%282%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pleasing_Lacewing_Female_-_Flickr_-_treegrow_%282%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#926430\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pseudomallada_edwardsi_AF_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudomallada_edwardsi_AF_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"222\" style=\"background-color:#626b51\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zeugomantispa_minuta_P1030119a.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Zeugomantispa_minuta_P1030119a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"247\" style=\"background-color:#72574f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brown_Lacewing_Larva_%2830941270143%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Brown_Lacewing_Larva_%2830941270143%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7e8740\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rapisma_tamilanum_India.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rapisma_tamilanum_India.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#5b6822\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nemoptera_sp._MHNT.ZOO.2004.0.736.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nemoptera_sp._MHNT.ZOO.2004.0.736.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#dcd4d2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Owlfly_%28Libelloides_macaronius%29_female_Istria.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Owlfly_%28Libelloides_macaronius%29_female_Istria.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#9c936e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_strepsiptera\" class=\"tree_box\"><span><span>Strepsiptera</span><a href=\"https://en.wikipedia.org/wiki/Strepsiptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Strepsiptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Strepsiptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Strepsiptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Strepsiptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">The twisted-wing insects. They are endoparasites of other insects with a parasitic larval stage. In most species the female does not leave its host and remains larviform (legless and wingless), protruding between segments of the host&#x27;s abdomen. The adult males hindwings are generally fan-shaped; their forewings are modified to be small and club-shaped; their mouthparts cannot be used for feeding; their eyes have a blackberry-like appearance; and their antennae are often branched.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Stylops_melittae_m3.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Stylops_melittae_m3.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#b2967f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stylops_melittae_f1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Stylops_melittae_f1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#575454\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Xenos_peckii_head_closeup.png\" target=\"_blank\"><img src=\"thumbnails/330px-Xenos_peckii_head_closeup.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"222\" style=\"background-color:#454545\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Andrena_nivalis%2C_stylopid%2C_U%2C_Cocos_Co.%2C_NH%2C_back_2015-07-13-15.57.01_ZS_PMax_%28cropped2%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Andrena_nivalis%2C_stylopid%2C_U%2C_Cocos_Co.%2C_NH%2C_back_2015-07-13-15.57.01_ZS_PMax_%28cropped2%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#715a44\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Strepsiptera.png\" target=\"_blank\"><img src=\"thumbnails/250px-Strepsiptera.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"245\" style=\"background-color:#d5cabd\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_megaloptera\" class=\"tree_box\"><span><span>Megaloptera</span><a href=\"https://en.wikipedia.org/wiki/Megaloptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Megaloptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Megaloptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Megaloptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Megaloptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(alderflies, dobsonflies, fishflies)</span><p class=\"tag\">Adults have large, nearly equal sized wings with crossveins near leading edge and a pleated region on their hindwings to help them fold over the abdomen; their antennae are prominent; and they have strong mandibles apparently adapted for chewing but many species do not eat as adults. The larvae live in fresh water; have large heads and elongated bodies; possess strong jaws that they use to capture their prey; and are carnivorous feeding on small invertebrates.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Corydalus_affinis%2C_Pacaraima_-_RR%2C_69345-000%2C_Brasil_imported_from_iNaturalist_photo_203073948.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Corydalus_affinis%2C_Pacaraima_-_RR%2C_69345-000%2C_Brasil_imported_from_iNaturalist_photo_203073948.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"210\" style=\"background-color:#b8a592\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Protosialis_americana_PCCA20050708-9036A.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Protosialis_americana_PCCA20050708-9036A.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"208\" style=\"background-color:#627c12\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Other_Wondrous_Things_Dark_Fishfly_%2847947964738%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Other_Wondrous_Things_Dark_Fishfly_%2847947964738%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"293\" style=\"background-color:#adaaa5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Taeniochauliodes.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Taeniochauliodes.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"147\" style=\"background-color:#a07054\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chloronia_osae.jpg\" target=\"_blank\"><img src=\"thumbnails/Chloronia_osae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"378\" height=\"500\" style=\"background-color:#777041\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Platyneuromus_soror.jpg\" target=\"_blank\"><img src=\"thumbnails/Platyneuromus_soror.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"520\" height=\"300\" style=\"background-color:#d1baaf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sialis_lutaria_larva_%28aka%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sialis_lutaria_larva_%28aka%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"211\" style=\"background-color:#b29677\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dobsonfly_Corydalus_cornutus_larvae.jpg\" target=\"_blank\"><img src=\"thumbnails/Dobsonfly_Corydalus_cornutus_larvae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"220\" height=\"139\" style=\"background-color:#8a8563\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_raphidioptera\" class=\"tree_box\"><span><span>Raphidioptera</span><a href=\"https://en.wikipedia.org/wiki/Raphidioptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Raphidioptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Raphidioptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Raphidioptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Raphidioptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(snakeflies)</span><p class=\"tag\">The adults body is long and slender, has a mobile head and two pairs of long, membranous wings that are prominently veined. Females usually have a long ovipositor that is used to deposit eggs into crevices or under bark. The larvae develop under the bark of trees and have large heads with projecting mandibles with long bodies. Both adults and larvae are predators of soft-bodied arthropods.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Dichrostigma_flavipes_beentree.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dichrostigma_flavipes_beentree.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"268\" style=\"background-color:#829854\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Raphidia_ophiopsis_M_NL-Doorwerth-19540617_right_wing_-_collection_Naturalis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Raphidia_ophiopsis_M_NL-Doorwerth-19540617_right_wing_-_collection_Naturalis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9c7d60\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhaphidioptera-larva.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rhaphidioptera-larva.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#aba39f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_trichoptera\" class=\"tree_box\"><span><span>Trichoptera</span><a href=\"https://en.wikipedia.org/wiki/Trichoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Trichoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Trichoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Trichoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Trichoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(caddisflies)</span><p class=\"tag\">The adult is a medium-sized insect with membranous, hairy wings, which are held in a tent-wise fashion when the insect is at rest. The antennae are fairly long and threadlike, the mouthparts are reduced in size and the legs have five lower leg joints. The larvae are aquatic and may be predators, leaf shredders, algal grazers, or collectors of particles from the water column and benthos. The larvae of many species use silk to make protective cases, which are often strengthened with gravel, sand, twigs, or other debris. Most adults have short lives during which they do not feed.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:RHYACOPHILA_DORSALIS_Male_Pont_Forge_de_Sailly_Watigny_02_MHNT.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-RHYACOPHILA_DORSALIS_Male_Pont_Forge_de_Sailly_Watigny_02_MHNT.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"279\" style=\"background-color:#f2efe9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caddisfly_Larva.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caddisfly_Larva.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#c1c0be\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trichoptera_larvenbau.jpeg\" target=\"_blank\"><img src=\"thumbnails/Trichoptera_larvenbau.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"627\" height=\"528\" style=\"background-color:#91abb5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Philopotamidae_Notch.jpg\" target=\"_blank\"><img src=\"thumbnails/Philopotamidae_Notch.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#b06658\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tinodes_assimilis%2C_Psychomyiidae%2C_Glaslyn_marsh%2C_North_Wales%2C_July_2014_%281%29_%2818035673942%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tinodes_assimilis%2C_Psychomyiidae%2C_Glaslyn_marsh%2C_North_Wales%2C_July_2014_%281%29_%2818035673942%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"152\" style=\"background-color:#8f8a80\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Notidobia.ciliaris.jpg\" target=\"_blank\"><img src=\"thumbnails/Notidobia.ciliaris.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"427\" style=\"background-color:#a7b47c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_mecoptera\" class=\"tree_box\"><span><span>Mecoptera</span><a href=\"https://en.wikipedia.org/wiki/Mecoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mecoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mecoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mecoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Mecoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(scorpionflies, hangingflies, earwigflies)</span><p class=\"tag\">Adults are small to medium-sized insects with long beaklike rostra; an elongated head with chewing mouthparts; membranous wings that extend beyond abdomen; slender, elongated bodies; and are mostly scavengers, feeding on decaying vegetation and dead invertebrates. The larvae are caterpillar-like and mostly feed on vegetable matter. Both larvae and adults are omnivorous. Males of the scorpionfly group have enlarged genitals raised over the body that look similar to the stingers of scorpions.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Scorpionfly_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scorpionfly_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"209\" style=\"background-color:#dad4d2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Skorpionsfliege_Panorpa_communis_male_full_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Skorpionsfliege_Panorpa_communis_male_full_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"197\" style=\"background-color:#869b6b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bittacidae_fg1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Bittacidae_fg1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"307\" style=\"background-color:#737771\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Skorpionsfliege_Panorpa_communis_male_genital.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Skorpionsfliege_Panorpa_communis_male_genital.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#666310\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Boreus_hyemalis_female.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Boreus_hyemalis_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#bcb573\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scorpionfly_%285584476733%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Scorpionfly_%285584476733%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"335\" style=\"background-color:#8d7d4d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Notiothauma_reedi.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Notiothauma_reedi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"296\" style=\"background-color:#c38762\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Merope_tuber_dorsal_view_-_ZooKeys-269-051-g007A.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Merope_tuber_dorsal_view_-_ZooKeys-269-051-g007A.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"246\" style=\"background-color:#9b978f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_siphonaptera\" class=\"tree_box\"><span><span>Siphonaptera</span><a href=\"https://en.wikipedia.org/wiki/Siphonaptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Siphonaptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Siphonaptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Siphonaptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Siphonaptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(fleas, jiggers)</span><p class=\"tag\">Small flightless insects that live as external parasites of mammals and birds feeding on the blood of their hosts. They grow to be 3 millimetres long, and have bodies that are narrow to better move through their hosts&#x27; fur or feathers. Their hind legs are extremely well adapted for jumping.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Flea_Scanning_Electron_Micrograph_False_Color.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Flea_Scanning_Electron_Micrograph_False_Color.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"323\" style=\"background-color:#836948\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vogelfloehe.2.jpg\" target=\"_blank\"><img src=\"thumbnails/Vogelfloehe.2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"412\" height=\"404\" style=\"background-color:#c0bbae\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tunga_penetrans_%281%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Tunga_penetrans_%281%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#94634f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flea_Larva.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Flea_Larva.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"270\" style=\"background-color:#afa298\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%D0%9A%D0%BE%D1%88%D0%B0%D1%87%D1%8C%D1%8F_%D0%B1%D0%BB%D0%BE%D1%85%D0%B0.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%D0%9A%D0%BE%D1%88%D0%B0%D1%87%D1%8C%D1%8F_%D0%B1%D0%BB%D0%BE%D1%85%D0%B0.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#3b270a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:A_dog_flea_%28Ctenocephalides_canis%29%3B_adult%2C_pupa%2C_egg_and_lar_Wellcome_V0022501EL.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-A_dog_flea_%28Ctenocephalides_canis%29%3B_adult%2C_pupa%2C_egg_and_lar_Wellcome_V0022501EL.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"426\" style=\"background-color:#b6aea4\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_hymenoptera\" class=\"tree_box\"><span><span>Hymenoptera</span><a href=\"https://en.wikipedia.org/wiki/Hymenoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hymenoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hymenoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hymenoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Hymenoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"hymenoptera\">See children</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(sawflies, wasps, ants, bees)</span><p class=\"tag\">Adults range from very small to large insects; have well-developed mandibles adapted for chewing; many species have a long proboscis for drinking nector; and hindwings connected to the forewings by a series of hooks. Many of the species are parasitic. Females typically have an ovipositor for inserting eggs into hosts and this is often modified into a stinger. A large sub group are known for their &#x27;wasp-waist&#x27;.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Wasp_March_2008-3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wasp_March_2008-3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#5a5d41\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apis_mellifera_Western_honey_bee.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apis_mellifera_Western_honey_bee.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"274\" style=\"background-color:#68711d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Meat_eater_ant_feeding_on_honey02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Meat_eater_ant_feeding_on_honey02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#d8d5d5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:XN_Tenthredo_mesomela.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-XN_Tenthredo_mesomela.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"182\" style=\"background-color:#aad40b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bienenwabe_mit_Eiern_und_Brut_5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bienenwabe_mit_Eiern_und_Brut_5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#a06d21\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ants_and_Eggs_-_geograph.org.uk_-_726733.jpg\" target=\"_blank\"><img src=\"thumbnails/Ants_and_Eggs_-_geograph.org.uk_-_726733.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#6e6559\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pupae_of_an_S._invicta_queen.png\" target=\"_blank\"><img src=\"thumbnails/330px-Pupae_of_an_S._invicta_queen.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#656e5a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_lepidoptera\" class=\"tree_box\"><span><span>Lepidoptera</span><a href=\"https://en.wikipedia.org/wiki/Lepidoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lepidoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lepidoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lepidoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Lepidoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌlɛpɪˈdɒptərə\" target=\"_blank\">ˌlɛpɪˈdɒptərə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(butterflies, moths, caterpillars)</span><p class=\"tag\">Characterised by scales that cover the bodies, large triangular wings, and a coiled proboscis for siphoning nectars. The scales are modified hairs and give them their wide variety of colors and patterns. Mating and the laying of eggs is normally performed near or on host plants for the larvae. The larvae, caterpillars, have a cylindrical body with a well-developed head, mandible mouth parts, three pairs of thoracic legs and from none up to five pairs of prolegs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Fesoj_-_Papilio_machaon_%28by%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fesoj_-_Papilio_machaon_%28by%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#755c39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Giant_grey_moth.png\" target=\"_blank\"><img src=\"thumbnails/330px-Giant_grey_moth.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"259\" style=\"background-color:#cfcac8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:RhetusButterfly.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-RhetusButterfly.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"288\" style=\"background-color:#694734\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Deilephila_elpenor_04.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Deilephila_elpenor_04.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#5e4c34\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chrysalis5504.jpg\" target=\"_blank\"><img src=\"thumbnails/Chrysalis5504.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"300\" height=\"461\" style=\"background-color:#717869\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Group_of_Melitaea_athalia_near_Warka%2C_Poland.PNG\" target=\"_blank\"><img src=\"thumbnails/330px-Group_of_Melitaea_athalia_near_Warka%2C_Poland.PNG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"239\" style=\"background-color:#837c70\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hummingbird_hawkmoth_a.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hummingbird_hawkmoth_a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#d2666a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Peacock_butterfly_%28Aglais_io%29_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Peacock_butterfly_%28Aglais_io%29_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5e4c3f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Arctiidae_caterpillar_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Arctiidae_caterpillar_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#715d4d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Heliconius_mimicry.png\" target=\"_blank\"><img src=\"thumbnails/250px-Heliconius_mimicry.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"251\" style=\"background-color:#b9a790\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chenille_de_Grand_porte_queue_%28macaon%29_Fausses_pattes.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chenille_de_Grand_porte_queue_%28macaon%29_Fausses_pattes.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#323222\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caterpillar_face_close_up.jpg\" target=\"_blank\"><img src=\"thumbnails/Caterpillar_face_close_up.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"682\" height=\"554\" style=\"background-color:#7c6e41\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_diptera\" class=\"tree_box\"><span><span>Diptera</span><a href=\"https://en.wikipedia.org/wiki/Diptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Diptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Diptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Diptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Diptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(true flies, lovebugs, midges, mosquitoes, wireworms, metallic flat-headed wood borers)</span><p class=\"tag\">Adults only use a single pair of wings to fly since the hindwings have evolved into sensory orgrans to perform advanced aerobatics; have a mobile head; a pair of large compound eyes; and mouthparts designed eithern for piercing and sucking, or for lapping and sucking. The eggs are often laid on the larval food-source and the larvae, which lack true limbs, develop in a protected environment, often inside their food source. Other species opportunistically deposit hatched or hatching larvae instead of eggs on carrion, dung, decaying material, or open wounds of mammals.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Musca_domestica_housefly.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Musca_domestica_housefly.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#b47b65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Klegg_%2835325924364%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Klegg_%2835325924364%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"209\" style=\"background-color:#bbbcb1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ctenophora_pectinicornis_bl.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ctenophora_pectinicornis_bl.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#706860\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mosquito_Tasmania_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mosquito_Tasmania_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#9b7651\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Prionocera_turcica.jpg\" target=\"_blank\"><img src=\"thumbnails/Prionocera_turcica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"420\" style=\"background-color:#848b84\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Maggia_fg34.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Maggia_fg34.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"222\" style=\"background-color:#4e3f29\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Robber_Fly_with_prey_%28Holcocephala_fusca%29_by_Thomas_Shahan.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Robber_Fly_with_prey_%28Holcocephala_fusca%29_by_Thomas_Shahan.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"241\" style=\"background-color:#a1b749\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grosser_Wollschweber_Bombylius_major.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grosser_Wollschweber_Bombylius_major.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"297\" style=\"background-color:#c5b39d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mydas_sp..JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Mydas_sp..JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#cd8f67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stomoxys-stable-fly-life-cycle-2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Stomoxys-stable-fly-life-cycle-2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"243\" style=\"background-color:#886c4f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"insecta_coleoptera\" class=\"tree_box\"><span><span>Coleoptera</span><a href=\"https://en.wikipedia.org/wiki/Coleoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Coleoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Coleoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Coleoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><a href=\"https://genent.cals.ncsu.edu/insect-identification/order-Coleoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_ncstate.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=koʊliːˈɒptɛrə\" target=\"_blank\">koʊliːˈɒptɛrə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(beetles, Maybug, ladybugs, scarabs, weevils, fireflies, glowworms, grubs)</span><p class=\"tag\">Adults front pair of wings are hardened into wing-cases that meet in a straight line down the center of the back; typically have a particularly hard exoskeleton; most have mandibles that move in a horizontal plane; They feed on plants and fungi, break down animal and plant debris, or eat other invertebrates. The larvae are commonly called grubs; and typically have elongated bodies with chewing mouthparts and poorly developed eyes.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Coleoptera_collage.png\" target=\"_blank\"><img src=\"thumbnails/330px-Coleoptera_collage.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"315\" style=\"background-color:#d7d2cc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coleoptera_SMNK.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Coleoptera_SMNK.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"364\" style=\"background-color:#6a694f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cetonia-aurata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cetonia-aurata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"275\" style=\"background-color:#928c63\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dynastes_hercules_ecuatorianus_MHNT.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dynastes_hercules_ecuatorianus_MHNT.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#b9b3b1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scarabaeus_laticollis_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scarabaeus_laticollis_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#8f8068\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Temognatha_alternata_Jewel_Beetle_Cooktown.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Temognatha_alternata_Jewel_Beetle_Cooktown.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"235\" style=\"background-color:#bec38f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:BIEDRONA_mirrored%2C_cropped.png\" target=\"_blank\"><img src=\"thumbnails/250px-BIEDRONA_mirrored%2C_cropped.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"243\" style=\"background-color:#606215\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Weevil3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Weevil3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"272\" style=\"background-color:#c4c0bf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Head_of_the_Weaver_Beetle_%28Lamia_textor%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Head_of_the_Weaver_Beetle_%28Lamia_textor%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"222\" style=\"background-color:#666f48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Polyphylla_fullo_up.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Polyphylla_fullo_up.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"284\" style=\"background-color:#827459\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hercules_beetle_%28larva%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hercules_beetle_%28larva%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"445\" style=\"background-color:#8b7894\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Photuris_lucicrescens.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Photuris_lucicrescens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#869a57\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phengodes_species%2C_U%2C_Right%2C_U_2013-07-18-15.54.20_ZS_PMax_%289335901793%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phengodes_species%2C_U%2C_Right%2C_U_2013-07-18-15.54.20_ZS_PMax_%289335901793%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#23170d\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul>")
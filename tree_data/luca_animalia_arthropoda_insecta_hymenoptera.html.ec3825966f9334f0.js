@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_arthropoda_insecta_hymenoptera","<ul class=\"tree\" data-tree-range=\"hymenoptera\"><li><input type=\"checkbox\" checked id=\"Holometabola_Hymenoptera\"><label class=\"tree_label\" for=\"Holometabola_Hymenoptera\"></label><div class=\"outer_tree_box\"><div id=\"hymenoptera_hymenoptera\" class=\"tree_box\"><span><span>Hymenoptera</span><a href=\"https://en.wikipedia.org/wiki/Hymenoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hymenoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hymenoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hymenoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"insecta\">See parent</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(sawflies, wasps, ants, bees)</span><p class=\"tag\">Adults range from very small to large insects; have well-developed mandibles adapted for chewing; many species have a long proboscis for drinking nector; and hindwings connected to the forewings by a series of hooks. Many of the species are parasitic. Females typically have an ovipositor for inserting eggs into hosts and this is often modified into a stinger. A large sub group are known for their &#x27;wasp-waist&#x27;.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Wasp_March_2008-3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wasp_March_2008-3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#5a5d41\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apis_mellifera_Western_honey_bee.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apis_mellifera_Western_honey_bee.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"274\" style=\"background-color:#68711d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Meat_eater_ant_feeding_on_honey02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Meat_eater_ant_feeding_on_honey02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#d8d5d5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:XN_Tenthredo_mesomela.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-XN_Tenthredo_mesomela.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"182\" style=\"background-color:#aad40b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bienenwabe_mit_Eiern_und_Brut_5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bienenwabe_mit_Eiern_und_Brut_5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#a06d21\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ants_and_Eggs_-_geograph.org.uk_-_726733.jpg\" target=\"_blank\"><img src=\"thumbnails/Ants_and_Eggs_-_geograph.org.uk_-_726733.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#6e6559\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pupae_of_an_S._invicta_queen.png\" target=\"_blank\"><img src=\"thumbnails/330px-Pupae_of_an_S._invicta_queen.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#656e5a\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_symphyta\" class=\"tree_box\"><span><span>Symphyta</span><a href=\"https://en.wikipedia.org/wiki/Symphyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Symphyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Symphyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Symphyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(sawflies)</span><p class=\"tag\">A paraphyletic grouping of basal groups that are all commonly called sawflies. Their ovipositor has a saw-like appearance and the females use it to cut into the plants to they lay their eggs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Xyelapusilla.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Xyelapusilla.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"224\" style=\"background-color:#e7e2d6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diprionpini_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Diprionpini_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"201\" style=\"background-color:#e4dbd0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caenolyda_reticulata_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Caenolyda_reticulata_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"220\" style=\"background-color:#dacec8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hartigia_linearis.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hartigia_linearis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"235\" style=\"background-color:#f1eee8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hymenoptera_Vielfalt_Horntail.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hymenoptera_Vielfalt_Horntail.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"271\" style=\"background-color:#eae9e6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Xiphydria_prolongata_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Xiphydria_prolongata_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"215\" style=\"background-color:#ede8d9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Orussus_coronatus.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Orussus_coronatus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"256\" style=\"background-color:#e1d8cc\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Hymenoptera_Apocrita\"><label class=\"tree_label\" for=\"Hymenoptera_Apocrita\"></label><div class=\"outer_tree_box\"><div id=\"hymenoptera_apocrita\" class=\"tree_box\"><span><span>Apocrita</span><a href=\"https://en.wikipedia.org/wiki/Apocrita\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Apocrita\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Apocrita\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Apocrita\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(ants, bees, wasps)</span><p class=\"tag\">Known for a narrow &#x27;waist&#x27; (petiole) formed between the first two segments of the actual abdomen. Most species have grublike larvae that are sedentary; They may feed as parasites on other arthropods or within plant structures, or they may be fed by adults within a nest. Eusociality evolved multiple times.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Apocrita_Parasitoida\"><label class=\"tree_label\" for=\"Apocrita_Parasitoida\"></label><div class=\"outer_tree_box\"><div id=\"hymenoptera_parasitoida\" class=\"tree_box\"><span><span>Parasitoida</span><a href=\"https://en.wikipedia.org/wiki/Parasitoida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Parasitoida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Parasitoida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Parasitoida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Contains parasitoid wasps.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_ceraphronoidea\" class=\"tree_box\"><span><span>Ceraphronoidea</span><a href=\"https://en.wikipedia.org/wiki/Ceraphronoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ceraphronoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ceraphronoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ceraphronoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Ceraphonidae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ceraphonidae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"242\" style=\"background-color:#8ca037\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dendrocerus_sp._male.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dendrocerus_sp._male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"257\" style=\"background-color:#b3b6b8\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_ichneumonoidea\" class=\"tree_box\"><span><span>Ichneumonoidea</span><a href=\"https://en.wikipedia.org/wiki/Ichneumonoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ichneumonoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ichneumonoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ichneumonoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Megarhyssa_greenei_female.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Megarhyssa_greenei_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"242\" style=\"background-color:#9a846a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Braconidae_Richard_Bartz.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Braconidae_Richard_Bartz.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"198\" style=\"background-color:#c08456\"></a><a href=\"https://commons.wikimedia.org/wiki/File:IC_Ichneumonini.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-IC_Ichneumonini.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"283\" style=\"background-color:#9d9e8d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cremastinae_wasp.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cremastinae_wasp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#697825\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Parasitoida_Proctotrupomorpha\"><label class=\"tree_label\" for=\"Parasitoida_Proctotrupomorpha\"></label><div class=\"outer_tree_box\"><div id=\"hymenoptera_proctotrupomorpha\" class=\"tree_box\"><span><span>Proctotrupomorpha</span><a href=\"https://en.wikipedia.org/wiki/Proctotrupomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Proctotrupomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Proctotrupomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Proctotrupomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraorder</span></span><p class=\"tag\">Contains mainly small parasitic wasps.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_cynipoidea\" class=\"tree_box\"><span><span>Cynipoidea</span><a href=\"https://en.wikipedia.org/wiki/Cynipoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cynipoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cynipoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cynipoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><span class=\"common_names\">(gall wasps)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Cynips_sp_beentree.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cynips_sp_beentree.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"188\" style=\"background-color:#a08854\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ibaliidae_-_Ibalia_leucospoides.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ibaliidae_-_Ibalia_leucospoides.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#9c8c7c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Callaspidia.jpg\" target=\"_blank\"><img src=\"thumbnails/Callaspidia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"590\" height=\"420\" style=\"background-color:#ccab96\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gall_Wasp_-_Cynipidae_family%2C_Leesylvania_State_Park%2C_Woodbridge%2C_Virginia.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gall_Wasp_-_Cynipidae_family%2C_Leesylvania_State_Park%2C_Woodbridge%2C_Virginia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#4f3b2b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_platygastroidea\" class=\"tree_box\"><span><span>Platygastroidea</span><a href=\"https://en.wikipedia.org/wiki/Platygastroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Platygastroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Platygastroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Platygastroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Platygastrid_%28Leptacis_spp.%29_%289687661511%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Platygastrid_%28Leptacis_spp.%29_%289687661511%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#d9d4cf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trissolcus_on_Chinavia_eggs.jpg\" target=\"_blank\"><img src=\"thumbnails/Trissolcus_on_Chinavia_eggs.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"541\" height=\"461\" style=\"background-color:#8e885c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_chalcidoidea\" class=\"tree_box\"><span><span>Chalcidoidea</span><a href=\"https://en.wikipedia.org/wiki/Chalcidoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chalcidoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chalcidoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Chalcidoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Omphale-cornula.png\" target=\"_blank\"><img src=\"thumbnails/250px-Omphale-cornula.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"276\" style=\"background-color:#cdcecb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:IC_Leucospis_gigas.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-IC_Leucospis_gigas.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"279\" style=\"background-color:#6a7154\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Torymus_female.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Torymus_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#dadbdd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Balcha_indica._2.jpg\" target=\"_blank\"><img src=\"thumbnails/Balcha_indica._2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"620\" height=\"547\" style=\"background-color:#8c8743\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_diaprioidea\" class=\"tree_box\"><span><span>Diaprioidea</span><a href=\"https://en.wikipedia.org/wiki/Diaprioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Diaprioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Diaprioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Diaprioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Neurogalesus_carinatus_specimen.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Neurogalesus_carinatus_specimen.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"235\" style=\"background-color:#b5b3b0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Maaminga_rangi.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Maaminga_rangi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#eaeee8\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_proctotrupoidea\" class=\"tree_box\"><span><span>Proctotrupoidea</span><a href=\"https://en.wikipedia.org/wiki/Proctotrupoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Proctotrupoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Proctotrupoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Proctotrupoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Codrus_picicornis.jpg\" target=\"_blank\"><img src=\"thumbnails/Codrus_picicornis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"439\" height=\"480\" style=\"background-color:#e8e4de\"></a></div></div></div></li></ul></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_evanioidea\" class=\"tree_box\"><span><span>Evanioidea</span><a href=\"https://en.wikipedia.org/wiki/Evanioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Evanioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Evanioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Evanioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Evania_appendigaster.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Evania_appendigaster.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#e4e4e2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gasteruption%2C_U%2C_Maryland%2C_side_2015-07-10-16.53.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gasteruption%2C_U%2C_Maryland%2C_side_2015-07-10-16.53.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"189\" style=\"background-color:#0e0d0b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_stephanoidea\" class=\"tree_box\"><span><span>Stephanoidea</span><a href=\"https://en.wikipedia.org/wiki/Stephanoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Stephanoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Stephanoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Stephanoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Stephanus_serrator_F_%28ovipositing%29_rotated.JPG\" target=\"_blank\"><img src=\"thumbnails/Stephanus_serrator_F_%28ovipositing%29_rotated.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"762\" height=\"542\" style=\"background-color:#908780\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_trigonaloidea\" class=\"tree_box\"><span><span>Trigonaloidea</span><a href=\"https://en.wikipedia.org/wiki/Trigonaloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Trigonaloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Trigonaloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Trigonaloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Trigonalid_-_Orthogonalys_pulchella_%28Cresson%29_%2815646350670%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Trigonalid_-_Orthogonalys_pulchella_%28Cresson%29_%2815646350670%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#261d11\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Taeniogonalos_gundlachii.jpg\" target=\"_blank\"><img src=\"thumbnails/Taeniogonalos_gundlachii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"551\" height=\"413\" style=\"background-color:#51691b\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Apocrita_Aculeata\"><label class=\"tree_label\" for=\"Apocrita_Aculeata\"></label><div class=\"outer_tree_box\"><div id=\"hymenoptera_aculeata\" class=\"tree_box\"><span><span>Aculeata</span><a href=\"https://en.wikipedia.org/wiki/Aculeata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Aculeata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Aculeata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Aculeata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraorder</span></span><p class=\"tag\">The defining feature of the group is the modification of the ovipositor into a stinger, but not all species have this.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_chrysidoidea\" class=\"tree_box\"><span><span>Chrysidoidea</span><a href=\"https://en.wikipedia.org/wiki/Chrysidoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chrysidoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chrysidoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Chrysidoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><span class=\"common_names\">(jewel wasps)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Chrysididae_jewel_wasp.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Chrysididae_jewel_wasp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"68\" style=\"background-color:#928c60\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chrysis_viridula2.jpg\" target=\"_blank\"><img src=\"thumbnails/Chrysis_viridula2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"429\" height=\"474\" style=\"background-color:#8a643e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_vespoidea\" class=\"tree_box\"><span><span>Vespoidea</span><a href=\"https://en.wikipedia.org/wiki/Vespoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Vespoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Vespoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Vespoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><span class=\"common_names\">(yellowjackets, paper wasps, hornets, potter wasps)</span><p class=\"tag\">Includes wasps with a large variety of lifestyles including eusocial, social, and solitary habits, predators, scavengers, parasitoids, and some herbivores.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:European_wasp_white_bg.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-European_wasp_white_bg.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"80\" style=\"background-color:#dfdcd6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2919baldf.w.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2919baldf.w.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"263\" style=\"background-color:#96972b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ancistrocerus_antilope_female.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ancistrocerus_antilope_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"252\" style=\"background-color:#908612\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Polistes_sp_wasp.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Polistes_sp_wasp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#bfbab7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Yellow_Paper_Wasp.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Yellow_Paper_Wasp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"290\" style=\"background-color:#646d5a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_pompiloidea\" class=\"tree_box\"><span><span>Pompiloidea</span><a href=\"https://en.wikipedia.org/wiki/Pompiloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pompiloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pompiloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pompiloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Spider_Wasp_%28cropped%29.JPG\" target=\"_blank\"><img src=\"thumbnails/120px-Spider_Wasp_%28cropped%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"106\" style=\"background-color:#9d8e7e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ceropales_maculata_%2847936916403%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ceropales_maculata_%2847936916403%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"303\" style=\"background-color:#7c9343\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eusapvertic.jpg\" target=\"_blank\"><img src=\"thumbnails/Eusapvertic.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"560\" height=\"478\" style=\"background-color:#858233\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_thynnoidea\" class=\"tree_box\"><span><span>Thynnoidea</span><a href=\"https://en.wikipedia.org/wiki/Thynnoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Thynnoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Thynnoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Thynnoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><span class=\"common_names\">(chyphotid wasps, thynnid wasps)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Myzinum_quinquecinctum_P1240895a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Myzinum_quinquecinctum_P1240895a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#6b774e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_tiphioidea\" class=\"tree_box\"><span><span>Tiphioidea</span><a href=\"https://en.wikipedia.org/wiki/Tiphioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tiphioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tiphioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tiphioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Sierolomorpha_canadensis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sierolomorpha_canadensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#eae7e5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tiphia_P1280629a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tiphia_P1280629a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#2f3a20\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_scolioidea\" class=\"tree_box\"><span><span>Scolioidea</span><a href=\"https://en.wikipedia.org/wiki/Scolioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Scolioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Scolioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Scolioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(scoliid wasps)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Megascolia_procer_MHNT_dos.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Megascolia_procer_MHNT_dos.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#565854\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scolia_bicincta._female.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Scolia_bicincta._female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"257\" style=\"background-color:#9a9e33\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scoliid_wasp_%28Megascolia_bidens%29_male_Cap_Bon_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Scoliid_wasp_%28Megascolia_bidens%29_male_Cap_Bon_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7f805f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_formicoidea\" class=\"tree_box\"><span><span>Formicoidea</span><a href=\"https://en.wikipedia.org/wiki/Formicoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Formicoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Formicoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Formicoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(ants)</span><p class=\"tag\">Eusocial insects that form colonies. They are easily identified by their geniculate (elbowed) antennae and the distinctive node-like structure that forms their slender waists.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Meat_eater_ant_feeding_on_honey02.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Meat_eater_ant_feeding_on_honey02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"80\" style=\"background-color:#d8d4d5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_Ant_-_March_2025.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red_Ant_-_March_2025.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#9d8f8f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bullant_head_detail.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bullant_head_detail.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#604a3f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:FlyingAnts.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-FlyingAnts.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#728329\"></a><a href=\"https://commons.wikimedia.org/wiki/File:AntBridge_Crossing_10.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-AntBridge_Crossing_10.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#696b4d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:HoneyAnt.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-HoneyAnt.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#d39d71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ants_and_Eggs_-_geograph.org.uk_-_726733.jpg\" target=\"_blank\"><img src=\"thumbnails/Ants_and_Eggs_-_geograph.org.uk_-_726733.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#6e6559\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Aculeata_Apoidea\"><label class=\"tree_label\" for=\"Aculeata_Apoidea\"></label><div class=\"outer_tree_box\"><div id=\"hymenoptera_apoidea\" class=\"tree_box\"><span><span>Apoidea</span><a href=\"https://en.wikipedia.org/wiki/Apoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Apoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Apoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Apoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><span class=\"common_names\">(bees, sphecoid wasps)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Apis_mellifera_%28in_flight%29_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Apis_mellifera_%28in_flight%29_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"87\" style=\"background-color:#667e3c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Emerald_Cockroach_Wasp.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Emerald_Cockroach_Wasp.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"167\" style=\"background-color:#635956\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Astata_boopsDSC05135.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Astata_boopsDSC05135.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7c7269\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bembix_sp2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Bembix_sp2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"167\" style=\"background-color:#b4794e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sceliphron_spirifex_TZ_edit1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sceliphron_spirifex_TZ_edit1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"167\" style=\"background-color:#aa907a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ectemnius.lapidarius.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ectemnius.lapidarius.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"166\" style=\"background-color:#897a4e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mellinus_arvensis_-_Flickr_-_gailhampshire_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Mellinus_arvensis_-_Flickr_-_gailhampshire_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"195\" style=\"background-color:#859736\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pemphredon_%3F_%28Crabronidae%29_-_Zwerggrabwespe_%2811462528464%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pemphredon_%3F_%28Crabronidae%29_-_Zwerggrabwespe_%2811462528464%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"188\" style=\"background-color:#756f6a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:P._gibbosus57306787w.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-P._gibbosus57306787w.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"235\" style=\"background-color:#82816f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aphid_Wasp_-_Flickr_-_treegrow_%282%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aphid_Wasp_-_Flickr_-_treegrow_%282%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"187\" style=\"background-color:#646f2f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abeille_butineuse_et_son_pollen.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Abeille_butineuse_et_son_pollen.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"173\" style=\"background-color:#85817b\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"hymenoptera_anthophila\" class=\"tree_box\"><span><span>Anthophila</span><a href=\"https://en.wikipedia.org/wiki/Anthophila\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Anthophila\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Anthophila\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Anthophila\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(honey bees, bumblebees, stingless bees)</span><p class=\"tag\">Herbivorous insects that specifically feed on nectar and pollen. Many are eusocial.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Tetragonula_carbonaria_%2814521993792%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tetragonula_carbonaria_%2814521993792%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#875973\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amegilla_on_long_tube_of_Acanthus_ilicifolius_flower.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Amegilla_on_long_tube_of_Acanthus_ilicifolius_flower.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"279\" style=\"background-color:#a39171\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apis_mellifera_flying2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apis_mellifera_flying2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#aa8156\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leafcutter_bee_%28Megachile_sp.%29_collecting_leaves_%287519316920%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leafcutter_bee_%28Megachile_sp.%29_collecting_leaves_%287519316920%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"232\" style=\"background-color:#828450\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Iridescent.green.sweat.bee1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Iridescent.green.sweat.bee1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"199\" style=\"background-color:#92570e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Colletes_cunicularius_m1.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Colletes_cunicularius_m1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#b79a83\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stenotritus_pubescens%2C_f%2C_side%2C_australia_2014-07-05-12.18.33_ZS_PMax.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stenotritus_pubescens%2C_f%2C_side%2C_australia_2014-07-05-12.18.33_ZS_PMax.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#29251b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bee_swarm_on_fallen_tree03.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Bee_swarm_on_fallen_tree03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#766f51\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bienenwabe_mit_Eiern_und_Brut_5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bienenwabe_mit_Eiern_und_Brut_5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#a06d21\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata","<ul class=\"tree\" data-tree-range=\"chordata\"><li><input type=\"checkbox\" checked id=\"Deuterostomia_Chordata\"><label class=\"tree_label\" for=\"Deuterostomia_Chordata\"></label><div class=\"outer_tree_box\"><div id=\"chordata_chordata\" class=\"tree_box\"><span><span>Chordata</span><a href=\"https://en.wikipedia.org/wiki/Chordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Chordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=kɔːrˈdeɪtə\" target=\"_blank\">kɔːrˈdeɪtə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"animalia\">See parent</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(lancelets, sea squirts, vertibrates)</span><p class=\"tag\">Possess at some point during their larval or adult stages a notochord, a hollow dorsal nerve cord, an endostyle or thyroid, pharyngeal slits, and a post-anal tail.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#626660\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tunicate_komodo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tunicate_komodo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5a5950\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Branchiostoma_lanceolatum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Branchiostoma_lanceolatum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"261\" style=\"background-color:#0c0b0a\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chordata_cephalochordata\" class=\"tree_box\"><span><span>Cephalochordata</span><a href=\"https://en.wikipedia.org/wiki/Cephalochordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cephalochordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cephalochordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cephalochordata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=kɔːrˈdeɪtə\" target=\"_blank\">kɔːrˈdeɪtə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Subphylum</span></span><span class=\"common_names\">(lancelets)</span><p class=\"tag\">Fish-like benthic filter feeding chordates with a dorsal nerve cord protected by a notochord made up of collagen fibers and gills used for feeding not breathing.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Branchiostoma_lanceolatum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Branchiostoma_lanceolatum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"261\" style=\"background-color:#0c0b0a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:202208_Japanese_lancelet.svg\" target=\"_blank\"><img src=\"thumbnails/250px-202208_Japanese_lancelet.svg.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"313\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Epigonichthys_hectori_209703280.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Epigonichthys_hectori_209703280.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#58544b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chordata_tunicata\" class=\"tree_box\"><span><span>Tunicata</span><a href=\"https://en.wikipedia.org/wiki/Tunicata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tunicata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tunicata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tunicata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌtjuːnɪˈkeɪtə\" target=\"_blank\">ˌtjuːnɪˈkeɪtə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Subphylum</span></span><span class=\"common_names\">(sea squirts, salp, ghostfish)</span><p class=\"tag\">Cordates with a larval form that looks a lot like a frog tadpole and has a notocord but most adult forms are filter feeders, often permanently attached to rocks and losing their notocord.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ascidia_005.png\" target=\"_blank\"><img src=\"thumbnails/Ascidia_005.png\" class=\"taxa-img\" loading=\"lazy\" width=\"754\" height=\"355\" style=\"background-color:#cdcdcd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tunicate_komodo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tunicate_komodo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5a5950\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bluebell_tunicates_Nick_Hobgood.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bluebell_tunicates_Nick_Hobgood.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#515364\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sea_Squirts_Didemnum_molle.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sea_Squirts_Didemnum_molle.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#415b48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Salp_colony%2C_Aorangaia_PA171899.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Salp_colony%2C_Aorangaia_PA171899.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#67685f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MARUM-Tiere-02-HiRes.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-MARUM-Tiere-02-HiRes.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4c5753\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Predatory_tunicate_-_MBA.png\" target=\"_blank\"><img src=\"thumbnails/250px-Predatory_tunicate_-_MBA.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"397\" style=\"background-color:#413e39\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Chordata_Vertebrata\"><label class=\"tree_label\" for=\"Chordata_Vertebrata\"></label><div class=\"outer_tree_box\"><div id=\"chordata_vertebrata\" class=\"tree_box\"><span><span>Vertebrata</span><a href=\"https://en.wikipedia.org/wiki/Vertebrata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Vertebrata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Vertebrata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Vertebrata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subphylum</span></span><p class=\"tag\">Animals with a vertebral column, and a cranium, or skull.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Vertebrata_Agnatha\"><label class=\"tree_label\" for=\"Vertebrata_Agnatha\"></label><div class=\"outer_tree_box\"><div id=\"chordata_agnatha\" class=\"tree_box\"><span><span>Agnatha</span><a href=\"https://en.wikipedia.org/wiki/Agnatha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Agnatha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Agnatha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Agnatha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈæɡnəθə\" target=\"_blank\">ˈæɡnəθə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Infraphylum</span></span><span class=\"common_names\">(hagfishes, lampreys)</span><p class=\"tag\">The extant jawless fish.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chordata_myxini\" class=\"tree_box\"><span><span>Myxini</span><a href=\"https://en.wikipedia.org/wiki/Myxini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Myxini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Myxini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Myxini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=mɪkˈsaɪnaɪ\" target=\"_blank\">mɪkˈsaɪnaɪ</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(hagfish, slime eels)</span><p class=\"tag\">Eel-shaped jawless fish that have a skull but no vertebral column.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Eptatretus_polytrema.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eptatretus_polytrema.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"199\" style=\"background-color:#ebebeb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pacific_hagfish_Myxine.jpg\" target=\"_blank\"><img src=\"thumbnails/Pacific_hagfish_Myxine.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"199\" height=\"149\" style=\"background-color:#839b80\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eptatretus_stoutii.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eptatretus_stoutii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7e9b7b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chordata_petromyzontida\" class=\"tree_box\"><span><span>Petromyzontida</span><a href=\"https://en.wikipedia.org/wiki/Petromyzontida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Petromyzontida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Petromyzontida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Petromyzontida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(lampreys)</span><p class=\"tag\">Adults are characterized by a toothed, funnel-like sucking mouth.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:J%C3%B5esilmud2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-J%C3%B5esilmud2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#62605f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Petromyzon_marinus.004_-_Aquarium_Finisterrae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Petromyzon_marinus.004_-_Aquarium_Finisterrae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#88887d\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Vertebrata_Gnathostomata\"><label class=\"tree_label\" for=\"Vertebrata_Gnathostomata\"></label><div class=\"outer_tree_box\"><div id=\"chordata_gnathostomata\" class=\"tree_box\"><span><span>Gnathostomata</span><a href=\"https://en.wikipedia.org/wiki/Gnathostomata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gnathostomata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gnathostomata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gnathostomata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌnæθoʊˈstɒmətə\" target=\"_blank\">ˌnæθoʊˈstɒmətə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Infraphylum</span></span><p class=\"tag\">The jawed fish. They have a camera-style eye, adaptive immune system and myelinated neurons.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Gnathostomata_Chondrichthyes\"><label class=\"tree_label\" for=\"Gnathostomata_Chondrichthyes\"></label><div class=\"outer_tree_box\"><div id=\"chordata_chondrichthyes\" class=\"tree_box\"><span><span>Chondrichthyes</span><a href=\"https://en.wikipedia.org/wiki/Chondrichthyes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chondrichthyes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chondrichthyes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Chondrichthyes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=kɒnˈdrɪkθiiːz\" target=\"_blank\">kɒnˈdrɪkθiiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">A class of jawed fish including the cartilaginous fish.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chordata_elasmobranchii\" class=\"tree_box\"><span><span>Elasmobranchii</span><a href=\"https://en.wikipedia.org/wiki/Elasmobranchii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Elasmobranchii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Elasmobranchii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Elasmobranchii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ɪˌlæzməˈbræŋkiaɪ\" target=\"_blank\">ɪˌlæzməˈbræŋkiaɪ</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"elasmobranchii\">See children</button><span class=\"badge\">Subclass</span></span><span class=\"common_names\">(sharks, whale sharks, rays, skates, sawfish)</span><p class=\"tag\">The cartilaginous fish. They have no swim bladder and need to swim to avoid sinking. The teeth are in several series; the upper jaw is not fused to the cranium, and the lower jaw is articulated with the upper.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Scalloped_Hammerhead_Shark_Sphyrna_Lewini_%28226845659%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Scalloped_Hammerhead_Shark_Sphyrna_Lewini_%28226845659%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#256e90\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Great_White_Shark_%2814730719119%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Great_White_Shark_%2814730719119%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4061ac\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bullshark.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Bullshark.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#255f62\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SStringray.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-SStringray.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#c7c5b5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aetobatus_narinari_342101452.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aetobatus_narinari_342101452.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4b7a8e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Manta_ray_from_Yap.jpg\" target=\"_blank\"><img src=\"thumbnails/Manta_ray_from_Yap.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"535\" style=\"background-color:#0787a4\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chordata_holocephali\" class=\"tree_box\"><span><span>Holocephali</span><a href=\"https://en.wikipedia.org/wiki/Holocephali\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Holocephali\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Holocephali\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Holocephali\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><span class=\"common_names\">(chimaeras)</span><p class=\"tag\">These sometimes called ghost sharks and sometimes put in their own class.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Observations_of_Chimaera_opalescens.png\" target=\"_blank\"><img src=\"thumbnails/Observations_of_Chimaera_opalescens.png\" class=\"taxa-img\" loading=\"lazy\" width=\"587\" height=\"270\" style=\"background-color:#2c2b48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Deep_sea_chimaera.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Deep_sea_chimaera.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"274\" style=\"background-color:#1e1f28\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cape_Elephantfish.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cape_Elephantfish.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#859d70\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Gnathostomata_Osteichthyes\"><label class=\"tree_label\" for=\"Gnathostomata_Osteichthyes\"></label><div class=\"outer_tree_box\"><div id=\"chordata_osteichthyes\" class=\"tree_box\"><span><span>Osteichthyes</span><a href=\"https://en.wikipedia.org/wiki/Osteichthyes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Osteichthyes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Osteichthyes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Osteichthyes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌɒstiːˈɪkθiːz\" target=\"_blank\">ˌɒstiːˈɪkθiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">The bony fish. Had foregut pouches that eventually evolved into swim bladders and lungs.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chordata_actinopterygii\" class=\"tree_box\"><span><span>Actinopterygii</span><a href=\"https://en.wikipedia.org/wiki/Actinopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Actinopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Actinopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Actinopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌæktɪnɒptəˈrɪdʒiaɪ\" target=\"_blank\">ˌæktɪnɒptəˈrɪdʒiaɪ</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"actinopterygii\">See children</button><span class=\"badge\">Class</span></span><p class=\"tag\">The ray-finned fish. The majority of the extant fish. They have lightly built fins made of webbings of skin supported by radially extended thin bony spines that resemble folding fans.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Sole_commune_%28Solea_solea%29_en_rade_de_Brest_%28Ifremer_00558-67035_-_20670%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sole_commune_%28Solea_solea%29_en_rade_de_Brest_%28Ifremer_00558-67035_-_20670%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#8d8267\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hippocampus_hippocampus_%28on_Ascophyllum_nodosum%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hippocampus_hippocampus_%28on_Ascophyllum_nodosum%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#393217\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stone_Fish_at_AQWA_SMC2006.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stone_Fish_at_AQWA_SMC2006.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8e7d6b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Morena_pimienta_%28Gymnothorax_griseus%29%2C_parque_nacional_Ras_Muhammad%2C_Egipto%2C_2022-03-27%2C_DD_185.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Morena_pimienta_%28Gymnothorax_griseus%29%2C_parque_nacional_Ras_Muhammad%2C_Egipto%2C_2022-03-27%2C_DD_185.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#898162\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Puffer_Fish_DSC01257.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Puffer_Fish_DSC01257.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#45787c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clown_fish_in_the_Andaman_Coral_Reef.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Clown_fish_in_the_Andaman_Coral_Reef.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#644a24\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chaetodon_ephippium_PLW_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chaetodon_ephippium_PLW_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#3e8a7b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MC_Rotfeuerfisch.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-MC_Rotfeuerfisch.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#31352c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Atlantischer_Lachs.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Atlantischer_Lachs.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"148\" style=\"background-color:#5e6855\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Osteichthyes_Sarcopterygii\"><label class=\"tree_label\" for=\"Osteichthyes_Sarcopterygii\"></label><div class=\"outer_tree_box\"><div id=\"chordata_sarcopterygii\" class=\"tree_box\"><span><span>Sarcopterygii</span><a href=\"https://en.wikipedia.org/wiki/Sarcopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sarcopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sarcopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Sarcopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌsɑːrkɒptəˈrɪdʒi.aɪ\" target=\"_blank\">ˌsɑːrkɒptəˈrɪdʒi.aɪ</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(lobe-finned fish, coelacanths, lungfish, Queensland lungfish)</span><p class=\"tag\">The lobe-finned fish (and relatives to all land vertebrates). Characterised by prominent muscular limb buds (lobes) within their fins, which are supported by articulated appendicular skeletons.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Coelacanth_off_Pumula_on_the_KwaZulu-Natal_South_Coast%2C_South_Africa%2C_on_22_November_2019.png\" target=\"_blank\"><img src=\"thumbnails/330px-Coelacanth_off_Pumula_on_the_KwaZulu-Natal_South_Coast%2C_South_Africa%2C_on_22_November_2019.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"198\" style=\"background-color:#446059\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neoceratodus_forsteri%2C_2014-09-19.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Neoceratodus_forsteri%2C_2014-09-19.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5d663f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Latimeria_Paris.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Latimeria_Paris.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#727d79\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fins_to_hands.png\" target=\"_blank\"><img src=\"thumbnails/330px-Fins_to_hands.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"166\" style=\"background-color:#eceaeb\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Sarcopterygii_Rhipidistia\"><label class=\"tree_label\" for=\"Sarcopterygii_Rhipidistia\"></label><div class=\"outer_tree_box\"><div id=\"chordata_rhipidistia\" class=\"tree_box\"><span><span>Rhipidistia</span><a href=\"https://en.wikipedia.org/wiki/Rhipidistia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rhipidistia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rhipidistia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Rhipidistia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">A clade that includes the lobe-finned fish, lungfishes and the tetrapods.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chordata_dipnoi\" class=\"tree_box\"><span><span>Dipnoi</span><a href=\"https://en.wikipedia.org/wiki/Dipnoi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dipnoi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dipnoi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Dipnoi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(lungfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Lepidosiren_paradoxa_0.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lepidosiren_paradoxa_0.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"189\" style=\"background-color:#4d5649\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leopard_lungfish_%28Protopterus_aethiopicus%29_close_-_GRB.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Leopard_lungfish_%28Protopterus_aethiopicus%29_close_-_GRB.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#343e37\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neoceratodus_forsteri%2C_2014-09-19.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Neoceratodus_forsteri%2C_2014-09-19.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5d663f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Marbled_lungfish_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Marbled_lungfish_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"386\" style=\"background-color:#494f34\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chordata_tetrapoda\" class=\"tree_box\"><span><span>Tetrapoda</span><a href=\"https://en.wikipedia.org/wiki/Tetrapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tetrapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tetrapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tetrapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈtɛtrəˌpɒd\" target=\"_blank\">ˈtɛtrəˌpɒd</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"tetrapoda\">See children</button><span class=\"badge\">Clade</span></span><p class=\"tag\">Four-limbed vertebrates. Have paired lungs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Mercurana.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mercurana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#232010\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dermophis_mexicanus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dermophis_mexicanus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#8d6e55\"></a><a href=\"https://commons.wikimedia.org/wiki/File:AgamaSinaita01_ST_10_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-AgamaSinaita01_ST_10_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#bca085\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#626660\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tachyglossus_aculeatus_side_on.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tachyglossus_aculeatus_side_on.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"201\" style=\"background-color:#919886\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Royal_Tern.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Royal_Tern.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"207\" style=\"background-color:#858584\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul>")
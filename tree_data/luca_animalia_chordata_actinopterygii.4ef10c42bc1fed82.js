@@ -0,0 +1 @@
+TreeData.register("luca_animalia_chordata_actinopterygii",[{"name":"Polypteriformes","parent":"Actinopterygii","rank":"Order","ipa":"pəˈlɪptərɪfɔːrmiːz","etymology":"","common":["bichirs","reedfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/Cuvier-105-Polypt%C3%A8re.jpg/250px-Cuvier-105-Polypt%C3%A8re.jpg"],"species":14},{"name":"Acipenseriformes","parent":"Actinopterygii","rank":"Order","ipa":"","etymology":"","common":["sturgeon","paddlefish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Atlantic_sturgeon_flipped.jpg/330px-Atlantic_sturgeon_flipped.jpg"],"species":27},{"name":"Neopterygii","parent":"Actinopterygii","rank":"Subclass","ipa":"","etymology":"","common":[],"tag":"The dorsal and anal fins have a 1:1 ratio between radials and basals, the caudal fin also becomes more symmetrical, scales are less mineralised and more ossification of the notochord.","imgs":[],"species":32000},{"name":"Lepisosteiformes","parent":"Neopterygii","rank":"Order","ipa":"","etymology":"","common":["gars"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/eb/Alligator_gar_fish_%28white_background%29.jpg/330px-Alligator_gar_fish_%28white_background%29.jpg"],"species":7},{"name":"Amiiformes","parent":"Neopterygii","rank":"Order","ipa":"","etymology":"","common":["bowfins"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/23/Amia_calva_%28white_background%29.jpg/330px-Amia_calva_%28white_background%29.jpg"],"species":2},{"name":"Teleostei","parent":"Neopterygii","rank":"Infraclass","ipa":"ˌtɛliˈɒstiaɪ","etymology":"'complete'-'bone'","common":[],"tag":"Have a movable premaxilla used to protrude their jaws outwards from their mouth. Most use external fertilisation and many are sequential hermaphrodites changing sex with age.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6b/Common_carp_%28white_background%29.jpg/330px-Common_carp_%28white_background%29.jpg"],"species":32000},{"name":"Osteoglossomorpha","parent":"Teleostei","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"Use their tongue as the opposing surface for the teeth. Extant species are freshwater fish.","imgs":[],"species":0},{"name":"Hiodontiformes","parent":"Osteoglossomorpha","rank":"Order","ipa":"haɪəˈdɒntɪfɔːrmiːz","etymology":"","common":["mooneyes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/Hiodon_tergisus_NOAA.jpg/120px-Hiodon_tergisus_NOAA.jpg"],"species":2},{"name":"Osteoglossiformes","parent":"Osteoglossomorpha","rank":"Order","ipa":"ˌɒstiːoʊˈɡlɒsɪfɔːrmiːz","etymology":"'boney'-'tongues'","common":["bonytongues","elephantfishes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/de/Osteoglossum_bicirrhosum_%28white_background%29.jpg/250px-Osteoglossum_bicirrhosum_%28white_background%29.jpg"],"species":0},{"name":"Elopomorpha","parent":"Teleostei","rank":"Superorder","ipa":"","etymology":"","common":[],"tag":"Unique to this group are flat and transparent larvae.","imgs":[],"species":0},{"name":"Elopiformes","parent":"Elopomorpha","rank":"Order","ipa":"ˈɛləpɪfɔːrmiːz","etymology":"","common":["tenpounders","tarpons","ladyfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/fe/Tarpon_%28PSF%29.png/250px-Tarpon_%28PSF%29.png"],"species":0},{"name":"Albuliformes","parent":"Elopomorpha","rank":"Order","ipa":"ˈælbjəlɪfɔːrmiːz","etymology":"","common":["Japanese gissus","bonefishes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4f/Albula_conorhynchus_-_1700-1880_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28white_background%29.jpg/250px-Albula_conorhynchus_-_1700-1880_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28white_background%29.jpg"],"species":0},{"name":"Notacanthiformes","parent":"Elopomorpha","rank":"Order","ipa":"nɒtəˈkænθɪfɔːrmiːz","etymology":"","common":[],"tag":"Deep-sea ray-finned eels.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/54/Notacanthus_sexspinis1.jpg/250px-Notacanthus_sexspinis1.jpg"],"species":0},{"name":"Anguilliformes","parent":"Elopomorpha","rank":"Order","ipa":"æŋˈɡwɪlɪfɔːrmiːz","etymology":"","common":["true eels"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/76/Conger_conger_Gervais.jpg/250px-Conger_conger_Gervais.jpg"],"species":0},{"name":"Otocephala","parent":"Teleostei","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"Named for the presence of a hearing link from the swimbladder to the inner ear.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/84/FMIB_43249_Menhaden_%28Brevortia_tyrannus%29_2.jpeg/330px-FMIB_43249_Menhaden_%28Brevortia_tyrannus%29_2.jpeg"],"species":0},{"name":"Clupeiformes","parent":"Otocephala","rank":"Order","ipa":"ˈkluːpiːɪfɔːrmiːz","etymology":"","common":["herrings","anchovies","sardines"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/41/American_shad_fish_alosa_sapidissima_%28white_background%29.jpg/250px-American_shad_fish_alosa_sapidissima_%28white_background%29.jpg"],"species":0},{"name":"Alepocephaliformes","parent":"Otocephala","rank":"Order","ipa":"","etymology":"","common":["slickheads","tubeshoulders"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e6/Alepocephalus_rostratus_Gervais.jpg/250px-Alepocephalus_rostratus_Gervais.jpg"],"species":0},{"name":"Ostariophysi","parent":"Otocephala","rank":"Superorder","ipa":"","etymology":"","common":[],"tag":"Have an alarm substance and a Weberian apparatus - a chain of small bones that connect the auditory system to the gas bladder. Most species possess a swim bladder","imgs":[],"species":10758},{"name":"Gonorynchiformes","parent":"Ostariophysi","rank":"Order","ipa":"","etymology":"","common":["milkfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/14/Chanos_salmoneus_Achilles_166.jpg/250px-Chanos_salmoneus_Achilles_166.jpg"],"species":37},{"name":"Cypriniformes","parent":"Ostariophysi","rank":"Order","ipa":"","etymology":"","common":["minnow","carp","loach"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6b/Common_carp_%28white_background%29.jpg/250px-Common_carp_%28white_background%29.jpg"],"species":4501},{"name":"Characiformes","parent":"Ostariophysi","rank":"Order","ipa":"","etymology":"","common":["tetras","piranhas"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/F_de_Castelnau-poissonsPl37_%28Serrasalmus_humeralis%29.jpg/250px-F_de_Castelnau-poissonsPl37_%28Serrasalmus_humeralis%29.jpg"],"species":2168},{"name":"Gymnotiformes","parent":"Ostariophysi","rank":"Order","ipa":"","etymology":"","common":["knifefish","electric eels"],"tag":"They have long bodies and swim using undulations of their elongated anal fin. They mostly live in fresh water, are usually nocturnal and are capable of producing electric fields to detect prey, for navigation, communication, and for the electric eel, attack and defense.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/67/Adontosternarchus_balaenops.jpg/330px-Adontosternarchus_balaenops.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Eigenmannia_lineata.JPG/330px-Eigenmannia_lineata.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c1/Apteronotus_albifrons.jpg/330px-Apteronotus_albifrons.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/LatPT2_gray.tif/lossy-page1-320px-LatPT2_gray.tif.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8f/Electric-eel.jpg/330px-Electric-eel.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/eb/Electrophorus_electricus_showing_lateral_line_pits.jpg/250px-Electrophorus_electricus_showing_lateral_line_pits.jpg"],"species":239},{"name":"Siluriformes","parent":"Ostariophysi","rank":"Order","ipa":"","etymology":"","common":["catfish"],"tag":"In some species, their mucus-covered skin is used in cutaneous respiration, where the fish breathes through its skin.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1b/Black_bullhead_fish_%28white_background%29.jpg/250px-Black_bullhead_fish_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d3/Aquarium_tropical_de_Pierrefitte-Nestalas_03082018_Clarias_batrachus_2.jpg/330px-Aquarium_tropical_de_Pierrefitte-Nestalas_03082018_Clarias_batrachus_2.jpg"],"species":3813},{"name":"Euteleostei","parent":"Teleostei","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/Bachforelle_Zeichnung.jpg/330px-Bachforelle_Zeichnung.jpg"],"species":0},{"name":"Lepidogalaxiiformes","parent":"Euteleostei","rank":"Order","ipa":"","etymology":"","common":["salamanderfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c5/Lepidogalaxias_salamandroides_324066790.jpg/330px-Lepidogalaxias_salamandroides_324066790.jpg"],"species":0},{"name":"Protacanthopterygii","parent":"Euteleostei","rank":"Superorder","ipa":"","etymology":"","common":[],"tag":"Usual traits include: more than 24 vertebrae, epicentral cartilages, one supraorbital bone, and a mesocoracoid, an adipose fin, and (often prominent) glossohyal teeth. Most members are mid-sized to larger predators of smaller animals.","imgs":[],"species":0},{"name":"Argentiniformes","parent":"Protacanthopterygii","rank":"Order","ipa":"","etymology":"","common":["marine smelts"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Argentina_sphyraena.jpg/250px-Argentina_sphyraena.jpg"],"species":0},{"name":"Galaxiiformes","parent":"Protacanthopterygii","rank":"Order","ipa":"","etymology":"","common":["white bait","mudfishes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/4/45/Galaxias_maculatus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a5/Chatham_Mudfish.jpg/330px-Chatham_Mudfish.jpg"],"species":0},{"name":"Esociformes","parent":"Protacanthopterygii","rank":"Order","ipa":"","etymology":"","common":["pike"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c5/Esox_lucius1.jpg/250px-Esox_lucius1.jpg"],"species":0},{"name":"Salmoniformes","parent":"Protacanthopterygii","rank":"Order","ipa":"","etymology":"","common":["salmon","trout"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/06/Salmo_salar_%28crop%29.jpg/250px-Salmo_salar_%28crop%29.jpg"],"species":0},{"name":"Stomiati","parent":"Euteleostei","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"Known for their large mouth, long throat/barbel, and no caudal filament.","imgs":[],"species":0},{"name":"Stomiiformes","parent":"Stomiati","rank":"Order","ipa":"","etymology":"","common":["dragonfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/14/Fish4104_-_Flickr_-_NOAA_Photo_Library.jpg/250px-Fish4104_-_Flickr_-_NOAA_Photo_Library.jpg"],"species":0},{"name":"Osmeriformes","parent":"Stomiati","rank":"Order","ipa":"","etymology":"","common":["smelt"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/2b/Pond_smelt_illustration.jpg/250px-Pond_smelt_illustration.jpg"],"species":0},{"name":"Neoteleostei","parent":"Euteleostei","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"The swim bladder, when present, only serves as a buoyancy organ and is no longer connected to the gastrointestinal tract.","imgs":[],"species":0},{"name":"Ateleopodiformes","parent":"Neoteleostei","rank":"Order","ipa":"","etymology":"","common":["jellynoses"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/8d/Ijimaia_plicatellus1.jpg/250px-Ijimaia_plicatellus1.jpg"],"species":0},{"name":"Aulopiformes","parent":"Neoteleostei","rank":"Order","ipa":"ˈɔːləpɪfɔːrmiːz","etymology":"","common":["lizardfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Aulopus_filamentosus.jpg/250px-Aulopus_filamentosus.jpg"],"species":0},{"name":"Myctophiformes","parent":"Neoteleostei","rank":"Order","ipa":"ˈmɪktəfɪfɔːrmiːz","etymology":"","common":["lanternfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/Myctophum_punctatum1.jpg/250px-Myctophum_punctatum1.jpg"],"species":0},{"name":"Acanthomorpha","parent":"Neoteleostei","rank":"Clade","ipa":"","etymology":"'thorn'-'shaped'","common":[],"tag":"Have spines at the anterior edge of the dorsal and anal fins that can be extended for protection and retracted to decrease drag when swimming.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Scomber_scombrus.png/140px-Scomber_scombrus.png"],"species":0}],{},{"120px-Hiodon_tergisus_NOAA.jpg":[120,66,"#dfd8cc"],"140px-Scomber_scombrus.png":[140,85,null],"250px-Albula_conorhynchus_-_1700-1880_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_(white_background).jpg":[250,84,"#bfbcb8"],"250px-Alepocephalus_rostratus_Gervais.jpg":[250,70,"#b2b1b7"],"250px-American_shad_fish_alosa_sapidissima_(white_background).jpg":[250,109,"#c6ccc6"],"250px-Argentina_sphyraena.jpg":[250,99,"#e4dfd8"],"250px-Aulopus_filamentosus.jpg":[250,141,"#ebe7e1"],"250px-Black_bullhead_fish_(white_background).jpg":[250,106,"#bebab6"],"250px-Chanos_salmoneus_Achilles_166.jpg":[250,105,"#ebe9e3"],"250px-Common_carp_(white_background).jpg":[250,108,"#b8b1a4"],"250px-Conger_conger_Gervais.jpg":[250,91,"#cecccb"],"250px-Cuvier-105-Polyptère.jpg":[250,49,"#c5c4b8"],"250px-Electrophorus_electricus_showing_lateral_line_pits.jpg":[250,310,"#4e4735"],"250px-Esox_lucius1.jpg":[250,92,"#d2cfc8"],"250px-F_de_Castelnau-poissonsPl37_(Serrasalmus_humeralis).jpg":[250,160,"#c6bdbb"],"250px-Fish4104_-_Flickr_-_NOAA_Photo_Library.jpg":[250,130,"#cfc7c4"],"250px-Ijimaia_plicatellus1.jpg":[250,146,"#dedede"],"250px-Myctophum_punctatum1.jpg":[250,87,"#d7d4cb"],"250px-Notacanthus_sexspinis1.jpg":[250,35,"#bababa"],"250px-Osteoglossum_bicirrhosum_(white_background).jpg":[250,73,"#afa99c"],"250px-Pond_smelt_illustration.jpg":[250,89,"#d6d6d6"],"250px-Salmo_salar_(crop).jpg":[250,80,"#c8c3b8"],"250px-Tarpon_(PSF).png":[250,87,"#d2d2d2"],"330px-Adontosternarchus_balaenops.jpg":[330,154,"#564b2a"],"330px-Alligator_gar_fish_(white_background).jpg":[330,79,"#b7b7b0"],"330px-Amia_calva_(white_background).jpg":[330,83,"#aca38d"],"330px-Apteronotus_albifrons.jpg":[330,116,"#aca8a7"],"330px-Aquarium_tropical_de_Pierrefitte-Nestalas_03082018_Clarias_batrachus_2.jpg":[330,163,"#383836"],"330px-Atlantic_sturgeon_flipped.jpg":[330,80,"#c3c3ba"],"330px-Bachforelle_Zeichnung.jpg":[330,130,"#d1c6a6"],"330px-Chatham_Mudfish.jpg":[330,258,"#d1a368"],"330px-Common_carp_(white_background).jpg":[330,142,"#bab3a7"],"330px-Eigenmannia_lineata.JPG":[330,259,"#41431a"],"330px-Electric-eel.jpg":[330,247,"#587748"],"330px-FMIB_43249_Menhaden_(Brevortia_tyrannus)_2.jpeg":[330,135,"#dcd4c3"],"330px-Lepidogalaxias_salamandroides_324066790.jpg":[330,126,"#9d7549"],"Galaxias_maculatus.jpg":[693,572,"#efefe7"],"lossy-page1-320px-LatPT2_gray.tif.jpg":[320,111,"#c5bcb5"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_actinopterygii","<ul class=\"tree\" data-tree-range=\"actinopterygii\"><li><input type=\"checkbox\" checked id=\"Osteichthyes_Actinopterygii\"><label class=\"tree_label\" for=\"Osteichthyes_Actinopterygii\"></label><div class=\"outer_tree_box\"><div id=\"actinopterygii_actinopterygii\" class=\"tree_box\"><span><span>Actinopterygii</span><a href=\"https://en.wikipedia.org/wiki/Actinopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Actinopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Actinopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Actinopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌæktɪnɒptəˈrɪdʒiaɪ\" target=\"_blank\">ˌæktɪnɒptəˈrɪdʒiaɪ</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"chordata\">See parent</button><span class=\"badge\">Class</span></span><p class=\"tag\">The ray-finned fish. The majority of the extant fish. They have lightly built fins made of webbings of skin supported by radially extended thin bony spines that resemble folding fans.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Sole_commune_%28Solea_solea%29_en_rade_de_Brest_%28Ifremer_00558-67035_-_20670%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sole_commune_%28Solea_solea%29_en_rade_de_Brest_%28Ifremer_00558-67035_-_20670%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#8d8267\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hippocampus_hippocampus_%28on_Ascophyllum_nodosum%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hippocampus_hippocampus_%28on_Ascophyllum_nodosum%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#393217\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stone_Fish_at_AQWA_SMC2006.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stone_Fish_at_AQWA_SMC2006.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8e7d6b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Morena_pimienta_%28Gymnothorax_griseus%29%2C_parque_nacional_Ras_Muhammad%2C_Egipto%2C_2022-03-27%2C_DD_185.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Morena_pimienta_%28Gymnothorax_griseus%29%2C_parque_nacional_Ras_Muhammad%2C_Egipto%2C_2022-03-27%2C_DD_185.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#898162\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Puffer_Fish_DSC01257.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Puffer_Fish_DSC01257.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#45787c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clown_fish_in_the_Andaman_Coral_Reef.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Clown_fish_in_the_Andaman_Coral_Reef.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#644a24\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chaetodon_ephippium_PLW_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chaetodon_ephippium_PLW_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#3e8a7b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MC_Rotfeuerfisch.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-MC_Rotfeuerfisch.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#31352c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Atlantischer_Lachs.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Atlantischer_Lachs.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"148\" style=\"background-color:#5e6855\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_polypteriformes\" class=\"tree_box\"><span><span>Polypteriformes</span><a href=\"https://en.wikipedia.org/wiki/Polypteriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Polypteriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Polypteriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Polypteriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=pəˈlɪptərɪfɔːrmiːz\" target=\"_blank\">pəˈlɪptərɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(bichirs, reedfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Cuvier-105-Polypt%C3%A8re.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cuvier-105-Polypt%C3%A8re.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"49\" style=\"background-color:#c5c4b8\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_acipenseriformes\" class=\"tree_box\"><span><span>Acipenseriformes</span><a href=\"https://en.wikipedia.org/wiki/Acipenseriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Acipenseriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Acipenseriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Acipenseriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(sturgeon, paddlefish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Atlantic_sturgeon_flipped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Atlantic_sturgeon_flipped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"80\" style=\"background-color:#c3c3ba\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Actinopterygii_Neopterygii\"><label class=\"tree_label\" for=\"Actinopterygii_Neopterygii\"></label><div class=\"outer_tree_box\"><div id=\"actinopterygii_neopterygii\" class=\"tree_box\"><span><span>Neopterygii</span><a href=\"https://en.wikipedia.org/wiki/Neopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Neopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Neopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Neopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><p class=\"tag\">The dorsal and anal fins have a 1:1 ratio between radials and basals, the caudal fin also becomes more symmetrical, scales are less mineralised and more ossification of the notochord.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_lepisosteiformes\" class=\"tree_box\"><span><span>Lepisosteiformes</span><a href=\"https://en.wikipedia.org/wiki/Lepisosteiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lepisosteiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lepisosteiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lepisosteiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(gars)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Alligator_gar_fish_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Alligator_gar_fish_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"79\" style=\"background-color:#b7b7b0\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_amiiformes\" class=\"tree_box\"><span><span>Amiiformes</span><a href=\"https://en.wikipedia.org/wiki/Amiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Amiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Amiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Amiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(bowfins)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Amia_calva_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amia_calva_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"83\" style=\"background-color:#aca38d\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Neopterygii_Teleostei\"><label class=\"tree_label\" for=\"Neopterygii_Teleostei\"></label><div class=\"outer_tree_box\"><div id=\"actinopterygii_teleostei\" class=\"tree_box\"><span><span>Teleostei</span><a href=\"https://en.wikipedia.org/wiki/Teleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Teleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Teleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Teleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌtɛliˈɒstiaɪ\" target=\"_blank\">ˌtɛliˈɒstiaɪ</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Infraclass</span></span><p class=\"tag\">Have a movable premaxilla used to protrude their jaws outwards from their mouth. Most use external fertilisation and many are sequential hermaphrodites changing sex with age.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Common_carp_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Common_carp_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"142\" style=\"background-color:#bab3a7\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Teleostei_Osteoglossomorpha\"><label class=\"tree_label\" for=\"Teleostei_Osteoglossomorpha\"></label><div class=\"outer_tree_box\"><div id=\"actinopterygii_osteoglossomorpha\" class=\"tree_box\"><span><span>Osteoglossomorpha</span><a href=\"https://en.wikipedia.org/wiki/Osteoglossomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Osteoglossomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Osteoglossomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Osteoglossomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Use their tongue as the opposing surface for the teeth. Extant species are freshwater fish.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_hiodontiformes\" class=\"tree_box\"><span><span>Hiodontiformes</span><a href=\"https://en.wikipedia.org/wiki/Hiodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hiodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hiodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hiodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=haɪəˈdɒntɪfɔːrmiːz\" target=\"_blank\">haɪəˈdɒntɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(mooneyes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Hiodon_tergisus_NOAA.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Hiodon_tergisus_NOAA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"66\" style=\"background-color:#dfd8cc\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_osteoglossiformes\" class=\"tree_box\"><span><span>Osteoglossiformes</span><a href=\"https://en.wikipedia.org/wiki/Osteoglossiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Osteoglossiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Osteoglossiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Osteoglossiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌɒstiːoʊˈɡlɒsɪfɔːrmiːz\" target=\"_blank\">ˌɒstiːoʊˈɡlɒsɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(bonytongues, elephantfishes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Osteoglossum_bicirrhosum_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Osteoglossum_bicirrhosum_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"73\" style=\"background-color:#afa99c\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Teleostei_Elopomorpha\"><label class=\"tree_label\" for=\"Teleostei_Elopomorpha\"></label><div class=\"outer_tree_box\"><div id=\"actinopterygii_elopomorpha\" class=\"tree_box\"><span><span>Elopomorpha</span><a href=\"https://en.wikipedia.org/wiki/Elopomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Elopomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Elopomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Elopomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><p class=\"tag\">Unique to this group are flat and transparent larvae.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_elopiformes\" class=\"tree_box\"><span><span>Elopiformes</span><a href=\"https://en.wikipedia.org/wiki/Elopiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Elopiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Elopiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Elopiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈɛləpɪfɔːrmiːz\" target=\"_blank\">ˈɛləpɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(tenpounders, tarpons, ladyfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Tarpon_%28PSF%29.png\" target=\"_blank\"><img src=\"thumbnails/250px-Tarpon_%28PSF%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"87\" style=\"background-color:#d2d2d2\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_albuliformes\" class=\"tree_box\"><span><span>Albuliformes</span><a href=\"https://en.wikipedia.org/wiki/Albuliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Albuliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Albuliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Albuliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈælbjəlɪfɔːrmiːz\" target=\"_blank\">ˈælbjəlɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(Japanese gissus, bonefishes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Albula_conorhynchus_-_1700-1880_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Albula_conorhynchus_-_1700-1880_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"84\" style=\"background-color:#bfbcb8\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_notacanthiformes\" class=\"tree_box\"><span><span>Notacanthiformes</span><a href=\"https://en.wikipedia.org/wiki/Notacanthiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Notacanthiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Notacanthiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Notacanthiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=nɒtəˈkænθɪfɔːrmiːz\" target=\"_blank\">nɒtəˈkænθɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Deep-sea ray-finned eels.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Notacanthus_sexspinis1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Notacanthus_sexspinis1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"35\" style=\"background-color:#bababa\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_anguilliformes\" class=\"tree_box\"><span><span>Anguilliformes</span><a href=\"https://en.wikipedia.org/wiki/Anguilliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Anguilliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Anguilliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Anguilliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=æŋˈɡwɪlɪfɔːrmiːz\" target=\"_blank\">æŋˈɡwɪlɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(true eels)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Conger_conger_Gervais.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Conger_conger_Gervais.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"91\" style=\"background-color:#cecccb\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Teleostei_Otocephala\"><label class=\"tree_label\" for=\"Teleostei_Otocephala\"></label><div class=\"outer_tree_box\"><div id=\"actinopterygii_otocephala\" class=\"tree_box\"><span><span>Otocephala</span><a href=\"https://en.wikipedia.org/wiki/Otocephala\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Otocephala\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Otocephala\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Otocephala\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Named for the presence of a hearing link from the swimbladder to the inner ear.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:FMIB_43249_Menhaden_%28Brevortia_tyrannus%29_2.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-FMIB_43249_Menhaden_%28Brevortia_tyrannus%29_2.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"135\" style=\"background-color:#dcd4c3\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_clupeiformes\" class=\"tree_box\"><span><span>Clupeiformes</span><a href=\"https://en.wikipedia.org/wiki/Clupeiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Clupeiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Clupeiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Clupeiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈkluːpiːɪfɔːrmiːz\" target=\"_blank\">ˈkluːpiːɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(herrings, anchovies, sardines)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:American_shad_fish_alosa_sapidissima_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-American_shad_fish_alosa_sapidissima_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"109\" style=\"background-color:#c6ccc6\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_alepocephaliformes\" class=\"tree_box\"><span><span>Alepocephaliformes</span><a href=\"https://en.wikipedia.org/wiki/Alepocephaliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Alepocephaliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Alepocephaliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Alepocephaliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(slickheads, tubeshoulders)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Alepocephalus_rostratus_Gervais.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Alepocephalus_rostratus_Gervais.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"70\" style=\"background-color:#b2b1b7\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Otocephala_Ostariophysi\"><label class=\"tree_label\" for=\"Otocephala_Ostariophysi\"></label><div class=\"outer_tree_box\"><div id=\"actinopterygii_ostariophysi\" class=\"tree_box\"><span><span>Ostariophysi</span><a href=\"https://en.wikipedia.org/wiki/Ostariophysi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ostariophysi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ostariophysi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ostariophysi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><p class=\"tag\">Have an alarm substance and a Weberian apparatus - a chain of small bones that connect the auditory system to the gas bladder. Most species possess a swim bladder</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_gonorynchiformes\" class=\"tree_box\"><span><span>Gonorynchiformes</span><a href=\"https://en.wikipedia.org/wiki/Gonorynchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gonorynchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gonorynchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gonorynchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(milkfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Chanos_salmoneus_Achilles_166.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chanos_salmoneus_Achilles_166.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"105\" style=\"background-color:#ebe9e3\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_cypriniformes\" class=\"tree_box\"><span><span>Cypriniformes</span><a href=\"https://en.wikipedia.org/wiki/Cypriniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cypriniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cypriniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cypriniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(minnow, carp, loach)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Common_carp_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Common_carp_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"108\" style=\"background-color:#b8b1a4\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_characiformes\" class=\"tree_box\"><span><span>Characiformes</span><a href=\"https://en.wikipedia.org/wiki/Characiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Characiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Characiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Characiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(tetras, piranhas)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:F_de_Castelnau-poissonsPl37_%28Serrasalmus_humeralis%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-F_de_Castelnau-poissonsPl37_%28Serrasalmus_humeralis%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"160\" style=\"background-color:#c6bdbb\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_gymnotiformes\" class=\"tree_box\"><span><span>Gymnotiformes</span><a href=\"https://en.wikipedia.org/wiki/Gymnotiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gymnotiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gymnotiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gymnotiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(knifefish, electric eels)</span><p class=\"tag\">They have long bodies and swim using undulations of their elongated anal fin. They mostly live in fresh water, are usually nocturnal and are capable of producing electric fields to detect prey, for navigation, communication, and for the electric eel, attack and defense.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Adontosternarchus_balaenops.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Adontosternarchus_balaenops.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"154\" style=\"background-color:#564b2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eigenmannia_lineata.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Eigenmannia_lineata.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"259\" style=\"background-color:#41431a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apteronotus_albifrons.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apteronotus_albifrons.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"116\" style=\"background-color:#aca8a7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:LatPT2_gray.tif\" target=\"_blank\"><img src=\"thumbnails/lossy-page1-320px-LatPT2_gray.tif.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"320\" height=\"111\" style=\"background-color:#c5bcb5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Electric-eel.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Electric-eel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#587748\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Electrophorus_electricus_showing_lateral_line_pits.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Electrophorus_electricus_showing_lateral_line_pits.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"310\" style=\"background-color:#4e4735\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_siluriformes\" class=\"tree_box\"><span><span>Siluriformes</span><a href=\"https://en.wikipedia.org/wiki/Siluriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Siluriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Siluriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Siluriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(catfish)</span><p class=\"tag\">In some species, their mucus-covered skin is used in cutaneous respiration, where the fish breathes through its skin.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Black_bullhead_fish_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Black_bullhead_fish_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"106\" style=\"background-color:#bebab6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aquarium_tropical_de_Pierrefitte-Nestalas_03082018_Clarias_batrachus_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aquarium_tropical_de_Pierrefitte-Nestalas_03082018_Clarias_batrachus_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"163\" style=\"background-color:#383836\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Teleostei_Euteleostei\"><label class=\"tree_label\" for=\"Teleostei_Euteleostei\"></label><div class=\"outer_tree_box\"><div id=\"actinopterygii_euteleostei\" class=\"tree_box\"><span><span>Euteleostei</span><a href=\"https://en.wikipedia.org/wiki/Euteleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Euteleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Euteleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Euteleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Bachforelle_Zeichnung.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bachforelle_Zeichnung.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"130\" style=\"background-color:#d1c6a6\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_lepidogalaxiiformes\" class=\"tree_box\"><span><span>Lepidogalaxiiformes</span><a href=\"https://en.wikipedia.org/wiki/Lepidogalaxiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lepidogalaxiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lepidogalaxiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lepidogalaxiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(salamanderfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Lepidogalaxias_salamandroides_324066790.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lepidogalaxias_salamandroides_324066790.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"126\" style=\"background-color:#9d7549\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Euteleostei_Protacanthopterygii\"><label class=\"tree_label\" for=\"Euteleostei_Protacanthopterygii\"></label><div class=\"outer_tree_box\"><div id=\"actinopterygii_protacanthopterygii\" class=\"tree_box\"><span><span>Protacanthopterygii</span><a href=\"https://en.wikipedia.org/wiki/Protacanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Protacanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Protacanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Protacanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><p class=\"tag\">Usual traits include: more than 24 vertebrae, epicentral cartilages, one supraorbital bone, and a mesocoracoid, an adipose fin, and (often prominent) glossohyal teeth. Most members are mid-sized to larger predators of smaller animals.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_argentiniformes\" class=\"tree_box\"><span><span>Argentiniformes</span><a href=\"https://en.wikipedia.org/wiki/Argentiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Argentiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Argentiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Argentiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(marine smelts)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Argentina_sphyraena.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Argentina_sphyraena.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"99\" style=\"background-color:#e4dfd8\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_galaxiiformes\" class=\"tree_box\"><span><span>Galaxiiformes</span><a href=\"https://en.wikipedia.org/wiki/Galaxiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Galaxiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Galaxiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Galaxiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(white bait, mudfishes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Galaxias_maculatus.jpg\" target=\"_blank\"><img src=\"thumbnails/Galaxias_maculatus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"693\" height=\"572\" style=\"background-color:#efefe7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chatham_Mudfish.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chatham_Mudfish.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"258\" style=\"background-color:#d1a368\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_esociformes\" class=\"tree_box\"><span><span>Esociformes</span><a href=\"https://en.wikipedia.org/wiki/Esociformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Esociformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Esociformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Esociformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(pike)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Esox_lucius1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Esox_lucius1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"92\" style=\"background-color:#d2cfc8\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_salmoniformes\" class=\"tree_box\"><span><span>Salmoniformes</span><a href=\"https://en.wikipedia.org/wiki/Salmoniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Salmoniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Salmoniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Salmoniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(salmon, trout)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Salmo_salar_%28crop%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Salmo_salar_%28crop%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"80\" style=\"background-color:#c8c3b8\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Euteleostei_Stomiati\"><label class=\"tree_label\" for=\"Euteleostei_Stomiati\"></label><div class=\"outer_tree_box\"><div id=\"actinopterygii_stomiati\" class=\"tree_box\"><span><span>Stomiati</span><a href=\"https://en.wikipedia.org/wiki/Stomiati\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Stomiati\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Stomiati\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Stomiati\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Known for their large mouth, long throat/barbel, and no caudal filament.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_stomiiformes\" class=\"tree_box\"><span><span>Stomiiformes</span><a href=\"https://en.wikipedia.org/wiki/Stomiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Stomiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Stomiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Stomiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(dragonfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Fish4104_-_Flickr_-_NOAA_Photo_Library.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fish4104_-_Flickr_-_NOAA_Photo_Library.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"130\" style=\"background-color:#cfc7c4\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_osmeriformes\" class=\"tree_box\"><span><span>Osmeriformes</span><a href=\"https://en.wikipedia.org/wiki/Osmeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Osmeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Osmeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Osmeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(smelt)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Pond_smelt_illustration.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pond_smelt_illustration.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"89\" style=\"background-color:#d6d6d6\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Euteleostei_Neoteleostei\"><label class=\"tree_label\" for=\"Euteleostei_Neoteleostei\"></label><div class=\"outer_tree_box\"><div id=\"actinopterygii_neoteleostei\" class=\"tree_box\"><span><span>Neoteleostei</span><a href=\"https://en.wikipedia.org/wiki/Neoteleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Neoteleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Neoteleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Neoteleostei\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">The swim bladder, when present, only serves as a buoyancy organ and is no longer connected to the gastrointestinal tract.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_ateleopodiformes\" class=\"tree_box\"><span><span>Ateleopodiformes</span><a href=\"https://en.wikipedia.org/wiki/Ateleopodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ateleopodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ateleopodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ateleopodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(jellynoses)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Ijimaia_plicatellus1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ijimaia_plicatellus1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"146\" style=\"background-color:#dedede\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_aulopiformes\" class=\"tree_box\"><span><span>Aulopiformes</span><a href=\"https://en.wikipedia.org/wiki/Aulopiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Aulopiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Aulopiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Aulopiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈɔːləpɪfɔːrmiːz\" target=\"_blank\">ˈɔːləpɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(lizardfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Aulopus_filamentosus.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aulopus_filamentosus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"141\" style=\"background-color:#ebe7e1\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_myctophiformes\" class=\"tree_box\"><span><span>Myctophiformes</span><a href=\"https://en.wikipedia.org/wiki/Myctophiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Myctophiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Myctophiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Myctophiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈmɪktəfɪfɔːrmiːz\" target=\"_blank\">ˈmɪktəfɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(lanternfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Myctophum_punctatum1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Myctophum_punctatum1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"87\" style=\"background-color:#d7d4cb\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"actinopterygii_acanthomorpha\" class=\"tree_box\"><span><span>Acanthomorpha</span><a href=\"https://en.wikipedia.org/wiki/Acanthomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Acanthomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Acanthomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Acanthomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"acanthomorpha\">See children</button><span class=\"badge\">Clade</span></span><p class=\"tag\">Have spines at the anterior edge of the dorsal and anal fins that can be extended for protection and retracted to decrease drag when swimming.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Scomber_scombrus.png\" target=\"_blank\"><img src=\"thumbnails/140px-Scomber_scombrus.png\" class=\"taxa-img\" loading=\"lazy\" width=\"140\" height=\"85\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul>")
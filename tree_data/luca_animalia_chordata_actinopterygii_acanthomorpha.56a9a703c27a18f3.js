@@ -0,0 +1 @@
+TreeData.register("luca_animalia_chordata_actinopterygii_acanthomorpha",[{"name":"Lampridiformes","parent":"Acanthomorpha","rank":"Order","ipa":"","etymology":"","common":["oarfish","opah","ribbonfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Lampris_guttatus.png/140px-Lampris_guttatus.png"],"species":0},{"name":"Paracanthopterygii","parent":"Acanthomorpha","rank":"Superorder","ipa":"","etymology":"","common":[],"tag":"","imgs":[],"species":0},{"name":"Percopsiformes","parent":"Paracanthopterygii","rank":"Order","ipa":"","etymology":"","common":["trout-perches"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/2c/Percopsis_omiscomaycus.jpg/250px-Percopsis_omiscomaycus.jpg"],"species":0},{"name":"Zeiformes","parent":"Paracanthopterygii","rank":"Order","ipa":"","etymology":"","common":["dories"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6b/Zeus_faber.jpg/250px-Zeus_faber.jpg"],"species":0},{"name":"Stylephoriformes","parent":"Paracanthopterygii","rank":"Order","ipa":"","etymology":"","common":["Tube-eyes"],"tag":"","imgs":[],"species":0},{"name":"Gadiformes","parent":"Paracanthopterygii","rank":"Order","ipa":"","etymology":"","common":["cods"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b9/Gadus_morhua.png/140px-Gadus_morhua.png"],"species":0},{"name":"Polymixiiformes","parent":"Acanthomorpha","rank":"Order","ipa":"","etymology":"","common":["beardfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/28/Polymixia_nobilis1.jpg/250px-Polymixia_nobilis1.jpg"],"species":0},{"name":"Acanthopterygii","parent":"Acanthomorpha","rank":"Superorder","ipa":"","etymology":"","common":[],"tag":"The spiny-rayed fishes.","imgs":[],"species":0},{"name":"Beryciformes","parent":"Acanthopterygii","rank":"Order","ipa":"ˈbɛrɪsɪfɔːrmiːz","etymology":"","common":["alfonsinos","whalefishes","squirrelfish","soldierfish","alfonsinos","berycids","pricklefishes","whalefishes","gibberfishes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/37/Beryx_decadactylus_%28white_background%29.jpg/250px-Beryx_decadactylus_%28white_background%29.jpg"],"species":0},{"name":"Trachichthyiformes","parent":"Acanthopterygii","rank":"Order","ipa":"træˈkɪkθi.ɪfɔːrmiːz","etymology":"","common":["pinecone fishes","slimeheads","fangtooths"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f7/Hoplostethus_mediterraneus.jpg/250px-Hoplostethus_mediterraneus.jpg"],"species":0},{"name":"Percomorpha","parent":"Acanthopterygii","rank":"Clade","ipa":"","etymology":"latin 'perch'-'shape'","common":[],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Scomber_scombrus.png/140px-Scomber_scombrus.png"],"species":17000},{"name":"Ophidiiformes","parent":"Percomorpha","rank":"Order","ipa":"","etymology":"","common":["cusk-eels","brotulas","pearlfishes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a8/Barathrites_iris.jpg/250px-Barathrites_iris.jpg"],"species":0},{"name":"Batrachoidiformes","parent":"Percomorpha","rank":"Order","ipa":"","etymology":"","common":["toadfishes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e1/Opsanus_beta_1.jpg/120px-Opsanus_beta_1.jpg"],"species":0},{"name":"Syngnathomorpharia","parent":"Percomorpha","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"","imgs":[],"species":0},{"name":"Scombriformes","parent":"Syngnathomorpharia","rank":"Order","ipa":"","etymology":"","common":["tunas","mackerel","bluefishes","ragfishes","pomfrets","cutlassfish","swallowers","medusafish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Scomber_scombrus.png/140px-Scomber_scombrus.png"],"species":0},{"name":"Syngnathiformes","parent":"Syngnathomorpharia","rank":"Order","ipa":"","etymology":"","common":["seahorses","seadragon","pipefishes","trumpetfishes","goatfishes","gurnards","seamoths"],"tag":"They generally have elongated, narrow bodies surrounded by a series of bony rings with small, tubular mouths. The shape of their mouth is usually for the ingestion of prey at close range via suction and are usually well camouflaged. The males house the fertilized eggs in an osmo-regulated brood pouch, or adhere them to their tail, until the eggs reach maturity.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Trumpetfish.jpg/500px-Trumpetfish.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/eb/Aulostomus_maculatus_%28Trumpetfish_-brown_variation%29.jpg/500px-Aulostomus_maculatus_%28Trumpetfish_-brown_variation%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Yellow_Trumpet_Fish.jpg/330px-Yellow_Trumpet_Fish.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/25/Hippocampus_hippocampus_%28on_Ascophyllum_nodosum%29.jpg/250px-Hippocampus_hippocampus_%28on_Ascophyllum_nodosum%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Tehotny_morsky_konik.jpg/250px-Tehotny_morsky_konik.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b6/Hippocampus_jayakari%2C_Egipto.jpg/330px-Hippocampus_jayakari%2C_Egipto.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Leafy_Seadragon_on_Kangaroo_Island.jpg/330px-Leafy_Seadragon_on_Kangaroo_Island.jpg","https://upload.wikimedia.org/wikipedia/commons/9/9a/TengunoOG.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Pegasus_lancifer_in_vivo.jpg/330px-Pegasus_lancifer_in_vivo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Eurypegasus_draconis_SI.jpg/330px-Eurypegasus_draconis_SI.jpg","https://upload.wikimedia.org/wikipedia/commons/3/33/Eurypegasus_draconis.jpg"],"species":0},{"name":"Gobiiformes","parent":"Percomorpha","rank":"Order","ipa":"ˈɡoʊbi.ɪfɔːrmiːz","etymology":"'goby-like'","common":["gobies","sleepers","mudskippers","prawn gobies","cardinalfishes","nurseryfishes","sand-divers"],"tag":"They have adhesive eggs with elaborate structures. Many species have parental care from the male. Some species can remain out of the water for long periods.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Cryptocentrus_cinctus.JPG/330px-Cryptocentrus_cinctus.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/ApogonVithisma.jpg/330px-ApogonVithisma.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Pterapogon_kauderni4.JPG/330px-Pterapogon_kauderni4.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e0/GambianMudskippers.jpg/330px-GambianMudskippers.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Cryptocentrus_strigilliceps_%28Target_shrimpgoby%29_and_Alpheus_rapacida_%28Snapping_shrimp%29.jpg/330px-Cryptocentrus_strigilliceps_%28Target_shrimpgoby%29_and_Alpheus_rapacida_%28Snapping_shrimp%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/Metallic_Shrimp_Goby.jpg/330px-Metallic_Shrimp_Goby.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Pterapogon_kauderni4.JPG/330px-Pterapogon_kauderni4.JPG","https://upload.wikimedia.org/wikipedia/commons/f/f1/%E0%B8%9B%E0%B8%A5%E0%B8%B2%E0%B8%95%E0%B8%B5%E0%B8%99%E0%B8%AB%E0%B8%A3%E0%B8%B7%E0%B8%AD%28%E0%B8%9B%E0%B8%A5%E0%B8%B2%E0%B8%81%E0%B8%A3%E0%B8%B0%E0%B8%88%E0%B8%B1%E0%B8%87%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4c/%C5%92ufs_de_gobie_%28Ifremer_00553-66491_-_49085%29.jpg/330px-%C5%92ufs_de_gobie_%28Ifremer_00553-66491_-_49085%29.jpg","https://upload.wikimedia.org/wikipedia/commons/5/5f/KuroeriGP.jpg"],"species":0},{"name":"Carangimopharia","parent":"Percomorpha","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"","imgs":[],"species":0},{"name":"Synbranchiformes","parent":"Carangimopharia","rank":"Order","ipa":"","etymology":"","common":["swamp eels"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/8/89/Monopterus_albus_4.jpg"],"species":0},{"name":"Anabantiformes","parent":"Carangimopharia","rank":"Order","ipa":"ænəˈbæntɪfɔːrmiːz","etymology":"","common":["labyrinth fishes","snakeheads","badids"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/f/f0/Anabas_testudineus.png"],"species":0},{"name":"Carangiformes","parent":"Carangimopharia","rank":"Order","ipa":"","etymology":"","common":["jacks","flatfish","billfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/Lined_sole.jpg/120px-Lined_sole.jpg"],"species":0},{"name":"Ovalentariae","parent":"Carangimopharia","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"Have demersal eggs that are attached to a substrate.","imgs":[],"species":0},{"name":"Cichliformes","parent":"Ovalentariae","rank":"Order","ipa":"","etymology":"","common":["cichlids","leaffishes","convict blenny"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Bathybates_ferox.jpg/250px-Bathybates_ferox.jpg"],"species":0},{"name":"Mugiliformes","parent":"Ovalentariae","rank":"Order","ipa":"","etymology":"","common":["mullets","Asiatic glassfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9d/Tainha_%28Mugil_sp%29.png/250px-Tainha_%28Mugil_sp%29.png"],"species":0},{"name":"Beloniformes","parent":"Ovalentariae","rank":"Order","ipa":"","etymology":"","common":["flyingfishes","ricefish","needlefishes","halfbeaks"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/Exocoetus_volitans.jpg/250px-Exocoetus_volitans.jpg"],"species":0},{"name":"Cyprinodontiformes","parent":"Ovalentariae","rank":"Order","ipa":"","etymology":"","common":["livebearers","killifishes","rivulines","pupfishes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/74/Fundulus_waccamensis.jpg/250px-Fundulus_waccamensis.jpg"],"species":0},{"name":"Atheriniformes","parent":"Ovalentariae","rank":"Order","ipa":"","etymology":"","common":["silversides","rainbowfishes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a1/Labidesthes_sicculus_1908.jpg/250px-Labidesthes_sicculus_1908.jpg"],"species":0},{"name":"Blenniiformes","parent":"Ovalentariae","rank":"Order","ipa":"'mucus'-'order'","etymology":"","common":["blennies","clingfishes","dottybacks","jawfishes","damselfishes","clownfishes","anemonefishes","surfperches","basslets"],"tag":"They often have a slimy coating on their scales; The blennies usually have elongated bodies with blunt heads sometimes with whiskers on top. The nested damselfishes and clownfishes are usually laterally compressed. They tend to be reclusive, burrowing into sandy substrates and living in reef crevices. Some look similar to the goby and dragonet families.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/ad/Amphiprion_ocellaris_%28Clown_anemonefish%29_by_Nick_Hobgood.jpg/330px-Amphiprion_ocellaris_%28Clown_anemonefish%29_by_Nick_Hobgood.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7b/Abudefduf_sexfasciatus_R%C3%A9union.jpg/330px-Abudefduf_sexfasciatus_R%C3%A9union.jpg","https://upload.wikimedia.org/wikipedia/commons/e/e7/Crysiptera_hemicyanea.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c8/Pomacentrus_caeruleopunctatus_R%C3%A9union.jpg/330px-Pomacentrus_caeruleopunctatus_R%C3%A9union.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/98/Maroon_Clown_Fish444.jpg/330px-Maroon_Clown_Fish444.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6a/Humbug_dascyllus_%28Dascyllus_aruanus%29_%2848652156722%29.jpg/330px-Humbug_dascyllus_%28Dascyllus_aruanus%29_%2848652156722%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/HemiglyphidPlagiom3RLS.jpg/330px-HemiglyphidPlagiom3RLS.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Manonichthys_splendens.jpg/330px-Manonichthys_splendens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7a/Paraplesiops_bleekeri_1.jpg/330px-Paraplesiops_bleekeri_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c4/Pez_cometa_%28Calloplesiops_altivelis%29%2C_Anilao%2C_Filipinas%2C_2023-08-25%2C_DD_270.jpg/330px-Pez_cometa_%28Calloplesiops_altivelis%29%2C_Anilao%2C_Filipinas%2C_2023-08-25%2C_DD_270.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Gramma_loreto_257593008.jpg/330px-Gramma_loreto_257593008.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Opistognathus_aurifrons.jpg/250px-Opistognathus_aurifrons.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c9/Jawfish_%28Stalix_sp.%29_%2841480592115%29.jpg/330px-Jawfish_%28Stalix_sp.%29_%2841480592115%29.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c3/Diplecogaster_bimaculata_%28Stefano_Guerrieri%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/Eastern_Cleaner_Clingfish-Cochleoceps_orientalis_%2822695734536%29.jpg/330px-Eastern_Cleaner_Clingfish-Cochleoceps_orientalis_%2822695734536%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e1/Notoclinops_caerulepunctus_%28Blue_dot_triplefin%29.jpg/330px-Notoclinops_caerulepunctus_%28Blue_dot_triplefin%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c4/Combtooth_blenny_mudskipper_%28Alticus_anjouanae%29_Reunion.jpg/330px-Combtooth_blenny_mudskipper_%28Alticus_anjouanae%29_Reunion.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/Plagiotremus_rhinorhynchos_%28Blue-lined_Sabertooth_Blenny%29.jpg/330px-Plagiotremus_rhinorhynchos_%28Blue-lined_Sabertooth_Blenny%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7a/Dactyloscopus_byersi.jpg/330px-Dactyloscopus_byersi.jpg","https://upload.wikimedia.org/wikipedia/commons/6/64/Acanthemblemaria_atrata_4.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ef/Chaenopsis_ocellata_173000605.jpg/250px-Chaenopsis_ocellata_173000605.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/76/Emblemariopsis_carib_%28Caribbean_Flagfin_Blenny%29.jpg/330px-Emblemariopsis_carib_%28Caribbean_Flagfin_Blenny%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Sarcastic_Fringehead_California_ScienCenter.jpg/330px-Sarcastic_Fringehead_California_ScienCenter.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Neoclinus_uninotatus_1_2017-04-01.jpg/330px-Neoclinus_uninotatus_1_2017-04-01.jpg"],"species":0},{"name":"Eupercaria","parent":"Percomorpha","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"","imgs":[],"species":0},{"name":"Perciformes","parent":"Eupercaria","rank":"Order","ipa":"","etymology":"","common":["groupers","perches","seabasses","darters","notothens","flatheads","searobins","scorpionfish","sculpins","sticklebacks","eelpouts","lionfish"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/58/Abborre%2C_Iduns_kokbok.jpg/120px-Abborre%2C_Iduns_kokbok.jpg","https://upload.wikimedia.org/wikipedia/commons/8/84/Grosserdrachenkopf-02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Pterois_volitans.001_-_Aquarium_Finisterrae.JPG/330px-Pterois_volitans.001_-_Aquarium_Finisterrae.JPG"],"species":0},{"name":"Centrarchiformes","parent":"Eupercaria","rank":"Order","ipa":"","etymology":"","common":["blackbasses","temperate perch","knifejaws","sea chubs","freshwater sunfish","hawkfishes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Micropterus_salmoides.jpg/120px-Micropterus_salmoides.jpg"],"species":0},{"name":"Labriformes","parent":"Eupercaria","rank":"Order","ipa":"","etymology":"","common":["wrasses","parrotfishes","cales","sandlances","stargazers","false scorpionfishes","sandperches","torrentfish"],"tag":"Their upper jaw is fused with the skull, allowing for powerful suction feeding. Found in a variety of marine habitats with diverse feeding habits. They use pectoral fin oscillation to move around.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Humphead_wrasse_melb_aquarium.jpg/330px-Humphead_wrasse_melb_aquarium.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e1/Vieille_coquette_%28Labrus_mixtus%29_%28Ifremer_00563-67488_-_23544%29_%28cropped_2%29.jpg/330px-Vieille_coquette_%28Labrus_mixtus%29_%28Ifremer_00563-67488_-_23544%29_%28cropped_2%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Paine%27s_flasher_wrasse_%28Paracheilinus_paineorum%29_%2840420276722%29.jpg/330px-Paine%27s_flasher_wrasse_%28Paracheilinus_paineorum%29_%2840420276722%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/03/CentrogenyVaigiensisRLS.jpg/330px-CentrogenyVaigiensisRLS.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/Odax_acroptilus.jpg/330px-Odax_acroptilus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/66/Odax_pullus_%28Greenbone%29.jpg/330px-Odax_pullus_%28Greenbone%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Ammodytes_hexapterus.jpg/330px-Ammodytes_hexapterus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8e/Genyagnus_monopterygius_355792970.jpg/330px-Genyagnus_monopterygius_355792970.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/95/Astroscopus_zephyreus_254703040.jpg/250px-Astroscopus_zephyreus_254703040.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Northern_Stargazer.JPG/330px-Northern_Stargazer.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Parapercis_hexophtalma_1.jpg/330px-Parapercis_hexophtalma_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Torrentfish.png/330px-Torrentfish.png"],"species":0},{"name":"Acropomatiformes","parent":"Eupercaria","rank":"Order","ipa":"","etymology":"","common":["lanternbellies","gnomefishes","wreckfishes","banjofish","oceanic basslets","armorheads"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/0/07/Banjos_banjos.jpg"],"species":0},{"name":"Acanthuriformes","parent":"Eupercaria","rank":"Order","ipa":"","etymology":"","common":["surgeonfishes","butterflyfishes","rabbitfishes","marine angelfishes","drumfishes","grunts","ponyfishes","mojarras","snappers","temperate basses","spadefishes","porgies","scats","bigeyes","boarfishes","bandfishes"],"tag":"Butterflyfishes, Angelfishes, And Allies. Contains many of the iconic tropical reef fish groups. Most species have a laterally compressed body for maneuvering between corals. They usually have a small, terminal mouth for for grazing on algae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Zanclus_cornutus_in_Kona.jpg/250px-Zanclus_cornutus_in_Kona.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Pacific_double-saddle_butterfly_fish_%28Chaetodon_ulietensis%29_Moorea.jpg/330px-Pacific_double-saddle_butterfly_fish_%28Chaetodon_ulietensis%29_Moorea.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/Acanthurussohal-ArabischerDoktor.jpg/330px-Acanthurussohal-ArabischerDoktor.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4a/Pomocanthus_imperator_facing_right.jpg/330px-Pomocanthus_imperator_facing_right.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/Holacanthus_ciliaris_2.jpg/250px-Holacanthus_ciliaris_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ac/Malacanthus_latovittatus.jpg/330px-Malacanthus_latovittatus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Grammatonotus_brianne.jpg/330px-Grammatonotus_brianne.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a5/Lethrinus_obsoletus.jpg/330px-Lethrinus_obsoletus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2d/Goldbrasse_-_9379.jpg/330px-Goldbrasse_-_9379.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2c/Scatophagus_argus_%28Wroclaw_zoo%29-2.JPG/330px-Scatophagus_argus_%28Wroclaw_zoo%29-2.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Acanthocepola_krusensternii.JPG/330px-Acanthocepola_krusensternii.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/Priacanthus_cruentatus.jpg/330px-Priacanthus_cruentatus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Boarfish_%28_Antigonia_capros_%29.jpg/330px-Boarfish_%28_Antigonia_capros_%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/Paddletail_melb_aquarium.jpg/330px-Paddletail_melb_aquarium.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Silver_Moony.jpg/330px-Silver_Moony.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/86/Lobotes_surinamensis_Gobius.jpg/330px-Lobotes_surinamensis_Gobius.jpg","https://upload.wikimedia.org/wikipedia/commons/d/d1/3726_aquaimages.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c7/Platax_teira.jpg/330px-Platax_teira.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/Dicentrarchus_labrax.jpg/250px-Dicentrarchus_labrax.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/Sunday_fishing_in_Tokyo_bay.jpg/330px-Sunday_fishing_in_Tokyo_bay.jpg"],"species":0},{"name":"Lophiiformes","parent":"Eupercaria","rank":"Order","ipa":"ˌlɒfiɪˈfɔːrmiːz","etymology":"","common":["anglerfishes","deep-sea batfishes","sea toads","frogfishes","monkfishes","goosefishes","dreamers"],"tag":"Named from the way many species have a modified dorsal fin ray that acts as a lure for prey. They are generally ambush predators. The majority of species are bottom-dwellers, with some deep-sea anglerfish living high in the water column.  They are sexual dimorphic; this can go so far as sexual parasitism with the male attached to the much larger female, sometimes fusing together as an example of natural parabiosis. In most species, a wide mouth extends all around the anterior circumference of the head, and bands of inwardly inclined teeth line both jaws and the teeth are depressible and can hinge back. They have gills that open behind the pectoral fins. Their lengths vary from 2–18 cm.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1b/Humpback_anglerfish.png/120px-Humpback_anglerfish.png","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Halieutaea_stellata_by_DaijuAzuma.jpg/250px-Halieutaea_stellata_by_DaijuAzuma.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/Caulophryne_pelagica_facing_left.jpg/330px-Caulophryne_pelagica_facing_left.jpg","https://upload.wikimedia.org/wikipedia/commons/5/59/Sea_toad_genus_Chaunax_Mona_Canyon_13_April_2015.png","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9a/Lophius_piscatorius_269401148.jpg/330px-Lophius_piscatorius_269401148.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b9/%D0%A1%D0%B5%D0%B2%D0%B5%D1%80%D0%BD%D0%B0%D1%8F_%D1%86%D0%B5%D1%80%D0%B0%D0%BF%D0%B8%D1%8F_%28cropped%29.jpg/330px-%D0%A1%D0%B5%D0%B2%D0%B5%D1%80%D0%BD%D0%B0%D1%8F_%D1%86%D0%B5%D1%80%D0%B0%D0%BF%D0%B8%D1%8F_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Ogcocephalus_vespertilio_110861367.jpg/330px-Ogcocephalus_vespertilio_110861367.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Expl2183_%289734084875%29.jpg/330px-Expl2183_%289734084875%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Sea_toad_%28Chaunacops_cf._melanostomus%29.jpg/330px-Sea_toad_%28Chaunacops_cf._melanostomus%29.jpg","https://upload.wikimedia.org/wikipedia/commons/c/cf/Haplophryne.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a5/BMC_-_Thaumatichthyidae-Thaumatichthys.binghami.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a4/BMC_-_Melanocetidae-Melanocetus.eustales.jpg"],"species":0},{"name":"Tetraodontiformes","parent":"Eupercaria","rank":"Order","ipa":"","etymology":"'four-tooth'","common":["pufferfishes","boxfishes","triplespines","spikefishes","triggerfishes","filefishes","ocean sunfish","porcupinefishes"],"tag":"Most do not have a streamlined body and are slow moving are ostraciiform swimmers. They have bodies that are nearly square or triangular, spherical, or laterally compressed. They range in size from 2 cm to 3 m in length. Some inflate their bodies in defense or have a powerful neurotoxin.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/77/Puffer_Fish_DSC01257.JPG/330px-Puffer_Fish_DSC01257.JPG","https://upload.wikimedia.org/wikipedia/commons/1/11/Arothron_meleagris_by_NPS_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Pufferfish_%28Butete%29.jpg/330px-Pufferfish_%28Butete%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/Arothron_mappa_-_Nancy.jpg/330px-Arothron_mappa_-_Nancy.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Pufferfish_komodo.jpg/330px-Pufferfish_komodo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cc/Ostracion_cubicum_400115646.jpg/330px-Ostracion_cubicum_400115646.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/88/Kentrocapros_aculeatus_%28Takeshima_aquarium%29.jpg/330px-Kentrocapros_aculeatus_%28Takeshima_aquarium%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8f/Abalistes_filamentosus_JNC2724_Body.JPG/330px-Abalistes_filamentosus_JNC2724_Body.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6a/Triacanthus_biaculeatus%2C_Mangalore_%28cropped%29.JPG/330px-Triacanthus_biaculeatus%2C_Mangalore_%28cropped%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6a/Triodon_macropterus_JNC2989.JPG/330px-Triodon_macropterus_JNC2989.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Triacanthodes_anomalus_by_OpenCage.JPG/250px-Triacanthodes_anomalus_by_OpenCage.JPG","https://upload.wikimedia.org/wikipedia/commons/3/3f/Stephanolepis_hispidus.jpg","https://upload.wikimedia.org/wikipedia/commons/9/95/Mola_alexandrini_%28Bump-head_Mola%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/98/Mola_mola.jpg/330px-Mola_mola.jpg"],"species":0}],{},{"120px-Abborre,_Iduns_kokbok.jpg":[120,58,"#c5c0b1"],"120px-Humpback_anglerfish.png":[120,112,"#a6a095"],"120px-Lined_sole.jpg":[120,82,"#a29891"],"120px-Micropterus_salmoides.jpg":[120,50,"#c6bca2"],"120px-Opsanus_beta_1.jpg":[120,106,"#b7b6a8"],"140px-Gadus_morhua.png":[140,85,null],"140px-Lampris_guttatus.png":[140,85,null],"140px-Scomber_scombrus.png":[140,85,null],"250px-Astroscopus_zephyreus_254703040.jpg":[250,317,"#5a7976"],"250px-Barathrites_iris.jpg":[250,86,"#e6e1d9"],"250px-Bathybates_ferox.jpg":[250,97,"#d0cec6"],"250px-Beryx_decadactylus_(white_background).jpg":[250,174,"#f0d6cd"],"250px-Chaenopsis_ocellata_173000605.jpg":[250,333,"#434526"],"250px-Dicentrarchus_labrax.jpg":[250,245,"#706647"],"250px-Exocoetus_volitans.jpg":[250,135,"#eceae8"],"250px-Fundulus_waccamensis.jpg":[250,83,"#d4d8d3"],"250px-Halieutaea_stellata_by_DaijuAzuma.jpg":[250,250,"#5a6392"],"250px-Hippocampus_hippocampus_(on_Ascophyllum_nodosum).jpg":[250,333,"#393217"],"250px-Holacanthus_ciliaris_2.jpg":[249,255,"#47728f"],"250px-Hoplostethus_mediterraneus.jpg":[250,131,"#d0ccc5"],"250px-Labidesthes_sicculus_1908.jpg":[250,73,"#f3f2ea"],"250px-Opistognathus_aurifrons.jpg":[250,329,"#5c6379"],"250px-Percopsis_omiscomaycus.jpg":[250,104,"#dddcd3"],"250px-Polymixia_nobilis1.jpg":[250,125,"#dadada"],"250px-Tainha_(Mugil_sp).png":[250,89,null],"250px-Tehotny_morsky_konik.jpg":[250,333,"#6f441d"],"250px-Triacanthodes_anomalus_by_OpenCage.JPG":[250,250,"#574940"],"250px-Zanclus_cornutus_in_Kona.jpg":[250,298,"#557859"],"250px-Zeus_faber.jpg":[250,174,"#c9c0ba"],"330px-Abalistes_filamentosus_JNC2724_Body.JPG":[330,188,"#aba7a8"],"330px-Abudefduf_sexfasciatus_Réunion.jpg":[330,242,"#4a7973"],"330px-Acanthocepola_krusensternii.JPG":[330,247,"#659299"],"330px-Acanthurussohal-ArabischerDoktor.jpg":[330,163,"#657479"],"330px-Ammodytes_hexapterus.jpg":[330,247,"#515354"],"330px-Amphiprion_ocellaris_(Clown_anemonefish)_by_Nick_Hobgood.jpg":[330,225,"#503719"],"330px-ApogonVithisma.jpg":[330,247,"#825e4d"],"330px-Arothron_mappa_-_Nancy.jpg":[330,247,"#796351"],"330px-Boarfish_(_Antigonia_capros_).jpg":[330,220,"#438e89"],"330px-Caulophryne_pelagica_facing_left.jpg":[330,226,"#1c1616"],"330px-CentrogenyVaigiensisRLS.jpg":[330,220,"#616847"],"330px-Combtooth_blenny_mudskipper_(Alticus_anjouanae)_Reunion.jpg":[330,220,"#65656a"],"330px-Cryptocentrus_cinctus.JPG":[330,220,"#6a6949"],"330px-Cryptocentrus_strigilliceps_(Target_shrimpgoby)_and_Alpheus_rapacida_(Snapping_shrimp).jpg":[330,247,"#8a7854"],"330px-Dactyloscopus_byersi.jpg":[330,225,"#777f7e"],"330px-Eastern_Cleaner_Clingfish-Cochleoceps_orientalis_(22695734536).jpg":[330,247,"#585340"],"330px-Emblemariopsis_carib_(Caribbean_Flagfin_Blenny).jpg":[330,248,"#724d36"],"330px-Eurypegasus_draconis_SI.jpg":[330,255,"#ece5d9"],"330px-Expl2183_(9734084875).jpg":[330,186,"#393743"],"330px-GambianMudskippers.jpg":[330,235,"#857463"],"330px-Genyagnus_monopterygius_355792970.jpg":[330,247,"#414843"],"330px-Goldbrasse_-_9379.jpg":[330,148,"#3c3f40"],"330px-Gramma_loreto_257593008.jpg":[330,247,"#392c2a"],"330px-Grammatonotus_brianne.jpg":[330,221,"#e5d6cc"],"330px-HemiglyphidPlagiom3RLS.jpg":[330,220,"#494a53"],"330px-Hippocampus_jayakari,_Egipto.jpg":[330,245,"#528b82"],"330px-Humbug_dascyllus_(Dascyllus_aruanus)_(48652156722).jpg":[330,248,"#596564"],"330px-Humphead_wrasse_melb_aquarium.jpg":[330,220,"#50615e"],"330px-Jawfish_(Stalix_sp.)_(41480592115).jpg":[330,248,"#817773"],"330px-Kentrocapros_aculeatus_(Takeshima_aquarium).jpg":[330,198,"#53564f"],"330px-Leafy_Seadragon_on_Kangaroo_Island.jpg":[330,220,"#2a414d"],"330px-Lethrinus_obsoletus.jpg":[330,248,"#4d5149"],"330px-Lobotes_surinamensis_Gobius.jpg":[330,170,"#636e70"],"330px-Lophius_piscatorius_269401148.jpg":[330,247,"#3f5e80"],"330px-Malacanthus_latovittatus.jpg":[330,240,"#566b63"],"330px-Manonichthys_splendens.jpg":[330,224,"#6d4b27"],"330px-Maroon_Clown_Fish444.jpg":[330,247,"#4c3d1e"],"330px-Metallic_Shrimp_Goby.jpg":[330,249,"#82a39d"],"330px-Mola_mola.jpg":[330,258,"#014b83"],"330px-Neoclinus_uninotatus_1_2017-04-01.jpg":[330,247,"#2e2322"],"330px-Northern_Stargazer.JPG":[330,220,"#96938d"],"330px-Notoclinops_caerulepunctus_(Blue_dot_triplefin).jpg":[330,133,"#7b605b"],"330px-Odax_acroptilus.jpg":[330,237,"#434111"],"330px-Odax_pullus_(Greenbone).jpg":[330,167,"#232c3b"],"330px-Ogcocephalus_vespertilio_110861367.jpg":[330,219,"#57574f"],"330px-Ostracion_cubicum_400115646.jpg":[330,219,"#305f63"],"330px-Pacific_double-saddle_butterfly_fish_(Chaetodon_ulietensis)_Moorea.jpg":[330,220,"#52a3bc"],"330px-Paddletail_melb_aquarium.jpg":[330,220,"#3c4532"],"330px-Paine's_flasher_wrasse_(Paracheilinus_paineorum)_(40420276722).jpg":[330,224,"#221c1b"],"330px-Parapercis_hexophtalma_1.jpg":[330,237,"#61949c"],"330px-Paraplesiops_bleekeri_1.jpg":[330,221,"#7b8a69"],"330px-Pegasus_lancifer_in_vivo.jpg":[330,219,"#85877b"],"330px-Pez_cometa_(Calloplesiops_altivelis),_Anilao,_Filipinas,_2023-08-25,_DD_270.jpg":[330,220,"#4b4747"],"330px-Plagiotremus_rhinorhynchos_(Blue-lined_Sabertooth_Blenny).jpg":[330,247,"#9c6948"],"330px-Platax_teira.jpg":[330,237,"#156cc8"],"330px-Pomacentrus_caeruleopunctatus_Réunion.jpg":[330,261,"#443f3b"],"330px-Pomocanthus_imperator_facing_right.jpg":[330,248,"#567766"],"330px-Priacanthus_cruentatus.jpg":[330,220,"#503e3e"],"330px-Pterapogon_kauderni4.JPG":[330,248,"#6a6a61"],"330px-Pterois_volitans.001_-_Aquarium_Finisterrae.JPG":[330,247,"#3052b4"],"330px-Puffer_Fish_DSC01257.JPG":[330,282,"#45787c"],"330px-Pufferfish_(Butete).jpg":[330,219,"#7d8569"],"330px-Pufferfish_komodo.jpg":[330,247,"#595046"],"330px-Sarcastic_Fringehead_California_ScienCenter.jpg":[330,247,"#6866ae"],"330px-Scatophagus_argus_(Wroclaw_zoo)-2.JPG":[330,247,"#5b6661"],"330px-Sea_toad_(Chaunacops_cf._melanostomus).jpg":[330,186,"#544243"],"330px-Silver_Moony.jpg":[330,247,"#50675c"],"330px-Sunday_fishing_in_Tokyo_bay.jpg":[330,221,"#a78654"],"330px-Torrentfish.png":[330,131,"#473d31"],"330px-Triacanthus_biaculeatus,_Mangalore_(cropped).JPG":[330,207,"#386576"],"330px-Triodon_macropterus_JNC2989.JPG":[330,303,"#9e9ea4"],"330px-Vieille_coquette_(Labrus_mixtus)_(Ifremer_00563-67488_-_23544)_(cropped_2).jpg":[330,194,"#29574a"],"330px-Yellow_Trumpet_Fish.jpg":[330,248,"#5b6759"],"330px-Œufs_de_gobie_(Ifremer_00553-66491_-_49085).jpg":[330,220,"#a09e80"],"330px-Северная_церапия_(cropped).jpg":[330,140,"#979698"],"3726_aquaimages.jpg":[600,450,"#74827b"],"500px-Aulostomus_maculatus_(Trumpetfish_-brown_variation).jpg":[500,666,"#0f232f"],"500px-Trumpetfish.jpg":[500,654,"#75918a"],"Acanthemblemaria_atrata_4.jpg":[640,436,"#67654b"],"Anabas_testudineus.png":[482,362,"#2d2f26"],"Arothron_meleagris_by_NPS_1.jpg":[504,448,"#63655c"],"BMC_-_Melanocetidae-Melanocetus.eustales.jpg":[585,449,"#30150e"],"BMC_-_Thaumatichthyidae-Thaumatichthys.binghami.jpg":[582,327,"#241910"],"Banjos_banjos.jpg":[726,545,"#d8ddd9"],"Crysiptera_hemicyanea.jpg":[500,332,"#868ba6"],"Diplecogaster_bimaculata_(Stefano_Guerrieri).jpg":[610,408,"#8a6d3d"],"Eurypegasus_draconis.jpg":[746,480,"#1b4558"],"Grosserdrachenkopf-02.jpg":[698,523,"#544a37"],"Haplophryne.jpg":[266,180,"#333029"],"KuroeriGP.jpg":[640,480,"#585c61"],"Mola_alexandrini_(Bump-head_Mola).jpg":[638,480,"#0c8fb6"],"Monopterus_albus_4.jpg":[646,480,"#8c7c74"],"Sea_toad_genus_Chaunax_Mona_Canyon_13_April_2015.png":[322,237,"#8a755c"],"Stephanolepis_hispidus.jpg":[586,401,"#453a23"],"TengunoOG.jpg":[640,480,"#62635c"],"ปลาตีนหรือ(ปลากระจัง).jpg":[658,433,"#a3967e"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_actinopterygii_acanthomorpha","<ul class=\"tree\" data-tree-range=\"acanthomorpha\"><li><input type=\"checkbox\" checked id=\"Neoteleostei_Acanthomorpha\"><label class=\"tree_label\" for=\"Neoteleostei_Acanthomorpha\"></label><div class=\"outer_tree_box\"><div id=\"acanthomorpha_acanthomorpha\" class=\"tree_box\"><span><span>Acanthomorpha</span><a href=\"https://en.wikipedia.org/wiki/Acanthomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Acanthomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Acanthomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Acanthomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"actinopterygii\">See parent</button><span class=\"badge\">Clade</span></span><p class=\"tag\">Have spines at the anterior edge of the dorsal and anal fins that can be extended for protection and retracted to decrease drag when swimming.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Scomber_scombrus.png\" target=\"_blank\"><img src=\"thumbnails/140px-Scomber_scombrus.png\" class=\"taxa-img\" loading=\"lazy\" width=\"140\" height=\"85\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_lampridiformes\" class=\"tree_box\"><span><span>Lampridiformes</span><a href=\"https://en.wikipedia.org/wiki/Lampridiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lampridiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lampridiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lampridiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(oarfish, opah, ribbonfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Lampris_guttatus.png\" target=\"_blank\"><img src=\"thumbnails/140px-Lampris_guttatus.png\" class=\"taxa-img\" loading=\"lazy\" width=\"140\" height=\"85\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Acanthomorpha_Paracanthopterygii\"><label class=\"tree_label\" for=\"Acanthomorpha_Paracanthopterygii\"></label><div class=\"outer_tree_box\"><div id=\"acanthomorpha_paracanthopterygii\" class=\"tree_box\"><span><span>Paracanthopterygii</span><a href=\"https://en.wikipedia.org/wiki/Paracanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Paracanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Paracanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Paracanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_percopsiformes\" class=\"tree_box\"><span><span>Percopsiformes</span><a href=\"https://en.wikipedia.org/wiki/Percopsiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Percopsiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Percopsiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Percopsiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(trout-perches)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Percopsis_omiscomaycus.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Percopsis_omiscomaycus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"104\" style=\"background-color:#dddcd3\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_zeiformes\" class=\"tree_box\"><span><span>Zeiformes</span><a href=\"https://en.wikipedia.org/wiki/Zeiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Zeiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Zeiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Zeiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(dories)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Zeus_faber.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Zeus_faber.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"174\" style=\"background-color:#c9c0ba\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_stylephoriformes\" class=\"tree_box\"><span><span>Stylephoriformes</span><a href=\"https://en.wikipedia.org/wiki/Stylephoriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Stylephoriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Stylephoriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Stylephoriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(Tube-eyes)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_gadiformes\" class=\"tree_box\"><span><span>Gadiformes</span><a href=\"https://en.wikipedia.org/wiki/Gadiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gadiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gadiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gadiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(cods)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Gadus_morhua.png\" target=\"_blank\"><img src=\"thumbnails/140px-Gadus_morhua.png\" class=\"taxa-img\" loading=\"lazy\" width=\"140\" height=\"85\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_polymixiiformes\" class=\"tree_box\"><span><span>Polymixiiformes</span><a href=\"https://en.wikipedia.org/wiki/Polymixiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Polymixiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Polymixiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Polymixiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(beardfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Polymixia_nobilis1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Polymixia_nobilis1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"125\" style=\"background-color:#dadada\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Acanthomorpha_Acanthopterygii\"><label class=\"tree_label\" for=\"Acanthomorpha_Acanthopterygii\"></label><div class=\"outer_tree_box\"><div id=\"acanthomorpha_acanthopterygii\" class=\"tree_box\"><span><span>Acanthopterygii</span><a href=\"https://en.wikipedia.org/wiki/Acanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Acanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Acanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Acanthopterygii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><p class=\"tag\">The spiny-rayed fishes.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_beryciformes\" class=\"tree_box\"><span><span>Beryciformes</span><a href=\"https://en.wikipedia.org/wiki/Beryciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Beryciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Beryciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Beryciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈbɛrɪsɪfɔːrmiːz\" target=\"_blank\">ˈbɛrɪsɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(alfonsinos, whalefishes, squirrelfish, soldierfish, alfonsinos, berycids, pricklefishes, whalefishes, gibberfishes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Beryx_decadactylus_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Beryx_decadactylus_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"174\" style=\"background-color:#f0d6cd\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_trachichthyiformes\" class=\"tree_box\"><span><span>Trachichthyiformes</span><a href=\"https://en.wikipedia.org/wiki/Trachichthyiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Trachichthyiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Trachichthyiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Trachichthyiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=træˈkɪkθi.ɪfɔːrmiːz\" target=\"_blank\">træˈkɪkθi.ɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(pinecone fishes, slimeheads, fangtooths)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Hoplostethus_mediterraneus.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hoplostethus_mediterraneus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"131\" style=\"background-color:#d0ccc5\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Acanthopterygii_Percomorpha\"><label class=\"tree_label\" for=\"Acanthopterygii_Percomorpha\"></label><div class=\"outer_tree_box\"><div id=\"acanthomorpha_percomorpha\" class=\"tree_box\"><span><span>Percomorpha</span><a href=\"https://en.wikipedia.org/wiki/Percomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Percomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Percomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Percomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Scomber_scombrus.png\" target=\"_blank\"><img src=\"thumbnails/140px-Scomber_scombrus.png\" class=\"taxa-img\" loading=\"lazy\" width=\"140\" height=\"85\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_ophidiiformes\" class=\"tree_box\"><span><span>Ophidiiformes</span><a href=\"https://en.wikipedia.org/wiki/Ophidiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ophidiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ophidiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ophidiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(cusk-eels, brotulas, pearlfishes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Barathrites_iris.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Barathrites_iris.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"86\" style=\"background-color:#e6e1d9\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_batrachoidiformes\" class=\"tree_box\"><span><span>Batrachoidiformes</span><a href=\"https://en.wikipedia.org/wiki/Batrachoidiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Batrachoidiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Batrachoidiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Batrachoidiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(toadfishes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Opsanus_beta_1.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Opsanus_beta_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"106\" style=\"background-color:#b7b6a8\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Percomorpha_Syngnathomorpharia\"><label class=\"tree_label\" for=\"Percomorpha_Syngnathomorpharia\"></label><div class=\"outer_tree_box\"><div id=\"acanthomorpha_syngnathomorpharia\" class=\"tree_box\"><span><span>Syngnathomorpharia</span><a href=\"https://en.wikipedia.org/wiki/Syngnathomorpharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Syngnathomorpharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Syngnathomorpharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Syngnathomorpharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_scombriformes\" class=\"tree_box\"><span><span>Scombriformes</span><a href=\"https://en.wikipedia.org/wiki/Scombriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Scombriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Scombriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Scombriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(tunas, mackerel, bluefishes, ragfishes, pomfrets, cutlassfish, swallowers, medusafish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Scomber_scombrus.png\" target=\"_blank\"><img src=\"thumbnails/140px-Scomber_scombrus.png\" class=\"taxa-img\" loading=\"lazy\" width=\"140\" height=\"85\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_syngnathiformes\" class=\"tree_box\"><span><span>Syngnathiformes</span><a href=\"https://en.wikipedia.org/wiki/Syngnathiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Syngnathiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Syngnathiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Syngnathiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(seahorses, seadragon, pipefishes, trumpetfishes, goatfishes, gurnards, seamoths)</span><p class=\"tag\">They generally have elongated, narrow bodies surrounded by a series of bony rings with small, tubular mouths. The shape of their mouth is usually for the ingestion of prey at close range via suction and are usually well camouflaged. The males house the fertilized eggs in an osmo-regulated brood pouch, or adhere them to their tail, until the eggs reach maturity.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Trumpetfish.jpg\" target=\"_blank\"><img src=\"thumbnails/500px-Trumpetfish.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"654\" style=\"background-color:#75918a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aulostomus_maculatus_%28Trumpetfish_-brown_variation%29.jpg\" target=\"_blank\"><img src=\"thumbnails/500px-Aulostomus_maculatus_%28Trumpetfish_-brown_variation%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"666\" style=\"background-color:#0f232f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Yellow_Trumpet_Fish.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Yellow_Trumpet_Fish.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#5b6759\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hippocampus_hippocampus_%28on_Ascophyllum_nodosum%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hippocampus_hippocampus_%28on_Ascophyllum_nodosum%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#393217\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tehotny_morsky_konik.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tehotny_morsky_konik.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6f441d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hippocampus_jayakari%2C_Egipto.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hippocampus_jayakari%2C_Egipto.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#528b82\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leafy_Seadragon_on_Kangaroo_Island.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leafy_Seadragon_on_Kangaroo_Island.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#2a414d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:TengunoOG.jpg\" target=\"_blank\"><img src=\"thumbnails/TengunoOG.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#62635c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pegasus_lancifer_in_vivo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pegasus_lancifer_in_vivo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#85877b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eurypegasus_draconis_SI.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eurypegasus_draconis_SI.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#ece5d9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eurypegasus_draconis.jpg\" target=\"_blank\"><img src=\"thumbnails/Eurypegasus_draconis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"746\" height=\"480\" style=\"background-color:#1b4558\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_gobiiformes\" class=\"tree_box\"><span><span>Gobiiformes</span><a href=\"https://en.wikipedia.org/wiki/Gobiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gobiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gobiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gobiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈɡoʊbi.ɪfɔːrmiːz\" target=\"_blank\">ˈɡoʊbi.ɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(gobies, sleepers, mudskippers, prawn gobies, cardinalfishes, nurseryfishes, sand-divers)</span><p class=\"tag\">They have adhesive eggs with elaborate structures. Many species have parental care from the male. Some species can remain out of the water for long periods.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cryptocentrus_cinctus.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Cryptocentrus_cinctus.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6a6949\"></a><a href=\"https://commons.wikimedia.org/wiki/File:ApogonVithisma.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-ApogonVithisma.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#825e4d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pterapogon_kauderni4.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Pterapogon_kauderni4.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#6a6a61\"></a><a href=\"https://commons.wikimedia.org/wiki/File:GambianMudskippers.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-GambianMudskippers.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"235\" style=\"background-color:#857463\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cryptocentrus_strigilliceps_%28Target_shrimpgoby%29_and_Alpheus_rapacida_%28Snapping_shrimp%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cryptocentrus_strigilliceps_%28Target_shrimpgoby%29_and_Alpheus_rapacida_%28Snapping_shrimp%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8a7854\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Metallic_Shrimp_Goby.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Metallic_Shrimp_Goby.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#82a39d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pterapogon_kauderni4.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Pterapogon_kauderni4.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#6a6a61\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%E0%B8%9B%E0%B8%A5%E0%B8%B2%E0%B8%95%E0%B8%B5%E0%B8%99%E0%B8%AB%E0%B8%A3%E0%B8%B7%E0%B8%AD%28%E0%B8%9B%E0%B8%A5%E0%B8%B2%E0%B8%81%E0%B8%A3%E0%B8%B0%E0%B8%88%E0%B8%B1%E0%B8%87%29.jpg\" target=\"_blank\"><img src=\"thumbnails/%E0%B8%9B%E0%B8%A5%E0%B8%B2%E0%B8%95%E0%B8%B5%E0%B8%99%E0%B8%AB%E0%B8%A3%E0%B8%B7%E0%B8%AD%28%E0%B8%9B%E0%B8%A5%E0%B8%B2%E0%B8%81%E0%B8%A3%E0%B8%B0%E0%B8%88%E0%B8%B1%E0%B8%87%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"658\" height=\"433\" style=\"background-color:#a3967e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%C5%92ufs_de_gobie_%28Ifremer_00553-66491_-_49085%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%C5%92ufs_de_gobie_%28Ifremer_00553-66491_-_49085%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a09e80\"></a><a href=\"https://commons.wikimedia.org/wiki/File:KuroeriGP.jpg\" target=\"_blank\"><img src=\"thumbnails/KuroeriGP.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#585c61\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Percomorpha_Carangimopharia\"><label class=\"tree_label\" for=\"Percomorpha_Carangimopharia\"></label><div class=\"outer_tree_box\"><div id=\"acanthomorpha_carangimopharia\" class=\"tree_box\"><span><span>Carangimopharia</span><a href=\"https://en.wikipedia.org/wiki/Carangimopharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Carangimopharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Carangimopharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Carangimopharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_synbranchiformes\" class=\"tree_box\"><span><span>Synbranchiformes</span><a href=\"https://en.wikipedia.org/wiki/Synbranchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Synbranchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Synbranchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Synbranchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(swamp eels)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Monopterus_albus_4.jpg\" target=\"_blank\"><img src=\"thumbnails/Monopterus_albus_4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"646\" height=\"480\" style=\"background-color:#8c7c74\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_anabantiformes\" class=\"tree_box\"><span><span>Anabantiformes</span><a href=\"https://en.wikipedia.org/wiki/Anabantiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Anabantiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Anabantiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Anabantiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ænəˈbæntɪfɔːrmiːz\" target=\"_blank\">ænəˈbæntɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(labyrinth fishes, snakeheads, badids)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Anabas_testudineus.png\" target=\"_blank\"><img src=\"thumbnails/Anabas_testudineus.png\" class=\"taxa-img\" loading=\"lazy\" width=\"482\" height=\"362\" style=\"background-color:#2d2f26\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_carangiformes\" class=\"tree_box\"><span><span>Carangiformes</span><a href=\"https://en.wikipedia.org/wiki/Carangiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Carangiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Carangiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Carangiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(jacks, flatfish, billfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Lined_sole.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Lined_sole.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"82\" style=\"background-color:#a29891\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Carangimopharia_Ovalentariae\"><label class=\"tree_label\" for=\"Carangimopharia_Ovalentariae\"></label><div class=\"outer_tree_box\"><div id=\"acanthomorpha_ovalentariae\" class=\"tree_box\"><span><span>Ovalentariae</span><a href=\"https://en.wikipedia.org/wiki/Ovalentariae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ovalentariae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ovalentariae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ovalentariae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Have demersal eggs that are attached to a substrate.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_cichliformes\" class=\"tree_box\"><span><span>Cichliformes</span><a href=\"https://en.wikipedia.org/wiki/Cichliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cichliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cichliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cichliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(cichlids, leaffishes, convict blenny)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Bathybates_ferox.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Bathybates_ferox.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"97\" style=\"background-color:#d0cec6\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_mugiliformes\" class=\"tree_box\"><span><span>Mugiliformes</span><a href=\"https://en.wikipedia.org/wiki/Mugiliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mugiliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mugiliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mugiliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(mullets, Asiatic glassfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Tainha_%28Mugil_sp%29.png\" target=\"_blank\"><img src=\"thumbnails/250px-Tainha_%28Mugil_sp%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"89\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_beloniformes\" class=\"tree_box\"><span><span>Beloniformes</span><a href=\"https://en.wikipedia.org/wiki/Beloniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Beloniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Beloniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Beloniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(flyingfishes, ricefish, needlefishes, halfbeaks)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Exocoetus_volitans.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Exocoetus_volitans.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"135\" style=\"background-color:#eceae8\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_cyprinodontiformes\" class=\"tree_box\"><span><span>Cyprinodontiformes</span><a href=\"https://en.wikipedia.org/wiki/Cyprinodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cyprinodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cyprinodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cyprinodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(livebearers, killifishes, rivulines, pupfishes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Fundulus_waccamensis.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fundulus_waccamensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"83\" style=\"background-color:#d4d8d3\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_atheriniformes\" class=\"tree_box\"><span><span>Atheriniformes</span><a href=\"https://en.wikipedia.org/wiki/Atheriniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Atheriniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Atheriniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Atheriniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(silversides, rainbowfishes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Labidesthes_sicculus_1908.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Labidesthes_sicculus_1908.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"73\" style=\"background-color:#f3f2ea\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_blenniiformes\" class=\"tree_box\"><span><span>Blenniiformes</span><a href=\"https://en.wikipedia.org/wiki/Blenniiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Blenniiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Blenniiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Blenniiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=&#x27;mucus&#x27;-&#x27;order&#x27;\" target=\"_blank\">&#x27;mucus&#x27;-&#x27;order&#x27;</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(blennies, clingfishes, dottybacks, jawfishes, damselfishes, clownfishes, anemonefishes, surfperches, basslets)</span><p class=\"tag\">They often have a slimy coating on their scales; The blennies usually have elongated bodies with blunt heads sometimes with whiskers on top. The nested damselfishes and clownfishes are usually laterally compressed. They tend to be reclusive, burrowing into sandy substrates and living in reef crevices. Some look similar to the goby and dragonet families.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Amphiprion_ocellaris_%28Clown_anemonefish%29_by_Nick_Hobgood.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amphiprion_ocellaris_%28Clown_anemonefish%29_by_Nick_Hobgood.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"225\" style=\"background-color:#503719\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abudefduf_sexfasciatus_R%C3%A9union.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Abudefduf_sexfasciatus_R%C3%A9union.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"242\" style=\"background-color:#4a7973\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crysiptera_hemicyanea.jpg\" target=\"_blank\"><img src=\"thumbnails/Crysiptera_hemicyanea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"332\" style=\"background-color:#868ba6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pomacentrus_caeruleopunctatus_R%C3%A9union.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pomacentrus_caeruleopunctatus_R%C3%A9union.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"261\" style=\"background-color:#443f3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Maroon_Clown_Fish444.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Maroon_Clown_Fish444.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4c3d1e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Humbug_dascyllus_%28Dascyllus_aruanus%29_%2848652156722%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Humbug_dascyllus_%28Dascyllus_aruanus%29_%2848652156722%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#596564\"></a><a href=\"https://commons.wikimedia.org/wiki/File:HemiglyphidPlagiom3RLS.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-HemiglyphidPlagiom3RLS.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#494a53\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Manonichthys_splendens.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Manonichthys_splendens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#6d4b27\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Paraplesiops_bleekeri_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Paraplesiops_bleekeri_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#7b8a69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pez_cometa_%28Calloplesiops_altivelis%29%2C_Anilao%2C_Filipinas%2C_2023-08-25%2C_DD_270.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pez_cometa_%28Calloplesiops_altivelis%29%2C_Anilao%2C_Filipinas%2C_2023-08-25%2C_DD_270.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#4b4747\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gramma_loreto_257593008.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gramma_loreto_257593008.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#392c2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Opistognathus_aurifrons.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Opistognathus_aurifrons.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"329\" style=\"background-color:#5c6379\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jawfish_%28Stalix_sp.%29_%2841480592115%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Jawfish_%28Stalix_sp.%29_%2841480592115%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#817773\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diplecogaster_bimaculata_%28Stefano_Guerrieri%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Diplecogaster_bimaculata_%28Stefano_Guerrieri%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"610\" height=\"408\" style=\"background-color:#8a6d3d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eastern_Cleaner_Clingfish-Cochleoceps_orientalis_%2822695734536%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eastern_Cleaner_Clingfish-Cochleoceps_orientalis_%2822695734536%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#585340\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Notoclinops_caerulepunctus_%28Blue_dot_triplefin%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Notoclinops_caerulepunctus_%28Blue_dot_triplefin%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"133\" style=\"background-color:#7b605b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Combtooth_blenny_mudskipper_%28Alticus_anjouanae%29_Reunion.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Combtooth_blenny_mudskipper_%28Alticus_anjouanae%29_Reunion.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#65656a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Plagiotremus_rhinorhynchos_%28Blue-lined_Sabertooth_Blenny%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Plagiotremus_rhinorhynchos_%28Blue-lined_Sabertooth_Blenny%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9c6948\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dactyloscopus_byersi.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dactyloscopus_byersi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"225\" style=\"background-color:#777f7e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acanthemblemaria_atrata_4.jpg\" target=\"_blank\"><img src=\"thumbnails/Acanthemblemaria_atrata_4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"436\" style=\"background-color:#67654b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chaenopsis_ocellata_173000605.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chaenopsis_ocellata_173000605.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#434526\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Emblemariopsis_carib_%28Caribbean_Flagfin_Blenny%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Emblemariopsis_carib_%28Caribbean_Flagfin_Blenny%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#724d36\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sarcastic_Fringehead_California_ScienCenter.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sarcastic_Fringehead_California_ScienCenter.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6866ae\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neoclinus_uninotatus_1_2017-04-01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Neoclinus_uninotatus_1_2017-04-01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#2e2322\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Percomorpha_Eupercaria\"><label class=\"tree_label\" for=\"Percomorpha_Eupercaria\"></label><div class=\"outer_tree_box\"><div id=\"acanthomorpha_eupercaria\" class=\"tree_box\"><span><span>Eupercaria</span><a href=\"https://en.wikipedia.org/wiki/Eupercaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eupercaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eupercaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Eupercaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_perciformes\" class=\"tree_box\"><span><span>Perciformes</span><a href=\"https://en.wikipedia.org/wiki/Perciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Perciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Perciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Perciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(groupers, perches, seabasses, darters, notothens, flatheads, searobins, scorpionfish, sculpins, sticklebacks, eelpouts, lionfish)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Abborre%2C_Iduns_kokbok.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Abborre%2C_Iduns_kokbok.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"58\" style=\"background-color:#c5c0b1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grosserdrachenkopf-02.jpg\" target=\"_blank\"><img src=\"thumbnails/Grosserdrachenkopf-02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"698\" height=\"523\" style=\"background-color:#544a37\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pterois_volitans.001_-_Aquarium_Finisterrae.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Pterois_volitans.001_-_Aquarium_Finisterrae.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3052b4\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_centrarchiformes\" class=\"tree_box\"><span><span>Centrarchiformes</span><a href=\"https://en.wikipedia.org/wiki/Centrarchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Centrarchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Centrarchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Centrarchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(blackbasses, temperate perch, knifejaws, sea chubs, freshwater sunfish, hawkfishes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Micropterus_salmoides.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Micropterus_salmoides.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"50\" style=\"background-color:#c6bca2\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_labriformes\" class=\"tree_box\"><span><span>Labriformes</span><a href=\"https://en.wikipedia.org/wiki/Labriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Labriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Labriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Labriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(wrasses, parrotfishes, cales, sandlances, stargazers, false scorpionfishes, sandperches, torrentfish)</span><p class=\"tag\">Their upper jaw is fused with the skull, allowing for powerful suction feeding. Found in a variety of marine habitats with diverse feeding habits. They use pectoral fin oscillation to move around.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Humphead_wrasse_melb_aquarium.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Humphead_wrasse_melb_aquarium.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#50615e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vieille_coquette_%28Labrus_mixtus%29_%28Ifremer_00563-67488_-_23544%29_%28cropped_2%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vieille_coquette_%28Labrus_mixtus%29_%28Ifremer_00563-67488_-_23544%29_%28cropped_2%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"194\" style=\"background-color:#29574a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Paine%27s_flasher_wrasse_%28Paracheilinus_paineorum%29_%2840420276722%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Paine%27s_flasher_wrasse_%28Paracheilinus_paineorum%29_%2840420276722%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#221c1b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CentrogenyVaigiensisRLS.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-CentrogenyVaigiensisRLS.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#616847\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Odax_acroptilus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Odax_acroptilus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#434111\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Odax_pullus_%28Greenbone%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Odax_pullus_%28Greenbone%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"167\" style=\"background-color:#232c3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ammodytes_hexapterus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ammodytes_hexapterus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#515354\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Genyagnus_monopterygius_355792970.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Genyagnus_monopterygius_355792970.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#414843\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Astroscopus_zephyreus_254703040.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Astroscopus_zephyreus_254703040.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"317\" style=\"background-color:#5a7976\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Northern_Stargazer.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Northern_Stargazer.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#96938d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Parapercis_hexophtalma_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Parapercis_hexophtalma_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#61949c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Torrentfish.png\" target=\"_blank\"><img src=\"thumbnails/330px-Torrentfish.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"131\" style=\"background-color:#473d31\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_acropomatiformes\" class=\"tree_box\"><span><span>Acropomatiformes</span><a href=\"https://en.wikipedia.org/wiki/Acropomatiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Acropomatiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Acropomatiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Acropomatiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(lanternbellies, gnomefishes, wreckfishes, banjofish, oceanic basslets, armorheads)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Banjos_banjos.jpg\" target=\"_blank\"><img src=\"thumbnails/Banjos_banjos.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"726\" height=\"545\" style=\"background-color:#d8ddd9\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_acanthuriformes\" class=\"tree_box\"><span><span>Acanthuriformes</span><a href=\"https://en.wikipedia.org/wiki/Acanthuriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Acanthuriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Acanthuriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Acanthuriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(surgeonfishes, butterflyfishes, rabbitfishes, marine angelfishes, drumfishes, grunts, ponyfishes, mojarras, snappers, temperate basses, spadefishes, porgies, scats, bigeyes, boarfishes, bandfishes)</span><p class=\"tag\">Butterflyfishes, Angelfishes, And Allies. Contains many of the iconic tropical reef fish groups. Most species have a laterally compressed body for maneuvering between corals. They usually have a small, terminal mouth for for grazing on algae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Zanclus_cornutus_in_Kona.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Zanclus_cornutus_in_Kona.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"298\" style=\"background-color:#557859\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pacific_double-saddle_butterfly_fish_%28Chaetodon_ulietensis%29_Moorea.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pacific_double-saddle_butterfly_fish_%28Chaetodon_ulietensis%29_Moorea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#52a3bc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acanthurussohal-ArabischerDoktor.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Acanthurussohal-ArabischerDoktor.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"163\" style=\"background-color:#657479\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pomocanthus_imperator_facing_right.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pomocanthus_imperator_facing_right.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#567766\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Holacanthus_ciliaris_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Holacanthus_ciliaris_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"249\" height=\"255\" style=\"background-color:#47728f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Malacanthus_latovittatus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Malacanthus_latovittatus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"240\" style=\"background-color:#566b63\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grammatonotus_brianne.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grammatonotus_brianne.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#e5d6cc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lethrinus_obsoletus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lethrinus_obsoletus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4d5149\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Goldbrasse_-_9379.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Goldbrasse_-_9379.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"148\" style=\"background-color:#3c3f40\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scatophagus_argus_%28Wroclaw_zoo%29-2.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Scatophagus_argus_%28Wroclaw_zoo%29-2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5b6661\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acanthocepola_krusensternii.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Acanthocepola_krusensternii.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#659299\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Priacanthus_cruentatus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Priacanthus_cruentatus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#503e3e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Boarfish_%28_Antigonia_capros_%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Boarfish_%28_Antigonia_capros_%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#438e89\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Paddletail_melb_aquarium.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Paddletail_melb_aquarium.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#3c4532\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Silver_Moony.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Silver_Moony.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#50675c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lobotes_surinamensis_Gobius.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lobotes_surinamensis_Gobius.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"170\" style=\"background-color:#636e70\"></a><a href=\"https://commons.wikimedia.org/wiki/File:3726_aquaimages.jpg\" target=\"_blank\"><img src=\"thumbnails/3726_aquaimages.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"450\" style=\"background-color:#74827b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Platax_teira.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Platax_teira.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#156cc8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dicentrarchus_labrax.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dicentrarchus_labrax.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"245\" style=\"background-color:#706647\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sunday_fishing_in_Tokyo_bay.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sunday_fishing_in_Tokyo_bay.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#a78654\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_lophiiformes\" class=\"tree_box\"><span><span>Lophiiformes</span><a href=\"https://en.wikipedia.org/wiki/Lophiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lophiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lophiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lophiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌlɒfiɪˈfɔːrmiːz\" target=\"_blank\">ˌlɒfiɪˈfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(anglerfishes, deep-sea batfishes, sea toads, frogfishes, monkfishes, goosefishes, dreamers)</span><p class=\"tag\">Named from the way many species have a modified dorsal fin ray that acts as a lure for prey. They are generally ambush predators. The majority of species are bottom-dwellers, with some deep-sea anglerfish living high in the water column.  They are sexual dimorphic; this can go so far as sexual parasitism with the male attached to the much larger female, sometimes fusing together as an example of natural parabiosis. In most species, a wide mouth extends all around the anterior circumference of the head, and bands of inwardly inclined teeth line both jaws and the teeth are depressible and can hinge back. They have gills that open behind the pectoral fins. Their lengths vary from 2–18 cm.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Humpback_anglerfish.png\" target=\"_blank\"><img src=\"thumbnails/120px-Humpback_anglerfish.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"112\" style=\"background-color:#a6a095\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Halieutaea_stellata_by_DaijuAzuma.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Halieutaea_stellata_by_DaijuAzuma.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#5a6392\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulophryne_pelagica_facing_left.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caulophryne_pelagica_facing_left.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#1c1616\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sea_toad_genus_Chaunax_Mona_Canyon_13_April_2015.png\" target=\"_blank\"><img src=\"thumbnails/Sea_toad_genus_Chaunax_Mona_Canyon_13_April_2015.png\" class=\"taxa-img\" loading=\"lazy\" width=\"322\" height=\"237\" style=\"background-color:#8a755c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lophius_piscatorius_269401148.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lophius_piscatorius_269401148.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3f5e80\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%D0%A1%D0%B5%D0%B2%D0%B5%D1%80%D0%BD%D0%B0%D1%8F_%D1%86%D0%B5%D1%80%D0%B0%D0%BF%D0%B8%D1%8F_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%D0%A1%D0%B5%D0%B2%D0%B5%D1%80%D0%BD%D0%B0%D1%8F_%D1%86%D0%B5%D1%80%D0%B0%D0%BF%D0%B8%D1%8F_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"140\" style=\"background-color:#979698\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ogcocephalus_vespertilio_110861367.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ogcocephalus_vespertilio_110861367.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#57574f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Expl2183_%289734084875%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Expl2183_%289734084875%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#393743\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sea_toad_%28Chaunacops_cf._melanostomus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sea_toad_%28Chaunacops_cf._melanostomus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#544243\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Haplophryne.jpg\" target=\"_blank\"><img src=\"thumbnails/Haplophryne.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"266\" height=\"180\" style=\"background-color:#333029\"></a><a href=\"https://commons.wikimedia.org/wiki/File:BMC_-_Thaumatichthyidae-Thaumatichthys.binghami.jpg\" target=\"_blank\"><img src=\"thumbnails/BMC_-_Thaumatichthyidae-Thaumatichthys.binghami.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"582\" height=\"327\" style=\"background-color:#241910\"></a><a href=\"https://commons.wikimedia.org/wiki/File:BMC_-_Melanocetidae-Melanocetus.eustales.jpg\" target=\"_blank\"><img src=\"thumbnails/BMC_-_Melanocetidae-Melanocetus.eustales.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"585\" height=\"449\" style=\"background-color:#30150e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"acanthomorpha_tetraodontiformes\" class=\"tree_box\"><span><span>Tetraodontiformes</span><a href=\"https://en.wikipedia.org/wiki/Tetraodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tetraodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tetraodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tetraodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(pufferfishes, boxfishes, triplespines, spikefishes, triggerfishes, filefishes, ocean sunfish, porcupinefishes)</span><p class=\"tag\">Most do not have a streamlined body and are slow moving are ostraciiform swimmers. They have bodies that are nearly square or triangular, spherical, or laterally compressed. They range in size from 2 cm to 3 m in length. Some inflate their bodies in defense or have a powerful neurotoxin.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Puffer_Fish_DSC01257.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Puffer_Fish_DSC01257.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#45787c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Arothron_meleagris_by_NPS_1.jpg\" target=\"_blank\"><img src=\"thumbnails/Arothron_meleagris_by_NPS_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"504\" height=\"448\" style=\"background-color:#63655c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pufferfish_%28Butete%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pufferfish_%28Butete%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#7d8569\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Arothron_mappa_-_Nancy.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Arothron_mappa_-_Nancy.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#796351\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pufferfish_komodo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pufferfish_komodo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#595046\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ostracion_cubicum_400115646.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ostracion_cubicum_400115646.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#305f63\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kentrocapros_aculeatus_%28Takeshima_aquarium%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Kentrocapros_aculeatus_%28Takeshima_aquarium%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"198\" style=\"background-color:#53564f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abalistes_filamentosus_JNC2724_Body.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Abalistes_filamentosus_JNC2724_Body.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"188\" style=\"background-color:#aba7a8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Triacanthus_biaculeatus%2C_Mangalore_%28cropped%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Triacanthus_biaculeatus%2C_Mangalore_%28cropped%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"207\" style=\"background-color:#386576\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Triodon_macropterus_JNC2989.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Triodon_macropterus_JNC2989.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"303\" style=\"background-color:#9e9ea4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Triacanthodes_anomalus_by_OpenCage.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Triacanthodes_anomalus_by_OpenCage.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#574940\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stephanolepis_hispidus.jpg\" target=\"_blank\"><img src=\"thumbnails/Stephanolepis_hispidus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"586\" height=\"401\" style=\"background-color:#453a23\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mola_alexandrini_%28Bump-head_Mola%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Mola_alexandrini_%28Bump-head_Mola%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"638\" height=\"480\" style=\"background-color:#0c8fb6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mola_mola.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mola_mola.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"258\" style=\"background-color:#014b83\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul>")
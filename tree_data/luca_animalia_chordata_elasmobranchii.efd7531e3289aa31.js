@@ -0,0 +1 @@
+TreeData.register("luca_animalia_chordata_elasmobranchii",[{"name":"Selachii","parent":"Elasmobranchii","rank":"Division","ipa":"","etymology":"","common":["sharks"],"tag":"","imgs":[],"card":1},{"name":"Galeomorphi","parent":"Selachii","rank":"Superorder","ipa":"","etymology":"","common":[],"tag":"The galean sharks.","imgs":[],"card":1},{"name":"Heterodontiformes","parent":"Galeomorphi","rank":"Order","ipa":"","etymology":"","common":["bullhead sharks"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/3/35/Heterodontus_portusjacksoni_wilsons_promontory.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Heterodontus_galeatus_callala_creek.jpg/330px-Heterodontus_galeatus_callala_creek.jpg","https://upload.wikimedia.org/wikipedia/commons/9/91/Heterodontus_japonicus_port_of_nagoya.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7a/Heterodontus_ramalheira.jpg/330px-Heterodontus_ramalheira.jpg"],"card":2},{"name":"Orectolobiformes","parent":"Galeomorphi","rank":"Order","ipa":"ɒrɛkˈtɒləbɪfɔːrmiːz","etymology":"","common":["carpet sharks","whale sharks","nurse sharks"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c9/Blindshark.jpg/330px-Blindshark.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d1/Nurse_shark.jpg/330px-Nurse_shark.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Chiloscyllium_griseum_Oceanopolis.jpg/330px-Chiloscyllium_griseum_Oceanopolis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Tasseled_wobbegong_shark.jpg/330px-Tasseled_wobbegong_shark.jpg","https://upload.wikimedia.org/wikipedia/commons/0/09/Cirrhoscyllium_japonicum_nagoya.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/Similan_Dive_Center_-_great_whale_shark.jpg/330px-Similan_Dive_Center_-_great_whale_shark.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/Oc%C3%A9anopolis_-_les_aquariums_010.JPG/330px-Oc%C3%A9anopolis_-_les_aquariums_010.JPG"],"card":2},{"name":"Lamniformes","parent":"Galeomorphi","rank":"Order","ipa":"ˈlæmnɪfɔːrmiːz","etymology":"","common":["great white","goblin shark","thresher sharks","basking sharks","megalodon"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a7/Thresher_shark_jumping.jpg/250px-Thresher_shark_jumping.jpg","https://upload.wikimedia.org/wikipedia/commons/4/4e/Alopias_pelagicus_1.jpg","https://upload.wikimedia.org/wikipedia/commons/7/70/Thresher_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/2/2c/Mustelus_mustelus2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0a/Basking_Shark.jpg/330px-Basking_Shark.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/56/White_shark.jpg/330px-White_shark.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/82/White_shark_%28Carcharodon_carcharias%29_scavenging_on_whale_carcass_-_journal.pone.0060797.g004-A.png/330px-White_shark_%28Carcharodon_carcharias%29_scavenging_on_whale_carcass_-_journal.pone.0060797.g004-A.png","https://upload.wikimedia.org/wikipedia/commons/c/cc/Akula_180416.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/17/Mistukurina_owstoni_museum_victoria_-_head_detail.jpg/330px-Mistukurina_owstoni_museum_victoria_-_head_detail.jpg"],"card":2},{"name":"Carcharhiniformes","parent":"Galeomorphi","rank":"Order","ipa":"ˌkɑːrkəˌraɪnɪˈfɔːrmiːz","etymology":"greek 'sharp'-'nose'-'shape'","common":["catsharks","houndsharks","tiger sharks","hammerhead sharks"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1a/Katzenhai_Ei-Kapseln.JPG/330px-Katzenhai_Ei-Kapseln.JPG","https://upload.wikimedia.org/wikipedia/commons/2/2b/Atelomycterus_marmoratus_newport.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1e/Leopard_shark_in_kelp.jpg/330px-Leopard_shark_in_kelp.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/95/Bullshark.JPG/330px-Bullshark.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/Lemonshark_%282%29.jpg/330px-Lemonshark_%282%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Carcharhinus_limbatus_%282%29.jpg/330px-Carcharhinus_limbatus_%282%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Triaenodon_obesus_guam.jpg/330px-Triaenodon_obesus_guam.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/39/Tiger_shark.jpg/330px-Tiger_shark.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bf/Scalloped_Hammerhead_Shark_Sphyrna_Lewini_%28226845659%29.jpeg/330px-Scalloped_Hammerhead_Shark_Sphyrna_Lewini_%28226845659%29.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/Hammerhead_shark%2C_Cocos_Island%2C_Costa_Rica.jpg/330px-Hammerhead_shark%2C_Cocos_Island%2C_Costa_Rica.jpg"],"card":2},{"name":"Squalomorphi","parent":"Selachii","rank":"Superorder","ipa":"","etymology":"","common":[],"tag":"Generally characterized by lacking traits such as an anal fin, nictitating membrane, or suborbital shelves in the cranium.","imgs":[],"card":1},{"name":"Hexanchiformes","parent":"Squalomorphi","rank":"Order","ipa":"hɛkˈsæŋkɪfɔːrmiːz","etymology":"","common":["frilled sharks","cow sharks"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Chlamydoselachus_anguineus_head.jpg/330px-Chlamydoselachus_anguineus_head.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/60/Chlamydoselachus_anguineus_NOOA.jpg/330px-Chlamydoselachus_anguineus_NOOA.jpg","https://upload.wikimedia.org/wikipedia/commons/e/e1/Six-gill_shark.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7d/Hexanchus_griseus_santa_rosa.jpg/330px-Hexanchus_griseus_santa_rosa.jpg","https://upload.wikimedia.org/wikipedia/commons/4/4a/Notorynchus_cepedianus_SI4.jpg"],"card":3},{"name":"Squaliformes","parent":"Squalomorphi","rank":"Order","ipa":"ˌskwɒlɪˈfɔːrmiːz","etymology":"","common":["gulper sharks","kitefin sharks","lantern sharks","rough sharks","sleeper sharks","dogfish sharks"],"tag":"Often deep water sharks.","imgs":["https://upload.wikimedia.org/wikipedia/commons/7/7d/Isistius_brasiliensis.jpg","https://upload.wikimedia.org/wikipedia/commons/8/88/Etmopterus_spinax_Sardinia.jpg","https://upload.wikimedia.org/wikipedia/commons/3/38/Oxynotus_bruniensis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Caribbean_roughshark.jpg/330px-Caribbean_roughshark.jpg","https://upload.wikimedia.org/wikipedia/commons/a/ad/Oxynotus_paradoxus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/77/Somniosus_microcephalus_okeanos.jpg/330px-Somniosus_microcephalus_okeanos.jpg","https://upload.wikimedia.org/wikipedia/commons/4/44/Mandarin_dogfish2.jpg"],"card":3},{"name":"Echinorhiniformes","parent":"Squalomorphi","rank":"Order","ipa":"","etymology":"","common":["bramble sharks","prickly sharks"],"tag":"Deep sea sharks.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Echinorhinus_brucus1.jpg/330px-Echinorhinus_brucus1.jpg","https://upload.wikimedia.org/wikipedia/commons/0/0e/Echinorhinus_cookei_head2.jpg"],"card":3},{"name":"Squatiniformes","parent":"Squalomorphi","rank":"Order","ipa":"","etymology":"","common":["angelsharks"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/b/b0/Squatina_squatina_tenerife2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Squatina_australis.jpg/330px-Squatina_australis.jpg"],"card":3},{"name":"Pristiophoriformes","parent":"Squalomorphi","rank":"Order","ipa":"prɪstiˈɒfɒrɪfɔːrmiːz","etymology":"","common":["sawsharks"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/f/ff/Pristiophorus_japonicus_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6c/Pristis_pristis_-_Georgia_Aquarium_Jan_2006.jpg/330px-Pristis_pristis_-_Georgia_Aquarium_Jan_2006.jpg"],"card":3},{"name":"Batomorphi","parent":"Elasmobranchii","rank":"Division","ipa":"","etymology":"","common":["rays"],"tag":"","imgs":[],"card":1},{"name":"Torpediniformes","parent":"Batomorphi","rank":"Order","ipa":"tɔːrˈpɛdɪnɪfɔːrmiːz","etymology":"","common":["electric rays"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Torpedo_marmorata2.jpg/330px-Torpedo_marmorata2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/Fish4345_-_Flickr_-_NOAA_Photo_Library.jpg/330px-Fish4345_-_Flickr_-_NOAA_Photo_Library.jpg"],"card":4},{"name":"Rajiformes","parent":"Batomorphi","rank":"Order","ipa":"ˈrædʒɪfɔːrmiːz","etymology":"","common":["skates"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/8/88/Bathyraja_abyssicola.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/92/Pluto_Skate_Fenestraja_plutonia.jpg/330px-Pluto_Skate_Fenestraja_plutonia.jpg","https://upload.wikimedia.org/wikipedia/commons/4/4e/Mermaidpurse.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/Dorron_-_16197242004.jpg/250px-Dorron_-_16197242004.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b9/Leucoraja_erinacea.jpg"],"card":4},{"name":"Pristiformes","parent":"Batomorphi","rank":"Order","ipa":"","etymology":"","common":["Sawfish","carpenter sharks"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6c/Pristis_pristis_-_Georgia_Aquarium_Jan_2006.jpg/330px-Pristis_pristis_-_Georgia_Aquarium_Jan_2006.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/05/Sawfish_Pristis_zijsron_Genova_Aquarium.jpg/250px-Sawfish_Pristis_zijsron_Genova_Aquarium.jpg"],"card":4},{"name":"Myliobatiformes","parent":"Batomorphi","rank":"Order","ipa":"","etymology":"","common":["stingrays","manta rays","devil rays"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/8d/Porcupine_ray_from_Lakshadweep_JJH_edit.jpg/330px-Porcupine_ray_from_Lakshadweep_JJH_edit.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a7/Gymnura_altavela_aquarium.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/Ornate_eagle_ray_%28Aetomylaeus_vespertilio%29_Baa_Atoll%2C_Maldives_%282018%29.jpg/330px-Ornate_eagle_ray_%28Aetomylaeus_vespertilio%29_Baa_Atoll%2C_Maldives_%282018%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Mobula_breaching.jpg/330px-Mobula_breaching.jpg","https://upload.wikimedia.org/wikipedia/commons/d/df/Manta_birostris-Thailand4.jpg"],"card":4}],{},{"250px-Dorron_-_16197242004.jpg":[250,360,"#3f5746"],"250px-Sawfish_Pristis_zijsron_Genova_Aquarium.jpg":[250,283,"#8bacab"],"250px-Thresher_shark_jumping.jpg":[250,313,"#8faab8"],"330px-Basking_Shark.jpg":[330,250,"#054682"],"330px-Blindshark.jpg":[330,186,"#717773"],"330px-Bullshark.JPG":[330,238,"#255f62"],"330px-Carcharhinus_limbatus_(2).jpg":[330,194,"#124467"],"330px-Caribbean_roughshark.jpg":[330,219,"#3c6155"],"330px-Chiloscyllium_griseum_Oceanopolis.jpg":[330,201,"#716d5d"],"330px-Chlamydoselachus_anguineus_NOOA.jpg":[330,251,"#2060b0"],"330px-Chlamydoselachus_anguineus_head.jpg":[330,248,"#100f0d"],"330px-Echinorhinus_brucus1.jpg":[330,139,"#ddd5d3"],"330px-Fish4345_-_Flickr_-_NOAA_Photo_Library.jpg":[330,222,"#b0b5a8"],"330px-Hammerhead_shark,_Cocos_Island,_Costa_Rica.jpg":[330,262,"#1a6e97"],"330px-Heterodontus_galeatus_callala_creek.jpg":[330,220,"#695c40"],"330px-Heterodontus_ramalheira.jpg":[330,163,"#bcb7af"],"330px-Hexanchus_griseus_santa_rosa.jpg":[330,186,"#1d3d4d"],"330px-Katzenhai_Ei-Kapseln.JPG":[330,220,"#776030"],"330px-Lemonshark_(2).jpg":[330,218,"#1a8aa8"],"330px-Leopard_shark_in_kelp.jpg":[330,189,"#857559"],"330px-Mistukurina_owstoni_museum_victoria_-_head_detail.jpg":[330,219,"#bdb4c0"],"330px-Mobula_breaching.jpg":[330,247,"#78a1ba"],"330px-Nurse_shark.jpg":[330,217,"#377382"],"330px-Océanopolis_-_les_aquariums_010.JPG":[330,247,"#334d58"],"330px-Ornate_eagle_ray_(Aetomylaeus_vespertilio)_Baa_Atoll,_Maldives_(2018).jpg":[330,220,"#6d858b"],"330px-Pluto_Skate_Fenestraja_plutonia.jpg":[330,219,"#997148"],"330px-Porcupine_ray_from_Lakshadweep_JJH_edit.jpg":[330,185,"#9f9c90"],"330px-Pristis_pristis_-_Georgia_Aquarium_Jan_2006.jpg":[330,129,"#1887b8"],"330px-Scalloped_Hammerhead_Shark_Sphyrna_Lewini_(226845659).jpeg":[330,186,"#256e90"],"330px-Similan_Dive_Center_-_great_whale_shark.jpg":[330,165,"#086f98"],"330px-Somniosus_microcephalus_okeanos.jpg":[330,186,"#394632"],"330px-Squatina_australis.jpg":[330,204,"#82816a"],"330px-Tasseled_wobbegong_shark.jpg":[330,247,"#544949"],"330px-Tiger_shark.jpg":[330,245,"#377294"],"330px-Torpedo_marmorata2.jpg":[330,248,"#56737a"],"330px-Triaenodon_obesus_guam.jpg":[330,248,"#788181"],"330px-White_shark.jpg":[330,230,"#1f75b3"],"330px-White_shark_(Carcharodon_carcharias)_scavenging_on_whale_carcass_-_journal.pone.0060797.g004-A.png":[330,233,"#848082"],"Akula_180416.jpg":[800,550,"#5d697b"],"Alopias_pelagicus_1.jpg":[450,284,"#3b52a7"],"Atelomycterus_marmoratus_newport.jpg":[800,533,"#707168"],"Bathyraja_abyssicola.jpg":[520,384,"#72795c"],"Cirrhoscyllium_japonicum_nagoya.jpg":[800,450,"#679cad"],"Echinorhinus_cookei_head2.jpg":[640,436,"#6488ad"],"Etmopterus_spinax_Sardinia.jpg":[800,351,"#aea9a4"],"Gymnura_altavela_aquarium.jpg":[577,434,"#98976c"],"Heterodontus_japonicus_port_of_nagoya.jpg":[800,533,"#7b7d6c"],"Heterodontus_portusjacksoni_wilsons_promontory.jpg":[648,431,"#4a3c2b"],"Isistius_brasiliensis.jpg":[733,387,"#8b8582"],"Leucoraja_erinacea.jpg":[504,342,"#9f8f81"],"Mandarin_dogfish2.jpg":[800,600,"#595f56"],"Manta_birostris-Thailand4.jpg":[800,600,"#2d4b83"],"Mermaidpurse.jpg":[800,600,"#dcdddc"],"Mustelus_mustelus2.jpg":[617,336,"#95ac9a"],"Notorynchus_cepedianus_SI4.jpg":[640,436,"#333f3b"],"Oxynotus_bruniensis.jpg":[606,453,"#373e4a"],"Oxynotus_paradoxus.jpg":[900,424,"#241f1a"],"Pristiophorus_japonicus_cropped.jpg":[798,272,"#4a545d"],"Six-gill_shark.jpg":[600,450,"#1a576e"],"Squatina_squatina_tenerife2.jpg":[633,289,"#2c7b9a"],"Thresher_(cropped).jpg":[1054,621,"#0494c0"]})
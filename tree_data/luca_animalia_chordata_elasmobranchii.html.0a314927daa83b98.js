@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_elasmobranchii","<ul class=\"tree\" data-tree-range=\"elasmobranchii\"><li><input type=\"checkbox\" checked id=\"Chondrichthyes_Elasmobranchii\"><label class=\"tree_label\" for=\"Chondrichthyes_Elasmobranchii\"></label><div class=\"outer_tree_box\"><div id=\"elasmobranchii_elasmobranchii\" class=\"tree_box\"><span><span>Elasmobranchii</span><a href=\"https://en.wikipedia.org/wiki/Elasmobranchii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Elasmobranchii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Elasmobranchii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Elasmobranchii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ɪˌlæzməˈbræŋkiaɪ\" target=\"_blank\">ɪˌlæzməˈbræŋkiaɪ</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"chordata\">See parent</button><span class=\"badge\">Subclass</span></span><span class=\"common_names\">(sharks, whale sharks, rays, skates, sawfish)</span><p class=\"tag\">The cartilaginous fish. They have no swim bladder and need to swim to avoid sinking. The teeth are in several series; the upper jaw is not fused to the cranium, and the lower jaw is articulated with the upper.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Scalloped_Hammerhead_Shark_Sphyrna_Lewini_%28226845659%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Scalloped_Hammerhead_Shark_Sphyrna_Lewini_%28226845659%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#256e90\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Great_White_Shark_%2814730719119%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Great_White_Shark_%2814730719119%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4061ac\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bullshark.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Bullshark.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#255f62\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SStringray.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-SStringray.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#c7c5b5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aetobatus_narinari_342101452.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aetobatus_narinari_342101452.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4b7a8e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Manta_ray_from_Yap.jpg\" target=\"_blank\"><img src=\"thumbnails/Manta_ray_from_Yap.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"535\" style=\"background-color:#0787a4\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Elasmobranchii_Selachii\"><label class=\"tree_label\" for=\"Elasmobranchii_Selachii\"></label><div class=\"outer_tree_box\"><div id=\"elasmobranchii_selachii\" class=\"tree_box\"><span><span>Selachii</span><a href=\"https://en.wikipedia.org/wiki/Selachii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Selachii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Selachii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Selachii\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><span class=\"common_names\">(sharks)</span><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Selachii_Galeomorphi\"><label class=\"tree_label\" for=\"Selachii_Galeomorphi\"></label><div class=\"outer_tree_box\"><div id=\"elasmobranchii_galeomorphi\" class=\"tree_box\"><span><span>Galeomorphi</span><a href=\"https://en.wikipedia.org/wiki/Galeomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Galeomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Galeomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Galeomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><p class=\"tag\">The galean sharks.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_heterodontiformes\" class=\"tree_box\"><span><span>Heterodontiformes</span><a href=\"https://en.wikipedia.org/wiki/Heterodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Heterodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Heterodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Heterodontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(bullhead sharks)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Heterodontus_portusjacksoni_wilsons_promontory.jpg\" target=\"_blank\"><img src=\"thumbnails/Heterodontus_portusjacksoni_wilsons_promontory.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"648\" height=\"431\" style=\"background-color:#4a3c2b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Heterodontus_galeatus_callala_creek.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Heterodontus_galeatus_callala_creek.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#695c40\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Heterodontus_japonicus_port_of_nagoya.jpg\" target=\"_blank\"><img src=\"thumbnails/Heterodontus_japonicus_port_of_nagoya.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"533\" style=\"background-color:#7b7d6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Heterodontus_ramalheira.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Heterodontus_ramalheira.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"163\" style=\"background-color:#bcb7af\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_orectolobiformes\" class=\"tree_box\"><span><span>Orectolobiformes</span><a href=\"https://en.wikipedia.org/wiki/Orectolobiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Orectolobiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Orectolobiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Orectolobiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ɒrɛkˈtɒləbɪfɔːrmiːz\" target=\"_blank\">ɒrɛkˈtɒləbɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(carpet sharks, whale sharks, nurse sharks)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Blindshark.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Blindshark.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#717773\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nurse_shark.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nurse_shark.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#377382\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chiloscyllium_griseum_Oceanopolis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chiloscyllium_griseum_Oceanopolis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"201\" style=\"background-color:#716d5d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tasseled_wobbegong_shark.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tasseled_wobbegong_shark.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#544949\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cirrhoscyllium_japonicum_nagoya.jpg\" target=\"_blank\"><img src=\"thumbnails/Cirrhoscyllium_japonicum_nagoya.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"450\" style=\"background-color:#679cad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Similan_Dive_Center_-_great_whale_shark.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Similan_Dive_Center_-_great_whale_shark.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"165\" style=\"background-color:#086f98\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oc%C3%A9anopolis_-_les_aquariums_010.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Oc%C3%A9anopolis_-_les_aquariums_010.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#334d58\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_lamniformes\" class=\"tree_box\"><span><span>Lamniformes</span><a href=\"https://en.wikipedia.org/wiki/Lamniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lamniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lamniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lamniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈlæmnɪfɔːrmiːz\" target=\"_blank\">ˈlæmnɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(great white, goblin shark, thresher sharks, basking sharks, megalodon)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Thresher_shark_jumping.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Thresher_shark_jumping.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"313\" style=\"background-color:#8faab8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Alopias_pelagicus_1.jpg\" target=\"_blank\"><img src=\"thumbnails/Alopias_pelagicus_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"450\" height=\"284\" style=\"background-color:#3b52a7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thresher_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Thresher_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"1054\" height=\"621\" style=\"background-color:#0494c0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mustelus_mustelus2.jpg\" target=\"_blank\"><img src=\"thumbnails/Mustelus_mustelus2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"617\" height=\"336\" style=\"background-color:#95ac9a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Basking_Shark.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Basking_Shark.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"250\" style=\"background-color:#054682\"></a><a href=\"https://commons.wikimedia.org/wiki/File:White_shark.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-White_shark.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#1f75b3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:White_shark_%28Carcharodon_carcharias%29_scavenging_on_whale_carcass_-_journal.pone.0060797.g004-A.png\" target=\"_blank\"><img src=\"thumbnails/330px-White_shark_%28Carcharodon_carcharias%29_scavenging_on_whale_carcass_-_journal.pone.0060797.g004-A.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#848082\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Akula_180416.jpg\" target=\"_blank\"><img src=\"thumbnails/Akula_180416.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"550\" style=\"background-color:#5d697b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mistukurina_owstoni_museum_victoria_-_head_detail.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mistukurina_owstoni_museum_victoria_-_head_detail.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#bdb4c0\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_carcharhiniformes\" class=\"tree_box\"><span><span>Carcharhiniformes</span><a href=\"https://en.wikipedia.org/wiki/Carcharhiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Carcharhiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Carcharhiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Carcharhiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌkɑːrkəˌraɪnɪˈfɔːrmiːz\" target=\"_blank\">ˌkɑːrkəˌraɪnɪˈfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(catsharks, houndsharks, tiger sharks, hammerhead sharks)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Katzenhai_Ei-Kapseln.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Katzenhai_Ei-Kapseln.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#776030\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Atelomycterus_marmoratus_newport.jpg\" target=\"_blank\"><img src=\"thumbnails/Atelomycterus_marmoratus_newport.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"533\" style=\"background-color:#707168\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leopard_shark_in_kelp.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leopard_shark_in_kelp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"189\" style=\"background-color:#857559\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bullshark.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Bullshark.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#255f62\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lemonshark_%282%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lemonshark_%282%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"218\" style=\"background-color:#1a8aa8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Carcharhinus_limbatus_%282%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Carcharhinus_limbatus_%282%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"194\" style=\"background-color:#124467\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Triaenodon_obesus_guam.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Triaenodon_obesus_guam.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#788181\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tiger_shark.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tiger_shark.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#377294\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scalloped_Hammerhead_Shark_Sphyrna_Lewini_%28226845659%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Scalloped_Hammerhead_Shark_Sphyrna_Lewini_%28226845659%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#256e90\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hammerhead_shark%2C_Cocos_Island%2C_Costa_Rica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hammerhead_shark%2C_Cocos_Island%2C_Costa_Rica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"262\" style=\"background-color:#1a6e97\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Selachii_Squalomorphi\"><label class=\"tree_label\" for=\"Selachii_Squalomorphi\"></label><div class=\"outer_tree_box\"><div id=\"elasmobranchii_squalomorphi\" class=\"tree_box\"><span><span>Squalomorphi</span><a href=\"https://en.wikipedia.org/wiki/Squalomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Squalomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Squalomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Squalomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><p class=\"tag\">Generally characterized by lacking traits such as an anal fin, nictitating membrane, or suborbital shelves in the cranium.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_hexanchiformes\" class=\"tree_box\"><span><span>Hexanchiformes</span><a href=\"https://en.wikipedia.org/wiki/Hexanchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hexanchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hexanchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hexanchiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=hɛkˈsæŋkɪfɔːrmiːz\" target=\"_blank\">hɛkˈsæŋkɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(frilled sharks, cow sharks)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Chlamydoselachus_anguineus_head.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chlamydoselachus_anguineus_head.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#100f0d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chlamydoselachus_anguineus_NOOA.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chlamydoselachus_anguineus_NOOA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#2060b0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Six-gill_shark.jpg\" target=\"_blank\"><img src=\"thumbnails/Six-gill_shark.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"450\" style=\"background-color:#1a576e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hexanchus_griseus_santa_rosa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hexanchus_griseus_santa_rosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#1d3d4d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Notorynchus_cepedianus_SI4.jpg\" target=\"_blank\"><img src=\"thumbnails/Notorynchus_cepedianus_SI4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"436\" style=\"background-color:#333f3b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_squaliformes\" class=\"tree_box\"><span><span>Squaliformes</span><a href=\"https://en.wikipedia.org/wiki/Squaliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Squaliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Squaliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Squaliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌskwɒlɪˈfɔːrmiːz\" target=\"_blank\">ˌskwɒlɪˈfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(gulper sharks, kitefin sharks, lantern sharks, rough sharks, sleeper sharks, dogfish sharks)</span><p class=\"tag\">Often deep water sharks.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Isistius_brasiliensis.jpg\" target=\"_blank\"><img src=\"thumbnails/Isistius_brasiliensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"733\" height=\"387\" style=\"background-color:#8b8582\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Etmopterus_spinax_Sardinia.jpg\" target=\"_blank\"><img src=\"thumbnails/Etmopterus_spinax_Sardinia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"351\" style=\"background-color:#aea9a4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oxynotus_bruniensis.jpg\" target=\"_blank\"><img src=\"thumbnails/Oxynotus_bruniensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"606\" height=\"453\" style=\"background-color:#373e4a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caribbean_roughshark.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caribbean_roughshark.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#3c6155\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oxynotus_paradoxus.jpg\" target=\"_blank\"><img src=\"thumbnails/Oxynotus_paradoxus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"900\" height=\"424\" style=\"background-color:#241f1a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Somniosus_microcephalus_okeanos.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Somniosus_microcephalus_okeanos.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#394632\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mandarin_dogfish2.jpg\" target=\"_blank\"><img src=\"thumbnails/Mandarin_dogfish2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#595f56\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_echinorhiniformes\" class=\"tree_box\"><span><span>Echinorhiniformes</span><a href=\"https://en.wikipedia.org/wiki/Echinorhiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Echinorhiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Echinorhiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Echinorhiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(bramble sharks, prickly sharks)</span><p class=\"tag\">Deep sea sharks.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Echinorhinus_brucus1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Echinorhinus_brucus1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"139\" style=\"background-color:#ddd5d3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Echinorhinus_cookei_head2.jpg\" target=\"_blank\"><img src=\"thumbnails/Echinorhinus_cookei_head2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"436\" style=\"background-color:#6488ad\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_squatiniformes\" class=\"tree_box\"><span><span>Squatiniformes</span><a href=\"https://en.wikipedia.org/wiki/Squatiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Squatiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Squatiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Squatiniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(angelsharks)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Squatina_squatina_tenerife2.jpg\" target=\"_blank\"><img src=\"thumbnails/Squatina_squatina_tenerife2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"633\" height=\"289\" style=\"background-color:#2c7b9a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Squatina_australis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Squatina_australis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"204\" style=\"background-color:#82816a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_pristiophoriformes\" class=\"tree_box\"><span><span>Pristiophoriformes</span><a href=\"https://en.wikipedia.org/wiki/Pristiophoriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pristiophoriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pristiophoriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pristiophoriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=prɪstiˈɒfɒrɪfɔːrmiːz\" target=\"_blank\">prɪstiˈɒfɒrɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(sawsharks)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Pristiophorus_japonicus_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/Pristiophorus_japonicus_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"798\" height=\"272\" style=\"background-color:#4a545d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pristis_pristis_-_Georgia_Aquarium_Jan_2006.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pristis_pristis_-_Georgia_Aquarium_Jan_2006.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"129\" style=\"background-color:#1887b8\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Elasmobranchii_Batomorphi\"><label class=\"tree_label\" for=\"Elasmobranchii_Batomorphi\"></label><div class=\"outer_tree_box\"><div id=\"elasmobranchii_batomorphi\" class=\"tree_box\"><span><span>Batomorphi</span><a href=\"https://en.wikipedia.org/wiki/Batomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Batomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Batomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Batomorphi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><span class=\"common_names\">(rays)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_torpediniformes\" class=\"tree_box\"><span><span>Torpediniformes</span><a href=\"https://en.wikipedia.org/wiki/Torpediniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Torpediniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Torpediniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Torpediniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=tɔːrˈpɛdɪnɪfɔːrmiːz\" target=\"_blank\">tɔːrˈpɛdɪnɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(electric rays)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Torpedo_marmorata2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Torpedo_marmorata2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#56737a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fish4345_-_Flickr_-_NOAA_Photo_Library.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fish4345_-_Flickr_-_NOAA_Photo_Library.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"222\" style=\"background-color:#b0b5a8\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_rajiformes\" class=\"tree_box\"><span><span>Rajiformes</span><a href=\"https://en.wikipedia.org/wiki/Rajiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rajiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rajiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Rajiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈrædʒɪfɔːrmiːz\" target=\"_blank\">ˈrædʒɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(skates)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Bathyraja_abyssicola.jpg\" target=\"_blank\"><img src=\"thumbnails/Bathyraja_abyssicola.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"520\" height=\"384\" style=\"background-color:#72795c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pluto_Skate_Fenestraja_plutonia.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pluto_Skate_Fenestraja_plutonia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#997148\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mermaidpurse.jpg\" target=\"_blank\"><img src=\"thumbnails/Mermaidpurse.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#dcdddc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dorron_-_16197242004.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dorron_-_16197242004.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"360\" style=\"background-color:#3f5746\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leucoraja_erinacea.jpg\" target=\"_blank\"><img src=\"thumbnails/Leucoraja_erinacea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"504\" height=\"342\" style=\"background-color:#9f8f81\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_pristiformes\" class=\"tree_box\"><span><span>Pristiformes</span><a href=\"https://en.wikipedia.org/wiki/Pristiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pristiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pristiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pristiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(Sawfish, carpenter sharks)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Pristis_pristis_-_Georgia_Aquarium_Jan_2006.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pristis_pristis_-_Georgia_Aquarium_Jan_2006.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"129\" style=\"background-color:#1887b8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sawfish_Pristis_zijsron_Genova_Aquarium.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sawfish_Pristis_zijsron_Genova_Aquarium.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"283\" style=\"background-color:#8bacab\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"elasmobranchii_myliobatiformes\" class=\"tree_box\"><span><span>Myliobatiformes</span><a href=\"https://en.wikipedia.org/wiki/Myliobatiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Myliobatiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Myliobatiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Myliobatiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(stingrays, manta rays, devil rays)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Porcupine_ray_from_Lakshadweep_JJH_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Porcupine_ray_from_Lakshadweep_JJH_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"185\" style=\"background-color:#9f9c90\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gymnura_altavela_aquarium.jpg\" target=\"_blank\"><img src=\"thumbnails/Gymnura_altavela_aquarium.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"577\" height=\"434\" style=\"background-color:#98976c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ornate_eagle_ray_%28Aetomylaeus_vespertilio%29_Baa_Atoll%2C_Maldives_%282018%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ornate_eagle_ray_%28Aetomylaeus_vespertilio%29_Baa_Atoll%2C_Maldives_%282018%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6d858b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mobula_breaching.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mobula_breaching.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#78a1ba\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Manta_birostris-Thailand4.jpg\" target=\"_blank\"><img src=\"thumbnails/Manta_birostris-Thailand4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#2d4b83\"></a></div></div></div></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_animalia_chordata_tetrapoda",[{"name":"Amphibia","parent":"Tetrapoda","rank":"Class","ipa":"","common":["frogs","salamanders","newts","caecilians"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/f/f6/AxolotlBE.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e9/Litoria_phyllochroa.JPG/330px-Litoria_phyllochroa.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Notophthalmus_viridescensPCCA20040816-3983A.jpg/330px-Notophthalmus_viridescensPCCA20040816-3983A.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/Dermophis_mexicanus.jpg/330px-Dermophis_mexicanus.jpg"],"card":1},{"name":"Anura","parent":"Amphibia","rank":"Order","ipa":"","etymology":"greek 'without'-'tail'","common":["frogs"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4f/Bombina_bombina_1_%28Marek_Szczepanek%29_tight_crop.jpg/330px-Bombina_bombina_1_%28Marek_Szczepanek%29_tight_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Atelopus_zeteki1.jpg/330px-Atelopus_zeteki1.jpg"],"card":6},{"name":"Urodela","parent":"Amphibia","rank":"Order","ipa":"","etymology":"greek 'conspicuous tail'","common":["salamanders","newts","axolotls"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b2/SpottedSalamander.jpg/401px-SpottedSalamander.jpg","https://upload.wikimedia.org/wikipedia/commons/5/5a/P_anguinus-head1.jpg","https://upload.wikimedia.org/wikipedia/commons/f/f6/AxolotlBE.jpg"],"card":6},{"name":"Gymnophiona","parent":"Amphibia","rank":"Order","ipa":"","etymology":"latin 'blind ones'","common":["caecilians"],"tag":"Limbless, worm or snake shaped amphibians with small or nonexistent eyes.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/39/Geotrypetes_seraphini_81151958.jpg/330px-Geotrypetes_seraphini_81151958.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Oscaecilia_ochrocephala_%2816983972190%29.jpg/330px-Oscaecilia_ochrocephala_%2816983972190%29.jpg"],"card":6},{"name":"Amniota","parent":"Tetrapoda","rank":"Clade","ipa":"","common":[],"tag":"Has an embryo that develops within a set of protective extra-embryonic membranes; thicker and keratinized skin; costal respiration (breathing by expanding/constricting the rib cage); more complex kidneys; the presence of an astragalus for better extremity range of motion; the diminished role of skin breathing.","imgs":[],"card":1},{"name":"Synapsida","parent":"Amniota","rank":"Clade","ipa":"","etymology":"greek 'together-arch'","common":[],"tag":"The sibling taxon to sauropsida. All mammals and their extinct relatives. They have a single hole behind each eye, on the lower part of the skull.","imgs":[],"card":1},{"name":"Sauropsida","parent":"Amniota","rank":"Clade","ipa":"","etymology":"greek 'lizard faces'","common":[],"tag":"The sibling taxon to Synapsida. The class Reptilia but including birds and extinct relatives.","imgs":[],"card":1},{"name":"Eureptilia","parent":"Sauropsida","rank":"Clade","ipa":"","common":[],"tag":"A contested clade with the only extant species being in Diapsida.","imgs":[],"card":2},{"name":"Diapsida","parent":"Eureptilia","rank":"Clade","ipa":"","common":["birds","reptiles","turtles"],"tag":"Have two holes behind their eye sockets.","imgs":[],"card":2},{"name":"Sauria","parent":"Diapsida","rank":"Clade","ipa":"","common":[],"tag":"All descendants of the most recent common ancestor to crocodilians, birds, lizards, snakes and the tuatara.","imgs":[],"card":2},{"name":"Lepidosauria","parent":"Sauria","rank":"Superorder","ipa":"","common":["tautara","lizards","snakes"],"tag":"All descendants of the most recent common ancestor to lizards, snakes and the tuatara.","imgs":[],"card":2},{"name":"Rhynchocephalia","parent":"Lepidosauria","rank":"Order","ipa":"ˌrɪŋkoʊsɪˈfeɪliə","etymology":"'beak-heads'","common":["tuatara"],"tag":"The only extant species is the tuatara in New Zealand. They were diverse during the Mesozoic era. They have primitive hearing organs and lower odorant receptors compared to crocodiles","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/Henry_at_Invercargill.jpg/250px-Henry_at_Invercargill.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/Tuatara_%285205719005%29.jpg/330px-Tuatara_%285205719005%29.jpg"],"card":4},{"name":"Squamata","parent":"Lepidosauria","rank":"Order","ipa":"","common":["lizards","snakes"],"tag":"","imgs":[],"card":4},{"name":"Gekkota","parent":"Squamata","rank":"Infraorder","ipa":"","common":["gekkos","legless lizards"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Phelsuma_l._laticauda.jpg/250px-Phelsuma_l._laticauda.jpg","https://upload.wikimedia.org/wikipedia/commons/0/01/Phyllodactylus_xanti.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/Pygopus_lepidopodus_431078669_%28cropped%29.jpg/330px-Pygopus_lepidopodus_431078669_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/ff/Pink-tailed_Worm-lizard_%28Aprasia_parapulchella%29_%289105308465%29.jpg/330px-Pink-tailed_Worm-lizard_%28Aprasia_parapulchella%29_%289105308465%29.jpg"],"card":4},{"name":"Scincomorpha","parent":"Squamata","rank":"Infraorder","ipa":"","common":["skinks","allies","blue-tongued lizards","limbless skinks"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/dd/Blue-toungued_skink444.jpg/330px-Blue-toungued_skink444.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ad/Tropical_Girdled_Lizard_P9240103.JPG/330px-Tropical_Girdled_Lizard_P9240103.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/Newbery%27s_Legless_Skink%2C_Vhembe_District_Municipality%2C_South_Africa_imported_from_iNaturalist_photo_457324536.jpg/330px-Newbery%27s_Legless_Skink%2C_Vhembe_District_Municipality%2C_South_Africa_imported_from_iNaturalist_photo_457324536.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/Cryptoblepharus_boutonii_furcata.jpg/330px-Cryptoblepharus_boutonii_furcata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/86/Acontias_breviceps.jpg/330px-Acontias_breviceps.jpg"],"card":4},{"name":"Laterata","parent":"Squamata","rank":"Suborder","ipa":"","common":["wall lizards","rock lizards","worm lizards"],"imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/91/Jaszczurka-Lacerta_agilis.jpg/330px-Jaszczurka-Lacerta_agilis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3a/Tupinambis_teguixin_66357095.jpg/330px-Tupinambis_teguixin_66357095.jpg","https://upload.wikimedia.org/wikipedia/commons/4/40/Amphisbaenia_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8b/Iberian_worm_lizard.jpg/330px-Iberian_worm_lizard.jpg"],"card":4},{"name":"Toxicofera","parent":"Squamata","rank":"Clade","ipa":"","common":[],"tag":"Venom evolved once for this taxa","imgs":[],"card":4},{"name":"Anguimorpha","parent":"Toxicofera","rank":"Suborder","ipa":"","common":["monitors","goannas","komodo dragons","slow worms","glass lizards"],"tag":"All autarchoglossans closer to Varanus (monitor lizards) and Anguis (slowworms) than Scincus","imgs":["https://upload.wikimedia.org/wikipedia/commons/9/9e/Chin-krokodilschwanzechse-01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Lace_monitor_%28Varanus_varius%29%2C_photographed_in_the_Kindra_State_Forest.jpg/250px-Lace_monitor_%28Varanus_varius%29%2C_photographed_in_the_Kindra_State_Forest.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d1/%281%29Goanna-1.jpg/330px-%281%29Goanna-1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2f/Yuli_Seperi_Komodo_TNKomodo-2_%28cropped%29.jpg/330px-Yuli_Seperi_Komodo_TNKomodo-2_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/5/5e/Anguidae.jpg"],"card":5},{"name":"Iguania","parent":"Toxicofera","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"The iguanas, chameleons, agamids, and New World lizards.","imgs":[],"card":5},{"name":"Pleurodonta","parent":"Iguania","rank":"Clade","ipa":"","etymology":"greek 'lateral teeth'","common":["iguanas","New World lizards"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1e/Plumedbasiliskcele4_edit.jpg/330px-Plumedbasiliskcele4_edit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4b/Green_anole.jpg/330px-Green_anole.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/62/Male_Green_Iguana_Belize.jpg/250px-Male_Green_Iguana_Belize.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/14/Leiocephalidae.jpg/330px-Leiocephalidae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b6/Liolaemus_Tenuis.jpg/330px-Liolaemus_Tenuis.jpg"],"card":5},{"name":"Acrodonta","parent":"Iguania","rank":"Clade","ipa":"","etymology":"greek 'highest teeth'","common":["chameleons","thorny devil","frilled-neck lizards"],"tag":"Includes the families Chamaeleonidae (chameleons, their range is mostly in Africa) and Agamidae (dragon lizards including the thorny devil, and frilled-neck lizards)","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/86/Draco_taeniopterus_Gunther%2C_1861_from_Bulon_%28cropped%29.jpg/330px-Draco_taeniopterus_Gunther%2C_1861_from_Bulon_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c6/Acanthosaura_cardamomensis_189186673_%28cropped%29.jpg/330px-Acanthosaura_cardamomensis_189186673_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dc/Frilled_dragon_with_frill_extended_close_up_-_DPLA_-_d6e3c74db204607072354d5bf185b8c9_%28cropped%29.jpg/330px-Frilled_dragon_with_frill_extended_close_up_-_DPLA_-_d6e3c74db204607072354d5bf185b8c9_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/Moloch_horridus_77894454_%28cropped%29.jpg/330px-Moloch_horridus_77894454_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/77/Cameleon%2C_peyrieras_20.JPG/330px-Cameleon%2C_peyrieras_20.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9f/Calumma_gastrotaenia.jpg/330px-Calumma_gastrotaenia.jpg"],"card":5},{"name":"Serpentes","parent":"Toxicofera","rank":"Suborder","ipa":"","etymology":"","common":["snakes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/60/Trimeresurus_sabahi_fucatus%2C_Banded_pit_viper_-_Takua_Pa_District%2C_Phang-nga_Province_%2846710893582%29.jpg/330px-Trimeresurus_sabahi_fucatus%2C_Banded_pit_viper_-_Takua_Pa_District%2C_Phang-nga_Province_%2846710893582%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/01/Laticauda_colubrina_%28Wakatobi%29.jpg/250px-Laticauda_colubrina_%28Wakatobi%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/84/Indian_Cobra%2C_crop.jpg/250px-Indian_Cobra%2C_crop.jpg"],"card":5},{"name":"Archosauria","parent":"Sauria","rank":"Clade","ipa":"","etymology":"greek 'ruling'-'reptiles'","common":["crocodiles","birds"],"tag":"All living and extinct relatives of birds and crocodilians.","imgs":[],"card":2},{"name":"Testudines","parent":"Sauria","rank":"Order","ipa":"","common":["turtles","tortoises","terrapins"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Green_Sea_Turtle_swimming.jpg/330px-Green_Sea_Turtle_swimming.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/af/Diamond_terrapin_turtle_reptile_malaclemys_terrapin.jpg/330px-Diamond_terrapin_turtle_reptile_malaclemys_terrapin.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/A._gigantea_Aldabra_Giant_Tortoise.jpg/330px-A._gigantea_Aldabra_Giant_Tortoise.jpg"],"card":2},{"name":"Mammalia","parent":"Synapsida","rank":"Class","ipa":"","common":[],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/Monachus_schauinslandi.jpg/330px-Monachus_schauinslandi.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/25/Tuskercorbett.jpg/330px-Tuskercorbett.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Flying_fox_at_botanical_gardens_in_Sydney_%28cropped%29.jpg/250px-Flying_fox_at_botanical_gardens_in_Sydney_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Humpback_stellwagen_edit.jpg/330px-Humpback_stellwagen_edit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Kangaroo_Australia_01_11_2008_-_retouch.JPG/330px-Kangaroo_Australia_01_11_2008_-_retouch.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Panthera_tigris_tigris_edit2.jpg/330px-Panthera_tigris_tigris_edit2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f5/Lemur_catta_001.jpg/330px-Lemur_catta_001.jpg"],"card":1},{"name":"Crocodilia","parent":"Archosauria","rank":"Order","ipa":"","etymology":"","common":["crocodiles","alligators","caimans","gharial"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/SaltwaterCrocodile%28%27Maximo%27%29.jpg/330px-SaltwaterCrocodile%28%27Maximo%27%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2f/Freshwater_Crocodile_at_Lone_Pine_Koala_Sanctuary.jpg/330px-Freshwater_Crocodile_at_Lone_Pine_Koala_Sanctuary.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/03/American_Alligator.jpg/250px-American_Alligator.jpg"],"card":3},{"name":"Dinosauria","parent":"Archosauria","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"Descendents of the most recent common ancestor to Triceratops and modern birds.","imgs":[],"card":3},{"name":"Aves","parent":"Dinosauria","rank":"Class","ipa":"","common":["birds"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/American_Flamingo_JG.jpg/330px-American_Flamingo_JG.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c4/Puffin_%28Fratercula_arctica%29.jpg/250px-Puffin_%28Fratercula_arctica%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/74/2020-11_Kerguelen_Islands_-_Gentoo_penguin_11.jpg/250px-2020-11_Kerguelen_Islands_-_Gentoo_penguin_11.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/54/Southern_Cassowary_7071.jpg/330px-Southern_Cassowary_7071.jpg"],"card":3}],{},{"250px-2020-11_Kerguelen_Islands_-_Gentoo_penguin_11.jpg":[250,250,"#707279"],"250px-American_Alligator.jpg":[250,333,"#616357"],"250px-Flying_fox_at_botanical_gardens_in_Sydney_(cropped).jpg":[250,470,"#c2b8b4"],"250px-Henry_at_Invercargill.jpg":[250,324,"#6a6866"],"250px-Indian_Cobra,_crop.jpg":[250,246,"#baa58f"],"250px-Lace_monitor_(Varanus_varius),_photographed_in_the_Kindra_State_Forest.jpg":[250,375,"#a4937f"],"250px-Laticauda_colubrina_(Wakatobi).jpg":[250,306,"#66a597"],"250px-Male_Green_Iguana_Belize.jpg":[250,312,"#756e5e"],"250px-Phelsuma_l._laticauda.jpg":[250,307,"#a0967b"],"250px-Puffin_(Fratercula_arctica).jpg":[250,250,"#7d8285"],"330px-(1)Goanna-1.jpg":[330,220,"#6b5b3e"],"330px-A._gigantea_Aldabra_Giant_Tortoise.jpg":[330,247,"#7d7b7a"],"330px-Acanthosaura_cardamomensis_189186673_(cropped).jpg":[330,136,"#282722"],"330px-Acontias_breviceps.jpg":[330,239,"#907960"],"330px-American_Flamingo_JG.jpg":[330,248,"#4c4a58"],"330px-Atelopus_zeteki1.jpg":[330,209,"#484f15"],"330px-Blue-toungued_skink444.jpg":[330,248,"#b38561"],"330px-Bombina_bombina_1_(Marek_Szczepanek)_tight_crop.jpg":[330,248,"#66664b"],"330px-Calumma_gastrotaenia.jpg":[330,221,"#1e2010"],"330px-Cameleon,_peyrieras_20.JPG":[330,220,"#544d32"],"330px-Cryptoblepharus_boutonii_furcata.jpg":[330,211,"#f3f2e2"],"330px-Dermophis_mexicanus.jpg":[330,219,"#8d6e55"],"330px-Diamond_terrapin_turtle_reptile_malaclemys_terrapin.jpg":[329,220,"#838b7e"],"330px-Draco_taeniopterus_Gunther,_1861_from_Bulon_(cropped).jpg":[330,155,"#909082"],"330px-Freshwater_Crocodile_at_Lone_Pine_Koala_Sanctuary.jpg":[330,221,"#7a8c68"],"330px-Frilled_dragon_with_frill_extended_close_up_-_DPLA_-_d6e3c74db204607072354d5bf185b8c9_(cropped).jpg":[330,180,"#6d6342"],"330px-Geotrypetes_seraphini_81151958.jpg":[330,220,"#634e2a"],"330px-Green_Sea_Turtle_swimming.jpg":[330,220,"#18b0bc"],"330px-Green_anole.jpg":[330,158,"#6e724b"],"330px-Humpback_stellwagen_edit.jpg":[330,187,"#8897a9"],"330px-Iberian_worm_lizard.jpg":[330,198,"#6f6a6f"],"330px-Jaszczurka-Lacerta_agilis.jpg":[330,232,"#6b856f"],"330px-Kangaroo_Australia_01_11_2008_-_retouch.JPG":[330,221,"#717f5b"],"330px-Leiocephalidae.jpg":[330,154,"#858478"],"330px-Lemur_catta_001.jpg":[330,186,"#988474"],"330px-Liolaemus_Tenuis.jpg":[330,268,"#75643b"],"330px-Litoria_phyllochroa.JPG":[330,238,"#4b4e20"],"330px-Moloch_horridus_77894454_(cropped).jpg":[330,165,"#b37b5c"],"330px-Monachus_schauinslandi.jpg":[330,219,"#194487"],"330px-Newbery's_Legless_Skink,_Vhembe_District_Municipality,_South_Africa_imported_from_iNaturalist_photo_457324536.jpg":[330,220,"#93683c"],"330px-Notophthalmus_viridescensPCCA20040816-3983A.jpg":[330,209,"#9f7151"],"330px-Oscaecilia_ochrocephala_(16983972190).jpg":[330,220,"#d0d1d5"],"330px-Panthera_tigris_tigris_edit2.jpg":[330,220,"#797d52"],"330px-Pink-tailed_Worm-lizard_(Aprasia_parapulchella)_(9105308465).jpg":[330,213,"#986445"],"330px-Plumedbasiliskcele4_edit.jpg":[330,219,"#366432"],"330px-Pygopus_lepidopodus_431078669_(cropped).jpg":[330,190,"#6d6a62"],"330px-SaltwaterCrocodile('Maximo').jpg":[330,247,"#918573"],"330px-Southern_Cassowary_7071.jpg":[330,247,"#9ab37c"],"330px-Trimeresurus_sabahi_fucatus,_Banded_pit_viper_-_Takua_Pa_District,_Phang-nga_Province_(46710893582).jpg":[330,220,"#2c2b1e"],"330px-Tropical_Girdled_Lizard_P9240103.JPG":[330,247,"#766d65"],"330px-Tuatara_(5205719005).jpg":[330,264,"#525031"],"330px-Tupinambis_teguixin_66357095.jpg":[330,220,"#6d6a5a"],"330px-Tuskercorbett.jpg":[330,220,"#819598"],"330px-Yuli_Seperi_Komodo_TNKomodo-2_(cropped).jpg":[330,86,"#716641"],"401px-SpottedSalamander.jpg":[401,600,"#bebcbb"],"Amphisbaenia_1.jpg":[246,133,"#9e8575"],"Anguidae.jpg":[700,523,"#7d7366"],"AxolotlBE.jpg":[480,358,"#9e9b84"],"Chin-krokodilschwanzechse-01.jpg":[699,522,"#575f32"],"P_anguinus-head1.jpg":[300,206,"#32302d"],"Phyllodactylus_xanti.jpg":[436,338,"#6f6351"]})
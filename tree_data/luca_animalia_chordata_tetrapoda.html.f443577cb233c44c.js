@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda","<ul class=\"tree\" data-tree-range=\"tetrapoda\"><li><input type=\"checkbox\" checked id=\"Rhipidistia_Tetrapoda\"><label class=\"tree_label\" for=\"Rhipidistia_Tetrapoda\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_tetrapoda\" class=\"tree_box\"><span><span>Tetrapoda</span><a href=\"https://en.wikipedia.org/wiki/Tetrapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tetrapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tetrapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tetrapoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈtɛtrəˌpɒd\" target=\"_blank\">ˈtɛtrəˌpɒd</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"chordata\">See parent</button><span class=\"badge\">Clade</span></span><p class=\"tag\">Four-limbed vertebrates. Have paired lungs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Mercurana.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mercurana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#232010\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dermophis_mexicanus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dermophis_mexicanus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#8d6e55\"></a><a href=\"https://commons.wikimedia.org/wiki/File:AgamaSinaita01_ST_10_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-AgamaSinaita01_ST_10_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#bca085\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Equus_quagga_burchellii_-_Etosha%2C_2014.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#626660\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tachyglossus_aculeatus_side_on.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tachyglossus_aculeatus_side_on.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"201\" style=\"background-color:#919886\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Royal_Tern.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Royal_Tern.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"207\" style=\"background-color:#858584\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Tetrapoda_Amphibia\"><label class=\"tree_label\" for=\"Tetrapoda_Amphibia\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_amphibia\" class=\"tree_box\"><span><span>Amphibia</span><a href=\"https://en.wikipedia.org/wiki/Amphibia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Amphibia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Amphibia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Amphibia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(frogs, salamanders, newts, caecilians)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:AxolotlBE.jpg\" target=\"_blank\"><img src=\"thumbnails/AxolotlBE.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"480\" height=\"358\" style=\"background-color:#9e9b84\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Litoria_phyllochroa.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Litoria_phyllochroa.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#4b4e20\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Notophthalmus_viridescensPCCA20040816-3983A.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Notophthalmus_viridescensPCCA20040816-3983A.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"209\" style=\"background-color:#9f7151\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dermophis_mexicanus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dermophis_mexicanus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#8d6e55\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_anura\" class=\"tree_box\"><span><span>Anura</span><a href=\"https://en.wikipedia.org/wiki/Anura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Anura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Anura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Anura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(frogs)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Bombina_bombina_1_%28Marek_Szczepanek%29_tight_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bombina_bombina_1_%28Marek_Szczepanek%29_tight_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#66664b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Atelopus_zeteki1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Atelopus_zeteki1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"209\" style=\"background-color:#484f15\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_urodela\" class=\"tree_box\"><span><span>Urodela</span><a href=\"https://en.wikipedia.org/wiki/Urodela\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Urodela\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Urodela\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Urodela\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(salamanders, newts, axolotls)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:SpottedSalamander.jpg\" target=\"_blank\"><img src=\"thumbnails/401px-SpottedSalamander.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"401\" height=\"600\" style=\"background-color:#bebcbb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:P_anguinus-head1.jpg\" target=\"_blank\"><img src=\"thumbnails/P_anguinus-head1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"300\" height=\"206\" style=\"background-color:#32302d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:AxolotlBE.jpg\" target=\"_blank\"><img src=\"thumbnails/AxolotlBE.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"480\" height=\"358\" style=\"background-color:#9e9b84\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_gymnophiona\" class=\"tree_box\"><span><span>Gymnophiona</span><a href=\"https://en.wikipedia.org/wiki/Gymnophiona\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gymnophiona\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gymnophiona\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gymnophiona\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(caecilians)</span><p class=\"tag\">Limbless, worm or snake shaped amphibians with small or nonexistent eyes.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Geotrypetes_seraphini_81151958.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Geotrypetes_seraphini_81151958.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#634e2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oscaecilia_ochrocephala_%2816983972190%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Oscaecilia_ochrocephala_%2816983972190%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#d0d1d5\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Tetrapoda_Amniota\"><label class=\"tree_label\" for=\"Tetrapoda_Amniota\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_amniota\" class=\"tree_box\"><span><span>Amniota</span><a href=\"https://en.wikipedia.org/wiki/Amniota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Amniota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Amniota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Amniota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Has an embryo that develops within a set of protective extra-embryonic membranes; thicker and keratinized skin; costal respiration (breathing by expanding/constricting the rib cage); more complex kidneys; the presence of an astragalus for better extremity range of motion; the diminished role of skin breathing.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Amniota_Synapsida\"><label class=\"tree_label\" for=\"Amniota_Synapsida\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_synapsida\" class=\"tree_box\"><span><span>Synapsida</span><a href=\"https://en.wikipedia.org/wiki/Synapsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Synapsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Synapsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Synapsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">The sibling taxon to sauropsida. All mammals and their extinct relatives. They have a single hole behind each eye, on the lower part of the skull.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_mammalia\" class=\"tree_box\"><span><span>Mammalia</span><a href=\"https://en.wikipedia.org/wiki/Mammalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mammalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mammalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mammalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"mammalia\">See children</button><span class=\"badge\">Class</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Monachus_schauinslandi.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Monachus_schauinslandi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#194487\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tuskercorbett.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tuskercorbett.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#819598\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flying_fox_at_botanical_gardens_in_Sydney_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Flying_fox_at_botanical_gardens_in_Sydney_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"470\" style=\"background-color:#c2b8b4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Humpback_stellwagen_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Humpback_stellwagen_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"187\" style=\"background-color:#8897a9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kangaroo_Australia_01_11_2008_-_retouch.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Kangaroo_Australia_01_11_2008_-_retouch.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#717f5b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Panthera_tigris_tigris_edit2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Panthera_tigris_tigris_edit2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#797d52\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lemur_catta_001.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lemur_catta_001.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#988474\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Amniota_Sauropsida\"><label class=\"tree_label\" for=\"Amniota_Sauropsida\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_sauropsida\" class=\"tree_box\"><span><span>Sauropsida</span><a href=\"https://en.wikipedia.org/wiki/Sauropsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sauropsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sauropsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Sauropsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">The sibling taxon to Synapsida. The class Reptilia but including birds and extinct relatives.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Sauropsida_Eureptilia\"><label class=\"tree_label\" for=\"Sauropsida_Eureptilia\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_eureptilia\" class=\"tree_box\"><span><span>Eureptilia</span><a href=\"https://en.wikipedia.org/wiki/Eureptilia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eureptilia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eureptilia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Eureptilia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">A contested clade with the only extant species being in Diapsida.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Eureptilia_Diapsida\"><label class=\"tree_label\" for=\"Eureptilia_Diapsida\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_diapsida\" class=\"tree_box\"><span><span>Diapsida</span><a href=\"https://en.wikipedia.org/wiki/Diapsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Diapsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Diapsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Diapsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(birds, reptiles, turtles)</span><p class=\"tag\">Have two holes behind their eye sockets.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Diapsida_Sauria\"><label class=\"tree_label\" for=\"Diapsida_Sauria\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_sauria\" class=\"tree_box\"><span><span>Sauria</span><a href=\"https://en.wikipedia.org/wiki/Sauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Sauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">All descendants of the most recent common ancestor to crocodilians, birds, lizards, snakes and the tuatara.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Sauria_Lepidosauria\"><label class=\"tree_label\" for=\"Sauria_Lepidosauria\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_lepidosauria\" class=\"tree_box\"><span><span>Lepidosauria</span><a href=\"https://en.wikipedia.org/wiki/Lepidosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lepidosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lepidosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lepidosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><span class=\"common_names\">(tautara, lizards, snakes)</span><p class=\"tag\">All descendants of the most recent common ancestor to lizards, snakes and the tuatara.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_rhynchocephalia\" class=\"tree_box\"><span><span>Rhynchocephalia</span><a href=\"https://en.wikipedia.org/wiki/Rhynchocephalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rhynchocephalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rhynchocephalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Rhynchocephalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌrɪŋkoʊsɪˈfeɪliə\" target=\"_blank\">ˌrɪŋkoʊsɪˈfeɪliə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(tuatara)</span><p class=\"tag\">The only extant species is the tuatara in New Zealand. They were diverse during the Mesozoic era. They have primitive hearing organs and lower odorant receptors compared to crocodiles</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Henry_at_Invercargill.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Henry_at_Invercargill.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"324\" style=\"background-color:#6a6866\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tuatara_%285205719005%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tuatara_%285205719005%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#525031\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Lepidosauria_Squamata\"><label class=\"tree_label\" for=\"Lepidosauria_Squamata\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_squamata\" class=\"tree_box\"><span><span>Squamata</span><a href=\"https://en.wikipedia.org/wiki/Squamata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Squamata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Squamata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Squamata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(lizards, snakes)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_gekkota\" class=\"tree_box\"><span><span>Gekkota</span><a href=\"https://en.wikipedia.org/wiki/Gekkota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gekkota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gekkota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gekkota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraorder</span></span><span class=\"common_names\">(gekkos, legless lizards)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Phelsuma_l._laticauda.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Phelsuma_l._laticauda.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"307\" style=\"background-color:#a0967b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phyllodactylus_xanti.jpg\" target=\"_blank\"><img src=\"thumbnails/Phyllodactylus_xanti.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"436\" height=\"338\" style=\"background-color:#6f6351\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pygopus_lepidopodus_431078669_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pygopus_lepidopodus_431078669_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"190\" style=\"background-color:#6d6a62\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pink-tailed_Worm-lizard_%28Aprasia_parapulchella%29_%289105308465%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pink-tailed_Worm-lizard_%28Aprasia_parapulchella%29_%289105308465%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"213\" style=\"background-color:#986445\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_scincomorpha\" class=\"tree_box\"><span><span>Scincomorpha</span><a href=\"https://en.wikipedia.org/wiki/Scincomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Scincomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Scincomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Scincomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraorder</span></span><span class=\"common_names\">(skinks, allies, blue-tongued lizards, limbless skinks)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Blue-toungued_skink444.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Blue-toungued_skink444.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#b38561\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tropical_Girdled_Lizard_P9240103.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Tropical_Girdled_Lizard_P9240103.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#766d65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Newbery%27s_Legless_Skink%2C_Vhembe_District_Municipality%2C_South_Africa_imported_from_iNaturalist_photo_457324536.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Newbery%27s_Legless_Skink%2C_Vhembe_District_Municipality%2C_South_Africa_imported_from_iNaturalist_photo_457324536.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#93683c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cryptoblepharus_boutonii_furcata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cryptoblepharus_boutonii_furcata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"211\" style=\"background-color:#f3f2e2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acontias_breviceps.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Acontias_breviceps.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"239\" style=\"background-color:#907960\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_laterata\" class=\"tree_box\"><span><span>Laterata</span><a href=\"https://en.wikipedia.org/wiki/Laterata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Laterata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Laterata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Laterata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(wall lizards, rock lizards, worm lizards)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Jaszczurka-Lacerta_agilis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Jaszczurka-Lacerta_agilis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"232\" style=\"background-color:#6b856f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tupinambis_teguixin_66357095.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tupinambis_teguixin_66357095.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6d6a5a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amphisbaenia_1.jpg\" target=\"_blank\"><img src=\"thumbnails/Amphisbaenia_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"246\" height=\"133\" style=\"background-color:#9e8575\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Iberian_worm_lizard.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Iberian_worm_lizard.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"198\" style=\"background-color:#6f6a6f\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Squamata_Toxicofera\"><label class=\"tree_label\" for=\"Squamata_Toxicofera\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_toxicofera\" class=\"tree_box\"><span><span>Toxicofera</span><a href=\"https://en.wikipedia.org/wiki/Toxicofera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Toxicofera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Toxicofera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Toxicofera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Venom evolved once for this taxa</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_anguimorpha\" class=\"tree_box\"><span><span>Anguimorpha</span><a href=\"https://en.wikipedia.org/wiki/Anguimorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Anguimorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Anguimorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Anguimorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(monitors, goannas, komodo dragons, slow worms, glass lizards)</span><p class=\"tag\">All autarchoglossans closer to Varanus (monitor lizards) and Anguis (slowworms) than Scincus</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chin-krokodilschwanzechse-01.jpg\" target=\"_blank\"><img src=\"thumbnails/Chin-krokodilschwanzechse-01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"699\" height=\"522\" style=\"background-color:#575f32\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lace_monitor_%28Varanus_varius%29%2C_photographed_in_the_Kindra_State_Forest.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lace_monitor_%28Varanus_varius%29%2C_photographed_in_the_Kindra_State_Forest.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#a4937f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%281%29Goanna-1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%281%29Goanna-1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6b5b3e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Yuli_Seperi_Komodo_TNKomodo-2_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Yuli_Seperi_Komodo_TNKomodo-2_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"86\" style=\"background-color:#716641\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anguidae.jpg\" target=\"_blank\"><img src=\"thumbnails/Anguidae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"700\" height=\"523\" style=\"background-color:#7d7366\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Toxicofera_Iguania\"><label class=\"tree_label\" for=\"Toxicofera_Iguania\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_iguania\" class=\"tree_box\"><span><span>Iguania</span><a href=\"https://en.wikipedia.org/wiki/Iguania\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Iguania\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Iguania\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Iguania\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">The iguanas, chameleons, agamids, and New World lizards.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_pleurodonta\" class=\"tree_box\"><span><span>Pleurodonta</span><a href=\"https://en.wikipedia.org/wiki/Pleurodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pleurodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pleurodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pleurodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(iguanas, New World lizards)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Plumedbasiliskcele4_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Plumedbasiliskcele4_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#366432\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Green_anole.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Green_anole.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"158\" style=\"background-color:#6e724b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Male_Green_Iguana_Belize.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Male_Green_Iguana_Belize.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"312\" style=\"background-color:#756e5e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leiocephalidae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leiocephalidae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"154\" style=\"background-color:#858478\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Liolaemus_Tenuis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Liolaemus_Tenuis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"268\" style=\"background-color:#75643b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_acrodonta\" class=\"tree_box\"><span><span>Acrodonta</span><a href=\"https://en.wikipedia.org/wiki/Acrodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Acrodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Acrodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Acrodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(chameleons, thorny devil, frilled-neck lizards)</span><p class=\"tag\">Includes the families Chamaeleonidae (chameleons, their range is mostly in Africa) and Agamidae (dragon lizards including the thorny devil, and frilled-neck lizards)</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Draco_taeniopterus_Gunther%2C_1861_from_Bulon_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Draco_taeniopterus_Gunther%2C_1861_from_Bulon_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"155\" style=\"background-color:#909082\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acanthosaura_cardamomensis_189186673_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Acanthosaura_cardamomensis_189186673_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"136\" style=\"background-color:#282722\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Frilled_dragon_with_frill_extended_close_up_-_DPLA_-_d6e3c74db204607072354d5bf185b8c9_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Frilled_dragon_with_frill_extended_close_up_-_DPLA_-_d6e3c74db204607072354d5bf185b8c9_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"180\" style=\"background-color:#6d6342\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Moloch_horridus_77894454_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Moloch_horridus_77894454_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"165\" style=\"background-color:#b37b5c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cameleon%2C_peyrieras_20.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Cameleon%2C_peyrieras_20.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#544d32\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Calumma_gastrotaenia.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Calumma_gastrotaenia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#1e2010\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_serpentes\" class=\"tree_box\"><span><span>Serpentes</span><a href=\"https://en.wikipedia.org/wiki/Serpentes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Serpentes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Serpentes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Serpentes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(snakes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Trimeresurus_sabahi_fucatus%2C_Banded_pit_viper_-_Takua_Pa_District%2C_Phang-nga_Province_%2846710893582%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Trimeresurus_sabahi_fucatus%2C_Banded_pit_viper_-_Takua_Pa_District%2C_Phang-nga_Province_%2846710893582%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#2c2b1e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Laticauda_colubrina_%28Wakatobi%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Laticauda_colubrina_%28Wakatobi%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"306\" style=\"background-color:#66a597\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Indian_Cobra%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Indian_Cobra%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"246\" style=\"background-color:#baa58f\"></a></div></div></div></li></ul></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Sauria_Archosauria\"><label class=\"tree_label\" for=\"Sauria_Archosauria\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_archosauria\" class=\"tree_box\"><span><span>Archosauria</span><a href=\"https://en.wikipedia.org/wiki/Archosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Archosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Archosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Archosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(crocodiles, birds)</span><p class=\"tag\">All living and extinct relatives of birds and crocodilians.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_crocodilia\" class=\"tree_box\"><span><span>Crocodilia</span><a href=\"https://en.wikipedia.org/wiki/Crocodilia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Crocodilia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Crocodilia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Crocodilia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(crocodiles, alligators, caimans, gharial)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:SaltwaterCrocodile%28%27Maximo%27%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-SaltwaterCrocodile%28%27Maximo%27%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#918573\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Freshwater_Crocodile_at_Lone_Pine_Koala_Sanctuary.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Freshwater_Crocodile_at_Lone_Pine_Koala_Sanctuary.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#7a8c68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:American_Alligator.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-American_Alligator.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#616357\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Archosauria_Dinosauria\"><label class=\"tree_label\" for=\"Archosauria_Dinosauria\"></label><div class=\"outer_tree_box\"><div id=\"tetrapoda_dinosauria\" class=\"tree_box\"><span><span>Dinosauria</span><a href=\"https://en.wikipedia.org/wiki/Dinosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dinosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dinosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Dinosauria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Descendents of the most recent common ancestor to Triceratops and modern birds.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_aves\" class=\"tree_box\"><span><span>Aves</span><a href=\"https://en.wikipedia.org/wiki/Aves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Aves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Aves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Aves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"aves\">See children</button><span class=\"badge\">Class</span></span><span class=\"common_names\">(birds)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:American_Flamingo_JG.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-American_Flamingo_JG.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4c4a58\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Puffin_%28Fratercula_arctica%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Puffin_%28Fratercula_arctica%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7d8285\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2020-11_Kerguelen_Islands_-_Gentoo_penguin_11.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2020-11_Kerguelen_Islands_-_Gentoo_penguin_11.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#707279\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Southern_Cassowary_7071.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Southern_Cassowary_7071.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9ab37c\"></a></div></div></div></li></ul></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"tetrapoda_testudines\" class=\"tree_box\"><span><span>Testudines</span><a href=\"https://en.wikipedia.org/wiki/Testudines\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Testudines\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Testudines\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Testudines\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(turtles, tortoises, terrapins)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Green_Sea_Turtle_swimming.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Green_Sea_Turtle_swimming.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#18b0bc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diamond_terrapin_turtle_reptile_malaclemys_terrapin.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Diamond_terrapin_turtle_reptile_malaclemys_terrapin.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"329\" height=\"220\" style=\"background-color:#838b7e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:A._gigantea_Aldabra_Giant_Tortoise.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-A._gigantea_Aldabra_Giant_Tortoise.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7d7b7a\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul>")
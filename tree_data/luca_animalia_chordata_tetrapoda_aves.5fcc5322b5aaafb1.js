@@ -0,0 +1 @@
+TreeData.register("luca_animalia_chordata_tetrapoda_aves",[{"name":"Palaeognathae","parent":"Aves","rank":"Infraclass","ipa":"ˌpæliˈɒɡnəθi","etymology":"greek 'old'-'jaw'","common":["tinamous","kiwis","cassowaries","emus","rheas","ostriches","moas"],"tag":"Mostly flightless birds where the male incubates the eggs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Avestruz_de_cuello_azul_%28Struthio_camelus_australis%29%2C_cabo_de_Buena_Esparanza%2C_Sud%C3%A1frica%2C_2018-07-23%2C_DD_87.jpg/330px-Avestruz_de_cuello_azul_%28Struthio_camelus_australis%29%2C_cabo_de_Buena_Esparanza%2C_Sud%C3%A1frica%2C_2018-07-23%2C_DD_87.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Rhynchotus_rufescens_-Parque_das_Aves-8a.jpg/330px-Rhynchotus_rufescens_-Parque_das_Aves-8a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Apteryx_mantelli_-Rotorua%2C_North_Island%2C_New_Zealand-8a.jpg/330px-Apteryx_mantelli_-Rotorua%2C_North_Island%2C_New_Zealand-8a.jpg"],"card":1},{"name":"Struthioniformes","parent":"Palaeognathae","rank":"Order","ipa":"","etymology":"","common":["ostriches"],"tag":"Large flightless birds native to Africa. They are the largest extant birds and the fastest runners.","imgs":["https://upload.wikimedia.org/wikipedia/commons/0/07/Struthio_camelus_-_Etosha_2014_%281%29_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e7/%CE%A3%CF%84%CF%81%CE%BF%CF%85%CE%B8%CE%BF%CE%BA%CE%B1%CE%BC%CE%AE%CE%BB%CE%BF%CF%85_%CF%83%CF%84%CE%B7%CE%BD_Bucaramanga_%CF%84%CE%B7%CF%82_%CE%9A%CE%BF%CE%BB%CE%BF%CE%BC%CE%B2%CE%AF%CE%B1%CF%82.jpg/330px-%CE%A3%CF%84%CF%81%CE%BF%CF%85%CE%B8%CE%BF%CE%BA%CE%B1%CE%BC%CE%AE%CE%BB%CE%BF%CF%85_%CF%83%CF%84%CE%B7%CE%BD_Bucaramanga_%CF%84%CE%B7%CF%82_%CE%9A%CE%BF%CE%BB%CE%BF%CE%BC%CE%B2%CE%AF%CE%B1%CF%82.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e1/Somali_ostrich.jpg/330px-Somali_ostrich.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Avestruz_de_cuello_azul_%28Struthio_camelus_australis%29%2C_cabo_de_Buena_Esparanza%2C_Sud%C3%A1frica%2C_2018-07-23%2C_DD_87.jpg/330px-Avestruz_de_cuello_azul_%28Struthio_camelus_australis%29%2C_cabo_de_Buena_Esparanza%2C_Sud%C3%A1frica%2C_2018-07-23%2C_DD_87.jpg"],"species":2,"card":4},{"name":"Tinamiformes","parent":"Palaeognathae","rank":"Order","ipa":"ˌtɪnəməˈfɔːrmiːz","etymology":"","common":["tinamous"],"tag":"Heavy bodied and short tailed ground dwelling birds of central and South America that have the ability to fly; sometimes domesticated.","imgs":["https://upload.wikimedia.org/wikipedia/commons/f/fc/NothuraDarwiniiSmit_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/Elegant_Crested_Tinamou_%28Eudromia_elegans%29_%2815953728501%29.jpg/330px-Elegant_Crested_Tinamou_%28Eudromia_elegans%29_%2815953728501%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Rhynchotus_rufescens_-Parque_das_Aves-8a.jpg/330px-Rhynchotus_rufescens_-Parque_das_Aves-8a.jpg","https://upload.wikimedia.org/wikipedia/commons/e/e9/Crypturellus_tataupa.JPG"],"species":46,"card":4},{"name":"Rheiformes","parent":"Palaeognathae","rank":"Order","ipa":"","etymology":"","common":["rheas"],"tag":"Rheiformes is an order of flightless birds primarily native to South America.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5f/Rhea_white_background.jpg/250px-Rhea_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cc/Nandu_Rhea_americana_Tierpark_Hellabrunn-1.jpg/330px-Nandu_Rhea_americana_Tierpark_Hellabrunn-1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0e/Greater_Rhea_%28Rhea_americana%29_%2828234029614%29.jpg/250px-Greater_Rhea_%28Rhea_americana%29_%2828234029614%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6c/As_emas.jpg/330px-As_emas.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a6/Pterocnemia_pennat_%28zoo_Zurich%29.jpg/250px-Pterocnemia_pennat_%28zoo_Zurich%29.jpg"],"species":2,"card":4},{"name":"Apterygiformes","parent":"Palaeognathae","rank":"Order","ipa":"","etymology":"greek 'without'-'wing'-'shape'","common":["kiwis"],"tag":"Flightless birds characterized by their small size, nocturnal habits, and lack of functional wings. Known primarily for the modern family of Kiwis, native to New Zealand.","imgs":["https://upload.wikimedia.org/wikipedia/commons/7/72/Little_spotted_kiwi%2C_Apteryx_owenii%2C_Auckland_War_Memorial_Museum_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Okarito_kiwi_2.jpg/250px-Okarito_kiwi_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Apteryx_mantelli_-Rotorua%2C_North_Island%2C_New_Zealand-8a.jpg/330px-Apteryx_mantelli_-Rotorua%2C_North_Island%2C_New_Zealand-8a.jpg"],"species":5,"card":4},{"name":"Casuariiformes","parent":"Palaeognathae","rank":"Order","ipa":"","etymology":"'cassowary'-'form'","common":["emu","cassowaries"],"tag":"Large flightless birds native to the Australasian region.","imgs":["https://upload.wikimedia.org/wikipedia/commons/0/00/Emu_RWD2_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Darica_Cossowary_00975.jpg/250px-Darica_Cossowary_00975.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Casuarius_unappendiculatus_qtl1.jpg/330px-Casuarius_unappendiculatus_qtl1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Emu_portrait.jpg/330px-Emu_portrait.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c4/Emoe.jpg"],"species":4,"card":4},{"name":"Neognathae","parent":"Aves","rank":"Infraclass","ipa":"niˈɒɡnəθiː","etymology":"greek 'new'-'jaw'","common":[],"tag":"All birds except the tinamous and the flightless ratites. They have fused metacarpals and an elongate third finger.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Greater_flamingo_galapagos.JPG/330px-Greater_flamingo_galapagos.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/SNOW-PIGEON-SELA.jpg/330px-SNOW-PIGEON-SELA.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Pelecanus_conspicillatus_-Australia_-8.jpg/330px-Pelecanus_conspicillatus_-Australia_-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg/330px-Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/17/Accipiter_nisus_edit.jpg/330px-Accipiter_nisus_edit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/House_Sparrow%2C_England_-_May_09.jpg/330px-House_Sparrow%2C_England_-_May_09.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3e/A_male_peafowl_dancing.jpg/330px-A_male_peafowl_dancing.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7d/Wood-ducks-male-female-chicago-march-2024.jpg/330px-Wood-ducks-male-female-chicago-march-2024.jpg","https://upload.wikimedia.org/wikipedia/commons/2/23/Red_jungle_fowl.png"],"card":1},{"name":"Galloanserae","parent":"Neognathae","rank":"Superorder","ipa":"","etymology":"latin 'rooster'-'goose'","common":["pheasants","ducks","geese","swans"],"tag":"The fowl. Survived the K-T extinction event.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/7d/Wood-ducks-male-female-chicago-march-2024.jpg/330px-Wood-ducks-male-female-chicago-march-2024.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Anser_caerulescens_CT8.jpg/330px-Anser_caerulescens_CT8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3e/A_male_peafowl_dancing.jpg/330px-A_male_peafowl_dancing.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c0/Malleefowl_0A2A4564.jpg/330px-Malleefowl_0A2A4564.jpg","https://upload.wikimedia.org/wikipedia/commons/2/23/Red_jungle_fowl.png"],"card":1},{"name":"Galliformes","parent":"Galloanserae","rank":"Order","ipa":" ˌɡælɪˈfɔːrmiːz","etymology":"","common":["chickens","pheasants","turkeys","quail","peacocks","partridges","grouse","guinea foul"],"tag":"The gamefowl. Heavy-bodied ground-feeding landfowl often domesticated or hunted as game birds.","imgs":["https://upload.wikimedia.org/wikipedia/commons/2/23/Red_jungle_fowl.png","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Chestnut-bellied_Partridge_RWD2.jpg/330px-Chestnut-bellied_Partridge_RWD2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/Pheasant.jpg/330px-Pheasant.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3e/A_male_peafowl_dancing.jpg/330px-A_male_peafowl_dancing.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Peacock-JS.jpg/330px-Peacock-JS.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bd/SageGrouse21.jpg/250px-SageGrouse21.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/af/Numida_meleagris_-Serengeti_National_Park%2C_Tanzania-8_%281%29.jpg/330px-Numida_meleagris_-Serengeti_National_Park%2C_Tanzania-8_%281%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c6/Crax_daubentoni_-Philadelphia_Zoo_-female-8a-4c.jpg/250px-Crax_daubentoni_-Philadelphia_Zoo_-female-8a-4c.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c0/Malleefowl_0A2A4564.jpg/330px-Malleefowl_0A2A4564.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/67/Australian_Brushturkey_2_-_Newington.jpg/250px-Australian_Brushturkey_2_-_Newington.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4f/Brushturkeykansaszoo.jpg/330px-Brushturkeykansaszoo.jpg"],"species":302,"card":5},{"name":"Anseriformes","parent":"Galloanserae","rank":"Order","ipa":"","etymology":"","common":["ducks","geese","swans","screamers"],"tag":"The waterfowl. Highly adapted for an aquatic existence at the water surface. The bill and a modified tongue create suction to pump or draw water in.","imgs":["https://upload.wikimedia.org/wikipedia/commons/b/b1/Cuvier-97-Canard_colvert.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/At_Possa_da_Londra_in_the_Brazilian_Patanal_%28105m%29_-_the_weird_looking_Southern_Screamer_%28Chauna_torquata%29_-_%2824213807344%29.jpg/330px-At_Possa_da_Londra_in_the_Brazilian_Patanal_%28105m%29_-_the_weird_looking_Southern_Screamer_%28Chauna_torquata%29_-_%2824213807344%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Anseranas_semipalmata_-Edithvale_Wetland%2C_Melbourne%2C_Australia-8.jpg/330px-Anseranas_semipalmata_-Edithvale_Wetland%2C_Melbourne%2C_Australia-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7d/Wood-ducks-male-female-chicago-march-2024.jpg/330px-Wood-ducks-male-female-chicago-march-2024.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Anser_caerulescens_CT8.jpg/330px-Anser_caerulescens_CT8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1b/Black_Swans_mating_in_Lake_Burley_Griffin-2_%285549171039%29.jpg/330px-Black_Swans_mating_in_Lake_Burley_Griffin-2_%285549171039%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7b/Mute_Swan_Emsworth2.JPG/330px-Mute_Swan_Emsworth2.JPG"],"species":178,"card":5},{"name":"Neoaves","parent":"Neognathae","rank":"Clade","ipa":"","etymology":"","common":["landbirds","waterbirds","tropicbirds","swifts","hummingbirds","pigeons","flamingos","cranes","gulls","passerines"],"tag":"The most inclusive crown clade containing the house sparrow, but not the red junglefowl. These are all birds except the ratites, tinamous, and fowls; or roughly 95% of birds.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/House_Sparrow%2C_England_-_May_09.jpg/330px-House_Sparrow%2C_England_-_May_09.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/17/Accipiter_nisus_edit.jpg/330px-Accipiter_nisus_edit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg/330px-Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Pelecanus_conspicillatus_-Australia_-8.jpg/330px-Pelecanus_conspicillatus_-Australia_-8.jpg","https://upload.wikimedia.org/wikipedia/commons/2/2f/Greatbluturaco%2C_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/SNOW-PIGEON-SELA.jpg/330px-SNOW-PIGEON-SELA.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Greater_flamingo_galapagos.JPG/330px-Greater_flamingo_galapagos.JPG"],"card":1},{"name":"Mirandornithes","parent":"Neoaves","rank":"Clade","ipa":"mɪˌrændɔːrˈnɪθiːz","etymology":"","common":["flamingos","grebes"],"tag":"Specialised aquatic birds found on freshwater lakes and ponds. Includes the flamingos and grebes.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Greater_flamingo_galapagos.JPG/330px-Greater_flamingo_galapagos.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Podilymbus-podiceps-001.jpg/330px-Podilymbus-podiceps-001.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Great_Crested_Grebe_%2852909695022%29.jpg/330px-Great_Crested_Grebe_%2852909695022%29.jpg"],"card":2},{"name":"Phoenicopteriformes","parent":"Mirandornithes","rank":"Order","ipa":"","etymology":"","common":["flamingos"],"tag":"Birds with vibrant pink or reddish plumage, long legs, and uniquely shaped beaks adapted for filter feeding found in saline lakes throughout tropical and warm temperate zones.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Greater_flamingo_galapagos.JPG/330px-Greater_flamingo_galapagos.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f3/Flamingo_and_offspring.jpg/250px-Flamingo_and_offspring.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a5/Large_number_of_flamingos_at_Lake_Nakuru.jpg/330px-Large_number_of_flamingos_at_Lake_Nakuru.jpg"],"species":6,"card":6},{"name":"Podicipediformes","parent":"Mirandornithes","rank":"Order","ipa":"ˌpɒdɪsɪˈpɛdɪfɔːrmiːz","etymology":"","common":["grebes"],"tag":"Medium-sized, stocky waterbirds of lakes and marshes, well adapted to aquatic life. Some are flightless.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/89/Fuut_Podiceps_cristatus_Jos_Zwarts_5.tif/lossy-page1-318px-Fuut_Podiceps_cristatus_Jos_Zwarts_5.tif.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Flickr_-_Rainbirder_-_Great_Crested_Grebe_%28Podiceps_cristatus%29.jpg/250px-Flickr_-_Rainbirder_-_Great_Crested_Grebe_%28Podiceps_cristatus%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Podilymbus-podiceps-001.jpg/330px-Podilymbus-podiceps-001.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/eb/101_-_CLARK%27S_GREBE_%285-18-08%29_santa_margarita_lake%2C_sloco%2C_ca_%282%29_%288722134244%29.jpg/330px-101_-_CLARK%27S_GREBE_%285-18-08%29_santa_margarita_lake%2C_sloco%2C_ca_%282%29_%288722134244%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Great_Crested_Grebe_%2852909695022%29.jpg/330px-Great_Crested_Grebe_%2852909695022%29.jpg"],"species":23,"card":6},{"name":"Columbimorphae","parent":"Neoaves","rank":"Clade","ipa":"","etymology":"","common":["mesites","sandgrouse","pigeons"],"tag":"The pigeons, sandgrouse & allies.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Subdesert_Mesite.jpg/330px-Subdesert_Mesite.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/2012-namaqua-sandgrouse-male.jpg/330px-2012-namaqua-sandgrouse-male.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/SNOW-PIGEON-SELA.jpg/330px-SNOW-PIGEON-SELA.jpg"],"card":2},{"name":"Columbiformes","parent":"Columbimorphae","rank":"Order","ipa":"","etymology":"","common":["pigeons","doves","dodos"],"tag":"Stout-bodied monogomous birds with small heads, relatively short necks and slender bills. They feed largely on plant matter and are capable of drinking by sucking up water.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/41/Meyers_grosses_Konversations-Lexikon_-_ein_Nachschlagewerk_des_allgemeinen_Wissens_%281908%29_%28Antwerpener_Breiftaube%29.jpg/250px-Meyers_grosses_Konversations-Lexikon_-_ein_Nachschlagewerk_des_allgemeinen_Wissens_%281908%29_%28Antwerpener_Breiftaube%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/Oxford_Dodo_display.jpg/330px-Oxford_Dodo_display.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/ff/Treron_vernans_male_-_Kent_Ridge_Park.jpg/330px-Treron_vernans_male_-_Kent_Ridge_Park.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ae/Nicobar_Pigeon_on_the_bar.jpg/330px-Nicobar_Pigeon_on_the_bar.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/SNOW-PIGEON-SELA.jpg/330px-SNOW-PIGEON-SELA.jpg"],"species":351,"card":7},{"name":"Mesitornithiformes","parent":"Columbimorphae","rank":"Order","ipa":"","etymology":"","common":["mesites"],"tag":"Somewhat small-bodied, flightless or near flightless, somewhat shy birds endemic to Madagascar.","imgs":["https://upload.wikimedia.org/wikipedia/commons/d/d6/Monias_benschi_1912_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Subdesert_Mesite.jpg/330px-Subdesert_Mesite.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5d/White-breasted_Mesite_-_Ankarafantsika_-_Madagascar_S4E9441_%2815297364032%29.jpg/330px-White-breasted_Mesite_-_Ankarafantsika_-_Madagascar_S4E9441_%2815297364032%29.jpg"],"species":3,"card":7},{"name":"Pterocliformes","parent":"Columbimorphae","rank":"Order","ipa":"ˌtɛrəklɪfɔːrmiːz","etymology":"","common":["sandgrouse"],"tag":"Ground-dwelling birds with small, pigeon-like heads and necks and sturdy compact bodies that are restricted to treeless, open country.","imgs":["https://upload.wikimedia.org/wikipedia/commons/b/be/Pterocles_quadricinctus_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/2012-namaqua-sandgrouse-male.jpg/330px-2012-namaqua-sandgrouse-male.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/63/Burchell%27s_sandgrouse%2C_Pterocles_burchelli%2C_at_Kgalagadi_Transfrontier_Park%2C_Northern_Cape%2C_South_Africa_%2835283376362%29%2C_crop.jpg/250px-Burchell%27s_sandgrouse%2C_Pterocles_burchelli%2C_at_Kgalagadi_Transfrontier_Park%2C_Northern_Cape%2C_South_Africa_%2835283376362%29%2C_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c4/Painted_Sandgrouse_Male_%2850325876266%29.jpg/330px-Painted_Sandgrouse_Male_%2850325876266%29.jpg","https://upload.wikimedia.org/wikipedia/commons/9/91/Syrrhaptes_paradoxus_%28J%C3%A1n_Svetl%C3%ADk%29.jpg"],"species":16,"card":7},{"name":"Otidimorphae","parent":"Neoaves","rank":"Clade","ipa":"","etymology":"","common":["turacos","bustards","cuckoos"],"tag":"A clade of birds that contains the cuckoos, turacos, and bustards orders.","imgs":["https://upload.wikimedia.org/wikipedia/commons/2/2f/Greatbluturaco%2C_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Denham%27s_Bustard_%28Neotis_denhami%29_%287083219537%29.jpg/330px-Denham%27s_Bustard_%28Neotis_denhami%29_%287083219537%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Coquerel%27s_Coua%2C_crop.jpg/330px-Coquerel%27s_Coua%2C_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/74/Lesser_Roadrunner_-_Mexico_S4E1497.jpg/330px-Lesser_Roadrunner_-_Mexico_S4E1497.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Reed_warbler_cuckoo.jpg/426px-Reed_warbler_cuckoo.jpg"],"card":2},{"name":"Musophagiformes","parent":"Otidimorphae","rank":"Order","ipa":"ˌmjuːzoʊˈfædʒɪdiː","etymology":"'banana'-'eaters'","common":["turacos","loeries","plantain-eaters","go-away-birds"],"tag":"Medium to large-sized colourful birds that feed mainly of fruits, leaves, and flowers with semi-zygodactylous toes (the fourth toe can be switched back and forth).","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/88/Planches_enlumin%C3%A9es_d%27histoire_naturelle_%281765%29_%28Tauraco_persa%29.jpg/250px-Planches_enlumin%C3%A9es_d%27histoire_naturelle_%281765%29_%28Tauraco_persa%29.jpg","https://upload.wikimedia.org/wikipedia/commons/2/2f/Greatbluturaco%2C_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/Crinifer_piscator_-Lotherton_Hall%2C_West_Yorkshire%2C_England-8a.jpg/250px-Crinifer_piscator_-Lotherton_Hall%2C_West_Yorkshire%2C_England-8a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Bare-faced_Go-away-bird_RWD5.jpg/330px-Bare-faced_Go-away-bird_RWD5.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/2009-white-bellied-goaway-bird.jpg/250px-2009-white-bellied-goaway-bird.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Tauraco_fischeri.jpg/250px-Tauraco_fischeri.jpg"],"species":23,"card":8},{"name":"Otidiformes","parent":"Otidimorphae","rank":"Order","ipa":"","etymology":"","common":["bustards","floricans","korhaans"],"tag":"Elusive ground-dwelling birds adaptated to open landscapes with an elegant walk tht reluctantly fly.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Cayley_Ardeotis_australis_flipped.jpg/250px-Cayley_Ardeotis_australis_flipped.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Denham%27s_Bustard_%28Neotis_denhami%29_%287083219537%29.jpg/330px-Denham%27s_Bustard_%28Neotis_denhami%29_%287083219537%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/Bengal_Florican_Houbaropsis_bengalensis_bengalensis_%28cropped%29.jpg/250px-Bengal_Florican_Houbaropsis_bengalensis_bengalensis_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/86/Northern_black_korhaan_%28Afrotis_afraoides%29_male.jpg/250px-Northern_black_korhaan_%28Afrotis_afraoides%29_male.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Blue_Korhaan_%28Eupodotis_caerulescens%29_male.jpg/330px-Blue_Korhaan_%28Eupodotis_caerulescens%29_male.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/36/Kori_Bustard_Bushes_2019-07-26.jpg/250px-Kori_Bustard_Bushes_2019-07-26.jpg"],"species":26,"card":8},{"name":"Cuculiformes","parent":"Otidimorphae","rank":"Order","ipa":"kjuːˈkjuːlɪfɔːrmiːz","etymology":"","common":["cuckoos","roadrunners","koels","malkohas","couas","coucals","anis"],"tag":"Small to medium sized birds, slender birds, often with a long tail. Most species live in trees, with some ground-dwelling. Some species are brood parasites.","imgs":["https://upload.wikimedia.org/wikipedia/commons/1/10/British_birds_in_their_haunts_%28Cuculus_canorus%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/Cuculus_canorus_vogelartinfo.jpg/330px-Cuculus_canorus_vogelartinfo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/74/Lesser_Roadrunner_-_Mexico_S4E1497.jpg/330px-Lesser_Roadrunner_-_Mexico_S4E1497.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/41/Pacific_koel_male_kob08.JPG/250px-Pacific_koel_male_kob08.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Chestnut-breasted_Malkoha_San_Deigo_Zoo_2009.jpg/330px-Chestnut-breasted_Malkoha_San_Deigo_Zoo_2009.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Coquerel%27s_Coua%2C_crop.jpg/330px-Coquerel%27s_Coua%2C_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/97/Senegal_coucal_%28Centropus_senegalensis_senegalensis%29.jpg/250px-Senegal_coucal_%28Centropus_senegalensis_senegalensis%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/ANU-PRETO_%28Crotophaga_ani%29.jpg/250px-ANU-PRETO_%28Crotophaga_ani%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Reed_warbler_cuckoo.jpg/426px-Reed_warbler_cuckoo.jpg"],"species":150,"card":8},{"name":"Elementaves","parent":"Neoaves","rank":"Clade","ipa":"","etymology":"","common":["hoatzin","cranes","puffins","gulls","frogmouths","swifts","hummingbirds","tropicbirds","loons","albatrosses","penguins","storks","frigatebirds","boobies","pelicans","ibises"],"tag":"This clade is only proposed! The clade's name refers to the classical elements, reflecting its members' varying adaptations to earth, air, and water","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Cuvier-59-Hoazin_hupp%C3%A9.jpg/330px-Cuvier-59-Hoazin_hupp%C3%A9.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Cuvier-72-Grue_cendr%C3%A9e.jpg/250px-Cuvier-72-Grue_cendr%C3%A9e.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/Papageitaucher_Fratercula_arctica.jpg/330px-Papageitaucher_Fratercula_arctica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7f/Larus_argentatus_ad.jpg/330px-Larus_argentatus_ad.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg/330px-Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Purple-throated_carib_hummingbird_feeding.jpg/330px-Purple-throated_carib_hummingbird_feeding.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/A_Tawny_frogmouth%2C_Podargus_strigoides.jpg/330px-A_Tawny_frogmouth%2C_Podargus_strigoides.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg/330px-Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Gavia_arctica_EM1B1934_%2848009481846%29.jpg/330px-Gavia_arctica_EM1B1934_%2848009481846%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b2/Phoebastria_albatrus1.jpg/330px-Phoebastria_albatrus1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg/330px-Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Yellow-billed_Stork_%28Mycteria_ibis%29_%2812011503884%29.jpg/330px-Yellow-billed_Stork_%28Mycteria_ibis%29_%2812011503884%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Pelecanus_conspicillatus_-Australia_-8.jpg/330px-Pelecanus_conspicillatus_-Australia_-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/Magnificent-Frigate-male.jpg/330px-Magnificent-Frigate-male.jpg"],"card":2},{"name":"Opisthocomiformes","parent":"Elementaves","rank":"Order","ipa":"","etymology":"greek 'behind'-'hair'-'form'","common":["hoatzin","stinkbird"],"tag":"A tropical bird found in South America with a digestive system that ferments plant matter. The chicks have two claws on each wing.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Cuvier-59-Hoazin_hupp%C3%A9.jpg/330px-Cuvier-59-Hoazin_hupp%C3%A9.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/54/Hoatzin_%28Opisthocomus_hoazin%29_Rio_Napo.jpg/250px-Hoatzin_%28Opisthocomus_hoazin%29_Rio_Napo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Hoatzin_%28Opisthocomus_hoazin%29_head_Rio_Napo.jpg/250px-Hoatzin_%28Opisthocomus_hoazin%29_head_Rio_Napo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/57/Rurrenabaque_Bolivia_-_The_Amazon.jpg/330px-Rurrenabaque_Bolivia_-_The_Amazon.jpg"],"species":1,"card":3},{"name":"Gruiformes","parent":"Elementaves","rank":"Order","ipa":"ˈɡruːɪfɔːrmiːz","etymology":"","common":["rails","cranes","crakes","coots","flufftails","finfoots","limpkin","trumpeters","quails"],"tag":"The cranes & allies but the group is varied and many are not so crane-like. Ground-feeding and nesting birds. Many species have elaborate courtship displays and long seasonal migrations.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Cuvier-72-Grue_cendr%C3%A9e.jpg/250px-Cuvier-72-Grue_cendr%C3%A9e.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/25/Anthropoides_virgo_-Mongolia_-flying-8.jpg/330px-Anthropoides_virgo_-Mongolia_-flying-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1e/Japanse_kraanvogels_in_Akan_International_Crane_Centre%2C_-24_februari_2012_a.jpg/250px-Japanse_kraanvogels_in_Akan_International_Crane_Centre%2C_-24_februari_2012_a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5f/Grey_crowned_crane_at_Martin_Mere.JPG/250px-Grey_crowned_crane_at_Martin_Mere.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Sandhill_bare_areas.jpg/330px-Sandhill_bare_areas.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Dusky_moorhen442.jpg/330px-Dusky_moorhen442.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/69/African_Finfoot%2C_male_breeding.jpg/330px-African_Finfoot%2C_male_breeding.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/Grey-wing_Turmpeter_RWD.jpg/330px-Grey-wing_Turmpeter_RWD.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Brown_Quail.jpg/330px-Brown_Quail.jpg"],"species":188,"card":3},{"name":"Charadriiformes","parent":"Elementaves","rank":"Order","ipa":"kəˈrædri.ɪfɔːrmiːz","etymology":"","common":["sandpipers","puffins","gulls","plovers","phalaropes","stilts","jacanas","painted snipes","pratincoles","terns","seedsnipes","sheathbills","skimmers","skuas","auks","alcids","false quails"],"tag":"Small to medium-large birds that are waterbirds or birds clearly derived from waterbirds found along seacoasts and inland waters, with many called shorebirds. Most eat invertebrates or other small animals.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/D%27Orbigny-Mouette_rieuse_et_Bec-en-ciseaux_white_background.jpg/330px-D%27Orbigny-Mouette_rieuse_et_Bec-en-ciseaux_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/CURLEW%2C_LONG-BILLED_%283-22-10%29_morro_bay%2C_ca_-04_%284455146301%29.jpg/330px-CURLEW%2C_LONG-BILLED_%283-22-10%29_morro_bay%2C_ca_-04_%284455146301%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4f/Black-breasted_Button-quail_male_inskip.JPG/250px-Black-breasted_Button-quail_male_inskip.JPG","https://upload.wikimedia.org/wikipedia/commons/6/60/Reiherl%C3%A4ufer.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7f/Larus_argentatus_ad.jpg/330px-Larus_argentatus_ad.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Laridae_on_Lake_Baikal.png/330px-Laridae_on_Lake_Baikal.png","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/Stercorarius_antarcticus_-Godthul%2C_South_Georgia%2C_British_Overseas_Territories%2C_UK_-landing-8.jpg/250px-Stercorarius_antarcticus_-Godthul%2C_South_Georgia%2C_British_Overseas_Territories%2C_UK_-landing-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/Aethia_pygmaea3.jpg/250px-Aethia_pygmaea3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/Papageitaucher_Fratercula_arctica.jpg/330px-Papageitaucher_Fratercula_arctica.jpg"],"species":390,"card":3},{"name":"Strisores","parent":"Elementaves","rank":"Clade","ipa":"straɪˈsoʊriːz","etymology":"","common":["nightjars","frogmouths","swifts","hummingbirds"],"tag":"Basal members are nocturnal birds with wide beaks, a large gape, and soft cryptically-coloured plumage, that feed on the wing. Some of these qualities are lost in Apodiformes.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Lesser_Nighthawk.jpg/330px-Lesser_Nighthawk.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fb/M%C3%A3e-da-lua-gigante_%28Nyctibius_grandis%29.jpg/330px-M%C3%A3e-da-lua-gigante_%28Nyctibius_grandis%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/37/Oilbirds.jpg/330px-Oilbirds.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/A_Tawny_frogmouth%2C_Podargus_strigoides.jpg/330px-A_Tawny_frogmouth%2C_Podargus_strigoides.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Aegotheles_chrisoptus_-_Catlereigh_Nature_Reserve.jpg/250px-Aegotheles_chrisoptus_-_Catlereigh_Nature_Reserve.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg/330px-Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Purple-throated_carib_hummingbird_feeding.jpg/330px-Purple-throated_carib_hummingbird_feeding.jpg"],"card":3},{"name":"Caprimulgiformes","parent":"Strisores","rank":"Order","ipa":"ˌkæprɪˈmʌldʒɪfɔːrmiːz/ ","etymology":"","common":["nightjars"],"tag":"Often nocturnal or crepuscular hunters with a highly developed sense of sight that are known for feeding on the wing and are excellent flyers with small weak legs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/Chordeiles_acutipennis_texensisAQBIP06CA.jpg/330px-Chordeiles_acutipennis_texensisAQBIP06CA.jpg","https://upload.wikimedia.org/wikipedia/commons/2/28/Mlongipennis.png","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Lesser_Nighthawk.jpg/330px-Lesser_Nighthawk.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/01/Great_Eared-Nightjar%2C_Tangkoko%2C_Sulawesi_%285799113025%29_%282%29.jpg/250px-Great_Eared-Nightjar%2C_Tangkoko%2C_Sulawesi_%285799113025%29_%282%29.jpg"],"species":100,"card":9},{"name":"Nyctibiiformes","parent":"Strisores","rank":"Order","ipa":"","etymology":"","common":["potoos","poor-me-ones"],"tag":"Nocturnal insectivores that lack the bristles around the mouth found in the true nightjars that are found in central and south America. They hunt from a perch and during the day they perch upright camouflaged on tree stumps.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/NyctibiusBracteatusSmit.jpg/330px-NyctibiusBracteatusSmit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/79/Northern_potoo_%28Nyctibius_jamaicensis_mexicanus%29_Orange_Walk.jpg/250px-Northern_potoo_%28Nyctibius_jamaicensis_mexicanus%29_Orange_Walk.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fb/M%C3%A3e-da-lua-gigante_%28Nyctibius_grandis%29.jpg/330px-M%C3%A3e-da-lua-gigante_%28Nyctibius_grandis%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Nyctibius_griseus_471885191_27f931630d_o_Crop.jpg/250px-Nyctibius_griseus_471885191_27f931630d_o_Crop.jpg"],"species":7,"card":9},{"name":"Steatornithiformes","parent":"Strisores","rank":"Order","ipa":"","etymology":"","common":["oilbirds"],"tag":"Nocturnal forager with specially adapted eyesight that also echolocate, eat fruit and nesting in colonies in caves. They are found in northern South America.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Steatornis_caripensis_MHNT_ZON_STEA_1.jpg/330px-Steatornis_caripensis_MHNT_ZON_STEA_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/37/Oilbirds.jpg/330px-Oilbirds.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Oilbird_%2817370415445%29.jpg/330px-Oilbird_%2817370415445%29.jpg"],"species":1,"card":9},{"name":"Podargiformes","parent":"Strisores","rank":"Order","ipa":"","etymology":"","common":["frogmouths"],"tag":"Nocturnal birds with weak flight from Australasia with large flattened hooked bill and huge frog-like gape that they use to eat insects and small invertebrates. During the day they rest camouflaged on branches.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Batrachostomus_septimus_01.jpg/250px-Batrachostomus_septimus_01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/44/Tawny_frogmouth_wholebody444.jpg/330px-Tawny_frogmouth_wholebody444.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/82/Pair_of_tawny_frogmouths.jpg/250px-Pair_of_tawny_frogmouths.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/A_Tawny_frogmouth%2C_Podargus_strigoides.jpg/330px-A_Tawny_frogmouth%2C_Podargus_strigoides.jpg"],"species":16,"card":9},{"name":"Aegotheliformes","parent":"Strisores","rank":"Order","ipa":" ˈstraɪsərz","etymology":"","common":["owlet-nightjars"],"tag":"Small birds that feed on insects at twilight that are found in Australasia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Aegotheles_savesi.jpg/250px-Aegotheles_savesi.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7f/Barred_Owlet-Nightjar.jpg/250px-Barred_Owlet-Nightjar.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Aegotheles_chrisoptus_-_Catlereigh_Nature_Reserve.jpg/250px-Aegotheles_chrisoptus_-_Catlereigh_Nature_Reserve.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0d/Australian_owlet-nightjar_A22I9928.jpg/330px-Australian_owlet-nightjar_A22I9928.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ee/Feline_Owlet-nightjar_0A2A6959.jpg/330px-Feline_Owlet-nightjar_0A2A6959.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/Moluccan_Owlet-nightjar_0A2A8326.jpg/330px-Moluccan_Owlet-nightjar_0A2A8326.jpg"],"species":10,"card":9},{"name":"Apodiformes","parent":"Strisores","rank":"Order","ipa":"ˈæpədɪfɔːrmiːz","etymology":"greek 'footless'","common":["swifts","treeswifts","hummingbirds"],"tag":"Small to very small birds with a specialized wing morphology that feed while flying.","imgs":["https://upload.wikimedia.org/wikipedia/commons/4/41/White-eared_Hummingbird_%28Basilinna_leucotis%29_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/7/78/Flickr_-_Rainbirder_-_Chestnut-collared_Swift_%28Streptoprocne_rutila%29_on_the_nest.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg/330px-Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg","https://upload.wikimedia.org/wikipedia/commons/1/16/Apus_apus_flock_flying_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/Grey_Rumped_Treeswift.jpg/250px-Grey_Rumped_Treeswift.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/Moustached_Treeswift_%28Hemiprocne_mystacea%29_-_Flickr_-_Lip_Kee.jpg/250px-Moustached_Treeswift_%28Hemiprocne_mystacea%29_-_Flickr_-_Lip_Kee.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f3/Archilochus_colubris_%28Male%29.jpg/330px-Archilochus_colubris_%28Male%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Purple-throated_carib_hummingbird_feeding.jpg/330px-Purple-throated_carib_hummingbird_feeding.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b5/Rufous_Hummingbird%2C_male_01.jpg/330px-Rufous_Hummingbird%2C_male_01.jpg"],"species":497,"card":9},{"name":"Eurypygimorphae","parent":"Elementaves","rank":"Clade","ipa":"","etymology":"","common":["tropicbirds","sunbittern","kagu"],"tag":"The least inclusive crown clade containing the red-billed tropicbird, the sunbittern, and the kagu.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg/330px-Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3a/Eurypyga_helias_-Smithsonian_National_Zoological_Park%2C_USA-8.jpg/330px-Eurypyga_helias_-Smithsonian_National_Zoological_Park%2C_USA-8.jpg"],"species":2,"card":3},{"name":"Phaethontiformes","parent":"Eurypygimorphae","rank":"Order","ipa":"ˌfeɪ.ɪˈθɒntɪfɔːrmiːz","etymology":"","common":["tropicbirds"],"tag":"Seabirds with elongated tail feathers.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg/330px-Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Starr_080612-8667_Calophyllum_inophyllum.jpg/330px-Starr_080612-8667_Calophyllum_inophyllum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/47/Red-tailed_Tropicbird_RWD2.jpg/330px-Red-tailed_Tropicbird_RWD2.jpg"],"species":3,"card":10},{"name":"Eurypygiformes","parent":"Eurypygimorphae","rank":"Order","ipa":"","etymology":"","common":["sunbittern","kagu"],"tag":"Medium-sized, almost flightless, non-migratory birds.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e7/Cuvier-72-Caurale_soleil.jpg/330px-Cuvier-72-Caurale_soleil.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3a/Eurypyga_helias_-Smithsonian_National_Zoological_Park%2C_USA-8.jpg/330px-Eurypyga_helias_-Smithsonian_National_Zoological_Park%2C_USA-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c6/Kagu_0A2A3521.jpg/330px-Kagu_0A2A3521.jpg"],"species":2,"card":10},{"name":"Aequornithes","parent":"Elementaves","rank":"Clade","ipa":"","etymology":"","common":["loons","albatrosses","penguins","storks","frigatebirds","boobies","pelicans","ibises"],"tag":"Core waterbirds. The least inclusive crown clade containing the great white pelican and the common loon.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/0e/Pelican_Safari_Park.jpg/250px-Pelican_Safari_Park.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Gavia_immer_-Minocqua%2C_Wisconsin%2C_USA_-swimming-8.jpg/330px-Gavia_immer_-Minocqua%2C_Wisconsin%2C_USA_-swimming-8.jpg"],"card":3},{"name":"Gaviiformes","parent":"Aequornithes","rank":"Order","ipa":"ˈɡævi.ɪfɔːrmiːz","etymology":"","common":["loons","divers"],"tag":"Waterbirds that breed beside lakes and ponds in arctic and subarctic latitudes of North America.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/IJsduiker_Gavia_immer_Jos_Zwarts.tif/lossy-page1-320px-IJsduiker_Gavia_immer_Jos_Zwarts.tif.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Gavia_immer_-Osgood_Pond%2C_New_York%2C_USA_-nest-8a.jpg/330px-Gavia_immer_-Osgood_Pond%2C_New_York%2C_USA_-nest-8a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Gavia_immer_-Minocqua%2C_Wisconsin%2C_USA_-swimming-8.jpg/330px-Gavia_immer_-Minocqua%2C_Wisconsin%2C_USA_-swimming-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e8/Red-throated_Loon_%28Gavia_stellata%29_-_Summer_plumage_breeding_adult2.jpg/250px-Red-throated_Loon_%28Gavia_stellata%29_-_Summer_plumage_breeding_adult2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Gavia_arctica_EM1B1934_%2848009481846%29.jpg/330px-Gavia_arctica_EM1B1934_%2848009481846%29.jpg"],"species":5,"card":11},{"name":"Procellariiformes","parent":"Aequornithes","rank":"Order","ipa":"prɒsɛˈlɛəri.ɪfɔːrmiːz","etymology":"latin 'storm'-'order'","common":["petrels","albatrosses","shearwaters"],"tag":"Medium to large seabirds that feed in the open ocean, travel long distances and are often known as tubenoses. They tend to form monogamous bonds and nest on remote islands.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Thalassarche_chlororhynchos_1838.jpg/250px-Thalassarche_chlororhynchos_1838.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Giant_petrel_-_Macronectes_giganteus.jpg/330px-Giant_petrel_-_Macronectes_giganteus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f2/Shearwater_migrant_flock.jpg/250px-Shearwater_migrant_flock.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b5/Diomedea_epomophora_portrait_-_SE_Tasmania.jpg/330px-Diomedea_epomophora_portrait_-_SE_Tasmania.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b2/Phoebastria_albatrus1.jpg/330px-Phoebastria_albatrus1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c4/Diomedea_exulans_in_flight_-_SE_Tasmania.jpg/330px-Diomedea_exulans_in_flight_-_SE_Tasmania.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8e/Oceanodroma_furcata1.jpg/330px-Oceanodroma_furcata1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Grey-backed_Storm_Petrel_0A2A8780.jpg/330px-Grey-backed_Storm_Petrel_0A2A8780.jpg"],"species":147,"card":11},{"name":"Sphenisciformes","parent":"Aequornithes","rank":"Order","ipa":"sfɪˈnɪsəfɔːrmiːz","etymology":"","common":["penguins"],"tag":"Flightless seabirds with wings adapted to swimming and most species native to cool southern hemisphere waters.","imgs":["https://upload.wikimedia.org/wikipedia/commons/7/78/Chinstrap_Penguin_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/Aptenodytes_forsteri_-Snow_Hill_Island%2C_Antarctica_-adults_and_juvenile-8.jpg/250px-Aptenodytes_forsteri_-Snow_Hill_Island%2C_Antarctica_-adults_and_juvenile-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/South_Shetland-2016-Deception_Island%E2%80%93Chinstrap_penguin_%28Pygoscelis_antarctica%29_04.jpg/250px-South_Shetland-2016-Deception_Island%E2%80%93Chinstrap_penguin_%28Pygoscelis_antarctica%29_04.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Snares_Penguin_%28Eudyptes_robustus%29_-group.jpg/330px-Snares_Penguin_%28Eudyptes_robustus%29_-group.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/63/African_penguin_side_profile.jpg/250px-African_penguin_side_profile.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/Falkland_Islands_Penguins_70.jpg/330px-Falkland_Islands_Penguins_70.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg/330px-Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg"],"species":18,"card":11},{"name":"Ciconiiformes","parent":"Aequornithes","rank":"Order","ipa":"sɪˈkoʊni.ɪfɔːrmiːz","etymology":"","common":["storks"],"tag":"Long-legged and often long necked birds adapted for wading and capturing animal foods and usually fly by soaring.","imgs":["https://upload.wikimedia.org/wikipedia/commons/d/d1/Wei%C3%9Fstorch_%28Ciconia_ciconia%29_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/06/Ringed_white_stork.jpg/250px-Ringed_white_stork.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/06/Dvorac_Bisag_-_roda.jpg/250px-Dvorac_Bisag_-_roda.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1a/African_openbill%2C_Anastomus_lamelligerus%2C_Chobe_National_Park%2C_Botswana_%2832390774275%29.jpg/330px-African_openbill%2C_Anastomus_lamelligerus%2C_Chobe_National_Park%2C_Botswana_%2832390774275%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Abdim%27s_Stork_%28Ciconia_abdimii%29_%287011390701%29.jpg/330px-Abdim%27s_Stork_%28Ciconia_abdimii%29_%287011390701%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Yellow-billed_Stork_%28Mycteria_ibis%29_%2812011503884%29.jpg/330px-Yellow-billed_Stork_%28Mycteria_ibis%29_%2812011503884%29.jpg"],"species":19,"card":11},{"name":"Suliformes","parent":"Aequornithes","rank":"Order","ipa":"ˈsjuːlɪfɔːrmiːz","etymology":"","common":["frigatebirds","gannets","cormorants","darters","totipalmate","shags","anhingas","boobies"],"tag":"Pelagic piscivores of tropical oceans. They obtain food on the wing and can stay airborne for long periods.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c7/Cormorant_in_Strunjan%2C_white_background.png/330px-Cormorant_in_Strunjan%2C_white_background.png","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Brown_boobytern.JPG/250px-Brown_boobytern.JPG","https://upload.wikimedia.org/wikipedia/commons/5/59/Northern_Gannet_2006_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7f/Lamberts_Bay_P1010338.JPG/330px-Lamberts_Bay_P1010338.JPG","https://upload.wikimedia.org/wikipedia/commons/9/9d/Fou.varie1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Fregata_magnificens_-Galapagos%2C_Ecuador_-male-8_%281%29.jpg/330px-Fregata_magnificens_-Galapagos%2C_Ecuador_-male-8_%281%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/Magnificent-Frigate-male.jpg/330px-Magnificent-Frigate-male.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Little_cormorant_%28Microcarbo_niger%29_-_20070322.jpg/250px-Little_cormorant_%28Microcarbo_niger%29_-_20070322.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Phalacrocorax_atriceps%2C_Beagle_Channel.jpg/250px-Phalacrocorax_atriceps%2C_Beagle_Channel.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Anhinga_rufa_-Chobe_River_front%2C_Botswana-8.jpg/250px-Anhinga_rufa_-Chobe_River_front%2C_Botswana-8.jpg"],"species":61,"card":11},{"name":"Pelecaniformes","parent":"Aequornithes","rank":"Order","ipa":"pɛlɪˈkænɪfɔːrmiːz","etymology":"","common":["pelicans","herons","ibises","spoonbills","bitterns","hammerkop","shoebills"],"tag":"Medium to large sized aquatic birds that eat fish or squid and have all four toes webbed. Most members have distensible bare throat patch between the branches of the lower mandible.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Spot-billed_pelican_takeoff_white_background.jpg/250px-Spot-billed_pelican_takeoff_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Scarlet_ibis_arp.jpg/250px-Scarlet_ibis_arp.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c1/Black-headed_Ibis_%28Threskiornis_melanocephalus%29.jpg/330px-Black-headed_Ibis_%28Threskiornis_melanocephalus%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Yellow_Bittern_hunting.jpg/330px-Yellow_Bittern_hunting.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bc/Goliath_heron_standing_cropped.jpg/250px-Goliath_heron_standing_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e6/Heron_tricol_01.JPG/330px-Heron_tricol_01.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/1/11/Hamerkop_%28Scopus_umbretta_umbretta%29_2.jpg/250px-Hamerkop_%28Scopus_umbretta_umbretta%29_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c0/Balaeniceps_rex.jpg/250px-Balaeniceps_rex.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/Pelikan_Walvis_Bay.jpg/330px-Pelikan_Walvis_Bay.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Pelecanus_conspicillatus_-Australia_-8.jpg/330px-Pelecanus_conspicillatus_-Australia_-8.jpg"],"species":118,"card":11},{"name":"Telluraves","parent":"Neoaves","rank":"Clade","ipa":"","etymology":"","common":["owls","raptors","mousebirds","kingfishers","woodpeckers","toucans","falcons","parrots","passerines"],"tag":"Core landbirds. The least inclusive crown clade containing the northern sparrowhawk and the house sparrow.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/17/Accipiter_nisus_edit.jpg/330px-Accipiter_nisus_edit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/House_Sparrow%2C_England_-_May_09.jpg/330px-House_Sparrow%2C_England_-_May_09.jpg"],"species":0,"card":2},{"name":"Afroaves","parent":"Telluraves","rank":"Clade","ipa":"","etymology":"","common":["owls","raptors","mousebirds","kingfishers","woodpeckers","toucans"],"tag":"The least inclusive crown clade containing the northern sparrowhawk, white-backed mousebird and European green woodpecker but not the house sparrow.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/17/Accipiter_nisus_edit.jpg/330px-Accipiter_nisus_edit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0a/Colius_White-backed_mousebird_feeding_on_Duranta_berries_9860s.jpg/250px-Colius_White-backed_mousebird_feeding_on_Duranta_berries_9860s.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c5/European_green_woodpecker_%28Picus_viridis%29_female_Barnes.jpg/250px-European_green_woodpecker_%28Picus_viridis%29_female_Barnes.jpg"],"card":12},{"name":"Strigiformes","parent":"Afroaves","rank":"Order","ipa":"ˈstrɪdʒəfɔːrmiːz","etymology":"","common":["owls"],"tag":"Solitary, nocturnal birds of prey occupying all regions of earth except Antarctica. Rounded heads with large eyes; upright stance; feathers adapted for silent flight; legs and toes often feathered; hunt mostly small mammals, insects.","imgs":["https://upload.wikimedia.org/wikipedia/commons/e/e7/Cuvier-12-Hibou_%C3%A0_huppe_courte.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Pulsatrix_perspicillata.jpg/250px-Pulsatrix_perspicillata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/76/Coruja-de-crista_%28Lophostrix_cristata%29.jpg/250px-Coruja-de-crista_%28Lophostrix_cristata%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Eastern_Screech_Owl.jpg/250px-Eastern_Screech_Owl.jpg","https://upload.wikimedia.org/wikipedia/commons/4/49/Ceylon_Bay_Owl1_Abhilash_Arjunan.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Harfang_en_vol_1.jpg/330px-Harfang_en_vol_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ae/SpottedEagleOwl2539MGEyeLid.jpg/250px-SpottedEagleOwl2539MGEyeLid.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/39/Owl_sleeping_in_tree.jpg/250px-Owl_sleeping_in_tree.jpg"],"species":255,"card":12},{"name":"Accipitriformes","parent":"Afroaves","rank":"Order","ipa":"ækˌsɪpɪtrɪˈfɔːrmiːz","etymology":"latin 'hawk'-'form'","common":["raptors","hawks","eagles","vultures","harriers","kites","ospreys","secretarybirds"],"tag":"Diurnal birds of prey with a sharply hooked bill, wings optimised for souring and sharp curved talons. Female can be up to twice as large. ","imgs":["https://upload.wikimedia.org/wikipedia/commons/b/b2/Golden_Eagle_Illustration_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Wedge_tailed_eagle_in_flight04.jpg/330px-Wedge_tailed_eagle_in_flight04.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ea/Circus_aeruginosus_Valencia_3.jpeg/330px-Circus_aeruginosus_Valencia_3.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Red-tailed_Hawk.jpg/250px-Red-tailed_Hawk.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Milvus_milvus_Jura.jpg/330px-Milvus_milvus_Jura.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/77/Gyps_africanus_Torgos_tracheliotus.jpg/330px-Gyps_africanus_Torgos_tracheliotus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ae/Osprey_at_Shadow_Mountain_Lake%2C_CO_8-27-12_%288054292660%29.jpg/250px-Osprey_at_Shadow_Mountain_Lake%2C_CO_8-27-12_%288054292660%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Osprey_with_its_nest.jpg/330px-Osprey_with_its_nest.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/59/Greater_Yellow-headed_Vulture_%28Cathartes_melambrotus%29_in_flight_from_below.jpg/330px-Greater_Yellow-headed_Vulture_%28Cathartes_melambrotus%29_in_flight_from_below.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a6/Urubu_a_tete_rouge_-_Turkey_Vulture.jpg/250px-Urubu_a_tete_rouge_-_Turkey_Vulture.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bd/Sagittarius_serpentarius_Sekret%C3%A4r.JPG/250px-Sagittarius_serpentarius_Sekret%C3%A4r.JPG"],"species":266,"card":12},{"name":"Coraciimorphae","parent":"Afroaves","rank":"Clade","ipa":"","etymology":"","common":["mousebirds","trogons","hornbills","kingfishers","woodpeckers","toucans"],"tag":"A diversified clade of predominantly diurnal and arboreal birds.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Fishing_-_Alcedo_atthis%2C_crop.jpg/250px-Fishing_-_Alcedo_atthis%2C_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c2/Toco_toucan_-_panoramio_-_Basa_Roland.jpg/330px-Toco_toucan_-_panoramio_-_Basa_Roland.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4a/Abyssinian_Ground_Hornbill_RWD3.jpg/330px-Abyssinian_Ground_Hornbill_RWD3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/69/Harpactes_erythrocephalus_-_Khao_Yai.jpg/250px-Harpactes_erythrocephalus_-_Khao_Yai.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dc/Male_cuckoo_roller.jpg/250px-Male_cuckoo_roller.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/60/Urocolius_macrourus-20090110B.jpg/250px-Urocolius_macrourus-20090110B.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/PileatedWoodpeckerFeedingonTree%2C_crop.jpg/250px-PileatedWoodpeckerFeedingonTree%2C_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Dacelo_novaeguineae_waterworks.jpg/330px-Dacelo_novaeguineae_waterworks.jpg"],"card":12},{"name":"Coliiformes","parent":"Coraciimorphae","rank":"Order","ipa":"","etymology":"","common":["mousebirds"],"tag":"Slender greyish or brown birds with soft, hairlike body feathers with pamprodactyl feet found in sub-Saharan Africa. They are arboreal and scurry through the leaves like rodents, in search of berries, fruit and buds.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/89/ColiusCastanonotusKeulemans.jpg/250px-ColiusCastanonotusKeulemans.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/60/Urocolius_macrourus-20090110B.jpg/250px-Urocolius_macrourus-20090110B.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Colius_striatus1.jpg/330px-Colius_striatus1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/White-headed_Mousebird_-_Samburu_NH8O5520.jpg/250px-White-headed_Mousebird_-_Samburu_NH8O5520.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/62/Red-faced_Mousebird_Urocolius_indicus_in_flight_2012_05_08_6358t.JPG/330px-Red-faced_Mousebird_Urocolius_indicus_in_flight_2012_05_08_6358t.JPG"],"species":6,"card":13},{"name":"Leptosomiformes","parent":"Coraciimorphae","rank":"Order","ipa":"lɛptoʊˈsɒmɪdiː","etymology":"","common":["cuckoo roller"],"tag":"A medium-large sexually dichromatic bird with zygodactyl feet that feeds on vertebrates and insects. It nests in tree cavities and is found in forests and woodlands of Madagascar and the Comoro Islands.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/Leptosomus_discolor_-_1825-1834_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28cropped%29.tif/lossy-page1-200px-Leptosomus_discolor_-_1825-1834_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28cropped%29.tif.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/Leptosomusdiscolorcrop.jpg/250px-Leptosomusdiscolorcrop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dc/Male_cuckoo_roller.jpg/250px-Male_cuckoo_roller.jpg"],"species":1,"card":13},{"name":"Trogoniformes","parent":"Coraciimorphae","rank":"Order","ipa":"","etymology":"","common":["trogons","quetzals"],"tag":"Birds that live in tropical forests worldwide that nest in holes dug into trees or termite nests. They feed on insects and fruit, have distinct male and female plumage, and a heterodactyl toe arrangement.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Harpactes_fasciatus_1838_white_background.jpg/250px-Harpactes_fasciatus_1838_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/34/PhilippineTrogonFemale.jpg/250px-PhilippineTrogonFemale.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f2/Javan_Trogon_%28Harpactes_reinwardtii_reinwardtii%29.jpg/330px-Javan_Trogon_%28Harpactes_reinwardtii_reinwardtii%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/Quetzal01.jpg/250px-Quetzal01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Priotelus_temnurus_-Matanzas_Province%2C_Cuba-8.jpg/250px-Priotelus_temnurus_-Matanzas_Province%2C_Cuba-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/69/Harpactes_erythrocephalus_-_Khao_Yai.jpg/250px-Harpactes_erythrocephalus_-_Khao_Yai.jpg"],"species":43,"card":13},{"name":"Bucerotiformes","parent":"Coraciimorphae","rank":"Order","ipa":"bjuːˈsɛrətɪfɔːrmiːz","etymology":"","common":["hornbills","hoopoes"],"tag":"Medium to large birds many with bright beaks and others with large curved beaks. Some species wall the female into a tree cavity while she incubates the eggs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/c/cf/A_monograph_of_the_Bucerotid%C3%A6%2C_or_family_of_the_hornbills_%28Plate_II%29_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Common_Scimitar-bill_01.jpg/330px-Common_Scimitar-bill_01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4f/Hoopoe_with_insect.jpg/250px-Hoopoe_with_insect.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4a/Abyssinian_Ground_Hornbill_RWD3.jpg/330px-Abyssinian_Ground_Hornbill_RWD3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/eb/Southern_Ground-hornbill_%28Bucorvus_leadbeateri%29_-side_beak_open.jpg/330px-Southern_Ground-hornbill_%28Bucorvus_leadbeateri%29_-side_beak_open.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c0/Great_hornbill_%28Buceros_bicornis%29_Photograph_by_Shantanu_Kuveskar.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8e/Malabar_Grey_Hornbill_DSCN8046.jpg/330px-Malabar_Grey_Hornbill_DSCN8046.jpg"],"species":74,"card":13},{"name":"Coraciiformes","parent":"Coraciimorphae","rank":"Order","ipa":"","etymology":"","common":["kingfishers","kookaburras","rollers","bee-eaters","rollers","todies","motmots"],"tag":"Colourful birds with syndactyly toes and usually bright plumage often eating either fish or insects. Most nest in cavities or mud banks.","imgs":["https://upload.wikimedia.org/wikipedia/commons/5/5f/Cuvier-46-Martin-p%C3%AAcheur_d%27Europe.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/European_roller.jpg/330px-European_roller.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Dacelo_novaeguineae_waterworks.jpg/330px-Dacelo_novaeguineae_waterworks.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Fishing_-_Alcedo_atthis%2C_crop.jpg/250px-Fishing_-_Alcedo_atthis%2C_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a6/Ein_Eisvogel_im_Schwebflug.jpg/330px-Ein_Eisvogel_im_Schwebflug.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b6/Nyctyornis_amictus_-_Kaeng_Krachan.jpg/250px-Nyctyornis_amictus_-_Kaeng_Krachan.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/16/Blue-throated_Roller_from_Canopy_Walkway_-_Kakum_NP_-_Ghana_14_S4E1636_%2816011512580%29.jpg/250px-Blue-throated_Roller_from_Canopy_Walkway_-_Kakum_NP_-_Ghana_14_S4E1636_%2816011512580%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Blue-crowned_Motmot_back_2.jpg/250px-Blue-crowned_Motmot_back_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/75/Jamaican_tody_%28Todus_todus%29.jpg/250px-Jamaican_tody_%28Todus_todus%29.jpg"],"species":184,"card":13},{"name":"Piciformes","parent":"Coraciimorphae","rank":"Order","ipa":"ˈpɪsɪfɔːrmiːz","etymology":"","common":["woodpeckers","honeyguides","toucans","barbets","jacamars","puffbirds","nunbirds"],"tag":"Arboreal insectivorous birds with a peculiar arrangement of the tendons of the toes. Nearly all have zygodactyl feet—two with toes forward and two back.","imgs":["https://upload.wikimedia.org/wikipedia/commons/c/c6/Dendrocopos_major_-Durham%2C_England_-female-8_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/Red-headed_barbet_%28Eubucco_bourcierii_aequatorialis%29_male_Paz_de_las_Aves.jpg/330px-Red-headed_barbet_%28Eubucco_bourcierii_aequatorialis%29_male_Paz_de_las_Aves.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c2/Toco_toucan_-_panoramio_-_Basa_Roland.jpg/330px-Toco_toucan_-_panoramio_-_Basa_Roland.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ad/Flickr_-_Rainbirder_-_Scaly-throated_Honeyguide_%28Indicator_variegatus%29.jpg/504px-Flickr_-_Rainbirder_-_Scaly-throated_Honeyguide_%28Indicator_variegatus%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/60/Rufous-tailed_jacamar_%28Galbula_ruficauda%29_male_2.JPG/250px-Rufous-tailed_jacamar_%28Galbula_ruficauda%29_male_2.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Lanceolated_Monklet_%28Micromonacha_lanceolata%29.jpg/250px-Lanceolated_Monklet_%28Micromonacha_lanceolata%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/Monasa_atra_-_Black_nunbird.JPG/330px-Monasa_atra_-_Black_nunbird.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/PileatedWoodpeckerFeedingonTree%2C_crop.jpg/250px-PileatedWoodpeckerFeedingonTree%2C_crop.jpg"],"species":449,"card":13},{"name":"Australaves","parent":"Telluraves","rank":"Clade","ipa":"","etymology":"'southern birds'","common":["falcons","parrots","passerines"],"tag":"The least inclusive crown clade containing the crested seriema and the house sparrow. Members are altricial (young are underdeveloped at the time of birth).","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/Cariama_cristata_-near_Goiania%2C_Goias%2C_Brazil-8.jpg/330px-Cariama_cristata_-near_Goiania%2C_Goias%2C_Brazil-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/House_sparrow_male_in_Prospect_Park_%2853532%29.jpg/330px-House_sparrow_male_in_Prospect_Park_%2853532%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/House_Sparrow%2C_England_-_May_09.jpg/330px-House_Sparrow%2C_England_-_May_09.jpg"],"card":12},{"name":"Cariamiformes","parent":"Australaves","rank":"Order","ipa":"","etymology":"","common":["seriemas","terror birds"],"tag":"Primarily flightless birds that are basal to the rest of Australaves.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Cariama_cristata_1838_white_background.jpg/250px-Cariama_cristata_1838_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/79/Seriema_de_Perna_Vermelha_I.jpg/250px-Seriema_de_Perna_Vermelha_I.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a7/Black-legged_seriema_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/97/Skeleton_of_Titanis_at_the_Florida_Museum_of_Natural_History.jpg/330px-Skeleton_of_Titanis_at_the_Florida_Museum_of_Natural_History.jpg"],"species":2,"card":14},{"name":"Falconiformes","parent":"Australaves","rank":"Order","ipa":"fælˈkɒnɪˌfɔːrmiːz","etymology":"","common":["falcons","caracaras","kestrels"],"tag":"Diurnal birds of prey. Male is often considerably smaller than the female. They are highly adept fliers and hunters.","imgs":["https://upload.wikimedia.org/wikipedia/commons/4/4e/NewZealandFalconBuller_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/39/Brown-Falcon%2C-Vic%2C-3.1.2008.jpg/250px-Brown-Falcon%2C-Vic%2C-3.1.2008.jpg","https://upload.wikimedia.org/wikipedia/commons/e/e4/Falco_vespertinus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/61/Lachfalke.jpg/250px-Lachfalke.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Ave_Carcar%C3%A1.jpg/330px-Ave_Carcar%C3%A1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/Common_kestrel_falco_tinnunculus.jpg/250px-Common_kestrel_falco_tinnunculus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Black_Caracara_-_Chupacacao_Negro_%28Daptrius_ater%29_%2814909975447%29_%28cropped%29.jpg/250px-Black_Caracara_-_Chupacacao_Negro_%28Daptrius_ater%29_%2814909975447%29_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Caracara_cheriway_-Brevard_Zoo-8a.jpg/330px-Caracara_cheriway_-Brevard_Zoo-8a.jpg"],"species":65,"card":14},{"name":"Psittaciformes","parent":"Australaves","rank":"Order","ipa":"","etymology":"","common":["parrots","parakeets","macaws","cockatoos","lorikeets","budgerigar"],"tag":"Birds with a strong curved beak, upright stance, and strong zygodactyl feet (two toes facing forward and two back) that are known for their vocal ability and intelligence.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/2f/Pyrrhura_lucianii_-_Castelnau_2.jpg/250px-Pyrrhura_lucianii_-_Castelnau_2.jpg","https://upload.wikimedia.org/wikipedia/commons/a/aa/Sirocco_full_length_portrait.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5f/Kea.jpg/250px-Kea.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c2/Rainbow_lorikeet.jpg/250px-Rainbow_lorikeet.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f5/Melopsittacus_undulatus_%2824082227505%29.jpg/330px-Melopsittacus_undulatus_%2824082227505%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Psittrichas_fulgidus_-Jurong_Bird_Park-8a.jpg/250px-Psittrichas_fulgidus_-Jurong_Bird_Park-8a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/Ara_ararauna_Luc_Viatour.jpg/330px-Ara_ararauna_Luc_Viatour.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/27/Congo_African_Grey_Parrot_-head_detail.jpg/330px-Congo_African_Grey_Parrot_-head_detail.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/61/Cacatua_galerita_-perching_on_branch_-crest-8a-2c.jpg/250px-Cacatua_galerita_-perching_on_branch_-crest-8a-2c.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c6/Kaka-Parrots.jpg"],"species":403,"card":14},{"name":"Passeriformes","parent":"Australaves","rank":"Order","ipa":"ˈpæsərɪfɔːrmiːz","etymology":"Latin 'sparrow'-'shaped'","common":["passerines","sparrows","martins","treecreepers","bowerbirds","wrens","honeyeaters","warblers","babblers","shrikes","larks","ifrits","birds-of-paradise","crows","ravens","jays","magpies"],"tag":"A diverse and rich assemblage of mostly small land birds with strong feet for perching and grabbing branches.","imgs":["https://upload.wikimedia.org/wikipedia/commons/5/50/Cuvier-33-Moineau_domestique.jpg","https://upload.wikimedia.org/wikipedia/commons/e/ed/Rock_wren.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9d/Gymnopithys-leucaspis-001_edit2.jpg/250px-Gymnopithys-leucaspis-001_edit2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6a/Flickr_-_Rainbirder_-_Long-tailed_Manakin_%28Chiroxiphia_linearis%29.jpg/500px-Flickr_-_Rainbirder_-_Long-tailed_Manakin_%28Chiroxiphia_linearis%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0e/Turca%2C_Alto_del_Naranjo_01nov14_.jpg/250px-Turca%2C_Alto_del_Naranjo_01nov14_.jpg","https://upload.wikimedia.org/wikipedia/commons/c/cd/Yellow_bellied_Asity12.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ae/Superb_lyrbird_in_scrub.jpg/330px-Superb_lyrbird_in_scrub.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a1/Brown_Treecreeper.jpg/250px-Brown_Treecreeper.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4b/Vogelkop_Bowerbird_Bower_1099.jpg/330px-Vogelkop_Bowerbird_Bower_1099.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/01/Acanthorhynchus_tenuirostris_female.jpg/330px-Acanthorhynchus_tenuirostris_female.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Ribbon-tailed_Astrapia.jpg/250px-Ribbon-tailed_Astrapia.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Paradisaea_raggiana_23zz.jpg/330px-Paradisaea_raggiana_23zz.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a9/Corvus_corone_-near_Canford_Cliffs%2C_Poole%2C_England-8.jpg/250px-Corvus_corone_-near_Canford_Cliffs%2C_Poole%2C_England-8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/Towerrabe.png/250px-Towerrabe.png","https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Cracticus_tibicen_hypoleuca_male_domain.jpg/250px-Cracticus_tibicen_hypoleuca_male_domain.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Blue_jay_in_PP_%2830960%29.jpg/250px-Blue_jay_in_PP_%2830960%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/Helmet_vanga_%28Euryceros_prevostii%29.jpg/330px-Helmet_vanga_%28Euryceros_prevostii%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a8/Cliff_Swallow-27527-2.jpg/330px-Cliff_Swallow-27527-2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Pseudhirundo_griseopyga_Sharpe_%28cropped%29.jpg/330px-Pseudhirundo_griseopyga_Sharpe_%28cropped%29.jpg"],"species":6533,"card":14}],{},{"250px-2009-white-bellied-goaway-bird.jpg":[250,394,"#8d8b88"],"250px-ANU-PRETO_(Crotophaga_ani).jpg":[250,366,"#6d81a7"],"250px-Aegotheles_chrisoptus_-_Catlereigh_Nature_Reserve.jpg":[250,250,"#7f6f5c"],"250px-Aegotheles_savesi.jpg":[250,375,"#bfbbb2"],"250px-Aethia_pygmaea3.jpg":[250,377,"#3b5669"],"250px-African_penguin_side_profile.jpg":[250,274,"#726f6c"],"250px-Anhinga_rufa_-Chobe_River_front,_Botswana-8.jpg":[250,376,"#7e837b"],"250px-Aptenodytes_forsteri_-Snow_Hill_Island,_Antarctica_-adults_and_juvenile-8.jpg":[250,401,"#898c90"],"250px-Australian_Brushturkey_2_-_Newington.jpg":[250,250,"#96824a"],"250px-Balaeniceps_rex.jpg":[250,333,"#364d2d"],"250px-Barred_Owlet-Nightjar.jpg":[250,333,"#a0ab81"],"250px-Batrachostomus_septimus_01.jpg":[250,320,"#d6cac6"],"250px-Bengal_Florican_Houbaropsis_bengalensis_bengalensis_(cropped).jpg":[250,305,"#9aa366"],"250px-Black-breasted_Button-quail_male_inskip.JPG":[250,249,"#724f2c"],"250px-Black_Caracara_-_Chupacacao_Negro_(Daptrius_ater)_(14909975447)_(cropped).jpg":[250,298,"#7a8173"],"250px-Blue-crowned_Motmot_back_2.jpg":[250,375,"#5b6e49"],"250px-Blue-throated_Roller_from_Canopy_Walkway_-_Kakum_NP_-_Ghana_14_S4E1636_(16011512580).jpg":[250,375,"#adb7be"],"250px-Blue_jay_in_PP_(30960).jpg":[250,341,"#858469"],"250px-Brown-Falcon,-Vic,-3.1.2008.jpg":[250,375,"#686a49"],"250px-Brown_Treecreeper.jpg":[250,375,"#676b69"],"250px-Brown_boobytern.JPG":[250,354,"#698696"],"250px-Burchell's_sandgrouse,_Pterocles_burchelli,_at_Kgalagadi_Transfrontier_Park,_Northern_Cape,_South_Africa_(35283376362),_crop.jpg":[250,244,"#8e7d68"],"250px-Cacatua_galerita_-perching_on_branch_-crest-8a-2c.jpg":[250,250,"#8d7763"],"250px-Cariama_cristata_1838_white_background.jpg":[250,318,"#ece8e5"],"250px-Cayley_Ardeotis_australis_flipped.jpg":[250,300,"#e8e4df"],"250px-ColiusCastanonotusKeulemans.jpg":[250,339,"#ddd7c8"],"250px-Colius_White-backed_mousebird_feeding_on_Duranta_berries_9860s.jpg":[250,406,"#6b7a4e"],"250px-Common_kestrel_falco_tinnunculus.jpg":[250,353,"#676435"],"250px-Coruja-de-crista_(Lophostrix_cristata).jpg":[250,375,"#7c904d"],"250px-Corvus_corone_-near_Canford_Cliffs,_Poole,_England-8.jpg":[250,267,"#847d6e"],"250px-Cracticus_tibicen_hypoleuca_male_domain.jpg":[250,256,"#565544"],"250px-Crax_daubentoni_-Philadelphia_Zoo_-female-8a-4c.jpg":[250,250,"#8a8a8b"],"250px-Crinifer_piscator_-Lotherton_Hall,_West_Yorkshire,_England-8a.jpg":[250,376,"#717269"],"250px-Cuvier-72-Grue_cendrée.jpg":[250,356,"#e3e2e0"],"250px-Darica_Cossowary_00975.jpg":[250,333,"#3e3c2e"],"250px-Dvorac_Bisag_-_roda.jpg":[250,333,"#939ba7"],"250px-Eastern_Screech_Owl.jpg":[250,375,"#85775f"],"250px-European_green_woodpecker_(Picus_viridis)_female_Barnes.jpg":[250,355,"#716b3d"],"250px-Fishing_-_Alcedo_atthis,_crop.jpg":[250,266,"#7c9236"],"250px-Flamingo_and_offspring.jpg":[250,376,"#857964"],"250px-Flickr_-_Rainbirder_-_Great_Crested_Grebe_(Podiceps_cristatus).jpg":[250,339,"#707567"],"250px-Goliath_heron_standing_cropped.jpg":[250,380,"#7b7680"],"250px-Great_Eared-Nightjar,_Tangkoko,_Sulawesi_(5799113025)_(2).jpg":[250,271,"#1c1a1b"],"250px-Greater_Rhea_(Rhea_americana)_(28234029614).jpg":[250,330,"#7a7853"],"250px-Grey_Rumped_Treeswift.jpg":[250,357,"#7f99bf"],"250px-Grey_crowned_crane_at_Martin_Mere.JPG":[250,333,"#857e68"],"250px-Gymnopithys-leucaspis-001_edit2.jpg":[250,250,"#5c5339"],"250px-Hamerkop_(Scopus_umbretta_umbretta)_2.jpg":[250,250,"#7d9fbc"],"250px-Harpactes_erythrocephalus_-_Khao_Yai.jpg":[250,375,"#9eac5f"],"250px-Harpactes_fasciatus_1838_white_background.jpg":[250,296,"#ddd2d0"],"250px-Hoatzin_(Opisthocomus_hoazin)_Rio_Napo.jpg":[250,375,"#9aa7a5"],"250px-Hoatzin_(Opisthocomus_hoazin)_head_Rio_Napo.jpg":[250,333,"#72735d"],"250px-Hoopoe_with_insect.jpg":[250,250,"#715c4c"],"250px-Jamaican_tody_(Todus_todus).jpg":[250,250,"#7c8d3b"],"250px-Japanse_kraanvogels_in_Akan_International_Crane_Centre,_-24_februari_2012_a.jpg":[250,376,"#8d8c90"],"250px-Kea.jpg":[250,333,"#8c8986"],"250px-Kori_Bustard_Bushes_2019-07-26.jpg":[250,375,"#7f8080"],"250px-Lachfalke.jpg":[250,375,"#7b8e9e"],"250px-Lanceolated_Monklet_(Micromonacha_lanceolata).jpg":[250,261,"#adaba0"],"250px-Leptosomusdiscolorcrop.jpg":[250,350,"#5e6252"],"250px-Little_cormorant_(Microcarbo_niger)_-_20070322.jpg":[250,290,"#a4a6a1"],"250px-Male_cuckoo_roller.jpg":[250,333,"#c1c4c4"],"250px-Meyers_grosses_Konversations-Lexikon_-_ein_Nachschlagewerk_des_allgemeinen_Wissens_(1908)_(Antwerpener_Breiftaube).jpg":[250,274,"#d6d4cb"],"250px-Moustached_Treeswift_(Hemiprocne_mystacea)_-_Flickr_-_Lip_Kee.jpg":[250,312,"#b3beda"],"250px-Northern_black_korhaan_(Afrotis_afraoides)_male.jpg":[250,250,"#928f7b"],"250px-Northern_potoo_(Nyctibius_jamaicensis_mexicanus)_Orange_Walk.jpg":[250,375,"#474541"],"250px-Nyctibius_griseus_471885191_27f931630d_o_Crop.jpg":[250,301,"#686d4a"],"250px-Nyctyornis_amictus_-_Kaeng_Krachan.jpg":[250,375,"#6d7562"],"250px-Okarito_kiwi_2.jpg":[250,310,"#5d5446"],"250px-Osprey_at_Shadow_Mountain_Lake,_CO_8-27-12_(8054292660).jpg":[250,451,"#b8b7b6"],"250px-Owl_sleeping_in_tree.jpg":[250,375,"#65635f"],"250px-Pacific_koel_male_kob08.JPG":[250,287,"#939070"],"250px-Pair_of_tawny_frogmouths.jpg":[250,375,"#6a665a"],"250px-Pelican_Safari_Park.jpg":[250,325,"#4f6045"],"250px-Phalacrocorax_atriceps,_Beagle_Channel.jpg":[250,306,"#939194"],"250px-PhilippineTrogonFemale.jpg":[250,313,"#718232"],"250px-PileatedWoodpeckerFeedingonTree,_crop.jpg":[250,277,"#746559"],"250px-Planches_enluminées_d'histoire_naturelle_(1765)_(Tauraco_persa).jpg":[250,314,"#d4d8cb"],"250px-Priotelus_temnurus_-Matanzas_Province,_Cuba-8.jpg":[250,352,"#848a70"],"250px-Psittrichas_fulgidus_-Jurong_Bird_Park-8a.jpg":[250,319,"#5c4236"],"250px-Pterocnemia_pennat_(zoo_Zurich).jpg":[250,333,"#767166"],"250px-Pulsatrix_perspicillata.jpg":[250,382,"#857d75"],"250px-Pyrrhura_lucianii_-_Castelnau_2.jpg":[250,242,"#d4d3cf"],"250px-Quetzal01.jpg":[250,340,"#83916a"],"250px-Rainbow_lorikeet.jpg":[250,375,"#494e35"],"250px-Red-tailed_Hawk.jpg":[250,375,"#948e7a"],"250px-Red-throated_Loon_(Gavia_stellata)_-_Summer_plumage_breeding_adult2.jpg":[250,273,"#76787c"],"250px-Rhea_white_background.jpg":[250,368,"#d3d5d8"],"250px-Ribbon-tailed_Astrapia.jpg":[250,333,"#6e6f67"],"250px-Ringed_white_stork.jpg":[250,333,"#7f99b9"],"250px-Rufous-tailed_jacamar_(Galbula_ruficauda)_male_2.JPG":[250,375,"#938278"],"250px-SageGrouse21.jpg":[250,292,"#807d6e"],"250px-Sagittarius_serpentarius_Sekretär.JPG":[250,343,"#9e8a6e"],"250px-Scarlet_ibis_arp.jpg":[250,244,"#9f8051"],"250px-Senegal_coucal_(Centropus_senegalensis_senegalensis).jpg":[250,250,"#9e7c69"],"250px-Seriema_de_Perna_Vermelha_I.jpg":[250,250,"#6f955a"],"250px-Shearwater_migrant_flock.jpg":[250,386,"#4a7077"],"250px-South_Shetland-2016-Deception_Island–Chinstrap_penguin_(Pygoscelis_antarctica)_04.jpg":[250,375,"#7e8488"],"250px-Spot-billed_pelican_takeoff_white_background.jpg":[250,258,"#eae5e0"],"250px-SpottedEagleOwl2539MGEyeLid.jpg":[250,333,"#807d77"],"250px-Stercorarius_antarcticus_-Godthul,_South_Georgia,_British_Overseas_Territories,_UK_-landing-8.jpg":[250,282,"#776d5b"],"250px-Tauraco_fischeri.jpg":[250,312,"#827462"],"250px-Thalassarche_chlororhynchos_1838.jpg":[250,322,"#dcd3bc"],"250px-Towerrabe.png":[250,286,"#a99985"],"250px-Turca,_Alto_del_Naranjo_01nov14_.jpg":[250,333,"#9c9186"],"250px-Urocolius_macrourus-20090110B.jpg":[250,326,"#557452"],"250px-Urubu_a_tete_rouge_-_Turkey_Vulture.jpg":[250,357,"#74716b"],"250px-White-headed_Mousebird_-_Samburu_NH8O5520.jpg":[250,375,"#726746"],"330px-101_-_CLARK'S_GREBE_(5-18-08)_santa_margarita_lake,_sloco,_ca_(2)_(8722134244).jpg":[330,238,"#6989a6"],"330px-2012-namaqua-sandgrouse-male.jpg":[330,253,"#908a7f"],"330px-A_Tawny_frogmouth,_Podargus_strigoides.jpg":[330,247,"#6f7270"],"330px-A_male_peafowl_dancing.jpg":[330,206,"#b2b68d"],"330px-Abdim's_Stork_(Ciconia_abdimii)_(7011390701).jpg":[330,247,"#668eae"],"330px-Abyssinian_Ground_Hornbill_RWD3.jpg":[330,248,"#606754"],"330px-Acanthorhynchus_tenuirostris_female.jpg":[330,282,"#6e5f4f"],"330px-Accipiter_nisus_edit.jpg":[330,307,"#818d61"],"330px-African_Finfoot,_male_breeding.jpg":[330,218,"#807350"],"330px-African_openbill,_Anastomus_lamelligerus,_Chobe_National_Park,_Botswana_(32390774275).jpg":[330,236,"#7f7d72"],"330px-Anser_caerulescens_CT8.jpg":[330,220,"#6284af"],"330px-Anseranas_semipalmata_-Edithvale_Wetland,_Melbourne,_Australia-8.jpg":[330,247,"#4f574b"],"330px-Anthropoides_virgo_-Mongolia_-flying-8.jpg":[330,220,"#6493c8"],"330px-Apteryx_mantelli_-Rotorua,_North_Island,_New_Zealand-8a.jpg":[330,247,"#5c4a31"],"330px-Apus_apus_-Barcelona,_Spain-8_(1).jpg":[330,220,"#92bae8"],"330px-Ara_ararauna_Luc_Viatour.jpg":[330,255,"#5b6b35"],"330px-Archilochus_colubris_(Male).jpg":[330,227,"#aeb1a9"],"330px-As_emas.jpg":[330,247,"#5d7c59"],"330px-At_Possa_da_Londra_in_the_Brazilian_Patanal_(105m)_-_the_weird_looking_Southern_Screamer_(Chauna_torquata)_-_(24213807344).jpg":[330,220,"#7c8793"],"330px-Australian_owlet-nightjar_A22I9928.jpg":[330,220,"#6d5643"],"330px-Ave_Carcará.jpg":[330,247,"#9d7254"],"330px-Avestruz_de_cuello_azul_(Struthio_camelus_australis),_cabo_de_Buena_Esparanza,_Sudáfrica,_2018-07-23,_DD_87.jpg":[330,268,"#9b9870"],"330px-Bare-faced_Go-away-bird_RWD5.jpg":[330,248,"#6f7053"],"330px-Black-headed_Ibis_(Threskiornis_melanocephalus).jpg":[330,220,"#898445"],"330px-Black_Swans_mating_in_Lake_Burley_Griffin-2_(5549171039).jpg":[330,214,"#666161"],"330px-Blue_Korhaan_(Eupodotis_caerulescens)_male.jpg":[330,315,"#b1997b"],"330px-Brown_Quail.jpg":[330,273,"#9da076"],"330px-Brushturkeykansaszoo.jpg":[330,221,"#75746b"],"330px-CURLEW,_LONG-BILLED_(3-22-10)_morro_bay,_ca_-04_(4455146301).jpg":[330,242,"#6e8ca1"],"330px-Caracara_cheriway_-Brevard_Zoo-8a.jpg":[330,274,"#84827d"],"330px-Cariama_cristata_-near_Goiania,_Goias,_Brazil-8.jpg":[330,241,"#aa7645"],"330px-Casuarius_unappendiculatus_qtl1.jpg":[330,278,"#70756d"],"330px-Chestnut-bellied_Partridge_RWD2.jpg":[330,247,"#817e77"],"330px-Chestnut-breasted_Malkoha_San_Deigo_Zoo_2009.jpg":[330,248,"#56644d"],"330px-Chordeiles_acutipennis_texensisAQBIP06CA.jpg":[330,301,"#cdcac7"],"330px-Circus_aeruginosus_Valencia_3.jpeg":[330,220,"#6e5238"],"330px-Cliff_Swallow-27527-2.jpg":[330,248,"#aa9573"],"330px-Colius_striatus1.jpg":[330,235,"#5f633d"],"330px-Common_Scimitar-bill_01.jpg":[330,247,"#b9b7b7"],"330px-Congo_African_Grey_Parrot_-head_detail.jpg":[330,245,"#565d4e"],"330px-Coquerel's_Coua,_crop.jpg":[330,252,"#a58058"],"330px-Cormorant_in_Strunjan,_white_background.png":[330,257,null],"330px-Cuculus_canorus_vogelartinfo.jpg":[330,228,"#7d9fb6"],"330px-Cuvier-59-Hoazin_huppé.jpg":[330,234,"#dcd8d4"],"330px-Cuvier-72-Caurale_soleil.jpg":[330,295,"#d4d0cb"],"330px-D'Orbigny-Mouette_rieuse_et_Bec-en-ciseaux_white_background.jpg":[330,218,"#e3e2e1"],"330px-Dacelo_novaeguineae_waterworks.jpg":[330,241,"#747f71"],"330px-Denham's_Bustard_(Neotis_denhami)_(7083219537).jpg":[330,247,"#778536"],"330px-Diomedea_epomophora_portrait_-_SE_Tasmania.jpg":[330,264,"#8c939e"],"330px-Diomedea_exulans_in_flight_-_SE_Tasmania.jpg":[330,201,"#3169ad"],"330px-Dusky_moorhen442.jpg":[330,248,"#958055"],"330px-Ein_Eisvogel_im_Schwebflug.jpg":[330,220,"#67805b"],"330px-Elegant_Crested_Tinamou_(Eudromia_elegans)_(15953728501).jpg":[330,220,"#8a7f71"],"330px-Emu_portrait.jpg":[330,220,"#709460"],"330px-European_roller.jpg":[330,264,"#a2a198"],"330px-Eurypyga_helias_-Smithsonian_National_Zoological_Park,_USA-8.jpg":[330,247,"#707767"],"330px-Falkland_Islands_Penguins_70.jpg":[330,219,"#5c6f7e"],"330px-Feline_Owlet-nightjar_0A2A6959.jpg":[330,220,"#37402d"],"330px-Fregata_magnificens_-Galapagos,_Ecuador_-male-8_(1).jpg":[330,268,"#795c41"],"330px-Gavia_arctica_EM1B1934_(48009481846).jpg":[330,248,"#6a8198"],"330px-Gavia_immer_-Minocqua,_Wisconsin,_USA_-swimming-8.jpg":[330,223,"#476374"],"330px-Gavia_immer_-Osgood_Pond,_New_York,_USA_-nest-8a.jpg":[330,276,"#71825a"],"330px-Giant_petrel_-_Macronectes_giganteus.jpg":[330,219,"#c6c3b6"],"330px-Great_Crested_Grebe_(52909695022).jpg":[330,220,"#b6b2af"],"330px-Greater_Yellow-headed_Vulture_(Cathartes_melambrotus)_in_flight_from_below.jpg":[330,228,"#507eb3"],"330px-Greater_flamingo_galapagos.JPG":[330,298,"#61564c"],"330px-Grey-backed_Storm_Petrel_0A2A8780.jpg":[330,248,"#acbbd3"],"330px-Grey-wing_Turmpeter_RWD.jpg":[330,247,"#95917d"],"330px-Gyps_africanus_Torgos_tracheliotus.jpg":[330,266,"#8c957d"],"330px-Harfang_en_vol_1.jpg":[329,223,"#6684a5"],"330px-Helmet_vanga_(Euryceros_prevostii).jpg":[330,220,"#697443"],"330px-Heron_tricol_01.JPG":[330,271,"#949390"],"330px-House_Sparrow,_England_-_May_09.jpg":[330,277,"#919853"],"330px-House_sparrow_male_in_Prospect_Park_(53532).jpg":[330,257,"#a3a67a"],"330px-Javan_Trogon_(Harpactes_reinwardtii_reinwardtii).jpg":[330,264,"#717647"],"330px-Kagu_0A2A3521.jpg":[330,220,"#776f62"],"330px-Lamberts_Bay_P1010338.JPG":[330,247,"#7c7a75"],"330px-Large_number_of_flamingos_at_Lake_Nakuru.jpg":[330,219,"#7c7e88"],"330px-Laridae_on_Lake_Baikal.png":[330,286,"#85a6be"],"330px-Larus_argentatus_ad.jpg":[330,264,"#5c6f89"],"330px-Lesser_Nighthawk.jpg":[330,260,"#a49b81"],"330px-Lesser_Roadrunner_-_Mexico_S4E1497.jpg":[330,220,"#778e3d"],"330px-Magnificent-Frigate-male.jpg":[330,220,"#94cee7"],"330px-Malabar_Grey_Hornbill_DSCN8046.jpg":[330,255,"#88837c"],"330px-Malleefowl_0A2A4564.jpg":[330,220,"#7f776f"],"330px-Melopsittacus_undulatus_(24082227505).jpg":[330,247,"#7b7754"],"330px-Milvus_milvus_Jura.jpg":[330,236,"#69849a"],"330px-Moluccan_Owlet-nightjar_0A2A8326.jpg":[330,220,"#141411"],"330px-Monasa_atra_-_Black_nunbird.JPG":[330,283,"#67695e"],"330px-Mute_Swan_Emsworth2.JPG":[330,250,"#595a5f"],"330px-Mãe-da-lua-gigante_(Nyctibius_grandis).jpg":[330,215,"#627548"],"330px-Nandu_Rhea_americana_Tierpark_Hellabrunn-1.jpg":[330,259,"#717b56"],"330px-Nicobar_Pigeon_on_the_bar.jpg":[330,240,"#627755"],"330px-Numida_meleagris_-Serengeti_National_Park,_Tanzania-8_(1).jpg":[330,221,"#7b7d72"],"330px-NyctibiusBracteatusSmit.jpg":[330,248,"#cec5b9"],"330px-Oceanodroma_furcata1.jpg":[330,219,"#4d493f"],"330px-Oilbird_(17370415445).jpg":[330,220,"#59524f"],"330px-Oilbirds.jpg":[330,218,"#5a4c3a"],"330px-Osprey_with_its_nest.jpg":[330,220,"#b2b1ad"],"330px-Oxford_Dodo_display.jpg":[330,218,"#736c6d"],"330px-Painted_Sandgrouse_Male_(50325876266).jpg":[330,243,"#807b59"],"330px-Papageitaucher_Fratercula_arctica.jpg":[330,220,"#8f958f"],"330px-Paradisaea_raggiana_23zz.jpg":[330,281,"#656337"],"330px-Peacock-JS.jpg":[330,206,"#495746"],"330px-Pelecanus_conspicillatus_-Australia_-8.jpg":[330,224,"#446379"],"330px-Pelikan_Walvis_Bay.jpg":[330,247,"#948f8d"],"330px-Pheasant.jpg":[330,217,"#8d8b5c"],"330px-Phoebastria_albatrus1.jpg":[330,224,"#97a4a0"],"330px-Podilymbus-podiceps-001.jpg":[330,248,"#8b8d73"],"330px-Pseudhirundo_griseopyga_Sharpe_(cropped).jpg":[330,220,"#c3c7c1"],"330px-Purple-throated_carib_hummingbird_feeding.jpg":[330,206,"#88814e"],"330px-Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg":[330,219,"#1d7690"],"330px-Red-billed_Tropicbird_(Phaethon_aethereus)_(4089464789).jpg":[330,186,"#475973"],"330px-Red-faced_Mousebird_Urocolius_indicus_in_flight_2012_05_08_6358t.JPG":[330,233,"#454d50"],"330px-Red-headed_barbet_(Eubucco_bourcierii_aequatorialis)_male_Paz_de_las_Aves.jpg":[330,220,"#636a40"],"330px-Red-tailed_Tropicbird_RWD2.jpg":[330,248,"#3e4a3d"],"330px-Rhynchotus_rufescens_-Parque_das_Aves-8a.jpg":[330,220,"#896e4f"],"330px-Rufous_Hummingbird,_male_01.jpg":[330,251,"#a9a59c"],"330px-Rurrenabaque_Bolivia_-_The_Amazon.jpg":[330,255,"#979795"],"330px-SNOW-PIGEON-SELA.jpg":[330,220,"#6f635b"],"330px-Sandhill_bare_areas.jpg":[330,243,"#94896a"],"330px-Skeleton_of_Titanis_at_the_Florida_Museum_of_Natural_History.jpg":[330,261,"#7e4c30"],"330px-Snares_Penguin_(Eudyptes_robustus)_-group.jpg":[330,247,"#5e5a4f"],"330px-Somali_ostrich.jpg":[330,222,"#826c40"],"330px-Southern_Ground-hornbill_(Bucorvus_leadbeateri)_-side_beak_open.jpg":[330,219,"#665745"],"330px-Starr_080612-8667_Calophyllum_inophyllum.jpg":[330,247,"#615c51"],"330px-Steatornis_caripensis_MHNT_ZON_STEA_1.jpg":[330,249,"#e0dacf"],"330px-Subdesert_Mesite.jpg":[330,279,"#8b6e62"],"330px-Superb_lyrbird_in_scrub.jpg":[330,220,"#90966c"],"330px-Tawny_frogmouth_wholebody444.jpg":[330,247,"#28201b"],"330px-Toco_toucan_-_panoramio_-_Basa_Roland.jpg":[330,247,"#516a51"],"330px-Treron_vernans_male_-_Kent_Ridge_Park.jpg":[330,220,"#5b7035"],"330px-Vogelkop_Bowerbird_Bower_1099.jpg":[330,220,"#485939"],"330px-Wedge_tailed_eagle_in_flight04.jpg":[330,220,"#7d9ecd"],"330px-White-breasted_Mesite_-_Ankarafantsika_-_Madagascar_S4E9441_(15297364032).jpg":[330,220,"#967b4f"],"330px-Wood-ducks-male-female-chicago-march-2024.jpg":[330,191,"#798396"],"330px-Yellow-billed_Stork_(Mycteria_ibis)_(12011503884).jpg":[330,247,"#80857a"],"330px-Yellow_Bittern_hunting.jpg":[330,205,"#57734c"],"330px-Στρουθοκαμήλου_στην_Bucaramanga_της_Κολομβίας.jpg":[330,247,"#666553"],"426px-Reed_warbler_cuckoo.jpg":[426,600,"#6c6a46"],"500px-Flickr_-_Rainbirder_-_Long-tailed_Manakin_(Chiroxiphia_linearis).jpg":[500,739,"#556740"],"504px-Flickr_-_Rainbirder_-_Scaly-throated_Honeyguide_(Indicator_variegatus).jpg":[504,599,"#98a4a7"],"A_monograph_of_the_Bucerotidæ,_or_family_of_the_hornbills_(Plate_II)_(white_background).jpg":[594,450,"#c5c4c3"],"Apus_apus_flock_flying_1.jpg":[544,389,"#6499ca"],"Black-legged_seriema_crop.jpg":[457,387,"#6c5842"],"British_birds_in_their_haunts_(Cuculus_canorus).jpg":[680,528,"#dad4cb"],"Ceylon_Bay_Owl1_Abhilash_Arjunan.jpg":[489,720,"#858a5b"],"Chinstrap_Penguin_white_background.jpg":[257,396,"#aaaaaa"],"Crypturellus_tataupa.JPG":[327,298,"#8d8c8e"],"Cuvier-12-Hibou_à_huppe_courte.jpg":[514,670,"#dcd5c9"],"Cuvier-33-Moineau_domestique.jpg":[614,371,"#ded9d3"],"Cuvier-46-Martin-pêcheur_d'Europe.jpg":[478,409,"#d0cdc7"],"Cuvier-97-Canard_colvert.jpg":[625,346,"#d1cfca"],"Dendrocopos_major_-Durham,_England_-female-8_white_background.jpg":[437,337,"#dcdbdd"],"Emoe.jpg":[567,586,"#7c7355"],"Emu_RWD2_white_background.jpg":[427,534,"#cdccca"],"Falco_vespertinus.jpg":[350,400,"#8b94b0"],"Flickr_-_Rainbirder_-_Chestnut-collared_Swift_(Streptoprocne_rutila)_on_the_nest.jpg":[720,515,"#533f26"],"Fou.varie1.jpg":[650,433,"#9db4d2"],"Golden_Eagle_Illustration_white_background.jpg":[362,481,"#d1c9bc"],"Great_hornbill_(Buceros_bicornis)_Photograph_by_Shantanu_Kuveskar.jpg":[800,600,"#768b69"],"Greatbluturaco,_crop.jpg":[357,400,"#b2b4a1"],"Kaka-Parrots.jpg":[760,570,"#70765e"],"Little_spotted_kiwi,_Apteryx_owenii,_Auckland_War_Memorial_Museum_white_background.jpg":[430,296,"#bab1a7"],"Mlongipennis.png":[551,230,"#868479"],"Monias_benschi_1912_white_background.jpg":[1010,375,"#bcb5ad"],"NewZealandFalconBuller_white_background.jpg":[263,530,"#c4bcb5"],"Northern_Gannet_2006_2.jpg":[775,517,"#869fc6"],"NothuraDarwiniiSmit_white_background.jpg":[374,428,"#cfc3b0"],"Pterocles_quadricinctus_white_background.jpg":[482,500,"#c9c7c0"],"Red_jungle_fowl.png":[800,549,"#bc9c87"],"Reiherläufer.jpg":[640,438,"#60665a"],"Rock_wren.jpg":[650,433,"#beb89f"],"Sirocco_full_length_portrait.jpg":[344,450,"#757c68"],"Struthio_camelus_-_Etosha_2014_(1)_white_background.jpg":[411,462,"#d4d3d3"],"Syrrhaptes_paradoxus_(Ján_Svetlík).jpg":[649,452,"#a79c8f"],"Weißstorch_(Ciconia_ciconia)_white_background.jpg":[407,574,"#dbd7d4"],"White-eared_Hummingbird_(Basilinna_leucotis)_white_background.jpg":[499,547,"#d2d5cf"],"Yellow_bellied_Asity12.jpg":[689,477,"#5f5c2c"],"lossy-page1-200px-Leptosomus_discolor_-_1825-1834_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_(cropped).tif.jpg":[200,240,"#cabeab"],"lossy-page1-318px-Fuut_Podiceps_cristatus_Jos_Zwarts_5.tif.jpg":[318,240,"#e9e6e7"],"lossy-page1-320px-IJsduiker_Gavia_immer_Jos_Zwarts.tif.jpg":[320,157,"#e8e8e8"]})
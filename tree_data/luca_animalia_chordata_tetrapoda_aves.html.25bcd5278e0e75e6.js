@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda_aves","<ul class=\"tree\" data-tree-range=\"aves\"><li><input type=\"checkbox\" checked id=\"Dinosauria_Aves\"><label class=\"tree_label\" for=\"Dinosauria_Aves\"></label><div class=\"outer_tree_box\"><div id=\"aves_aves\" class=\"tree_box\"><span><span>Aves</span><a href=\"https://en.wikipedia.org/wiki/Aves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Aves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Aves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Aves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"tetrapoda\">See parent</button><span class=\"badge\">Class</span></span><span class=\"common_names\">(birds)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:American_Flamingo_JG.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-American_Flamingo_JG.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4c4a58\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Puffin_%28Fratercula_arctica%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Puffin_%28Fratercula_arctica%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7d8285\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2020-11_Kerguelen_Islands_-_Gentoo_penguin_11.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2020-11_Kerguelen_Islands_-_Gentoo_penguin_11.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#707279\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Southern_Cassowary_7071.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Southern_Cassowary_7071.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9ab37c\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Aves_Palaeognathae\"><label class=\"tree_label\" for=\"Aves_Palaeognathae\"></label><div class=\"outer_tree_box\"><div id=\"aves_palaeognathae\" class=\"tree_box\"><span><span>Palaeognathae</span><a href=\"https://en.wikipedia.org/wiki/Palaeognathae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Palaeognathae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Palaeognathae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Palaeognathae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌpæliˈɒɡnəθi\" target=\"_blank\">ˌpæliˈɒɡnəθi</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Infraclass</span></span><span class=\"common_names\">(tinamous, kiwis, cassowaries, emus, rheas, ostriches, moas)</span><p class=\"tag\">Mostly flightless birds where the male incubates the eggs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Avestruz_de_cuello_azul_%28Struthio_camelus_australis%29%2C_cabo_de_Buena_Esparanza%2C_Sud%C3%A1frica%2C_2018-07-23%2C_DD_87.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Avestruz_de_cuello_azul_%28Struthio_camelus_australis%29%2C_cabo_de_Buena_Esparanza%2C_Sud%C3%A1frica%2C_2018-07-23%2C_DD_87.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"268\" style=\"background-color:#9b9870\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhynchotus_rufescens_-Parque_das_Aves-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rhynchotus_rufescens_-Parque_das_Aves-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#896e4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apteryx_mantelli_-Rotorua%2C_North_Island%2C_New_Zealand-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apteryx_mantelli_-Rotorua%2C_North_Island%2C_New_Zealand-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5c4a31\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_struthioniformes\" class=\"tree_box\"><span><span>Struthioniformes</span><a href=\"https://en.wikipedia.org/wiki/Struthioniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Struthioniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Struthioniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Struthioniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(ostriches)</span><p class=\"tag\">Large flightless birds native to Africa. They are the largest extant birds and the fastest runners.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Struthio_camelus_-_Etosha_2014_%281%29_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/Struthio_camelus_-_Etosha_2014_%281%29_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"411\" height=\"462\" style=\"background-color:#d4d3d3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%CE%A3%CF%84%CF%81%CE%BF%CF%85%CE%B8%CE%BF%CE%BA%CE%B1%CE%BC%CE%AE%CE%BB%CE%BF%CF%85_%CF%83%CF%84%CE%B7%CE%BD_Bucaramanga_%CF%84%CE%B7%CF%82_%CE%9A%CE%BF%CE%BB%CE%BF%CE%BC%CE%B2%CE%AF%CE%B1%CF%82.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%CE%A3%CF%84%CF%81%CE%BF%CF%85%CE%B8%CE%BF%CE%BA%CE%B1%CE%BC%CE%AE%CE%BB%CE%BF%CF%85_%CF%83%CF%84%CE%B7%CE%BD_Bucaramanga_%CF%84%CE%B7%CF%82_%CE%9A%CE%BF%CE%BB%CE%BF%CE%BC%CE%B2%CE%AF%CE%B1%CF%82.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#666553\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Somali_ostrich.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Somali_ostrich.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"222\" style=\"background-color:#826c40\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Avestruz_de_cuello_azul_%28Struthio_camelus_australis%29%2C_cabo_de_Buena_Esparanza%2C_Sud%C3%A1frica%2C_2018-07-23%2C_DD_87.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Avestruz_de_cuello_azul_%28Struthio_camelus_australis%29%2C_cabo_de_Buena_Esparanza%2C_Sud%C3%A1frica%2C_2018-07-23%2C_DD_87.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"268\" style=\"background-color:#9b9870\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_tinamiformes\" class=\"tree_box\"><span><span>Tinamiformes</span><a href=\"https://en.wikipedia.org/wiki/Tinamiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tinamiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tinamiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tinamiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌtɪnəməˈfɔːrmiːz\" target=\"_blank\">ˌtɪnəməˈfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(tinamous)</span><p class=\"tag\">Heavy bodied and short tailed ground dwelling birds of central and South America that have the ability to fly; sometimes domesticated.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:NothuraDarwiniiSmit_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/NothuraDarwiniiSmit_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"374\" height=\"428\" style=\"background-color:#cfc3b0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Elegant_Crested_Tinamou_%28Eudromia_elegans%29_%2815953728501%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Elegant_Crested_Tinamou_%28Eudromia_elegans%29_%2815953728501%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#8a7f71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhynchotus_rufescens_-Parque_das_Aves-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rhynchotus_rufescens_-Parque_das_Aves-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#896e4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crypturellus_tataupa.JPG\" target=\"_blank\"><img src=\"thumbnails/Crypturellus_tataupa.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"327\" height=\"298\" style=\"background-color:#8d8c8e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_rheiformes\" class=\"tree_box\"><span><span>Rheiformes</span><a href=\"https://en.wikipedia.org/wiki/Rheiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rheiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rheiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Rheiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(rheas)</span><p class=\"tag\">Rheiformes is an order of flightless birds primarily native to South America.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Rhea_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Rhea_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"368\" style=\"background-color:#d3d5d8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nandu_Rhea_americana_Tierpark_Hellabrunn-1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nandu_Rhea_americana_Tierpark_Hellabrunn-1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"259\" style=\"background-color:#717b56\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Greater_Rhea_%28Rhea_americana%29_%2828234029614%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Greater_Rhea_%28Rhea_americana%29_%2828234029614%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"330\" style=\"background-color:#7a7853\"></a><a href=\"https://commons.wikimedia.org/wiki/File:As_emas.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-As_emas.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5d7c59\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pterocnemia_pennat_%28zoo_Zurich%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pterocnemia_pennat_%28zoo_Zurich%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#767166\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_apterygiformes\" class=\"tree_box\"><span><span>Apterygiformes</span><a href=\"https://en.wikipedia.org/wiki/Apterygiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Apterygiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Apterygiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Apterygiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(kiwis)</span><p class=\"tag\">Flightless birds characterized by their small size, nocturnal habits, and lack of functional wings. Known primarily for the modern family of Kiwis, native to New Zealand.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Little_spotted_kiwi%2C_Apteryx_owenii%2C_Auckland_War_Memorial_Museum_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/Little_spotted_kiwi%2C_Apteryx_owenii%2C_Auckland_War_Memorial_Museum_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"430\" height=\"296\" style=\"background-color:#bab1a7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Okarito_kiwi_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Okarito_kiwi_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"310\" style=\"background-color:#5d5446\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apteryx_mantelli_-Rotorua%2C_North_Island%2C_New_Zealand-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apteryx_mantelli_-Rotorua%2C_North_Island%2C_New_Zealand-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5c4a31\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_casuariiformes\" class=\"tree_box\"><span><span>Casuariiformes</span><a href=\"https://en.wikipedia.org/wiki/Casuariiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Casuariiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Casuariiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Casuariiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(emu, cassowaries)</span><p class=\"tag\">Large flightless birds native to the Australasian region.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Emu_RWD2_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/Emu_RWD2_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"427\" height=\"534\" style=\"background-color:#cdccca\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Darica_Cossowary_00975.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Darica_Cossowary_00975.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#3e3c2e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Casuarius_unappendiculatus_qtl1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Casuarius_unappendiculatus_qtl1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"278\" style=\"background-color:#70756d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Emu_portrait.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Emu_portrait.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#709460\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Emoe.jpg\" target=\"_blank\"><img src=\"thumbnails/Emoe.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"567\" height=\"586\" style=\"background-color:#7c7355\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Aves_Neognathae\"><label class=\"tree_label\" for=\"Aves_Neognathae\"></label><div class=\"outer_tree_box\"><div id=\"aves_neognathae\" class=\"tree_box\"><span><span>Neognathae</span><a href=\"https://en.wikipedia.org/wiki/Neognathae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Neognathae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Neognathae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Neognathae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=niˈɒɡnəθiː\" target=\"_blank\">niˈɒɡnəθiː</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Infraclass</span></span><p class=\"tag\">All birds except the tinamous and the flightless ratites. They have fused metacarpals and an elongate third finger.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Greater_flamingo_galapagos.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Greater_flamingo_galapagos.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"298\" style=\"background-color:#61564c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SNOW-PIGEON-SELA.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-SNOW-PIGEON-SELA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6f635b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pelecanus_conspicillatus_-Australia_-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pelecanus_conspicillatus_-Australia_-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#446379\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#1d7690\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Accipiter_nisus_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Accipiter_nisus_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"307\" style=\"background-color:#818d61\"></a><a href=\"https://commons.wikimedia.org/wiki/File:House_Sparrow%2C_England_-_May_09.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-House_Sparrow%2C_England_-_May_09.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"277\" style=\"background-color:#919853\"></a><a href=\"https://commons.wikimedia.org/wiki/File:A_male_peafowl_dancing.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-A_male_peafowl_dancing.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#b2b68d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wood-ducks-male-female-chicago-march-2024.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wood-ducks-male-female-chicago-march-2024.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"191\" style=\"background-color:#798396\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_jungle_fowl.png\" target=\"_blank\"><img src=\"thumbnails/Red_jungle_fowl.png\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"549\" style=\"background-color:#bc9c87\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Neognathae_Galloanserae\"><label class=\"tree_label\" for=\"Neognathae_Galloanserae\"></label><div class=\"outer_tree_box\"><div id=\"aves_galloanserae\" class=\"tree_box\"><span><span>Galloanserae</span><a href=\"https://en.wikipedia.org/wiki/Galloanserae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Galloanserae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Galloanserae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Galloanserae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><span class=\"common_names\">(pheasants, ducks, geese, swans)</span><p class=\"tag\">The fowl. Survived the K-T extinction event.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Wood-ducks-male-female-chicago-march-2024.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wood-ducks-male-female-chicago-march-2024.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"191\" style=\"background-color:#798396\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anser_caerulescens_CT8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Anser_caerulescens_CT8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6284af\"></a><a href=\"https://commons.wikimedia.org/wiki/File:A_male_peafowl_dancing.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-A_male_peafowl_dancing.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#b2b68d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Malleefowl_0A2A4564.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Malleefowl_0A2A4564.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7f776f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_jungle_fowl.png\" target=\"_blank\"><img src=\"thumbnails/Red_jungle_fowl.png\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"549\" style=\"background-color:#bc9c87\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_galliformes\" class=\"tree_box\"><span><span>Galliformes</span><a href=\"https://en.wikipedia.org/wiki/Galliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Galliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Galliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Galliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text= ˌɡælɪˈfɔːrmiːz\" target=\"_blank\"> ˌɡælɪˈfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(chickens, pheasants, turkeys, quail, peacocks, partridges, grouse, guinea foul)</span><p class=\"tag\">The gamefowl. Heavy-bodied ground-feeding landfowl often domesticated or hunted as game birds.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Red_jungle_fowl.png\" target=\"_blank\"><img src=\"thumbnails/Red_jungle_fowl.png\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"549\" style=\"background-color:#bc9c87\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chestnut-bellied_Partridge_RWD2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chestnut-bellied_Partridge_RWD2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#817e77\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pheasant.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pheasant.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#8d8b5c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:A_male_peafowl_dancing.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-A_male_peafowl_dancing.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#b2b68d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Peacock-JS.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Peacock-JS.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#495746\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SageGrouse21.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-SageGrouse21.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"292\" style=\"background-color:#807d6e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Numida_meleagris_-Serengeti_National_Park%2C_Tanzania-8_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Numida_meleagris_-Serengeti_National_Park%2C_Tanzania-8_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#7b7d72\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crax_daubentoni_-Philadelphia_Zoo_-female-8a-4c.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Crax_daubentoni_-Philadelphia_Zoo_-female-8a-4c.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#8a8a8b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Malleefowl_0A2A4564.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Malleefowl_0A2A4564.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7f776f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Australian_Brushturkey_2_-_Newington.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Australian_Brushturkey_2_-_Newington.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#96824a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brushturkeykansaszoo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Brushturkeykansaszoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#75746b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_anseriformes\" class=\"tree_box\"><span><span>Anseriformes</span><a href=\"https://en.wikipedia.org/wiki/Anseriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Anseriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Anseriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Anseriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(ducks, geese, swans, screamers)</span><p class=\"tag\">The waterfowl. Highly adapted for an aquatic existence at the water surface. The bill and a modified tongue create suction to pump or draw water in.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cuvier-97-Canard_colvert.jpg\" target=\"_blank\"><img src=\"thumbnails/Cuvier-97-Canard_colvert.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"625\" height=\"346\" style=\"background-color:#d1cfca\"></a><a href=\"https://commons.wikimedia.org/wiki/File:At_Possa_da_Londra_in_the_Brazilian_Patanal_%28105m%29_-_the_weird_looking_Southern_Screamer_%28Chauna_torquata%29_-_%2824213807344%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-At_Possa_da_Londra_in_the_Brazilian_Patanal_%28105m%29_-_the_weird_looking_Southern_Screamer_%28Chauna_torquata%29_-_%2824213807344%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7c8793\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anseranas_semipalmata_-Edithvale_Wetland%2C_Melbourne%2C_Australia-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Anseranas_semipalmata_-Edithvale_Wetland%2C_Melbourne%2C_Australia-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4f574b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wood-ducks-male-female-chicago-march-2024.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wood-ducks-male-female-chicago-march-2024.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"191\" style=\"background-color:#798396\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anser_caerulescens_CT8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Anser_caerulescens_CT8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6284af\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black_Swans_mating_in_Lake_Burley_Griffin-2_%285549171039%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Black_Swans_mating_in_Lake_Burley_Griffin-2_%285549171039%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"214\" style=\"background-color:#666161\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mute_Swan_Emsworth2.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Mute_Swan_Emsworth2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"250\" style=\"background-color:#595a5f\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Neognathae_Neoaves\"><label class=\"tree_label\" for=\"Neognathae_Neoaves\"></label><div class=\"outer_tree_box\"><div id=\"aves_neoaves\" class=\"tree_box\"><span><span>Neoaves</span><a href=\"https://en.wikipedia.org/wiki/Neoaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Neoaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Neoaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Neoaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(landbirds, waterbirds, tropicbirds, swifts, hummingbirds, pigeons, flamingos, cranes, gulls, passerines)</span><p class=\"tag\">The most inclusive crown clade containing the house sparrow, but not the red junglefowl. These are all birds except the ratites, tinamous, and fowls; or roughly 95% of birds.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:House_Sparrow%2C_England_-_May_09.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-House_Sparrow%2C_England_-_May_09.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"277\" style=\"background-color:#919853\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Accipiter_nisus_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Accipiter_nisus_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"307\" style=\"background-color:#818d61\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#1d7690\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pelecanus_conspicillatus_-Australia_-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pelecanus_conspicillatus_-Australia_-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#446379\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Greatbluturaco%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/Greatbluturaco%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"357\" height=\"400\" style=\"background-color:#b2b4a1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SNOW-PIGEON-SELA.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-SNOW-PIGEON-SELA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6f635b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Greater_flamingo_galapagos.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Greater_flamingo_galapagos.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"298\" style=\"background-color:#61564c\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Neoaves_Mirandornithes\"><label class=\"tree_label\" for=\"Neoaves_Mirandornithes\"></label><div class=\"outer_tree_box\"><div id=\"aves_mirandornithes\" class=\"tree_box\"><span><span>Mirandornithes</span><a href=\"https://en.wikipedia.org/wiki/Mirandornithes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mirandornithes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mirandornithes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mirandornithes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=mɪˌrændɔːrˈnɪθiːz\" target=\"_blank\">mɪˌrændɔːrˈnɪθiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(flamingos, grebes)</span><p class=\"tag\">Specialised aquatic birds found on freshwater lakes and ponds. Includes the flamingos and grebes.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Greater_flamingo_galapagos.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Greater_flamingo_galapagos.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"298\" style=\"background-color:#61564c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Podilymbus-podiceps-001.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Podilymbus-podiceps-001.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8b8d73\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Great_Crested_Grebe_%2852909695022%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Great_Crested_Grebe_%2852909695022%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#b6b2af\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_phoenicopteriformes\" class=\"tree_box\"><span><span>Phoenicopteriformes</span><a href=\"https://en.wikipedia.org/wiki/Phoenicopteriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Phoenicopteriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Phoenicopteriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Phoenicopteriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(flamingos)</span><p class=\"tag\">Birds with vibrant pink or reddish plumage, long legs, and uniquely shaped beaks adapted for filter feeding found in saline lakes throughout tropical and warm temperate zones.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Greater_flamingo_galapagos.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Greater_flamingo_galapagos.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"298\" style=\"background-color:#61564c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flamingo_and_offspring.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Flamingo_and_offspring.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#857964\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Large_number_of_flamingos_at_Lake_Nakuru.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Large_number_of_flamingos_at_Lake_Nakuru.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#7c7e88\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_podicipediformes\" class=\"tree_box\"><span><span>Podicipediformes</span><a href=\"https://en.wikipedia.org/wiki/Podicipediformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Podicipediformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Podicipediformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Podicipediformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌpɒdɪsɪˈpɛdɪfɔːrmiːz\" target=\"_blank\">ˌpɒdɪsɪˈpɛdɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(grebes)</span><p class=\"tag\">Medium-sized, stocky waterbirds of lakes and marshes, well adapted to aquatic life. Some are flightless.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Fuut_Podiceps_cristatus_Jos_Zwarts_5.tif\" target=\"_blank\"><img src=\"thumbnails/lossy-page1-318px-Fuut_Podiceps_cristatus_Jos_Zwarts_5.tif.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"318\" height=\"240\" style=\"background-color:#e9e6e7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flickr_-_Rainbirder_-_Great_Crested_Grebe_%28Podiceps_cristatus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Flickr_-_Rainbirder_-_Great_Crested_Grebe_%28Podiceps_cristatus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"339\" style=\"background-color:#707567\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Podilymbus-podiceps-001.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Podilymbus-podiceps-001.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8b8d73\"></a><a href=\"https://commons.wikimedia.org/wiki/File:101_-_CLARK%27S_GREBE_%285-18-08%29_santa_margarita_lake%2C_sloco%2C_ca_%282%29_%288722134244%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-101_-_CLARK%27S_GREBE_%285-18-08%29_santa_margarita_lake%2C_sloco%2C_ca_%282%29_%288722134244%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#6989a6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Great_Crested_Grebe_%2852909695022%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Great_Crested_Grebe_%2852909695022%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#b6b2af\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Neoaves_Columbimorphae\"><label class=\"tree_label\" for=\"Neoaves_Columbimorphae\"></label><div class=\"outer_tree_box\"><div id=\"aves_columbimorphae\" class=\"tree_box\"><span><span>Columbimorphae</span><a href=\"https://en.wikipedia.org/wiki/Columbimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Columbimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Columbimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Columbimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(mesites, sandgrouse, pigeons)</span><p class=\"tag\">The pigeons, sandgrouse &amp; allies.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Subdesert_Mesite.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Subdesert_Mesite.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"279\" style=\"background-color:#8b6e62\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2012-namaqua-sandgrouse-male.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2012-namaqua-sandgrouse-male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"253\" style=\"background-color:#908a7f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SNOW-PIGEON-SELA.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-SNOW-PIGEON-SELA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6f635b\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_columbiformes\" class=\"tree_box\"><span><span>Columbiformes</span><a href=\"https://en.wikipedia.org/wiki/Columbiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Columbiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Columbiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Columbiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(pigeons, doves, dodos)</span><p class=\"tag\">Stout-bodied monogomous birds with small heads, relatively short necks and slender bills. They feed largely on plant matter and are capable of drinking by sucking up water.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Meyers_grosses_Konversations-Lexikon_-_ein_Nachschlagewerk_des_allgemeinen_Wissens_%281908%29_%28Antwerpener_Breiftaube%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Meyers_grosses_Konversations-Lexikon_-_ein_Nachschlagewerk_des_allgemeinen_Wissens_%281908%29_%28Antwerpener_Breiftaube%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"274\" style=\"background-color:#d6d4cb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oxford_Dodo_display.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Oxford_Dodo_display.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"218\" style=\"background-color:#736c6d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Treron_vernans_male_-_Kent_Ridge_Park.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Treron_vernans_male_-_Kent_Ridge_Park.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5b7035\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nicobar_Pigeon_on_the_bar.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nicobar_Pigeon_on_the_bar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"240\" style=\"background-color:#627755\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SNOW-PIGEON-SELA.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-SNOW-PIGEON-SELA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6f635b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_mesitornithiformes\" class=\"tree_box\"><span><span>Mesitornithiformes</span><a href=\"https://en.wikipedia.org/wiki/Mesitornithiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mesitornithiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mesitornithiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mesitornithiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(mesites)</span><p class=\"tag\">Somewhat small-bodied, flightless or near flightless, somewhat shy birds endemic to Madagascar.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Monias_benschi_1912_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/Monias_benschi_1912_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"1010\" height=\"375\" style=\"background-color:#bcb5ad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Subdesert_Mesite.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Subdesert_Mesite.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"279\" style=\"background-color:#8b6e62\"></a><a href=\"https://commons.wikimedia.org/wiki/File:White-breasted_Mesite_-_Ankarafantsika_-_Madagascar_S4E9441_%2815297364032%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-White-breasted_Mesite_-_Ankarafantsika_-_Madagascar_S4E9441_%2815297364032%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#967b4f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_pterocliformes\" class=\"tree_box\"><span><span>Pterocliformes</span><a href=\"https://en.wikipedia.org/wiki/Pterocliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pterocliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pterocliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pterocliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌtɛrəklɪfɔːrmiːz\" target=\"_blank\">ˌtɛrəklɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(sandgrouse)</span><p class=\"tag\">Ground-dwelling birds with small, pigeon-like heads and necks and sturdy compact bodies that are restricted to treeless, open country.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pterocles_quadricinctus_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/Pterocles_quadricinctus_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"482\" height=\"500\" style=\"background-color:#c9c7c0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2012-namaqua-sandgrouse-male.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2012-namaqua-sandgrouse-male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"253\" style=\"background-color:#908a7f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Burchell%27s_sandgrouse%2C_Pterocles_burchelli%2C_at_Kgalagadi_Transfrontier_Park%2C_Northern_Cape%2C_South_Africa_%2835283376362%29%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Burchell%27s_sandgrouse%2C_Pterocles_burchelli%2C_at_Kgalagadi_Transfrontier_Park%2C_Northern_Cape%2C_South_Africa_%2835283376362%29%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"244\" style=\"background-color:#8e7d68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Painted_Sandgrouse_Male_%2850325876266%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Painted_Sandgrouse_Male_%2850325876266%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"243\" style=\"background-color:#807b59\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Syrrhaptes_paradoxus_%28J%C3%A1n_Svetl%C3%ADk%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Syrrhaptes_paradoxus_%28J%C3%A1n_Svetl%C3%ADk%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"649\" height=\"452\" style=\"background-color:#a79c8f\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Neoaves_Otidimorphae\"><label class=\"tree_label\" for=\"Neoaves_Otidimorphae\"></label><div class=\"outer_tree_box\"><div id=\"aves_otidimorphae\" class=\"tree_box\"><span><span>Otidimorphae</span><a href=\"https://en.wikipedia.org/wiki/Otidimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Otidimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Otidimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Otidimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(turacos, bustards, cuckoos)</span><p class=\"tag\">A clade of birds that contains the cuckoos, turacos, and bustards orders.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Greatbluturaco%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/Greatbluturaco%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"357\" height=\"400\" style=\"background-color:#b2b4a1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Denham%27s_Bustard_%28Neotis_denhami%29_%287083219537%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Denham%27s_Bustard_%28Neotis_denhami%29_%287083219537%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#778536\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coquerel%27s_Coua%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Coquerel%27s_Coua%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"252\" style=\"background-color:#a58058\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lesser_Roadrunner_-_Mexico_S4E1497.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lesser_Roadrunner_-_Mexico_S4E1497.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#778e3d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Reed_warbler_cuckoo.jpg\" target=\"_blank\"><img src=\"thumbnails/426px-Reed_warbler_cuckoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"426\" height=\"600\" style=\"background-color:#6c6a46\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_musophagiformes\" class=\"tree_box\"><span><span>Musophagiformes</span><a href=\"https://en.wikipedia.org/wiki/Musophagiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Musophagiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Musophagiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Musophagiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌmjuːzoʊˈfædʒɪdiː\" target=\"_blank\">ˌmjuːzoʊˈfædʒɪdiː</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(turacos, loeries, plantain-eaters, go-away-birds)</span><p class=\"tag\">Medium to large-sized colourful birds that feed mainly of fruits, leaves, and flowers with semi-zygodactylous toes (the fourth toe can be switched back and forth).</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Planches_enlumin%C3%A9es_d%27histoire_naturelle_%281765%29_%28Tauraco_persa%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Planches_enlumin%C3%A9es_d%27histoire_naturelle_%281765%29_%28Tauraco_persa%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"314\" style=\"background-color:#d4d8cb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Greatbluturaco%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/Greatbluturaco%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"357\" height=\"400\" style=\"background-color:#b2b4a1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crinifer_piscator_-Lotherton_Hall%2C_West_Yorkshire%2C_England-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Crinifer_piscator_-Lotherton_Hall%2C_West_Yorkshire%2C_England-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#717269\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bare-faced_Go-away-bird_RWD5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bare-faced_Go-away-bird_RWD5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#6f7053\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2009-white-bellied-goaway-bird.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2009-white-bellied-goaway-bird.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"394\" style=\"background-color:#8d8b88\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tauraco_fischeri.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tauraco_fischeri.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"312\" style=\"background-color:#827462\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_otidiformes\" class=\"tree_box\"><span><span>Otidiformes</span><a href=\"https://en.wikipedia.org/wiki/Otidiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Otidiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Otidiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Otidiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(bustards, floricans, korhaans)</span><p class=\"tag\">Elusive ground-dwelling birds adaptated to open landscapes with an elegant walk tht reluctantly fly.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cayley_Ardeotis_australis_flipped.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cayley_Ardeotis_australis_flipped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"300\" style=\"background-color:#e8e4df\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Denham%27s_Bustard_%28Neotis_denhami%29_%287083219537%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Denham%27s_Bustard_%28Neotis_denhami%29_%287083219537%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#778536\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bengal_Florican_Houbaropsis_bengalensis_bengalensis_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Bengal_Florican_Houbaropsis_bengalensis_bengalensis_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"305\" style=\"background-color:#9aa366\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Northern_black_korhaan_%28Afrotis_afraoides%29_male.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Northern_black_korhaan_%28Afrotis_afraoides%29_male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#928f7b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blue_Korhaan_%28Eupodotis_caerulescens%29_male.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Blue_Korhaan_%28Eupodotis_caerulescens%29_male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"315\" style=\"background-color:#b1997b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kori_Bustard_Bushes_2019-07-26.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Kori_Bustard_Bushes_2019-07-26.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#7f8080\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_cuculiformes\" class=\"tree_box\"><span><span>Cuculiformes</span><a href=\"https://en.wikipedia.org/wiki/Cuculiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cuculiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cuculiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cuculiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=kjuːˈkjuːlɪfɔːrmiːz\" target=\"_blank\">kjuːˈkjuːlɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(cuckoos, roadrunners, koels, malkohas, couas, coucals, anis)</span><p class=\"tag\">Small to medium sized birds, slender birds, often with a long tail. Most species live in trees, with some ground-dwelling. Some species are brood parasites.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:British_birds_in_their_haunts_%28Cuculus_canorus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/British_birds_in_their_haunts_%28Cuculus_canorus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"680\" height=\"528\" style=\"background-color:#dad4cb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cuculus_canorus_vogelartinfo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cuculus_canorus_vogelartinfo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"228\" style=\"background-color:#7d9fb6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lesser_Roadrunner_-_Mexico_S4E1497.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lesser_Roadrunner_-_Mexico_S4E1497.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#778e3d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pacific_koel_male_kob08.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Pacific_koel_male_kob08.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"287\" style=\"background-color:#939070\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chestnut-breasted_Malkoha_San_Deigo_Zoo_2009.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chestnut-breasted_Malkoha_San_Deigo_Zoo_2009.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#56644d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coquerel%27s_Coua%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Coquerel%27s_Coua%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"252\" style=\"background-color:#a58058\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Senegal_coucal_%28Centropus_senegalensis_senegalensis%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Senegal_coucal_%28Centropus_senegalensis_senegalensis%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#9e7c69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:ANU-PRETO_%28Crotophaga_ani%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-ANU-PRETO_%28Crotophaga_ani%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"366\" style=\"background-color:#6d81a7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Reed_warbler_cuckoo.jpg\" target=\"_blank\"><img src=\"thumbnails/426px-Reed_warbler_cuckoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"426\" height=\"600\" style=\"background-color:#6c6a46\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Neoaves_Elementaves\"><label class=\"tree_label\" for=\"Neoaves_Elementaves\"></label><div class=\"outer_tree_box\"><div id=\"aves_elementaves\" class=\"tree_box\"><span><span>Elementaves</span><a href=\"https://en.wikipedia.org/wiki/Elementaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Elementaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Elementaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Elementaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(hoatzin, cranes, puffins, gulls, frogmouths, swifts, hummingbirds, tropicbirds, loons, albatrosses, penguins, storks, frigatebirds, boobies, pelicans, ibises)</span><p class=\"tag\">This clade is only proposed! The clade&#x27;s name refers to the classical elements, reflecting its members&#x27; varying adaptations to earth, air, and water</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cuvier-59-Hoazin_hupp%C3%A9.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cuvier-59-Hoazin_hupp%C3%A9.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#dcd8d4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cuvier-72-Grue_cendr%C3%A9e.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cuvier-72-Grue_cendr%C3%A9e.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"356\" style=\"background-color:#e3e2e0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Papageitaucher_Fratercula_arctica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Papageitaucher_Fratercula_arctica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#8f958f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Larus_argentatus_ad.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Larus_argentatus_ad.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#5c6f89\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#92bae8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Purple-throated_carib_hummingbird_feeding.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Purple-throated_carib_hummingbird_feeding.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#88814e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:A_Tawny_frogmouth%2C_Podargus_strigoides.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-A_Tawny_frogmouth%2C_Podargus_strigoides.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6f7270\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#475973\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gavia_arctica_EM1B1934_%2848009481846%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gavia_arctica_EM1B1934_%2848009481846%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#6a8198\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phoebastria_albatrus1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phoebastria_albatrus1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#97a4a0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#1d7690\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Yellow-billed_Stork_%28Mycteria_ibis%29_%2812011503884%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Yellow-billed_Stork_%28Mycteria_ibis%29_%2812011503884%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#80857a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pelecanus_conspicillatus_-Australia_-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pelecanus_conspicillatus_-Australia_-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#446379\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Magnificent-Frigate-male.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Magnificent-Frigate-male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#94cee7\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_opisthocomiformes\" class=\"tree_box\"><span><span>Opisthocomiformes</span><a href=\"https://en.wikipedia.org/wiki/Opisthocomiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Opisthocomiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Opisthocomiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Opisthocomiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(hoatzin, stinkbird)</span><p class=\"tag\">A tropical bird found in South America with a digestive system that ferments plant matter. The chicks have two claws on each wing.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cuvier-59-Hoazin_hupp%C3%A9.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cuvier-59-Hoazin_hupp%C3%A9.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#dcd8d4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hoatzin_%28Opisthocomus_hoazin%29_Rio_Napo.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hoatzin_%28Opisthocomus_hoazin%29_Rio_Napo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#9aa7a5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hoatzin_%28Opisthocomus_hoazin%29_head_Rio_Napo.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hoatzin_%28Opisthocomus_hoazin%29_head_Rio_Napo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#72735d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rurrenabaque_Bolivia_-_The_Amazon.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rurrenabaque_Bolivia_-_The_Amazon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#979795\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_gruiformes\" class=\"tree_box\"><span><span>Gruiformes</span><a href=\"https://en.wikipedia.org/wiki/Gruiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gruiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gruiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gruiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈɡruːɪfɔːrmiːz\" target=\"_blank\">ˈɡruːɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(rails, cranes, crakes, coots, flufftails, finfoots, limpkin, trumpeters, quails)</span><p class=\"tag\">The cranes &amp; allies but the group is varied and many are not so crane-like. Ground-feeding and nesting birds. Many species have elaborate courtship displays and long seasonal migrations.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cuvier-72-Grue_cendr%C3%A9e.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cuvier-72-Grue_cendr%C3%A9e.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"356\" style=\"background-color:#e3e2e0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anthropoides_virgo_-Mongolia_-flying-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Anthropoides_virgo_-Mongolia_-flying-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6493c8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Japanse_kraanvogels_in_Akan_International_Crane_Centre%2C_-24_februari_2012_a.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Japanse_kraanvogels_in_Akan_International_Crane_Centre%2C_-24_februari_2012_a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#8d8c90\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grey_crowned_crane_at_Martin_Mere.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Grey_crowned_crane_at_Martin_Mere.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#857e68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sandhill_bare_areas.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sandhill_bare_areas.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"243\" style=\"background-color:#94896a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dusky_moorhen442.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dusky_moorhen442.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#958055\"></a><a href=\"https://commons.wikimedia.org/wiki/File:African_Finfoot%2C_male_breeding.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-African_Finfoot%2C_male_breeding.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"218\" style=\"background-color:#807350\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grey-wing_Turmpeter_RWD.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grey-wing_Turmpeter_RWD.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#95917d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brown_Quail.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Brown_Quail.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"273\" style=\"background-color:#9da076\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_charadriiformes\" class=\"tree_box\"><span><span>Charadriiformes</span><a href=\"https://en.wikipedia.org/wiki/Charadriiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Charadriiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Charadriiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Charadriiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=kəˈrædri.ɪfɔːrmiːz\" target=\"_blank\">kəˈrædri.ɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(sandpipers, puffins, gulls, plovers, phalaropes, stilts, jacanas, painted snipes, pratincoles, terns, seedsnipes, sheathbills, skimmers, skuas, auks, alcids, false quails)</span><p class=\"tag\">Small to medium-large birds that are waterbirds or birds clearly derived from waterbirds found along seacoasts and inland waters, with many called shorebirds. Most eat invertebrates or other small animals.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:D%27Orbigny-Mouette_rieuse_et_Bec-en-ciseaux_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-D%27Orbigny-Mouette_rieuse_et_Bec-en-ciseaux_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"218\" style=\"background-color:#e3e2e1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CURLEW%2C_LONG-BILLED_%283-22-10%29_morro_bay%2C_ca_-04_%284455146301%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-CURLEW%2C_LONG-BILLED_%283-22-10%29_morro_bay%2C_ca_-04_%284455146301%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"242\" style=\"background-color:#6e8ca1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black-breasted_Button-quail_male_inskip.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Black-breasted_Button-quail_male_inskip.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"249\" style=\"background-color:#724f2c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Reiherl%C3%A4ufer.jpg\" target=\"_blank\"><img src=\"thumbnails/Reiherl%C3%A4ufer.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"438\" style=\"background-color:#60665a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Larus_argentatus_ad.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Larus_argentatus_ad.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#5c6f89\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Laridae_on_Lake_Baikal.png\" target=\"_blank\"><img src=\"thumbnails/330px-Laridae_on_Lake_Baikal.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"286\" style=\"background-color:#85a6be\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stercorarius_antarcticus_-Godthul%2C_South_Georgia%2C_British_Overseas_Territories%2C_UK_-landing-8.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Stercorarius_antarcticus_-Godthul%2C_South_Georgia%2C_British_Overseas_Territories%2C_UK_-landing-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"282\" style=\"background-color:#776d5b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aethia_pygmaea3.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aethia_pygmaea3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"377\" style=\"background-color:#3b5669\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Papageitaucher_Fratercula_arctica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Papageitaucher_Fratercula_arctica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#8f958f\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Elementaves_Strisores\"><label class=\"tree_label\" for=\"Elementaves_Strisores\"></label><div class=\"outer_tree_box\"><div id=\"aves_strisores\" class=\"tree_box\"><span><span>Strisores</span><a href=\"https://en.wikipedia.org/wiki/Strisores\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Strisores\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Strisores\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Strisores\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=straɪˈsoʊriːz\" target=\"_blank\">straɪˈsoʊriːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(nightjars, frogmouths, swifts, hummingbirds)</span><p class=\"tag\">Basal members are nocturnal birds with wide beaks, a large gape, and soft cryptically-coloured plumage, that feed on the wing. Some of these qualities are lost in Apodiformes.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lesser_Nighthawk.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lesser_Nighthawk.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"260\" style=\"background-color:#a49b81\"></a><a href=\"https://commons.wikimedia.org/wiki/File:M%C3%A3e-da-lua-gigante_%28Nyctibius_grandis%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-M%C3%A3e-da-lua-gigante_%28Nyctibius_grandis%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#627548\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oilbirds.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Oilbirds.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"218\" style=\"background-color:#5a4c3a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:A_Tawny_frogmouth%2C_Podargus_strigoides.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-A_Tawny_frogmouth%2C_Podargus_strigoides.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6f7270\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aegotheles_chrisoptus_-_Catlereigh_Nature_Reserve.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aegotheles_chrisoptus_-_Catlereigh_Nature_Reserve.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7f6f5c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#92bae8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Purple-throated_carib_hummingbird_feeding.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Purple-throated_carib_hummingbird_feeding.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#88814e\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_caprimulgiformes\" class=\"tree_box\"><span><span>Caprimulgiformes</span><a href=\"https://en.wikipedia.org/wiki/Caprimulgiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Caprimulgiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Caprimulgiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Caprimulgiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌkæprɪˈmʌldʒɪfɔːrmiːz/ \" target=\"_blank\">ˌkæprɪˈmʌldʒɪfɔːrmiːz/ </a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(nightjars)</span><p class=\"tag\">Often nocturnal or crepuscular hunters with a highly developed sense of sight that are known for feeding on the wing and are excellent flyers with small weak legs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chordeiles_acutipennis_texensisAQBIP06CA.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chordeiles_acutipennis_texensisAQBIP06CA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"301\" style=\"background-color:#cdcac7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mlongipennis.png\" target=\"_blank\"><img src=\"thumbnails/Mlongipennis.png\" class=\"taxa-img\" loading=\"lazy\" width=\"551\" height=\"230\" style=\"background-color:#868479\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lesser_Nighthawk.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lesser_Nighthawk.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"260\" style=\"background-color:#a49b81\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Great_Eared-Nightjar%2C_Tangkoko%2C_Sulawesi_%285799113025%29_%282%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Great_Eared-Nightjar%2C_Tangkoko%2C_Sulawesi_%285799113025%29_%282%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"271\" style=\"background-color:#1c1a1b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_nyctibiiformes\" class=\"tree_box\"><span><span>Nyctibiiformes</span><a href=\"https://en.wikipedia.org/wiki/Nyctibiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Nyctibiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Nyctibiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Nyctibiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(potoos, poor-me-ones)</span><p class=\"tag\">Nocturnal insectivores that lack the bristles around the mouth found in the true nightjars that are found in central and south America. They hunt from a perch and during the day they perch upright camouflaged on tree stumps.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:NyctibiusBracteatusSmit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-NyctibiusBracteatusSmit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#cec5b9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Northern_potoo_%28Nyctibius_jamaicensis_mexicanus%29_Orange_Walk.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Northern_potoo_%28Nyctibius_jamaicensis_mexicanus%29_Orange_Walk.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#474541\"></a><a href=\"https://commons.wikimedia.org/wiki/File:M%C3%A3e-da-lua-gigante_%28Nyctibius_grandis%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-M%C3%A3e-da-lua-gigante_%28Nyctibius_grandis%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#627548\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nyctibius_griseus_471885191_27f931630d_o_Crop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nyctibius_griseus_471885191_27f931630d_o_Crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"301\" style=\"background-color:#686d4a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_steatornithiformes\" class=\"tree_box\"><span><span>Steatornithiformes</span><a href=\"https://en.wikipedia.org/wiki/Steatornithiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Steatornithiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Steatornithiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Steatornithiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(oilbirds)</span><p class=\"tag\">Nocturnal forager with specially adapted eyesight that also echolocate, eat fruit and nesting in colonies in caves. They are found in northern South America.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Steatornis_caripensis_MHNT_ZON_STEA_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Steatornis_caripensis_MHNT_ZON_STEA_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#e0dacf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oilbirds.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Oilbirds.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"218\" style=\"background-color:#5a4c3a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oilbird_%2817370415445%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Oilbird_%2817370415445%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#59524f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_podargiformes\" class=\"tree_box\"><span><span>Podargiformes</span><a href=\"https://en.wikipedia.org/wiki/Podargiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Podargiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Podargiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Podargiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(frogmouths)</span><p class=\"tag\">Nocturnal birds with weak flight from Australasia with large flattened hooked bill and huge frog-like gape that they use to eat insects and small invertebrates. During the day they rest camouflaged on branches.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Batrachostomus_septimus_01.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Batrachostomus_septimus_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"320\" style=\"background-color:#d6cac6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tawny_frogmouth_wholebody444.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tawny_frogmouth_wholebody444.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#28201b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pair_of_tawny_frogmouths.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pair_of_tawny_frogmouths.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#6a665a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:A_Tawny_frogmouth%2C_Podargus_strigoides.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-A_Tawny_frogmouth%2C_Podargus_strigoides.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6f7270\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_aegotheliformes\" class=\"tree_box\"><span><span>Aegotheliformes</span><a href=\"https://en.wikipedia.org/wiki/Aegotheliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Aegotheliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Aegotheliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Aegotheliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text= ˈstraɪsərz\" target=\"_blank\"> ˈstraɪsərz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(owlet-nightjars)</span><p class=\"tag\">Small birds that feed on insects at twilight that are found in Australasia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Aegotheles_savesi.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aegotheles_savesi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#bfbbb2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Barred_Owlet-Nightjar.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Barred_Owlet-Nightjar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#a0ab81\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aegotheles_chrisoptus_-_Catlereigh_Nature_Reserve.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aegotheles_chrisoptus_-_Catlereigh_Nature_Reserve.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7f6f5c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Australian_owlet-nightjar_A22I9928.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Australian_owlet-nightjar_A22I9928.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6d5643\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Feline_Owlet-nightjar_0A2A6959.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Feline_Owlet-nightjar_0A2A6959.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#37402d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Moluccan_Owlet-nightjar_0A2A8326.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Moluccan_Owlet-nightjar_0A2A8326.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#141411\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_apodiformes\" class=\"tree_box\"><span><span>Apodiformes</span><a href=\"https://en.wikipedia.org/wiki/Apodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Apodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Apodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Apodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈæpədɪfɔːrmiːz\" target=\"_blank\">ˈæpədɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(swifts, treeswifts, hummingbirds)</span><p class=\"tag\">Small to very small birds with a specialized wing morphology that feed while flying.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:White-eared_Hummingbird_%28Basilinna_leucotis%29_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/White-eared_Hummingbird_%28Basilinna_leucotis%29_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"499\" height=\"547\" style=\"background-color:#d2d5cf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flickr_-_Rainbirder_-_Chestnut-collared_Swift_%28Streptoprocne_rutila%29_on_the_nest.jpg\" target=\"_blank\"><img src=\"thumbnails/Flickr_-_Rainbirder_-_Chestnut-collared_Swift_%28Streptoprocne_rutila%29_on_the_nest.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"720\" height=\"515\" style=\"background-color:#533f26\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apus_apus_-Barcelona%2C_Spain-8_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#92bae8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apus_apus_flock_flying_1.jpg\" target=\"_blank\"><img src=\"thumbnails/Apus_apus_flock_flying_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"544\" height=\"389\" style=\"background-color:#6499ca\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grey_Rumped_Treeswift.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Grey_Rumped_Treeswift.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"357\" style=\"background-color:#7f99bf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Moustached_Treeswift_%28Hemiprocne_mystacea%29_-_Flickr_-_Lip_Kee.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Moustached_Treeswift_%28Hemiprocne_mystacea%29_-_Flickr_-_Lip_Kee.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"312\" style=\"background-color:#b3beda\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Archilochus_colubris_%28Male%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Archilochus_colubris_%28Male%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"227\" style=\"background-color:#aeb1a9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Purple-throated_carib_hummingbird_feeding.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Purple-throated_carib_hummingbird_feeding.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#88814e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rufous_Hummingbird%2C_male_01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rufous_Hummingbird%2C_male_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#a9a59c\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Elementaves_Eurypygimorphae\"><label class=\"tree_label\" for=\"Elementaves_Eurypygimorphae\"></label><div class=\"outer_tree_box\"><div id=\"aves_eurypygimorphae\" class=\"tree_box\"><span><span>Eurypygimorphae</span><a href=\"https://en.wikipedia.org/wiki/Eurypygimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eurypygimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eurypygimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Eurypygimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(tropicbirds, sunbittern, kagu)</span><p class=\"tag\">The least inclusive crown clade containing the red-billed tropicbird, the sunbittern, and the kagu.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#475973\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eurypyga_helias_-Smithsonian_National_Zoological_Park%2C_USA-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eurypyga_helias_-Smithsonian_National_Zoological_Park%2C_USA-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#707767\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_phaethontiformes\" class=\"tree_box\"><span><span>Phaethontiformes</span><a href=\"https://en.wikipedia.org/wiki/Phaethontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Phaethontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Phaethontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Phaethontiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌfeɪ.ɪˈθɒntɪfɔːrmiːz\" target=\"_blank\">ˌfeɪ.ɪˈθɒntɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(tropicbirds)</span><p class=\"tag\">Seabirds with elongated tail feathers.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red-billed_Tropicbird_%28Phaethon_aethereus%29_%284089464789%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#475973\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Starr_080612-8667_Calophyllum_inophyllum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Starr_080612-8667_Calophyllum_inophyllum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#615c51\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red-tailed_Tropicbird_RWD2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red-tailed_Tropicbird_RWD2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#3e4a3d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_eurypygiformes\" class=\"tree_box\"><span><span>Eurypygiformes</span><a href=\"https://en.wikipedia.org/wiki/Eurypygiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eurypygiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eurypygiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Eurypygiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(sunbittern, kagu)</span><p class=\"tag\">Medium-sized, almost flightless, non-migratory birds.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cuvier-72-Caurale_soleil.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cuvier-72-Caurale_soleil.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"295\" style=\"background-color:#d4d0cb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eurypyga_helias_-Smithsonian_National_Zoological_Park%2C_USA-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eurypyga_helias_-Smithsonian_National_Zoological_Park%2C_USA-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#707767\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kagu_0A2A3521.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Kagu_0A2A3521.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#776f62\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Elementaves_Aequornithes\"><label class=\"tree_label\" for=\"Elementaves_Aequornithes\"></label><div class=\"outer_tree_box\"><div id=\"aves_aequornithes\" class=\"tree_box\"><span><span>Aequornithes</span><a href=\"https://en.wikipedia.org/wiki/Aequornithes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Aequornithes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Aequornithes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Aequornithes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(loons, albatrosses, penguins, storks, frigatebirds, boobies, pelicans, ibises)</span><p class=\"tag\">Core waterbirds. The least inclusive crown clade containing the great white pelican and the common loon.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pelican_Safari_Park.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pelican_Safari_Park.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"325\" style=\"background-color:#4f6045\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gavia_immer_-Minocqua%2C_Wisconsin%2C_USA_-swimming-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gavia_immer_-Minocqua%2C_Wisconsin%2C_USA_-swimming-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"223\" style=\"background-color:#476374\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_gaviiformes\" class=\"tree_box\"><span><span>Gaviiformes</span><a href=\"https://en.wikipedia.org/wiki/Gaviiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gaviiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gaviiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gaviiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈɡævi.ɪfɔːrmiːz\" target=\"_blank\">ˈɡævi.ɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(loons, divers)</span><p class=\"tag\">Waterbirds that breed beside lakes and ponds in arctic and subarctic latitudes of North America.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:IJsduiker_Gavia_immer_Jos_Zwarts.tif\" target=\"_blank\"><img src=\"thumbnails/lossy-page1-320px-IJsduiker_Gavia_immer_Jos_Zwarts.tif.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"320\" height=\"157\" style=\"background-color:#e8e8e8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gavia_immer_-Osgood_Pond%2C_New_York%2C_USA_-nest-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gavia_immer_-Osgood_Pond%2C_New_York%2C_USA_-nest-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"276\" style=\"background-color:#71825a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gavia_immer_-Minocqua%2C_Wisconsin%2C_USA_-swimming-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gavia_immer_-Minocqua%2C_Wisconsin%2C_USA_-swimming-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"223\" style=\"background-color:#476374\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red-throated_Loon_%28Gavia_stellata%29_-_Summer_plumage_breeding_adult2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Red-throated_Loon_%28Gavia_stellata%29_-_Summer_plumage_breeding_adult2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"273\" style=\"background-color:#76787c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gavia_arctica_EM1B1934_%2848009481846%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gavia_arctica_EM1B1934_%2848009481846%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#6a8198\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_procellariiformes\" class=\"tree_box\"><span><span>Procellariiformes</span><a href=\"https://en.wikipedia.org/wiki/Procellariiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Procellariiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Procellariiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Procellariiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=prɒsɛˈlɛəri.ɪfɔːrmiːz\" target=\"_blank\">prɒsɛˈlɛəri.ɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(petrels, albatrosses, shearwaters)</span><p class=\"tag\">Medium to large seabirds that feed in the open ocean, travel long distances and are often known as tubenoses. They tend to form monogamous bonds and nest on remote islands.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Thalassarche_chlororhynchos_1838.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Thalassarche_chlororhynchos_1838.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"322\" style=\"background-color:#dcd3bc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Giant_petrel_-_Macronectes_giganteus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Giant_petrel_-_Macronectes_giganteus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#c6c3b6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Shearwater_migrant_flock.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Shearwater_migrant_flock.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"386\" style=\"background-color:#4a7077\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diomedea_epomophora_portrait_-_SE_Tasmania.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Diomedea_epomophora_portrait_-_SE_Tasmania.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#8c939e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phoebastria_albatrus1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phoebastria_albatrus1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#97a4a0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diomedea_exulans_in_flight_-_SE_Tasmania.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Diomedea_exulans_in_flight_-_SE_Tasmania.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"201\" style=\"background-color:#3169ad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oceanodroma_furcata1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Oceanodroma_furcata1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#4d493f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grey-backed_Storm_Petrel_0A2A8780.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grey-backed_Storm_Petrel_0A2A8780.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#acbbd3\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_sphenisciformes\" class=\"tree_box\"><span><span>Sphenisciformes</span><a href=\"https://en.wikipedia.org/wiki/Sphenisciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sphenisciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sphenisciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Sphenisciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=sfɪˈnɪsəfɔːrmiːz\" target=\"_blank\">sfɪˈnɪsəfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(penguins)</span><p class=\"tag\">Flightless seabirds with wings adapted to swimming and most species native to cool southern hemisphere waters.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chinstrap_Penguin_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/Chinstrap_Penguin_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"257\" height=\"396\" style=\"background-color:#aaaaaa\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aptenodytes_forsteri_-Snow_Hill_Island%2C_Antarctica_-adults_and_juvenile-8.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aptenodytes_forsteri_-Snow_Hill_Island%2C_Antarctica_-adults_and_juvenile-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"401\" style=\"background-color:#898c90\"></a><a href=\"https://commons.wikimedia.org/wiki/File:South_Shetland-2016-Deception_Island%E2%80%93Chinstrap_penguin_%28Pygoscelis_antarctica%29_04.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-South_Shetland-2016-Deception_Island%E2%80%93Chinstrap_penguin_%28Pygoscelis_antarctica%29_04.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#7e8488\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Snares_Penguin_%28Eudyptes_robustus%29_-group.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Snares_Penguin_%28Eudyptes_robustus%29_-group.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5e5a4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:African_penguin_side_profile.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-African_penguin_side_profile.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"274\" style=\"background-color:#726f6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Falkland_Islands_Penguins_70.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Falkland_Islands_Penguins_70.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#5c6f7e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pygoscelis_papua_-Nagasaki_Penguin_Aquarium_-swimming_underwater-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#1d7690\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_ciconiiformes\" class=\"tree_box\"><span><span>Ciconiiformes</span><a href=\"https://en.wikipedia.org/wiki/Ciconiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ciconiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ciconiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ciconiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=sɪˈkoʊni.ɪfɔːrmiːz\" target=\"_blank\">sɪˈkoʊni.ɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(storks)</span><p class=\"tag\">Long-legged and often long necked birds adapted for wading and capturing animal foods and usually fly by soaring.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Wei%C3%9Fstorch_%28Ciconia_ciconia%29_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/Wei%C3%9Fstorch_%28Ciconia_ciconia%29_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"407\" height=\"574\" style=\"background-color:#dbd7d4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ringed_white_stork.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ringed_white_stork.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7f99b9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dvorac_Bisag_-_roda.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dvorac_Bisag_-_roda.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#939ba7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:African_openbill%2C_Anastomus_lamelligerus%2C_Chobe_National_Park%2C_Botswana_%2832390774275%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-African_openbill%2C_Anastomus_lamelligerus%2C_Chobe_National_Park%2C_Botswana_%2832390774275%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#7f7d72\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abdim%27s_Stork_%28Ciconia_abdimii%29_%287011390701%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Abdim%27s_Stork_%28Ciconia_abdimii%29_%287011390701%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#668eae\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Yellow-billed_Stork_%28Mycteria_ibis%29_%2812011503884%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Yellow-billed_Stork_%28Mycteria_ibis%29_%2812011503884%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#80857a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_suliformes\" class=\"tree_box\"><span><span>Suliformes</span><a href=\"https://en.wikipedia.org/wiki/Suliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Suliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Suliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Suliformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈsjuːlɪfɔːrmiːz\" target=\"_blank\">ˈsjuːlɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(frigatebirds, gannets, cormorants, darters, totipalmate, shags, anhingas, boobies)</span><p class=\"tag\">Pelagic piscivores of tropical oceans. They obtain food on the wing and can stay airborne for long periods.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cormorant_in_Strunjan%2C_white_background.png\" target=\"_blank\"><img src=\"thumbnails/330px-Cormorant_in_Strunjan%2C_white_background.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"257\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brown_boobytern.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Brown_boobytern.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"354\" style=\"background-color:#698696\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Northern_Gannet_2006_2.jpg\" target=\"_blank\"><img src=\"thumbnails/Northern_Gannet_2006_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"775\" height=\"517\" style=\"background-color:#869fc6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lamberts_Bay_P1010338.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Lamberts_Bay_P1010338.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7c7a75\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fou.varie1.jpg\" target=\"_blank\"><img src=\"thumbnails/Fou.varie1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"650\" height=\"433\" style=\"background-color:#9db4d2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fregata_magnificens_-Galapagos%2C_Ecuador_-male-8_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fregata_magnificens_-Galapagos%2C_Ecuador_-male-8_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"268\" style=\"background-color:#795c41\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Magnificent-Frigate-male.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Magnificent-Frigate-male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#94cee7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Little_cormorant_%28Microcarbo_niger%29_-_20070322.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Little_cormorant_%28Microcarbo_niger%29_-_20070322.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"290\" style=\"background-color:#a4a6a1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phalacrocorax_atriceps%2C_Beagle_Channel.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Phalacrocorax_atriceps%2C_Beagle_Channel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"306\" style=\"background-color:#939194\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anhinga_rufa_-Chobe_River_front%2C_Botswana-8.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Anhinga_rufa_-Chobe_River_front%2C_Botswana-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#7e837b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_pelecaniformes\" class=\"tree_box\"><span><span>Pelecaniformes</span><a href=\"https://en.wikipedia.org/wiki/Pelecaniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pelecaniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pelecaniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pelecaniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=pɛlɪˈkænɪfɔːrmiːz\" target=\"_blank\">pɛlɪˈkænɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(pelicans, herons, ibises, spoonbills, bitterns, hammerkop, shoebills)</span><p class=\"tag\">Medium to large sized aquatic birds that eat fish or squid and have all four toes webbed. Most members have distensible bare throat patch between the branches of the lower mandible.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Spot-billed_pelican_takeoff_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Spot-billed_pelican_takeoff_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"258\" style=\"background-color:#eae5e0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scarlet_ibis_arp.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Scarlet_ibis_arp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"244\" style=\"background-color:#9f8051\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black-headed_Ibis_%28Threskiornis_melanocephalus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Black-headed_Ibis_%28Threskiornis_melanocephalus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#898445\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Yellow_Bittern_hunting.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Yellow_Bittern_hunting.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"205\" style=\"background-color:#57734c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Goliath_heron_standing_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Goliath_heron_standing_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"380\" style=\"background-color:#7b7680\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Heron_tricol_01.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Heron_tricol_01.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"271\" style=\"background-color:#949390\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hamerkop_%28Scopus_umbretta_umbretta%29_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hamerkop_%28Scopus_umbretta_umbretta%29_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7d9fbc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Balaeniceps_rex.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Balaeniceps_rex.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#364d2d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pelikan_Walvis_Bay.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pelikan_Walvis_Bay.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#948f8d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pelecanus_conspicillatus_-Australia_-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pelecanus_conspicillatus_-Australia_-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#446379\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Neoaves_Telluraves\"><label class=\"tree_label\" for=\"Neoaves_Telluraves\"></label><div class=\"outer_tree_box\"><div id=\"aves_telluraves\" class=\"tree_box\"><span><span>Telluraves</span><a href=\"https://en.wikipedia.org/wiki/Telluraves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Telluraves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Telluraves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Telluraves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(owls, raptors, mousebirds, kingfishers, woodpeckers, toucans, falcons, parrots, passerines)</span><p class=\"tag\">Core landbirds. The least inclusive crown clade containing the northern sparrowhawk and the house sparrow.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Accipiter_nisus_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Accipiter_nisus_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"307\" style=\"background-color:#818d61\"></a><a href=\"https://commons.wikimedia.org/wiki/File:House_Sparrow%2C_England_-_May_09.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-House_Sparrow%2C_England_-_May_09.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"277\" style=\"background-color:#919853\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Telluraves_Afroaves\"><label class=\"tree_label\" for=\"Telluraves_Afroaves\"></label><div class=\"outer_tree_box\"><div id=\"aves_afroaves\" class=\"tree_box\"><span><span>Afroaves</span><a href=\"https://en.wikipedia.org/wiki/Afroaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Afroaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Afroaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Afroaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(owls, raptors, mousebirds, kingfishers, woodpeckers, toucans)</span><p class=\"tag\">The least inclusive crown clade containing the northern sparrowhawk, white-backed mousebird and European green woodpecker but not the house sparrow.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Accipiter_nisus_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Accipiter_nisus_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"307\" style=\"background-color:#818d61\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Colius_White-backed_mousebird_feeding_on_Duranta_berries_9860s.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Colius_White-backed_mousebird_feeding_on_Duranta_berries_9860s.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"406\" style=\"background-color:#6b7a4e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:European_green_woodpecker_%28Picus_viridis%29_female_Barnes.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-European_green_woodpecker_%28Picus_viridis%29_female_Barnes.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"355\" style=\"background-color:#716b3d\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_strigiformes\" class=\"tree_box\"><span><span>Strigiformes</span><a href=\"https://en.wikipedia.org/wiki/Strigiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Strigiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Strigiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Strigiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈstrɪdʒəfɔːrmiːz\" target=\"_blank\">ˈstrɪdʒəfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(owls)</span><p class=\"tag\">Solitary, nocturnal birds of prey occupying all regions of earth except Antarctica. Rounded heads with large eyes; upright stance; feathers adapted for silent flight; legs and toes often feathered; hunt mostly small mammals, insects.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cuvier-12-Hibou_%C3%A0_huppe_courte.jpg\" target=\"_blank\"><img src=\"thumbnails/Cuvier-12-Hibou_%C3%A0_huppe_courte.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"514\" height=\"670\" style=\"background-color:#dcd5c9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pulsatrix_perspicillata.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pulsatrix_perspicillata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"382\" style=\"background-color:#857d75\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coruja-de-crista_%28Lophostrix_cristata%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Coruja-de-crista_%28Lophostrix_cristata%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#7c904d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eastern_Screech_Owl.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eastern_Screech_Owl.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#85775f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ceylon_Bay_Owl1_Abhilash_Arjunan.jpg\" target=\"_blank\"><img src=\"thumbnails/Ceylon_Bay_Owl1_Abhilash_Arjunan.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"489\" height=\"720\" style=\"background-color:#858a5b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Harfang_en_vol_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Harfang_en_vol_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"329\" height=\"223\" style=\"background-color:#6684a5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SpottedEagleOwl2539MGEyeLid.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-SpottedEagleOwl2539MGEyeLid.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#807d77\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Owl_sleeping_in_tree.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Owl_sleeping_in_tree.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#65635f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_accipitriformes\" class=\"tree_box\"><span><span>Accipitriformes</span><a href=\"https://en.wikipedia.org/wiki/Accipitriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Accipitriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Accipitriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Accipitriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ækˌsɪpɪtrɪˈfɔːrmiːz\" target=\"_blank\">ækˌsɪpɪtrɪˈfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(raptors, hawks, eagles, vultures, harriers, kites, ospreys, secretarybirds)</span><p class=\"tag\">Diurnal birds of prey with a sharply hooked bill, wings optimised for souring and sharp curved talons. Female can be up to twice as large. </p><div><a href=\"https://commons.wikimedia.org/wiki/File:Golden_Eagle_Illustration_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/Golden_Eagle_Illustration_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"362\" height=\"481\" style=\"background-color:#d1c9bc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wedge_tailed_eagle_in_flight04.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wedge_tailed_eagle_in_flight04.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7d9ecd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Circus_aeruginosus_Valencia_3.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Circus_aeruginosus_Valencia_3.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6e5238\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red-tailed_Hawk.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Red-tailed_Hawk.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#948e7a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Milvus_milvus_Jura.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Milvus_milvus_Jura.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#69849a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gyps_africanus_Torgos_tracheliotus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gyps_africanus_Torgos_tracheliotus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"266\" style=\"background-color:#8c957d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Osprey_at_Shadow_Mountain_Lake%2C_CO_8-27-12_%288054292660%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Osprey_at_Shadow_Mountain_Lake%2C_CO_8-27-12_%288054292660%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"451\" style=\"background-color:#b8b7b6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Osprey_with_its_nest.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Osprey_with_its_nest.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#b2b1ad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Greater_Yellow-headed_Vulture_%28Cathartes_melambrotus%29_in_flight_from_below.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Greater_Yellow-headed_Vulture_%28Cathartes_melambrotus%29_in_flight_from_below.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"228\" style=\"background-color:#507eb3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Urubu_a_tete_rouge_-_Turkey_Vulture.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Urubu_a_tete_rouge_-_Turkey_Vulture.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"357\" style=\"background-color:#74716b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sagittarius_serpentarius_Sekret%C3%A4r.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Sagittarius_serpentarius_Sekret%C3%A4r.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"343\" style=\"background-color:#9e8a6e\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Afroaves_Coraciimorphae\"><label class=\"tree_label\" for=\"Afroaves_Coraciimorphae\"></label><div class=\"outer_tree_box\"><div id=\"aves_coraciimorphae\" class=\"tree_box\"><span><span>Coraciimorphae</span><a href=\"https://en.wikipedia.org/wiki/Coraciimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Coraciimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Coraciimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Coraciimorphae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(mousebirds, trogons, hornbills, kingfishers, woodpeckers, toucans)</span><p class=\"tag\">A diversified clade of predominantly diurnal and arboreal birds.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Fishing_-_Alcedo_atthis%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fishing_-_Alcedo_atthis%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"266\" style=\"background-color:#7c9236\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Toco_toucan_-_panoramio_-_Basa_Roland.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Toco_toucan_-_panoramio_-_Basa_Roland.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#516a51\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abyssinian_Ground_Hornbill_RWD3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Abyssinian_Ground_Hornbill_RWD3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#606754\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Harpactes_erythrocephalus_-_Khao_Yai.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Harpactes_erythrocephalus_-_Khao_Yai.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#9eac5f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Male_cuckoo_roller.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Male_cuckoo_roller.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#c1c4c4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Urocolius_macrourus-20090110B.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Urocolius_macrourus-20090110B.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"326\" style=\"background-color:#557452\"></a><a href=\"https://commons.wikimedia.org/wiki/File:PileatedWoodpeckerFeedingonTree%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-PileatedWoodpeckerFeedingonTree%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"277\" style=\"background-color:#746559\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dacelo_novaeguineae_waterworks.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dacelo_novaeguineae_waterworks.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"241\" style=\"background-color:#747f71\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_coliiformes\" class=\"tree_box\"><span><span>Coliiformes</span><a href=\"https://en.wikipedia.org/wiki/Coliiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Coliiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Coliiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Coliiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(mousebirds)</span><p class=\"tag\">Slender greyish or brown birds with soft, hairlike body feathers with pamprodactyl feet found in sub-Saharan Africa. They are arboreal and scurry through the leaves like rodents, in search of berries, fruit and buds.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:ColiusCastanonotusKeulemans.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-ColiusCastanonotusKeulemans.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"339\" style=\"background-color:#ddd7c8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Urocolius_macrourus-20090110B.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Urocolius_macrourus-20090110B.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"326\" style=\"background-color:#557452\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Colius_striatus1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Colius_striatus1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"235\" style=\"background-color:#5f633d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:White-headed_Mousebird_-_Samburu_NH8O5520.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-White-headed_Mousebird_-_Samburu_NH8O5520.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#726746\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red-faced_Mousebird_Urocolius_indicus_in_flight_2012_05_08_6358t.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Red-faced_Mousebird_Urocolius_indicus_in_flight_2012_05_08_6358t.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#454d50\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_leptosomiformes\" class=\"tree_box\"><span><span>Leptosomiformes</span><a href=\"https://en.wikipedia.org/wiki/Leptosomiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Leptosomiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Leptosomiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Leptosomiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=lɛptoʊˈsɒmɪdiː\" target=\"_blank\">lɛptoʊˈsɒmɪdiː</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(cuckoo roller)</span><p class=\"tag\">A medium-large sexually dichromatic bird with zygodactyl feet that feeds on vertebrates and insects. It nests in tree cavities and is found in forests and woodlands of Madagascar and the Comoro Islands.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Leptosomus_discolor_-_1825-1834_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28cropped%29.tif\" target=\"_blank\"><img src=\"thumbnails/lossy-page1-200px-Leptosomus_discolor_-_1825-1834_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28cropped%29.tif.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"200\" height=\"240\" style=\"background-color:#cabeab\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leptosomusdiscolorcrop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Leptosomusdiscolorcrop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"350\" style=\"background-color:#5e6252\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Male_cuckoo_roller.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Male_cuckoo_roller.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#c1c4c4\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_trogoniformes\" class=\"tree_box\"><span><span>Trogoniformes</span><a href=\"https://en.wikipedia.org/wiki/Trogoniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Trogoniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Trogoniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Trogoniformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(trogons, quetzals)</span><p class=\"tag\">Birds that live in tropical forests worldwide that nest in holes dug into trees or termite nests. They feed on insects and fruit, have distinct male and female plumage, and a heterodactyl toe arrangement.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Harpactes_fasciatus_1838_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Harpactes_fasciatus_1838_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"296\" style=\"background-color:#ddd2d0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:PhilippineTrogonFemale.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-PhilippineTrogonFemale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"313\" style=\"background-color:#718232\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Javan_Trogon_%28Harpactes_reinwardtii_reinwardtii%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Javan_Trogon_%28Harpactes_reinwardtii_reinwardtii%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#717647\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Quetzal01.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Quetzal01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"340\" style=\"background-color:#83916a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Priotelus_temnurus_-Matanzas_Province%2C_Cuba-8.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Priotelus_temnurus_-Matanzas_Province%2C_Cuba-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"352\" style=\"background-color:#848a70\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Harpactes_erythrocephalus_-_Khao_Yai.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Harpactes_erythrocephalus_-_Khao_Yai.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#9eac5f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_bucerotiformes\" class=\"tree_box\"><span><span>Bucerotiformes</span><a href=\"https://en.wikipedia.org/wiki/Bucerotiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Bucerotiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Bucerotiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Bucerotiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=bjuːˈsɛrətɪfɔːrmiːz\" target=\"_blank\">bjuːˈsɛrətɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(hornbills, hoopoes)</span><p class=\"tag\">Medium to large birds many with bright beaks and others with large curved beaks. Some species wall the female into a tree cavity while she incubates the eggs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:A_monograph_of_the_Bucerotid%C3%A6%2C_or_family_of_the_hornbills_%28Plate_II%29_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/A_monograph_of_the_Bucerotid%C3%A6%2C_or_family_of_the_hornbills_%28Plate_II%29_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"594\" height=\"450\" style=\"background-color:#c5c4c3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Common_Scimitar-bill_01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Common_Scimitar-bill_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#b9b7b7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hoopoe_with_insect.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hoopoe_with_insect.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#715c4c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abyssinian_Ground_Hornbill_RWD3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Abyssinian_Ground_Hornbill_RWD3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#606754\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Southern_Ground-hornbill_%28Bucorvus_leadbeateri%29_-side_beak_open.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Southern_Ground-hornbill_%28Bucorvus_leadbeateri%29_-side_beak_open.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#665745\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Great_hornbill_%28Buceros_bicornis%29_Photograph_by_Shantanu_Kuveskar.jpg\" target=\"_blank\"><img src=\"thumbnails/Great_hornbill_%28Buceros_bicornis%29_Photograph_by_Shantanu_Kuveskar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#768b69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Malabar_Grey_Hornbill_DSCN8046.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Malabar_Grey_Hornbill_DSCN8046.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#88837c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_coraciiformes\" class=\"tree_box\"><span><span>Coraciiformes</span><a href=\"https://en.wikipedia.org/wiki/Coraciiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Coraciiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Coraciiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Coraciiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(kingfishers, kookaburras, rollers, bee-eaters, rollers, todies, motmots)</span><p class=\"tag\">Colourful birds with syndactyly toes and usually bright plumage often eating either fish or insects. Most nest in cavities or mud banks.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cuvier-46-Martin-p%C3%AAcheur_d%27Europe.jpg\" target=\"_blank\"><img src=\"thumbnails/Cuvier-46-Martin-p%C3%AAcheur_d%27Europe.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"478\" height=\"409\" style=\"background-color:#d0cdc7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:European_roller.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-European_roller.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#a2a198\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dacelo_novaeguineae_waterworks.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dacelo_novaeguineae_waterworks.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"241\" style=\"background-color:#747f71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fishing_-_Alcedo_atthis%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fishing_-_Alcedo_atthis%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"266\" style=\"background-color:#7c9236\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ein_Eisvogel_im_Schwebflug.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ein_Eisvogel_im_Schwebflug.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#67805b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nyctyornis_amictus_-_Kaeng_Krachan.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nyctyornis_amictus_-_Kaeng_Krachan.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#6d7562\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blue-throated_Roller_from_Canopy_Walkway_-_Kakum_NP_-_Ghana_14_S4E1636_%2816011512580%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Blue-throated_Roller_from_Canopy_Walkway_-_Kakum_NP_-_Ghana_14_S4E1636_%2816011512580%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#adb7be\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blue-crowned_Motmot_back_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Blue-crowned_Motmot_back_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#5b6e49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jamaican_tody_%28Todus_todus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Jamaican_tody_%28Todus_todus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7c8d3b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_piciformes\" class=\"tree_box\"><span><span>Piciformes</span><a href=\"https://en.wikipedia.org/wiki/Piciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Piciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Piciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Piciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈpɪsɪfɔːrmiːz\" target=\"_blank\">ˈpɪsɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(woodpeckers, honeyguides, toucans, barbets, jacamars, puffbirds, nunbirds)</span><p class=\"tag\">Arboreal insectivorous birds with a peculiar arrangement of the tendons of the toes. Nearly all have zygodactyl feet—two with toes forward and two back.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Dendrocopos_major_-Durham%2C_England_-female-8_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/Dendrocopos_major_-Durham%2C_England_-female-8_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"437\" height=\"337\" style=\"background-color:#dcdbdd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red-headed_barbet_%28Eubucco_bourcierii_aequatorialis%29_male_Paz_de_las_Aves.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red-headed_barbet_%28Eubucco_bourcierii_aequatorialis%29_male_Paz_de_las_Aves.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#636a40\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Toco_toucan_-_panoramio_-_Basa_Roland.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Toco_toucan_-_panoramio_-_Basa_Roland.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#516a51\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flickr_-_Rainbirder_-_Scaly-throated_Honeyguide_%28Indicator_variegatus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/504px-Flickr_-_Rainbirder_-_Scaly-throated_Honeyguide_%28Indicator_variegatus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"504\" height=\"599\" style=\"background-color:#98a4a7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rufous-tailed_jacamar_%28Galbula_ruficauda%29_male_2.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Rufous-tailed_jacamar_%28Galbula_ruficauda%29_male_2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#938278\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lanceolated_Monklet_%28Micromonacha_lanceolata%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lanceolated_Monklet_%28Micromonacha_lanceolata%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"261\" style=\"background-color:#adaba0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Monasa_atra_-_Black_nunbird.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Monasa_atra_-_Black_nunbird.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"283\" style=\"background-color:#67695e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:PileatedWoodpeckerFeedingonTree%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-PileatedWoodpeckerFeedingonTree%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"277\" style=\"background-color:#746559\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Telluraves_Australaves\"><label class=\"tree_label\" for=\"Telluraves_Australaves\"></label><div class=\"outer_tree_box\"><div id=\"aves_australaves\" class=\"tree_box\"><span><span>Australaves</span><a href=\"https://en.wikipedia.org/wiki/Australaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Australaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Australaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Australaves\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(falcons, parrots, passerines)</span><p class=\"tag\">The least inclusive crown clade containing the crested seriema and the house sparrow. Members are altricial (young are underdeveloped at the time of birth).</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cariama_cristata_-near_Goiania%2C_Goias%2C_Brazil-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cariama_cristata_-near_Goiania%2C_Goias%2C_Brazil-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"241\" style=\"background-color:#aa7645\"></a><a href=\"https://commons.wikimedia.org/wiki/File:House_sparrow_male_in_Prospect_Park_%2853532%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-House_sparrow_male_in_Prospect_Park_%2853532%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"257\" style=\"background-color:#a3a67a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:House_Sparrow%2C_England_-_May_09.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-House_Sparrow%2C_England_-_May_09.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"277\" style=\"background-color:#919853\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_cariamiformes\" class=\"tree_box\"><span><span>Cariamiformes</span><a href=\"https://en.wikipedia.org/wiki/Cariamiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cariamiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cariamiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cariamiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(seriemas, terror birds)</span><p class=\"tag\">Primarily flightless birds that are basal to the rest of Australaves.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cariama_cristata_1838_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cariama_cristata_1838_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"318\" style=\"background-color:#ece8e5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Seriema_de_Perna_Vermelha_I.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Seriema_de_Perna_Vermelha_I.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#6f955a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black-legged_seriema_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/Black-legged_seriema_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"457\" height=\"387\" style=\"background-color:#6c5842\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Skeleton_of_Titanis_at_the_Florida_Museum_of_Natural_History.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Skeleton_of_Titanis_at_the_Florida_Museum_of_Natural_History.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"261\" style=\"background-color:#7e4c30\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_falconiformes\" class=\"tree_box\"><span><span>Falconiformes</span><a href=\"https://en.wikipedia.org/wiki/Falconiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Falconiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Falconiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Falconiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=fælˈkɒnɪˌfɔːrmiːz\" target=\"_blank\">fælˈkɒnɪˌfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(falcons, caracaras, kestrels)</span><p class=\"tag\">Diurnal birds of prey. Male is often considerably smaller than the female. They are highly adept fliers and hunters.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:NewZealandFalconBuller_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/NewZealandFalconBuller_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"263\" height=\"530\" style=\"background-color:#c4bcb5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brown-Falcon%2C-Vic%2C-3.1.2008.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Brown-Falcon%2C-Vic%2C-3.1.2008.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#686a49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Falco_vespertinus.jpg\" target=\"_blank\"><img src=\"thumbnails/Falco_vespertinus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"350\" height=\"400\" style=\"background-color:#8b94b0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lachfalke.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lachfalke.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#7b8e9e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ave_Carcar%C3%A1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ave_Carcar%C3%A1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9d7254\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Common_kestrel_falco_tinnunculus.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Common_kestrel_falco_tinnunculus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"353\" style=\"background-color:#676435\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black_Caracara_-_Chupacacao_Negro_%28Daptrius_ater%29_%2814909975447%29_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Black_Caracara_-_Chupacacao_Negro_%28Daptrius_ater%29_%2814909975447%29_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"298\" style=\"background-color:#7a8173\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caracara_cheriway_-Brevard_Zoo-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caracara_cheriway_-Brevard_Zoo-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"274\" style=\"background-color:#84827d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_psittaciformes\" class=\"tree_box\"><span><span>Psittaciformes</span><a href=\"https://en.wikipedia.org/wiki/Psittaciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Psittaciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Psittaciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Psittaciformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(parrots, parakeets, macaws, cockatoos, lorikeets, budgerigar)</span><p class=\"tag\">Birds with a strong curved beak, upright stance, and strong zygodactyl feet (two toes facing forward and two back) that are known for their vocal ability and intelligence.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pyrrhura_lucianii_-_Castelnau_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pyrrhura_lucianii_-_Castelnau_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"242\" style=\"background-color:#d4d3cf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sirocco_full_length_portrait.jpg\" target=\"_blank\"><img src=\"thumbnails/Sirocco_full_length_portrait.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"344\" height=\"450\" style=\"background-color:#757c68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kea.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Kea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#8c8986\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rainbow_lorikeet.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Rainbow_lorikeet.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#494e35\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Melopsittacus_undulatus_%2824082227505%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Melopsittacus_undulatus_%2824082227505%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7b7754\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Psittrichas_fulgidus_-Jurong_Bird_Park-8a.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Psittrichas_fulgidus_-Jurong_Bird_Park-8a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"319\" style=\"background-color:#5c4236\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ara_ararauna_Luc_Viatour.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ara_ararauna_Luc_Viatour.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#5b6b35\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Congo_African_Grey_Parrot_-head_detail.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Congo_African_Grey_Parrot_-head_detail.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#565d4e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cacatua_galerita_-perching_on_branch_-crest-8a-2c.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cacatua_galerita_-perching_on_branch_-crest-8a-2c.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#8d7763\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kaka-Parrots.jpg\" target=\"_blank\"><img src=\"thumbnails/Kaka-Parrots.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"760\" height=\"570\" style=\"background-color:#70765e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"aves_passeriformes\" class=\"tree_box\"><span><span>Passeriformes</span><a href=\"https://en.wikipedia.org/wiki/Passeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Passeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Passeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Passeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈpæsərɪfɔːrmiːz\" target=\"_blank\">ˈpæsərɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"passeriformes\">See children</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(passerines, sparrows, martins, treecreepers, bowerbirds, wrens, honeyeaters, warblers, babblers, shrikes, larks, ifrits, birds-of-paradise, crows, ravens, jays, magpies)</span><p class=\"tag\">A diverse and rich assemblage of mostly small land birds with strong feet for perching and grabbing branches.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cuvier-33-Moineau_domestique.jpg\" target=\"_blank\"><img src=\"thumbnails/Cuvier-33-Moineau_domestique.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"614\" height=\"371\" style=\"background-color:#ded9d3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rock_wren.jpg\" target=\"_blank\"><img src=\"thumbnails/Rock_wren.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"650\" height=\"433\" style=\"background-color:#beb89f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gymnopithys-leucaspis-001_edit2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gymnopithys-leucaspis-001_edit2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#5c5339\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flickr_-_Rainbirder_-_Long-tailed_Manakin_%28Chiroxiphia_linearis%29.jpg\" target=\"_blank\"><img src=\"thumbnails/500px-Flickr_-_Rainbirder_-_Long-tailed_Manakin_%28Chiroxiphia_linearis%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"739\" style=\"background-color:#556740\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Turca%2C_Alto_del_Naranjo_01nov14_.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Turca%2C_Alto_del_Naranjo_01nov14_.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#9c9186\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Yellow_bellied_Asity12.jpg\" target=\"_blank\"><img src=\"thumbnails/Yellow_bellied_Asity12.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"689\" height=\"477\" style=\"background-color:#5f5c2c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Superb_lyrbird_in_scrub.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Superb_lyrbird_in_scrub.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#90966c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brown_Treecreeper.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Brown_Treecreeper.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#676b69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vogelkop_Bowerbird_Bower_1099.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vogelkop_Bowerbird_Bower_1099.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#485939\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acanthorhynchus_tenuirostris_female.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Acanthorhynchus_tenuirostris_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#6e5f4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ribbon-tailed_Astrapia.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ribbon-tailed_Astrapia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6e6f67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Paradisaea_raggiana_23zz.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Paradisaea_raggiana_23zz.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"281\" style=\"background-color:#656337\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Corvus_corone_-near_Canford_Cliffs%2C_Poole%2C_England-8.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Corvus_corone_-near_Canford_Cliffs%2C_Poole%2C_England-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"267\" style=\"background-color:#847d6e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Towerrabe.png\" target=\"_blank\"><img src=\"thumbnails/250px-Towerrabe.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"286\" style=\"background-color:#a99985\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cracticus_tibicen_hypoleuca_male_domain.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cracticus_tibicen_hypoleuca_male_domain.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"256\" style=\"background-color:#565544\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blue_jay_in_PP_%2830960%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Blue_jay_in_PP_%2830960%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"341\" style=\"background-color:#858469\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Helmet_vanga_%28Euryceros_prevostii%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Helmet_vanga_%28Euryceros_prevostii%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#697443\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cliff_Swallow-27527-2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cliff_Swallow-27527-2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#aa9573\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pseudhirundo_griseopyga_Sharpe_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudhirundo_griseopyga_Sharpe_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#c3c7c1\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul>")
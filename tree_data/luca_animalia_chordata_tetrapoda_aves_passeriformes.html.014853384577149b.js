@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda_aves_passeriformes","<ul class=\"tree\" data-tree-range=\"passeriformes\"><li><input type=\"checkbox\" checked id=\"Australaves_Passeriformes\"><label class=\"tree_label\" for=\"Australaves_Passeriformes\"></label><div class=\"outer_tree_box\"><div id=\"passeriformes_passeriformes\" class=\"tree_box\"><span><span>Passeriformes</span><a href=\"https://en.wikipedia.org/wiki/Passeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Passeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Passeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Passeriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈpæsərɪfɔːrmiːz\" target=\"_blank\">ˈpæsərɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"aves\">See parent</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(passerines, sparrows, martins, treecreepers, bowerbirds, wrens, honeyeaters, warblers, babblers, shrikes, larks, ifrits, birds-of-paradise, crows, ravens, jays, magpies)</span><p class=\"tag\">A diverse and rich assemblage of mostly small land birds with strong feet for perching and grabbing branches.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cuvier-33-Moineau_domestique.jpg\" target=\"_blank\"><img src=\"thumbnails/Cuvier-33-Moineau_domestique.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"614\" height=\"371\" style=\"background-color:#ded9d3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rock_wren.jpg\" target=\"_blank\"><img src=\"thumbnails/Rock_wren.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"650\" height=\"433\" style=\"background-color:#beb89f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gymnopithys-leucaspis-001_edit2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gymnopithys-leucaspis-001_edit2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#5c5339\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flickr_-_Rainbirder_-_Long-tailed_Manakin_%28Chiroxiphia_linearis%29.jpg\" target=\"_blank\"><img src=\"thumbnails/500px-Flickr_-_Rainbirder_-_Long-tailed_Manakin_%28Chiroxiphia_linearis%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"739\" style=\"background-color:#556740\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Turca%2C_Alto_del_Naranjo_01nov14_.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Turca%2C_Alto_del_Naranjo_01nov14_.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#9c9186\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Yellow_bellied_Asity12.jpg\" target=\"_blank\"><img src=\"thumbnails/Yellow_bellied_Asity12.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"689\" height=\"477\" style=\"background-color:#5f5c2c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Superb_lyrbird_in_scrub.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Superb_lyrbird_in_scrub.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#90966c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brown_Treecreeper.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Brown_Treecreeper.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#676b69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vogelkop_Bowerbird_Bower_1099.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vogelkop_Bowerbird_Bower_1099.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#485939\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acanthorhynchus_tenuirostris_female.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Acanthorhynchus_tenuirostris_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#6e5f4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ribbon-tailed_Astrapia.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ribbon-tailed_Astrapia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6e6f67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Paradisaea_raggiana_23zz.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Paradisaea_raggiana_23zz.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"281\" style=\"background-color:#656337\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Corvus_corone_-near_Canford_Cliffs%2C_Poole%2C_England-8.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Corvus_corone_-near_Canford_Cliffs%2C_Poole%2C_England-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"267\" style=\"background-color:#847d6e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Towerrabe.png\" target=\"_blank\"><img src=\"thumbnails/250px-Towerrabe.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"286\" style=\"background-color:#a99985\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cracticus_tibicen_hypoleuca_male_domain.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cracticus_tibicen_hypoleuca_male_domain.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"256\" style=\"background-color:#565544\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blue_jay_in_PP_%2830960%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Blue_jay_in_PP_%2830960%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"341\" style=\"background-color:#858469\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Helmet_vanga_%28Euryceros_prevostii%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Helmet_vanga_%28Euryceros_prevostii%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#697443\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cliff_Swallow-27527-2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cliff_Swallow-27527-2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#aa9573\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pseudhirundo_griseopyga_Sharpe_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudhirundo_griseopyga_Sharpe_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#c3c7c1\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_acanthisittidae\" class=\"tree_box\"><span><span>Acanthisittidae</span><a href=\"https://en.wikipedia.org/wiki/Acanthisittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Acanthisittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Acanthisittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Acanthisittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(New Zealand wrens)</span><div></div></div></div></li><li><input type=\"checkbox\" checked id=\"Passeriformes_Tyranni\"><label class=\"tree_label\" for=\"Passeriformes_Tyranni\"></label><div class=\"outer_tree_box\"><div id=\"passeriformes_tyranni\" class=\"tree_box\"><span><span>Tyranni</span><a href=\"https://en.wikipedia.org/wiki/Tyranni\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tyranni\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tyranni\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tyranni\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><p class=\"tag\">Have a simpler syrinx musculature so their vocalizations are more mechanical sounding.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Tyranni_Eurylaimides\"><label class=\"tree_label\" for=\"Tyranni_Eurylaimides\"></label><div class=\"outer_tree_box\"><div id=\"passeriformes_eurylaimides\" class=\"tree_box\"><span><span>Eurylaimides</span><a href=\"https://en.wikipedia.org/wiki/Eurylaimides\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eurylaimides\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eurylaimides\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Eurylaimides\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraorder</span></span><p class=\"tag\">An Old World bird group distributed pantropically.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_philepittidae\" class=\"tree_box\"><span><span>Philepittidae</span><a href=\"https://en.wikipedia.org/wiki/Philepittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Philepittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Philepittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Philepittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(asites)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_eurylaimidae\" class=\"tree_box\"><span><span>Eurylaimidae</span><a href=\"https://en.wikipedia.org/wiki/Eurylaimidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eurylaimidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eurylaimidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Eurylaimidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(eurylaimid broadbills)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_calyptomenidae\" class=\"tree_box\"><span><span>Calyptomenidae</span><a href=\"https://en.wikipedia.org/wiki/Calyptomenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Calyptomenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Calyptomenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Calyptomenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(African broadbills, green broadbills)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_sapayoidae\" class=\"tree_box\"><span><span>Sapayoidae</span><a href=\"https://en.wikipedia.org/wiki/Sapayoidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sapayoidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sapayoidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Sapayoidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(sapayoa)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_pittidae\" class=\"tree_box\"><span><span>Pittidae</span><a href=\"https://en.wikipedia.org/wiki/Pittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pittidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(pittas)</span><div></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Tyranni_Tyrannides\"><label class=\"tree_label\" for=\"Tyranni_Tyrannides\"></label><div class=\"outer_tree_box\"><div id=\"passeriformes_tyrannides\" class=\"tree_box\"><span><span>Tyrannides</span><a href=\"https://en.wikipedia.org/wiki/Tyrannides\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tyrannides\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tyrannides\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tyrannides\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraorder</span></span><p class=\"tag\">New World suboscines. Likely originated in South America during the Eocene, about 45 million years ago.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Tyrannides_Furnariida\"><label class=\"tree_label\" for=\"Tyrannides_Furnariida\"></label><div class=\"outer_tree_box\"><div id=\"passeriformes_furnariida\" class=\"tree_box\"><span><span>Furnariida</span><a href=\"https://en.wikipedia.org/wiki/Furnariida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Furnariida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Furnariida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Furnariida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(ovenbirds, woodcreepers, antbirds)</span><p class=\"tag\">Neotropical ovenbirds and allies.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_melanopareiidae\" class=\"tree_box\"><span><span>Melanopareiidae</span><a href=\"https://en.wikipedia.org/wiki/Melanopareiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Melanopareiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Melanopareiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Melanopareiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(crescentchests)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_conopophagidae\" class=\"tree_box\"><span><span>Conopophagidae</span><a href=\"https://en.wikipedia.org/wiki/Conopophagidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Conopophagidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Conopophagidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Conopophagidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(gnateaters)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_thamnophilidae\" class=\"tree_box\"><span><span>Thamnophilidae</span><a href=\"https://en.wikipedia.org/wiki/Thamnophilidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Thamnophilidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Thamnophilidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Thamnophilidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(antbirds)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_grallariidae\" class=\"tree_box\"><span><span>Grallariidae</span><a href=\"https://en.wikipedia.org/wiki/Grallariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Grallariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Grallariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Grallariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(antpittas)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_rhinocryptidae\" class=\"tree_box\"><span><span>Rhinocryptidae</span><a href=\"https://en.wikipedia.org/wiki/Rhinocryptidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rhinocryptidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rhinocryptidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Rhinocryptidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(tapaculos)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_formicariidae\" class=\"tree_box\"><span><span>Formicariidae</span><a href=\"https://en.wikipedia.org/wiki/Formicariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Formicariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Formicariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Formicariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(antthrushes)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_furnariidae\" class=\"tree_box\"><span><span>Furnariidae</span><a href=\"https://en.wikipedia.org/wiki/Furnariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Furnariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Furnariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Furnariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(ovenbirds)</span><div></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Tyrannides_Tyrannida\"><label class=\"tree_label\" for=\"Tyrannides_Tyrannida\"></label><div class=\"outer_tree_box\"><div id=\"passeriformes_tyrannida\" class=\"tree_box\"><span><span>Tyrannida</span><a href=\"https://en.wikipedia.org/wiki/Tyrannida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tyrannida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tyrannida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tyrannida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_pipridae\" class=\"tree_box\"><span><span>Pipridae</span><a href=\"https://en.wikipedia.org/wiki/Pipridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pipridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pipridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pipridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(manakins)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_cotingidae\" class=\"tree_box\"><span><span>Cotingidae</span><a href=\"https://en.wikipedia.org/wiki/Cotingidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cotingidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cotingidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cotingidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(cotingas)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_tityridae\" class=\"tree_box\"><span><span>Tityridae</span><a href=\"https://en.wikipedia.org/wiki/Tityridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tityridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tityridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tityridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(tityras, becards)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_tyrannidae\" class=\"tree_box\"><span><span>Tyrannidae</span><a href=\"https://en.wikipedia.org/wiki/Tyrannidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tyrannidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tyrannidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tyrannidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(tyrant flycatchers)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_oxyruncidae\" class=\"tree_box\"><span><span>Oxyruncidae</span><a href=\"https://en.wikipedia.org/wiki/Oxyruncidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Oxyruncidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Oxyruncidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Oxyruncidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(sharpbill)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_onychorhynchidae\" class=\"tree_box\"><span><span>Onychorhynchidae</span><a href=\"https://en.wikipedia.org/wiki/Onychorhynchidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Onychorhynchidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Onychorhynchidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Onychorhynchidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(royal flycatchers, myiobiuses)</span><div></div></div></div></li></ul></li></ul></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"passeriformes_passeri\" class=\"tree_box\"><span><span>Passeri</span><a href=\"https://en.wikipedia.org/wiki/Passeri\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Passeri\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Passeri\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Passeri\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"passeri\">See children</button><span class=\"badge\">Suborder</span></span><p class=\"tag\">The song birds. They have a complex syrinx musculature allowing a wide range of songs and other vocalizations.</p><div></div></div></div></li></ul></li></ul>")
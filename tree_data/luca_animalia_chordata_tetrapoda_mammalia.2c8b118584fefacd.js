@@ -0,0 +1 @@
+TreeData.register("luca_animalia_chordata_tetrapoda_mammalia",[{"name":"Monotremata","parent":"Mammalia","rank":"Order","ipa":"","etymology":"","common":["platypus","echidnas"],"tag":"Nurse their young with milk but still lay eggs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/Duck-billed_platypus_%28Ornithorhynchus_anatinus%29_surfacing_Scottsdale.jpg/250px-Duck-billed_platypus_%28Ornithorhynchus_anatinus%29_surfacing_Scottsdale.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a7/Short-beaked_echidna_%28Tachyglossus_aculeatus_setosus%29_Scottsdale.jpg/330px-Short-beaked_echidna_%28Tachyglossus_aculeatus_setosus%29_Scottsdale.jpg"],"card":1},{"name":"Marsupialia","parent":"Mammalia","rank":"Infraclass","ipa":"","etymology":"","common":["kangaroos","koalas","opossums","possums","wombats","wallabies","bandicoots"],"tag":"Bear their young within a pouch on the mother's abdomen after a birth in a relatively undeveloped state.","imgs":[],"card":1},{"name":"Paucituberculata","parent":"Marsupialia","rank":"Order","ipa":"ˌpɔːsɪtjuːˌbɜːrkjuːˈleɪtə","etymology":"","common":["shrew opossums"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d7/Caenolestes_sangay._Foto_Jorge_Brito.jpg/330px-Caenolestes_sangay._Foto_Jorge_Brito.jpg"],"card":2},{"name":"Didelphimorphia","parent":"Marsupialia","rank":"Order","ipa":"daɪˌdɛlfɪˈmɔːrfiə","etymology":"","common":["opossums"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/Didelphis_virginiana_with_young.JPG/330px-Didelphis_virginiana_with_young.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ee/Opossum2.jpg/330px-Opossum2.jpg"],"card":2},{"name":"Microbiotheria","parent":"Marsupialia","rank":"Order","ipa":"","etymology":"","common":["monitos del monte"],"tag":"Small marsupials that look like mice.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/Monito_del_Monte_ps6.jpg/250px-Monito_del_Monte_ps6.jpg"],"card":2},{"name":"Eomarsupialia","parent":"Marsupialia","rank":"Order","ipa":"","etymology":"","common":["marsupial moles","bandicoots","numbats","Tasmanian devils","kangaroos","possums","koala","wombats"],"tag":"The Australasian marsupials. They descend from a single dispersal event from South America via Antartica.","imgs":[],"card":2},{"name":"Notoryctidae","parent":"Eomarsupialia","rank":"Order","ipa":"","etymology":"","common":["marsupial moles"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Em_-_Notoryctes_typhlops_-_1.jpg/330px-Em_-_Notoryctes_typhlops_-_1.jpg"],"card":3},{"name":"Peramelemorphia","parent":"Eomarsupialia","rank":"Order","ipa":"pɛrəmɛlɪˈmɔːrfiə","etymology":"","common":["bandicoots","bilbies"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Perameles_gunnii_268991712.jpg/330px-Perameles_gunnii_268991712.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Southern_Brown_Bandicoot_%28Isoodon_obesulus%29_2%2C_Vic%2C_jjron%2C_09.01.2013.jpg/330px-Southern_Brown_Bandicoot_%28Isoodon_obesulus%29_2%2C_Vic%2C_jjron%2C_09.01.2013.jpg","https://upload.wikimedia.org/wikipedia/commons/8/8c/Macrotis_lagotis_-_bandicut_conejo.jpg"],"card":3},{"name":"Dasyuromorphia","parent":"Eomarsupialia","rank":"Order","ipa":"dæsijʊəroʊˈmɔːrfiə","etymology":"greek 'hairy tail'","common":["quolls","dunnarts","numbats","Tasmanian devils","Tasmanian tigers"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Sarcophilus_harrisii_taranna.jpg/330px-Sarcophilus_harrisii_taranna.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bd/Eastern_quoll_%28Dasyurus_viverrinus%29_fawn_morph_Esk_Valley.jpg/330px-Eastern_quoll_%28Dasyurus_viverrinus%29_fawn_morph_Esk_Valley.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/Fat-tailed_Dunnart_%28Sminthopsis_crassicaudata%29_%2814559441713%29.jpg/330px-Fat-tailed_Dunnart_%28Sminthopsis_crassicaudata%29_%2814559441713%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/01/Myrmecobius_fasciatus_259629687.jpg/330px-Myrmecobius_fasciatus_259629687.jpg","https://upload.wikimedia.org/wikipedia/commons/d/d5/Thylacinus.jpg"],"card":3},{"name":"Diprotodontia","parent":"Eomarsupialia","rank":"Order","ipa":"daɪˌproʊtəˈdɒntiə","etymology":"Greek 'two forward teeth'","common":["kangaroos","wallabies","possums","koala","wombats","tree-kangaroos"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Koala_climbing_tree.jpg/250px-Koala_climbing_tree.jpg","https://upload.wikimedia.org/wikipedia/commons/0/01/Mahogany_glider.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Macropus_giganteus_-_Brunkerville.jpg/250px-Macropus_giganteus_-_Brunkerville.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/34/Ailurops_ursinus_Naemundung_2_North_Sulawesi.jpg/330px-Ailurops_ursinus_Naemundung_2_North_Sulawesi.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Bennett%27s_Tree-kangaroo.jpg/250px-Bennett%27s_Tree-kangaroo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0f/Dendrolagus_matschiei_at_the_Bronx_Zoo_007.jpg/250px-Dendrolagus_matschiei_at_the_Bronx_Zoo_007.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/56/Tree_kangaroo2.jpg/250px-Tree_kangaroo2.jpg","https://upload.wikimedia.org/wikipedia/commons/7/72/Dendrolagus_mbaiso.jpg"],"card":3},{"name":"Placentalia","parent":"Mammalia","rank":"Infraclass","ipa":"","etymology":"","common":[],"tag":"Carry the fetus in the uterus of the mother to a relatively late stage of development.","imgs":[],"card":1},{"name":"Xenarthra","parent":"Placentalia","rank":"Superorder","ipa":"zɛˈnɑːrθrə","etymology":"greek 'unusual'-'joint'","common":["anteaters","sloths","armadillos"],"tag":"Primitive placental mammals that are believed to have descended from subterranean diggers. They have single-color vision and low metabolic rates. Females show no clear distinction between the uterus and vagina, and males have testicles inside the body.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/Myresluger2.jpg/330px-Myresluger2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Bicho-pregui%C3%A7a_3.jpg/330px-Bicho-pregui%C3%A7a_3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Nine-banded_Armadillo_%28Dasypus_novemcinctus%29_%2837649606094%29.jpg/330px-Nine-banded_Armadillo_%28Dasypus_novemcinctus%29_%2837649606094%29.jpg"],"card":1},{"name":"Cingulata","parent":"Xenarthra","rank":"Order","ipa":"","etymology":"","common":["armadillos"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Nine-banded_Armadillo_%28Dasypus_novemcinctus%29_%2837649606094%29.jpg/330px-Nine-banded_Armadillo_%28Dasypus_novemcinctus%29_%2837649606094%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Nine-banded_Armadillo.jpg/330px-Nine-banded_Armadillo.jpg"],"card":4},{"name":"Pilosa","parent":"Xenarthra","rank":"Order","ipa":"paɪˈloʊsə","etymology":"latin 'hairy'","common":["anteaters","sloths"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/e/e1/Myresluger.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/Myresluger2.jpg/330px-Myresluger2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/54/Silky_Anteater.jpg/330px-Silky_Anteater.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/Cholepus_didactylus_-_Flickr_-_Dick_Culbert.jpg/330px-Cholepus_didactylus_-_Flickr_-_Dick_Culbert.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/Bradypus.jpg/250px-Bradypus.jpg"],"card":4},{"name":"Afrotheria","parent":"Placentalia","rank":"Superorder","ipa":"","etymology":"latin 'african'-'wild beasts'","common":["golden moles","elephant shrews","otter shrews","tenrecs","aardvarks","hyraxes","elephants","sea cows"],"tag":"A clade of mammals that evolved to fill niches in Africa while it was an isolated island, before the Cenozoic.","imgs":[],"card":1},{"name":"Paenungulata","parent":"Afrotheria","rank":"Grandorder","ipa":"","etymology":"latin 'almost'-'having hoofs'","common":["hyraxes","sea cows","elephants"],"tag":"Herbivorous near ungulates mammals of African origin. Some have long incisors and others continuously replace their teeth from the back of the jaw.","imgs":[],"card":5},{"name":"Hyracoidea","parent":"Paenungulata","rank":"Order","ipa":"","etymology":"","common":["hyraxes","dassies"],"tag":"Small, stout, thickset, herbivorous mammals with multichambered stomachs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Klipdas.jpg/330px-Klipdas.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Hyrax_on_the_Rocks.JPG/330px-Hyrax_on_the_Rocks.JPG"],"card":6},{"name":"Sirenia","parent":"Paenungulata","rank":"Order","ipa":"saɪˈriːni.ə","etymology":"","common":["sea cows","dugong","manatees"],"tag":"Fully aquatic, herbivorous mammals.","imgs":["https://upload.wikimedia.org/wikipedia/commons/3/3b/Manatee_Florida.jpg","https://upload.wikimedia.org/wikipedia/commons/7/75/Dugong_dugon.jpg"],"card":6},{"name":"Proboscidea","parent":"Paenungulata","rank":"Order","ipa":"ˌproʊbəˈsɪdiə","etymology":"latin 'elephant's trunk'","common":["elephants","mastodons","mammoths","gomphotheres","stegodonts"],"tag":"Herbivorous mammals that are typically large with extant species having long tusks and strong mobile trunks.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/25/Tuskercorbett.jpg/330px-Tuskercorbett.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/Herd_of_Elephants.jpg/330px-Herd_of_Elephants.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f3/Loxodontacyclotis.jpg/330px-Loxodontacyclotis.jpg"],"card":6},{"name":"Tubulidentata","parent":"Afrotheria","rank":"Order","ipa":"","etymology":"latin 'tubule'-'tooth'","common":["aardvarks"],"tag":"Mammals with tubule-style teeth. Extant species are medium-sized, burrowing, nocturnal mammals native to Africa that feed almost exclusively on termites and ants.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/67/SanWild17.jpg/330px-SanWild17.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/44/Orycteropus_afer_175359476.jpg/250px-Orycteropus_afer_175359476.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f0/Orycteropus_afer_175359469.jpg/330px-Orycteropus_afer_175359469.jpg"],"card":5},{"name":"Macroscelidea","parent":"Afrotheria","rank":"Order","ipa":"","etymology":"","common":["Elephant shrews","jumping shrews","sengis"],"tag":"Small quadrupedal insectivorous mammals with scaly tails and long snouts native to Africa that are superficially similar to shrews.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/Rhynchocyon_petersi_from_side.jpg/330px-Rhynchocyon_petersi_from_side.jpg","https://upload.wikimedia.org/wikipedia/commons/b/bc/Bushveld-elephant-shrew.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Petrodromus_tetradactylus-Zootaxa.jpg/330px-Petrodromus_tetradactylus-Zootaxa.jpg"],"card":5},{"name":"Afrosoricida","parent":"Afrotheria","rank":"Order","ipa":"","etymology":"latin 'looking like African shrews'","common":["golden moles","otter shrews","tenrecs"],"tag":"These small mammals have dirersified into a number of faunivorous niches in Madagascar and Africa so their morphology can vary with some species bearing similarities to hedgehogs, moles, shrews, or miniature otters.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/Amblysomus_hottentotus_%28Palmiet_Nature_Reserve%2C_South_Africa_East_Coast%29_2.jpg/330px-Amblysomus_hottentotus_%28Palmiet_Nature_Reserve%2C_South_Africa_East_Coast%29_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/Chrysochloris_asiatica_Cape_golden_mole_adult_IMG_7120.jpg/330px-Chrysochloris_asiatica_Cape_golden_mole_adult_IMG_7120.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/67/Potamogale_velox_340101862.jpg/330px-Potamogale_velox_340101862.jpg","https://upload.wikimedia.org/wikipedia/commons/0/01/Kleiner-igeltanrek-a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/61/Microgale_cowani.jpg/250px-Microgale_cowani.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bc/Tanrek.jpg/330px-Tanrek.jpg"],"card":5},{"name":"Boreoeutheria","parent":"Placentalia","rank":"Magnorder","ipa":"","etymology":"","common":["primates","cats","dogs","hedgehogs","rodents","moles","true shrews","bats","pangolins","zebras","rhinoceroses","hippopotamuses","deer","cattle","whales"],"tag":"Most males have their testicles in an external pouch.","imgs":[],"card":1},{"name":"Laurasiatheria","parent":"Boreoeutheria","rank":"Superorder","ipa":"lɔːrˌeɪʒəˈθɪəriə","etymology":"'Laurasian beasts'","common":["hedgehogs","moles","true shrews","bats","cats","dogs","pangolins","zebras","rhinoceroses","hippopotamuses","deer","cattle","whales"],"tag":"Mammals with ancestors that originated on the northern supercontinent of Laurasia, after it split from Gondwana.","imgs":[],"card":1},{"name":"Eulipotyphla","parent":"Laurasiatheria","rank":"Order","ipa":"ˌjuːlɪpoʊˈtɪflə","etymology":"'lacking a cecum'","common":["hedgehogs","gymnures","solenodons","moles","shrew-like moles","desmans","true shrews"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Talpa_europaea_MHNT_Tete.jpg/330px-Talpa_europaea_MHNT_Tete.jpg","https://upload.wikimedia.org/wikipedia/commons/0/09/Hispaniolan_Solenodon_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6c/Sorex-araneus.jpg/330px-Sorex-araneus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Erinaceus_europaeus_%28Linnaeus%2C_1758%29.jpg/330px-Erinaceus_europaeus_%28Linnaeus%2C_1758%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Talpa_europaea_MHNT.jpg/330px-Talpa_europaea_MHNT.jpg"],"card":7},{"name":"Chiroptera","parent":"Laurasiatheria","rank":"Order","ipa":"kaɪˈrɒptərə","etymology":"","common":["bats"],"tag":"The only mammals capable of true and sustained flight. Most are nocturnal, and many roost in caves. Many are insectivores, but some eat fruit, nectar, or blood.","imgs":["https://upload.wikimedia.org/wikipedia/commons/0/0d/Gro%C3%9Fes_Mausohr.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/Lesser_short-nosed_fruit_bat_%28Cynopterus_brachyotis%29.jpg/330px-Lesser_short-nosed_fruit_bat_%28Cynopterus_brachyotis%29.jpg","https://upload.wikimedia.org/wikipedia/commons/3/3f/Golden_crowned_fruit_bat.jpg"],"card":7},{"name":"Ferungulata","parent":"Laurasiatheria","rank":"Grandorder","ipa":"","etymology":"'wild beasts and ungulates'","common":["cats","dogs","pangolins","zebras","rhinoceroses","tapirs","hippopotamuses","deer","camels","cattle","whales"],"tag":"A clade of placental mammals that includes carnivores, pangolins, and the hoofed herbivores.","imgs":[],"card":7},{"name":"Pholidota","parent":"Ferungulata","rank":"Order","ipa":"fɒlɪˈdoʊtə","etymology":"greek 'clad in scales'","common":["pangolins","scaly anteaters"],"tag":"Nocturnal mammals with large, protective keratin scales that live in hollow trees or burrows that mostly feed on ants and termites.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Pangolin_brought_to_the_Range_office%2C_KMTR_AJTJ_cropped.jpg/330px-Pangolin_brought_to_the_Range_office%2C_KMTR_AJTJ_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/95/Manis_temminckii_%2829390603130%29.jpg/330px-Manis_temminckii_%2829390603130%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Philippine_Pangolin_Curled-up_by_Gregg_Yan.jpg/330px-Philippine_Pangolin_Curled-up_by_Gregg_Yan.jpg"],"card":8},{"name":"Carnivora","parent":"Ferungulata","rank":"Order","ipa":"","etymology":"","common":["cats","dogs","hyenas","mongoose","bears","skunks","raccoons"],"tag":"An order of placental mammals specialized primarily in eating flesh.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/7_Walross_1999.jpg/330px-7_Walross_1999.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e0/%E7%8C%8E%E8%B1%B9.jpg/330px-%E7%8C%8E%E8%B1%B9.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/75/Grizzly_Bear_Drip_%286968122232%29.jpg/330px-Grizzly_Bear_Drip_%286968122232%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/72/North_American_Wolf_-_Tala_0912_%287263487664%29.jpg/330px-North_American_Wolf_-_Tala_0912_%287263487664%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/MinkforWiki.jpg/330px-MinkforWiki.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f3/Bored_Raccoon.jpg/330px-Bored_Raccoon.jpg"],"card":8},{"name":"Euungulata","parent":"Ferungulata","rank":"","ipa":"","etymology":"'true ungulates'","common":["horses","zebras","rhinoceroses","tapirs","pigs","hippopotamuses","deer","giraffes","camels","sheep","cattle","whales"],"tag":"Typically herbivorous mammals that descended from hooved ancestors.","imgs":[],"card":8},{"name":"Perissodactyla","parent":"Euungulata","rank":"Order","ipa":"pəˌrɪsoʊˈdæktɪlə","etymology":"greek 'odd'-'toe'","common":["horses","asses","zebras","rhinoceroses","tapirs"],"tag":"The odd-toed ungulates are herbivores that digest plant cellulose in their intestines in an enlarged cecum.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/Ybtpr_3b_%2816045157658%29.jpg/330px-Ybtpr_3b_%2816045157658%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c6/Eurasian_wild_horse.jpg/330px-Eurasian_wild_horse.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/03/Waterberg_Nashorn2.jpg/330px-Waterberg_Nashorn2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/Plains_Zebra_Equus_quagga_cropped.jpg/250px-Plains_Zebra_Equus_quagga_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/1/1a/Donkey_in_Clovelly%2C_North_Devon%2C_England.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/58/Schabrackentapir_Tapirus_indicus_Tiergarten-Nuernberg-1.jpg/330px-Schabrackentapir_Tapirus_indicus_Tiergarten-Nuernberg-1.jpg"],"card":8},{"name":"Artiodactyla","parent":"Euungulata","rank":"Order","ipa":"ˌɑːrtioʊˈdæktɪlə","etymology":"greek 'even'-'toe'","common":["pigs","hippopotamuses","antelopes","deer","giraffes","camels","llamas","sheep","cattle","whales","dolphins"],"tag":"The even-toed ungulates bear weight equally on an even number of their toes and digest plant cellulose in one or more stomach chambers. Many are herbivores, but some are omnivorous, and others are entirely carnivorous.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Choeropsis.jpg/330px-Choeropsis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Sable_bull.jpg/330px-Sable_bull.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/White-tailed_deer.jpg/330px-White-tailed_deer.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Giraffe_Mikumi_National_Park.jpg/250px-Giraffe_Mikumi_National_Park.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/07._Camel_Profile%2C_near_Silverton%2C_NSW%2C_07.07.2007.jpg/250px-07._Camel_Profile%2C_near_Silverton%2C_NSW%2C_07.07.2007.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Alpaca_%2831562329701%29.jpg/250px-Alpaca_%2831562329701%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/2005_04_27_1582_Dall_Sheep.jpg/330px-2005_04_27_1582_Dall_Sheep.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a9/Dolphin_Encounter-9563.jpg/330px-Dolphin_Encounter-9563.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Cow_%28Fleckvieh_breed%29_Oeschinensee_Slaunger_2009-07-07.jpg/330px-Cow_%28Fleckvieh_breed%29_Oeschinensee_Slaunger_2009-07-07.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/Mother_and_baby_sperm_whale.jpg/330px-Mother_and_baby_sperm_whale.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6a/Eubalaena_glacialis_with_calf.jpg/250px-Eubalaena_glacialis_with_calf.jpg"],"card":8},{"name":"Euarchontoglires","parent":"Boreoeutheria","rank":"Superorder","ipa":"","etymology":"'true rulers'-'dormice'","common":["rodents","lagomorphs","treeshrews","primates","colugos"],"tag":"The rodents and the primates.","imgs":[],"card":1},{"name":"Scandentia","parent":"Euarchontoglires","rank":"Order","ipa":"","etymology":"latin 'to climb'","common":["tree shrews","banxrings"],"tag":"Omnivorous mammals that live in small family groups, resemble shews and some species live in trees.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/Spitzh%C3%B6rnchen.JPG/330px-Spitzh%C3%B6rnchen.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c9/Tupaia_minor.jpg/330px-Tupaia_minor.jpg","https://upload.wikimedia.org/wikipedia/commons/7/78/Anathana_ellioti.jpg"],"card":9},{"name":"Lagomorpha","parent":"Euarchontoglires","rank":"Order","ipa":"ˈlæɡəmɔːrf","etymology":"","common":["rabbits","hares","pikas"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/df/Eastern_Cottontail.JPG/250px-Eastern_Cottontail.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/The_Pika.jpg/330px-The_Pika.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Pika.jpg/330px-Pika.jpg"],"card":9},{"name":"Rodentia","parent":"Euarchontoglires","rank":"Order","ipa":"roʊˈdɛnʃə","etymology":"latin 'to gnaw'","common":["mice","rats","bandicoot rat","squirrels","prairie dogs","porcupines","beavers","guinea pigs","hamsters"],"tag":"The group is characterized by a single pair of continuously growing incisors in each of the upper and lower jaws.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/34/Hydrochoeris_hydrochaeris_in_Brazil_in_Petr%C3%B3polis%2C_Rio_de_Janeiro%2C_Brazil_09.jpg/330px-Hydrochoeris_hydrochaeris_in_Brazil_in_Petr%C3%B3polis%2C_Rio_de_Janeiro%2C_Brazil_09.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/Goldmantelziesel.jpg/330px-Goldmantelziesel.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6b/American_Beaver.jpg/250px-American_Beaver.jpg","https://upload.wikimedia.org/wikipedia/commons/8/8f/Mouse_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/47/MainePorcupine.JPG/330px-MainePorcupine.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/Cynomys_parvidens_%2829259482624%29.jpg/330px-Cynomys_parvidens_%2829259482624%29.jpg","https://upload.wikimedia.org/wikipedia/commons/4/43/Graphiurus_spec_-murinus-1.jpg"],"card":9},{"name":"Dermoptera","parent":"Euarchontoglires","rank":"Order","ipa":"","etymology":"","common":["colugos","flying lemurs"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cd/Colugo_%28Galeopterus_variegatus%2C_adult_female%29%2C_Central_Catchment_Area%2C_Singapore_-_20060618.jpg/250px-Colugo_%28Galeopterus_variegatus%2C_adult_female%29%2C_Central_Catchment_Area%2C_Singapore_-_20060618.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Flying_Lemur_%26_Baby%2C_Bohol.jpg/250px-Flying_Lemur_%26_Baby%2C_Bohol.jpg"],"card":9},{"name":"Primates","parent":"Euarchontoglires","rank":"Order","ipa":"","etymology":"","common":["lemurs","galagos","lorisids","monkeys","apes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f5/Lemur_catta_001.jpg/330px-Lemur_catta_001.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7e/Bohol_Tarsier.jpg/330px-Bohol_Tarsier.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/Hylobates_lar_pair_of_white_and_black_01.jpg/330px-Hylobates_lar_pair_of_white_and_black_01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg/250px-015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/Papio_hamadryas_%28aka%29.jpg/330px-Papio_hamadryas_%28aka%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg/250px-Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg"],"card":9}],{},{"250px-015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg":[250,375,"#747d60"],"250px-07._Camel_Profile,_near_Silverton,_NSW,_07.07.2007.jpg":[250,308,"#877d69"],"250px-Alpaca_(31562329701).jpg":[250,277,"#767963"],"250px-American_Beaver.jpg":[250,250,"#8c755e"],"250px-Bennett's_Tree-kangaroo.jpg":[250,346,"#dbd8d1"],"250px-Bradypus.jpg":[250,333,"#848367"],"250px-Colugo_(Galeopterus_variegatus,_adult_female),_Central_Catchment_Area,_Singapore_-_20060618.jpg":[250,312,"#676a48"],"250px-Dendrolagus_matschiei_at_the_Bronx_Zoo_007.jpg":[250,333,"#524c31"],"250px-Duck-billed_platypus_(Ornithorhynchus_anatinus)_surfacing_Scottsdale.jpg":[250,250,"#6f7857"],"250px-Eastern_Cottontail.JPG":[250,242,"#798f5e"],"250px-Eubalaena_glacialis_with_calf.jpg":[250,280,"#227fb2"],"250px-Flying_Lemur_&_Baby,_Bohol.jpg":[250,326,"#827a53"],"250px-Giraffe_Mikumi_National_Park.jpg":[250,316,"#908d76"],"250px-Gorille_des_plaines_de_l'ouest_à_l'Espace_Zoologique.jpg":[250,376,"#7b8169"],"250px-Koala_climbing_tree.jpg":[250,246,"#726b68"],"250px-Macropus_giganteus_-_Brunkerville.jpg":[250,250,"#727153"],"250px-Microgale_cowani.jpg":[250,250,"#7f4f33"],"250px-Monito_del_Monte_ps6.jpg":[250,272,"#645f41"],"250px-Orycteropus_afer_175359476.jpg":[250,361,"#b58c75"],"250px-Plains_Zebra_Equus_quagga_cropped.jpg":[250,322,"#a18f70"],"250px-Tree_kangaroo2.jpg":[250,350,"#746453"],"330px-2005_04_27_1582_Dall_Sheep.jpg":[330,247,"#746953"],"330px-7_Walross_1999.jpg":[330,220,"#909c90"],"330px-Ailurops_ursinus_Naemundung_2_North_Sulawesi.jpg":[330,247,"#677062"],"330px-Amblysomus_hottentotus_(Palmiet_Nature_Reserve,_South_Africa_East_Coast)_2.jpg":[330,215,"#af9178"],"330px-Bicho-preguiça_3.jpg":[330,220,"#697462"],"330px-Bohol_Tarsier.jpg":[330,248,"#919989"],"330px-Bored_Raccoon.jpg":[330,248,"#6b6f59"],"330px-Caenolestes_sangay._Foto_Jorge_Brito.jpg":[330,247,"#70684e"],"330px-Choeropsis.jpg":[329,264,"#736858"],"330px-Cholepus_didactylus_-_Flickr_-_Dick_Culbert.jpg":[330,297,"#6e644d"],"330px-Chrysochloris_asiatica_Cape_golden_mole_adult_IMG_7120.jpg":[330,248,"#e7e6e6"],"330px-Cow_(Fleckvieh_breed)_Oeschinensee_Slaunger_2009-07-07.jpg":[330,221,"#8b895d"],"330px-Cynomys_parvidens_(29259482624).jpg":[330,220,"#938167"],"330px-Didelphis_virginiana_with_young.JPG":[330,247,"#5c5c4e"],"330px-Dolphin_Encounter-9563.jpg":[330,248,"#495f67"],"330px-Eastern_quoll_(Dasyurus_viverrinus)_fawn_morph_Esk_Valley.jpg":[330,220,"#434635"],"330px-Em_-_Notoryctes_typhlops_-_1.jpg":[330,220,"#8e8472"],"330px-Erinaceus_europaeus_(Linnaeus,_1758).jpg":[330,255,"#82884d"],"330px-Eurasian_wild_horse.jpg":[330,184,"#889363"],"330px-Fat-tailed_Dunnart_(Sminthopsis_crassicaudata)_(14559441713).jpg":[330,220,"#645827"],"330px-Goldmantelziesel.jpg":[330,284,"#7b756c"],"330px-Grizzly_Bear_Drip_(6968122232).jpg":[330,264,"#858979"],"330px-Herd_of_Elephants.jpg":[330,220,"#958e78"],"330px-Hydrochoeris_hydrochaeris_in_Brazil_in_Petrópolis,_Rio_de_Janeiro,_Brazil_09.jpg":[330,220,"#8e9058"],"330px-Hylobates_lar_pair_of_white_and_black_01.jpg":[330,220,"#5b765d"],"330px-Hyrax_on_the_Rocks.JPG":[330,287,"#827b71"],"330px-Klipdas.jpg":[330,220,"#a3a092"],"330px-Lemur_catta_001.jpg":[330,186,"#988474"],"330px-Lesser_short-nosed_fruit_bat_(Cynopterus_brachyotis).jpg":[330,212,"#828b6f"],"330px-Loxodontacyclotis.jpg":[330,220,"#464838"],"330px-MainePorcupine.JPG":[330,247,"#909d7e"],"330px-Manis_temminckii_(29390603130).jpg":[330,247,"#836748"],"330px-MinkforWiki.jpg":[330,248,"#a7a29e"],"330px-Mother_and_baby_sperm_whale.jpg":[330,186,"#205997"],"330px-Myresluger2.jpg":[330,223,"#716054"],"330px-Myrmecobius_fasciatus_259629687.jpg":[330,220,"#9a8265"],"330px-Nine-banded_Armadillo.jpg":[330,199,"#605f47"],"330px-Nine-banded_Armadillo_(Dasypus_novemcinctus)_(37649606094).jpg":[330,223,"#72735e"],"330px-North_American_Wolf_-_Tala_0912_(7263487664).jpg":[330,220,"#73875d"],"330px-Opossum2.jpg":[330,191,"#959491"],"330px-Orycteropus_afer_175359469.jpg":[330,229,"#a57e67"],"330px-Pangolin_brought_to_the_Range_office,_KMTR_AJTJ_cropped.jpg":[330,224,"#be8c5c"],"330px-Papio_hamadryas_(aka).jpg":[330,264,"#544d49"],"330px-Perameles_gunnii_268991712.jpg":[330,247,"#202020"],"330px-Petrodromus_tetradactylus-Zootaxa.jpg":[330,157,"#8e7454"],"330px-Philippine_Pangolin_Curled-up_by_Gregg_Yan.jpg":[330,230,"#687552"],"330px-Pika.jpg":[330,220,"#858382"],"330px-Potamogale_velox_340101862.jpg":[330,220,"#4c3f33"],"330px-Rhynchocyon_petersi_from_side.jpg":[330,220,"#50493d"],"330px-Sable_bull.jpg":[330,285,"#7f7a70"],"330px-SanWild17.jpg":[330,234,"#906a47"],"330px-Sarcophilus_harrisii_taranna.jpg":[330,215,"#748557"],"330px-Schabrackentapir_Tapirus_indicus_Tiergarten-Nuernberg-1.jpg":[330,230,"#868884"],"330px-Short-beaked_echidna_(Tachyglossus_aculeatus_setosus)_Scottsdale.jpg":[330,220,"#82805f"],"330px-Silky_Anteater.jpg":[330,220,"#6b7e87"],"330px-Sorex-araneus.jpg":[330,184,"#76764c"],"330px-Southern_Brown_Bandicoot_(Isoodon_obesulus)_2,_Vic,_jjron,_09.01.2013.jpg":[330,220,"#7b6e5c"],"330px-Spitzhörnchen.JPG":[330,247,"#677a5a"],"330px-Talpa_europaea_MHNT.jpg":[330,204,"#b4aca3"],"330px-Talpa_europaea_MHNT_Tete.jpg":[330,228,"#6a5d50"],"330px-Tanrek.jpg":[330,248,"#737066"],"330px-The_Pika.jpg":[330,269,"#8e836e"],"330px-Tupaia_minor.jpg":[330,284,"#6d7169"],"330px-Tuskercorbett.jpg":[330,220,"#819598"],"330px-Waterberg_Nashorn2.jpg":[330,220,"#9c8174"],"330px-White-tailed_deer.jpg":[330,251,"#76685d"],"330px-Ybtpr_3b_(16045157658).jpg":[330,225,"#7b6f5e"],"330px-猎豹.jpg":[330,247,"#7d874a"],"Anathana_ellioti.jpg":[275,130,"#605f41"],"Bushveld-elephant-shrew.jpg":[720,491,"#a28f7e"],"Dendrolagus_mbaiso.jpg":[265,423,"#645e4e"],"Donkey_in_Clovelly,_North_Devon,_England.jpg":[750,536,"#787f54"],"Dugong_dugon.jpg":[737,393,"#1b7198"],"Golden_crowned_fruit_bat.jpg":[200,319,"#81734d"],"Graphiurus_spec_-murinus-1.jpg":[800,533,"#5b4c42"],"Großes_Mausohr.jpg":[640,427,"#11140e"],"Hispaniolan_Solenodon_crop.jpg":[720,584,"#908779"],"Kleiner-igeltanrek-a.jpg":[704,449,"#86847e"],"Macrotis_lagotis_-_bandicut_conejo.jpg":[480,360,"#a76e41"],"Mahogany_glider.jpg":[500,337,"#8e967d"],"Manatee_Florida.jpg":[640,520,"#606253"],"Mouse_white_background.jpg":[300,200,"#d0cac4"],"Myresluger.jpg":[350,229,"#707d67"],"Thylacinus.jpg":[728,486,"#a6a5a6"]})
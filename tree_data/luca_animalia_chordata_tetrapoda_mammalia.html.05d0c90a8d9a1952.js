@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda_mammalia","<ul class=\"tree\" data-tree-range=\"mammalia\"><li><input type=\"checkbox\" checked id=\"Synapsida_Mammalia\"><label class=\"tree_label\" for=\"Synapsida_Mammalia\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_mammalia\" class=\"tree_box\"><span><span>Mammalia</span><a href=\"https://en.wikipedia.org/wiki/Mammalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mammalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mammalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mammalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"tetrapoda\">See parent</button><span class=\"badge\">Class</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Monachus_schauinslandi.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Monachus_schauinslandi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#194487\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tuskercorbett.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tuskercorbett.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#819598\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flying_fox_at_botanical_gardens_in_Sydney_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Flying_fox_at_botanical_gardens_in_Sydney_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"470\" style=\"background-color:#c2b8b4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Humpback_stellwagen_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Humpback_stellwagen_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"187\" style=\"background-color:#8897a9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kangaroo_Australia_01_11_2008_-_retouch.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Kangaroo_Australia_01_11_2008_-_retouch.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#717f5b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Panthera_tigris_tigris_edit2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Panthera_tigris_tigris_edit2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#797d52\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lemur_catta_001.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lemur_catta_001.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#988474\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_monotremata\" class=\"tree_box\"><span><span>Monotremata</span><a href=\"https://en.wikipedia.org/wiki/Monotremata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Monotremata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Monotremata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Monotremata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(platypus, echidnas)</span><p class=\"tag\">Nurse their young with milk but still lay eggs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Duck-billed_platypus_%28Ornithorhynchus_anatinus%29_surfacing_Scottsdale.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Duck-billed_platypus_%28Ornithorhynchus_anatinus%29_surfacing_Scottsdale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#6f7857\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Short-beaked_echidna_%28Tachyglossus_aculeatus_setosus%29_Scottsdale.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Short-beaked_echidna_%28Tachyglossus_aculeatus_setosus%29_Scottsdale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#82805f\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Mammalia_Marsupialia\"><label class=\"tree_label\" for=\"Mammalia_Marsupialia\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_marsupialia\" class=\"tree_box\"><span><span>Marsupialia</span><a href=\"https://en.wikipedia.org/wiki/Marsupialia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Marsupialia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Marsupialia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Marsupialia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraclass</span></span><span class=\"common_names\">(kangaroos, koalas, opossums, possums, wombats, wallabies, bandicoots)</span><p class=\"tag\">Bear their young within a pouch on the mother&#x27;s abdomen after a birth in a relatively undeveloped state.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_paucituberculata\" class=\"tree_box\"><span><span>Paucituberculata</span><a href=\"https://en.wikipedia.org/wiki/Paucituberculata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Paucituberculata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Paucituberculata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Paucituberculata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌpɔːsɪtjuːˌbɜːrkjuːˈleɪtə\" target=\"_blank\">ˌpɔːsɪtjuːˌbɜːrkjuːˈleɪtə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(shrew opossums)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Caenolestes_sangay._Foto_Jorge_Brito.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caenolestes_sangay._Foto_Jorge_Brito.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#70684e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_didelphimorphia\" class=\"tree_box\"><span><span>Didelphimorphia</span><a href=\"https://en.wikipedia.org/wiki/Didelphimorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Didelphimorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Didelphimorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Didelphimorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=daɪˌdɛlfɪˈmɔːrfiə\" target=\"_blank\">daɪˌdɛlfɪˈmɔːrfiə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(opossums)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Didelphis_virginiana_with_young.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Didelphis_virginiana_with_young.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5c5c4e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Opossum2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Opossum2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"191\" style=\"background-color:#959491\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_microbiotheria\" class=\"tree_box\"><span><span>Microbiotheria</span><a href=\"https://en.wikipedia.org/wiki/Microbiotheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Microbiotheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Microbiotheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Microbiotheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(monitos del monte)</span><p class=\"tag\">Small marsupials that look like mice.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Monito_del_Monte_ps6.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Monito_del_Monte_ps6.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"272\" style=\"background-color:#645f41\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Marsupialia_Eomarsupialia\"><label class=\"tree_label\" for=\"Marsupialia_Eomarsupialia\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_eomarsupialia\" class=\"tree_box\"><span><span>Eomarsupialia</span><a href=\"https://en.wikipedia.org/wiki/Eomarsupialia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eomarsupialia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eomarsupialia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Eomarsupialia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(marsupial moles, bandicoots, numbats, Tasmanian devils, kangaroos, possums, koala, wombats)</span><p class=\"tag\">The Australasian marsupials. They descend from a single dispersal event from South America via Antartica.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_notoryctidae\" class=\"tree_box\"><span><span>Notoryctidae</span><a href=\"https://en.wikipedia.org/wiki/Notoryctidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Notoryctidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Notoryctidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Notoryctidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(marsupial moles)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Em_-_Notoryctes_typhlops_-_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Em_-_Notoryctes_typhlops_-_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#8e8472\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_peramelemorphia\" class=\"tree_box\"><span><span>Peramelemorphia</span><a href=\"https://en.wikipedia.org/wiki/Peramelemorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Peramelemorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Peramelemorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Peramelemorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=pɛrəmɛlɪˈmɔːrfiə\" target=\"_blank\">pɛrəmɛlɪˈmɔːrfiə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(bandicoots, bilbies)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Perameles_gunnii_268991712.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Perameles_gunnii_268991712.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#202020\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Southern_Brown_Bandicoot_%28Isoodon_obesulus%29_2%2C_Vic%2C_jjron%2C_09.01.2013.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Southern_Brown_Bandicoot_%28Isoodon_obesulus%29_2%2C_Vic%2C_jjron%2C_09.01.2013.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7b6e5c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Macrotis_lagotis_-_bandicut_conejo.jpg\" target=\"_blank\"><img src=\"thumbnails/Macrotis_lagotis_-_bandicut_conejo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"480\" height=\"360\" style=\"background-color:#a76e41\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_dasyuromorphia\" class=\"tree_box\"><span><span>Dasyuromorphia</span><a href=\"https://en.wikipedia.org/wiki/Dasyuromorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dasyuromorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dasyuromorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Dasyuromorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=dæsijʊəroʊˈmɔːrfiə\" target=\"_blank\">dæsijʊəroʊˈmɔːrfiə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(quolls, dunnarts, numbats, Tasmanian devils, Tasmanian tigers)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Sarcophilus_harrisii_taranna.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sarcophilus_harrisii_taranna.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#748557\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eastern_quoll_%28Dasyurus_viverrinus%29_fawn_morph_Esk_Valley.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eastern_quoll_%28Dasyurus_viverrinus%29_fawn_morph_Esk_Valley.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#434635\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fat-tailed_Dunnart_%28Sminthopsis_crassicaudata%29_%2814559441713%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fat-tailed_Dunnart_%28Sminthopsis_crassicaudata%29_%2814559441713%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#645827\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myrmecobius_fasciatus_259629687.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Myrmecobius_fasciatus_259629687.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#9a8265\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thylacinus.jpg\" target=\"_blank\"><img src=\"thumbnails/Thylacinus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"728\" height=\"486\" style=\"background-color:#a6a5a6\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_diprotodontia\" class=\"tree_box\"><span><span>Diprotodontia</span><a href=\"https://en.wikipedia.org/wiki/Diprotodontia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Diprotodontia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Diprotodontia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Diprotodontia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=daɪˌproʊtəˈdɒntiə\" target=\"_blank\">daɪˌproʊtəˈdɒntiə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(kangaroos, wallabies, possums, koala, wombats, tree-kangaroos)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Koala_climbing_tree.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Koala_climbing_tree.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"246\" style=\"background-color:#726b68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mahogany_glider.jpg\" target=\"_blank\"><img src=\"thumbnails/Mahogany_glider.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"337\" style=\"background-color:#8e967d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Macropus_giganteus_-_Brunkerville.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Macropus_giganteus_-_Brunkerville.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#727153\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ailurops_ursinus_Naemundung_2_North_Sulawesi.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ailurops_ursinus_Naemundung_2_North_Sulawesi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#677062\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bennett%27s_Tree-kangaroo.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Bennett%27s_Tree-kangaroo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"346\" style=\"background-color:#dbd8d1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dendrolagus_matschiei_at_the_Bronx_Zoo_007.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dendrolagus_matschiei_at_the_Bronx_Zoo_007.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#524c31\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tree_kangaroo2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tree_kangaroo2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"350\" style=\"background-color:#746453\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dendrolagus_mbaiso.jpg\" target=\"_blank\"><img src=\"thumbnails/Dendrolagus_mbaiso.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"265\" height=\"423\" style=\"background-color:#645e4e\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Mammalia_Placentalia\"><label class=\"tree_label\" for=\"Mammalia_Placentalia\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_placentalia\" class=\"tree_box\"><span><span>Placentalia</span><a href=\"https://en.wikipedia.org/wiki/Placentalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Placentalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Placentalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Placentalia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraclass</span></span><p class=\"tag\">Carry the fetus in the uterus of the mother to a relatively late stage of development.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Placentalia_Xenarthra\"><label class=\"tree_label\" for=\"Placentalia_Xenarthra\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_xenarthra\" class=\"tree_box\"><span><span>Xenarthra</span><a href=\"https://en.wikipedia.org/wiki/Xenarthra\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Xenarthra\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Xenarthra\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Xenarthra\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=zɛˈnɑːrθrə\" target=\"_blank\">zɛˈnɑːrθrə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><span class=\"common_names\">(anteaters, sloths, armadillos)</span><p class=\"tag\">Primitive placental mammals that are believed to have descended from subterranean diggers. They have single-color vision and low metabolic rates. Females show no clear distinction between the uterus and vagina, and males have testicles inside the body.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Myresluger2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Myresluger2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"223\" style=\"background-color:#716054\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bicho-pregui%C3%A7a_3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bicho-pregui%C3%A7a_3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#697462\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nine-banded_Armadillo_%28Dasypus_novemcinctus%29_%2837649606094%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nine-banded_Armadillo_%28Dasypus_novemcinctus%29_%2837649606094%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"223\" style=\"background-color:#72735e\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_cingulata\" class=\"tree_box\"><span><span>Cingulata</span><a href=\"https://en.wikipedia.org/wiki/Cingulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cingulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cingulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cingulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(armadillos)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Nine-banded_Armadillo_%28Dasypus_novemcinctus%29_%2837649606094%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nine-banded_Armadillo_%28Dasypus_novemcinctus%29_%2837649606094%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"223\" style=\"background-color:#72735e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nine-banded_Armadillo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nine-banded_Armadillo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"199\" style=\"background-color:#605f47\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_pilosa\" class=\"tree_box\"><span><span>Pilosa</span><a href=\"https://en.wikipedia.org/wiki/Pilosa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pilosa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pilosa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pilosa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=paɪˈloʊsə\" target=\"_blank\">paɪˈloʊsə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(anteaters, sloths)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Myresluger.jpg\" target=\"_blank\"><img src=\"thumbnails/Myresluger.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"350\" height=\"229\" style=\"background-color:#707d67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myresluger2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Myresluger2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"223\" style=\"background-color:#716054\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Silky_Anteater.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Silky_Anteater.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6b7e87\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cholepus_didactylus_-_Flickr_-_Dick_Culbert.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cholepus_didactylus_-_Flickr_-_Dick_Culbert.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"297\" style=\"background-color:#6e644d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bradypus.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Bradypus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#848367\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Placentalia_Afrotheria\"><label class=\"tree_label\" for=\"Placentalia_Afrotheria\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_afrotheria\" class=\"tree_box\"><span><span>Afrotheria</span><a href=\"https://en.wikipedia.org/wiki/Afrotheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Afrotheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Afrotheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Afrotheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><span class=\"common_names\">(golden moles, elephant shrews, otter shrews, tenrecs, aardvarks, hyraxes, elephants, sea cows)</span><p class=\"tag\">A clade of mammals that evolved to fill niches in Africa while it was an isolated island, before the Cenozoic.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Afrotheria_Paenungulata\"><label class=\"tree_label\" for=\"Afrotheria_Paenungulata\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_paenungulata\" class=\"tree_box\"><span><span>Paenungulata</span><a href=\"https://en.wikipedia.org/wiki/Paenungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Paenungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Paenungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Paenungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Grandorder</span></span><span class=\"common_names\">(hyraxes, sea cows, elephants)</span><p class=\"tag\">Herbivorous near ungulates mammals of African origin. Some have long incisors and others continuously replace their teeth from the back of the jaw.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_hyracoidea\" class=\"tree_box\"><span><span>Hyracoidea</span><a href=\"https://en.wikipedia.org/wiki/Hyracoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hyracoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hyracoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hyracoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(hyraxes, dassies)</span><p class=\"tag\">Small, stout, thickset, herbivorous mammals with multichambered stomachs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Klipdas.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Klipdas.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a3a092\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hyrax_on_the_Rocks.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Hyrax_on_the_Rocks.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"287\" style=\"background-color:#827b71\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_sirenia\" class=\"tree_box\"><span><span>Sirenia</span><a href=\"https://en.wikipedia.org/wiki/Sirenia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sirenia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sirenia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Sirenia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=saɪˈriːni.ə\" target=\"_blank\">saɪˈriːni.ə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(sea cows, dugong, manatees)</span><p class=\"tag\">Fully aquatic, herbivorous mammals.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Manatee_Florida.jpg\" target=\"_blank\"><img src=\"thumbnails/Manatee_Florida.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"520\" style=\"background-color:#606253\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dugong_dugon.jpg\" target=\"_blank\"><img src=\"thumbnails/Dugong_dugon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"737\" height=\"393\" style=\"background-color:#1b7198\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_proboscidea\" class=\"tree_box\"><span><span>Proboscidea</span><a href=\"https://en.wikipedia.org/wiki/Proboscidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Proboscidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Proboscidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Proboscidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌproʊbəˈsɪdiə\" target=\"_blank\">ˌproʊbəˈsɪdiə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(elephants, mastodons, mammoths, gomphotheres, stegodonts)</span><p class=\"tag\">Herbivorous mammals that are typically large with extant species having long tusks and strong mobile trunks.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Tuskercorbett.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tuskercorbett.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#819598\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Herd_of_Elephants.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Herd_of_Elephants.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#958e78\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Loxodontacyclotis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Loxodontacyclotis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#464838\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_tubulidentata\" class=\"tree_box\"><span><span>Tubulidentata</span><a href=\"https://en.wikipedia.org/wiki/Tubulidentata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tubulidentata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tubulidentata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tubulidentata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(aardvarks)</span><p class=\"tag\">Mammals with tubule-style teeth. Extant species are medium-sized, burrowing, nocturnal mammals native to Africa that feed almost exclusively on termites and ants.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:SanWild17.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-SanWild17.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#906a47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Orycteropus_afer_175359476.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Orycteropus_afer_175359476.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"361\" style=\"background-color:#b58c75\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Orycteropus_afer_175359469.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Orycteropus_afer_175359469.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#a57e67\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_macroscelidea\" class=\"tree_box\"><span><span>Macroscelidea</span><a href=\"https://en.wikipedia.org/wiki/Macroscelidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Macroscelidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Macroscelidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Macroscelidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(Elephant shrews, jumping shrews, sengis)</span><p class=\"tag\">Small quadrupedal insectivorous mammals with scaly tails and long snouts native to Africa that are superficially similar to shrews.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Rhynchocyon_petersi_from_side.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rhynchocyon_petersi_from_side.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#50493d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bushveld-elephant-shrew.jpg\" target=\"_blank\"><img src=\"thumbnails/Bushveld-elephant-shrew.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"720\" height=\"491\" style=\"background-color:#a28f7e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Petrodromus_tetradactylus-Zootaxa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Petrodromus_tetradactylus-Zootaxa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"157\" style=\"background-color:#8e7454\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_afrosoricida\" class=\"tree_box\"><span><span>Afrosoricida</span><a href=\"https://en.wikipedia.org/wiki/Afrosoricida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Afrosoricida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Afrosoricida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Afrosoricida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(golden moles, otter shrews, tenrecs)</span><p class=\"tag\">These small mammals have dirersified into a number of faunivorous niches in Madagascar and Africa so their morphology can vary with some species bearing similarities to hedgehogs, moles, shrews, or miniature otters.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Amblysomus_hottentotus_%28Palmiet_Nature_Reserve%2C_South_Africa_East_Coast%29_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amblysomus_hottentotus_%28Palmiet_Nature_Reserve%2C_South_Africa_East_Coast%29_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#af9178\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chrysochloris_asiatica_Cape_golden_mole_adult_IMG_7120.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chrysochloris_asiatica_Cape_golden_mole_adult_IMG_7120.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#e7e6e6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Potamogale_velox_340101862.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Potamogale_velox_340101862.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#4c3f33\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kleiner-igeltanrek-a.jpg\" target=\"_blank\"><img src=\"thumbnails/Kleiner-igeltanrek-a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"704\" height=\"449\" style=\"background-color:#86847e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Microgale_cowani.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Microgale_cowani.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7f4f33\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tanrek.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tanrek.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#737066\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Placentalia_Boreoeutheria\"><label class=\"tree_label\" for=\"Placentalia_Boreoeutheria\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_boreoeutheria\" class=\"tree_box\"><span><span>Boreoeutheria</span><a href=\"https://en.wikipedia.org/wiki/Boreoeutheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Boreoeutheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Boreoeutheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Boreoeutheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Magnorder</span></span><span class=\"common_names\">(primates, cats, dogs, hedgehogs, rodents, moles, true shrews, bats, pangolins, zebras, rhinoceroses, hippopotamuses, deer, cattle, whales)</span><p class=\"tag\">Most males have their testicles in an external pouch.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Boreoeutheria_Laurasiatheria\"><label class=\"tree_label\" for=\"Boreoeutheria_Laurasiatheria\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_laurasiatheria\" class=\"tree_box\"><span><span>Laurasiatheria</span><a href=\"https://en.wikipedia.org/wiki/Laurasiatheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Laurasiatheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Laurasiatheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Laurasiatheria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=lɔːrˌeɪʒəˈθɪəriə\" target=\"_blank\">lɔːrˌeɪʒəˈθɪəriə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><span class=\"common_names\">(hedgehogs, moles, true shrews, bats, cats, dogs, pangolins, zebras, rhinoceroses, hippopotamuses, deer, cattle, whales)</span><p class=\"tag\">Mammals with ancestors that originated on the northern supercontinent of Laurasia, after it split from Gondwana.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_eulipotyphla\" class=\"tree_box\"><span><span>Eulipotyphla</span><a href=\"https://en.wikipedia.org/wiki/Eulipotyphla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eulipotyphla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eulipotyphla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Eulipotyphla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌjuːlɪpoʊˈtɪflə\" target=\"_blank\">ˌjuːlɪpoʊˈtɪflə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(hedgehogs, gymnures, solenodons, moles, shrew-like moles, desmans, true shrews)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Talpa_europaea_MHNT_Tete.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Talpa_europaea_MHNT_Tete.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"228\" style=\"background-color:#6a5d50\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hispaniolan_Solenodon_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/Hispaniolan_Solenodon_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"720\" height=\"584\" style=\"background-color:#908779\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sorex-araneus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sorex-araneus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"184\" style=\"background-color:#76764c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Erinaceus_europaeus_%28Linnaeus%2C_1758%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Erinaceus_europaeus_%28Linnaeus%2C_1758%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#82884d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Talpa_europaea_MHNT.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Talpa_europaea_MHNT.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"204\" style=\"background-color:#b4aca3\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_chiroptera\" class=\"tree_box\"><span><span>Chiroptera</span><a href=\"https://en.wikipedia.org/wiki/Chiroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chiroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chiroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Chiroptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=kaɪˈrɒptərə\" target=\"_blank\">kaɪˈrɒptərə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(bats)</span><p class=\"tag\">The only mammals capable of true and sustained flight. Most are nocturnal, and many roost in caves. Many are insectivores, but some eat fruit, nectar, or blood.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Gro%C3%9Fes_Mausohr.jpg\" target=\"_blank\"><img src=\"thumbnails/Gro%C3%9Fes_Mausohr.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"427\" style=\"background-color:#11140e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lesser_short-nosed_fruit_bat_%28Cynopterus_brachyotis%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lesser_short-nosed_fruit_bat_%28Cynopterus_brachyotis%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"212\" style=\"background-color:#828b6f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Golden_crowned_fruit_bat.jpg\" target=\"_blank\"><img src=\"thumbnails/Golden_crowned_fruit_bat.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"200\" height=\"319\" style=\"background-color:#81734d\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Laurasiatheria_Ferungulata\"><label class=\"tree_label\" for=\"Laurasiatheria_Ferungulata\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_ferungulata\" class=\"tree_box\"><span><span>Ferungulata</span><a href=\"https://en.wikipedia.org/wiki/Ferungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ferungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ferungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ferungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Grandorder</span></span><span class=\"common_names\">(cats, dogs, pangolins, zebras, rhinoceroses, tapirs, hippopotamuses, deer, camels, cattle, whales)</span><p class=\"tag\">A clade of placental mammals that includes carnivores, pangolins, and the hoofed herbivores.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_pholidota\" class=\"tree_box\"><span><span>Pholidota</span><a href=\"https://en.wikipedia.org/wiki/Pholidota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pholidota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pholidota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pholidota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=fɒlɪˈdoʊtə\" target=\"_blank\">fɒlɪˈdoʊtə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(pangolins, scaly anteaters)</span><p class=\"tag\">Nocturnal mammals with large, protective keratin scales that live in hollow trees or burrows that mostly feed on ants and termites.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pangolin_brought_to_the_Range_office%2C_KMTR_AJTJ_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pangolin_brought_to_the_Range_office%2C_KMTR_AJTJ_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#be8c5c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Manis_temminckii_%2829390603130%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Manis_temminckii_%2829390603130%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#836748\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Philippine_Pangolin_Curled-up_by_Gregg_Yan.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Philippine_Pangolin_Curled-up_by_Gregg_Yan.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#687552\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_carnivora\" class=\"tree_box\"><span><span>Carnivora</span><a href=\"https://en.wikipedia.org/wiki/Carnivora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Carnivora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Carnivora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Carnivora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"carnivora\">See children</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(cats, dogs, hyenas, mongoose, bears, skunks, raccoons)</span><p class=\"tag\">An order of placental mammals specialized primarily in eating flesh.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:7_Walross_1999.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-7_Walross_1999.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#909c90\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%E7%8C%8E%E8%B1%B9.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%E7%8C%8E%E8%B1%B9.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7d874a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grizzly_Bear_Drip_%286968122232%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grizzly_Bear_Drip_%286968122232%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#858979\"></a><a href=\"https://commons.wikimedia.org/wiki/File:North_American_Wolf_-_Tala_0912_%287263487664%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-North_American_Wolf_-_Tala_0912_%287263487664%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#73875d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MinkforWiki.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-MinkforWiki.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#a7a29e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bored_Raccoon.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bored_Raccoon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#6b6f59\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Ferungulata_Euungulata\"><label class=\"tree_label\" for=\"Ferungulata_Euungulata\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_euungulata\" class=\"tree_box\"><span><span>Euungulata</span><a href=\"https://en.wikipedia.org/wiki/Euungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Euungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Euungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Euungulata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"></span><span class=\"common_names\">(horses, zebras, rhinoceroses, tapirs, pigs, hippopotamuses, deer, giraffes, camels, sheep, cattle, whales)</span><p class=\"tag\">Typically herbivorous mammals that descended from hooved ancestors.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_perissodactyla\" class=\"tree_box\"><span><span>Perissodactyla</span><a href=\"https://en.wikipedia.org/wiki/Perissodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Perissodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Perissodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Perissodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=pəˌrɪsoʊˈdæktɪlə\" target=\"_blank\">pəˌrɪsoʊˈdæktɪlə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(horses, asses, zebras, rhinoceroses, tapirs)</span><p class=\"tag\">The odd-toed ungulates are herbivores that digest plant cellulose in their intestines in an enlarged cecum.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ybtpr_3b_%2816045157658%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ybtpr_3b_%2816045157658%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"225\" style=\"background-color:#7b6f5e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eurasian_wild_horse.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eurasian_wild_horse.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"184\" style=\"background-color:#889363\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Waterberg_Nashorn2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Waterberg_Nashorn2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#9c8174\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Plains_Zebra_Equus_quagga_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Plains_Zebra_Equus_quagga_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"322\" style=\"background-color:#a18f70\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Donkey_in_Clovelly%2C_North_Devon%2C_England.jpg\" target=\"_blank\"><img src=\"thumbnails/Donkey_in_Clovelly%2C_North_Devon%2C_England.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"750\" height=\"536\" style=\"background-color:#787f54\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Schabrackentapir_Tapirus_indicus_Tiergarten-Nuernberg-1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Schabrackentapir_Tapirus_indicus_Tiergarten-Nuernberg-1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#868884\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_artiodactyla\" class=\"tree_box\"><span><span>Artiodactyla</span><a href=\"https://en.wikipedia.org/wiki/Artiodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Artiodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Artiodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Artiodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌɑːrtioʊˈdæktɪlə\" target=\"_blank\">ˌɑːrtioʊˈdæktɪlə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"artiodactyla\">See children</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(pigs, hippopotamuses, antelopes, deer, giraffes, camels, llamas, sheep, cattle, whales, dolphins)</span><p class=\"tag\">The even-toed ungulates bear weight equally on an even number of their toes and digest plant cellulose in one or more stomach chambers. Many are herbivores, but some are omnivorous, and others are entirely carnivorous.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Choeropsis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Choeropsis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"329\" height=\"264\" style=\"background-color:#736858\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sable_bull.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sable_bull.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"285\" style=\"background-color:#7f7a70\"></a><a href=\"https://commons.wikimedia.org/wiki/File:White-tailed_deer.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-White-tailed_deer.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#76685d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Giraffe_Mikumi_National_Park.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Giraffe_Mikumi_National_Park.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"316\" style=\"background-color:#908d76\"></a><a href=\"https://commons.wikimedia.org/wiki/File:07._Camel_Profile%2C_near_Silverton%2C_NSW%2C_07.07.2007.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-07._Camel_Profile%2C_near_Silverton%2C_NSW%2C_07.07.2007.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"308\" style=\"background-color:#877d69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Alpaca_%2831562329701%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Alpaca_%2831562329701%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"277\" style=\"background-color:#767963\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2005_04_27_1582_Dall_Sheep.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2005_04_27_1582_Dall_Sheep.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#746953\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dolphin_Encounter-9563.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dolphin_Encounter-9563.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#495f67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cow_%28Fleckvieh_breed%29_Oeschinensee_Slaunger_2009-07-07.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cow_%28Fleckvieh_breed%29_Oeschinensee_Slaunger_2009-07-07.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#8b895d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mother_and_baby_sperm_whale.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mother_and_baby_sperm_whale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#205997\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eubalaena_glacialis_with_calf.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eubalaena_glacialis_with_calf.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"280\" style=\"background-color:#227fb2\"></a></div></div></div></li></ul></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Boreoeutheria_Euarchontoglires\"><label class=\"tree_label\" for=\"Boreoeutheria_Euarchontoglires\"></label><div class=\"outer_tree_box\"><div id=\"mammalia_euarchontoglires\" class=\"tree_box\"><span><span>Euarchontoglires</span><a href=\"https://en.wikipedia.org/wiki/Euarchontoglires\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Euarchontoglires\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Euarchontoglires\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Euarchontoglires\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><span class=\"common_names\">(rodents, lagomorphs, treeshrews, primates, colugos)</span><p class=\"tag\">The rodents and the primates.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_scandentia\" class=\"tree_box\"><span><span>Scandentia</span><a href=\"https://en.wikipedia.org/wiki/Scandentia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Scandentia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Scandentia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Scandentia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(tree shrews, banxrings)</span><p class=\"tag\">Omnivorous mammals that live in small family groups, resemble shews and some species live in trees.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Spitzh%C3%B6rnchen.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Spitzh%C3%B6rnchen.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#677a5a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tupaia_minor.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tupaia_minor.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"284\" style=\"background-color:#6d7169\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anathana_ellioti.jpg\" target=\"_blank\"><img src=\"thumbnails/Anathana_ellioti.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"275\" height=\"130\" style=\"background-color:#605f41\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_lagomorpha\" class=\"tree_box\"><span><span>Lagomorpha</span><a href=\"https://en.wikipedia.org/wiki/Lagomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lagomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lagomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lagomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈlæɡəmɔːrf\" target=\"_blank\">ˈlæɡəmɔːrf</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(rabbits, hares, pikas)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Eastern_Cottontail.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Eastern_Cottontail.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"242\" style=\"background-color:#798f5e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:The_Pika.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-The_Pika.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"269\" style=\"background-color:#8e836e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pika.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pika.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#858382\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_rodentia\" class=\"tree_box\"><span><span>Rodentia</span><a href=\"https://en.wikipedia.org/wiki/Rodentia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rodentia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rodentia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Rodentia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=roʊˈdɛnʃə\" target=\"_blank\">roʊˈdɛnʃə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(mice, rats, bandicoot rat, squirrels, prairie dogs, porcupines, beavers, guinea pigs, hamsters)</span><p class=\"tag\">The group is characterized by a single pair of continuously growing incisors in each of the upper and lower jaws.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Hydrochoeris_hydrochaeris_in_Brazil_in_Petr%C3%B3polis%2C_Rio_de_Janeiro%2C_Brazil_09.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydrochoeris_hydrochaeris_in_Brazil_in_Petr%C3%B3polis%2C_Rio_de_Janeiro%2C_Brazil_09.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#8e9058\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Goldmantelziesel.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Goldmantelziesel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"284\" style=\"background-color:#7b756c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:American_Beaver.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-American_Beaver.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#8c755e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mouse_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/Mouse_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"300\" height=\"200\" style=\"background-color:#d0cac4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MainePorcupine.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-MainePorcupine.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#909d7e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cynomys_parvidens_%2829259482624%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cynomys_parvidens_%2829259482624%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#938167\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Graphiurus_spec_-murinus-1.jpg\" target=\"_blank\"><img src=\"thumbnails/Graphiurus_spec_-murinus-1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"533\" style=\"background-color:#5b4c42\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_dermoptera\" class=\"tree_box\"><span><span>Dermoptera</span><a href=\"https://en.wikipedia.org/wiki/Dermoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dermoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dermoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Dermoptera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(colugos, flying lemurs)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Colugo_%28Galeopterus_variegatus%2C_adult_female%29%2C_Central_Catchment_Area%2C_Singapore_-_20060618.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Colugo_%28Galeopterus_variegatus%2C_adult_female%29%2C_Central_Catchment_Area%2C_Singapore_-_20060618.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"312\" style=\"background-color:#676a48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flying_Lemur_%26_Baby%2C_Bohol.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Flying_Lemur_%26_Baby%2C_Bohol.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"326\" style=\"background-color:#827a53\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mammalia_primates\" class=\"tree_box\"><span><span>Primates</span><a href=\"https://en.wikipedia.org/wiki/Primates\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Primates\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Primates\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Primates\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"primates\">See children</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(lemurs, galagos, lorisids, monkeys, apes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Lemur_catta_001.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lemur_catta_001.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#988474\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bohol_Tarsier.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bohol_Tarsier.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#919989\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hylobates_lar_pair_of_white_and_black_01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hylobates_lar_pair_of_white_and_black_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5b765d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#747d60\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Papio_hamadryas_%28aka%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Papio_hamadryas_%28aka%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#544d49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#7b8169\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_animalia_chordata_tetrapoda_mammalia_artiodactyla",[{"name":"Camelidae","parent":"Artiodactyla","rank":"Family","ipa":"","etymology":"","common":["dromedary camels","Bactrian camels","llamas","alpacas","vicuñas","guanacos"],"tag":"Strictly herbivorous animals with slender necks and long legs but with vestigial canine teeth and tusk-like premolars and three-chambered stomachs. They have two-toed feet with toenails and soft foot pads, not hooves. Their red blood cells are elliptical.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/ac/Cladogram_of_Cetacea_within_Artiodactyla_%28Camelus_bactrianus%29.png/120px-Cladogram_of_Cetacea_within_Artiodactyla_%28Camelus_bactrianus%29.png"],"card":1},{"name":"Suina","parent":"Artiodactyla","rank":"Suborder","ipa":"","etymology":"","common":[],"tag":"The pigs. Omnivorous, non-ruminant artiodactyl mammals.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/Recherches_pour_servir_%C3%A0_l%27histoire_naturelle_des_mammif%C3%A8res_%28Pl._80%29_%28white_background%29.jpg/120px-Recherches_pour_servir_%C3%A0_l%27histoire_naturelle_des_mammif%C3%A8res_%28Pl._80%29_%28white_background%29.jpg"],"card":1},{"name":"Suidae","parent":"Suina","rank":"Family","ipa":"","etymology":"","common":["pigs","hogs","warthogs","babirusas"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/Recherches_pour_servir_%C3%A0_l%27histoire_naturelle_des_mammif%C3%A8res_%28Pl._80%29_%28white_background%29.jpg/120px-Recherches_pour_servir_%C3%A0_l%27histoire_naturelle_des_mammif%C3%A8res_%28Pl._80%29_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e8/PotamochoerusAfricanusWolf_white_background.jpg/120px-PotamochoerusAfricanusWolf_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/Babiroussa_%28white_background%29.jpg/120px-Babiroussa_%28white_background%29.jpg"],"card":4},{"name":"Tayassuidae","parent":"Suina","rank":"Family","ipa":"","etymology":"","common":["javelinas","skunk pigs"],"tag":"New World pig. Medium-sized animal, with a strong resemblance to a pigs but with tusks that are short and straight that interlock with each other. They have a three chambered stomach and are foregut fermenters.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/Collared_peccary02_-_melbourne_zoo.jpg/330px-Collared_peccary02_-_melbourne_zoo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Tayassu_pecari.jpg/330px-Tayassu_pecari.jpg"],"card":4},{"name":"Cetruminantia","parent":"Artiodactyla","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"The ruminants, hippopotamuses and whales.","imgs":[],"card":1},{"name":"Ruminantia","parent":"Cetruminantia","rank":"Suborder","ipa":"","etymology":"","common":["cattle","bovines","goats","sheep","giraffes","deer","gazelles","antelopes"],"tag":"The ruminants. They have a four-chambered stomach, and a paraxonic foot.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/ad/Walia_ibex_illustration_white_background.png/120px-Walia_ibex_illustration_white_background.png"],"card":2},{"name":"Tragulidae","parent":"Ruminantia","rank":"Family","ipa":"","etymology":"","common":["mouse-deer"],"tag":"The smallest hoofed mammals in the world. They have a four-chambered stomach (but the third chamber is poorly developed), and a paraxonic foot.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Tragulus_napu_-_1818-1842_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28white_background%29.jpg/120px-Tragulus_napu_-_1818-1842_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Mouse-deer_Singapore_Zoo_2012.JPG/250px-Mouse-deer_Singapore_Zoo_2012.JPG"],"card":2},{"name":"Pecora","parent":"Ruminantia","rank":"","ipa":"","etymology":"","common":[],"tag":"The horn bearers. Most species have cranial appendages projecting from their frontal bones but only some are properly called 'horns'. They have a four-chambered stomach, and a paraxonic foot.","imgs":[],"card":2},{"name":"Antilocapridae","parent":"Pecora","rank":"Family","ipa":"","etymology":"","common":["pronghorns"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d3/Antilocapra_white_background.jpg/120px-Antilocapra_white_background.jpg"],"card":5},{"name":"Giraffidae","parent":"Pecora","rank":"Family","ipa":"","etymology":"","common":["zebra giraffes","giraffes"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/Giraffa_camelopardalis_Brockhaus_white_background.jpg/120px-Giraffa_camelopardalis_Brockhaus_white_background.jpg"],"card":5},{"name":"Cervidae","parent":"Pecora","rank":"Family","ipa":"","etymology":"","common":["true deer","muntjac","elk","wapiti","red deer","fallow deer","reindeer","caribou","white-tailed deer","roe deer","moose"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1e/The_deer_of_all_lands_%281898%29_Hangul_white_background.png/120px-The_deer_of_all_lands_%281898%29_Hangul_white_background.png"],"card":5},{"name":"Bovidae","parent":"Pecora","rank":"Family","ipa":"","etymology":"","common":["cattle","bison","buffalo","antelopes","goat-antelopes","sheep","goats"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/bd/Birds_and_nature_%281901%29_%2814562088237%29_white_background.jpg/120px-Birds_and_nature_%281901%29_%2814562088237%29_white_background.jpg"],"species":143,"card":5},{"name":"Moschidae","parent":"Pecora","rank":"Family","ipa":"","etymology":"","common":["musk deer"],"tag":"Characterized by long 'saber teeth' instead of horns and a lack of facial glands.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Moschus_chrysogaster_white_background.jpg/120px-Moschus_chrysogaster_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2f/Siberian_Musk_Deer.jpg/250px-Siberian_Musk_Deer.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9d/Moschus_moschiferus_in_Plzen_zoo_%2812.02.2011%29.jpg/250px-Moschus_moschiferus_in_Plzen_zoo_%2812.02.2011%29.jpg"],"card":5},{"name":"Whippomorpha","parent":"Cetruminantia","rank":"Suborder","ipa":"","etymology":"","common":["hippopotamuses","whales","dolphins","porpoises"],"tag":"The even-toed ungulates that exhibit amphibious and aquatic behaviors possibly the point they now have flippers. They have a dense layer of subcutaneous fat and largely hairless bodies.","imgs":[],"card":2},{"name":"Hippopotamidae","parent":"Whippomorpha","rank":"Family","ipa":"","etymology":"","common":["hippopotamuses"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/82/Voyage_en_Abyssinie_Plate_2_%28white_background%29.jpg/120px-Voyage_en_Abyssinie_Plate_2_%28white_background%29.jpg"],"card":3},{"name":"Cetacea","parent":"Whippomorpha","rank":"Suborder","ipa":"","etymology":"","common":["whales","dolphins","porpoises"],"tag":"Have a fully aquatic lifestyle, streamlined body shape, often large size and exclusively carnivorous diet.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Bowhead-Whale1_%2816273933365%29.jpg/120px-Bowhead-Whale1_%2816273933365%29.jpg"],"card":3}],{},{"120px-Antilocapra_white_background.jpg":[120,152,"#d3c5b9"],"120px-Babiroussa_(white_background).jpg":[120,68,"#a1a39d"],"120px-Birds_and_nature_(1901)_(14562088237)_white_background.jpg":[120,78,"#a09088"],"120px-Bowhead-Whale1_(16273933365).jpg":[120,45,"#b5b7bd"],"120px-Cladogram_of_Cetacea_within_Artiodactyla_(Camelus_bactrianus).png":[120,85,"#c4b4a9"],"120px-Giraffa_camelopardalis_Brockhaus_white_background.jpg":[120,193,"#dfd6cb"],"120px-Moschus_chrysogaster_white_background.jpg":[120,108,"#d3c2af"],"120px-PotamochoerusAfricanusWolf_white_background.jpg":[120,74,"#9f988d"],"120px-Recherches_pour_servir_à_l'histoire_naturelle_des_mammifères_(Pl._80)_(white_background).jpg":[120,75,"#a0988d"],"120px-The_deer_of_all_lands_(1898)_Hangul_white_background.png":[120,143,"#d9d6cf"],"120px-Tragulus_napu_-_1818-1842_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_(white_background).jpg":[120,63,"#d5cfc4"],"120px-Voyage_en_Abyssinie_Plate_2_(white_background).jpg":[120,56,"#9a9897"],"120px-Walia_ibex_illustration_white_background.png":[120,105,"#d9cec9"],"250px-Moschus_moschiferus_in_Plzen_zoo_(12.02.2011).jpg":[250,333,"#79604a"],"250px-Mouse-deer_Singapore_Zoo_2012.JPG":[250,263,"#484136"],"250px-Siberian_Musk_Deer.jpg":[250,269,"#787675"],"330px-Collared_peccary02_-_melbourne_zoo.jpg":[330,220,"#807267"],"330px-Tayassu_pecari.jpg":[330,261,"#7d7875"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda_mammalia_artiodactyla","<ul class=\"tree\" data-tree-range=\"artiodactyla\"><li><input type=\"checkbox\" checked id=\"Euungulata_Artiodactyla\"><label class=\"tree_label\" for=\"Euungulata_Artiodactyla\"></label><div class=\"outer_tree_box\"><div id=\"artiodactyla_artiodactyla\" class=\"tree_box\"><span><span>Artiodactyla</span><a href=\"https://en.wikipedia.org/wiki/Artiodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Artiodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Artiodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Artiodactyla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌɑːrtioʊˈdæktɪlə\" target=\"_blank\">ˌɑːrtioʊˈdæktɪlə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"mammalia\">See parent</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(pigs, hippopotamuses, antelopes, deer, giraffes, camels, llamas, sheep, cattle, whales, dolphins)</span><p class=\"tag\">The even-toed ungulates bear weight equally on an even number of their toes and digest plant cellulose in one or more stomach chambers. Many are herbivores, but some are omnivorous, and others are entirely carnivorous.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Choeropsis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Choeropsis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"329\" height=\"264\" style=\"background-color:#736858\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sable_bull.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sable_bull.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"285\" style=\"background-color:#7f7a70\"></a><a href=\"https://commons.wikimedia.org/wiki/File:White-tailed_deer.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-White-tailed_deer.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#76685d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Giraffe_Mikumi_National_Park.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Giraffe_Mikumi_National_Park.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"316\" style=\"background-color:#908d76\"></a><a href=\"https://commons.wikimedia.org/wiki/File:07._Camel_Profile%2C_near_Silverton%2C_NSW%2C_07.07.2007.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-07._Camel_Profile%2C_near_Silverton%2C_NSW%2C_07.07.2007.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"308\" style=\"background-color:#877d69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Alpaca_%2831562329701%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Alpaca_%2831562329701%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"277\" style=\"background-color:#767963\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2005_04_27_1582_Dall_Sheep.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2005_04_27_1582_Dall_Sheep.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#746953\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dolphin_Encounter-9563.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dolphin_Encounter-9563.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#495f67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cow_%28Fleckvieh_breed%29_Oeschinensee_Slaunger_2009-07-07.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cow_%28Fleckvieh_breed%29_Oeschinensee_Slaunger_2009-07-07.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#8b895d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mother_and_baby_sperm_whale.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mother_and_baby_sperm_whale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#205997\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eubalaena_glacialis_with_calf.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eubalaena_glacialis_with_calf.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"280\" style=\"background-color:#227fb2\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"artiodactyla_camelidae\" class=\"tree_box\"><span><span>Camelidae</span><a href=\"https://en.wikipedia.org/wiki/Camelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Camelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Camelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Camelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(dromedary camels, Bactrian camels, llamas, alpacas, vicuñas, guanacos)</span><p class=\"tag\">Strictly herbivorous animals with slender necks and long legs but with vestigial canine teeth and tusk-like premolars and three-chambered stomachs. They have two-toed feet with toenails and soft foot pads, not hooves. Their red blood cells are elliptical.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cladogram_of_Cetacea_within_Artiodactyla_%28Camelus_bactrianus%29.png\" target=\"_blank\"><img src=\"thumbnails/120px-Cladogram_of_Cetacea_within_Artiodactyla_%28Camelus_bactrianus%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"85\" style=\"background-color:#c4b4a9\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Artiodactyla_Suina\"><label class=\"tree_label\" for=\"Artiodactyla_Suina\"></label><div class=\"outer_tree_box\"><div id=\"artiodactyla_suina\" class=\"tree_box\"><span><span>Suina</span><a href=\"https://en.wikipedia.org/wiki/Suina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Suina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Suina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Suina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><p class=\"tag\">The pigs. Omnivorous, non-ruminant artiodactyl mammals.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Recherches_pour_servir_%C3%A0_l%27histoire_naturelle_des_mammif%C3%A8res_%28Pl._80%29_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Recherches_pour_servir_%C3%A0_l%27histoire_naturelle_des_mammif%C3%A8res_%28Pl._80%29_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"75\" style=\"background-color:#a0988d\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"artiodactyla_suidae\" class=\"tree_box\"><span><span>Suidae</span><a href=\"https://en.wikipedia.org/wiki/Suidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Suidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Suidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Suidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(pigs, hogs, warthogs, babirusas)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Recherches_pour_servir_%C3%A0_l%27histoire_naturelle_des_mammif%C3%A8res_%28Pl._80%29_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Recherches_pour_servir_%C3%A0_l%27histoire_naturelle_des_mammif%C3%A8res_%28Pl._80%29_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"75\" style=\"background-color:#a0988d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:PotamochoerusAfricanusWolf_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-PotamochoerusAfricanusWolf_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"74\" style=\"background-color:#9f988d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Babiroussa_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Babiroussa_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"68\" style=\"background-color:#a1a39d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"artiodactyla_tayassuidae\" class=\"tree_box\"><span><span>Tayassuidae</span><a href=\"https://en.wikipedia.org/wiki/Tayassuidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tayassuidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tayassuidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tayassuidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(javelinas, skunk pigs)</span><p class=\"tag\">New World pig. Medium-sized animal, with a strong resemblance to a pigs but with tusks that are short and straight that interlock with each other. They have a three chambered stomach and are foregut fermenters.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Collared_peccary02_-_melbourne_zoo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Collared_peccary02_-_melbourne_zoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#807267\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tayassu_pecari.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tayassu_pecari.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"261\" style=\"background-color:#7d7875\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Artiodactyla_Cetruminantia\"><label class=\"tree_label\" for=\"Artiodactyla_Cetruminantia\"></label><div class=\"outer_tree_box\"><div id=\"artiodactyla_cetruminantia\" class=\"tree_box\"><span><span>Cetruminantia</span><a href=\"https://en.wikipedia.org/wiki/Cetruminantia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cetruminantia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cetruminantia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cetruminantia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">The ruminants, hippopotamuses and whales.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Cetruminantia_Ruminantia\"><label class=\"tree_label\" for=\"Cetruminantia_Ruminantia\"></label><div class=\"outer_tree_box\"><div id=\"artiodactyla_ruminantia\" class=\"tree_box\"><span><span>Ruminantia</span><a href=\"https://en.wikipedia.org/wiki/Ruminantia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ruminantia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ruminantia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ruminantia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(cattle, bovines, goats, sheep, giraffes, deer, gazelles, antelopes)</span><p class=\"tag\">The ruminants. They have a four-chambered stomach, and a paraxonic foot.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Walia_ibex_illustration_white_background.png\" target=\"_blank\"><img src=\"thumbnails/120px-Walia_ibex_illustration_white_background.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"105\" style=\"background-color:#d9cec9\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"artiodactyla_tragulidae\" class=\"tree_box\"><span><span>Tragulidae</span><a href=\"https://en.wikipedia.org/wiki/Tragulidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tragulidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tragulidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tragulidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(mouse-deer)</span><p class=\"tag\">The smallest hoofed mammals in the world. They have a four-chambered stomach (but the third chamber is poorly developed), and a paraxonic foot.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Tragulus_napu_-_1818-1842_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Tragulus_napu_-_1818-1842_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"63\" style=\"background-color:#d5cfc4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mouse-deer_Singapore_Zoo_2012.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Mouse-deer_Singapore_Zoo_2012.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"263\" style=\"background-color:#484136\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Ruminantia_Pecora\"><label class=\"tree_label\" for=\"Ruminantia_Pecora\"></label><div class=\"outer_tree_box\"><div id=\"artiodactyla_pecora\" class=\"tree_box\"><span><span>Pecora</span><a href=\"https://en.wikipedia.org/wiki/Pecora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pecora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pecora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pecora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"></span><p class=\"tag\">The horn bearers. Most species have cranial appendages projecting from their frontal bones but only some are properly called &#x27;horns&#x27;. They have a four-chambered stomach, and a paraxonic foot.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"artiodactyla_antilocapridae\" class=\"tree_box\"><span><span>Antilocapridae</span><a href=\"https://en.wikipedia.org/wiki/Antilocapridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Antilocapridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Antilocapridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Antilocapridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(pronghorns)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Antilocapra_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Antilocapra_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"152\" style=\"background-color:#d3c5b9\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"artiodactyla_giraffidae\" class=\"tree_box\"><span><span>Giraffidae</span><a href=\"https://en.wikipedia.org/wiki/Giraffidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Giraffidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Giraffidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Giraffidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(zebra giraffes, giraffes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Giraffa_camelopardalis_Brockhaus_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Giraffa_camelopardalis_Brockhaus_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"193\" style=\"background-color:#dfd6cb\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"artiodactyla_cervidae\" class=\"tree_box\"><span><span>Cervidae</span><a href=\"https://en.wikipedia.org/wiki/Cervidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cervidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cervidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cervidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(true deer, muntjac, elk, wapiti, red deer, fallow deer, reindeer, caribou, white-tailed deer, roe deer, moose)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:The_deer_of_all_lands_%281898%29_Hangul_white_background.png\" target=\"_blank\"><img src=\"thumbnails/120px-The_deer_of_all_lands_%281898%29_Hangul_white_background.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"143\" style=\"background-color:#d9d6cf\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"artiodactyla_bovidae\" class=\"tree_box\"><span><span>Bovidae</span><a href=\"https://en.wikipedia.org/wiki/Bovidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Bovidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Bovidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Bovidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(cattle, bison, buffalo, antelopes, goat-antelopes, sheep, goats)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Birds_and_nature_%281901%29_%2814562088237%29_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Birds_and_nature_%281901%29_%2814562088237%29_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"78\" style=\"background-color:#a09088\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"artiodactyla_moschidae\" class=\"tree_box\"><span><span>Moschidae</span><a href=\"https://en.wikipedia.org/wiki/Moschidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Moschidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Moschidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Moschidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(musk deer)</span><p class=\"tag\">Characterized by long &#x27;saber teeth&#x27; instead of horns and a lack of facial glands.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Moschus_chrysogaster_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Moschus_chrysogaster_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"108\" style=\"background-color:#d3c2af\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Siberian_Musk_Deer.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Siberian_Musk_Deer.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"269\" style=\"background-color:#787675\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Moschus_moschiferus_in_Plzen_zoo_%2812.02.2011%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Moschus_moschiferus_in_Plzen_zoo_%2812.02.2011%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#79604a\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Cetruminantia_Whippomorpha\"><label class=\"tree_label\" for=\"Cetruminantia_Whippomorpha\"></label><div class=\"outer_tree_box\"><div id=\"artiodactyla_whippomorpha\" class=\"tree_box\"><span><span>Whippomorpha</span><a href=\"https://en.wikipedia.org/wiki/Whippomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Whippomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Whippomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Whippomorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(hippopotamuses, whales, dolphins, porpoises)</span><p class=\"tag\">The even-toed ungulates that exhibit amphibious and aquatic behaviors possibly the point they now have flippers. They have a dense layer of subcutaneous fat and largely hairless bodies.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"artiodactyla_hippopotamidae\" class=\"tree_box\"><span><span>Hippopotamidae</span><a href=\"https://en.wikipedia.org/wiki/Hippopotamidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hippopotamidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hippopotamidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hippopotamidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(hippopotamuses)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Voyage_en_Abyssinie_Plate_2_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Voyage_en_Abyssinie_Plate_2_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"56\" style=\"background-color:#9a9897\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"artiodactyla_cetacea\" class=\"tree_box\"><span><span>Cetacea</span><a href=\"https://en.wikipedia.org/wiki/Cetacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cetacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cetacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cetacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"cetacea\">See children</button><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(whales, dolphins, porpoises)</span><p class=\"tag\">Have a fully aquatic lifestyle, streamlined body shape, often large size and exclusively carnivorous diet.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Bowhead-Whale1_%2816273933365%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Bowhead-Whale1_%2816273933365%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"45\" style=\"background-color:#b5b7bd\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda_mammalia_artiodactyla_cetacea","<ul class=\"tree\" data-tree-range=\"cetacea\"><li><input type=\"checkbox\" checked id=\"Whippomorpha_Cetacea\"><label class=\"tree_label\" for=\"Whippomorpha_Cetacea\"></label><div class=\"outer_tree_box\"><div id=\"cetacea_cetacea\" class=\"tree_box\"><span><span>Cetacea</span><a href=\"https://en.wikipedia.org/wiki/Cetacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cetacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cetacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cetacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"artiodactyla\">See parent</button><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(whales, dolphins, porpoises)</span><p class=\"tag\">Have a fully aquatic lifestyle, streamlined body shape, often large size and exclusively carnivorous diet.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Bowhead-Whale1_%2816273933365%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Bowhead-Whale1_%2816273933365%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"45\" style=\"background-color:#b5b7bd\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Cetacea_Mysticeti\"><label class=\"tree_label\" for=\"Cetacea_Mysticeti\"></label><div class=\"outer_tree_box\"><div id=\"cetacea_mysticeti\" class=\"tree_box\"><span><span>Mysticeti</span><a href=\"https://en.wikipedia.org/wiki/Mysticeti\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mysticeti\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mysticeti\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mysticeti\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Parvorder</span></span><p class=\"tag\">The baleen whales. They are all filter feeders. Some skim slow moving prey, some lunch schools, others bottom feed filtering the sand.  They have fused neck vertebrae, and are unable to turn their heads at all. They have a layer of blubber under the skin to keep warm in the cold water.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_balaenidae\" class=\"tree_box\"><span><span>Balaenidae</span><a href=\"https://en.wikipedia.org/wiki/Balaenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Balaenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Balaenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Balaenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=bəˈlɛnɪdeɪ\" target=\"_blank\">bəˈlɛnɪdeɪ</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(right whales, bowhead whales)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Eubalaena_japonica_drawing-removebg-preview.png\" target=\"_blank\"><img src=\"thumbnails/250px-Eubalaena_japonica_drawing-removebg-preview.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"189\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eubalaena_australis3_flipped.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eubalaena_australis3_flipped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"120\" style=\"background-color:#bcbcbc\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_cetotheriidae\" class=\"tree_box\"><span><span>Cetotheriidae</span><a href=\"https://en.wikipedia.org/wiki/Cetotheriidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cetotheriidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cetotheriidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cetotheriidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(pygmy right whales)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Caperea_marginata_3.jpg\" target=\"_blank\"><img src=\"thumbnails/Caperea_marginata_3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"1014\" height=\"376\" style=\"background-color:#c8ccd4\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_balaenopteridae\" class=\"tree_box\"><span><span>Balaenopteridae</span><a href=\"https://en.wikipedia.org/wiki/Balaenopteridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Balaenopteridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Balaenopteridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Balaenopteridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(right whales, grey whales, blue whales, humpback whales, fin whales, sei whales, minke whales)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Blauwal.png\" target=\"_blank\"><img src=\"thumbnails/Blauwal.png\" class=\"taxa-img\" loading=\"lazy\" width=\"450\" height=\"126\" style=\"background-color:#bdc5c7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Megaptera_novaeangliae_NOAA.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Megaptera_novaeangliae_NOAA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"118\" style=\"background-color:#c1c1c1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rorcual_austral_3_flipped.jpg\" target=\"_blank\"><img src=\"thumbnails/Rorcual_austral_3_flipped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"213\" style=\"background-color:#d2d2d2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Balaenoptera_edeni.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Balaenoptera_edeni.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"80\" style=\"background-color:#dddddd\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Cetacea_Odontoceti\"><label class=\"tree_label\" for=\"Cetacea_Odontoceti\"></label><div class=\"outer_tree_box\"><div id=\"cetacea_odontoceti\" class=\"tree_box\"><span><span>Odontoceti</span><a href=\"https://en.wikipedia.org/wiki/Odontoceti\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Odontoceti\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Odontoceti\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Odontoceti\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Parvorder</span></span><p class=\"tag\">The toothed whales. They feed largely on fish and squid, but a few feed on mammals. Many species are highly sociable, with some pods reaching over a thousand individuals.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_kogiidae\" class=\"tree_box\"><span><span>Kogiidae</span><a href=\"https://en.wikipedia.org/wiki/Kogiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Kogiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Kogiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Kogiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">Dwarf sperm whales.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Kogia_sima_%28transparent_background%29.png\" target=\"_blank\"><img src=\"thumbnails/120px-Kogia_sima_%28transparent_background%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"84\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_physeteridae\" class=\"tree_box\"><span><span>Physeteridae</span><a href=\"https://en.wikipedia.org/wiki/Physeteridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Physeteridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Physeteridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Physeteridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">Sperm whales.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Physeter_macrocephalus_NOAA.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Physeter_macrocephalus_NOAA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"35\" style=\"background-color:#b7b7b7\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_platanistidae\" class=\"tree_box\"><span><span>Platanistidae</span><a href=\"https://en.wikipedia.org/wiki/Platanistidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Platanistidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Platanistidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Platanistidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(Ganges river dolphins, Indus river dolphins)</span><p class=\"tag\">The river dolphins of South Asia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ganges.png\" target=\"_blank\"><img src=\"thumbnails/120px-Ganges.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"47\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_ziphiidae\" class=\"tree_box\"><span><span>Ziphiidae</span><a href=\"https://en.wikipedia.org/wiki/Ziphiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ziphiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ziphiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ziphiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">The beaked whales.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ziphius_cavirostris_NOAA.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Ziphius_cavirostris_NOAA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"35\" style=\"background-color:#c3c3c3\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Odontoceti_Delphinida\"><label class=\"tree_label\" for=\"Odontoceti_Delphinida\"></label><div class=\"outer_tree_box\"><div id=\"cetacea_delphinida\" class=\"tree_box\"><span><span>Delphinida</span><a href=\"https://en.wikipedia.org/wiki/Delphinida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Delphinida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Delphinida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Delphinida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">The modern oceanic dolphins, porpoises, and most river dolphins.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Delphinida_Inioidea\"><label class=\"tree_label\" for=\"Delphinida_Inioidea\"></label><div class=\"outer_tree_box\"><div id=\"cetacea_inioidea\" class=\"tree_box\"><span><span>Inioidea</span><a href=\"https://en.wikipedia.org/wiki/Inioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Inioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Inioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Inioidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><p class=\"tag\">American River Dolphins.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_iniidae\" class=\"tree_box\"><span><span>Iniidae</span><a href=\"https://en.wikipedia.org/wiki/Iniidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Iniidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Iniidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Iniidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(Araguaian river dolphins, Bolivian river dolphins, Amazon river dolphins, Orinoco river dolphins)</span><p class=\"tag\">A family of river dolphins living in the Orinoco and Amazon basins (connected through the Casiquiare canal).</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Inia_geoffrensis.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Inia_geoffrensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"40\" style=\"background-color:#dfdfdf\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_pontoporiidae\" class=\"tree_box\"><span><span>Pontoporiidae</span><a href=\"https://en.wikipedia.org/wiki/Pontoporiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pontoporiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pontoporiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pontoporiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(La Plata dolphins)</span><p class=\"tag\">A river dolphin found in coastal Atlantic waters of southeastern South America in the ocean and saltwater estuaries.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pontoporia_blainvillei.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Pontoporia_blainvillei.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"41\" style=\"background-color:#e6e6e6\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_lipotidae\" class=\"tree_box\"><span><span>Lipotidae</span><a href=\"https://en.wikipedia.org/wiki/Lipotidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lipotidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lipotidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lipotidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(Yangtze river dolphins.)</span><p class=\"tag\">The river dolphins of China. Thought to be newly extinct.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lipotes_vexillifer.png\" target=\"_blank\"><img src=\"thumbnails/120px-Lipotes_vexillifer.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"52\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Delphinida_Delphinoidea\"><label class=\"tree_label\" for=\"Delphinida_Delphinoidea\"></label><div class=\"outer_tree_box\"><div id=\"cetacea_delphinoidea\" class=\"tree_box\"><span><span>Delphinoidea</span><a href=\"https://en.wikipedia.org/wiki/Delphinoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Delphinoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Delphinoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Delphinoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><span class=\"common_names\">(oceanic dolphins, porpoises, narwhals, beluga whales)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_delphinidae\" class=\"tree_box\"><span><span>Delphinidae</span><a href=\"https://en.wikipedia.org/wiki/Delphinidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Delphinidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Delphinidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Delphinidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(false killer whales, pilot whales, Maui&#x27;s dolphins, orcas, bottlenose dolphins)</span><p class=\"tag\">The true dolphins, or oceanic dolphins.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Orcinus_orca_NOAA_2.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Orcinus_orca_NOAA_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"63\" style=\"background-color:#cecece\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_monodontidae\" class=\"tree_box\"><span><span>Monodontidae</span><a href=\"https://en.wikipedia.org/wiki/Monodontidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Monodontidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Monodontidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Monodontidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(narwhals, beluga whales)</span><p class=\"tag\">Medium-sized whales found at high latitudes in the arctic seas and in most of the major rivers draining into them. They feed mainly near the bottom on fish and invertebrates and are generally found in schools, sometimes more than 100 individuals.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Delphinapterus_leucas_NOAA.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Delphinapterus_leucas_NOAA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"30\" style=\"background-color:#e9e9e9\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cetacea_phocoenidae\" class=\"tree_box\"><span><span>Phocoenidae</span><a href=\"https://en.wikipedia.org/wiki/Phocoenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Phocoenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Phocoenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Phocoenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(porpoises)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Vaquita_swimming_through_the_void._%28Phocoena_Sinus%29.png\" target=\"_blank\"><img src=\"thumbnails/120px-Vaquita_swimming_through_the_void._%28Phocoena_Sinus%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"67\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_animalia_chordata_tetrapoda_mammalia_carnivora",[{"name":"Feliformia","parent":"Carnivora","rank":"Suborder","ipa":"","etymology":"","common":["cats","hyenas","mongooses","viverrids"],"tag":"The 'cat-like' animals.","imgs":[],"species":0},{"name":"Nandiniidae","parent":"Feliformia","rank":"Family","ipa":"","etymology":"","common":["African palm civet"],"tag":"A small feliform mammal that's nocturnal, largely arboreal, eats fruit and widely distributed in sub-Saharan Africa.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/ad/The_carnivores_of_West_Africa_%28Nandinia_binotata_white_background%29.png/120px-The_carnivores_of_West_Africa_%28Nandinia_binotata_white_background%29.png","https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/Nandinia_binotata%2C_Manchester_Museum.jpg/330px-Nandinia_binotata%2C_Manchester_Museum.jpg"],"species":1},{"name":"Viverroidea","parent":"Feliformia","rank":"Parvorder","ipa":"","etymology":"","tag":"Includes viverrids, mongooses and hyaenas.","imgs":[],"species":0},{"name":"Viverridae","parent":"Viverroidea","rank":"Family","ipa":"","etymology":"","common":["viverrids","civets","genets","oyans","African linsangs"],"tag":"Found in Southern Europe, Indomalayan realm, and Africa.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/Malay_Civet_%28Viverra_tangalunga%29_white_background.jpg/120px-Malay_Civet_%28Viverra_tangalunga%29_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/Small_Indian_Civet%2C_Silchar%2C_Assam%2C_India.jpg/330px-Small_Indian_Civet%2C_Silchar%2C_Assam%2C_India.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/05/Banded_palm_civet_10.jpg/330px-Banded_palm_civet_10.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a7/Binturong_in_Overloon.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Palm_civet_on_tree_%28detail%29.jpg/330px-Palm_civet_on_tree_%28detail%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/63/Genetta_genetta_felina_%28Wroclaw_zoo%29.JPG/250px-Genetta_genetta_felina_%28Wroclaw_zoo%29.JPG"],"species":34},{"name":"Herpestidae","parent":"Viverroidea","rank":"Family","ipa":"","etymology":"","common":["mongooses","meerkats"],"tag":"Found in the Iberian Peninsula, Africa, the Middle East, the Caucasus, Central Asia, and the Indomalayan realm.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e7/Lydekker_-_Broad-banded_Cusimanse_%28white_background%29.JPG/120px-Lydekker_-_Broad-banded_Cusimanse_%28white_background%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/3/34/Herpestes_ichneumon%2C_Israel_4.jpg/330px-Herpestes_ichneumon%2C_Israel_4.jpg","https://upload.wikimedia.org/wikipedia/commons/9/96/Herpestes_edwardsii_at_Hyderaba.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9a/Cynictis_penicillata_%28Etosha%2C_2011%29.jpg/250px-Cynictis_penicillata_%28Etosha%2C_2011%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9a/Meerkat_%28Suricata_suricatta%29_Tswalu.jpg/330px-Meerkat_%28Suricata_suricatta%29_Tswalu.jpg"],"species":34},{"name":"Eupleridae","parent":"Viverroidea","rank":"Family","ipa":"","etymology":"","common":["Malagasy mongooses","Malagasy civets","mongoose-like euplerids"],"tag":"Believed to have evolved from a single raft event from mainland Africa 18–24 million years ago. Found in Madagascar.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/8b/Cryptoprocta_ferox_-_1700-1880_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-%28white_background%29.png/120px-Cryptoprocta_ferox_-_1700-1880_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-%28white_background%29.png","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/Eupleres_goudotii_-_Museo_Civico_di_Storia_Naturale_Giacomo_Doria_-_Genoa%2C_Italy_-_DSC02711.JPG/330px-Eupleres_goudotii_-_Museo_Civico_di_Storia_Naturale_Giacomo_Doria_-_Genoa%2C_Italy_-_DSC02711.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/Galidia_elegans_1.jpg/250px-Galidia_elegans_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a6/Cryptoprocta_Ferox.JPG/330px-Cryptoprocta_Ferox.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7b/Smalstreepmangoest.JPG/330px-Smalstreepmangoest.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ac/Spotted_fanaloka_%28Fossa_fossana%29.jpg/330px-Spotted_fanaloka_%28Fossa_fossana%29.jpg"],"species":8},{"name":"Hyaenidae","parent":"Viverroidea","rank":"Family","ipa":"","etymology":"","common":["hyenas"],"tag":"Found in Africa, the Middle East, the Caucasus, Central Asia, and the Indian subcontinent.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/3c/Spotted_hyena_%28Crocuta_crocuta%29_by_Connor_Ashbridge.png/120px-Spotted_hyena_%28Crocuta_crocuta%29_by_Connor_Ashbridge.png","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2b/Hyena_at_chattbir_zoo.jpg/330px-Hyena_at_chattbir_zoo.jpg"],"species":4},{"name":"Feloidea","parent":"Feliformia","rank":"Superfamily","ipa":"","etymology":"","tag":"Includes cats and Asiatic linsangs","imgs":[],"species":0},{"name":"Prionodontidae","parent":"Feloidea","rank":"Family","ipa":"","etymology":"","common":["Asiatic linsangs"],"tag":"Tree-dwelling carnivorous mammals that are nocturnal, solitary, and at least partly arboreal. They den in hollows in trees and feed on rodents, frogs and snakes. Native to the Indomalayan realm.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/0e/Prionodon_maculosus.png/120px-Prionodon_maculosus.png","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/Prionodon_linsang_-_Museo_Civico_di_Storia_Naturale_Giacomo_Doria_-_Genoa%2C_Italy_-_DSC02704.JPG/330px-Prionodon_linsang_-_Museo_Civico_di_Storia_Naturale_Giacomo_Doria_-_Genoa%2C_Italy_-_DSC02704.JPG"],"species":2},{"name":"Felidae","parent":"Feloidea","rank":"Family","ipa":"","etymology":"","common":["cats","tigers","leopards","jaguars","lions","cheetahs","ocelots"],"tag":"Found in the Americas, Africa, and Eurasia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/bf/Stamp-russia2014-save-russian-cats-%28snow_leopard%29.png/120px-Stamp-russia2014-save-russian-cats-%28snow_leopard%29.png","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b6/Felis_catus-cat_on_snow.jpg/330px-Felis_catus-cat_on_snow.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/Walking_tiger_female.jpg/330px-Walking_tiger_female.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/African_leopard_male_%28cropped%29.jpg/250px-African_leopard_male_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/0/0a/Standing_jaguar.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a6/020_The_lion_king_Snyggve_in_the_Serengeti_National_Park_Photo_by_Giles_Laurent.jpg/330px-020_The_lion_king_Snyggve_in_the_Serengeti_National_Park_Photo_by_Giles_Laurent.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/92/Male_cheetah_facing_left_in_South_Africa.jpg/330px-Male_cheetah_facing_left_in_South_Africa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Ocelot_%28Jaguatirica%29_Zoo_Itatiba.jpg/330px-Ocelot_%28Jaguatirica%29_Zoo_Itatiba.jpg"],"species":37},{"name":"Caniformia","parent":"Carnivora","rank":"Suborder","ipa":"","etymology":"","common":["dogs","bears","raccoons","mustelids","pinnipeds"],"tag":"The 'dog-like' animals.","imgs":[],"species":0},{"name":"Canidae","parent":"Caniformia","rank":"Family","ipa":"","etymology":"","common":["dogs","wolves","foxes","dingoes","jackals","coyotes"],"tag":"Found in the Americas, Africa, and Eurasia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Dogs%2C_jackals%2C_wolves%2C_and_foxes_%28Plate_XI%29.jpg/120px-Dogs%2C_jackals%2C_wolves%2C_and_foxes_%28Plate_XI%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/2013072515020909_MyDogs_622.jpg/330px-2013072515020909_MyDogs_622.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/Eurasian_wolf_2.jpg/330px-Eurasian_wolf_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/Vulpes_vulpes_ssp_fulvus.jpg/330px-Vulpes_vulpes_ssp_fulvus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Dingo_%28Canis_lupus_dingo%29_Kakadu_2.jpg/330px-Dingo_%28Canis_lupus_dingo%29_Kakadu_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/37/Flickr_-_Rainbirder_-_Golden_Jackal_%281%29.jpg/330px-Flickr_-_Rainbirder_-_Golden_Jackal_%281%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/2009-Coyote-Yosemite.jpg/250px-2009-Coyote-Yosemite.jpg"],"species":35},{"name":"Arctoidea","parent":"Caniformia","rank":"Infraorder","ipa":"","etymology":"","common":["bears","raccoons","mustelids","pinnipeds"],"tag":"mostly carnivorous mammals found in all continents from 46 million years ago to the present.","imgs":[],"species":0},{"name":"Ursidae","parent":"Arctoidea","rank":"Family","ipa":"","etymology":"","common":["brown bears","black bears","panda bears","spectacled bears","polar bear"],"tag":"Modern bears include large bodies with stocky legs, long snouts, small rounded ears, shaggy hair, plantigrade paws with five nonretractile claws, and short tails. Found in the Americas and Eurasia. The polar bear is mostly carnivorous, the giant panda is mostly herbivorous, and the remaining species are omnivorous with varying diets.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1a/Grizzly_Bear_Family_in_Glacier_National_Park.jpg/330px-Grizzly_Bear_Family_in_Glacier_National_Park.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/American_black_bear_cub_in_tree_-_DPLA_-_bde0bcd3661a5079a10ef3e34dd41e96.jpg/250px-American_black_bear_cub_in_tree_-_DPLA_-_bde0bcd3661a5079a10ef3e34dd41e96.jpg","https://upload.wikimedia.org/wikipedia/commons/6/66/Polar_Bear_-_Alaska_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/Ursus_thibetanus_3_%28Wroclaw_zoo%29.JPG/250px-Ursus_thibetanus_3_%28Wroclaw_zoo%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fe/Sun_bear_climbing.jpg/330px-Sun_bear_climbing.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Sloth_bear_stand.jpg/250px-Sloth_bear_stand.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/99/Spectacled_Bear_-_Houston_Zoo.jpg/330px-Spectacled_Bear_-_Houston_Zoo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cd/Panda_Cub_from_Wolong%2C_Sichuan%2C_China.JPG/330px-Panda_Cub_from_Wolong%2C_Sichuan%2C_China.JPG"],"species":8},{"name":"Pinnipedia","parent":"Arctoidea","rank":"Parvorder","ipa":"","etymology":"","common":[],"tag":"Carnivorous, fin-footed, semiaquatic, mostly marine mammals.","imgs":[],"species":0},{"name":"Phocidae","parent":"Pinnipedia","rank":"Family","ipa":"ˈfoʊsɪdiː","etymology":"","common":["elephant seals","monk seals","Baikal seals"],"tag":"The earless seals - true seals. Found in the sea and Lake Baikal.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/8a/Cambridge_Natural_History_Mammalia_Fig_230_white_background.jpg/120px-Cambridge_Natural_History_Mammalia_Fig_230_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7d/Seehund.jpg/330px-Seehund.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/Monachus_monachus_DSC_0274.jpg/330px-Monachus_monachus_DSC_0274.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/Nerpa_%28Pusa_sibirica%29_%283635255975%29.jpg/330px-Nerpa_%28Pusa_sibirica%29_%283635255975%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/Mirounga_leonina.jpg/330px-Mirounga_leonina.jpg"],"species":18},{"name":"Otariidae","parent":"Pinnipedia","rank":"Family","ipa":"","etymology":"greek 'little ear'","common":["fur seals","sea lions"],"tag":"The Eared seals - fur seals and sea lions. Found in subpolar, temperate, and equatorial waters throughout the Pacific and Southern Oceans and the southern Indian and Atlantic Oceans. Have small but visible external ear flaps.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/76/NIE_1905_Seal_%28white_background%29.jpg/120px-NIE_1905_Seal_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0f/Southern_Sea_Lions.jpg/330px-Southern_Sea_Lions.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Otaria_fg02.jpg/330px-Otaria_fg02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Sea_lion_head.jpg/250px-Sea_lion_head.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/Kangaroosealion.jpg/250px-Kangaroosealion.jpg"],"species":15},{"name":"Odobenidae","parent":"Pinnipedia","rank":"Family","ipa":"","etymology":"","common":["walruses"],"tag":"Found in the North Pole in the Arctic Ocean and subarctic seas of the Northern Hemisphere.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/7d/Walrus_animal_male_detailed_photo_white_background.jpg/120px-Walrus_animal_male_detailed_photo_white_background.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/13/Walrus2.jpg/330px-Walrus2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Pacific_Walrus_-_Bull_%288247646168%29.jpg/330px-Pacific_Walrus_-_Bull_%288247646168%29.jpg"],"species":1},{"name":"Musteloidea","parent":"Arctoidea","rank":"Superfamily","ipa":"","etymology":"","common":[],"tag":"Includes the weasels, raccoons, red pandas, and skunks.","imgs":[],"species":0},{"name":"Mephitidae","parent":"Musteloidea","rank":"Family","ipa":"","etymology":"","common":["skunks","stink badgers"],"tag":"Found in the Americas, western Philippines, and Indonesia and Malaysia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Die_S%C3%A4ugthiere_in_Abbildungen_nach_der_Natur%2C_mit_Beschreibungen_%28Plate_CXXI-%29_%28white_background%29.jpg/120px-Die_S%C3%A4ugthiere_in_Abbildungen_nach_der_Natur%2C_mit_Beschreibungen_%28Plate_CXXI-%29_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/Skunk_about_to_spray.jpg/330px-Skunk_about_to_spray.jpg"],"species":12},{"name":"Ailuridae","parent":"Musteloidea","rank":"Family","ipa":"","etymology":"","common":["red panda"],"tag":"Found in the Eastern Himalayas and southwestern China.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/62/RedPandaFullBody_white_background.JPG/120px-RedPandaFullBody_white_background.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/RedPanda_SingalilaNationalPark_DFrame.jpg/330px-RedPanda_SingalilaNationalPark_DFrame.jpg"],"species":1},{"name":"Procyonidae","parent":"Musteloidea","rank":"Family","ipa":"","etymology":"","common":["raccoons","olingos","ringtails","coatis","cacomistles","kinkajous"],"tag":"Found in the Americas.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cd/Wild_animals_of_North_America%2C_intimate_studies_of_big_and_little_creatures_of_the_mammal_kingdom_%28Page_410%29_%28white_background%29.jpg/120px-Wild_animals_of_North_America%2C_intimate_studies_of_big_and_little_creatures_of_the_mammal_kingdom_%28Page_410%29_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7f/Waschbaer_auf_dem_Dach.jpg/330px-Waschbaer_auf_dem_Dach.jpg"],"species":12},{"name":"Mustelidae","parent":"Musteloidea","rank":"Family","ipa":"","etymology":"","common":["weasels","otters","wolverines","polecats","badgers","martens","grisons"],"tag":"Found in the Americas, Africa, and Eurasia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5b/Fitch_white_background.png/120px-Fitch_white_background.png","https://upload.wikimedia.org/wikipedia/commons/thumb/9/97/Stoat_-_RSPB_Sandy_%2828058976023%29.jpg/330px-Stoat_-_RSPB_Sandy_%2828058976023%29.jpg"],"species":57}],{},{"120px-Cambridge_Natural_History_Mammalia_Fig_230_white_background.jpg":[120,46,"#d4d4d4"],"120px-Cryptoprocta_ferox_-_1700-1880_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-(white_background).png":[120,78,"#dcd4cc"],"120px-Die_Säugthiere_in_Abbildungen_nach_der_Natur,_mit_Beschreibungen_(Plate_CXXI-)_(white_background).jpg":[120,68,"#cbc7bd"],"120px-Dogs,_jackals,_wolves,_and_foxes_(Plate_XI).jpg":[120,77,"#d0c8bb"],"120px-Fitch_white_background.png":[120,59,"#c4bcb0"],"120px-Lydekker_-_Broad-banded_Cusimanse_(white_background).JPG":[120,49,"#cdc4b6"],"120px-Malay_Civet_(Viverra_tangalunga)_white_background.jpg":[120,63,"#c2c1c0"],"120px-NIE_1905_Seal_(white_background).jpg":[120,94,"#d0c4b5"],"120px-Prionodon_maculosus.png":[120,61,"#c3bdb0"],"120px-RedPandaFullBody_white_background.JPG":[120,52,"#aea195"],"120px-Spotted_hyena_(Crocuta_crocuta)_by_Connor_Ashbridge.png":[120,89,"#d3c8bf"],"120px-Stamp-russia2014-save-russian-cats-(snow_leopard).png":[120,62,"#d0ccc8"],"120px-The_carnivores_of_West_Africa_(Nandinia_binotata_white_background).png":[120,46,"#cfc3b3"],"120px-Walrus_animal_male_detailed_photo_white_background.jpg":[120,62,"#b7b0ad"],"120px-Wild_animals_of_North_America,_intimate_studies_of_big_and_little_creatures_of_the_mammal_kingdom_(Page_410)_(white_background).jpg":[120,63,"#cfc7b8"],"250px-2009-Coyote-Yosemite.jpg":[250,290,"#cac8bf"],"250px-African_leopard_male_(cropped).jpg":[250,250,"#454345"],"250px-American_black_bear_cub_in_tree_-_DPLA_-_bde0bcd3661a5079a10ef3e34dd41e96.jpg":[250,380,"#7c8987"],"250px-Cynictis_penicillata_(Etosha,_2011).jpg":[250,375,"#646855"],"250px-Galidia_elegans_1.jpg":[250,250,"#736458"],"250px-Genetta_genetta_felina_(Wroclaw_zoo).JPG":[250,333,"#594230"],"250px-Kangaroosealion.jpg":[250,333,"#9a9998"],"250px-Sea_lion_head.jpg":[250,310,"#6e5948"],"250px-Sloth_bear_stand.jpg":[250,376,"#5a554f"],"250px-Ursus_thibetanus_3_(Wroclaw_zoo).JPG":[250,333,"#828488"],"330px-020_The_lion_king_Snyggve_in_the_Serengeti_National_Park_Photo_by_Giles_Laurent.jpg":[330,220,"#b29e7d"],"330px-2013072515020909_MyDogs_622.jpg":[330,220,"#84735c"],"330px-Banded_palm_civet_10.jpg":[330,236,"#746d67"],"330px-Cryptoprocta_Ferox.JPG":[330,250,"#8c7e62"],"330px-Dingo_(Canis_lupus_dingo)_Kakadu_2.jpg":[330,291,"#79746a"],"330px-Eupleres_goudotii_-_Museo_Civico_di_Storia_Naturale_Giacomo_Doria_-_Genoa,_Italy_-_DSC02711.JPG":[330,221,"#8bb85e"],"330px-Eurasian_wolf_2.jpg":[330,256,"#bbb8b8"],"330px-Felis_catus-cat_on_snow.jpg":[330,220,"#a8abb0"],"330px-Flickr_-_Rainbirder_-_Golden_Jackal_(1).jpg":[330,220,"#9c877b"],"330px-Grizzly_Bear_Family_in_Glacier_National_Park.jpg":[330,220,"#6b8d74"],"330px-Herpestes_ichneumon,_Israel_4.jpg":[330,220,"#a59379"],"330px-Hyena_at_chattbir_zoo.jpg":[330,247,"#5c6a48"],"330px-Male_cheetah_facing_left_in_South_Africa.jpg":[330,220,"#685e4b"],"330px-Meerkat_(Suricata_suricatta)_Tswalu.jpg":[330,272,"#855429"],"330px-Mirounga_leonina.jpg":[330,219,"#bec0c6"],"330px-Monachus_monachus_DSC_0274.jpg":[330,247,"#767a7a"],"330px-Nandinia_binotata,_Manchester_Museum.jpg":[330,247,"#968d82"],"330px-Nerpa_(Pusa_sibirica)_(3635255975).jpg":[330,221,"#697376"],"330px-Ocelot_(Jaguatirica)_Zoo_Itatiba.jpg":[330,254,"#6a6352"],"330px-Otaria_fg02.jpg":[330,219,"#968672"],"330px-Pacific_Walrus_-_Bull_(8247646168).jpg":[330,220,"#9da2a5"],"330px-Palm_civet_on_tree_(detail).jpg":[330,241,"#c2bdb9"],"330px-Panda_Cub_from_Wolong,_Sichuan,_China.JPG":[330,220,"#4c514c"],"330px-Prionodon_linsang_-_Museo_Civico_di_Storia_Naturale_Giacomo_Doria_-_Genoa,_Italy_-_DSC02704.JPG":[330,176,"#86a436"],"330px-RedPanda_SingalilaNationalPark_DFrame.jpg":[330,264,"#64624a"],"330px-Seehund.jpg":[330,219,"#777364"],"330px-Skunk_about_to_spray.jpg":[330,402,"#948b7c"],"330px-Small_Indian_Civet,_Silchar,_Assam,_India.jpg":[330,220,"#989d8c"],"330px-Smalstreepmangoest.JPG":[330,220,"#635342"],"330px-Southern_Sea_Lions.jpg":[330,330,"#6e726c"],"330px-Spectacled_Bear_-_Houston_Zoo.jpg":[330,300,"#555754"],"330px-Spotted_fanaloka_(Fossa_fossana).jpg":[330,220,"#644d3c"],"330px-Stoat_-_RSPB_Sandy_(28058976023).jpg":[330,220,"#9d984d"],"330px-Sun_bear_climbing.jpg":[330,250,"#797b61"],"330px-Vulpes_vulpes_ssp_fulvus.jpg":[330,248,"#b3a9a1"],"330px-Walking_tiger_female.jpg":[330,182,"#7d7859"],"330px-Walrus2.jpg":[330,242,"#60453f"],"330px-Waschbaer_auf_dem_Dach.jpg":[330,247,"#7b746e"],"Binturong_in_Overloon.jpg":[800,545,"#708869"],"Herpestes_edwardsii_at_Hyderaba.jpg":[800,527,"#7a6e5c"],"Polar_Bear_-_Alaska_(cropped).jpg":[563,565,"#c5c6cd"],"Standing_jaguar.jpg":[727,501,"#664b2e"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda_mammalia_carnivora","<ul class=\"tree\" data-tree-range=\"carnivora\"><li><input type=\"checkbox\" checked id=\"Ferungulata_Carnivora\"><label class=\"tree_label\" for=\"Ferungulata_Carnivora\"></label><div class=\"outer_tree_box\"><div id=\"carnivora_carnivora\" class=\"tree_box\"><span><span>Carnivora</span><a href=\"https://en.wikipedia.org/wiki/Carnivora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Carnivora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Carnivora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Carnivora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"mammalia\">See parent</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(cats, dogs, hyenas, mongoose, bears, skunks, raccoons)</span><p class=\"tag\">An order of placental mammals specialized primarily in eating flesh.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:7_Walross_1999.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-7_Walross_1999.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#909c90\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%E7%8C%8E%E8%B1%B9.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%E7%8C%8E%E8%B1%B9.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7d874a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grizzly_Bear_Drip_%286968122232%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grizzly_Bear_Drip_%286968122232%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#858979\"></a><a href=\"https://commons.wikimedia.org/wiki/File:North_American_Wolf_-_Tala_0912_%287263487664%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-North_American_Wolf_-_Tala_0912_%287263487664%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#73875d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MinkforWiki.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-MinkforWiki.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#a7a29e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bored_Raccoon.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bored_Raccoon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#6b6f59\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Carnivora_Feliformia\"><label class=\"tree_label\" for=\"Carnivora_Feliformia\"></label><div class=\"outer_tree_box\"><div id=\"carnivora_feliformia\" class=\"tree_box\"><span><span>Feliformia</span><a href=\"https://en.wikipedia.org/wiki/Feliformia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Feliformia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Feliformia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Feliformia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(cats, hyenas, mongooses, viverrids)</span><p class=\"tag\">The &#x27;cat-like&#x27; animals.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_nandiniidae\" class=\"tree_box\"><span><span>Nandiniidae</span><a href=\"https://en.wikipedia.org/wiki/Nandiniidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Nandiniidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Nandiniidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Nandiniidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(African palm civet)</span><p class=\"tag\">A small feliform mammal that&#x27;s nocturnal, largely arboreal, eats fruit and widely distributed in sub-Saharan Africa.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:The_carnivores_of_West_Africa_%28Nandinia_binotata_white_background%29.png\" target=\"_blank\"><img src=\"thumbnails/120px-The_carnivores_of_West_Africa_%28Nandinia_binotata_white_background%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"46\" style=\"background-color:#cfc3b3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nandinia_binotata%2C_Manchester_Museum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nandinia_binotata%2C_Manchester_Museum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#968d82\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Feliformia_Viverroidea\"><label class=\"tree_label\" for=\"Feliformia_Viverroidea\"></label><div class=\"outer_tree_box\"><div id=\"carnivora_viverroidea\" class=\"tree_box\"><span><span>Viverroidea</span><a href=\"https://en.wikipedia.org/wiki/Viverroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Viverroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Viverroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Viverroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Parvorder</span></span><p class=\"tag\">Includes viverrids, mongooses and hyaenas.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_viverridae\" class=\"tree_box\"><span><span>Viverridae</span><a href=\"https://en.wikipedia.org/wiki/Viverridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Viverridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Viverridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Viverridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(viverrids, civets, genets, oyans, African linsangs)</span><p class=\"tag\">Found in Southern Europe, Indomalayan realm, and Africa.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Malay_Civet_%28Viverra_tangalunga%29_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Malay_Civet_%28Viverra_tangalunga%29_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"63\" style=\"background-color:#c2c1c0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Small_Indian_Civet%2C_Silchar%2C_Assam%2C_India.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Small_Indian_Civet%2C_Silchar%2C_Assam%2C_India.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#989d8c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Banded_palm_civet_10.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Banded_palm_civet_10.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#746d67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Binturong_in_Overloon.jpg\" target=\"_blank\"><img src=\"thumbnails/Binturong_in_Overloon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"545\" style=\"background-color:#708869\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Palm_civet_on_tree_%28detail%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Palm_civet_on_tree_%28detail%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"241\" style=\"background-color:#c2bdb9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Genetta_genetta_felina_%28Wroclaw_zoo%29.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Genetta_genetta_felina_%28Wroclaw_zoo%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#594230\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_herpestidae\" class=\"tree_box\"><span><span>Herpestidae</span><a href=\"https://en.wikipedia.org/wiki/Herpestidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Herpestidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Herpestidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Herpestidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(mongooses, meerkats)</span><p class=\"tag\">Found in the Iberian Peninsula, Africa, the Middle East, the Caucasus, Central Asia, and the Indomalayan realm.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lydekker_-_Broad-banded_Cusimanse_%28white_background%29.JPG\" target=\"_blank\"><img src=\"thumbnails/120px-Lydekker_-_Broad-banded_Cusimanse_%28white_background%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"49\" style=\"background-color:#cdc4b6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Herpestes_ichneumon%2C_Israel_4.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Herpestes_ichneumon%2C_Israel_4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a59379\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Herpestes_edwardsii_at_Hyderaba.jpg\" target=\"_blank\"><img src=\"thumbnails/Herpestes_edwardsii_at_Hyderaba.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"527\" style=\"background-color:#7a6e5c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cynictis_penicillata_%28Etosha%2C_2011%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cynictis_penicillata_%28Etosha%2C_2011%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#646855\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Meerkat_%28Suricata_suricatta%29_Tswalu.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Meerkat_%28Suricata_suricatta%29_Tswalu.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"272\" style=\"background-color:#855429\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_eupleridae\" class=\"tree_box\"><span><span>Eupleridae</span><a href=\"https://en.wikipedia.org/wiki/Eupleridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eupleridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eupleridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Eupleridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(Malagasy mongooses, Malagasy civets, mongoose-like euplerids)</span><p class=\"tag\">Believed to have evolved from a single raft event from mainland Africa 18–24 million years ago. Found in Madagascar.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cryptoprocta_ferox_-_1700-1880_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-%28white_background%29.png\" target=\"_blank\"><img src=\"thumbnails/120px-Cryptoprocta_ferox_-_1700-1880_-_Print_-_Iconographia_Zoologica_-_Special_Collections_University_of_Amsterdam_-%28white_background%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"78\" style=\"background-color:#dcd4cc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eupleres_goudotii_-_Museo_Civico_di_Storia_Naturale_Giacomo_Doria_-_Genoa%2C_Italy_-_DSC02711.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Eupleres_goudotii_-_Museo_Civico_di_Storia_Naturale_Giacomo_Doria_-_Genoa%2C_Italy_-_DSC02711.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#8bb85e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Galidia_elegans_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Galidia_elegans_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#736458\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cryptoprocta_Ferox.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Cryptoprocta_Ferox.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"250\" style=\"background-color:#8c7e62\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Smalstreepmangoest.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Smalstreepmangoest.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#635342\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spotted_fanaloka_%28Fossa_fossana%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Spotted_fanaloka_%28Fossa_fossana%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#644d3c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_hyaenidae\" class=\"tree_box\"><span><span>Hyaenidae</span><a href=\"https://en.wikipedia.org/wiki/Hyaenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hyaenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hyaenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hyaenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(hyenas)</span><p class=\"tag\">Found in Africa, the Middle East, the Caucasus, Central Asia, and the Indian subcontinent.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Spotted_hyena_%28Crocuta_crocuta%29_by_Connor_Ashbridge.png\" target=\"_blank\"><img src=\"thumbnails/120px-Spotted_hyena_%28Crocuta_crocuta%29_by_Connor_Ashbridge.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"89\" style=\"background-color:#d3c8bf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hyena_at_chattbir_zoo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hyena_at_chattbir_zoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5c6a48\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Feliformia_Feloidea\"><label class=\"tree_label\" for=\"Feliformia_Feloidea\"></label><div class=\"outer_tree_box\"><div id=\"carnivora_feloidea\" class=\"tree_box\"><span><span>Feloidea</span><a href=\"https://en.wikipedia.org/wiki/Feloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Feloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Feloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Feloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><p class=\"tag\">Includes cats and Asiatic linsangs</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_prionodontidae\" class=\"tree_box\"><span><span>Prionodontidae</span><a href=\"https://en.wikipedia.org/wiki/Prionodontidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Prionodontidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Prionodontidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Prionodontidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(Asiatic linsangs)</span><p class=\"tag\">Tree-dwelling carnivorous mammals that are nocturnal, solitary, and at least partly arboreal. They den in hollows in trees and feed on rodents, frogs and snakes. Native to the Indomalayan realm.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Prionodon_maculosus.png\" target=\"_blank\"><img src=\"thumbnails/120px-Prionodon_maculosus.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"61\" style=\"background-color:#c3bdb0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Prionodon_linsang_-_Museo_Civico_di_Storia_Naturale_Giacomo_Doria_-_Genoa%2C_Italy_-_DSC02704.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Prionodon_linsang_-_Museo_Civico_di_Storia_Naturale_Giacomo_Doria_-_Genoa%2C_Italy_-_DSC02704.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"176\" style=\"background-color:#86a436\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_felidae\" class=\"tree_box\"><span><span>Felidae</span><a href=\"https://en.wikipedia.org/wiki/Felidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Felidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Felidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Felidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"felidae\">See children</button><span class=\"badge\">Family</span></span><span class=\"common_names\">(cats, tigers, leopards, jaguars, lions, cheetahs, ocelots)</span><p class=\"tag\">Found in the Americas, Africa, and Eurasia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Stamp-russia2014-save-russian-cats-%28snow_leopard%29.png\" target=\"_blank\"><img src=\"thumbnails/120px-Stamp-russia2014-save-russian-cats-%28snow_leopard%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"62\" style=\"background-color:#d0ccc8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Felis_catus-cat_on_snow.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Felis_catus-cat_on_snow.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a8abb0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Walking_tiger_female.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Walking_tiger_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"182\" style=\"background-color:#7d7859\"></a><a href=\"https://commons.wikimedia.org/wiki/File:African_leopard_male_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-African_leopard_male_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#454345\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Standing_jaguar.jpg\" target=\"_blank\"><img src=\"thumbnails/Standing_jaguar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"727\" height=\"501\" style=\"background-color:#664b2e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:020_The_lion_king_Snyggve_in_the_Serengeti_National_Park_Photo_by_Giles_Laurent.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-020_The_lion_king_Snyggve_in_the_Serengeti_National_Park_Photo_by_Giles_Laurent.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#b29e7d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Male_cheetah_facing_left_in_South_Africa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Male_cheetah_facing_left_in_South_Africa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#685e4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ocelot_%28Jaguatirica%29_Zoo_Itatiba.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ocelot_%28Jaguatirica%29_Zoo_Itatiba.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"254\" style=\"background-color:#6a6352\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Carnivora_Caniformia\"><label class=\"tree_label\" for=\"Carnivora_Caniformia\"></label><div class=\"outer_tree_box\"><div id=\"carnivora_caniformia\" class=\"tree_box\"><span><span>Caniformia</span><a href=\"https://en.wikipedia.org/wiki/Caniformia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Caniformia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Caniformia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Caniformia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(dogs, bears, raccoons, mustelids, pinnipeds)</span><p class=\"tag\">The &#x27;dog-like&#x27; animals.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_canidae\" class=\"tree_box\"><span><span>Canidae</span><a href=\"https://en.wikipedia.org/wiki/Canidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Canidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Canidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Canidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"canidae\">See children</button><span class=\"badge\">Family</span></span><span class=\"common_names\">(dogs, wolves, foxes, dingoes, jackals, coyotes)</span><p class=\"tag\">Found in the Americas, Africa, and Eurasia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Dogs%2C_jackals%2C_wolves%2C_and_foxes_%28Plate_XI%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Dogs%2C_jackals%2C_wolves%2C_and_foxes_%28Plate_XI%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"77\" style=\"background-color:#d0c8bb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2013072515020909_MyDogs_622.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2013072515020909_MyDogs_622.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#84735c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eurasian_wolf_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eurasian_wolf_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#bbb8b8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vulpes_vulpes_ssp_fulvus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vulpes_vulpes_ssp_fulvus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#b3a9a1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dingo_%28Canis_lupus_dingo%29_Kakadu_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dingo_%28Canis_lupus_dingo%29_Kakadu_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"291\" style=\"background-color:#79746a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flickr_-_Rainbirder_-_Golden_Jackal_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Flickr_-_Rainbirder_-_Golden_Jackal_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#9c877b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2009-Coyote-Yosemite.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2009-Coyote-Yosemite.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"290\" style=\"background-color:#cac8bf\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Caniformia_Arctoidea\"><label class=\"tree_label\" for=\"Caniformia_Arctoidea\"></label><div class=\"outer_tree_box\"><div id=\"carnivora_arctoidea\" class=\"tree_box\"><span><span>Arctoidea</span><a href=\"https://en.wikipedia.org/wiki/Arctoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Arctoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Arctoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Arctoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraorder</span></span><span class=\"common_names\">(bears, raccoons, mustelids, pinnipeds)</span><p class=\"tag\">mostly carnivorous mammals found in all continents from 46 million years ago to the present.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_ursidae\" class=\"tree_box\"><span><span>Ursidae</span><a href=\"https://en.wikipedia.org/wiki/Ursidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ursidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ursidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ursidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(brown bears, black bears, panda bears, spectacled bears, polar bear)</span><p class=\"tag\">Modern bears include large bodies with stocky legs, long snouts, small rounded ears, shaggy hair, plantigrade paws with five nonretractile claws, and short tails. Found in the Americas and Eurasia. The polar bear is mostly carnivorous, the giant panda is mostly herbivorous, and the remaining species are omnivorous with varying diets.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Grizzly_Bear_Family_in_Glacier_National_Park.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grizzly_Bear_Family_in_Glacier_National_Park.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6b8d74\"></a><a href=\"https://commons.wikimedia.org/wiki/File:American_black_bear_cub_in_tree_-_DPLA_-_bde0bcd3661a5079a10ef3e34dd41e96.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-American_black_bear_cub_in_tree_-_DPLA_-_bde0bcd3661a5079a10ef3e34dd41e96.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"380\" style=\"background-color:#7c8987\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Polar_Bear_-_Alaska_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Polar_Bear_-_Alaska_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"563\" height=\"565\" style=\"background-color:#c5c6cd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ursus_thibetanus_3_%28Wroclaw_zoo%29.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Ursus_thibetanus_3_%28Wroclaw_zoo%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#828488\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sun_bear_climbing.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sun_bear_climbing.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"250\" style=\"background-color:#797b61\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sloth_bear_stand.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sloth_bear_stand.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#5a554f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spectacled_Bear_-_Houston_Zoo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Spectacled_Bear_-_Houston_Zoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"300\" style=\"background-color:#555754\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Panda_Cub_from_Wolong%2C_Sichuan%2C_China.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Panda_Cub_from_Wolong%2C_Sichuan%2C_China.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#4c514c\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Arctoidea_Pinnipedia\"><label class=\"tree_label\" for=\"Arctoidea_Pinnipedia\"></label><div class=\"outer_tree_box\"><div id=\"carnivora_pinnipedia\" class=\"tree_box\"><span><span>Pinnipedia</span><a href=\"https://en.wikipedia.org/wiki/Pinnipedia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pinnipedia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pinnipedia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pinnipedia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Parvorder</span></span><p class=\"tag\">Carnivorous, fin-footed, semiaquatic, mostly marine mammals.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_phocidae\" class=\"tree_box\"><span><span>Phocidae</span><a href=\"https://en.wikipedia.org/wiki/Phocidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Phocidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Phocidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Phocidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈfoʊsɪdiː\" target=\"_blank\">ˈfoʊsɪdiː</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(elephant seals, monk seals, Baikal seals)</span><p class=\"tag\">The earless seals - true seals. Found in the sea and Lake Baikal.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cambridge_Natural_History_Mammalia_Fig_230_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Cambridge_Natural_History_Mammalia_Fig_230_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"46\" style=\"background-color:#d4d4d4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Seehund.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Seehund.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#777364\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Monachus_monachus_DSC_0274.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Monachus_monachus_DSC_0274.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#767a7a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nerpa_%28Pusa_sibirica%29_%283635255975%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nerpa_%28Pusa_sibirica%29_%283635255975%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#697376\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mirounga_leonina.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mirounga_leonina.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#bec0c6\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_otariidae\" class=\"tree_box\"><span><span>Otariidae</span><a href=\"https://en.wikipedia.org/wiki/Otariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Otariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Otariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Otariidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(fur seals, sea lions)</span><p class=\"tag\">The Eared seals - fur seals and sea lions. Found in subpolar, temperate, and equatorial waters throughout the Pacific and Southern Oceans and the southern Indian and Atlantic Oceans. Have small but visible external ear flaps.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:NIE_1905_Seal_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-NIE_1905_Seal_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"94\" style=\"background-color:#d0c4b5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Southern_Sea_Lions.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Southern_Sea_Lions.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"330\" style=\"background-color:#6e726c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Otaria_fg02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Otaria_fg02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#968672\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sea_lion_head.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sea_lion_head.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"310\" style=\"background-color:#6e5948\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kangaroosealion.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Kangaroosealion.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#9a9998\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_odobenidae\" class=\"tree_box\"><span><span>Odobenidae</span><a href=\"https://en.wikipedia.org/wiki/Odobenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Odobenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Odobenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Odobenidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(walruses)</span><p class=\"tag\">Found in the North Pole in the Arctic Ocean and subarctic seas of the Northern Hemisphere.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Walrus_animal_male_detailed_photo_white_background.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Walrus_animal_male_detailed_photo_white_background.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"62\" style=\"background-color:#b7b0ad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Walrus2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Walrus2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"242\" style=\"background-color:#60453f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pacific_Walrus_-_Bull_%288247646168%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pacific_Walrus_-_Bull_%288247646168%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#9da2a5\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Arctoidea_Musteloidea\"><label class=\"tree_label\" for=\"Arctoidea_Musteloidea\"></label><div class=\"outer_tree_box\"><div id=\"carnivora_musteloidea\" class=\"tree_box\"><span><span>Musteloidea</span><a href=\"https://en.wikipedia.org/wiki/Musteloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Musteloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Musteloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Musteloidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><p class=\"tag\">Includes the weasels, raccoons, red pandas, and skunks.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_mephitidae\" class=\"tree_box\"><span><span>Mephitidae</span><a href=\"https://en.wikipedia.org/wiki/Mephitidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mephitidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mephitidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mephitidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(skunks, stink badgers)</span><p class=\"tag\">Found in the Americas, western Philippines, and Indonesia and Malaysia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Die_S%C3%A4ugthiere_in_Abbildungen_nach_der_Natur%2C_mit_Beschreibungen_%28Plate_CXXI-%29_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Die_S%C3%A4ugthiere_in_Abbildungen_nach_der_Natur%2C_mit_Beschreibungen_%28Plate_CXXI-%29_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"68\" style=\"background-color:#cbc7bd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Skunk_about_to_spray.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Skunk_about_to_spray.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"402\" style=\"background-color:#948b7c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_ailuridae\" class=\"tree_box\"><span><span>Ailuridae</span><a href=\"https://en.wikipedia.org/wiki/Ailuridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ailuridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ailuridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ailuridae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(red panda)</span><p class=\"tag\">Found in the Eastern Himalayas and southwestern China.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:RedPandaFullBody_white_background.JPG\" target=\"_blank\"><img src=\"thumbnails/120px-RedPandaFullBody_white_background.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"52\" style=\"background-color:#aea195\"></a><a href=\"https://commons.wikimedia.org/wiki/File:RedPanda_SingalilaNationalPark_DFrame.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-RedPanda_SingalilaNationalPark_DFrame.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#64624a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_procyonidae\" class=\"tree_box\"><span><span>Procyonidae</span><a href=\"https://en.wikipedia.org/wiki/Procyonidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Procyonidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Procyonidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Procyonidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(raccoons, olingos, ringtails, coatis, cacomistles, kinkajous)</span><p class=\"tag\">Found in the Americas.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Wild_animals_of_North_America%2C_intimate_studies_of_big_and_little_creatures_of_the_mammal_kingdom_%28Page_410%29_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Wild_animals_of_North_America%2C_intimate_studies_of_big_and_little_creatures_of_the_mammal_kingdom_%28Page_410%29_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"63\" style=\"background-color:#cfc7b8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Waschbaer_auf_dem_Dach.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Waschbaer_auf_dem_Dach.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7b746e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"carnivora_mustelidae\" class=\"tree_box\"><span><span>Mustelidae</span><a href=\"https://en.wikipedia.org/wiki/Mustelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mustelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mustelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mustelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(weasels, otters, wolverines, polecats, badgers, martens, grisons)</span><p class=\"tag\">Found in the Americas, Africa, and Eurasia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Fitch_white_background.png\" target=\"_blank\"><img src=\"thumbnails/120px-Fitch_white_background.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"59\" style=\"background-color:#c4bcb0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stoat_-_RSPB_Sandy_%2828058976023%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stoat_-_RSPB_Sandy_%2828058976023%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#9d984d\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul>")
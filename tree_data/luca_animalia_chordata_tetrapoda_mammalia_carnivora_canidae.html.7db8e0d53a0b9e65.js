@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda_mammalia_carnivora_canidae","<ul class=\"tree\" data-tree-range=\"canidae\"><li><input type=\"checkbox\" checked id=\"Caniformia_Canidae\"><label class=\"tree_label\" for=\"Caniformia_Canidae\"></label><div class=\"outer_tree_box\"><div id=\"canidae_canidae\" class=\"tree_box\"><span><span>Canidae</span><a href=\"https://en.wikipedia.org/wiki/Canidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Canidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Canidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Canidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"carnivora\">See parent</button><span class=\"badge\">Family</span></span><span class=\"common_names\">(dogs, wolves, foxes, dingoes, jackals, coyotes)</span><p class=\"tag\">Found in the Americas, Africa, and Eurasia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Dogs%2C_jackals%2C_wolves%2C_and_foxes_%28Plate_XI%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Dogs%2C_jackals%2C_wolves%2C_and_foxes_%28Plate_XI%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"77\" style=\"background-color:#d0c8bb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2013072515020909_MyDogs_622.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2013072515020909_MyDogs_622.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#84735c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eurasian_wolf_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eurasian_wolf_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#bbb8b8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vulpes_vulpes_ssp_fulvus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vulpes_vulpes_ssp_fulvus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#b3a9a1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dingo_%28Canis_lupus_dingo%29_Kakadu_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dingo_%28Canis_lupus_dingo%29_Kakadu_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"291\" style=\"background-color:#79746a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flickr_-_Rainbirder_-_Golden_Jackal_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Flickr_-_Rainbirder_-_Golden_Jackal_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#9c877b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2009-Coyote-Yosemite.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2009-Coyote-Yosemite.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"290\" style=\"background-color:#cac8bf\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Canidae_Canini\"><label class=\"tree_label\" for=\"Canidae_Canini\"></label><div class=\"outer_tree_box\"><div id=\"canidae_canini\" class=\"tree_box\"><span><span>Canini</span><a href=\"https://en.wikipedia.org/wiki/Canini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Canini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Canini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Canini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Tribe</span></span><p class=\"tag\">The dog-like canines.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Atelocynus_microtis_en_Amazonie_p%C3%A9ruvienne.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Atelocynus_microtis_en_Amazonie_p%C3%A9ruvienne.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"416\" style=\"background-color:#474644\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Speothos_venaticus_Zoo_Praha_2011-5_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Speothos_venaticus_Zoo_Praha_2011-5_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#6d746a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eurasian_wolf_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eurasian_wolf_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#bbb8b8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lobo_Guar%C3%A1_andando.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lobo_Guar%C3%A1_andando.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"214\" style=\"background-color:#86864d\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Canini_Canina\"><label class=\"tree_label\" for=\"Canini_Canina\"></label><div class=\"outer_tree_box\"><div id=\"canidae_canina\" class=\"tree_box\"><span><span>Canina</span><a href=\"https://en.wikipedia.org/wiki/Canina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Canina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Canina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Canina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subtribe</span></span><p class=\"tag\">The wolf and wolf-like canines.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lupulella_mesomelas_schmidti_Kenya_2020_2_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lupulella_mesomelas_schmidti_Kenya_2020_2_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"254\" style=\"background-color:#857f65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:African_wild_dog_%28Lycaon_pictus_pictus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-African_wild_dog_%28Lycaon_pictus_pictus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#b38a5a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dhole_%28Asiatic_wild_dog%29_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dhole_%28Asiatic_wild_dog%29_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"307\" style=\"background-color:#777342\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eurasian_wolf_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eurasian_wolf_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#bbb8b8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:BlkStdSchnauzer2.jpg\" target=\"_blank\"><img src=\"thumbnails/BlkStdSchnauzer2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"477\" height=\"387\" style=\"background-color:#727a46\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_canis\" class=\"tree_box\"><span><span>Canis</span><a href=\"https://en.wikipedia.org/wiki/Canis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Canis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Canis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Canis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(wolves, dogs, coyotes, golden jackals)</span><p class=\"tag\">The wolf genus. Distinguished by their moderate to large size, their massive, well-developed skulls and dentition, long legs, and comparatively short ears and tails.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:2009-Coyote-Yosemite.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2009-Coyote-Yosemite.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"290\" style=\"background-color:#cac8bf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:07-03-23RedWolfAlbanyGAChehaw.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-07-03-23RedWolfAlbanyGAChehaw.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"276\" style=\"background-color:#8e7d63\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eurasian_wolf_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eurasian_wolf_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#bbb8b8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:BlkStdSchnauzer2.jpg\" target=\"_blank\"><img src=\"thumbnails/BlkStdSchnauzer2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"477\" height=\"387\" style=\"background-color:#727a46\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grey_jackal_from_Haizer_Algeria_10_%28cropped%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Grey_jackal_from_Haizer_Algeria_10_%28cropped%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"242\" style=\"background-color:#a1886c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ethiopian_wolf.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Ethiopian_wolf.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"188\" style=\"background-color:#857b79\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Canis_aureus_syriacus_114837596.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Canis_aureus_syriacus_114837596.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"242\" style=\"background-color:#666d5b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_cuon\" class=\"tree_box\"><span><span>Cuon</span><a href=\"https://en.wikipedia.org/wiki/Cuon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cuon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cuon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cuon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(dhole)</span><p class=\"tag\">Contains canid species native Asia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Dhole_%28Asiatic_wild_dog%29_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dhole_%28Asiatic_wild_dog%29_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"307\" style=\"background-color:#777342\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_lycaon\" class=\"tree_box\"><span><span>Lycaon</span><a href=\"https://en.wikipedia.org/wiki/Lycaon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lycaon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lycaon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lycaon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(African wild dogs)</span><p class=\"tag\">The only extant species is the largest wild canine in Africa. Fur consists entirely of stiff bristle-hairs with no underfur.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:African_wild_dog_%28Lycaon_pictus_pictus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-African_wild_dog_%28Lycaon_pictus_pictus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#b38a5a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wild_Dogs_%28Lycaon_pictus%29_%2816394165128%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wild_Dogs_%28Lycaon_pictus%29_%2816394165128%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#78825c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:African_wild_dog_%28Lycaon_pictus_pictus%29_play_fighting.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-African_wild_dog_%28Lycaon_pictus_pictus%29_play_fighting.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a68462\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_lupulella\" class=\"tree_box\"><span><span>Lupulella</span><a href=\"https://en.wikipedia.org/wiki/Lupulella\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lupulella\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lupulella\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lupulella\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(black-backed jackal, side-striped jackal)</span><p class=\"tag\">A genus of canine found in Africa.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lupulella_mesomelas_schmidti_Kenya_2020_2_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lupulella_mesomelas_schmidti_Kenya_2020_2_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"254\" style=\"background-color:#857f65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lupulella_adusta_in_Kalabo_Zambia_01.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Lupulella_adusta_in_Kalabo_Zambia_01.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#8b7a65\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Canini_Cerdocyonina\"><label class=\"tree_label\" for=\"Canini_Cerdocyonina\"></label><div class=\"outer_tree_box\"><div id=\"canidae_cerdocyonina\" class=\"tree_box\"><span><span>Cerdocyonina</span><a href=\"https://en.wikipedia.org/wiki/Cerdocyonina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cerdocyonina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cerdocyonina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cerdocyonina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subtribe</span></span><p class=\"tag\">The South American canines.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Speothos_venaticus_Zoo_Praha_2011-5_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Speothos_venaticus_Zoo_Praha_2011-5_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#6d746a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lobo_Guar%C3%A1_andando.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lobo_Guar%C3%A1_andando.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"214\" style=\"background-color:#86864d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Atelocynus_microtis_en_Amazonie_p%C3%A9ruvienne.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Atelocynus_microtis_en_Amazonie_p%C3%A9ruvienne.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"416\" style=\"background-color:#474644\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crab-eating_Fox_%28cropped%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Crab-eating_Fox_%28cropped%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#616c5e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:South_american_grey_fox_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-South_american_grey_fox_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"279\" style=\"background-color:#a39787\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_speothos\" class=\"tree_box\"><span><span>Speothos</span><a href=\"https://en.wikipedia.org/wiki/Speothos\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Speothos\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Speothos\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Speothos\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(bush dogs)</span><p class=\"tag\">A genus of canid found in Central and South America</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chien_des_buissons_Safari_de_Peaugres_07082017_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chien_des_buissons_Safari_de_Peaugres_07082017_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"212\" style=\"background-color:#828067\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Speothos_venaticus_Zoo_Praha_2011-5_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Speothos_venaticus_Zoo_Praha_2011-5_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#6d746a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_chrysocyon\" class=\"tree_box\"><span><span>Chrysocyon</span><a href=\"https://en.wikipedia.org/wiki/Chrysocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chrysocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chrysocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Chrysocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=greek &#x27;golden dog&#x27;\" target=\"_blank\">greek &#x27;golden dog&#x27;</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(maned wolf)</span><p class=\"tag\">Contains the largest canine in South America. It has markings resembling a red fox.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lobo_Guar%C3%A1_andando.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lobo_Guar%C3%A1_andando.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"214\" style=\"background-color:#86864d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_lycalopex\" class=\"tree_box\"><span><span>Lycalopex</span><a href=\"https://en.wikipedia.org/wiki/Lycalopex\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lycalopex\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lycalopex\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lycalopex\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(raposa)</span><p class=\"tag\">Contains South American canines that resemble true foxes.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:South_american_grey_fox_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-South_american_grey_fox_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"279\" style=\"background-color:#a39787\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lycalopex_vetulus_in_Bacury_Lodge%2C_Anhembi_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lycalopex_vetulus_in_Bacury_Lodge%2C_Anhembi_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"246\" style=\"background-color:#9c9c54\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lycalopex_sechurae_in_Peru_2_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lycalopex_sechurae_in_Peru_2_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"244\" style=\"background-color:#424b2f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zorro_de_Darwin.jpg\" target=\"_blank\"><img src=\"thumbnails/Zorro_de_Darwin.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"758\" height=\"550\" style=\"background-color:#3d4134\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Culpeo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Culpeo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"228\" style=\"background-color:#ae907d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_cerdocyon\" class=\"tree_box\"><span><span>Cerdocyon</span><a href=\"https://en.wikipedia.org/wiki/Cerdocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cerdocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cerdocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cerdocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(crab-eating fox)</span><p class=\"tag\">Contains a medium-sized nocturnal canid endemic to the central part of South America.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Crab-eating_Fox_%28cropped%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Crab-eating_Fox_%28cropped%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#616c5e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_atelocynus\" class=\"tree_box\"><span><span>Atelocynus</span><a href=\"https://en.wikipedia.org/wiki/Atelocynus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Atelocynus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Atelocynus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Atelocynus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(short-eared dogs)</span><p class=\"tag\">Contains an elusive canid species endemic to the Amazonian basin.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Atelocynus_microtis_en_amazonie_p%C3%A9ruvienne.jpg\" target=\"_blank\"><img src=\"thumbnails/Atelocynus_microtis_en_amazonie_p%C3%A9ruvienne.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"634\" height=\"419\" style=\"background-color:#64715d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Atelocynus_microtis_en_Amazonie_p%C3%A9ruvienne.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Atelocynus_microtis_en_Amazonie_p%C3%A9ruvienne.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"416\" style=\"background-color:#474644\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Canidae_Vulpini\"><label class=\"tree_label\" for=\"Canidae_Vulpini\"></label><div class=\"outer_tree_box\"><div id=\"canidae_vulpini\" class=\"tree_box\"><span><span>Vulpini</span><a href=\"https://en.wikipedia.org/wiki/Vulpini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Vulpini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Vulpini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Vulpini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Tribe</span></span><p class=\"tag\">The fox-like canines.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Bat_eared_fox_Kenya_crop_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bat_eared_fox_Kenya_crop_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"265\" style=\"background-color:#9e826d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nyctereutes_procyonoides_4_%28Piotr_Kuczynski%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nyctereutes_procyonoides_4_%28Piotr_Kuczynski%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#687046\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vulpes_vulpes_ssp_fulvus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vulpes_vulpes_ssp_fulvus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#b3a9a1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fennec_Fox_Vulpes_zerda.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fennec_Fox_Vulpes_zerda.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#6c5f67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Arctic_Fox_Posed_%288564878025%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Arctic_Fox_Posed_%288564878025%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a99b8c\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_otocyon\" class=\"tree_box\"><span><span>Otocyon</span><a href=\"https://en.wikipedia.org/wiki/Otocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Otocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Otocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Otocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(bat-eared foxes)</span><p class=\"tag\">Contains a single species of fox found on the African savanna.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Bat_eared_fox_Kenya_crop_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bat_eared_fox_Kenya_crop_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"265\" style=\"background-color:#9e826d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_nyctereutes\" class=\"tree_box\"><span><span>Nyctereutes</span><a href=\"https://en.wikipedia.org/wiki/Nyctereutes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Nyctereutes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Nyctereutes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Nyctereutes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(racoon dogs)</span><p class=\"tag\">A fox-like canine that has a face that resembles a racoon.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Nyctereutes_procyonoides_4_%28Piotr_Kuczynski%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nyctereutes_procyonoides_4_%28Piotr_Kuczynski%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#687046\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tanuki_in_Higashiyama_Zoo_-_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tanuki_in_Higashiyama_Zoo_-_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#617157\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_vulpes\" class=\"tree_box\"><span><span>Vulpes</span><a href=\"https://en.wikipedia.org/wiki/Vulpes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Vulpes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Vulpes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Vulpes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(true foxes)</span><p class=\"tag\">They have a smaller size, longer, bushier tail, and flatter skull. They have black, triangular markings between their eyes and nose, and the tip of their tail is often a different color from the rest of their pelt.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Indian_Fox_in_a_Grassland.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Indian_Fox_in_a_Grassland.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#90944c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blandford%27s_fox_1.jpg\" target=\"_blank\"><img src=\"thumbnails/Blandford%27s_fox_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"770\" height=\"567\" style=\"background-color:#746855\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vulpes_chama_%28Etosha%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vulpes_chama_%28Etosha%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#959599\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vulpes_corsac_Halle_Zoo_10.2012.jpg\" target=\"_blank\"><img src=\"thumbnails/Vulpes_corsac_Halle_Zoo_10.2012.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"375\" style=\"background-color:#575952\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vulpes_ferrilata_367800858.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vulpes_ferrilata_367800858.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#667b48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Arctic_Fox_Posed_%288564878025%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Arctic_Fox_Posed_%288564878025%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a99b8c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kit_fox_tds.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Kit_fox_tds.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7c7156\"></a><a href=\"https://commons.wikimedia.org/wiki/File:R%C3%BCppell%27s_fox.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-R%C3%BCppell%27s_fox.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#797677\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Swift_Fox_Colorado_Wolf_and_Wildlife_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Swift_Fox_Colorado_Wolf_and_Wildlife_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7d6a5f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vulpes_vulpes_ssp_fulvus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vulpes_vulpes_ssp_fulvus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#b3a9a1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fennec_Fox_Vulpes_zerda.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fennec_Fox_Vulpes_zerda.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#6c5f67\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"canidae_urocyon\" class=\"tree_box\"><span><span>Urocyon</span><a href=\"https://en.wikipedia.org/wiki/Urocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Urocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Urocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Urocyon\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(gray foxes, island foxes)</span><p class=\"tag\">The gray foxes.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Urocyon_littoralis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Urocyon_littoralis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"246\" style=\"background-color:#917e72\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gray_fox.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gray_fox.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#757764\"></a></div></div></div></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda_mammalia_carnivora_felidae","<ul class=\"tree\" data-tree-range=\"felidae\"><li><input type=\"checkbox\" checked id=\"Feloidea_Felidae\"><label class=\"tree_label\" for=\"Feloidea_Felidae\"></label><div class=\"outer_tree_box\"><div id=\"felidae_felidae\" class=\"tree_box\"><span><span>Felidae</span><a href=\"https://en.wikipedia.org/wiki/Felidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Felidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Felidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Felidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"carnivora\">See parent</button><span class=\"badge\">Family</span></span><span class=\"common_names\">(cats, tigers, leopards, jaguars, lions, cheetahs, ocelots)</span><p class=\"tag\">Found in the Americas, Africa, and Eurasia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Stamp-russia2014-save-russian-cats-%28snow_leopard%29.png\" target=\"_blank\"><img src=\"thumbnails/120px-Stamp-russia2014-save-russian-cats-%28snow_leopard%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"62\" style=\"background-color:#d0ccc8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Felis_catus-cat_on_snow.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Felis_catus-cat_on_snow.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a8abb0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Walking_tiger_female.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Walking_tiger_female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"182\" style=\"background-color:#7d7859\"></a><a href=\"https://commons.wikimedia.org/wiki/File:African_leopard_male_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-African_leopard_male_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#454345\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Standing_jaguar.jpg\" target=\"_blank\"><img src=\"thumbnails/Standing_jaguar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"727\" height=\"501\" style=\"background-color:#664b2e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:020_The_lion_king_Snyggve_in_the_Serengeti_National_Park_Photo_by_Giles_Laurent.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-020_The_lion_king_Snyggve_in_the_Serengeti_National_Park_Photo_by_Giles_Laurent.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#b29e7d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Male_cheetah_facing_left_in_South_Africa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Male_cheetah_facing_left_in_South_Africa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#685e4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ocelot_%28Jaguatirica%29_Zoo_Itatiba.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ocelot_%28Jaguatirica%29_Zoo_Itatiba.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"254\" style=\"background-color:#6a6352\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Felidae_Pantherinae\"><label class=\"tree_label\" for=\"Felidae_Pantherinae\"></label><div class=\"outer_tree_box\"><div id=\"felidae_pantherinae\" class=\"tree_box\"><span><span>Pantherinae</span><a href=\"https://en.wikipedia.org/wiki/Pantherinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pantherinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pantherinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pantherinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><p class=\"tag\">Characterised by an imperfectly ossified hyoid bone with elastic tendons that enable their larynx to be mobile so many species can roar.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_neofelis\" class=\"tree_box\"><span><span>Neofelis</span><a href=\"https://en.wikipedia.org/wiki/Neofelis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Neofelis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Neofelis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Neofelis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(clouded leopards)</span><p class=\"tag\">Two extant cat species in Southeast Asia that are the sister taxon to other pantherine cats and can still purr. They have a maximum gape of approximately 90 degrees, the biggest of extant carnivora</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Neofelis_nebulosa.jpg\" target=\"_blank\"><img src=\"thumbnails/Neofelis_nebulosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"432\" height=\"252\" style=\"background-color:#6c6a63\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clouded_Leopard_Neofelis_nebulosa_by_Dr_Raju_Kasambe_DSC_7497_%2828%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Clouded_Leopard_Neofelis_nebulosa_by_Dr_Raju_Kasambe_DSC_7497_%2828%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6e6b66\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neofelis_nebulosa_face.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Neofelis_nebulosa_face.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#797a73\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Borneo_clouded_leopard.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Borneo_clouded_leopard.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"194\" style=\"background-color:#3f3a2a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_panthera\" class=\"tree_box\"><span><span>Panthera</span><a href=\"https://en.wikipedia.org/wiki/Panthera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Panthera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Panthera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Panthera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(jaguars, leopards, lions, snow leopards, tigers, † cave lions, † American lions)</span><p class=\"tag\">Contains the largest living members of the cat family, native to Africa, Asia and the Americas with humans implicated in the species lost to Europe, North America and Russia. They have a specially adapted larynx with large vocal folds covered in a fibro-elastic pad; these characteristics enable them to roar.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Standing_jaguar.jpg\" target=\"_blank\"><img src=\"thumbnails/Standing_jaguar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"727\" height=\"501\" style=\"background-color:#664b2e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:African_leopard%2C_Panthera_pardus_pardus%2C_near_Lake_Panic%2C_Kruger_National_Park%2C_South_Africa_%2819448654130%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-African_leopard%2C_Panthera_pardus_pardus%2C_near_Lake_Panic%2C_Kruger_National_Park%2C_South_Africa_%2819448654130%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#8b825c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:020_The_lion_king_Snyggve_in_the_Serengeti_National_Park_Photo_by_Giles_Laurent.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-020_The_lion_king_Snyggve_in_the_Serengeti_National_Park_Photo_by_Giles_Laurent.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#b29e7d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Schneeleopard_Koeln.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Schneeleopard_Koeln.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7b7b59\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Panthera_tigris_corbetti_%28Tierpark_Berlin%29_832-714-%28118%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Panthera_tigris_corbetti_%28Tierpark_Berlin%29_832-714-%28118%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#6b5d4b\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Felidae_Felinae\"><label class=\"tree_label\" for=\"Felidae_Felinae\"></label><div class=\"outer_tree_box\"><div id=\"felidae_felinae\" class=\"tree_box\"><span><span>Felinae</span><a href=\"https://en.wikipedia.org/wiki/Felinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Felinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Felinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Felinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><p class=\"tag\">Members have a bony hyoid, so they can purr but not roar, and retractable claws.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_leptailurus\" class=\"tree_box\"><span><span>Leptailurus</span><a href=\"https://en.wikipedia.org/wiki/Leptailurus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Leptailurus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Leptailurus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Leptailurus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(servals)</span><p class=\"tag\">Contains a wild, slender, medium-sized cat with the longest legs of any cat relative to its body size. Native to Africa. It feeds on rodents. Characterised by a small head, large ears, a golden-yellow to buff coat spotted and striped with black, and a short, black-tipped tail</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Leptailurus_serval_-Serengeti_National_Park%2C_Tanzania-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leptailurus_serval_-Serengeti_National_Park%2C_Tanzania-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#776f4e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leptailurus_serval_61666728%2C_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leptailurus_serval_61666728%2C_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"306\" style=\"background-color:#82935c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Serval_imported_from_iNaturalist_photo_27691409_on_6_December_2024.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Serval_imported_from_iNaturalist_photo_27691409_on_6_December_2024.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"194\" style=\"background-color:#be9d49\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_caracal\" class=\"tree_box\"><span><span>Caracal</span><a href=\"https://en.wikipedia.org/wiki/Caracal\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Caracal\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Caracal\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Caracal\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(African golden cats, caracals)</span><p class=\"tag\">Two species of medium-sized solitary and nocturnal wild cats native to Africa and Southwestern Asia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Caracal_hunting_in_the_serengeti.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caracal_hunting_in_the_serengeti.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#809259\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caracal_on_the_road%2C_early_morning_in_Kgalagadi_%2836173878220%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Caracal_on_the_road%2C_early_morning_in_Kgalagadi_%2836173878220%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#a49b8e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caracal001.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Caracal001.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"259\" style=\"background-color:#8d8c89\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_leopardus\" class=\"tree_box\"><span><span>Leopardus</span><a href=\"https://en.wikipedia.org/wiki/Leopardus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Leopardus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Leopardus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Leopardus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(ocelot, oncillas, Pampas cats, kodkods, margays, Geoffroy&#x27;s cats, Andean mountain cats, Southern tigrinas)</span><p class=\"tag\">The oldest branch of a genetic lineage of small cats in the Americas. Native to Central and Southern America. They have 36 chromosomes, when other felids have 38.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ocelot_%28Leopardus_pardalis%29-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ocelot_%28Leopardus_pardalis%29-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"254\" style=\"background-color:#574a3e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leopardus_tigrinus_-_Parc_des_F%C3%A9lins.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leopardus_tigrinus_-_Parc_des_F%C3%A9lins.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"243\" style=\"background-color:#595f3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leopardus_pajeros_20101006.jpg\" target=\"_blank\"><img src=\"thumbnails/Leopardus_pajeros_20101006.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"415\" height=\"252\" style=\"background-color:#7d7b6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leopardus_guigna.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Leopardus_guigna.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"184\" style=\"background-color:#647833\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Margay.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Margay.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5c773e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Margay_in_Costa_Rica.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Margay_in_Costa_Rica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#374025\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Salzkatze.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Salzkatze.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"253\" style=\"background-color:#9c896f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Andean_cat_1_Jim_Sanderson.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Andean_cat_1_Jim_Sanderson.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"271\" style=\"background-color:#5d5f54\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gato-do-mato-pequeno.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gato-do-mato-pequeno.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"240\" style=\"background-color:#56704c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_pardofelis\" class=\"tree_box\"><span><span>Pardofelis</span><a href=\"https://en.wikipedia.org/wiki/Pardofelis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pardofelis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pardofelis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pardofelis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(marbled cats)</span><p class=\"tag\">Contains a single species of small wild cat native from the eastern Himalayas to Southeast Asia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Marbled_cat_borneo.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Marbled_cat_borneo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"379\" style=\"background-color:#352f22\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pardofelis_marmorata_300280177.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pardofelis_marmorata_300280177.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"299\" style=\"background-color:#787339\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_catopuma\" class=\"tree_box\"><span><span>Catopuma</span><a href=\"https://en.wikipedia.org/wiki/Catopuma\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Catopuma\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Catopuma\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Catopuma\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(bay cats, Asian golden cats)</span><p class=\"tag\">Contains two small cat species native to Southeast Asia. Both have solid reddish brown coloration on their backs and darker markings on the head.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Bay_cat_1_Jim_Sanderson-cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bay_cat_1_Jim_Sanderson-cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#715f42\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Asian_Golden_Cat.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Asian_Golden_Cat.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#605e5b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_lynx\" class=\"tree_box\"><span><span>Lynx</span><a href=\"https://en.wikipedia.org/wiki/Lynx\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lynx\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lynx\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lynx\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=lɪŋks\" target=\"_blank\">lɪŋks</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(lynxs, bobcats)</span><p class=\"tag\">Medium-sized wild cat with a short tail; characteristic tufts of black hair on the tips of their ears; large, padded paws; and long whiskers on the face. Native to the Northern Hemisphere.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Eurasischer_Luchs_im_Tier-Freigel%C3%A4nde_Nationalparkzentrums_Falkenstein_im_Nationalpark_Bayerischer_Wald.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eurasischer_Luchs_im_Tier-Freigel%C3%A4nde_Nationalparkzentrums_Falkenstein_im_Nationalpark_Bayerischer_Wald.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#636a38\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Linces10.jpg\" target=\"_blank\"><img src=\"thumbnails/Linces10.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"294\" height=\"420\" style=\"background-color:#7c6d47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Canada_Lynx_%286187103428%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Canada_Lynx_%286187103428%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#72747b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bobcat_at_Columbus_Zoo_Boo.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Bobcat_at_Columbus_Zoo_Boo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"374\" style=\"background-color:#81776b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lynx_Nationalpark_Bayerischer_Wald_01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lynx_Nationalpark_Bayerischer_Wald_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#a4aeb8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Canadian_lynx_by_Keith_Williams.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Canadian_lynx_by_Keith_Williams.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"260\" style=\"background-color:#9fa8ba\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Iberian_Lynx_cub_07.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Iberian_Lynx_cub_07.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#918169\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_acinonyx\" class=\"tree_box\"><span><span>Acinonyx</span><a href=\"https://en.wikipedia.org/wiki/Acinonyx\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Acinonyx\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Acinonyx\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Acinonyx\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(cheetahs)</span><p class=\"tag\">The only extant specicies is a large cat and the fastest land animal. It is lightly built, has a slender body, spotted coat, long tail and semi-retractable claws. Native to Africa and Southwestern Asia</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Male_cheetah_facing_left_in_South_Africa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Male_cheetah_facing_left_in_South_Africa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#685e4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Iranian_Cheetah_roars.jpg\" target=\"_blank\"><img src=\"thumbnails/Iranian_Cheetah_roars.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"798\" height=\"488\" style=\"background-color:#6b7480\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cheetah_portrait_Whipsnade_Zoo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cheetah_portrait_Whipsnade_Zoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"298\" style=\"background-color:#817f4a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gepardjagt1_%28Acinonyx_jubatus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gepardjagt1_%28Acinonyx_jubatus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"187\" style=\"background-color:#848047\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_otocolobus\" class=\"tree_box\"><span><span>Otocolobus</span><a href=\"https://en.wikipedia.org/wiki/Otocolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Otocolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Otocolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Otocolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(Pallas&#x27;s cats, manuls)</span><p class=\"tag\">Contains a single species of small wild cat with long and dense light grey fur, and rounded ears set low on the sides of the head. Native to Central Asia. It finds shelter in rock crevices and burrows, and preys foremost on lagomorphs and rodents.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:2018-Manul01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2018-Manul01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"240\" style=\"background-color:#636c5b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Felis_manul_-Howletts_Wild_Animal_Park_-8.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Felis_manul_-Howletts_Wild_Animal_Park_-8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"260\" style=\"background-color:#787974\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_prionailurus\" class=\"tree_box\"><span><span>Prionailurus</span><a href=\"https://en.wikipedia.org/wiki/Prionailurus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Prionailurus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Prionailurus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Prionailurus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(leopard cats, flat-headed cats, fishing cats, rusty-spotted cats)</span><p class=\"tag\">Contains spotted, small wild cats native to Southeastern and Eastern Asia. Forests are their preferred habitat; they feed on small mammals, reptiles and birds, and occasionally aquatic wildlife.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Leopard_cat_India.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leopard_cat_India.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"196\" style=\"background-color:#545d60\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Prionailurus_bengalensis_in_Indonesia_02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Prionailurus_bengalensis_in_Indonesia_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#3d3b37\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flat-headed_cat_1_Jim_Sanderson.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Flat-headed_cat_1_Jim_Sanderson.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#78796d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Prionailurus_viverrinus_07.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Prionailurus_viverrinus_07.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#607651\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rusty_spotted_cat_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rusty_spotted_cat_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#92694b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"felidae_felis\" class=\"tree_box\"><span><span>Felis</span><a href=\"https://en.wikipedia.org/wiki/Felis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Felis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Felis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Felis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(Domestic cats, European wildcats, Jungle cats, African wildcats, Black-footed cats, Sand cats, Chinese mountain cats)</span><p class=\"tag\">Small and medium-sized cat species native to most of Africa and south of 60° latitude in Europe and Asia to Indochina.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Orange_tabby_cat_sitting_on_fallen_leaves-Hisashi-01A.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Orange_tabby_cat_sitting_on_fallen_leaves-Hisashi-01A.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7e756c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Felis_silvestris_silvestris_Luc_Viatour.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Felis_silvestris_silvestris_Luc_Viatour.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#525043\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jungle_Cat_on_tree_at_Sundarban%2C_West_Bengal%2C_India.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Jungle_Cat_on_tree_at_Sundarban%2C_West_Bengal%2C_India.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#616437\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Southern_African_Wildcat_%28Felis_sylvestris_cafra%29_female_..._%28captive_specimen%29_%2839789072173%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Southern_African_Wildcat_%28Felis_sylvestris_cafra%29_female_..._%28captive_specimen%29_%2839789072173%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"243\" style=\"background-color:#738151\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zoo_Wuppertal_Schwarzfusskatze.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Zoo_Wuppertal_Schwarzfusskatze.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"377\" style=\"background-color:#7d7060\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Persian_sand_CAT.jpg\" target=\"_blank\"><img src=\"thumbnails/Persian_sand_CAT.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"415\" style=\"background-color:#797a64\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chinese_Mountain_Cat_%28Felis_Bieti%29_in_XiNing_Wild_Zoo_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chinese_Mountain_Cat_%28Felis_Bieti%29_in_XiNing_Wild_Zoo_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#a09085\"></a></div></div></div></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_animalia_chordata_tetrapoda_mammalia_primates",[{"name":"Strepsirrhini","parent":"Primates","rank":"Superfamily","ipa":"ˌstrɛpsəˈraɪni","etymology":"greek 'curved nose'","common":[],"tag":"The moist-nosed primates. Native to Africa and Asia.","imgs":[],"card":1},{"name":"Lemuriformes","parent":"Strepsirrhini","rank":"Infraorder","ipa":"","etymology":"","common":["lemurs","lorises","bush babies"],"tag":"The extant infraorder of moist-nosed primates. Native to Africa and Asia. Characterized by a toothcomb, a specialized set of teeth in the front, lower part of the mouth mostly used for combing fur during grooming.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9d/FMIB_46849_Primates_Maki_Moccoe_Lemur_catta_%28white_background%29.jpeg/120px-FMIB_46849_Primates_Maki_Moccoe_Lemur_catta_%28white_background%29.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Nycticebus_%28white_background%29.jpg/60px-Nycticebus_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Zwergmausmaki--w.jpg/330px-Zwergmausmaki--w.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Nycticebus_pygmaeus_004.jpg/330px-Nycticebus_pygmaeus_004.jpg"],"card":1},{"name":"Lemuroidea","parent":"Lemuriformes","rank":"Superfamily","ipa":"","etymology":"","common":["lemurs"],"tag":"Small moist-nosed primates native to Madagascar with a pointed snout, large eyes, and a long tail.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9d/FMIB_46849_Primates_Maki_Moccoe_Lemur_catta_%28white_background%29.jpeg/120px-FMIB_46849_Primates_Maki_Moccoe_Lemur_catta_%28white_background%29.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0b/Ring-tailed_lemur_%28Lemur_catta%29.jpg/250px-Ring-tailed_lemur_%28Lemur_catta%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Propithecus_coquereli_02.jpg/250px-Propithecus_coquereli_02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Wild_aye_aye.jpg/330px-Wild_aye_aye.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Zwergmausmaki--w.jpg/330px-Zwergmausmaki--w.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/Common_brown_lemur_%28Eulemur_fulvus%29_female_with_juvenile_2.jpg/250px-Common_brown_lemur_%28Eulemur_fulvus%29_female_with_juvenile_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4c/Black-and-white_ruffed_lemur_in_tree.jpg/250px-Black-and-white_ruffed_lemur_in_tree.jpg"],"card":4},{"name":"Lorisoidea","parent":"Lemuriformes","rank":"Superfamily","ipa":"","etymology":"","common":["lorises","bush babies","pottos"],"tag":"Nocturnal primates found throughout Africa and Asia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Nycticebus_%28white_background%29.jpg/60px-Nycticebus_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/Brown_Greater_Galago.jpg/500px-Brown_Greater_Galago.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/PottoCincyZoo.jpg/330px-PottoCincyZoo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Nycticebus_pygmaeus_004.jpg/330px-Nycticebus_pygmaeus_004.jpg"],"card":4},{"name":"Haplorhini","parent":"Primates","rank":"Suborder","ipa":"hæpləˈraɪnaɪ","etymology":"greek 'dry-nosed'","common":[],"tag":"The 'dry-nosed' primates. Native to Africa, Asia and the Americas.","imgs":[],"card":1},{"name":"Tarsiidae","parent":"Haplorhini","rank":"Family","ipa":"","etymology":"","common":["tarsiers"],"tag":"Small primates with enormous eyes. Native to maritime Southeast Asia. Males do not have a penis bone.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/S%C3%A4ugethiere_vom_Celebes-_und_Philippinen-Archipel_%28Taf._III%29_%28white_background%29_%281%29.jpg/60px-S%C3%A4ugethiere_vom_Celebes-_und_Philippinen-Archipel_%28Taf._III%29_%28white_background%29_%281%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/59/Tarsier-GG.jpg/250px-Tarsier-GG.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7e/Bohol_Tarsier.jpg/330px-Bohol_Tarsier.jpg"],"card":1},{"name":"Simiiformes","parent":"Haplorhini","rank":"Infraorder","ipa":"ˈsɪmi.ɪfɔːrmiːz","etymology":"","common":[],"tag":"The higher primates. Native to Africa, Asia and the Americas.","imgs":[],"card":1},{"name":"Platyrrhini","parent":"Simiiformes","rank":"Parvorder","ipa":"plætɪˈraɪnaɪ","etymology":"greek 'broad nosed'","common":["marmosets","tamarins","capuchins","squirrel monkeys","night monkeys","titis","sakis","uakaris","howler","spider monkeys","woolly monkeys","woolly spider monkeys"],"tag":"The New World monkeys, found in the Americas. The noses of New World monkeys are flatter than the narrow noses of Old World monkeys, and have side-facing nostrils.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d7/Panamanian_night_monkey.jpg/250px-Panamanian_night_monkey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9d/Marmoset_copy.jpg/250px-Marmoset_copy.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Tamarin_portrait_2_edit3.jpg/330px-Tamarin_portrait_2_edit3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/40/Capuchin_Costa_Rica.jpg/250px-Capuchin_Costa_Rica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Saimiri_sciureus-1_Luc_Viatour.jpg/330px-Saimiri_sciureus-1_Luc_Viatour.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e6/WhiteFacedSaki.jpg/250px-WhiteFacedSaki.jpg","https://upload.wikimedia.org/wikipedia/commons/0/00/Uakari_male.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/84/Ateles_fusciceps_Colombia.JPG/250px-Ateles_fusciceps_Colombia.JPG","https://upload.wikimedia.org/wikipedia/commons/1/1a/Brachyteles_hypoxanthus2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Lagothrix_lagotricha_%28male%29.jpg/330px-Lagothrix_lagotricha_%28male%29.jpg"],"card":2},{"name":"Cercopithecidae","parent":"Simiiformes","rank":"Family","ipa":"ˌsɜːrkoʊpɪˈθɛsɪdiː","etymology":"greek 'longtailed ape'","common":["baboons","red colobus","macaques"],"tag":"The Old World monkeys, native to Africa and Asia. Most have tails, but they are not adapted for grasping or holding. All species have well developed thumbs. Most species are omnivorous, all species can store food in cheek pouches, some species have rumps will change colour during mating periods.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6b/Chacma_Baboon_%28Papio_ursinus%29_%2816824823063%29.jpg/250px-Chacma_Baboon_%28Papio_ursinus%29_%2816824823063%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Red_Colobus_7.jpg/330px-Red_Colobus_7.jpg","https://upload.wikimedia.org/wikipedia/commons/4/43/Bonnet_macaque_%28Macaca_radiata%29_Photograph_By_Shantanu_Kuveskar.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/FranceNormandieChamprepusCercopithecusDiana.jpg/330px-FranceNormandieChamprepusCercopithecusDiana.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Colobus_angolensis.jpg/330px-Colobus_angolensis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg/330px-Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Vervet_monkey_%28Chlorocebus_pygerythrus_rufoviridis%29_juvenile%2C_Semliki_Wildlife_Reserve.jpg/330px-Vervet_monkey_%28Chlorocebus_pygerythrus_rufoviridis%29_juvenile%2C_Semliki_Wildlife_Reserve.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dc/Southern_gelada_%28Theropithecus_gelada_obscura%29_female_with_baby.jpg/250px-Southern_gelada_%28Theropithecus_gelada_obscura%29_female_with_baby.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/15/Cercocebus_torquatus%2C_Colchester_Zoo%2C_Essex%2C_England_-_20080211.jpg/330px-Cercocebus_torquatus%2C_Colchester_Zoo%2C_Essex%2C_England_-_20080211.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Mandrill_Albert_September_2015_Zoo_Berlin_%282%29.jpg/250px-Mandrill_Albert_September_2015_Zoo_Berlin_%282%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Drill_Monkey.jpg/330px-Drill_Monkey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Proboscis_monkey_%28Nasalis_larvatus%29_male_head.jpg/330px-Proboscis_monkey_%28Nasalis_larvatus%29_male_head.jpg"],"card":2},{"name":"Hominoidea","parent":"Simiiformes","rank":"Superfamily","ipa":"hɒmɪˈnɔɪdi.ə","etymology":"","common":[],"tag":"The Apes. Native to sub-Saharan Africa and Southeast Asia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Agilegibbon.jpg/330px-Agilegibbon.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG/250px-Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg/250px-Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg/250px-015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Apeldoorn_Apenheul_zoo_Bonobo.jpg/250px-Apeldoorn_Apenheul_zoo_Bonobo.jpg"],"card":2},{"name":"Hylobatidae","parent":"Hominoidea","rank":"Family","ipa":"","etymology":"","common":["gibbons "],"tag":"Native to the subtropical and tropical forests of Asia. Unlike the great apes they are smaller, exhibit low sexual dimorphism, and don't make nests.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Le_gibbon_%28white_background%29.jpg/120px-Le_gibbon_%28white_background%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/03/Hylobates_lar_-_Kaeng_Krachan_WB.jpg/330px-Hylobates_lar_-_Kaeng_Krachan_WB.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Agilegibbon.jpg/330px-Agilegibbon.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/Pileated_Gibbon_%28Hylobates_pileatus%29_-_Female.jpg/250px-Pileated_Gibbon_%28Hylobates_pileatus%29_-_Female.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/de/Symphalangus_syndactylus%2C_Chiba_Zoo%2C_Japan.jpg/330px-Symphalangus_syndactylus%2C_Chiba_Zoo%2C_Japan.jpg"],"card":2},{"name":"Hominidae","parent":"Hominoidea","rank":"Family","ipa":"ˌhaɪləˈbætɪdiː","etymology":"","common":["orangutans","gorillas","chimpanzees","bonobos","humans"],"tag":"The great apes, or hominids. Native to Africa, Indonesia and Malaysia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG/250px-Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg/250px-Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg/250px-015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Apeldoorn_Apenheul_zoo_Bonobo.jpg/250px-Apeldoorn_Apenheul_zoo_Bonobo.jpg"],"card":2},{"name":"Pongo","parent":"Hominidae","rank":"Genus","ipa":"","etymology":"","common":["orangutans"],"tag":"The most arboreal of the great apes, covered in reddish-brown hair and native to the rainforests of Indonesia and Malaysia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG/250px-Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9d/Bornean%2C_Sumatran_%26_Tapanuli_orangs_%28horizontal%29.jpg/330px-Bornean%2C_Sumatran_%26_Tapanuli_orangs_%28horizontal%29.jpg"],"card":3},{"name":"Gorilla","parent":"Hominidae","rank":"Genus","ipa":"","etymology":"","common":["gorillas"],"tag":"The largest living primates. They are primarily herbivorous, great apes that inhabit the tropical forests of equatorial Africa","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg/250px-Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2d/Gorilla_gorilla_%26_Gorilla_beringei.jpg/330px-Gorilla_gorilla_%26_Gorilla_beringei.jpg"],"card":3},{"name":"Pan","parent":"Hominidae","rank":"Genus","ipa":"","etymology":"","common":["chimpanzees","bonobos"],"tag":"Chimpanzees and bonobos are equally humanity's closest living relatives. Native to sub-Saharan Africa","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Apeldoorn_Apenheul_zoo_Bonobo.jpg/250px-Apeldoorn_Apenheul_zoo_Bonobo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg/250px-015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Grooming_de_Zo%C3%A9.jpg/330px-Grooming_de_Zo%C3%A9.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Bonobo_%28Pan_paniscus%29_at_Lola_Ya_Bonobo_-_3.JPG/330px-Bonobo_%28Pan_paniscus%29_at_Lola_Ya_Bonobo_-_3.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ea/Adult_female_and_infant_wild_chimpanzees_feeding_on_Ficus_sur.jpeg/330px-Adult_female_and_infant_wild_chimpanzees_feeding_on_Ficus_sur.jpeg"],"card":3},{"name":"Australopithecina","parent":"Hominidae","rank":"Subtribe","ipa":"","etymology":"","common":["Australopithecus","humans","Neanderthals","Denisovans"],"tag":"Bipedal great apes with similar teeth to humans, but with a brain size not much larger than a modern apes.","imgs":[],"card":3},{"name":"Homo","parent":"Australopithecina","rank":"Genus","ipa":"","etymology":"","common":["humans","Neanderthals","Denisovans"],"tag":"","imgs":[],"card":3}],{},{"120px-FMIB_46849_Primates_Maki_Moccoe_Lemur_catta_(white_background).jpeg":[120,180,"#ddd9d5"],"120px-Le_gibbon_(white_background).jpg":[120,132,"#cccac6"],"250px-015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg":[250,375,"#747d60"],"250px-Apeldoorn_Apenheul_zoo_Bonobo.jpg":[250,248,"#595f46"],"250px-Ateles_fusciceps_Colombia.JPG":[250,287,"#7f8170"],"250px-Black-and-white_ruffed_lemur_in_tree.jpg":[250,289,"#5e6b58"],"250px-Capuchin_Costa_Rica.jpg":[250,245,"#71804d"],"250px-Chacma_Baboon_(Papio_ursinus)_(16824823063).jpg":[250,303,"#958a6d"],"250px-Common_brown_lemur_(Eulemur_fulvus)_female_with_juvenile_2.jpg":[250,375,"#80825e"],"250px-Gorille_des_plaines_de_l'ouest_à_l'Espace_Zoologique.jpg":[250,376,"#7b8169"],"250px-Mandrill_Albert_September_2015_Zoo_Berlin_(2).jpg":[250,326,"#747665"],"250px-Marmoset_copy.jpg":[250,375,"#5d5037"],"250px-Orang_Utan,_Semenggok_Forest_Reserve,_Sarawak,_Borneo,_Malaysia.JPG":[250,361,"#6f7350"],"250px-Panamanian_night_monkey.jpg":[250,333,"#6e512c"],"250px-Pileated_Gibbon_(Hylobates_pileatus)_-_Female.jpg":[250,375,"#8f9552"],"250px-Propithecus_coquereli_02.jpg":[250,333,"#6e7553"],"250px-Ring-tailed_lemur_(Lemur_catta).jpg":[250,375,"#72724a"],"250px-Southern_gelada_(Theropithecus_gelada_obscura)_female_with_baby.jpg":[250,250,"#8e816d"],"250px-Tarsier-GG.jpg":[250,375,"#737842"],"250px-WhiteFacedSaki.jpg":[250,362,"#686866"],"330px-Adult_female_and_infant_wild_chimpanzees_feeding_on_Ficus_sur.jpeg":[330,230,"#6c6752"],"330px-Agilegibbon.jpg":[330,238,"#423f32"],"330px-Bohol_Tarsier.jpg":[330,248,"#919989"],"330px-Bonobo_(Pan_paniscus)_at_Lola_Ya_Bonobo_-_3.JPG":[330,255,"#938b75"],"330px-Bornean,_Sumatran_&_Tapanuli_orangs_(horizontal).jpg":[330,124,"#7b695c"],"330px-Cercocebus_torquatus,_Colchester_Zoo,_Essex,_England_-_20080211.jpg":[330,248,"#8b7052"],"330px-Colobus_angolensis.jpg":[330,237,"#6c7267"],"330px-Drill_Monkey.jpg":[330,236,"#888c79"],"330px-FranceNormandieChamprepusCercopithecusDiana.jpg":[330,275,"#60625a"],"330px-Gorilla_gorilla_&_Gorilla_beringei.jpg":[330,227,"#595955"],"330px-Grooming_de_Zoé.jpg":[330,220,"#818747"],"330px-Hylobates_lar_-_Kaeng_Krachan_WB.jpg":[330,186,"#54603f"],"330px-Lagothrix_lagotricha_(male).jpg":[330,220,"#7c8a5d"],"330px-Nycticebus_pygmaeus_004.jpg":[330,237,"#645138"],"330px-PottoCincyZoo.jpg":[330,260,"#535047"],"330px-Proboscis_monkey_(Nasalis_larvatus)_male_head.jpg":[330,220,"#717241"],"330px-Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg":[330,233,"#3f403a"],"330px-Red_Colobus_7.jpg":[330,248,"#8e8f6c"],"330px-Saimiri_sciureus-1_Luc_Viatour.jpg":[330,245,"#7c8152"],"330px-Symphalangus_syndactylus,_Chiba_Zoo,_Japan.jpg":[330,220,"#44413b"],"330px-Tamarin_portrait_2_edit3.jpg":[330,220,"#46423a"],"330px-Vervet_monkey_(Chlorocebus_pygerythrus_rufoviridis)_juvenile,_Semliki_Wildlife_Reserve.jpg":[330,220,"#879485"],"330px-Wild_aye_aye.jpg":[330,220,"#3e392b"],"330px-Zwergmausmaki--w.jpg":[330,226,"#464132"],"500px-Brown_Greater_Galago.jpg":[500,331,"#413132"],"60px-Nycticebus_(white_background).jpg":[60,39,"#c0b6a0"],"60px-Säugethiere_vom_Celebes-_und_Philippinen-Archipel_(Taf._III)_(white_background)_(1).jpg":[60,101,"#c4b9a4"],"Bonnet_macaque_(Macaca_radiata)_Photograph_By_Shantanu_Kuveskar.jpg":[354,600,"#c1b38d"],"Brachyteles_hypoxanthus2.jpg":[600,600,"#958a47"],"Uakari_male.jpg":[800,600,"#778841"]})
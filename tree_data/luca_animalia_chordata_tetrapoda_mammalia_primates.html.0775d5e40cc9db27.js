@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda_mammalia_primates","<ul class=\"tree\" data-tree-range=\"primates\"><li><input type=\"checkbox\" checked id=\"Euarchontoglires_Primates\"><label class=\"tree_label\" for=\"Euarchontoglires_Primates\"></label><div class=\"outer_tree_box\"><div id=\"primates_primates\" class=\"tree_box\"><span><span>Primates</span><a href=\"https://en.wikipedia.org/wiki/Primates\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Primates\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Primates\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Primates\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"mammalia\">See parent</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(lemurs, galagos, lorisids, monkeys, apes)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Lemur_catta_001.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lemur_catta_001.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#988474\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bohol_Tarsier.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bohol_Tarsier.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#919989\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hylobates_lar_pair_of_white_and_black_01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hylobates_lar_pair_of_white_and_black_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5b765d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#747d60\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Papio_hamadryas_%28aka%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Papio_hamadryas_%28aka%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#544d49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#7b8169\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Primates_Strepsirrhini\"><label class=\"tree_label\" for=\"Primates_Strepsirrhini\"></label><div class=\"outer_tree_box\"><div id=\"primates_strepsirrhini\" class=\"tree_box\"><span><span>Strepsirrhini</span><a href=\"https://en.wikipedia.org/wiki/Strepsirrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Strepsirrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Strepsirrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Strepsirrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌstrɛpsəˈraɪni\" target=\"_blank\">ˌstrɛpsəˈraɪni</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><p class=\"tag\">The moist-nosed primates. Native to Africa and Asia.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Strepsirrhini_Lemuriformes\"><label class=\"tree_label\" for=\"Strepsirrhini_Lemuriformes\"></label><div class=\"outer_tree_box\"><div id=\"primates_lemuriformes\" class=\"tree_box\"><span><span>Lemuriformes</span><a href=\"https://en.wikipedia.org/wiki/Lemuriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lemuriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lemuriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lemuriformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraorder</span></span><span class=\"common_names\">(lemurs, lorises, bush babies)</span><p class=\"tag\">The extant infraorder of moist-nosed primates. Native to Africa and Asia. Characterized by a toothcomb, a specialized set of teeth in the front, lower part of the mouth mostly used for combing fur during grooming.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:FMIB_46849_Primates_Maki_Moccoe_Lemur_catta_%28white_background%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/120px-FMIB_46849_Primates_Maki_Moccoe_Lemur_catta_%28white_background%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"180\" style=\"background-color:#ddd9d5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nycticebus_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/60px-Nycticebus_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"60\" height=\"39\" style=\"background-color:#c0b6a0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zwergmausmaki--w.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Zwergmausmaki--w.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#464132\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nycticebus_pygmaeus_004.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nycticebus_pygmaeus_004.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#645138\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"primates_lemuroidea\" class=\"tree_box\"><span><span>Lemuroidea</span><a href=\"https://en.wikipedia.org/wiki/Lemuroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lemuroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lemuroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lemuroidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><span class=\"common_names\">(lemurs)</span><p class=\"tag\">Small moist-nosed primates native to Madagascar with a pointed snout, large eyes, and a long tail.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:FMIB_46849_Primates_Maki_Moccoe_Lemur_catta_%28white_background%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/120px-FMIB_46849_Primates_Maki_Moccoe_Lemur_catta_%28white_background%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"180\" style=\"background-color:#ddd9d5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ring-tailed_lemur_%28Lemur_catta%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ring-tailed_lemur_%28Lemur_catta%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#72724a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Propithecus_coquereli_02.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Propithecus_coquereli_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6e7553\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wild_aye_aye.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wild_aye_aye.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#3e392b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zwergmausmaki--w.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Zwergmausmaki--w.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"226\" style=\"background-color:#464132\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Common_brown_lemur_%28Eulemur_fulvus%29_female_with_juvenile_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Common_brown_lemur_%28Eulemur_fulvus%29_female_with_juvenile_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#80825e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black-and-white_ruffed_lemur_in_tree.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Black-and-white_ruffed_lemur_in_tree.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"289\" style=\"background-color:#5e6b58\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"primates_lorisoidea\" class=\"tree_box\"><span><span>Lorisoidea</span><a href=\"https://en.wikipedia.org/wiki/Lorisoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lorisoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lorisoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lorisoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><span class=\"common_names\">(lorises, bush babies, pottos)</span><p class=\"tag\">Nocturnal primates found throughout Africa and Asia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Nycticebus_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/60px-Nycticebus_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"60\" height=\"39\" style=\"background-color:#c0b6a0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brown_Greater_Galago.jpg\" target=\"_blank\"><img src=\"thumbnails/500px-Brown_Greater_Galago.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"331\" style=\"background-color:#413132\"></a><a href=\"https://commons.wikimedia.org/wiki/File:PottoCincyZoo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-PottoCincyZoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"260\" style=\"background-color:#535047\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nycticebus_pygmaeus_004.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nycticebus_pygmaeus_004.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#645138\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Primates_Haplorhini\"><label class=\"tree_label\" for=\"Primates_Haplorhini\"></label><div class=\"outer_tree_box\"><div id=\"primates_haplorhini\" class=\"tree_box\"><span><span>Haplorhini</span><a href=\"https://en.wikipedia.org/wiki/Haplorhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Haplorhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Haplorhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Haplorhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=hæpləˈraɪnaɪ\" target=\"_blank\">hæpləˈraɪnaɪ</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><p class=\"tag\">The &#x27;dry-nosed&#x27; primates. Native to Africa, Asia and the Americas.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"primates_tarsiidae\" class=\"tree_box\"><span><span>Tarsiidae</span><a href=\"https://en.wikipedia.org/wiki/Tarsiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tarsiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tarsiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Tarsiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(tarsiers)</span><p class=\"tag\">Small primates with enormous eyes. Native to maritime Southeast Asia. Males do not have a penis bone.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:S%C3%A4ugethiere_vom_Celebes-_und_Philippinen-Archipel_%28Taf._III%29_%28white_background%29_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/60px-S%C3%A4ugethiere_vom_Celebes-_und_Philippinen-Archipel_%28Taf._III%29_%28white_background%29_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"60\" height=\"101\" style=\"background-color:#c4b9a4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tarsier-GG.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tarsier-GG.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#737842\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bohol_Tarsier.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bohol_Tarsier.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#919989\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Haplorhini_Simiiformes\"><label class=\"tree_label\" for=\"Haplorhini_Simiiformes\"></label><div class=\"outer_tree_box\"><div id=\"primates_simiiformes\" class=\"tree_box\"><span><span>Simiiformes</span><a href=\"https://en.wikipedia.org/wiki/Simiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Simiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Simiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Simiiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈsɪmi.ɪfɔːrmiːz\" target=\"_blank\">ˈsɪmi.ɪfɔːrmiːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Infraorder</span></span><p class=\"tag\">The higher primates. Native to Africa, Asia and the Americas.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"primates_platyrrhini\" class=\"tree_box\"><span><span>Platyrrhini</span><a href=\"https://en.wikipedia.org/wiki/Platyrrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Platyrrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Platyrrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Platyrrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=plætɪˈraɪnaɪ\" target=\"_blank\">plætɪˈraɪnaɪ</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"platyrrhini\">See children</button><span class=\"badge\">Parvorder</span></span><span class=\"common_names\">(marmosets, tamarins, capuchins, squirrel monkeys, night monkeys, titis, sakis, uakaris, howler, spider monkeys, woolly monkeys, woolly spider monkeys)</span><p class=\"tag\">The New World monkeys, found in the Americas. The noses of New World monkeys are flatter than the narrow noses of Old World monkeys, and have side-facing nostrils.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Panamanian_night_monkey.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Panamanian_night_monkey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6e512c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Marmoset_copy.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Marmoset_copy.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#5d5037\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tamarin_portrait_2_edit3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tamarin_portrait_2_edit3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#46423a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Capuchin_Costa_Rica.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Capuchin_Costa_Rica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"245\" style=\"background-color:#71804d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saimiri_sciureus-1_Luc_Viatour.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saimiri_sciureus-1_Luc_Viatour.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#7c8152\"></a><a href=\"https://commons.wikimedia.org/wiki/File:WhiteFacedSaki.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-WhiteFacedSaki.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"362\" style=\"background-color:#686866\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Uakari_male.jpg\" target=\"_blank\"><img src=\"thumbnails/Uakari_male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#778841\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ateles_fusciceps_Colombia.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Ateles_fusciceps_Colombia.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"287\" style=\"background-color:#7f8170\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brachyteles_hypoxanthus2.jpg\" target=\"_blank\"><img src=\"thumbnails/Brachyteles_hypoxanthus2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"600\" style=\"background-color:#958a47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lagothrix_lagotricha_%28male%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lagothrix_lagotricha_%28male%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7c8a5d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"primates_cercopithecidae\" class=\"tree_box\"><span><span>Cercopithecidae</span><a href=\"https://en.wikipedia.org/wiki/Cercopithecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cercopithecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cercopithecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cercopithecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌsɜːrkoʊpɪˈθɛsɪdiː\" target=\"_blank\">ˌsɜːrkoʊpɪˈθɛsɪdiː</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"cercopithecidae\">See children</button><span class=\"badge\">Family</span></span><span class=\"common_names\">(baboons, red colobus, macaques)</span><p class=\"tag\">The Old World monkeys, native to Africa and Asia. Most have tails, but they are not adapted for grasping or holding. All species have well developed thumbs. Most species are omnivorous, all species can store food in cheek pouches, some species have rumps will change colour during mating periods.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chacma_Baboon_%28Papio_ursinus%29_%2816824823063%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chacma_Baboon_%28Papio_ursinus%29_%2816824823063%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"303\" style=\"background-color:#958a6d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_Colobus_7.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red_Colobus_7.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8e8f6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bonnet_macaque_%28Macaca_radiata%29_Photograph_By_Shantanu_Kuveskar.jpg\" target=\"_blank\"><img src=\"thumbnails/Bonnet_macaque_%28Macaca_radiata%29_Photograph_By_Shantanu_Kuveskar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"354\" height=\"600\" style=\"background-color:#c1b38d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:FranceNormandieChamprepusCercopithecusDiana.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-FranceNormandieChamprepusCercopithecusDiana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"275\" style=\"background-color:#60625a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Colobus_angolensis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Colobus_angolensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#6c7267\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#3f403a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vervet_monkey_%28Chlorocebus_pygerythrus_rufoviridis%29_juvenile%2C_Semliki_Wildlife_Reserve.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vervet_monkey_%28Chlorocebus_pygerythrus_rufoviridis%29_juvenile%2C_Semliki_Wildlife_Reserve.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#879485\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Southern_gelada_%28Theropithecus_gelada_obscura%29_female_with_baby.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Southern_gelada_%28Theropithecus_gelada_obscura%29_female_with_baby.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#8e816d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cercocebus_torquatus%2C_Colchester_Zoo%2C_Essex%2C_England_-_20080211.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cercocebus_torquatus%2C_Colchester_Zoo%2C_Essex%2C_England_-_20080211.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8b7052\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mandrill_Albert_September_2015_Zoo_Berlin_%282%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Mandrill_Albert_September_2015_Zoo_Berlin_%282%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"326\" style=\"background-color:#747665\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Drill_Monkey.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Drill_Monkey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#888c79\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Proboscis_monkey_%28Nasalis_larvatus%29_male_head.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Proboscis_monkey_%28Nasalis_larvatus%29_male_head.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#717241\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Simiiformes_Hominoidea\"><label class=\"tree_label\" for=\"Simiiformes_Hominoidea\"></label><div class=\"outer_tree_box\"><div id=\"primates_hominoidea\" class=\"tree_box\"><span><span>Hominoidea</span><a href=\"https://en.wikipedia.org/wiki/Hominoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hominoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hominoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hominoidea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=hɒmɪˈnɔɪdi.ə\" target=\"_blank\">hɒmɪˈnɔɪdi.ə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Superfamily</span></span><p class=\"tag\">The Apes. Native to sub-Saharan Africa and Southeast Asia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Agilegibbon.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Agilegibbon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#423f32\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"361\" style=\"background-color:#6f7350\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#7b8169\"></a><a href=\"https://commons.wikimedia.org/wiki/File:015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#747d60\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apeldoorn_Apenheul_zoo_Bonobo.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Apeldoorn_Apenheul_zoo_Bonobo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"248\" style=\"background-color:#595f46\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"primates_hylobatidae\" class=\"tree_box\"><span><span>Hylobatidae</span><a href=\"https://en.wikipedia.org/wiki/Hylobatidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hylobatidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hylobatidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hylobatidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(gibbons )</span><p class=\"tag\">Native to the subtropical and tropical forests of Asia. Unlike the great apes they are smaller, exhibit low sexual dimorphism, and don&#x27;t make nests.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Le_gibbon_%28white_background%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Le_gibbon_%28white_background%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"132\" style=\"background-color:#cccac6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hylobates_lar_-_Kaeng_Krachan_WB.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hylobates_lar_-_Kaeng_Krachan_WB.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#54603f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Agilegibbon.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Agilegibbon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#423f32\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pileated_Gibbon_%28Hylobates_pileatus%29_-_Female.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pileated_Gibbon_%28Hylobates_pileatus%29_-_Female.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#8f9552\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Symphalangus_syndactylus%2C_Chiba_Zoo%2C_Japan.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Symphalangus_syndactylus%2C_Chiba_Zoo%2C_Japan.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#44413b\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Hominoidea_Hominidae\"><label class=\"tree_label\" for=\"Hominoidea_Hominidae\"></label><div class=\"outer_tree_box\"><div id=\"primates_hominidae\" class=\"tree_box\"><span><span>Hominidae</span><a href=\"https://en.wikipedia.org/wiki/Hominidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hominidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hominidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hominidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌhaɪləˈbætɪdiː\" target=\"_blank\">ˌhaɪləˈbætɪdiː</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(orangutans, gorillas, chimpanzees, bonobos, humans)</span><p class=\"tag\">The great apes, or hominids. Native to Africa, Indonesia and Malaysia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"361\" style=\"background-color:#6f7350\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#7b8169\"></a><a href=\"https://commons.wikimedia.org/wiki/File:015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#747d60\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apeldoorn_Apenheul_zoo_Bonobo.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Apeldoorn_Apenheul_zoo_Bonobo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"248\" style=\"background-color:#595f46\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"primates_pongo\" class=\"tree_box\"><span><span>Pongo</span><a href=\"https://en.wikipedia.org/wiki/Pongo\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pongo\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pongo\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pongo\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(orangutans)</span><p class=\"tag\">The most arboreal of the great apes, covered in reddish-brown hair and native to the rainforests of Indonesia and Malaysia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Orang_Utan%2C_Semenggok_Forest_Reserve%2C_Sarawak%2C_Borneo%2C_Malaysia.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"361\" style=\"background-color:#6f7350\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bornean%2C_Sumatran_%26_Tapanuli_orangs_%28horizontal%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bornean%2C_Sumatran_%26_Tapanuli_orangs_%28horizontal%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"124\" style=\"background-color:#7b695c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"primates_gorilla\" class=\"tree_box\"><span><span>Gorilla</span><a href=\"https://en.wikipedia.org/wiki/Gorilla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gorilla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gorilla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gorilla\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(gorillas)</span><p class=\"tag\">The largest living primates. They are primarily herbivorous, great apes that inhabit the tropical forests of equatorial Africa</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gorille_des_plaines_de_l%27ouest_%C3%A0_l%27Espace_Zoologique.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#7b8169\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gorilla_gorilla_%26_Gorilla_beringei.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gorilla_gorilla_%26_Gorilla_beringei.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"227\" style=\"background-color:#595955\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"primates_pan\" class=\"tree_box\"><span><span>Pan</span><a href=\"https://en.wikipedia.org/wiki/Pan\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pan\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pan\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pan\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(chimpanzees, bonobos)</span><p class=\"tag\">Chimpanzees and bonobos are equally humanity&#x27;s closest living relatives. Native to sub-Saharan Africa</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Apeldoorn_Apenheul_zoo_Bonobo.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Apeldoorn_Apenheul_zoo_Bonobo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"248\" style=\"background-color:#595f46\"></a><a href=\"https://commons.wikimedia.org/wiki/File:015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-015_Chimpanzee_at_Kibale_forest_National_Park_Photo_by_Giles_Laurent.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#747d60\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grooming_de_Zo%C3%A9.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grooming_de_Zo%C3%A9.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#818747\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bonobo_%28Pan_paniscus%29_at_Lola_Ya_Bonobo_-_3.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Bonobo_%28Pan_paniscus%29_at_Lola_Ya_Bonobo_-_3.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#938b75\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Adult_female_and_infant_wild_chimpanzees_feeding_on_Ficus_sur.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Adult_female_and_infant_wild_chimpanzees_feeding_on_Ficus_sur.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#6c6752\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Hominidae_Australopithecina\"><label class=\"tree_label\" for=\"Hominidae_Australopithecina\"></label><div class=\"outer_tree_box\"><div id=\"primates_australopithecina\" class=\"tree_box\"><span><span>Australopithecina</span><a href=\"https://en.wikipedia.org/wiki/Australopithecina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Australopithecina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Australopithecina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Australopithecina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subtribe</span></span><span class=\"common_names\">(Australopithecus, humans, Neanderthals, Denisovans)</span><p class=\"tag\">Bipedal great apes with similar teeth to humans, but with a brain size not much larger than a modern apes.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"primates_homo\" class=\"tree_box\"><span><span>Homo</span><a href=\"https://en.wikipedia.org/wiki/Homo\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Homo\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Homo\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Homo\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"homo\">See children</button><span class=\"badge\">Genus</span></span><span class=\"common_names\">(humans, Neanderthals, Denisovans)</span><div></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul>")
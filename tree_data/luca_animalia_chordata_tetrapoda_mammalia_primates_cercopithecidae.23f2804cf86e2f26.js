@@ -0,0 +1 @@
+TreeData.register("luca_animalia_chordata_tetrapoda_mammalia_primates_cercopithecidae",[{"name":"Colobinae","parent":"Cercopithecidae","rank":"Subfamily","ipa":"","etymology":"","common":["black-and-white colobus","large-nosed proboscis monkeys","gray langurs"],"tag":"Medium-sized primates with long tails. Most species are arboreal. They are folivorous, though their diet may be supplemented with flowers, fruits and the occasional insect. They have multichambered, complex stomachs, making them the only primates with foregut fermentation.","imgs":[],"card":1},{"name":"Colobini","parent":"Colobinae","rank":"Tribe","ipa":"","etymology":"","common":["black-and-white colobus monkeys","red colobus monkeys","olive colobus monkeys"],"tag":"","imgs":[],"card":2},{"name":"Colobus","parent":"Colobini","rank":"Genus","ipa":"","etymology":"","common":["black-and-white colobus monkeys"],"tag":"Generally found in high-density forests where they forage on leaves, flowers and fruit. Social groups of colobus are diverse, varying from group to group. Resident-egalitarian and allomothering relationships have been observed among the female population.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Colobus_angolensis.jpg/330px-Colobus_angolensis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b2/Mantled_Guereza.jpg/250px-Mantled_Guereza.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/14/Multi-male_unit_of_Rwenzori_colobus_in_Nyungwe_.jpg/330px-Multi-male_unit_of_Rwenzori_colobus_in_Nyungwe_.jpg"],"card":4},{"name":"Piliocolobus","parent":"Colobini","rank":"Genus","ipa":"","etymology":"","common":["red colobus monkeys"],"tag":"Primarily arboreal and most are restricted to humid forests. Groups often establish a dominance hierarchy determined by aggressive behavior. Food, grooming, and sexual partners are distributed amongst higher-ranking individuals initially, followed by lower-ranking individuals. Diet consists mainly of young leaves, flowers, and unripe fruit. They are known to eat charcoal or clay to help combat the cyanide some leaves contain.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Red_Colobus_7.jpg/330px-Red_Colobus_7.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/97/Piliocolobus_kirkii_7.jpg/250px-Piliocolobus_kirkii_7.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Western_Red_Colobus_Monkey_%2832257813804%29.jpg/330px-Western_Red_Colobus_Monkey_%2832257813804%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c9/Ugandan_red_colobus_%28Procolobus_tephrosceles%29.jpg/250px-Ugandan_red_colobus_%28Procolobus_tephrosceles%29.jpg"],"card":4},{"name":"Procolobus","parent":"Colobini","rank":"Genus","ipa":"","etymology":"","common":["olive colobus"],"tag":"Rarely observed in its natural habitat because of its cryptic coloration and secretive nature.","imgs":[],"card":4},{"name":"Presbytini","parent":"Colobinae","rank":"Tribe","ipa":"","etymology":"","common":["black-and-white colobus monkeys","red colobus monkeys","olive colobus monkeys"],"tag":"","imgs":[],"card":2},{"name":"Trachypithecus","parent":"Presbytini","rank":"Genus","ipa":"","etymology":"","common":["lutungs","leaf monkeys"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Dusky_Langurs_at_Penang_National_Park.jpg/250px-Dusky_Langurs_at_Penang_National_Park.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/SAIGON_ZOO_VIETNAM_JAN_2012_%287009538995%29.jpg/250px-SAIGON_ZOO_VIETNAM_JAN_2012_%287009538995%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/54/Langur_de_Delacour.jpg/250px-Langur_de_Delacour.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c1/Ebony_Langur_Javan_Lutung_Trachypithecus_auratus_at_Bronx_Zoo_3.jpg/250px-Ebony_Langur_Javan_Lutung_Trachypithecus_auratus_at_Bronx_Zoo_3.jpg","https://upload.wikimedia.org/wikipedia/commons/b/bd/Golden_langur.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Silvered_Leaf_Monkey_%28Trachypithecus_cristatus%29_%288125672881%29.jpg/330px-Silvered_Leaf_Monkey_%28Trachypithecus_cristatus%29_%288125672881%29.jpg"],"card":5},{"name":"Presbytis","parent":"Presbytini","rank":"Genus","ipa":"","etymology":"","common":["surilis"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9a/Presbytis_comata_53175454.jpg/500px-Presbytis_comata_53175454.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/Red_leaf_monkey_%28Presbytis_rubicunda%29.jpg/330px-Red_leaf_monkey_%28Presbytis_rubicunda%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f2/White_leaf_monkey2.jpg/250px-White_leaf_monkey2.jpg","https://upload.wikimedia.org/wikipedia/commons/c/ca/Presbytis_femoralis_Andie_Ang.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Thomas%27s_langur_Presbytis_thomasi.jpg/250px-Thomas%27s_langur_Presbytis_thomasi.jpg"],"card":5},{"name":"Semnopithecus","parent":"Presbytini","rank":"Genus","ipa":"","etymology":"","common":["gray langurs"],"tag":"Terrestrial, inhabiting forest, open lightly wooded habitats, and urban areas. They mostly walk quadrupedally and spend half of their time on the ground and the other half in trees.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/61/Gray_langur_%28Semnopithecus%29_by_Shantanu_Kuveskar.jpg/250px-Gray_langur_%28Semnopithecus%29_by_Shantanu_Kuveskar.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/34/Gray_Langur_-_Young.jpg/330px-Gray_Langur_-_Young.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f9/Purple-faced_langur_%28Semnopithecus_vetulus_vetulus%29.jpg/250px-Purple-faced_langur_%28Semnopithecus_vetulus_vetulus%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/Tufted_grey_langur_%28Semnopithecus_priam%29.jpg/250px-Tufted_grey_langur_%28Semnopithecus_priam%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/66/Nilgiri_langur_%281%29_by_N._A._Naseer.jpg/250px-Nilgiri_langur_%281%29_by_N._A._Naseer.jpg"],"card":5},{"name":"Pygathrix","parent":"Presbytini","rank":"Genus","ipa":"","etymology":"","common":["doucs"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg/330px-Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a5/Ch%C3%A0_v%C3%A1_ch%C3%A2n_%C4%91en.jpg/330px-Ch%C3%A0_v%C3%A1_ch%C3%A2n_%C4%91en.jpg"],"card":5},{"name":"Rhinopithecus","parent":"Presbytini","rank":"Genus","ipa":"","etymology":"","common":["snub-nosed monkeys"],"tag":"Named for the short stump of a nose on their round faces, with nostrils arranged forward. They have relatively multicolored and long fur, particularly at the shoulders and backs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c8/Golden_Snub-nosed_Monkeys%2C_Qinling_Mountains_-_China.jpg/250px-Golden_Snub-nosed_Monkeys%2C_Qinling_Mountains_-_China.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0d/Black_Snub-nosed_Monkey_%2844489823001%29.jpg/330px-Black_Snub-nosed_Monkey_%2844489823001%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Tonkin_snub-nosed_monkeys_%28Rhinopithecus_avunculus%29.jpg/330px-Tonkin_snub-nosed_monkeys_%28Rhinopithecus_avunculus%29.jpg"],"card":5},{"name":"Nasalis","parent":"Presbytini","rank":"Genus","ipa":"","etymology":"","common":["proboscis monkeys"],"tag":"Has an unusually large nose (or proboscis), a reddish-brown skin color and a long tail. Sexual dimorphism is pronounced.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e5/Proboscis_Monkey_in_Borneo.jpg/330px-Proboscis_Monkey_in_Borneo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Proboscis_monkey_%28Nasalis_larvatus%29_male_head.jpg/330px-Proboscis_monkey_%28Nasalis_larvatus%29_male_head.jpg"],"card":5},{"name":"Simias","parent":"Presbytini","rank":"Genus","ipa":"","etymology":"","common":["pig-tailed langur"],"tag":"A critically endangered endemic to several small islands off the coast of Sumatra in Indonesia. Little is known of their natural history.","imgs":[],"card":5},{"name":"Cercopithecinae","parent":"Cercopithecidae","rank":"Subfamily","ipa":"","etymology":"","common":["baboons","macaques","vervet monkeys"],"tag":"Diurnal monkeys that live together in social groups. Most species are omnivorous, with diets ranging from fruits, leaves, seeds, buds, and mushrooms to insects, spiders, and smaller vertebrates. All species possess cheek pouches in which they can store food.","imgs":[],"card":1},{"name":"Cercopithecini","parent":"Cercopithecinae","rank":"Tribe","ipa":"","etymology":"","common":["vervet monkeys","talapoins","Allen's swamp monkeys","guenons"],"tag":"","imgs":[],"card":3},{"name":"Allenopithecus","parent":"Cercopithecini","rank":"Genus","ipa":"","etymology":"","common":["Allen's swamp monkeys"],"tag":"A diurnal monkey that inhabits swampy, water-rich areas and can swim well with its slight webbing on its fingers and toes. Its diet consists of fruits and leaves, as well as beetles and worms.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Allens_swamp_monkey.jpg/330px-Allens_swamp_monkey.jpg"],"card":6},{"name":"Cercopithecus","parent":"Cercopithecini","rank":"Genus","ipa":"ˌsɜːrkəˈpɪθəkəs","etymology":"","common":["[most] guenons"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/FranceNormandieChamprepusCercopithecusDiana.jpg/330px-FranceNormandieChamprepusCercopithecusDiana.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Blue_monkey_%28Cercopithecus_mitis_stuhlmanni%29.jpg/250px-Blue_monkey_%28Cercopithecus_mitis_stuhlmanni%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/RWA_4663.review_1_Rwanda_Mona_Monkey.jpg/250px-RWA_4663.review_1_Rwanda_Mona_Monkey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5f/La_Bourbansais_04.jpg/330px-La_Bourbansais_04.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Putty-nosed_monkey_%28Cercopithecus_nictitans%29.JPG/250px-Putty-nosed_monkey_%28Cercopithecus_nictitans%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Monkey_at_the_San_Diego_Zoo.jpg/330px-Monkey_at_the_San_Diego_Zoo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fd/Lowe%27s_Mona_Monkey.JPG/330px-Lowe%27s_Mona_Monkey.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Cercopithecus_roloway.jpg/330px-Cercopithecus_roloway.jpg"],"card":6},{"name":"Miopithecus","parent":"Cercopithecini","rank":"Genus","ipa":"","etymology":"","common":["talapoins"],"tag":"Have grey green fur on top and whitish on their underside. Diurnal and arboreal, preferring rain forest or mangroves near water. They are omnivores with a diet mainly of fruits, seeds, aquatic plants, insects, shellfish, bird eggs and small vertebrates. They swim well.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Talapoin_II_-_Bioparc_Valencia_%282787418966%29.jpg/330px-Talapoin_II_-_Bioparc_Valencia_%282787418966%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/eb/Miopithecus_ogouensis_in_Prague_Zoo_01.JPG/330px-Miopithecus_ogouensis_in_Prague_Zoo_01.JPG"],"card":6},{"name":"Chlorocebus","parent":"Cercopithecini","rank":"Genus","ipa":"","etymology":"","common":["vervet monkeys","green monkeys"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/Gambia06Bijilo0015_%285421078756%29.jpg/250px-Gambia06Bijilo0015_%285421078756%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/60/Grivet_%28Chlorocebus_aethiops%29_head_2.jpg/250px-Grivet_%28Chlorocebus_aethiops%29_head_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f7/Chlorocebus_cynosuros_%28Zambia%29.jpg/330px-Chlorocebus_cynosuros_%28Zambia%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Black_faced_vervet_monkey.jpg/250px-Black_faced_vervet_monkey.jpg"],"card":6},{"name":"Erythrocebus","parent":"Cercopithecini","rank":"Genus","ipa":"","etymology":"","common":["patas monkeys"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4a/Patas_Monkey_Jr.jpg/330px-Patas_Monkey_Jr.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c6/Patas_Monkey.jpg/330px-Patas_Monkey.jpg"],"card":6},{"name":"Allochrocebus","parent":"Cercopithecini","rank":"Genus","ipa":"","etymology":"","common":["L'Hoest's monkeys","Preuss's monkeys","sun-tailed monkeys"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/ce/L%27Hoest%27s_monkey_%28Cercopithecus_lhoesti%29.jpg/330px-L%27Hoest%27s_monkey_%28Cercopithecus_lhoesti%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/25/Solatus.JPG/330px-Solatus.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Cercopithecus_lhoesti_%28L%27Hoest%27s_monkey_-_Colchester_Zoo%2C_England%2C_2008%29.jpg/330px-Cercopithecus_lhoesti_%28L%27Hoest%27s_monkey_-_Colchester_Zoo%2C_England%2C_2008%29.jpg"],"card":6},{"name":"Papionini","parent":"Cercopithecinae","rank":"Tribe","ipa":"","etymology":"","common":["macaques","baboons","geladas","mangabeys","kipunji","drills","mandrills"],"tag":"","imgs":[],"card":3},{"name":"Macaca","parent":"Papionini","rank":"Genus","ipa":"","etymology":"","common":["macaques"],"tag":"Principally frugivorous (preferring fruit), although their diet also includes seeds, leaves, flowers, and tree bark. Some species will supplement their diets with small amounts of meat from shellfish, insects, and small mammals. Social groups are arranged around dominant matriarchs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Assamese_macaque_AJTJ_P1020178.JPG/330px-Assamese_macaque_AJTJ_P1020178.JPG","https://upload.wikimedia.org/wikipedia/commons/4/43/Bonnet_macaque_%28Macaca_radiata%29_Photograph_By_Shantanu_Kuveskar.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c4/Kuifmakaak_%288721744168%29.jpg/250px-Kuifmakaak_%288721744168%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e1/Crab-eating_macaque_%28Macaca_fascicularis%29_Phang_Nga.jpg/250px-Crab-eating_macaque_%28Macaca_fascicularis%29_Phang_Nga.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/YushanNationalPark_jdtien_002.jpg/250px-YushanNationalPark_jdtien_002.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Lion-tailed_Macaque_in_Bristol_Zoo.jpg/250px-Lion-tailed_Macaque_in_Bristol_Zoo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Macaca_Maura_Satwa_Endemik_Sulawesi_Selatan_01.jpg/330px-Macaca_Maura_Satwa_Endemik_Sulawesi_Selatan_01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ce/Macaca_arctoides%2C_Stump-tailed_macaque_-_Kaeng_Krachan_National_Park_%2823274848523%29.jpg/330px-Macaca_arctoides%2C_Stump-tailed_macaque_-_Kaeng_Krachan_National_Park_%2823274848523%29.jpg"],"card":7},{"name":"Cercocebus","parent":"Papionini","rank":"Genus","ipa":"","etymology":"","common":["white-eyelid mangabeys"],"tag":"Characterized by their bare upper eyelids, which are lighter than their facial skin colouring, and the uniformly coloured hairs of the fur.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/Tanzania_-Sanje_Mangabey.jpg/330px-Tanzania_-Sanje_Mangabey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b2/Cercocebus_chrysogaster_0006.jpg/330px-Cercocebus_chrysogaster_0006.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6c/Cercocebus_atys_219636002.jpg/330px-Cercocebus_atys_219636002.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/Cercocebus_galeritus_50817270.jpg/330px-Cercocebus_galeritus_50817270.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/37/Cercocebus_atys_lunulatus_Barcelona_zoo.jpg/250px-Cercocebus_atys_lunulatus_Barcelona_zoo.jpg"],"card":7},{"name":"Lophocebus","parent":"Papionini","rank":"Genus","ipa":"","etymology":"","common":["crested mangabeys"],"tag":"Tend to have dark skin, eyelids that match their facial skin, and crests of hair on their heads.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Grey-cheeked_Mangabey.JPG/330px-Grey-cheeked_Mangabey.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Black_Mangabey_002.jpg/330px-Black_Mangabey_002.jpg"],"card":7},{"name":"Rungwecebus","parent":"Papionini","rank":"Genus","ipa":"","etymology":"","common":["highland mangabeys"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c0/Kipunji_walking_h.jpg/330px-Kipunji_walking_h.jpg"],"card":7},{"name":"Papio","parent":"Papionini","rank":"Genus","ipa":"","etymology":"","common":["baboons"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6b/Chacma_Baboon_%28Papio_ursinus%29_%2816824823063%29.jpg/250px-Chacma_Baboon_%28Papio_ursinus%29_%2816824823063%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Papio_hamadryas_pair.jpg/330px-Papio_hamadryas_pair.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/Olive_baboon_Ngorongoro.jpg/330px-Olive_baboon_Ngorongoro.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/de/Papio_cynocephalus02.jpg/250px-Papio_cynocephalus02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/Portrait_Of_A_Baboon.jpg/330px-Portrait_Of_A_Baboon.jpg"],"card":7},{"name":"Theropithecus","parent":"Papionini","rank":"Genus","ipa":"","etymology":"","common":["gelada"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/8b/Gelada_%28Theropithecus_gelada_gelada%29_male_2.jpg/250px-Gelada_%28Theropithecus_gelada_gelada%29_male_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dc/Southern_gelada_%28Theropithecus_gelada_obscura%29_female_with_baby.jpg/250px-Southern_gelada_%28Theropithecus_gelada_obscura%29_female_with_baby.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Gelada_Baboon_Semien_Mountains_Ethiopia.jpg/250px-Gelada_Baboon_Semien_Mountains_Ethiopia.jpg"],"card":7}],{},{"250px-Black_faced_vervet_monkey.jpg":[250,375,"#686660"],"250px-Blue_monkey_(Cercopithecus_mitis_stuhlmanni).jpg":[250,250,"#6a745f"],"250px-Cercocebus_atys_lunulatus_Barcelona_zoo.jpg":[250,375,"#625b49"],"250px-Chacma_Baboon_(Papio_ursinus)_(16824823063).jpg":[250,303,"#958a6d"],"250px-Crab-eating_macaque_(Macaca_fascicularis)_Phang_Nga.jpg":[250,250,"#8e8761"],"250px-Dusky_Langurs_at_Penang_National_Park.jpg":[250,365,"#69604c"],"250px-Ebony_Langur_Javan_Lutung_Trachypithecus_auratus_at_Bronx_Zoo_3.jpg":[250,333,"#78726e"],"250px-Gambia06Bijilo0015_(5421078756).jpg":[250,333,"#796e61"],"250px-Gelada_(Theropithecus_gelada_gelada)_male_2.jpg":[250,250,"#756c49"],"250px-Gelada_Baboon_Semien_Mountains_Ethiopia.jpg":[250,375,"#7f7e69"],"250px-Golden_Snub-nosed_Monkeys,_Qinling_Mountains_-_China.jpg":[250,364,"#5f544c"],"250px-Gray_langur_(Semnopithecus)_by_Shantanu_Kuveskar.jpg":[250,333,"#7b938c"],"250px-Grivet_(Chlorocebus_aethiops)_head_2.jpg":[250,250,"#514f47"],"250px-Kuifmakaak_(8721744168).jpg":[250,375,"#848781"],"250px-Langur_de_Delacour.jpg":[250,310,"#4c5245"],"250px-Lion-tailed_Macaque_in_Bristol_Zoo.jpg":[250,319,"#786350"],"250px-Mantled_Guereza.jpg":[250,303,"#747878"],"250px-Nilgiri_langur_(1)_by_N._A._Naseer.jpg":[250,369,"#3f4129"],"250px-Papio_cynocephalus02.jpg":[250,301,"#84885d"],"250px-Piliocolobus_kirkii_7.jpg":[250,375,"#a9a07c"],"250px-Purple-faced_langur_(Semnopithecus_vetulus_vetulus).jpg":[250,375,"#69604e"],"250px-Putty-nosed_monkey_(Cercopithecus_nictitans).JPG":[250,376,"#6c6969"],"250px-RWA_4663.review_1_Rwanda_Mona_Monkey.jpg":[250,384,"#4e5439"],"250px-SAIGON_ZOO_VIETNAM_JAN_2012_(7009538995).jpg":[250,332,"#413728"],"250px-Southern_gelada_(Theropithecus_gelada_obscura)_female_with_baby.jpg":[250,250,"#8e816d"],"250px-Thomas's_langur_Presbytis_thomasi.jpg":[250,358,"#5f6856"],"250px-Tufted_grey_langur_(Semnopithecus_priam).jpg":[250,375,"#72644a"],"250px-Ugandan_red_colobus_(Procolobus_tephrosceles).jpg":[250,375,"#747555"],"250px-White_leaf_monkey2.jpg":[250,284,"#919785"],"250px-YushanNationalPark_jdtien_002.jpg":[250,446,"#787a72"],"330px-Allens_swamp_monkey.jpg":[330,220,"#666748"],"330px-Assamese_macaque_AJTJ_P1020178.JPG":[330,247,"#8a9178"],"330px-Black_Mangabey_002.jpg":[330,274,"#847032"],"330px-Black_Snub-nosed_Monkey_(44489823001).jpg":[330,256,"#1c1e15"],"330px-Cercocebus_atys_219636002.jpg":[330,220,"#5e6442"],"330px-Cercocebus_chrysogaster_0006.jpg":[330,247,"#857339"],"330px-Cercocebus_galeritus_50817270.jpg":[330,313,"#717777"],"330px-Cercopithecus_lhoesti_(L'Hoest's_monkey_-_Colchester_Zoo,_England,_2008).jpg":[330,313,"#8f8c87"],"330px-Cercopithecus_roloway.jpg":[330,247,"#6c6a43"],"330px-Chlorocebus_cynosuros_(Zambia).jpg":[330,248,"#937853"],"330px-Chà_vá_chân_đen.jpg":[330,142,"#74854d"],"330px-Colobus_angolensis.jpg":[330,237,"#6c7267"],"330px-FranceNormandieChamprepusCercopithecusDiana.jpg":[330,275,"#60625a"],"330px-Gray_Langur_-_Young.jpg":[330,248,"#8f9d85"],"330px-Grey-cheeked_Mangabey.JPG":[330,217,"#849666"],"330px-Kipunji_walking_h.jpg":[330,240,"#c0a783"],"330px-L'Hoest's_monkey_(Cercopithecus_lhoesti).jpg":[330,220,"#52684f"],"330px-La_Bourbansais_04.jpg":[330,219,"#7e9a48"],"330px-Lowe's_Mona_Monkey.JPG":[330,248,"#4a432f"],"330px-Macaca_Maura_Satwa_Endemik_Sulawesi_Selatan_01.jpg":[330,220,"#4a6948"],"330px-Macaca_arctoides,_Stump-tailed_macaque_-_Kaeng_Krachan_National_Park_(23274848523).jpg":[330,220,"#534e39"],"330px-Miopithecus_ogouensis_in_Prague_Zoo_01.JPG":[330,221,"#6f6d5a"],"330px-Monkey_at_the_San_Diego_Zoo.jpg":[330,219,"#605e55"],"330px-Multi-male_unit_of_Rwenzori_colobus_in_Nyungwe_.jpg":[330,247,"#7a8b57"],"330px-Olive_baboon_Ngorongoro.jpg":[330,300,"#79744b"],"330px-Papio_hamadryas_pair.jpg":[330,247,"#8f8174"],"330px-Patas_Monkey.jpg":[330,220,"#63704b"],"330px-Patas_Monkey_Jr.jpg":[330,219,"#524e20"],"330px-Portrait_Of_A_Baboon.jpg":[330,252,"#b18e69"],"330px-Proboscis_Monkey_in_Borneo.jpg":[330,236,"#4d4d43"],"330px-Proboscis_monkey_(Nasalis_larvatus)_male_head.jpg":[330,220,"#717241"],"330px-Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg":[330,233,"#3f403a"],"330px-Red_Colobus_7.jpg":[330,248,"#8e8f6c"],"330px-Red_leaf_monkey_(Presbytis_rubicunda).jpg":[330,220,"#646f4a"],"330px-Silvered_Leaf_Monkey_(Trachypithecus_cristatus)_(8125672881).jpg":[330,247,"#887a56"],"330px-Solatus.JPG":[330,220,"#818863"],"330px-Talapoin_II_-_Bioparc_Valencia_(2787418966).jpg":[330,220,"#8e8071"],"330px-Tanzania_-Sanje_Mangabey.jpg":[330,220,"#778e60"],"330px-Tonkin_snub-nosed_monkeys_(Rhinopithecus_avunculus).jpg":[330,220,"#60655c"],"330px-Western_Red_Colobus_Monkey_(32257813804).jpg":[330,235,"#70644a"],"500px-Presbytis_comata_53175454.jpg":[500,667,"#5f6e53"],"Bonnet_macaque_(Macaca_radiata)_Photograph_By_Shantanu_Kuveskar.jpg":[354,600,"#c1b38d"],"Golden_langur.jpg":[500,345,"#6e5a42"],"Presbytis_femoralis_Andie_Ang.jpg":[597,398,"#607540"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda_mammalia_primates_cercopithecidae","<ul class=\"tree\" data-tree-range=\"cercopithecidae\"><li><input type=\"checkbox\" checked id=\"Simiiformes_Cercopithecidae\"><label class=\"tree_label\" for=\"Simiiformes_Cercopithecidae\"></label><div class=\"outer_tree_box\"><div id=\"cercopithecidae_cercopithecidae\" class=\"tree_box\"><span><span>Cercopithecidae</span><a href=\"https://en.wikipedia.org/wiki/Cercopithecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cercopithecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cercopithecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cercopithecidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌsɜːrkoʊpɪˈθɛsɪdiː\" target=\"_blank\">ˌsɜːrkoʊpɪˈθɛsɪdiː</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"primates\">See parent</button><span class=\"badge\">Family</span></span><span class=\"common_names\">(baboons, red colobus, macaques)</span><p class=\"tag\">The Old World monkeys, native to Africa and Asia. Most have tails, but they are not adapted for grasping or holding. All species have well developed thumbs. Most species are omnivorous, all species can store food in cheek pouches, some species have rumps will change colour during mating periods.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chacma_Baboon_%28Papio_ursinus%29_%2816824823063%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chacma_Baboon_%28Papio_ursinus%29_%2816824823063%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"303\" style=\"background-color:#958a6d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_Colobus_7.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red_Colobus_7.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8e8f6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bonnet_macaque_%28Macaca_radiata%29_Photograph_By_Shantanu_Kuveskar.jpg\" target=\"_blank\"><img src=\"thumbnails/Bonnet_macaque_%28Macaca_radiata%29_Photograph_By_Shantanu_Kuveskar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"354\" height=\"600\" style=\"background-color:#c1b38d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:FranceNormandieChamprepusCercopithecusDiana.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-FranceNormandieChamprepusCercopithecusDiana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"275\" style=\"background-color:#60625a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Colobus_angolensis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Colobus_angolensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#6c7267\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#3f403a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vervet_monkey_%28Chlorocebus_pygerythrus_rufoviridis%29_juvenile%2C_Semliki_Wildlife_Reserve.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vervet_monkey_%28Chlorocebus_pygerythrus_rufoviridis%29_juvenile%2C_Semliki_Wildlife_Reserve.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#879485\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Southern_gelada_%28Theropithecus_gelada_obscura%29_female_with_baby.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Southern_gelada_%28Theropithecus_gelada_obscura%29_female_with_baby.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#8e816d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cercocebus_torquatus%2C_Colchester_Zoo%2C_Essex%2C_England_-_20080211.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cercocebus_torquatus%2C_Colchester_Zoo%2C_Essex%2C_England_-_20080211.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8b7052\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mandrill_Albert_September_2015_Zoo_Berlin_%282%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Mandrill_Albert_September_2015_Zoo_Berlin_%282%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"326\" style=\"background-color:#747665\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Drill_Monkey.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Drill_Monkey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#888c79\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Proboscis_monkey_%28Nasalis_larvatus%29_male_head.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Proboscis_monkey_%28Nasalis_larvatus%29_male_head.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#717241\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Cercopithecidae_Colobinae\"><label class=\"tree_label\" for=\"Cercopithecidae_Colobinae\"></label><div class=\"outer_tree_box\"><div id=\"cercopithecidae_colobinae\" class=\"tree_box\"><span><span>Colobinae</span><a href=\"https://en.wikipedia.org/wiki/Colobinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Colobinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Colobinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Colobinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><span class=\"common_names\">(black-and-white colobus, large-nosed proboscis monkeys, gray langurs)</span><p class=\"tag\">Medium-sized primates with long tails. Most species are arboreal. They are folivorous, though their diet may be supplemented with flowers, fruits and the occasional insect. They have multichambered, complex stomachs, making them the only primates with foregut fermentation.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Colobinae_Colobini\"><label class=\"tree_label\" for=\"Colobinae_Colobini\"></label><div class=\"outer_tree_box\"><div id=\"cercopithecidae_colobini\" class=\"tree_box\"><span><span>Colobini</span><a href=\"https://en.wikipedia.org/wiki/Colobini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Colobini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Colobini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Colobini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Tribe</span></span><span class=\"common_names\">(black-and-white colobus monkeys, red colobus monkeys, olive colobus monkeys)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_colobus\" class=\"tree_box\"><span><span>Colobus</span><a href=\"https://en.wikipedia.org/wiki/Colobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Colobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Colobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Colobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(black-and-white colobus monkeys)</span><p class=\"tag\">Generally found in high-density forests where they forage on leaves, flowers and fruit. Social groups of colobus are diverse, varying from group to group. Resident-egalitarian and allomothering relationships have been observed among the female population.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Colobus_angolensis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Colobus_angolensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#6c7267\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mantled_Guereza.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Mantled_Guereza.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"303\" style=\"background-color:#747878\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Multi-male_unit_of_Rwenzori_colobus_in_Nyungwe_.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Multi-male_unit_of_Rwenzori_colobus_in_Nyungwe_.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7a8b57\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_piliocolobus\" class=\"tree_box\"><span><span>Piliocolobus</span><a href=\"https://en.wikipedia.org/wiki/Piliocolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Piliocolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Piliocolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Piliocolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(red colobus monkeys)</span><p class=\"tag\">Primarily arboreal and most are restricted to humid forests. Groups often establish a dominance hierarchy determined by aggressive behavior. Food, grooming, and sexual partners are distributed amongst higher-ranking individuals initially, followed by lower-ranking individuals. Diet consists mainly of young leaves, flowers, and unripe fruit. They are known to eat charcoal or clay to help combat the cyanide some leaves contain.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Red_Colobus_7.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red_Colobus_7.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8e8f6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Piliocolobus_kirkii_7.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Piliocolobus_kirkii_7.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#a9a07c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Western_Red_Colobus_Monkey_%2832257813804%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Western_Red_Colobus_Monkey_%2832257813804%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"235\" style=\"background-color:#70644a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ugandan_red_colobus_%28Procolobus_tephrosceles%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ugandan_red_colobus_%28Procolobus_tephrosceles%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#747555\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_procolobus\" class=\"tree_box\"><span><span>Procolobus</span><a href=\"https://en.wikipedia.org/wiki/Procolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Procolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Procolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Procolobus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(olive colobus)</span><p class=\"tag\">Rarely observed in its natural habitat because of its cryptic coloration and secretive nature.</p><div></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Colobinae_Presbytini\"><label class=\"tree_label\" for=\"Colobinae_Presbytini\"></label><div class=\"outer_tree_box\"><div id=\"cercopithecidae_presbytini\" class=\"tree_box\"><span><span>Presbytini</span><a href=\"https://en.wikipedia.org/wiki/Presbytini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Presbytini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Presbytini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Presbytini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Tribe</span></span><span class=\"common_names\">(black-and-white colobus monkeys, red colobus monkeys, olive colobus monkeys)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_trachypithecus\" class=\"tree_box\"><span><span>Trachypithecus</span><a href=\"https://en.wikipedia.org/wiki/Trachypithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Trachypithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Trachypithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Trachypithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(lutungs, leaf monkeys)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Dusky_Langurs_at_Penang_National_Park.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dusky_Langurs_at_Penang_National_Park.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"365\" style=\"background-color:#69604c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SAIGON_ZOO_VIETNAM_JAN_2012_%287009538995%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-SAIGON_ZOO_VIETNAM_JAN_2012_%287009538995%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"332\" style=\"background-color:#413728\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Langur_de_Delacour.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Langur_de_Delacour.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"310\" style=\"background-color:#4c5245\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ebony_Langur_Javan_Lutung_Trachypithecus_auratus_at_Bronx_Zoo_3.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ebony_Langur_Javan_Lutung_Trachypithecus_auratus_at_Bronx_Zoo_3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#78726e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Golden_langur.jpg\" target=\"_blank\"><img src=\"thumbnails/Golden_langur.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"345\" style=\"background-color:#6e5a42\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Silvered_Leaf_Monkey_%28Trachypithecus_cristatus%29_%288125672881%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Silvered_Leaf_Monkey_%28Trachypithecus_cristatus%29_%288125672881%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#887a56\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_presbytis\" class=\"tree_box\"><span><span>Presbytis</span><a href=\"https://en.wikipedia.org/wiki/Presbytis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Presbytis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Presbytis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Presbytis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(surilis)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Presbytis_comata_53175454.jpg\" target=\"_blank\"><img src=\"thumbnails/500px-Presbytis_comata_53175454.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"667\" style=\"background-color:#5f6e53\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_leaf_monkey_%28Presbytis_rubicunda%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red_leaf_monkey_%28Presbytis_rubicunda%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#646f4a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:White_leaf_monkey2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-White_leaf_monkey2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"284\" style=\"background-color:#919785\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Presbytis_femoralis_Andie_Ang.jpg\" target=\"_blank\"><img src=\"thumbnails/Presbytis_femoralis_Andie_Ang.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"597\" height=\"398\" style=\"background-color:#607540\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thomas%27s_langur_Presbytis_thomasi.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Thomas%27s_langur_Presbytis_thomasi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"358\" style=\"background-color:#5f6856\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_semnopithecus\" class=\"tree_box\"><span><span>Semnopithecus</span><a href=\"https://en.wikipedia.org/wiki/Semnopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Semnopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Semnopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Semnopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(gray langurs)</span><p class=\"tag\">Terrestrial, inhabiting forest, open lightly wooded habitats, and urban areas. They mostly walk quadrupedally and spend half of their time on the ground and the other half in trees.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Gray_langur_%28Semnopithecus%29_by_Shantanu_Kuveskar.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gray_langur_%28Semnopithecus%29_by_Shantanu_Kuveskar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7b938c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gray_Langur_-_Young.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gray_Langur_-_Young.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8f9d85\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Purple-faced_langur_%28Semnopithecus_vetulus_vetulus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Purple-faced_langur_%28Semnopithecus_vetulus_vetulus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#69604e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tufted_grey_langur_%28Semnopithecus_priam%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tufted_grey_langur_%28Semnopithecus_priam%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#72644a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nilgiri_langur_%281%29_by_N._A._Naseer.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nilgiri_langur_%281%29_by_N._A._Naseer.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"369\" style=\"background-color:#3f4129\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_pygathrix\" class=\"tree_box\"><span><span>Pygathrix</span><a href=\"https://en.wikipedia.org/wiki/Pygathrix\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pygathrix\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pygathrix\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pygathrix\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(doucs)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Red-shanked_Douc_at_the_Philadelphia_Zoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#3f403a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ch%C3%A0_v%C3%A1_ch%C3%A2n_%C4%91en.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ch%C3%A0_v%C3%A1_ch%C3%A2n_%C4%91en.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"142\" style=\"background-color:#74854d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_rhinopithecus\" class=\"tree_box\"><span><span>Rhinopithecus</span><a href=\"https://en.wikipedia.org/wiki/Rhinopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rhinopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rhinopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Rhinopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(snub-nosed monkeys)</span><p class=\"tag\">Named for the short stump of a nose on their round faces, with nostrils arranged forward. They have relatively multicolored and long fur, particularly at the shoulders and backs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Golden_Snub-nosed_Monkeys%2C_Qinling_Mountains_-_China.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Golden_Snub-nosed_Monkeys%2C_Qinling_Mountains_-_China.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"364\" style=\"background-color:#5f544c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black_Snub-nosed_Monkey_%2844489823001%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Black_Snub-nosed_Monkey_%2844489823001%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#1c1e15\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tonkin_snub-nosed_monkeys_%28Rhinopithecus_avunculus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tonkin_snub-nosed_monkeys_%28Rhinopithecus_avunculus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#60655c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_nasalis\" class=\"tree_box\"><span><span>Nasalis</span><a href=\"https://en.wikipedia.org/wiki/Nasalis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Nasalis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Nasalis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Nasalis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(proboscis monkeys)</span><p class=\"tag\">Has an unusually large nose (or proboscis), a reddish-brown skin color and a long tail. Sexual dimorphism is pronounced.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Proboscis_Monkey_in_Borneo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Proboscis_Monkey_in_Borneo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#4d4d43\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Proboscis_monkey_%28Nasalis_larvatus%29_male_head.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Proboscis_monkey_%28Nasalis_larvatus%29_male_head.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#717241\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_simias\" class=\"tree_box\"><span><span>Simias</span><a href=\"https://en.wikipedia.org/wiki/Simias\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Simias\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Simias\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Simias\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(pig-tailed langur)</span><p class=\"tag\">A critically endangered endemic to several small islands off the coast of Sumatra in Indonesia. Little is known of their natural history.</p><div></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Cercopithecidae_Cercopithecinae\"><label class=\"tree_label\" for=\"Cercopithecidae_Cercopithecinae\"></label><div class=\"outer_tree_box\"><div id=\"cercopithecidae_cercopithecinae\" class=\"tree_box\"><span><span>Cercopithecinae</span><a href=\"https://en.wikipedia.org/wiki/Cercopithecinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cercopithecinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cercopithecinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cercopithecinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><span class=\"common_names\">(baboons, macaques, vervet monkeys)</span><p class=\"tag\">Diurnal monkeys that live together in social groups. Most species are omnivorous, with diets ranging from fruits, leaves, seeds, buds, and mushrooms to insects, spiders, and smaller vertebrates. All species possess cheek pouches in which they can store food.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Cercopithecinae_Cercopithecini\"><label class=\"tree_label\" for=\"Cercopithecinae_Cercopithecini\"></label><div class=\"outer_tree_box\"><div id=\"cercopithecidae_cercopithecini\" class=\"tree_box\"><span><span>Cercopithecini</span><a href=\"https://en.wikipedia.org/wiki/Cercopithecini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cercopithecini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cercopithecini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cercopithecini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Tribe</span></span><span class=\"common_names\">(vervet monkeys, talapoins, Allen&#x27;s swamp monkeys, guenons)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_allenopithecus\" class=\"tree_box\"><span><span>Allenopithecus</span><a href=\"https://en.wikipedia.org/wiki/Allenopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Allenopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Allenopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Allenopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(Allen&#x27;s swamp monkeys)</span><p class=\"tag\">A diurnal monkey that inhabits swampy, water-rich areas and can swim well with its slight webbing on its fingers and toes. Its diet consists of fruits and leaves, as well as beetles and worms.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Allens_swamp_monkey.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Allens_swamp_monkey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#666748\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_cercopithecus\" class=\"tree_box\"><span><span>Cercopithecus</span><a href=\"https://en.wikipedia.org/wiki/Cercopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cercopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cercopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cercopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌsɜːrkəˈpɪθəkəs\" target=\"_blank\">ˌsɜːrkəˈpɪθəkəs</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">([most] guenons)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:FranceNormandieChamprepusCercopithecusDiana.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-FranceNormandieChamprepusCercopithecusDiana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"275\" style=\"background-color:#60625a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blue_monkey_%28Cercopithecus_mitis_stuhlmanni%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Blue_monkey_%28Cercopithecus_mitis_stuhlmanni%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#6a745f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:RWA_4663.review_1_Rwanda_Mona_Monkey.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-RWA_4663.review_1_Rwanda_Mona_Monkey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"384\" style=\"background-color:#4e5439\"></a><a href=\"https://commons.wikimedia.org/wiki/File:La_Bourbansais_04.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-La_Bourbansais_04.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#7e9a48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Putty-nosed_monkey_%28Cercopithecus_nictitans%29.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Putty-nosed_monkey_%28Cercopithecus_nictitans%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#6c6969\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Monkey_at_the_San_Diego_Zoo.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Monkey_at_the_San_Diego_Zoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#605e55\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lowe%27s_Mona_Monkey.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Lowe%27s_Mona_Monkey.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4a432f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cercopithecus_roloway.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cercopithecus_roloway.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6c6a43\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_miopithecus\" class=\"tree_box\"><span><span>Miopithecus</span><a href=\"https://en.wikipedia.org/wiki/Miopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Miopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Miopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Miopithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(talapoins)</span><p class=\"tag\">Have grey green fur on top and whitish on their underside. Diurnal and arboreal, preferring rain forest or mangroves near water. They are omnivores with a diet mainly of fruits, seeds, aquatic plants, insects, shellfish, bird eggs and small vertebrates. They swim well.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Talapoin_II_-_Bioparc_Valencia_%282787418966%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Talapoin_II_-_Bioparc_Valencia_%282787418966%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#8e8071\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Miopithecus_ogouensis_in_Prague_Zoo_01.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Miopithecus_ogouensis_in_Prague_Zoo_01.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#6f6d5a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_chlorocebus\" class=\"tree_box\"><span><span>Chlorocebus</span><a href=\"https://en.wikipedia.org/wiki/Chlorocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chlorocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chlorocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Chlorocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(vervet monkeys, green monkeys)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Gambia06Bijilo0015_%285421078756%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gambia06Bijilo0015_%285421078756%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#796e61\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grivet_%28Chlorocebus_aethiops%29_head_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Grivet_%28Chlorocebus_aethiops%29_head_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#514f47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chlorocebus_cynosuros_%28Zambia%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chlorocebus_cynosuros_%28Zambia%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#937853\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black_faced_vervet_monkey.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Black_faced_vervet_monkey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#686660\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_erythrocebus\" class=\"tree_box\"><span><span>Erythrocebus</span><a href=\"https://en.wikipedia.org/wiki/Erythrocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Erythrocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Erythrocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Erythrocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(patas monkeys)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Patas_Monkey_Jr.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Patas_Monkey_Jr.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#524e20\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Patas_Monkey.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Patas_Monkey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#63704b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_allochrocebus\" class=\"tree_box\"><span><span>Allochrocebus</span><a href=\"https://en.wikipedia.org/wiki/Allochrocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Allochrocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Allochrocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Allochrocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(L&#x27;Hoest&#x27;s monkeys, Preuss&#x27;s monkeys, sun-tailed monkeys)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:L%27Hoest%27s_monkey_%28Cercopithecus_lhoesti%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-L%27Hoest%27s_monkey_%28Cercopithecus_lhoesti%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#52684f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Solatus.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Solatus.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#818863\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cercopithecus_lhoesti_%28L%27Hoest%27s_monkey_-_Colchester_Zoo%2C_England%2C_2008%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cercopithecus_lhoesti_%28L%27Hoest%27s_monkey_-_Colchester_Zoo%2C_England%2C_2008%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"313\" style=\"background-color:#8f8c87\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Cercopithecinae_Papionini\"><label class=\"tree_label\" for=\"Cercopithecinae_Papionini\"></label><div class=\"outer_tree_box\"><div id=\"cercopithecidae_papionini\" class=\"tree_box\"><span><span>Papionini</span><a href=\"https://en.wikipedia.org/wiki/Papionini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Papionini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Papionini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Papionini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Tribe</span></span><span class=\"common_names\">(macaques, baboons, geladas, mangabeys, kipunji, drills, mandrills)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_macaca\" class=\"tree_box\"><span><span>Macaca</span><a href=\"https://en.wikipedia.org/wiki/Macaca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Macaca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Macaca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Macaca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(macaques)</span><p class=\"tag\">Principally frugivorous (preferring fruit), although their diet also includes seeds, leaves, flowers, and tree bark. Some species will supplement their diets with small amounts of meat from shellfish, insects, and small mammals. Social groups are arranged around dominant matriarchs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Assamese_macaque_AJTJ_P1020178.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Assamese_macaque_AJTJ_P1020178.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8a9178\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bonnet_macaque_%28Macaca_radiata%29_Photograph_By_Shantanu_Kuveskar.jpg\" target=\"_blank\"><img src=\"thumbnails/Bonnet_macaque_%28Macaca_radiata%29_Photograph_By_Shantanu_Kuveskar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"354\" height=\"600\" style=\"background-color:#c1b38d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kuifmakaak_%288721744168%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Kuifmakaak_%288721744168%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#848781\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crab-eating_macaque_%28Macaca_fascicularis%29_Phang_Nga.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Crab-eating_macaque_%28Macaca_fascicularis%29_Phang_Nga.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#8e8761\"></a><a href=\"https://commons.wikimedia.org/wiki/File:YushanNationalPark_jdtien_002.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-YushanNationalPark_jdtien_002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"446\" style=\"background-color:#787a72\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lion-tailed_Macaque_in_Bristol_Zoo.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lion-tailed_Macaque_in_Bristol_Zoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"319\" style=\"background-color:#786350\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Macaca_Maura_Satwa_Endemik_Sulawesi_Selatan_01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Macaca_Maura_Satwa_Endemik_Sulawesi_Selatan_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#4a6948\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Macaca_arctoides%2C_Stump-tailed_macaque_-_Kaeng_Krachan_National_Park_%2823274848523%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Macaca_arctoides%2C_Stump-tailed_macaque_-_Kaeng_Krachan_National_Park_%2823274848523%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#534e39\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_cercocebus\" class=\"tree_box\"><span><span>Cercocebus</span><a href=\"https://en.wikipedia.org/wiki/Cercocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cercocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cercocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cercocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(white-eyelid mangabeys)</span><p class=\"tag\">Characterized by their bare upper eyelids, which are lighter than their facial skin colouring, and the uniformly coloured hairs of the fur.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Tanzania_-Sanje_Mangabey.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tanzania_-Sanje_Mangabey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#778e60\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cercocebus_chrysogaster_0006.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cercocebus_chrysogaster_0006.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#857339\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cercocebus_atys_219636002.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cercocebus_atys_219636002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5e6442\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cercocebus_galeritus_50817270.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cercocebus_galeritus_50817270.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"313\" style=\"background-color:#717777\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cercocebus_atys_lunulatus_Barcelona_zoo.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cercocebus_atys_lunulatus_Barcelona_zoo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#625b49\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_lophocebus\" class=\"tree_box\"><span><span>Lophocebus</span><a href=\"https://en.wikipedia.org/wiki/Lophocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lophocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lophocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lophocebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(crested mangabeys)</span><p class=\"tag\">Tend to have dark skin, eyelids that match their facial skin, and crests of hair on their heads.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Grey-cheeked_Mangabey.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Grey-cheeked_Mangabey.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#849666\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black_Mangabey_002.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Black_Mangabey_002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"274\" style=\"background-color:#847032\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_rungwecebus\" class=\"tree_box\"><span><span>Rungwecebus</span><a href=\"https://en.wikipedia.org/wiki/Rungwecebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rungwecebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rungwecebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Rungwecebus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(highland mangabeys)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Kipunji_walking_h.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Kipunji_walking_h.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"240\" style=\"background-color:#c0a783\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_papio\" class=\"tree_box\"><span><span>Papio</span><a href=\"https://en.wikipedia.org/wiki/Papio\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Papio\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Papio\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Papio\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(baboons)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Chacma_Baboon_%28Papio_ursinus%29_%2816824823063%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chacma_Baboon_%28Papio_ursinus%29_%2816824823063%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"303\" style=\"background-color:#958a6d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Papio_hamadryas_pair.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Papio_hamadryas_pair.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8f8174\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Olive_baboon_Ngorongoro.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Olive_baboon_Ngorongoro.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"300\" style=\"background-color:#79744b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Papio_cynocephalus02.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Papio_cynocephalus02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"301\" style=\"background-color:#84885d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Portrait_Of_A_Baboon.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Portrait_Of_A_Baboon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"252\" style=\"background-color:#b18e69\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cercopithecidae_theropithecus\" class=\"tree_box\"><span><span>Theropithecus</span><a href=\"https://en.wikipedia.org/wiki/Theropithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Theropithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Theropithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Theropithecus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(gelada)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Gelada_%28Theropithecus_gelada_gelada%29_male_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gelada_%28Theropithecus_gelada_gelada%29_male_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#756c49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Southern_gelada_%28Theropithecus_gelada_obscura%29_female_with_baby.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Southern_gelada_%28Theropithecus_gelada_obscura%29_female_with_baby.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#8e816d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gelada_Baboon_Semien_Mountains_Ethiopia.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gelada_Baboon_Semien_Mountains_Ethiopia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#7f7e69\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_animalia_chordata_tetrapoda_mammalia_primates_platyrrhini",[{"name":"Pitheciidae","parent":"Platyrrhini","rank":"Family","ipa":"pɪθɪˈsaɪ.ɪdiː","etymology":"","common":["titis","sakis","uakaris"],"tag":"","imgs":[]},{"name":"Callicebinae","parent":"Pitheciidae","rank":"Subfamily","ipa":"","etymology":"","common":["titis"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/05/Callicebus_nigrifrons_Minas_Gerais.jpg/250px-Callicebus_nigrifrons_Minas_Gerais.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Brown_Titi_Monkey_%28Callicebus_brunneus%29_%283419492981%29.jpg/250px-Brown_Titi_Monkey_%28Callicebus_brunneus%29_%283419492981%29.jpg"]},{"name":"Pitheciinae","parent":"Pitheciidae","rank":"Subfamily","ipa":"","etymology":"","common":["sakis","uakaris"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e6/WhiteFacedSaki.jpg/250px-WhiteFacedSaki.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Male_uakari.jpg/330px-Male_uakari.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6c/Cacajao_calvus_ucayalii.jpg/250px-Cacajao_calvus_ucayalii.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Chiropotes_utahickae.jpg/330px-Chiropotes_utahickae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0a/Chiropotes_albinasus.jpg/330px-Chiropotes_albinasus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/79/Captive_Pithecia_albicans.jpg/330px-Captive_Pithecia_albicans.jpg"]},{"name":"Atelidae","parent":"Platyrrhini","rank":"Family","ipa":"","etymology":"","common":["howler monkeys","spider monkeys","woolly spider monkeys","woolly monkeys"],"tag":"","imgs":[]},{"name":"Alouattinae","parent":"Atelidae","rank":"Subfamily","ipa":"","etymology":"","common":["howler monkeys"],"tag":"","imgs":[]},{"name":"Alouatta","parent":"Alouattinae","rank":"Genus","ipa":"","etymology":"","common":["howler monkeys"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/c/c9/Howler_Monkey_at_Parque_Ambue_Ari%2C_Bolivia.png","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bd/Black_Howler_Monkey_%28adult_male%29_4.jpg/330px-Black_Howler_Monkey_%28adult_male%29_4.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/Brown_Howler_Monkey_6.jpg/330px-Brown_Howler_Monkey_6.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/Alouatta_seniculus_Sorocaba.JPG/330px-Alouatta_seniculus_Sorocaba.JPG"],"species":12},{"name":"Atelinae","parent":"Atelidae","rank":"Subfamily","ipa":"","etymology":"","common":["spider monkeys","woolly spider monkeys","woolly monkeys"],"tag":"","imgs":[]},{"name":"Ateles","parent":"Atelinae","rank":"Genus","ipa":"","etymology":"","common":["spider monkeys"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/92/Ateles-fusciceps_54724770b.jpg/330px-Ateles-fusciceps_54724770b.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dc/Ateles_marginatus3.jpg/330px-Ateles_marginatus3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Ateles_belzebuth_belzebuth.jpg/330px-Ateles_belzebuth_belzebuth.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Geoffroy%27s_spider_monkey_%28Ateles_geoffroyi_yucatanensis%29_male_Peten.jpg/250px-Geoffroy%27s_spider_monkey_%28Ateles_geoffroyi_yucatanensis%29_male_Peten.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dc/BrownSpiderMonkey_%28edit2%29.jpg/250px-BrownSpiderMonkey_%28edit2%29.jpg"],"species":7},{"name":"Brachyteles","parent":"Atelinae","rank":"Genus","ipa":"","etymology":"","common":["muriquis","woolly spider monkeys"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f9/Brachyteles_hypoxanthus.jpg/250px-Brachyteles_hypoxanthus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/Brachyteles_arachnoides_1.jpg/330px-Brachyteles_arachnoides_1.jpg"],"species":2},{"name":"Lagothrix","parent":"Atelinae","rank":"Genus","ipa":"","etymology":"","common":["woolly monkeys"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Lagothrix_lagotricha_%28male%29.jpg/330px-Lagothrix_lagotricha_%28male%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/89/Cola_amarilla.jpg/250px-Cola_amarilla.jpg"],"species":2},{"name":"Cebidae","parent":"Platyrrhini","rank":"Family","ipa":"","etymology":"","common":["capuchins","squirrel monkeys"],"tag":"","imgs":[]},{"name":"Cebinae","parent":"Cebidae","rank":"Subfamily","ipa":"","etymology":"","common":["capuchins"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Cebus_albifrons_edit.jpg/250px-Cebus_albifrons_edit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Capuchin_Monkey_enjoys_a_massage.jpg/330px-Capuchin_Monkey_enjoys_a_massage.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Capuchin_monkeys_sharing.jpg/250px-Capuchin_monkeys_sharing.jpg"]},{"name":"Saimirinae","parent":"Cebidae","rank":"Subfamily","ipa":"","etymology":"","common":["squirrel monkeys"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Saimiri_sciureus-1_Luc_Viatour.jpg/330px-Saimiri_sciureus-1_Luc_Viatour.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Wild-57.jpg/330px-Wild-57.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Miss_Baker%2C_the_squirrel_monkey.jpg/330px-Miss_Baker%2C_the_squirrel_monkey.jpg"]},{"name":"Callitrichidae","parent":"Platyrrhini","rank":"Family","ipa":"","etymology":"","common":["marmosets","tamarins"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5b/Springtamarin_%28Callimico_goeldii%29.jpg/250px-Springtamarin_%28Callimico_goeldii%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Black-tufted_marmoset_%28sagui-de-tufos-pretos%29.jpg/330px-Black-tufted_marmoset_%28sagui-de-tufos-pretos%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Callithrix_flaviceps_2.jpg/250px-Callithrix_flaviceps_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ea/Buffy-tufted_marmoset_%28Callithrix_aurita%29.jpg/330px-Buffy-tufted_marmoset_%28Callithrix_aurita%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/23/Wei%C3%9Fb%C3%BCschelaffe_%28Callithrix_jacchus%29.jpg/330px-Wei%C3%9Fb%C3%BCschelaffe_%28Callithrix_jacchus%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f0/Callithrix_kuhlii_at_P%C3%A3o_de_A%C3%A7%C3%BAcar%2C_Brazil.jpg/330px-Callithrix_kuhlii_at_P%C3%A3o_de_A%C3%A7%C3%BAcar%2C_Brazil.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1a/Pygmy_Marmoset_%285336773146%29.jpg/330px-Pygmy_Marmoset_%285336773146%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/84/Saguinus_fuscicollis_246375885.jpg/330px-Saguinus_fuscicollis_246375885.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fe/Black_Lion_Tamarin_4.jpg/330px-Black_Lion_Tamarin_4.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8f/Leontopithecus_rosalia_-_Copenhagen_Zoo_-_DSC09082.JPG/250px-Leontopithecus_rosalia_-_Copenhagen_Zoo_-_DSC09082.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Mico_chrysoleucus_Kenny_Ross_1.jpg/250px-Mico_chrysoleucus_Kenny_Ross_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Mico_humeralifer.jpg/330px-Mico_humeralifer.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/Callithrix_argentata_at_the_Bronx_Zoo_03.jpg/250px-Callithrix_argentata_at_the_Bronx_Zoo_03.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/84/Saguinus_fuscicollis_246375885.jpg/330px-Saguinus_fuscicollis_246375885.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Saguinus_niger.JPG/330px-Saguinus_niger.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Tamarin_portrait.JPG/330px-Tamarin_portrait.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/d/df/Geoffroy%27s_tamarin_%28Saguinus_geoffroyi%29_2.jpg/250px-Geoffroy%27s_tamarin_%28Saguinus_geoffroyi%29_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/91/Saguinus_midas_flk24863753.jpg/330px-Saguinus_midas_flk24863753.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Saguinus_tripartitus_-_Golden-mantled_Tamarin.jpg/330px-Saguinus_tripartitus_-_Golden-mantled_Tamarin.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/Saguinus_mystax_pileatus_205524045.jpg/330px-Saguinus_mystax_pileatus_205524045.jpg"]},{"name":"Aotidae","parent":"Platyrrhini","rank":"Family","ipa":"eɪˈɒtɪdiː","etymology":"'earless'","common":["night monkeys","owl monkeys"],"tag":"The only truly nocturnal monkeys. Native to Central and South America. They have large eyes which improve their vision at night, while their ears are mostly hidden","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d7/Panamanian_night_monkey.jpg/250px-Panamanian_night_monkey.jpg","https://upload.wikimedia.org/wikipedia/commons/5/54/Stavenn_Aotus_trivirgatus_00.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d9/Aotus_azarae_infulatus.jpg/330px-Aotus_azarae_infulatus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Aotus_nigriceps.jpg/330px-Aotus_nigriceps.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Aotus_nancymai.jpg/330px-Aotus_nancymai.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/eb/Amiconax_FMC.jpg/330px-Amiconax_FMC.jpg"]}],{},{"250px-Brachyteles_hypoxanthus.jpg":[250,350,"#70694e"],"250px-BrownSpiderMonkey_(edit2).jpg":[250,280,"#827e65"],"250px-Brown_Titi_Monkey_(Callicebus_brunneus)_(3419492981).jpg":[250,375,"#4b5339"],"250px-Cacajao_calvus_ucayalii.jpg":[250,373,"#805540"],"250px-Callicebus_nigrifrons_Minas_Gerais.jpg":[250,346,"#788350"],"250px-Callithrix_argentata_at_the_Bronx_Zoo_03.jpg":[250,375,"#574d39"],"250px-Callithrix_flaviceps_2.jpg":[250,333,"#4f4e45"],"250px-Capuchin_monkeys_sharing.jpg":[250,303,"#6d695b"],"250px-Cebus_albifrons_edit.jpg":[250,333,"#565837"],"250px-Cola_amarilla.jpg":[250,242,"#837f40"],"250px-Geoffroy's_spider_monkey_(Ateles_geoffroyi_yucatanensis)_male_Peten.jpg":[250,310,"#73787e"],"250px-Geoffroy's_tamarin_(Saguinus_geoffroyi)_2.jpg":[250,250,"#747655"],"250px-Leontopithecus_rosalia_-_Copenhagen_Zoo_-_DSC09082.JPG":[250,373,"#8e8680"],"250px-Mico_chrysoleucus_Kenny_Ross_1.jpg":[250,375,"#717142"],"250px-Panamanian_night_monkey.jpg":[250,333,"#6e512c"],"250px-Springtamarin_(Callimico_goeldii).jpg":[250,349,"#4e5042"],"250px-WhiteFacedSaki.jpg":[250,362,"#686866"],"330px-Alouatta_seniculus_Sorocaba.JPG":[330,247,"#676750"],"330px-Amiconax_FMC.jpg":[330,308,"#7d6b4e"],"330px-Aotus_azarae_infulatus.jpg":[330,220,"#685437"],"330px-Aotus_nancymai.jpg":[330,219,"#5c4a3b"],"330px-Aotus_nigriceps.jpg":[330,247,"#575955"],"330px-Ateles-fusciceps_54724770b.jpg":[330,220,"#908e83"],"330px-Ateles_belzebuth_belzebuth.jpg":[330,220,"#959085"],"330px-Ateles_marginatus3.jpg":[330,247,"#6a776d"],"330px-Black-tufted_marmoset_(sagui-de-tufos-pretos).jpg":[330,247,"#6e644f"],"330px-Black_Howler_Monkey_(adult_male)_4.jpg":[330,220,"#75806f"],"330px-Black_Lion_Tamarin_4.jpg":[330,233,"#4e5a39"],"330px-Brachyteles_arachnoides_1.jpg":[330,248,"#4d5938"],"330px-Brown_Howler_Monkey_6.jpg":[330,247,"#5c6545"],"330px-Buffy-tufted_marmoset_(Callithrix_aurita).jpg":[330,220,"#525f26"],"330px-Callithrix_kuhlii_at_Pão_de_Açúcar,_Brazil.jpg":[330,220,"#6c6d6c"],"330px-Captive_Pithecia_albicans.jpg":[330,220,"#929585"],"330px-Capuchin_Monkey_enjoys_a_massage.jpg":[330,213,"#6e705d"],"330px-Chiropotes_albinasus.jpg":[330,244,"#62663e"],"330px-Chiropotes_utahickae.jpg":[330,311,"#857c7c"],"330px-Lagothrix_lagotricha_(male).jpg":[330,220,"#7c8a5d"],"330px-Male_uakari.jpg":[330,230,"#676a44"],"330px-Mico_humeralifer.jpg":[330,220,"#71675d"],"330px-Miss_Baker,_the_squirrel_monkey.jpg":[330,250,"#adadad"],"330px-Pygmy_Marmoset_(5336773146).jpg":[330,220,"#73855b"],"330px-Saguinus_fuscicollis_246375885.jpg":[330,220,"#818f34"],"330px-Saguinus_midas_flk24863753.jpg":[330,247,"#969f7f"],"330px-Saguinus_mystax_pileatus_205524045.jpg":[330,221,"#7a806e"],"330px-Saguinus_niger.JPG":[330,247,"#67706f"],"330px-Saguinus_tripartitus_-_Golden-mantled_Tamarin.jpg":[330,264,"#53654a"],"330px-Saimiri_sciureus-1_Luc_Viatour.jpg":[330,245,"#7c8152"],"330px-Tamarin_portrait.JPG":[330,220,"#4b473e"],"330px-Weißbüschelaffe_(Callithrix_jacchus).jpg":[330,256,"#544f37"],"330px-Wild-57.jpg":[330,219,"#4b642f"],"Howler_Monkey_at_Parque_Ambue_Ari,_Bolivia.png":[200,298,"#55533d"],"Stavenn_Aotus_trivirgatus_00.jpg":[360,480,"#6c6958"]})
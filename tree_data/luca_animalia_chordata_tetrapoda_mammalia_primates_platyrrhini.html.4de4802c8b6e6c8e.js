@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_chordata_tetrapoda_mammalia_primates_platyrrhini","<ul class=\"tree\" data-tree-range=\"platyrrhini\"><li><input type=\"checkbox\" checked id=\"Simiiformes_Platyrrhini\"><label class=\"tree_label\" for=\"Simiiformes_Platyrrhini\"></label><div class=\"outer_tree_box\"><div id=\"platyrrhini_platyrrhini\" class=\"tree_box\"><span><span>Platyrrhini</span><a href=\"https://en.wikipedia.org/wiki/Platyrrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Platyrrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Platyrrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Platyrrhini\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=plætɪˈraɪnaɪ\" target=\"_blank\">plætɪˈraɪnaɪ</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"primates\">See parent</button><span class=\"badge\">Parvorder</span></span><span class=\"common_names\">(marmosets, tamarins, capuchins, squirrel monkeys, night monkeys, titis, sakis, uakaris, howler, spider monkeys, woolly monkeys, woolly spider monkeys)</span><p class=\"tag\">The New World monkeys, found in the Americas. The noses of New World monkeys are flatter than the narrow noses of Old World monkeys, and have side-facing nostrils.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Panamanian_night_monkey.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Panamanian_night_monkey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6e512c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Marmoset_copy.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Marmoset_copy.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#5d5037\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tamarin_portrait_2_edit3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tamarin_portrait_2_edit3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#46423a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Capuchin_Costa_Rica.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Capuchin_Costa_Rica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"245\" style=\"background-color:#71804d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saimiri_sciureus-1_Luc_Viatour.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saimiri_sciureus-1_Luc_Viatour.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#7c8152\"></a><a href=\"https://commons.wikimedia.org/wiki/File:WhiteFacedSaki.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-WhiteFacedSaki.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"362\" style=\"background-color:#686866\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Uakari_male.jpg\" target=\"_blank\"><img src=\"thumbnails/Uakari_male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#778841\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ateles_fusciceps_Colombia.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Ateles_fusciceps_Colombia.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"287\" style=\"background-color:#7f8170\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brachyteles_hypoxanthus2.jpg\" target=\"_blank\"><img src=\"thumbnails/Brachyteles_hypoxanthus2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"600\" style=\"background-color:#958a47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lagothrix_lagotricha_%28male%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lagothrix_lagotricha_%28male%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7c8a5d\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Platyrrhini_Pitheciidae\"><label class=\"tree_label\" for=\"Platyrrhini_Pitheciidae\"></label><div class=\"outer_tree_box\"><div id=\"platyrrhini_pitheciidae\" class=\"tree_box\"><span><span>Pitheciidae</span><a href=\"https://en.wikipedia.org/wiki/Pitheciidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pitheciidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pitheciidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pitheciidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=pɪθɪˈsaɪ.ɪdiː\" target=\"_blank\">pɪθɪˈsaɪ.ɪdiː</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(titis, sakis, uakaris)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"platyrrhini_callicebinae\" class=\"tree_box\"><span><span>Callicebinae</span><a href=\"https://en.wikipedia.org/wiki/Callicebinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Callicebinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Callicebinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Callicebinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><span class=\"common_names\">(titis)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Callicebus_nigrifrons_Minas_Gerais.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Callicebus_nigrifrons_Minas_Gerais.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"346\" style=\"background-color:#788350\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brown_Titi_Monkey_%28Callicebus_brunneus%29_%283419492981%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Brown_Titi_Monkey_%28Callicebus_brunneus%29_%283419492981%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#4b5339\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"platyrrhini_pitheciinae\" class=\"tree_box\"><span><span>Pitheciinae</span><a href=\"https://en.wikipedia.org/wiki/Pitheciinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pitheciinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pitheciinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pitheciinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><span class=\"common_names\">(sakis, uakaris)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:WhiteFacedSaki.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-WhiteFacedSaki.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"362\" style=\"background-color:#686866\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Male_uakari.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Male_uakari.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#676a44\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cacajao_calvus_ucayalii.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cacajao_calvus_ucayalii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"373\" style=\"background-color:#805540\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chiropotes_utahickae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chiropotes_utahickae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"311\" style=\"background-color:#857c7c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chiropotes_albinasus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chiropotes_albinasus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"244\" style=\"background-color:#62663e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Captive_Pithecia_albicans.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Captive_Pithecia_albicans.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#929585\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Platyrrhini_Atelidae\"><label class=\"tree_label\" for=\"Platyrrhini_Atelidae\"></label><div class=\"outer_tree_box\"><div id=\"platyrrhini_atelidae\" class=\"tree_box\"><span><span>Atelidae</span><a href=\"https://en.wikipedia.org/wiki/Atelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Atelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Atelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Atelidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(howler monkeys, spider monkeys, woolly spider monkeys, woolly monkeys)</span><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Atelidae_Alouattinae\"><label class=\"tree_label\" for=\"Atelidae_Alouattinae\"></label><div class=\"outer_tree_box\"><div id=\"platyrrhini_alouattinae\" class=\"tree_box\"><span><span>Alouattinae</span><a href=\"https://en.wikipedia.org/wiki/Alouattinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Alouattinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Alouattinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Alouattinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><span class=\"common_names\">(howler monkeys)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"platyrrhini_alouatta\" class=\"tree_box\"><span><span>Alouatta</span><a href=\"https://en.wikipedia.org/wiki/Alouatta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Alouatta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Alouatta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Alouatta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(howler monkeys)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Howler_Monkey_at_Parque_Ambue_Ari%2C_Bolivia.png\" target=\"_blank\"><img src=\"thumbnails/Howler_Monkey_at_Parque_Ambue_Ari%2C_Bolivia.png\" class=\"taxa-img\" loading=\"lazy\" width=\"200\" height=\"298\" style=\"background-color:#55533d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black_Howler_Monkey_%28adult_male%29_4.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Black_Howler_Monkey_%28adult_male%29_4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#75806f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brown_Howler_Monkey_6.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Brown_Howler_Monkey_6.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5c6545\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Alouatta_seniculus_Sorocaba.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Alouatta_seniculus_Sorocaba.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#676750\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Atelidae_Atelinae\"><label class=\"tree_label\" for=\"Atelidae_Atelinae\"></label><div class=\"outer_tree_box\"><div id=\"platyrrhini_atelinae\" class=\"tree_box\"><span><span>Atelinae</span><a href=\"https://en.wikipedia.org/wiki/Atelinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Atelinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Atelinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Atelinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><span class=\"common_names\">(spider monkeys, woolly spider monkeys, woolly monkeys)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"platyrrhini_ateles\" class=\"tree_box\"><span><span>Ateles</span><a href=\"https://en.wikipedia.org/wiki/Ateles\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ateles\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ateles\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ateles\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(spider monkeys)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Ateles-fusciceps_54724770b.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ateles-fusciceps_54724770b.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#908e83\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ateles_marginatus3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ateles_marginatus3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6a776d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ateles_belzebuth_belzebuth.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ateles_belzebuth_belzebuth.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#959085\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Geoffroy%27s_spider_monkey_%28Ateles_geoffroyi_yucatanensis%29_male_Peten.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Geoffroy%27s_spider_monkey_%28Ateles_geoffroyi_yucatanensis%29_male_Peten.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"310\" style=\"background-color:#73787e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:BrownSpiderMonkey_%28edit2%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-BrownSpiderMonkey_%28edit2%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"280\" style=\"background-color:#827e65\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"platyrrhini_brachyteles\" class=\"tree_box\"><span><span>Brachyteles</span><a href=\"https://en.wikipedia.org/wiki/Brachyteles\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Brachyteles\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Brachyteles\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Brachyteles\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(muriquis, woolly spider monkeys)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Brachyteles_hypoxanthus.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Brachyteles_hypoxanthus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"350\" style=\"background-color:#70694e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brachyteles_arachnoides_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Brachyteles_arachnoides_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4d5938\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"platyrrhini_lagothrix\" class=\"tree_box\"><span><span>Lagothrix</span><a href=\"https://en.wikipedia.org/wiki/Lagothrix\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lagothrix\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lagothrix\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Lagothrix\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(woolly monkeys)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Lagothrix_lagotricha_%28male%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lagothrix_lagotricha_%28male%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7c8a5d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cola_amarilla.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cola_amarilla.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"242\" style=\"background-color:#837f40\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Platyrrhini_Cebidae\"><label class=\"tree_label\" for=\"Platyrrhini_Cebidae\"></label><div class=\"outer_tree_box\"><div id=\"platyrrhini_cebidae\" class=\"tree_box\"><span><span>Cebidae</span><a href=\"https://en.wikipedia.org/wiki/Cebidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cebidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cebidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cebidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(capuchins, squirrel monkeys)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"platyrrhini_cebinae\" class=\"tree_box\"><span><span>Cebinae</span><a href=\"https://en.wikipedia.org/wiki/Cebinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cebinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cebinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cebinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><span class=\"common_names\">(capuchins)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Cebus_albifrons_edit.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cebus_albifrons_edit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#565837\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Capuchin_Monkey_enjoys_a_massage.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Capuchin_Monkey_enjoys_a_massage.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"213\" style=\"background-color:#6e705d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Capuchin_monkeys_sharing.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Capuchin_monkeys_sharing.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"303\" style=\"background-color:#6d695b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"platyrrhini_saimirinae\" class=\"tree_box\"><span><span>Saimirinae</span><a href=\"https://en.wikipedia.org/wiki/Saimirinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Saimirinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Saimirinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Saimirinae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><span class=\"common_names\">(squirrel monkeys)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Saimiri_sciureus-1_Luc_Viatour.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saimiri_sciureus-1_Luc_Viatour.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#7c8152\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wild-57.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wild-57.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#4b642f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Miss_Baker%2C_the_squirrel_monkey.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Miss_Baker%2C_the_squirrel_monkey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"250\" style=\"background-color:#adadad\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"platyrrhini_callitrichidae\" class=\"tree_box\"><span><span>Callitrichidae</span><a href=\"https://en.wikipedia.org/wiki/Callitrichidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Callitrichidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Callitrichidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Callitrichidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(marmosets, tamarins)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Springtamarin_%28Callimico_goeldii%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Springtamarin_%28Callimico_goeldii%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"349\" style=\"background-color:#4e5042\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black-tufted_marmoset_%28sagui-de-tufos-pretos%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Black-tufted_marmoset_%28sagui-de-tufos-pretos%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6e644f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Callithrix_flaviceps_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Callithrix_flaviceps_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#4f4e45\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Buffy-tufted_marmoset_%28Callithrix_aurita%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Buffy-tufted_marmoset_%28Callithrix_aurita%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#525f26\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wei%C3%9Fb%C3%BCschelaffe_%28Callithrix_jacchus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wei%C3%9Fb%C3%BCschelaffe_%28Callithrix_jacchus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#544f37\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Callithrix_kuhlii_at_P%C3%A3o_de_A%C3%A7%C3%BAcar%2C_Brazil.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Callithrix_kuhlii_at_P%C3%A3o_de_A%C3%A7%C3%BAcar%2C_Brazil.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6c6d6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pygmy_Marmoset_%285336773146%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pygmy_Marmoset_%285336773146%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#73855b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saguinus_fuscicollis_246375885.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saguinus_fuscicollis_246375885.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#818f34\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Black_Lion_Tamarin_4.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Black_Lion_Tamarin_4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#4e5a39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leontopithecus_rosalia_-_Copenhagen_Zoo_-_DSC09082.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Leontopithecus_rosalia_-_Copenhagen_Zoo_-_DSC09082.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"373\" style=\"background-color:#8e8680\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mico_chrysoleucus_Kenny_Ross_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Mico_chrysoleucus_Kenny_Ross_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#717142\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mico_humeralifer.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mico_humeralifer.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#71675d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Callithrix_argentata_at_the_Bronx_Zoo_03.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Callithrix_argentata_at_the_Bronx_Zoo_03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#574d39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saguinus_fuscicollis_246375885.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saguinus_fuscicollis_246375885.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#818f34\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saguinus_niger.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Saguinus_niger.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#67706f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tamarin_portrait.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Tamarin_portrait.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#4b473e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Geoffroy%27s_tamarin_%28Saguinus_geoffroyi%29_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Geoffroy%27s_tamarin_%28Saguinus_geoffroyi%29_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#747655\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saguinus_midas_flk24863753.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saguinus_midas_flk24863753.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#969f7f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saguinus_tripartitus_-_Golden-mantled_Tamarin.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saguinus_tripartitus_-_Golden-mantled_Tamarin.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#53654a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saguinus_mystax_pileatus_205524045.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saguinus_mystax_pileatus_205524045.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#7a806e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"platyrrhini_aotidae\" class=\"tree_box\"><span><span>Aotidae</span><a href=\"https://en.wikipedia.org/wiki/Aotidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Aotidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Aotidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Aotidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=eɪˈɒtɪdiː\" target=\"_blank\">eɪˈɒtɪdiː</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(night monkeys, owl monkeys)</span><p class=\"tag\">The only truly nocturnal monkeys. Native to Central and South America. They have large eyes which improve their vision at night, while their ears are mostly hidden</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Panamanian_night_monkey.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Panamanian_night_monkey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6e512c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stavenn_Aotus_trivirgatus_00.jpg\" target=\"_blank\"><img src=\"thumbnails/Stavenn_Aotus_trivirgatus_00.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"360\" height=\"480\" style=\"background-color:#6c6958\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aotus_azarae_infulatus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aotus_azarae_infulatus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#685437\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aotus_nigriceps.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aotus_nigriceps.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#575955\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aotus_nancymai.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aotus_nancymai.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#5c4a3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amiconax_FMC.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amiconax_FMC.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"308\" style=\"background-color:#7d6b4e\"></a></div></div></div></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_animalia_cnidaria",[{"name":"Anthozoa","parent":"Cnidaria","rank":"Subphylum","ipa":"","etymology":"greek 'flower'-'animal'","common":[],"tag":"The polyps in the cnidaria phylum that have no medusa stage that have no medusa stage including all the corals and sea/tube anemones","imgs":[],"card":1},{"name":"Hexacorallia","parent":"Anthozoa","rank":"Class","ipa":"","etymology":"","common":["sea anenomes","hard corals"],"tag":"Have six or fewer axes of symmetry but possibly more tentacles","imgs":[],"card":2},{"name":"Actiniaria","parent":"Hexacorallia","rank":"Order","ipa":"","etymology":"","common":["sea anemones"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Stichodactyla_gigantea%2C_tent%C3%A1culos.jpg/330px-Stichodactyla_gigantea%2C_tent%C3%A1culos.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c8/Stichodactyla_haddoni_01_by_Line1.JPG/330px-Stichodactyla_haddoni_01_by_Line1.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/Actinostola_3.jpg/330px-Actinostola_3.jpg","https://upload.wikimedia.org/wikipedia/commons/6/64/Striped_colonial_anemone.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/Actinoscyphia_aurelia_1.jpg/250px-Actinoscyphia_aurelia_1.jpg"],"card":3},{"name":"Antipatharia","parent":"Hexacorallia","rank":"Order","ipa":"","etymology":"","common":["black corals"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c0/Plumapathes_pennacea.jpg/330px-Plumapathes_pennacea.jpg","https://upload.wikimedia.org/wikipedia/commons/d/d1/Leiopathes_NOAA%2C_Haw%C3%A1i.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/63/Cirrhipathes.jpg/250px-Cirrhipathes.jpg"],"card":3},{"name":"Corallimorpharia","parent":"Hexacorallia","rank":"Order","ipa":"","etymology":"","common":["false corals"],"tag":"Corallimorpharians or the false corals.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/Corynactis_australis_389639.jpeg/330px-Corynactis_australis_389639.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/Amplexidiscus_fenestrafer_Maldives.JPG/330px-Amplexidiscus_fenestrafer_Maldives.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cd/Paracorynactis_hoplites_Museum_Of_The_World_Ocean.jpg/330px-Paracorynactis_hoplites_Museum_Of_The_World_Ocean.jpg"],"card":3},{"name":"Scleractinia","parent":"Hexacorallia","rank":"Order","ipa":"","etymology":"","common":["stony corals"],"tag":"The true corals, sometimes called hermatypic or reef building corals, build reefs by depositing hard calcareous material for their skeletons, forming the stony framework of the reef. A close up each looks like miniature sea anemone since they are closely related.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/56/Brain_coral.jpg/250px-Brain_coral.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a1/Favites_abdita.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Faviidae_-_Echinopora_fruticolosa.JPG/250px-Faviidae_-_Echinopora_fruticolosa.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/86/Leptoria_phrygia.jpg/330px-Leptoria_phrygia.jpg","https://upload.wikimedia.org/wikipedia/commons/4/48/Plesiastrea_versipora%2C_in_situ.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/Coral_%28Favia_favus%29%2C_parque_nacional_Ras_Muhammad%2C_Egipto%2C_2022-03-27%2C_DD_12.jpg/250px-Coral_%28Favia_favus%29%2C_parque_nacional_Ras_Muhammad%2C_Egipto%2C_2022-03-27%2C_DD_12.jpg"],"card":3},{"name":"Zoantharia","parent":"Hexacorallia","rank":"Order","ipa":"","etymology":"","common":["zoanthids"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Zoanthus-dragon-eye.jpg/330px-Zoanthus-dragon-eye.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/75/Parazoanth2.JPG/250px-Parazoanth2.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Palythoa_grandis_%28Sun_Zoanthids%29.jpg/330px-Palythoa_grandis_%28Sun_Zoanthids%29.jpg"],"card":3},{"name":"Octocorallia","parent":"Anthozoa","rank":"Class","ipa":"","etymology":"","common":["sea fans","sea pens","soft corals","blue corals"],"tag":"Colonial organisms of polyps connected by gastrodermal tubes, called solenia, with each polyp having eight fold symmetry (ie. eight tentacles).","imgs":[],"card":2},{"name":"Malacalcyonacea","parent":"Octocorallia","rank":"Order","ipa":"","etymology":"","common":["soft corals","bamboo corals","sea fans","carnation corals","tree corals"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Folded_Coral_Flynn_Reef.jpg/330px-Folded_Coral_Flynn_Reef.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d0/Isidella_tentaculum_-_NOAA.jpg/330px-Isidella_tentaculum_-_NOAA.jpg","https://upload.wikimedia.org/wikipedia/commons/9/93/Melithaea_ochracea2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Capnella_sp.JPG/330px-Capnella_sp.JPG"],"card":4},{"name":"Scleralcyonacea","parent":"Octocorallia","rank":"Order","ipa":"","etymology":"","common":["sea pens","soft corals","blue corals"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6e/Virgularia_sp._%28Purple_sea_pen%29.jpg/250px-Virgularia_sp._%28Purple_sea_pen%29.jpg","https://upload.wikimedia.org/wikipedia/commons/1/11/Heliopora_coerulea_%28YPM_IZ_010737.CN%29.jpeg","https://upload.wikimedia.org/wikipedia/commons/a/a4/Heliopora_coerulea%2C_Samoa_Americana.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/eb/Narella_sp.jpg/330px-Narella_sp.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ae/Umbellula_-_MBA.png/330px-Umbellula_-_MBA.png","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Cavernularia_obesa_2.jpg/250px-Cavernularia_obesa_2.jpg"],"card":4},{"name":"Ceriantharia","parent":"Anthozoa","rank":"Class","ipa":"","etymology":"","common":[],"tag":"Radially symmetrical tube anemones that can fully retract their tentacles into their fibrous tubes.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5b/Cerianthus_membranaceus_Spallanzani%2C_1784.jpg/330px-Cerianthus_membranaceus_Spallanzani%2C_1784.jpg"],"card":2},{"name":"Scyphozoa","parent":"Cnidaria","rank":"Class","ipa":"","etymology":"greek 'cup'-'animal'","common":["lion's mane jellyfish","moon jellies","upside-down jellyfish"],"tag":"The true jellyfish. Their firmness comes from hydrostatic pressure and they are 95% water, have four radial gastric pouches.","imgs":["https://upload.wikimedia.org/wikipedia/commons/3/36/Sea_nettles.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/27/Moon_jellyfish_at_Gota_Sagher.JPG/330px-Moon_jellyfish_at_Gota_Sagher.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4c/Phyllorhiza_punctata_macro_II.jpg/330px-Phyllorhiza_punctata_macro_II.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/11/Periphyllopsis_braueri.jpg/330px-Periphyllopsis_braueri.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Fkeysmacro.jpg/330px-Fkeysmacro.jpg"],"card":1},{"name":"Staurozoa","parent":"Cnidaria","rank":"Class","ipa":"","etymology":"greek 'cross'-'animal'","common":["stalked jellyfishes"],"tag":"The only extant order is commonly called the stalked jellyfishes. They are similar to the scyphozoans but lack an alternating polyp/medusa life cycle and have a stalk that attaches to rock resulting in a flowerlike in apearance.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/7b/Haliclystus_antarcticus_1B.jpg/330px-Haliclystus_antarcticus_1B.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8a/Haliclystus_stejnegeri_1.jpg/250px-Haliclystus_stejnegeri_1.jpg"],"card":1},{"name":"Cubozoa","parent":"Cnidaria","rank":"Class","ipa":"","etymology":"greek 'box'-'animal'","common":["box jellyfish"],"tag":"Compared to the scyphozoa (true jellyfish) they have more optimised propusion and a more developed nervous system. They have four radial symmetric parts each with six fully formed eyes (including two that are lensed)","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/89/Box_jellyfish_at_Bakoven_Rock_DSC11031.JPG/330px-Box_jellyfish_at_Bakoven_Rock_DSC11031.JPG","https://upload.wikimedia.org/wikipedia/commons/7/75/Chironex_fleckeri_%28sea_wasp%29.jpg"],"card":1},{"name":"Hydrozoa","parent":"Cnidaria","rank":"Class","ipa":"","etymology":"greek 'water'-'animal'","common":["Portuguese man o' war / bluebottle","fire corals","deep red jellyfish","air ferns","freshwater jellyfish","flower hat jelly"],"tag":"A morphologically diverse group of cnidarians that includes small predatory polyps (like the freshwater genus hydra), colonial organisms (like the Portuguese man o' war) and hydrocorals (like the fire corals).","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Millepora_alcicornis_%28Branching_Fire_Coral%29.jpg/250px-Millepora_alcicornis_%28Branching_Fire_Coral%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/47/Sertularia_argentea_6880622.jpg/330px-Sertularia_argentea_6880622.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Craspedacusta_sowerbyi_by_OpenCage.jpg/250px-Craspedacusta_sowerbyi_by_OpenCage.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/09/Expl0393_-_Flickr_-_NOAA_Photo_Library.jpg/330px-Expl0393_-_Flickr_-_NOAA_Photo_Library.jpg","https://upload.wikimedia.org/wikipedia/commons/1/1a/Hydra_oligactis.jpg","https://upload.wikimedia.org/wikipedia/commons/6/61/Noble_coral8.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Portuguese_Man-O-War_%28Physalia_physalis%29.jpg/250px-Portuguese_Man-O-War_%28Physalia_physalis%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Physalia_physalis_EM1B0679_%2840827501481%29.jpg/330px-Physalia_physalis_EM1B0679_%2840827501481%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/17/Flower_Hat_Jellyfish_1.jpg/330px-Flower_Hat_Jellyfish_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/03/Tubularia-indivisa.jpg/330px-Tubularia-indivisa.jpg"],"card":1}],{},{"250px-Actinoscyphia_aurelia_1.jpg":[250,333,"#211a15"],"250px-Brain_coral.jpg":[250,266,"#86ad80"],"250px-Cavernularia_obesa_2.jpg":[250,250,"#4f6b8a"],"250px-Cirrhipathes.jpg":[250,371,"#190e04"],"250px-Coral_(Favia_favus),_parque_nacional_Ras_Muhammad,_Egipto,_2022-03-27,_DD_12.jpg":[250,250,"#786661"],"250px-Craspedacusta_sowerbyi_by_OpenCage.jpg":[250,250,"#201d2a"],"250px-Faviidae_-_Echinopora_fruticolosa.JPG":[250,250,"#af9e8d"],"250px-Haliclystus_stejnegeri_1.jpg":[250,250,"#603f22"],"250px-Millepora_alcicornis_(Branching_Fire_Coral).jpg":[250,333,"#715f1d"],"250px-Parazoanth2.JPG":[250,343,"#907232"],"250px-Portuguese_Man-O-War_(Physalia_physalis).jpg":[250,343,"#d5ddda"],"250px-Virgularia_sp._(Purple_sea_pen).jpg":[250,333,"#353530"],"330px-Actinostola_3.jpg":[330,246,"#5d554c"],"330px-Amplexidiscus_fenestrafer_Maldives.JPG":[330,247,"#9baa9b"],"330px-Box_jellyfish_at_Bakoven_Rock_DSC11031.JPG":[330,247,"#7b926d"],"330px-Capnella_sp.JPG":[330,247,"#93747a"],"330px-Cerianthus_membranaceus_Spallanzani,_1784.jpg":[330,276,"#525850"],"330px-Corynactis_australis_389639.jpeg":[330,219,"#a4766c"],"330px-Expl0393_-_Flickr_-_NOAA_Photo_Library.jpg":[330,220,"#2b1008"],"330px-Fkeysmacro.jpg":[330,248,"#7a7059"],"330px-Flower_Hat_Jellyfish_1.jpg":[330,247,"#47332e"],"330px-Folded_Coral_Flynn_Reef.jpg":[330,275,"#7c663f"],"330px-Haliclystus_antarcticus_1B.jpg":[330,257,"#9f776d"],"330px-Isidella_tentaculum_-_NOAA.jpg":[330,247,"#435131"],"330px-Leptoria_phrygia.jpg":[330,248,"#a3957c"],"330px-Moon_jellyfish_at_Gota_Sagher.JPG":[330,248,"#174975"],"330px-Narella_sp.jpg":[329,249,"#787665"],"330px-Palythoa_grandis_(Sun_Zoanthids).jpg":[330,247,"#6c512f"],"330px-Paracorynactis_hoplites_Museum_Of_The_World_Ocean.jpg":[330,227,"#697275"],"330px-Periphyllopsis_braueri.jpg":[330,194,"#23140f"],"330px-Phyllorhiza_punctata_macro_II.jpg":[330,224,"#232775"],"330px-Physalia_physalis_EM1B0679_(40827501481).jpg":[330,248,"#7e876d"],"330px-Plumapathes_pennacea.jpg":[330,247,"#9b8575"],"330px-Sertularia_argentea_6880622.jpg":[330,221,"#5f4d3f"],"330px-Stichodactyla_gigantea,_tentáculos.jpg":[330,303,"#5c6f53"],"330px-Stichodactyla_haddoni_01_by_Line1.JPG":[330,247,"#808776"],"330px-Tubularia-indivisa.jpg":[330,247,"#2e2630"],"330px-Umbellula_-_MBA.png":[330,272,"#8b857f"],"330px-Zoanthus-dragon-eye.jpg":[330,257,"#908d70"],"Chironex_fleckeri_(sea_wasp).jpg":[260,260,"#111c6d"],"Favites_abdita.jpg":[504,399,"#716c52"],"Heliopora_coerulea,_Samoa_Americana.jpg":[504,366,"#266452"],"Heliopora_coerulea_(YPM_IZ_010737.CN).jpeg":[480,342,"#46515c"],"Hydra_oligactis.jpg":[378,265,"#285544"],"Leiopathes_NOAA,_Hawái.jpg":[330,300,"#707346"],"Melithaea_ochracea2.jpg":[640,480,"#618291"],"Noble_coral8.jpg":[640,397,"#853332"],"Plesiastrea_versipora,_in_situ.jpg":[480,360,"#5b6e5c"],"Sea_nettles.jpg":[427,311,"#537ca2"],"Striped_colonial_anemone.jpg":[700,550,"#63463d"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_cnidaria","<ul class=\"tree\" data-tree-range=\"cnidaria\"><li><input type=\"checkbox\" checked id=\"ParaHoxozoa_Cnidaria\"><label class=\"tree_label\" for=\"ParaHoxozoa_Cnidaria\"></label><div class=\"outer_tree_box\"><div id=\"cnidaria_cnidaria\" class=\"tree_box\"><span><span>Cnidaria</span><a href=\"https://en.wikipedia.org/wiki/Cnidaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cnidaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cnidaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cnidaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=nɪˈdɛəriə\" target=\"_blank\">nɪˈdɛəriə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"animalia\">See parent</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(jellyfish, hydroids, sea anemones, corals)</span><p class=\"tag\">Aquatic invertebrates found both in freshwater and marine environment. They usually have two basic body forms (swimming medusae and sessile polyps) and both are radially symmetrical with mouths surrounded by tentacles. They have an uncentralized nervous system distributed throughout a gelatinous body and specialized cells with ejectable flagella used mainly for envenomation and capturing prey. They have no organs or organ systems and include some of the smallest marine parasites. They can reproduce both sexually and asexually.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Phyllorhiza_punctata_macro_II.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phyllorhiza_punctata_macro_II.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#232775\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hertshoon.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hertshoon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#334953\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chrysaora_jelly.jpg\" target=\"_blank\"><img src=\"thumbnails/Chrysaora_jelly.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"450\" style=\"background-color:#162a41\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Annella_mollis_Maldives.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Annella_mollis_Maldives.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4a4530\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Colonial_anemone_zebra.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Colonial_anemone_zebra.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"318\" style=\"background-color:#201b19\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Cnidaria_Anthozoa\"><label class=\"tree_label\" for=\"Cnidaria_Anthozoa\"></label><div class=\"outer_tree_box\"><div id=\"cnidaria_anthozoa\" class=\"tree_box\"><span><span>Anthozoa</span><a href=\"https://en.wikipedia.org/wiki/Anthozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Anthozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Anthozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Anthozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subphylum</span></span><p class=\"tag\">The polyps in the cnidaria phylum that have no medusa stage that have no medusa stage including all the corals and sea/tube anemones</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Anthozoa_Hexacorallia\"><label class=\"tree_label\" for=\"Anthozoa_Hexacorallia\"></label><div class=\"outer_tree_box\"><div id=\"cnidaria_hexacorallia\" class=\"tree_box\"><span><span>Hexacorallia</span><a href=\"https://en.wikipedia.org/wiki/Hexacorallia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hexacorallia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hexacorallia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hexacorallia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(sea anenomes, hard corals)</span><p class=\"tag\">Have six or fewer axes of symmetry but possibly more tentacles</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_actiniaria\" class=\"tree_box\"><span><span>Actiniaria</span><a href=\"https://en.wikipedia.org/wiki/Actiniaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Actiniaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Actiniaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Actiniaria\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(sea anemones)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Stichodactyla_gigantea%2C_tent%C3%A1culos.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stichodactyla_gigantea%2C_tent%C3%A1culos.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"303\" style=\"background-color:#5c6f53\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stichodactyla_haddoni_01_by_Line1.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Stichodactyla_haddoni_01_by_Line1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#808776\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Actinostola_3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Actinostola_3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"246\" style=\"background-color:#5d554c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Striped_colonial_anemone.jpg\" target=\"_blank\"><img src=\"thumbnails/Striped_colonial_anemone.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"700\" height=\"550\" style=\"background-color:#63463d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Actinoscyphia_aurelia_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Actinoscyphia_aurelia_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#211a15\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_antipatharia\" class=\"tree_box\"><span><span>Antipatharia</span><a href=\"https://en.wikipedia.org/wiki/Antipatharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Antipatharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Antipatharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Antipatharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(black corals)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Plumapathes_pennacea.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Plumapathes_pennacea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9b8575\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leiopathes_NOAA%2C_Haw%C3%A1i.jpg\" target=\"_blank\"><img src=\"thumbnails/Leiopathes_NOAA%2C_Haw%C3%A1i.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"300\" style=\"background-color:#707346\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cirrhipathes.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cirrhipathes.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"371\" style=\"background-color:#190e04\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_corallimorpharia\" class=\"tree_box\"><span><span>Corallimorpharia</span><a href=\"https://en.wikipedia.org/wiki/Corallimorpharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Corallimorpharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Corallimorpharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Corallimorpharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(false corals)</span><p class=\"tag\">Corallimorpharians or the false corals.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Corynactis_australis_389639.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Corynactis_australis_389639.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#a4766c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amplexidiscus_fenestrafer_Maldives.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Amplexidiscus_fenestrafer_Maldives.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9baa9b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Paracorynactis_hoplites_Museum_Of_The_World_Ocean.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Paracorynactis_hoplites_Museum_Of_The_World_Ocean.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"227\" style=\"background-color:#697275\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_scleractinia\" class=\"tree_box\"><span><span>Scleractinia</span><a href=\"https://en.wikipedia.org/wiki/Scleractinia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Scleractinia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Scleractinia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Scleractinia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(stony corals)</span><p class=\"tag\">The true corals, sometimes called hermatypic or reef building corals, build reefs by depositing hard calcareous material for their skeletons, forming the stony framework of the reef. A close up each looks like miniature sea anemone since they are closely related.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Brain_coral.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Brain_coral.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"266\" style=\"background-color:#86ad80\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Favites_abdita.jpg\" target=\"_blank\"><img src=\"thumbnails/Favites_abdita.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"504\" height=\"399\" style=\"background-color:#716c52\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Faviidae_-_Echinopora_fruticolosa.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Faviidae_-_Echinopora_fruticolosa.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#af9e8d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leptoria_phrygia.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leptoria_phrygia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#a3957c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Plesiastrea_versipora%2C_in_situ.jpg\" target=\"_blank\"><img src=\"thumbnails/Plesiastrea_versipora%2C_in_situ.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"480\" height=\"360\" style=\"background-color:#5b6e5c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coral_%28Favia_favus%29%2C_parque_nacional_Ras_Muhammad%2C_Egipto%2C_2022-03-27%2C_DD_12.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Coral_%28Favia_favus%29%2C_parque_nacional_Ras_Muhammad%2C_Egipto%2C_2022-03-27%2C_DD_12.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#786661\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_zoantharia\" class=\"tree_box\"><span><span>Zoantharia</span><a href=\"https://en.wikipedia.org/wiki/Zoantharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Zoantharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Zoantharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Zoantharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(zoanthids)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Zoanthus-dragon-eye.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Zoanthus-dragon-eye.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"257\" style=\"background-color:#908d70\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Parazoanth2.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Parazoanth2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"343\" style=\"background-color:#907232\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Palythoa_grandis_%28Sun_Zoanthids%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Palythoa_grandis_%28Sun_Zoanthids%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6c512f\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Anthozoa_Octocorallia\"><label class=\"tree_label\" for=\"Anthozoa_Octocorallia\"></label><div class=\"outer_tree_box\"><div id=\"cnidaria_octocorallia\" class=\"tree_box\"><span><span>Octocorallia</span><a href=\"https://en.wikipedia.org/wiki/Octocorallia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Octocorallia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Octocorallia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Octocorallia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(sea fans, sea pens, soft corals, blue corals)</span><p class=\"tag\">Colonial organisms of polyps connected by gastrodermal tubes, called solenia, with each polyp having eight fold symmetry (ie. eight tentacles).</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_malacalcyonacea\" class=\"tree_box\"><span><span>Malacalcyonacea</span><a href=\"https://en.wikipedia.org/wiki/Malacalcyonacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Malacalcyonacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Malacalcyonacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Malacalcyonacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(soft corals, bamboo corals, sea fans, carnation corals, tree corals)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Folded_Coral_Flynn_Reef.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Folded_Coral_Flynn_Reef.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"275\" style=\"background-color:#7c663f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Isidella_tentaculum_-_NOAA.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Isidella_tentaculum_-_NOAA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#435131\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Melithaea_ochracea2.jpg\" target=\"_blank\"><img src=\"thumbnails/Melithaea_ochracea2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#618291\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Capnella_sp.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Capnella_sp.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#93747a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_scleralcyonacea\" class=\"tree_box\"><span><span>Scleralcyonacea</span><a href=\"https://en.wikipedia.org/wiki/Scleralcyonacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Scleralcyonacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Scleralcyonacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Scleralcyonacea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(sea pens, soft corals, blue corals)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Virgularia_sp._%28Purple_sea_pen%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Virgularia_sp._%28Purple_sea_pen%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#353530\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Heliopora_coerulea_%28YPM_IZ_010737.CN%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/Heliopora_coerulea_%28YPM_IZ_010737.CN%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"480\" height=\"342\" style=\"background-color:#46515c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Heliopora_coerulea%2C_Samoa_Americana.jpg\" target=\"_blank\"><img src=\"thumbnails/Heliopora_coerulea%2C_Samoa_Americana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"504\" height=\"366\" style=\"background-color:#266452\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Narella_sp.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Narella_sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"329\" height=\"249\" style=\"background-color:#787665\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Umbellula_-_MBA.png\" target=\"_blank\"><img src=\"thumbnails/330px-Umbellula_-_MBA.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"272\" style=\"background-color:#8b857f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cavernularia_obesa_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cavernularia_obesa_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#4f6b8a\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_ceriantharia\" class=\"tree_box\"><span><span>Ceriantharia</span><a href=\"https://en.wikipedia.org/wiki/Ceriantharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ceriantharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ceriantharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Ceriantharia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Radially symmetrical tube anemones that can fully retract their tentacles into their fibrous tubes.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cerianthus_membranaceus_Spallanzani%2C_1784.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cerianthus_membranaceus_Spallanzani%2C_1784.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"276\" style=\"background-color:#525850\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_scyphozoa\" class=\"tree_box\"><span><span>Scyphozoa</span><a href=\"https://en.wikipedia.org/wiki/Scyphozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Scyphozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Scyphozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Scyphozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(lion&#x27;s mane jellyfish, moon jellies, upside-down jellyfish)</span><p class=\"tag\">The true jellyfish. Their firmness comes from hydrostatic pressure and they are 95% water, have four radial gastric pouches.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Sea_nettles.jpg\" target=\"_blank\"><img src=\"thumbnails/Sea_nettles.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"427\" height=\"311\" style=\"background-color:#537ca2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Moon_jellyfish_at_Gota_Sagher.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Moon_jellyfish_at_Gota_Sagher.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#174975\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phyllorhiza_punctata_macro_II.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phyllorhiza_punctata_macro_II.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#232775\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Periphyllopsis_braueri.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Periphyllopsis_braueri.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"194\" style=\"background-color:#23140f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fkeysmacro.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fkeysmacro.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#7a7059\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_staurozoa\" class=\"tree_box\"><span><span>Staurozoa</span><a href=\"https://en.wikipedia.org/wiki/Staurozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Staurozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Staurozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Staurozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(stalked jellyfishes)</span><p class=\"tag\">The only extant order is commonly called the stalked jellyfishes. They are similar to the scyphozoans but lack an alternating polyp/medusa life cycle and have a stalk that attaches to rock resulting in a flowerlike in apearance.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Haliclystus_antarcticus_1B.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Haliclystus_antarcticus_1B.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"257\" style=\"background-color:#9f776d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Haliclystus_stejnegeri_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Haliclystus_stejnegeri_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#603f22\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_cubozoa\" class=\"tree_box\"><span><span>Cubozoa</span><a href=\"https://en.wikipedia.org/wiki/Cubozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cubozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cubozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cubozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(box jellyfish)</span><p class=\"tag\">Compared to the scyphozoa (true jellyfish) they have more optimised propusion and a more developed nervous system. They have four radial symmetric parts each with six fully formed eyes (including two that are lensed)</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Box_jellyfish_at_Bakoven_Rock_DSC11031.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Box_jellyfish_at_Bakoven_Rock_DSC11031.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7b926d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chironex_fleckeri_%28sea_wasp%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Chironex_fleckeri_%28sea_wasp%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"260\" height=\"260\" style=\"background-color:#111c6d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"cnidaria_hydrozoa\" class=\"tree_box\"><span><span>Hydrozoa</span><a href=\"https://en.wikipedia.org/wiki/Hydrozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hydrozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hydrozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Hydrozoa\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(Portuguese man o&#x27; war / bluebottle, fire corals, deep red jellyfish, air ferns, freshwater jellyfish, flower hat jelly)</span><p class=\"tag\">A morphologically diverse group of cnidarians that includes small predatory polyps (like the freshwater genus hydra), colonial organisms (like the Portuguese man o&#x27; war) and hydrocorals (like the fire corals).</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Millepora_alcicornis_%28Branching_Fire_Coral%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Millepora_alcicornis_%28Branching_Fire_Coral%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#715f1d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sertularia_argentea_6880622.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sertularia_argentea_6880622.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#5f4d3f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Craspedacusta_sowerbyi_by_OpenCage.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Craspedacusta_sowerbyi_by_OpenCage.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#201d2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Expl0393_-_Flickr_-_NOAA_Photo_Library.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Expl0393_-_Flickr_-_NOAA_Photo_Library.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#2b1008\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydra_oligactis.jpg\" target=\"_blank\"><img src=\"thumbnails/Hydra_oligactis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"378\" height=\"265\" style=\"background-color:#285544\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Noble_coral8.jpg\" target=\"_blank\"><img src=\"thumbnails/Noble_coral8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"397\" style=\"background-color:#853332\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Portuguese_Man-O-War_%28Physalia_physalis%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Portuguese_Man-O-War_%28Physalia_physalis%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"343\" style=\"background-color:#d5ddda\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Physalia_physalis_EM1B0679_%2840827501481%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Physalia_physalis_EM1B0679_%2840827501481%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#7e876d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flower_Hat_Jellyfish_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Flower_Hat_Jellyfish_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#47332e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tubularia-indivisa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tubularia-indivisa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#2e2630\"></a></div></div></div></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_animalia_mollusca",[{"name":"Aculifera","parent":"Mollusca","rank":"Subphylum","ipa":"","common":[],"tag":"Have no conch or shell.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Tonicella-lineata.jpg/330px-Tonicella-lineata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Falcidens_crossotus.jpg/120px-Falcidens_crossotus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b2/Dondersia_annulata%2C_Nudi_Falls_imported_from_iNaturalist_photo_95332364.jpg/250px-Dondersia_annulata%2C_Nudi_Falls_imported_from_iNaturalist_photo_95332364.jpg"]},{"name":"Polyplacophora","parent":"Aculifera","rank":"Class","ipa":"","common":["chitons","sea cradles"],"tag":"Have a shell composed of eight separate shell plates or valves.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Chiton_magnificus.jpg/120px-Chiton_magnificus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Tonicella-lineata.jpg/330px-Tonicella-lineata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Acanthopleura_granulata_with_Nerita_tessellata.jpg/330px-Acanthopleura_granulata_with_Nerita_tessellata.jpg"]},{"name":"Caudofoveata","parent":"Aculifera","rank":"Class","ipa":"","common":[],"tag":"Caudofoveata are worm-like molluscs mostly ranging from 0.02 cm to 10 cm.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Falcidens_crossotus.jpg/120px-Falcidens_crossotus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Chaetoderma_nitidulum.jpg/330px-Chaetoderma_nitidulum.jpg"]},{"name":"Solenogastres","parent":"Aculifera","rank":"Class","ipa":"","common":[],"tag":"Small, worm-like, shell-less molluscs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d9/Epimenia_verrucosa.jpg/120px-Epimenia_verrucosa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b2/Dondersia_annulata%2C_Nudi_Falls_imported_from_iNaturalist_photo_95332364.jpg/250px-Dondersia_annulata%2C_Nudi_Falls_imported_from_iNaturalist_photo_95332364.jpg"]},{"name":"Conchifera","parent":"Mollusca","rank":"Subphylum","ipa":"","common":[],"tag":"Members may bear a single shell, a single pair of shells, or lack a shell.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/11/Giant_clam_or_Tridacna_gigas.jpg/250px-Giant_clam_or_Tridacna_gigas.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Nautilus_pompilius_%28head%29.jpg/330px-Nautilus_pompilius_%28head%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Octopus3.jpg/330px-Octopus3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Slimaczek.jpg/330px-Slimaczek.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7f/Vinogradski_puz_glava.jpg/330px-Vinogradski_puz_glava.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/CornishMussels.JPG/330px-CornishMussels.JPG"]},{"name":"Monoplacophora","parent":"Conchifera","rank":"Class","ipa":"ˌmɒnoʊpləˈkɒfərə","etymology":"'one'-'plate'-'bearing'","common":[],"tag":"Molluscs with a cap-like shell, inhabiting deep sea environments. Their reduced head lacks eyes or tentacles. They are a basal group of moluscs with primitive features like paired multiple organs.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/3e/Tryblidium_reticulatum_2.jpg/60px-Tryblidium_reticulatum_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Veleropilina_oligotropha.jpg/330px-Veleropilina_oligotropha.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Neopilina.jpg/250px-Neopilina.jpg"]},{"name":"Cephalopoda","parent":"Conchifera","rank":"Class","ipa":"sɛfəˈlɒpədə","etymology":"'head'-'feet'","common":["squid","octopus","cuttlefish","nautilus"],"tag":"Characterized by bilateral body symmetry, a prominent head, a set of arms or tentacles with a two part beak in the center, usually a radula. Many species can squirt ink.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Octopus_vulgaris_Merculiano.jpg/120px-Octopus_vulgaris_Merculiano.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e1/Sepioteuthis_sepioidea_%28Caribbean_Reef_Squid%29.jpg/330px-Sepioteuthis_sepioidea_%28Caribbean_Reef_Squid%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/57/Octopus2.jpg/330px-Octopus2.jpg","https://upload.wikimedia.org/wikipedia/commons/9/9f/Cuttlefish_komodo_large.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Nautilus_belauensis_from_Palau.jpg/330px-Nautilus_belauensis_from_Palau.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Nautilus_pompilius_%28head%29.jpg/330px-Nautilus_pompilius_%28head%29.jpg"]},{"name":"Nautilida","parent":"Cephalopoda","rank":"Order","ipa":"","etymology":"","common":[],"tag":"Have a coiled shell covering its body and tentacles that form two rings around its mouth. The eyes lack any lens or cornea they also lack ocular muscles.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Nautilus_belauensis_from_Palau.jpg/250px-Nautilus_belauensis_from_Palau.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Nautilus_pompilius_%28head%29.jpg/330px-Nautilus_pompilius_%28head%29.jpg","https://upload.wikimedia.org/wikipedia/commons/7/73/Nautilus_pompilius.jpg","https://upload.wikimedia.org/wikipedia/commons/1/16/Allonautilus_scrobiculatus.jpg"]},{"name":"Octopodiformes","parent":"Cephalopoda","rank":"Superorder","ipa":"","etymology":"","common":[],"tag":"They have eight arms, although a branch has thin filaments that were modified from two extra tentacles.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Octopus_vulgaris_Merculiano.jpg/250px-Octopus_vulgaris_Merculiano.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ee/Vampyroteuthis_infernalis_dorsal_view.jpg/330px-Vampyroteuthis_infernalis_dorsal_view.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Octopus3.jpg/330px-Octopus3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Enteroctopus_dofleini_in_aquarium_rotated.jpg/330px-Enteroctopus_dofleini_in_aquarium_rotated.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3c/Pu_-_Vampyroteuthis_infernalis_-_2.jpg/330px-Pu_-_Vampyroteuthis_infernalis_-_2.jpg"]},{"name":"Vampyromorphida","parent":"Octopodiformes","rank":"Order","ipa":"","etymology":"","common":["vampire squids"],"tag":"Found in extreme deep sea conditions using its bioluminescent organs and its unique oxygen metabolism. It has two long retractile filaments.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Vampire_des_abysses.jpg/250px-Vampire_des_abysses.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ee/Vampyroteuthis_infernalis_dorsal_view.jpg/330px-Vampyroteuthis_infernalis_dorsal_view.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Vampyroteuthis_infernalis_arms.jpg/250px-Vampyroteuthis_infernalis_arms.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8e/MBNMS_-_Juvenile_Vampire_Squid_%2827667875204%29.jpg/330px-MBNMS_-_Juvenile_Vampire_Squid_%2827667875204%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3c/Pu_-_Vampyroteuthis_infernalis_-_2.jpg/330px-Pu_-_Vampyroteuthis_infernalis_-_2.jpg"]},{"name":"Octopoda","parent":"Octopodiformes","rank":"Order","ipa":"","etymology":"","common":["octopus"],"tag":"Soft-bodied, eight-limbed molluscs. They can radically deform their shape and many can change colour. They use their siphon for respiration, waste disposal, discharging ink, and locomotion. They have a complex nervous system, excellent sight, and are among the most intelligent invertebrates.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Octopus_vulgaris_Merculiano.jpg/250px-Octopus_vulgaris_Merculiano.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Octopus3.jpg/330px-Octopus3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Enteroctopus_dofleini_in_aquarium_rotated.jpg/330px-Enteroctopus_dofleini_in_aquarium_rotated.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/Suckers_of_octopus_by_steve_lodefink.jpg/250px-Suckers_of_octopus_by_steve_lodefink.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Octopus_vulgaris_%2C_%D0%9E%D0%BA%D1%82%D0%BE%D0%BF%D0%BE%D0%B4_%21.JPG/330px-Octopus_vulgaris_%2C_%D0%9E%D0%BA%D1%82%D0%BE%D0%BF%D0%BE%D0%B4_%21.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/0/09/Graneledone_boreopacifica2.jpg/250px-Graneledone_boreopacifica2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Fish3566_-_Flickr_-_NOAA_Photo_Library.jpg/330px-Fish3566_-_Flickr_-_NOAA_Photo_Library.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/Reef1072_-_Flickr_-_NOAA_Photo_Library.jpg/330px-Reef1072_-_Flickr_-_NOAA_Photo_Library.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Dumbo-hires_%28cropped%29.jpg/330px-Dumbo-hires_%28cropped%29.jpg"]},{"name":"Decapodiformes","parent":"Cephalopoda","rank":"Superorder","ipa":"","etymology":"","common":[],"tag":"They have ten limbs, specifically eight short arms and two long tentacles.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/2f/%E3%82%A2%E3%82%AA%E3%83%AA%E3%82%A4%E3%82%AB-Sepioteuthis_lessoniana.jpg/330px-%E3%82%A2%E3%82%AA%E3%83%AA%E3%82%A4%E3%82%AB-Sepioteuthis_lessoniana.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e9/Sepiola_atlantica.jpg/330px-Sepiola_atlantica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Sepia_officinalis_2.jpg/250px-Sepia_officinalis_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c0/Spirula_spirula_illustration.jpg/250px-Spirula_spirula_illustration.jpg"]},{"name":"Spirulida","parent":"Decapodiformes","rank":"Order","ipa":"","etymology":"","common":["ram's horn squid"],"tag":"A deep-water squid-like mollusk with a light-emitting organ. They have no radula, at most a vestigial one. Its shell commonly floats onto beaches and is known as the ram's horn shell.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c0/Spirula_spirula_illustration.jpg/250px-Spirula_spirula_illustration.jpg","https://upload.wikimedia.org/wikipedia/commons/1/18/Spirula_spirula4.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/00/Spirula_spirula1.jpg/330px-Spirula_spirula1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/Spirula_spirula_lateral-view.jpg/250px-Spirula_spirula_lateral-view.jpg"]},{"name":"Sepiida","parent":"Decapodiformes","rank":"Suborder","ipa":"","etymology":"","common":["cuttlefish"],"tag":"They have a unique internal shell, the cuttlebone, which is used for control of buoyancy. Their eyes have W-shaped pupils, and two tentacles are furnished with denticulated suckers. Some produce venom that's excreted through their beak, and others can change colour. They eat small molluscs, crabs, shrimp, fish, octopuses, worms, and other cuttlefish. Life expectancy is about 1–2 years.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Sepia_officinalis_2.jpg/250px-Sepia_officinalis_2.jpg","https://upload.wikimedia.org/wikipedia/commons/9/9f/Cuttlefish_komodo_large.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Australian_Giant_Cuttlefish%2C_Australia_imported_from_iNaturalist_photo_479494705.jpg/330px-Australian_Giant_Cuttlefish%2C_Australia_imported_from_iNaturalist_photo_479494705.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/34/Cuttlefish_eye.jpg/330px-Cuttlefish_eye.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/98/Kalamar.jpg/250px-Kalamar.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Ascarosepion_pfefferi_1.jpg/330px-Ascarosepion_pfefferi_1.jpg"]},{"name":"Sepiolida","parent":"Decapodiformes","rank":"Suborder","ipa":"","etymology":"","common":["bobtail squid"],"tag":"They have a rounder mantle than cuttlefish and have no cuttlebone with a typical male mantle length being between 1 and 8 cm.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/7f/Heteroteuthis_hawaiiensis1.jpg/250px-Heteroteuthis_hawaiiensis1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e9/Sepiola_atlantica.jpg/330px-Sepiola_atlantica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/69/Bobtail_squid.jpg/330px-Bobtail_squid.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/79/Rossia_pacifica.jpg/330px-Rossia_pacifica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Euprymna_scolopes_%28Bobtail_squid_in_orange_form%29.jpg/330px-Euprymna_scolopes_%28Bobtail_squid_in_orange_form%29.jpg"]},{"name":"Idiosepiidae","parent":"Decapodiformes","rank":"Family","ipa":"","etymology":"","common":["pygmy squids"],"tag":"The smallest known squids. The dorsal surface of the mantle has a unique oval adhesive organ, which secretes a sticky substance and is used to attach itself to seaweed or seagrass blades.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cd/Tropical_Pygmy_Squid_%28Idiosepius_pygmaeus%29_%2825377304317%29.jpg/330px-Tropical_Pygmy_Squid_%28Idiosepius_pygmaeus%29_%2825377304317%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/Idiosepius_paradoxus_himeika03_1.jpg/330px-Idiosepius_paradoxus_himeika03_1.jpg"]},{"name":"Myopsida","parent":"Decapodiformes","rank":"Order","ipa":"","etymology":"","common":["pencil squids","European common squids","reef squids"],"tag":"They lack a secondary eyelid. Their arms and tentacles are ornamented with simple suckers without hooks.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/2f/%E3%82%A2%E3%82%AA%E3%83%AA%E3%82%A4%E3%82%AB-Sepioteuthis_lessoniana.jpg/330px-%E3%82%A2%E3%82%AA%E3%83%AA%E3%82%A4%E3%82%AB-Sepioteuthis_lessoniana.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/Squid_komodo.jpg/250px-Squid_komodo.jpg","https://upload.wikimedia.org/wikipedia/commons/2/25/Caribbean_reef_squid.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e0/Logilo_cc.jpg/330px-Logilo_cc.jpg","https://upload.wikimedia.org/wikipedia/commons/1/1a/Uroteuthis_noctiluca.jpeg"]},{"name":"Bathyteuthida","parent":"Decapodiformes","rank":"Order","ipa":"","etymology":"","common":[],"tag":"Deep see squid with some bioluminescent species. They lack corneal membranes covering their eyes. They have tentacle pockets in the head and small suckers on the buccal supports.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Bathyteuthisabyssicola.jpg/330px-Bathyteuthisabyssicola.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/59/Chtenopteryx_sicula_1.jpg/250px-Chtenopteryx_sicula_1.jpg"]},{"name":"Oegopsida","parent":"Decapodiformes","rank":"Order","ipa":"","etymology":"","common":["giant squid","firefly squid"],"tag":"Their head is without tentacle pockets, eyes lack a corneal covering, arms and tentacle clubs may have hooks, the buccal supports are without suckers, and oviducts in females are paired.","imgs":["https://upload.wikimedia.org/wikipedia/commons/c/c0/Watasenia_scintillans_%28rotated%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Slosarczykovia_circumantarctica_122_mm_ML.jpg/330px-Slosarczykovia_circumantarctica_122_mm_ML.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fd/Octosquid.jpg/330px-Octosquid.jpg","https://upload.wikimedia.org/wikipedia/commons/f/fa/Joubiniteuthis_portieri.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e7/Cranchiidae_sp.jpg/250px-Cranchiidae_sp.jpg","https://upload.wikimedia.org/wikipedia/commons/9/92/Dosidicus_gigas.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3c/Giant_squid_Ranheim.jpg/250px-Giant_squid_Ranheim.jpg"]},{"name":"Gastropoda","parent":"Conchifera","rank":"Class","ipa":"ɡæsˈtrɒpədə","common":["slugs","snails","nudibranchs","conches","periwinkles","whelks"],"tag":"Snails and slugs from saltwater, freshwater, and from the land","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Grapevinesnail_01a.jpg/120px-Grapevinesnail_01a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Slimaczek.jpg/330px-Slimaczek.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4a/Slug_02.jpg/330px-Slug_02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Common_limpets1.jpg/330px-Common_limpets1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Berghia_coerulescens_%28Laurillard%2C_1830%29.jpg/330px-Berghia_coerulescens_%28Laurillard%2C_1830%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Chromodoris_lochi_%28AA3%29.jpg/330px-Chromodoris_lochi_%28AA3%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/57/Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg/330px-Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Queen_Conch_%28Lobatus_gigas%29.jpg/330px-Queen_Conch_%28Lobatus_gigas%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/LivingAbalone.JPG/330px-LivingAbalone.JPG"]},{"name":"Patellogastropoda","parent":"Gastropoda","rank":"Subclass","ipa":"","common":["true limpets"],"tag":"They have flattened, cone-shaped shells, and the majority of species are commonly found adhering strongly to rocks or other hard substrates. Most species feed on algae. Some return to the same spot on the rock known just before the tide recedes. The radula of limpets is among the strongest biological materials known.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/7f/Patelloida_pustulata_%28Helbling%2C_1779%29_%284631972937%29.jpg/250px-Patelloida_pustulata_%28Helbling%2C_1779%29_%284631972937%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8a/Collisella_pelta.jpg/330px-Collisella_pelta.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Common_limpets1.jpg/330px-Common_limpets1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/56/Napfschnecken_Galizien2005.jpg/250px-Napfschnecken_Galizien2005.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/Eoacmaea_profunda_%28MNHN-IM-2000-4977%29.jpeg/330px-Eoacmaea_profunda_%28MNHN-IM-2000-4977%29.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/88/Lapa_com%C3%BAn_%28Patella_vulgata%29%2C_Set%C3%BAbal%2C_Portugal%2C_2020-08-01%2C_DD_02.jpg/250px-Lapa_com%C3%BAn_%28Patella_vulgata%29%2C_Set%C3%BAbal%2C_Portugal%2C_2020-08-01%2C_DD_02.jpg"]},{"name":"Vetigastropoda","parent":"Gastropoda","rank":"Subclass","ipa":"","common":[],"tag":"Among the most primitive living gastropods. They have intersected crossed platy shell structure. Most vetigastropods have some bilateral asymmetry of their organ systems.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Angaria_Delphinus_Shell_Macro.JPG/250px-Angaria_Delphinus_Shell_Macro.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/Oxystele_variegata_-_ZooKeys-365-337-g004A.jpg/250px-Oxystele_variegata_-_ZooKeys-365-337-g004A.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/ba/Lucapina_suffusa_%28Reeve%2C_1850%29_%284947706383%29.jpg/250px-Lucapina_suffusa_%28Reeve%2C_1850%29_%284947706383%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2f/Fissurella_nimbosa_Linn%C3%A9%2C_1758_%284426866577%29.jpg/250px-Fissurella_nimbosa_Linn%C3%A9%2C_1758_%284426866577%29.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b2/Guilfordiayoka.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c0/Calliostoma_selectum.JPG/330px-Calliostoma_selectum.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/Turbo_Marmoratus_Madagascar.jpg/330px-Turbo_Marmoratus_Madagascar.jpg","https://upload.wikimedia.org/wikipedia/commons/0/05/Tegula_pulligo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Angaria_Delphinus_Shells_Macro.JPG/330px-Angaria_Delphinus_Shells_Macro.JPG","https://upload.wikimedia.org/wikipedia/commons/2/27/Paua.jpg"]},{"name":"Neritimorpha","parent":"Gastropoda","rank":"Subclass","ipa":"","common":[],"tag":"Contains some sea snails, limpets, freshwater snails, land snails and slugs. Neritomorphs typically have calcified opercula.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e5/Theodoxus_anatolicus_%28R%C3%A9cluz%2C_1841%29_%283000195752%29.jpg/250px-Theodoxus_anatolicus_%28R%C3%A9cluz%2C_1841%29_%283000195752%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/65/Nerita_plicata.jpg/250px-Nerita_plicata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Nerita_plicata_2.jpg/330px-Nerita_plicata_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/Vittina_coromandeliana_1.jpg/330px-Vittina_coromandeliana_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e5/Nerita_exuvia_shell.jpg/330px-Nerita_exuvia_shell.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b9/Titiscania_limacina.JPG/330px-Titiscania_limacina.JPG"]},{"name":"Caenogastropoda","parent":"Gastropoda","rank":"Subclass","ipa":"","common":["periwinkles","cowries","wentletraps","moon snails","murexes","cone snails","turrids"],"tag":"May have coiled or uncoiled shells. Includes some snails, slugs, and limpets. The pallial cavity contains the gill.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/Ampullaria_ampullacea_%28Linn%C3%A9%29_%282999358117%29.jpg/250px-Ampullaria_ampullacea_%28Linn%C3%A9%29_%282999358117%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b9/Acicula_lineata_%28Draparnaud%2C_1801%29_%284309322782%29.jpg/120px-Acicula_lineata_%28Draparnaud%2C_1801%29_%284309322782%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/Epitonium-scalare--Trp-6.png/250px-Epitonium-scalare--Trp-6.png","https://upload.wikimedia.org/wikipedia/commons/7/73/Charonia_tritonis.png","https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Acanthina_brevidentata_%28Wood%2C_1828%29_%283063441884%29.jpg/250px-Acanthina_brevidentata_%28Wood%2C_1828%29_%283063441884%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Neverita_didyma.jpg/250px-Neverita_didyma.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d9/Oncomelania_hupensis.jpg/250px-Oncomelania_hupensis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Caenogastropoda_various_examples_2.jpg/330px-Caenogastropoda_various_examples_2.jpg"]},{"name":"Euthyneura","parent":"Gastropoda","rank":"Infraclass","ipa":"","common":[],"tag":"Named for the intestines, heart, nephridia, gills, and nerve cords evolving to be twisted but to then, in this clade, evolving to be untwisted.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/57/Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg/330px-Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b6/Sea_angel.jpg/330px-Sea_angel.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Grapevinesnail_01a.jpg/250px-Grapevinesnail_01a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Limax_maximus_5.jpg/250px-Limax_maximus_5.jpg"]},{"name":"Nudipleura","parent":"Euthyneura","rank":"Superorder","ipa":"","common":["nudibranchs"],"tag":"A clade of sea slugs without a shell or with a highly reduced shell; many are very colourful.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/Glaucus_atlanticus_1_cropped.jpg/250px-Glaucus_atlanticus_1_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/Chromodoris_willani_for_nudipixel.jpg/330px-Chromodoris_willani_for_nudipixel.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Berthella_martensi_%28Pilsbry%2C_1896%29.jpg/330px-Berthella_martensi_%28Pilsbry%2C_1896%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Berthella_ornata.JPG/330px-Berthella_ornata.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Gills_of_pleurobranch_sea_slug_Berthella_martensi_%28Pilsbry%2C_1896%29.jpg/330px-Gills_of_pleurobranch_sea_slug_Berthella_martensi_%28Pilsbry%2C_1896%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Berghia_coerulescens_%28Laurillard%2C_1830%29.jpg/330px-Berghia_coerulescens_%28Laurillard%2C_1830%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/57/Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg/330px-Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/05/Nudi_from_tidepool.jpg/330px-Nudi_from_tidepool.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/af/Tritoniopsis_elegans.jpg/330px-Tritoniopsis_elegans.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/Nudi_branch.jpg/330px-Nudi_branch.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/Goniobranchus_Kuniei.jpg/330px-Goniobranchus_Kuniei.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/Mystery_mollusc.jpg/330px-Mystery_mollusc.jpg"]},{"name":"Euopisthobranchia","parent":"Euthyneura","rank":"Clade","ipa":"","common":["headshield slugs","bubble snails","sea hares","sea butterflies","sea angels"],"tag":"A molecular clade that includes the bubble shells, sea hares and pteropods.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/ac/Aplysia_californica_NHGRI-79108.jpg/250px-Aplysia_californica_NHGRI-79108.jpg","https://upload.wikimedia.org/wikipedia/commons/1/1d/Tylodina_perversa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/63/Umbraculum_umbraculum.jpg/330px-Umbraculum_umbraculum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/16/Haminoea_cymbalum_R%C3%A9union.JPG/330px-Haminoea_cymbalum_R%C3%A9union.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Chelidonura_varians.JPG/250px-Chelidonura_varians.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/1/13/Karukerina_antola_%28MNHN-IM-2000-26967%29.jpeg/330px-Karukerina_antola_%28MNHN-IM-2000-26967%29.jpeg","https://upload.wikimedia.org/wikipedia/commons/e/ef/Aplysia_californica.jpg","https://upload.wikimedia.org/wikipedia/commons/7/7c/LimacinaHelicinaNOAA.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b6/Sea_angel.jpg/330px-Sea_angel.jpg"]},{"name":"Panpulmonata","parent":"Euthyneura","rank":"Subcohort","ipa":"","common":["garden snails","pond snails","ramshorn snails","bladder snails"],"tag":"A group of terrestrial or freshwater snails. They are hermaphroditic, mostly simultaneously hermaphroditic. They have a single gonad (the ovotestis) that produces both eggs and sperm","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5d/Biomphalaria_glabrata.jpg/250px-Biomphalaria_glabrata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Grapevinesnail_01a.jpg/250px-Grapevinesnail_01a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f2/Ancylus_fluviatilis_O.F.M%C3%BCller%2C_1774_%284206383684%29.jpg/250px-Ancylus_fluviatilis_O.F.M%C3%BCller%2C_1774_%284206383684%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/False_Limpet_Shell_Macro_Digon3.jpg/250px-False_Limpet_Shell_Macro_Digon3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d1/Snail-WA.jpg/330px-Snail-WA.jpg","https://upload.wikimedia.org/wikipedia/commons/5/52/Elysia_clarki%2C_Florida.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8a/Oxynoe_viridis_cropped.jpg/250px-Oxynoe_viridis_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/e/e6/Acochlidium_fijiiensis.png","https://upload.wikimedia.org/wikipedia/commons/c/c3/Turbonilla_acutissima.png","https://upload.wikimedia.org/wikipedia/commons/thumb/6/61/Lymnea-snail.JPG/330px-Lymnea-snail.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9f/Onchidella_nigricans_195907923.jpg/330px-Onchidella_nigricans_195907923.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Limax_maximus_5.jpg/250px-Limax_maximus_5.jpg"]},{"name":"Bivalvia","parent":"Conchifera","rank":"Class","ipa":"baɪˈvælviə","common":["clams","oysters","cockles","mussels","scallops"],"tag":"Aquatic molluscs (marine and freshwater) that have laterally compressed soft bodies enclosed by a calcified exoskeleton consisting of a hinged pair of half-shells known as valves. Most are are benthic filter feeders that bury themselves in sediment.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/41/Bivalve_Sea_Shell.png/120px-Bivalve_Sea_Shell.png","https://upload.wikimedia.org/wikipedia/commons/3/3b/LittleNeck_clams_USDA96c1862.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e9/Geoduck_held_in_two_hands.jpg/250px-Geoduck_held_in_two_hands.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Crassostrea_gigas_p1040848.jpg/330px-Crassostrea_gigas_p1040848.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/98/Sydney_rock_oysters.jpg/330px-Sydney_rock_oysters.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Coque_blanche_%28Cerastoderma_edule%29.jpg/250px-Coque_blanche_%28Cerastoderma_edule%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bc/Mytilus_with_byssus.jpg/250px-Mytilus_with_byssus.jpg","https://upload.wikimedia.org/wikipedia/commons/0/09/Argopecten_irradians.jpg"]},{"name":"Heterodonta","parent":"Bivalvia","rank":"Subclass","ipa":"","common":["cockles","Venus clams","freshwater mussels","brooch clams"],"tag":"Their shell has two equally sized halves with a few cardinal teeth separated from a number of long lateral teeth. Their shells lack a nacreous layer, and the gills are lamellibranch in form. Most species have a siphon.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/PZSL1852PlateMollusca17_clean.png/250px-PZSL1852PlateMollusca17_clean.png","https://upload.wikimedia.org/wikipedia/commons/thumb/a/af/Freshwater_mussels.jpg/330px-Freshwater_mussels.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Sunetta_meroe_002.jpg/330px-Sunetta_meroe_002.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Coque_blanche_%28Cerastoderma_edule%29.jpg/250px-Coque_blanche_%28Cerastoderma_edule%29.jpg"]},{"name":"Palaeoheterodonta","parent":"Bivalvia","rank":"Subclass","ipa":"","common":["freshwater mussels"],"tag":"Their two shell halves are equal size and shape, but the hinge teeth are in a single row, instead of separated into two groups.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f0/Neotrigonia_margaritacea.jpg/330px-Neotrigonia_margaritacea.jpg","https://upload.wikimedia.org/wikipedia/commons/2/25/Anodonta_anatina1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/af/Freshwater_mussels.jpg/330px-Freshwater_mussels.jpg"]},{"name":"Protobranchia","parent":"Bivalvia","rank":"Subclass","ipa":"","common":["nut clams"],"tag":"Deep water clams with a hinge that uses many similar, small teeth; generally with a central ligament pit; large labial palps which are used in deposit feeding; the gills used only for respiration; the anterior and posterior adductor muscles are nearly equal in size; the foot is divided sagittally and longitudinally with papillate margins.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Acila_cobboldiae.jpg/250px-Acila_cobboldiae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dc/Nucula_nucleus_2008-09-09-63.jpg/330px-Nucula_nucleus_2008-09-09-63.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e7/Solemya_elarraichensis_holotype.jpg/330px-Solemya_elarraichensis_holotype.jpg"]},{"name":"Pteriomorphia","parent":"Bivalvia","rank":"Subclass","ipa":"","common":["marine mussels","scallops","pen shells","oysters"],"tag":"They have lamellibranch gills, are epibenthic, some attach to the substrate using a byssus, the foot is reduced, and gills are usually large and assist in feeding. Some members have rudimentary eyes, unlike other bivalves.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/bc/Mytilus_with_byssus.jpg/250px-Mytilus_with_byssus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/CornishMussels.JPG/330px-CornishMussels.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6a/Pectinidae_-_Argopecten_irradians.JPG/330px-Pectinidae_-_Argopecten_irradians.JPG","https://upload.wikimedia.org/wikipedia/commons/0/09/Argopecten_irradians.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/23/Scallop_eyes2.jpg/330px-Scallop_eyes2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cc/Atrina_rigida_no.1.jpg/250px-Atrina_rigida_no.1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3c/Atrina_serrata.jpg/330px-Atrina_serrata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Pinnidae_-_Pinna_nobilis.jpg/250px-Pinnidae_-_Pinna_nobilis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Crassostrea_gigas_p1040847.jpg/330px-Crassostrea_gigas_p1040847.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/98/Sydney_rock_oysters.jpg/330px-Sydney_rock_oysters.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4b/Spondylus_varius.jpg/330px-Spondylus_varius.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Spondylus_crassisquama.jpg/330px-Spondylus_crassisquama.jpg"]},{"name":"Scaphopoda","parent":"Conchifera","rank":"Class","ipa":"skæˈfɒpədə","etymology":"'shovel foot'","common":["tusk shells"],"tag":"They have tapering shells that are conical and slightly curved to the dorsal side. The adult lives buried in sand or mud, with their head-end pointed downwards. The narrow posterior end of the shell sticks up into the seawater for water exchange and waste expulsion. Their tentacles dig for food and eat with a radula. They have no gills.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/bc/Natural_History_-_Mollusca_-_Dentalium_Tarentinum.png/40px-Natural_History_-_Mollusca_-_Dentalium_Tarentinum.png","https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/Calliodentalium_semitracheatum_%28MNHN-IM-2012-13993%29.jpeg/330px-Calliodentalium_semitracheatum_%28MNHN-IM-2012-13993%29.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/Antalis_vulgaris.jpg/330px-Antalis_vulgaris.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/Pulsellum_filiforme_%28MNHN-IM-2000-24333%29_001.jpeg/330px-Pulsellum_filiforme_%28MNHN-IM-2000-24333%29_001.jpeg"]}],{},{"120px-Acicula_lineata_(Draparnaud,_1801)_(4309322782).jpg":[120,317,"#b9a996"],"120px-Bivalve_Sea_Shell.png":[120,111,null],"120px-Chiton_magnificus.jpg":[120,174,"#8c878c"],"120px-Epimenia_verrucosa.jpg":[120,124,"#c3b298"],"120px-Falcidens_crossotus.jpg":[120,56,"#3a321f"],"120px-Grapevinesnail_01a.jpg":[120,69,"#c8c0b7"],"120px-Octopus_vulgaris_Merculiano.jpg":[120,133,"#ccbaa9"],"250px-Acanthina_brevidentata_(Wood,_1828)_(3063441884).jpg":[250,179,"#acaaa3"],"250px-Acila_cobboldiae.jpg":[250,421,"#554438"],"250px-Ampullaria_ampullacea_(Linné)_(2999358117).jpg":[250,258,"#bab0a5"],"250px-Ancylus_fluviatilis_O.F.Müller,_1774_(4206383684).jpg":[250,83,"#d2bfb0"],"250px-Angaria_Delphinus_Shell_Macro.JPG":[250,187,"#dddad6"],"250px-Aplysia_californica_NHGRI-79108.jpg":[250,138,"#a59592"],"250px-Atrina_rigida_no.1.jpg":[250,333,"#a5a2a0"],"250px-Biomphalaria_glabrata.jpg":[250,315,"#e5b6ab"],"250px-Chelidonura_varians.JPG":[250,350,"#548373"],"250px-Chtenopteryx_sicula_1.jpg":[250,387,"#ebebeb"],"250px-Coque_blanche_(Cerastoderma_edule).jpg":[250,333,"#627e91"],"250px-Cranchiidae_sp.jpg":[250,267,"#080912"],"250px-Dondersia_annulata,_Nudi_Falls_imported_from_iNaturalist_photo_95332364.jpg":[250,333,"#4c210f"],"250px-Epitonium-scalare--Trp-6.png":[250,330,null],"250px-False_Limpet_Shell_Macro_Digon3.jpg":[250,187,"#ada697"],"250px-Fissurella_nimbosa_Linné,_1758_(4426866577).jpg":[250,95,"#bfb299"],"250px-Geoduck_held_in_two_hands.jpg":[250,375,"#eaded6"],"250px-Giant_clam_or_Tridacna_gigas.jpg":[250,333,"#798588"],"250px-Giant_squid_Ranheim.jpg":[250,375,"#717171"],"250px-Glaucus_atlanticus_1_cropped.jpg":[250,243,"#d6d9df"],"250px-Graneledone_boreopacifica2.jpg":[250,240,"#373b3f"],"250px-Grapevinesnail_01a.jpg":[250,143,"#c8bfb7"],"250px-Heteroteuthis_hawaiiensis1.jpg":[250,161,"#dadada"],"250px-Kalamar.jpg":[250,333,"#4e462a"],"250px-Lapa_común_(Patella_vulgata),_Setúbal,_Portugal,_2020-08-01,_DD_02.jpg":[250,250,"#7a6c4a"],"250px-Limax_maximus_5.jpg":[250,276,"#87847c"],"250px-Lucapina_suffusa_(Reeve,_1850)_(4947706383).jpg":[250,128,"#c3b79c"],"250px-Mytilus_with_byssus.jpg":[250,375,"#796f57"],"250px-Napfschnecken_Galizien2005.jpg":[250,250,"#817168"],"250px-Nautilus_belauensis_from_Palau.jpg":[250,187,"#4e45a2"],"250px-Neopilina.jpg":[250,296,"#645d57"],"250px-Nerita_plicata.jpg":[250,250,"#7b775c"],"250px-Neverita_didyma.jpg":[250,187,"#afa398"],"250px-Octopus_vulgaris_Merculiano.jpg":[250,278,"#cdbbab"],"250px-Oncomelania_hupensis.jpg":[250,326,"#cfbaae"],"250px-Oxynoe_viridis_cropped.jpg":[250,246,"#745927"],"250px-Oxystele_variegata_-_ZooKeys-365-337-g004A.jpg":[250,231,"#c1bfb7"],"250px-PZSL1852PlateMollusca17_clean.png":[250,379,"#e0dbcf"],"250px-Patelloida_pustulata_(Helbling,_1779)_(4631972937).jpg":[250,167,"#d1c5a9"],"250px-Pinnidae_-_Pinna_nobilis.jpg":[250,333,"#407570"],"250px-Sepia_officinalis_2.jpg":[250,164,"#323029"],"250px-Spirula_spirula_illustration.jpg":[250,308,"#2d2e32"],"250px-Spirula_spirula_lateral-view.jpg":[250,284,"#454345"],"250px-Squid_komodo.jpg":[250,333,"#161c15"],"250px-Suckers_of_octopus_by_steve_lodefink.jpg":[250,363,"#a1655f"],"250px-Theodoxus_anatolicus_(Récluz,_1841)_(3000195752).jpg":[250,214,"#aba59f"],"250px-Vampire_des_abysses.jpg":[250,169,"#202b31"],"250px-Vampyroteuthis_infernalis_arms.jpg":[250,260,"#d4c8bf"],"330px-Acanthopleura_granulata_with_Nerita_tessellata.jpg":[330,247,"#807d63"],"330px-Angaria_Delphinus_Shells_Macro.JPG":[330,248,"#dfdbd7"],"330px-Antalis_vulgaris.jpg":[330,221,"#1a1711"],"330px-Ascarosepion_pfefferi_1.jpg":[330,222,"#4f442a"],"330px-Atrina_serrata.jpg":[330,247,"#9b917d"],"330px-Australian_Giant_Cuttlefish,_Australia_imported_from_iNaturalist_photo_479494705.jpg":[330,247,"#5e5d57"],"330px-Bathyteuthisabyssicola.jpg":[330,248,"#ebddd4"],"330px-Berghia_coerulescens_(Laurillard,_1830).jpg":[330,186,"#6b5b42"],"330px-Berthella_martensi_(Pilsbry,_1896).jpg":[330,247,"#64434c"],"330px-Berthella_ornata.JPG":[330,235,"#98764d"],"330px-Blue_dragon-glaucus_atlanticus_(8599051974).jpg":[330,247,"#67624f"],"330px-Bobtail_squid.jpg":[330,264,"#888685"],"330px-Caenogastropoda_various_examples_2.jpg":[330,298,"#3c3127"],"330px-Calliodentalium_semitracheatum_(MNHN-IM-2012-13993).jpeg":[330,229,"#0d0c0c"],"330px-Calliostoma_selectum.JPG":[330,247,"#a1805b"],"330px-Chaetoderma_nitidulum.jpg":[330,224,"#504e44"],"330px-Chromodoris_lochi_(AA3).jpg":[330,247,"#6b4e39"],"330px-Chromodoris_willani_for_nudipixel.jpg":[330,247,"#723f2c"],"330px-Collisella_pelta.jpg":[330,220,"#494a47"],"330px-Common_limpets1.jpg":[330,248,"#73726f"],"330px-CornishMussels.JPG":[330,247,"#50525a"],"330px-Crassostrea_gigas_p1040847.jpg":[330,215,"#8e8882"],"330px-Crassostrea_gigas_p1040848.jpg":[330,230,"#c5bdb1"],"330px-Cuttlefish_eye.jpg":[330,247,"#86706f"],"330px-Dumbo-hires_(cropped).jpg":[329,279,"#323336"],"330px-Enteroctopus_dofleini_in_aquarium_rotated.jpg":[330,247,"#7b7255"],"330px-Eoacmaea_profunda_(MNHN-IM-2000-4977).jpeg":[330,231,"#3f3832"],"330px-Euprymna_scolopes_(Bobtail_squid_in_orange_form).jpg":[330,247,"#8d7960"],"330px-Fish3566_-_Flickr_-_NOAA_Photo_Library.jpg":[330,219,"#76674d"],"330px-Freshwater_mussels.jpg":[330,247,"#7e7667"],"330px-Gills_of_pleurobranch_sea_slug_Berthella_martensi_(Pilsbry,_1896).jpg":[330,247,"#3f130e"],"330px-Goniobranchus_Kuniei.jpg":[330,195,"#3d2918"],"330px-Haminoea_cymbalum_Réunion.JPG":[330,245,"#6b552a"],"330px-Idiosepius_paradoxus_himeika03_1.jpg":[330,186,"#c4b8a7"],"330px-Karukerina_antola_(MNHN-IM-2000-26967).jpeg":[330,240,"#545531"],"330px-LivingAbalone.JPG":[330,246,"#67614e"],"330px-Logilo_cc.jpg":[330,138,"#43372f"],"330px-Lymnea-snail.JPG":[330,264,"#3b3027"],"330px-MBNMS_-_Juvenile_Vampire_Squid_(27667875204).jpg":[330,249,"#1c3e71"],"330px-Mystery_mollusc.jpg":[330,284,"#2d3337"],"330px-Nautilus_belauensis_from_Palau.jpg":[330,247,"#4f46a3"],"330px-Nautilus_pompilius_(head).jpg":[330,220,"#514c39"],"330px-Neotrigonia_margaritacea.jpg":[330,165,"#4b3525"],"330px-Nerita_exuvia_shell.jpg":[330,267,"#8d7e77"],"330px-Nerita_plicata_2.jpg":[330,248,"#6d6244"],"330px-Nucula_nucleus_2008-09-09-63.jpg":[330,206,"#94948d"],"330px-Nudi_branch.jpg":[330,220,"#412c20"],"330px-Nudi_from_tidepool.jpg":[330,290,"#8b746a"],"330px-Octopus2.jpg":[330,251,"#757d68"],"330px-Octopus3.jpg":[330,267,"#386568"],"330px-Octopus_vulgaris_,_Октопод_!.JPG":[330,247,"#463032"],"330px-Octosquid.jpg":[330,247,"#9e999b"],"330px-Onchidella_nigricans_195907923.jpg":[330,220,"#7f6d43"],"330px-Pectinidae_-_Argopecten_irradians.JPG":[330,248,"#4c5778"],"330px-Pu_-_Vampyroteuthis_infernalis_-_2.jpg":[330,220,"#a79078"],"330px-Pulsellum_filiforme_(MNHN-IM-2000-24333)_001.jpeg":[330,229,"#0b0b0b"],"330px-Queen_Conch_(Lobatus_gigas).jpg":[330,264,"#a6a36c"],"330px-Reef1072_-_Flickr_-_NOAA_Photo_Library.jpg":[330,247,"#8a735f"],"330px-Rossia_pacifica.jpg":[330,283,"#896e38"],"330px-Scallop_eyes2.jpg":[330,184,"#984c18"],"330px-Sea_angel.jpg":[330,219,"#3a362e"],"330px-Sepiola_atlantica.jpg":[330,247,"#2d2d28"],"330px-Sepioteuthis_sepioidea_(Caribbean_Reef_Squid).jpg":[330,247,"#a8c3bd"],"330px-Slimaczek.jpg":[330,263,"#414824"],"330px-Slosarczykovia_circumantarctica_122_mm_ML.jpg":[330,191,"#bab0ac"],"330px-Slug_02.jpg":[330,258,"#905e2e"],"330px-Snail-WA.jpg":[330,297,"#698f4b"],"330px-Solemya_elarraichensis_holotype.jpg":[330,183,"#867965"],"330px-Spirula_spirula1.jpg":[330,197,"#e7e0dc"],"330px-Spondylus_crassisquama.jpg":[330,214,"#dabeb7"],"330px-Spondylus_varius.jpg":[330,247,"#746458"],"330px-Sunetta_meroe_002.jpg":[330,218,"#7b6354"],"330px-Sydney_rock_oysters.jpg":[330,248,"#7f786b"],"330px-Titiscania_limacina.JPG":[330,262,"#474539"],"330px-Tonicella-lineata.jpg":[330,200,"#785c4b"],"330px-Tritoniopsis_elegans.jpg":[330,247,"#372125"],"330px-Tropical_Pygmy_Squid_(Idiosepius_pygmaeus)_(25377304317).jpg":[330,247,"#6c5d47"],"330px-Turbo_Marmoratus_Madagascar.jpg":[330,264,"#293735"],"330px-Umbraculum_umbraculum.jpg":[330,247,"#44483e"],"330px-Vampyroteuthis_infernalis_dorsal_view.jpg":[330,217,"#bbaca5"],"330px-Veleropilina_oligotropha.jpg":[330,246,"#4c453b"],"330px-Vinogradski_puz_glava.jpg":[330,266,"#a7a195"],"330px-Vittina_coromandeliana_1.jpg":[330,254,"#716c3e"],"330px-アオリイカ-Sepioteuthis_lessoniana.jpg":[330,220,"#575f88"],"40px-Natural_History_-_Mollusca_-_Dentalium_Tarentinum.png":[40,119,"#d2d2d2"],"60px-Tryblidium_reticulatum_2.jpg":[60,88,"#b7b7b7"],"Acochlidium_fijiiensis.png":[132,284,"#d1cdbb"],"Allonautilus_scrobiculatus.jpg":[640,425,"#3c7c8d"],"Anodonta_anatina1.jpg":[468,359,"#6d6962"],"Aplysia_californica.jpg":[400,289,"#763c3f"],"Argopecten_irradians.jpg":[720,389,"#645743"],"Caribbean_reef_squid.jpg":[793,600,"#379ab7"],"Charonia_tritonis.png":[100,200,null],"Cuttlefish_komodo_large.jpg":[600,450,"#313837"],"Dosidicus_gigas.jpg":[384,280,"#2f382e"],"Elysia_clarki,_Florida.jpg":[480,342,"#7d8170"],"Guilfordiayoka.jpg":[591,591,"#15100a"],"Joubiniteuthis_portieri.jpg":[568,458,"#151a18"],"LimacinaHelicinaNOAA.jpg":[600,450,"#1b1823"],"LittleNeck_clams_USDA96c1862.jpg":[640,432,"#856765"],"Nautilus_pompilius.jpg":[640,480,"#918592"],"Paua.jpg":[720,540,"#5d6b6f"],"Spirula_spirula4.jpg":[440,289,"#e9e1dd"],"Tegula_pulligo.jpg":[568,488,"#7c6660"],"Turbonilla_acutissima.png":[157,327,"#3b3937"],"Tylodina_perversa.jpg":[335,327,"#6b651c"],"Uroteuthis_noctiluca.jpeg":[475,599,"#a6aba9"],"Watasenia_scintillans_(rotated).jpg":[784,273,"#e0d9d1"]})
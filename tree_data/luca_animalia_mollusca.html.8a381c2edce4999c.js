@@ -0,0 +1 @@
+TreeData.register_html("luca_animalia_mollusca","<ul class=\"tree\" data-tree-range=\"mollusca\"><li><input type=\"checkbox\" checked id=\"Spiralia_Mollusca\"><label class=\"tree_label\" for=\"Spiralia_Mollusca\"></label><div class=\"outer_tree_box\"><div id=\"mollusca_mollusca\" class=\"tree_box\"><span><span>Mollusca</span><a href=\"https://en.wikipedia.org/wiki/Mollusca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mollusca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mollusca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Mollusca\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"animalia\">See parent</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(snails, sea slugs, bivalves, cockles, octopuses, squids, cuttlefish, nudibranchs)</span><p class=\"tag\">Extant species have a soft body composed almost entirely of muscle, a mantle with a significant cavity used for breathing and excretion, the presence of a radula (except for bivalves), and the structure of the nervous system.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Grapevinesnail_01.jpg\" target=\"_blank\"><img src=\"thumbnails/Grapevinesnail_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"1024\" height=\"604\" style=\"background-color:#d6cec7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bivalve_Sea_Shell.png\" target=\"_blank\"><img src=\"thumbnails/Bivalve_Sea_Shell.png\" class=\"taxa-img\" loading=\"lazy\" width=\"473\" height=\"436\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sepioteuthis_sepioidea_%28Caribbean_Reef_Squid%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sepioteuthis_sepioidea_%28Caribbean_Reef_Squid%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a8c3bd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tonicella-lineata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tonicella-lineata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"200\" style=\"background-color:#785c4b\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Mollusca_Aculifera\"><label class=\"tree_label\" for=\"Mollusca_Aculifera\"></label><div class=\"outer_tree_box\"><div id=\"mollusca_aculifera\" class=\"tree_box\"><span><span>Aculifera</span><a href=\"https://en.wikipedia.org/wiki/Aculifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Aculifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Aculifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Aculifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subphylum</span></span><p class=\"tag\">Have no conch or shell.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Tonicella-lineata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tonicella-lineata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"200\" style=\"background-color:#785c4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Falcidens_crossotus.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Falcidens_crossotus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"56\" style=\"background-color:#3a321f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dondersia_annulata%2C_Nudi_Falls_imported_from_iNaturalist_photo_95332364.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dondersia_annulata%2C_Nudi_Falls_imported_from_iNaturalist_photo_95332364.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#4c210f\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_polyplacophora\" class=\"tree_box\"><span><span>Polyplacophora</span><a href=\"https://en.wikipedia.org/wiki/Polyplacophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Polyplacophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Polyplacophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Polyplacophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(chitons, sea cradles)</span><p class=\"tag\">Have a shell composed of eight separate shell plates or valves.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chiton_magnificus.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Chiton_magnificus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"174\" style=\"background-color:#8c878c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tonicella-lineata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tonicella-lineata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"200\" style=\"background-color:#785c4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acanthopleura_granulata_with_Nerita_tessellata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Acanthopleura_granulata_with_Nerita_tessellata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#807d63\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_caudofoveata\" class=\"tree_box\"><span><span>Caudofoveata</span><a href=\"https://en.wikipedia.org/wiki/Caudofoveata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Caudofoveata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Caudofoveata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Caudofoveata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Caudofoveata are worm-like molluscs mostly ranging from 0.02 cm to 10 cm.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Falcidens_crossotus.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Falcidens_crossotus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"56\" style=\"background-color:#3a321f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chaetoderma_nitidulum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chaetoderma_nitidulum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"224\" style=\"background-color:#504e44\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_solenogastres\" class=\"tree_box\"><span><span>Solenogastres</span><a href=\"https://en.wikipedia.org/wiki/Solenogastres\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Solenogastres\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Solenogastres\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Solenogastres\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Small, worm-like, shell-less molluscs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Epimenia_verrucosa.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Epimenia_verrucosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"124\" style=\"background-color:#c3b298\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dondersia_annulata%2C_Nudi_Falls_imported_from_iNaturalist_photo_95332364.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dondersia_annulata%2C_Nudi_Falls_imported_from_iNaturalist_photo_95332364.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#4c210f\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Mollusca_Conchifera\"><label class=\"tree_label\" for=\"Mollusca_Conchifera\"></label><div class=\"outer_tree_box\"><div id=\"mollusca_conchifera\" class=\"tree_box\"><span><span>Conchifera</span><a href=\"https://en.wikipedia.org/wiki/Conchifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Conchifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Conchifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Conchifera\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subphylum</span></span><p class=\"tag\">Members may bear a single shell, a single pair of shells, or lack a shell.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Giant_clam_or_Tridacna_gigas.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Giant_clam_or_Tridacna_gigas.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#798588\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nautilus_pompilius_%28head%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nautilus_pompilius_%28head%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#514c39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Octopus3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Octopus3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"267\" style=\"background-color:#386568\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Slimaczek.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Slimaczek.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"263\" style=\"background-color:#414824\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vinogradski_puz_glava.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vinogradski_puz_glava.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"266\" style=\"background-color:#a7a195\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CornishMussels.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-CornishMussels.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#50525a\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_monoplacophora\" class=\"tree_box\"><span><span>Monoplacophora</span><a href=\"https://en.wikipedia.org/wiki/Monoplacophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Monoplacophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Monoplacophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Monoplacophora\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌmɒnoʊpləˈkɒfərə\" target=\"_blank\">ˌmɒnoʊpləˈkɒfərə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Molluscs with a cap-like shell, inhabiting deep sea environments. Their reduced head lacks eyes or tentacles. They are a basal group of moluscs with primitive features like paired multiple organs.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Tryblidium_reticulatum_2.jpg\" target=\"_blank\"><img src=\"thumbnails/60px-Tryblidium_reticulatum_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"60\" height=\"88\" style=\"background-color:#b7b7b7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Veleropilina_oligotropha.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Veleropilina_oligotropha.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"246\" style=\"background-color:#4c453b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neopilina.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Neopilina.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"296\" style=\"background-color:#645d57\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Conchifera_Cephalopoda\"><label class=\"tree_label\" for=\"Conchifera_Cephalopoda\"></label><div class=\"outer_tree_box\"><div id=\"mollusca_cephalopoda\" class=\"tree_box\"><span><span>Cephalopoda</span><a href=\"https://en.wikipedia.org/wiki/Cephalopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cephalopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cephalopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Cephalopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=sɛfəˈlɒpədə\" target=\"_blank\">sɛfəˈlɒpədə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(squid, octopus, cuttlefish, nautilus)</span><p class=\"tag\">Characterized by bilateral body symmetry, a prominent head, a set of arms or tentacles with a two part beak in the center, usually a radula. Many species can squirt ink.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Octopus_vulgaris_Merculiano.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Octopus_vulgaris_Merculiano.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"133\" style=\"background-color:#ccbaa9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sepioteuthis_sepioidea_%28Caribbean_Reef_Squid%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sepioteuthis_sepioidea_%28Caribbean_Reef_Squid%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a8c3bd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Octopus2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Octopus2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#757d68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cuttlefish_komodo_large.jpg\" target=\"_blank\"><img src=\"thumbnails/Cuttlefish_komodo_large.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"450\" style=\"background-color:#313837\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nautilus_belauensis_from_Palau.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nautilus_belauensis_from_Palau.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4f46a3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nautilus_pompilius_%28head%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nautilus_pompilius_%28head%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#514c39\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_nautilida\" class=\"tree_box\"><span><span>Nautilida</span><a href=\"https://en.wikipedia.org/wiki/Nautilida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Nautilida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Nautilida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Nautilida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Have a coiled shell covering its body and tentacles that form two rings around its mouth. The eyes lack any lens or cornea they also lack ocular muscles.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Nautilus_belauensis_from_Palau.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nautilus_belauensis_from_Palau.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"187\" style=\"background-color:#4e45a2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nautilus_pompilius_%28head%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nautilus_pompilius_%28head%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#514c39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nautilus_pompilius.jpg\" target=\"_blank\"><img src=\"thumbnails/Nautilus_pompilius.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#918592\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Allonautilus_scrobiculatus.jpg\" target=\"_blank\"><img src=\"thumbnails/Allonautilus_scrobiculatus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#3c7c8d\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Cephalopoda_Octopodiformes\"><label class=\"tree_label\" for=\"Cephalopoda_Octopodiformes\"></label><div class=\"outer_tree_box\"><div id=\"mollusca_octopodiformes\" class=\"tree_box\"><span><span>Octopodiformes</span><a href=\"https://en.wikipedia.org/wiki/Octopodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Octopodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Octopodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Octopodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><p class=\"tag\">They have eight arms, although a branch has thin filaments that were modified from two extra tentacles.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Octopus_vulgaris_Merculiano.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Octopus_vulgaris_Merculiano.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"278\" style=\"background-color:#cdbbab\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vampyroteuthis_infernalis_dorsal_view.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vampyroteuthis_infernalis_dorsal_view.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#bbaca5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Octopus3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Octopus3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"267\" style=\"background-color:#386568\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Enteroctopus_dofleini_in_aquarium_rotated.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Enteroctopus_dofleini_in_aquarium_rotated.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7b7255\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pu_-_Vampyroteuthis_infernalis_-_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pu_-_Vampyroteuthis_infernalis_-_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a79078\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_vampyromorphida\" class=\"tree_box\"><span><span>Vampyromorphida</span><a href=\"https://en.wikipedia.org/wiki/Vampyromorphida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Vampyromorphida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Vampyromorphida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Vampyromorphida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(vampire squids)</span><p class=\"tag\">Found in extreme deep sea conditions using its bioluminescent organs and its unique oxygen metabolism. It has two long retractile filaments.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Vampire_des_abysses.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Vampire_des_abysses.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"169\" style=\"background-color:#202b31\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vampyroteuthis_infernalis_dorsal_view.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vampyroteuthis_infernalis_dorsal_view.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#bbaca5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vampyroteuthis_infernalis_arms.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Vampyroteuthis_infernalis_arms.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"260\" style=\"background-color:#d4c8bf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MBNMS_-_Juvenile_Vampire_Squid_%2827667875204%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-MBNMS_-_Juvenile_Vampire_Squid_%2827667875204%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#1c3e71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pu_-_Vampyroteuthis_infernalis_-_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pu_-_Vampyroteuthis_infernalis_-_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a79078\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_octopoda\" class=\"tree_box\"><span><span>Octopoda</span><a href=\"https://en.wikipedia.org/wiki/Octopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Octopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Octopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Octopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(octopus)</span><p class=\"tag\">Soft-bodied, eight-limbed molluscs. They can radically deform their shape and many can change colour. They use their siphon for respiration, waste disposal, discharging ink, and locomotion. They have a complex nervous system, excellent sight, and are among the most intelligent invertebrates.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Octopus_vulgaris_Merculiano.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Octopus_vulgaris_Merculiano.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"278\" style=\"background-color:#cdbbab\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Octopus3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Octopus3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"267\" style=\"background-color:#386568\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Enteroctopus_dofleini_in_aquarium_rotated.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Enteroctopus_dofleini_in_aquarium_rotated.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7b7255\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Suckers_of_octopus_by_steve_lodefink.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Suckers_of_octopus_by_steve_lodefink.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"363\" style=\"background-color:#a1655f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Octopus_vulgaris_%2C_%D0%9E%D0%BA%D1%82%D0%BE%D0%BF%D0%BE%D0%B4_%21.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Octopus_vulgaris_%2C_%D0%9E%D0%BA%D1%82%D0%BE%D0%BF%D0%BE%D0%B4_%21.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#463032\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Graneledone_boreopacifica2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Graneledone_boreopacifica2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"240\" style=\"background-color:#373b3f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fish3566_-_Flickr_-_NOAA_Photo_Library.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fish3566_-_Flickr_-_NOAA_Photo_Library.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#76674d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Reef1072_-_Flickr_-_NOAA_Photo_Library.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Reef1072_-_Flickr_-_NOAA_Photo_Library.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8a735f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dumbo-hires_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dumbo-hires_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"329\" height=\"279\" style=\"background-color:#323336\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Cephalopoda_Decapodiformes\"><label class=\"tree_label\" for=\"Cephalopoda_Decapodiformes\"></label><div class=\"outer_tree_box\"><div id=\"mollusca_decapodiformes\" class=\"tree_box\"><span><span>Decapodiformes</span><a href=\"https://en.wikipedia.org/wiki/Decapodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Decapodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Decapodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Decapodiformes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><p class=\"tag\">They have ten limbs, specifically eight short arms and two long tentacles.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:%E3%82%A2%E3%82%AA%E3%83%AA%E3%82%A4%E3%82%AB-Sepioteuthis_lessoniana.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%E3%82%A2%E3%82%AA%E3%83%AA%E3%82%A4%E3%82%AB-Sepioteuthis_lessoniana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#575f88\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sepiola_atlantica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sepiola_atlantica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#2d2d28\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sepia_officinalis_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sepia_officinalis_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"164\" style=\"background-color:#323029\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spirula_spirula_illustration.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Spirula_spirula_illustration.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"308\" style=\"background-color:#2d2e32\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_spirulida\" class=\"tree_box\"><span><span>Spirulida</span><a href=\"https://en.wikipedia.org/wiki/Spirulida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Spirulida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Spirulida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Spirulida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(ram&#x27;s horn squid)</span><p class=\"tag\">A deep-water squid-like mollusk with a light-emitting organ. They have no radula, at most a vestigial one. Its shell commonly floats onto beaches and is known as the ram&#x27;s horn shell.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Spirula_spirula_illustration.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Spirula_spirula_illustration.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"308\" style=\"background-color:#2d2e32\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spirula_spirula4.jpg\" target=\"_blank\"><img src=\"thumbnails/Spirula_spirula4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"440\" height=\"289\" style=\"background-color:#e9e1dd\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spirula_spirula1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Spirula_spirula1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"197\" style=\"background-color:#e7e0dc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spirula_spirula_lateral-view.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Spirula_spirula_lateral-view.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"284\" style=\"background-color:#454345\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_sepiida\" class=\"tree_box\"><span><span>Sepiida</span><a href=\"https://en.wikipedia.org/wiki/Sepiida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sepiida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sepiida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Sepiida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(cuttlefish)</span><p class=\"tag\">They have a unique internal shell, the cuttlebone, which is used for control of buoyancy. Their eyes have W-shaped pupils, and two tentacles are furnished with denticulated suckers. Some produce venom that&#x27;s excreted through their beak, and others can change colour. They eat small molluscs, crabs, shrimp, fish, octopuses, worms, and other cuttlefish. Life expectancy is about 1–2 years.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Sepia_officinalis_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sepia_officinalis_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"164\" style=\"background-color:#323029\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cuttlefish_komodo_large.jpg\" target=\"_blank\"><img src=\"thumbnails/Cuttlefish_komodo_large.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"450\" style=\"background-color:#313837\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Australian_Giant_Cuttlefish%2C_Australia_imported_from_iNaturalist_photo_479494705.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Australian_Giant_Cuttlefish%2C_Australia_imported_from_iNaturalist_photo_479494705.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5e5d57\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cuttlefish_eye.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cuttlefish_eye.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#86706f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kalamar.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Kalamar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#4e462a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ascarosepion_pfefferi_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ascarosepion_pfefferi_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"222\" style=\"background-color:#4f442a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_sepiolida\" class=\"tree_box\"><span><span>Sepiolida</span><a href=\"https://en.wikipedia.org/wiki/Sepiolida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sepiolida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sepiolida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Sepiolida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Suborder</span></span><span class=\"common_names\">(bobtail squid)</span><p class=\"tag\">They have a rounder mantle than cuttlefish and have no cuttlebone with a typical male mantle length being between 1 and 8 cm.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Heteroteuthis_hawaiiensis1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Heteroteuthis_hawaiiensis1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"161\" style=\"background-color:#dadada\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sepiola_atlantica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sepiola_atlantica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#2d2d28\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bobtail_squid.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bobtail_squid.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#888685\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rossia_pacifica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rossia_pacifica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"283\" style=\"background-color:#896e38\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Euprymna_scolopes_%28Bobtail_squid_in_orange_form%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Euprymna_scolopes_%28Bobtail_squid_in_orange_form%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8d7960\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_idiosepiidae\" class=\"tree_box\"><span><span>Idiosepiidae</span><a href=\"https://en.wikipedia.org/wiki/Idiosepiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Idiosepiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Idiosepiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Idiosepiidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(pygmy squids)</span><p class=\"tag\">The smallest known squids. The dorsal surface of the mantle has a unique oval adhesive organ, which secretes a sticky substance and is used to attach itself to seaweed or seagrass blades.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Tropical_Pygmy_Squid_%28Idiosepius_pygmaeus%29_%2825377304317%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tropical_Pygmy_Squid_%28Idiosepius_pygmaeus%29_%2825377304317%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6c5d47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Idiosepius_paradoxus_himeika03_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Idiosepius_paradoxus_himeika03_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#c4b8a7\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_myopsida\" class=\"tree_box\"><span><span>Myopsida</span><a href=\"https://en.wikipedia.org/wiki/Myopsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Myopsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Myopsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Myopsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(pencil squids, European common squids, reef squids)</span><p class=\"tag\">They lack a secondary eyelid. Their arms and tentacles are ornamented with simple suckers without hooks.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:%E3%82%A2%E3%82%AA%E3%83%AA%E3%82%A4%E3%82%AB-Sepioteuthis_lessoniana.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%E3%82%A2%E3%82%AA%E3%83%AA%E3%82%A4%E3%82%AB-Sepioteuthis_lessoniana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#575f88\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Squid_komodo.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Squid_komodo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#161c15\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caribbean_reef_squid.jpg\" target=\"_blank\"><img src=\"thumbnails/Caribbean_reef_squid.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"793\" height=\"600\" style=\"background-color:#379ab7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Logilo_cc.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Logilo_cc.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"138\" style=\"background-color:#43372f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Uroteuthis_noctiluca.jpeg\" target=\"_blank\"><img src=\"thumbnails/Uroteuthis_noctiluca.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"475\" height=\"599\" style=\"background-color:#a6aba9\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_bathyteuthida\" class=\"tree_box\"><span><span>Bathyteuthida</span><a href=\"https://en.wikipedia.org/wiki/Bathyteuthida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Bathyteuthida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Bathyteuthida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Bathyteuthida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Deep see squid with some bioluminescent species. They lack corneal membranes covering their eyes. They have tentacle pockets in the head and small suckers on the buccal supports.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Bathyteuthisabyssicola.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bathyteuthisabyssicola.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#ebddd4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chtenopteryx_sicula_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chtenopteryx_sicula_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"387\" style=\"background-color:#ebebeb\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_oegopsida\" class=\"tree_box\"><span><span>Oegopsida</span><a href=\"https://en.wikipedia.org/wiki/Oegopsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Oegopsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Oegopsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Oegopsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(giant squid, firefly squid)</span><p class=\"tag\">Their head is without tentacle pockets, eyes lack a corneal covering, arms and tentacle clubs may have hooks, the buccal supports are without suckers, and oviducts in females are paired.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Watasenia_scintillans_%28rotated%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Watasenia_scintillans_%28rotated%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"784\" height=\"273\" style=\"background-color:#e0d9d1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Slosarczykovia_circumantarctica_122_mm_ML.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Slosarczykovia_circumantarctica_122_mm_ML.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"191\" style=\"background-color:#bab0ac\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Octosquid.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Octosquid.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9e999b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Joubiniteuthis_portieri.jpg\" target=\"_blank\"><img src=\"thumbnails/Joubiniteuthis_portieri.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"568\" height=\"458\" style=\"background-color:#151a18\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cranchiidae_sp.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cranchiidae_sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"267\" style=\"background-color:#080912\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dosidicus_gigas.jpg\" target=\"_blank\"><img src=\"thumbnails/Dosidicus_gigas.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"384\" height=\"280\" style=\"background-color:#2f382e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Giant_squid_Ranheim.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Giant_squid_Ranheim.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#717171\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Conchifera_Gastropoda\"><label class=\"tree_label\" for=\"Conchifera_Gastropoda\"></label><div class=\"outer_tree_box\"><div id=\"mollusca_gastropoda\" class=\"tree_box\"><span><span>Gastropoda</span><a href=\"https://en.wikipedia.org/wiki/Gastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Gastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ɡæsˈtrɒpədə\" target=\"_blank\">ɡæsˈtrɒpədə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(slugs, snails, nudibranchs, conches, periwinkles, whelks)</span><p class=\"tag\">Snails and slugs from saltwater, freshwater, and from the land</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Grapevinesnail_01a.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Grapevinesnail_01a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"69\" style=\"background-color:#c8c0b7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Slimaczek.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Slimaczek.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"263\" style=\"background-color:#414824\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Slug_02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Slug_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"258\" style=\"background-color:#905e2e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Common_limpets1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Common_limpets1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#73726f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Berghia_coerulescens_%28Laurillard%2C_1830%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Berghia_coerulescens_%28Laurillard%2C_1830%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#6b5b42\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chromodoris_lochi_%28AA3%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chromodoris_lochi_%28AA3%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6b4e39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#67624f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Queen_Conch_%28Lobatus_gigas%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Queen_Conch_%28Lobatus_gigas%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#a6a36c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:LivingAbalone.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-LivingAbalone.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"246\" style=\"background-color:#67614e\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_patellogastropoda\" class=\"tree_box\"><span><span>Patellogastropoda</span><a href=\"https://en.wikipedia.org/wiki/Patellogastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Patellogastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Patellogastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Patellogastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><span class=\"common_names\">(true limpets)</span><p class=\"tag\">They have flattened, cone-shaped shells, and the majority of species are commonly found adhering strongly to rocks or other hard substrates. Most species feed on algae. Some return to the same spot on the rock known just before the tide recedes. The radula of limpets is among the strongest biological materials known.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Patelloida_pustulata_%28Helbling%2C_1779%29_%284631972937%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Patelloida_pustulata_%28Helbling%2C_1779%29_%284631972937%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"167\" style=\"background-color:#d1c5a9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Collisella_pelta.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Collisella_pelta.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#494a47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Common_limpets1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Common_limpets1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#73726f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Napfschnecken_Galizien2005.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Napfschnecken_Galizien2005.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#817168\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eoacmaea_profunda_%28MNHN-IM-2000-4977%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Eoacmaea_profunda_%28MNHN-IM-2000-4977%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#3f3832\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lapa_com%C3%BAn_%28Patella_vulgata%29%2C_Set%C3%BAbal%2C_Portugal%2C_2020-08-01%2C_DD_02.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lapa_com%C3%BAn_%28Patella_vulgata%29%2C_Set%C3%BAbal%2C_Portugal%2C_2020-08-01%2C_DD_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7a6c4a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_vetigastropoda\" class=\"tree_box\"><span><span>Vetigastropoda</span><a href=\"https://en.wikipedia.org/wiki/Vetigastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Vetigastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Vetigastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Vetigastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><p class=\"tag\">Among the most primitive living gastropods. They have intersected crossed platy shell structure. Most vetigastropods have some bilateral asymmetry of their organ systems.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Angaria_Delphinus_Shell_Macro.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Angaria_Delphinus_Shell_Macro.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"187\" style=\"background-color:#dddad6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oxystele_variegata_-_ZooKeys-365-337-g004A.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Oxystele_variegata_-_ZooKeys-365-337-g004A.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"231\" style=\"background-color:#c1bfb7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lucapina_suffusa_%28Reeve%2C_1850%29_%284947706383%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lucapina_suffusa_%28Reeve%2C_1850%29_%284947706383%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"128\" style=\"background-color:#c3b79c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fissurella_nimbosa_Linn%C3%A9%2C_1758_%284426866577%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fissurella_nimbosa_Linn%C3%A9%2C_1758_%284426866577%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"95\" style=\"background-color:#bfb299\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Guilfordiayoka.jpg\" target=\"_blank\"><img src=\"thumbnails/Guilfordiayoka.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"591\" height=\"591\" style=\"background-color:#15100a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Calliostoma_selectum.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Calliostoma_selectum.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a1805b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Turbo_Marmoratus_Madagascar.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Turbo_Marmoratus_Madagascar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#293735\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tegula_pulligo.jpg\" target=\"_blank\"><img src=\"thumbnails/Tegula_pulligo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"568\" height=\"488\" style=\"background-color:#7c6660\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Angaria_Delphinus_Shells_Macro.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Angaria_Delphinus_Shells_Macro.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#dfdbd7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Paua.jpg\" target=\"_blank\"><img src=\"thumbnails/Paua.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"720\" height=\"540\" style=\"background-color:#5d6b6f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_neritimorpha\" class=\"tree_box\"><span><span>Neritimorpha</span><a href=\"https://en.wikipedia.org/wiki/Neritimorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Neritimorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Neritimorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Neritimorpha\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><p class=\"tag\">Contains some sea snails, limpets, freshwater snails, land snails and slugs. Neritomorphs typically have calcified opercula.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Theodoxus_anatolicus_%28R%C3%A9cluz%2C_1841%29_%283000195752%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Theodoxus_anatolicus_%28R%C3%A9cluz%2C_1841%29_%283000195752%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"214\" style=\"background-color:#aba59f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nerita_plicata.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nerita_plicata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7b775c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nerita_plicata_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nerita_plicata_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#6d6244\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vittina_coromandeliana_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vittina_coromandeliana_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"254\" style=\"background-color:#716c3e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nerita_exuvia_shell.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nerita_exuvia_shell.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"267\" style=\"background-color:#8d7e77\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Titiscania_limacina.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Titiscania_limacina.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"262\" style=\"background-color:#474539\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_caenogastropoda\" class=\"tree_box\"><span><span>Caenogastropoda</span><a href=\"https://en.wikipedia.org/wiki/Caenogastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Caenogastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Caenogastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Caenogastropoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><span class=\"common_names\">(periwinkles, cowries, wentletraps, moon snails, murexes, cone snails, turrids)</span><p class=\"tag\">May have coiled or uncoiled shells. Includes some snails, slugs, and limpets. The pallial cavity contains the gill.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ampullaria_ampullacea_%28Linn%C3%A9%29_%282999358117%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ampullaria_ampullacea_%28Linn%C3%A9%29_%282999358117%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"258\" style=\"background-color:#bab0a5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acicula_lineata_%28Draparnaud%2C_1801%29_%284309322782%29.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Acicula_lineata_%28Draparnaud%2C_1801%29_%284309322782%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"317\" style=\"background-color:#b9a996\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Epitonium-scalare--Trp-6.png\" target=\"_blank\"><img src=\"thumbnails/250px-Epitonium-scalare--Trp-6.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"330\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Charonia_tritonis.png\" target=\"_blank\"><img src=\"thumbnails/Charonia_tritonis.png\" class=\"taxa-img\" loading=\"lazy\" width=\"100\" height=\"200\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acanthina_brevidentata_%28Wood%2C_1828%29_%283063441884%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Acanthina_brevidentata_%28Wood%2C_1828%29_%283063441884%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"179\" style=\"background-color:#acaaa3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neverita_didyma.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Neverita_didyma.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"187\" style=\"background-color:#afa398\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oncomelania_hupensis.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Oncomelania_hupensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"326\" style=\"background-color:#cfbaae\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caenogastropoda_various_examples_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caenogastropoda_various_examples_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"298\" style=\"background-color:#3c3127\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Gastropoda_Euthyneura\"><label class=\"tree_label\" for=\"Gastropoda_Euthyneura\"></label><div class=\"outer_tree_box\"><div id=\"mollusca_euthyneura\" class=\"tree_box\"><span><span>Euthyneura</span><a href=\"https://en.wikipedia.org/wiki/Euthyneura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Euthyneura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Euthyneura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Euthyneura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Infraclass</span></span><p class=\"tag\">Named for the intestines, heart, nephridia, gills, and nerve cords evolving to be twisted but to then, in this clade, evolving to be untwisted.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#67624f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sea_angel.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sea_angel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#3a362e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grapevinesnail_01a.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Grapevinesnail_01a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"143\" style=\"background-color:#c8bfb7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Limax_maximus_5.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Limax_maximus_5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"276\" style=\"background-color:#87847c\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_nudipleura\" class=\"tree_box\"><span><span>Nudipleura</span><a href=\"https://en.wikipedia.org/wiki/Nudipleura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Nudipleura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Nudipleura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Nudipleura\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Superorder</span></span><span class=\"common_names\">(nudibranchs)</span><p class=\"tag\">A clade of sea slugs without a shell or with a highly reduced shell; many are very colourful.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Glaucus_atlanticus_1_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Glaucus_atlanticus_1_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"243\" style=\"background-color:#d6d9df\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chromodoris_willani_for_nudipixel.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chromodoris_willani_for_nudipixel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#723f2c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Berthella_martensi_%28Pilsbry%2C_1896%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Berthella_martensi_%28Pilsbry%2C_1896%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#64434c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Berthella_ornata.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Berthella_ornata.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"235\" style=\"background-color:#98764d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gills_of_pleurobranch_sea_slug_Berthella_martensi_%28Pilsbry%2C_1896%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gills_of_pleurobranch_sea_slug_Berthella_martensi_%28Pilsbry%2C_1896%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3f130e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Berghia_coerulescens_%28Laurillard%2C_1830%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Berghia_coerulescens_%28Laurillard%2C_1830%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#6b5b42\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Blue_dragon-glaucus_atlanticus_%288599051974%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#67624f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nudi_from_tidepool.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nudi_from_tidepool.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"290\" style=\"background-color:#8b746a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tritoniopsis_elegans.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tritoniopsis_elegans.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#372125\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nudi_branch.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nudi_branch.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#412c20\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Goniobranchus_Kuniei.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Goniobranchus_Kuniei.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"195\" style=\"background-color:#3d2918\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mystery_mollusc.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mystery_mollusc.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"284\" style=\"background-color:#2d3337\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_euopisthobranchia\" class=\"tree_box\"><span><span>Euopisthobranchia</span><a href=\"https://en.wikipedia.org/wiki/Euopisthobranchia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Euopisthobranchia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Euopisthobranchia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Euopisthobranchia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(headshield slugs, bubble snails, sea hares, sea butterflies, sea angels)</span><p class=\"tag\">A molecular clade that includes the bubble shells, sea hares and pteropods.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Aplysia_californica_NHGRI-79108.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aplysia_californica_NHGRI-79108.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"138\" style=\"background-color:#a59592\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tylodina_perversa.jpg\" target=\"_blank\"><img src=\"thumbnails/Tylodina_perversa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"335\" height=\"327\" style=\"background-color:#6b651c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Umbraculum_umbraculum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Umbraculum_umbraculum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#44483e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Haminoea_cymbalum_R%C3%A9union.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Haminoea_cymbalum_R%C3%A9union.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#6b552a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chelidonura_varians.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Chelidonura_varians.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"350\" style=\"background-color:#548373\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Karukerina_antola_%28MNHN-IM-2000-26967%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Karukerina_antola_%28MNHN-IM-2000-26967%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"240\" style=\"background-color:#545531\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aplysia_californica.jpg\" target=\"_blank\"><img src=\"thumbnails/Aplysia_californica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"400\" height=\"289\" style=\"background-color:#763c3f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:LimacinaHelicinaNOAA.jpg\" target=\"_blank\"><img src=\"thumbnails/LimacinaHelicinaNOAA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"450\" style=\"background-color:#1b1823\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sea_angel.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sea_angel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#3a362e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_panpulmonata\" class=\"tree_box\"><span><span>Panpulmonata</span><a href=\"https://en.wikipedia.org/wiki/Panpulmonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Panpulmonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Panpulmonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Panpulmonata\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subcohort</span></span><span class=\"common_names\">(garden snails, pond snails, ramshorn snails, bladder snails)</span><p class=\"tag\">A group of terrestrial or freshwater snails. They are hermaphroditic, mostly simultaneously hermaphroditic. They have a single gonad (the ovotestis) that produces both eggs and sperm</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Biomphalaria_glabrata.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Biomphalaria_glabrata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"315\" style=\"background-color:#e5b6ab\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grapevinesnail_01a.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Grapevinesnail_01a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"143\" style=\"background-color:#c8bfb7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ancylus_fluviatilis_O.F.M%C3%BCller%2C_1774_%284206383684%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ancylus_fluviatilis_O.F.M%C3%BCller%2C_1774_%284206383684%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"83\" style=\"background-color:#d2bfb0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:False_Limpet_Shell_Macro_Digon3.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-False_Limpet_Shell_Macro_Digon3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"187\" style=\"background-color:#ada697\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Snail-WA.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Snail-WA.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"297\" style=\"background-color:#698f4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Elysia_clarki%2C_Florida.jpg\" target=\"_blank\"><img src=\"thumbnails/Elysia_clarki%2C_Florida.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"480\" height=\"342\" style=\"background-color:#7d8170\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oxynoe_viridis_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Oxynoe_viridis_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"246\" style=\"background-color:#745927\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acochlidium_fijiiensis.png\" target=\"_blank\"><img src=\"thumbnails/Acochlidium_fijiiensis.png\" class=\"taxa-img\" loading=\"lazy\" width=\"132\" height=\"284\" style=\"background-color:#d1cdbb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Turbonilla_acutissima.png\" target=\"_blank\"><img src=\"thumbnails/Turbonilla_acutissima.png\" class=\"taxa-img\" loading=\"lazy\" width=\"157\" height=\"327\" style=\"background-color:#3b3937\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lymnea-snail.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Lymnea-snail.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#3b3027\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Onchidella_nigricans_195907923.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Onchidella_nigricans_195907923.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7f6d43\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Limax_maximus_5.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Limax_maximus_5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"276\" style=\"background-color:#87847c\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Conchifera_Bivalvia\"><label class=\"tree_label\" for=\"Conchifera_Bivalvia\"></label><div class=\"outer_tree_box\"><div id=\"mollusca_bivalvia\" class=\"tree_box\"><span><span>Bivalvia</span><a href=\"https://en.wikipedia.org/wiki/Bivalvia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Bivalvia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Bivalvia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Bivalvia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=baɪˈvælviə\" target=\"_blank\">baɪˈvælviə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(clams, oysters, cockles, mussels, scallops)</span><p class=\"tag\">Aquatic molluscs (marine and freshwater) that have laterally compressed soft bodies enclosed by a calcified exoskeleton consisting of a hinged pair of half-shells known as valves. Most are are benthic filter feeders that bury themselves in sediment.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Bivalve_Sea_Shell.png\" target=\"_blank\"><img src=\"thumbnails/120px-Bivalve_Sea_Shell.png\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"111\"></a><a href=\"https://commons.wikimedia.org/wiki/File:LittleNeck_clams_USDA96c1862.jpg\" target=\"_blank\"><img src=\"thumbnails/LittleNeck_clams_USDA96c1862.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"432\" style=\"background-color:#856765\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Geoduck_held_in_two_hands.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Geoduck_held_in_two_hands.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#eaded6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crassostrea_gigas_p1040848.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Crassostrea_gigas_p1040848.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#c5bdb1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sydney_rock_oysters.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sydney_rock_oysters.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#7f786b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coque_blanche_%28Cerastoderma_edule%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Coque_blanche_%28Cerastoderma_edule%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#627e91\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mytilus_with_byssus.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Mytilus_with_byssus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#796f57\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Argopecten_irradians.jpg\" target=\"_blank\"><img src=\"thumbnails/Argopecten_irradians.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"720\" height=\"389\" style=\"background-color:#645743\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_heterodonta\" class=\"tree_box\"><span><span>Heterodonta</span><a href=\"https://en.wikipedia.org/wiki/Heterodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Heterodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Heterodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Heterodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><span class=\"common_names\">(cockles, Venus clams, freshwater mussels, brooch clams)</span><p class=\"tag\">Their shell has two equally sized halves with a few cardinal teeth separated from a number of long lateral teeth. Their shells lack a nacreous layer, and the gills are lamellibranch in form. Most species have a siphon.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:PZSL1852PlateMollusca17_clean.png\" target=\"_blank\"><img src=\"thumbnails/250px-PZSL1852PlateMollusca17_clean.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"379\" style=\"background-color:#e0dbcf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Freshwater_mussels.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Freshwater_mussels.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7e7667\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sunetta_meroe_002.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sunetta_meroe_002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"218\" style=\"background-color:#7b6354\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coque_blanche_%28Cerastoderma_edule%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Coque_blanche_%28Cerastoderma_edule%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#627e91\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_palaeoheterodonta\" class=\"tree_box\"><span><span>Palaeoheterodonta</span><a href=\"https://en.wikipedia.org/wiki/Palaeoheterodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Palaeoheterodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Palaeoheterodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Palaeoheterodonta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><span class=\"common_names\">(freshwater mussels)</span><p class=\"tag\">Their two shell halves are equal size and shape, but the hinge teeth are in a single row, instead of separated into two groups.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Neotrigonia_margaritacea.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Neotrigonia_margaritacea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"165\" style=\"background-color:#4b3525\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anodonta_anatina1.jpg\" target=\"_blank\"><img src=\"thumbnails/Anodonta_anatina1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"468\" height=\"359\" style=\"background-color:#6d6962\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Freshwater_mussels.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Freshwater_mussels.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7e7667\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_protobranchia\" class=\"tree_box\"><span><span>Protobranchia</span><a href=\"https://en.wikipedia.org/wiki/Protobranchia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Protobranchia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Protobranchia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Protobranchia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><span class=\"common_names\">(nut clams)</span><p class=\"tag\">Deep water clams with a hinge that uses many similar, small teeth; generally with a central ligament pit; large labial palps which are used in deposit feeding; the gills used only for respiration; the anterior and posterior adductor muscles are nearly equal in size; the foot is divided sagittally and longitudinally with papillate margins.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Acila_cobboldiae.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Acila_cobboldiae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"421\" style=\"background-color:#554438\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nucula_nucleus_2008-09-09-63.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nucula_nucleus_2008-09-09-63.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#94948d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Solemya_elarraichensis_holotype.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Solemya_elarraichensis_holotype.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"183\" style=\"background-color:#867965\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_pteriomorphia\" class=\"tree_box\"><span><span>Pteriomorphia</span><a href=\"https://en.wikipedia.org/wiki/Pteriomorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pteriomorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pteriomorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Pteriomorphia\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><span class=\"common_names\">(marine mussels, scallops, pen shells, oysters)</span><p class=\"tag\">They have lamellibranch gills, are epibenthic, some attach to the substrate using a byssus, the foot is reduced, and gills are usually large and assist in feeding. Some members have rudimentary eyes, unlike other bivalves.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Mytilus_with_byssus.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Mytilus_with_byssus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#796f57\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CornishMussels.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-CornishMussels.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#50525a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pectinidae_-_Argopecten_irradians.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Pectinidae_-_Argopecten_irradians.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4c5778\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Argopecten_irradians.jpg\" target=\"_blank\"><img src=\"thumbnails/Argopecten_irradians.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"720\" height=\"389\" style=\"background-color:#645743\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scallop_eyes2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scallop_eyes2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"184\" style=\"background-color:#984c18\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Atrina_rigida_no.1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Atrina_rigida_no.1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#a5a2a0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Atrina_serrata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Atrina_serrata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9b917d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pinnidae_-_Pinna_nobilis.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pinnidae_-_Pinna_nobilis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#407570\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crassostrea_gigas_p1040847.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Crassostrea_gigas_p1040847.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#8e8882\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sydney_rock_oysters.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sydney_rock_oysters.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#7f786b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spondylus_varius.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Spondylus_varius.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#746458\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spondylus_crassisquama.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Spondylus_crassisquama.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"214\" style=\"background-color:#dabeb7\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"mollusca_scaphopoda\" class=\"tree_box\"><span><span>Scaphopoda</span><a href=\"https://en.wikipedia.org/wiki/Scaphopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Scaphopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Scaphopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><a href=\"https://animaldiversity.org/accounts/Scaphopoda\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_animaldiversity.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=skæˈfɒpədə\" target=\"_blank\">skæˈfɒpədə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(tusk shells)</span><p class=\"tag\">They have tapering shells that are conical and slightly curved to the dorsal side. The adult lives buried in sand or mud, with their head-end pointed downwards. The narrow posterior end of the shell sticks up into the seawater for water exchange and waste expulsion. Their tentacles dig for food and eat with a radula. They have no gills.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Natural_History_-_Mollusca_-_Dentalium_Tarentinum.png\" target=\"_blank\"><img src=\"thumbnails/40px-Natural_History_-_Mollusca_-_Dentalium_Tarentinum.png\" class=\"taxa-img\" loading=\"lazy\" width=\"40\" height=\"119\" style=\"background-color:#d2d2d2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Calliodentalium_semitracheatum_%28MNHN-IM-2012-13993%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Calliodentalium_semitracheatum_%28MNHN-IM-2012-13993%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#0d0c0c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Antalis_vulgaris.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Antalis_vulgaris.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#1a1711\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pulsellum_filiforme_%28MNHN-IM-2000-24333%29_001.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Pulsellum_filiforme_%28MNHN-IM-2000-24333%29_001.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#0b0b0b\"></a></div></div></div></li></ul></li></ul></li></ul>")
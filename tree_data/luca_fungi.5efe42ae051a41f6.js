@@ -0,0 +1 @@
+TreeData.register("luca_fungi",[{"name":"Rozellomycota","parent":"Fungi","rank":"Phylum","ipa":"","ipa_alt":[""],"common":[],"tag":"Micro-organisms that they lack chitinous cell walls at any trophic stage in their lifecycle. Often parasitic.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Rozella_allomycis2.jpg/330px-Rozella_allomycis2.jpg","https://upload.wikimedia.org/wikipedia/commons/3/33/Fibrillanosema_spore.jpg"],"card":1},{"name":"Aphelidiomycota","parent":"Fungi","rank":"Phylum","ipa":"","ipa_alt":[""],"common":[],"tag":"Parasitoids of various algae and diatoms.","imgs":["https://upload.wikimedia.org/wikipedia/commons/a/a2/Amoeboaphelidium.jpg"],"card":1},{"name":"Eumycota","parent":"Fungi","rank":"Clade","ipa":"","ipa_alt":[""],"etymology":"'true'-'fungi'","common":[],"tag":"The true fungi. Thalli usually do not posses Plasmodia or pseudoplasmodia. Members are unicellular or filamentous with definite cell wall.","imgs":[],"card":1},{"name":"Neocallimastigomycota","parent":"Eumycota","rank":"Phylum","ipa":"","ipa_alt":[""],"common":[],"tag":"Anaerobic fungi that reproduce in the rumen of ruminants. Their flagellated zoospores are capable of active movement.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Anaeromyces_robustus_2.webp/250px-Anaeromyces_robustus_2.webp.png","https://upload.wikimedia.org/wikipedia/commons/9/9b/Anaeromyces_robustus_1.jpg"],"card":2},{"name":"Chytridiomycota","parent":"Eumycota","rank":"Phylum","ipa":"","ipa_alt":[""],"etymology":"greek 'little pot'","common":["chytrids"],"tag":"Decomposers of chitin and keratin, that sometimes act as parasites. They have chitin cell walls, a posterior whiplash flagellum, use of glycogen as an energy storage compound, and synthesis of lysine.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/de/Monoblephs_002.jpg/330px-Monoblephs_002.jpg","https://upload.wikimedia.org/wikipedia/commons/6/63/Synchytridium_endobioticum.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b5/Pennate_diatom_infected_with_two_chytrid-like_fungal_pathogens.png","https://upload.wikimedia.org/wikipedia/commons/2/2c/Spizellomycete.jpg"],"card":2},{"name":"Blastocladiomycota","parent":"Eumycota","rank":"Phylum","ipa":"","ipa_alt":[""],"common":["blastoclads"],"tag":"Very similar to the chytrids, and often still colloquially have the same name, but a different genetic tree.","imgs":["https://upload.wikimedia.org/wikipedia/commons/7/73/Cladochytrium_menyanthis_-_Lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cd/WJD103_6-16-11.jpg/330px-WJD103_6-16-11.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b5/Physoderma_pluriannulatum_285414352.jpg/330px-Physoderma_pluriannulatum_285414352.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Blastocladia_sp.png/330px-Blastocladia_sp.png"],"card":2},{"name":"Amastigomycota","parent":"Eumycota","rank":"Clade","ipa":"","ipa_alt":[""],"common":[],"tag":"All fungi without flagella or centrioles, and with unstacked Golgi apparatus cisternae. Includes Dikarya and the traditional paraphyletic assemblage 'Zygomycota'. Sometimes known as 'Eufungi'.","imgs":[],"card":2},{"name":"Basidiobolomycota","parent":"Amastigomycota","rank":"Phylum","ipa":"","ipa_alt":[""],"common":[],"tag":"Cells are uninucleate and their relatively large nuclei contain a nucleolus, but no heterochromatin.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/0a/Basidiobolus_%28257_20%29.jpg/330px-Basidiobolus_%28257_20%29.jpg"],"card":4},{"name":"Zoopagomyceta","parent":"Amastigomycota","rank":"Subkingdom","ipa":"","ipa_alt":[""],"common":[],"tag":"May be saprotrophs, gut symbionts or parasites of animals or mycoparasites. Thallus mycelial, mostly separated into cells with complete or uniperforate septa; Some reproduce sexually via zygospores by gametangial conjugation.","imgs":[],"card":3},{"name":"Zoopagomycota","parent":"Zoopagomyceta","rank":"Phylum","ipa":"","ipa_alt":[""],"common":[],"tag":"Microscopic and typically obligate parasites of other zygomycete fungi and of microscopic soil animals such as nematodes, rotifers and amoebae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cd/OH06_Ditch-W_150522_Amoebophilus60.jpg/330px-OH06_Ditch-W_150522_Amoebophilus60.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Helicocephalum01.jpg/330px-Helicocephalum01.jpg","https://upload.wikimedia.org/wikipedia/commons/e/e0/Rhopalomyces_elegans_215425.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/Sigmoideomycetaceae_sp.jpg/250px-Sigmoideomycetaceae_sp.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/OH05_Moss_150705_Zoophagus2.jpg/330px-OH05_Moss_150705_Zoophagus2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e8/Piptocephalis_sp002.jpg/330px-Piptocephalis_sp002.jpg"],"card":7},{"name":"Entomophthoromycota","parent":"Zoopagomyceta","rank":"Phylum","ipa":"","ipa_alt":[""],"common":[],"tag":"Mostly arthropod pathogens or soil- and litter-borne saprobes.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Conidiobolus_firmipilleus_ARSEF_2731_%2835127474912%29.jpg/250px-Conidiobolus_firmipilleus_ARSEF_2731_%2835127474912%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0a/Basidiobolus_%28257_20%29.jpg/330px-Basidiobolus_%28257_20%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/Entomophthora_muscae_on_Scathophaga_stercoraria_%28lateral_view%29.jpg/330px-Entomophthora_muscae_on_Scathophaga_stercoraria_%28lateral_view%29.jpg"],"card":7},{"name":"Kickxellomycota","parent":"Zoopagomyceta","rank":"Phylum","ipa":"","ipa_alt":[""],"common":[],"tag":"Decomposers that may be parasitic on fungi and can form symbiotic associations.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/Coemansia_spsono1.jpg/330px-Coemansia_spsono1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c2/Dimargaris_bacillispora_1.jpg/250px-Dimargaris_bacillispora_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Harpellales_%2810.3897-mycokeys.67.52055%29_Figure_14.png/330px-Harpellales_%2810.3897-mycokeys.67.52055%29_Figure_14.png"],"card":7},{"name":"Mortierellomycota","parent":"Amastigomycota","rank":"Phylum","ipa":"","ipa_alt":[""],"common":[],"tag":"Parasitic or saprotrophic; fine mycelium, branched (arachnoid); sporangia with 1 or many spores; may form chlamydospores (thick-walled asexual spores); produces garliclike odour.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Lobosporangium_transversalis_1.jpg/250px-Lobosporangium_transversalis_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6b/Modicella_malleola_Bassetts.jpg/330px-Modicella_malleola_Bassetts.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Mortierella_polycephala_colony.jpg/330px-Mortierella_polycephala_colony.jpg"],"card":3},{"name":"Mucoromyceta","parent":"Amastigomycota","rank":"Subkingdom","ipa":"","ipa_alt":[""],"common":[],"tag":"A diverse group of various molds.","imgs":[],"card":3},{"name":"Mucoromycota","parent":"Mucoromyceta","rank":"Phylum","ipa":"","ipa_alt":[""],"common":["common bread molds"],"tag":"Saprotrophic, filamentous and developes coenocytic mycelium. Some are parasites of animals. Some are used for fermentation.","imgs":["https://upload.wikimedia.org/wikipedia/commons/b/b3/Mucor_spec._-_Lindsey_1a.jpg","https://upload.wikimedia.org/wikipedia/commons/3/39/Mucor_circinelloides1.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c9/Mucor_plumbeus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c5/Rhizopus_fungus.jpg/250px-Rhizopus_fungus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/df/Rhizopus_Oryzae.jpg/330px-Rhizopus_Oryzae.jpg","https://upload.wikimedia.org/wikipedia/commons/1/1c/Rhizopus_stolonifer_on_a_strawberry_showing_black_sporangia.jpg"],"card":5},{"name":"Calcarisporiellomycota","parent":"Mucoromyceta","rank":"Phylum","ipa":"","ipa_alt":[""],"common":[],"tag":"The thallus is branched, with septate hyphae. The vegetative hyphae is hyaline, smooth and thin-walled. It has cultures with no distinctive smell.","imgs":[],"card":5},{"name":"Glomeromycota","parent":"Amastigomycota","rank":"Phylum","ipa":"","ipa_alt":[""],"common":[],"tag":"Most members are endomycorrhizal fungi with bryophytes and the roots of vascular land plants but at least one species forms an endocytobiotic with a cyanobacteria instead. Some species seem to be able to live independently.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/01/Geosiphon_pyriformis_by_Wettstein.png/330px-Geosiphon_pyriformis_by_Wettstein.png","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c7/Gigaspora_margarita.JPG/330px-Gigaspora_margarita.JPG","https://upload.wikimedia.org/wikipedia/commons/0/01/Entrophospora_etunicata_spores.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/R%C3%A9seau_de_mycorhize_%C3%A0_l%27int%C3%A9rieur_d%27une_racine.tif/lossy-page1-320px-R%C3%A9seau_de_mycorhize_%C3%A0_l%27int%C3%A9rieur_d%27une_racine.tif.jpg"],"card":3},{"name":"Dikarya","parent":"Amastigomycota","rank":"Subkingdom","ipa":"","ipa_alt":[""],"common":["puffballs","bracket fungi","jelly fungi","chanterelles","earth stars","rusts","human pathogenic yeast","morels","truffles","brewers' yeast","bakers' yeast","the majority of lichens","penicillium"],"tag":"In general produce dikaryons, may be filamentous or unicellular, but are always without flagella. Sometimes called 'higher fungi'.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/Amanita_muscaria_%28Fly_Agaric%29_%2823229103500%29.jpg/330px-Amanita_muscaria_%28Fly_Agaric%29_%2823229103500%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e9/Dacrymyces_palmatus_63214.jpg/330px-Dacrymyces_palmatus_63214.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Clathrus_ruber_specimen.JPG/330px-Clathrus_ruber_specimen.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e0/%28Gemeine_Steinpilz%29_Boletus_edulis.jpg/330px-%28Gemeine_Steinpilz%29_Boletus_edulis.jpg","https://upload.wikimedia.org/wikipedia/commons/2/26/Exobasidium.vaccinii.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Uromyces_rumicis_2019_08_04_12.jpg/330px-Uromyces_rumicis_2019_08_04_12.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/01/Phallus-Indusiatus.JPG/330px-Phallus-Indusiatus.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f9/Meredithblackwellia-eburnea-rosette.tiff/lossy-page1-1158px-Meredithblackwellia-eburnea-rosette.tiff.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4a/2011-04-30_Morchella_esculenta.jpg/330px-2011-04-30_Morchella_esculenta.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8b/2009-08-01_Neolecta_vitellina_23804_cropped.jpg/330px-2009-08-01_Neolecta_vitellina_23804_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a5/Tuber_melanosporum_-_trufa_negra%2C_%C3%81greda%2C_Espa%C3%B1a.jpg/330px-Tuber_melanosporum_-_trufa_negra%2C_%C3%81greda%2C_Espa%C3%B1a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/Sarcoscypha_austriaca_81949.jpg/330px-Sarcoscypha_austriaca_81949.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg/330px-Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/Rhizocarpon_sp._%2843746102904%29.jpg/250px-Rhizocarpon_sp._%2843746102904%29.jpg","https://upload.wikimedia.org/wikipedia/commons/d/da/Fission_yeast.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Macroconidia_Microsporum_canis.JPG/330px-Macroconidia_Microsporum_canis.JPG"],"card":3},{"name":"Basidiomycota","parent":"Dikarya","rank":"Phylum","ipa":"bəˌsɪdi.oʊmaɪˈkoʊtə","ipa_alt":[""],"common":["agarics","puffballs","stinkhorns","bracket fungi","jelly fungi","boletes","chanterelles","earth stars","smuts","bunts","rusts","mirror yeasts","human pathogenic yeast","basidiolichens"],"tag":"Filamentous fungi that are usually composed of hyphae and usually reproduce sexually via the formation of specialized club-shaped end cells called basidia that normally bear external meiospores (usually four).","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c2/Amanita_muscaria_%28fly_agaric%29.JPG/250px-Amanita_muscaria_%28fly_agaric%29.JPG","https://upload.wikimedia.org/wikipedia/commons/1/12/Puffball_fungai.jpg","https://upload.wikimedia.org/wikipedia/commons/d/d4/Fungi_in_Borneo.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Tremella_closeup.jpg/330px-Tremella_closeup.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Boletus_edulis_EtgHollande_041031_091.jpg/330px-Boletus_edulis_EtgHollande_041031_091.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/2007-07-14_Cantharellus_cibarius.jpg/330px-2007-07-14_Cantharellus_cibarius.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Myriostoma_coliforme.jpg/330px-Myriostoma_coliforme.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Huitlacoche_1929.jpg/330px-Huitlacoche_1929.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/54/Bruine_roest_op_tarwe_%28Puccinia_recondita_f.sp._tritici_on_Triticum_aestivum%29.jpg/330px-Bruine_roest_op_tarwe_%28Puccinia_recondita_f.sp._tritici_on_Triticum_aestivum%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d9/Cryptococcosis_of_lung_in_patient_with_AIDS._Mucicarmine_stain_962_lores.jpg/330px-Cryptococcosis_of_lung_in_patient_with_AIDS._Mucicarmine_stain_962_lores.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/01/Phallus-Indusiatus.JPG/330px-Phallus-Indusiatus.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Clathrus_ruber_specimen.JPG/330px-Clathrus_ruber_specimen.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/72/Cora_glabrata_%283143611489%29.jpg/330px-Cora_glabrata_%283143611489%29.jpg","https://upload.wikimedia.org/wikipedia/commons/3/30/Lichenomphalia_umbellifera_-_Lindsey_1a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0d/Multiclavula_mucida_23753.jpg/330px-Multiclavula_mucida_23753.jpg"],"card":6},{"name":"Entorrhizomycota","parent":"Dikarya","rank":"Phylum","ipa":"","ipa_alt":[""],"common":[],"tag":"A small group of teliosporic root parasites that form galls on plants in the rush sedge families.","imgs":["https://upload.wikimedia.org/wikipedia/commons/1/13/Entorrhiza.jpg"],"card":6},{"name":"Ascomycota","parent":"Dikarya","rank":"Phylum","ipa":"","ipa_alt":[""],"etymology":"greek 'sac'-'mushroom'","common":["morels","truffles","brewers' yeast","bakers' yeast","dead man's fingers","cup fungi","ascolichens","penicillium"],"tag":"Characterized by a saclike structure, the ascus that may forcibly eject the ascospores. Genetically related fungi in the group may not have this structure.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Morchella_esculenta_5.jpg/330px-Morchella_esculenta_5.jpg","https://upload.wikimedia.org/wikipedia/commons/2/26/Truffe_noire_du_P%C3%A9rigord.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/95/Saccharomyces_cerevisiae_SEM.jpg/330px-Saccharomyces_cerevisiae_SEM.jpg","https://upload.wikimedia.org/wikipedia/commons/9/93/Xylaria_hypoxylon.jpg","https://upload.wikimedia.org/wikipedia/commons/8/82/Peziza_spec._-_Lindsey_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/Aleuria_aurantia_1.jpg/330px-Aleuria_aurantia_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6e/Letharia_vulpina_JHollinger_crop.jpg/330px-Letharia_vulpina_JHollinger_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1a/CladoniaSpec01.jpg/250px-CladoniaSpec01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Cladonia_grayi_108849472.jpg/330px-Cladonia_grayi_108849472.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/09/Cladonia_macrophyllodes_109105.jpg/330px-Cladonia_macrophyllodes_109105.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e6/Candida_Gram_stain.jpg/330px-Candida_Gram_stain.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Candida_albicans_PHIL_3192_lores.jpg/330px-Candida_albicans_PHIL_3192_lores.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d0/Flavoparmelia_caperata_240112.jpg/330px-Flavoparmelia_caperata_240112.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0d/Xantoria-by-color.jpg/250px-Xantoria-by-color.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg/330px-Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg"],"card":6}],{},{"250px-Amanita_muscaria_(fly_agaric).JPG":[250,368,"#83594e"],"250px-Anaeromyces_robustus_2.webp.png":[250,250,"#3b3b3b"],"250px-CladoniaSpec01.jpg":[250,333,"#625e41"],"250px-Conidiobolus_firmipilleus_ARSEF_2731_(35127474912).jpg":[250,288,"#a2a2ae"],"250px-Dimargaris_bacillispora_1.jpg":[250,329,"#777777"],"250px-Lobosporangium_transversalis_1.jpg":[250,333,"#636363"],"250px-Rhizocarpon_sp._(43746102904).jpg":[250,375,"#616045"],"250px-Rhizopus_fungus.jpg":[250,240,"#908e83"],"250px-Sigmoideomycetaceae_sp.jpg":[250,333,"#626269"],"250px-Xantoria-by-color.jpg":[250,250,"#aba277"],"330px-(Gemeine_Steinpilz)_Boletus_edulis.jpg":[330,220,"#69674f"],"330px-2007-07-14_Cantharellus_cibarius.jpg":[330,248,"#48511c"],"330px-2009-08-01_Neolecta_vitellina_23804_cropped.jpg":[330,234,"#4c401d"],"330px-2011-04-30_Morchella_esculenta.jpg":[330,257,"#685433"],"330px-Aleuria_aurantia_1.jpg":[330,247,"#845c4f"],"330px-Amanita_muscaria_(Fly_Agaric)_(23229103500).jpg":[330,264,"#7b6a54"],"330px-Basidiobolus_(257_20).jpg":[330,211,"#8f7017"],"330px-Blastocladia_sp.png":[330,247,"#87898a"],"330px-Boletus_edulis_EtgHollande_041031_091.jpg":[330,247,"#715948"],"330px-Bruine_roest_op_tarwe_(Puccinia_recondita_f.sp._tritici_on_Triticum_aestivum).jpg":[330,117,"#a2876e"],"330px-Candida_Gram_stain.jpg":[330,220,"#bfacd8"],"330px-Candida_albicans_PHIL_3192_lores.jpg":[330,220,"#464430"],"330px-Cladonia_grayi_108849472.jpg":[330,248,"#827d4f"],"330px-Cladonia_macrophyllodes_109105.jpg":[330,247,"#4e561b"],"330px-Clathrus_ruber_specimen.JPG":[330,247,"#847e6a"],"330px-Coemansia_spsono1.jpg":[330,247,"#777571"],"330px-Cora_glabrata_(3143611489).jpg":[330,220,"#57502f"],"330px-Cryptococcosis_of_lung_in_patient_with_AIDS._Mucicarmine_stain_962_lores.jpg":[330,219,"#c9b4ad"],"330px-Dacrymyces_palmatus_63214.jpg":[330,248,"#7b673d"],"330px-Entomophthora_muscae_on_Scathophaga_stercoraria_(lateral_view).jpg":[330,247,"#879b34"],"330px-Flavoparmelia_caperata_240112.jpg":[330,247,"#656b52"],"330px-Geosiphon_pyriformis_by_Wettstein.png":[330,143,"#ebebeb"],"330px-Gigaspora_margarita.JPG":[330,247,"#48463d"],"330px-Harpellales_(10.3897-mycokeys.67.52055)_Figure_14.png":[330,286,"#818c8d"],"330px-Helicocephalum01.jpg":[330,219,"#524539"],"330px-Huitlacoche_1929.jpg":[330,219,"#98978c"],"330px-Letharia_vulpina_JHollinger_crop.jpg":[330,282,"#6b7254"],"330px-Macroconidia_Microsporum_canis.JPG":[330,247,"#979cad"],"330px-Modicella_malleola_Bassetts.jpg":[330,239,"#312e28"],"330px-Monoblephs_002.jpg":[330,247,"#9c9c9a"],"330px-Morchella_esculenta_5.jpg":[330,248,"#958e86"],"330px-Mortierella_polycephala_colony.jpg":[330,247,"#beb78f"],"330px-Multiclavula_mucida_23753.jpg":[330,248,"#525344"],"330px-Myriostoma_coliforme.jpg":[330,247,"#4f3b2a"],"330px-OH05_Moss_150705_Zoophagus2.jpg":[330,247,"#a5a6a4"],"330px-OH06_Ditch-W_150522_Amoebophilus60.jpg":[330,275,"#aaacac"],"330px-Penicillium_на_мандарине.jpg":[330,247,"#a17e3f"],"330px-Phallus-Indusiatus.JPG":[330,247,"#373324"],"330px-Physoderma_pluriannulatum_285414352.jpg":[330,247,"#6d8e5e"],"330px-Piptocephalis_sp002.jpg":[330,219,"#8e8d7b"],"330px-Rhizopus_Oryzae.jpg":[330,247,"#897b6f"],"330px-Rozella_allomycis2.jpg":[330,170,"#8b8a8a"],"330px-Saccharomyces_cerevisiae_SEM.jpg":[330,213,"#707070"],"330px-Sarcoscypha_austriaca_81949.jpg":[330,185,"#573d34"],"330px-Tremella_closeup.jpg":[330,247,"#a8a592"],"330px-Tuber_melanosporum_-_trufa_negra,_Ágreda,_España.jpg":[330,214,"#d5d2ca"],"330px-Uromyces_rumicis_2019_08_04_12.jpg":[330,220,"#978769"],"330px-WJD103_6-16-11.jpg":[330,247,"#b8a77a"],"Amoeboaphelidium.jpg":[245,328,"#7b7b7b"],"Anaeromyces_robustus_1.jpg":[232,175,"#424242"],"Cladochytrium_menyanthis_-_Lindsey.jpg":[640,426,"#9a9c53"],"Entorrhiza.jpg":[159,280,"#070605"],"Entrophospora_etunicata_spores.jpg":[480,360,"#4c7ccc"],"Exobasidium.vaccinii.-.lindsey.jpg":[640,426,"#94922d"],"Fibrillanosema_spore.jpg":[523,374,"#949494"],"Fission_yeast.jpg":[325,260,"#797979"],"Fungi_in_Borneo.jpg":[449,600,"#96815e"],"Lichenomphalia_umbellifera_-_Lindsey_1a.jpg":[640,425,"#56513a"],"Mucor_circinelloides1.jpg":[297,197,"#717d55"],"Mucor_plumbeus.jpg":[375,375,"#aca197"],"Mucor_spec._-_Lindsey_1a.jpg":[640,428,"#8c7f71"],"Pennate_diatom_infected_with_two_chytrid-like_fungal_pathogens.png":[710,495,"#605f5f"],"Peziza_spec._-_Lindsey_1.jpg":[640,425,"#846340"],"Puffball_fungai.jpg":[800,533,"#322314"],"Rhizopus_stolonifer_on_a_strawberry_showing_black_sporangia.jpg":[720,540,"#9a706f"],"Rhopalomyces_elegans_215425.jpg":[800,600,"#a3aba6"],"Spizellomycete.jpg":[273,272,"#737277"],"Synchytridium_endobioticum.jpg":[601,401,"#4b3236"],"Truffe_noire_du_Périgord.jpg":[800,600,"#8c8885"],"Xylaria_hypoxylon.jpg":[800,600,"#666252"],"lossy-page1-1158px-Meredithblackwellia-eburnea-rosette.tiff.jpg":[1158,1036,"#c2c2c2"],"lossy-page1-320px-Réseau_de_mycorhize_à_l'intérieur_d'une_racine.tif.jpg":[320,240,"#506b58"]})
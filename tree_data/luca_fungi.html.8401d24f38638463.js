@@ -0,0 +1 @@
+TreeData.register_html("luca_fungi","<ul class=\"tree\" data-tree-range=\"fungi\"><li><input type=\"checkbox\" checked id=\"Amorphea_Fungi\"><label class=\"tree_label\" for=\"Amorphea_Fungi\"></label><div class=\"outer_tree_box\"><div id=\"fungi_fungi\" class=\"tree_box\"><span><span>Fungi</span><a href=\"https://en.wikipedia.org/wiki/Fungi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Fungi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Fungi\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈfʌŋɡi\" target=\"_blank\">ˈfʌŋɡi</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"overview\">See parent</button><span class=\"badge\">Kingdom</span></span><p class=\"tag\">The primary decomposers in many ecological systems. Their cell walls contain chitin.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Scarlet_elf_cap_cadnant_dingle.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scarlet_elf_cap_cadnant_dingle.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"254\" style=\"background-color:#825a4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caloplaca_thallincola.jpg\" target=\"_blank\"><img src=\"thumbnails/Caloplaca_thallincola.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#828164\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%28Gemeine_Steinpilz%29_Boletus_edulis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%28Gemeine_Steinpilz%29_Boletus_edulis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#69674f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flavoparmelia_caperata_240112.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Flavoparmelia_caperata_240112.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#656b52\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a17e3f\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_rozellomycota\" class=\"tree_box\"><span><span>Rozellomycota</span><a href=\"https://en.wikipedia.org/wiki/Rozellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rozellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rozellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">Micro-organisms that they lack chitinous cell walls at any trophic stage in their lifecycle. Often parasitic.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Rozella_allomycis2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rozella_allomycis2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"170\" style=\"background-color:#8b8a8a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fibrillanosema_spore.jpg\" target=\"_blank\"><img src=\"thumbnails/Fibrillanosema_spore.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"523\" height=\"374\" style=\"background-color:#949494\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_aphelidiomycota\" class=\"tree_box\"><span><span>Aphelidiomycota</span><a href=\"https://en.wikipedia.org/wiki/Aphelidiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Aphelidiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Aphelidiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">Parasitoids of various algae and diatoms.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Amoeboaphelidium.jpg\" target=\"_blank\"><img src=\"thumbnails/Amoeboaphelidium.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"245\" height=\"328\" style=\"background-color:#7b7b7b\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Fungi_Eumycota\"><label class=\"tree_label\" for=\"Fungi_Eumycota\"></label><div class=\"outer_tree_box\"><div id=\"fungi_eumycota\" class=\"tree_box\"><span><span>Eumycota</span><a href=\"https://en.wikipedia.org/wiki/Eumycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eumycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eumycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">The true fungi. Thalli usually do not posses Plasmodia or pseudoplasmodia. Members are unicellular or filamentous with definite cell wall.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_neocallimastigomycota\" class=\"tree_box\"><span><span>Neocallimastigomycota</span><a href=\"https://en.wikipedia.org/wiki/Neocallimastigomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Neocallimastigomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Neocallimastigomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">Anaerobic fungi that reproduce in the rumen of ruminants. Their flagellated zoospores are capable of active movement.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Anaeromyces_robustus_2.webp\" target=\"_blank\"><img src=\"thumbnails/250px-Anaeromyces_robustus_2.webp.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#3b3b3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anaeromyces_robustus_1.jpg\" target=\"_blank\"><img src=\"thumbnails/Anaeromyces_robustus_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"232\" height=\"175\" style=\"background-color:#424242\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_chytridiomycota\" class=\"tree_box\"><span><span>Chytridiomycota</span><a href=\"https://en.wikipedia.org/wiki/Chytridiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chytridiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chytridiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(chytrids)</span><p class=\"tag\">Decomposers of chitin and keratin, that sometimes act as parasites. They have chitin cell walls, a posterior whiplash flagellum, use of glycogen as an energy storage compound, and synthesis of lysine.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Monoblephs_002.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Monoblephs_002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9c9c9a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Synchytridium_endobioticum.jpg\" target=\"_blank\"><img src=\"thumbnails/Synchytridium_endobioticum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"601\" height=\"401\" style=\"background-color:#4b3236\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pennate_diatom_infected_with_two_chytrid-like_fungal_pathogens.png\" target=\"_blank\"><img src=\"thumbnails/Pennate_diatom_infected_with_two_chytrid-like_fungal_pathogens.png\" class=\"taxa-img\" loading=\"lazy\" width=\"710\" height=\"495\" style=\"background-color:#605f5f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spizellomycete.jpg\" target=\"_blank\"><img src=\"thumbnails/Spizellomycete.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"273\" height=\"272\" style=\"background-color:#737277\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_blastocladiomycota\" class=\"tree_box\"><span><span>Blastocladiomycota</span><a href=\"https://en.wikipedia.org/wiki/Blastocladiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Blastocladiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Blastocladiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(blastoclads)</span><p class=\"tag\">Very similar to the chytrids, and often still colloquially have the same name, but a different genetic tree.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cladochytrium_menyanthis_-_Lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Cladochytrium_menyanthis_-_Lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"426\" style=\"background-color:#9a9c53\"></a><a href=\"https://commons.wikimedia.org/wiki/File:WJD103_6-16-11.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-WJD103_6-16-11.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#b8a77a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Physoderma_pluriannulatum_285414352.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Physoderma_pluriannulatum_285414352.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6d8e5e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blastocladia_sp.png\" target=\"_blank\"><img src=\"thumbnails/330px-Blastocladia_sp.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#87898a\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Eumycota_Amastigomycota\"><label class=\"tree_label\" for=\"Eumycota_Amastigomycota\"></label><div class=\"outer_tree_box\"><div id=\"fungi_amastigomycota\" class=\"tree_box\"><span><span>Amastigomycota</span><a href=\"https://en.wikipedia.org/wiki/Amastigomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Amastigomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Amastigomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">All fungi without flagella or centrioles, and with unstacked Golgi apparatus cisternae. Includes Dikarya and the traditional paraphyletic assemblage &#x27;Zygomycota&#x27;. Sometimes known as &#x27;Eufungi&#x27;.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_basidiobolomycota\" class=\"tree_box\"><span><span>Basidiobolomycota</span><a href=\"https://en.wikipedia.org/wiki/Basidiobolomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Basidiobolomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Basidiobolomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">Cells are uninucleate and their relatively large nuclei contain a nucleolus, but no heterochromatin.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Basidiobolus_%28257_20%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Basidiobolus_%28257_20%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"211\" style=\"background-color:#8f7017\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Amastigomycota_Zoopagomyceta\"><label class=\"tree_label\" for=\"Amastigomycota_Zoopagomyceta\"></label><div class=\"outer_tree_box\"><div id=\"fungi_zoopagomyceta\" class=\"tree_box\"><span><span>Zoopagomyceta</span><a href=\"https://en.wikipedia.org/wiki/Zoopagomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Zoopagomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Zoopagomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subkingdom</span></span><p class=\"tag\">May be saprotrophs, gut symbionts or parasites of animals or mycoparasites. Thallus mycelial, mostly separated into cells with complete or uniperforate septa; Some reproduce sexually via zygospores by gametangial conjugation.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_zoopagomycota\" class=\"tree_box\"><span><span>Zoopagomycota</span><a href=\"https://en.wikipedia.org/wiki/Zoopagomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Zoopagomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Zoopagomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">Microscopic and typically obligate parasites of other zygomycete fungi and of microscopic soil animals such as nematodes, rotifers and amoebae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:OH06_Ditch-W_150522_Amoebophilus60.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-OH06_Ditch-W_150522_Amoebophilus60.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"275\" style=\"background-color:#aaacac\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Helicocephalum01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Helicocephalum01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#524539\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhopalomyces_elegans_215425.jpg\" target=\"_blank\"><img src=\"thumbnails/Rhopalomyces_elegans_215425.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#a3aba6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sigmoideomycetaceae_sp.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sigmoideomycetaceae_sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#626269\"></a><a href=\"https://commons.wikimedia.org/wiki/File:OH05_Moss_150705_Zoophagus2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-OH05_Moss_150705_Zoophagus2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a5a6a4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Piptocephalis_sp002.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Piptocephalis_sp002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#8e8d7b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_entomophthoromycota\" class=\"tree_box\"><span><span>Entomophthoromycota</span><a href=\"https://en.wikipedia.org/wiki/Entomophthoromycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Entomophthoromycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Entomophthoromycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">Mostly arthropod pathogens or soil- and litter-borne saprobes.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Conidiobolus_firmipilleus_ARSEF_2731_%2835127474912%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Conidiobolus_firmipilleus_ARSEF_2731_%2835127474912%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"288\" style=\"background-color:#a2a2ae\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Basidiobolus_%28257_20%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Basidiobolus_%28257_20%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"211\" style=\"background-color:#8f7017\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Entomophthora_muscae_on_Scathophaga_stercoraria_%28lateral_view%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Entomophthora_muscae_on_Scathophaga_stercoraria_%28lateral_view%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#879b34\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_kickxellomycota\" class=\"tree_box\"><span><span>Kickxellomycota</span><a href=\"https://en.wikipedia.org/wiki/Kickxellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Kickxellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Kickxellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">Decomposers that may be parasitic on fungi and can form symbiotic associations.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Coemansia_spsono1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Coemansia_spsono1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#777571\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dimargaris_bacillispora_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dimargaris_bacillispora_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"329\" style=\"background-color:#777777\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Harpellales_%2810.3897-mycokeys.67.52055%29_Figure_14.png\" target=\"_blank\"><img src=\"thumbnails/330px-Harpellales_%2810.3897-mycokeys.67.52055%29_Figure_14.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"286\" style=\"background-color:#818c8d\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_mortierellomycota\" class=\"tree_box\"><span><span>Mortierellomycota</span><a href=\"https://en.wikipedia.org/wiki/Mortierellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mortierellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mortierellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">Parasitic or saprotrophic; fine mycelium, branched (arachnoid); sporangia with 1 or many spores; may form chlamydospores (thick-walled asexual spores); produces garliclike odour.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lobosporangium_transversalis_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lobosporangium_transversalis_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#636363\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Modicella_malleola_Bassetts.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Modicella_malleola_Bassetts.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"239\" style=\"background-color:#312e28\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mortierella_polycephala_colony.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mortierella_polycephala_colony.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#beb78f\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Amastigomycota_Mucoromyceta\"><label class=\"tree_label\" for=\"Amastigomycota_Mucoromyceta\"></label><div class=\"outer_tree_box\"><div id=\"fungi_mucoromyceta\" class=\"tree_box\"><span><span>Mucoromyceta</span><a href=\"https://en.wikipedia.org/wiki/Mucoromyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mucoromyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mucoromyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subkingdom</span></span><p class=\"tag\">A diverse group of various molds.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_mucoromycota\" class=\"tree_box\"><span><span>Mucoromycota</span><a href=\"https://en.wikipedia.org/wiki/Mucoromycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Mucoromycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Mucoromycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(common bread molds)</span><p class=\"tag\">Saprotrophic, filamentous and developes coenocytic mycelium. Some are parasites of animals. Some are used for fermentation.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Mucor_spec._-_Lindsey_1a.jpg\" target=\"_blank\"><img src=\"thumbnails/Mucor_spec._-_Lindsey_1a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"428\" style=\"background-color:#8c7f71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mucor_circinelloides1.jpg\" target=\"_blank\"><img src=\"thumbnails/Mucor_circinelloides1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"297\" height=\"197\" style=\"background-color:#717d55\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mucor_plumbeus.jpg\" target=\"_blank\"><img src=\"thumbnails/Mucor_plumbeus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"375\" height=\"375\" style=\"background-color:#aca197\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhizopus_fungus.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Rhizopus_fungus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"240\" style=\"background-color:#908e83\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhizopus_Oryzae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rhizopus_Oryzae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#897b6f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhizopus_stolonifer_on_a_strawberry_showing_black_sporangia.jpg\" target=\"_blank\"><img src=\"thumbnails/Rhizopus_stolonifer_on_a_strawberry_showing_black_sporangia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"720\" height=\"540\" style=\"background-color:#9a706f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_calcarisporiellomycota\" class=\"tree_box\"><span><span>Calcarisporiellomycota</span><a href=\"https://en.wikipedia.org/wiki/Calcarisporiellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Calcarisporiellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Calcarisporiellomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">The thallus is branched, with septate hyphae. The vegetative hyphae is hyaline, smooth and thin-walled. It has cultures with no distinctive smell.</p><div></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_glomeromycota\" class=\"tree_box\"><span><span>Glomeromycota</span><a href=\"https://en.wikipedia.org/wiki/Glomeromycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Glomeromycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Glomeromycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">Most members are endomycorrhizal fungi with bryophytes and the roots of vascular land plants but at least one species forms an endocytobiotic with a cyanobacteria instead. Some species seem to be able to live independently.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Geosiphon_pyriformis_by_Wettstein.png\" target=\"_blank\"><img src=\"thumbnails/330px-Geosiphon_pyriformis_by_Wettstein.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"143\" style=\"background-color:#ebebeb\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gigaspora_margarita.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Gigaspora_margarita.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#48463d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Entrophospora_etunicata_spores.jpg\" target=\"_blank\"><img src=\"thumbnails/Entrophospora_etunicata_spores.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"480\" height=\"360\" style=\"background-color:#4c7ccc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:R%C3%A9seau_de_mycorhize_%C3%A0_l%27int%C3%A9rieur_d%27une_racine.tif\" target=\"_blank\"><img src=\"thumbnails/lossy-page1-320px-R%C3%A9seau_de_mycorhize_%C3%A0_l%27int%C3%A9rieur_d%27une_racine.tif.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"320\" height=\"240\" style=\"background-color:#506b58\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Amastigomycota_Dikarya\"><label class=\"tree_label\" for=\"Amastigomycota_Dikarya\"></label><div class=\"outer_tree_box\"><div id=\"fungi_dikarya\" class=\"tree_box\"><span><span>Dikarya</span><a href=\"https://en.wikipedia.org/wiki/Dikarya\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dikarya\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dikarya\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subkingdom</span></span><span class=\"common_names\">(puffballs, bracket fungi, jelly fungi, chanterelles, earth stars, rusts, human pathogenic yeast, morels, truffles, brewers&#x27; yeast, bakers&#x27; yeast, the majority of lichens, penicillium)</span><p class=\"tag\">In general produce dikaryons, may be filamentous or unicellular, but are always without flagella. Sometimes called &#x27;higher fungi&#x27;.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Amanita_muscaria_%28Fly_Agaric%29_%2823229103500%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amanita_muscaria_%28Fly_Agaric%29_%2823229103500%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#7b6a54\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dacrymyces_palmatus_63214.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dacrymyces_palmatus_63214.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#7b673d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clathrus_ruber_specimen.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Clathrus_ruber_specimen.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#847e6a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%28Gemeine_Steinpilz%29_Boletus_edulis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%28Gemeine_Steinpilz%29_Boletus_edulis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#69674f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Exobasidium.vaccinii.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Exobasidium.vaccinii.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"426\" style=\"background-color:#94922d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Uromyces_rumicis_2019_08_04_12.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Uromyces_rumicis_2019_08_04_12.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#978769\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phallus-Indusiatus.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Phallus-Indusiatus.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#373324\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Meredithblackwellia-eburnea-rosette.tiff\" target=\"_blank\"><img src=\"thumbnails/lossy-page1-1158px-Meredithblackwellia-eburnea-rosette.tiff.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"1158\" height=\"1036\" style=\"background-color:#c2c2c2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2011-04-30_Morchella_esculenta.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2011-04-30_Morchella_esculenta.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"257\" style=\"background-color:#685433\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2009-08-01_Neolecta_vitellina_23804_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2009-08-01_Neolecta_vitellina_23804_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#4c401d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tuber_melanosporum_-_trufa_negra%2C_%C3%81greda%2C_Espa%C3%B1a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tuber_melanosporum_-_trufa_negra%2C_%C3%81greda%2C_Espa%C3%B1a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"214\" style=\"background-color:#d5d2ca\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sarcoscypha_austriaca_81949.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sarcoscypha_austriaca_81949.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"185\" style=\"background-color:#573d34\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a17e3f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhizocarpon_sp._%2843746102904%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Rhizocarpon_sp._%2843746102904%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#616045\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fission_yeast.jpg\" target=\"_blank\"><img src=\"thumbnails/Fission_yeast.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"325\" height=\"260\" style=\"background-color:#797979\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Macroconidia_Microsporum_canis.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Macroconidia_Microsporum_canis.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#979cad\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_basidiomycota\" class=\"tree_box\"><span><span>Basidiomycota</span><a href=\"https://en.wikipedia.org/wiki/Basidiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Basidiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Basidiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=bəˌsɪdi.oʊmaɪˈkoʊtə\" target=\"_blank\">bəˌsɪdi.oʊmaɪˈkoʊtə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"basidiomycota\">See children</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(agarics, puffballs, stinkhorns, bracket fungi, jelly fungi, boletes, chanterelles, earth stars, smuts, bunts, rusts, mirror yeasts, human pathogenic yeast, basidiolichens)</span><p class=\"tag\">Filamentous fungi that are usually composed of hyphae and usually reproduce sexually via the formation of specialized club-shaped end cells called basidia that normally bear external meiospores (usually four).</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Amanita_muscaria_%28fly_agaric%29.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Amanita_muscaria_%28fly_agaric%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"368\" style=\"background-color:#83594e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Puffball_fungai.jpg\" target=\"_blank\"><img src=\"thumbnails/Puffball_fungai.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"533\" style=\"background-color:#322314\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fungi_in_Borneo.jpg\" target=\"_blank\"><img src=\"thumbnails/Fungi_in_Borneo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"449\" height=\"600\" style=\"background-color:#96815e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tremella_closeup.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tremella_closeup.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a8a592\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Boletus_edulis_EtgHollande_041031_091.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Boletus_edulis_EtgHollande_041031_091.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#715948\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2007-07-14_Cantharellus_cibarius.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2007-07-14_Cantharellus_cibarius.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#48511c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myriostoma_coliforme.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Myriostoma_coliforme.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4f3b2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Huitlacoche_1929.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Huitlacoche_1929.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#98978c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bruine_roest_op_tarwe_%28Puccinia_recondita_f.sp._tritici_on_Triticum_aestivum%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bruine_roest_op_tarwe_%28Puccinia_recondita_f.sp._tritici_on_Triticum_aestivum%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"117\" style=\"background-color:#a2876e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cryptococcosis_of_lung_in_patient_with_AIDS._Mucicarmine_stain_962_lores.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cryptococcosis_of_lung_in_patient_with_AIDS._Mucicarmine_stain_962_lores.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#c9b4ad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phallus-Indusiatus.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Phallus-Indusiatus.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#373324\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clathrus_ruber_specimen.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Clathrus_ruber_specimen.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#847e6a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cora_glabrata_%283143611489%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cora_glabrata_%283143611489%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#57502f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lichenomphalia_umbellifera_-_Lindsey_1a.jpg\" target=\"_blank\"><img src=\"thumbnails/Lichenomphalia_umbellifera_-_Lindsey_1a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#56513a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Multiclavula_mucida_23753.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Multiclavula_mucida_23753.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#525344\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_entorrhizomycota\" class=\"tree_box\"><span><span>Entorrhizomycota</span><a href=\"https://en.wikipedia.org/wiki/Entorrhizomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Entorrhizomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Entorrhizomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Phylum</span></span><p class=\"tag\">A small group of teliosporic root parasites that form galls on plants in the rush sedge families.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Entorrhiza.jpg\" target=\"_blank\"><img src=\"thumbnails/Entorrhiza.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"159\" height=\"280\" style=\"background-color:#070605\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fungi_ascomycota\" class=\"tree_box\"><span><span>Ascomycota</span><a href=\"https://en.wikipedia.org/wiki/Ascomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ascomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ascomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"ascomycota\">See children</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(morels, truffles, brewers&#x27; yeast, bakers&#x27; yeast, dead man&#x27;s fingers, cup fungi, ascolichens, penicillium)</span><p class=\"tag\">Characterized by a saclike structure, the ascus that may forcibly eject the ascospores. Genetically related fungi in the group may not have this structure.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Morchella_esculenta_5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Morchella_esculenta_5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#958e86\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Truffe_noire_du_P%C3%A9rigord.jpg\" target=\"_blank\"><img src=\"thumbnails/Truffe_noire_du_P%C3%A9rigord.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#8c8885\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saccharomyces_cerevisiae_SEM.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saccharomyces_cerevisiae_SEM.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"213\" style=\"background-color:#707070\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Xylaria_hypoxylon.jpg\" target=\"_blank\"><img src=\"thumbnails/Xylaria_hypoxylon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#666252\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Peziza_spec._-_Lindsey_1.jpg\" target=\"_blank\"><img src=\"thumbnails/Peziza_spec._-_Lindsey_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#846340\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aleuria_aurantia_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aleuria_aurantia_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#845c4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Letharia_vulpina_JHollinger_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Letharia_vulpina_JHollinger_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#6b7254\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CladoniaSpec01.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-CladoniaSpec01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#625e41\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cladonia_grayi_108849472.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cladonia_grayi_108849472.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#827d4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cladonia_macrophyllodes_109105.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cladonia_macrophyllodes_109105.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4e561b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Candida_Gram_stain.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Candida_Gram_stain.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#bfacd8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Candida_albicans_PHIL_3192_lores.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Candida_albicans_PHIL_3192_lores.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#464430\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flavoparmelia_caperata_240112.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Flavoparmelia_caperata_240112.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#656b52\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Xantoria-by-color.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Xantoria-by-color.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#aba277\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a17e3f\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul>")
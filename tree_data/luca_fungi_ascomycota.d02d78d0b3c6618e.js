@@ -0,0 +1 @@
+TreeData.register("luca_fungi_ascomycota",[{"name":"Pezizomycotina","parent":"Ascomycota","rank":"Subdivision","ipa":"","ipa_alt":[""],"etymology":"","common":["truffles","ergot","ascolichens","cup fungi","pyrenomycetes","lorchels","caterpillar fungus","powdery mildews","dermatophytic fungi","Laboulbeniales"],"tag":"These fungi reproduce by fission rather than budding. It's the largest subphylum and contains all ascomycetes that produce ascocarps (fruiting bodies), except for one genus, Neolecta, in the Taphrinomycotina.","imgs":[]},{"name":"Orbiliomycetes","parent":"Pezizomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Saprobic sac fungi. Some species are carnivorous fungi, and have evolved to trap nematodes.","imgs":[]},{"name":"Geoglossaceae","parent":"Pezizomycotina","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":["earth tongues"],"tag":"The ascocarps of most species in the family Geoglossaceae are terrestrial and are generally small, dark in color, and club-shaped with a height of 2–8 cm","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e9/2011-09-16_Geoglossum_glutinosum_Pers_192121.jpg/330px-2011-09-16_Geoglossum_glutinosum_Pers_192121.jpg"]},{"name":"Pezizomycetes","parent":"Pezizomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":["cup fungi","morels","Elfin saddles","truffles"],"tag":"The operculate discomycetes.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/Aleuria_aurantia_1.jpg/330px-Aleuria_aurantia_1.jpg"]},{"name":"Pezizales","parent":"Pezizomycetes","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"","imgs":[]},{"name":"Sarcoscyphaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":["scarlet elf cup"],"tag":"Cup fungi found in both tropical and temperate regions.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Sarcoscypha_coccinea_74716.jpg/330px-Sarcoscypha_coccinea_74716.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Cookeina_tricholoma_pair_Ecuador.jpg/250px-Cookeina_tricholoma_pair_Ecuador.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/Microstoma_floccosum_13099.jpg/330px-Microstoma_floccosum_13099.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Phillipsia_domingensis_105040.jpg/330px-Phillipsia_domingensis_105040.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4b/Phillipsia_subpurpurea_423741.jpg/330px-Phillipsia_subpurpurea_423741.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Phillipsia_lutea_239291.jpg/330px-Phillipsia_lutea_239291.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ae/Pithya_189.jpg/330px-Pithya_189.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Pseudopithyella_miniscula_451262.jpg/250px-Pseudopithyella_miniscula_451262.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/67/Scarlet_elf_cap_cadnant_dingle.jpg/330px-Scarlet_elf_cap_cadnant_dingle.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8e/Wynnea_sparassoides_74608.jpg/250px-Wynnea_sparassoides_74608.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Wynnea_americana_47834.jpg/330px-Wynnea_americana_47834.jpg"]},{"name":"Tuberaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":["white truffles","black truffles"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c9/Truffle_washed_and_cut.jpg/330px-Truffle_washed_and_cut.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Truffle_4.jpg/330px-Truffle_4.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Maeandertrueffel.jpg/330px-Maeandertrueffel.jpg"]},{"name":"Carbomycetaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Desert truffles found in Mexico and the USA.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/06/2014-10-26_Carbomyces_Gilkey_475175.jpg/330px-2014-10-26_Carbomyces_Gilkey_475175.jpg"]},{"name":"Ascobolaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Most fruiting bodies are round and without conidium. Members have a saprobiontic lifestyle, feeding on decaying and dead matter.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/66/2007-02-06_Thecotheus_holmskioldii_%28E.C._Hansen%29_Eckblad_46531.jpg/250px-2007-02-06_Thecotheus_holmskioldii_%28E.C._Hansen%29_Eckblad_46531.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/2014-04-02_Ascobolus_carbonarius_P._Karst_412861.jpg/330px-2014-04-02_Ascobolus_carbonarius_P._Karst_412861.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/92/2015-05-27_Ascobolus_scatigenus_%28Berk%29_Brumm_523193.jpg/330px-2015-05-27_Ascobolus_scatigenus_%28Berk%29_Brumm_523193.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/Ascobolus_215000.jpg/330px-Ascobolus_215000.jpg"]},{"name":"Glaziellaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":["orange bladder"],"tag":"Includes organge cup fungi.","imgs":[]},{"name":"Sarcosomataceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"The type genus is Sarcosoma. Most are cup fungi and have a dark brown or black apothecium which is gelatinous or leathery.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/Donadinia_nigrella_%281%29.jpg/250px-Donadinia_nigrella_%281%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dd/Galiella_rufa_87995.jpg/250px-Galiella_rufa_87995.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a9/Plectania_nannfeldtii_187.jpg/330px-Plectania_nannfeldtii_187.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/2008-03-28_Pseudoplectania_nigrella_cropped.jpg/330px-2008-03-28_Pseudoplectania_nigrella_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c7/Bombmurkla.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/92/Urnula_craterium_closeup.jpg/330px-Urnula_craterium_closeup.jpg"]},{"name":"Rhizinaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":["doughnut fungi"],"tag":"Fungi parasitic on conifer seedlings. The fruit bodies of the fungus are dark purple brown with a bright yellow margin, crust-like and attached to the growing surface by numerous root-like yellow rhizoids.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Rhizina_undulata.JPG/330px-Rhizina_undulata.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0e/Rhizina_undulata_California.jpg/330px-Rhizina_undulata_California.jpg"]},{"name":"Chorioactidaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":["devil's cigars"],"tag":"Cup fungi with taxa that are saprotrophic, and inhabit temperate and subtropical regions.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/Devil%27s_cigar_Chorioactis_geaster.jpg/330px-Devil%27s_cigar_Chorioactis_geaster.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c0/Chorioactis_geaster_2.jpg/330px-Chorioactis_geaster_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/eb/2011-04-09_Neournula_pouchetii_%28Berthet_%26_Riousset%29_Paden_207948.jpg/330px-2011-04-09_Neournula_pouchetii_%28Berthet_%26_Riousset%29_Paden_207948.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Wolfina_aurantiopsis_74602.jpg/250px-Wolfina_aurantiopsis_74602.jpg"]},{"name":"Caloscyphaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":["snowbank orange peel fungus"],"tag":"Contains cup fungi with a bright to pale orange interior and orange.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/dd/Caloscypha_fulgens_AR.jpg/330px-Caloscypha_fulgens_AR.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Caloscypha_fulgens.jpg/250px-Caloscypha_fulgens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d9/Caloscypha_fulgens_42761.jpg/330px-Caloscypha_fulgens_42761.jpg"]},{"name":"Morchellaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":["morels","bleach cups","early morels","thimble morels","Oregon brown truffles"],"tag":"The best-known members are the true morels, the thimble morels, and a genus of cup-shaped fungi.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/57/Morchella_esculenta_270408.jpg/250px-Morchella_esculenta_270408.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Verpa.jpg/250px-Verpa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0e/DisciotisVenosa.JPG/330px-DisciotisVenosa.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/92/2005-04-23_Disciotis_venosa.jpg/330px-2005-04-23_Disciotis_venosa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6b/Old_holiday_shot_of_Morchella_esculenta_%28GB%3D_Morel_mushroom%2C_D%3D_Speise-Morchel%2C_NL%3D_Gewone_morielje%29_-_panoramio.jpg/250px-Old_holiday_shot_of_Morchella_esculenta_%28GB%3D_Morel_mushroom%2C_D%3D_Speise-Morchel%2C_NL%3D_Gewone_morielje%29_-_panoramio.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Morchella_americana_on_a_mossy_riverbank_in_MI.jpg/330px-Morchella_americana_on_a_mossy_riverbank_in_MI.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Morchella_esculenta_5.jpg/330px-Morchella_esculenta_5.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/White_Morel_IMG_0399.JPG/330px-White_Morel_IMG_0399.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/71/Morchella_elata_4846.JPG/330px-Morchella_elata_4846.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/LongNek1.JPG/330px-LongNek1.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0e/Kalapuya_brunnea_53866.jpg/330px-Kalapuya_brunnea_53866.jpg","https://upload.wikimedia.org/wikipedia/commons/e/ef/Leucangium_carthusianum_17755.jpg"]},{"name":"Pezizaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":["cup fungi"],"tag":"They produce mushrooms that tend to grow in the shape of a 'cup'. Spores are formed on the inner surface of the fruit body (ascoma). The cup shape typically serves to focus raindrops into splashing spores out of the cup.","imgs":[]},{"name":"Ascodesmidaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/9/98/Lasiobolus_papillatus_499885.jpg"]},{"name":"Discinaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":["false morels","pig ear"],"tag":"Includes species possessing saddle-shaped apothecia and hypogeous truffles. Members are known to have epigeous and hypogeous species, and are characterized by ascomata composed of an inner layer of interwoven hyphae and an outer layer composed of elongated cells arranged perpendicular to its exterior.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/97/Fr%C3%BChjahrslorchel.JPG/250px-Fr%C3%BChjahrslorchel.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/79/Gyromitra_Colima.jpg/250px-Gyromitra_Colima.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/Discina_perlata_95195.jpg/330px-Discina_perlata_95195.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Gymnohydnotrya_sp.png/330px-Gymnohydnotrya_sp.png","https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/Hydnotrya_tulasnei_89493.jpg/330px-Hydnotrya_tulasnei_89493.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4f/Pseudorhizina_sphaerospora_338724.jpg/330px-Pseudorhizina_sphaerospora_338724.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Gyromitra_anthracobia_%2819.3.17-Kourdali%29_1.jpg/330px-Gyromitra_anthracobia_%2819.3.17-Kourdali%29_1.jpg"]},{"name":"Helvellaceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":["elfin saddles"],"tag":"Almost all species have saddle-shaped ascocarps with cupulate or  lobed  caps  on a  disinct  shape,  and ellipsoid ascospores.","imgs":["https://upload.wikimedia.org/wikipedia/commons/c/cd/2010-06-05_Barssia_oregonensis_Gilkey_88036.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fd/2011-05-29_Helvella_acetabulum_68463.jpg/330px-2011-05-29_Helvella_acetabulum_68463.jpg","https://upload.wikimedia.org/wikipedia/commons/8/81/Helvella_costifera_297108.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ac/Helvella_ephippium_sattellorchel.jpg/330px-Helvella_ephippium_sattellorchel.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8b/Helvella_crispa_031130w.jpg/250px-Helvella_crispa_031130w.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Underwoodia_columnaris_265847.jpg/330px-Underwoodia_columnaris_265847.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/2011-05-31_Helvella_silvicola_68480_cropped.jpg/330px-2011-05-31_Helvella_silvicola_68480_cropped.jpg"]},{"name":"Pyronemataceae","parent":"Pezizales","rank":"Family","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Morphologically and ecologically highly diverse, comprising saprobic, ectomycorrhizal, bryosymbiotic and parasitic species, occurring in a broad range of habitats.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Pyropyxis_rubra_153286.jpg/330px-Pyropyxis_rubra_153286.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/91/Neottiella_rutilans_Jymm_02.jpg/330px-Neottiella_rutilans_Jymm_02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/Halbkugeliger_Borstling_Humaria_hemisphaerica.jpg/330px-Halbkugeliger_Borstling_Humaria_hemisphaerica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/74/Eselsohren_Otidea_onotica.jpg/330px-Eselsohren_Otidea_onotica.jpg","https://upload.wikimedia.org/wikipedia/commons/d/d4/Scutellinia_spec._-_Lindsey_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b9/Sowerbyella_rhenana_77176.jpg/330px-Sowerbyella_rhenana_77176.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b2/Cheilymenia_spp_36744.jpg/250px-Cheilymenia_spp_36744.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/PyronemaSCU_cropped_withScaleBar.jpg/330px-PyronemaSCU_cropped_withScaleBar.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f1/Octosporella_jungermanniarum.jpg/330px-Octosporella_jungermanniarum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Melastiza_chateri_-_Flickr_-_gailhampshire.jpg/250px-Melastiza_chateri_-_Flickr_-_gailhampshire.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fe/Geopora_cooperi.jpg/330px-Geopora_cooperi.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Genea_hispidula_40613.jpg/330px-Genea_hispidula_40613.jpg"]},{"name":"Terfeziaceae","parent":"Pezizaceae","rank":"Clade","ipa":"","ipa_alt":[""],"etymology":"","common":["desert truffles"],"tag":"Fruit-bodies are large, more or less spherical to cylindrical, don't split open at maturity, thick-walled, and solid. The asci are formed in marbled veins interspersed with sterile tissue.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/Desert_truffle_-_Terfezia_spp._from_Avanos%2C_Turkey.jpg/330px-Desert_truffle_-_Terfezia_spp._from_Avanos%2C_Turkey.jpg","https://upload.wikimedia.org/wikipedia/commons/8/82/Peziza_spec._-_Lindsey_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c4/Plicaria_endocarpoides_13215.jpg/330px-Plicaria_endocarpoides_13215.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c7/MES2159_Ruhlandiella_and_snail_eggcrp.tif/lossless-page1-542px-MES2159_Ruhlandiella_and_snail_eggcrp.tif.png","https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/Sarcosphaera_coronaria_42754.jpg/330px-Sarcosphaera_coronaria_42754.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Pachyella_clypeata_175754.jpg/330px-Pachyella_clypeata_175754.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Kalaharitrueffel.jpg/250px-Kalaharitrueffel.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Cazia_Folsom_March_18_2025.jpg/330px-Cazia_Folsom_March_18_2025.jpg"]},{"name":"Leotiomyceta","parent":"Pezizomycotina","rank":"Clade","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Represents all the filamentous ascomycete fungi (Pezizomycotina), excluding the classes Pezizomycetes and Orbiliomycetes.","imgs":[]},{"name":"Dothideomyceta","parent":"Leotiomyceta","rank":"Clade","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"","imgs":[]},{"name":"Dothideomycetes","parent":"Dothideomyceta","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Have ascolocular development. Mostly produce flask-like structures. Includes some plant pathogens and lichens.","imgs":["https://upload.wikimedia.org/wikipedia/commons/1/15/Apple_scab_SEM.jpg"]},{"name":"Lecanoromycetes","parent":"Dothideomyceta","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":["sheild lichens","reindeer lichens","cup lichens","mountain lichens","wolf lichens","lungwort lichens"],"tag":"The largest class of lichenized fungi.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Cladonia_sobolescens-2.jpg/250px-Cladonia_sobolescens-2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9c/Rhizocarpon_geographicum01.jpg/330px-Rhizocarpon_geographicum01.jpg","https://upload.wikimedia.org/wikipedia/commons/0/0e/Shrub_Stubble_Lichen_%282298099580%29.jpg","https://upload.wikimedia.org/wikipedia/commons/4/46/Acarospora_glaucocarpa-1.jpg","https://upload.wikimedia.org/wikipedia/commons/9/93/Lecanora_muralis-2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d1/Lecidea_perlatolica_-_Flickr_-_pellaea.jpg/250px-Lecidea_perlatolica_-_Flickr_-_pellaea.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Leprocaulon_knudsenii_-_Flickr_-_pellaea.jpg/250px-Leprocaulon_knudsenii_-_Flickr_-_pellaea.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Apfelflechte_Peltigera_aphtosa_OhWeh-005.jpg/330px-Apfelflechte_Peltigera_aphtosa_OhWeh-005.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e6/Rhizocarpon_superficiale_-_Flickr_-_pellaea_%282%29.jpg/330px-Rhizocarpon_superficiale_-_Flickr_-_pellaea_%282%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Teloschistes_chrysophthalmus4.jpg/250px-Teloschistes_chrysophthalmus4.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/Vezdaea_retigera_TSB002978.jpg/330px-Vezdaea_retigera_TSB002978.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Graphis_scripta.jpg/330px-Graphis_scripta.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Gabura_fasciculare_11361947.jpg/250px-Gabura_fasciculare_11361947.jpg"]},{"name":"Coniocybales","parent":"Dothideomyceta","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Lichens that have stalked reproductive structures called apothecia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/2011-06-21_Chaenotheca_brunneola_%28Ach.%29_M%C3%BCll._Arg_237882.jpg/330px-2011-06-21_Chaenotheca_brunneola_%28Ach.%29_M%C3%BCll._Arg_237882.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e7/Chaenotheca_chlorella.JPG/330px-Chaenotheca_chlorella.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Sclerophora_peronella_291106481.jpg/250px-Sclerophora_peronella_291106481.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/36/Sclerophora_pallida_1611745918.jpg/330px-Sclerophora_pallida_1611745918.jpg"]},{"name":"Lichinales","parent":"Dothideomyceta","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Most species are lichenized.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Lichina_pygmaea_%C3%8E_aux_Vaches_2008-11-26.jpg/330px-Lichina_pygmaea_%C3%8E_aux_Vaches_2008-11-26.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/45/Gloeoheppia_turgida.jpg/330px-Gloeoheppia_turgida.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Lichinella_cribellifera_6160711.jpg/330px-Lichinella_cribellifera_6160711.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ae/Peltula_euploca_2952674.jpg/330px-Peltula_euploca_2952674.jpg","https://upload.wikimedia.org/wikipedia/commons/f/fe/Candelariella.coralliza2.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/05/Candelariella_xanthostigma_a1_%286%29.JPG/330px-Candelariella_xanthostigma_a1_%286%29.JPG"]},{"name":"Arthoniomycetes","parent":"Dothideomyceta","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Most of the taxa in these orders are tropical and subtropical lichens.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Cryptothecia.jpg/250px-Cryptothecia.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Lichenostigma_cosmopolites_143712.jpg/330px-Lichenostigma_cosmopolites_143712.jpg","https://upload.wikimedia.org/wikipedia/commons/d/d0/Arthonia_radiata.jpg"]},{"name":"Eurotiomycetes","parent":"Dothideomyceta","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Includes many lichenized species. Many are mostly bitunicate in the formation of asci.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Flakea_papillata_122726.jpg/250px-Flakea_papillata_122726.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e1/Wahlenbergiella_mucosa_Jymm.jpg/330px-Wahlenbergiella_mucosa_Jymm.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e8/Caliciopsis_calicioides_110992936.jpg/330px-Caliciopsis_calicioides_110992936.jpg","https://upload.wikimedia.org/wikipedia/commons/0/08/Cryptocalicium_blascoi_F_cropped.webp","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f5/Sclerococcum_stygium_182943614.jpg/330px-Sclerococcum_stygium_182943614.jpg"]},{"name":"Sordariomyceta","parent":"Leotiomyceta","rank":"Clade","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"","imgs":[]},{"name":"Leotiomycetes","parent":"Sordariomyceta","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"The inoperculate discomycetes. Many cause serious plant diseases.","imgs":["https://upload.wikimedia.org/wikipedia/commons/d/d8/UncinulaTulasneiDetail.jpg"]},{"name":"Laboulbeniomycetes","parent":"Sordariomyceta","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"A group of fungi that are obligatorily associated with arthropods, either as external parasites or for dispersal.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Laboulbeniales_on_Harmonia_axyridis_%287211939256%29.jpg/330px-Laboulbeniales_on_Harmonia_axyridis_%287211939256%29.jpg"]},{"name":"Sordariomycetes","parent":"Sordariomyceta","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":["stag's horn","dead man's fingers","zombie-ant fungus"],"tag":"The fungi are characterized by a flask-shaped fruiting body (perithecium) that bears saclike structures (asci) and usually has a pore (ostiole) through which ascospores are discharged. Some are parasites to plants, insects and other arthropods.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f5/Langstielige_Ahorn-Holzkeule_%28Xylaria_longipes%29.JPG/250px-Langstielige_Ahorn-Holzkeule_%28Xylaria_longipes%29.JPG","https://upload.wikimedia.org/wikipedia/commons/9/93/Xylaria_hypoxylon.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a1/Ophiocordyceps_unilateralis_B.png/330px-Ophiocordyceps_unilateralis_B.png","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/Ophiocordyceps_unilateralis_A.png/330px-Ophiocordyceps_unilateralis_A.png","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/2010-08-06_Cordyceps_militaris_1.jpg/250px-2010-08-06_Cordyceps_militaris_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d6/Hypocreopsis_rhododendri.JPG/250px-Hypocreopsis_rhododendri.JPG"]},{"name":"Saccharomycotina","parent":"Ascomycota","rank":"Subdivision","ipa":"","ipa_alt":[""],"etymology":"","common":["true yeasts","baker's yeast","human thrush"],"tag":"Includes most of the ascomycete yeasts. Part of the gut microbiome. Members reproduce by budding and do not produce ascocarps.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d9/S_cerevisiae_under_DIC_microscopy.jpg/250px-S_cerevisiae_under_DIC_microscopy.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/95/Saccharomyces_cerevisiae_SEM.jpg/330px-Saccharomyces_cerevisiae_SEM.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/Candida_spores_and_pseudohyphae.jpg/330px-Candida_spores_and_pseudohyphae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Candida_albicans_PHIL_3192_lores.jpg/330px-Candida_albicans_PHIL_3192_lores.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b6/Candida_albicans.jpg"]},{"name":"Taphrinomycotina","parent":"Ascomycota","rank":"Subdivision","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"A disparate and basal group recognized following molecular (DNA) analyses. It includes hyphal fungi, fission yeasts , and the mammalian lung parasite Pneumocystis.","imgs":[]},{"name":"Schizosaccharomycetes","parent":"Taphrinomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Yeasts that reproduce by fission rather than budding","imgs":["https://upload.wikimedia.org/wikipedia/commons/d/da/Fission_yeast.jpg"]},{"name":"Taphrinomycetes","parent":"Taphrinomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":["witches broom"],"tag":"Dimorphic plant parasites that induce a number of galls. They have both a yeast state and a filamentous (hyphal) state in infected plants. They characteristically infect leaves, catkins, and branches, not roots. Taphrinomycetes form asci but no ascomata.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f9/Protomyces_macrosporus_on_Aegopodium_podagraria_lower_surface.JPG/330px-Protomyces_macrosporus_on_Aegopodium_podagraria_lower_surface.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Oak_leaf_blister.JPG/250px-Oak_leaf_blister.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Taphrina_betulina_123463459.jpg/330px-Taphrina_betulina_123463459.jpg"]},{"name":"Neolectomycetes","parent":"Taphrinomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":["Irregular Earth Tongue","Egg-yellow Earth Tongue"],"tag":"Form ascomata which specifically grow out of root tips.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Neolecta_irregularis_76559.jpg/330px-Neolecta_irregularis_76559.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/97/2009-08-01_Neolecta_vitellina_23804.jpg/330px-2009-08-01_Neolecta_vitellina_23804.jpg"]},{"name":"Pneumocystidomycetes","parent":"Taphrinomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Encompasses one genus of yeasts. One species causes Pneumocystis pneumonia in humans by developing cysts on the lung tissue.","imgs":["https://upload.wikimedia.org/wikipedia/commons/8/87/Pneumocystis_carinii_01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/59/Pneumocystisjiroveci.jpg/330px-Pneumocystisjiroveci.jpg","https://upload.wikimedia.org/wikipedia/commons/6/6e/Pneumocystis.jpg"]}],{},{"2010-06-05_Barssia_oregonensis_Gilkey_88036.jpg":[640,480,"#7a5a65"],"250px-2007-02-06_Thecotheus_holmskioldii_(E.C._Hansen)_Eckblad_46531.jpg":[250,244,"#4b473d"],"250px-2010-08-06_Cordyceps_militaris_1.jpg":[250,300,"#4d590d"],"250px-Caloscypha_fulgens.jpg":[250,333,"#878277"],"250px-Cheilymenia_spp_36744.jpg":[250,333,"#694d2d"],"250px-Cladonia_sobolescens-2.jpg":[250,259,"#647265"],"250px-Cookeina_tricholoma_pair_Ecuador.jpg":[250,288,"#2c231f"],"250px-Cryptothecia.jpg":[250,375,"#676e5a"],"250px-Donadinia_nigrella_(1).jpg":[250,333,"#806a68"],"250px-Flakea_papillata_122726.jpg":[250,313,"#6c6d42"],"250px-Frühjahrslorchel.JPG":[250,334,"#9d8562"],"250px-Gabura_fasciculare_11361947.jpg":[250,330,"#5c5c3c"],"250px-Galiella_rufa_87995.jpg":[250,281,"#5c4631"],"250px-Gyromitra_Colima.jpg":[250,375,"#726e47"],"250px-Helvella_crispa_031130w.jpg":[250,333,"#7e624f"],"250px-Hypocreopsis_rhododendri.JPG":[250,288,"#ad763b"],"250px-Kalaharitrueffel.jpg":[250,333,"#8d7f71"],"250px-Langstielige_Ahorn-Holzkeule_(Xylaria_longipes).JPG":[250,388,"#445c28"],"250px-Lecidea_perlatolica_-_Flickr_-_pellaea.jpg":[250,250,"#706556"],"250px-Leprocaulon_knudsenii_-_Flickr_-_pellaea.jpg":[250,333,"#818551"],"250px-Melastiza_chateri_-_Flickr_-_gailhampshire.jpg":[250,246,"#a68772"],"250px-Morchella_esculenta_270408.jpg":[250,334,"#7c7447"],"250px-Oak_leaf_blister.JPG":[250,333,"#5e655e"],"250px-Old_holiday_shot_of_Morchella_esculenta_(GB=_Morel_mushroom,_D=_Speise-Morchel,_NL=_Gewone_morielje)_-_panoramio.jpg":[250,333,"#8a7040"],"250px-Pseudopithyella_miniscula_451262.jpg":[250,250,"#54392d"],"250px-S_cerevisiae_under_DIC_microscopy.jpg":[250,250,"#6f6f6f"],"250px-Sclerophora_peronella_291106481.jpg":[250,333,"#837d77"],"250px-Teloschistes_chrysophthalmus4.jpg":[250,330,"#7f7850"],"250px-Verpa.jpg":[250,332,"#5b5245"],"250px-Wolfina_aurantiopsis_74602.jpg":[250,370,"#4a3e2d"],"250px-Wynnea_sparassoides_74608.jpg":[250,277,"#514a35"],"330px-2005-04-23_Disciotis_venosa.jpg":[330,238,"#523f33"],"330px-2008-03-28_Pseudoplectania_nigrella_cropped.jpg":[330,238,"#584e39"],"330px-2009-08-01_Neolecta_vitellina_23804.jpg":[330,237,"#353525"],"330px-2011-04-09_Neournula_pouchetii_(Berthet_&_Riousset)_Paden_207948.jpg":[330,247,"#353129"],"330px-2011-05-29_Helvella_acetabulum_68463.jpg":[330,235,"#64513e"],"330px-2011-05-31_Helvella_silvicola_68480_cropped.jpg":[330,255,"#625849"],"330px-2011-06-21_Chaenotheca_brunneola_(Ach.)_Müll._Arg_237882.jpg":[330,252,"#a29b7b"],"330px-2011-09-16_Geoglossum_glutinosum_Pers_192121.jpg":[330,264,"#62642f"],"330px-2014-04-02_Ascobolus_carbonarius_P._Karst_412861.jpg":[330,247,"#7a7777"],"330px-2014-10-26_Carbomyces_Gilkey_475175.jpg":[330,204,"#cac0bb"],"330px-2015-05-27_Ascobolus_scatigenus_(Berk)_Brumm_523193.jpg":[330,247,"#6b5f54"],"330px-Aleuria_aurantia_1.jpg":[330,247,"#845c4f"],"330px-Apfelflechte_Peltigera_aphtosa_OhWeh-005.jpg":[330,247,"#626635"],"330px-Ascobolus_215000.jpg":[330,220,"#796e47"],"330px-Caliciopsis_calicioides_110992936.jpg":[330,247,"#888584"],"330px-Caloscypha_fulgens_42761.jpg":[330,247,"#6e5c4a"],"330px-Caloscypha_fulgens_AR.jpg":[330,246,"#673d1d"],"330px-Candelariella_xanthostigma_a1_(6).JPG":[330,248,"#626133"],"330px-Candida_albicans_PHIL_3192_lores.jpg":[330,220,"#464430"],"330px-Candida_spores_and_pseudohyphae.jpg":[330,220,"#af7a7a"],"330px-Cazia_Folsom_March_18_2025.jpg":[330,219,"#644f4d"],"330px-Chaenotheca_chlorella.JPG":[330,219,"#68695f"],"330px-Chorioactis_geaster_2.jpg":[330,296,"#877a6b"],"330px-Desert_truffle_-_Terfezia_spp._from_Avanos,_Turkey.jpg":[330,247,"#7f6537"],"330px-Devil's_cigar_Chorioactis_geaster.jpg":[330,281,"#796846"],"330px-Discina_perlata_95195.jpg":[330,247,"#6e6668"],"330px-DisciotisVenosa.JPG":[330,247,"#58503a"],"330px-Eselsohren_Otidea_onotica.jpg":[330,220,"#444710"],"330px-Genea_hispidula_40613.jpg":[330,247,"#745c45"],"330px-Geopora_cooperi.jpg":[330,247,"#707e67"],"330px-Gloeoheppia_turgida.jpg":[330,245,"#7c756b"],"330px-Graphis_scripta.jpg":[330,248,"#6d794f"],"330px-Gymnohydnotrya_sp.png":[330,139,"#5f4f5d"],"330px-Gyromitra_anthracobia_(19.3.17-Kourdali)_1.jpg":[330,232,"#635f5d"],"330px-Halbkugeliger_Borstling_Humaria_hemisphaerica.jpg":[330,219,"#41413b"],"330px-Helvella_ephippium_sattellorchel.jpg":[330,225,"#56503b"],"330px-Hydnotrya_tulasnei_89493.jpg":[330,247,"#ab8e78"],"330px-Kalapuya_brunnea_53866.jpg":[330,219,"#89663e"],"330px-Laboulbeniales_on_Harmonia_axyridis_(7211939256).jpg":[330,219,"#828138"],"330px-Lichenostigma_cosmopolites_143712.jpg":[330,289,"#696651"],"330px-Lichina_pygmaea_Î_aux_Vaches_2008-11-26.jpg":[330,247,"#6a6f74"],"330px-Lichinella_cribellifera_6160711.jpg":[330,220,"#6d635c"],"330px-LongNek1.JPG":[330,247,"#828e73"],"330px-Maeandertrueffel.jpg":[330,216,"#6f706c"],"330px-Microstoma_floccosum_13099.jpg":[330,247,"#644a2b"],"330px-Morchella_americana_on_a_mossy_riverbank_in_MI.jpg":[330,247,"#978b4b"],"330px-Morchella_elata_4846.JPG":[330,220,"#857963"],"330px-Morchella_esculenta_5.jpg":[330,248,"#958e86"],"330px-Neolecta_irregularis_76559.jpg":[330,230,"#5a4f15"],"330px-Neottiella_rutilans_Jymm_02.jpg":[330,220,"#5e5c4f"],"330px-Octosporella_jungermanniarum.jpg":[330,251,"#978331"],"330px-Ophiocordyceps_unilateralis_A.png":[330,238,"#353d14"],"330px-Ophiocordyceps_unilateralis_B.png":[330,238,"#828139"],"330px-Pachyella_clypeata_175754.jpg":[330,220,"#7e665e"],"330px-Peltula_euploca_2952674.jpg":[330,220,"#6a6661"],"330px-Phillipsia_domingensis_105040.jpg":[330,247,"#827571"],"330px-Phillipsia_lutea_239291.jpg":[330,247,"#706b30"],"330px-Phillipsia_subpurpurea_423741.jpg":[330,247,"#433a3d"],"330px-Pithya_189.jpg":[330,247,"#1e160f"],"330px-Plectania_nannfeldtii_187.jpg":[330,247,"#281e1b"],"330px-Plicaria_endocarpoides_13215.jpg":[330,234,"#7c7167"],"330px-Pneumocystisjiroveci.jpg":[330,234,"#a1b39e"],"330px-Protomyces_macrosporus_on_Aegopodium_podagraria_lower_surface.JPG":[330,259,"#889a71"],"330px-Pseudorhizina_sphaerospora_338724.jpg":[330,247,"#585b15"],"330px-PyronemaSCU_cropped_withScaleBar.jpg":[330,206,"#605e52"],"330px-Pyropyxis_rubra_153286.jpg":[330,220,"#846250"],"330px-Rhizina_undulata.JPG":[330,247,"#888485"],"330px-Rhizina_undulata_California.jpg":[330,220,"#635b5d"],"330px-Rhizocarpon_geographicum01.jpg":[330,254,"#7c766a"],"330px-Rhizocarpon_superficiale_-_Flickr_-_pellaea_(2).jpg":[330,248,"#565b38"],"330px-Saccharomyces_cerevisiae_SEM.jpg":[330,213,"#707070"],"330px-Sarcoscypha_coccinea_74716.jpg":[330,247,"#6a6b51"],"330px-Sarcosphaera_coronaria_42754.jpg":[330,247,"#67564a"],"330px-Scarlet_elf_cap_cadnant_dingle.jpg":[330,254,"#825a4b"],"330px-Sclerococcum_stygium_182943614.jpg":[330,220,"#bab7b1"],"330px-Sclerophora_pallida_1611745918.jpg":[330,221,"#716353"],"330px-Sowerbyella_rhenana_77176.jpg":[330,248,"#7a572f"],"330px-Taphrina_betulina_123463459.jpg":[330,220,"#9e9c95"],"330px-Truffle_4.jpg":[330,247,"#898182"],"330px-Truffle_washed_and_cut.jpg":[330,266,"#bdb5a9"],"330px-Underwoodia_columnaris_265847.jpg":[330,247,"#585753"],"330px-Urnula_craterium_closeup.jpg":[330,236,"#504432"],"330px-Vezdaea_retigera_TSB002978.jpg":[330,245,"#4c4d3a"],"330px-Wahlenbergiella_mucosa_Jymm.jpg":[330,247,"#939899"],"330px-White_Morel_IMG_0399.JPG":[330,247,"#797a77"],"330px-Wynnea_americana_47834.jpg":[330,247,"#5f612f"],"Acarospora_glaucocarpa-1.jpg":[735,485,"#8c8561"],"Apple_scab_SEM.jpg":[640,433,"#787878"],"Arthonia_radiata.jpg":[735,518,"#af8c88"],"Bombmurkla.jpg":[800,600,"#544224"],"Candelariella.coralliza2.-.lindsey.jpg":[640,428,"#90794a"],"Candida_albicans.jpg":[640,480,"#dbd2cf"],"Cryptocalicium_blascoi_F_cropped.webp":[422,505,"#5e5846"],"Fission_yeast.jpg":[325,260,"#797979"],"Helvella_costifera_297108.jpg":[500,333,"#433f36"],"Lasiobolus_papillatus_499885.jpg":[640,480,"#545440"],"Lecanora_muralis-2.jpg":[720,467,"#86806f"],"Leucangium_carthusianum_17755.jpg":[640,480,"#595a71"],"Peziza_spec._-_Lindsey_1.jpg":[640,425,"#846340"],"Pneumocystis.jpg":[600,364,"#97c7e3"],"Pneumocystis_carinii_01.jpg":[1795,1200,"#90b25c"],"Scutellinia_spec._-_Lindsey_1.jpg":[398,600,"#956d61"],"Shrub_Stubble_Lichen_(2298099580).jpg":[600,400,"#6c6769"],"UncinulaTulasneiDetail.jpg":[568,454,"#788c59"],"Xylaria_hypoxylon.jpg":[800,600,"#666252"],"lossless-page1-542px-MES2159_Ruhlandiella_and_snail_eggcrp.tif.png":[542,600,"#7d7e7a"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_fungi_ascomycota","<ul class=\"tree\" data-tree-range=\"ascomycota\"><li><input type=\"checkbox\" checked id=\"Dikarya_Ascomycota\"><label class=\"tree_label\" for=\"Dikarya_Ascomycota\"></label><div class=\"outer_tree_box\"><div id=\"ascomycota_ascomycota\" class=\"tree_box\"><span><span>Ascomycota</span><a href=\"https://en.wikipedia.org/wiki/Ascomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ascomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ascomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"fungi\">See parent</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(morels, truffles, brewers&#x27; yeast, bakers&#x27; yeast, dead man&#x27;s fingers, cup fungi, ascolichens, penicillium)</span><p class=\"tag\">Characterized by a saclike structure, the ascus that may forcibly eject the ascospores. Genetically related fungi in the group may not have this structure.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Morchella_esculenta_5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Morchella_esculenta_5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#958e86\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Truffe_noire_du_P%C3%A9rigord.jpg\" target=\"_blank\"><img src=\"thumbnails/Truffe_noire_du_P%C3%A9rigord.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#8c8885\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saccharomyces_cerevisiae_SEM.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saccharomyces_cerevisiae_SEM.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"213\" style=\"background-color:#707070\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Xylaria_hypoxylon.jpg\" target=\"_blank\"><img src=\"thumbnails/Xylaria_hypoxylon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#666252\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Peziza_spec._-_Lindsey_1.jpg\" target=\"_blank\"><img src=\"thumbnails/Peziza_spec._-_Lindsey_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#846340\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aleuria_aurantia_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aleuria_aurantia_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#845c4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Letharia_vulpina_JHollinger_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Letharia_vulpina_JHollinger_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#6b7254\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CladoniaSpec01.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-CladoniaSpec01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#625e41\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cladonia_grayi_108849472.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cladonia_grayi_108849472.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#827d4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cladonia_macrophyllodes_109105.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cladonia_macrophyllodes_109105.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4e561b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Candida_Gram_stain.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Candida_Gram_stain.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#bfacd8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Candida_albicans_PHIL_3192_lores.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Candida_albicans_PHIL_3192_lores.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#464430\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flavoparmelia_caperata_240112.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Flavoparmelia_caperata_240112.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#656b52\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Xantoria-by-color.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Xantoria-by-color.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#aba277\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Penicillium_%D0%BD%D0%B0_%D0%BC%D0%B0%D0%BD%D0%B4%D0%B0%D1%80%D0%B8%D0%BD%D0%B5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a17e3f\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Ascomycota_Pezizomycotina\"><label class=\"tree_label\" for=\"Ascomycota_Pezizomycotina\"></label><div class=\"outer_tree_box\"><div id=\"ascomycota_pezizomycotina\" class=\"tree_box\"><span><span>Pezizomycotina</span><a href=\"https://en.wikipedia.org/wiki/Pezizomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pezizomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pezizomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subdivision</span></span><span class=\"common_names\">(truffles, ergot, ascolichens, cup fungi, pyrenomycetes, lorchels, caterpillar fungus, powdery mildews, dermatophytic fungi, Laboulbeniales)</span><p class=\"tag\">These fungi reproduce by fission rather than budding. It&#x27;s the largest subphylum and contains all ascomycetes that produce ascocarps (fruiting bodies), except for one genus, Neolecta, in the Taphrinomycotina.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_orbiliomycetes\" class=\"tree_box\"><span><span>Orbiliomycetes</span><a href=\"https://en.wikipedia.org/wiki/Orbiliomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Orbiliomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Orbiliomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Saprobic sac fungi. Some species are carnivorous fungi, and have evolved to trap nematodes.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_geoglossaceae\" class=\"tree_box\"><span><span>Geoglossaceae</span><a href=\"https://en.wikipedia.org/wiki/Geoglossaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Geoglossaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Geoglossaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(earth tongues)</span><p class=\"tag\">The ascocarps of most species in the family Geoglossaceae are terrestrial and are generally small, dark in color, and club-shaped with a height of 2–8 cm</p><div><a href=\"https://commons.wikimedia.org/wiki/File:2011-09-16_Geoglossum_glutinosum_Pers_192121.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2011-09-16_Geoglossum_glutinosum_Pers_192121.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#62642f\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Pezizomycotina_Pezizomycetes\"><label class=\"tree_label\" for=\"Pezizomycotina_Pezizomycetes\"></label><div class=\"outer_tree_box\"><div id=\"ascomycota_pezizomycetes\" class=\"tree_box\"><span><span>Pezizomycetes</span><a href=\"https://en.wikipedia.org/wiki/Pezizomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pezizomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pezizomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(cup fungi, morels, Elfin saddles, truffles)</span><p class=\"tag\">The operculate discomycetes.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Aleuria_aurantia_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aleuria_aurantia_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#845c4f\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Pezizomycetes_Pezizales\"><label class=\"tree_label\" for=\"Pezizomycetes_Pezizales\"></label><div class=\"outer_tree_box\"><div id=\"ascomycota_pezizales\" class=\"tree_box\"><span><span>Pezizales</span><a href=\"https://en.wikipedia.org/wiki/Pezizales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pezizales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pezizales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_sarcoscyphaceae\" class=\"tree_box\"><span><span>Sarcoscyphaceae</span><a href=\"https://en.wikipedia.org/wiki/Sarcoscyphaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sarcoscyphaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sarcoscyphaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(scarlet elf cup)</span><p class=\"tag\">Cup fungi found in both tropical and temperate regions.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Sarcoscypha_coccinea_74716.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sarcoscypha_coccinea_74716.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6a6b51\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cookeina_tricholoma_pair_Ecuador.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cookeina_tricholoma_pair_Ecuador.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"288\" style=\"background-color:#2c231f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Microstoma_floccosum_13099.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Microstoma_floccosum_13099.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#644a2b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phillipsia_domingensis_105040.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phillipsia_domingensis_105040.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#827571\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phillipsia_subpurpurea_423741.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phillipsia_subpurpurea_423741.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#433a3d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phillipsia_lutea_239291.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phillipsia_lutea_239291.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#706b30\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pithya_189.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pithya_189.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#1e160f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pseudopithyella_miniscula_451262.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pseudopithyella_miniscula_451262.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#54392d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scarlet_elf_cap_cadnant_dingle.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scarlet_elf_cap_cadnant_dingle.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"254\" style=\"background-color:#825a4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wynnea_sparassoides_74608.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Wynnea_sparassoides_74608.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"277\" style=\"background-color:#514a35\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wynnea_americana_47834.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wynnea_americana_47834.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5f612f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_tuberaceae\" class=\"tree_box\"><span><span>Tuberaceae</span><a href=\"https://en.wikipedia.org/wiki/Tuberaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tuberaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tuberaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(white truffles, black truffles)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Truffle_washed_and_cut.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Truffle_washed_and_cut.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"266\" style=\"background-color:#bdb5a9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Truffle_4.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Truffle_4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#898182\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Maeandertrueffel.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Maeandertrueffel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"216\" style=\"background-color:#6f706c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_carbomycetaceae\" class=\"tree_box\"><span><span>Carbomycetaceae</span><a href=\"https://en.wikipedia.org/wiki/Carbomycetaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Carbomycetaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Carbomycetaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">Desert truffles found in Mexico and the USA.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:2014-10-26_Carbomyces_Gilkey_475175.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2014-10-26_Carbomyces_Gilkey_475175.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"204\" style=\"background-color:#cac0bb\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_ascobolaceae\" class=\"tree_box\"><span><span>Ascobolaceae</span><a href=\"https://en.wikipedia.org/wiki/Ascobolaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ascobolaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ascobolaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">Most fruiting bodies are round and without conidium. Members have a saprobiontic lifestyle, feeding on decaying and dead matter.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:2007-02-06_Thecotheus_holmskioldii_%28E.C._Hansen%29_Eckblad_46531.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2007-02-06_Thecotheus_holmskioldii_%28E.C._Hansen%29_Eckblad_46531.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"244\" style=\"background-color:#4b473d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2014-04-02_Ascobolus_carbonarius_P._Karst_412861.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2014-04-02_Ascobolus_carbonarius_P._Karst_412861.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7a7777\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2015-05-27_Ascobolus_scatigenus_%28Berk%29_Brumm_523193.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2015-05-27_Ascobolus_scatigenus_%28Berk%29_Brumm_523193.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6b5f54\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ascobolus_215000.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ascobolus_215000.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#796e47\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_glaziellaceae\" class=\"tree_box\"><span><span>Glaziellaceae</span><a href=\"https://en.wikipedia.org/wiki/Glaziellaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Glaziellaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Glaziellaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(orange bladder)</span><p class=\"tag\">Includes organge cup fungi.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_sarcosomataceae\" class=\"tree_box\"><span><span>Sarcosomataceae</span><a href=\"https://en.wikipedia.org/wiki/Sarcosomataceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sarcosomataceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sarcosomataceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">The type genus is Sarcosoma. Most are cup fungi and have a dark brown or black apothecium which is gelatinous or leathery.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Donadinia_nigrella_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Donadinia_nigrella_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#806a68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Galiella_rufa_87995.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Galiella_rufa_87995.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"281\" style=\"background-color:#5c4631\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Plectania_nannfeldtii_187.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Plectania_nannfeldtii_187.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#281e1b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2008-03-28_Pseudoplectania_nigrella_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2008-03-28_Pseudoplectania_nigrella_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#584e39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bombmurkla.jpg\" target=\"_blank\"><img src=\"thumbnails/Bombmurkla.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#544224\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Urnula_craterium_closeup.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Urnula_craterium_closeup.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#504432\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_rhizinaceae\" class=\"tree_box\"><span><span>Rhizinaceae</span><a href=\"https://en.wikipedia.org/wiki/Rhizinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rhizinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rhizinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(doughnut fungi)</span><p class=\"tag\">Fungi parasitic on conifer seedlings. The fruit bodies of the fungus are dark purple brown with a bright yellow margin, crust-like and attached to the growing surface by numerous root-like yellow rhizoids.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Rhizina_undulata.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Rhizina_undulata.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#888485\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhizina_undulata_California.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rhizina_undulata_California.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#635b5d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_chorioactidaceae\" class=\"tree_box\"><span><span>Chorioactidaceae</span><a href=\"https://en.wikipedia.org/wiki/Chorioactidaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chorioactidaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chorioactidaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(devil&#x27;s cigars)</span><p class=\"tag\">Cup fungi with taxa that are saprotrophic, and inhabit temperate and subtropical regions.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Devil%27s_cigar_Chorioactis_geaster.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Devil%27s_cigar_Chorioactis_geaster.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"281\" style=\"background-color:#796846\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chorioactis_geaster_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chorioactis_geaster_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"296\" style=\"background-color:#877a6b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2011-04-09_Neournula_pouchetii_%28Berthet_%26_Riousset%29_Paden_207948.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2011-04-09_Neournula_pouchetii_%28Berthet_%26_Riousset%29_Paden_207948.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#353129\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wolfina_aurantiopsis_74602.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Wolfina_aurantiopsis_74602.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"370\" style=\"background-color:#4a3e2d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_caloscyphaceae\" class=\"tree_box\"><span><span>Caloscyphaceae</span><a href=\"https://en.wikipedia.org/wiki/Caloscyphaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Caloscyphaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Caloscyphaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(snowbank orange peel fungus)</span><p class=\"tag\">Contains cup fungi with a bright to pale orange interior and orange.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Caloscypha_fulgens_AR.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caloscypha_fulgens_AR.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"246\" style=\"background-color:#673d1d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caloscypha_fulgens.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Caloscypha_fulgens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#878277\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caloscypha_fulgens_42761.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caloscypha_fulgens_42761.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6e5c4a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_morchellaceae\" class=\"tree_box\"><span><span>Morchellaceae</span><a href=\"https://en.wikipedia.org/wiki/Morchellaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Morchellaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Morchellaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(morels, bleach cups, early morels, thimble morels, Oregon brown truffles)</span><p class=\"tag\">The best-known members are the true morels, the thimble morels, and a genus of cup-shaped fungi.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Morchella_esculenta_270408.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Morchella_esculenta_270408.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"334\" style=\"background-color:#7c7447\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Verpa.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Verpa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"332\" style=\"background-color:#5b5245\"></a><a href=\"https://commons.wikimedia.org/wiki/File:DisciotisVenosa.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-DisciotisVenosa.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#58503a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2005-04-23_Disciotis_venosa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2005-04-23_Disciotis_venosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#523f33\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Old_holiday_shot_of_Morchella_esculenta_%28GB%3D_Morel_mushroom%2C_D%3D_Speise-Morchel%2C_NL%3D_Gewone_morielje%29_-_panoramio.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Old_holiday_shot_of_Morchella_esculenta_%28GB%3D_Morel_mushroom%2C_D%3D_Speise-Morchel%2C_NL%3D_Gewone_morielje%29_-_panoramio.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#8a7040\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Morchella_americana_on_a_mossy_riverbank_in_MI.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Morchella_americana_on_a_mossy_riverbank_in_MI.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#978b4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Morchella_esculenta_5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Morchella_esculenta_5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#958e86\"></a><a href=\"https://commons.wikimedia.org/wiki/File:White_Morel_IMG_0399.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-White_Morel_IMG_0399.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#797a77\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Morchella_elata_4846.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Morchella_elata_4846.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#857963\"></a><a href=\"https://commons.wikimedia.org/wiki/File:LongNek1.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-LongNek1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#828e73\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kalapuya_brunnea_53866.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Kalapuya_brunnea_53866.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#89663e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leucangium_carthusianum_17755.jpg\" target=\"_blank\"><img src=\"thumbnails/Leucangium_carthusianum_17755.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#595a71\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Pezizales_Pezizaceae\"><label class=\"tree_label\" for=\"Pezizales_Pezizaceae\"></label><div class=\"outer_tree_box\"><div id=\"ascomycota_pezizaceae\" class=\"tree_box\"><span><span>Pezizaceae</span><a href=\"https://en.wikipedia.org/wiki/Pezizaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pezizaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pezizaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(cup fungi)</span><p class=\"tag\">They produce mushrooms that tend to grow in the shape of a &#x27;cup&#x27;. Spores are formed on the inner surface of the fruit body (ascoma). The cup shape typically serves to focus raindrops into splashing spores out of the cup.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_terfeziaceae\" class=\"tree_box\"><span><span>Terfeziaceae</span><a href=\"https://en.wikipedia.org/wiki/Terfeziaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Terfeziaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Terfeziaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(desert truffles)</span><p class=\"tag\">Fruit-bodies are large, more or less spherical to cylindrical, don&#x27;t split open at maturity, thick-walled, and solid. The asci are formed in marbled veins interspersed with sterile tissue.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Desert_truffle_-_Terfezia_spp._from_Avanos%2C_Turkey.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Desert_truffle_-_Terfezia_spp._from_Avanos%2C_Turkey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7f6537\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Peziza_spec._-_Lindsey_1.jpg\" target=\"_blank\"><img src=\"thumbnails/Peziza_spec._-_Lindsey_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#846340\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Plicaria_endocarpoides_13215.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Plicaria_endocarpoides_13215.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#7c7167\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MES2159_Ruhlandiella_and_snail_eggcrp.tif\" target=\"_blank\"><img src=\"thumbnails/lossless-page1-542px-MES2159_Ruhlandiella_and_snail_eggcrp.tif.png\" class=\"taxa-img\" loading=\"lazy\" width=\"542\" height=\"600\" style=\"background-color:#7d7e7a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sarcosphaera_coronaria_42754.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sarcosphaera_coronaria_42754.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#67564a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pachyella_clypeata_175754.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pachyella_clypeata_175754.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7e665e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kalaharitrueffel.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Kalaharitrueffel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#8d7f71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cazia_Folsom_March_18_2025.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cazia_Folsom_March_18_2025.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#644f4d\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_ascodesmidaceae\" class=\"tree_box\"><span><span>Ascodesmidaceae</span><a href=\"https://en.wikipedia.org/wiki/Ascodesmidaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ascodesmidaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ascodesmidaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:Lasiobolus_papillatus_499885.jpg\" target=\"_blank\"><img src=\"thumbnails/Lasiobolus_papillatus_499885.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#545440\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_discinaceae\" class=\"tree_box\"><span><span>Discinaceae</span><a href=\"https://en.wikipedia.org/wiki/Discinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Discinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Discinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(false morels, pig ear)</span><p class=\"tag\">Includes species possessing saddle-shaped apothecia and hypogeous truffles. Members are known to have epigeous and hypogeous species, and are characterized by ascomata composed of an inner layer of interwoven hyphae and an outer layer composed of elongated cells arranged perpendicular to its exterior.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Fr%C3%BChjahrslorchel.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Fr%C3%BChjahrslorchel.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"334\" style=\"background-color:#9d8562\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gyromitra_Colima.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gyromitra_Colima.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#726e47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Discina_perlata_95195.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Discina_perlata_95195.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6e6668\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gymnohydnotrya_sp.png\" target=\"_blank\"><img src=\"thumbnails/330px-Gymnohydnotrya_sp.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"139\" style=\"background-color:#5f4f5d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydnotrya_tulasnei_89493.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydnotrya_tulasnei_89493.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#ab8e78\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pseudorhizina_sphaerospora_338724.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudorhizina_sphaerospora_338724.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#585b15\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gyromitra_anthracobia_%2819.3.17-Kourdali%29_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gyromitra_anthracobia_%2819.3.17-Kourdali%29_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"232\" style=\"background-color:#635f5d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_helvellaceae\" class=\"tree_box\"><span><span>Helvellaceae</span><a href=\"https://en.wikipedia.org/wiki/Helvellaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Helvellaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Helvellaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(elfin saddles)</span><p class=\"tag\">Almost all species have saddle-shaped ascocarps with cupulate or  lobed  caps  on a  disinct  shape,  and ellipsoid ascospores.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:2010-06-05_Barssia_oregonensis_Gilkey_88036.jpg\" target=\"_blank\"><img src=\"thumbnails/2010-06-05_Barssia_oregonensis_Gilkey_88036.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#7a5a65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2011-05-29_Helvella_acetabulum_68463.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2011-05-29_Helvella_acetabulum_68463.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"235\" style=\"background-color:#64513e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Helvella_costifera_297108.jpg\" target=\"_blank\"><img src=\"thumbnails/Helvella_costifera_297108.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"333\" style=\"background-color:#433f36\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Helvella_ephippium_sattellorchel.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Helvella_ephippium_sattellorchel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"225\" style=\"background-color:#56503b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Helvella_crispa_031130w.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Helvella_crispa_031130w.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7e624f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Underwoodia_columnaris_265847.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Underwoodia_columnaris_265847.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#585753\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2011-05-31_Helvella_silvicola_68480_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2011-05-31_Helvella_silvicola_68480_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#625849\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_pyronemataceae\" class=\"tree_box\"><span><span>Pyronemataceae</span><a href=\"https://en.wikipedia.org/wiki/Pyronemataceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pyronemataceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pyronemataceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">Morphologically and ecologically highly diverse, comprising saprobic, ectomycorrhizal, bryosymbiotic and parasitic species, occurring in a broad range of habitats.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pyropyxis_rubra_153286.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pyropyxis_rubra_153286.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#846250\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neottiella_rutilans_Jymm_02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Neottiella_rutilans_Jymm_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5e5c4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Halbkugeliger_Borstling_Humaria_hemisphaerica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Halbkugeliger_Borstling_Humaria_hemisphaerica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#41413b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eselsohren_Otidea_onotica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eselsohren_Otidea_onotica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#444710\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scutellinia_spec._-_Lindsey_1.jpg\" target=\"_blank\"><img src=\"thumbnails/Scutellinia_spec._-_Lindsey_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"398\" height=\"600\" style=\"background-color:#956d61\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sowerbyella_rhenana_77176.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sowerbyella_rhenana_77176.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#7a572f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cheilymenia_spp_36744.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cheilymenia_spp_36744.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#694d2d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:PyronemaSCU_cropped_withScaleBar.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-PyronemaSCU_cropped_withScaleBar.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#605e52\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Octosporella_jungermanniarum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Octosporella_jungermanniarum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#978331\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Melastiza_chateri_-_Flickr_-_gailhampshire.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Melastiza_chateri_-_Flickr_-_gailhampshire.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"246\" style=\"background-color:#a68772\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Geopora_cooperi.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Geopora_cooperi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#707e67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Genea_hispidula_40613.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Genea_hispidula_40613.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#745c45\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Pezizomycotina_Leotiomyceta\"><label class=\"tree_label\" for=\"Pezizomycotina_Leotiomyceta\"></label><div class=\"outer_tree_box\"><div id=\"ascomycota_leotiomyceta\" class=\"tree_box\"><span><span>Leotiomyceta</span><a href=\"https://en.wikipedia.org/wiki/Leotiomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Leotiomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Leotiomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Represents all the filamentous ascomycete fungi (Pezizomycotina), excluding the classes Pezizomycetes and Orbiliomycetes.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Leotiomyceta_Dothideomyceta\"><label class=\"tree_label\" for=\"Leotiomyceta_Dothideomyceta\"></label><div class=\"outer_tree_box\"><div id=\"ascomycota_dothideomyceta\" class=\"tree_box\"><span><span>Dothideomyceta</span><a href=\"https://en.wikipedia.org/wiki/Dothideomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dothideomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dothideomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_dothideomycetes\" class=\"tree_box\"><span><span>Dothideomycetes</span><a href=\"https://en.wikipedia.org/wiki/Dothideomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dothideomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dothideomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Have ascolocular development. Mostly produce flask-like structures. Includes some plant pathogens and lichens.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Apple_scab_SEM.jpg\" target=\"_blank\"><img src=\"thumbnails/Apple_scab_SEM.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"433\" style=\"background-color:#787878\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_lecanoromycetes\" class=\"tree_box\"><span><span>Lecanoromycetes</span><a href=\"https://en.wikipedia.org/wiki/Lecanoromycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lecanoromycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lecanoromycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(sheild lichens, reindeer lichens, cup lichens, mountain lichens, wolf lichens, lungwort lichens)</span><p class=\"tag\">The largest class of lichenized fungi.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cladonia_sobolescens-2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cladonia_sobolescens-2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"259\" style=\"background-color:#647265\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhizocarpon_geographicum01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rhizocarpon_geographicum01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"254\" style=\"background-color:#7c766a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Shrub_Stubble_Lichen_%282298099580%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Shrub_Stubble_Lichen_%282298099580%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"400\" style=\"background-color:#6c6769\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acarospora_glaucocarpa-1.jpg\" target=\"_blank\"><img src=\"thumbnails/Acarospora_glaucocarpa-1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"735\" height=\"485\" style=\"background-color:#8c8561\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lecanora_muralis-2.jpg\" target=\"_blank\"><img src=\"thumbnails/Lecanora_muralis-2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"720\" height=\"467\" style=\"background-color:#86806f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lecidea_perlatolica_-_Flickr_-_pellaea.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lecidea_perlatolica_-_Flickr_-_pellaea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#706556\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leprocaulon_knudsenii_-_Flickr_-_pellaea.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Leprocaulon_knudsenii_-_Flickr_-_pellaea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#818551\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apfelflechte_Peltigera_aphtosa_OhWeh-005.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apfelflechte_Peltigera_aphtosa_OhWeh-005.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#626635\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhizocarpon_superficiale_-_Flickr_-_pellaea_%282%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rhizocarpon_superficiale_-_Flickr_-_pellaea_%282%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#565b38\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Teloschistes_chrysophthalmus4.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Teloschistes_chrysophthalmus4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"330\" style=\"background-color:#7f7850\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vezdaea_retigera_TSB002978.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vezdaea_retigera_TSB002978.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#4c4d3a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Graphis_scripta.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Graphis_scripta.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#6d794f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gabura_fasciculare_11361947.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gabura_fasciculare_11361947.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"330\" style=\"background-color:#5c5c3c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_coniocybales\" class=\"tree_box\"><span><span>Coniocybales</span><a href=\"https://en.wikipedia.org/wiki/Coniocybales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Coniocybales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Coniocybales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Lichens that have stalked reproductive structures called apothecia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:2011-06-21_Chaenotheca_brunneola_%28Ach.%29_M%C3%BCll._Arg_237882.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2011-06-21_Chaenotheca_brunneola_%28Ach.%29_M%C3%BCll._Arg_237882.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"252\" style=\"background-color:#a29b7b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chaenotheca_chlorella.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Chaenotheca_chlorella.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#68695f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sclerophora_peronella_291106481.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sclerophora_peronella_291106481.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#837d77\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sclerophora_pallida_1611745918.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sclerophora_pallida_1611745918.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#716353\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_lichinales\" class=\"tree_box\"><span><span>Lichinales</span><a href=\"https://en.wikipedia.org/wiki/Lichinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lichinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lichinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Most species are lichenized.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lichina_pygmaea_%C3%8E_aux_Vaches_2008-11-26.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lichina_pygmaea_%C3%8E_aux_Vaches_2008-11-26.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6a6f74\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gloeoheppia_turgida.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gloeoheppia_turgida.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#7c756b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lichinella_cribellifera_6160711.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lichinella_cribellifera_6160711.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6d635c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Peltula_euploca_2952674.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Peltula_euploca_2952674.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6a6661\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Candelariella.coralliza2.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Candelariella.coralliza2.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"428\" style=\"background-color:#90794a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Candelariella_xanthostigma_a1_%286%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Candelariella_xanthostigma_a1_%286%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#626133\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_arthoniomycetes\" class=\"tree_box\"><span><span>Arthoniomycetes</span><a href=\"https://en.wikipedia.org/wiki/Arthoniomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Arthoniomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Arthoniomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Most of the taxa in these orders are tropical and subtropical lichens.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cryptothecia.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cryptothecia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#676e5a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lichenostigma_cosmopolites_143712.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lichenostigma_cosmopolites_143712.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"289\" style=\"background-color:#696651\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Arthonia_radiata.jpg\" target=\"_blank\"><img src=\"thumbnails/Arthonia_radiata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"735\" height=\"518\" style=\"background-color:#af8c88\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_eurotiomycetes\" class=\"tree_box\"><span><span>Eurotiomycetes</span><a href=\"https://en.wikipedia.org/wiki/Eurotiomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eurotiomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eurotiomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Includes many lichenized species. Many are mostly bitunicate in the formation of asci.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Flakea_papillata_122726.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Flakea_papillata_122726.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"313\" style=\"background-color:#6c6d42\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wahlenbergiella_mucosa_Jymm.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wahlenbergiella_mucosa_Jymm.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#939899\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caliciopsis_calicioides_110992936.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caliciopsis_calicioides_110992936.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#888584\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cryptocalicium_blascoi_F_cropped.webp\" target=\"_blank\"><img src=\"thumbnails/Cryptocalicium_blascoi_F_cropped.webp\" class=\"taxa-img\" loading=\"lazy\" width=\"422\" height=\"505\" style=\"background-color:#5e5846\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sclerococcum_stygium_182943614.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sclerococcum_stygium_182943614.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#bab7b1\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Leotiomyceta_Sordariomyceta\"><label class=\"tree_label\" for=\"Leotiomyceta_Sordariomyceta\"></label><div class=\"outer_tree_box\"><div id=\"ascomycota_sordariomyceta\" class=\"tree_box\"><span><span>Sordariomyceta</span><a href=\"https://en.wikipedia.org/wiki/Sordariomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sordariomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sordariomyceta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_leotiomycetes\" class=\"tree_box\"><span><span>Leotiomycetes</span><a href=\"https://en.wikipedia.org/wiki/Leotiomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Leotiomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Leotiomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">The inoperculate discomycetes. Many cause serious plant diseases.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:UncinulaTulasneiDetail.jpg\" target=\"_blank\"><img src=\"thumbnails/UncinulaTulasneiDetail.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"568\" height=\"454\" style=\"background-color:#788c59\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_laboulbeniomycetes\" class=\"tree_box\"><span><span>Laboulbeniomycetes</span><a href=\"https://en.wikipedia.org/wiki/Laboulbeniomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Laboulbeniomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Laboulbeniomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">A group of fungi that are obligatorily associated with arthropods, either as external parasites or for dispersal.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Laboulbeniales_on_Harmonia_axyridis_%287211939256%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Laboulbeniales_on_Harmonia_axyridis_%287211939256%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#828138\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_sordariomycetes\" class=\"tree_box\"><span><span>Sordariomycetes</span><a href=\"https://en.wikipedia.org/wiki/Sordariomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sordariomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sordariomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(stag&#x27;s horn, dead man&#x27;s fingers, zombie-ant fungus)</span><p class=\"tag\">The fungi are characterized by a flask-shaped fruiting body (perithecium) that bears saclike structures (asci) and usually has a pore (ostiole) through which ascospores are discharged. Some are parasites to plants, insects and other arthropods.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Langstielige_Ahorn-Holzkeule_%28Xylaria_longipes%29.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Langstielige_Ahorn-Holzkeule_%28Xylaria_longipes%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"388\" style=\"background-color:#445c28\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Xylaria_hypoxylon.jpg\" target=\"_blank\"><img src=\"thumbnails/Xylaria_hypoxylon.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#666252\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ophiocordyceps_unilateralis_B.png\" target=\"_blank\"><img src=\"thumbnails/330px-Ophiocordyceps_unilateralis_B.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#828139\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ophiocordyceps_unilateralis_A.png\" target=\"_blank\"><img src=\"thumbnails/330px-Ophiocordyceps_unilateralis_A.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#353d14\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2010-08-06_Cordyceps_militaris_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2010-08-06_Cordyceps_militaris_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"300\" style=\"background-color:#4d590d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hypocreopsis_rhododendri.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Hypocreopsis_rhododendri.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"288\" style=\"background-color:#ad763b\"></a></div></div></div></li></ul></li></ul></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_saccharomycotina\" class=\"tree_box\"><span><span>Saccharomycotina</span><a href=\"https://en.wikipedia.org/wiki/Saccharomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Saccharomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Saccharomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subdivision</span></span><span class=\"common_names\">(true yeasts, baker&#x27;s yeast, human thrush)</span><p class=\"tag\">Includes most of the ascomycete yeasts. Part of the gut microbiome. Members reproduce by budding and do not produce ascocarps.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:S_cerevisiae_under_DIC_microscopy.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-S_cerevisiae_under_DIC_microscopy.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#6f6f6f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saccharomyces_cerevisiae_SEM.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saccharomyces_cerevisiae_SEM.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"213\" style=\"background-color:#707070\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Candida_spores_and_pseudohyphae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Candida_spores_and_pseudohyphae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#af7a7a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Candida_albicans_PHIL_3192_lores.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Candida_albicans_PHIL_3192_lores.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#464430\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Candida_albicans.jpg\" target=\"_blank\"><img src=\"thumbnails/Candida_albicans.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#dbd2cf\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Ascomycota_Taphrinomycotina\"><label class=\"tree_label\" for=\"Ascomycota_Taphrinomycotina\"></label><div class=\"outer_tree_box\"><div id=\"ascomycota_taphrinomycotina\" class=\"tree_box\"><span><span>Taphrinomycotina</span><a href=\"https://en.wikipedia.org/wiki/Taphrinomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Taphrinomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Taphrinomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subdivision</span></span><p class=\"tag\">A disparate and basal group recognized following molecular (DNA) analyses. It includes hyphal fungi, fission yeasts , and the mammalian lung parasite Pneumocystis.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_schizosaccharomycetes\" class=\"tree_box\"><span><span>Schizosaccharomycetes</span><a href=\"https://en.wikipedia.org/wiki/Schizosaccharomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Schizosaccharomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Schizosaccharomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Yeasts that reproduce by fission rather than budding</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Fission_yeast.jpg\" target=\"_blank\"><img src=\"thumbnails/Fission_yeast.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"325\" height=\"260\" style=\"background-color:#797979\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_taphrinomycetes\" class=\"tree_box\"><span><span>Taphrinomycetes</span><a href=\"https://en.wikipedia.org/wiki/Taphrinomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Taphrinomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Taphrinomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(witches broom)</span><p class=\"tag\">Dimorphic plant parasites that induce a number of galls. They have both a yeast state and a filamentous (hyphal) state in infected plants. They characteristically infect leaves, catkins, and branches, not roots. Taphrinomycetes form asci but no ascomata.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Protomyces_macrosporus_on_Aegopodium_podagraria_lower_surface.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Protomyces_macrosporus_on_Aegopodium_podagraria_lower_surface.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"259\" style=\"background-color:#889a71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oak_leaf_blister.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Oak_leaf_blister.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#5e655e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Taphrina_betulina_123463459.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Taphrina_betulina_123463459.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#9e9c95\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_neolectomycetes\" class=\"tree_box\"><span><span>Neolectomycetes</span><a href=\"https://en.wikipedia.org/wiki/Neolectomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Neolectomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Neolectomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(Irregular Earth Tongue, Egg-yellow Earth Tongue)</span><p class=\"tag\">Form ascomata which specifically grow out of root tips.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Neolecta_irregularis_76559.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Neolecta_irregularis_76559.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#5a4f15\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2009-08-01_Neolecta_vitellina_23804.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2009-08-01_Neolecta_vitellina_23804.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#353525\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"ascomycota_pneumocystidomycetes\" class=\"tree_box\"><span><span>Pneumocystidomycetes</span><a href=\"https://en.wikipedia.org/wiki/Pneumocystidomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pneumocystidomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pneumocystidomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Encompasses one genus of yeasts. One species causes Pneumocystis pneumonia in humans by developing cysts on the lung tissue.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pneumocystis_carinii_01.jpg\" target=\"_blank\"><img src=\"thumbnails/Pneumocystis_carinii_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"1795\" height=\"1200\" style=\"background-color:#90b25c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pneumocystisjiroveci.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pneumocystisjiroveci.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#a1b39e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pneumocystis.jpg\" target=\"_blank\"><img src=\"thumbnails/Pneumocystis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"364\" style=\"background-color:#97c7e3\"></a></div></div></div></li></ul></li></ul></li></ul>")
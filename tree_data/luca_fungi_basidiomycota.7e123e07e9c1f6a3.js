@@ -0,0 +1 @@
+TreeData.register("luca_fungi_basidiomycota",[{"name":"Agaricomycotina","parent":"Basidiomycota","rank":"Subdivision","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Contains jelly fungi, yeasts, and mushrooms.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c7/Amanita_caesarea_%2816489941652%29.jpg/330px-Amanita_caesarea_%2816489941652%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f3/Geastrum_saccatum_28733618.jpg/250px-Geastrum_saccatum_28733618.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Clathrus_archeri_45492229.jpg/250px-Clathrus_archeri_45492229.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cd/Trametes_versicolor_93075730.jpg/250px-Trametes_versicolor_93075730.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/39/Tremella_fuciformis_74925764.jpg/330px-Tremella_fuciformis_74925764.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Calocera_viscosa_%2828519507173%29.jpg/250px-Calocera_viscosa_%2828519507173%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b6/Coprinellus_disseminatus.Fairy_Bonnets._%288725479830%29.jpg/330px-Coprinellus_disseminatus.Fairy_Bonnets._%288725479830%29.jpg"]},{"name":"Tremellomycetes","parent":"Agaricomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Includes basidiomycete yeasts, conspicuous jelly fungi, dimorphic taxa, and species that form complex fruiting bodies. Some are human and animal pathogens.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Sirobasidium_magnum_225759797.jpg/250px-Sirobasidium_magnum_225759797.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c9/Tremella_fuciformis_54604208.jpg/250px-Tremella_fuciformis_54604208.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Golden_ear_bacteria_%282%29.jpg/250px-Golden_ear_bacteria_%282%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/Tremella_mycophaga_Martin_344001_2013-05-08.jpg/330px-Tremella_mycophaga_Martin_344001_2013-05-08.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2b/Phaeotremella_foliacea_%28Pers.%29_Wedin%2C_J.C._Zamora_%26_Millanes_885447.jpg/330px-Phaeotremella_foliacea_%28Pers.%29_Wedin%2C_J.C._Zamora_%26_Millanes_885447.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0b/2008-02-29_Tremella_encephala_Stereum_sanguinolentum.jpg/330px-2008-02-29_Tremella_encephala_Stereum_sanguinolentum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Tremella_aurantia_Stereum_hirsutum_4342408020_bdbeb3eaa8_o.jpg/330px-Tremella_aurantia_Stereum_hirsutum_4342408020_bdbeb3eaa8_o.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Cryptococcus_neoformans_using_a_light_India_ink_staining_preparation_PHIL_3771_lores.jpg/330px-Cryptococcus_neoformans_using_a_light_India_ink_staining_preparation_PHIL_3771_lores.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Tremella_polyporina_Reid_311599_2012-09-13.jpg/330px-Tremella_polyporina_Reid_311599_2012-09-13.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Trichosporon_asahii_Gram_Stain.jpg/330px-Trichosporon_asahii_Gram_Stain.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Zyzygomyces_physciacearum_59616219.jpg/330px-Zyzygomyces_physciacearum_59616219.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/41/Syzygospora_mycetophila_2388957.jpg/330px-Syzygospora_mycetophila_2388957.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7d/Phaffia_rhodozyma_on_PDA_plate_02.jpg/250px-Phaffia_rhodozyma_on_PDA_plate_02.jpg"]},{"name":"Agaricomycetes","parent":"Agaricomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Includes all the agarics (gilled mushrooms), bracket fungi, clavarioid fungi, corticioid fungi, and gasteroid fungi.","imgs":[]},{"name":"Cantharellales","parent":"Agaricomycetes","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":["chanterelles","black chanterelles","winter chanterelles"],"tag":"Includes the chanterelles, some of the tooth fungi, clavarioid fungi, and corticioid fungi. Some are plant pathogens or symbiotic. Sporocarps (fruit bodies) have false gills.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9a/Chanterelle_Cantharellus_cibarius.jpg/330px-Chanterelle_Cantharellus_cibarius.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8e/Cantharellus_formosus_174975_Belfair.jpg/330px-Cantharellus_formosus_174975_Belfair.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/2007-07-14_Cantharellus_cibarius_Detail.jpg/330px-2007-07-14_Cantharellus_cibarius_Detail.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Trumpets_on_the_forest_floor.jpg/330px-Trumpets_on_the_forest_floor.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Craterellus_tubaeformis_LC0374.jpg/250px-Craterellus_tubaeformis_LC0374.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Ceratobasidium_cornigerum_%2802%29.jpg/330px-Ceratobasidium_cornigerum_%2802%29.jpg","https://upload.wikimedia.org/wikipedia/commons/0/09/Clavulina_cristata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Hydnum_repandum_semmelstoppelpilz.jpg/330px-Hydnum_repandum_semmelstoppelpilz.jpg","https://upload.wikimedia.org/wikipedia/commons/6/62/Hedgehog_fungi.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c7/Tulasnella.violea.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/95/Lejkowiec_d%C4%99ty_%28Craterellus_cornucopioides%29.jpg/330px-Lejkowiec_d%C4%99ty_%28Craterellus_cornucopioides%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/Krause_Kraterelle%2C_Pseudocraterellus_undulatus.jpg/330px-Krause_Kraterelle%2C_Pseudocraterellus_undulatus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8b/2012-04-28_Botryobasidium_subcoronatum_%28H%C3%B6hn._%26_Litsch.%29_Donk_215384.jpg/330px-2012-04-28_Botryobasidium_subcoronatum_%28H%C3%B6hn._%26_Litsch.%29_Donk_215384.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6c/Aphelaria_82539.jpg/330px-Aphelaria_82539.jpg","https://upload.wikimedia.org/wikipedia/commons/f/f8/Botryobasidium.vagum.-.lindsey.jpg"]},{"name":"Sebacinales","parent":"Agaricomycetes","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Taxa have a widespread distribution and are mostly terrestrial, many forming mycorrhizas with a wide variety of plants, including orchids.","imgs":["https://upload.wikimedia.org/wikipedia/commons/c/c0/Sebacina_concrescens_16775.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/Sebacina_sparassoidea_56969.jpg/330px-Sebacina_sparassoidea_56969.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/15/Craterocolla_cerasi_139582.jpg/250px-Craterocolla_cerasi_139582.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/37/Tremellodendron_pallidum_54765.jpg/330px-Tremellodendron_pallidum_54765.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/Serendipita_herbamans.tif/lossy-page1-189px-Serendipita_herbamans.tif.jpg"]},{"name":"Auriculariales","parent":"Agaricomycetes","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"The majority of species produce gelatinous basidiocarps (fruit bodies) on dead wood. In some these are conspicuous and may be ear-shaped, button-shaped, lobed, bracket-like, or effused. Some species produce dry, leathery, or web-like fruit bodies resembling those of the corticioid fungi.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Hirneola_auricula-judae_%28xndr%29.jpg/330px-Hirneola_auricula-judae_%28xndr%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/09/2012-01-30_Exidia_nucleata_%28Schweinitz%29_Burt_197669.jpg/250px-2012-01-30_Exidia_nucleata_%28Schweinitz%29_Burt_197669.jpg","https://upload.wikimedia.org/wikipedia/commons/1/10/Star_jelly_-_lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/03/Tremellochaete_novozealandica.jpg/330px-Tremellochaete_novozealandica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Elmerina_holophaea.jpg/330px-Elmerina_holophaea.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/2013-05-04_Eichleriella_deglubens_%28Berk._%26_Broome%29_D.A._Reid_342451.jpg/330px-2013-05-04_Eichleriella_deglubens_%28Berk._%26_Broome%29_D.A._Reid_342451.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Exidiopsis_effusa_a1_%285%29.JPG/330px-Exidiopsis_effusa_a1_%285%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d6/Exidia_glandulosa_74739.jpg/330px-Exidia_glandulosa_74739.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Suur_tardpoorik1.jpg/330px-Suur_tardpoorik1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Amphistereum_schrenkii.jpg/330px-Amphistereum_schrenkii.jpg"]},{"name":"Phallomycetidae","parent":"Agaricomycetes","rank":"Subclass","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"","imgs":[]},{"name":"Geastrales","parent":"Phallomycetidae","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":["earthstars","shotgun fungus"],"tag":"Found under trees, mainly conifers. Spherical or egg-shaped fruiting bodies, some become star-shaped after splitting open to release spores.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/fb/Geastrum_triplex.jpg/330px-Geastrum_triplex.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/Geastrum_saccatum.jpg/330px-Geastrum_saccatum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Myriostoma_coliforme.jpg/330px-Myriostoma_coliforme.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Myriostoma_coliforme_%28Dicks.%29_Corda_605138.jpg/330px-Myriostoma_coliforme_%28Dicks.%29_Corda_605138.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Myriostoma_coliforme_111029435.jpg/250px-Myriostoma_coliforme_111029435.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/Schenella_pityophila_53720.jpg/330px-Schenella_pityophila_53720.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4b/Sphaerobolus.jpg/330px-Sphaerobolus.jpg"]},{"name":"Hysterangiales","parent":"Phallomycetidae","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":["club-shaped stinkhorns"],"tag":"Most are saprotrophic. Resembles puffballs when small, becoming pear-shaped and finally globose when mature. Fruiting body may be pink to vibrant lilac in colour. Mature internal tissue characterized by fetid odour.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Gallacea_scleroderma_002.jpg/330px-Gallacea_scleroderma_002.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Hysterangium_stoloniferum_Rissige_Schwanztr%C3%BCffel.jpg/330px-Hysterangium_stoloniferum_Rissige_Schwanztr%C3%BCffel.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a8/Phallogaster_saccatus_190326.jpg/330px-Phallogaster_saccatus_190326.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/74/Protubera_sabulonensis_73327.jpg/330px-Protubera_sabulonensis_73327.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/77/Trappea_99522.jpg/330px-Trappea_99522.jpg"]},{"name":"Gomphales","parent":"Phallomycetidae","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Most are mycorrhizal, some are saprotrophic. Includes some club-shaped and coral-shaped fungi. Spores may be olive-shaped, usually rough.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/1372215000_NF7651BeenakiadacostaelowerLyrebirdWalk5-07WM.jpg/330px-1372215000_NF7651BeenakiadacostaelowerLyrebirdWalk5-07WM.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/Clavariadelphus-pistillaris.jpg/250px-Clavariadelphus-pistillaris.jpg","https://upload.wikimedia.org/wikipedia/commons/d/d5/Clavariadelphus_truncatus_69586.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cc/Hydnocristella_himantia_52517515.jpg/330px-Hydnocristella_himantia_52517515.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/59/Lentaria_micheneri_349076.jpg/330px-Lentaria_micheneri_349076.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/91/Austrogautieria_sp.jpg/330px-Austrogautieria_sp.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Gautieria_morchelliformis_74809.jpg/250px-Gautieria_morchelliformis_74809.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f2/Gloeocantharellus_purpurascens_245812.jpg/330px-Gloeocantharellus_purpurascens_245812.jpg","https://upload.wikimedia.org/wikipedia/commons/2/20/Gomphus_clavatus_best.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a8/Phaeoclavulina_cyanocephala_206537348_%28cropped%29.jpg/330px-Phaeoclavulina_cyanocephala_206537348_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2d/Ramaria_lorithamnus_-_Bola_Creek.jpg/250px-Ramaria_lorithamnus_-_Bola_Creek.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ea/Gomphus_floccosus_6051.JPG/250px-Gomphus_floccosus_6051.JPG"]},{"name":"Phallales","parent":"Phallomycetidae","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":["stinkhorns"],"tag":"Stinkhorns and related species. Most start as a truffle-like fungus, or 'egg', but some burst open into a fruiting body that is either club shaped or elaborately shaped, coated in a stinky slime that attracts insects, especially flies, to spread their spores.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/Phallus_impudicus7_Stinkhorn.jpg/250px-Phallus_impudicus7_Stinkhorn.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/Stinkhorn_mushroom_mount_cameroon_national_park.jpg/330px-Stinkhorn_mushroom_mount_cameroon_national_park.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f5/Bridal_Veil_Stinkhorn_%28Phallus_indusiatus%29.jpg/250px-Bridal_Veil_Stinkhorn_%28Phallus_indusiatus%29.jpg","https://upload.wikimedia.org/wikipedia/commons/5/53/Hexenei.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fd/Stinkhorn_Springbrook.jpg/330px-Stinkhorn_Springbrook.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7d/Clathrus_columnatus_two.jpeg/330px-Clathrus_columnatus_two.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/Laternea_pusilla_68902.jpg/330px-Laternea_pusilla_68902.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Lysurus_mokusin_apex.jpg/330px-Lysurus_mokusin_apex.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/Phallus_impudicus_Stinkmorchel.jpg/250px-Phallus_impudicus_Stinkmorchel.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Gastrosporium_simplex_364536.jpg/330px-Gastrosporium_simplex_364536.jpg","https://upload.wikimedia.org/wikipedia/commons/9/96/Claustula_fischeri.jpg"]},{"name":"Hydnodontaceae","parent":"Agaricomycetes","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"They often form crust-like structures on decaying wood or soil.","imgs":["https://upload.wikimedia.org/wikipedia/commons/6/6a/Trechispora.mollusca.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/3/30/Basidiomata_of_Trechisporales_%2810.3897-mycokeys.48.31956%29_Figure_1f.png","https://upload.wikimedia.org/wikipedia/commons/thumb/2/28/Trechispora_stevensonii_54363254.jpg/330px-Trechispora_stevensonii_54363254.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Subulicystidium_longisporum_210912.jpg/330px-Subulicystidium_longisporum_210912.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0a/Sistotremastrum_niveocremeum_191634.jpg/330px-Sistotremastrum_niveocremeum_191634.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Hydnodon_thelephorus_545249.jpg/250px-Hydnodon_thelephorus_545249.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Brevicellicium_olivascens_a1_%283%29.jpg/330px-Brevicellicium_olivascens_a1_%283%29.jpg"]},{"name":"Hymenochaetales","parent":"Agaricomycetes","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Mostly corticioid fungi and poroid fungi, but also including several clavarioid fungi and agarics.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/Asterodon_ferruginosus.jpg/330px-Asterodon_ferruginosus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/91/Coltricia_perennis_a1_%281%29.JPG/330px-Coltricia_perennis_a1_%281%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e8/2014-11-02_Hymenochaete_iodina_%28Mont.%29_Pat_489348.jpg/250px-2014-11-02_Hymenochaete_iodina_%28Mont.%29_Pat_489348.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6e/Fomes_fomentarius_sasata.JPG/330px-Fomes_fomentarius_sasata.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e9/T%C3%A4pptaelik_2.jpg/330px-T%C3%A4pptaelik_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4a/Fulvifomes_everhartii_%28Ellis_%26._Gall.%29_Murrill_414536.jpg/250px-Fulvifomes_everhartii_%28Ellis_%26._Gall.%29_Murrill_414536.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6a/Fuscoporia_ferruginosa_1_132465_cropped.jpg/250px-Fuscoporia_ferruginosa_1_132465_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Hydnochaete_olivacea.jpg/330px-Hydnochaete_olivacea.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6a/Hymenochaete_rubiginosa_81208.jpg/330px-Hymenochaete_rubiginosa_81208.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/71/Inonotus_rheades_%2814950933886%29.jpg/330px-Inonotus_rheades_%2814950933886%29.jpg","https://upload.wikimedia.org/wikipedia/commons/6/6b/Inonotus_tamaricis_01.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/79/Onnia_tomentosa_72124.jpg/330px-Onnia_tomentosa_72124.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Polystictus_cinnabarinus_1904.jpg/250px-Polystictus_cinnabarinus_1904.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c1/Alloclavaria_purpurea_78452.jpg/330px-Alloclavaria_purpurea_78452.jpg","https://upload.wikimedia.org/wikipedia/commons/c/cc/Cantharellopsis_prescotii_%28Weinm.%29_Kuyper_3461425368.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/62/Contumyces_rosellus_222.jpg/330px-Contumyces_rosellus_222.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/28/Cotylidia_aurantiaca_13979.jpg/330px-Cotylidia_aurantiaca_13979.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d0/Loreleia_postii_68641.jpg/330px-Loreleia_postii_68641.jpg","https://upload.wikimedia.org/wikipedia/commons/a/ae/Schizopora.paradoxa2.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/66/Basidioradulum_radula_206606.jpg/330px-Basidioradulum_radula_206606.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4b/Echinoporia_hydnophora.jpg/330px-Echinoporia_hydnophora.jpg","https://upload.wikimedia.org/wikipedia/commons/8/80/Basidiomata_of_Trechisporales_%2810.3897-mycokeys.48.31956%29_Figure_1c.png"]},{"name":"Thelephorales","parent":"Agaricomycetes","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":["leathery earthfans","tooth fungi","bleeding tooth fungi"],"tag":"Includes corticioid and hydnoid fungi, together with a few polypores and clavarioid species. Most are ectomycorrhizal.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/ff/Scharfer_Korkstacheling_Hydnellum_peckii_jung.jpg/330px-Scharfer_Korkstacheling_Hydnellum_peckii_jung.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/47/Hydnellum_ferrugineum_Glieres.jpg/330px-Hydnellum_ferrugineum_Glieres.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ac/Hydnellum_peckii2.jpg/330px-Hydnellum_peckii2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Hydnellum_suaveolens_51703.jpg/330px-Hydnellum_suaveolens_51703.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/98/Hydnellum_compactum_01.JPG/330px-Hydnellum_compactum_01.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6a/Hydnellum_auratile_34144.jpg/330px-Hydnellum_auratile_34144.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/Sarcodon_fuscoindicus-_the_Violet_Hedgehog_-_Flickr_-_Dick_Culbert.jpg/330px-Sarcodon_fuscoindicus-_the_Violet_Hedgehog_-_Flickr_-_Dick_Culbert.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1b/Hydnellum_regium_267536.jpg/330px-Hydnellum_regium_267536.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Phellodon_niger_496570.jpg/330px-Phellodon_niger_496570.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/71/Phellodon_tomentosus_%287%29.JPG/330px-Phellodon_tomentosus_%287%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/Sarcodon_imbricatus0.jpg/330px-Sarcodon_imbricatus0.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0f/Sarcodon_calvatus_-_Flickr_-_Dick_Culbert.jpg/330px-Sarcodon_calvatus_-_Flickr_-_Dick_Culbert.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Sarcodon_rimosus_400861.jpg/330px-Sarcodon_rimosus_400861.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/65/Amaurodon_viridis_202958.jpg/330px-Amaurodon_viridis_202958.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Polyozellus_multiplex_-Haida_Guaii.jpg/330px-Polyozellus_multiplex_-Haida_Guaii.jpg","https://upload.wikimedia.org/wikipedia/commons/6/60/Thelephora.terrestris4.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0f/Tomentella_radiosa_192432.jpg/330px-Tomentella_radiosa_192432.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Boletopsis_nothofagi_fruitbodies.jpg/330px-Boletopsis_nothofagi_fruitbodies.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b2/Boletopsis_grisea_171255.jpg/330px-Boletopsis_grisea_171255.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Bankera_violascens_%289737748490%29.jpg/330px-Bankera_violascens_%289737748490%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6c/2014-08-02_Hydnellum_aurantiacum_%28Batsch%29_P._Karst_441904.jpg/330px-2014-08-02_Hydnellum_aurantiacum_%28Batsch%29_P._Karst_441904.jpg"]},{"name":"Polyporales","parent":"Agaricomycetes","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Includes some polypores as well as many corticioid fungi and a few agarics. Many species within the order are saprotrophic, most of them wood-rotters. Some species that attack living tissues and then continue to degrade the wood of their dead hosts.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d2/Crustomyces_subabruptus_39745.jpg/330px-Crustomyces_subabruptus_39745.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e5/Fomitopsis_pinicola_1.JPG/330px-Fomitopsis_pinicola_1.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/23/Piptoporus_quercinus_I_Posazavi.jpg/330px-Piptoporus_quercinus_I_Posazavi.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Climacocystis_borealis_38653.jpg/330px-Climacocystis_borealis_38653.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8b/Laetiporus_sulphureus_JPG01.jpg/330px-Laetiporus_sulphureus_JPG01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/91/Fomitopsis_officinalis_483579.jpg/250px-Fomitopsis_officinalis_483579.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f2/Oligoporus_caesius_74766.jpg/330px-Oligoporus_caesius_74766.jpg","https://upload.wikimedia.org/wikipedia/commons/d/dc/Pycnoporellus_alboluteus_61386.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/16/Daedalea_quercina_beentree.jpg/330px-Daedalea_quercina_beentree.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Fungus-IMG_0656.JPG/330px-Fungus-IMG_0656.JPG","https://upload.wikimedia.org/wikipedia/commons/0/0c/Merulius_tremellosus_-_Lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Teranacaerulea.jpg/330px-Teranacaerulea.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/36/Polyporus_squamosus_Molter.jpg/330px-Polyporus_squamosus_Molter.jpg","https://upload.wikimedia.org/wikipedia/commons/f/f1/Cerioporus_mollis_%28Polyporaceae%29%2C_Zoelen%2C_the_Netherlands.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/71/Favolus_tenuiculus_-_Flickr_-_Dick_Culbert.jpg/330px-Favolus_tenuiculus_-_Flickr_-_Dick_Culbert.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/66/Hapalopilus_nidulans_G7_%284%29.JPG/330px-Hapalopilus_nidulans_G7_%284%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/3/37/2008-02-10_Polyporus_umbellatus_crop.jpg/330px-2008-02-10_Polyporus_umbellatus_crop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/72/Pycnoporus_cinnabarinus_%28Jacq.%29_P._Karst_153.jpg/330px-Pycnoporus_cinnabarinus_%28Jacq.%29_P._Karst_153.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b2/Fungus-IMG_3248.JPG/330px-Fungus-IMG_3248.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/41/2011-09-21_Frantisekia_mentschulensis_%28Pilat%29_Spirin_204803.jpg/330px-2011-09-21_Frantisekia_mentschulensis_%28Pilat%29_Spirin_204803.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/Nigroporus_vinosus_264439.jpg/330px-Nigroporus_vinosus_264439.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/15/Loweomyces_fractipes_241707.jpg/330px-Loweomyces_fractipes_241707.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Xenasma_pulverulentum_212363.jpg/330px-Xenasma_pulverulentum_212363.jpg"]},{"name":"Corticiales","parent":"Agaricomycetes","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Composed of corticioid fungi. Species within the order are generally saprotrophic, most of them wood-rotters, but several are parasitic on grasses or lichens.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Corticium_roseum_115846554.jpg/250px-Corticium_roseum_115846554.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/Laetisaria_fuciformis_258033360.jpg/250px-Laetisaria_fuciformis_258033360.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/37/Marchandiomyces_corallinus_Jymm.jpg/330px-Marchandiomyces_corallinus_Jymm.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Dendrocorticium_polygonioides_GBIF_observation_3441204021.jpg/330px-Dendrocorticium_polygonioides_GBIF_observation_3441204021.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Punctularia_strigoso-zonata_128943.jpg/330px-Punctularia_strigoso-zonata_128943.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/66/Australovuilleminia_coccinea.jpg/330px-Australovuilleminia_coccinea.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/99/Cytidia_salicina_214600.jpg/330px-Cytidia_salicina_214600.jpg"]},{"name":"Gloeophyllales","parent":"Agaricomycetes","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Wood-decay fungi that is characterized by the ability to produce a brown rot of wood.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Gloeophyllum_protractum_liekok%C3%A4%C3%A4p%C3%A4_tallstocksticka.jpg/330px-Gloeophyllum_protractum_liekok%C3%A4%C3%A4p%C3%A4_tallstocksticka.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/Gloeophyllum_sepiarium_qtl1.jpg/330px-Gloeophyllum_sepiarium_qtl1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/14/Heliocybe_sulcata_88711.jpg/330px-Heliocybe_sulcata_88711.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/61/NeoLentinus_lepideus.JPG/330px-NeoLentinus_lepideus.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/Neolentinus_ponderosus_232623.jpg/330px-Neolentinus_ponderosus_232623.jpg","https://upload.wikimedia.org/wikipedia/commons/3/34/Neolentinus_ponderosus_147223.jpg"]},{"name":"Russulales","parent":"Agaricomycetes","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":["brittlegills","milk-caps"],"tag":"Includes polypores, some tooth fungi and club fungi. Basidiospores in this group are typically ornamented with amyloid warts or reticulation.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/bd/Albatrellus-ovinus.jpg/330px-Albatrellus-ovinus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9d/2012-05-09_Leucophleps_spinospora_217703.jpg/330px-2012-05-09_Leucophleps_spinospora_217703.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/2012-07-12_Polyporoletus_sublividus_Snell_236757.jpg/330px-2012-07-12_Polyporoletus_sublividus_Snell_236757.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/57/Artomyces_pyxidatus_50687.jpg/330px-Artomyces_pyxidatus_50687.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7e/Auriscalpium_vulgare_060924.jpg/330px-Auriscalpium_vulgare_060924.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/Clavicorona_taxophila_107049507.jpg/330px-Clavicorona_taxophila_107049507.jpg","https://upload.wikimedia.org/wikipedia/commons/e/ec/Post-1-1127312702.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Bondarzewia_berkeleyi.jpg/330px-Bondarzewia_berkeleyi.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/2016-02-21_Gloiodon_strigosus_%28Sw.%29_P._Karst_600817.jpg/330px-2016-02-21_Gloiodon_strigosus_%28Sw.%29_P._Karst_600817.jpg","https://upload.wikimedia.org/wikipedia/commons/6/6f/Heterobasidion_annosum_2_-_Lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/00/Igelstachelbart_Nov_06.jpg/330px-Igelstachelbart_Nov_06.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e8/2012-03-15_Dentipellis_fragilis_%28Pers.%29_Donk_204703.jpg/330px-2012-03-15_Dentipellis_fragilis_%28Pers.%29_Donk_204703.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/Hericium_coralloides_-_Male_Karpaty_I.jpg/330px-Hericium_coralloides_-_Male_Karpaty_I.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/2011-04-25_Laxitextum_bicolor_%28Pers.%29_Lentz_142910.jpg/330px-2011-04-25_Laxitextum_bicolor_%28Pers.%29_Lentz_142910.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/54/2014-08-16_Lachnocladium_schweinfurthianum_P._Henn_445707.jpg/250px-2014-08-16_Lachnocladium_schweinfurthianum_P._Henn_445707.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0f/Peniophora_incarnata_%2836443147085%29.jpg/330px-Peniophora_incarnata_%2836443147085%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Russula_brevipes.JPG/330px-Russula_brevipes.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/Russulamexicana.jpg/330px-Russulamexicana.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Russula_flavida_Veracruz.jpg/330px-Russula_flavida_Veracruz.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/13/2007-07-09_Lactarius_quietus_2.jpg/250px-2007-07-09_Lactarius_quietus_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Lactifluus_sp_G3264_pleurotoid_French_Guiana_cropped.png/330px-Lactifluus_sp_G3264_pleurotoid_French_Guiana_cropped.png","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7e/Lactarius_volemus_90024_cropped.jpg/330px-Lactarius_volemus_90024_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/27/Lactarius_piperatus_BS11.jpg/330px-Lactarius_piperatus_BS11.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/71/Multifurca_sp_85586.jpg/330px-Multifurca_sp_85586.jpg","https://upload.wikimedia.org/wikipedia/commons/8/89/Lactarius_deliciosus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/88/2013-08-06_Lactarius_indigo_%28Schwein.%29_Fr_359776.jpg/330px-2013-08-06_Lactarius_indigo_%28Schwein.%29_Fr_359776.jpg","https://upload.wikimedia.org/wikipedia/commons/8/82/Lactarius_pyrogallus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Stereum_Hirsutum01.jpg/330px-Stereum_Hirsutum01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/86/2012-01-03_Pseudoxenasma_verrucisporum_Larsson_%26_Hjortstam_192883.jpg/330px-2012-01-03_Pseudoxenasma_verrucisporum_Larsson_%26_Hjortstam_192883.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ae/Scytinostromella_heterogenea_189515.jpg/330px-Scytinostromella_heterogenea_189515.jpg"]},{"name":"Agaricomycetidae","parent":"Agaricomycetes","rank":"Subclass","ipa":"","ipa_alt":[""],"etymology":"","common":["false chanterelles"],"tag":"","imgs":[]},{"name":"Agaricales","parent":"Agaricomycetidae","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":["field mushrooms","dung bird's nest","destroying angels","violet coral mushrooms","beefsteak fungi"],"tag":"The majority are terrestrial. Species are saprotrophic or ectomycorrhizal, occasionally parasitic on plants or other fungi, and sometimes lichenized. A handful form mutualistic symbioses with ants and termites, and a few are important plant pathogens.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/3a/Agaricus_campestris.jpg/330px-Agaricus_campestris.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Cyathus_stercoreus_Fruchtk%C3%B6rper.JPG/330px-Cyathus_stercoreus_Fruchtk%C3%B6rper.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/29/Amanita_muscaria_Marriott_Falls_1.jpg/330px-Amanita_muscaria_Marriott_Falls_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/Stereopsis_humphreyi_56449.jpg/330px-Stereopsis_humphreyi_56449.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Goldmistpilze2.jpg/330px-Goldmistpilze2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e6/Clavaria_zollingeri_90973.jpg/330px-Clavaria_zollingeri_90973.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5d/Cortinarius_violaceus_02.jpg/250px-Cortinarius_violaceus_02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Crassisporium_funariophilum_39856110.jpg/330px-Crassisporium_funariophilum_39856110.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Crepidotus_cinnabarinus_54962444.jpg/330px-Crepidotus_cinnabarinus_54962444.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ef/Cystostereum_murrayi_k%C3%A4ns%C3%A4orvakka_doftskinn.jpg/330px-Cystostereum_murrayi_k%C3%A4ns%C3%A4orvakka_doftskinn.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3a/Fistulina_hepatica.jpg/330px-Fistulina_hepatica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/Hygrophorus_eburneus-pastorino.JPG/330px-Hygrophorus_eburneus-pastorino.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/75/Inocybe_obscura_20061015w.jpg/330px-Inocybe_obscura_20061015w.jpg","https://upload.wikimedia.org/wikipedia/commons/3/32/Lyophyllum_decastes.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c9/Mythicomyces_corneipes_270323.jpg/330px-Mythicomyces_corneipes_270323.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/Merismodes_fasciculata_82199.jpg/330px-Merismodes_fasciculata_82199.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Cyathus_striatus_154206673.jpg/330px-Cyathus_striatus_154206673.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Omphalotus_olearius_Mallorca.jpg/330px-Omphalotus_olearius_Mallorca.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/41/Phellorinia_herculeana1.jpg/250px-Phellorinia_herculeana1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/Phyllotopsis_nidulans_99741687.jpg/330px-Phyllotopsis_nidulans_99741687.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c1/Rhodotus_palmatus2.jpg/330px-Rhodotus_palmatus2.jpg","https://upload.wikimedia.org/wikipedia/commons/9/94/Oyster_mushoom_fells.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/Pluteus_cervinus_20080420wa.jpg/330px-Pluteus_cervinus_20080420wa.jpg","https://upload.wikimedia.org/wikipedia/commons/6/6a/Psathyrella_spec._-_Lindsey_1a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/39/Pseudoclitocybe_cyathiformis_180105w.JPG/330px-Pseudoclitocybe_cyathiformis_180105w.JPG","https://upload.wikimedia.org/wikipedia/commons/4/48/Pterula.subulata.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/82/Radulomyces_copelandii_56998817.jpg/330px-Radulomyces_copelandii_56998817.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Spaltbl%C3%A4ttlinge.jpg/330px-Spaltbl%C3%A4ttlinge.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fd/2012-10-14_Cystoderma_carcharias_1.jpg/330px-2012-10-14_Cystoderma_carcharias_1.jpg","https://upload.wikimedia.org/wikipedia/commons/7/7b/2013-04-23_Lindtneria_trachyspora_%28Bourdot_%26_Galzin%29_Pil%C3%A1t_722659.jpg","https://upload.wikimedia.org/wikipedia/commons/7/7b/Stropharia.aeruginosa.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/G%C4%85ska_zielonka_4163586757.jpg/330px-G%C4%85ska_zielonka_4163586757.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/ff/Tubaria_furfuracea_61894862.jpg/330px-Tubaria_furfuracea_61894862.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/86/2013-11-11_Typhula_sclerotioides_%28Pers.%29_Fr_384017.jpg/250px-2013-11-11_Typhula_sclerotioides_%28Pers.%29_Fr_384017.jpg"]},{"name":"Boletales","parent":"Agaricomycetidae","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":["boletes","prettymouths","earthballs"],"tag":"Includes some boletes, earthballs, puffballs, and false truffles. Most members are saprobic, primarily found on the wood of fallen trees or in the soil at the base of trees.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/11/Weilangta_Phylloporus_sp.jpg/330px-Weilangta_Phylloporus_sp.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Boletus_satanas.JPG/250px-Boletus_satanas.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/98/Boletinellus_merulioides_95348.jpg/330px-Boletinellus_merulioides_95348.jpg","https://upload.wikimedia.org/wikipedia/commons/e/e9/Coniophora_puteana_2_-_Lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Astraeus_hygrometricus.jpg/330px-Astraeus_hygrometricus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Diplocystis_wrightii2.jpg/250px-Diplocystis_wrightii2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Gastrosporium_simplex_364536.jpg/330px-Gastrosporium_simplex_364536.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/56/Gomphidius_glutinosus_131007.jpg/250px-Gomphidius_glutinosus_131007.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/2012-08-08_Gyroporus_purpurinus_246803.jpg/330px-2012-08-08_Gyroporus_purpurinus_246803.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/2020-08-21_Gyroporus_phaeocyanescens_Singer_%26_M.H._Ivory_1227490.jpg/330px-2020-08-21_Gyroporus_phaeocyanescens_Singer_%26_M.H._Ivory_1227490.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Gyroporus_subalbellus_427925.jpg/250px-Gyroporus_subalbellus_427925.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/False_Chanterelle_Hygrophoropsis_aurantiaca.jpg/330px-False_Chanterelle_Hygrophoropsis_aurantiaca.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/36/Leucogyrophana_mollusca_325823.jpg/330px-Leucogyrophana_mollusca_325823.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/Rhopalogaster_transversarium_81638.jpg/250px-Rhopalogaster_transversarium_81638.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Scleroderma_citrina_051106low.jpg/330px-Scleroderma_citrina_051106low.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Calostoma_cinnabarina.jpg/330px-Calostoma_cinnabarina.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Calostoma_fuscum.jpg/250px-Calostoma_fuscum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/69/Pisolithus_arrhizus_98622.jpg/250px-Pisolithus_arrhizus_98622.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/84/Scleroderma_texense_Veracruz.jpg/330px-Scleroderma_texense_Veracruz.jpg","https://upload.wikimedia.org/wikipedia/commons/7/71/Hausschwamm.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Truncocolumella_citrina_397223.jpg/330px-Truncocolumella_citrina_397223.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/89/Pseudomerulius_aureus.jpg/330px-Pseudomerulius_aureus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4c/Samtfu%C3%9F-Holzkrempling_Tapinella_atrotomentosa.jpg/330px-Samtfu%C3%9F-Holzkrempling_Tapinella_atrotomentosa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Oyster_Rollrim_imported_from_iNaturalist_photo_34421800_on_25_February_2024.jpg/330px-Oyster_Rollrim_imported_from_iNaturalist_photo_34421800_on_25_February_2024.jpg"]},{"name":"Amylocorticiales","parent":"Agaricomycetidae","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Form fruit bodies that are effused (stretched out flat like a film-like growth), effused-reflexed (stretched out but with edges curled up) to almost pileate (with a cap), or stipitate (with a stipe). They have smooth hymenophores that can be either merulioid (wrinkled with low, uneven ridges), irpicoid (with 'teeth') or poroid (with pores).","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/3e/Podoserpula_pusio.jpg/250px-Podoserpula_pusio.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b8/Plicaturopsis.crispa.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7a/Leptosporomyces_roseus_2024.jpg/330px-Leptosporomyces_roseus_2024.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Ceraceomyces_sublaevis_38439.jpg/330px-Ceraceomyces_sublaevis_38439.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/06/Anomoloma_myceliosum_150634.jpg/330px-Anomoloma_myceliosum_150634.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e7/Amylocorticium_subincarnatum_203078.jpg/330px-Amylocorticium_subincarnatum_203078.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Anomoporia_kamtschatica_harsuk%C3%A4%C3%A4p%C3%A4_vaddporing.jpg/330px-Anomoporia_kamtschatica_harsuk%C3%A4%C3%A4p%C3%A4_vaddporing.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e8/Anomoporia_bombycina.jpg/330px-Anomoporia_bombycina.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Athelia_rolfsii.jpg/330px-Athelia_rolfsii.jpg"]},{"name":"Lepidostromatales","parent":"Agaricomycetidae","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Lichenized fungi with fruiting bodies that are clavarioid.","imgs":["https://upload.wikimedia.org/wikipedia/commons/1/1d/Lepidostroma_vilgalysii%2C_type_collection%2C_in_the_field%2C_2007.jpg"]},{"name":"Atheliales","parent":"Agaricomycetidae","rank":"Order","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Mostly corticioid fungi with varied ecological diversity. Most species have relatively simple gross morphology and produce crust-like fruiting bodies attached loosely to their substrate.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Amphinema_byssoides_202959.jpg/330px-Amphinema_byssoides_202959.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a6/Athelia_neuhoffii_-_Lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Byssocorticium_atrovirens_202452.jpg/330px-Byssocorticium_atrovirens_202452.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/15/Byssoporia_terrestre_196354.jpg/330px-Byssoporia_terrestre_196354.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7a/Leptosporomyces_roseus_2024.jpg/330px-Leptosporomyces_roseus_2024.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/Piloderma_fallax_132197.jpg/330px-Piloderma_fallax_132197.jpg"]},{"name":"Dacrymycetes","parent":"Agaricomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"All are wood-rotting saprotrophs. Basidiocarps (fruit bodies) are ceraceous to gelatinous and typically yellow to orange.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/2019-06-07_Dacrymyces_tortus_1042878.jpg/330px-2019-06-07_Dacrymyces_tortus_1042878.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1a/Geel_hoorntje.jpg/330px-Geel_hoorntje.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/13/Guepiniopsis_buccina_%28Pers.%29_L.L._Kenn_453388.jpg/330px-Guepiniopsis_buccina_%28Pers.%29_L.L._Kenn_453388.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dd/Calocera_viscosa_RF.jpg/330px-Calocera_viscosa_RF.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ae/Dacryopinax_spathularia_29235034.jpg/330px-Dacryopinax_spathularia_29235034.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/33/Heterotextus_miltinus_40693891.jpg/330px-Heterotextus_miltinus_40693891.jpg","https://upload.wikimedia.org/wikipedia/commons/6/6f/Calocera_viscosa_NV.jpg"]},{"name":"Ustilaginomycotina","parent":"Basidiomycota","rank":"Subdivision","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Includes the true smut fungi. They are mostly plant parasites on vascular plants. They consist of two states: anamorphic yeast state and teleomorphic filamentous smut state.","imgs":[]},{"name":"Malasseziomycetes","parent":"Ustilaginomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"A yeast found on the skin of animals, including humans that requires fat to grow.","imgs":["https://upload.wikimedia.org/wikipedia/commons/e/e0/Malassezia_furfur_in_skin_scale_from_a_patient_with_tinea_versicolor_PHIL_3938_lores.jpg"]},{"name":"Ustilaginomycetes","parent":"Ustilaginomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"The true smut fungi are plant parasites. They have a simple septum with a septal pore cap.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Urocystis_colchici_var._cepulae_on_an_onion_seedling.jpg/250px-Urocystis_colchici_var._cepulae_on_an_onion_seedling.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3a/Huitlacoche.jpg/250px-Huitlacoche.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d0/Anthracoidea_paniceae_on_Carex_panicea_2.jpg/250px-Anthracoidea_paniceae_on_Carex_panicea_2.jpg"]},{"name":"Exobasidiomycetes","parent":"Ustilaginomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Includes fungi associated with galls on plants and smut fungi.","imgs":["https://upload.wikimedia.org/wikipedia/commons/2/26/Exobasidium.vaccinii.-.lindsey.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c5/Microstroma_album_264712080.jpg/250px-Microstroma_album_264712080.jpg","https://upload.wikimedia.org/wikipedia/commons/5/54/Entyloma_oryzae_on_Oryza_sativa_%2805%29.jpg","https://upload.wikimedia.org/wikipedia/commons/2/2d/Exobasidium_rhododendri_54465.jpg","https://upload.wikimedia.org/wikipedia/commons/9/93/Entyloma_achilleae_-_Lindsey.jpg"]},{"name":"Monilielliomycetes","parent":"Ustilaginomycotina","rank":"Class","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"Includes some black, yeast-like fungi. Some species can cause disease in humans and cats.","imgs":[]},{"name":"Pucciniomycotina","parent":"Basidiomycota","rank":"Subdivision","ipa":"","ipa_alt":[""],"etymology":"","common":[],"tag":"A diverse group of fungi, including rusts, insect parasitic/symbiotic fungi, yeasts, smut-like, jelly-like fungi and a mixture of odd, infrequently seen, or seldom recognized fungi, often parasitic on plants.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/17/Phragmidium_bulbosum_-_Radevormwald-0211.jpg/330px-Phragmidium_bulbosum_-_Radevormwald-0211.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/2011-10-23_Phleogena_faginea_%28Fr.%29_Link_214654.jpg/250px-2011-10-23_Phleogena_faginea_%28Fr.%29_Link_214654.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Classicula_sinensis_%2810.3897-mycokeys.40.23828%29_Figure_2.jpg/250px-Classicula_sinensis_%2810.3897-mycokeys.40.23828%29_Figure_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Cystobasidium_fimetarium_iNaturalist_photo_247882200.jpg/330px-Cystobasidium_fimetarium_iNaturalist_photo_247882200.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a4/Naohidea_sebacea.png","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Rhodotorula_mucilaginosa_colonies_53.jpg/250px-Rhodotorula_mucilaginosa_colonies_53.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Puccinia_sessilis_0521.jpg/330px-Puccinia_sessilis_0521.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fb/2013-05-21_Eocronartium_muscicola_%28Pers.%29_Fitzp_334819.jpg/330px-2013-05-21_Eocronartium_muscicola_%28Pers.%29_Fitzp_334819.jpg"]}],{},{"2013-04-23_Lindtneria_trachyspora_(Bourdot_&_Galzin)_Pilát_722659.jpg":[800,600,"#676944"],"250px-2007-07-09_Lactarius_quietus_2.jpg":[250,241,"#65532e"],"250px-2011-10-23_Phleogena_faginea_(Fr.)_Link_214654.jpg":[250,265,null],"250px-2012-01-30_Exidia_nucleata_(Schweinitz)_Burt_197669.jpg":[250,292,"#74717d"],"250px-2013-11-11_Typhula_sclerotioides_(Pers.)_Fr_384017.jpg":[250,376,"#776945"],"250px-2014-08-16_Lachnocladium_schweinfurthianum_P._Henn_445707.jpg":[250,444,"#424228"],"250px-2014-11-02_Hymenochaete_iodina_(Mont.)_Pat_489348.jpg":[250,333,"#4b4629"],"250px-Anthracoidea_paniceae_on_Carex_panicea_2.jpg":[250,400,"#cfc2b5"],"250px-Boletus_satanas.JPG":[250,250,"#605749"],"250px-Bridal_Veil_Stinkhorn_(Phallus_indusiatus).jpg":[250,357,"#665d43"],"250px-Calocera_viscosa_(28519507173).jpg":[250,375,"#593b10"],"250px-Calostoma_fuscum.jpg":[250,350,"#715a4b"],"250px-Classicula_sinensis_(10.3897-mycokeys.40.23828)_Figure_2.jpg":[250,354,"#646464"],"250px-Clathrus_archeri_45492229.jpg":[250,333,"#5a3b2f"],"250px-Clavariadelphus-pistillaris.jpg":[250,333,"#857869"],"250px-Corticium_roseum_115846554.jpg":[250,375,"#b2afac"],"250px-Cortinarius_violaceus_02.jpg":[250,304,"#4b453f"],"250px-Craterellus_tubaeformis_LC0374.jpg":[250,312,"#7a7252"],"250px-Craterocolla_cerasi_139582.jpg":[250,347,"#886e6c"],"250px-Diplocystis_wrightii2.jpg":[250,250,"#8f8b87"],"250px-Fomitopsis_officinalis_483579.jpg":[250,333,"#69605d"],"250px-Fulvifomes_everhartii_(Ellis_&._Gall.)_Murrill_414536.jpg":[250,333,"#968579"],"250px-Fuscoporia_ferruginosa_1_132465_cropped.jpg":[250,300,"#7e624b"],"250px-Gautieria_morchelliformis_74809.jpg":[250,329,"#3c2e14"],"250px-Geastrum_saccatum_28733618.jpg":[250,333,"#403b35"],"250px-Golden_ear_bacteria_(2).jpg":[250,250,"#9b7d4e"],"250px-Gomphidius_glutinosus_131007.jpg":[250,278,"#75725f"],"250px-Gomphus_floccosus_6051.JPG":[250,375,"#47391c"],"250px-Gyroporus_subalbellus_427925.jpg":[250,276,"#6a5d4a"],"250px-Huitlacoche.jpg":[250,449,"#85887c"],"250px-Hydnodon_thelephorus_545249.jpg":[250,333,"#4a4041"],"250px-Laetisaria_fuciformis_258033360.jpg":[250,375,"#675939"],"250px-Microstroma_album_264712080.jpg":[250,333,"#786f51"],"250px-Myriostoma_coliforme_111029435.jpg":[250,333,"#736959"],"250px-Phaffia_rhodozyma_on_PDA_plate_02.jpg":[250,333,"#796a5e"],"250px-Phallus_impudicus7_Stinkhorn.jpg":[250,334,"#69554a"],"250px-Phallus_impudicus_Stinkmorchel.jpg":[250,333,"#757771"],"250px-Phellorinia_herculeana1.jpg":[250,360,"#9f7764"],"250px-Pisolithus_arrhizus_98622.jpg":[250,257,"#696264"],"250px-Podoserpula_pusio.jpg":[250,375,"#4a4327"],"250px-Polystictus_cinnabarinus_1904.jpg":[250,338,"#73604a"],"250px-Ramaria_lorithamnus_-_Bola_Creek.jpg":[250,250,"#796a3b"],"250px-Rhodotorula_mucilaginosa_colonies_53.jpg":[250,250,"#7e6351"],"250px-Rhopalogaster_transversarium_81638.jpg":[250,240,"#3b312c"],"250px-Sirobasidium_magnum_225759797.jpg":[250,444,"#7a7560"],"250px-Trametes_versicolor_93075730.jpg":[250,250,"#6c645c"],"250px-Tremella_fuciformis_54604208.jpg":[250,333,"#625c54"],"250px-Urocystis_colchici_var._cepulae_on_an_onion_seedling.jpg":[250,371,"#676560"],"330px-1372215000_NF7651BeenakiadacostaelowerLyrebirdWalk5-07WM.jpg":[330,252,"#7c7d7e"],"330px-2007-07-14_Cantharellus_cibarius_Detail.jpg":[330,251,"#826826"],"330px-2008-02-10_Polyporus_umbellatus_crop.jpg":[330,282,"#604a35"],"330px-2008-02-29_Tremella_encephala_Stereum_sanguinolentum.jpg":[330,239,"#5e4331"],"330px-2011-04-25_Laxitextum_bicolor_(Pers.)_Lentz_142910.jpg":[330,232,"#484346"],"330px-2011-09-21_Frantisekia_mentschulensis_(Pilat)_Spirin_204803.jpg":[330,247,"#3c3521"],"330px-2012-01-03_Pseudoxenasma_verrucisporum_Larsson_&_Hjortstam_192883.jpg":[330,227,"#5c5843"],"330px-2012-03-15_Dentipellis_fragilis_(Pers.)_Donk_204703.jpg":[330,248,"#7d7873"],"330px-2012-04-28_Botryobasidium_subcoronatum_(Höhn._&_Litsch.)_Donk_215384.jpg":[330,247,"#746a64"],"330px-2012-05-09_Leucophleps_spinospora_217703.jpg":[330,218,"#655f59"],"330px-2012-07-12_Polyporoletus_sublividus_Snell_236757.jpg":[330,300,"#6d845a"],"330px-2012-08-08_Gyroporus_purpurinus_246803.jpg":[330,177,"#845f4d"],"330px-2012-10-14_Cystoderma_carcharias_1.jpg":[330,247,"#485629"],"330px-2013-05-04_Eichleriella_deglubens_(Berk._&_Broome)_D.A._Reid_342451.jpg":[330,247,"#61624e"],"330px-2013-05-21_Eocronartium_muscicola_(Pers.)_Fitzp_334819.jpg":[330,243,"#4f5840"],"330px-2013-08-06_Lactarius_indigo_(Schwein.)_Fr_359776.jpg":[330,220,"#6e7baa"],"330px-2014-08-02_Hydnellum_aurantiacum_(Batsch)_P._Karst_441904.jpg":[330,241,"#53543a"],"330px-2016-02-21_Gloiodon_strigosus_(Sw.)_P._Karst_600817.jpg":[330,256,"#5c564f"],"330px-2019-06-07_Dacrymyces_tortus_1042878.jpg":[330,220,"#716663"],"330px-2020-08-21_Gyroporus_phaeocyanescens_Singer_&_M.H._Ivory_1227490.jpg":[330,234,"#756860"],"330px-Agaricus_campestris.jpg":[330,247,"#61684d"],"330px-Albatrellus-ovinus.jpg":[330,247,"#4f4a3b"],"330px-Alloclavaria_purpurea_78452.jpg":[330,248,"#97756b"],"330px-Amanita_caesarea_(16489941652).jpg":[330,248,"#655b57"],"330px-Amanita_muscaria_Marriott_Falls_1.jpg":[330,220,"#644c37"],"330px-Amaurodon_viridis_202958.jpg":[330,247,"#5f5c56"],"330px-Amphinema_byssoides_202959.jpg":[330,247,"#3c433c"],"330px-Amphistereum_schrenkii.jpg":[330,220,"#5f4b42"],"330px-Amylocorticium_subincarnatum_203078.jpg":[330,247,"#504c49"],"330px-Anomoloma_myceliosum_150634.jpg":[330,247,"#686561"],"330px-Anomoporia_bombycina.jpg":[330,221,"#73786d"],"330px-Anomoporia_kamtschatica_harsukääpä_vaddporing.jpg":[330,247,"#7d7c79"],"330px-Aphelaria_82539.jpg":[330,250,"#78582f"],"330px-Artomyces_pyxidatus_50687.jpg":[330,247,"#887644"],"330px-Asterodon_ferruginosus.jpg":[330,241,"#8a7251"],"330px-Astraeus_hygrometricus.jpg":[330,248,"#4b3c2e"],"330px-Athelia_rolfsii.jpg":[330,220,"#6d5047"],"330px-Auriscalpium_vulgare_060924.jpg":[330,283,"#382c0e"],"330px-Australovuilleminia_coccinea.jpg":[330,203,"#60412b"],"330px-Austrogautieria_sp.jpg":[330,303,"#4a4142"],"330px-Bankera_violascens_(9737748490).jpg":[330,247,"#535839"],"330px-Basidioradulum_radula_206606.jpg":[330,247,"#3e4440"],"330px-Boletinellus_merulioides_95348.jpg":[330,248,"#5c623c"],"330px-Boletopsis_grisea_171255.jpg":[330,256,"#585653"],"330px-Boletopsis_nothofagi_fruitbodies.jpg":[330,220,"#bbb7af"],"330px-Bondarzewia_berkeleyi.jpg":[330,220,"#86701f"],"330px-Brevicellicium_olivascens_a1_(3).jpg":[330,247,"#7c776b"],"330px-Byssocorticium_atrovirens_202452.jpg":[330,247,"#6f6a69"],"330px-Byssoporia_terrestre_196354.jpg":[330,247,"#27221b"],"330px-Calocera_viscosa_RF.jpg":[330,252,"#523c11"],"330px-Calostoma_cinnabarina.jpg":[330,247,"#404330"],"330px-Cantharellus_formosus_174975_Belfair.jpg":[330,247,"#8d612c"],"330px-Ceraceomyces_sublaevis_38439.jpg":[330,247,"#36332e"],"330px-Ceratobasidium_cornigerum_(02).jpg":[330,205,"#787673"],"330px-Chanterelle_Cantharellus_cibarius.jpg":[330,248,"#7b5c2e"],"330px-Clathrus_columnatus_two.jpeg":[330,247,"#836c5b"],"330px-Clavaria_zollingeri_90973.jpg":[330,295,"#6d574f"],"330px-Clavicorona_taxophila_107049507.jpg":[330,247,"#50503c"],"330px-Climacocystis_borealis_38653.jpg":[330,247,"#5e5543"],"330px-Coltricia_perennis_a1_(1).JPG":[330,247,"#786948"],"330px-Contumyces_rosellus_222.jpg":[330,247,"#606866"],"330px-Coprinellus_disseminatus.Fairy_Bonnets._(8725479830).jpg":[330,213,"#746d66"],"330px-Cotylidia_aurantiaca_13979.jpg":[330,220,"#4b4630"],"330px-Crassisporium_funariophilum_39856110.jpg":[330,247,"#735f50"],"330px-Crepidotus_cinnabarinus_54962444.jpg":[330,220,"#80371f"],"330px-Crustomyces_subabruptus_39745.jpg":[330,247,"#4a4845"],"330px-Cryptococcus_neoformans_using_a_light_India_ink_staining_preparation_PHIL_3771_lores.jpg":[330,221,"#b29d7c"],"330px-Cyathus_stercoreus_Fruchtkörper.JPG":[330,247,"#543c17"],"330px-Cyathus_striatus_154206673.jpg":[330,247,"#66635c"],"330px-Cystobasidium_fimetarium_iNaturalist_photo_247882200.jpg":[330,220,"#a29c91"],"330px-Cystostereum_murrayi_känsäorvakka_doftskinn.jpg":[330,247,"#5e5850"],"330px-Cytidia_salicina_214600.jpg":[330,285,"#937669"],"330px-Dacryopinax_spathularia_29235034.jpg":[330,247,"#86774f"],"330px-Daedalea_quercina_beentree.jpg":[330,247,"#7f7861"],"330px-Dendrocorticium_polygonioides_GBIF_observation_3441204021.jpg":[330,247,"#3a3c34"],"330px-Echinoporia_hydnophora.jpg":[330,273,"#8c8677"],"330px-Elmerina_holophaea.jpg":[330,221,"#686042"],"330px-Exidia_glandulosa_74739.jpg":[330,248,"#857970"],"330px-Exidiopsis_effusa_a1_(5).JPG":[330,247,"#575d5c"],"330px-False_Chanterelle_Hygrophoropsis_aurantiaca.jpg":[330,228,"#6c623e"],"330px-Favolus_tenuiculus_-_Flickr_-_Dick_Culbert.jpg":[330,279,"#96918b"],"330px-Fistulina_hepatica.jpg":[330,247,"#94753e"],"330px-Fomes_fomentarius_sasata.JPG":[330,303,"#717466"],"330px-Fomitopsis_pinicola_1.JPG":[330,248,"#4f4339"],"330px-Fungus-IMG_0656.JPG":[330,247,"#726b4e"],"330px-Fungus-IMG_3248.JPG":[330,247,"#575448"],"330px-Gallacea_scleroderma_002.jpg":[330,247,"#423e45"],"330px-Gastrosporium_simplex_364536.jpg":[330,247,"#634433"],"330px-Geastrum_saccatum.jpg":[330,220,"#5f4f42"],"330px-Geastrum_triplex.jpg":[330,247,"#76675a"],"330px-Geel_hoorntje.jpg":[330,249,"#847e7a"],"330px-Gloeocantharellus_purpurascens_245812.jpg":[330,213,"#564d48"],"330px-Gloeophyllum_protractum_liekokääpä_tallstocksticka.jpg":[330,247,"#7b7874"],"330px-Gloeophyllum_sepiarium_qtl1.jpg":[330,221,"#60473c"],"330px-Goldmistpilze2.jpg":[330,220,"#57552f"],"330px-Guepiniopsis_buccina_(Pers.)_L.L._Kenn_453388.jpg":[330,176,"#626335"],"330px-Gąska_zielonka_4163586757.jpg":[330,247,"#604f35"],"330px-Hapalopilus_nidulans_G7_(4).JPG":[330,248,"#666458"],"330px-Heliocybe_sulcata_88711.jpg":[330,247,"#847c67"],"330px-Hericium_coralloides_-_Male_Karpaty_I.jpg":[330,248,"#484340"],"330px-Heterotextus_miltinus_40693891.jpg":[330,247,"#514938"],"330px-Hirneola_auricula-judae_(xndr).jpg":[330,220,"#837565"],"330px-Hydnellum_auratile_34144.jpg":[330,214,"#61541b"],"330px-Hydnellum_compactum_01.JPG":[330,247,"#856f1a"],"330px-Hydnellum_ferrugineum_Glieres.jpg":[330,247,"#556337"],"330px-Hydnellum_peckii2.jpg":[330,247,"#804a3c"],"330px-Hydnellum_regium_267536.jpg":[330,262,"#634933"],"330px-Hydnellum_suaveolens_51703.jpg":[330,220,"#857c72"],"330px-Hydnochaete_olivacea.jpg":[330,221,"#896651"],"330px-Hydnocristella_himantia_52517515.jpg":[330,247,"#7e7063"],"330px-Hydnum_repandum_semmelstoppelpilz.jpg":[330,221,"#5d4f3a"],"330px-Hygrophorus_eburneus-pastorino.JPG":[330,247,"#564f46"],"330px-Hymenochaete_rubiginosa_81208.jpg":[330,172,"#4e422d"],"330px-Hysterangium_stoloniferum_Rissige_Schwanztrüffel.jpg":[330,223,"#52543e"],"330px-Igelstachelbart_Nov_06.jpg":[330,247,"#51523a"],"330px-Inocybe_obscura_20061015w.jpg":[330,220,"#596a48"],"330px-Inonotus_rheades_(14950933886).jpg":[330,220,"#655542"],"330px-Krause_Kraterelle,_Pseudocraterellus_undulatus.jpg":[330,247,"#635838"],"330px-Lactarius_piperatus_BS11.jpg":[330,248,"#3f3c33"],"330px-Lactarius_volemus_90024_cropped.jpg":[330,244,"#725629"],"330px-Lactifluus_sp_G3264_pleurotoid_French_Guiana_cropped.png":[330,279,"#434229"],"330px-Laetiporus_sulphureus_JPG01.jpg":[330,263,"#7b613e"],"330px-Laternea_pusilla_68902.jpg":[330,247,"#3b2913"],"330px-Lejkowiec_dęty_(Craterellus_cornucopioides).jpg":[330,248,"#466546"],"330px-Lentaria_micheneri_349076.jpg":[330,233,"#42443a"],"330px-Leptosporomyces_roseus_2024.jpg":[330,247,"#3c3735"],"330px-Leucogyrophana_mollusca_325823.jpg":[330,247,"#4d4232"],"330px-Loreleia_postii_68641.jpg":[330,221,"#9a754f"],"330px-Loweomyces_fractipes_241707.jpg":[330,223,"#57563f"],"330px-Lysurus_mokusin_apex.jpg":[330,247,"#745e49"],"330px-Marchandiomyces_corallinus_Jymm.jpg":[330,251,"#736f67"],"330px-Merismodes_fasciculata_82199.jpg":[330,313,"#8b7f6b"],"330px-Multifurca_sp_85586.jpg":[330,266,"#756049"],"330px-Myriostoma_coliforme.jpg":[330,247,"#4f3b2a"],"330px-Myriostoma_coliforme_(Dicks.)_Corda_605138.jpg":[330,186,"#645e58"],"330px-Mythicomyces_corneipes_270323.jpg":[330,258,"#505c39"],"330px-NeoLentinus_lepideus.JPG":[330,247,"#43382e"],"330px-Neolentinus_ponderosus_232623.jpg":[330,207,"#645f53"],"330px-Nigroporus_vinosus_264439.jpg":[330,260,"#624d49"],"330px-Oligoporus_caesius_74766.jpg":[330,248,"#626453"],"330px-Omphalotus_olearius_Mallorca.jpg":[330,247,"#624c30"],"330px-Onnia_tomentosa_72124.jpg":[330,247,"#8f7360"],"330px-Oyster_Rollrim_imported_from_iNaturalist_photo_34421800_on_25_February_2024.jpg":[330,247,"#9e8e78"],"330px-Peniophora_incarnata_(36443147085).jpg":[330,220,"#56504d"],"330px-Phaeoclavulina_cyanocephala_206537348_(cropped).jpg":[330,265,"#655349"],"330px-Phaeotremella_foliacea_(Pers.)_Wedin,_J.C._Zamora_&_Millanes_885447.jpg":[330,299,"#767959"],"330px-Phallogaster_saccatus_190326.jpg":[330,180,"#4e3325"],"330px-Phellodon_niger_496570.jpg":[330,248,"#6a635c"],"330px-Phellodon_tomentosus_(7).JPG":[330,248,"#5e5e63"],"330px-Phragmidium_bulbosum_-_Radevormwald-0211.jpg":[330,220,"#635f51"],"330px-Phyllotopsis_nidulans_99741687.jpg":[330,296,"#634e0c"],"330px-Piloderma_fallax_132197.jpg":[330,231,"#7d552f"],"330px-Piptoporus_quercinus_I_Posazavi.jpg":[330,285,"#74672f"],"330px-Pluteus_cervinus_20080420wa.jpg":[330,220,"#63653c"],"330px-Polyozellus_multiplex_-Haida_Guaii.jpg":[330,284,"#64662e"],"330px-Polyporus_squamosus_Molter.jpg":[330,247,"#7d704d"],"330px-Protubera_sabulonensis_73327.jpg":[330,282,"#958b78"],"330px-Pseudoclitocybe_cyathiformis_180105w.JPG":[330,220,"#534132"],"330px-Pseudomerulius_aureus.jpg":[330,149,"#66543d"],"330px-Puccinia_sessilis_0521.jpg":[330,282,"#8b8c3c"],"330px-Punctularia_strigoso-zonata_128943.jpg":[330,247,"#4d3d32"],"330px-Pycnoporus_cinnabarinus_(Jacq.)_P._Karst_153.jpg":[330,247,"#5a301f"],"330px-Radulomyces_copelandii_56998817.jpg":[330,247,"#9f824b"],"330px-Rhodotus_palmatus2.jpg":[330,247,"#5d382f"],"330px-Russula_brevipes.JPG":[330,261,"#5a5951"],"330px-Russula_flavida_Veracruz.jpg":[330,220,"#625025"],"330px-Russulamexicana.jpg":[330,220,"#595446"],"330px-Samtfuß-Holzkrempling_Tapinella_atrotomentosa.jpg":[330,228,"#4b5640"],"330px-Sarcodon_calvatus_-_Flickr_-_Dick_Culbert.jpg":[330,247,"#5a594c"],"330px-Sarcodon_fuscoindicus-_the_Violet_Hedgehog_-_Flickr_-_Dick_Culbert.jpg":[330,221,"#6a6d69"],"330px-Sarcodon_imbricatus0.jpg":[330,247,"#7d704b"],"330px-Sarcodon_rimosus_400861.jpg":[330,262,"#596e41"],"330px-Scharfer_Korkstacheling_Hydnellum_peckii_jung.jpg":[330,223,"#483629"],"330px-Schenella_pityophila_53720.jpg":[330,247,"#74706c"],"330px-Scleroderma_citrina_051106low.jpg":[330,220,"#87815f"],"330px-Scleroderma_texense_Veracruz.jpg":[330,275,"#6f624d"],"330px-Scytinostromella_heterogenea_189515.jpg":[330,247,"#62615f"],"330px-Sebacina_sparassoidea_56969.jpg":[330,220,"#69715f"],"330px-Sistotremastrum_niveocremeum_191634.jpg":[330,247,"#757171"],"330px-Spaltblättlinge.jpg":[330,220,"#7d767b"],"330px-Sphaerobolus.jpg":[330,186,"#2e2a21"],"330px-Stereopsis_humphreyi_56449.jpg":[330,247,"#574839"],"330px-Stereum_Hirsutum01.jpg":[330,179,"#6a634c"],"330px-Stinkhorn_Springbrook.jpg":[330,247,"#513a32"],"330px-Stinkhorn_mushroom_mount_cameroon_national_park.jpg":[330,220,"#4f4950"],"330px-Subulicystidium_longisporum_210912.jpg":[330,247,"#5a5958"],"330px-Suur_tardpoorik1.jpg":[330,219,"#755b4b"],"330px-Syzygospora_mycetophila_2388957.jpg":[330,204,"#73705c"],"330px-Teranacaerulea.jpg":[330,221,"#5e5953"],"330px-Tomentella_radiosa_192432.jpg":[330,247,"#414242"],"330px-Trappea_99522.jpg":[330,280,"#7d7368"],"330px-Trechispora_stevensonii_54363254.jpg":[330,218,"#635652"],"330px-Tremella_aurantia_Stereum_hirsutum_4342408020_bdbeb3eaa8_o.jpg":[330,247,"#4e3717"],"330px-Tremella_fuciformis_74925764.jpg":[330,255,"#63564c"],"330px-Tremella_mycophaga_Martin_344001_2013-05-08.jpg":[330,248,"#4e4a3a"],"330px-Tremella_polyporina_Reid_311599_2012-09-13.jpg":[330,249,"#4f4b3f"],"330px-Tremellochaete_novozealandica.jpg":[330,247,"#6d6e6c"],"330px-Tremellodendron_pallidum_54765.jpg":[330,247,"#6a6853"],"330px-Trichosporon_asahii_Gram_Stain.jpg":[330,269,"#b5999d"],"330px-Trumpets_on_the_forest_floor.jpg":[330,247,"#7c7a70"],"330px-Truncocolumella_citrina_397223.jpg":[330,187,"#76694d"],"330px-Tubaria_furfuracea_61894862.jpg":[330,247,"#996f43"],"330px-Täpptaelik_2.jpg":[330,233,"#696f51"],"330px-Weilangta_Phylloporus_sp.jpg":[330,220,"#5f5143"],"330px-Xenasma_pulverulentum_212363.jpg":[330,248,"#424937"],"330px-Zyzygomyces_physciacearum_59616219.jpg":[330,247,"#5f623c"],"Athelia_neuhoffii_-_Lindsey.jpg":[640,428,"#7f7f7f"],"Basidiomata_of_Trechisporales_(10.3897-mycokeys.48.31956)_Figure_1c.png":[747,493,"#555751"],"Basidiomata_of_Trechisporales_(10.3897-mycokeys.48.31956)_Figure_1f.png":[751,498,"#61605a"],"Botryobasidium.vagum.-.lindsey.jpg":[640,428,"#aa9883"],"Calocera_viscosa_NV.jpg":[800,600,"#736940"],"Cantharellopsis_prescotii_(Weinm.)_Kuyper_3461425368.jpg":[500,333,"#5e6635"],"Cerioporus_mollis_(Polyporaceae),_Zoelen,_the_Netherlands.jpg":[800,600,"#55524f"],"Claustula_fischeri.jpg":[550,222,"#486d6e"],"Clavariadelphus_truncatus_69586.jpg":[750,500,"#877e4c"],"Clavulina_cristata.jpg":[640,480,"#615c55"],"Coniophora_puteana_2_-_Lindsey.jpg":[640,428,"#5e5245"],"Entyloma_achilleae_-_Lindsey.jpg":[640,426,"#8e8039"],"Entyloma_oryzae_on_Oryza_sativa_(05).jpg":[768,510,"#caa857"],"Exobasidium.vaccinii.-.lindsey.jpg":[640,426,"#94922d"],"Exobasidium_rhododendri_54465.jpg":[750,500,"#8a7b48"],"Gomphus_clavatus_best.jpg":[800,600,"#4f5528"],"Hausschwamm.jpg":[623,207,"#725f4c"],"Hedgehog_fungi.jpg":[800,530,"#65522f"],"Heterobasidion_annosum_2_-_Lindsey.jpg":[640,425,"#605e43"],"Hexenei.jpg":[400,389,"#585b58"],"Inonotus_tamaricis_01.JPG":[800,600,"#665843"],"Lactarius_deliciosus.jpg":[800,600,"#6e5e44"],"Lactarius_pyrogallus.jpg":[640,480,"#6d6940"],"Lepidostroma_vilgalysii,_type_collection,_in_the_field,_2007.jpg":[335,510,"#98855e"],"Lyophyllum_decastes.jpg":[800,600,"#6c6861"],"Malassezia_furfur_in_skin_scale_from_a_patient_with_tinea_versicolor_PHIL_3938_lores.jpg":[700,470,"#f7e1c4"],"Merulius_tremellosus_-_Lindsey.jpg":[640,425,"#6b5e36"],"Naohidea_sebacea.png":[658,370,null],"Neolentinus_ponderosus_147223.jpg":[499,466,"#bca379"],"Oyster_mushoom_fells.jpg":[778,532,"#877455"],"Plicaturopsis.crispa.-.lindsey.jpg":[640,425,"#646348"],"Post-1-1127312702.jpg":[800,587,"#706e63"],"Psathyrella_spec._-_Lindsey_1a.jpg":[640,425,"#5f7854"],"Pterula.subulata.-.lindsey.jpg":[640,425,"#816b52"],"Pycnoporellus_alboluteus_61386.jpg":[800,600,"#807862"],"Schizopora.paradoxa2.-.lindsey.jpg":[640,428,"#6b6738"],"Sebacina_concrescens_16775.jpg":[800,600,"#455e3c"],"Star_jelly_-_lindsey.jpg":[640,425,"#745e47"],"Stropharia.aeruginosa.-.lindsey.jpg":[320,480,"#59593f"],"Thelephora.terrestris4.-.lindsey.jpg":[319,480,"#77733e"],"Trechispora.mollusca.-.lindsey.jpg":[640,428,"#ab9a85"],"Tulasnella.violea.-.lindsey.jpg":[640,425,"#907355"],"lossy-page1-189px-Serendipita_herbamans.tif.jpg":[189,240,"#adaca9"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_fungi_basidiomycota","<ul class=\"tree\" data-tree-range=\"basidiomycota\"><li><input type=\"checkbox\" checked id=\"Dikarya_Basidiomycota\"><label class=\"tree_label\" for=\"Dikarya_Basidiomycota\"></label><div class=\"outer_tree_box\"><div id=\"basidiomycota_basidiomycota\" class=\"tree_box\"><span><span>Basidiomycota</span><a href=\"https://en.wikipedia.org/wiki/Basidiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Basidiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Basidiomycota\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=bəˌsɪdi.oʊmaɪˈkoʊtə\" target=\"_blank\">bəˌsɪdi.oʊmaɪˈkoʊtə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"fungi\">See parent</button><span class=\"badge\">Phylum</span></span><span class=\"common_names\">(agarics, puffballs, stinkhorns, bracket fungi, jelly fungi, boletes, chanterelles, earth stars, smuts, bunts, rusts, mirror yeasts, human pathogenic yeast, basidiolichens)</span><p class=\"tag\">Filamentous fungi that are usually composed of hyphae and usually reproduce sexually via the formation of specialized club-shaped end cells called basidia that normally bear external meiospores (usually four).</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Amanita_muscaria_%28fly_agaric%29.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Amanita_muscaria_%28fly_agaric%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"368\" style=\"background-color:#83594e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Puffball_fungai.jpg\" target=\"_blank\"><img src=\"thumbnails/Puffball_fungai.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"533\" style=\"background-color:#322314\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fungi_in_Borneo.jpg\" target=\"_blank\"><img src=\"thumbnails/Fungi_in_Borneo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"449\" height=\"600\" style=\"background-color:#96815e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tremella_closeup.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tremella_closeup.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a8a592\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Boletus_edulis_EtgHollande_041031_091.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Boletus_edulis_EtgHollande_041031_091.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#715948\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2007-07-14_Cantharellus_cibarius.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2007-07-14_Cantharellus_cibarius.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#48511c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myriostoma_coliforme.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Myriostoma_coliforme.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4f3b2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Huitlacoche_1929.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Huitlacoche_1929.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#98978c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bruine_roest_op_tarwe_%28Puccinia_recondita_f.sp._tritici_on_Triticum_aestivum%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bruine_roest_op_tarwe_%28Puccinia_recondita_f.sp._tritici_on_Triticum_aestivum%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"117\" style=\"background-color:#a2876e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cryptococcosis_of_lung_in_patient_with_AIDS._Mucicarmine_stain_962_lores.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cryptococcosis_of_lung_in_patient_with_AIDS._Mucicarmine_stain_962_lores.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#c9b4ad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phallus-Indusiatus.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Phallus-Indusiatus.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#373324\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clathrus_ruber_specimen.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Clathrus_ruber_specimen.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#847e6a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cora_glabrata_%283143611489%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cora_glabrata_%283143611489%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#57502f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lichenomphalia_umbellifera_-_Lindsey_1a.jpg\" target=\"_blank\"><img src=\"thumbnails/Lichenomphalia_umbellifera_-_Lindsey_1a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#56513a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Multiclavula_mucida_23753.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Multiclavula_mucida_23753.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#525344\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Basidiomycota_Agaricomycotina\"><label class=\"tree_label\" for=\"Basidiomycota_Agaricomycotina\"></label><div class=\"outer_tree_box\"><div id=\"basidiomycota_agaricomycotina\" class=\"tree_box\"><span><span>Agaricomycotina</span><a href=\"https://en.wikipedia.org/wiki/Agaricomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Agaricomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Agaricomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subdivision</span></span><p class=\"tag\">Contains jelly fungi, yeasts, and mushrooms.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Amanita_caesarea_%2816489941652%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amanita_caesarea_%2816489941652%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#655b57\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Geastrum_saccatum_28733618.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Geastrum_saccatum_28733618.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#403b35\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clathrus_archeri_45492229.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Clathrus_archeri_45492229.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#5a3b2f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trametes_versicolor_93075730.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Trametes_versicolor_93075730.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#6c645c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tremella_fuciformis_74925764.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tremella_fuciformis_74925764.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#63564c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Calocera_viscosa_%2828519507173%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Calocera_viscosa_%2828519507173%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#593b10\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coprinellus_disseminatus.Fairy_Bonnets._%288725479830%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Coprinellus_disseminatus.Fairy_Bonnets._%288725479830%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"213\" style=\"background-color:#746d66\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_tremellomycetes\" class=\"tree_box\"><span><span>Tremellomycetes</span><a href=\"https://en.wikipedia.org/wiki/Tremellomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tremellomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tremellomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Includes basidiomycete yeasts, conspicuous jelly fungi, dimorphic taxa, and species that form complex fruiting bodies. Some are human and animal pathogens.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Sirobasidium_magnum_225759797.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sirobasidium_magnum_225759797.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"444\" style=\"background-color:#7a7560\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tremella_fuciformis_54604208.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tremella_fuciformis_54604208.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#625c54\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Golden_ear_bacteria_%282%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Golden_ear_bacteria_%282%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#9b7d4e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tremella_mycophaga_Martin_344001_2013-05-08.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tremella_mycophaga_Martin_344001_2013-05-08.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4e4a3a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phaeotremella_foliacea_%28Pers.%29_Wedin%2C_J.C._Zamora_%26_Millanes_885447.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phaeotremella_foliacea_%28Pers.%29_Wedin%2C_J.C._Zamora_%26_Millanes_885447.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"299\" style=\"background-color:#767959\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2008-02-29_Tremella_encephala_Stereum_sanguinolentum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2008-02-29_Tremella_encephala_Stereum_sanguinolentum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"239\" style=\"background-color:#5e4331\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tremella_aurantia_Stereum_hirsutum_4342408020_bdbeb3eaa8_o.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tremella_aurantia_Stereum_hirsutum_4342408020_bdbeb3eaa8_o.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4e3717\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cryptococcus_neoformans_using_a_light_India_ink_staining_preparation_PHIL_3771_lores.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cryptococcus_neoformans_using_a_light_India_ink_staining_preparation_PHIL_3771_lores.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#b29d7c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tremella_polyporina_Reid_311599_2012-09-13.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tremella_polyporina_Reid_311599_2012-09-13.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#4f4b3f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trichosporon_asahii_Gram_Stain.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Trichosporon_asahii_Gram_Stain.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"269\" style=\"background-color:#b5999d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zyzygomyces_physciacearum_59616219.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Zyzygomyces_physciacearum_59616219.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5f623c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Syzygospora_mycetophila_2388957.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Syzygospora_mycetophila_2388957.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"204\" style=\"background-color:#73705c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phaffia_rhodozyma_on_PDA_plate_02.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Phaffia_rhodozyma_on_PDA_plate_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#796a5e\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Agaricomycotina_Agaricomycetes\"><label class=\"tree_label\" for=\"Agaricomycotina_Agaricomycetes\"></label><div class=\"outer_tree_box\"><div id=\"basidiomycota_agaricomycetes\" class=\"tree_box\"><span><span>Agaricomycetes</span><a href=\"https://en.wikipedia.org/wiki/Agaricomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Agaricomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Agaricomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Includes all the agarics (gilled mushrooms), bracket fungi, clavarioid fungi, corticioid fungi, and gasteroid fungi.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_cantharellales\" class=\"tree_box\"><span><span>Cantharellales</span><a href=\"https://en.wikipedia.org/wiki/Cantharellales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cantharellales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cantharellales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(chanterelles, black chanterelles, winter chanterelles)</span><p class=\"tag\">Includes the chanterelles, some of the tooth fungi, clavarioid fungi, and corticioid fungi. Some are plant pathogens or symbiotic. Sporocarps (fruit bodies) have false gills.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chanterelle_Cantharellus_cibarius.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chanterelle_Cantharellus_cibarius.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#7b5c2e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cantharellus_formosus_174975_Belfair.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cantharellus_formosus_174975_Belfair.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8d612c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2007-07-14_Cantharellus_cibarius_Detail.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2007-07-14_Cantharellus_cibarius_Detail.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#826826\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trumpets_on_the_forest_floor.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Trumpets_on_the_forest_floor.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7c7a70\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Craterellus_tubaeformis_LC0374.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Craterellus_tubaeformis_LC0374.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"312\" style=\"background-color:#7a7252\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ceratobasidium_cornigerum_%2802%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ceratobasidium_cornigerum_%2802%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"205\" style=\"background-color:#787673\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clavulina_cristata.jpg\" target=\"_blank\"><img src=\"thumbnails/Clavulina_cristata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#615c55\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydnum_repandum_semmelstoppelpilz.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydnum_repandum_semmelstoppelpilz.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#5d4f3a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hedgehog_fungi.jpg\" target=\"_blank\"><img src=\"thumbnails/Hedgehog_fungi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"530\" style=\"background-color:#65522f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tulasnella.violea.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Tulasnella.violea.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#907355\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lejkowiec_d%C4%99ty_%28Craterellus_cornucopioides%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lejkowiec_d%C4%99ty_%28Craterellus_cornucopioides%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#466546\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Krause_Kraterelle%2C_Pseudocraterellus_undulatus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Krause_Kraterelle%2C_Pseudocraterellus_undulatus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#635838\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2012-04-28_Botryobasidium_subcoronatum_%28H%C3%B6hn._%26_Litsch.%29_Donk_215384.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2012-04-28_Botryobasidium_subcoronatum_%28H%C3%B6hn._%26_Litsch.%29_Donk_215384.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#746a64\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aphelaria_82539.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aphelaria_82539.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"250\" style=\"background-color:#78582f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Botryobasidium.vagum.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Botryobasidium.vagum.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"428\" style=\"background-color:#aa9883\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_sebacinales\" class=\"tree_box\"><span><span>Sebacinales</span><a href=\"https://en.wikipedia.org/wiki/Sebacinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sebacinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sebacinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Taxa have a widespread distribution and are mostly terrestrial, many forming mycorrhizas with a wide variety of plants, including orchids.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Sebacina_concrescens_16775.jpg\" target=\"_blank\"><img src=\"thumbnails/Sebacina_concrescens_16775.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#455e3c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sebacina_sparassoidea_56969.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sebacina_sparassoidea_56969.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#69715f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Craterocolla_cerasi_139582.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Craterocolla_cerasi_139582.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"347\" style=\"background-color:#886e6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tremellodendron_pallidum_54765.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tremellodendron_pallidum_54765.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6a6853\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Serendipita_herbamans.tif\" target=\"_blank\"><img src=\"thumbnails/lossy-page1-189px-Serendipita_herbamans.tif.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"189\" height=\"240\" style=\"background-color:#adaca9\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_auriculariales\" class=\"tree_box\"><span><span>Auriculariales</span><a href=\"https://en.wikipedia.org/wiki/Auriculariales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Auriculariales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Auriculariales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">The majority of species produce gelatinous basidiocarps (fruit bodies) on dead wood. In some these are conspicuous and may be ear-shaped, button-shaped, lobed, bracket-like, or effused. Some species produce dry, leathery, or web-like fruit bodies resembling those of the corticioid fungi.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Hirneola_auricula-judae_%28xndr%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hirneola_auricula-judae_%28xndr%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#837565\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2012-01-30_Exidia_nucleata_%28Schweinitz%29_Burt_197669.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2012-01-30_Exidia_nucleata_%28Schweinitz%29_Burt_197669.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"292\" style=\"background-color:#74717d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Star_jelly_-_lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Star_jelly_-_lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#745e47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tremellochaete_novozealandica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tremellochaete_novozealandica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6d6e6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Elmerina_holophaea.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Elmerina_holophaea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#686042\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2013-05-04_Eichleriella_deglubens_%28Berk._%26_Broome%29_D.A._Reid_342451.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2013-05-04_Eichleriella_deglubens_%28Berk._%26_Broome%29_D.A._Reid_342451.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#61624e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Exidiopsis_effusa_a1_%285%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Exidiopsis_effusa_a1_%285%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#575d5c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Exidia_glandulosa_74739.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Exidia_glandulosa_74739.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#857970\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Suur_tardpoorik1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Suur_tardpoorik1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#755b4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amphistereum_schrenkii.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amphistereum_schrenkii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5f4b42\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Agaricomycetes_Phallomycetidae\"><label class=\"tree_label\" for=\"Agaricomycetes_Phallomycetidae\"></label><div class=\"outer_tree_box\"><div id=\"basidiomycota_phallomycetidae\" class=\"tree_box\"><span><span>Phallomycetidae</span><a href=\"https://en.wikipedia.org/wiki/Phallomycetidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Phallomycetidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Phallomycetidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_geastrales\" class=\"tree_box\"><span><span>Geastrales</span><a href=\"https://en.wikipedia.org/wiki/Geastrales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Geastrales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Geastrales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(earthstars, shotgun fungus)</span><p class=\"tag\">Found under trees, mainly conifers. Spherical or egg-shaped fruiting bodies, some become star-shaped after splitting open to release spores.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Geastrum_triplex.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Geastrum_triplex.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#76675a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Geastrum_saccatum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Geastrum_saccatum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5f4f42\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myriostoma_coliforme.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Myriostoma_coliforme.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4f3b2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myriostoma_coliforme_%28Dicks.%29_Corda_605138.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Myriostoma_coliforme_%28Dicks.%29_Corda_605138.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#645e58\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myriostoma_coliforme_111029435.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Myriostoma_coliforme_111029435.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#736959\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Schenella_pityophila_53720.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Schenella_pityophila_53720.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#74706c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sphaerobolus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sphaerobolus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#2e2a21\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_hysterangiales\" class=\"tree_box\"><span><span>Hysterangiales</span><a href=\"https://en.wikipedia.org/wiki/Hysterangiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hysterangiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hysterangiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(club-shaped stinkhorns)</span><p class=\"tag\">Most are saprotrophic. Resembles puffballs when small, becoming pear-shaped and finally globose when mature. Fruiting body may be pink to vibrant lilac in colour. Mature internal tissue characterized by fetid odour.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Gallacea_scleroderma_002.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gallacea_scleroderma_002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#423e45\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hysterangium_stoloniferum_Rissige_Schwanztr%C3%BCffel.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hysterangium_stoloniferum_Rissige_Schwanztr%C3%BCffel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"223\" style=\"background-color:#52543e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phallogaster_saccatus_190326.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phallogaster_saccatus_190326.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"180\" style=\"background-color:#4e3325\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Protubera_sabulonensis_73327.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Protubera_sabulonensis_73327.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#958b78\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trappea_99522.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Trappea_99522.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"280\" style=\"background-color:#7d7368\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_gomphales\" class=\"tree_box\"><span><span>Gomphales</span><a href=\"https://en.wikipedia.org/wiki/Gomphales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gomphales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gomphales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Most are mycorrhizal, some are saprotrophic. Includes some club-shaped and coral-shaped fungi. Spores may be olive-shaped, usually rough.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:1372215000_NF7651BeenakiadacostaelowerLyrebirdWalk5-07WM.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-1372215000_NF7651BeenakiadacostaelowerLyrebirdWalk5-07WM.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"252\" style=\"background-color:#7c7d7e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clavariadelphus-pistillaris.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Clavariadelphus-pistillaris.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#857869\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clavariadelphus_truncatus_69586.jpg\" target=\"_blank\"><img src=\"thumbnails/Clavariadelphus_truncatus_69586.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"750\" height=\"500\" style=\"background-color:#877e4c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydnocristella_himantia_52517515.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydnocristella_himantia_52517515.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7e7063\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lentaria_micheneri_349076.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lentaria_micheneri_349076.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#42443a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Austrogautieria_sp.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Austrogautieria_sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"303\" style=\"background-color:#4a4142\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gautieria_morchelliformis_74809.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gautieria_morchelliformis_74809.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"329\" style=\"background-color:#3c2e14\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gloeocantharellus_purpurascens_245812.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gloeocantharellus_purpurascens_245812.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"213\" style=\"background-color:#564d48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gomphus_clavatus_best.jpg\" target=\"_blank\"><img src=\"thumbnails/Gomphus_clavatus_best.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#4f5528\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phaeoclavulina_cyanocephala_206537348_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phaeoclavulina_cyanocephala_206537348_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"265\" style=\"background-color:#655349\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ramaria_lorithamnus_-_Bola_Creek.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ramaria_lorithamnus_-_Bola_Creek.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#796a3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gomphus_floccosus_6051.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Gomphus_floccosus_6051.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#47391c\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_phallales\" class=\"tree_box\"><span><span>Phallales</span><a href=\"https://en.wikipedia.org/wiki/Phallales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Phallales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Phallales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(stinkhorns)</span><p class=\"tag\">Stinkhorns and related species. Most start as a truffle-like fungus, or &#x27;egg&#x27;, but some burst open into a fruiting body that is either club shaped or elaborately shaped, coated in a stinky slime that attracts insects, especially flies, to spread their spores.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Phallus_impudicus7_Stinkhorn.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Phallus_impudicus7_Stinkhorn.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"334\" style=\"background-color:#69554a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stinkhorn_mushroom_mount_cameroon_national_park.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stinkhorn_mushroom_mount_cameroon_national_park.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#4f4950\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bridal_Veil_Stinkhorn_%28Phallus_indusiatus%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Bridal_Veil_Stinkhorn_%28Phallus_indusiatus%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"357\" style=\"background-color:#665d43\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hexenei.jpg\" target=\"_blank\"><img src=\"thumbnails/Hexenei.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"400\" height=\"389\" style=\"background-color:#585b58\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stinkhorn_Springbrook.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stinkhorn_Springbrook.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#513a32\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clathrus_columnatus_two.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Clathrus_columnatus_two.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#836c5b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Laternea_pusilla_68902.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Laternea_pusilla_68902.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3b2913\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lysurus_mokusin_apex.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lysurus_mokusin_apex.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#745e49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phallus_impudicus_Stinkmorchel.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Phallus_impudicus_Stinkmorchel.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#757771\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gastrosporium_simplex_364536.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gastrosporium_simplex_364536.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#634433\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Claustula_fischeri.jpg\" target=\"_blank\"><img src=\"thumbnails/Claustula_fischeri.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"550\" height=\"222\" style=\"background-color:#486d6e\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_hydnodontaceae\" class=\"tree_box\"><span><span>Hydnodontaceae</span><a href=\"https://en.wikipedia.org/wiki/Hydnodontaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hydnodontaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hydnodontaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">They often form crust-like structures on decaying wood or soil.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Trechispora.mollusca.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Trechispora.mollusca.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"428\" style=\"background-color:#ab9a85\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Basidiomata_of_Trechisporales_%2810.3897-mycokeys.48.31956%29_Figure_1f.png\" target=\"_blank\"><img src=\"thumbnails/Basidiomata_of_Trechisporales_%2810.3897-mycokeys.48.31956%29_Figure_1f.png\" class=\"taxa-img\" loading=\"lazy\" width=\"751\" height=\"498\" style=\"background-color:#61605a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trechispora_stevensonii_54363254.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Trechispora_stevensonii_54363254.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"218\" style=\"background-color:#635652\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Subulicystidium_longisporum_210912.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Subulicystidium_longisporum_210912.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5a5958\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sistotremastrum_niveocremeum_191634.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sistotremastrum_niveocremeum_191634.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#757171\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydnodon_thelephorus_545249.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hydnodon_thelephorus_545249.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#4a4041\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brevicellicium_olivascens_a1_%283%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Brevicellicium_olivascens_a1_%283%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7c776b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_hymenochaetales\" class=\"tree_box\"><span><span>Hymenochaetales</span><a href=\"https://en.wikipedia.org/wiki/Hymenochaetales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Hymenochaetales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Hymenochaetales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Mostly corticioid fungi and poroid fungi, but also including several clavarioid fungi and agarics.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Asterodon_ferruginosus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Asterodon_ferruginosus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"241\" style=\"background-color:#8a7251\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coltricia_perennis_a1_%281%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Coltricia_perennis_a1_%281%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#786948\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2014-11-02_Hymenochaete_iodina_%28Mont.%29_Pat_489348.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2014-11-02_Hymenochaete_iodina_%28Mont.%29_Pat_489348.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#4b4629\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fomes_fomentarius_sasata.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Fomes_fomentarius_sasata.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"303\" style=\"background-color:#717466\"></a><a href=\"https://commons.wikimedia.org/wiki/File:T%C3%A4pptaelik_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-T%C3%A4pptaelik_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#696f51\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fulvifomes_everhartii_%28Ellis_%26._Gall.%29_Murrill_414536.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fulvifomes_everhartii_%28Ellis_%26._Gall.%29_Murrill_414536.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#968579\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fuscoporia_ferruginosa_1_132465_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fuscoporia_ferruginosa_1_132465_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"300\" style=\"background-color:#7e624b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydnochaete_olivacea.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydnochaete_olivacea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#896651\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hymenochaete_rubiginosa_81208.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hymenochaete_rubiginosa_81208.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"172\" style=\"background-color:#4e422d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Inonotus_rheades_%2814950933886%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Inonotus_rheades_%2814950933886%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#655542\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Inonotus_tamaricis_01.JPG\" target=\"_blank\"><img src=\"thumbnails/Inonotus_tamaricis_01.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#665843\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Onnia_tomentosa_72124.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Onnia_tomentosa_72124.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8f7360\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Polystictus_cinnabarinus_1904.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Polystictus_cinnabarinus_1904.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"338\" style=\"background-color:#73604a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Alloclavaria_purpurea_78452.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Alloclavaria_purpurea_78452.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#97756b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cantharellopsis_prescotii_%28Weinm.%29_Kuyper_3461425368.jpg\" target=\"_blank\"><img src=\"thumbnails/Cantharellopsis_prescotii_%28Weinm.%29_Kuyper_3461425368.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"333\" style=\"background-color:#5e6635\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Contumyces_rosellus_222.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Contumyces_rosellus_222.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#606866\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cotylidia_aurantiaca_13979.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cotylidia_aurantiaca_13979.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#4b4630\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Loreleia_postii_68641.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Loreleia_postii_68641.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#9a754f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Schizopora.paradoxa2.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Schizopora.paradoxa2.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"428\" style=\"background-color:#6b6738\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Basidioradulum_radula_206606.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Basidioradulum_radula_206606.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3e4440\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Echinoporia_hydnophora.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Echinoporia_hydnophora.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"273\" style=\"background-color:#8c8677\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Basidiomata_of_Trechisporales_%2810.3897-mycokeys.48.31956%29_Figure_1c.png\" target=\"_blank\"><img src=\"thumbnails/Basidiomata_of_Trechisporales_%2810.3897-mycokeys.48.31956%29_Figure_1c.png\" class=\"taxa-img\" loading=\"lazy\" width=\"747\" height=\"493\" style=\"background-color:#555751\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_thelephorales\" class=\"tree_box\"><span><span>Thelephorales</span><a href=\"https://en.wikipedia.org/wiki/Thelephorales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Thelephorales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Thelephorales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(leathery earthfans, tooth fungi, bleeding tooth fungi)</span><p class=\"tag\">Includes corticioid and hydnoid fungi, together with a few polypores and clavarioid species. Most are ectomycorrhizal.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Scharfer_Korkstacheling_Hydnellum_peckii_jung.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scharfer_Korkstacheling_Hydnellum_peckii_jung.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"223\" style=\"background-color:#483629\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydnellum_ferrugineum_Glieres.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydnellum_ferrugineum_Glieres.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#556337\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydnellum_peckii2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydnellum_peckii2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#804a3c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydnellum_suaveolens_51703.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydnellum_suaveolens_51703.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#857c72\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydnellum_compactum_01.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Hydnellum_compactum_01.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#856f1a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydnellum_auratile_34144.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydnellum_auratile_34144.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"214\" style=\"background-color:#61541b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sarcodon_fuscoindicus-_the_Violet_Hedgehog_-_Flickr_-_Dick_Culbert.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sarcodon_fuscoindicus-_the_Violet_Hedgehog_-_Flickr_-_Dick_Culbert.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#6a6d69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydnellum_regium_267536.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydnellum_regium_267536.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"262\" style=\"background-color:#634933\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phellodon_niger_496570.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phellodon_niger_496570.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#6a635c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phellodon_tomentosus_%287%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Phellodon_tomentosus_%287%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#5e5e63\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sarcodon_imbricatus0.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sarcodon_imbricatus0.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7d704b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sarcodon_calvatus_-_Flickr_-_Dick_Culbert.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sarcodon_calvatus_-_Flickr_-_Dick_Culbert.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5a594c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sarcodon_rimosus_400861.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sarcodon_rimosus_400861.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"262\" style=\"background-color:#596e41\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amaurodon_viridis_202958.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amaurodon_viridis_202958.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5f5c56\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Polyozellus_multiplex_-Haida_Guaii.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Polyozellus_multiplex_-Haida_Guaii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"284\" style=\"background-color:#64662e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thelephora.terrestris4.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Thelephora.terrestris4.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"319\" height=\"480\" style=\"background-color:#77733e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tomentella_radiosa_192432.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tomentella_radiosa_192432.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#414242\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Boletopsis_nothofagi_fruitbodies.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Boletopsis_nothofagi_fruitbodies.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#bbb7af\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Boletopsis_grisea_171255.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Boletopsis_grisea_171255.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#585653\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bankera_violascens_%289737748490%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bankera_violascens_%289737748490%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#535839\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2014-08-02_Hydnellum_aurantiacum_%28Batsch%29_P._Karst_441904.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2014-08-02_Hydnellum_aurantiacum_%28Batsch%29_P._Karst_441904.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"241\" style=\"background-color:#53543a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_polyporales\" class=\"tree_box\"><span><span>Polyporales</span><a href=\"https://en.wikipedia.org/wiki/Polyporales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Polyporales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Polyporales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Includes some polypores as well as many corticioid fungi and a few agarics. Many species within the order are saprotrophic, most of them wood-rotters. Some species that attack living tissues and then continue to degrade the wood of their dead hosts.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Crustomyces_subabruptus_39745.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Crustomyces_subabruptus_39745.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4a4845\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fomitopsis_pinicola_1.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Fomitopsis_pinicola_1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4f4339\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Piptoporus_quercinus_I_Posazavi.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Piptoporus_quercinus_I_Posazavi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"285\" style=\"background-color:#74672f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Climacocystis_borealis_38653.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Climacocystis_borealis_38653.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5e5543\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Laetiporus_sulphureus_JPG01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Laetiporus_sulphureus_JPG01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"263\" style=\"background-color:#7b613e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fomitopsis_officinalis_483579.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fomitopsis_officinalis_483579.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#69605d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oligoporus_caesius_74766.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Oligoporus_caesius_74766.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#626453\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pycnoporellus_alboluteus_61386.jpg\" target=\"_blank\"><img src=\"thumbnails/Pycnoporellus_alboluteus_61386.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#807862\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Daedalea_quercina_beentree.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Daedalea_quercina_beentree.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7f7861\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fungus-IMG_0656.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Fungus-IMG_0656.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#726b4e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Merulius_tremellosus_-_Lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Merulius_tremellosus_-_Lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#6b5e36\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Teranacaerulea.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Teranacaerulea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#5e5953\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Polyporus_squamosus_Molter.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Polyporus_squamosus_Molter.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7d704d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cerioporus_mollis_%28Polyporaceae%29%2C_Zoelen%2C_the_Netherlands.jpg\" target=\"_blank\"><img src=\"thumbnails/Cerioporus_mollis_%28Polyporaceae%29%2C_Zoelen%2C_the_Netherlands.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#55524f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Favolus_tenuiculus_-_Flickr_-_Dick_Culbert.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Favolus_tenuiculus_-_Flickr_-_Dick_Culbert.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"279\" style=\"background-color:#96918b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hapalopilus_nidulans_G7_%284%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Hapalopilus_nidulans_G7_%284%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#666458\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2008-02-10_Polyporus_umbellatus_crop.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2008-02-10_Polyporus_umbellatus_crop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#604a35\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pycnoporus_cinnabarinus_%28Jacq.%29_P._Karst_153.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pycnoporus_cinnabarinus_%28Jacq.%29_P._Karst_153.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5a301f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fungus-IMG_3248.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Fungus-IMG_3248.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#575448\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2011-09-21_Frantisekia_mentschulensis_%28Pilat%29_Spirin_204803.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2011-09-21_Frantisekia_mentschulensis_%28Pilat%29_Spirin_204803.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3c3521\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nigroporus_vinosus_264439.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nigroporus_vinosus_264439.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"260\" style=\"background-color:#624d49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Loweomyces_fractipes_241707.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Loweomyces_fractipes_241707.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"223\" style=\"background-color:#57563f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Xenasma_pulverulentum_212363.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Xenasma_pulverulentum_212363.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#424937\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_corticiales\" class=\"tree_box\"><span><span>Corticiales</span><a href=\"https://en.wikipedia.org/wiki/Corticiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Corticiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Corticiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Composed of corticioid fungi. Species within the order are generally saprotrophic, most of them wood-rotters, but several are parasitic on grasses or lichens.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Corticium_roseum_115846554.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Corticium_roseum_115846554.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#b2afac\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Laetisaria_fuciformis_258033360.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Laetisaria_fuciformis_258033360.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#675939\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Marchandiomyces_corallinus_Jymm.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Marchandiomyces_corallinus_Jymm.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#736f67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dendrocorticium_polygonioides_GBIF_observation_3441204021.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dendrocorticium_polygonioides_GBIF_observation_3441204021.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3a3c34\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Punctularia_strigoso-zonata_128943.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Punctularia_strigoso-zonata_128943.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4d3d32\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Australovuilleminia_coccinea.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Australovuilleminia_coccinea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"203\" style=\"background-color:#60412b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cytidia_salicina_214600.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cytidia_salicina_214600.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"285\" style=\"background-color:#937669\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_gloeophyllales\" class=\"tree_box\"><span><span>Gloeophyllales</span><a href=\"https://en.wikipedia.org/wiki/Gloeophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gloeophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gloeophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Wood-decay fungi that is characterized by the ability to produce a brown rot of wood.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Gloeophyllum_protractum_liekok%C3%A4%C3%A4p%C3%A4_tallstocksticka.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gloeophyllum_protractum_liekok%C3%A4%C3%A4p%C3%A4_tallstocksticka.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7b7874\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gloeophyllum_sepiarium_qtl1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gloeophyllum_sepiarium_qtl1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#60473c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Heliocybe_sulcata_88711.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Heliocybe_sulcata_88711.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#847c67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:NeoLentinus_lepideus.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-NeoLentinus_lepideus.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#43382e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neolentinus_ponderosus_232623.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Neolentinus_ponderosus_232623.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"207\" style=\"background-color:#645f53\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neolentinus_ponderosus_147223.jpg\" target=\"_blank\"><img src=\"thumbnails/Neolentinus_ponderosus_147223.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"499\" height=\"466\" style=\"background-color:#bca379\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_russulales\" class=\"tree_box\"><span><span>Russulales</span><a href=\"https://en.wikipedia.org/wiki/Russulales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Russulales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Russulales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(brittlegills, milk-caps)</span><p class=\"tag\">Includes polypores, some tooth fungi and club fungi. Basidiospores in this group are typically ornamented with amyloid warts or reticulation.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Albatrellus-ovinus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Albatrellus-ovinus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4f4a3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2012-05-09_Leucophleps_spinospora_217703.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2012-05-09_Leucophleps_spinospora_217703.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"218\" style=\"background-color:#655f59\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2012-07-12_Polyporoletus_sublividus_Snell_236757.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2012-07-12_Polyporoletus_sublividus_Snell_236757.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"300\" style=\"background-color:#6d845a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Artomyces_pyxidatus_50687.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Artomyces_pyxidatus_50687.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#887644\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Auriscalpium_vulgare_060924.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Auriscalpium_vulgare_060924.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"283\" style=\"background-color:#382c0e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clavicorona_taxophila_107049507.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Clavicorona_taxophila_107049507.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#50503c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Post-1-1127312702.jpg\" target=\"_blank\"><img src=\"thumbnails/Post-1-1127312702.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"587\" style=\"background-color:#706e63\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bondarzewia_berkeleyi.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bondarzewia_berkeleyi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#86701f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2016-02-21_Gloiodon_strigosus_%28Sw.%29_P._Karst_600817.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2016-02-21_Gloiodon_strigosus_%28Sw.%29_P._Karst_600817.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#5c564f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Heterobasidion_annosum_2_-_Lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Heterobasidion_annosum_2_-_Lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#605e43\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Igelstachelbart_Nov_06.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Igelstachelbart_Nov_06.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#51523a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2012-03-15_Dentipellis_fragilis_%28Pers.%29_Donk_204703.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2012-03-15_Dentipellis_fragilis_%28Pers.%29_Donk_204703.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#7d7873\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hericium_coralloides_-_Male_Karpaty_I.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hericium_coralloides_-_Male_Karpaty_I.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#484340\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2011-04-25_Laxitextum_bicolor_%28Pers.%29_Lentz_142910.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2011-04-25_Laxitextum_bicolor_%28Pers.%29_Lentz_142910.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"232\" style=\"background-color:#484346\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2014-08-16_Lachnocladium_schweinfurthianum_P._Henn_445707.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2014-08-16_Lachnocladium_schweinfurthianum_P._Henn_445707.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"444\" style=\"background-color:#424228\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Peniophora_incarnata_%2836443147085%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Peniophora_incarnata_%2836443147085%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#56504d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Russula_brevipes.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Russula_brevipes.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"261\" style=\"background-color:#5a5951\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Russulamexicana.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Russulamexicana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#595446\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Russula_flavida_Veracruz.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Russula_flavida_Veracruz.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#625025\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2007-07-09_Lactarius_quietus_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2007-07-09_Lactarius_quietus_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"241\" style=\"background-color:#65532e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lactifluus_sp_G3264_pleurotoid_French_Guiana_cropped.png\" target=\"_blank\"><img src=\"thumbnails/330px-Lactifluus_sp_G3264_pleurotoid_French_Guiana_cropped.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"279\" style=\"background-color:#434229\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lactarius_volemus_90024_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lactarius_volemus_90024_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"244\" style=\"background-color:#725629\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lactarius_piperatus_BS11.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lactarius_piperatus_BS11.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#3f3c33\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Multifurca_sp_85586.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Multifurca_sp_85586.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"266\" style=\"background-color:#756049\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lactarius_deliciosus.jpg\" target=\"_blank\"><img src=\"thumbnails/Lactarius_deliciosus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#6e5e44\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2013-08-06_Lactarius_indigo_%28Schwein.%29_Fr_359776.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2013-08-06_Lactarius_indigo_%28Schwein.%29_Fr_359776.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6e7baa\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lactarius_pyrogallus.jpg\" target=\"_blank\"><img src=\"thumbnails/Lactarius_pyrogallus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#6d6940\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stereum_Hirsutum01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stereum_Hirsutum01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"179\" style=\"background-color:#6a634c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2012-01-03_Pseudoxenasma_verrucisporum_Larsson_%26_Hjortstam_192883.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2012-01-03_Pseudoxenasma_verrucisporum_Larsson_%26_Hjortstam_192883.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"227\" style=\"background-color:#5c5843\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scytinostromella_heterogenea_189515.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scytinostromella_heterogenea_189515.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#62615f\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Agaricomycetes_Agaricomycetidae\"><label class=\"tree_label\" for=\"Agaricomycetes_Agaricomycetidae\"></label><div class=\"outer_tree_box\"><div id=\"basidiomycota_agaricomycetidae\" class=\"tree_box\"><span><span>Agaricomycetidae</span><a href=\"https://en.wikipedia.org/wiki/Agaricomycetidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Agaricomycetidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Agaricomycetidae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subclass</span></span><span class=\"common_names\">(false chanterelles)</span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_agaricales\" class=\"tree_box\"><span><span>Agaricales</span><a href=\"https://en.wikipedia.org/wiki/Agaricales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Agaricales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Agaricales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(field mushrooms, dung bird&#x27;s nest, destroying angels, violet coral mushrooms, beefsteak fungi)</span><p class=\"tag\">The majority are terrestrial. Species are saprotrophic or ectomycorrhizal, occasionally parasitic on plants or other fungi, and sometimes lichenized. A handful form mutualistic symbioses with ants and termites, and a few are important plant pathogens.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Agaricus_campestris.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Agaricus_campestris.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#61684d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cyathus_stercoreus_Fruchtk%C3%B6rper.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Cyathus_stercoreus_Fruchtk%C3%B6rper.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#543c17\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amanita_muscaria_Marriott_Falls_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amanita_muscaria_Marriott_Falls_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#644c37\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stereopsis_humphreyi_56449.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Stereopsis_humphreyi_56449.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#574839\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Goldmistpilze2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Goldmistpilze2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#57552f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clavaria_zollingeri_90973.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Clavaria_zollingeri_90973.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"295\" style=\"background-color:#6d574f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cortinarius_violaceus_02.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cortinarius_violaceus_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"304\" style=\"background-color:#4b453f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crassisporium_funariophilum_39856110.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Crassisporium_funariophilum_39856110.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#735f50\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crepidotus_cinnabarinus_54962444.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Crepidotus_cinnabarinus_54962444.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#80371f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cystostereum_murrayi_k%C3%A4ns%C3%A4orvakka_doftskinn.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cystostereum_murrayi_k%C3%A4ns%C3%A4orvakka_doftskinn.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5e5850\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fistulina_hepatica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fistulina_hepatica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#94753e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hygrophorus_eburneus-pastorino.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Hygrophorus_eburneus-pastorino.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#564f46\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Inocybe_obscura_20061015w.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Inocybe_obscura_20061015w.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#596a48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lyophyllum_decastes.jpg\" target=\"_blank\"><img src=\"thumbnails/Lyophyllum_decastes.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#6c6861\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mythicomyces_corneipes_270323.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mythicomyces_corneipes_270323.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"258\" style=\"background-color:#505c39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Merismodes_fasciculata_82199.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Merismodes_fasciculata_82199.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"313\" style=\"background-color:#8b7f6b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cyathus_striatus_154206673.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cyathus_striatus_154206673.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#66635c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Omphalotus_olearius_Mallorca.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Omphalotus_olearius_Mallorca.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#624c30\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phellorinia_herculeana1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Phellorinia_herculeana1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"360\" style=\"background-color:#9f7764\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phyllotopsis_nidulans_99741687.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phyllotopsis_nidulans_99741687.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"296\" style=\"background-color:#634e0c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhodotus_palmatus2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rhodotus_palmatus2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5d382f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oyster_mushoom_fells.jpg\" target=\"_blank\"><img src=\"thumbnails/Oyster_mushoom_fells.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"778\" height=\"532\" style=\"background-color:#877455\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pluteus_cervinus_20080420wa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pluteus_cervinus_20080420wa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#63653c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Psathyrella_spec._-_Lindsey_1a.jpg\" target=\"_blank\"><img src=\"thumbnails/Psathyrella_spec._-_Lindsey_1a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#5f7854\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pseudoclitocybe_cyathiformis_180105w.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudoclitocybe_cyathiformis_180105w.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#534132\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pterula.subulata.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Pterula.subulata.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#816b52\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Radulomyces_copelandii_56998817.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Radulomyces_copelandii_56998817.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9f824b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spaltbl%C3%A4ttlinge.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Spaltbl%C3%A4ttlinge.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7d767b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2012-10-14_Cystoderma_carcharias_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2012-10-14_Cystoderma_carcharias_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#485629\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2013-04-23_Lindtneria_trachyspora_%28Bourdot_%26_Galzin%29_Pil%C3%A1t_722659.jpg\" target=\"_blank\"><img src=\"thumbnails/2013-04-23_Lindtneria_trachyspora_%28Bourdot_%26_Galzin%29_Pil%C3%A1t_722659.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#676944\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stropharia.aeruginosa.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Stropharia.aeruginosa.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"320\" height=\"480\" style=\"background-color:#59593f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:G%C4%85ska_zielonka_4163586757.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-G%C4%85ska_zielonka_4163586757.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#604f35\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tubaria_furfuracea_61894862.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tubaria_furfuracea_61894862.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#996f43\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2013-11-11_Typhula_sclerotioides_%28Pers.%29_Fr_384017.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2013-11-11_Typhula_sclerotioides_%28Pers.%29_Fr_384017.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#776945\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_boletales\" class=\"tree_box\"><span><span>Boletales</span><a href=\"https://en.wikipedia.org/wiki/Boletales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Boletales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Boletales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(boletes, prettymouths, earthballs)</span><p class=\"tag\">Includes some boletes, earthballs, puffballs, and false truffles. Most members are saprobic, primarily found on the wood of fallen trees or in the soil at the base of trees.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Weilangta_Phylloporus_sp.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Weilangta_Phylloporus_sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5f5143\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Boletus_satanas.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Boletus_satanas.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#605749\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Boletinellus_merulioides_95348.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Boletinellus_merulioides_95348.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#5c623c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coniophora_puteana_2_-_Lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Coniophora_puteana_2_-_Lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"428\" style=\"background-color:#5e5245\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Astraeus_hygrometricus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Astraeus_hygrometricus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#4b3c2e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diplocystis_wrightii2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Diplocystis_wrightii2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#8f8b87\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gastrosporium_simplex_364536.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gastrosporium_simplex_364536.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#634433\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gomphidius_glutinosus_131007.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gomphidius_glutinosus_131007.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"278\" style=\"background-color:#75725f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2012-08-08_Gyroporus_purpurinus_246803.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2012-08-08_Gyroporus_purpurinus_246803.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"177\" style=\"background-color:#845f4d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2020-08-21_Gyroporus_phaeocyanescens_Singer_%26_M.H._Ivory_1227490.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2020-08-21_Gyroporus_phaeocyanescens_Singer_%26_M.H._Ivory_1227490.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#756860\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gyroporus_subalbellus_427925.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gyroporus_subalbellus_427925.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"276\" style=\"background-color:#6a5d4a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:False_Chanterelle_Hygrophoropsis_aurantiaca.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-False_Chanterelle_Hygrophoropsis_aurantiaca.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"228\" style=\"background-color:#6c623e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leucogyrophana_mollusca_325823.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leucogyrophana_mollusca_325823.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4d4232\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhopalogaster_transversarium_81638.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Rhopalogaster_transversarium_81638.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"240\" style=\"background-color:#3b312c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scleroderma_citrina_051106low.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scleroderma_citrina_051106low.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#87815f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Calostoma_cinnabarina.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Calostoma_cinnabarina.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#404330\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Calostoma_fuscum.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Calostoma_fuscum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"350\" style=\"background-color:#715a4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pisolithus_arrhizus_98622.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pisolithus_arrhizus_98622.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"257\" style=\"background-color:#696264\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scleroderma_texense_Veracruz.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Scleroderma_texense_Veracruz.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"275\" style=\"background-color:#6f624d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hausschwamm.jpg\" target=\"_blank\"><img src=\"thumbnails/Hausschwamm.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"623\" height=\"207\" style=\"background-color:#725f4c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Truncocolumella_citrina_397223.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Truncocolumella_citrina_397223.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"187\" style=\"background-color:#76694d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pseudomerulius_aureus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudomerulius_aureus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"149\" style=\"background-color:#66543d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Samtfu%C3%9F-Holzkrempling_Tapinella_atrotomentosa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Samtfu%C3%9F-Holzkrempling_Tapinella_atrotomentosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"228\" style=\"background-color:#4b5640\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oyster_Rollrim_imported_from_iNaturalist_photo_34421800_on_25_February_2024.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Oyster_Rollrim_imported_from_iNaturalist_photo_34421800_on_25_February_2024.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9e8e78\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_amylocorticiales\" class=\"tree_box\"><span><span>Amylocorticiales</span><a href=\"https://en.wikipedia.org/wiki/Amylocorticiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Amylocorticiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Amylocorticiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Form fruit bodies that are effused (stretched out flat like a film-like growth), effused-reflexed (stretched out but with edges curled up) to almost pileate (with a cap), or stipitate (with a stipe). They have smooth hymenophores that can be either merulioid (wrinkled with low, uneven ridges), irpicoid (with &#x27;teeth&#x27;) or poroid (with pores).</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Podoserpula_pusio.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Podoserpula_pusio.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#4a4327\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Plicaturopsis.crispa.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Plicaturopsis.crispa.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"425\" style=\"background-color:#646348\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leptosporomyces_roseus_2024.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leptosporomyces_roseus_2024.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3c3735\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ceraceomyces_sublaevis_38439.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ceraceomyces_sublaevis_38439.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#36332e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anomoloma_myceliosum_150634.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Anomoloma_myceliosum_150634.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#686561\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amylocorticium_subincarnatum_203078.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amylocorticium_subincarnatum_203078.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#504c49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anomoporia_kamtschatica_harsuk%C3%A4%C3%A4p%C3%A4_vaddporing.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Anomoporia_kamtschatica_harsuk%C3%A4%C3%A4p%C3%A4_vaddporing.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7d7c79\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anomoporia_bombycina.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Anomoporia_bombycina.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#73786d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Athelia_rolfsii.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Athelia_rolfsii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6d5047\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_lepidostromatales\" class=\"tree_box\"><span><span>Lepidostromatales</span><a href=\"https://en.wikipedia.org/wiki/Lepidostromatales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lepidostromatales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lepidostromatales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Lichenized fungi with fruiting bodies that are clavarioid.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lepidostroma_vilgalysii%2C_type_collection%2C_in_the_field%2C_2007.jpg\" target=\"_blank\"><img src=\"thumbnails/Lepidostroma_vilgalysii%2C_type_collection%2C_in_the_field%2C_2007.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"335\" height=\"510\" style=\"background-color:#98855e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_atheliales\" class=\"tree_box\"><span><span>Atheliales</span><a href=\"https://en.wikipedia.org/wiki/Atheliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Atheliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Atheliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Mostly corticioid fungi with varied ecological diversity. Most species have relatively simple gross morphology and produce crust-like fruiting bodies attached loosely to their substrate.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Amphinema_byssoides_202959.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amphinema_byssoides_202959.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3c433c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Athelia_neuhoffii_-_Lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Athelia_neuhoffii_-_Lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"428\" style=\"background-color:#7f7f7f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Byssocorticium_atrovirens_202452.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Byssocorticium_atrovirens_202452.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6f6a69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Byssoporia_terrestre_196354.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Byssoporia_terrestre_196354.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#27221b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leptosporomyces_roseus_2024.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leptosporomyces_roseus_2024.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3c3735\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Piloderma_fallax_132197.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Piloderma_fallax_132197.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"231\" style=\"background-color:#7d552f\"></a></div></div></div></li></ul></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_dacrymycetes\" class=\"tree_box\"><span><span>Dacrymycetes</span><a href=\"https://en.wikipedia.org/wiki/Dacrymycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dacrymycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dacrymycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">All are wood-rotting saprotrophs. Basidiocarps (fruit bodies) are ceraceous to gelatinous and typically yellow to orange.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:2019-06-07_Dacrymyces_tortus_1042878.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2019-06-07_Dacrymyces_tortus_1042878.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#716663\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Geel_hoorntje.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Geel_hoorntje.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#847e7a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Guepiniopsis_buccina_%28Pers.%29_L.L._Kenn_453388.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Guepiniopsis_buccina_%28Pers.%29_L.L._Kenn_453388.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"176\" style=\"background-color:#626335\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Calocera_viscosa_RF.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Calocera_viscosa_RF.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"252\" style=\"background-color:#523c11\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dacryopinax_spathularia_29235034.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dacryopinax_spathularia_29235034.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#86774f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Heterotextus_miltinus_40693891.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Heterotextus_miltinus_40693891.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#514938\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Calocera_viscosa_NV.jpg\" target=\"_blank\"><img src=\"thumbnails/Calocera_viscosa_NV.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#736940\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Basidiomycota_Ustilaginomycotina\"><label class=\"tree_label\" for=\"Basidiomycota_Ustilaginomycotina\"></label><div class=\"outer_tree_box\"><div id=\"basidiomycota_ustilaginomycotina\" class=\"tree_box\"><span><span>Ustilaginomycotina</span><a href=\"https://en.wikipedia.org/wiki/Ustilaginomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ustilaginomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ustilaginomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subdivision</span></span><p class=\"tag\">Includes the true smut fungi. They are mostly plant parasites on vascular plants. They consist of two states: anamorphic yeast state and teleomorphic filamentous smut state.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_malasseziomycetes\" class=\"tree_box\"><span><span>Malasseziomycetes</span><a href=\"https://en.wikipedia.org/wiki/Malasseziomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Malasseziomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Malasseziomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">A yeast found on the skin of animals, including humans that requires fat to grow.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Malassezia_furfur_in_skin_scale_from_a_patient_with_tinea_versicolor_PHIL_3938_lores.jpg\" target=\"_blank\"><img src=\"thumbnails/Malassezia_furfur_in_skin_scale_from_a_patient_with_tinea_versicolor_PHIL_3938_lores.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"700\" height=\"470\" style=\"background-color:#f7e1c4\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_ustilaginomycetes\" class=\"tree_box\"><span><span>Ustilaginomycetes</span><a href=\"https://en.wikipedia.org/wiki/Ustilaginomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ustilaginomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ustilaginomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">The true smut fungi are plant parasites. They have a simple septum with a septal pore cap.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Urocystis_colchici_var._cepulae_on_an_onion_seedling.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Urocystis_colchici_var._cepulae_on_an_onion_seedling.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"371\" style=\"background-color:#676560\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Huitlacoche.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Huitlacoche.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"449\" style=\"background-color:#85887c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anthracoidea_paniceae_on_Carex_panicea_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Anthracoidea_paniceae_on_Carex_panicea_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"400\" style=\"background-color:#cfc2b5\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_exobasidiomycetes\" class=\"tree_box\"><span><span>Exobasidiomycetes</span><a href=\"https://en.wikipedia.org/wiki/Exobasidiomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Exobasidiomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Exobasidiomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Includes fungi associated with galls on plants and smut fungi.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Exobasidium.vaccinii.-.lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Exobasidium.vaccinii.-.lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"426\" style=\"background-color:#94922d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Microstroma_album_264712080.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Microstroma_album_264712080.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#786f51\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Entyloma_oryzae_on_Oryza_sativa_%2805%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Entyloma_oryzae_on_Oryza_sativa_%2805%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"768\" height=\"510\" style=\"background-color:#caa857\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Exobasidium_rhododendri_54465.jpg\" target=\"_blank\"><img src=\"thumbnails/Exobasidium_rhododendri_54465.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"750\" height=\"500\" style=\"background-color:#8a7b48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Entyloma_achilleae_-_Lindsey.jpg\" target=\"_blank\"><img src=\"thumbnails/Entyloma_achilleae_-_Lindsey.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"426\" style=\"background-color:#8e8039\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_monilielliomycetes\" class=\"tree_box\"><span><span>Monilielliomycetes</span><a href=\"https://en.wikipedia.org/wiki/Monilielliomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Monilielliomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Monilielliomycetes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Includes some black, yeast-like fungi. Some species can cause disease in humans and cats.</p><div></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"basidiomycota_pucciniomycotina\" class=\"tree_box\"><span><span>Pucciniomycotina</span><a href=\"https://en.wikipedia.org/wiki/Pucciniomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pucciniomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pucciniomycotina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subdivision</span></span><p class=\"tag\">A diverse group of fungi, including rusts, insect parasitic/symbiotic fungi, yeasts, smut-like, jelly-like fungi and a mixture of odd, infrequently seen, or seldom recognized fungi, often parasitic on plants.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Phragmidium_bulbosum_-_Radevormwald-0211.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phragmidium_bulbosum_-_Radevormwald-0211.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#635f51\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2011-10-23_Phleogena_faginea_%28Fr.%29_Link_214654.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2011-10-23_Phleogena_faginea_%28Fr.%29_Link_214654.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"265\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Classicula_sinensis_%2810.3897-mycokeys.40.23828%29_Figure_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Classicula_sinensis_%2810.3897-mycokeys.40.23828%29_Figure_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"354\" style=\"background-color:#646464\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cystobasidium_fimetarium_iNaturalist_photo_247882200.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cystobasidium_fimetarium_iNaturalist_photo_247882200.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a29c91\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Naohidea_sebacea.png\" target=\"_blank\"><img src=\"thumbnails/Naohidea_sebacea.png\" class=\"taxa-img\" loading=\"lazy\" width=\"658\" height=\"370\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhodotorula_mucilaginosa_colonies_53.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Rhodotorula_mucilaginosa_colonies_53.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7e6351\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Puccinia_sessilis_0521.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Puccinia_sessilis_0521.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#8b8c3c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2013-05-21_Eocronartium_muscicola_%28Pers.%29_Fitzp_334819.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2013-05-21_Eocronartium_muscicola_%28Pers.%29_Fitzp_334819.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"243\" style=\"background-color:#4f5840\"></a></div></div></div></li></ul></li></ul>")
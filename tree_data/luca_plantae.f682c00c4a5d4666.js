@@ -0,0 +1 @@
+TreeData.register("luca_plantae",[{"name":"Rhodophyta","parent":"Plantae","rank":"Division","ipa":"roʊˈdɒfɪtə","ipa_alt":["ˌroʊdəˈfaɪtə"],"common":["red alga"],"tag":"Characterized by eukaryotic cells without flagella and centrioles, chloroplasts without external endoplasmic reticulum or unstacked (stroma) thylakoids, and use phycobiliproteins as accessory pigments, which give them their red color.","imgs":["https://upload.wikimedia.org/wikipedia/commons/a/a8/Stylonemaalsidii.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/New_Zealand_Mosses_Am_media-v-838854_%28Plocamium_spp.%29.jpg/250px-New_Zealand_Mosses_Am_media-v-838854_%28Plocamium_spp.%29.jpg"],"card":1},{"name":"Viridiplantae","parent":"Plantae","rank":"Clade","ipa":"","common":[],"tag":"","imgs":[],"card":1},{"name":"Prasinodermophyta","parent":"Viridiplantae","rank":"Division","ipa":"","common":["green alga"],"tag":"A proposed basal Viridiplantae clade that includes both unicellular algae and spherical cells in a gelatinous matrix. It's one of the taxa often called prasinophytes, a paraphyletic group of unicellular green algae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/1/13/Prasinoderma_coloniale_LM.webp","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b6/Palmophyllum_crassum_20084925.jpg/330px-Palmophyllum_crassum_20084925.jpg"],"card":1},{"name":"Chlorophyta","parent":"Viridiplantae","rank":"Division","ipa":"","common":["green alga"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Meersalat-Ulva-lactuca.jpg/330px-Meersalat-Ulva-lactuca.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/62/Caulerpa_prolifera.JPG/250px-Caulerpa_prolifera.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/Dictyosphaeria_cavernosa.jpg/330px-Dictyosphaeria_cavernosa.jpg"],"card":1},{"name":"Streptophyta","parent":"Viridiplantae","rank":"Clade","ipa":"strɛpˈtɒfɪtə","ipa_alt":"ˈstrɛptoʊfaɪtə","common":[],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/CharaGlobularis.jpg/250px-CharaGlobularis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg/330px-Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg"],"card":1},{"name":"Charophyta","parent":"Streptophyta","rank":"Division","ipa":"","common":["green alga","stoneworts","brittleworts","skunkweeds","musk grasses","desmids","water silks"],"tag":"A paraphyletic grade of freshwater green algae treated here as streptophyta excluding embryophyta. They are an assortment of extant freshwater and terrestrial green algae that display a wide array of unicellular, filamentous, and “parenchymatous” forms. Some have adapted to terrestrial conditions.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/CharaGlobularis.jpg/250px-CharaGlobularis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4d/Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg/330px-Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Mesostigma_viride_534857918.jpg/250px-Mesostigma_viride_534857918.jpg","https://upload.wikimedia.org/wikipedia/commons/8/8c/Chlorokybus_atmophyticus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ea/Lychnothamnus_barbatus_423056606.jpg/330px-Lychnothamnus_barbatus_423056606.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d3/Nitella_hyalina%2C_habitus%2C_Little_Eden%2C_a.jpg/330px-Nitella_hyalina%2C_habitus%2C_Little_Eden%2C_a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/Nitella_pseudoflabellata_57883868.jpg/250px-Nitella_pseudoflabellata_57883868.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5f/Nitella_syncarpa_sl5.jpg/330px-Nitella_syncarpa_sl5.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8d/Nitella_tenuissima_175124051.jpg/330px-Nitella_tenuissima_175124051.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4c/Nitellopsis_obtusa_bulbil.jpg/330px-Nitellopsis_obtusa_bulbil.jpg","https://upload.wikimedia.org/wikipedia/commons/2/2e/Tolypella_prolifera_23267822.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/34/Chara1.jpg/330px-Chara1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/76/Spirogyra-bgiu.jpg/330px-Spirogyra-bgiu.jpg","https://upload.wikimedia.org/wikipedia/commons/4/4e/Micrasterias2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/20/Gonatozygon_kinahani_189177769.jpg/330px-Gonatozygon_kinahani_189177769.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/49/Penium_polymorphum_%28PERTY%29_PERTY_68x25m.jpg/250px-Penium_polymorphum_%28PERTY%29_PERTY_68x25m.jpg"],"card":1},{"name":"Embryophyta","parent":"Streptophyta","rank":"Clade","ipa":"","common":[],"tag":"The land plants.","imgs":[],"card":1},{"name":"Bryophyta","parent":"Embryophyta","rank":"Clade","ipa":"braɪˈɒfətə","ipa_alt":["ˌbraɪ.əˈfaɪtə"],"common":[],"tag":"A clade of early land plants that are dominated by a multicellular haploid gametophyte and lack of true vascular tissue.","imgs":[],"card":2},{"name":"Marchantiophyta","parent":"Bryophyta","rank":"Division","ipa":"mɑːrˌkæntiˈɒfətə","ipa_alt":["mɑːrˌkæntiˈoʊˈfaɪtə"],"common":["liverworts"],"tag":"Have a gametophyte-dominant life cycle, in which cells of the plant carry only a single set of genetic information. The division name was derived from the genus name Marchantia, named by French botanist Jean Marchant after his father, also a biologist and together they authored Histoire des plantes.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/Lunularia_cruciata.jpg/330px-Lunularia_cruciata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f1/Marchantia_polymorpha_20100619_44.jpg/250px-Marchantia_polymorpha_20100619_44.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Jungermannia_hyalina_%28a%2C_113308-471324%29_2392.JPG/330px-Jungermannia_hyalina_%28a%2C_113308-471324%29_2392.JPG"],"card":2},{"name":"Anthocerotophyta","parent":"Bryophyta","rank":"Division","ipa":"ˌænθoʊˌsɛrəˈtɒfətə","ipa_alt":["ˌænθoʊˌsɛrəˈtəˈfaɪtə"],"etymology":"greek 'flower'-'horn'-'plant'","common":["hornworts"],"tag":"The hornworts (refering to the elongated horn-like structure, which is the sporophyte). As in mosses and liverworts, hornworts have a gametophyte-dominant life cycle, in which cells of the plant carry only a single set of genetic information; the flattened, green plant body of a hornwort is the gametophyte stage of the plant.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/ce/Phaeoceros_laevis.jpg/330px-Phaeoceros_laevis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/Dendroceros.jpg/330px-Dendroceros.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/95/Anthoceros_agrestis_060910c.jpg/250px-Anthoceros_agrestis_060910c.jpg"],"card":2},{"name":"Bryophytina","parent":"Bryophyta","rank":"Division","ipa":"","common":["mosses"],"tag":"The division of mosses, they are small, non-vascular plants that typically form dense green mats or clumps in damp or shaded environments, lack seeds and reproduce through spores. Bryophytina is technically a proposed name as a class.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Tionesta-ac-moss2.jpg/330px-Tionesta-ac-moss2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c9/Winter_moss.jpg/330px-Winter_moss.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Sphagnum_cuspidatum_041107a.jpg/330px-Sphagnum_cuspidatum_041107a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Oedipodium_griffithianum_1.jpg/330px-Oedipodium_griffithianum_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d6/Distichium_capillaceum_%28b%2C_144346-474700%29_3624.JPG/330px-Distichium_capillaceum_%28b%2C_144346-474700%29_3624.JPG"],"card":2},{"name":"Tracheophyta","parent":"Embryophyta","rank":"Clade","ipa":"","tag":"The vascular plants with a sporophyte dominated lifecyle; have true roots, leaves, and stems; using phloem to conduct products of photosynthesis and xylem to conconduct water and minerals.","card":2},{"name":"Lycopodiophyta","parent":"Tracheophyta","rank":"Division","ipa":"","common":["club mosses"],"tag":"A division of plants that includes the clubmoss class, Lycopodiopsida, that have an early vascular system and biflagellate sperm.","imgs":["https://upload.wikimedia.org/wikipedia/commons/f/f8/Isoetes_histrix.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Lycopodium_dendroideum.JPG/330px-Lycopodium_dendroideum.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/Lycopodium_annotinum_161102a.jpg/330px-Lycopodium_annotinum_161102a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dd/Selaginella_canaliculata.jpeg/330px-Selaginella_canaliculata.jpeg","https://upload.wikimedia.org/wikipedia/commons/6/69/Lycopodium_plant.jpg"],"card":3},{"name":"Euphyllophyta","parent":"Tracheophyta","rank":"Clade","ipa":"","common":[],"tag":"Vascular plants that are characterized by the possession of true leaves (megaphylls).","imgs":[],"card":3},{"name":"Polypodiophyta","parent":"Euphyllophyta","rank":"Division","ipa":"","common":["ferns","whisk ferns","horsetails"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/44/Tree_Fern_%2848717210587%29.jpg/330px-Tree_Fern_%2848717210587%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Equisetopsida.jpg/250px-Equisetopsida.jpg","https://upload.wikimedia.org/wikipedia/commons/0/0d/Psilotum.jpg"],"card":3},{"name":"Lignophytes","parent":"Euphyllophyta","rank":"Clade","ipa":"","etymology":"","common":[],"tag":"Characterised by a bifascial vascular cambium (secondary xylem and secondary phloem), or wood.","imgs":[],"card":3},{"name":"Spermatophyta","parent":"Lignophytes","rank":"Division","ipa":"","etymology":"latin 'seed' - greek 'plant'","common":[],"tag":"Plants that produce seeds.","imgs":[],"card":3},{"name":"Gymnospermae","parent":"Spermatophyta","rank":"Clade","ipa":"ˈdʒɪmnəˌspɜːrmz","etymology":"greek 'naked'-'seed'","common":[],"tag":"Early seed plants that don't have their seeds encased in an ovary and often form cones.","imgs":[],"card":4},{"name":"Cycadophyta","parent":"Gymnospermae","rank":"Division","ipa":"","common":["cycads"],"tag":"Dioecious plants that resemble palms and ferns but have cones for reproduction.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/27/Cycas_circinalis.jpg/250px-Cycas_circinalis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ad/Cycads%2C_Limpopo%2C_South_Africa_%282417726335%29.jpg/250px-Cycads%2C_Limpopo%2C_South_Africa_%282417726335%29.jpg"],"card":5},{"name":"Ginkgophyta","parent":"Gymnospermae","rank":"Division","ipa":"","common":["ginkos"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/Ginko_bilboa_%27King_of_Dongting%27_%28Ginkgoaceae%29_leaves.JPG/330px-Ginko_bilboa_%27King_of_Dongting%27_%28Ginkgoaceae%29_leaves.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/67/Ginko_tree_in_late_October_01.jpg/330px-Ginko_tree_in_late_October_01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fb/Cussac-ginko_01.jpg/250px-Cussac-ginko_01.jpg"],"card":5},{"name":"Pinophyta","parent":"Gymnospermae","rank":"Division","ipa":"","common":["conifers"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Pseudotsuga_menziesii_06280.JPG/330px-Pseudotsuga_menziesii_06280.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Abies_grandis_5359.JPG/500px-Abies_grandis_5359.JPG","https://upload.wikimedia.org/wikipedia/commons/e/e9/C_lawsoniana_Lge.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d0/Abies_lasiocarpa_5922.JPG/250px-Abies_lasiocarpa_5922.JPG"],"card":5},{"name":"Gnetophyta","parent":"Gymnospermae","rank":"Division","ipa":"","common":[],"tag":"A division of conifers that exhibit some characteristics of flowering plants.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/59/Gnetum_luofuense_125787614.jpg/330px-Gnetum_luofuense_125787614.jpg","https://upload.wikimedia.org/wikipedia/commons/9/9f/Welwitschia_at_Ugab_River_basin.jpg"],"card":5},{"name":"Angiosperms","parent":"Spermatophyta","rank":"Division","ipa":"","etymology":"greek 'container'-'seed'","common":[],"tag":"Plants that bear flowers and fruits. They have reduced gametophytes and a closed carpel enclosing the ovules.","card":4}],{},{"250px-Abies_lasiocarpa_5922.JPG":[250,375,"#58635f"],"250px-Anthoceros_agrestis_060910c.jpg":[250,294,"#81774f"],"250px-Caulerpa_prolifera.JPG":[250,279,"#e4e0d7"],"250px-CharaGlobularis.jpg":[250,307,"#bdc0b4"],"250px-Cussac-ginko_01.jpg":[250,376,"#667574"],"250px-Cycads,_Limpopo,_South_Africa_(2417726335).jpg":[250,253,"#5a5e4b"],"250px-Cycas_circinalis.jpg":[250,333,"#6f7f5e"],"250px-Equisetopsida.jpg":[250,375,"#445f2a"],"250px-Marchantia_polymorpha_20100619_44.jpg":[250,250,"#42462a"],"250px-Mesostigma_viride_534857918.jpg":[250,375,"#bbb8b7"],"250px-New_Zealand_Mosses_Am_media-v-838854_(Plocamium_spp.).jpg":[250,253,"#bfa289"],"250px-Nitella_pseudoflabellata_57883868.jpg":[250,249,"#738881"],"250px-Penium_polymorphum_(PERTY)_PERTY_68x25m.jpg":[250,269,"#c9c8a3"],"330px-Chara1.jpg":[330,219,"#636469"],"330px-Dendroceros.jpg":[330,248,"#756e50"],"330px-Dictyosphaeria_cavernosa.jpg":[330,253,"#695043"],"330px-Distichium_capillaceum_(b,_144346-474700)_3624.JPG":[330,220,"#84763b"],"330px-Ginko_bilboa_'King_of_Dongting'_(Ginkgoaceae)_leaves.JPG":[330,247,"#536519"],"330px-Ginko_tree_in_late_October_01.jpg":[330,186,"#9e7515"],"330px-Gnetum_luofuense_125787614.jpg":[330,220,"#949e88"],"330px-Gonatozygon_kinahani_189177769.jpg":[330,186,"#8e8c8a"],"330px-Jungermannia_hyalina_(a,_113308-471324)_2392.JPG":[330,220,"#657b30"],"330px-Klebsormidium_bilatum_Belgium_(14759117646).jpg":[330,248,"#b5aa87"],"330px-Lunularia_cruciata.jpg":[330,249,"#7e9660"],"330px-Lychnothamnus_barbatus_423056606.jpg":[330,220,"#a68672"],"330px-Lycopodium_annotinum_161102a.jpg":[330,247,"#847034"],"330px-Lycopodium_dendroideum.JPG":[330,309,"#897d55"],"330px-Meersalat-Ulva-lactuca.jpg":[330,234,"#89813e"],"330px-Nitella_hyalina,_habitus,_Little_Eden,_a.jpg":[330,247,"#5e6549"],"330px-Nitella_syncarpa_sl5.jpg":[330,295,"#9b9a92"],"330px-Nitella_tenuissima_175124051.jpg":[330,220,"#615b44"],"330px-Nitellopsis_obtusa_bulbil.jpg":[330,256,"#788988"],"330px-Oedipodium_griffithianum_1.jpg":[330,256,"#54612f"],"330px-Palmophyllum_crassum_20084925.jpg":[330,247,"#644c28"],"330px-Phaeoceros_laevis.jpg":[330,290,"#5c8263"],"330px-Pseudotsuga_menziesii_06280.JPG":[330,247,"#4a572f"],"330px-Selaginella_canaliculata.jpeg":[330,248,"#496b11"],"330px-Sphagnum_cuspidatum_041107a.jpg":[330,234,"#5f6116"],"330px-Spirogyra-bgiu.jpg":[330,247,"#87903d"],"330px-Tionesta-ac-moss2.jpg":[330,248,"#324330"],"330px-Tree_Fern_(48717210587).jpg":[330,219,"#848466"],"330px-Winter_moss.jpg":[330,206,"#7a6f5f"],"500px-Abies_grandis_5359.JPG":[500,750,"#555e2a"],"C_lawsoniana_Lge.jpg":[316,238,"#8a9871"],"Chlorokybus_atmophyticus.jpg":[294,174,"#7d8244"],"Isoetes_histrix.jpg":[500,410,"#4b5a2d"],"Lycopodium_plant.jpg":[400,533,"#8b8b63"],"Micrasterias2.jpg":[424,412,"#a58b39"],"Prasinoderma_coloniale_LM.webp":[775,563,"#7d93a0"],"Psilotum.jpg":[400,300,"#627035"],"Stylonemaalsidii.jpg":[431,345,"#b1ad98"],"Tolypella_prolifera_23267822.jpg":[565,573,"#508bbe"],"Welwitschia_at_Ugab_River_basin.jpg":[709,531,"#9a938a"]})
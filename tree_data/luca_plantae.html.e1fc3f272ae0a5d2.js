@@ -0,0 +1 @@
+TreeData.register_html("luca_plantae","<ul class=\"tree\" data-tree-range=\"plantae\"><li><input type=\"checkbox\" checked id=\"Diaphoretickes_Plantae\"><label class=\"tree_label\" for=\"Diaphoretickes_Plantae\"></label><div class=\"outer_tree_box\"><div id=\"plantae_plantae\" class=\"tree_box\"><span><span>Plantae</span><a href=\"https://en.wikipedia.org/wiki/Plantae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Plantae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Plantae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈplænti\" target=\"_blank\">ˈplænti</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"overview\">See parent</button><span class=\"badge\">Kingdom</span></span><span class=\"common_names\">(plants)</span><p class=\"tag\">The primary producers in most terrestrial ecosystems using organelles specialised for photosynthesis. Their cell walls contain cellulose.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chondrus_crispus_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-034_%28single%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Chondrus_crispus_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-034_%28single%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"332\" height=\"256\" style=\"background-color:#d3c4c9\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tionesta-ac-moss2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tionesta-ac-moss2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#324330\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Senecio_angulatus_003.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Senecio_angulatus_003.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#3f492d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#b5aa87\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jungermannia_hyalina_%28a%2C_113308-471324%29_2392.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Jungermannia_hyalina_%28a%2C_113308-471324%29_2392.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#657b30\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tree_Fern_%2848717210587%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tree_Fern_%2848717210587%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#848466\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Larix_decidua_Aletschwald.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Larix_decidua_Aletschwald.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#889872\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_rhodophyta\" class=\"tree_box\"><span><span>Rhodophyta</span><a href=\"https://en.wikipedia.org/wiki/Rhodophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rhodophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rhodophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=roʊˈdɒfɪtə\" target=\"_blank\">roʊˈdɒfɪtə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"rhodophyta\">See children</button><span class=\"badge\">Division</span></span><span class=\"common_names\">(red alga)</span><p class=\"tag\">Characterized by eukaryotic cells without flagella and centrioles, chloroplasts without external endoplasmic reticulum or unstacked (stroma) thylakoids, and use phycobiliproteins as accessory pigments, which give them their red color.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Stylonemaalsidii.jpg\" target=\"_blank\"><img src=\"thumbnails/Stylonemaalsidii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"431\" height=\"345\" style=\"background-color:#b1ad98\"></a><a href=\"https://commons.wikimedia.org/wiki/File:New_Zealand_Mosses_Am_media-v-838854_%28Plocamium_spp.%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-New_Zealand_Mosses_Am_media-v-838854_%28Plocamium_spp.%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"253\" style=\"background-color:#bfa289\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Plantae_Viridiplantae\"><label class=\"tree_label\" for=\"Plantae_Viridiplantae\"></label><div class=\"outer_tree_box\"><div id=\"plantae_viridiplantae\" class=\"tree_box\"><span><span>Viridiplantae</span><a href=\"https://en.wikipedia.org/wiki/Viridiplantae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Viridiplantae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Viridiplantae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_prasinodermophyta\" class=\"tree_box\"><span><span>Prasinodermophyta</span><a href=\"https://en.wikipedia.org/wiki/Prasinodermophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Prasinodermophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Prasinodermophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><span class=\"common_names\">(green alga)</span><p class=\"tag\">A proposed basal Viridiplantae clade that includes both unicellular algae and spherical cells in a gelatinous matrix. It&#x27;s one of the taxa often called prasinophytes, a paraphyletic group of unicellular green algae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Prasinoderma_coloniale_LM.webp\" target=\"_blank\"><img src=\"thumbnails/Prasinoderma_coloniale_LM.webp\" class=\"taxa-img\" loading=\"lazy\" width=\"775\" height=\"563\" style=\"background-color:#7d93a0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Palmophyllum_crassum_20084925.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Palmophyllum_crassum_20084925.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#644c28\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_chlorophyta\" class=\"tree_box\"><span><span>Chlorophyta</span><a href=\"https://en.wikipedia.org/wiki/Chlorophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chlorophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chlorophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"chlorophyta\">See children</button><span class=\"badge\">Division</span></span><span class=\"common_names\">(green alga)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Meersalat-Ulva-lactuca.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Meersalat-Ulva-lactuca.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#89813e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulerpa_prolifera.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Caulerpa_prolifera.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"279\" style=\"background-color:#e4e0d7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dictyosphaeria_cavernosa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dictyosphaeria_cavernosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"253\" style=\"background-color:#695043\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Viridiplantae_Streptophyta\"><label class=\"tree_label\" for=\"Viridiplantae_Streptophyta\"></label><div class=\"outer_tree_box\"><div id=\"plantae_streptophyta\" class=\"tree_box\"><span><span>Streptophyta</span><a href=\"https://en.wikipedia.org/wiki/Streptophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Streptophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Streptophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=strɛpˈtɒfɪtə\" target=\"_blank\">strɛpˈtɒfɪtə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div><a href=\"https://commons.wikimedia.org/wiki/File:CharaGlobularis.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-CharaGlobularis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"307\" style=\"background-color:#bdc0b4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#b5aa87\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_charophyta\" class=\"tree_box\"><span><span>Charophyta</span><a href=\"https://en.wikipedia.org/wiki/Charophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Charophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Charophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><span class=\"common_names\">(green alga, stoneworts, brittleworts, skunkweeds, musk grasses, desmids, water silks)</span><p class=\"tag\">A paraphyletic grade of freshwater green algae treated here as streptophyta excluding embryophyta. They are an assortment of extant freshwater and terrestrial green algae that display a wide array of unicellular, filamentous, and “parenchymatous” forms. Some have adapted to terrestrial conditions.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:CharaGlobularis.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-CharaGlobularis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"307\" style=\"background-color:#bdc0b4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Klebsormidium_bilatum_Belgium_%2814759117646%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#b5aa87\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mesostigma_viride_534857918.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Mesostigma_viride_534857918.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#bbb8b7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chlorokybus_atmophyticus.jpg\" target=\"_blank\"><img src=\"thumbnails/Chlorokybus_atmophyticus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"294\" height=\"174\" style=\"background-color:#7d8244\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lychnothamnus_barbatus_423056606.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lychnothamnus_barbatus_423056606.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a68672\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nitella_hyalina%2C_habitus%2C_Little_Eden%2C_a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nitella_hyalina%2C_habitus%2C_Little_Eden%2C_a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5e6549\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nitella_pseudoflabellata_57883868.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nitella_pseudoflabellata_57883868.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"249\" style=\"background-color:#738881\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nitella_syncarpa_sl5.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nitella_syncarpa_sl5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"295\" style=\"background-color:#9b9a92\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nitella_tenuissima_175124051.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nitella_tenuissima_175124051.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#615b44\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nitellopsis_obtusa_bulbil.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Nitellopsis_obtusa_bulbil.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#788988\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tolypella_prolifera_23267822.jpg\" target=\"_blank\"><img src=\"thumbnails/Tolypella_prolifera_23267822.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"565\" height=\"573\" style=\"background-color:#508bbe\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chara1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chara1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#636469\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spirogyra-bgiu.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Spirogyra-bgiu.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#87903d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Micrasterias2.jpg\" target=\"_blank\"><img src=\"thumbnails/Micrasterias2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"424\" height=\"412\" style=\"background-color:#a58b39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gonatozygon_kinahani_189177769.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gonatozygon_kinahani_189177769.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#8e8c8a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Penium_polymorphum_%28PERTY%29_PERTY_68x25m.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Penium_polymorphum_%28PERTY%29_PERTY_68x25m.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"269\" style=\"background-color:#c9c8a3\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Streptophyta_Embryophyta\"><label class=\"tree_label\" for=\"Streptophyta_Embryophyta\"></label><div class=\"outer_tree_box\"><div id=\"plantae_embryophyta\" class=\"tree_box\"><span><span>Embryophyta</span><a href=\"https://en.wikipedia.org/wiki/Embryophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Embryophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Embryophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">The land plants.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Embryophyta_Bryophyta\"><label class=\"tree_label\" for=\"Embryophyta_Bryophyta\"></label><div class=\"outer_tree_box\"><div id=\"plantae_bryophyta\" class=\"tree_box\"><span><span>Bryophyta</span><a href=\"https://en.wikipedia.org/wiki/Bryophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Bryophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Bryophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=braɪˈɒfətə\" target=\"_blank\">braɪˈɒfətə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">A clade of early land plants that are dominated by a multicellular haploid gametophyte and lack of true vascular tissue.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_marchantiophyta\" class=\"tree_box\"><span><span>Marchantiophyta</span><a href=\"https://en.wikipedia.org/wiki/Marchantiophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Marchantiophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Marchantiophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=mɑːrˌkæntiˈɒfətə\" target=\"_blank\">mɑːrˌkæntiˈɒfətə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><span class=\"common_names\">(liverworts)</span><p class=\"tag\">Have a gametophyte-dominant life cycle, in which cells of the plant carry only a single set of genetic information. The division name was derived from the genus name Marchantia, named by French botanist Jean Marchant after his father, also a biologist and together they authored Histoire des plantes.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lunularia_cruciata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lunularia_cruciata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#7e9660\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Marchantia_polymorpha_20100619_44.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Marchantia_polymorpha_20100619_44.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#42462a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jungermannia_hyalina_%28a%2C_113308-471324%29_2392.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Jungermannia_hyalina_%28a%2C_113308-471324%29_2392.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#657b30\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_anthocerotophyta\" class=\"tree_box\"><span><span>Anthocerotophyta</span><a href=\"https://en.wikipedia.org/wiki/Anthocerotophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Anthocerotophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Anthocerotophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌænθoʊˌsɛrəˈtɒfətə\" target=\"_blank\">ˌænθoʊˌsɛrəˈtɒfətə</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><span class=\"common_names\">(hornworts)</span><p class=\"tag\">The hornworts (refering to the elongated horn-like structure, which is the sporophyte). As in mosses and liverworts, hornworts have a gametophyte-dominant life cycle, in which cells of the plant carry only a single set of genetic information; the flattened, green plant body of a hornwort is the gametophyte stage of the plant.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Phaeoceros_laevis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phaeoceros_laevis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"290\" style=\"background-color:#5c8263\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dendroceros.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dendroceros.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#756e50\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anthoceros_agrestis_060910c.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Anthoceros_agrestis_060910c.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"294\" style=\"background-color:#81774f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_bryophytina\" class=\"tree_box\"><span><span>Bryophytina</span><a href=\"https://en.wikipedia.org/wiki/Bryophytina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Bryophytina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Bryophytina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><span class=\"common_names\">(mosses)</span><p class=\"tag\">The division of mosses, they are small, non-vascular plants that typically form dense green mats or clumps in damp or shaded environments, lack seeds and reproduce through spores. Bryophytina is technically a proposed name as a class.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Tionesta-ac-moss2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tionesta-ac-moss2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#324330\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Winter_moss.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Winter_moss.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#7a6f5f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sphagnum_cuspidatum_041107a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sphagnum_cuspidatum_041107a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#5f6116\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oedipodium_griffithianum_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Oedipodium_griffithianum_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#54612f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Distichium_capillaceum_%28b%2C_144346-474700%29_3624.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Distichium_capillaceum_%28b%2C_144346-474700%29_3624.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#84763b\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Embryophyta_Tracheophyta\"><label class=\"tree_label\" for=\"Embryophyta_Tracheophyta\"></label><div class=\"outer_tree_box\"><div id=\"plantae_tracheophyta\" class=\"tree_box\"><span><span>Tracheophyta</span><a href=\"https://en.wikipedia.org/wiki/Tracheophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tracheophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tracheophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">The vascular plants with a sporophyte dominated lifecyle; have true roots, leaves, and stems; using phloem to conduct products of photosynthesis and xylem to conconduct water and minerals.</p></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_lycopodiophyta\" class=\"tree_box\"><span><span>Lycopodiophyta</span><a href=\"https://en.wikipedia.org/wiki/Lycopodiophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lycopodiophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lycopodiophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><span class=\"common_names\">(club mosses)</span><p class=\"tag\">A division of plants that includes the clubmoss class, Lycopodiopsida, that have an early vascular system and biflagellate sperm.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Isoetes_histrix.jpg\" target=\"_blank\"><img src=\"thumbnails/Isoetes_histrix.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"410\" style=\"background-color:#4b5a2d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lycopodium_dendroideum.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Lycopodium_dendroideum.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"309\" style=\"background-color:#897d55\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lycopodium_annotinum_161102a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lycopodium_annotinum_161102a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#847034\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Selaginella_canaliculata.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Selaginella_canaliculata.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#496b11\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lycopodium_plant.jpg\" target=\"_blank\"><img src=\"thumbnails/Lycopodium_plant.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"400\" height=\"533\" style=\"background-color:#8b8b63\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Tracheophyta_Euphyllophyta\"><label class=\"tree_label\" for=\"Tracheophyta_Euphyllophyta\"></label><div class=\"outer_tree_box\"><div id=\"plantae_euphyllophyta\" class=\"tree_box\"><span><span>Euphyllophyta</span><a href=\"https://en.wikipedia.org/wiki/Euphyllophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Euphyllophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Euphyllophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Vascular plants that are characterized by the possession of true leaves (megaphylls).</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_polypodiophyta\" class=\"tree_box\"><span><span>Polypodiophyta</span><a href=\"https://en.wikipedia.org/wiki/Polypodiophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Polypodiophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Polypodiophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><span class=\"common_names\">(ferns, whisk ferns, horsetails)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Tree_Fern_%2848717210587%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tree_Fern_%2848717210587%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#848466\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Equisetopsida.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Equisetopsida.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#445f2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Psilotum.jpg\" target=\"_blank\"><img src=\"thumbnails/Psilotum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"400\" height=\"300\" style=\"background-color:#627035\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Euphyllophyta_Lignophytes\"><label class=\"tree_label\" for=\"Euphyllophyta_Lignophytes\"></label><div class=\"outer_tree_box\"><div id=\"plantae_lignophytes\" class=\"tree_box\"><span><span>Lignophytes</span><a href=\"https://en.wikipedia.org/wiki/Lignophytes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lignophytes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lignophytes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Characterised by a bifascial vascular cambium (secondary xylem and secondary phloem), or wood.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Lignophytes_Spermatophyta\"><label class=\"tree_label\" for=\"Lignophytes_Spermatophyta\"></label><div class=\"outer_tree_box\"><div id=\"plantae_spermatophyta\" class=\"tree_box\"><span><span>Spermatophyta</span><a href=\"https://en.wikipedia.org/wiki/Spermatophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Spermatophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Spermatophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><p class=\"tag\">Plants that produce seeds.</p><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Spermatophyta_Gymnospermae\"><label class=\"tree_label\" for=\"Spermatophyta_Gymnospermae\"></label><div class=\"outer_tree_box\"><div id=\"plantae_gymnospermae\" class=\"tree_box\"><span><span>Gymnospermae</span><a href=\"https://en.wikipedia.org/wiki/Gymnospermae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gymnospermae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gymnospermae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˈdʒɪmnəˌspɜːrmz\" target=\"_blank\">ˈdʒɪmnəˌspɜːrmz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Early seed plants that don&#x27;t have their seeds encased in an ovary and often form cones.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_cycadophyta\" class=\"tree_box\"><span><span>Cycadophyta</span><a href=\"https://en.wikipedia.org/wiki/Cycadophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cycadophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cycadophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><span class=\"common_names\">(cycads)</span><p class=\"tag\">Dioecious plants that resemble palms and ferns but have cones for reproduction.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cycas_circinalis.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cycas_circinalis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6f7f5e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cycads%2C_Limpopo%2C_South_Africa_%282417726335%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cycads%2C_Limpopo%2C_South_Africa_%282417726335%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"253\" style=\"background-color:#5a5e4b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_ginkgophyta\" class=\"tree_box\"><span><span>Ginkgophyta</span><a href=\"https://en.wikipedia.org/wiki/Ginkgophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ginkgophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ginkgophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><span class=\"common_names\">(ginkos)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Ginko_bilboa_%27King_of_Dongting%27_%28Ginkgoaceae%29_leaves.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Ginko_bilboa_%27King_of_Dongting%27_%28Ginkgoaceae%29_leaves.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#536519\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ginko_tree_in_late_October_01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ginko_tree_in_late_October_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#9e7515\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cussac-ginko_01.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cussac-ginko_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#667574\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_pinophyta\" class=\"tree_box\"><span><span>Pinophyta</span><a href=\"https://en.wikipedia.org/wiki/Pinophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pinophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pinophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"pinophyta\">See children</button><span class=\"badge\">Division</span></span><span class=\"common_names\">(conifers)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Pseudotsuga_menziesii_06280.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudotsuga_menziesii_06280.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4a572f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abies_grandis_5359.JPG\" target=\"_blank\"><img src=\"thumbnails/500px-Abies_grandis_5359.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"750\" style=\"background-color:#555e2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:C_lawsoniana_Lge.jpg\" target=\"_blank\"><img src=\"thumbnails/C_lawsoniana_Lge.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"316\" height=\"238\" style=\"background-color:#8a9871\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abies_lasiocarpa_5922.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Abies_lasiocarpa_5922.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#58635f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_gnetophyta\" class=\"tree_box\"><span><span>Gnetophyta</span><a href=\"https://en.wikipedia.org/wiki/Gnetophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gnetophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gnetophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Division</span></span><p class=\"tag\">A division of conifers that exhibit some characteristics of flowering plants.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Gnetum_luofuense_125787614.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gnetum_luofuense_125787614.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#949e88\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Welwitschia_at_Ugab_River_basin.jpg\" target=\"_blank\"><img src=\"thumbnails/Welwitschia_at_Ugab_River_basin.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"709\" height=\"531\" style=\"background-color:#9a938a\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"plantae_angiosperms\" class=\"tree_box\"><span><span>Angiosperms</span><a href=\"https://en.wikipedia.org/wiki/Angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"angiosperms\">See children</button><span class=\"badge\">Division</span></span><p class=\"tag\">Plants that bear flowers and fruits. They have reduced gametophytes and a closed carpel enclosing the ovules.</p></div></div></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_plantae_angiosperms",[{"name":"Basal angiosperms","parent":"Angiosperms","rank":"Grade","ipa":"","tag":"A parathyletic grade also known as the ANA grade.","imgs":[],"card":1},{"name":"Amborellales","parent":"Basal angiosperms","rank":"Order","ipa":"","tag":"An order containing a single species of New Caledonia shrub that is a sister group to all other known flowering plants.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/72/Amborella_trichopoda.jpg/330px-Amborella_trichopoda.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/Amborella_trichopoda_%283065968016%29_fragment.jpg/330px-Amborella_trichopoda_%283065968016%29_fragment.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Amborella_trichopoda_5.jpg/250px-Amborella_trichopoda_5.jpg"],"card":4},{"name":"Nymphaeales","parent":"Basal angiosperms","rank":"Order","ipa":"","common":["water lilies"],"tag":"An order of aquatic or sub-aquatic, annual or perennial herbs that lack a xylem and phloem.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/2007_nymphaea_lotus.jpg/330px-2007_nymphaea_lotus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/54/Trithuria_submersa_-_Flickr_-_Kevin_Thiele.jpg/250px-Trithuria_submersa_-_Flickr_-_Kevin_Thiele.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Euryale_ferox_kz06.jpg/330px-Euryale_ferox_kz06.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7d/Nuphar_lutea_%28flower%29.jpg/250px-Nuphar_lutea_%28flower%29.jpg"],"card":4},{"name":"Austrobaileyales","parent":"Basal angiosperms","rank":"Order","ipa":"","common":["star anise"],"tag":"An order of woody plants growing as trees, shrubs and lianas.","imgs":["https://upload.wikimedia.org/wikipedia/commons/d/d1/Schisandra_rubriflora.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Illicium_verum_1zz.jpg/330px-Illicium_verum_1zz.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2f/Dried_Star_Anise_Fruit_Seeds.jpg/330px-Dried_Star_Anise_Fruit_Seeds.jpg"],"card":4},{"name":"Core angiosperms","parent":"Angiosperms","rank":"Grade","ipa":"","tag":"","imgs":[],"card":1},{"name":"Magnoliid","parent":"Core angiosperms","rank":"Clade","ipa":"","common":["magnolias","nutmeg","bay laurel","cinnamon","avocado","black pepper","tulip tree"],"tag":"A group characterized by trimerous flowers, pollen with one pore, and usually branching-veined leaves.","imgs":["https://upload.wikimedia.org/wikipedia/commons/7/70/Magnolia_obovata_02.jpg"],"card":2},{"name":"Piperales","parent":"Magnoliid","rank":"Order","ipa":"","common":["black pepper vines","kava","pepper elder","lizard's tail","birthwort","wild ginger"],"tag":"An order that necessarily contains the family Piperaceae. Plants have simple leaves, minute flowers in spikes and the perianth is simple or lacking.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/ff/Black_Pepper_on_Jackfruit_Tree_-_Kerala_-_IMG_3623.jpg/250px-Black_Pepper_on_Jackfruit_Tree_-_Kerala_-_IMG_3623.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/Peperomia_trifolia_2011-01-17.jpg/330px-Peperomia_trifolia_2011-01-17.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Asarum_caudatum_1117.JPG/250px-Asarum_caudatum_1117.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Aristolochia_labiata.jpg/330px-Aristolochia_labiata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8b/Saururus_cernuus.jpg/330px-Saururus_cernuus.jpg"],"card":3},{"name":"Canellales","parent":"Magnoliid","rank":"Order","ipa":"","common":["horopito"],"tag":"A small group of typically evergreen trees and shrubs with smooth, leathery leaves with aromatic bark that includes the canellas, winter's-bark, and allies.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/17/Canella_winterana_Guadeloupe.JPG/330px-Canella_winterana_Guadeloupe.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/88/Drimys_winteri.jpg/330px-Drimys_winteri.jpg"],"card":3},{"name":"Laurales","parent":"Magnoliid","rank":"Order","ipa":"","common":["bay trees","cinnamon trees","avocado trees","Sassafras","Calycanthus"],"tag":"A group characterized by woodiness, aromatic parts, and a single strand of conducting tissues continuing from the stem into the leaf.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Starr-071024-0195-Laurus_nobilis-leaves-Enchanting_Floral_Gardens_of_Kula-Maui_%2824867859296%29.jpg/250px-Starr-071024-0195-Laurus_nobilis-leaves-Enchanting_Floral_Gardens_of_Kula-Maui_%2824867859296%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Cinnamon_tree.jpg/120px-Cinnamon_tree.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f2/Persea_americana_fruit_2.JPG/250px-Persea_americana_fruit_2.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/Sassafras_Leaves_June_Nbg_%28261691941%29.jpeg/330px-Sassafras_Leaves_June_Nbg_%28261691941%29.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fe/Laurus_nobilis_MHNT_Fleurs.jpg/330px-Laurus_nobilis_MHNT_Fleurs.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5b/Floridus1f.UME.jpg/250px-Floridus1f.UME.jpg","https://upload.wikimedia.org/wikipedia/commons/e/e1/Cinnamomum_verum1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/de/Cinnamomum_verum_spices.jpg/330px-Cinnamomum_verum_spices.jpg"],"card":3},{"name":"Magnoliales","parent":"Magnoliid","rank":"Order","ipa":"","common":["magnolias","tulip trees","custard apples","American pawpaw","cherimoyas","ylang-ylang","soursop fruit","nutmeg"],"tag":"An order including magnolia and related aromatic flowers.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/05/Liriodendron_tulipifera.jpg/330px-Liriodendron_tulipifera.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5b/Cananga_odorata_01.JPG/330px-Cananga_odorata_01.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Annona_muricata_1.jpg/250px-Annona_muricata_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Myris_fragr_Fr_080112-3290_ltn.jpg/250px-Myris_fragr_Fr_080112-3290_ltn.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Magnolia_sieboldii_flower_1.jpg/330px-Magnolia_sieboldii_flower_1.jpg"],"card":3},{"name":"Chloranthales","parent":"Core angiosperms","rank":"Order","ipa":"","tag":"An early-diverging lineages in the angiosperms of woody or weakly woody plants sometimes lacking petals.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Sarcandra_glabra2.jpg/330px-Sarcandra_glabra2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Chloranthus_fortunei_2.jpg/330px-Chloranthus_fortunei_2.jpg"],"card":2},{"name":"Monocots","parent":"Core angiosperms","rank":"Clade","ipa":"","common":["grasses","dates","onions","rice","maize","sugarcane","orchids","tulips","daffodils","lilies"],"tag":"Flowering plants with seeds that contain only one embryonic leaf, flowers parts in multiples of three, single pore pollen, usually parallel-veined leaves, and an atactostele (or scattered vascular tissue).","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/White_orchid_in_Clara_bog._03.jpg/250px-White_orchid_in_Clara_bog._03.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2b/Lily_Lilium_%27Citronella%27_Flower.jpg/330px-Lily_Lilium_%27Citronella%27_Flower.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/74/Seagrass_Zostera_marina_%28Dzharylhach_island%29.jpg/330px-Seagrass_Zostera_marina_%28Dzharylhach_island%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/98/Phoenix_Dactylifera_Date_Palm_Fields_South_Coast_Wholesale.jpg/330px-Phoenix_Dactylifera_Date_Palm_Fields_South_Coast_Wholesale.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/Vehn%C3%A4pelto_6.jpg/330px-Vehn%C3%A4pelto_6.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/Songe-R%C3%A9union.JPG/330px-Songe-R%C3%A9union.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8d/Pandanus_heterocarpus_01.JPG/250px-Pandanus_heterocarpus_01.JPG"],"card":2},{"name":"Ceratophyllales","parent":"Core angiosperms","rank":"Order","ipa":"","common":["coontails"],"tag":"A flowering plants aquatic plant found in tropical and in temperate regions with only a single genus.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/9f/CeratophyllumSubmersum.jpg/330px-CeratophyllumSubmersum.jpg"],"card":2},{"name":"Eudicots","parent":"Core angiosperms","rank":"Clade","ipa":"","etymology":"'true dicots'","common":["sunflowers","dandelions","forget-me-nots","cabbages","apples","buttercups","maples","macadamias"],"tag":"Flowering plants that have two seed leaves (cotyledons) upon germination, 4- or 5-part flowers, 3-pore pollen, and usually branch-veined leaves.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Senecio_angulatus_003.jpg/330px-Senecio_angulatus_003.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/40/Sunflower_sky_backdrop.jpg/250px-Sunflower_sky_backdrop.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/54/TaraxacumOfficinaleSeed.JPG/330px-TaraxacumOfficinaleSeed.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/e/eb/Myosotis_arvensis_ois.JPG/330px-Myosotis_arvensis_ois.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Cabbage_and_cross_section_on_white.jpg/330px-Cabbage_and_cross_section_on_white.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Acer_pseudoplatanus_002.jpg/330px-Acer_pseudoplatanus_002.jpg"],"card":2}],{},{"120px-Cinnamon_tree.jpg":[120,288,"#8a9772"],"250px-Amborella_trichopoda_5.jpg":[249,306,"#455725"],"250px-Annona_muricata_1.jpg":[250,333,"#65754e"],"250px-Asarum_caudatum_1117.JPG":[250,375,"#3c4d21"],"250px-Black_Pepper_on_Jackfruit_Tree_-_Kerala_-_IMG_3623.jpg":[250,375,"#687061"],"250px-Floridus1f.UME.jpg":[250,333,"#6f7b3b"],"250px-Myris_fragr_Fr_080112-3290_ltn.jpg":[250,327,"#666f1d"],"250px-Nuphar_lutea_(flower).jpg":[250,333,"#66722b"],"250px-Pandanus_heterocarpus_01.JPG":[250,333,"#8a8a92"],"250px-Persea_americana_fruit_2.JPG":[250,313,"#7a7b46"],"250px-Starr-071024-0195-Laurus_nobilis-leaves-Enchanting_Floral_Gardens_of_Kula-Maui_(24867859296).jpg":[250,333,"#587044"],"250px-Sunflower_sky_backdrop.jpg":[250,277,"#536b81"],"250px-Trithuria_submersa_-_Flickr_-_Kevin_Thiele.jpg":[250,244,"#201714"],"250px-White_orchid_in_Clara_bog._03.jpg":[250,444,"#666947"],"330px-2007_nymphaea_lotus.jpg":[330,219,"#55611f"],"330px-Acer_pseudoplatanus_002.jpg":[330,247,"#7b901e"],"330px-Amborella_trichopoda.jpg":[330,248,"#444a2b"],"330px-Amborella_trichopoda_(3065968016)_fragment.jpg":[330,259,"#66614d"],"330px-Aristolochia_labiata.jpg":[330,248,"#546a38"],"330px-Cabbage_and_cross_section_on_white.jpg":[330,149,"#c0c6ad"],"330px-Cananga_odorata_01.JPG":[330,251,"#697748"],"330px-Canella_winterana_Guadeloupe.JPG":[330,247,"#2f5224"],"330px-CeratophyllumSubmersum.jpg":[330,239,"#777f71"],"330px-Chloranthus_fortunei_2.jpg":[330,220,"#616e28"],"330px-Cinnamomum_verum_spices.jpg":[330,189,"#dcc9be"],"330px-Dried_Star_Anise_Fruit_Seeds.jpg":[330,220,"#e7ded6"],"330px-Drimys_winteri.jpg":[330,221,"#455d28"],"330px-Euryale_ferox_kz06.jpg":[330,220,"#7f8078"],"330px-Illicium_verum_1zz.jpg":[330,247,"#6a895c"],"330px-Laurus_nobilis_MHNT_Fleurs.jpg":[330,220,"#6d6230"],"330px-Lily_Lilium_'Citronella'_Flower.jpg":[330,256,"#68737e"],"330px-Liriodendron_tulipifera.jpg":[330,247,"#6f8b35"],"330px-Magnolia_sieboldii_flower_1.jpg":[330,275,"#7b8171"],"330px-Myosotis_arvensis_ois.JPG":[330,237,"#616c3e"],"330px-Peperomia_trifolia_2011-01-17.jpg":[330,247,"#517d3b"],"330px-Phoenix_Dactylifera_Date_Palm_Fields_South_Coast_Wholesale.jpg":[330,247,"#6f6b55"],"330px-Sarcandra_glabra2.jpg":[330,245,"#74834a"],"330px-Sassafras_Leaves_June_Nbg_(261691941).jpeg":[330,234,"#4e8748"],"330px-Saururus_cernuus.jpg":[330,220,"#232721"],"330px-Seagrass_Zostera_marina_(Dzharylhach_island).jpg":[330,247,"#7e8955"],"330px-Senecio_angulatus_003.jpg":[330,219,"#3f492d"],"330px-Songe-Réunion.JPG":[330,247,"#697852"],"330px-TaraxacumOfficinaleSeed.JPG":[330,247,"#3c6431"],"330px-Vehnäpelto_6.jpg":[330,220,"#a58963"],"Cinnamomum_verum1.jpg":[500,323,"#a19b7e"],"Magnolia_obovata_02.jpg":[640,480,"#718653"],"Schisandra_rubriflora.jpg":[525,394,"#917c5a"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_plantae_angiosperms","<ul class=\"tree\" data-tree-range=\"angiosperms\"><li><input type=\"checkbox\" checked id=\"Spermatophyta_Angiosperms\"><label class=\"tree_label\" for=\"Spermatophyta_Angiosperms\"></label><div class=\"outer_tree_box\"><div id=\"angiosperms_angiosperms\" class=\"tree_box\"><span><span>Angiosperms</span><a href=\"https://en.wikipedia.org/wiki/Angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"plantae\">See parent</button><span class=\"badge\">Division</span></span><p class=\"tag\">Plants that bear flowers and fruits. They have reduced gametophytes and a closed carpel enclosing the ovules.</p></div></div><ul><li><input type=\"checkbox\" checked id=\"Angiosperms_Basal angiosperms\"><label class=\"tree_label\" for=\"Angiosperms_Basal angiosperms\"></label><div class=\"outer_tree_box\"><div id=\"angiosperms_basal angiosperms\" class=\"tree_box\"><span><span>Basal angiosperms</span><a href=\"https://en.wikipedia.org/wiki/Basal angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Basal angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Basal angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Grade</span></span><p class=\"tag\">A parathyletic grade also known as the ANA grade.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"angiosperms_amborellales\" class=\"tree_box\"><span><span>Amborellales</span><a href=\"https://en.wikipedia.org/wiki/Amborellales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Amborellales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Amborellales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">An order containing a single species of New Caledonia shrub that is a sister group to all other known flowering plants.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Amborella_trichopoda.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amborella_trichopoda.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#444a2b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amborella_trichopoda_%283065968016%29_fragment.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amborella_trichopoda_%283065968016%29_fragment.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"259\" style=\"background-color:#66614d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amborella_trichopoda_5.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Amborella_trichopoda_5.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"249\" height=\"306\" style=\"background-color:#455725\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"angiosperms_nymphaeales\" class=\"tree_box\"><span><span>Nymphaeales</span><a href=\"https://en.wikipedia.org/wiki/Nymphaeales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Nymphaeales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Nymphaeales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(water lilies)</span><p class=\"tag\">An order of aquatic or sub-aquatic, annual or perennial herbs that lack a xylem and phloem.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:2007_nymphaea_lotus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2007_nymphaea_lotus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#55611f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trithuria_submersa_-_Flickr_-_Kevin_Thiele.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Trithuria_submersa_-_Flickr_-_Kevin_Thiele.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"244\" style=\"background-color:#201714\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Euryale_ferox_kz06.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Euryale_ferox_kz06.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7f8078\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nuphar_lutea_%28flower%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nuphar_lutea_%28flower%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#66722b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"angiosperms_austrobaileyales\" class=\"tree_box\"><span><span>Austrobaileyales</span><a href=\"https://en.wikipedia.org/wiki/Austrobaileyales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Austrobaileyales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Austrobaileyales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(star anise)</span><p class=\"tag\">An order of woody plants growing as trees, shrubs and lianas.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Schisandra_rubriflora.jpg\" target=\"_blank\"><img src=\"thumbnails/Schisandra_rubriflora.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"525\" height=\"394\" style=\"background-color:#917c5a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Illicium_verum_1zz.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Illicium_verum_1zz.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6a895c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dried_Star_Anise_Fruit_Seeds.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dried_Star_Anise_Fruit_Seeds.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#e7ded6\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Angiosperms_Core angiosperms\"><label class=\"tree_label\" for=\"Angiosperms_Core angiosperms\"></label><div class=\"outer_tree_box\"><div id=\"angiosperms_core angiosperms\" class=\"tree_box\"><span><span>Core angiosperms</span><a href=\"https://en.wikipedia.org/wiki/Core angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Core angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Core angiosperms\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Grade</span></span><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Core angiosperms_Magnoliid\"><label class=\"tree_label\" for=\"Core angiosperms_Magnoliid\"></label><div class=\"outer_tree_box\"><div id=\"angiosperms_magnoliid\" class=\"tree_box\"><span><span>Magnoliid</span><a href=\"https://en.wikipedia.org/wiki/Magnoliid\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Magnoliid\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Magnoliid\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><span class=\"common_names\">(magnolias, nutmeg, bay laurel, cinnamon, avocado, black pepper, tulip tree)</span><p class=\"tag\">A group characterized by trimerous flowers, pollen with one pore, and usually branching-veined leaves.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Magnolia_obovata_02.jpg\" target=\"_blank\"><img src=\"thumbnails/Magnolia_obovata_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#718653\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"angiosperms_piperales\" class=\"tree_box\"><span><span>Piperales</span><a href=\"https://en.wikipedia.org/wiki/Piperales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Piperales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Piperales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(black pepper vines, kava, pepper elder, lizard&#x27;s tail, birthwort, wild ginger)</span><p class=\"tag\">An order that necessarily contains the family Piperaceae. Plants have simple leaves, minute flowers in spikes and the perianth is simple or lacking.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Black_Pepper_on_Jackfruit_Tree_-_Kerala_-_IMG_3623.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Black_Pepper_on_Jackfruit_Tree_-_Kerala_-_IMG_3623.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#687061\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Peperomia_trifolia_2011-01-17.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Peperomia_trifolia_2011-01-17.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#517d3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Asarum_caudatum_1117.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Asarum_caudatum_1117.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#3c4d21\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aristolochia_labiata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aristolochia_labiata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#546a38\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Saururus_cernuus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Saururus_cernuus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#232721\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"angiosperms_canellales\" class=\"tree_box\"><span><span>Canellales</span><a href=\"https://en.wikipedia.org/wiki/Canellales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Canellales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Canellales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(horopito)</span><p class=\"tag\">A small group of typically evergreen trees and shrubs with smooth, leathery leaves with aromatic bark that includes the canellas, winter&#x27;s-bark, and allies.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Canella_winterana_Guadeloupe.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Canella_winterana_Guadeloupe.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#2f5224\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Drimys_winteri.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Drimys_winteri.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#455d28\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"angiosperms_laurales\" class=\"tree_box\"><span><span>Laurales</span><a href=\"https://en.wikipedia.org/wiki/Laurales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Laurales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Laurales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(bay trees, cinnamon trees, avocado trees, Sassafras, Calycanthus)</span><p class=\"tag\">A group characterized by woodiness, aromatic parts, and a single strand of conducting tissues continuing from the stem into the leaf.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Starr-071024-0195-Laurus_nobilis-leaves-Enchanting_Floral_Gardens_of_Kula-Maui_%2824867859296%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Starr-071024-0195-Laurus_nobilis-leaves-Enchanting_Floral_Gardens_of_Kula-Maui_%2824867859296%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#587044\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cinnamon_tree.jpg\" target=\"_blank\"><img src=\"thumbnails/120px-Cinnamon_tree.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"288\" style=\"background-color:#8a9772\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Persea_americana_fruit_2.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Persea_americana_fruit_2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"313\" style=\"background-color:#7a7b46\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sassafras_Leaves_June_Nbg_%28261691941%29.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Sassafras_Leaves_June_Nbg_%28261691941%29.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#4e8748\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Laurus_nobilis_MHNT_Fleurs.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Laurus_nobilis_MHNT_Fleurs.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6d6230\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Floridus1f.UME.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Floridus1f.UME.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6f7b3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cinnamomum_verum1.jpg\" target=\"_blank\"><img src=\"thumbnails/Cinnamomum_verum1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"323\" style=\"background-color:#a19b7e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cinnamomum_verum_spices.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cinnamomum_verum_spices.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"189\" style=\"background-color:#dcc9be\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"angiosperms_magnoliales\" class=\"tree_box\"><span><span>Magnoliales</span><a href=\"https://en.wikipedia.org/wiki/Magnoliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Magnoliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Magnoliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(magnolias, tulip trees, custard apples, American pawpaw, cherimoyas, ylang-ylang, soursop fruit, nutmeg)</span><p class=\"tag\">An order including magnolia and related aromatic flowers.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Liriodendron_tulipifera.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Liriodendron_tulipifera.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6f8b35\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cananga_odorata_01.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Cananga_odorata_01.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#697748\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Annona_muricata_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Annona_muricata_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#65754e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myris_fragr_Fr_080112-3290_ltn.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Myris_fragr_Fr_080112-3290_ltn.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"327\" style=\"background-color:#666f1d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Magnolia_sieboldii_flower_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Magnolia_sieboldii_flower_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"275\" style=\"background-color:#7b8171\"></a></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"angiosperms_chloranthales\" class=\"tree_box\"><span><span>Chloranthales</span><a href=\"https://en.wikipedia.org/wiki/Chloranthales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chloranthales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chloranthales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">An early-diverging lineages in the angiosperms of woody or weakly woody plants sometimes lacking petals.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Sarcandra_glabra2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sarcandra_glabra2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#74834a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chloranthus_fortunei_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chloranthus_fortunei_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#616e28\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"angiosperms_monocots\" class=\"tree_box\"><span><span>Monocots</span><a href=\"https://en.wikipedia.org/wiki/Monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"monocots\">See children</button><span class=\"badge\">Clade</span></span><span class=\"common_names\">(grasses, dates, onions, rice, maize, sugarcane, orchids, tulips, daffodils, lilies)</span><p class=\"tag\">Flowering plants with seeds that contain only one embryonic leaf, flowers parts in multiples of three, single pore pollen, usually parallel-veined leaves, and an atactostele (or scattered vascular tissue).</p><div><a href=\"https://commons.wikimedia.org/wiki/File:White_orchid_in_Clara_bog._03.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-White_orchid_in_Clara_bog._03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"444\" style=\"background-color:#666947\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lily_Lilium_%27Citronella%27_Flower.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lily_Lilium_%27Citronella%27_Flower.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#68737e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Seagrass_Zostera_marina_%28Dzharylhach_island%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Seagrass_Zostera_marina_%28Dzharylhach_island%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7e8955\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phoenix_Dactylifera_Date_Palm_Fields_South_Coast_Wholesale.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phoenix_Dactylifera_Date_Palm_Fields_South_Coast_Wholesale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6f6b55\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vehn%C3%A4pelto_6.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vehn%C3%A4pelto_6.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a58963\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Songe-R%C3%A9union.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Songe-R%C3%A9union.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#697852\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pandanus_heterocarpus_01.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Pandanus_heterocarpus_01.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#8a8a92\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"angiosperms_ceratophyllales\" class=\"tree_box\"><span><span>Ceratophyllales</span><a href=\"https://en.wikipedia.org/wiki/Ceratophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ceratophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ceratophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(coontails)</span><p class=\"tag\">A flowering plants aquatic plant found in tropical and in temperate regions with only a single genus.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:CeratophyllumSubmersum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-CeratophyllumSubmersum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"239\" style=\"background-color:#777f71\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"angiosperms_eudicots\" class=\"tree_box\"><span><span>Eudicots</span><a href=\"https://en.wikipedia.org/wiki/Eudicots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eudicots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eudicots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"eudicots\">See children</button><span class=\"badge\">Clade</span></span><span class=\"common_names\">(sunflowers, dandelions, forget-me-nots, cabbages, apples, buttercups, maples, macadamias)</span><p class=\"tag\">Flowering plants that have two seed leaves (cotyledons) upon germination, 4- or 5-part flowers, 3-pore pollen, and usually branch-veined leaves.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Senecio_angulatus_003.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Senecio_angulatus_003.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#3f492d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sunflower_sky_backdrop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sunflower_sky_backdrop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"277\" style=\"background-color:#536b81\"></a><a href=\"https://commons.wikimedia.org/wiki/File:TaraxacumOfficinaleSeed.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-TaraxacumOfficinaleSeed.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3c6431\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myosotis_arvensis_ois.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Myosotis_arvensis_ois.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#616c3e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cabbage_and_cross_section_on_white.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cabbage_and_cross_section_on_white.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"149\" style=\"background-color:#c0c6ad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acer_pseudoplatanus_002.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Acer_pseudoplatanus_002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7b901e\"></a></div></div></div></li></ul></li></ul></li></ul>")
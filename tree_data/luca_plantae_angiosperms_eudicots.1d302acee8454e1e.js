@@ -0,0 +1 @@
+TreeData.register("luca_plantae_angiosperms_eudicots",[{"name":"Ranunculales","parent":"Eudicots","rank":"Order","ipa":"","common":["poppies","barberries","hellebores","buttercups"],"tag":"The order that is sister to all other known Eudicots and includes the buttercups family Ranunculaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1a/5206-Decaisnea_fargesii-20111103-hamburg.jpg/250px-5206-Decaisnea_fargesii-20111103-hamburg.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Akebia_longeracemosa_%2814168601575%29.jpg/250px-Akebia_longeracemosa_%2814168601575%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Circaeaster_agrestis_7_Yunnan%2C_China_Photo_Magnus_Lid%C3%A9n.jpg/250px-Circaeaster_agrestis_7_Yunnan%2C_China_Photo_Magnus_Lid%C3%A9n.jpg","https://upload.wikimedia.org/wikipedia/commons/9/98/Berberis_darwinii_from_the_Berberidaceae_%288406231651%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8a/Creeping_butercup_close_800.jpg/330px-Creeping_butercup_close_800.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Helleborus_foetidus_re.jpg/250px-Helleborus_foetidus_re.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0f/Persian_Poppy%2C_Behbahan.jpg/250px-Persian_Poppy%2C_Behbahan.jpg"],"card":1},{"name":"Proteales","parent":"Eudicots","rank":"Order","ipa":"","common":["sugarbushes","banksias","spider flowers","macadamia","planetree","sacred lotus"],"tag":"An order or eudicots with seeds that have little or no endosperm. Includes the Proteaceae family and a family of aquatic flowering plants that have evolved to be similar to the water lilies.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Sacred_lotus_Nelumbo_nucifera.jpg/330px-Sacred_lotus_Nelumbo_nucifera.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/79/London_plane_flower.jpg/330px-London_plane_flower.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/63/Protea_exima.jpg/330px-Protea_exima.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e7/Banksia_serrata_follicles.jpg/250px-Banksia_serrata_follicles.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7e/EmbothriumFlowers_w.jpg/330px-EmbothriumFlowers_w.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Grevillea_rivularis.jpg/330px-Grevillea_rivularis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/Macadamia_nuts_on_tree.JPG/250px-Macadamia_nuts_on_tree.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/Hakea_laurina_Tas.jpg/330px-Hakea_laurina_Tas.jpg","https://upload.wikimedia.org/wikipedia/commons/6/64/Banksia_baxteri_Stahl_email.jpg"],"card":1},{"name":"Trochodendrales","parent":"Eudicots","rank":"Order","ipa":"","common":["wheel trees"],"tag":"An order of eudicots that have secondary xylem without vessel elements. Includes the wheel tree genus, Trochodendron.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/Tetracentron_sinense_-_Feuilles_et_fleurs-3.jpg/330px-Tetracentron_sinense_-_Feuilles_et_fleurs-3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/Trochodendron_aralioides_09072.JPG/250px-Trochodendron_aralioides_09072.JPG"],"card":1},{"name":"Buxales","parent":"Eudicots","rank":"Order","ipa":"","common":["common box","cape box"],"tag":"Includes the box family, Buxaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/fb/Buxus_sempervirens_IP1204022.JPG/330px-Buxus_sempervirens_IP1204022.JPG","https://upload.wikimedia.org/wikipedia/commons/5/56/Pachysandra_terminalis0.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c5/Haptanthus-pistil-stamens.jpg/330px-Haptanthus-pistil-stamens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fd/Buxus_sempervirens.jpg/250px-Buxus_sempervirens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/Buxus_sempervirens0.jpg/330px-Buxus_sempervirens0.jpg","https://upload.wikimedia.org/wikipedia/commons/7/7d/Sarcococca-humilis.JPG"],"card":1},{"name":"Core eudicots","parent":"Eudicots","rank":"Clade","ipa":"","common":[],"tag":"","imgs":[],"card":1},{"name":"Gunnerales","parent":"Core eudicots","rank":"Order","ipa":"","common":["giant rhubarbs"],"tag":"Includes the Gunneraceae family.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/Giant_rhubarb%2C_Urubici_-_State_of_Santa_Catarina%2C_88650-000%2C_Brazil_imported_from_iNaturalist_photo_62240680.jpg/330px-Giant_rhubarb%2C_Urubici_-_State_of_Santa_Catarina%2C_88650-000%2C_Brazil_imported_from_iNaturalist_photo_62240680.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Gunnera_manicata_%28Mammut-Blatt%29-1.JPG/330px-Gunnera_manicata_%28Mammut-Blatt%29-1.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3a/Myrothamnus_flabellifolius_Myrothamanaceae.jpg/250px-Myrothamnus_flabellifolius_Myrothamanaceae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Myrothamnus_flabellifolius04.jpg/330px-Myrothamnus_flabellifolius04.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Gunnera_hamiltonii_kz03.jpg/330px-Gunnera_hamiltonii_kz03.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Gunnera_insignis.jpg/330px-Gunnera_insignis.jpg"],"card":2},{"name":"Dilleniales","parent":"Core eudicots","rank":"Order","ipa":"","common":["guinea flowers","wild cashew tree","hibbertia"],"tag":"Includes the Dilleniaceae family.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4b/Lixeira_do_cerrado_de_Mato_Grosso.JPG/330px-Lixeira_do_cerrado_de_Mato_Grosso.JPG","https://upload.wikimedia.org/wikipedia/commons/b/b5/Flickr_-_Jo%C3%A3o_de_Deus_Medeiros_-_Doliocarpus_brevipedicellatus_%281%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Davilla_kunthii%2C_the_Sandpaper_Vine_%2810620657533%29.jpg/330px-Davilla_kunthii%2C_the_Sandpaper_Vine_%2810620657533%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/72/Hibbertia_stellaris.jpg/330px-Hibbertia_stellaris.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/11/Hibbertia_stellaris_1.jpg/330px-Hibbertia_stellaris_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Gardenology-IMG_7966_hunt10aug.jpg/330px-Gardenology-IMG_7966_hunt10aug.jpg"],"card":2},{"name":"Superrosids","parent":"Core eudicots","rank":"Clade","ipa":"","common":[],"tag":"","imgs":[],"card":2},{"name":"Saxifragales","parent":"Superrosids","rank":"Order","ipa":"","common":["saxifrages","blackcurrants","redcurrants","gooseberries","peonies","liquidambars","witch-hazel","Persian ironwood","katsura","jade plant","houseleeks","water milfoil","sweetgums","money trees","houseleeks"],"tag":"A eudicot order with the saxifrages (Saxifraga) as the type genus.","imgs":["https://upload.wikimedia.org/wikipedia/commons/6/66/Saxifraga_cochlearis1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/95/Blackcurrant_1.jpg/250px-Blackcurrant_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fd/PaeoniaSuffruticosa7.jpg/330px-PaeoniaSuffruticosa7.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6a/Leaves_of_Liquidambar_orientalis_1.jpg/330px-Leaves_of_Liquidambar_orientalis_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/CopalmeDAmerique.jpg/250px-CopalmeDAmerique.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ea/Hamamelis_virginiana_FlowersLeaves_BotGardBln0906.JPG/250px-Hamamelis_virginiana_FlowersLeaves_BotGardBln0906.JPG","https://upload.wikimedia.org/wikipedia/commons/0/0b/Cercidiphyllum_japonicum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Crassula_ovata_700.jpg/250px-Crassula_ovata_700.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Sempervirum_tectorum1.jpg/250px-Sempervirum_tectorum1.jpg"],"card":3},{"name":"Rosids","parent":"Superrosids","rank":"Clade","ipa":"","common":[],"tag":"","imgs":[],"card":3},{"name":"Vitales","parent":"Rosids","rank":"Order","ipa":"","common":["grapes","Virginia creeper"],"tag":"A eudicot order of woody plants, most of them tendril-bearing vines that includes the grape genus, Vitis.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5d/Ampelopsis_glandulosa_var._heterophylla_0810.jpg/330px-Ampelopsis_glandulosa_var._heterophylla_0810.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Virginia_creeper_Parthenocissus_quinquifolia_169.JPG/330px-Virginia_creeper_Parthenocissus_quinquifolia_169.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d9/Grapes03.jpg/250px-Grapes03.jpg"],"card":3},{"name":"Fabids","parent":"Rosids","rank":"Clade","ipa":"","common":[],"tag":"","imgs":[],"card":3},{"name":"Fabales","parent":"Fabids","rank":"Order","ipa":"","common":["legumes","milkworts"],"tag":"Includes the legume family, Fabaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4a/Peanut_9417.jpg/330px-Peanut_9417.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/23/Chickpeas_Plant.jpg/250px-Chickpeas_Plant.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/Ceratonia_siliqua_Keciboynuzu_1370984_Nevit.jpg/250px-Ceratonia_siliqua_Keciboynuzu_1370984_Nevit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e5/Glycyrrhiza_glabra_inflorescence.jpg/250px-Glycyrrhiza_glabra_inflorescence.jpg","https://upload.wikimedia.org/wikipedia/commons/7/77/Tamarindus_indica_flower_in_Hyderabad_W_IMG_8905.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Dialium_schlechteri00.jpg/330px-Dialium_schlechteri00.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2e/Quillaja_saponaria_2c.JPG/250px-Quillaja_saponaria_2c.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a5/Securidaca_longipedunculata_MS_1933.JPG/330px-Securidaca_longipedunculata_MS_1933.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/40/Polygala_amara_a1.jpg/330px-Polygala_amara_a1.jpg"],"card":4},{"name":"Rosales","parent":"Fabids","rank":"Order","ipa":"","common":["roses","strawberries","blackberries","raspberries","apples","pears","plums","peaches","apricots","almonds","elms","figs","mulberries","nettles","hops","cannabis"],"tag":"A eudicot order necessarily including the rose family, Rosaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/Cannabis_01_bgiu.jpg/330px-Cannabis_01_bgiu.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3a/Hippophae_rhamnoides-01_%28xndr%29.JPG/250px-Hippophae_rhamnoides-01_%28xndr%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/89/Alb-Z._jujuba-fruit-2.jpg/250px-Alb-Z._jujuba-fruit-2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6b/Pilea_pumila2.JPG/330px-Pilea_pumila2.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/23/-2020-09-23_Blackberrys%2C_Coast_Path%2C_Trimingham.JPG/330px--2020-09-23_Blackberrys%2C_Coast_Path%2C_Trimingham.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1f/A_close-up_of_climbing_roses.jpg/330px-A_close-up_of_climbing_roses.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/57/Fr%C3%BChling_bl%C3%BChender_Kirschenbaum.jpg/330px-Fr%C3%BChling_bl%C3%BChender_Kirschenbaum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/03/Lyonothamnusfloribundusasp.jpg/330px-Lyonothamnusfloribundusasp.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/82/Flowering_crabapple_in_Washington_DC.jpg/330px-Flowering_crabapple_in_Washington_DC.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Sorbaria_grandiflora_-_Fleurs-2.jpg/330px-Sorbaria_grandiflora_-_Fleurs-2.jpg"],"card":4},{"name":"Fagales","parent":"Fabids","rank":"Order","ipa":"","common":["beeches","chestnuts","oaks","walnut","pecan","hickory","birches","alders","hazels","hornbeams","she-oaks","southern beeches"],"tag":"A eudicot order necessarily including the beech family, Fagus.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/Mountain_Beech.jpg/500px-Mountain_Beech.jpg","https://upload.wikimedia.org/wikipedia/commons/d/d6/Myrica_faya.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9d/Juglans_regia_Broadview.jpg/506px-Juglans_regia_Broadview.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/ba/Fagus_sylvatica_Purpurea_JPG4a.jpg/330px-Fagus_sylvatica_Purpurea_JPG4a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/17/Fagus_sylvatica_019.jpg/250px-Fagus_sylvatica_019.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Casuarina_equisetifolia_0004.jpg/330px-Casuarina_equisetifolia_0004.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Gymnostoma_poissonianum_%28Scott_Zona%29_002.jpg/250px-Gymnostoma_poissonianum_%28Scott_Zona%29_002.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4c/Catkins_Corylus_avellana-Mont_Bart-5124~2015_12_26.JPG/330px-Catkins_Corylus_avellana-Mont_Bart-5124~2015_12_26.JPG"],"card":4},{"name":"Cucurbitales","parent":"Fabids","rank":"Order","ipa":"","common":["squash","pumpkins","watermelons","cucumbers","melons"],"tag":"Includes the gourd family, Cucurbitaceae. Mostly comprised of annual vines with thick pointed petals, many species of which are cultivated for their fruit. Includes some parasitic plants.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/fc/Pilostyles_hamiltonii.jpg/330px-Pilostyles_hamiltonii.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c5/Begonia_pseudolubbersii.jpg/250px-Begonia_pseudolubbersii.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7d/Cyclanthera_pedata_z02.JPG/250px-Cyclanthera_pedata_z02.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8d/Xerosicyos_danguyi_2015-05-29_OB_187.jpg/250px-Xerosicyos_danguyi_2015-05-29_OB_187.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Datisca_cannabina.jpg/250px-Datisca_cannabina.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7d/Nilambur_teak_forest_3755_-Tetrameles_nudiflora.JPG/250px-Nilambur_teak_forest_3755_-Tetrameles_nudiflora.JPG"],"card":4},{"name":"Oxalidales","parent":"Fabids","rank":"Order","ipa":"","common":["starfruit"],"tag":"Includes the wood sorrel family, Oxalidaceae. Also includes some carniverous pitcher plants.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Connarus_paniculatus_13.JPG/330px-Connarus_paniculatus_13.JPG","https://upload.wikimedia.org/wikipedia/commons/3/33/Eucryphia.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/62/Averrhoa_carambola_ARS_k5735-7.jpg/250px-Averrhoa_carambola_ARS_k5735-7.jpg","https://upload.wikimedia.org/wikipedia/commons/a/af/Crinodendron_hookerianum1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6e/Cephalotus_follicularis_0001.JPG/250px-Cephalotus_follicularis_0001.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Brunellia_comocladifolia_1.JPG/330px-Brunellia_comocladifolia_1.JPG"],"card":4},{"name":"Malpighiales","parent":"Fabids","rank":"Order","ipa":"","common":["willows","violets","aspens","poplars","poinsettia","corpse flower","coca plant","cassava","flaxseed","castor bean","Saint John's wort","passionfruit","mangosteen","manchineel tree"],"tag":"A eudicot order with the type genus Malpighia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/92/Hippomane_mancinella_%28fruit%29.jpg/330px-Hippomane_mancinella_%28fruit%29.jpg","https://upload.wikimedia.org/wikipedia/commons/9/91/Passiflora_edulis_forma_flavicarpa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/%28MHNT%29_Hypericum_perforatum_flower_and_buttons.jpg/250px-%28MHNT%29_Hypericum_perforatum_flower_and_buttons.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0b/Castor_bean_young_with_teething_leaves.jpg/330px-Castor_bean_young_with_teething_leaves.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6b/Flax_flowers.jpg/330px-Flax_flowers.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Cassava1_%283945716612%29.jpg/330px-Cassava1_%283945716612%29.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c7/Erythroxylum_novogranatense_var._Novogranatense_%28retouched%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dd/Rafflesia_arnoldii%2C_Sumatra.jpg/250px-Rafflesia_arnoldii%2C_Sumatra.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b9/Euphorbia_pulcherrima_Blanco1.167-cropped.jpg/330px-Euphorbia_pulcherrima_Blanco1.167-cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a8/Fall_Colors_at_Kebler_Pass%2C_Colorado_USA.JPG/330px-Fall_Colors_at_Kebler_Pass%2C_Colorado_USA.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Viola_pedata.jpg/250px-Viola_pedata.jpg","https://upload.wikimedia.org/wikipedia/commons/0/00/Salix_alba_Morton.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Malpighia_glabra_blossom_and_fruit.jpg/330px-Malpighia_glabra_blossom_and_fruit.jpg"],"card":4},{"name":"Celastrales","parent":"Fabids","rank":"Order","ipa":"","common":["staff-vine","bittersweet"],"tag":"Includes the staff-vine family, Celastraceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/41/Ruptiliocarpon_caracolito_1zz.jpg/330px-Ruptiliocarpon_caracolito_1zz.jpg","https://upload.wikimedia.org/wikipedia/commons/3/36/DwNorthernGrassofParnassus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Mait%C3%A9n.JPG/250px-Mait%C3%A9n.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0b/Celastrus_scandens.jpg/250px-Celastrus_scandens.jpg"],"card":4},{"name":"Zygophyllales","parent":"Fabids","rank":"Order","ipa":"","common":["bean-caper","caltrop","creosote bush","rhatany"],"tag":"Includes the Zygophyllaceae family.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b2/Larrea_tridentata_1.jpg/330px-Larrea_tridentata_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b9/Starr_070727-7629_Guaiacum_officinale.jpg/330px-Starr_070727-7629_Guaiacum_officinale.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/Seetzenia_orientalis_kz02.jpg/330px-Seetzenia_orientalis_kz02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/16/Zygophyllum_fontanesii_03.JPG/250px-Zygophyllum_fontanesii_03.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b5/Zygophyllum_sp._flower.jpg/250px-Zygophyllum_sp._flower.jpg"],"card":4},{"name":"Malvids","parent":"Rosids","rank":"Clade","ipa":"","common":[],"tag":"","imgs":[],"card":3},{"name":"Geraniales","parent":"Malvids","rank":"Order","ipa":"","common":["geraniums","stork's-bills","honey flowers"],"tag":"The type genus are the true geraniums, Geranium.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/85/Geranium-pratense-070706-800-1.jpg/330px-Geranium-pratense-070706-800-1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Geraniaceae.jpg/330px-Geraniaceae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/ff/Francoa_sonchifolia_form.jpg/250px-Francoa_sonchifolia_form.jpg"],"card":5},{"name":"Myrtales","parent":"Malvids","rank":"Order","ipa":"","common":["myrtle","pōhutukawa","bay rum tree","clove","guava","acca","allspice","eucalyptus","crape myrtles","henna tree","pomegranate","water caltrop","loosestrifes","cigar plants","evening primroses","fuchsias","willowherbs","white mangrove","leadwood tree","African birch","Koster's curse","velvet tree"],"tag":"Includes the myrtle family, Myrtaceae","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c9/Alzatea_verticillata_imported_from_iNaturalist_photo_173522367_on_27_January_2022.jpg/250px-Alzatea_verticillata_imported_from_iNaturalist_photo_173522367_on_27_January_2022.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/Combretum_constrictum3.jpg/330px-Combretum_constrictum3.jpg","https://upload.wikimedia.org/wikipedia/commons/0/02/Purple_loosestrife.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e6/Punica_granatum_004.JPG/330px-Punica_granatum_004.JPG","https://upload.wikimedia.org/wikipedia/commons/e/e1/Trapa_natans0.jpg","https://upload.wikimedia.org/wikipedia/commons/8/8a/Chamerion.latifolium.web.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/Starr_080304-3229_Myrtus_communis.jpg/330px-Starr_080304-3229_Myrtus_communis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c5/MetrosiderosAK.jpg/330px-MetrosiderosAK.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/The_flowers_of_clove_tree_in_Pemba_island.JPG/330px-The_flowers_of_clove_tree_in_Pemba_island.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/Guava_fruit_tree.jpg/250px-Guava_fruit_tree.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/65/Eucalyptus_leucoxylon1.jpg/250px-Eucalyptus_leucoxylon1.jpg","https://upload.wikimedia.org/wikipedia/commons/a/a3/Eucalyptus_deglupta-trees.jpg"],"card":5},{"name":"Crossosomatales","parent":"Malvids","rank":"Order","ipa":"","common":["guyalone","bladdernut trees"],"tag":"Includes the family Crossosomataceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/fb/Geissoloma_Lignaut_2.jpg/330px-Geissoloma_Lignaut_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f9/Geissoloma_Lignaut_1.jpg/250px-Geissoloma_Lignaut_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Aphloia_theiformis_1DS-II_8649.jpg/250px-Aphloia_theiformis_1DS-II_8649.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/af/Stachyurus_praecox3.jpg/250px-Stachyurus_praecox3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Staphylea_colchica.jpg/330px-Staphylea_colchica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Ixerba_brexioides.jpg/330px-Ixerba_brexioides.jpg"],"card":5},{"name":"Picramniales","parent":"Malvids","rank":"Order","ipa":"","common":[],"tag":"Includes the bitterbush genus, Picramnia.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/ba/Alvaradoa_amorphoides-leaves-fruit.jpg/250px-Alvaradoa_amorphoides-leaves-fruit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/Picramnia_glazioviana_Engl._%288560606574%29.jpg/330px-Picramnia_glazioviana_Engl._%288560606574%29.jpg"],"card":5},{"name":"Malvales","parent":"Malvids","rank":"Order","ipa":"","common":["balsa trees","basswood trees","cacao trees","daphnes","hibiscus","hollyhocks","okra","jute","baobab trees","cotton","kapok","durian"],"tag":"Includes the mallows family, Malvaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Matadecacao.jpg/250px-Matadecacao.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a6/Balso_%28Ochroma_pyramidale%29_%2814723405443%29.jpg/330px-Balso_%28Ochroma_pyramidale%29_%2814723405443%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/84/Durio_Zibethinus_Van_Nooten.jpg/250px-Durio_Zibethinus_Van_Nooten.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e7/Bombax_ceiba_Flower_in_Lantau_island%2C_Hong_Kong.JPG/330px-Bombax_ceiba_Flower_in_Lantau_island%2C_Hong_Kong.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f8/Cotton_plant%2C_Ware_County%2C_GA%2C_US.jpg/330px-Cotton_plant%2C_Ware_County%2C_GA%2C_US.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a8/Adansonia_grandidieri04.jpg/250px-Adansonia_grandidieri04.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/95/Hong_Kong_Okra_Aug_25_2012.JPG/330px-Hong_Kong_Okra_Aug_25_2012.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Hibiscus_flower_uploaded_by_Vijayanrajapuram_02.jpg/250px-Hibiscus_flower_uploaded_by_Vijayanrajapuram_02.jpg","https://upload.wikimedia.org/wikipedia/commons/7/72/Daphne_philippi1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fd/Thymelaea_hirsuta_kz2.jpg/330px-Thymelaea_hirsuta_kz2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Leptolaena_multiflora.jpg/250px-Leptolaena_multiflora.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0b/Grielum_humifusum1.jpg/330px-Grielum_humifusum1.jpg","https://upload.wikimedia.org/wikipedia/commons/c/cb/Munting_calab_070609_214_ipb.jpg","https://upload.wikimedia.org/wikipedia/commons/0/00/Bixa_bluete.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c3/Cistus_incanus_2004.jpg","https://upload.wikimedia.org/wikipedia/commons/0/07/Cytinus_hypocistis06052003_1.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Malva_sylvestris3.jpg/250px-Malva_sylvestris3.jpg"],"card":5},{"name":"Brassicales","parent":"Malvids","rank":"Order","ipa":"","common":["cabbage","cauliflower","Brussels sprout","broccoli","kale","mustard","turnip","bok choy","rapeseed","radish","horseradish","caper","papaya","turtleweed"],"tag":"Includes the mustard and cabbage family, Brassicaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/70/Yellow_and_red_Tropaeolum_majus_%28Garden_nasturtium%29.jpg/330px-Yellow_and_red_Tropaeolum_majus_%28Garden_nasturtium%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Tovaria_pendula_03.jpg/250px-Tovaria_pendula_03.jpg","https://upload.wikimedia.org/wikipedia/commons/2/2a/Tiganophyton_karasense_Photo_474711747%2C_no_rights_reserved.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Peelo_10.jpg/330px-Peelo_10.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Moringa_ovalifolia.jpg/250px-Moringa_ovalifolia.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/Koeberlinia_spinosa_WikiPlant.jpg/330px-Koeberlinia_spinosa_WikiPlant.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Polanisia_erosa.jpg/330px-Polanisia_erosa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/84/Carica_papaya_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-029.jpg/250px-Carica_papaya_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-029.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1e/Capullito_capullito.JPG/330px-Capullito_capullito.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Arabidopsis_thaliana.jpg/250px-Arabidopsis_thaliana.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Radish_3371103037_4ab07db0bf_o.jpg/250px-Radish_3371103037_4ab07db0bf_o.jpg","https://upload.wikimedia.org/wikipedia/commons/6/6e/Reseda_lutea1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/11/Brassica_oleracea0.jpg/330px-Brassica_oleracea0.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/03/Smelowskia_americana_4859.JPG/250px-Smelowskia_americana_4859.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/LunariaAnnua1.jpg/250px-LunariaAnnua1.jpg","https://upload.wikimedia.org/wikipedia/commons/0/00/Batis_maritima_male.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f7/Akania_bidwillii_leaves.jpg/500px-Akania_bidwillii_leaves.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/Limnanthes_douglasii_flowers.JPG/250px-Limnanthes_douglasii_flowers.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9a/Gyrostemon_ramulosis_habitus.jpg/330px-Gyrostemon_ramulosis_habitus.jpg"],"card":5},{"name":"Huerteales","parent":"Malvids","rank":"Order","ipa":"","common":[],"tag":"Woody eudicots  with leaves that alternate and have toothed margins. The inflorescence is cymose.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4f/Starr_020925-0042_Perrottetia_sandwicensis.jpg/330px-Starr_020925-0042_Perrottetia_sandwicensis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/73/Gerrardina_foliosa_1.jpg/250px-Gerrardina_foliosa_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d9/Tapiscia_sinensis_01.jpg/330px-Tapiscia_sinensis_01.jpg"],"card":5},{"name":"Sapindales","parent":"Malvids","rank":"Order","ipa":"","common":["citrus","maples","horse-chestnuts","lychees","rambutans","mangos","cashews","frankincense","myrrh","mahogany","neem"],"tag":"Includes the soapberry family, Sapindaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/df/Starr-170913-0143-Sapindus_saponaria-fruit-CTAHR_Urban_Garden_Center_Pearl_City-Oahu_-_Flickr_-_Starr_Environmental.jpg/330px-Starr-170913-0143-Sapindus_saponaria-fruit-CTAHR_Urban_Garden_Center_Pearl_City-Oahu_-_Flickr_-_Starr_Environmental.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Die_Weinraute%2C_lat._Ruta_graveolens%2C_Bl%C3%BCten.jpg/330px-Die_Weinraute%2C_lat._Ruta_graveolens%2C_Bl%C3%BCten.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Nitraria_billardierei_%288729570925%29.jpg/250px-Nitraria_billardierei_%288729570925%29.jpg","https://upload.wikimedia.org/wikipedia/commons/8/89/Palo_mulato.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/28/Cashewnuts_hanging_on_a_Cashew_Tree.jpg/330px-Cashewnuts_hanging_on_a_Cashew_Tree.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/MangoImmatureFruits.JPG/250px-MangoImmatureFruits.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/Poison_ivy_in_May_beside_Appalachian_Trail_in_Rockfish_Gap_VA_area_1.jpg/250px-Poison_ivy_in_May_beside_Appalachian_Trail_in_Rockfish_Gap_VA_area_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3d/Toxicodendron_pubescens.jpg/330px-Toxicodendron_pubescens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/860631-Pistachio-IMG_6862-2.jpg/330px-860631-Pistachio-IMG_6862-2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/89/Acer_palmatum_sango_kaku.jpg/330px-Acer_palmatum_sango_kaku.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a5/Lychee.jpg/330px-Lychee.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/Acer_saccharum.jpg/250px-Acer_saccharum.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b0/OrangeBloss_wb.jpg","https://upload.wikimedia.org/wikipedia/commons/a/af/%D7%90%D7%A4%D7%A8%D7%A1%D7%9E%D7%95%D7%9F2.jpg","https://upload.wikimedia.org/wikipedia/commons/5/59/Big-leaved_Mahogany.jpg"],"card":5},{"name":"Superasterids","parent":"Core eudicots","rank":"Clade","ipa":"","common":[],"tag":"","imgs":[],"card":2},{"name":"Berberidopsidales","parent":"Superasterids","rank":"Order","ipa":"","common":["olivillo"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/b/bb/Aextoxicon_punctatum_flor_femenina_-_Flickr_-_Pato_Novoa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d1/Aextoxicon_punctatum_%2853136865463%29.jpg/250px-Aextoxicon_punctatum_%2853136865463%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/df/Vine_near_the_skywalk_Dorrigo_National_Park.jpg/330px-Vine_near_the_skywalk_Dorrigo_National_Park.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b9/Streptothamnus_moorei.jpg/330px-Streptothamnus_moorei.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Aetoxicon8.jpg/250px-Aetoxicon8.jpg"],"card":6},{"name":"Santalales","parent":"Superasterids","rank":"Order","ipa":"","common":["sandalwoods","many mistletoes"],"tag":"its type genus, Santalum (sandalwood)","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/Starr_041006-0222_Santalum_haleakalae.jpg/330px-Starr_041006-0222_Santalum_haleakalae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Viscum_minimum2_ies.jpg/330px-Viscum_minimum2_ies.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c5/Mistletoe_in_White_Poplar_1.jpg/250px-Mistletoe_in_White_Poplar_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7f/SantalumAlbumLeaf.jpg/330px-SantalumAlbumLeaf.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bd/%E6%AA%80%E9%A6%99_Santalum_album_20210712091332_04.jpg/250px-%E6%AA%80%E9%A6%99_Santalum_album_20210712091332_04.jpg"],"card":6},{"name":"Caryophyllales","parent":"Superasterids","rank":"Order","ipa":"","common":["cacti","carnations","beets","quinoa","spinach","amaranths","pigfaces","oraches","saltbushes","goosefoots","sundews","Venus flytraps","monkey cup pitcher plants","Malabar spinach","bougainvilleas","four o'clock flowers","buckwheat","knotweeds","rhubarb","sorrel","portulacas","jojoba","tamarisks"],"tag":"Includes the carnation family, Caryophyllaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/9/99/Cardon_Pachycereus_pringlei.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/de/Rhipsalis_paradoxa.jpg/250px-Rhipsalis_paradoxa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/Dianthus_caryophyllus_L_%28Clove_pink%29.JPG/330px-Dianthus_caryophyllus_L_%28Clove_pink%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Beta_vulgaris_subsp_maritima_89-08.JPG/330px-Beta_vulgaris_subsp_maritima_89-08.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/Reismelde.jpg/250px-Reismelde.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/37/Spinacia_oleracea_Spinazie_bloeiend.jpg/250px-Spinacia_oleracea_Spinazie_bloeiend.jpg","https://upload.wikimedia.org/wikipedia/commons/9/91/Amaranthus_tricolor0.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/Mesembryanthemum_crystallinum.JPG/330px-Mesembryanthemum_crystallinum.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/61/Atriplex_nummularia.JPG/330px-Atriplex_nummularia.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/77/Chenopodium_berlandieri_NPS-1.jpg/250px-Chenopodium_berlandieri_NPS-1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Drosera_spatulata_KansaiHabit.jpg/330px-Drosera_spatulata_KansaiHabit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/37/Venus_Flytrap_showing_trigger_hairs.jpg/250px-Venus_Flytrap_showing_trigger_hairs.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/11/Nepenthes_peltata.jpg/250px-Nepenthes_peltata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Pink_paperflowers_%28Bougainvillea_glabra%29.jpg/330px-Pink_paperflowers_%28Bougainvillea_glabra%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/63/Gul-Abas-4-O%27clock_plant.JPG/330px-Gul-Abas-4-O%27clock_plant.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a7/Japanese_Buckwheat_Flower.JPG/330px-Japanese_Buckwheat_Flower.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2b/Rheum_rhabarbarum.2006-04-27.uellue.jpg/330px-Rheum_rhabarbarum.2006-04-27.uellue.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/%28MHNT%29_Rumex_acetosa_-_Habit.jpg/330px-%28MHNT%29_Rumex_acetosa_-_Habit.jpg"],"card":6},{"name":"Asterids","parent":"Superasterids","rank":"Clade","ipa":"","common":[],"tag":"","imgs":[],"card":6},{"name":"Cornales","parent":"Asterids","rank":"Order","ipa":"","common":["Assegai trees","happy trees","dove trees"],"tag":"Includes the dogwood family, Cornaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/00/Cornus_suecica_Ume_River.jpg/330px-Cornus_suecica_Ume_River.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Curtisia_dentata_-_Assegai_tree_-_Table_Mountain_6.JPG/250px-Curtisia_dentata_-_Assegai_tree_-_Table_Mountain_6.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/Grubbia_tomentosa_58439387.jpg/250px-Grubbia_tomentosa_58439387.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bf/Caiophora.jpg/330px-Caiophora.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Davidia_involucrata_flowering_branch.jpg/330px-Davidia_involucrata_flowering_branch.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/Hydrangea_macrophylla_-_Bigleaf_hydrangea2.jpg/250px-Hydrangea_macrophylla_-_Bigleaf_hydrangea2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/94/Fendlera_rupicola_var._rupicola_%2819362832713%29.jpg/330px-Fendlera_rupicola_var._rupicola_%2819362832713%29.jpg"],"card":7},{"name":"Ericales","parent":"Asterids","rank":"Order","ipa":"","common":["camellias","persimmon","ebony","blueberry","cranberry","lingonberry","huckleberry","kiwifruit","Brazil nut","argan","sapote","azaleas","rhododendrons","heather","heath","impatiens","phlox","Jacob's ladder","primroses","cyclamens","shea","sapodilla","pouterias","trumpet pitchers"],"tag":"Includes the heather family, Ericaceae","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Camellia_sasanqua1JAM343.jpg/330px-Camellia_sasanqua1JAM343.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Diospyros_whyteana_IMG_2651.JPG/250px-Diospyros_whyteana_IMG_2651.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/54/Daboecia_cantabrica1373917974.jpg/330px-Daboecia_cantabrica1373917974.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/00/%E0%B4%B8%E0%B4%AA%E0%B5%8D%E0%B4%AA%E0%B5%8B%E0%B4%9F%E0%B5%8D%E0%B4%9F.jpg/330px-%E0%B4%B8%E0%B4%AA%E0%B5%8D%E0%B4%AA%E0%B5%8B%E0%B4%9F%E0%B5%8D%E0%B4%9F.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2e/Sarracenia_purpurea_pitchers_Brown%27s_Lake_Bog.JPG/250px-Sarracenia_purpurea_pitchers_Brown%27s_Lake_Bog.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0c/Vitellaria_paradoxa_MS_6563.JPG/330px-Vitellaria_paradoxa_MS_6563.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/d/de/Wild_cyclamens.jpg/330px-Wild_cyclamens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Polemonium_reptans_2009.jpg/330px-Polemonium_reptans_2009.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Phlox_Paniculata.jpg/330px-Phlox_Paniculata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/34/Impatiens_scapiflora.jpg/330px-Impatiens_scapiflora.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Leptecophylla_juniperina.jpg/250px-Leptecophylla_juniperina.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/CallunaVulgaris.jpg/330px-CallunaVulgaris.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e0/Alpenroos.jpg/330px-Alpenroos.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8f/George_Taber_azalea.jpg/330px-George_Taber_azalea.jpg","https://upload.wikimedia.org/wikipedia/commons/3/3c/Bog_huckleberry.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3a/Cranberry_bog.jpg/330px-Cranberry_bog.jpg"],"card":7},{"name":"Campanulids","parent":"Asterids","rank":"Clade","ipa":"","common":[],"tag":"","imgs":[],"card":7},{"name":"Aquifoliales","parent":"Campanulids","rank":"Order","ipa":"","common":["holly"],"tag":"A eudicot order that includes the holly family, Aquifoliaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/Ilex-aquifolium_%28Europaeische_Stechpalme-1%29.jpg/330px-Ilex-aquifolium_%28Europaeische_Stechpalme-1%29.jpg","https://upload.wikimedia.org/wikipedia/commons/9/9e/Citronella_moorei_juvenile2.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/Helwingia_japonica_m.jpg/330px-Helwingia_japonica_m.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/96/Helwingia_japonica_%28fruits_s4%29.jpg/250px-Helwingia_japonica_%28fruits_s4%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Gomphandra_australiana.jpg/250px-Gomphandra_australiana.jpg"],"card":8},{"name":"Asterales","parent":"Campanulids","rank":"Order","ipa":"ˌæstəˈreɪliːz","common":["lettuces","sunflowers","artichokes","pot marigold","coneflowers","daisies","fleabane","chrysanthemums","dahlias","zinnias","heleniums","yarrow"],"tag":"an order of dicotyledonous flowering plants that includes the large family Asteraceae known for composite flowers made of florets, and related families. One has evolved to be similar to the water lilies.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a9/A_sunflower.jpg/250px-A_sunflower.jpg","https://upload.wikimedia.org/wikipedia/commons/6/6f/Wittsteinia_vaccinacea.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/47/Corokia_virgata.jpg/330px-Corokia_virgata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f3/Calycera_calcitrapa%2C_Calyceraceae_%288639683617%29.jpg/330px-Calycera_calcitrapa%2C_Calyceraceae_%288639683617%29.jpg","https://upload.wikimedia.org/wikipedia/commons/d/de/Campanula_cespitosa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5e/Nymphoides_ezannoi_%28aka%29.jpg/250px-Nymphoides_ezannoi_%28aka%29.jpg","https://upload.wikimedia.org/wikipedia/commons/6/63/Abrophyllum_ornans_Elvina_Bay.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/95/Cuttsia_viburnea_2329.jpg/330px-Cuttsia_viburnea_2329.jpg","https://upload.wikimedia.org/wikipedia/commons/0/01/Stylidium_amoenum_gdaywa1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6d/Artichoke_J1.jpg/250px-Artichoke_J1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Lactuca_tuberosa_2.jpg/250px-Lactuca_tuberosa_2.jpg"],"card":8},{"name":"Escalloniales","parent":"Campanulids","rank":"Order","ipa":"","common":[],"tag":"A eudicot order that includes the Escalloniaceae family.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/Starr_050817-3953_Escallonia_rubra_var._macrantha.jpg/330px-Starr_050817-3953_Escallonia_rubra_var._macrantha.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/15/Anopterus_macleayanus.jpg/330px-Anopterus_macleayanus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/00/Eremosyne_pectinata_-_Flickr_-_Kevin_Thiele_%281%29.jpg/250px-Eremosyne_pectinata_-_Flickr_-_Kevin_Thiele_%281%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/25/Escallonia-virgata-close.jpg/330px-Escallonia-virgata-close.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/71/Forgesia_racemosa.JPG/330px-Forgesia_racemosa.JPG","https://upload.wikimedia.org/wikipedia/commons/8/84/Polyosma_cunninghamii_at_Mount_Banda_Banda.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f7/Tribeles_australis_342571777.jpg/250px-Tribeles_australis_342571777.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Valdivia_gayana_imported_from_iNaturalist_photo_111498848_on_20_September_2023.jpg/250px-Valdivia_gayana_imported_from_iNaturalist_photo_111498848_on_20_September_2023.jpg"],"card":8},{"name":"Bruniales","parent":"Campanulids","rank":"Order","ipa":"","common":[],"tag":"A eudicot order that includes the Bruniaceae family.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/27/Berzelia_lanuginosa_2.jpg/330px-Berzelia_lanuginosa_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f1/Audouinia_capitata_1DS-II_1-8839.jpg/330px-Audouinia_capitata_1DS-II_1-8839.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Brunia20090406_19.jpg/330px-Brunia20090406_19.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Desfontainia_spinosa.jpg/250px-Desfontainia_spinosa.jpg"],"card":8},{"name":"Apiales","parent":"Campanulids","rank":"Order","ipa":"","common":["carrots","celery","coriander","parsley","parsnips","poison hemlock","ginseng","ivies","pittosporums"],"tag":"An order of eudicots with the type being the carrot family, Apiaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/2/23/Aralia_elata_en_fleur4081.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/Griselinia_littoralis.jpg/250px-Griselinia_littoralis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/ba/Pennantiacorymbosa2.jpg/330px-Pennantiacorymbosa2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a9/Starr_051004-4689_Pittosporum_confertiflorum.jpg/330px-Starr_051004-4689_Pittosporum_confertiflorum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/93/Toricellia_angulata_var._intermedia_-_Kunming_Botanical_Garden_-_DSC02765.JPG/250px-Toricellia_angulata_var._intermedia_-_Kunming_Botanical_Garden_-_DSC02765.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/Vegetable-Carrot-Bundle-wStalks.jpg/330px-Vegetable-Carrot-Bundle-wStalks.jpg","https://upload.wikimedia.org/wikipedia/commons/1/13/Coriandrum_sativum_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-193.jpg","https://upload.wikimedia.org/wikipedia/commons/c/c2/Conium_maculatum_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-191.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/ad/Ginsengpflanze.jpg/250px-Ginsengpflanze.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d7/Hedera_algeriensis_kz01.jpg/330px-Hedera_algeriensis_kz01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Pittosporum_heterophyllum.jpg/330px-Pittosporum_heterophyllum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ef/Umbella.jpg/330px-Umbella.jpg"],"card":8},{"name":"Dipsacales","parent":"Campanulids","rank":"Order","ipa":"","common":["honeysuckle","elderflowers","elderberrie","viburnum","valerian"],"tag":"Includes the teasel genus, Dipsacus.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/Adoxa_moschatellina01.jpg/250px-Adoxa_moschatellina01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a9/Sambucus-berries.jpg/330px-Sambucus-berries.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fe/Viburnum_opulus_C.jpg/330px-Viburnum_opulus_C.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b2/Honeysuckle_w_y.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/df/Cephalaria_gigantea_2.jpg/250px-Cephalaria_gigantea_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8d/Dipsacus_fullonum1.jpg/250px-Dipsacus_fullonum1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7e/Dipsacus_pilosus01.jpg/330px-Dipsacus_pilosus01.jpg","https://upload.wikimedia.org/wikipedia/commons/2/26/Sambucus_canadensis_W2_IMG_3144.jpg"],"card":8},{"name":"Paracryphiales","parent":"Campanulids","rank":"Order","ipa":"possumwood","common":[],"tag":"A eudicot order that includes the Paracryphia family.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b5/Quintinia_sieberi.jpg/330px-Quintinia_sieberi.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/64/Small_tree_Banda_Banda.jpg/250px-Small_tree_Banda_Banda.jpg"],"card":8},{"name":"Lamiids","parent":"Asterids","rank":"Clade","ipa":"","common":[],"tag":"","imgs":[],"card":7},{"name":"Solanales","parent":"Lamiids","rank":"Order","ipa":"","common":["potatoes","eggplants","tomatoes","chili peppers","tobacco","petunias","nightshades","morning glory","sweet potato"],"tag":"A eudicot order that includes the nightshades family, Solanaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/a/a7/Potato_plants.jpg/330px-Potato_plants.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/76/Solanum_melongena_24_08_2012_%281%29.JPG/250px-Solanum_melongena_24_08_2012_%281%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Tomato_flower_and_young_fruit.jpg/330px-Tomato_flower_and_young_fruit.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/32/Thai_peppers.jpg/330px-Thai_peppers.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/78/Native_American_tobacco_flower.jpg/250px-Native_American_tobacco_flower.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fb/Petunia_exserta_by_Scott_Zona_-_004_%281%29.jpg/330px-Petunia_exserta_by_Scott_Zona_-_004_%281%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e1/Illustration_Solanum_dulcamara0_clean.png/250px-Illustration_Solanum_dulcamara0_clean.png","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Genasu_gadde_%28Kannada_%E0%B2%97%E0%B3%86%E0%B2%A3%E0%B2%B8%E0%B3%81_%E0%B2%97%E0%B2%A1%E0%B3%8D%E0%B2%A1%E0%B3%86%29_%2849108875711%29.jpg/330px-Genasu_gadde_%28Kannada_%E0%B2%97%E0%B3%86%E0%B2%A3%E0%B2%B8%E0%B3%81_%E0%B2%97%E0%B2%A1%E0%B3%8D%E0%B2%A1%E0%B3%86%29_%2849108875711%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d7/RMM_475_Montiniaceae-Kaliphoraceae_Grevea_madagascariensis_Baill._Maintirano%2C_Phot._PG_04_03_08_IMG_3060.JPG/330px-RMM_475_Montiniaceae-Kaliphoraceae_Grevea_madagascariensis_Baill._Maintirano%2C_Phot._PG_04_03_08_IMG_3060.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/4/47/Hydrolea_ovata_Arkansas.jpg/330px-Hydrolea_ovata_Arkansas.jpg"],"card":9},{"name":"Lamiales","parent":"Lamiids","rank":"Order","ipa":"","common":["basil","mint","rosemary","sage","savory","marjoram","oregano","hyssop","thyme","lavender","perilla","lemon verbena","catnip","bee balm","wild dagga","oriental motherwort","olives","ash trees","teak","foxgloves","lilacs","jasmine","snapdragons","African violets","Jacarandas","Paulownias","butterfly bushes","sesame","psyllium","bladderworts"],"tag":"A eudicot order that includes the mint / sage family, Lamiaceae. Includes some carnivorous and protocarnivorous plants.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/72/Pfefferminze_natur_peppermint.jpg/330px-Pfefferminze_natur_peppermint.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a3/Rosemary_in_bloom.JPG/330px-Rosemary_in_bloom.JPG","https://upload.wikimedia.org/wikipedia/commons/5/5a/Salvia_officinalis0.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5c/Origanum_majorana_002.JPG/250px-Origanum_majorana_002.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/1/14/Origanum_vulgare_-_harilik_pune.jpg/250px-Origanum_vulgare_-_harilik_pune.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/91/Variegated_Lemon_Thyme_Thymus_citriodorus_variegata_Leaves_3264px.JPG/330px-Variegated_Lemon_Thyme_Thymus_citriodorus_variegata_Leaves_3264px.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9b/Lavandula_fields.jpg/330px-Lavandula_fields.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0b/Catnip_flowers.jpg/330px-Catnip_flowers.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6e/Monarda_didyma_00.jpg/250px-Monarda_didyma_00.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5d/Leonotis_leonurus_flower.jpg/250px-Leonotis_leonurus_flower.jpg","https://upload.wikimedia.org/wikipedia/commons/1/16/Olea_europaea_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-229.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e4/Nilambur_Teak_Plantation_0666.jpg/250px-Nilambur_Teak_Plantation_0666.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/74/Digitalis_purpurea2.jpg/250px-Digitalis_purpurea2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/79/Lilac.head.600pix.jpg/250px-Lilac.head.600pix.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/Jasmine_.jpg/330px-Jasmine_.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f5/Antirrhinum_tortuosum_2601.jpg/330px-Antirrhinum_tortuosum_2601.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/2007-04-20Saintpaulia_ionantha03.jpg/330px-2007-04-20Saintpaulia_ionantha03.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/6e/Jacaranda255.jpg/330px-Jacaranda255.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d1/Genlisea_subglabra_Darwiniana.jpg/330px-Genlisea_subglabra_Darwiniana.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bd/Pinguicula_moranensis.jpg/330px-Pinguicula_moranensis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3b/Uk_pond_bladderwort2.jpg/330px-Uk_pond_bladderwort2.jpg"],"card":9},{"name":"Vahliales","parent":"Lamiids","rank":"Order","ipa":"","common":[],"tag":"A eudicot order that includes the Vahliaceae family.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Vahlia_capensis_2.jpg/250px-Vahlia_capensis_2.jpg"],"card":9},{"name":"Gentianales","parent":"Lamiids","rank":"Order","ipa":"","common":["oleander","dogbanes","milkweeds","periwinkles","coffee"],"tag":"A eudicot order that includes the Gentianaceae family.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/2a/Pachypodium_lamerei_01.jpg/250px-Pachypodium_lamerei_01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/72/PachypodiumLamerei.jpg/250px-PachypodiumLamerei.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/06/Gelsemium_elegans_107560597.jpg/330px-Gelsemium_elegans_107560597.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a6/GentianaAcaulisRannoch.jpg/250px-GentianaAcaulisRannoch.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/66/Strychnos_nux-vomica_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-266.jpg/250px-Strychnos_nux-vomica_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-266.jpg","https://upload.wikimedia.org/wikipedia/commons/6/66/Cinchona.pubescens01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c7/Coffee_Flowers.JPG/330px-Coffee_Flowers.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/CoffeeBerry.jpg/330px-CoffeeBerry.jpg"],"card":9},{"name":"Boraginales","parent":"Lamiids","rank":"Order","ipa":"","common":["alkanet","borage","comfrey","fiddleneck","forget-me-not","geigertree","green alkanet","heliotrope","hound's tongue","lungwort","oysterplant","purple viper's bugloss/Salvation Jane","Siberian bugloss","viper's bugloss"],"tag":"A eudicot order that includes the forget-me-not family, Boraginaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/8d/Borago_officinalis%2C_two_blossoms.jpg/330px-Borago_officinalis%2C_two_blossoms.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d9/Amsinckia_eastwoodiae.jpg/330px-Amsinckia_eastwoodiae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/eb/Myosotis_arvensis_ois.JPG/330px-Myosotis_arvensis_ois.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a6/Scarlet_cordia.jpg/250px-Scarlet_cordia.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ee/CynoglossumOfficinale-bloem-kl.jpg/330px-CynoglossumOfficinale-bloem-kl.jpg","https://upload.wikimedia.org/wikipedia/commons/f/f2/Heliotropium_peruvianum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/Lungwort-oliv.jpg/330px-Lungwort-oliv.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/2b/Echium_plantagineum_flowers.JPG/330px-Echium_plantagineum_flowers.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/%28MHNT%29_Brunnera_macrophylla%2C_flowers_-_Les_Martels%2C_Giroussens_Tarn.jpg/250px-%28MHNT%29_Brunnera_macrophylla%2C_flowers_-_Les_Martels%2C_Giroussens_Tarn.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d4/Echium_vulgare_L.jpg/250px-Echium_vulgare_L.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/84/B._officinalis-flor-1.JPG/250px-B._officinalis-flor-1.JPG","https://upload.wikimedia.org/wikipedia/commons/2/23/Coldenia_procumbens_in_AP_W2_IMG_9943.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Cordia_subcordata%2C_habitat.jpg/330px-Cordia_subcordata%2C_habitat.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/af/Ehretia_dicksonii.jpg/330px-Ehretia_dicksonii.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/HELIOTROPIUM_EUROPAEUM_-_AGUDA_-_IB-323_%28Herba_berruguera%29.JPG/330px-HELIOTROPIUM_EUROPAEUM_-_AGUDA_-_IB-323_%28Herba_berruguera%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/89/Hydrophyllum_occidentale.jpg/250px-Hydrophyllum_occidentale.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/44/Pholismaarenarium.jpg/330px-Pholismaarenarium.jpg"],"card":9},{"name":"Garryales","parent":"Lamiids","rank":"Order","ipa":"","common":["silktassels"],"tag":"A eudicot order that includes the silktassels family, Garryaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/c/c5/Garrya_elliptica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/61/Garrya-sp.jpg/250px-Garrya-sp.jpg","https://upload.wikimedia.org/wikipedia/commons/9/93/Aucuba_japonica1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c6/Eucommia-ulmoides.JPG/330px-Eucommia-ulmoides.JPG"],"card":9},{"name":"Metteniusales","parent":"Lamiids","rank":"Order","ipa":"","common":[],"tag":"A eudicot order that includes the Metteniusaceae family.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Apodytes_dimidiata_tree_-_Cape_Town_77.jpg/250px-Apodytes_dimidiata_tree_-_Cape_Town_77.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f2/Calatola_columbiana_%2814216331560%29.jpg/250px-Calatola_columbiana_%2814216331560%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/58/Emmotum_nitens.jpg/330px-Emmotum_nitens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/fb/Metteniusa_tessmanniana_01.jpg/250px-Metteniusa_tessmanniana_01.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b9/Ottoschulzia_rhodoxylon.png"],"card":9},{"name":"Icacinales","parent":"Lamiids","rank":"Order","ipa":"","common":[],"tag":"A eudicot order that includes the white pear family, Icacinaceae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/Icacina_senegalensis_MS_4743.JPG/330px-Icacina_senegalensis_MS_4743.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/8/88/Amruta_%28Marathi-_%E0%A4%85%E0%A4%AE%E0%A5%83%E0%A4%A4%E0%A4%BE%29_%2815379062596%29.jpg/330px-Amruta_%28Marathi-_%E0%A4%85%E0%A4%AE%E0%A5%83%E0%A4%A4%E0%A4%BE%29_%2815379062596%29.jpg"],"card":9}],{},{"250px-(MHNT)_Brunnera_macrophylla,_flowers_-_Les_Martels,_Giroussens_Tarn.jpg":[250,322,"#4d5e26"],"250px-(MHNT)_Hypericum_perforatum_flower_and_buttons.jpg":[250,341,"#8e8942"],"250px-5206-Decaisnea_fargesii-20111103-hamburg.jpg":[250,333,"#8c855c"],"250px-A_sunflower.jpg":[250,333,"#615f1d"],"250px-Acer_saccharum.jpg":[250,333,"#719255"],"250px-Adansonia_grandidieri04.jpg":[250,333,"#9ba59f"],"250px-Adoxa_moschatellina01.jpg":[250,381,"#738449"],"250px-Aetoxicon8.jpg":[250,333,"#8f9973"],"250px-Aextoxicon_punctatum_(53136865463).jpg":[250,334,"#42502e"],"250px-Akebia_longeracemosa_(14168601575).jpg":[250,333,"#778f6b"],"250px-Alb-Z._jujuba-fruit-2.jpg":[250,333,"#67724d"],"250px-Alvaradoa_amorphoides-leaves-fruit.jpg":[250,269,"#96876b"],"250px-Alzatea_verticillata_imported_from_iNaturalist_photo_173522367_on_27_January_2022.jpg":[250,333,"#597d58"],"250px-Aphloia_theiformis_1DS-II_8649.jpg":[250,375,"#555c27"],"250px-Apodytes_dimidiata_tree_-_Cape_Town_77.jpg":[250,381,"#87917c"],"250px-Arabidopsis_thaliana.jpg":[250,347,"#9d9480"],"250px-Artichoke_J1.jpg":[250,339,"#587f2d"],"250px-Averrhoa_carambola_ARS_k5735-7.jpg":[250,374,"#4f6031"],"250px-B._officinalis-flor-1.JPG":[250,333,"#73816f"],"250px-Banksia_serrata_follicles.jpg":[250,324,"#9a9582"],"250px-Begonia_pseudolubbersii.jpg":[250,375,"#7c7465"],"250px-Blackcurrant_1.jpg":[250,333,"#868848"],"250px-Buxus_sempervirens.jpg":[250,395,"#69875b"],"250px-Calatola_columbiana_(14216331560).jpg":[250,333,"#6c7f78"],"250px-Carica_papaya_-_Köhler–s_Medizinal-Pflanzen-029.jpg":[250,353,"#bdc2a0"],"250px-Celastrus_scandens.jpg":[250,312,"#5b6f29"],"250px-Cephalaria_gigantea_2.jpg":[250,298,"#404c24"],"250px-Cephalotus_follicularis_0001.JPG":[250,333,"#604f42"],"250px-Ceratonia_siliqua_Keciboynuzu_1370984_Nevit.jpg":[250,333,"#728255"],"250px-Chenopodium_berlandieri_NPS-1.jpg":[250,333,"#6b6150"],"250px-Chickpeas_Plant.jpg":[250,395,"#4d4f2c"],"250px-Circaeaster_agrestis_7_Yunnan,_China_Photo_Magnus_Lidén.jpg":[250,259,"#828f49"],"250px-CopalmeDAmerique.jpg":[250,375,"#79716e"],"250px-Crassula_ovata_700.jpg":[250,352,"#747554"],"250px-Curtisia_dentata_-_Assegai_tree_-_Table_Mountain_6.JPG":[250,298,"#7d886f"],"250px-Cyclanthera_pedata_z02.JPG":[250,333,"#687b23"],"250px-Datisca_cannabina.jpg":[250,347,"#567d47"],"250px-Desfontainia_spinosa.jpg":[250,410,"#dbdbca"],"250px-Digitalis_purpurea2.jpg":[250,333,"#7b8a63"],"250px-Diospyros_whyteana_IMG_2651.JPG":[250,375,"#546f30"],"250px-Dipsacus_fullonum1.jpg":[250,348,"#64704e"],"250px-Durio_Zibethinus_Van_Nooten.jpg":[250,368,"#c4bca4"],"250px-Echium_vulgare_L.jpg":[250,375,"#78874e"],"250px-Eremosyne_pectinata_-_Flickr_-_Kevin_Thiele_(1).jpg":[250,284,"#212016"],"250px-Eucalyptus_leucoxylon1.jpg":[250,333,"#5d7451"],"250px-Fagus_sylvatica_019.jpg":[250,242,"#7c9279"],"250px-Francoa_sonchifolia_form.jpg":[250,358,"#7e7f5a"],"250px-Garrya-sp.jpg":[250,375,"#545746"],"250px-Geissoloma_Lignaut_1.jpg":[250,375,"#665b31"],"250px-GentianaAcaulisRannoch.jpg":[250,381,"#6f7962"],"250px-Gerrardina_foliosa_1.jpg":[250,301,"#707f31"],"250px-Ginsengpflanze.jpg":[250,250,"#91a678"],"250px-Glycyrrhiza_glabra_inflorescence.jpg":[250,306,"#5e7636"],"250px-Gomphandra_australiana.jpg":[250,333,"#576122"],"250px-Grapes03.jpg":[250,299,"#827c55"],"250px-Griselinia_littoralis.jpg":[250,343,"#8e9270"],"250px-Grubbia_tomentosa_58439387.jpg":[250,333,"#6f6e47"],"250px-Guava_fruit_tree.jpg":[250,444,"#607a36"],"250px-Gymnostoma_poissonianum_(Scott_Zona)_002.jpg":[250,374,"#595654"],"250px-Hamamelis_virginiana_FlowersLeaves_BotGardBln0906.JPG":[250,333,"#6f7846"],"250px-Helleborus_foetidus_re.jpg":[250,333,"#757964"],"250px-Helwingia_japonica_(fruits_s4).jpg":[250,250,"#5b7518"],"250px-Hibiscus_flower_uploaded_by_Vijayanrajapuram_02.jpg":[250,333,"#6b5b50"],"250px-Hippophae_rhamnoides-01_(xndr).JPG":[250,316,"#7d8a7f"],"250px-Hydrangea_macrophylla_-_Bigleaf_hydrangea2.jpg":[250,333,"#7f696b"],"250px-Hydrophyllum_occidentale.jpg":[250,368,"#544b3c"],"250px-Illustration_Solanum_dulcamara0_clean.png":[250,430,"#cdd3b4"],"250px-Lactuca_tuberosa_2.jpg":[250,327,"#6f835e"],"250px-Leonotis_leonurus_flower.jpg":[250,333,"#6c6831"],"250px-Leptecophylla_juniperina.jpg":[250,375,"#353231"],"250px-Leptolaena_multiflora.jpg":[250,333,"#5b6357"],"250px-Lilac.head.600pix.jpg":[250,333,"#686951"],"250px-Limnanthes_douglasii_flowers.JPG":[250,282,"#5d5f2c"],"250px-LunariaAnnua1.jpg":[250,375,"#3c4131"],"250px-Macadamia_nuts_on_tree.JPG":[250,375,"#67633d"],"250px-Maitén.JPG":[250,334,"#8a9776"],"250px-Malva_sylvestris3.jpg":[250,336,"#534e53"],"250px-MangoImmatureFruits.JPG":[250,333,"#657b3c"],"250px-Matadecacao.jpg":[250,375,"#4f5d1d"],"250px-Metteniusa_tessmanniana_01.jpg":[250,376,"#66732b"],"250px-Mistletoe_in_White_Poplar_1.jpg":[250,308,"#697a8c"],"250px-Monarda_didyma_00.jpg":[250,250,"#8a98cc"],"250px-Moringa_ovalifolia.jpg":[250,378,"#717a80"],"250px-Myrothamnus_flabellifolius_Myrothamanaceae.jpg":[250,250,"#7491b2"],"250px-Native_American_tobacco_flower.jpg":[250,333,"#617f2b"],"250px-Nepenthes_peltata.jpg":[250,333,"#807452"],"250px-Nilambur_Teak_Plantation_0666.jpg":[250,375,"#4b5b2f"],"250px-Nilambur_teak_forest_3755_-Tetrameles_nudiflora.JPG":[250,375,"#55602f"],"250px-Nitraria_billardierei_(8729570925).jpg":[250,266,"#32361f"],"250px-Nymphoides_ezannoi_(aka).jpg":[250,291,"#748748"],"250px-Origanum_majorana_002.JPG":[250,333,"#415628"],"250px-Origanum_vulgare_-_harilik_pune.jpg":[250,375,"#9f8437"],"250px-PachypodiumLamerei.jpg":[250,333,"#737872"],"250px-Pachypodium_lamerei_01.jpg":[250,333,"#757266"],"250px-Persian_Poppy,_Behbahan.jpg":[250,333,"#537c4e"],"250px-Poison_ivy_in_May_beside_Appalachian_Trail_in_Rockfish_Gap_VA_area_1.jpg":[250,246,"#4d763b"],"250px-Quillaja_saponaria_2c.JPG":[250,333,"#6a7344"],"250px-Radish_3371103037_4ab07db0bf_o.jpg":[250,333,"#7c876e"],"250px-Rafflesia_arnoldii,_Sumatra.jpg":[250,257,"#7c5751"],"250px-Reismelde.jpg":[250,405,"#6d7264"],"250px-Rhipsalis_paradoxa.jpg":[250,333,"#50543e"],"250px-Sarracenia_purpurea_pitchers_Brown's_Lake_Bog.JPG":[250,284,"#90764b"],"250px-Scarlet_cordia.jpg":[250,333,"#925427"],"250px-Sempervirum_tectorum1.jpg":[250,333,"#6f6d47"],"250px-Small_tree_Banda_Banda.jpg":[250,356,"#4f564f"],"250px-Smelowskia_americana_4859.JPG":[250,375,"#625a53"],"250px-Solanum_melongena_24_08_2012_(1).JPG":[250,273,"#6c8e40"],"250px-Spinacia_oleracea_Spinazie_bloeiend.jpg":[250,326,"#598647"],"250px-Stachyurus_praecox3.jpg":[250,333,"#8b865c"],"250px-Strychnos_nux-vomica_-_Köhler–s_Medizinal-Pflanzen-266.jpg":[250,338,"#d2d5be"],"250px-Toricellia_angulata_var._intermedia_-_Kunming_Botanical_Garden_-_DSC02765.JPG":[250,333,"#727e56"],"250px-Tovaria_pendula_03.jpg":[250,338,"#697344"],"250px-Tribeles_australis_342571777.jpg":[250,333,"#7f7d65"],"250px-Trochodendron_aralioides_09072.JPG":[250,333,"#687a1b"],"250px-Vahlia_capensis_2.jpg":[250,265,"#8c8765"],"250px-Valdivia_gayana_imported_from_iNaturalist_photo_111498848_on_20_September_2023.jpg":[250,333,"#516846"],"250px-Venus_Flytrap_showing_trigger_hairs.jpg":[250,273,"#7d3621"],"250px-Viola_pedata.jpg":[250,377,"#55595f"],"250px-Xerosicyos_danguyi_2015-05-29_OB_187.jpg":[250,320,"#838171"],"250px-Zygophyllum_fontanesii_03.JPG":[250,333,"#51491e"],"250px-Zygophyllum_sp._flower.jpg":[250,250,"#566558"],"250px-檀香_Santalum_album_20210712091332_04.jpg":[250,325,"#5b7b1f"],"330px-(MHNT)_Rumex_acetosa_-_Habit.jpg":[330,186,"#7b805b"],"330px--2020-09-23_Blackberrys,_Coast_Path,_Trimingham.JPG":[330,247,"#687261"],"330px-2007-04-20Saintpaulia_ionantha03.jpg":[330,273,"#6955a1"],"330px-860631-Pistachio-IMG_6862-2.jpg":[330,220,"#7d5b48"],"330px-A_close-up_of_climbing_roses.jpg":[330,186,"#7e6253"],"330px-Acer_palmatum_sango_kaku.jpg":[330,247,"#838257"],"330px-Alpenroos.jpg":[330,247,"#7a726d"],"330px-Ampelopsis_glandulosa_var._heterophylla_0810.jpg":[330,247,"#798f3c"],"330px-Amruta_(Marathi-_अमृता)_(15379062596).jpg":[330,248,"#2e3529"],"330px-Amsinckia_eastwoodiae.jpg":[330,248,"#847633"],"330px-Anopterus_macleayanus.jpg":[330,273,"#5c6e36"],"330px-Antirrhinum_tortuosum_2601.jpg":[330,293,"#403228"],"330px-Atriplex_nummularia.JPG":[330,247,"#768694"],"330px-Audouinia_capitata_1DS-II_1-8839.jpg":[330,261,"#44281f"],"330px-Balso_(Ochroma_pyramidale)_(14723405443).jpg":[330,256,"#6c7a75"],"330px-Berzelia_lanuginosa_2.jpg":[330,236,"#6e7037"],"330px-Beta_vulgaris_subsp_maritima_89-08.JPG":[330,210,"#6b6949"],"330px-Bombax_ceiba_Flower_in_Lantau_island,_Hong_Kong.JPG":[330,215,"#957b6c"],"330px-Borago_officinalis,_two_blossoms.jpg":[330,220,"#443d4a"],"330px-Brassica_oleracea0.jpg":[330,247,"#869564"],"330px-Brunellia_comocladifolia_1.JPG":[330,247,"#5a86b6"],"330px-Brunia20090406_19.jpg":[330,276,"#686030"],"330px-Buxus_sempervirens0.jpg":[330,248,"#8b986b"],"330px-Buxus_sempervirens_IP1204022.JPG":[330,280,"#575c23"],"330px-Caiophora.jpg":[330,247,"#968863"],"330px-CallunaVulgaris.jpg":[330,282,"#6e6248"],"330px-Calycera_calcitrapa,_Calyceraceae_(8639683617).jpg":[330,315,"#7b7a5b"],"330px-Camellia_sasanqua1JAM343.jpg":[330,247,"#983653"],"330px-Cannabis_01_bgiu.jpg":[330,247,"#5c8638"],"330px-Capullito_capullito.JPG":[330,247,"#505842"],"330px-Cashewnuts_hanging_on_a_Cashew_Tree.jpg":[330,230,"#9c9f83"],"330px-Cassava1_(3945716612).jpg":[330,219,"#6a883c"],"330px-Castor_bean_young_with_teething_leaves.jpg":[330,219,"#83887c"],"330px-Casuarina_equisetifolia_0004.jpg":[330,247,"#767d71"],"330px-Catkins_Corylus_avellana-Mont_Bart-5124~2015_12_26.JPG":[330,220,"#64645e"],"330px-Catnip_flowers.jpg":[330,247,"#78783b"],"330px-CoffeeBerry.jpg":[330,220,"#4d573e"],"330px-Coffee_Flowers.JPG":[330,248,"#687153"],"330px-Combretum_constrictum3.jpg":[330,219,"#5b3715"],"330px-Connarus_paniculatus_13.JPG":[330,255,"#80676b"],"330px-Cordia_subcordata,_habitat.jpg":[330,248,"#808b67"],"330px-Cornus_suecica_Ume_River.jpg":[330,247,"#628047"],"330px-Corokia_virgata.jpg":[330,247,"#626342"],"330px-Cotton_plant,_Ware_County,_GA,_US.jpg":[330,220,"#868f6f"],"330px-Cranberry_bog.jpg":[330,218,"#483d2d"],"330px-Creeping_butercup_close_800.jpg":[330,278,"#434820"],"330px-Cuttsia_viburnea_2329.jpg":[330,247,"#57604e"],"330px-CynoglossumOfficinale-bloem-kl.jpg":[330,248,"#717852"],"330px-Daboecia_cantabrica1373917974.jpg":[330,247,"#49382d"],"330px-Davidia_involucrata_flowering_branch.jpg":[330,186,"#5a775e"],"330px-Davilla_kunthii,_the_Sandpaper_Vine_(10620657533).jpg":[330,233,"#626b3a"],"330px-Dialium_schlechteri00.jpg":[330,246,"#838178"],"330px-Dianthus_caryophyllus_L_(Clove_pink).JPG":[330,304,"#8c6c71"],"330px-Die_Weinraute,_lat._Ruta_graveolens,_Blüten.jpg":[330,248,"#587438"],"330px-Dipsacus_pilosus01.jpg":[330,248,"#313b27"],"330px-Drosera_spatulata_KansaiHabit.jpg":[330,248,"#724c48"],"330px-Echium_plantagineum_flowers.JPG":[330,247,"#888476"],"330px-Ehretia_dicksonii.jpg":[330,247,"#5a5e4b"],"330px-EmbothriumFlowers_w.jpg":[330,268,"#835a25"],"330px-Emmotum_nitens.jpg":[330,248,"#597342"],"330px-Escallonia-virgata-close.jpg":[330,209,"#424b29"],"330px-Eucommia-ulmoides.JPG":[330,220,"#5b603d"],"330px-Euphorbia_pulcherrima_Blanco1.167-cropped.jpg":[330,207,"#e7ddd6"],"330px-Fagus_sylvatica_Purpurea_JPG4a.jpg":[330,220,"#92775c"],"330px-Fall_Colors_at_Kebler_Pass,_Colorado_USA.JPG":[330,220,"#9d9384"],"330px-Fendlera_rupicola_var._rupicola_(19362832713).jpg":[330,220,"#50503d"],"330px-Flax_flowers.jpg":[330,264,"#393d4c"],"330px-Flowering_crabapple_in_Washington_DC.jpg":[330,221,"#474023"],"330px-Forgesia_racemosa.JPG":[330,264,"#453a1b"],"330px-Frühling_blühender_Kirschenbaum.jpg":[330,249,"#6998ad"],"330px-Gardenology-IMG_7966_hunt10aug.jpg":[330,247,"#4d663d"],"330px-Geissoloma_Lignaut_2.jpg":[330,220,"#937551"],"330px-Gelsemium_elegans_107560597.jpg":[330,247,"#707a49"],"330px-Genasu_gadde_(Kannada_ಗೆಣಸು_ಗಡ್ಡೆ)_(49108875711).jpg":[330,247,"#60794b"],"330px-Genlisea_subglabra_Darwiniana.jpg":[330,247,"#69604b"],"330px-George_Taber_azalea.jpg":[330,219,"#6e5c57"],"330px-Geraniaceae.jpg":[330,248,"#616435"],"330px-Geranium-pratense-070706-800-1.jpg":[330,278,"#4a4a5a"],"330px-Giant_rhubarb,_Urubici_-_State_of_Santa_Catarina,_88650-000,_Brazil_imported_from_iNaturalist_photo_62240680.jpg":[330,239,"#78856c"],"330px-Grevillea_rivularis.jpg":[330,220,"#495233"],"330px-Grielum_humifusum1.jpg":[330,247,"#6d5d30"],"330px-Gul-Abas-4-O'clock_plant.JPG":[330,248,"#777c40"],"330px-Gunnera_hamiltonii_kz03.jpg":[330,220,"#766d63"],"330px-Gunnera_insignis.jpg":[330,247,"#677557"],"330px-Gunnera_manicata_(Mammut-Blatt)-1.JPG":[330,247,"#527c53"],"330px-Gyrostemon_ramulosis_habitus.jpg":[330,247,"#898573"],"330px-HELIOTROPIUM_EUROPAEUM_-_AGUDA_-_IB-323_(Herba_berruguera).JPG":[330,247,"#696951"],"330px-Hakea_laurina_Tas.jpg":[330,220,"#535346"],"330px-Haptanthus-pistil-stamens.jpg":[330,247,"#6a7a47"],"330px-Hedera_algeriensis_kz01.jpg":[330,220,"#6d8361"],"330px-Helwingia_japonica_m.jpg":[330,248,"#536d53"],"330px-Hibbertia_stellaris.jpg":[330,248,"#493828"],"330px-Hibbertia_stellaris_1.jpg":[330,251,"#76813b"],"330px-Hippomane_mancinella_(fruit).jpg":[330,247,"#858e33"],"330px-Hong_Kong_Okra_Aug_25_2012.JPG":[330,247,"#588f55"],"330px-Hydrolea_ovata_Arkansas.jpg":[330,264,"#465431"],"330px-Icacina_senegalensis_MS_4743.JPG":[330,239,"#878148"],"330px-Ilex-aquifolium_(Europaeische_Stechpalme-1).jpg":[330,247,"#617560"],"330px-Impatiens_scapiflora.jpg":[330,287,"#3f342e"],"330px-Ixerba_brexioides.jpg":[330,220,"#445029"],"330px-Jacaranda255.jpg":[330,247,"#8d8c99"],"330px-Japanese_Buckwheat_Flower.JPG":[330,245,"#414718"],"330px-Jasmine_.jpg":[330,247,"#456f4a"],"330px-Koeberlinia_spinosa_WikiPlant.jpg":[330,248,"#374516"],"330px-Larrea_tridentata_1.jpg":[330,260,"#74814b"],"330px-Lavandula_fields.jpg":[330,220,"#88949b"],"330px-Leaves_of_Liquidambar_orientalis_1.jpg":[330,220,"#936e64"],"330px-Lixeira_do_cerrado_de_Mato_Grosso.JPG":[330,248,"#8095a4"],"330px-London_plane_flower.jpg":[330,220,"#9b8328"],"330px-Lungwort-oliv.jpg":[330,248,"#988e7c"],"330px-Lychee.jpg":[330,219,"#2d271e"],"330px-Lyonothamnusfloribundusasp.jpg":[330,243,"#5f7440"],"330px-Malpighia_glabra_blossom_and_fruit.jpg":[330,247,"#686d36"],"330px-Mesembryanthemum_crystallinum.JPG":[330,247,"#866858"],"330px-MetrosiderosAK.jpg":[330,247,"#78644f"],"330px-Myosotis_arvensis_ois.JPG":[330,237,"#616c3e"],"330px-Myrothamnus_flabellifolius04.jpg":[330,219,"#6c7440"],"330px-PaeoniaSuffruticosa7.jpg":[330,248,"#5b5d49"],"330px-Peanut_9417.jpg":[330,247,"#757d56"],"330px-Peelo_10.jpg":[330,247,"#b1a685"],"330px-Pennantiacorymbosa2.jpg":[330,255,"#658032"],"330px-Petunia_exserta_by_Scott_Zona_-_004_(1).jpg":[330,247,"#5e594b"],"330px-Pfefferminze_natur_peppermint.jpg":[330,247,"#76835f"],"330px-Phlox_Paniculata.jpg":[330,248,"#84607e"],"330px-Pholismaarenarium.jpg":[330,219,"#645650"],"330px-Picramnia_glazioviana_Engl._(8560606574).jpg":[330,186,"#2d331d"],"330px-Pilea_pumila2.JPG":[330,247,"#5c683f"],"330px-Pilostyles_hamiltonii.jpg":[330,219,"#433024"],"330px-Pinguicula_moranensis.jpg":[330,272,"#504e29"],"330px-Pink_paperflowers_(Bougainvillea_glabra).jpg":[330,247,"#816749"],"330px-Pittosporum_heterophyllum.jpg":[330,247,"#545c3b"],"330px-Polanisia_erosa.jpg":[330,247,"#807949"],"330px-Polemonium_reptans_2009.jpg":[330,247,"#55633c"],"330px-Polygala_amara_a1.jpg":[330,247,"#72716f"],"330px-Potato_plants.jpg":[330,220,"#85967a"],"330px-Protea_exima.jpg":[330,288,"#6d5d4e"],"330px-Punica_granatum_004.JPG":[330,248,"#5b5e13"],"330px-Quintinia_sieberi.jpg":[330,220,"#515b43"],"330px-RMM_475_Montiniaceae-Kaliphoraceae_Grevea_madagascariensis_Baill._Maintirano,_Phot._PG_04_03_08_IMG_3060.JPG":[330,220,"#131609"],"330px-Rheum_rhabarbarum.2006-04-27.uellue.jpg":[330,247,"#80837e"],"330px-Rosemary_in_bloom.JPG":[330,247,"#78807c"],"330px-Ruptiliocarpon_caracolito_1zz.jpg":[330,220,"#344128"],"330px-Sacred_lotus_Nelumbo_nucifera.jpg":[330,302,"#657256"],"330px-Sambucus-berries.jpg":[330,248,"#5f7430"],"330px-SantalumAlbumLeaf.jpg":[330,248,"#7f9a36"],"330px-Securidaca_longipedunculata_MS_1933.JPG":[330,220,"#707e44"],"330px-Seetzenia_orientalis_kz02.jpg":[330,247,"#595749"],"330px-Sorbaria_grandiflora_-_Fleurs-2.jpg":[330,220,"#5c533f"],"330px-Staphylea_colchica.jpg":[330,247,"#66844b"],"330px-Starr-170913-0143-Sapindus_saponaria-fruit-CTAHR_Urban_Garden_Center_Pearl_City-Oahu_-_Flickr_-_Starr_Environmental.jpg":[330,247,"#67623b"],"330px-Starr_020925-0042_Perrottetia_sandwicensis.jpg":[330,247,"#74734e"],"330px-Starr_041006-0222_Santalum_haleakalae.jpg":[330,247,"#816f63"],"330px-Starr_050817-3953_Escallonia_rubra_var._macrantha.jpg":[330,247,"#30351c"],"330px-Starr_051004-4689_Pittosporum_confertiflorum.jpg":[330,247,"#4a5926"],"330px-Starr_070727-7629_Guaiacum_officinale.jpg":[330,247,"#5f7035"],"330px-Starr_080304-3229_Myrtus_communis.jpg":[330,247,"#647a6b"],"330px-Streptothamnus_moorei.jpg":[330,220,"#586e32"],"330px-Tapiscia_sinensis_01.jpg":[330,230,"#76843e"],"330px-Tetracentron_sinense_-_Feuilles_et_fleurs-3.jpg":[330,220,"#566432"],"330px-Thai_peppers.jpg":[330,220,"#50561c"],"330px-The_flowers_of_clove_tree_in_Pemba_island.JPG":[330,247,"#8f9356"],"330px-Thymelaea_hirsuta_kz2.jpg":[330,220,"#8b8866"],"330px-Tomato_flower_and_young_fruit.jpg":[330,279,"#788557"],"330px-Toxicodendron_pubescens.jpg":[330,217,"#6b7a58"],"330px-Uk_pond_bladderwort2.jpg":[330,248,"#ebf1d7"],"330px-Umbella.jpg":[330,304,"#8f8d77"],"330px-Variegated_Lemon_Thyme_Thymus_citriodorus_variegata_Leaves_3264px.JPG":[330,248,"#627743"],"330px-Vegetable-Carrot-Bundle-wStalks.jpg":[330,187,"#d0d1bf"],"330px-Viburnum_opulus_C.jpg":[330,266,"#576338"],"330px-Vine_near_the_skywalk_Dorrigo_National_Park.jpg":[329,206,"#5a7446"],"330px-Virginia_creeper_Parthenocissus_quinquifolia_169.JPG":[330,247,"#708d45"],"330px-Viscum_minimum2_ies.jpg":[330,289,"#9c7242"],"330px-Vitellaria_paradoxa_MS_6563.JPG":[330,220,"#9eaa99"],"330px-Wild_cyclamens.jpg":[330,248,"#5d5a4c"],"330px-Yellow_and_red_Tropaeolum_majus_(Garden_nasturtium).jpg":[330,247,"#596b25"],"330px-സപ്പോട്ട.jpg":[330,266,"#7f8d4e"],"500px-Akania_bidwillii_leaves.jpg":[500,666,"#5c7041"],"500px-Mountain_Beech.jpg":[500,747,"#626862"],"506px-Juglans_regia_Broadview.jpg":[506,600,"#62794d"],"Abrophyllum_ornans_Elvina_Bay.JPG":[640,481,"#6c8265"],"Aextoxicon_punctatum_flor_femenina_-_Flickr_-_Pato_Novoa.jpg":[640,480,"#434b45"],"Amaranthus_tricolor0.jpg":[640,480,"#978c43"],"Aralia_elata_en_fleur4081.jpg":[800,600,"#616c34"],"Aucuba_japonica1.jpg":[640,480,"#8f927a"],"Banksia_baxteri_Stahl_email.jpg":[422,556,"#615d40"],"Batis_maritima_male.jpg":[450,600,"#768648"],"Berberis_darwinii_from_the_Berberidaceae_(8406231651).jpg":[563,480,"#747b42"],"Big-leaved_Mahogany.jpg":[700,465,"#686f2e"],"Bixa_bluete.jpg":[689,485,"#5c6c43"],"Bog_huckleberry.jpg":[391,393,"#898848"],"Campanula_cespitosa.jpg":[800,600,"#6d7768"],"Cardon_Pachycereus_pringlei.jpg":[238,301,"#86969a"],"Cercidiphyllum_japonicum.jpg":[299,450,"#638644"],"Chamerion.latifolium.web.jpg":[295,384,"#906c72"],"Cinchona.pubescens01.jpg":[600,450,"#67665b"],"Cistus_incanus_2004.jpg":[800,600,"#81855d"],"Citronella_moorei_juvenile2.JPG":[480,360,"#676d5a"],"Coldenia_procumbens_in_AP_W2_IMG_9943.jpg":[661,600,"#547849"],"Conium_maculatum_-_Köhler–s_Medizinal-Pflanzen-191.jpg":[444,596,"#dde3cf"],"Coriandrum_sativum_-_Köhler–s_Medizinal-Pflanzen-193.jpg":[470,592,"#e4e6d7"],"Crinodendron_hookerianum1.jpg":[640,480,"#928c70"],"Cytinus_hypocistis06052003_1.JPG":[640,511,"#524528"],"Daphne_philippi1.jpg":[640,480,"#7a963e"],"DwNorthernGrassofParnassus.jpg":[393,560,"#3c5331"],"Erythroxylum_novogranatense_var._Novogranatense_(retouched).jpg":[800,600,"#63742e"],"Eucalyptus_deglupta-trees.jpg":[500,375,"#707e50"],"Eucryphia.jpg":[421,408,"#918881"],"Flickr_-_João_de_Deus_Medeiros_-_Doliocarpus_brevipedicellatus_(1).jpg":[1024,768,"#74785e"],"Garrya_elliptica.jpg":[697,569,"#96938b"],"Heliotropium_peruvianum.jpg":[522,392,"#66615e"],"Honeysuckle_w_y.jpg":[250,171,"#537c52"],"Munting_calab_070609_214_ipb.jpg":[465,385,"#5b7756"],"Myrica_faya.jpg":[300,400,"#7a7d66"],"Olea_europaea_-_Köhler–s_Medizinal-Pflanzen-229.jpg":[471,542,"#c7d6b3"],"OrangeBloss_wb.jpg":[578,509,"#534d28"],"Pachysandra_terminalis0.jpg":[640,480,"#708934"],"Palo_mulato.JPG":[640,480,"#7e9194"],"Passiflora_edulis_forma_flavicarpa.jpg":[700,525,"#686c62"],"Polyosma_cunninghamii_at_Mount_Banda_Banda.jpg":[480,361,"#4e5c39"],"Purple_loosestrife.jpg":[305,475,"#94a08a"],"Reseda_lutea1.jpg":[640,480,"#70894e"],"Salix_alba_Morton.jpg":[500,500,"#617850"],"Salvia_officinalis0.jpg":[640,480,"#777f79"],"Sambucus_canadensis_W2_IMG_3144.jpg":[800,600,"#838454"],"Sarcococca-humilis.JPG":[600,432,"#595f3d"],"Saxifraga_cochlearis1.jpg":[640,480,"#71836e"],"Stylidium_amoenum_gdaywa1.jpg":[500,375,"#6c705f"],"Tamarindus_indica_flower_in_Hyderabad_W_IMG_8905.jpg":[637,600,"#8a763e"],"Tiganophyton_karasense_Photo_474711747,_no_rights_reserved.jpeg":[500,375,"#907c5e"],"Trapa_natans0.jpg":[640,480,"#919588"],"Wittsteinia_vaccinacea.JPG":[640,480,"#505347"],"אפרסמון2.jpg":[571,428,"#625c56"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_plantae_angiosperms_eudicots","<ul class=\"tree\" data-tree-range=\"eudicots\"><li><input type=\"checkbox\" checked id=\"Core angiosperms_Eudicots\"><label class=\"tree_label\" for=\"Core angiosperms_Eudicots\"></label><div class=\"outer_tree_box\"><div id=\"eudicots_eudicots\" class=\"tree_box\"><span><span>Eudicots</span><a href=\"https://en.wikipedia.org/wiki/Eudicots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Eudicots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Eudicots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"angiosperms\">See parent</button><span class=\"badge\">Clade</span></span><span class=\"common_names\">(sunflowers, dandelions, forget-me-nots, cabbages, apples, buttercups, maples, macadamias)</span><p class=\"tag\">Flowering plants that have two seed leaves (cotyledons) upon germination, 4- or 5-part flowers, 3-pore pollen, and usually branch-veined leaves.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Senecio_angulatus_003.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Senecio_angulatus_003.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#3f492d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sunflower_sky_backdrop.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sunflower_sky_backdrop.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"277\" style=\"background-color:#536b81\"></a><a href=\"https://commons.wikimedia.org/wiki/File:TaraxacumOfficinaleSeed.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-TaraxacumOfficinaleSeed.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3c6431\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myosotis_arvensis_ois.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Myosotis_arvensis_ois.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#616c3e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cabbage_and_cross_section_on_white.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cabbage_and_cross_section_on_white.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"149\" style=\"background-color:#c0c6ad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acer_pseudoplatanus_002.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Acer_pseudoplatanus_002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7b901e\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_ranunculales\" class=\"tree_box\"><span><span>Ranunculales</span><a href=\"https://en.wikipedia.org/wiki/Ranunculales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ranunculales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ranunculales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(poppies, barberries, hellebores, buttercups)</span><p class=\"tag\">The order that is sister to all other known Eudicots and includes the buttercups family Ranunculaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:5206-Decaisnea_fargesii-20111103-hamburg.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-5206-Decaisnea_fargesii-20111103-hamburg.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#8c855c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Akebia_longeracemosa_%2814168601575%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Akebia_longeracemosa_%2814168601575%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#778f6b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Circaeaster_agrestis_7_Yunnan%2C_China_Photo_Magnus_Lid%C3%A9n.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Circaeaster_agrestis_7_Yunnan%2C_China_Photo_Magnus_Lid%C3%A9n.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"259\" style=\"background-color:#828f49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Berberis_darwinii_from_the_Berberidaceae_%288406231651%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Berberis_darwinii_from_the_Berberidaceae_%288406231651%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"563\" height=\"480\" style=\"background-color:#747b42\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Creeping_butercup_close_800.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Creeping_butercup_close_800.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"278\" style=\"background-color:#434820\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Helleborus_foetidus_re.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Helleborus_foetidus_re.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#757964\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Persian_Poppy%2C_Behbahan.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Persian_Poppy%2C_Behbahan.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#537c4e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_proteales\" class=\"tree_box\"><span><span>Proteales</span><a href=\"https://en.wikipedia.org/wiki/Proteales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Proteales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Proteales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(sugarbushes, banksias, spider flowers, macadamia, planetree, sacred lotus)</span><p class=\"tag\">An order or eudicots with seeds that have little or no endosperm. Includes the Proteaceae family and a family of aquatic flowering plants that have evolved to be similar to the water lilies.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Sacred_lotus_Nelumbo_nucifera.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sacred_lotus_Nelumbo_nucifera.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"302\" style=\"background-color:#657256\"></a><a href=\"https://commons.wikimedia.org/wiki/File:London_plane_flower.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-London_plane_flower.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#9b8328\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Protea_exima.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Protea_exima.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"288\" style=\"background-color:#6d5d4e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Banksia_serrata_follicles.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Banksia_serrata_follicles.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"324\" style=\"background-color:#9a9582\"></a><a href=\"https://commons.wikimedia.org/wiki/File:EmbothriumFlowers_w.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-EmbothriumFlowers_w.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"268\" style=\"background-color:#835a25\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grevillea_rivularis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grevillea_rivularis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#495233\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Macadamia_nuts_on_tree.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Macadamia_nuts_on_tree.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#67633d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hakea_laurina_Tas.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hakea_laurina_Tas.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#535346\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Banksia_baxteri_Stahl_email.jpg\" target=\"_blank\"><img src=\"thumbnails/Banksia_baxteri_Stahl_email.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"422\" height=\"556\" style=\"background-color:#615d40\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_trochodendrales\" class=\"tree_box\"><span><span>Trochodendrales</span><a href=\"https://en.wikipedia.org/wiki/Trochodendrales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Trochodendrales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Trochodendrales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(wheel trees)</span><p class=\"tag\">An order of eudicots that have secondary xylem without vessel elements. Includes the wheel tree genus, Trochodendron.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Tetracentron_sinense_-_Feuilles_et_fleurs-3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tetracentron_sinense_-_Feuilles_et_fleurs-3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#566432\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trochodendron_aralioides_09072.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Trochodendron_aralioides_09072.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#687a1b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_buxales\" class=\"tree_box\"><span><span>Buxales</span><a href=\"https://en.wikipedia.org/wiki/Buxales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Buxales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Buxales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(common box, cape box)</span><p class=\"tag\">Includes the box family, Buxaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Buxus_sempervirens_IP1204022.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Buxus_sempervirens_IP1204022.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"280\" style=\"background-color:#575c23\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pachysandra_terminalis0.jpg\" target=\"_blank\"><img src=\"thumbnails/Pachysandra_terminalis0.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#708934\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Haptanthus-pistil-stamens.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Haptanthus-pistil-stamens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6a7a47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Buxus_sempervirens.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Buxus_sempervirens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"395\" style=\"background-color:#69875b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Buxus_sempervirens0.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Buxus_sempervirens0.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8b986b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sarcococca-humilis.JPG\" target=\"_blank\"><img src=\"thumbnails/Sarcococca-humilis.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"432\" style=\"background-color:#595f3d\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Eudicots_Core eudicots\"><label class=\"tree_label\" for=\"Eudicots_Core eudicots\"></label><div class=\"outer_tree_box\"><div id=\"eudicots_core eudicots\" class=\"tree_box\"><span><span>Core eudicots</span><a href=\"https://en.wikipedia.org/wiki/Core eudicots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Core eudicots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Core eudicots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_gunnerales\" class=\"tree_box\"><span><span>Gunnerales</span><a href=\"https://en.wikipedia.org/wiki/Gunnerales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gunnerales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gunnerales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(giant rhubarbs)</span><p class=\"tag\">Includes the Gunneraceae family.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Giant_rhubarb%2C_Urubici_-_State_of_Santa_Catarina%2C_88650-000%2C_Brazil_imported_from_iNaturalist_photo_62240680.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Giant_rhubarb%2C_Urubici_-_State_of_Santa_Catarina%2C_88650-000%2C_Brazil_imported_from_iNaturalist_photo_62240680.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"239\" style=\"background-color:#78856c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gunnera_manicata_%28Mammut-Blatt%29-1.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Gunnera_manicata_%28Mammut-Blatt%29-1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#527c53\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myrothamnus_flabellifolius_Myrothamanaceae.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Myrothamnus_flabellifolius_Myrothamanaceae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#7491b2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myrothamnus_flabellifolius04.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Myrothamnus_flabellifolius04.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#6c7440\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gunnera_hamiltonii_kz03.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gunnera_hamiltonii_kz03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#766d63\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gunnera_insignis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gunnera_insignis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#677557\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_dilleniales\" class=\"tree_box\"><span><span>Dilleniales</span><a href=\"https://en.wikipedia.org/wiki/Dilleniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dilleniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dilleniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(guinea flowers, wild cashew tree, hibbertia)</span><p class=\"tag\">Includes the Dilleniaceae family.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lixeira_do_cerrado_de_Mato_Grosso.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Lixeira_do_cerrado_de_Mato_Grosso.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8095a4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flickr_-_Jo%C3%A3o_de_Deus_Medeiros_-_Doliocarpus_brevipedicellatus_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Flickr_-_Jo%C3%A3o_de_Deus_Medeiros_-_Doliocarpus_brevipedicellatus_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"1024\" height=\"768\" style=\"background-color:#74785e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Davilla_kunthii%2C_the_Sandpaper_Vine_%2810620657533%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Davilla_kunthii%2C_the_Sandpaper_Vine_%2810620657533%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#626b3a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hibbertia_stellaris.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hibbertia_stellaris.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#493828\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hibbertia_stellaris_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hibbertia_stellaris_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#76813b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gardenology-IMG_7966_hunt10aug.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gardenology-IMG_7966_hunt10aug.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4d663d\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Core eudicots_Superrosids\"><label class=\"tree_label\" for=\"Core eudicots_Superrosids\"></label><div class=\"outer_tree_box\"><div id=\"eudicots_superrosids\" class=\"tree_box\"><span><span>Superrosids</span><a href=\"https://en.wikipedia.org/wiki/Superrosids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Superrosids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Superrosids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_saxifragales\" class=\"tree_box\"><span><span>Saxifragales</span><a href=\"https://en.wikipedia.org/wiki/Saxifragales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Saxifragales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Saxifragales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(saxifrages, blackcurrants, redcurrants, gooseberries, peonies, liquidambars, witch-hazel, Persian ironwood, katsura, jade plant, houseleeks, water milfoil, sweetgums, money trees, houseleeks)</span><p class=\"tag\">A eudicot order with the saxifrages (Saxifraga) as the type genus.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Saxifraga_cochlearis1.jpg\" target=\"_blank\"><img src=\"thumbnails/Saxifraga_cochlearis1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#71836e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blackcurrant_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Blackcurrant_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#868848\"></a><a href=\"https://commons.wikimedia.org/wiki/File:PaeoniaSuffruticosa7.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-PaeoniaSuffruticosa7.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#5b5d49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leaves_of_Liquidambar_orientalis_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Leaves_of_Liquidambar_orientalis_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#936e64\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CopalmeDAmerique.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-CopalmeDAmerique.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#79716e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hamamelis_virginiana_FlowersLeaves_BotGardBln0906.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Hamamelis_virginiana_FlowersLeaves_BotGardBln0906.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6f7846\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cercidiphyllum_japonicum.jpg\" target=\"_blank\"><img src=\"thumbnails/Cercidiphyllum_japonicum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"299\" height=\"450\" style=\"background-color:#638644\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crassula_ovata_700.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Crassula_ovata_700.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"352\" style=\"background-color:#747554\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sempervirum_tectorum1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sempervirum_tectorum1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6f6d47\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Superrosids_Rosids\"><label class=\"tree_label\" for=\"Superrosids_Rosids\"></label><div class=\"outer_tree_box\"><div id=\"eudicots_rosids\" class=\"tree_box\"><span><span>Rosids</span><a href=\"https://en.wikipedia.org/wiki/Rosids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rosids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rosids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_vitales\" class=\"tree_box\"><span><span>Vitales</span><a href=\"https://en.wikipedia.org/wiki/Vitales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Vitales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Vitales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(grapes, Virginia creeper)</span><p class=\"tag\">A eudicot order of woody plants, most of them tendril-bearing vines that includes the grape genus, Vitis.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ampelopsis_glandulosa_var._heterophylla_0810.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ampelopsis_glandulosa_var._heterophylla_0810.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#798f3c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Virginia_creeper_Parthenocissus_quinquifolia_169.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Virginia_creeper_Parthenocissus_quinquifolia_169.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#708d45\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grapes03.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Grapes03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"299\" style=\"background-color:#827c55\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Rosids_Fabids\"><label class=\"tree_label\" for=\"Rosids_Fabids\"></label><div class=\"outer_tree_box\"><div id=\"eudicots_fabids\" class=\"tree_box\"><span><span>Fabids</span><a href=\"https://en.wikipedia.org/wiki/Fabids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Fabids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Fabids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_fabales\" class=\"tree_box\"><span><span>Fabales</span><a href=\"https://en.wikipedia.org/wiki/Fabales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Fabales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Fabales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(legumes, milkworts)</span><p class=\"tag\">Includes the legume family, Fabaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Peanut_9417.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Peanut_9417.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#757d56\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chickpeas_Plant.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chickpeas_Plant.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"395\" style=\"background-color:#4d4f2c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ceratonia_siliqua_Keciboynuzu_1370984_Nevit.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ceratonia_siliqua_Keciboynuzu_1370984_Nevit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#728255\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Glycyrrhiza_glabra_inflorescence.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Glycyrrhiza_glabra_inflorescence.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"306\" style=\"background-color:#5e7636\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tamarindus_indica_flower_in_Hyderabad_W_IMG_8905.jpg\" target=\"_blank\"><img src=\"thumbnails/Tamarindus_indica_flower_in_Hyderabad_W_IMG_8905.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"637\" height=\"600\" style=\"background-color:#8a763e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dialium_schlechteri00.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dialium_schlechteri00.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"246\" style=\"background-color:#838178\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Quillaja_saponaria_2c.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Quillaja_saponaria_2c.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6a7344\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Securidaca_longipedunculata_MS_1933.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Securidaca_longipedunculata_MS_1933.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#707e44\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Polygala_amara_a1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Polygala_amara_a1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#72716f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_rosales\" class=\"tree_box\"><span><span>Rosales</span><a href=\"https://en.wikipedia.org/wiki/Rosales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rosales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rosales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"rosales\">See children</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(roses, strawberries, blackberries, raspberries, apples, pears, plums, peaches, apricots, almonds, elms, figs, mulberries, nettles, hops, cannabis)</span><p class=\"tag\">A eudicot order necessarily including the rose family, Rosaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cannabis_01_bgiu.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cannabis_01_bgiu.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5c8638\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hippophae_rhamnoides-01_%28xndr%29.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Hippophae_rhamnoides-01_%28xndr%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"316\" style=\"background-color:#7d8a7f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Alb-Z._jujuba-fruit-2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Alb-Z._jujuba-fruit-2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#67724d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pilea_pumila2.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Pilea_pumila2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5c683f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:-2020-09-23_Blackberrys%2C_Coast_Path%2C_Trimingham.JPG\" target=\"_blank\"><img src=\"thumbnails/330px--2020-09-23_Blackberrys%2C_Coast_Path%2C_Trimingham.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#687261\"></a><a href=\"https://commons.wikimedia.org/wiki/File:A_close-up_of_climbing_roses.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-A_close-up_of_climbing_roses.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#7e6253\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fr%C3%BChling_bl%C3%BChender_Kirschenbaum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fr%C3%BChling_bl%C3%BChender_Kirschenbaum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#6998ad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lyonothamnusfloribundusasp.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lyonothamnusfloribundusasp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"243\" style=\"background-color:#5f7440\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flowering_crabapple_in_Washington_DC.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Flowering_crabapple_in_Washington_DC.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#474023\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sorbaria_grandiflora_-_Fleurs-2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sorbaria_grandiflora_-_Fleurs-2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5c533f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_fagales\" class=\"tree_box\"><span><span>Fagales</span><a href=\"https://en.wikipedia.org/wiki/Fagales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Fagales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Fagales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"fagales\">See children</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(beeches, chestnuts, oaks, walnut, pecan, hickory, birches, alders, hazels, hornbeams, she-oaks, southern beeches)</span><p class=\"tag\">A eudicot order necessarily including the beech family, Fagus.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Mountain_Beech.jpg\" target=\"_blank\"><img src=\"thumbnails/500px-Mountain_Beech.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"747\" style=\"background-color:#626862\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myrica_faya.jpg\" target=\"_blank\"><img src=\"thumbnails/Myrica_faya.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"300\" height=\"400\" style=\"background-color:#7a7d66\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Juglans_regia_Broadview.jpg\" target=\"_blank\"><img src=\"thumbnails/506px-Juglans_regia_Broadview.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"506\" height=\"600\" style=\"background-color:#62794d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fagus_sylvatica_Purpurea_JPG4a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fagus_sylvatica_Purpurea_JPG4a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#92775c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fagus_sylvatica_019.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fagus_sylvatica_019.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"242\" style=\"background-color:#7c9279\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Casuarina_equisetifolia_0004.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Casuarina_equisetifolia_0004.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#767d71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gymnostoma_poissonianum_%28Scott_Zona%29_002.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gymnostoma_poissonianum_%28Scott_Zona%29_002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"374\" style=\"background-color:#595654\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Catkins_Corylus_avellana-Mont_Bart-5124~2015_12_26.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Catkins_Corylus_avellana-Mont_Bart-5124~2015_12_26.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#64645e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_cucurbitales\" class=\"tree_box\"><span><span>Cucurbitales</span><a href=\"https://en.wikipedia.org/wiki/Cucurbitales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cucurbitales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cucurbitales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(squash, pumpkins, watermelons, cucumbers, melons)</span><p class=\"tag\">Includes the gourd family, Cucurbitaceae. Mostly comprised of annual vines with thick pointed petals, many species of which are cultivated for their fruit. Includes some parasitic plants.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pilostyles_hamiltonii.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pilostyles_hamiltonii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#433024\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Begonia_pseudolubbersii.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Begonia_pseudolubbersii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#7c7465\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cyclanthera_pedata_z02.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Cyclanthera_pedata_z02.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#687b23\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Xerosicyos_danguyi_2015-05-29_OB_187.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Xerosicyos_danguyi_2015-05-29_OB_187.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"320\" style=\"background-color:#838171\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Datisca_cannabina.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Datisca_cannabina.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"347\" style=\"background-color:#567d47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nilambur_teak_forest_3755_-Tetrameles_nudiflora.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Nilambur_teak_forest_3755_-Tetrameles_nudiflora.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#55602f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_oxalidales\" class=\"tree_box\"><span><span>Oxalidales</span><a href=\"https://en.wikipedia.org/wiki/Oxalidales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Oxalidales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Oxalidales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(starfruit)</span><p class=\"tag\">Includes the wood sorrel family, Oxalidaceae. Also includes some carniverous pitcher plants.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Connarus_paniculatus_13.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Connarus_paniculatus_13.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#80676b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eucryphia.jpg\" target=\"_blank\"><img src=\"thumbnails/Eucryphia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"421\" height=\"408\" style=\"background-color:#918881\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Averrhoa_carambola_ARS_k5735-7.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Averrhoa_carambola_ARS_k5735-7.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"374\" style=\"background-color:#4f6031\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Crinodendron_hookerianum1.jpg\" target=\"_blank\"><img src=\"thumbnails/Crinodendron_hookerianum1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#928c70\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cephalotus_follicularis_0001.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Cephalotus_follicularis_0001.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#604f42\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brunellia_comocladifolia_1.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Brunellia_comocladifolia_1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5a86b6\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_malpighiales\" class=\"tree_box\"><span><span>Malpighiales</span><a href=\"https://en.wikipedia.org/wiki/Malpighiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Malpighiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Malpighiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(willows, violets, aspens, poplars, poinsettia, corpse flower, coca plant, cassava, flaxseed, castor bean, Saint John&#x27;s wort, passionfruit, mangosteen, manchineel tree)</span><p class=\"tag\">A eudicot order with the type genus Malpighia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Hippomane_mancinella_%28fruit%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hippomane_mancinella_%28fruit%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#858e33\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Passiflora_edulis_forma_flavicarpa.jpg\" target=\"_blank\"><img src=\"thumbnails/Passiflora_edulis_forma_flavicarpa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"700\" height=\"525\" style=\"background-color:#686c62\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%28MHNT%29_Hypericum_perforatum_flower_and_buttons.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-%28MHNT%29_Hypericum_perforatum_flower_and_buttons.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"341\" style=\"background-color:#8e8942\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Castor_bean_young_with_teething_leaves.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Castor_bean_young_with_teething_leaves.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#83887c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flax_flowers.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Flax_flowers.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#393d4c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cassava1_%283945716612%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cassava1_%283945716612%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#6a883c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Erythroxylum_novogranatense_var._Novogranatense_%28retouched%29.jpg\" target=\"_blank\"><img src=\"thumbnails/Erythroxylum_novogranatense_var._Novogranatense_%28retouched%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#63742e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rafflesia_arnoldii%2C_Sumatra.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Rafflesia_arnoldii%2C_Sumatra.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"257\" style=\"background-color:#7c5751\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Euphorbia_pulcherrima_Blanco1.167-cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Euphorbia_pulcherrima_Blanco1.167-cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"207\" style=\"background-color:#e7ddd6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fall_Colors_at_Kebler_Pass%2C_Colorado_USA.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Fall_Colors_at_Kebler_Pass%2C_Colorado_USA.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#9d9384\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Viola_pedata.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Viola_pedata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"377\" style=\"background-color:#55595f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Salix_alba_Morton.jpg\" target=\"_blank\"><img src=\"thumbnails/Salix_alba_Morton.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"500\" style=\"background-color:#617850\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Malpighia_glabra_blossom_and_fruit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Malpighia_glabra_blossom_and_fruit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#686d36\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_celastrales\" class=\"tree_box\"><span><span>Celastrales</span><a href=\"https://en.wikipedia.org/wiki/Celastrales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Celastrales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Celastrales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(staff-vine, bittersweet)</span><p class=\"tag\">Includes the staff-vine family, Celastraceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ruptiliocarpon_caracolito_1zz.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ruptiliocarpon_caracolito_1zz.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#344128\"></a><a href=\"https://commons.wikimedia.org/wiki/File:DwNorthernGrassofParnassus.jpg\" target=\"_blank\"><img src=\"thumbnails/DwNorthernGrassofParnassus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"393\" height=\"560\" style=\"background-color:#3c5331\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mait%C3%A9n.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Mait%C3%A9n.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"334\" style=\"background-color:#8a9776\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Celastrus_scandens.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Celastrus_scandens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"312\" style=\"background-color:#5b6f29\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_zygophyllales\" class=\"tree_box\"><span><span>Zygophyllales</span><a href=\"https://en.wikipedia.org/wiki/Zygophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Zygophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Zygophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(bean-caper, caltrop, creosote bush, rhatany)</span><p class=\"tag\">Includes the Zygophyllaceae family.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Larrea_tridentata_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Larrea_tridentata_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"260\" style=\"background-color:#74814b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Starr_070727-7629_Guaiacum_officinale.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Starr_070727-7629_Guaiacum_officinale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5f7035\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Seetzenia_orientalis_kz02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Seetzenia_orientalis_kz02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#595749\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zygophyllum_fontanesii_03.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Zygophyllum_fontanesii_03.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#51491e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zygophyllum_sp._flower.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Zygophyllum_sp._flower.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#566558\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Rosids_Malvids\"><label class=\"tree_label\" for=\"Rosids_Malvids\"></label><div class=\"outer_tree_box\"><div id=\"eudicots_malvids\" class=\"tree_box\"><span><span>Malvids</span><a href=\"https://en.wikipedia.org/wiki/Malvids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Malvids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Malvids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_geraniales\" class=\"tree_box\"><span><span>Geraniales</span><a href=\"https://en.wikipedia.org/wiki/Geraniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Geraniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Geraniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(geraniums, stork&#x27;s-bills, honey flowers)</span><p class=\"tag\">The type genus are the true geraniums, Geranium.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Geranium-pratense-070706-800-1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Geranium-pratense-070706-800-1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"278\" style=\"background-color:#4a4a5a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Geraniaceae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Geraniaceae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#616435\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Francoa_sonchifolia_form.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Francoa_sonchifolia_form.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"358\" style=\"background-color:#7e7f5a\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_myrtales\" class=\"tree_box\"><span><span>Myrtales</span><a href=\"https://en.wikipedia.org/wiki/Myrtales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Myrtales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Myrtales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"myrtales\">See children</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(myrtle, pōhutukawa, bay rum tree, clove, guava, acca, allspice, eucalyptus, crape myrtles, henna tree, pomegranate, water caltrop, loosestrifes, cigar plants, evening primroses, fuchsias, willowherbs, white mangrove, leadwood tree, African birch, Koster&#x27;s curse, velvet tree)</span><p class=\"tag\">Includes the myrtle family, Myrtaceae</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Alzatea_verticillata_imported_from_iNaturalist_photo_173522367_on_27_January_2022.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Alzatea_verticillata_imported_from_iNaturalist_photo_173522367_on_27_January_2022.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#597d58\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Combretum_constrictum3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Combretum_constrictum3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#5b3715\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Purple_loosestrife.jpg\" target=\"_blank\"><img src=\"thumbnails/Purple_loosestrife.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"305\" height=\"475\" style=\"background-color:#94a08a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Punica_granatum_004.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Punica_granatum_004.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#5b5e13\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trapa_natans0.jpg\" target=\"_blank\"><img src=\"thumbnails/Trapa_natans0.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#919588\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chamerion.latifolium.web.jpg\" target=\"_blank\"><img src=\"thumbnails/Chamerion.latifolium.web.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"295\" height=\"384\" style=\"background-color:#906c72\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Starr_080304-3229_Myrtus_communis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Starr_080304-3229_Myrtus_communis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#647a6b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MetrosiderosAK.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-MetrosiderosAK.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#78644f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:The_flowers_of_clove_tree_in_Pemba_island.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-The_flowers_of_clove_tree_in_Pemba_island.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8f9356\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Guava_fruit_tree.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Guava_fruit_tree.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"444\" style=\"background-color:#607a36\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eucalyptus_leucoxylon1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eucalyptus_leucoxylon1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#5d7451\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eucalyptus_deglupta-trees.jpg\" target=\"_blank\"><img src=\"thumbnails/Eucalyptus_deglupta-trees.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"375\" style=\"background-color:#707e50\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_crossosomatales\" class=\"tree_box\"><span><span>Crossosomatales</span><a href=\"https://en.wikipedia.org/wiki/Crossosomatales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Crossosomatales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Crossosomatales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(guyalone, bladdernut trees)</span><p class=\"tag\">Includes the family Crossosomataceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Geissoloma_Lignaut_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Geissoloma_Lignaut_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#937551\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Geissoloma_Lignaut_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Geissoloma_Lignaut_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#665b31\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aphloia_theiformis_1DS-II_8649.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aphloia_theiformis_1DS-II_8649.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#555c27\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stachyurus_praecox3.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Stachyurus_praecox3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#8b865c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Staphylea_colchica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Staphylea_colchica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#66844b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ixerba_brexioides.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ixerba_brexioides.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#445029\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_picramniales\" class=\"tree_box\"><span><span>Picramniales</span><a href=\"https://en.wikipedia.org/wiki/Picramniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Picramniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Picramniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Includes the bitterbush genus, Picramnia.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Alvaradoa_amorphoides-leaves-fruit.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Alvaradoa_amorphoides-leaves-fruit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"269\" style=\"background-color:#96876b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Picramnia_glazioviana_Engl._%288560606574%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Picramnia_glazioviana_Engl._%288560606574%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#2d331d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_malvales\" class=\"tree_box\"><span><span>Malvales</span><a href=\"https://en.wikipedia.org/wiki/Malvales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Malvales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Malvales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(balsa trees, basswood trees, cacao trees, daphnes, hibiscus, hollyhocks, okra, jute, baobab trees, cotton, kapok, durian)</span><p class=\"tag\">Includes the mallows family, Malvaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Matadecacao.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Matadecacao.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#4f5d1d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Balso_%28Ochroma_pyramidale%29_%2814723405443%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Balso_%28Ochroma_pyramidale%29_%2814723405443%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#6c7a75\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Durio_Zibethinus_Van_Nooten.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Durio_Zibethinus_Van_Nooten.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"368\" style=\"background-color:#c4bca4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bombax_ceiba_Flower_in_Lantau_island%2C_Hong_Kong.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Bombax_ceiba_Flower_in_Lantau_island%2C_Hong_Kong.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#957b6c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cotton_plant%2C_Ware_County%2C_GA%2C_US.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cotton_plant%2C_Ware_County%2C_GA%2C_US.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#868f6f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Adansonia_grandidieri04.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Adansonia_grandidieri04.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#9ba59f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hong_Kong_Okra_Aug_25_2012.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Hong_Kong_Okra_Aug_25_2012.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#588f55\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hibiscus_flower_uploaded_by_Vijayanrajapuram_02.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hibiscus_flower_uploaded_by_Vijayanrajapuram_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6b5b50\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Daphne_philippi1.jpg\" target=\"_blank\"><img src=\"thumbnails/Daphne_philippi1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#7a963e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thymelaea_hirsuta_kz2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Thymelaea_hirsuta_kz2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#8b8866\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leptolaena_multiflora.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Leptolaena_multiflora.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#5b6357\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grielum_humifusum1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Grielum_humifusum1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6d5d30\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Munting_calab_070609_214_ipb.jpg\" target=\"_blank\"><img src=\"thumbnails/Munting_calab_070609_214_ipb.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"465\" height=\"385\" style=\"background-color:#5b7756\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bixa_bluete.jpg\" target=\"_blank\"><img src=\"thumbnails/Bixa_bluete.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"689\" height=\"485\" style=\"background-color:#5c6c43\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cistus_incanus_2004.jpg\" target=\"_blank\"><img src=\"thumbnails/Cistus_incanus_2004.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#81855d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cytinus_hypocistis06052003_1.JPG\" target=\"_blank\"><img src=\"thumbnails/Cytinus_hypocistis06052003_1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"511\" style=\"background-color:#524528\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Malva_sylvestris3.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Malva_sylvestris3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"336\" style=\"background-color:#534e53\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_brassicales\" class=\"tree_box\"><span><span>Brassicales</span><a href=\"https://en.wikipedia.org/wiki/Brassicales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Brassicales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Brassicales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(cabbage, cauliflower, Brussels sprout, broccoli, kale, mustard, turnip, bok choy, rapeseed, radish, horseradish, caper, papaya, turtleweed)</span><p class=\"tag\">Includes the mustard and cabbage family, Brassicaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Yellow_and_red_Tropaeolum_majus_%28Garden_nasturtium%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Yellow_and_red_Tropaeolum_majus_%28Garden_nasturtium%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#596b25\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tovaria_pendula_03.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tovaria_pendula_03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"338\" style=\"background-color:#697344\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tiganophyton_karasense_Photo_474711747%2C_no_rights_reserved.jpeg\" target=\"_blank\"><img src=\"thumbnails/Tiganophyton_karasense_Photo_474711747%2C_no_rights_reserved.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"375\" style=\"background-color:#907c5e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Peelo_10.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Peelo_10.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#b1a685\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Moringa_ovalifolia.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Moringa_ovalifolia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"378\" style=\"background-color:#717a80\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Koeberlinia_spinosa_WikiPlant.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Koeberlinia_spinosa_WikiPlant.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#374516\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Polanisia_erosa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Polanisia_erosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#807949\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Carica_papaya_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-029.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Carica_papaya_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-029.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"353\" style=\"background-color:#bdc2a0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Capullito_capullito.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Capullito_capullito.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#505842\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Arabidopsis_thaliana.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Arabidopsis_thaliana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"347\" style=\"background-color:#9d9480\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Radish_3371103037_4ab07db0bf_o.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Radish_3371103037_4ab07db0bf_o.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7c876e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Reseda_lutea1.jpg\" target=\"_blank\"><img src=\"thumbnails/Reseda_lutea1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#70894e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brassica_oleracea0.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Brassica_oleracea0.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#869564\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Smelowskia_americana_4859.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Smelowskia_americana_4859.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#625a53\"></a><a href=\"https://commons.wikimedia.org/wiki/File:LunariaAnnua1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-LunariaAnnua1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#3c4131\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Batis_maritima_male.jpg\" target=\"_blank\"><img src=\"thumbnails/Batis_maritima_male.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"450\" height=\"600\" style=\"background-color:#768648\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Akania_bidwillii_leaves.jpg\" target=\"_blank\"><img src=\"thumbnails/500px-Akania_bidwillii_leaves.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"666\" style=\"background-color:#5c7041\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Limnanthes_douglasii_flowers.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Limnanthes_douglasii_flowers.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"282\" style=\"background-color:#5d5f2c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gyrostemon_ramulosis_habitus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gyrostemon_ramulosis_habitus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#898573\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_huerteales\" class=\"tree_box\"><span><span>Huerteales</span><a href=\"https://en.wikipedia.org/wiki/Huerteales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Huerteales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Huerteales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">Woody eudicots  with leaves that alternate and have toothed margins. The inflorescence is cymose.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Starr_020925-0042_Perrottetia_sandwicensis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Starr_020925-0042_Perrottetia_sandwicensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#74734e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gerrardina_foliosa_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gerrardina_foliosa_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"301\" style=\"background-color:#707f31\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tapiscia_sinensis_01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tapiscia_sinensis_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#76843e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_sapindales\" class=\"tree_box\"><span><span>Sapindales</span><a href=\"https://en.wikipedia.org/wiki/Sapindales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sapindales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sapindales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(citrus, maples, horse-chestnuts, lychees, rambutans, mangos, cashews, frankincense, myrrh, mahogany, neem)</span><p class=\"tag\">Includes the soapberry family, Sapindaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Starr-170913-0143-Sapindus_saponaria-fruit-CTAHR_Urban_Garden_Center_Pearl_City-Oahu_-_Flickr_-_Starr_Environmental.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Starr-170913-0143-Sapindus_saponaria-fruit-CTAHR_Urban_Garden_Center_Pearl_City-Oahu_-_Flickr_-_Starr_Environmental.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#67623b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Die_Weinraute%2C_lat._Ruta_graveolens%2C_Bl%C3%BCten.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Die_Weinraute%2C_lat._Ruta_graveolens%2C_Bl%C3%BCten.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#587438\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nitraria_billardierei_%288729570925%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nitraria_billardierei_%288729570925%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"266\" style=\"background-color:#32361f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Palo_mulato.JPG\" target=\"_blank\"><img src=\"thumbnails/Palo_mulato.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#7e9194\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cashewnuts_hanging_on_a_Cashew_Tree.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cashewnuts_hanging_on_a_Cashew_Tree.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#9c9f83\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MangoImmatureFruits.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-MangoImmatureFruits.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#657b3c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Poison_ivy_in_May_beside_Appalachian_Trail_in_Rockfish_Gap_VA_area_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Poison_ivy_in_May_beside_Appalachian_Trail_in_Rockfish_Gap_VA_area_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"246\" style=\"background-color:#4d763b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Toxicodendron_pubescens.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Toxicodendron_pubescens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"217\" style=\"background-color:#6b7a58\"></a><a href=\"https://commons.wikimedia.org/wiki/File:860631-Pistachio-IMG_6862-2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-860631-Pistachio-IMG_6862-2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7d5b48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acer_palmatum_sango_kaku.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Acer_palmatum_sango_kaku.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#838257\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lychee.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lychee.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#2d271e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acer_saccharum.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Acer_saccharum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#719255\"></a><a href=\"https://commons.wikimedia.org/wiki/File:OrangeBloss_wb.jpg\" target=\"_blank\"><img src=\"thumbnails/OrangeBloss_wb.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"578\" height=\"509\" style=\"background-color:#534d28\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%D7%90%D7%A4%D7%A8%D7%A1%D7%9E%D7%95%D7%9F2.jpg\" target=\"_blank\"><img src=\"thumbnails/%D7%90%D7%A4%D7%A8%D7%A1%D7%9E%D7%95%D7%9F2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"571\" height=\"428\" style=\"background-color:#625c56\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Big-leaved_Mahogany.jpg\" target=\"_blank\"><img src=\"thumbnails/Big-leaved_Mahogany.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"700\" height=\"465\" style=\"background-color:#686f2e\"></a></div></div></div></li></ul></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Core eudicots_Superasterids\"><label class=\"tree_label\" for=\"Core eudicots_Superasterids\"></label><div class=\"outer_tree_box\"><div id=\"eudicots_superasterids\" class=\"tree_box\"><span><span>Superasterids</span><a href=\"https://en.wikipedia.org/wiki/Superasterids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Superasterids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Superasterids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_berberidopsidales\" class=\"tree_box\"><span><span>Berberidopsidales</span><a href=\"https://en.wikipedia.org/wiki/Berberidopsidales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Berberidopsidales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Berberidopsidales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(olivillo)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Aextoxicon_punctatum_flor_femenina_-_Flickr_-_Pato_Novoa.jpg\" target=\"_blank\"><img src=\"thumbnails/Aextoxicon_punctatum_flor_femenina_-_Flickr_-_Pato_Novoa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#434b45\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aextoxicon_punctatum_%2853136865463%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aextoxicon_punctatum_%2853136865463%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"334\" style=\"background-color:#42502e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vine_near_the_skywalk_Dorrigo_National_Park.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vine_near_the_skywalk_Dorrigo_National_Park.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"329\" height=\"206\" style=\"background-color:#5a7446\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Streptothamnus_moorei.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Streptothamnus_moorei.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#586e32\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aetoxicon8.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aetoxicon8.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#8f9973\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_santalales\" class=\"tree_box\"><span><span>Santalales</span><a href=\"https://en.wikipedia.org/wiki/Santalales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Santalales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Santalales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(sandalwoods, many mistletoes)</span><p class=\"tag\">its type genus, Santalum (sandalwood)</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Starr_041006-0222_Santalum_haleakalae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Starr_041006-0222_Santalum_haleakalae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#816f63\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Viscum_minimum2_ies.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Viscum_minimum2_ies.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"289\" style=\"background-color:#9c7242\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mistletoe_in_White_Poplar_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Mistletoe_in_White_Poplar_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"308\" style=\"background-color:#697a8c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SantalumAlbumLeaf.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-SantalumAlbumLeaf.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#7f9a36\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%E6%AA%80%E9%A6%99_Santalum_album_20210712091332_04.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-%E6%AA%80%E9%A6%99_Santalum_album_20210712091332_04.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"325\" style=\"background-color:#5b7b1f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_caryophyllales\" class=\"tree_box\"><span><span>Caryophyllales</span><a href=\"https://en.wikipedia.org/wiki/Caryophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Caryophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Caryophyllales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(cacti, carnations, beets, quinoa, spinach, amaranths, pigfaces, oraches, saltbushes, goosefoots, sundews, Venus flytraps, monkey cup pitcher plants, Malabar spinach, bougainvilleas, four o&#x27;clock flowers, buckwheat, knotweeds, rhubarb, sorrel, portulacas, jojoba, tamarisks)</span><p class=\"tag\">Includes the carnation family, Caryophyllaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cardon_Pachycereus_pringlei.jpg\" target=\"_blank\"><img src=\"thumbnails/Cardon_Pachycereus_pringlei.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"238\" height=\"301\" style=\"background-color:#86969a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rhipsalis_paradoxa.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Rhipsalis_paradoxa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#50543e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dianthus_caryophyllus_L_%28Clove_pink%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Dianthus_caryophyllus_L_%28Clove_pink%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"304\" style=\"background-color:#8c6c71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Beta_vulgaris_subsp_maritima_89-08.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Beta_vulgaris_subsp_maritima_89-08.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"210\" style=\"background-color:#6b6949\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Reismelde.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Reismelde.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"405\" style=\"background-color:#6d7264\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spinacia_oleracea_Spinazie_bloeiend.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Spinacia_oleracea_Spinazie_bloeiend.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"326\" style=\"background-color:#598647\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amaranthus_tricolor0.jpg\" target=\"_blank\"><img src=\"thumbnails/Amaranthus_tricolor0.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#978c43\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Mesembryanthemum_crystallinum.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Mesembryanthemum_crystallinum.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#866858\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Atriplex_nummularia.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Atriplex_nummularia.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#768694\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chenopodium_berlandieri_NPS-1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chenopodium_berlandieri_NPS-1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6b6150\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Drosera_spatulata_KansaiHabit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Drosera_spatulata_KansaiHabit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#724c48\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Venus_Flytrap_showing_trigger_hairs.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Venus_Flytrap_showing_trigger_hairs.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"273\" style=\"background-color:#7d3621\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nepenthes_peltata.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nepenthes_peltata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#807452\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pink_paperflowers_%28Bougainvillea_glabra%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pink_paperflowers_%28Bougainvillea_glabra%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#816749\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gul-Abas-4-O%27clock_plant.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Gul-Abas-4-O%27clock_plant.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#777c40\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Japanese_Buckwheat_Flower.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Japanese_Buckwheat_Flower.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#414718\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rheum_rhabarbarum.2006-04-27.uellue.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Rheum_rhabarbarum.2006-04-27.uellue.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#80837e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%28MHNT%29_Rumex_acetosa_-_Habit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%28MHNT%29_Rumex_acetosa_-_Habit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#7b805b\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Superasterids_Asterids\"><label class=\"tree_label\" for=\"Superasterids_Asterids\"></label><div class=\"outer_tree_box\"><div id=\"eudicots_asterids\" class=\"tree_box\"><span><span>Asterids</span><a href=\"https://en.wikipedia.org/wiki/Asterids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Asterids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Asterids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_cornales\" class=\"tree_box\"><span><span>Cornales</span><a href=\"https://en.wikipedia.org/wiki/Cornales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cornales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cornales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(Assegai trees, happy trees, dove trees)</span><p class=\"tag\">Includes the dogwood family, Cornaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cornus_suecica_Ume_River.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cornus_suecica_Ume_River.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#628047\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Curtisia_dentata_-_Assegai_tree_-_Table_Mountain_6.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Curtisia_dentata_-_Assegai_tree_-_Table_Mountain_6.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"298\" style=\"background-color:#7d886f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Grubbia_tomentosa_58439387.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Grubbia_tomentosa_58439387.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6f6e47\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caiophora.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caiophora.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#968863\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Davidia_involucrata_flowering_branch.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Davidia_involucrata_flowering_branch.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#5a775e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydrangea_macrophylla_-_Bigleaf_hydrangea2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hydrangea_macrophylla_-_Bigleaf_hydrangea2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7f696b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fendlera_rupicola_var._rupicola_%2819362832713%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fendlera_rupicola_var._rupicola_%2819362832713%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#50503d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_ericales\" class=\"tree_box\"><span><span>Ericales</span><a href=\"https://en.wikipedia.org/wiki/Ericales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ericales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ericales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(camellias, persimmon, ebony, blueberry, cranberry, lingonberry, huckleberry, kiwifruit, Brazil nut, argan, sapote, azaleas, rhododendrons, heather, heath, impatiens, phlox, Jacob&#x27;s ladder, primroses, cyclamens, shea, sapodilla, pouterias, trumpet pitchers)</span><p class=\"tag\">Includes the heather family, Ericaceae</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Camellia_sasanqua1JAM343.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Camellia_sasanqua1JAM343.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#983653\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Diospyros_whyteana_IMG_2651.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Diospyros_whyteana_IMG_2651.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#546f30\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Daboecia_cantabrica1373917974.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Daboecia_cantabrica1373917974.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#49382d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%E0%B4%B8%E0%B4%AA%E0%B5%8D%E0%B4%AA%E0%B5%8B%E0%B4%9F%E0%B5%8D%E0%B4%9F.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%E0%B4%B8%E0%B4%AA%E0%B5%8D%E0%B4%AA%E0%B5%8B%E0%B4%9F%E0%B5%8D%E0%B4%9F.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"266\" style=\"background-color:#7f8d4e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sarracenia_purpurea_pitchers_Brown%27s_Lake_Bog.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Sarracenia_purpurea_pitchers_Brown%27s_Lake_Bog.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"284\" style=\"background-color:#90764b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vitellaria_paradoxa_MS_6563.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Vitellaria_paradoxa_MS_6563.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#9eaa99\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wild_cyclamens.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Wild_cyclamens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#5d5a4c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Polemonium_reptans_2009.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Polemonium_reptans_2009.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#55633c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phlox_Paniculata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phlox_Paniculata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#84607e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Impatiens_scapiflora.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Impatiens_scapiflora.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"287\" style=\"background-color:#3f342e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leptecophylla_juniperina.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Leptecophylla_juniperina.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#353231\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CallunaVulgaris.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-CallunaVulgaris.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#6e6248\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Alpenroos.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Alpenroos.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7a726d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:George_Taber_azalea.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-George_Taber_azalea.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#6e5c57\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bog_huckleberry.jpg\" target=\"_blank\"><img src=\"thumbnails/Bog_huckleberry.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"391\" height=\"393\" style=\"background-color:#898848\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cranberry_bog.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cranberry_bog.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"218\" style=\"background-color:#483d2d\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Asterids_Campanulids\"><label class=\"tree_label\" for=\"Asterids_Campanulids\"></label><div class=\"outer_tree_box\"><div id=\"eudicots_campanulids\" class=\"tree_box\"><span><span>Campanulids</span><a href=\"https://en.wikipedia.org/wiki/Campanulids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Campanulids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Campanulids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_aquifoliales\" class=\"tree_box\"><span><span>Aquifoliales</span><a href=\"https://en.wikipedia.org/wiki/Aquifoliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Aquifoliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Aquifoliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(holly)</span><p class=\"tag\">A eudicot order that includes the holly family, Aquifoliaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Ilex-aquifolium_%28Europaeische_Stechpalme-1%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ilex-aquifolium_%28Europaeische_Stechpalme-1%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#617560\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Citronella_moorei_juvenile2.JPG\" target=\"_blank\"><img src=\"thumbnails/Citronella_moorei_juvenile2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"480\" height=\"360\" style=\"background-color:#676d5a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Helwingia_japonica_m.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Helwingia_japonica_m.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#536d53\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Helwingia_japonica_%28fruits_s4%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Helwingia_japonica_%28fruits_s4%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#5b7518\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gomphandra_australiana.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gomphandra_australiana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#576122\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_asterales\" class=\"tree_box\"><span><span>Asterales</span><a href=\"https://en.wikipedia.org/wiki/Asterales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Asterales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Asterales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ˌæstəˈreɪliːz\" target=\"_blank\">ˌæstəˈreɪliːz</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(lettuces, sunflowers, artichokes, pot marigold, coneflowers, daisies, fleabane, chrysanthemums, dahlias, zinnias, heleniums, yarrow)</span><p class=\"tag\">an order of dicotyledonous flowering plants that includes the large family Asteraceae known for composite flowers made of florets, and related families. One has evolved to be similar to the water lilies.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:A_sunflower.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-A_sunflower.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#615f1d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wittsteinia_vaccinacea.JPG\" target=\"_blank\"><img src=\"thumbnails/Wittsteinia_vaccinacea.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#505347\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Corokia_virgata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Corokia_virgata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#626342\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Calycera_calcitrapa%2C_Calyceraceae_%288639683617%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Calycera_calcitrapa%2C_Calyceraceae_%288639683617%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"315\" style=\"background-color:#7b7a5b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Campanula_cespitosa.jpg\" target=\"_blank\"><img src=\"thumbnails/Campanula_cespitosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#6d7768\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nymphoides_ezannoi_%28aka%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nymphoides_ezannoi_%28aka%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"291\" style=\"background-color:#748748\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abrophyllum_ornans_Elvina_Bay.JPG\" target=\"_blank\"><img src=\"thumbnails/Abrophyllum_ornans_Elvina_Bay.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"481\" style=\"background-color:#6c8265\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cuttsia_viburnea_2329.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cuttsia_viburnea_2329.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#57604e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stylidium_amoenum_gdaywa1.jpg\" target=\"_blank\"><img src=\"thumbnails/Stylidium_amoenum_gdaywa1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"375\" style=\"background-color:#6c705f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Artichoke_J1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Artichoke_J1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"339\" style=\"background-color:#587f2d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lactuca_tuberosa_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lactuca_tuberosa_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"327\" style=\"background-color:#6f835e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_escalloniales\" class=\"tree_box\"><span><span>Escalloniales</span><a href=\"https://en.wikipedia.org/wiki/Escalloniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Escalloniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Escalloniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">A eudicot order that includes the Escalloniaceae family.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Starr_050817-3953_Escallonia_rubra_var._macrantha.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Starr_050817-3953_Escallonia_rubra_var._macrantha.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#30351c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anopterus_macleayanus.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Anopterus_macleayanus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"273\" style=\"background-color:#5c6e36\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eremosyne_pectinata_-_Flickr_-_Kevin_Thiele_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eremosyne_pectinata_-_Flickr_-_Kevin_Thiele_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"284\" style=\"background-color:#212016\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Escallonia-virgata-close.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Escallonia-virgata-close.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"209\" style=\"background-color:#424b29\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Forgesia_racemosa.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Forgesia_racemosa.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#453a1b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Polyosma_cunninghamii_at_Mount_Banda_Banda.jpg\" target=\"_blank\"><img src=\"thumbnails/Polyosma_cunninghamii_at_Mount_Banda_Banda.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"480\" height=\"361\" style=\"background-color:#4e5c39\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tribeles_australis_342571777.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tribeles_australis_342571777.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7f7d65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Valdivia_gayana_imported_from_iNaturalist_photo_111498848_on_20_September_2023.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Valdivia_gayana_imported_from_iNaturalist_photo_111498848_on_20_September_2023.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#516846\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_bruniales\" class=\"tree_box\"><span><span>Bruniales</span><a href=\"https://en.wikipedia.org/wiki/Bruniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Bruniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Bruniales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">A eudicot order that includes the Bruniaceae family.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Berzelia_lanuginosa_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Berzelia_lanuginosa_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#6e7037\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Audouinia_capitata_1DS-II_1-8839.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Audouinia_capitata_1DS-II_1-8839.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"261\" style=\"background-color:#44281f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Brunia20090406_19.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Brunia20090406_19.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"276\" style=\"background-color:#686030\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Desfontainia_spinosa.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Desfontainia_spinosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"410\" style=\"background-color:#dbdbca\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_apiales\" class=\"tree_box\"><span><span>Apiales</span><a href=\"https://en.wikipedia.org/wiki/Apiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Apiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Apiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(carrots, celery, coriander, parsley, parsnips, poison hemlock, ginseng, ivies, pittosporums)</span><p class=\"tag\">An order of eudicots with the type being the carrot family, Apiaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Aralia_elata_en_fleur4081.jpg\" target=\"_blank\"><img src=\"thumbnails/Aralia_elata_en_fleur4081.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#616c34\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Griselinia_littoralis.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Griselinia_littoralis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"343\" style=\"background-color:#8e9270\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pennantiacorymbosa2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pennantiacorymbosa2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#658032\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Starr_051004-4689_Pittosporum_confertiflorum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Starr_051004-4689_Pittosporum_confertiflorum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4a5926\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Toricellia_angulata_var._intermedia_-_Kunming_Botanical_Garden_-_DSC02765.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Toricellia_angulata_var._intermedia_-_Kunming_Botanical_Garden_-_DSC02765.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#727e56\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vegetable-Carrot-Bundle-wStalks.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vegetable-Carrot-Bundle-wStalks.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"187\" style=\"background-color:#d0d1bf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coriandrum_sativum_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-193.jpg\" target=\"_blank\"><img src=\"thumbnails/Coriandrum_sativum_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-193.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"470\" height=\"592\" style=\"background-color:#e4e6d7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Conium_maculatum_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-191.jpg\" target=\"_blank\"><img src=\"thumbnails/Conium_maculatum_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-191.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"444\" height=\"596\" style=\"background-color:#dde3cf\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ginsengpflanze.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ginsengpflanze.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#91a678\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hedera_algeriensis_kz01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hedera_algeriensis_kz01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#6d8361\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pittosporum_heterophyllum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pittosporum_heterophyllum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#545c3b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Umbella.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Umbella.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"304\" style=\"background-color:#8f8d77\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_dipsacales\" class=\"tree_box\"><span><span>Dipsacales</span><a href=\"https://en.wikipedia.org/wiki/Dipsacales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dipsacales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dipsacales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(honeysuckle, elderflowers, elderberrie, viburnum, valerian)</span><p class=\"tag\">Includes the teasel genus, Dipsacus.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Adoxa_moschatellina01.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Adoxa_moschatellina01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"381\" style=\"background-color:#738449\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sambucus-berries.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sambucus-berries.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#5f7430\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Viburnum_opulus_C.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Viburnum_opulus_C.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"266\" style=\"background-color:#576338\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Honeysuckle_w_y.jpg\" target=\"_blank\"><img src=\"thumbnails/Honeysuckle_w_y.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"171\" style=\"background-color:#537c52\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cephalaria_gigantea_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cephalaria_gigantea_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"298\" style=\"background-color:#404c24\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dipsacus_fullonum1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dipsacus_fullonum1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"348\" style=\"background-color:#64704e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dipsacus_pilosus01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dipsacus_pilosus01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#313b27\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sambucus_canadensis_W2_IMG_3144.jpg\" target=\"_blank\"><img src=\"thumbnails/Sambucus_canadensis_W2_IMG_3144.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#838454\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_paracryphiales\" class=\"tree_box\"><span><span>Paracryphiales</span><a href=\"https://en.wikipedia.org/wiki/Paracryphiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Paracryphiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Paracryphiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=possumwood\" target=\"_blank\">possumwood</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">A eudicot order that includes the Paracryphia family.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Quintinia_sieberi.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Quintinia_sieberi.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#515b43\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Small_tree_Banda_Banda.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Small_tree_Banda_Banda.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"356\" style=\"background-color:#4f564f\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Asterids_Lamiids\"><label class=\"tree_label\" for=\"Asterids_Lamiids\"></label><div class=\"outer_tree_box\"><div id=\"eudicots_lamiids\" class=\"tree_box\"><span><span>Lamiids</span><a href=\"https://en.wikipedia.org/wiki/Lamiids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lamiids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lamiids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_solanales\" class=\"tree_box\"><span><span>Solanales</span><a href=\"https://en.wikipedia.org/wiki/Solanales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Solanales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Solanales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(potatoes, eggplants, tomatoes, chili peppers, tobacco, petunias, nightshades, morning glory, sweet potato)</span><p class=\"tag\">A eudicot order that includes the nightshades family, Solanaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Potato_plants.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Potato_plants.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#85967a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Solanum_melongena_24_08_2012_%281%29.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Solanum_melongena_24_08_2012_%281%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"273\" style=\"background-color:#6c8e40\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tomato_flower_and_young_fruit.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tomato_flower_and_young_fruit.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"279\" style=\"background-color:#788557\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thai_peppers.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Thai_peppers.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#50561c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Native_American_tobacco_flower.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Native_American_tobacco_flower.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#617f2b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Petunia_exserta_by_Scott_Zona_-_004_%281%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Petunia_exserta_by_Scott_Zona_-_004_%281%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5e594b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Illustration_Solanum_dulcamara0_clean.png\" target=\"_blank\"><img src=\"thumbnails/250px-Illustration_Solanum_dulcamara0_clean.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"430\" style=\"background-color:#cdd3b4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Genasu_gadde_%28Kannada_%E0%B2%97%E0%B3%86%E0%B2%A3%E0%B2%B8%E0%B3%81_%E0%B2%97%E0%B2%A1%E0%B3%8D%E0%B2%A1%E0%B3%86%29_%2849108875711%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Genasu_gadde_%28Kannada_%E0%B2%97%E0%B3%86%E0%B2%A3%E0%B2%B8%E0%B3%81_%E0%B2%97%E0%B2%A1%E0%B3%8D%E0%B2%A1%E0%B3%86%29_%2849108875711%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#60794b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:RMM_475_Montiniaceae-Kaliphoraceae_Grevea_madagascariensis_Baill._Maintirano%2C_Phot._PG_04_03_08_IMG_3060.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-RMM_475_Montiniaceae-Kaliphoraceae_Grevea_madagascariensis_Baill._Maintirano%2C_Phot._PG_04_03_08_IMG_3060.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#131609\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydrolea_ovata_Arkansas.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydrolea_ovata_Arkansas.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#465431\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_lamiales\" class=\"tree_box\"><span><span>Lamiales</span><a href=\"https://en.wikipedia.org/wiki/Lamiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lamiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lamiales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(basil, mint, rosemary, sage, savory, marjoram, oregano, hyssop, thyme, lavender, perilla, lemon verbena, catnip, bee balm, wild dagga, oriental motherwort, olives, ash trees, teak, foxgloves, lilacs, jasmine, snapdragons, African violets, Jacarandas, Paulownias, butterfly bushes, sesame, psyllium, bladderworts)</span><p class=\"tag\">A eudicot order that includes the mint / sage family, Lamiaceae. Includes some carnivorous and protocarnivorous plants.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pfefferminze_natur_peppermint.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pfefferminze_natur_peppermint.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#76835f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Rosemary_in_bloom.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Rosemary_in_bloom.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#78807c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Salvia_officinalis0.jpg\" target=\"_blank\"><img src=\"thumbnails/Salvia_officinalis0.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#777f79\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Origanum_majorana_002.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Origanum_majorana_002.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#415628\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Origanum_vulgare_-_harilik_pune.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Origanum_vulgare_-_harilik_pune.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#9f8437\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Variegated_Lemon_Thyme_Thymus_citriodorus_variegata_Leaves_3264px.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Variegated_Lemon_Thyme_Thymus_citriodorus_variegata_Leaves_3264px.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#627743\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lavandula_fields.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lavandula_fields.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#88949b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Catnip_flowers.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Catnip_flowers.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#78783b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Monarda_didyma_00.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Monarda_didyma_00.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#8a98cc\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Leonotis_leonurus_flower.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Leonotis_leonurus_flower.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6c6831\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Olea_europaea_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-229.jpg\" target=\"_blank\"><img src=\"thumbnails/Olea_europaea_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-229.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"471\" height=\"542\" style=\"background-color:#c7d6b3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nilambur_Teak_Plantation_0666.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Nilambur_Teak_Plantation_0666.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#4b5b2f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Digitalis_purpurea2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Digitalis_purpurea2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7b8a63\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lilac.head.600pix.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lilac.head.600pix.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#686951\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jasmine_.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Jasmine_.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#456f4a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Antirrhinum_tortuosum_2601.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Antirrhinum_tortuosum_2601.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"293\" style=\"background-color:#403228\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2007-04-20Saintpaulia_ionantha03.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2007-04-20Saintpaulia_ionantha03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"273\" style=\"background-color:#6955a1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jacaranda255.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Jacaranda255.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8d8c99\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Genlisea_subglabra_Darwiniana.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Genlisea_subglabra_Darwiniana.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#69604b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pinguicula_moranensis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pinguicula_moranensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"272\" style=\"background-color:#504e29\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Uk_pond_bladderwort2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Uk_pond_bladderwort2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#ebf1d7\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_vahliales\" class=\"tree_box\"><span><span>Vahliales</span><a href=\"https://en.wikipedia.org/wiki/Vahliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Vahliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Vahliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">A eudicot order that includes the Vahliaceae family.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Vahlia_capensis_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Vahlia_capensis_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"265\" style=\"background-color:#8c8765\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_gentianales\" class=\"tree_box\"><span><span>Gentianales</span><a href=\"https://en.wikipedia.org/wiki/Gentianales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Gentianales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Gentianales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(oleander, dogbanes, milkweeds, periwinkles, coffee)</span><p class=\"tag\">A eudicot order that includes the Gentianaceae family.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pachypodium_lamerei_01.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pachypodium_lamerei_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#757266\"></a><a href=\"https://commons.wikimedia.org/wiki/File:PachypodiumLamerei.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-PachypodiumLamerei.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#737872\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gelsemium_elegans_107560597.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gelsemium_elegans_107560597.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#707a49\"></a><a href=\"https://commons.wikimedia.org/wiki/File:GentianaAcaulisRannoch.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-GentianaAcaulisRannoch.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"381\" style=\"background-color:#6f7962\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Strychnos_nux-vomica_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-266.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Strychnos_nux-vomica_-_K%C3%B6hler%E2%80%93s_Medizinal-Pflanzen-266.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"338\" style=\"background-color:#d2d5be\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cinchona.pubescens01.jpg\" target=\"_blank\"><img src=\"thumbnails/Cinchona.pubescens01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"450\" style=\"background-color:#67665b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coffee_Flowers.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Coffee_Flowers.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#687153\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CoffeeBerry.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-CoffeeBerry.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#4d573e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_boraginales\" class=\"tree_box\"><span><span>Boraginales</span><a href=\"https://en.wikipedia.org/wiki/Boraginales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Boraginales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Boraginales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(alkanet, borage, comfrey, fiddleneck, forget-me-not, geigertree, green alkanet, heliotrope, hound&#x27;s tongue, lungwort, oysterplant, purple viper&#x27;s bugloss/Salvation Jane, Siberian bugloss, viper&#x27;s bugloss)</span><p class=\"tag\">A eudicot order that includes the forget-me-not family, Boraginaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Borago_officinalis%2C_two_blossoms.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Borago_officinalis%2C_two_blossoms.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#443d4a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amsinckia_eastwoodiae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amsinckia_eastwoodiae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#847633\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myosotis_arvensis_ois.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Myosotis_arvensis_ois.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#616c3e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scarlet_cordia.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Scarlet_cordia.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#925427\"></a><a href=\"https://commons.wikimedia.org/wiki/File:CynoglossumOfficinale-bloem-kl.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-CynoglossumOfficinale-bloem-kl.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#717852\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Heliotropium_peruvianum.jpg\" target=\"_blank\"><img src=\"thumbnails/Heliotropium_peruvianum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"522\" height=\"392\" style=\"background-color:#66615e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lungwort-oliv.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lungwort-oliv.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#988e7c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Echium_plantagineum_flowers.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Echium_plantagineum_flowers.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#888476\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%28MHNT%29_Brunnera_macrophylla%2C_flowers_-_Les_Martels%2C_Giroussens_Tarn.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-%28MHNT%29_Brunnera_macrophylla%2C_flowers_-_Les_Martels%2C_Giroussens_Tarn.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"322\" style=\"background-color:#4d5e26\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Echium_vulgare_L.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Echium_vulgare_L.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#78874e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:B._officinalis-flor-1.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-B._officinalis-flor-1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#73816f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coldenia_procumbens_in_AP_W2_IMG_9943.jpg\" target=\"_blank\"><img src=\"thumbnails/Coldenia_procumbens_in_AP_W2_IMG_9943.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"661\" height=\"600\" style=\"background-color:#547849\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cordia_subcordata%2C_habitat.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cordia_subcordata%2C_habitat.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#808b67\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ehretia_dicksonii.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ehretia_dicksonii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5a5e4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:HELIOTROPIUM_EUROPAEUM_-_AGUDA_-_IB-323_%28Herba_berruguera%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-HELIOTROPIUM_EUROPAEUM_-_AGUDA_-_IB-323_%28Herba_berruguera%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#696951\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydrophyllum_occidentale.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Hydrophyllum_occidentale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"368\" style=\"background-color:#544b3c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pholismaarenarium.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pholismaarenarium.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#645650\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_garryales\" class=\"tree_box\"><span><span>Garryales</span><a href=\"https://en.wikipedia.org/wiki/Garryales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Garryales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Garryales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(silktassels)</span><p class=\"tag\">A eudicot order that includes the silktassels family, Garryaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Garrya_elliptica.jpg\" target=\"_blank\"><img src=\"thumbnails/Garrya_elliptica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"697\" height=\"569\" style=\"background-color:#96938b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Garrya-sp.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Garrya-sp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#545746\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aucuba_japonica1.jpg\" target=\"_blank\"><img src=\"thumbnails/Aucuba_japonica1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#8f927a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eucommia-ulmoides.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Eucommia-ulmoides.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5b603d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_metteniusales\" class=\"tree_box\"><span><span>Metteniusales</span><a href=\"https://en.wikipedia.org/wiki/Metteniusales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Metteniusales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Metteniusales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">A eudicot order that includes the Metteniusaceae family.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Apodytes_dimidiata_tree_-_Cape_Town_77.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Apodytes_dimidiata_tree_-_Cape_Town_77.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"381\" style=\"background-color:#87917c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Calatola_columbiana_%2814216331560%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Calatola_columbiana_%2814216331560%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6c7f78\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Emmotum_nitens.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Emmotum_nitens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#597342\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Metteniusa_tessmanniana_01.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Metteniusa_tessmanniana_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#66732b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ottoschulzia_rhodoxylon.png\" target=\"_blank\"><img src=\"thumbnails/Ottoschulzia_rhodoxylon.png\" class=\"taxa-img\" loading=\"lazy\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"eudicots_icacinales\" class=\"tree_box\"><span><span>Icacinales</span><a href=\"https://en.wikipedia.org/wiki/Icacinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Icacinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Icacinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">A eudicot order that includes the white pear family, Icacinaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Icacina_senegalensis_MS_4743.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Icacina_senegalensis_MS_4743.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"239\" style=\"background-color:#878148\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Amruta_%28Marathi-_%E0%A4%85%E0%A4%AE%E0%A5%83%E0%A4%A4%E0%A4%BE%29_%2815379062596%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Amruta_%28Marathi-_%E0%A4%85%E0%A4%AE%E0%A5%83%E0%A4%A4%E0%A4%BE%29_%2815379062596%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#2e3529\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register_html("luca_plantae_angiosperms_eudicots_fagales","<ul class=\"tree\" data-tree-range=\"fagales\"><li><input type=\"checkbox\" checked id=\"Fabids_Fagales\"><label class=\"tree_label\" for=\"Fabids_Fagales\"></label><div class=\"outer_tree_box\"><div id=\"fagales_fagales\" class=\"tree_box\"><span><span>Fagales</span><a href=\"https://en.wikipedia.org/wiki/Fagales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Fagales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Fagales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"eudicots\">See parent</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(beeches, chestnuts, oaks, walnut, pecan, hickory, birches, alders, hazels, hornbeams, she-oaks, southern beeches)</span><p class=\"tag\">A eudicot order necessarily including the beech family, Fagus.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Mountain_Beech.jpg\" target=\"_blank\"><img src=\"thumbnails/500px-Mountain_Beech.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"747\" style=\"background-color:#626862\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Myrica_faya.jpg\" target=\"_blank\"><img src=\"thumbnails/Myrica_faya.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"300\" height=\"400\" style=\"background-color:#7a7d66\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Juglans_regia_Broadview.jpg\" target=\"_blank\"><img src=\"thumbnails/506px-Juglans_regia_Broadview.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"506\" height=\"600\" style=\"background-color:#62794d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fagus_sylvatica_Purpurea_JPG4a.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fagus_sylvatica_Purpurea_JPG4a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#92775c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fagus_sylvatica_019.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fagus_sylvatica_019.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"242\" style=\"background-color:#7c9279\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Casuarina_equisetifolia_0004.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Casuarina_equisetifolia_0004.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#767d71\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gymnostoma_poissonianum_%28Scott_Zona%29_002.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Gymnostoma_poissonianum_%28Scott_Zona%29_002.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"374\" style=\"background-color:#595654\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Catkins_Corylus_avellana-Mont_Bart-5124~2015_12_26.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Catkins_Corylus_avellana-Mont_Bart-5124~2015_12_26.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#64645e\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fagales_nothofagaceae\" class=\"tree_box\"><span><span>Nothofagaceae</span><a href=\"https://en.wikipedia.org/wiki/Nothofagaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Nothofagaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Nothofagaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(false beeches, southern beeches)</span><p class=\"tag\">The southern beech family. The leaves are toothed or entire, evergreen or deciduous. The fruit is a small, flattened or triangular nut, borne in cupules containing one to seven nuts. </p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fagales_fagaceae\" class=\"tree_box\"><span><span>Fagaceae</span><a href=\"https://en.wikipedia.org/wiki/Fagaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Fagaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Fagaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=fəˈɡeɪsi.iː\" target=\"_blank\">fəˈɡeɪsi.iː</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(beeches, chestnuts, oaks)</span><p class=\"tag\">The beech family.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fagales_myricaceae\" class=\"tree_box\"><span><span>Myricaceae</span><a href=\"https://en.wikipedia.org/wiki/Myricaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Myricaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Myricaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">The bayberry family.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fagales_juglandaceae\" class=\"tree_box\"><span><span>Juglandaceae</span><a href=\"https://en.wikipedia.org/wiki/Juglandaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Juglandaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Juglandaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(walnut, pecan, hickory)</span><p class=\"tag\">The walnut family.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fagales_ticodendraceae\" class=\"tree_box\"><span><span>Ticodendraceae</span><a href=\"https://en.wikipedia.org/wiki/Ticodendraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ticodendraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ticodendraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">The ticodendron family with only one species. A tree, 20–30 m tall, superficially resembling an alder in appearance, with alternate, simple leaves 5–12 cm long with a serrated margin. Generally dioecious, with separate male and female plants.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fagales_betulaceae\" class=\"tree_box\"><span><span>Betulaceae</span><a href=\"https://en.wikipedia.org/wiki/Betulaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Betulaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Betulaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(birches, alders, hazels, hornbeams, hazel-hornbeam, hop-hornbeams)</span><p class=\"tag\">The birch family.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"fagales_casuarinaceae\" class=\"tree_box\"><span><span>Casuarinaceae</span><a href=\"https://en.wikipedia.org/wiki/Casuarinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Casuarinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Casuarinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(she-oaks, Daintree oaks)</span><p class=\"tag\">The she-oak family. Dicotyledonous flowering trees and shrubs, many of which have a distinctly pinelike aspect when seen from afar. They are naturally distributed in tropical eastern Africa, the Mascarene Islands, Southeast Asia, Malaysia, Australia, and Polynesia.</p><div></div></div></div></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register_html("luca_plantae_angiosperms_eudicots_myrtales","<ul class=\"tree\" data-tree-range=\"myrtales\"><li><input type=\"checkbox\" checked id=\"Malvids_Myrtales\"><label class=\"tree_label\" for=\"Malvids_Myrtales\"></label><div class=\"outer_tree_box\"><div id=\"myrtales_myrtales\" class=\"tree_box\"><span><span>Myrtales</span><a href=\"https://en.wikipedia.org/wiki/Myrtales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Myrtales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Myrtales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"eudicots\">See parent</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(myrtle, pōhutukawa, bay rum tree, clove, guava, acca, allspice, eucalyptus, crape myrtles, henna tree, pomegranate, water caltrop, loosestrifes, cigar plants, evening primroses, fuchsias, willowherbs, white mangrove, leadwood tree, African birch, Koster&#x27;s curse, velvet tree)</span><p class=\"tag\">Includes the myrtle family, Myrtaceae</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Alzatea_verticillata_imported_from_iNaturalist_photo_173522367_on_27_January_2022.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Alzatea_verticillata_imported_from_iNaturalist_photo_173522367_on_27_January_2022.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#597d58\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Combretum_constrictum3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Combretum_constrictum3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#5b3715\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Purple_loosestrife.jpg\" target=\"_blank\"><img src=\"thumbnails/Purple_loosestrife.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"305\" height=\"475\" style=\"background-color:#94a08a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Punica_granatum_004.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Punica_granatum_004.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#5b5e13\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trapa_natans0.jpg\" target=\"_blank\"><img src=\"thumbnails/Trapa_natans0.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#919588\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chamerion.latifolium.web.jpg\" target=\"_blank\"><img src=\"thumbnails/Chamerion.latifolium.web.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"295\" height=\"384\" style=\"background-color:#906c72\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Starr_080304-3229_Myrtus_communis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Starr_080304-3229_Myrtus_communis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#647a6b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MetrosiderosAK.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-MetrosiderosAK.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#78644f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:The_flowers_of_clove_tree_in_Pemba_island.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-The_flowers_of_clove_tree_in_Pemba_island.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8f9356\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Guava_fruit_tree.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Guava_fruit_tree.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"444\" style=\"background-color:#607a36\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eucalyptus_leucoxylon1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eucalyptus_leucoxylon1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#5d7451\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eucalyptus_deglupta-trees.jpg\" target=\"_blank\"><img src=\"thumbnails/Eucalyptus_deglupta-trees.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"375\" style=\"background-color:#707e50\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"myrtales_alzateaceae\" class=\"tree_box\"><span><span>Alzateaceae</span><a href=\"https://en.wikipedia.org/wiki/Alzateaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Alzateaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Alzateaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">Only one species.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"myrtales_combretaceae\" class=\"tree_box\"><span><span>Combretaceae</span><a href=\"https://en.wikipedia.org/wiki/Combretaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Combretaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Combretaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">The white mangrove family.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"myrtales_crypteroniaceae\" class=\"tree_box\"><span><span>Crypteroniaceae</span><a href=\"https://en.wikipedia.org/wiki/Crypteroniaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Crypteroniaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Crypteroniaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">Native to Indomalaya.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"myrtales_lythraceae\" class=\"tree_box\"><span><span>Lythraceae</span><a href=\"https://en.wikipedia.org/wiki/Lythraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lythraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lythraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(loosestrifes, hennas, pomegranates, crape myrtle)</span><p class=\"tag\">The loosestrife and pomegranate family. The leaves generally have an opposite arrangement, but sometimes are whorled or alternate. The flower petals emerge from the rim of the calyx tube and the petals often appear crumpled. Most often herbs, and less often shrubs or trees; the shrubs and trees often have flaky bark.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"myrtales_melastomataceae\" class=\"tree_box\"><span><span>Melastomataceae</span><a href=\"https://en.wikipedia.org/wiki/Melastomataceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Melastomataceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Melastomataceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=mɛləstoʊmɑːˈteɪsiˌaɪ\" target=\"_blank\">mɛləstoʊmɑːˈteɪsiˌaɪ</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"myrtales_myrtaceae\" class=\"tree_box\"><span><span>Myrtaceae</span><a href=\"https://en.wikipedia.org/wiki/Myrtaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Myrtaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Myrtaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=mərˈteɪsiˌaɪ\" target=\"_blank\">mərˈteɪsiˌaɪ</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(Myrtles, pōhutukawas, bay rum trees, cloves, guavas, accas, allspices, eucalyptuses, gum trees, paperbarks, honey-myrtles, bottlebrushes, tea-trees)</span><p class=\"tag\">The myrtle family. Found mainly in the warmer parts of Australia and America and also Africa and Asia. Usually evergreen woody trees and shrubs with few herbs. The bark is often smooth and flakes off on older trees.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"myrtales_onagraceae\" class=\"tree_box\"><span><span>Onagraceae</span><a href=\"https://en.wikipedia.org/wiki/Onagraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Onagraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Onagraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(primroses, fuchsias, willowherbs, fireweed )</span><p class=\"tag\">The evening primrose and Fuchsia family. Characterised by flowers with usually four sepals and petals; in some genera the sepals are as brightly coloured as the petals. Seeds are generally very small. Some genera have tufts of hairs to help with wind dispersal.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"myrtales_penaeaceae\" class=\"tree_box\"><span><span>Penaeaceae</span><a href=\"https://en.wikipedia.org/wiki/Penaeaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Penaeaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Penaeaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"myrtales_vochysiaceae\" class=\"tree_box\"><span><span>Vochysiaceae</span><a href=\"https://en.wikipedia.org/wiki/Vochysiaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Vochysiaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Vochysiaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">A family that likely originated in South America with most native to the Neotropics and some native to West and Central Africa. Trees or shrubs with opposite leaves; flowers are zygomorph 1-(3)-5 merous; ovary inferior or superior; one fertile stamen; fruits are capsules or winged achene. </p><div></div></div></div></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register_html("luca_plantae_angiosperms_eudicots_rosales","<ul class=\"tree\" data-tree-range=\"rosales\"><li><input type=\"checkbox\" checked id=\"Fabids_Rosales\"><label class=\"tree_label\" for=\"Fabids_Rosales\"></label><div class=\"outer_tree_box\"><div id=\"rosales_rosales\" class=\"tree_box\"><span><span>Rosales</span><a href=\"https://en.wikipedia.org/wiki/Rosales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rosales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rosales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"eudicots\">See parent</button><span class=\"badge\">Order</span></span><span class=\"common_names\">(roses, strawberries, blackberries, raspberries, apples, pears, plums, peaches, apricots, almonds, elms, figs, mulberries, nettles, hops, cannabis)</span><p class=\"tag\">A eudicot order necessarily including the rose family, Rosaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cannabis_01_bgiu.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cannabis_01_bgiu.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5c8638\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hippophae_rhamnoides-01_%28xndr%29.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Hippophae_rhamnoides-01_%28xndr%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"316\" style=\"background-color:#7d8a7f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Alb-Z._jujuba-fruit-2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Alb-Z._jujuba-fruit-2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#67724d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pilea_pumila2.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Pilea_pumila2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5c683f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:-2020-09-23_Blackberrys%2C_Coast_Path%2C_Trimingham.JPG\" target=\"_blank\"><img src=\"thumbnails/330px--2020-09-23_Blackberrys%2C_Coast_Path%2C_Trimingham.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#687261\"></a><a href=\"https://commons.wikimedia.org/wiki/File:A_close-up_of_climbing_roses.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-A_close-up_of_climbing_roses.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#7e6253\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fr%C3%BChling_bl%C3%BChender_Kirschenbaum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fr%C3%BChling_bl%C3%BChender_Kirschenbaum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"249\" style=\"background-color:#6998ad\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lyonothamnusfloribundusasp.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lyonothamnusfloribundusasp.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"243\" style=\"background-color:#5f7440\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Flowering_crabapple_in_Washington_DC.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Flowering_crabapple_in_Washington_DC.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#474023\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sorbaria_grandiflora_-_Fleurs-2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sorbaria_grandiflora_-_Fleurs-2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#5c533f\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rosales_cannabaceae\" class=\"tree_box\"><span><span>Cannabaceae</span><a href=\"https://en.wikipedia.org/wiki/Cannabaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cannabaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cannabaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">The hemp family.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rosales_dirachmaceae\" class=\"tree_box\"><span><span>Dirachmaceae</span><a href=\"https://en.wikipedia.org/wiki/Dirachmaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dirachmaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dirachmaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rosales_elaeagnaceae\" class=\"tree_box\"><span><span>Elaeagnaceae</span><a href=\"https://en.wikipedia.org/wiki/Elaeagnaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Elaeagnaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Elaeagnaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">The oleaster/Russian olive family.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rosales_moraceae\" class=\"tree_box\"><span><span>Moraceae</span><a href=\"https://en.wikipedia.org/wiki/Moraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Moraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Moraceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(common fig, breadfruit, jackfruit, mulberry)</span><p class=\"tag\">The mulberry family.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rosales_rhamnaceae\" class=\"tree_box\"><span><span>Rhamnaceae</span><a href=\"https://en.wikipedia.org/wiki/Rhamnaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rhamnaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rhamnaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">The buckthorn family.</p><div></div></div></div></li><li><input type=\"checkbox\" checked id=\"Rosales_Rosaceae\"><label class=\"tree_label\" for=\"Rosales_Rosaceae\"></label><div class=\"outer_tree_box\"><div id=\"rosales_rosaceae\" class=\"tree_box\"><span><span>Rosaceae</span><a href=\"https://en.wikipedia.org/wiki/Rosaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rosaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rosaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">The rose family.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rosales_amygdaloideae\" class=\"tree_box\"><span><span>Amygdaloideae</span><a href=\"https://en.wikipedia.org/wiki/Amygdaloideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Amygdaloideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Amygdaloideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><span class=\"common_names\">(plums, cherries, apricots, peaches, almonds, apples, pears, spireas, meadowsweets, steeplebushes, goatsbeards)</span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rosales_rosoideae\" class=\"tree_box\"><span><span>Rosoideae</span><a href=\"https://en.wikipedia.org/wiki/Rosoideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rosoideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rosoideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rosales_dryadoideae\" class=\"tree_box\"><span><span>Dryadoideae</span><a href=\"https://en.wikipedia.org/wiki/Dryadoideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dryadoideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dryadoideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subfamily</span></span><div></div></div></div></li></ul></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rosales_ulmaceae\" class=\"tree_box\"><span><span>Ulmaceae</span><a href=\"https://en.wikipedia.org/wiki/Ulmaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ulmaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ulmaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ʌlˈmeɪsi\" target=\"_blank\">ʌlˈmeɪsi</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><span class=\"common_names\">(elms, zelkovas)</span><p class=\"tag\">The elm family.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rosales_urticaceae\" class=\"tree_box\"><span><span>Urticaceae</span><a href=\"https://en.wikipedia.org/wiki/Urticaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Urticaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Urticaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=ɜːrtɪˈkeɪsiː\" target=\"_blank\">ɜːrtɪˈkeɪsiː</a>/)</span></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><p class=\"tag\">The nettle family.</p><div></div></div></div></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register_html("luca_plantae_angiosperms_monocots","<ul class=\"tree\" data-tree-range=\"monocots\"><li><input type=\"checkbox\" checked id=\"Core angiosperms_Monocots\"><label class=\"tree_label\" for=\"Core angiosperms_Monocots\"></label><div class=\"outer_tree_box\"><div id=\"monocots_monocots\" class=\"tree_box\"><span><span>Monocots</span><a href=\"https://en.wikipedia.org/wiki/Monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"angiosperms\">See parent</button><span class=\"badge\">Clade</span></span><span class=\"common_names\">(grasses, dates, onions, rice, maize, sugarcane, orchids, tulips, daffodils, lilies)</span><p class=\"tag\">Flowering plants with seeds that contain only one embryonic leaf, flowers parts in multiples of three, single pore pollen, usually parallel-veined leaves, and an atactostele (or scattered vascular tissue).</p><div><a href=\"https://commons.wikimedia.org/wiki/File:White_orchid_in_Clara_bog._03.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-White_orchid_in_Clara_bog._03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"444\" style=\"background-color:#666947\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lily_Lilium_%27Citronella%27_Flower.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lily_Lilium_%27Citronella%27_Flower.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"256\" style=\"background-color:#68737e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Seagrass_Zostera_marina_%28Dzharylhach_island%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Seagrass_Zostera_marina_%28Dzharylhach_island%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7e8955\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phoenix_Dactylifera_Date_Palm_Fields_South_Coast_Wholesale.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phoenix_Dactylifera_Date_Palm_Fields_South_Coast_Wholesale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6f6b55\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Vehn%C3%A4pelto_6.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Vehn%C3%A4pelto_6.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#a58963\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Songe-R%C3%A9union.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Songe-R%C3%A9union.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#697852\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pandanus_heterocarpus_01.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Pandanus_heterocarpus_01.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#8a8a92\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Monocots_Alismatid monocots\"><label class=\"tree_label\" for=\"Monocots_Alismatid monocots\"></label><div class=\"outer_tree_box\"><div id=\"monocots_alismatid monocots\" class=\"tree_box\"><span><span>Alismatid monocots</span><a href=\"https://en.wikipedia.org/wiki/Alismatid monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Alismatid monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Alismatid monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Grade</span></span><p class=\"tag\">The grade that includes the two basal monocot orders.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"monocots_acorales\" class=\"tree_box\"><span><span>Acorales</span><a href=\"https://en.wikipedia.org/wiki/Acorales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Acorales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Acorales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(sweet flags)</span><p class=\"tag\">An order that&#x27;s sister to all other known monocots.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Acorus_americanus_USFS-1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Acorus_americanus_USFS-1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#8a9f6e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acorus_calamus1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Acorus_calamus1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#5e7424\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"monocots_alismatales\" class=\"tree_box\"><span><span>Alismatales</span><a href=\"https://en.wikipedia.org/wiki/Alismatales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Alismatales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Alismatales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(taros, arrowgrass, surfgrass, seagrass)</span><p class=\"tag\">An order of monocots often found in aquatic and marshy habitats, and the only known to have green embryos other than the Amaryllidaceae family.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Posidonia_oceanica_%28L%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Posidonia_oceanica_%28L%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#597d7c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Butomus_umbellatus_-_harilik_luigelill_Keilas.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Butomus_umbellatus_-_harilik_luigelill_Keilas.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#6d774f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Spathiphyllum_cochlearispathum_RTBG.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Spathiphyllum_cochlearispathum_RTBG.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#60714e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:044_Dracunculus_vulgaris_at_Akrotiri_peninsula%2C_Crete%2C_Greece.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-044_Dracunculus_vulgaris_at_Akrotiri_peninsula%2C_Crete%2C_Greece.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#978f82\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ottelia_alismoides_W_IMG_0915.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ottelia_alismoides_W_IMG_0915.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"184\" style=\"background-color:#5e5d47\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Monocots_Lilioid monocots\"><label class=\"tree_label\" for=\"Monocots_Lilioid monocots\"></label><div class=\"outer_tree_box\"><div id=\"monocots_lilioid monocots\" class=\"tree_box\"><span><span>Lilioid monocots</span><a href=\"https://en.wikipedia.org/wiki/Lilioid monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Lilioid monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Lilioid monocots\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Grade</span></span><p class=\"tag\">A grade of monocots that has lily like flowers.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Shoshan-Zachi-Evenor-6964.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Shoshan-Zachi-Evenor-6964.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"317\" style=\"background-color:#7f9395\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"monocots_petrosaviales\" class=\"tree_box\"><span><span>Petrosaviales</span><a href=\"https://en.wikipedia.org/wiki/Petrosaviales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Petrosaviales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Petrosaviales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><p class=\"tag\">An order of monocots found in low-light montane rainforests with some unable to photosynthesise so instead take their food from fungi.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Japonolirion_osense_1.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Japonolirion_osense_1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#607d2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Petrosavia_sakuraii_ihenglan_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Petrosavia_sakuraii_ihenglan_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"167\" style=\"background-color:#544c3b\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"monocots_dioscoreales\" class=\"tree_box\"><span><span>Dioscoreales</span><a href=\"https://en.wikipedia.org/wiki/Dioscoreales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Dioscoreales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Dioscoreales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(yams, fairy lanterns)</span><p class=\"tag\">A monocot order of vines and herbaceous forest floor plants with some unable to photosynthesise so instead take their food from fungi.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Apteria_aphylla000004.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Apteria_aphylla000004.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#6d5847\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Thismia_rodwayi_%28Fairy_lantern%29_2.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Thismia_rodwayi_%28Fairy_lantern%29_2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#756e68\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dioscorea_balcanica_BotGardBln310505.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Dioscorea_balcanica_BotGardBln310505.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"412\" style=\"background-color:#718f51\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tiputinia_foetida_Pastaza.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tiputinia_foetida_Pastaza.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"282\" style=\"background-color:#322923\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aletris_farinosa_CBM-34.png\" target=\"_blank\"><img src=\"thumbnails/250px-Aletris_farinosa_CBM-34.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"400\" style=\"background-color:#dadbd3\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"monocots_pandanales\" class=\"tree_box\"><span><span>Pandanales</span><a href=\"https://en.wikipedia.org/wiki/Pandanales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pandanales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pandanales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(pandan, toquilla palm, palmilla)</span><p class=\"tag\">A monocot order of the pandans or screw-pines with some unable to photosynthesise so instead take their food from fungi.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Xerophyta_retinervis00.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Xerophyta_retinervis00.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#735f3d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sciaphila_secundiflora_Thwaites_ex_Benth.%2C_1855_%E9%8C%AB%E8%98%AD%E9%9C%89%E8%8D%89_%2819886718405%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sciaphila_secundiflora_Thwaites_ex_Benth.%2C_1855_%E9%8C%AB%E8%98%AD%E9%9C%89%E8%8D%89_%2819886718405%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#7e4e32\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Croomia_heterosepala_flower.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Croomia_heterosepala_flower.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7a7f62\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chottola.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chottola.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#5d8e53\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pandanus_tectorius_%285187732979%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pandanus_tectorius_%285187732979%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#678a57\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Starr_030807-0128_Carludovica_palmata.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Starr_030807-0128_Carludovica_palmata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#646c3d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"monocots_liliales\" class=\"tree_box\"><span><span>Liliales</span><a href=\"https://en.wikipedia.org/wiki/Liliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Liliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Liliales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(lillies, tulip, greenbrier)</span><p class=\"tag\">A monocot order that necessarily includes the family Liliaceae that are predominantly perennial erect or twining herbaceous and climbing plants.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Lily_Festival_2009_Neepawa_Manitoba_Canada_%2816%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Lily_Festival_2009_Neepawa_Manitoba_Canada_%2816%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6f5d4c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%D7%A6%D7%91%D7%A2%D7%95%D7%A0%D7%99%D7%9D.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-%D7%A6%D7%91%D7%A2%D7%95%D7%A0%D7%99%D7%9D.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"329\" height=\"226\" style=\"background-color:#7c662e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lilium_martagon_Tauerntal_01.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lilium_martagon_Tauerntal_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#878d8a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Smilax_aspera.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Smilax_aspera.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#767c4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:TrilliumErectum.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-TrilliumErectum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"314\" style=\"background-color:#637935\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"monocots_asparagales\" class=\"tree_box\"><span><span>Asparagales</span><a href=\"https://en.wikipedia.org/wiki/Asparagales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Asparagales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Asparagales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(dragon trees, black boys, grasstree, joshua trees, iris, agave, spider ivy, aloe)</span><p class=\"tag\">A monocot order that necessarily includes the family Asparagaceae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Tates_grass_tree_Xanthorrhoea_semiplana_tateana_%288271136148%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tates_grass_tree_Xanthorrhoea_semiplana_tateana_%288271136148%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#818066\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aloe_arborescens_on_Monte_Vumba_%284387600468%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aloe_arborescens_on_Monte_Vumba_%284387600468%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#84806f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hierbabuena_0611_Revised.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hierbabuena_0611_Revised.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"254\" style=\"background-color:#5b634c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Agave_americana_R01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Agave_americana_R01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#7e755e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Yucca_elephantipes_and_alow.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Yucca_elephantipes_and_alow.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"368\" style=\"background-color:#837c60\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Asperge_in_bloei_Asparagus_officinalis.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Asperge_in_bloei_Asparagus_officinalis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#5d8248\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2007-12-17AdventFlowerShop02.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2007-12-17AdventFlowerShop02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"400\" style=\"background-color:#6e6444\"></a><a href=\"https://commons.wikimedia.org/wiki/File:%D8%B2%D9%86%D8%A8%D9%82_%D8%AE%D9%88%D8%AF%D8%B1%D9%88_%D8%AF%D8%B1_%D8%A8%D9%87%D8%A8%D9%87%D8%A7%D9%86.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-%D8%B2%D9%86%D8%A8%D9%82_%D8%AE%D9%88%D8%AF%D8%B1%D9%88_%D8%AF%D8%B1_%D8%A8%D9%87%D8%A8%D9%87%D8%A7%D9%86.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#3a542b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:ARS_red_onion.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-ARS_red_onion.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"368\" style=\"background-color:#56523f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Yucca_elata_-_tmcelrath_01.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Yucca_elata_-_tmcelrath_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#b7b2ab\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Joshua_Tree_NP_-_Joshua_Tree_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Joshua_Tree_NP_-_Joshua_Tree_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"387\" style=\"background-color:#677074\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Nolina_Menton.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Nolina_Menton.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#76805f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:White_orchid_in_Clara_bog._03.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-White_orchid_in_Clara_bog._03.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"444\" style=\"background-color:#666947\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Monocots_Commelinids\"><label class=\"tree_label\" for=\"Monocots_Commelinids\"></label><div class=\"outer_tree_box\"><div id=\"monocots_commelinids\" class=\"tree_box\"><span><span>Commelinids</span><a href=\"https://en.wikipedia.org/wiki/Commelinids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Commelinids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Commelinids\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Clade</span></span><p class=\"tag\">Distinguished by having cell walls containing ferulic acid.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"monocots_arecales\" class=\"tree_box\"><span><span>Arecales</span><a href=\"https://en.wikipedia.org/wiki/Arecales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Arecales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Arecales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(palms, bullanocks, black gins)</span><p class=\"tag\">A monocot order that includes the palms and relatives.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:BlackGins%2CAridGarden%2CRBG-CranbourneVIC.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-BlackGins%2CAridGarden%2CRBG-CranbourneVIC.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8c8881\"></a><a href=\"https://commons.wikimedia.org/wiki/File:1859-Martinique.web.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-1859-Martinique.web.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"381\" style=\"background-color:#627e98\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"monocots_poales\" class=\"tree_box\"><span><span>Poales</span><a href=\"https://en.wikipedia.org/wiki/Poales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Poales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Poales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(grasses, rushes, bromeliads, pineapples, Spanish moss, sedges, bamboo, reeds)</span><p class=\"tag\">A monocot order that includes grasses, sedges, rushes, and bromeliads.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Carex_pseudocyperus_002307258O.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Carex_pseudocyperus_002307258O.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"331\" style=\"background-color:#63753b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Billbergia_pyramidalis_in_Hyderabad_Nursery_W_IMG_0425.jpg\" target=\"_blank\"><img src=\"thumbnails/Billbergia_pyramidalis_in_Hyderabad_Nursery_W_IMG_0425.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"523\" height=\"600\" style=\"background-color:#7a3f30\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Typha_latifolia_Finland.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Typha_latifolia_Finland.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#61839d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chimonobambusa_tumidissinoda%27s_swollen_disk-like_nodes.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chimonobambusa_tumidissinoda%27s_swollen_disk-like_nodes.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7e7f5e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pineapple1.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Pineapple1.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#7a7863\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Zbo%C5%BCe.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Zbo%C5%BCe.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#647743\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"monocots_zingiberales\" class=\"tree_box\"><span><span>Zingiberales</span><a href=\"https://en.wikipedia.org/wiki/Zingiberales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Zingiberales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Zingiberales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(gingers, banana, Bird of Paradise, plantains, galangal, arrowroot, cardamom, turmeric)</span><p class=\"tag\">A monocot order with a herbaceous arborescent stem, distichous phyllotaxy, large petiolate leaves, and inflorescences of conspicuous colorful bracts.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Starr_061212-2337_Alpinia_purpurata.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Starr_061212-2337_Alpinia_purpurata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#796c4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fresh_ginger.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Fresh_ginger.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"258\" style=\"background-color:#a0977d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2018_06_TropicalIslands_IMG_2170.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-2018_06_TropicalIslands_IMG_2170.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"272\" style=\"background-color:#5c793a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Turmeric_inflorescence.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Turmeric_inflorescence.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"376\" style=\"background-color:#797d42\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bird_of_Paradise_flower.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Bird_of_Paradise_flower.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#292c16\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cardamom_Flowers_and_Blooms.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cardamom_Flowers_and_Blooms.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#3d4836\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"monocots_commelinales\" class=\"tree_box\"><span><span>Commelinales</span><a href=\"https://en.wikipedia.org/wiki/Commelinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Commelinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Commelinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><span class=\"common_names\">(spiderwort, water hyacinth, dayflowers, kangaroo paws)</span><p class=\"tag\">A monocot order with a lack of mycorrhizal associations and tapetal raphides.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Aneilema_aequinoctiale.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Aneilema_aequinoctiale.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#4b3f1e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anigozanthos.flavidus2.jpg\" target=\"_blank\"><img src=\"thumbnails/Anigozanthos.flavidus2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"400\" height=\"600\" style=\"background-color:#6b6868\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Fruiting_Hanguana_rubinea_in_Singapore%2C_August_2023.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Fruiting_Hanguana_rubinea_in_Singapore%2C_August_2023.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"332\" style=\"background-color:#6f765e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Helmholtzia_glaberrima_2.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Helmholtzia_glaberrima_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#445a33\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eichhornia_crassipes.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Eichhornia_crassipes.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#596745\"></a></div></div></div></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_plantae_chlorophyta",[{"name":"Basal Chlorophyta prasinophytes","parent":"Chlorophyta","rank":"Grade","ipa":"","common":[],"tag":"A number of taxa basal to Chlorophyta that are most of the paraphyletic term prasinophytes. They are unicellular green algae and mainly include marine planktonic species with some freshwater representatives. They are morphologically diverse, including flagellates with one to eight flagella and non-motile unicells, as well as dormant or cyst stage phycoma. The cells of many species are covered with organic body scales; others are naked.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cb/Pyramimonas_sp_color.jpg/250px-Pyramimonas_sp_color.jpg","https://upload.wikimedia.org/wikipedia/commons/8/88/Picocystis_salinarum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b6/2023_Prasinophyte.svg/330px-2023_Prasinophyte.svg.png","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a1/Chloroparvula_2017_Lope_dos_Santos_et_al.png/330px-Chloroparvula_2017_Lope_dos_Santos_et_al.png","https://upload.wikimedia.org/wikipedia/commons/0/02/Chloropicon_sieburthii_LM_A2.png","https://upload.wikimedia.org/wikipedia/commons/8/88/Deposition_velocity_versus_cell_diameters-6.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/16/Pyramimonas_longicauda_1.jpg/250px-Pyramimonas_longicauda_1.jpg"]},{"name":"Chlorophytina","parent":"Chlorophyta","rank":"Subphylum","ipa":"","common":[],"tag":"The core chlorophytes.","imgs":[]},{"name":"Chlorodendrophyceae","parent":"Chlorophytina","rank":"Class","ipa":"","common":[],"tag":"Unicellular green algae that's flagellated that have cellular scales of carbohydrates that fuse to form the thecal wall but remain separated on the flagella. It's one of the taxa often called prasinophytes, a paraphyletic group of unicellular green algae.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/Tetraselmis_suecica_in_a_vegetative_non-motile_stage_01.jpg/250px-Tetraselmis_suecica_in_a_vegetative_non-motile_stage_01.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b9/Bacillario008.png"]},{"name":"Pedinophyceae","parent":"Chlorophytina","rank":"Class","ipa":"","common":[],"tag":"A class of single celled, asymmetric uniflagellate green algae that do not have extracellular scales.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/25/Mantoniella_tinhauana_fmicb-15-1358574-g003.jpg/330px-Mantoniella_tinhauana_fmicb-15-1358574-g003.jpg"]},{"name":"Trebouxiophyceae","parent":"Chlorophytina","rank":"Class","ipa":"","common":["trebouxiophytes"],"tag":"Single-celled, colonial, or multicellular and are found in freshwater, terrestrial or marine habitats worldwide. Many taxa form symbiotic relationships with other organisms; in particular they are the main phycobionts within lichens. Others have lost the ability to photosynthesize and have evolved to become parasitic.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/83/Chlorella_vulgaris_NIES2170.jpg/330px-Chlorella_vulgaris_NIES2170.jpg","https://upload.wikimedia.org/wikipedia/commons/2/28/Trebouxia_2_-_Miguel_Varona_-_Cuaderno_de_Campo_del_Treparriscos.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Coccomyxa_polymorpha.png/250px-Coccomyxa_polymorpha.png","https://upload.wikimedia.org/wikipedia/commons/thumb/7/77/Desmococcus_on_beech_02.jpg/250px-Desmococcus_on_beech_02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/98/Eremosphaera_viridis_361793586.jpg/330px-Eremosphaera_viridis_361793586.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/Paramecium_bursaria.jpg/330px-Paramecium_bursaria.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a4/Prototheca_wickerhamii.GMS.jpg/330px-Prototheca_wickerhamii.GMS.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1a/Phyllosiphon_arisari_244841554.jpg/330px-Phyllosiphon_arisari_244841554.jpg","https://upload.wikimedia.org/wikipedia/commons/0/0b/Microthamnion.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3c/Prasiola_stipitata_Suhr_%28AM_AK307212-1%29.jpg/330px-Prasiola_stipitata_Suhr_%28AM_AK307212-1%29.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b9/Prasiola_calophylla.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/75/Prasiola_crispa.jpg/330px-Prasiola_crispa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bb/Plants-13-02405-g005.png/250px-Plants-13-02405-g005.png","https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/Botryococcus_braunii.jpg/330px-Botryococcus_braunii.jpg"]},{"name":"Chlorophyceae","parent":"Chlorophytina","rank":"Class","ipa":"","common":["globe alga","water net"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Mikrofoto.de-volvox-4.jpg/330px-Mikrofoto.de-volvox-4.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9e/Hydrodictyon_amimidoro01.jpg/330px-Hydrodictyon_amimidoro01.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f6/Volvox_aureus.jpg/250px-Volvox_aureus.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/Pleurococcus1pl.jpg/250px-Pleurococcus1pl.jpg","https://upload.wikimedia.org/wikipedia/commons/4/42/Stigeoclonium_sp_zugespitzte_seitenzweige.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/c5/Volvocales.png/250px-Volvocales.png","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8b/Bracteacoccus_aggregatus_BM5-15_%28IPPAS_C-2045%29.png/250px-Bracteacoccus_aggregatus_BM5-15_%28IPPAS_C-2045%29.png","https://upload.wikimedia.org/wikipedia/commons/2/29/Characium_hookeri.png","https://upload.wikimedia.org/wikipedia/commons/5/57/Pediastrum.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/63/Scenedesmus_GLERL.jpg/752px-Scenedesmus_GLERL.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/56/Ankistrodesmus_spiralis_245883620.jpg/250px-Ankistrodesmus_spiralis_245883620.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/06/Radiofilum_conjunctivum_358633818.jpg/330px-Radiofilum_conjunctivum_358633818.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/de/Treubaria_triappendiculata_410318208.jpg/250px-Treubaria_triappendiculata_410318208.jpg"]},{"name":"Ulvophyceae","parent":"Chlorophytina","rank":"Class","ipa":"","common":["sea lettuces","green sea fingers","dead man's fingers","sea grapes","green caviars","killer alga","green feather alga"],"tag":"Common forms include filaments (both unbranched and branched), tubular and blade-like thalli, and siphonous thalli. Siphonous thalli are composed of a single giant cell with thousands of nuclei and chloroplasts. They have a counter-clockwise arrangement of the flagellar basal bodies, cytokinesis by furrowing, a closed persistent mitotic spindle, and the lack of a phycoplast.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Meersalat-Ulva-lactuca.jpg/330px-Meersalat-Ulva-lactuca.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/Tufts_of_gutweed_in_Gullmarsfjorden_at_S%C3%A4mstad_1.jpg/330px-Tufts_of_gutweed_in_Gullmarsfjorden_at_S%C3%A4mstad_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Codiumfragile.jpg/330px-Codiumfragile.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d9/Tiny_Marine_Plant.jpg/330px-Tiny_Marine_Plant.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dd/Caulerpa_taxifolia_kz01.jpg/330px-Caulerpa_taxifolia_kz01.jpg","https://upload.wikimedia.org/wikipedia/commons/4/4a/HALIMEDA_PICT0294.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/82/Sea_lettuce_in_Brofjorden_1_-_cropped.jpg/250px-Sea_lettuce_in_Brofjorden_1_-_cropped.jpg","https://upload.wikimedia.org/wikipedia/commons/5/5c/Acrosiphonia_arcta.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/Gomontia_polyrhiza_%28Lagerh.%29_Bornet_and_Flahault_%28AM_AK327908%29.jpg/330px-Gomontia_polyrhiza_%28Lagerh.%29_Bornet_and_Flahault_%28AM_AK327908%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0b/Ulothrix_426.jpg/330px-Ulothrix_426.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/be/Bryopsis_vestita_29062289.jpg/330px-Bryopsis_vestita_29062289.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/Caulerpa_brownii.jpeg/330px-Caulerpa_brownii.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8e/Caulerpa_cactoides.jpeg/330px-Caulerpa_cactoides.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/dd/Caulerpa_papillosa_254297724.jpg/330px-Caulerpa_papillosa_254297724.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/23/Palm_tree_algae_%28Caulerpa_paspaloides%29_Shoots.jpg/330px-Palm_tree_algae_%28Caulerpa_paspaloides%29_Shoots.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/24/Caulerpa_prolifera133.jpg/330px-Caulerpa_prolifera133.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/82/Oval_sea_grapes%2C_Caulerpa_racemosa_var_clavifera%2C_at_5_meters_depth.jpg/330px-Oval_sea_grapes%2C_Caulerpa_racemosa_var_clavifera%2C_at_5_meters_depth.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f1/Caulerpa_racemosa_algae.jpg/330px-Caulerpa_racemosa_algae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b0/Caulerpa_scalpelliformis_254298193.jpg/330px-Caulerpa_scalpelliformis_254298193.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/88/Green_seaweed_Turimetta_south.jpg/330px-Green_seaweed_Turimetta_south.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/14/Caulerpa_flexilis.jpeg/330px-Caulerpa_flexilis.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a2/The_green_seaweed%2C_Caulerpa_serrulata%2C_at_Ponta_do_Ouro%2C_Mozambique_%286661104601%29.jpg/330px-The_green_seaweed%2C_Caulerpa_serrulata%2C_at_Ponta_do_Ouro%2C_Mozambique_%286661104601%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/41/Caulerpa_sertularioides.jpg/250px-Caulerpa_sertularioides.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Codium_sp..jpg/330px-Codium_sp..jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4a/Codium_cranwelliae_180193296.jpg/330px-Codium_cranwelliae_180193296.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/Codium_edule_448245056.jpg/250px-Codium_edule_448245056.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/28/Codium_galeatum_191546726.jpg/330px-Codium_galeatum_191546726.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9a/Codium_lucasii_15550859.jpg/330px-Codium_lucasii_15550859.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7c/Codium_pomoides_256330303.jpg/330px-Codium_pomoides_256330303.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Codium_spongiosum_R%C3%A9union.jpg/330px-Codium_spongiosum_R%C3%A9union.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Codium_tenue_354934676.jpg/250px-Codium_tenue_354934676.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/98/Alga_marina_%28Codium_tomentosum%29%2C_isla_de_Mouro%2C_Santander%2C_Espa%C3%B1a%2C_2019-08-14%2C_DD_09.jpg/330px-Alga_marina_%28Codium_tomentosum%29%2C_isla_de_Mouro%2C_Santander%2C_Espa%C3%B1a%2C_2019-08-14%2C_DD_09.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7e/Derbesia_sp..jpg/330px-Derbesia_sp..jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Avrainvillea_cf._amadelpha.jpg/330px-Avrainvillea_cf._amadelpha.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b4/Anadyomene_wrightii.JPG/330px-Anadyomene_wrightii.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Boodlea_composita.jpg/330px-Boodlea_composita.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a0/FilamentousChlorophyceae_SaintJosephReunion.jpg/330px-FilamentousChlorophyceae_SaintJosephReunion.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/40/Aegagropila_linnaei%2C_Hokkaido%2C_Japan.jpg/330px-Aegagropila_linnaei%2C_Hokkaido%2C_Japan.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/63/Boergesenia_forbesii_02.jpg/330px-Boergesenia_forbesii_02.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/51/Dictyosphaeria_cavernosa.jpg/330px-Dictyosphaeria_cavernosa.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/Bornetella_sphaerica.jpg/330px-Bornetella_sphaerica.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Cymopolia_barbata_455574231.jpg/330px-Cymopolia_barbata_455574231.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ed/Neomeris_vanbosseae.jpg/330px-Neomeris_vanbosseae.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/5f/Acetabularia_sp_20110530a.jpg/250px-Acetabularia_sp_20110530a.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/a/a5/C12_Cephaleuros_parasiticus_%285825293084%29.jpg/250px-C12_Cephaleuros_parasiticus_%285825293084%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d8/Trentepohlia_aurea_130408.jpg/330px-Trentepohlia_aurea_130408.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/db/Blidingia_minima.jpg/250px-Blidingia_minima.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d9/Percursaria_percusa_%28C.Agardh%29_Rosenv._%28AM_AK307496-1%29.jpg/330px-Percursaria_percusa_%28C.Agardh%29_Rosenv._%28AM_AK307496-1%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/68/Tufts_of_gutweed_in_Gullmarsfjorden_at_S%C3%A4mstad_1.jpg/330px-Tufts_of_gutweed_in_Gullmarsfjorden_at_S%C3%A4mstad_1.jpg"]}],{},{"250px-Acetabularia_sp_20110530a.jpg":[250,333,"#597f6b"],"250px-Ankistrodesmus_spiralis_245883620.jpg":[250,336,"#c1b7b1"],"250px-Blidingia_minima.jpg":[250,333,"#566b1d"],"250px-Bracteacoccus_aggregatus_BM5-15_(IPPAS_C-2045).png":[250,247,"#cacb97"],"250px-C12_Cephaleuros_parasiticus_(5825293084).jpg":[250,375,"#5b5e0f"],"250px-Caulerpa_sertularioides.jpg":[250,333,"#535c41"],"250px-Coccomyxa_polymorpha.png":[250,287,"#969a81"],"250px-Codium_edule_448245056.jpg":[250,313,"#8c8e6a"],"250px-Codium_tenue_354934676.jpg":[250,250,"#837d74"],"250px-Desmococcus_on_beech_02.jpg":[250,333,"#8d7e59"],"250px-Plants-13-02405-g005.png":[250,249,"#909778"],"250px-Pleurococcus1pl.jpg":[250,333,"#879137"],"250px-Pyramimonas_longicauda_1.jpg":[250,250,"#264882"],"250px-Pyramimonas_sp_color.jpg":[250,250,"#1f2e22"],"250px-Sea_lettuce_in_Brofjorden_1_-_cropped.jpg":[250,250,"#515b29"],"250px-Tetraselmis_suecica_in_a_vegetative_non-motile_stage_01.jpg":[250,254,"#878885"],"250px-Treubaria_triappendiculata_410318208.jpg":[250,375,"#cbc8d3"],"250px-Volvocales.png":[250,293,"#d5d7ca"],"250px-Volvox_aureus.jpg":[250,250,"#c3d9c2"],"330px-2023_Prasinophyte.svg.png":[330,265,null],"330px-Aegagropila_linnaei,_Hokkaido,_Japan.jpg":[330,247,"#7b7436"],"330px-Alga_marina_(Codium_tomentosum),_isla_de_Mouro,_Santander,_España,_2019-08-14,_DD_09.jpg":[330,220,"#77adc4"],"330px-Anadyomene_wrightii.JPG":[330,233,"#808058"],"330px-Avrainvillea_cf._amadelpha.jpg":[330,238,"#625644"],"330px-Boergesenia_forbesii_02.jpg":[330,230,"#928b60"],"330px-Boodlea_composita.jpg":[330,244,"#696f54"],"330px-Bornetella_sphaerica.jpg":[330,261,"#6a6f5e"],"330px-Botryococcus_braunii.jpg":[330,247,"#91907e"],"330px-Bryopsis_vestita_29062289.jpg":[330,220,"#758864"],"330px-Caulerpa_brownii.jpeg":[330,219,"#75942e"],"330px-Caulerpa_cactoides.jpeg":[330,219,"#6f8b43"],"330px-Caulerpa_flexilis.jpeg":[330,219,"#7d7650"],"330px-Caulerpa_papillosa_254297724.jpg":[330,247,"#8c806e"],"330px-Caulerpa_prolifera133.jpg":[330,185,"#8c611c"],"330px-Caulerpa_racemosa_algae.jpg":[330,247,"#434a1f"],"330px-Caulerpa_scalpelliformis_254298193.jpg":[330,247,"#868459"],"330px-Caulerpa_taxifolia_kz01.jpg":[330,236,"#5d656b"],"330px-Chlorella_vulgaris_NIES2170.jpg":[330,247,"#a0a789"],"330px-Chloroparvula_2017_Lope_dos_Santos_et_al.png":[330,255,"#929292"],"330px-Codium_cranwelliae_180193296.jpg":[330,247,"#b4b0aa"],"330px-Codium_galeatum_191546726.jpg":[330,301,"#8d8469"],"330px-Codium_lucasii_15550859.jpg":[330,281,"#6f6358"],"330px-Codium_pomoides_256330303.jpg":[330,247,"#968b73"],"330px-Codium_sp..jpg":[330,277,"#648f7d"],"330px-Codium_spongiosum_Réunion.jpg":[330,251,"#575744"],"330px-Codiumfragile.jpg":[330,247,"#9f926c"],"330px-Cymopolia_barbata_455574231.jpg":[330,247,"#677a2a"],"330px-Derbesia_sp..jpg":[330,269,"#5c7a36"],"330px-Dictyosphaeria_cavernosa.jpg":[330,253,"#695043"],"330px-Eremosphaera_viridis_361793586.jpg":[330,265,"#b9cc72"],"330px-FilamentousChlorophyceae_SaintJosephReunion.jpg":[330,247,"#6c785c"],"330px-Gomontia_polyrhiza_(Lagerh.)_Bornet_and_Flahault_(AM_AK327908).jpg":[330,247,"#acaca6"],"330px-Green_seaweed_Turimetta_south.jpg":[330,206,"#46643d"],"330px-Hydrodictyon_amimidoro01.jpg":[330,248,"#8e806f"],"330px-Mantoniella_tinhauana_fmicb-15-1358574-g003.jpg":[330,294,"#6f6f6f"],"330px-Meersalat-Ulva-lactuca.jpg":[330,234,"#89813e"],"330px-Mikrofoto.de-volvox-4.jpg":[330,220,"#1e261b"],"330px-Neomeris_vanbosseae.jpg":[330,230,"#6c6c56"],"330px-Oval_sea_grapes,_Caulerpa_racemosa_var_clavifera,_at_5_meters_depth.jpg":[330,216,"#1b1d23"],"330px-Palm_tree_algae_(Caulerpa_paspaloides)_Shoots.jpg":[330,247,"#807970"],"330px-Paramecium_bursaria.jpg":[330,220,"#7c8290"],"330px-Percursaria_percusa_(C.Agardh)_Rosenv._(AM_AK307496-1).jpg":[330,247,"#83865a"],"330px-Phyllosiphon_arisari_244841554.jpg":[330,247,"#5f7b3a"],"330px-Prasiola_crispa.jpg":[330,206,"#6b6c65"],"330px-Prasiola_stipitata_Suhr_(AM_AK307212-1).jpg":[330,247,"#767860"],"330px-Prototheca_wickerhamii.GMS.jpg":[330,274,"#79b9c2"],"330px-Radiofilum_conjunctivum_358633818.jpg":[330,185,"#5a5d5b"],"330px-The_green_seaweed,_Caulerpa_serrulata,_at_Ponta_do_Ouro,_Mozambique_(6661104601).jpg":[330,230,"#6f4d25"],"330px-Tiny_Marine_Plant.jpg":[330,221,"#5a603a"],"330px-Trentepohlia_aurea_130408.jpg":[330,230,"#917647"],"330px-Tufts_of_gutweed_in_Gullmarsfjorden_at_Sämstad_1.jpg":[330,229,"#636c38"],"330px-Ulothrix_426.jpg":[330,215,"#bfcbd5"],"752px-Scenedesmus_GLERL.jpg":[752,600,"#597f41"],"Acrosiphonia_arcta.jpg":[150,150,"#7f7838"],"Bacillario008.png":[175,156,"#faeaf1"],"Characium_hookeri.png":[472,383,null],"Chloropicon_sieburthii_LM_A2.png":[263,264,"#9f9e8e"],"Deposition_velocity_versus_cell_diameters-6.jpg":[348,324,"#5a5a5a"],"HALIMEDA_PICT0294.jpg":[379,480,"#757f6a"],"Microthamnion.jpg":[505,434,"#9b772e"],"Pediastrum.jpg":[600,586,"#c7b077"],"Picocystis_salinarum.jpg":[300,250,"#4d6c85"],"Prasiola_calophylla.jpg":[708,500,"#496334"],"Stigeoclonium_sp_zugespitzte_seitenzweige.jpeg":[800,600,"#b1ba9f"],"Trebouxia_2_-_Miguel_Varona_-_Cuaderno_de_Campo_del_Treparriscos.jpg":[736,464,"#32a29b"]})
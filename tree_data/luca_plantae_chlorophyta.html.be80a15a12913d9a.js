@@ -0,0 +1 @@
+TreeData.register_html("luca_plantae_chlorophyta","<ul class=\"tree\" data-tree-range=\"chlorophyta\"><li><input type=\"checkbox\" checked id=\"Viridiplantae_Chlorophyta\"><label class=\"tree_label\" for=\"Viridiplantae_Chlorophyta\"></label><div class=\"outer_tree_box\"><div id=\"chlorophyta_chlorophyta\" class=\"tree_box\"><span><span>Chlorophyta</span><a href=\"https://en.wikipedia.org/wiki/Chlorophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chlorophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chlorophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"plantae\">See parent</button><span class=\"badge\">Division</span></span><span class=\"common_names\">(green alga)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Meersalat-Ulva-lactuca.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Meersalat-Ulva-lactuca.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#89813e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulerpa_prolifera.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Caulerpa_prolifera.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"279\" style=\"background-color:#e4e0d7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dictyosphaeria_cavernosa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dictyosphaeria_cavernosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"253\" style=\"background-color:#695043\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chlorophyta_basal chlorophyta prasinophytes\" class=\"tree_box\"><span><span>Basal Chlorophyta prasinophytes</span><a href=\"https://en.wikipedia.org/wiki/Basal Chlorophyta prasinophytes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Basal Chlorophyta prasinophytes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Basal Chlorophyta prasinophytes\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Grade</span></span><p class=\"tag\">A number of taxa basal to Chlorophyta that are most of the paraphyletic term prasinophytes. They are unicellular green algae and mainly include marine planktonic species with some freshwater representatives. They are morphologically diverse, including flagellates with one to eight flagella and non-motile unicells, as well as dormant or cyst stage phycoma. The cells of many species are covered with organic body scales; others are naked.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pyramimonas_sp_color.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pyramimonas_sp_color.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#1f2e22\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Picocystis_salinarum.jpg\" target=\"_blank\"><img src=\"thumbnails/Picocystis_salinarum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"300\" height=\"250\" style=\"background-color:#4d6c85\"></a><a href=\"https://commons.wikimedia.org/wiki/File:2023_Prasinophyte.svg\" target=\"_blank\"><img src=\"thumbnails/330px-2023_Prasinophyte.svg.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"265\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chloroparvula_2017_Lope_dos_Santos_et_al.png\" target=\"_blank\"><img src=\"thumbnails/330px-Chloroparvula_2017_Lope_dos_Santos_et_al.png\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"255\" style=\"background-color:#929292\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chloropicon_sieburthii_LM_A2.png\" target=\"_blank\"><img src=\"thumbnails/Chloropicon_sieburthii_LM_A2.png\" class=\"taxa-img\" loading=\"lazy\" width=\"263\" height=\"264\" style=\"background-color:#9f9e8e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Deposition_velocity_versus_cell_diameters-6.jpg\" target=\"_blank\"><img src=\"thumbnails/Deposition_velocity_versus_cell_diameters-6.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"348\" height=\"324\" style=\"background-color:#5a5a5a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pyramimonas_longicauda_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pyramimonas_longicauda_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#264882\"></a></div></div></div></li><li><input type=\"checkbox\" checked id=\"Chlorophyta_Chlorophytina\"><label class=\"tree_label\" for=\"Chlorophyta_Chlorophytina\"></label><div class=\"outer_tree_box\"><div id=\"chlorophyta_chlorophytina\" class=\"tree_box\"><span><span>Chlorophytina</span><a href=\"https://en.wikipedia.org/wiki/Chlorophytina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chlorophytina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chlorophytina\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Subphylum</span></span><p class=\"tag\">The core chlorophytes.</p><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chlorophyta_chlorodendrophyceae\" class=\"tree_box\"><span><span>Chlorodendrophyceae</span><a href=\"https://en.wikipedia.org/wiki/Chlorodendrophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chlorodendrophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chlorodendrophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Unicellular green algae that&#x27;s flagellated that have cellular scales of carbohydrates that fuse to form the thecal wall but remain separated on the flagella. It&#x27;s one of the taxa often called prasinophytes, a paraphyletic group of unicellular green algae.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Tetraselmis_suecica_in_a_vegetative_non-motile_stage_01.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tetraselmis_suecica_in_a_vegetative_non-motile_stage_01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"254\" style=\"background-color:#878885\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bacillario008.png\" target=\"_blank\"><img src=\"thumbnails/Bacillario008.png\" class=\"taxa-img\" loading=\"lazy\" width=\"175\" height=\"156\" style=\"background-color:#faeaf1\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chlorophyta_pedinophyceae\" class=\"tree_box\"><span><span>Pedinophyceae</span><a href=\"https://en.wikipedia.org/wiki/Pedinophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pedinophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pedinophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">A class of single celled, asymmetric uniflagellate green algae that do not have extracellular scales.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Mantoniella_tinhauana_fmicb-15-1358574-g003.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mantoniella_tinhauana_fmicb-15-1358574-g003.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"294\" style=\"background-color:#6f6f6f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chlorophyta_trebouxiophyceae\" class=\"tree_box\"><span><span>Trebouxiophyceae</span><a href=\"https://en.wikipedia.org/wiki/Trebouxiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Trebouxiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Trebouxiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(trebouxiophytes)</span><p class=\"tag\">Single-celled, colonial, or multicellular and are found in freshwater, terrestrial or marine habitats worldwide. Many taxa form symbiotic relationships with other organisms; in particular they are the main phycobionts within lichens. Others have lost the ability to photosynthesize and have evolved to become parasitic.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Chlorella_vulgaris_NIES2170.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Chlorella_vulgaris_NIES2170.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a0a789\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trebouxia_2_-_Miguel_Varona_-_Cuaderno_de_Campo_del_Treparriscos.jpg\" target=\"_blank\"><img src=\"thumbnails/Trebouxia_2_-_Miguel_Varona_-_Cuaderno_de_Campo_del_Treparriscos.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"736\" height=\"464\" style=\"background-color:#32a29b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Coccomyxa_polymorpha.png\" target=\"_blank\"><img src=\"thumbnails/250px-Coccomyxa_polymorpha.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"287\" style=\"background-color:#969a81\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Desmococcus_on_beech_02.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Desmococcus_on_beech_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#8d7e59\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Eremosphaera_viridis_361793586.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Eremosphaera_viridis_361793586.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"265\" style=\"background-color:#b9cc72\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Paramecium_bursaria.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Paramecium_bursaria.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7c8290\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Prototheca_wickerhamii.GMS.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Prototheca_wickerhamii.GMS.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"274\" style=\"background-color:#79b9c2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Phyllosiphon_arisari_244841554.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Phyllosiphon_arisari_244841554.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#5f7b3a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Microthamnion.jpg\" target=\"_blank\"><img src=\"thumbnails/Microthamnion.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"505\" height=\"434\" style=\"background-color:#9b772e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Prasiola_stipitata_Suhr_%28AM_AK307212-1%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Prasiola_stipitata_Suhr_%28AM_AK307212-1%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#767860\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Prasiola_calophylla.jpg\" target=\"_blank\"><img src=\"thumbnails/Prasiola_calophylla.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"708\" height=\"500\" style=\"background-color:#496334\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Prasiola_crispa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Prasiola_crispa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#6b6c65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Plants-13-02405-g005.png\" target=\"_blank\"><img src=\"thumbnails/250px-Plants-13-02405-g005.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"249\" style=\"background-color:#909778\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Botryococcus_braunii.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Botryococcus_braunii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#91907e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chlorophyta_chlorophyceae\" class=\"tree_box\"><span><span>Chlorophyceae</span><a href=\"https://en.wikipedia.org/wiki/Chlorophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chlorophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chlorophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(globe alga, water net)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Mikrofoto.de-volvox-4.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Mikrofoto.de-volvox-4.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#1e261b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Hydrodictyon_amimidoro01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hydrodictyon_amimidoro01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#8e806f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Volvox_aureus.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Volvox_aureus.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#c3d9c2\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pleurococcus1pl.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pleurococcus1pl.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#879137\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Stigeoclonium_sp_zugespitzte_seitenzweige.jpeg\" target=\"_blank\"><img src=\"thumbnails/Stigeoclonium_sp_zugespitzte_seitenzweige.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#b1ba9f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Volvocales.png\" target=\"_blank\"><img src=\"thumbnails/250px-Volvocales.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"293\" style=\"background-color:#d5d7ca\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bracteacoccus_aggregatus_BM5-15_%28IPPAS_C-2045%29.png\" target=\"_blank\"><img src=\"thumbnails/250px-Bracteacoccus_aggregatus_BM5-15_%28IPPAS_C-2045%29.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"247\" style=\"background-color:#cacb97\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Characium_hookeri.png\" target=\"_blank\"><img src=\"thumbnails/Characium_hookeri.png\" class=\"taxa-img\" loading=\"lazy\" width=\"472\" height=\"383\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pediastrum.jpg\" target=\"_blank\"><img src=\"thumbnails/Pediastrum.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"600\" height=\"586\" style=\"background-color:#c7b077\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Scenedesmus_GLERL.jpg\" target=\"_blank\"><img src=\"thumbnails/752px-Scenedesmus_GLERL.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"752\" height=\"600\" style=\"background-color:#597f41\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ankistrodesmus_spiralis_245883620.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Ankistrodesmus_spiralis_245883620.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"336\" style=\"background-color:#c1b7b1\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Radiofilum_conjunctivum_358633818.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Radiofilum_conjunctivum_358633818.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"185\" style=\"background-color:#5a5d5b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Treubaria_triappendiculata_410318208.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Treubaria_triappendiculata_410318208.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#cbc8d3\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"chlorophyta_ulvophyceae\" class=\"tree_box\"><span><span>Ulvophyceae</span><a href=\"https://en.wikipedia.org/wiki/Ulvophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Ulvophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Ulvophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(sea lettuces, green sea fingers, dead man&#x27;s fingers, sea grapes, green caviars, killer alga, green feather alga)</span><p class=\"tag\">Common forms include filaments (both unbranched and branched), tubular and blade-like thalli, and siphonous thalli. Siphonous thalli are composed of a single giant cell with thousands of nuclei and chloroplasts. They have a counter-clockwise arrangement of the flagellar basal bodies, cytokinesis by furrowing, a closed persistent mitotic spindle, and the lack of a phycoplast.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Meersalat-Ulva-lactuca.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Meersalat-Ulva-lactuca.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"234\" style=\"background-color:#89813e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tufts_of_gutweed_in_Gullmarsfjorden_at_S%C3%A4mstad_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tufts_of_gutweed_in_Gullmarsfjorden_at_S%C3%A4mstad_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#636c38\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Codiumfragile.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Codiumfragile.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9f926c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tiny_Marine_Plant.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tiny_Marine_Plant.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#5a603a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulerpa_taxifolia_kz01.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caulerpa_taxifolia_kz01.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"236\" style=\"background-color:#5d656b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:HALIMEDA_PICT0294.jpg\" target=\"_blank\"><img src=\"thumbnails/HALIMEDA_PICT0294.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"379\" height=\"480\" style=\"background-color:#757f6a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sea_lettuce_in_Brofjorden_1_-_cropped.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Sea_lettuce_in_Brofjorden_1_-_cropped.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#515b29\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acrosiphonia_arcta.jpg\" target=\"_blank\"><img src=\"thumbnails/Acrosiphonia_arcta.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"150\" height=\"150\" style=\"background-color:#7f7838\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gomontia_polyrhiza_%28Lagerh.%29_Bornet_and_Flahault_%28AM_AK327908%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gomontia_polyrhiza_%28Lagerh.%29_Bornet_and_Flahault_%28AM_AK327908%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#acaca6\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ulothrix_426.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Ulothrix_426.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"215\" style=\"background-color:#bfcbd5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bryopsis_vestita_29062289.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bryopsis_vestita_29062289.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#758864\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulerpa_brownii.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Caulerpa_brownii.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#75942e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulerpa_cactoides.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Caulerpa_cactoides.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#6f8b43\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulerpa_papillosa_254297724.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caulerpa_papillosa_254297724.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#8c806e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Palm_tree_algae_%28Caulerpa_paspaloides%29_Shoots.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Palm_tree_algae_%28Caulerpa_paspaloides%29_Shoots.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#807970\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulerpa_prolifera133.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caulerpa_prolifera133.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"185\" style=\"background-color:#8c611c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Oval_sea_grapes%2C_Caulerpa_racemosa_var_clavifera%2C_at_5_meters_depth.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Oval_sea_grapes%2C_Caulerpa_racemosa_var_clavifera%2C_at_5_meters_depth.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"216\" style=\"background-color:#1b1d23\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulerpa_racemosa_algae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caulerpa_racemosa_algae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#434a1f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulerpa_scalpelliformis_254298193.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Caulerpa_scalpelliformis_254298193.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#868459\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Green_seaweed_Turimetta_south.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Green_seaweed_Turimetta_south.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"206\" style=\"background-color:#46643d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulerpa_flexilis.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Caulerpa_flexilis.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#7d7650\"></a><a href=\"https://commons.wikimedia.org/wiki/File:The_green_seaweed%2C_Caulerpa_serrulata%2C_at_Ponta_do_Ouro%2C_Mozambique_%286661104601%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-The_green_seaweed%2C_Caulerpa_serrulata%2C_at_Ponta_do_Ouro%2C_Mozambique_%286661104601%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#6f4d25\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Caulerpa_sertularioides.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Caulerpa_sertularioides.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#535c41\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Codium_sp..jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Codium_sp..jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"277\" style=\"background-color:#648f7d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Codium_cranwelliae_180193296.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Codium_cranwelliae_180193296.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#b4b0aa\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Codium_edule_448245056.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Codium_edule_448245056.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"313\" style=\"background-color:#8c8e6a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Codium_galeatum_191546726.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Codium_galeatum_191546726.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"301\" style=\"background-color:#8d8469\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Codium_lucasii_15550859.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Codium_lucasii_15550859.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"281\" style=\"background-color:#6f6358\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Codium_pomoides_256330303.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Codium_pomoides_256330303.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#968b73\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Codium_spongiosum_R%C3%A9union.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Codium_spongiosum_R%C3%A9union.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"251\" style=\"background-color:#575744\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Codium_tenue_354934676.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Codium_tenue_354934676.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#837d74\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Alga_marina_%28Codium_tomentosum%29%2C_isla_de_Mouro%2C_Santander%2C_Espa%C3%B1a%2C_2019-08-14%2C_DD_09.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Alga_marina_%28Codium_tomentosum%29%2C_isla_de_Mouro%2C_Santander%2C_Espa%C3%B1a%2C_2019-08-14%2C_DD_09.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#77adc4\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Derbesia_sp..jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Derbesia_sp..jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"269\" style=\"background-color:#5c7a36\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Avrainvillea_cf._amadelpha.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Avrainvillea_cf._amadelpha.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#625644\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Anadyomene_wrightii.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Anadyomene_wrightii.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"233\" style=\"background-color:#808058\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Boodlea_composita.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Boodlea_composita.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"244\" style=\"background-color:#696f54\"></a><a href=\"https://commons.wikimedia.org/wiki/File:FilamentousChlorophyceae_SaintJosephReunion.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-FilamentousChlorophyceae_SaintJosephReunion.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6c785c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Aegagropila_linnaei%2C_Hokkaido%2C_Japan.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Aegagropila_linnaei%2C_Hokkaido%2C_Japan.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#7b7436\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Boergesenia_forbesii_02.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Boergesenia_forbesii_02.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#928b60\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Dictyosphaeria_cavernosa.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Dictyosphaeria_cavernosa.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"253\" style=\"background-color:#695043\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Bornetella_sphaerica.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Bornetella_sphaerica.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"261\" style=\"background-color:#6a6f5e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cymopolia_barbata_455574231.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cymopolia_barbata_455574231.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#677a2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neomeris_vanbosseae.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Neomeris_vanbosseae.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#6c6c56\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Acetabularia_sp_20110530a.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Acetabularia_sp_20110530a.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#597f6b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:C12_Cephaleuros_parasiticus_%285825293084%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-C12_Cephaleuros_parasiticus_%285825293084%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#5b5e0f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Trentepohlia_aurea_130408.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Trentepohlia_aurea_130408.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"230\" style=\"background-color:#917647\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Blidingia_minima.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Blidingia_minima.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#566b1d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Percursaria_percusa_%28C.Agardh%29_Rosenv._%28AM_AK307496-1%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Percursaria_percusa_%28C.Agardh%29_Rosenv._%28AM_AK307496-1%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#83865a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tufts_of_gutweed_in_Gullmarsfjorden_at_S%C3%A4mstad_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Tufts_of_gutweed_in_Gullmarsfjorden_at_S%C3%A4mstad_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"229\" style=\"background-color:#636c38\"></a></div></div></div></li></ul></li></ul></li></ul>")
@@ -0,0 +1 @@
+TreeData.register("luca_plantae_pinophyta",[{"name":"Pinopsida","parent":"Pinophyta","rank":"Class","ipa":"","common":[],"tag":"","imgs":[],"card":1},{"name":"Pinales","parent":"Pinopsida","rank":"Order","ipa":"","common":[],"tag":"","imgs":[],"card":1},{"name":"Pinaceae","parent":"Pinales","rank":"Family","ipa":"","common":[],"tag":"","imgs":[],"card":1},{"name":"Pinus","parent":"Pinaceae","rank":"Genus","ipa":"","common":["pine"],"tag":"Conifers with needles that bundle in clusters.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/6/69/Pine_needles.png/250px-Pine_needles.png","https://upload.wikimedia.org/wikipedia/commons/thumb/0/03/Pinus_radiata_pollen_cones%2C_2_cm_scale_bar.png/250px-Pinus_radiata_pollen_cones%2C_2_cm_scale_bar.png","https://upload.wikimedia.org/wikipedia/commons/thumb/0/0b/Pinus_radiata_cone.jpg/330px-Pinus_radiata_cone.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ec/Pinus_densiflora_Kumgangsan.jpg/250px-Pinus_densiflora_Kumgangsan.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/04/Pinus_radiata_binata.jpg/330px-Pinus_radiata_binata.jpg"],"card":2},{"name":"Larix","parent":"Pinaceae","rank":"Genus","ipa":"","common":["larch"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b3/Larix_griffithii%2C_Yathang%2C_Sikkim%2C_India_1.jpg/330px-Larix_griffithii%2C_Yathang%2C_Sikkim%2C_India_1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/34/SubalpineLarch_7769.jpg/960px-SubalpineLarch_7769.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Larix_decidua_Aletschwald.jpg/250px-Larix_decidua_Aletschwald.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/f/f4/Lone_Larix_lyallii_in_fall_color_in_the_Enchantments_%2811_October_2024%29.jpg/250px-Lone_Larix_lyallii_in_fall_color_in_the_Enchantments_%2811_October_2024%29.jpg"],"card":2},{"name":"Picea","parent":"Pinaceae","rank":"Genus","ipa":"","common":["spruce"],"tag":"Conifers with four sided leaves that attach to peg like strutures and have cones that point down after polination.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/39/Picea_abies_Nadelkissen.jpg/960px-Picea_abies_Nadelkissen.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/48/Sitka_01.JPG/250px-Sitka_01.JPG"],"card":2},{"name":"Abies","parent":"Pinaceae","rank":"Genus","ipa":"","etymology":"Latin 'to rise'","common":["fir"],"tag":"Conifers with upright cones and flat needles that mostly attach on two sides of a branch.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/Abies_alba_PID1015-3.jpg/330px-Abies_alba_PID1015-3.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/8c/Abies_grandis_5359.JPG/250px-Abies_grandis_5359.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/71/Abies_koreana_%28szyszki%29.JPG/330px-Abies_koreana_%28szyszki%29.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/9/91/Abies_fabri_in_mist.jpg/250px-Abies_fabri_in_mist.jpg"],"card":2},{"name":"Cedrus","parent":"Pinaceae","rank":"Genus","ipa":"","common":["cedar"],"tag":"Note: There are many other plants commonly called cedar.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/4/4e/Cedrus_deodara_leaves_closeup.jpg/330px-Cedrus_deodara_leaves_closeup.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ee/Male_cone_of_Cedar_of_Lebanon.JPG/250px-Male_cone_of_Cedar_of_Lebanon.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/20130903Cedrus_deodara2.jpg/330px-20130903Cedrus_deodara2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bf/C%C3%A8dre_du_Liban_Barouk_2005.jpg/330px-C%C3%A8dre_du_Liban_Barouk_2005.jpg"],"card":2},{"name":"Tsuga","parent":"Pinaceae","rank":"Genus","ipa":"","common":["hemlock"],"tag":"Note: unrelated to the hemlock of the bible but with a similar smell.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/c/c8/2013-08-25_15_39_09_Closeup_of_Eastern_Hemlock_foliage_across_Taborton_Road_from_the_entrance_to_Spring_Lake_in_Berlin%2C_New_York.jpg/330px-2013-08-25_15_39_09_Closeup_of_Eastern_Hemlock_foliage_across_Taborton_Road_from_the_entrance_to_Spring_Lake_in_Berlin%2C_New_York.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/0/07/Tsuga-diversifolia.JPG/330px-Tsuga-diversifolia.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/5/57/Tsuga_heterophylla1.jpg/250px-Tsuga_heterophylla1.jpg"],"card":2},{"name":"Cupressales","parent":"Pinopsida","rank":"Order","ipa":"","common":[],"tag":"","imgs":[],"card":1},{"name":"Cupressaceae","parent":"Cupressales","rank":"Family","ipa":"","common":[],"tag":"","imgs":[],"card":1},{"name":"Sequoioideae","parent":"Cupressaceae","rank":"Genus","ipa":"","common":["redwood / sequoia"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/2c/MetaseqLeaves.jpg/330px-MetaseqLeaves.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/88/Sequoia_sempervirens1.jpg/330px-Sequoia_sempervirens1.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/3/3f/Giant_sequoias_in_Sequoia_National_Park_02_2013.jpg/250px-Giant_sequoias_in_Sequoia_National_Park_02_2013.jpg"],"card":3},{"name":"Cupressus","parent":"Cupressaceae","rank":"Genus","ipa":"","common":["cypress"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/d/d5/Cupressus_duclouxiana_-_Quarryhill_Botanical_Garden_-_DSC03443.JPG/330px-Cupressus_duclouxiana_-_Quarryhill_Botanical_Garden_-_DSC03443.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b1/Med_Cypress.jpg/250px-Med_Cypress.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/1c/Cupressus_atlantica0.jpg/250px-Cupressus_atlantica0.jpg"],"card":3},{"name":"Juniperus","parent":"Cupressaceae","rank":"Genus","ipa":"","common":["juniper"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/7/7a/Juniperus_californica_Joshua_Tree_NP_2.jpg/330px-Juniperus_californica_Joshua_Tree_NP_2.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/65/Jun_chin_close.jpg/250px-Jun_chin_close.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4f/SabinaChinensis.jpg/330px-SabinaChinensis.jpg"],"card":3},{"name":"Chamaecyparis","parent":"Cupressaceae","rank":"Genus","ipa":"","common":["false cypress"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/4/48/Sawara.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/Chamaecyparis_pisifera.jpg/250px-Chamaecyparis_pisifera.jpg"],"card":3},{"name":"Taxaceae","parent":"Cupressales","rank":"Family","ipa":"","common":[],"tag":"","imgs":[],"card":1},{"name":"Taxus","parent":"Taxaceae","rank":"Genus","ipa":"","common":["yew"],"tag":"","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/Taxus_baccata_MHNT.jpg/330px-Taxus_baccata_MHNT.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d6/4112_year_Yew_3.jpg/250px-4112_year_Yew_3.jpg"],"card":1}],{},{"250px-4112_year_Yew_3.jpg":[250,444,"#605d56"],"250px-Abies_fabri_in_mist.jpg":[250,343,"#70746e"],"250px-Abies_grandis_5359.JPG":[250,375,"#555e2a"],"250px-Chamaecyparis_pisifera.jpg":[250,355,"#767b6c"],"250px-Cupressus_atlantica0.jpg":[250,354,"#878a80"],"250px-Giant_sequoias_in_Sequoia_National_Park_02_2013.jpg":[250,380,"#5e594e"],"250px-Jun_chin_close.jpg":[250,303,"#c5cbba"],"250px-Larix_decidua_Aletschwald.jpg":[250,333,"#889872"],"250px-Lone_Larix_lyallii_in_fall_color_in_the_Enchantments_(11_October_2024).jpg":[250,333,"#89847f"],"250px-Male_cone_of_Cedar_of_Lebanon.JPG":[250,334,"#a39781"],"250px-Med_Cypress.jpg":[250,377,"#999a7f"],"250px-Pine_needles.png":[250,333,"#6a7448"],"250px-Pinus_densiflora_Kumgangsan.jpg":[250,344,"#869389"],"250px-Pinus_radiata_pollen_cones,_2_cm_scale_bar.png":[250,251,"#59503e"],"250px-Sitka_01.JPG":[250,371,"#7b7b60"],"250px-Tsuga_heterophylla1.jpg":[250,388,"#5a7579"],"330px-2013-08-25_15_39_09_Closeup_of_Eastern_Hemlock_foliage_across_Taborton_Road_from_the_entrance_to_Spring_Lake_in_Berlin,_New_York.jpg":[330,247,"#4b573e"],"330px-20130903Cedrus_deodara2.jpg":[330,247,"#576341"],"330px-Abies_alba_PID1015-3.jpg":[330,219,"#404f36"],"330px-Abies_koreana_(szyszki).JPG":[330,247,"#6a7b3f"],"330px-Cedrus_deodara_leaves_closeup.jpg":[330,247,"#949393"],"330px-Cupressus_duclouxiana_-_Quarryhill_Botanical_Garden_-_DSC03443.JPG":[330,260,"#747579"],"330px-Cèdre_du_Liban_Barouk_2005.jpg":[330,248,"#778687"],"330px-Juniperus_californica_Joshua_Tree_NP_2.jpg":[330,195,"#7a7a61"],"330px-Larix_griffithii,_Yathang,_Sikkim,_India_1.jpg":[330,220,"#7b8948"],"330px-MetaseqLeaves.jpg":[330,192,"#a5aa98"],"330px-Pinus_radiata_binata.jpg":[330,247,"#84959f"],"330px-Pinus_radiata_cone.jpg":[330,264,"#6f6c65"],"330px-SabinaChinensis.jpg":[330,248,"#979f9d"],"330px-Sequoia_sempervirens1.jpg":[330,245,"#59764b"],"330px-Taxus_baccata_MHNT.jpg":[330,288,"#5f6140"],"330px-Tsuga-diversifolia.JPG":[330,238,"#61645a"],"960px-Picea_abies_Nadelkissen.jpg":[960,666,"#5b6431"],"960px-SubalpineLarch_7769.jpg":[960,720,"#947940"],"Sawara.jpg":[281,496,"#acaca0"]})
@@ -0,0 +1 @@
+TreeData.register_html("luca_plantae_pinophyta","<ul class=\"tree\" data-tree-range=\"pinophyta\"><li><input type=\"checkbox\" checked id=\"Gymnospermae_Pinophyta\"><label class=\"tree_label\" for=\"Gymnospermae_Pinophyta\"></label><div class=\"outer_tree_box\"><div id=\"pinophyta_pinophyta\" class=\"tree_box\"><span><span>Pinophyta</span><a href=\"https://en.wikipedia.org/wiki/Pinophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pinophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pinophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><button data-open-tree=\"plantae\">See parent</button><span class=\"badge\">Division</span></span><span class=\"common_names\">(conifers)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Pseudotsuga_menziesii_06280.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Pseudotsuga_menziesii_06280.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4a572f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abies_grandis_5359.JPG\" target=\"_blank\"><img src=\"thumbnails/500px-Abies_grandis_5359.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"500\" height=\"750\" style=\"background-color:#555e2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:C_lawsoniana_Lge.jpg\" target=\"_blank\"><img src=\"thumbnails/C_lawsoniana_Lge.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"316\" height=\"238\" style=\"background-color:#8a9871\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abies_lasiocarpa_5922.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Abies_lasiocarpa_5922.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#58635f\"></a></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Pinophyta_Pinopsida\"><label class=\"tree_label\" for=\"Pinophyta_Pinopsida\"></label><div class=\"outer_tree_box\"><div id=\"pinophyta_pinopsida\" class=\"tree_box\"><span><span>Pinopsida</span><a href=\"https://en.wikipedia.org/wiki/Pinopsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pinopsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pinopsida\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Pinopsida_Pinales\"><label class=\"tree_label\" for=\"Pinopsida_Pinales\"></label><div class=\"outer_tree_box\"><div id=\"pinophyta_pinales\" class=\"tree_box\"><span><span>Pinales</span><a href=\"https://en.wikipedia.org/wiki/Pinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pinales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Pinales_Pinaceae\"><label class=\"tree_label\" for=\"Pinales_Pinaceae\"></label><div class=\"outer_tree_box\"><div id=\"pinophyta_pinaceae\" class=\"tree_box\"><span><span>Pinaceae</span><a href=\"https://en.wikipedia.org/wiki/Pinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pinaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"pinophyta_pinus\" class=\"tree_box\"><span><span>Pinus</span><a href=\"https://en.wikipedia.org/wiki/Pinus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Pinus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Pinus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(pine)</span><p class=\"tag\">Conifers with needles that bundle in clusters.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Pine_needles.png\" target=\"_blank\"><img src=\"thumbnails/250px-Pine_needles.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#6a7448\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pinus_radiata_pollen_cones%2C_2_cm_scale_bar.png\" target=\"_blank\"><img src=\"thumbnails/250px-Pinus_radiata_pollen_cones%2C_2_cm_scale_bar.png\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"251\" style=\"background-color:#59503e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pinus_radiata_cone.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pinus_radiata_cone.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"264\" style=\"background-color:#6f6c65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pinus_densiflora_Kumgangsan.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pinus_densiflora_Kumgangsan.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"344\" style=\"background-color:#869389\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pinus_radiata_binata.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pinus_radiata_binata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#84959f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"pinophyta_larix\" class=\"tree_box\"><span><span>Larix</span><a href=\"https://en.wikipedia.org/wiki/Larix\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Larix\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Larix\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(larch)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Larix_griffithii%2C_Yathang%2C_Sikkim%2C_India_1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Larix_griffithii%2C_Yathang%2C_Sikkim%2C_India_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#7b8948\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SubalpineLarch_7769.jpg\" target=\"_blank\"><img src=\"thumbnails/960px-SubalpineLarch_7769.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"960\" height=\"720\" style=\"background-color:#947940\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Larix_decidua_Aletschwald.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Larix_decidua_Aletschwald.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#889872\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lone_Larix_lyallii_in_fall_color_in_the_Enchantments_%2811_October_2024%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Lone_Larix_lyallii_in_fall_color_in_the_Enchantments_%2811_October_2024%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#89847f\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"pinophyta_picea\" class=\"tree_box\"><span><span>Picea</span><a href=\"https://en.wikipedia.org/wiki/Picea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Picea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Picea\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(spruce)</span><p class=\"tag\">Conifers with four sided leaves that attach to peg like strutures and have cones that point down after polination.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Picea_abies_Nadelkissen.jpg\" target=\"_blank\"><img src=\"thumbnails/960px-Picea_abies_Nadelkissen.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"960\" height=\"666\" style=\"background-color:#5b6431\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sitka_01.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Sitka_01.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"371\" style=\"background-color:#7b7b60\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"pinophyta_abies\" class=\"tree_box\"><span><span>Abies</span><a href=\"https://en.wikipedia.org/wiki/Abies\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Abies\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Abies\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(fir)</span><p class=\"tag\">Conifers with upright cones and flat needles that mostly attach on two sides of a branch.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Abies_alba_PID1015-3.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Abies_alba_PID1015-3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"219\" style=\"background-color:#404f36\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abies_grandis_5359.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Abies_grandis_5359.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"375\" style=\"background-color:#555e2a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abies_koreana_%28szyszki%29.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Abies_koreana_%28szyszki%29.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#6a7b3f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Abies_fabri_in_mist.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Abies_fabri_in_mist.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"343\" style=\"background-color:#70746e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"pinophyta_cedrus\" class=\"tree_box\"><span><span>Cedrus</span><a href=\"https://en.wikipedia.org/wiki/Cedrus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cedrus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cedrus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(cedar)</span><p class=\"tag\">Note: There are many other plants commonly called cedar.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cedrus_deodara_leaves_closeup.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Cedrus_deodara_leaves_closeup.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#949393\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Male_cone_of_Cedar_of_Lebanon.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Male_cone_of_Cedar_of_Lebanon.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"334\" style=\"background-color:#a39781\"></a><a href=\"https://commons.wikimedia.org/wiki/File:20130903Cedrus_deodara2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-20130903Cedrus_deodara2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#576341\"></a><a href=\"https://commons.wikimedia.org/wiki/File:C%C3%A8dre_du_Liban_Barouk_2005.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-C%C3%A8dre_du_Liban_Barouk_2005.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#778687\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"pinophyta_tsuga\" class=\"tree_box\"><span><span>Tsuga</span><a href=\"https://en.wikipedia.org/wiki/Tsuga\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Tsuga\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Tsuga\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(hemlock)</span><p class=\"tag\">Note: unrelated to the hemlock of the bible but with a similar smell.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:2013-08-25_15_39_09_Closeup_of_Eastern_Hemlock_foliage_across_Taborton_Road_from_the_entrance_to_Spring_Lake_in_Berlin%2C_New_York.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-2013-08-25_15_39_09_Closeup_of_Eastern_Hemlock_foliage_across_Taborton_Road_from_the_entrance_to_Spring_Lake_in_Berlin%2C_New_York.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4b573e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tsuga-diversifolia.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Tsuga-diversifolia.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"238\" style=\"background-color:#61645a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Tsuga_heterophylla1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Tsuga_heterophylla1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"388\" style=\"background-color:#5a7579\"></a></div></div></div></li></ul></li></ul></li><li><input type=\"checkbox\" checked id=\"Pinopsida_Cupressales\"><label class=\"tree_label\" for=\"Pinopsida_Cupressales\"></label><div class=\"outer_tree_box\"><div id=\"pinophyta_cupressales\" class=\"tree_box\"><span><span>Cupressales</span><a href=\"https://en.wikipedia.org/wiki/Cupressales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cupressales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cupressales\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Order</span></span><div></div></div></div><ul><li><input type=\"checkbox\" checked id=\"Cupressales_Cupressaceae\"><label class=\"tree_label\" for=\"Cupressales_Cupressaceae\"></label><div class=\"outer_tree_box\"><div id=\"pinophyta_cupressaceae\" class=\"tree_box\"><span><span>Cupressaceae</span><a href=\"https://en.wikipedia.org/wiki/Cupressaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cupressaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cupressaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"pinophyta_sequoioideae\" class=\"tree_box\"><span><span>Sequoioideae</span><a href=\"https://en.wikipedia.org/wiki/Sequoioideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Sequoioideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Sequoioideae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(redwood / sequoia)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:MetaseqLeaves.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-MetaseqLeaves.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"192\" style=\"background-color:#a5aa98\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Sequoia_sempervirens1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Sequoia_sempervirens1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"245\" style=\"background-color:#59764b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Giant_sequoias_in_Sequoia_National_Park_02_2013.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Giant_sequoias_in_Sequoia_National_Park_02_2013.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"380\" style=\"background-color:#5e594e\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"pinophyta_cupressus\" class=\"tree_box\"><span><span>Cupressus</span><a href=\"https://en.wikipedia.org/wiki/Cupressus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cupressus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cupressus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(cypress)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Cupressus_duclouxiana_-_Quarryhill_Botanical_Garden_-_DSC03443.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Cupressus_duclouxiana_-_Quarryhill_Botanical_Garden_-_DSC03443.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"260\" style=\"background-color:#747579\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Med_Cypress.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Med_Cypress.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"377\" style=\"background-color:#999a7f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Cupressus_atlantica0.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Cupressus_atlantica0.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"354\" style=\"background-color:#878a80\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"pinophyta_juniperus\" class=\"tree_box\"><span><span>Juniperus</span><a href=\"https://en.wikipedia.org/wiki/Juniperus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Juniperus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Juniperus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(juniper)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Juniperus_californica_Joshua_Tree_NP_2.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Juniperus_californica_Joshua_Tree_NP_2.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"195\" style=\"background-color:#7a7a61\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jun_chin_close.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Jun_chin_close.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"303\" style=\"background-color:#c5cbba\"></a><a href=\"https://commons.wikimedia.org/wiki/File:SabinaChinensis.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-SabinaChinensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"248\" style=\"background-color:#979f9d\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"pinophyta_chamaecyparis\" class=\"tree_box\"><span><span>Chamaecyparis</span><a href=\"https://en.wikipedia.org/wiki/Chamaecyparis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Chamaecyparis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Chamaecyparis\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(false cypress)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Sawara.jpg\" target=\"_blank\"><img src=\"thumbnails/Sawara.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"281\" height=\"496\" style=\"background-color:#acaca0\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chamaecyparis_pisifera.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Chamaecyparis_pisifera.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"355\" style=\"background-color:#767b6c\"></a></div></div></div></li></ul></li><li><input type=\"checkbox\" checked id=\"Cupressales_Taxaceae\"><label class=\"tree_label\" for=\"Cupressales_Taxaceae\"></label><div class=\"outer_tree_box\"><div id=\"pinophyta_taxaceae\" class=\"tree_box\"><span><span>Taxaceae</span><a href=\"https://en.wikipedia.org/wiki/Taxaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Taxaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Taxaceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Family</span></span><div></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"pinophyta_taxus\" class=\"tree_box\"><span><span>Taxus</span><a href=\"https://en.wikipedia.org/wiki/Taxus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Taxus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Taxus\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Genus</span></span><span class=\"common_names\">(yew)</span><div><a href=\"https://commons.wikimedia.org/wiki/File:Taxus_baccata_MHNT.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Taxus_baccata_MHNT.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"288\" style=\"background-color:#5f6140\"></a><a href=\"https://commons.wikimedia.org/wiki/File:4112_year_Yew_3.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-4112_year_Yew_3.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"444\" style=\"background-color:#605d56\"></a></div></div></div></li></ul></li></ul></li></ul></li></ul></li></ul>")
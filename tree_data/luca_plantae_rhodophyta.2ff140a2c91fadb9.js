@@ -0,0 +1 @@
+TreeData.register("luca_plantae_rhodophyta",[{"name":"Cyanidiophyceae","parent":"Rhodophyta","rank":"Class","ipa":"","common":[],"tag":"Unicellular red algae that contain a single plastid, one to three mitochondria, a nucleus, a vacuole, and floridean starch but pyrenoids are absent. Most are extremophiles that inhabit acid hot springs with a pH between 0.2 and 4 with temperatures up to 56 °C.","imgs":["https://upload.wikimedia.org/wikipedia/commons/4/45/Cyanidium_O5A.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b6/12862_2020_1677_Fig1A-Galdieria-photo.jpg","https://upload.wikimedia.org/wikipedia/commons/5/5e/12862_2020_1677_Fig1A-Galdieria-big.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/c/ca/Galdieria_partita_cells.jpg/330px-Galdieria_partita_cells.jpg"]},{"name":"Porphyridiophyceae","parent":"Rhodophyta","rank":"Class","ipa":"","common":[],"tag":"A microalga with a spherical shape. Instead of a cell wall, the cell is enveloped in secreted sulfur polysaccharides. Cells contain a high percentage of protein including phycoerythrin, that gives red algae their color. They show blue-greenish to reddish color.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/2/25/Porphyridium_purpureum1.jpg/330px-Porphyridium_purpureum1.jpg"]},{"name":"Compsopogonophyceae","parent":"Rhodophyta","rank":"Class","ipa":"","common":[],"tag":"Includes microscopic filamentous algae to macroscopic multicellular species. The color of chloroplasts is variable, blue green to red.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/8/87/Compsopogon_1.jpg/250px-Compsopogon_1.jpg"]},{"name":"Stylonematophyceae","parent":"Rhodophyta","rank":"Class","ipa":"","common":[],"tag":"Characterised by unicellular, colonial, prostrate, and upright filaments. Sometimes microscopic filamentous, pseudofilamentous or unicellular red algae. Most species live in coastal water. The color of chloroplast is reddish to blue-greenish.","imgs":["https://upload.wikimedia.org/wikipedia/commons/a/a8/Stylonemaalsidii.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/d7/Contributiones_ad_algologiam_et_fungologiam_%281875.%29_%2820658919796%29.jpg/250px-Contributiones_ad_algologiam_et_fungologiam_%281875.%29_%2820658919796%29.jpg"]},{"name":"Rhodellophyceae","parent":"Rhodophyta","rank":"Class","ipa":"","common":[],"tag":"Unicellular or pseudofilamentous red algae with a single highly lobed plastid that has an eccentric or centric pyrenoid. Reproduction is by cell division.","imgs":[]},{"name":"Bangiophyceae","parent":"Rhodophyta","rank":"Class","ipa":"","common":["nori","gim","laver"],"tag":"Red algae characterized by filamentous or leafy thalli, often found in intertidal and subtidal environments.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/0/0a/Bangia_fuscopurpurea_Helgoland.JPG/120px-Bangia_fuscopurpurea_Helgoland.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/b/b7/Clymene_coleana_%28W.A.Nelson%29_W.A.Nelson_%28AM_AK348117%29.jpg/250px-Clymene_coleana_%28W.A.Nelson%29_W.A.Nelson_%28AM_AK348117%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/28/Pyropia_virididentata_2239333.jpg/250px-Pyropia_virididentata_2239333.jpg","https://upload.wikimedia.org/wikipedia/commons/0/0c/Neopyropia_yezoensis.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/47/Pyropia_nereocystis_167506363.jpg/250px-Pyropia_nereocystis_167506363.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Pyropia_plicata_W.A.Nelson_%28AM_AK294882-4%29.jpg/330px-Pyropia_plicata_W.A.Nelson_%28AM_AK294882-4%29.jpg"]},{"name":"Florideophyceae","parent":"Rhodophyta","rank":"Class","ipa":"","common":["Irish moss","dulse","gulaman","ogonori"],"tag":"One of the most successful algal groups in marine environments. It has a global distribution, ranging from tropical to polar coasts, including some freshwater species and are more abundant along cold and temperate coastal regions. Their life cycles typically involve three generations. Many plastids per cell and no pyrenoids. Pit connections are always present.","imgs":["https://upload.wikimedia.org/wikipedia/commons/thumb/9/99/Hildenbrandia_rivularis_02_by-dpc.jpg/330px-Hildenbrandia_rivularis_02_by-dpc.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ef/Apophlaea_sinclairii_by_Peter_de_Lange.jpg/330px-Apophlaea_sinclairii_by_Peter_de_Lange.jpg","https://upload.wikimedia.org/wikipedia/commons/b/b6/Batrachospermum_moniliforme.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/9d/Red_seaweed%2C_Galaxaura_rugosa%2C_Daedalus_Reef%2C_Red_Sea%2C_Egypt.jpeg/330px-Red_seaweed%2C_Galaxaura_rugosa%2C_Daedalus_Reef%2C_Red_Sea%2C_Egypt.jpeg","https://upload.wikimedia.org/wikipedia/commons/thumb/5/58/Halosaccion_glandiforme.jpg/330px-Halosaccion_glandiforme.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/65/Palmeria_palmata.jpg/250px-Palmeria_palmata.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/e/e2/Lithophyllum_orbiculatum_037.jpg/330px-Lithophyllum_orbiculatum_037.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/6/62/Calliarthron_tuberculosum_in_Monterey_%2812229%29.jpg/250px-Calliarthron_tuberculosum_in_Monterey_%2812229%29.jpg","https://upload.wikimedia.org/wikipedia/commons/f/f6/Corallinapinnatifolia.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/e/ef/MA_I899406_Corallina_cf._hombronii_%28Mont.%29_Mont._ex_K%C3%BCtzing_%28cropped%29.jpg/250px-MA_I899406_Corallina_cf._hombronii_%28Mont.%29_Mont._ex_K%C3%BCtzing_%28cropped%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/Corallina_vancouveriensis_118467796.jpg/330px-Corallina_vancouveriensis_118467796.jpg","https://upload.wikimedia.org/wikipedia/commons/3/35/Jania_rubens.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Ahnfeltia_plicata_Helgoland.JPG/250px-Ahnfeltia_plicata_Helgoland.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/Wrangelia_penicillata.JPG/330px-Wrangelia_penicillata.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Capreolia_implexa_194169428.jpg/330px-Capreolia_implexa_194169428.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/D%C3%A9part_Gelidiella_acerosa_%C3%A0_confirmer.jpg/330px-D%C3%A9part_Gelidiella_acerosa_%C3%A0_confirmer.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/b/bd/Gus%C3%B4_%28Eucheuma_sp.%29_in_a_wet_market_in_the_Philippines.jpg/330px-Gus%C3%B4_%28Eucheuma_sp.%29_in_a_wet_market_in_the_Philippines.jpg","https://upload.wikimedia.org/wikipedia/commons/2/2b/Kappaphycus_alvarezii.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/4f/Endocladia_muricata_%2810108497395%29.jpg/330px-Endocladia_muricata_%2810108497395%29.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/2/26/Chondrus_elatus_-_National_Museum_of_Nature_and_Science%2C_Tokyo_-_DSC07637.JPG/250px-Chondrus_elatus_-_National_Museum_of_Nature_and_Science%2C_Tokyo_-_DSC07637.JPG","https://upload.wikimedia.org/wikipedia/commons/thumb/7/7a/Gracilaria2.JPG/330px-Gracilaria2.JPG","https://upload.wikimedia.org/wikipedia/commons/0/0f/Peyssonnelia_squamaria.jpg","https://upload.wikimedia.org/wikipedia/commons/thumb/4/46/Iceland_moss_-_Cetraria_islandica_%2830657503808%29.jpg/330px-Iceland_moss_-_Cetraria_islandica_%2830657503808%29.jpg"]}],{},{"120px-Bangia_fuscopurpurea_Helgoland.JPG":[120,305,"#c9c7c8"],"12862_2020_1677_Fig1A-Galdieria-big.jpg":[781,514,"#9aa598"],"12862_2020_1677_Fig1A-Galdieria-photo.jpg":[781,338,"#8a8f91"],"250px-Ahnfeltia_plicata_Helgoland.JPG":[250,262,"#cec9c5"],"250px-Calliarthron_tuberculosum_in_Monterey_(12229).jpg":[250,275,"#6d6374"],"250px-Chondrus_elatus_-_National_Museum_of_Nature_and_Science,_Tokyo_-_DSC07637.JPG":[250,241,"#817f80"],"250px-Clymene_coleana_(W.A.Nelson)_W.A.Nelson_(AM_AK348117).jpg":[250,399,"#dcd9d7"],"250px-Compsopogon_1.jpg":[250,387,"#cdc2a9"],"250px-Contributiones_ad_algologiam_et_fungologiam_(1875.)_(20658919796).jpg":[249,309,"#dddab6"],"250px-MA_I899406_Corallina_cf._hombronii_(Mont.)_Mont._ex_Kützing_(cropped).jpg":[250,272,"#eae6e3"],"250px-Palmeria_palmata.jpg":[250,390,"#594d4b"],"250px-Pyropia_nereocystis_167506363.jpg":[250,333,"#85635f"],"250px-Pyropia_virididentata_2239333.jpg":[250,250,"#b3af9c"],"330px-Apophlaea_sinclairii_by_Peter_de_Lange.jpg":[330,274,"#6e6a69"],"330px-Capreolia_implexa_194169428.jpg":[330,247,"#674e4f"],"330px-Corallina_vancouveriensis_118467796.jpg":[330,247,"#4c4141"],"330px-Départ_Gelidiella_acerosa_à_confirmer.jpg":[330,243,"#706e5b"],"330px-Endocladia_muricata_(10108497395).jpg":[330,241,"#927661"],"330px-Galdieria_partita_cells.jpg":[330,170,"#b3b3b3"],"330px-Gracilaria2.JPG":[330,247,"#a26346"],"330px-Gusô_(Eucheuma_sp.)_in_a_wet_market_in_the_Philippines.jpg":[330,186,"#726e52"],"330px-Halosaccion_glandiforme.jpg":[330,285,"#756a4e"],"330px-Hildenbrandia_rivularis_02_by-dpc.jpg":[330,221,"#67420c"],"330px-Iceland_moss_-_Cetraria_islandica_(30657503808).jpg":[330,220,"#866d51"],"330px-Lithophyllum_orbiculatum_037.jpg":[330,237,"#6c553a"],"330px-Porphyridium_purpureum1.jpg":[330,291,"#c0bfc5"],"330px-Pyropia_plicata_W.A.Nelson_(AM_AK294882-4).jpg":[330,247,"#9a8b76"],"330px-Red_seaweed,_Galaxaura_rugosa,_Daedalus_Reef,_Red_Sea,_Egypt.jpeg":[330,257,"#735641"],"330px-Wrangelia_penicillata.JPG":[330,247,"#748c65"],"Batrachospermum_moniliforme.jpg":[558,480,"#797670"],"Corallinapinnatifolia.JPG":[556,451,"#75665b"],"Cyanidium_O5A.jpg":[640,480,"#a1b4ac"],"Jania_rubens.jpg":[300,200,"#cc7f9d"],"Kappaphycus_alvarezii.jpg":[604,416,"#5f5545"],"Neopyropia_yezoensis.jpg":[800,600,"#7f867b"],"Peyssonnelia_squamaria.jpg":[300,200,"#5f3c32"],"Stylonemaalsidii.jpg":[431,345,"#b1ad98"]})
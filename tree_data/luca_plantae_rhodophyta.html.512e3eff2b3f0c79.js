@@ -0,0 +1 @@
+TreeData.register_html("luca_plantae_rhodophyta","<ul class=\"tree\" data-tree-range=\"rhodophyta\"><li><input type=\"checkbox\" checked id=\"Plantae_Rhodophyta\"><label class=\"tree_label\" for=\"Plantae_Rhodophyta\"></label><div class=\"outer_tree_box\"><div id=\"rhodophyta_rhodophyta\" class=\"tree_box\"><span><span>Rhodophyta</span><a href=\"https://en.wikipedia.org/wiki/Rhodophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rhodophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rhodophyta\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a><span> (/<a href=\"https://ipa-reader.com/?voice=Russell&amp;text=roʊˈdɒfɪtə\" target=\"_blank\">roʊˈdɒfɪtə</a>/)</span></span><span class=\"float-right\"><button data-open-tree=\"plantae\">See parent</button><span class=\"badge\">Division</span></span><span class=\"common_names\">(red alga)</span><p class=\"tag\">Characterized by eukaryotic cells without flagella and centrioles, chloroplasts without external endoplasmic reticulum or unstacked (stroma) thylakoids, and use phycobiliproteins as accessory pigments, which give them their red color.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Stylonemaalsidii.jpg\" target=\"_blank\"><img src=\"thumbnails/Stylonemaalsidii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"431\" height=\"345\" style=\"background-color:#b1ad98\"></a><a href=\"https://commons.wikimedia.org/wiki/File:New_Zealand_Mosses_Am_media-v-838854_%28Plocamium_spp.%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-New_Zealand_Mosses_Am_media-v-838854_%28Plocamium_spp.%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"253\" style=\"background-color:#bfa289\"></a></div></div></div><ul><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rhodophyta_cyanidiophyceae\" class=\"tree_box\"><span><span>Cyanidiophyceae</span><a href=\"https://en.wikipedia.org/wiki/Cyanidiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Cyanidiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Cyanidiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Unicellular red algae that contain a single plastid, one to three mitochondria, a nucleus, a vacuole, and floridean starch but pyrenoids are absent. Most are extremophiles that inhabit acid hot springs with a pH between 0.2 and 4 with temperatures up to 56 °C.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Cyanidium_O5A.jpg\" target=\"_blank\"><img src=\"thumbnails/Cyanidium_O5A.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"640\" height=\"480\" style=\"background-color:#a1b4ac\"></a><a href=\"https://commons.wikimedia.org/wiki/File:12862_2020_1677_Fig1A-Galdieria-photo.jpg\" target=\"_blank\"><img src=\"thumbnails/12862_2020_1677_Fig1A-Galdieria-photo.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"781\" height=\"338\" style=\"background-color:#8a8f91\"></a><a href=\"https://commons.wikimedia.org/wiki/File:12862_2020_1677_Fig1A-Galdieria-big.jpg\" target=\"_blank\"><img src=\"thumbnails/12862_2020_1677_Fig1A-Galdieria-big.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"781\" height=\"514\" style=\"background-color:#9aa598\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Galdieria_partita_cells.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Galdieria_partita_cells.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"170\" style=\"background-color:#b3b3b3\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rhodophyta_porphyridiophyceae\" class=\"tree_box\"><span><span>Porphyridiophyceae</span><a href=\"https://en.wikipedia.org/wiki/Porphyridiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Porphyridiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Porphyridiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">A microalga with a spherical shape. Instead of a cell wall, the cell is enveloped in secreted sulfur polysaccharides. Cells contain a high percentage of protein including phycoerythrin, that gives red algae their color. They show blue-greenish to reddish color.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Porphyridium_purpureum1.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Porphyridium_purpureum1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"291\" style=\"background-color:#c0bfc5\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rhodophyta_compsopogonophyceae\" class=\"tree_box\"><span><span>Compsopogonophyceae</span><a href=\"https://en.wikipedia.org/wiki/Compsopogonophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Compsopogonophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Compsopogonophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Includes microscopic filamentous algae to macroscopic multicellular species. The color of chloroplasts is variable, blue green to red.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Compsopogon_1.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Compsopogon_1.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"387\" style=\"background-color:#cdc2a9\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rhodophyta_stylonematophyceae\" class=\"tree_box\"><span><span>Stylonematophyceae</span><a href=\"https://en.wikipedia.org/wiki/Stylonematophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Stylonematophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Stylonematophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Characterised by unicellular, colonial, prostrate, and upright filaments. Sometimes microscopic filamentous, pseudofilamentous or unicellular red algae. Most species live in coastal water. The color of chloroplast is reddish to blue-greenish.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Stylonemaalsidii.jpg\" target=\"_blank\"><img src=\"thumbnails/Stylonemaalsidii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"431\" height=\"345\" style=\"background-color:#b1ad98\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Contributiones_ad_algologiam_et_fungologiam_%281875.%29_%2820658919796%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Contributiones_ad_algologiam_et_fungologiam_%281875.%29_%2820658919796%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"249\" height=\"309\" style=\"background-color:#dddab6\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rhodophyta_rhodellophyceae\" class=\"tree_box\"><span><span>Rhodellophyceae</span><a href=\"https://en.wikipedia.org/wiki/Rhodellophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Rhodellophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Rhodellophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><p class=\"tag\">Unicellular or pseudofilamentous red algae with a single highly lobed plastid that has an eccentric or centric pyrenoid. Reproduction is by cell division.</p><div></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rhodophyta_bangiophyceae\" class=\"tree_box\"><span><span>Bangiophyceae</span><a href=\"https://en.wikipedia.org/wiki/Bangiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Bangiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Bangiophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(nori, gim, laver)</span><p class=\"tag\">Red algae characterized by filamentous or leafy thalli, often found in intertidal and subtidal environments.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Bangia_fuscopurpurea_Helgoland.JPG\" target=\"_blank\"><img src=\"thumbnails/120px-Bangia_fuscopurpurea_Helgoland.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"120\" height=\"305\" style=\"background-color:#c9c7c8\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Clymene_coleana_%28W.A.Nelson%29_W.A.Nelson_%28AM_AK348117%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Clymene_coleana_%28W.A.Nelson%29_W.A.Nelson_%28AM_AK348117%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"399\" style=\"background-color:#dcd9d7\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pyropia_virididentata_2239333.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pyropia_virididentata_2239333.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"250\" style=\"background-color:#b3af9c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Neopyropia_yezoensis.jpg\" target=\"_blank\"><img src=\"thumbnails/Neopyropia_yezoensis.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"800\" height=\"600\" style=\"background-color:#7f867b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pyropia_nereocystis_167506363.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Pyropia_nereocystis_167506363.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"333\" style=\"background-color:#85635f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Pyropia_plicata_W.A.Nelson_%28AM_AK294882-4%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Pyropia_plicata_W.A.Nelson_%28AM_AK294882-4%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#9a8b76\"></a></div></div></div></li><li><div class=\"tree_label\"></div><div class=\"outer_tree_box\"><div id=\"rhodophyta_florideophyceae\" class=\"tree_box\"><span><span>Florideophyceae</span><a href=\"https://en.wikipedia.org/wiki/Florideophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_wikipedia.jpg\"></a><a href=\"https://www.inaturalist.org/search?source%5B%5D=taxa&amp;q=Florideophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_inaturalist.png\"></a><a href=\"https://eol.org/search?utf8=%E2%9C%93&amp;q=Florideophyceae\" target=\"_blank\" class=\"icon-button\"><img src=\"./thumbnails/icon_eol.png\"></a></span><span class=\"float-right\"><span class=\"badge\">Class</span></span><span class=\"common_names\">(Irish moss, dulse, gulaman, ogonori)</span><p class=\"tag\">One of the most successful algal groups in marine environments. It has a global distribution, ranging from tropical to polar coasts, including some freshwater species and are more abundant along cold and temperate coastal regions. Their life cycles typically involve three generations. Many plastids per cell and no pyrenoids. Pit connections are always present.</p><div><a href=\"https://commons.wikimedia.org/wiki/File:Hildenbrandia_rivularis_02_by-dpc.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Hildenbrandia_rivularis_02_by-dpc.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"221\" style=\"background-color:#67420c\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Apophlaea_sinclairii_by_Peter_de_Lange.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Apophlaea_sinclairii_by_Peter_de_Lange.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"274\" style=\"background-color:#6e6a69\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Batrachospermum_moniliforme.jpg\" target=\"_blank\"><img src=\"thumbnails/Batrachospermum_moniliforme.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"558\" height=\"480\" style=\"background-color:#797670\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Red_seaweed%2C_Galaxaura_rugosa%2C_Daedalus_Reef%2C_Red_Sea%2C_Egypt.jpeg\" target=\"_blank\"><img src=\"thumbnails/330px-Red_seaweed%2C_Galaxaura_rugosa%2C_Daedalus_Reef%2C_Red_Sea%2C_Egypt.jpeg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"257\" style=\"background-color:#735641\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Halosaccion_glandiforme.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Halosaccion_glandiforme.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"285\" style=\"background-color:#756a4e\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Palmeria_palmata.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Palmeria_palmata.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"390\" style=\"background-color:#594d4b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Lithophyllum_orbiculatum_037.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Lithophyllum_orbiculatum_037.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"237\" style=\"background-color:#6c553a\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Calliarthron_tuberculosum_in_Monterey_%2812229%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-Calliarthron_tuberculosum_in_Monterey_%2812229%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"275\" style=\"background-color:#6d6374\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Corallinapinnatifolia.JPG\" target=\"_blank\"><img src=\"thumbnails/Corallinapinnatifolia.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"556\" height=\"451\" style=\"background-color:#75665b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:MA_I899406_Corallina_cf._hombronii_%28Mont.%29_Mont._ex_K%C3%BCtzing_%28cropped%29.jpg\" target=\"_blank\"><img src=\"thumbnails/250px-MA_I899406_Corallina_cf._hombronii_%28Mont.%29_Mont._ex_K%C3%BCtzing_%28cropped%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"272\" style=\"background-color:#eae6e3\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Corallina_vancouveriensis_118467796.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Corallina_vancouveriensis_118467796.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#4c4141\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Jania_rubens.jpg\" target=\"_blank\"><img src=\"thumbnails/Jania_rubens.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"300\" height=\"200\" style=\"background-color:#cc7f9d\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Ahnfeltia_plicata_Helgoland.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Ahnfeltia_plicata_Helgoland.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"262\" style=\"background-color:#cec9c5\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Wrangelia_penicillata.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Wrangelia_penicillata.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#748c65\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Capreolia_implexa_194169428.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Capreolia_implexa_194169428.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#674e4f\"></a><a href=\"https://commons.wikimedia.org/wiki/File:D%C3%A9part_Gelidiella_acerosa_%C3%A0_confirmer.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-D%C3%A9part_Gelidiella_acerosa_%C3%A0_confirmer.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"243\" style=\"background-color:#706e5b\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gus%C3%B4_%28Eucheuma_sp.%29_in_a_wet_market_in_the_Philippines.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Gus%C3%B4_%28Eucheuma_sp.%29_in_a_wet_market_in_the_Philippines.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"186\" style=\"background-color:#726e52\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Kappaphycus_alvarezii.jpg\" target=\"_blank\"><img src=\"thumbnails/Kappaphycus_alvarezii.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"604\" height=\"416\" style=\"background-color:#5f5545\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Endocladia_muricata_%2810108497395%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Endocladia_muricata_%2810108497395%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"241\" style=\"background-color:#927661\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Chondrus_elatus_-_National_Museum_of_Nature_and_Science%2C_Tokyo_-_DSC07637.JPG\" target=\"_blank\"><img src=\"thumbnails/250px-Chondrus_elatus_-_National_Museum_of_Nature_and_Science%2C_Tokyo_-_DSC07637.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"250\" height=\"241\" style=\"background-color:#817f80\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Gracilaria2.JPG\" target=\"_blank\"><img src=\"thumbnails/330px-Gracilaria2.JPG\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"247\" style=\"background-color:#a26346\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Peyssonnelia_squamaria.jpg\" target=\"_blank\"><img src=\"thumbnails/Peyssonnelia_squamaria.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"300\" height=\"200\" style=\"background-color:#5f3c32\"></a><a href=\"https://commons.wikimedia.org/wiki/File:Iceland_moss_-_Cetraria_islandica_%2830657503808%29.jpg\" target=\"_blank\"><img src=\"thumbnails/330px-Iceland_moss_-_Cetraria_islandica_%2830657503808%29.jpg\" class=\"taxa-img\" loading=\"lazy\" width=\"330\" height=\"220\" style=\"background-color:#866d51\"></a></div></div></div></li></ul></li></ul>")
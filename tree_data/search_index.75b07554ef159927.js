@@ -0,0 +1 @@
+SearchIndex.register({"entries":[["Bacteria",0,"Single celled organisms that do not have organelles or a true nucleus. They appear in most habitats on earth, including larger life forms. Sometimes living in mutualistic, commensal and parasitic relationships. Their DNA is typically typically a single circular chromosome.",[]],["Archaea",0,"Early cellular life with one branch evolving into eukaryota. They are often found in extreme environments like hydrothermal vents, highly acidic soils, and salt lakes. Some are methanogens. Their cell walls lack peptidoglycan; use ether bonds to connect fatty acids and glycerol; have multiple RNA polymerases; metabolism can include nitrogen fixation, denitrification, chemolithotrophy, and hyperthermophilic growth.",[]],["Eukaryota",0,"Organisms with cells have a membrane-bound nucleus and organelles, including a nucleus, mitochondria, endoplasmic reticulum, and Golgi apparatus.",[]],["Amorphea",0,"",[]],["Amoebozoa",0,"Protists with the ability to alter its shape, primarily by extending and retracting pseudopods. They often possess blunt, fingerlike, lobose pseudopods and tubular mitochondrial cristae. Some live as parasites or symbionts of other organisms, and some are known to cause disease in humans and other organisms.",["amoebas","giant amoebas","insect-egg slime molds"]],["Fungi",0,"The primary decomposers in many ecological systems. Their cell walls contain chitin.",[]],["Holozoa",0,"",[]],["Choanoflagellata",0,"A group of free-living unicellular and colonial flagellate eukaryotes considered to be the closest living relatives of animals. They bear morphological similarities to the choanocyte, a type of cell in sponges. Some are colonial, believed to be a stage from unicellular to multicellular, and this ability seems to have arisen independently several times within the group.",["choanoflagellates"]],["Animalia",0,"Most species consume organic material, breathe oxygen, have myocytes and are able to move, can reproduce sexually, and grow from a hollow sphere of cells, the blastula, during embryonic development.",["animals"]],["Diaphoretickes",0,"",[]],["SAR",0,"",["diatoms","radiolarians","dinoflagellates","brown alga","kelps"]],["Rhizaria",0,"",["radiolarians"]],["Alveolate",0,"",["dinoflagellates"]],["Stramenopile",0,"",["diatoms","brown alga","kelps"]],["Plantae",0,"The primary producers in most terrestrial ecosystems using organelles specialised for photosynthesis. Their cell walls contain cellulose.",["plants"]],["Ctenophora",1,"A medusa that swims with groups of cilia. It's the largest animals to swim with the help of cilia. Their bodies consist of a mass of jelly, with a layer two cells thick on the outside, and another lining the internal cavity. Almost all ctenophores are predators.",["comb jellies"]],["Porifera",1,"Sessile filter feeders that are bound to the seabed with many being important reef-building organisms. They are multicellular organisms with tube-like bodies full of pores that circulate water usually with the help of flagella movements of 'collar cells'. They do not have complex nervous, digestive or circulatory systems. Their bodies consist of a non-living jelly-like mass sandwiched between two main layers of cells. They have unspecialized cells that can transform into other types and do not have tissues that derive from embryonic germ layers. Some are radially symmetrical, but most are asymmetrical.",["sea sponges"]],["ParaHoxozoa",1,"Named to include all of the animal phyla that have Hox and/or ParaHox genes.",[]],["Placozoa",1,"Blob-like animals composed of aggregations of cells. They move in water by ciliary motion, eat food by engulfment and reproduce by fission or budding. An individual body measures about 0.55 mm in diameter. They have three tissue layers: the upper, intermediate and lower epithelia. There are at least six different cell types.",[]],["Cnidaria",1,"Aquatic invertebrates found both in freshwater and marine environment. They usually have two basic body forms (swimming medusae and sessile polyps) and both are radially symmetrical with mouths surrounded by tentacles. They have an uncentralized nervous system distributed throughout a gelatinous body and specialized cells with ejectable flagella used mainly for envenomation and capturing prey. They have no organs or organ systems and include some of the smallest marine parasites. They can reproduce both sexually and asexually.",["jellyfish","hydroids","sea anemones","corals"]],["Bilateria",1,"Characterised by bilateral symmetry during embryonic development. Most maintain a bilaterally symmetrical body as adults. Embryos are triploblastic. They have complete digestive tracts with a separate mouth and anus.",[]],["Protostomia",1,"Named for they way many species form the organism's mouth before its anus during embryonic development. Cell fates become fixed at the first cleavage of the early embryo. Coeloms generally form out of a solid mass of embryonic tissue splitting away from the rest.",[]],["Spiralia",1,"Named for the spiral cleavage that many species exhibit during embryonic development.",[]],["Platyhelminthes",1,"Relatively simple bilaterian, unsegmented, soft-bodied invertebrates commonly called flatworms. Free-living flatworms are mostly predators. The parasitic forms live in the digestive systems of fish or land vertebrates with intermediate stages transfering the parasites from one host to another. They are acoelomates with no specialised circulatory and respiratory organs so they are restricted to a flattened body layout. The digestive cavity has only one opening for both ingestion and egestion so food can not be processed continuously.",["flatworms","flukes","tapeworms","ribbon worms"]],["Annelida",1,"The segmented worms. They are bilaterally symmetrical, triploblastic, coelomate, invertebrate organisms with a parapodia for locomotion. Their bodies are long, with segments visible by ring-like constrictions called annuli and each segment has the same sets of organs.",["earthworms","leeches","ragworms","feather duster worms","fan worms","bristle worms"]],["Mollusca",1,"Extant species have a soft body composed almost entirely of muscle, a mantle with a significant cavity used for breathing and excretion, the presence of a radula (except for bivalves), and the structure of the nervous system.",["snails","sea slugs","bivalves","cockles","octopuses","squids","cuttlefish","nudibranchs"]],["Ecdysozoa",1,"Characterised by a cuticle composed of organic material that is periodically molted as the animal grows. Their embryos do not undergo spiral cleavage. A respiratory and circulatory system is only present in some species.",["tardigrades","roundworms","crabs","insects","arachnids","centipedes"]],["Nematoda",1,"They are bilaterally symmetrical, elongated, and usually tapered at both ends. Most species are free-living, feeding on microorganisms, but many are parasitic. They secrete an external cuticle that is periodically molted and have a tubular digestive system with openings at both ends. Some cause of soil-transmitted helminthiases. Some species have a pseudocoel.",["roundworms"]],["Arthropoda",1,"Possess an exoskeleton with a cuticle made of chitin, often mineralised with calcium carbonate, a body with differentiated (metameric) segments, and paired jointed appendages. While growing they moult their exoskeleton. They have an open circulatory system with a body cavity called a haemocoel through which haemolymph circulates to the interior organs. Their internal organs are generally built of repeated segments.",["crabs","insects","arachnids","centipedes"]],["Deuterostomia",1,"Characterized by their anus forming before the mouth during embryonic development. Blastula divisions occur as radial cleavage; most deuterostomes display indeterminate cleavage; and the coelom develops from buds off the embryonic gut.",[]],["Echinodermata",1,"Adults have five-pointed radial symmetry (pentamerous symmetry), and are found on the sea bed at every ocean depth from the intertidal zone to the abyssal zone, but the larvae are bilaterally symmetrical. Most are able to reproduce asexually and regenerate tissue, organs and limbs. Their ossified dermal endoskeletons are major contributors to many limestone formations.",["starfish","sea urchins","sea stars","brittle stars","sea lillies","sea cucumbers","sand dollars"]],["Chordata",1,"Possess at some point during their larval or adult stages a notochord, a hollow dorsal nerve cord, an endostyle or thyroid, pharyngeal slits, and a post-anal tail.",["lancelets","sea squirts","vertibrates"]],["Anthozoa",2,"The polyps in the cnidaria phylum that have no medusa stage that have no medusa stage including all the corals and sea/tube anemones",[]],["Hexacorallia",2,"Have six or fewer axes of symmetry but possibly more tentacles",["sea anenomes","hard corals"]],["Actiniaria",2,"",["sea anemones"]],["Antipatharia",2,"",["black corals"]],["Corallimorpharia",2,"Corallimorpharians or the false corals.",["false corals"]],["Scleractinia",2,"The true corals, sometimes called hermatypic or reef building corals, build reefs by depositing hard calcareous material for their skeletons, forming the stony framework of the reef. A close up each looks like miniature sea anemone since they are closely related.",["stony corals"]],["Zoantharia",2,"",["zoanthids"]],["Octocorallia",2,"Colonial organisms of polyps connected by gastrodermal tubes, called solenia, with each polyp having eight fold symmetry (ie. eight tentacles).",["sea fans","sea pens","soft corals","blue corals"]],["Malacalcyonacea",2,"",["soft corals","bamboo corals","sea fans","carnation corals","tree corals"]],["Scleralcyonacea",2,"",["sea pens","soft corals","blue corals"]],["Ceriantharia",2,"Radially symmetrical tube anemones that can fully retract their tentacles into their fibrous tubes.",[]],["Scyphozoa",2,"The true jellyfish. Their firmness comes from hydrostatic pressure and they are 95% water, have four radial gastric pouches.",["lion's mane jellyfish","moon jellies","upside-down jellyfish"]],["Staurozoa",2,"The only extant order is commonly called the stalked jellyfishes. They are similar to the scyphozoans but lack an alternating polyp/medusa life cycle and have a stalk that attaches to rock resulting in a flowerlike in apearance.",["stalked jellyfishes"]],["Cubozoa",2,"Compared to the scyphozoa (true jellyfish) they have more optimised propusion and a more developed nervous system. They have four radial symmetric parts each with six fully formed eyes (including two that are lensed)",["box jellyfish"]],["Hydrozoa",2,"A morphologically diverse group of cnidarians that includes small predatory polyps (like the freshwater genus hydra), colonial organisms (like the Portuguese man o' war) and hydrocorals (like the fire corals).",["Portuguese man o' war / bluebottle","fire corals","deep red jellyfish","air ferns","freshwater jellyfish","flower hat jelly"]],["Aculifera",3,"Have no conch or shell.",[]],["Polyplacophora",3,"Have a shell composed of eight separate shell plates or valves.",["chitons","sea cradles"]],["Caudofoveata",3,"Caudofoveata are worm-like molluscs mostly ranging from 0.02 cm to 10 cm.",[]],["Solenogastres",3,"Small, worm-like, shell-less molluscs.",[]],["Conchifera",3,"Members may bear a single shell, a single pair of shells, or lack a shell.",[]],["Monoplacophora",3,"Molluscs with a cap-like shell, inhabiting deep sea environments. Their reduced head lacks eyes or tentacles. They are a basal group of moluscs with primitive features like paired multiple organs.",[]],["Cephalopoda",3,"Characterized by bilateral body symmetry, a prominent head, a set of arms or tentacles with a two part beak in the center, usually a radula. Many species can squirt ink.",["squid","octopus","cuttlefish","nautilus"]],["Nautilida",3,"Have a coiled shell covering its body and tentacles that form two rings around its mouth. The eyes lack any lens or cornea they also lack ocular muscles.",[]],["Octopodiformes",3,"They have eight arms, although a branch has thin filaments that were modified from two extra tentacles.",[]],["Vampyromorphida",3,"Found in extreme deep sea conditions using its bioluminescent organs and its unique oxygen metabolism. It has two long retractile filaments.",["vampire squids"]],["Octopoda",3,"Soft-bodied, eight-limbed molluscs. They can radically deform their shape and many can change colour. They use their siphon for respiration, waste disposal, discharging ink, and locomotion. They have a complex nervous system, excellent sight, and are among the most intelligent invertebrates.",["octopus"]],["Decapodiformes",3,"They have ten limbs, specifically eight short arms and two long tentacles.",[]],["Spirulida",3,"A deep-water squid-like mollusk with a light-emitting organ. They have no radula, at most a vestigial one. Its shell commonly floats onto beaches and is known as the ram's horn shell.",["ram's horn squid"]],["Sepiida",3,"They have a unique internal shell, the cuttlebone, which is used for control of buoyancy. Their eyes have W-shaped pupils, and two tentacles are furnished with denticulated suckers. Some produce venom that's excreted through their beak, and others can change colour. They eat small molluscs, crabs, shrimp, fish, octopuses, worms, and other cuttlefish. Life expectancy is about 1–2 years.",["cuttlefish"]],["Sepiolida",3,"They have a rounder mantle than cuttlefish and have no cuttlebone with a typical male mantle length being between 1 and 8 cm.",["bobtail squid"]],["Idiosepiidae",3,"The smallest known squids. The dorsal surface of the mantle has a unique oval adhesive organ, which secretes a sticky substance and is used to attach itself to seaweed or seagrass blades.",["pygmy squids"]],["Myopsida",3,"They lack a secondary eyelid. Their arms and tentacles are ornamented with simple suckers without hooks.",["pencil squids","European common squids","reef squids"]],["Bathyteuthida",3,"Deep see squid with some bioluminescent species. They lack corneal membranes covering their eyes. They have tentacle pockets in the head and small suckers on the buccal supports.",[]],["Oegopsida",3,"Their head is without tentacle pockets, eyes lack a corneal covering, arms and tentacle clubs may have hooks, the buccal supports are without suckers, and oviducts in females are paired.",["giant squid","firefly squid"]],["Gastropoda",3,"Snails and slugs from saltwater, freshwater, and from the land",["slugs","snails","nudibranchs","conches","periwinkles","whelks"]],["Patellogastropoda",3,"They have flattened, cone-shaped shells, and the majority of species are commonly found adhering strongly to rocks or other hard substrates. Most species feed on algae. Some return to the same spot on the rock known just before the tide recedes. The radula of limpets is among the strongest biological materials known.",["true limpets"]],["Vetigastropoda",3,"Among the most primitive living gastropods. They have intersected crossed platy shell structure. Most vetigastropods have some bilateral asymmetry of their organ systems.",[]],["Neritimorpha",3,"Contains some sea snails, limpets, freshwater snails, land snails and slugs. Neritomorphs typically have calcified opercula.",[]],["Caenogastropoda",3,"May have coiled or uncoiled shells. Includes some snails, slugs, and limpets. The pallial cavity contains the gill.",["periwinkles","cowries","wentletraps","moon snails","murexes","cone snails","turrids"]],["Euthyneura",3,"Named for the intestines, heart, nephridia, gills, and nerve cords evolving to be twisted but to then, in this clade, evolving to be untwisted.",[]],["Nudipleura",3,"A clade of sea slugs without a shell or with a highly reduced shell; many are very colourful.",["nudibranchs"]],["Euopisthobranchia",3,"A molecular clade that includes the bubble shells, sea hares and pteropods.",["headshield slugs","bubble snails","sea hares","sea butterflies","sea angels"]],["Panpulmonata",3,"A group of terrestrial or freshwater snails. They are hermaphroditic, mostly simultaneously hermaphroditic. They have a single gonad (the ovotestis) that produces both eggs and sperm",["garden snails","pond snails","ramshorn snails","bladder snails"]],["Bivalvia",3,"Aquatic molluscs (marine and freshwater) that have laterally compressed soft bodies enclosed by a calcified exoskeleton consisting of a hinged pair of half-shells known as valves. Most are are benthic filter feeders that bury themselves in sediment.",["clams","oysters","cockles","mussels","scallops"]],["Heterodonta",3,"Their shell has two equally sized halves with a few cardinal teeth separated from a number of long lateral teeth. Their shells lack a nacreous layer, and the gills are lamellibranch in form. Most species have a siphon.",["cockles","Venus clams","freshwater mussels","brooch clams"]],["Palaeoheterodonta",3,"Their two shell halves are equal size and shape, but the hinge teeth are in a single row, instead of separated into two groups.",["freshwater mussels"]],["Protobranchia",3,"Deep water clams with a hinge that uses many similar, small teeth; generally with a central ligament pit; large labial palps which are used in deposit feeding; the gills used only for respiration; the anterior and posterior adductor muscles are nearly equal in size; the foot is divided sagittally and longitudinally with papillate margins.",["nut clams"]],["Pteriomorphia",3,"They have lamellibranch gills, are epibenthic, some attach to the substrate using a byssus, the foot is reduced, and gills are usually large and assist in feeding. Some members have rudimentary eyes, unlike other bivalves.",["marine mussels","scallops","pen shells","oysters"]],["Scaphopoda",3,"They have tapering shells that are conical and slightly curved to the dorsal side. The adult lives buried in sand or mud, with their head-end pointed downwards. The narrow posterior end of the shell sticks up into the seawater for water exchange and waste expulsion. Their tentacles dig for food and eat with a radula. They have no gills.",["tusk shells"]],["Mandibulata",4,"",[]],["Pancrustacea",4,"",["crustaceans","hexapods"]],["Multicrustacea",4,"",[]],["Malacostraca",4,"",["crabs","lobsters","shrimp","isopods"]],["Stomatopoda",4,"",["mantis shrimp"]],["Isopoda",4,"",["isopods","pill bug/slater/roly-poly","tongue eating louse"]],["Amphipoda",4,"",["landhoppers","sandhoppers","scud"]],["Euphausiacea",4,"",["krill"]],["Decapoda",4,"",["crabs","lobsters","crayfish","shrimp","prawns","Moreton Bay bugs","crawdad","mudbug","yabbies"]],["Thecostraca",4,"",[]],["Cirripedia",4,"",["barnacles"]],["Branchiopoda",4,"",[]],["Anostraca",4,"",["fairy shrimp inc/ sea monkeys"]],["Hexapoda",4,"",[]],["Insecta",4,"The insects. They have a segmented body supported by an hard chitin exoskeleton with three segments: the head, thorax and abdomen. The head supports a pair of sensory antennae, usually a pair of compound eyes, zero to three simple eyes, and three sets of variously modified appendages that form the mouthparts. The thorax carries the three pairs of legs and up to two pairs of wings. The abdomen contains most of the digestive, respiratory, excretory and reproductive structures. Most have paired appendages on the rear-most segments called the cerci.",[]],["Myriapoda",4,"",["centipedes","millipedes","allies"]],["Chilopoda",4,"Fast moving with one leg per segment that extends away from the body. Their front legs are pincer like and inject venom. Usually predators.",["centipedes"]],["Diplopoda",4,"Slow moving with two legs per segment (besides the first three segments) that are underneath the body. Usually scavengers.",["centipedes","millipedes","allies"]],["Chelicerata",4,"Named for the fang/pincer appendages that appear before the mouth.",["sea spiders","horseshoe crabs","arachnids"]],["Pycnogonida",4,"",["sea spiders"]],["Xiphosura",4,"",["horseshoe crabs"]],["Arachnida",4,"They have eight legs attached to the cephalothorax. In some species the frontmost pair of legs has converted to a sensory function, while in others, different appendages can grow large enough to take on the appearance of extra pairs of legs.",["spiders","scorpions","pseudoscorpions","harvestmen","camel spiders","whip spiders","vinegaroons","ticks","mites","chiggers"]],["Archaeognatha",5,"Their abdomen ends in three long tail-like structures with a longer the medial filament. They have elongated bodies and backs that are arched. They easily dehydrate and must remain in moist air.",["jumping bristletails"]],["Zygentoma",5,"Their abdomen ends in three long tail-like structures of similar lengths. Their scales have a silvery glitter. They feed on organic detritus.",["silverfish","firebrat"]],["Pterygota",5,"The winged insects. They have veined wings on their second and third thoracic segments. Some species are have lost their wings when they have become a disadvantage, like in parasites or cave dwellers. Flight in insects is believed to have evolved from a single common ancestor.",[]],["Ephemeroptera",5,"They have long tails and wings that do not fold flat over the abdomen. Their immature stages are aquatic fresh water nymphs that emerge as adults together in large swarms. Adults do not feed and have only vestigial mouthparts.",["mayflies"]],["Odonata",5,"Predatory flying insects have aquatic larvae. The adults have two pairs of long, transparent wings that move independently, large compound eyes, short bristle-like antennae, and elongated abdomens. They are carnivorous and are almost entirely insectivorous. Damselflies have narrow wings as they join the thorax and dragonflies hind wings are wider near the base.",["dragonflies","damselfiles","darners","clubtails","skimmers"]],["Neoptera",5,"They have a wing-flexing mechanism that enables the wings to be folded back to rest on the surface of the abdomen. This has been lost in the butterflies.",[]],["Psocodea",5,"Small, scavenging insects that feed primarily on fungi, algae, lichen, and organic detritus. Some are parasitic on warm-blooded hosts feeding on skin, debris or blood. Non-parasitic species have a neck-like constriction between head and thorax.",["bark lice","book lice","parasitic lice"]],["Hemiptera",5,"The true bugs. Named because the the texture of the front wings is different near the base (leathery) than at the apex (membranous). Other distinguishing features are the way the front wings cross over to form “X”-pattern on back and the tubular proboscis (beak) used as piercing-sucking mouthparts. They range in size from 1 mm (0.04 in) to around 15 cm (6 in). They can be terrestrial, aquatic and semi-aquatic. Most feed on plant sap but some are bloodsucking, and others are predators.",["cicadas","aphids","stink bugs","bed bugs","assassin bugs","shield bugs","plant hoppers","leaf hoppers","moss bugs","bat bugs"]],["Thysanoptera",5,"Slender insects, widest in middle, with wings fringed with long hairs and unique asymmetrical 'piercing-sucking' mouthparts mouthparts that are concealed within head capsule. They are usually less than 1 mm long. Many species are fungivorous and many are pollinators.",["thrips"]],["Polyneoptera",5,"They have chewing mouthparts and incomplete development so instead of a pupal stage they develop through a series of nymphal instars that gradually acquire adult features. Some adults are secondarily wingless but if not they have four wings and the front wings are usually thickened or leathery with the front and hind wings operating independently of one another.",[]],["Orthoptera",5,"Grasshoppers, crickets, and allies. Named by having thickened front wings that are parallel-sided. Other distinguishing factors are hind legs modified for jumping; and antennae segments that are cylindrical and uniform in size. Many species have the ability to make and detect sounds.",["grasshoppers","locusts","crickets"]],["Phasmatodea",5,"Nocturnal herbivors known for having either cylindrical stick-like shapes or flattened leaflike shapes and camouflage well and the first of their three segments in their thorax is being shorter. They have chewing mandibles, long and slender legs, and long and slender antennae. Wings are reduced when present and then the thorax is longer to accomodate the the flight muscles.",["stick instects"]],["Embioptera",5,"They have long, flexible bodies and short legs with the lower segment of the front limbs enlarged and modified for silk production. They males do not feed and die soon after mating. Only the males have wings but not in all species. They live subsocially in galleries spun of silk. They are generalist herbivores.",["webspinners"]],["Plecoptera",5,"Named for the braided ladder-like pattern their veins make across their wings. They have long antennae and cerci; and their wings fold flat and extend past tip of abdomen. The nymphs are aquatic; usually herbivorous with some being hunters;  and live in the floor of well-oxygenated lakes and streams. Some adults do not feed at all, but those that do are herbivorous.",["stoneflies"]],["Dermaptera",5,"They have a pair of forceps-like pincers on their abdomen, and membranous wings folded underneath short, rarely used forewings. Some groups are tiny parasites on mammals and lack the typical pincers. They are mostly scavengers or herbivores that are mostly nocturnal and oten hide during the day.",["earwigs"]],["Zoraptera",5,"Small and soft bodied insects with two forms: winged with wings sheddable as in termites, dark and with eyes and ocelli; or wingless, pale and without eyes or ocelli. They have a characteristic nine-segmented beaded antenna. They have mouthparts adapted for chewing and are mostly found under bark, in dry wood or in leaf litter.",["angel insects"]],["Mantodea",5,"They have triangular heads with bulging eyes supported on flexible necks, raptorial front legs for catching and gripping prey, an upright posture and elongated bodies. They are mostly ambush predators. Females sometimes practice sexual cannibalism.",["mantises"]],["Blattodea",5,"The cockroaches and termites. Cockroaches are flattened dorsolaterally and are roughly oval with a shield-like plate covering the thorax and posterior region of the head, long thread-like antennae, and two short, multi-segmented protrusions from the rear.",["cockroaches","termites"]],["Termitoidae",5,"Detritophagous eusocial cockroaches that consume a variety of decaying plant material. They have antennae that resemble a string of beads and a wide junction between thorax and abdomen. The worker caste is a soft-bodied, unpigmented, often blind and are diploid individuals of both sexes that develop from fertilised eggs. The soldier class have larger heads with prominent mandibles and are often blind. The winged males and females usually have eyes and will pair to create a new colony after a nuptial flight.",["termites"]],["Notoptera",5,"They have long antennae but no wings, even as adults. They have mandibles adapted for biting with the lower jaw longer than the upper jaw.",["ice crawlers","gladiators"]],["Grylloblattodea",5,"They live in the cold on top of mountains and the edges of glaciers or in caves, have long cerci, their eyes are either missing or reduced, and most species are less than 3 cm long. Most are nocturnal and feed primarily on dead arthropods and carrion but can survive on plant material. Their optimal living temperature is usually between 1–4 °C and most will die with temperatures above 10 °C so they in colder temperatures they live under snow pack near the soil.",["ice crawlers"]],["Mantophasmatodea",5,"Nocturnal carnivores with short cerci that live in rock crevices. They are rate and only found in parts of southern Africa. During courtship, they communicate using vibrations transmitted through the ground or substrate",["gladiators"]],["Holometabola",5,"They undergo complete metamorphosis and go through distinctive life stages: egg, larva, pupa, and adult. Larval traits maximize feeding, growth, and development. Adult traits enable dispersal, mating, and egg laying. The pupa is usually a quiescent, non-feeding developmental stage and most move very little, sometimes enclosed in other structures like cocoons, nests, or shells.",[]],["Neuroptera",5,"The net-winged insects. Adults have two pairs of membranous wings with an extensive pattern of veins and crossveins that give them a lacy appearance. The larvae are specialised predators, with elongated mandibles adapted for piercing and sucking. Adults of many groups are also predatory, but some do not feed, or consume only nectar.",["lacewings","mantidflies","antlions"]],["Strepsiptera",5,"The twisted-wing insects. They are endoparasites of other insects with a parasitic larval stage. In most species the female does not leave its host and remains larviform (legless and wingless), protruding between segments of the host's abdomen. The adult males hindwings are generally fan-shaped; their forewings are modified to be small and club-shaped; their mouthparts cannot be used for feeding; their eyes have a blackberry-like appearance; and their antennae are often branched.",[]],["Megaloptera",5,"Adults have large, nearly equal sized wings with crossveins near leading edge and a pleated region on their hindwings to help them fold over the abdomen; their antennae are prominent; and they have strong mandibles apparently adapted for chewing but many species do not eat as adults. The larvae live in fresh water; have large heads and elongated bodies; possess strong jaws that they use to capture their prey; and are carnivorous feeding on small invertebrates.",["alderflies","dobsonflies","fishflies"]],["Raphidioptera",5,"The adults body is long and slender, has a mobile head and two pairs of long, membranous wings that are prominently veined. Females usually have a long ovipositor that is used to deposit eggs into crevices or under bark. The larvae develop under the bark of trees and have large heads with projecting mandibles with long bodies. Both adults and larvae are predators of soft-bodied arthropods.",["snakeflies"]],["Trichoptera",5,"The adult is a medium-sized insect with membranous, hairy wings, which are held in a tent-wise fashion when the insect is at rest. The antennae are fairly long and threadlike, the mouthparts are reduced in size and the legs have five lower leg joints. The larvae are aquatic and may be predators, leaf shredders, algal grazers, or collectors of particles from the water column and benthos. The larvae of many species use silk to make protective cases, which are often strengthened with gravel, sand, twigs, or other debris. Most adults have short lives during which they do not feed.",["caddisflies"]],["Mecoptera",5,"Adults are small to medium-sized insects with long beaklike rostra; an elongated head with chewing mouthparts; membranous wings that extend beyond abdomen; slender, elongated bodies; and are mostly scavengers, feeding on decaying vegetation and dead invertebrates. The larvae are caterpillar-like and mostly feed on vegetable matter. Both larvae and adults are omnivorous. Males of the scorpionfly group have enlarged genitals raised over the body that look similar to the stingers of scorpions.",["scorpionflies","hangingflies","earwigflies"]],["Siphonaptera",5,"Small flightless insects that live as external parasites of mammals and birds feeding on the blood of their hosts. They grow to be 3 millimetres long, and have bodies that are narrow to better move through their hosts' fur or feathers. Their hind legs are extremely well adapted for jumping.",["fleas","jiggers"]],["Hymenoptera",5,"Adults range from very small to large insects; have well-developed mandibles adapted for chewing; many species have a long proboscis for drinking nector; and hindwings connected to the forewings by a series of hooks. Many of the species are parasitic. Females typically have an ovipositor for inserting eggs into hosts and this is often modified into a stinger. A large sub group are known for their 'wasp-waist'.",["sawflies","wasps","ants","bees"]],["Lepidoptera",5,"Characterised by scales that cover the bodies, large triangular wings, and a coiled proboscis for siphoning nectars. The scales are modified hairs and give them their wide variety of colors and patterns. Mating and the laying of eggs is normally performed near or on host plants for the larvae. The larvae, caterpillars, have a cylindrical body with a well-developed head, mandible mouth parts, three pairs of thoracic legs and from none up to five pairs of prolegs.",["butterflies","moths","caterpillars"]],["Diptera",5,"Adults only use a single pair of wings to fly since the hindwings have evolved into sensory orgrans to perform advanced aerobatics; have a mobile head; a pair of large compound eyes; and mouthparts designed eithern for piercing and sucking, or for lapping and sucking. The eggs are often laid on the larval food-source and the larvae, which lack true limbs, develop in a protected environment, often inside their food source. Other species opportunistically deposit hatched or hatching larvae instead of eggs on carrion, dung, decaying material, or open wounds of mammals.",["true flies","lovebugs","midges","mosquitoes","wireworms","metallic flat-headed wood borers"]],["Coleoptera",5,"Adults front pair of wings are hardened into wing-cases that meet in a straight line down the center of the back; typically have a particularly hard exoskeleton; most have mandibles that move in a horizontal plane; They feed on plants and fungi, break down animal and plant debris, or eat other invertebrates. The larvae are commonly called grubs; and typically have elongated bodies with chewing mouthparts and poorly developed eyes.",["beetles","Maybug","ladybugs","scarabs","weevils","fireflies","glowworms","grubs"]],["Symphyta",6,"A paraphyletic grouping of basal groups that are all commonly called sawflies. Their ovipositor has a saw-like appearance and the females use it to cut into the plants to they lay their eggs.",["sawflies"]],["Apocrita",6,"Known for a narrow 'waist' (petiole) formed between the first two segments of the actual abdomen. Most species have grublike larvae that are sedentary; They may feed as parasites on other arthropods or within plant structures, or they may be fed by adults within a nest. Eusociality evolved multiple times.",["ants","bees","wasps"]],["Parasitoida",6,"Contains parasitoid wasps.",[]],["Ceraphronoidea",6,"",[]],["Ichneumonoidea",6,"",[]],["Proctotrupomorpha",6,"Contains mainly small parasitic wasps.",[]],["Cynipoidea",6,"",["gall wasps"]],["Platygastroidea",6,"",[]],["Chalcidoidea",6,"",[]],["Diaprioidea",6,"",[]],["Proctotrupoidea",6,"",[]],["Evanioidea",6,"",[]],["Stephanoidea",6,"",[]],["Trigonaloidea",6,"",[]],["Aculeata",6,"The defining feature of the group is the modification of the ovipositor into a stinger, but not all species have this.",[]],["Chrysidoidea",6,"",["jewel wasps"]],["Vespoidea",6,"Includes wasps with a large variety of lifestyles including eusocial, social, and solitary habits, predators, scavengers, parasitoids, and some herbivores.",["yellowjackets","paper wasps","hornets","potter wasps"]],["Pompiloidea",6,"",[]],["Thynnoidea",6,"",["chyphotid wasps","thynnid wasps"]],["Tiphioidea",6,"",[]],["Scolioidea",6,"",["scoliid wasps"]],["Formicoidea",6,"Eusocial insects that form colonies. They are easily identified by their geniculate (elbowed) antennae and the distinctive node-like structure that forms their slender waists.",["ants"]],["Apoidea",6,"",["bees","sphecoid wasps"]],["Anthophila",6,"Herbivorous insects that specifically feed on nectar and pollen. Many are eusocial.",["honey bees","bumblebees","stingless bees"]],["Acariformes",7,"The more diverse of the two superorders of mites. Members ingest solid food, being mainly microherbivores, fungivores and detritivores. Some are plant parasite species. Many species are also predators, fungivores, and animal parasites.",["mites","house dust mites","rust mites","gall mites"]],["Opiliones",7,"Known for having exceptionally long legs relative to their body size (but this is not true of all species). The connection between the cephalothorax and abdomen is broad, so that the body appears to be a single oval structure. They have no venom glands or silk glands. They can swallow chunks of solid food, not only liquids. They tend to have a single pair of camera-type eyes in the middle of the head.",["harvestmen","harvesters","daddy long legs"]],["Ricinulei",7,"They inhabit the leaf litter of rainforest floors, as well as caves, where they search for prey with their elongate sensory second, longer, leg pair. They are predatory; eating small arthropods. Extant species have no eyes. They have a \"hood\" which can be raised and lowered over the head. When lowered, it covers the mouth and the chelicerae.",["hooded tickspiders"]],["Solifugae",7,"Most species live in dry climates and are carnivores that feed opportunistically on ground-dwelling arthropods and other small animals. They hunt their prey using three main hunting-strategies: Stalking, chasing, and ambushing. They lack both spinnerets and silk. The chelicerae serve as jaws, and in many species also are used for stridulation. They have a pair of large central eyes. The smaller males often have longer legs.",["solifuges","sun spiders","camel spiders","wind scorpions"]],["Parasitiformes",7,"The less diverse of the two superorders of mites. Many species are parasitic. About half of the species are predatory and cryptozoan, living in soil-litter, rotting wood, dung, carrion, nests or house dust. A few species have switched to grazing on fungi or ingesting spores or pollen.",["mites","red mites","ticks"]],["Pseudoscorpiones",7,"They are small arachnids with a flat, pear-shaped body, and pincer-like pedipalps that resemble those of scorpions. They usually range from 2 to 8 mm in length. They have eight legs with five to seven segments each. They spin silk from a gland in their jaws to make disk-shaped cocoons for mating, molting, or waiting out cold weather. Some species are arboreal, while others are phagophiles, eating parasites in an example of cleaning symbiosis.",["false scorpions","book scorpions"]],["Scorpiones",7,"They are predatory arachnids with eight legs, a pair of grasping pincers and a narrow, segmented tail, often carried in a characteristic forward curve over the back and always ending with a stinger. They primarily prey on insects and other invertebrates, but some species hunt vertebrates. They use their pincers to restrain and kill prey, or to prevent their own predation.",["scorpions"]],["Tetrapulmonata",7,"They have a set of paired book lungs occupying the second and third opisthosomal segments; a large postcerebral pharynx; prosomal endosternite with four segmental components; and a complex coxotrochanteral joint in the walking legs.",[]],["Araneae",7,"They are air-breathing arthropods that have eight limbs, chelicerae with fangs generally able to inject venom, and spinnerets that extrude silk. The eye count can vary from 8, 6, 4, 2 and 0. The usual body segments found in arthropods are fused into two tagmata, the cephalothorax (prosoma) and the opisthosoma (abdomen) that is joined by a small, cylindrical pedicel.",[]],["Mygalomorphae",7,"They have chelicerae (fangs) that point straight down, parallel to the long axis of the spider's body, and only have one orientation they can employ during prey capture. Many members are known as trapdoor spiders. Many are well adapted to killing other large arthropods and will also sometimes kill small mammals, birds, and reptiles.",["tarantulas","Australian funnel web spiders","mouse spiders","trapdoor spiders"]],["Araneomorphae",7,"They have chelicerae (fangs) that point diagonally forward and cross in a pinching action.",[]],["Synspermiata",7,"United by having simpler genitalia than other araneomorph spiders, lacking a cribellum, and sharing an evolutionary history of synspermia – a particular way in which spermatozoa are grouped together when transferred to the female. There is unusual in the degree to which the eye number varies being either 8, 6, 4, or 2. Some species exhibit presocial behaviour, in which mature spiders live together and assist the young with food.",["coneweb spiders","false violin spiders","woodlouse hunters","sowbug-eating spiders","cell spiders","goblin spiders","cellar spiders","daddy long-legs spiders","carpenter spiders","vibrating spiders","gyrating spiders","long daddies","angel spiders","plectreurid spiders","tube-dwelling spiders","recluse spiders","violin spiders","brown recluse spiders","sand spiders","assassin spiders","long-legged cave spiders","armored spiders"]],["Palpimanoidea",7,"Many specialize in preying on other spiders. They often have enlarged front legs, which enable them to both seize and manipulate prey. Their heads are raised up on a \"neck\" with long chelicerae (\"jaws\").",["assassin spiders","palp-footed spiders"]],["Entelegynae",7,"Females have a genital plate and three external openings in the female's body. Sperm is injected via one or other of the two separate copulatory openings and then enters the spermathecae. The other external opening is where the fertilized egg emerges. Males have complex palpal bulbs.",[]],["Araneoidea",7,"",["araneoids","tangle-web spiders","cobweb spiders","comb-footed spiders","widow spiders","redback spiders","orb-weaver spiders","pirate spiders","ray spiders","sheet weavers","money spiders","triangular spiders"]],["Eresidae",7,"They can look quite smooth and velvety and usually live in silken tubes under objects, or underground, with some species building silken nests. They are almost entirely limited to the Old World, with the exception of one species known from Brazil.",["velvet spiders","ladybird spiders"]],["Titanoecidae",7,"They are mostly dark-colored builders of \"woolly\" (cribellate) silk webs. Several species are found at relatively high altitudes in mountain ranges and may be very common in such habitats.",[]],["RTA clade",7,"They have a backward-facing projection on the tibia of the male pedipalp.",[]],["Zodariidae",7,"Most species are daytime hunters and live together with ants, mimicking their behavior and sometimes even their chemical traits.",["ant spiders"]],["Sparassidae",7,"Many species grow very large. Their legs bear fairly prominent spines. They tend to live under rocks, bark and similar shelters. They hunt and forage for food with a diet consisting primarily of insects and other invertebrates, and occasionally small skinks and geckos. They are able to travel extremely quickly.",["huntsman spiders","giant crab spiders","wood spiders","rain spiders","lizard-eating spiders"]],["Lycosidae",7,"Traditionally defined as having a \"grate-shaped\" reflective layer at the back of the eye but phylogenetic studies shuffle these species somewhat.",["wolf spiders","wandering spiders","lynx spiders","nursery web spiders","flower crab spiders","ant mimicking crab spiders"]],["Dionycha",7,"Characterized by the possession of two tarsal claws with tufts of hairs (setae) beside them, which produce strong adhesion, enabling some species to climb glass.",[]],["Clubionidae",7,"They are nocturnal, sac-building hunting spiders with a near-worldwide distribution.",["sac spiders"]],["Gnaphosidae",7,"Generally characterized by having barrel-shaped anterior spinnerets that are one spinneret diameter apart. The main exception are some ant-mimicking species. All species lack a prey-capture web and generally run prey down on the surface. They entangle their prey in swathing attacks, often applying their webbing to their prey's legs and mouths. They hunt at night and spend the day in a silken retreat.",["ground spiders"]],["Corinnidae",7,"Phylogenetic studies have made the group stricter but the group was known for having eight eyes arranged in two rows, conical anterior spinnerets that touch and for being wandering predators that build silken retreats, or sacs, usually on plant terminals, between leaves, under bark or under rocks. Some species mimic ants and velvet ants.",["corinnid sac spiders"]],["Philodromidae",7,"They have a crab-like shape due to the first two pairs of legs being oriented sideways (laterigrade) but are not closely related to garden crab spiders (Thomisidae). They have scopula only at the tips of the tarsi and their eyes are in two curved rows with the posterior row wider than the anterior row. They are active ambush predators and are often found on the stems and leaves of plants.",["philodromid crab spiders","running crab spiders"]],["Salticidae",7,"They have some of the best vision among arthropods and are capable of stereoptic color vision. Most species are capable of very agile jumps. Both their book lungs and tracheal system are well-developed, and they use both systems (bimodal breathing). All species have four pairs of eyes, with the anterior median pair (the two front middle eyes) being particularly large.",["jumping spiders"]],["Amblypygi",7,"They possess no silk glands or venom. They are found in tropical and subtropical regions worldwide, mainly in warm and humid environments. They like to stay protected and hidden within leaf litter, caves, or underneath bark. Some species are subterranean; all are nocturnal. They have eight legs, but use only six for walking, often in a crab-like, sideways fashion. The front pair of legs are modified for use as antennae-like feelers. They mostly eat arthropod prey, but sometimes feed on vertebrates. They grind and chew the prey prior to ingestion.",["whip-spiders","tailless whip-scorpions"]],["Uropygi",7,"They resemble true scorpions, with a whiplike tail, and when attacked can discharge an offensive, vinegar-smelling liquid. They use only six legs for walking, with the first two legs serving as antennae-like sensory organs. All species also have large scorpion-like pedipalps (pincers). They have one pair of median eyes at the front of the cephalothorax and up till five pairs of lateral eyes on each side of the head. They are carnivorous, nocturnal hunters feeding mostly on insects, millipedes, scorpions, and terrestrial isopods, but sometimes on worms and slugs. The prey is crushed between special teeth while eating.",["whip scorpions","vinegaroons"]],["Cephalochordata",8,"Fish-like benthic filter feeding chordates with a dorsal nerve cord protected by a notochord made up of collagen fibers and gills used for feeding not breathing.",["lancelets"]],["Tunicata",8,"Cordates with a larval form that looks a lot like a frog tadpole and has a notocord but most adult forms are filter feeders, often permanently attached to rocks and losing their notocord.",["sea squirts","salp","ghostfish"]],["Vertebrata",8,"Animals with a vertebral column, and a cranium, or skull.",[]],["Agnatha",8,"The extant jawless fish.",["hagfishes","lampreys"]],["Myxini",8,"Eel-shaped jawless fish that have a skull but no vertebral column.",["hagfish","slime eels"]],["Petromyzontida",8,"Adults are characterized by a toothed, funnel-like sucking mouth.",["lampreys"]],["Gnathostomata",8,"The jawed fish. They have a camera-style eye, adaptive immune system and myelinated neurons.",[]],["Chondrichthyes",8,"A class of jawed fish including the cartilaginous fish.",[]],["Elasmobranchii",8,"The cartilaginous fish. They have no swim bladder and need to swim to avoid sinking. The teeth are in several series; the upper jaw is not fused to the cranium, and the lower jaw is articulated with the upper.",["sharks","whale sharks","rays","skates","sawfish"]],["Holocephali",8,"These sometimes called ghost sharks and sometimes put in their own class.",["chimaeras"]],["Osteichthyes",8,"The bony fish. Had foregut pouches that eventually evolved into swim bladders and lungs.",[]],["Actinopterygii",8,"The ray-finned fish. The majority of the extant fish. They have lightly built fins made of webbings of skin supported by radially extended thin bony spines that resemble folding fans.",[]],["Sarcopterygii",8,"The lobe-finned fish (and relatives to all land vertebrates). Characterised by prominent muscular limb buds (lobes) within their fins, which are supported by articulated appendicular skeletons.",["lobe-finned fish","coelacanths","lungfish","Queensland lungfish"]],["Rhipidistia",8,"A clade that includes the lobe-finned fish, lungfishes and the tetrapods.",[]],["Dipnoi",8,"",["lungfish"]],["Tetrapoda",8,"Four-limbed vertebrates. Have paired lungs.",[]],["Selachii",9,"",["sharks"]],["Galeomorphi",9,"The galean sharks.",[]],["Heterodontiformes",9,"",["bullhead sharks"]],["Orectolobiformes",9,"",["carpet sharks","whale sharks","nurse sharks"]],["Lamniformes",9,"",["great white","goblin shark","thresher sharks","basking sharks","megalodon"]],["Carcharhiniformes",9,"",["catsharks","houndsharks","tiger sharks","hammerhead sharks"]],["Squalomorphi",9,"Generally characterized by lacking traits such as an anal fin, nictitating membrane, or suborbital shelves in the cranium.",[]],["Hexanchiformes",9,"",["frilled sharks","cow sharks"]],["Squaliformes",9,"Often deep water sharks.",["gulper sharks","kitefin sharks","lantern sharks","rough sharks","sleeper sharks","dogfish sharks"]],["Echinorhiniformes",9,"Deep sea sharks.",["bramble sharks","prickly sharks"]],["Squatiniformes",9,"",["angelsharks"]],["Pristiophoriformes",9,"",["sawsharks"]],["Batomorphi",9,"",["rays"]],["Torpediniformes",9,"",["electric rays"]],["Rajiformes",9,"",["skates"]],["Pristiformes",9,"",["Sawfish","carpenter sharks"]],["Myliobatiformes",9,"",["stingrays","manta rays","devil rays"]],["Polypteriformes",10,"",["bichirs","reedfish"]],["Acipenseriformes",10,"",["sturgeon","paddlefish"]],["Neopterygii",10,"The dorsal and anal fins have a 1:1 ratio between radials and basals, the caudal fin also becomes more symmetrical, scales are less mineralised and more ossification of the notochord.",[]],["Lepisosteiformes",10,"",["gars"]],["Amiiformes",10,"",["bowfins"]],["Teleostei",10,"Have a movable premaxilla used to protrude their jaws outwards from their mouth. Most use external fertilisation and many are sequential hermaphrodites changing sex with age.",[]],["Osteoglossomorpha",10,"Use their tongue as the opposing surface for the teeth. Extant species are freshwater fish.",[]],["Hiodontiformes",10,"",["mooneyes"]],["Osteoglossiformes",10,"",["bonytongues","elephantfishes"]],["Elopomorpha",10,"Unique to this group are flat and transparent larvae.",[]],["Elopiformes",10,"",["tenpounders","tarpons","ladyfish"]],["Albuliformes",10,"",["Japanese gissus","bonefishes"]],["Notacanthiformes",10,"Deep-sea ray-finned eels.",[]],["Anguilliformes",10,"",["true eels"]],["Otocephala",10,"Named for the presence of a hearing link from the swimbladder to the inner ear.",[]],["Clupeiformes",10,"",["herrings","anchovies","sardines"]],["Alepocephaliformes",10,"",["slickheads","tubeshoulders"]],["Ostariophysi",10,"Have an alarm substance and a Weberian apparatus - a chain of small bones that connect the auditory system to the gas bladder. Most species possess a swim bladder",[]],["Gonorynchiformes",10,"",["milkfish"]],["Cypriniformes",10,"",["minnow","carp","loach"]],["Characiformes",10,"",["tetras","piranhas"]],["Gymnotiformes",10,"They have long bodies and swim using undulations of their elongated anal fin. They mostly live in fresh water, are usually nocturnal and are capable of producing electric fields to detect prey, for navigation, communication, and for the electric eel, attack and defense.",["knifefish","electric eels"]],["Siluriformes",10,"In some species, their mucus-covered skin is used in cutaneous respiration, where the fish breathes through its skin.",["catfish"]],["Euteleostei",10,"",[]],["Lepidogalaxiiformes",10,"",["salamanderfish"]],["Protacanthopterygii",10,"Usual traits include: more than 24 vertebrae, epicentral cartilages, one supraorbital bone, and a mesocoracoid, an adipose fin, and (often prominent) glossohyal teeth. Most members are mid-sized to larger predators of smaller animals.",[]],["Argentiniformes",10,"",["marine smelts"]],["Galaxiiformes",10,"",["white bait","mudfishes"]],["Esociformes",10,"",["pike"]],["Salmoniformes",10,"",["salmon","trout"]],["Stomiati",10,"Known for their large mouth, long throat/barbel, and no caudal filament.",[]],["Stomiiformes",10,"",["dragonfish"]],["Osmeriformes",10,"",["smelt"]],["Neoteleostei",10,"The swim bladder, when present, only serves as a buoyancy organ and is no longer connected to the gastrointestinal tract.",[]],["Ateleopodiformes",10,"",["jellynoses"]],["Aulopiformes",10,"",["lizardfish"]],["Myctophiformes",10,"",["lanternfish"]],["Acanthomorpha",10,"Have spines at the anterior edge of the dorsal and anal fins that can be extended for protection and retracted to decrease drag when swimming.",[]],["Lampridiformes",11,"",["oarfish","opah","ribbonfish"]],["Paracanthopterygii",11,"",[]],["Percopsiformes",11,"",["trout-perches"]],["Zeiformes",11,"",["dories"]],["Stylephoriformes",11,"",["Tube-eyes"]],["Gadiformes",11,"",["cods"]],["Polymixiiformes",11,"",["beardfish"]],["Acanthopterygii",11,"The spiny-rayed fishes.",[]],["Beryciformes",11,"",["alfonsinos","whalefishes","squirrelfish","soldierfish","alfonsinos","berycids","pricklefishes","whalefishes","gibberfishes"]],["Trachichthyiformes",11,"",["pinecone fishes","slimeheads","fangtooths"]],["Percomorpha",11,"",[]],["Ophidiiformes",11,"",["cusk-eels","brotulas","pearlfishes"]],["Batrachoidiformes",11,"",["toadfishes"]],["Syngnathomorpharia",11,"",[]],["Scombriformes",11,"",["tunas","mackerel","bluefishes","ragfishes","pomfrets","cutlassfish","swallowers","medusafish"]],["Syngnathiformes",11,"They generally have elongated, narrow bodies surrounded by a series of bony rings with small, tubular mouths. The shape of their mouth is usually for the ingestion of prey at close range via suction and are usually well camouflaged. The males house the fertilized eggs in an osmo-regulated brood pouch, or adhere them to their tail, until the eggs reach maturity.",["seahorses","seadragon","pipefishes","trumpetfishes","goatfishes","gurnards","seamoths"]],["Gobiiformes",11,"They have adhesive eggs with elaborate structures. Many species have parental care from the male. Some species can remain out of the water for long periods.",["gobies","sleepers","mudskippers","prawn gobies","cardinalfishes","nurseryfishes","sand-divers"]],["Carangimopharia",11,"",[]],["Synbranchiformes",11,"",["swamp eels"]],["Anabantiformes",11,"",["labyrinth fishes","snakeheads","badids"]],["Carangiformes",11,"",["jacks","flatfish","billfish"]],["Ovalentariae",11,"Have demersal eggs that are attached to a substrate.",[]],["Cichliformes",11,"",["cichlids","leaffishes","convict blenny"]],["Mugiliformes",11,"",["mullets","Asiatic glassfish"]],["Beloniformes",11,"",["flyingfishes","ricefish","needlefishes","halfbeaks"]],["Cyprinodontiformes",11,"",["livebearers","killifishes","rivulines","pupfishes"]],["Atheriniformes",11,"",["silversides","rainbowfishes"]],["Blenniiformes",11,"They often have a slimy coating on their scales; The blennies usually have elongated bodies with blunt heads sometimes with whiskers on top. The nested damselfishes and clownfishes are usually laterally compressed. They tend to be reclusive, burrowing into sandy substrates and living in reef crevices. Some look similar to the goby and dragonet families.",["blennies","clingfishes","dottybacks","jawfishes","damselfishes","clownfishes","anemonefishes","surfperches","basslets"]],["Eupercaria",11,"",[]],["Perciformes",11,"",["groupers","perches","seabasses","darters","notothens","flatheads","searobins","scorpionfish","sculpins","sticklebacks","eelpouts","lionfish"]],["Centrarchiformes",11,"",["blackbasses","temperate perch","knifejaws","sea chubs","freshwater sunfish","hawkfishes"]],["Labriformes",11,"Their upper jaw is fused with the skull, allowing for powerful suction feeding. Found in a variety of marine habitats with diverse feeding habits. They use pectoral fin oscillation to move around.",["wrasses","parrotfishes","cales","sandlances","stargazers","false scorpionfishes","sandperches","torrentfish"]],["Acropomatiformes",11,"",["lanternbellies","gnomefishes","wreckfishes","banjofish","oceanic basslets","armorheads"]],["Acanthuriformes",11,"Butterflyfishes, Angelfishes, And Allies. Contains many of the iconic tropical reef fish groups. Most species have a laterally compressed body for maneuvering between corals. They usually have a small, terminal mouth for for grazing on algae.",["surgeonfishes","butterflyfishes","rabbitfishes","marine angelfishes","drumfishes","grunts","ponyfishes","mojarras","snappers","temperate basses","spadefishes","porgies","scats","bigeyes","boarfishes","bandfishes"]],["Lophiiformes",11,"Named from the way many species have a modified dorsal fin ray that acts as a lure for prey. They are generally ambush predators. The majority of species are bottom-dwellers, with some deep-sea anglerfish living high in the water column.  They are sexual dimorphic; this can go so far as sexual parasitism with the male attached to the much larger female, sometimes fusing together as an example of natural parabiosis. In most species, a wide mouth extends all around the anterior circumference of the head, and bands of inwardly inclined teeth line both jaws and the teeth are depressible and can hinge back. They have gills that open behind the pectoral fins. Their lengths vary from 2–18 cm.",["anglerfishes","deep-sea batfishes","sea toads","frogfishes","monkfishes","goosefishes","dreamers"]],["Tetraodontiformes",11,"Most do not have a streamlined body and are slow moving are ostraciiform swimmers. They have bodies that are nearly square or triangular, spherical, or laterally compressed. They range in size from 2 cm to 3 m in length. Some inflate their bodies in defense or have a powerful neurotoxin.",["pufferfishes","boxfishes","triplespines","spikefishes","triggerfishes","filefishes","ocean sunfish","porcupinefishes"]],["Amphibia",12,"",["frogs","salamanders","newts","caecilians"]],["Anura",12,"",["frogs"]],["Urodela",12,"",["salamanders","newts","axolotls"]],["Gymnophiona",12,"Limbless, worm or snake shaped amphibians with small or nonexistent eyes.",["caecilians"]],["Amniota",12,"Has an embryo that develops within a set of protective extra-embryonic membranes; thicker and keratinized skin; costal respiration (breathing by expanding/constricting the rib cage); more complex kidneys; the presence of an astragalus for better extremity range of motion; the diminished role of skin breathing.",[]],["Synapsida",12,"The sibling taxon to sauropsida. All mammals and their extinct relatives. They have a single hole behind each eye, on the lower part of the skull.",[]],["Sauropsida",12,"The sibling taxon to Synapsida. The class Reptilia but including birds and extinct relatives.",[]],["Eureptilia",12,"A contested clade with the only extant species being in Diapsida.",[]],["Diapsida",12,"Have two holes behind their eye sockets.",["birds","reptiles","turtles"]],["Sauria",12,"All descendants of the most recent common ancestor to crocodilians, birds, lizards, snakes and the tuatara.",[]],["Lepidosauria",12,"All descendants of the most recent common ancestor to lizards, snakes and the tuatara.",["tautara","lizards","snakes"]],["Rhynchocephalia",12,"The only extant species is the tuatara in New Zealand. They were diverse during the Mesozoic era. They have primitive hearing organs and lower odorant receptors compared to crocodiles",["tuatara"]],["Squamata",12,"",["lizards","snakes"]],["Gekkota",12,"",["gekkos","legless lizards"]],["Scincomorpha",12,"",["skinks","allies","blue-tongued lizards","limbless skinks"]],["Laterata",12,"",["wall lizards","rock lizards","worm lizards"]],["Toxicofera",12,"Venom evolved once for this taxa",[]],["Anguimorpha",12,"All autarchoglossans closer to Varanus (monitor lizards) and Anguis (slowworms) than Scincus",["monitors","goannas","komodo dragons","slow worms","glass lizards"]],["Iguania",12,"The iguanas, chameleons, agamids, and New World lizards.",[]],["Pleurodonta",12,"",["iguanas","New World lizards"]],["Acrodonta",12,"Includes the families Chamaeleonidae (chameleons, their range is mostly in Africa) and Agamidae (dragon lizards including the thorny devil, and frilled-neck lizards)",["chameleons","thorny devil","frilled-neck lizards"]],["Serpentes",12,"",["snakes"]],["Archosauria",12,"All living and extinct relatives of birds and crocodilians.",["crocodiles","birds"]],["Testudines",12,"",["turtles","tortoises","terrapins"]],["Mammalia",12,"",[]],["Crocodilia",12,"",["crocodiles","alligators","caimans","gharial"]],["Dinosauria",12,"Descendents of the most recent common ancestor to Triceratops and modern birds.",[]],["Aves",12,"",["birds"]],["Palaeognathae",13,"Mostly flightless birds where the male incubates the eggs.",["tinamous","kiwis","cassowaries","emus","rheas","ostriches","moas"]],["Struthioniformes",13,"Large flightless birds native to Africa. They are the largest extant birds and the fastest runners.",["ostriches"]],["Tinamiformes",13,"Heavy bodied and short tailed ground dwelling birds of central and South America that have the ability to fly; sometimes domesticated.",["tinamous"]],["Rheiformes",13,"Rheiformes is an order of flightless birds primarily native to South America.",["rheas"]],["Apterygiformes",13,"Flightless birds characterized by their small size, nocturnal habits, and lack of functional wings. Known primarily for the modern family of Kiwis, native to New Zealand.",["kiwis"]],["Casuariiformes",13,"Large flightless birds native to the Australasian region.",["emu","cassowaries"]],["Neognathae",13,"All birds except the tinamous and the flightless ratites. They have fused metacarpals and an elongate third finger.",[]],["Galloanserae",13,"The fowl. Survived the K-T extinction event.",["pheasants","ducks","geese","swans"]],["Galliformes",13,"The gamefowl. Heavy-bodied ground-feeding landfowl often domesticated or hunted as game birds.",["chickens","pheasants","turkeys","quail","peacocks","partridges","grouse","guinea foul"]],["Anseriformes",13,"The waterfowl. Highly adapted for an aquatic existence at the water surface. The bill and a modified tongue create suction to pump or draw water in.",["ducks","geese","swans","screamers"]],["Neoaves",13,"The most inclusive crown clade containing the house sparrow, but not the red junglefowl. These are all birds except the ratites, tinamous, and fowls; or roughly 95% of birds.",["landbirds","waterbirds","tropicbirds","swifts","hummingbirds","pigeons","flamingos","cranes","gulls","passerines"]],["Mirandornithes",13,"Specialised aquatic birds found on freshwater lakes and ponds. Includes the flamingos and grebes.",["flamingos","grebes"]],["Phoenicopteriformes",13,"Birds with vibrant pink or reddish plumage, long legs, and uniquely shaped beaks adapted for filter feeding found in saline lakes throughout tropical and warm temperate zones.",["flamingos"]],["Podicipediformes",13,"Medium-sized, stocky waterbirds of lakes and marshes, well adapted to aquatic life. Some are flightless.",["grebes"]],["Columbimorphae",13,"The pigeons, sandgrouse & allies.",["mesites","sandgrouse","pigeons"]],["Columbiformes",13,"Stout-bodied monogomous birds with small heads, relatively short necks and slender bills. They feed largely on plant matter and are capable of drinking by sucking up water.",["pigeons","doves","dodos"]],["Mesitornithiformes",13,"Somewhat small-bodied, flightless or near flightless, somewhat shy birds endemic to Madagascar.",["mesites"]],["Pterocliformes",13,"Ground-dwelling birds with small, pigeon-like heads and necks and sturdy compact bodies that are restricted to treeless, open country.",["sandgrouse"]],["Otidimorphae",13,"A clade of birds that contains the cuckoos, turacos, and bustards orders.",["turacos","bustards","cuckoos"]],["Musophagiformes",13,"Medium to large-sized colourful birds that feed mainly of fruits, leaves, and flowers with semi-zygodactylous toes (the fourth toe can be switched back and forth).",["turacos","loeries","plantain-eaters","go-away-birds"]],["Otidiformes",13,"Elusive ground-dwelling birds adaptated to open landscapes with an elegant walk tht reluctantly fly.",["bustards","floricans","korhaans"]],["Cuculiformes",13,"Small to medium sized birds, slender birds, often with a long tail. Most species live in trees, with some ground-dwelling. Some species are brood parasites.",["cuckoos","roadrunners","koels","malkohas","couas","coucals","anis"]],["Elementaves",13,"This clade is only proposed! The clade's name refers to the classical elements, reflecting its members' varying adaptations to earth, air, and water",["hoatzin","cranes","puffins","gulls","frogmouths","swifts","hummingbirds","tropicbirds","loons","albatrosses","penguins","storks","frigatebirds","boobies","pelicans","ibises"]],["Opisthocomiformes",13,"A tropical bird found in South America with a digestive system that ferments plant matter. The chicks have two claws on each wing.",["hoatzin","stinkbird"]],["Gruiformes",13,"The cranes & allies but the group is varied and many are not so crane-like. Ground-feeding and nesting birds. Many species have elaborate courtship displays and long seasonal migrations.",["rails","cranes","crakes","coots","flufftails","finfoots","limpkin","trumpeters","quails"]],["Charadriiformes",13,"Small to medium-large birds that are waterbirds or birds clearly derived from waterbirds found along seacoasts and inland waters, with many called shorebirds. Most eat invertebrates or other small animals.",["sandpipers","puffins","gulls","plovers","phalaropes","stilts","jacanas","painted snipes","pratincoles","terns","seedsnipes","sheathbills","skimmers","skuas","auks","alcids","false quails"]],["Strisores",13,"Basal members are nocturnal birds with wide beaks, a large gape, and soft cryptically-coloured plumage, that feed on the wing. Some of these qualities are lost in Apodiformes.",["nightjars","frogmouths","swifts","hummingbirds"]],["Caprimulgiformes",13,"Often nocturnal or crepuscular hunters with a highly developed sense of sight that are known for feeding on the wing and are excellent flyers with small weak legs.",["nightjars"]],["Nyctibiiformes",13,"Nocturnal insectivores that lack the bristles around the mouth found in the true nightjars that are found in central and south America. They hunt from a perch and during the day they perch upright camouflaged on tree stumps.",["potoos","poor-me-ones"]],["Steatornithiformes",13,"Nocturnal forager with specially adapted eyesight that also echolocate, eat fruit and nesting in colonies in caves. They are found in northern South America.",["oilbirds"]],["Podargiformes",13,"Nocturnal birds with weak flight from Australasia with large flattened hooked bill and huge frog-like gape that they use to eat insects and small invertebrates. During the day they rest camouflaged on branches.",["frogmouths"]],["Aegotheliformes",13,"Small birds that feed on insects at twilight that are found in Australasia.",["owlet-nightjars"]],["Apodiformes",13,"Small to very small birds with a specialized wing morphology that feed while flying.",["swifts","treeswifts","hummingbirds"]],["Eurypygimorphae",13,"The least inclusive crown clade containing the red-billed tropicbird, the sunbittern, and the kagu.",["tropicbirds","sunbittern","kagu"]],["Phaethontiformes",13,"Seabirds with elongated tail feathers.",["tropicbirds"]],["Eurypygiformes",13,"Medium-sized, almost flightless, non-migratory birds.",["sunbittern","kagu"]],["Aequornithes",13,"Core waterbirds. The least inclusive crown clade containing the great white pelican and the common loon.",["loons","albatrosses","penguins","storks","frigatebirds","boobies","pelicans","ibises"]],["Gaviiformes",13,"Waterbirds that breed beside lakes and ponds in arctic and subarctic latitudes of North America.",["loons","divers"]],["Procellariiformes",13,"Medium to large seabirds that feed in the open ocean, travel long distances and are often known as tubenoses. They tend to form monogamous bonds and nest on remote islands.",["petrels","albatrosses","shearwaters"]],["Sphenisciformes",13,"Flightless seabirds with wings adapted to swimming and most species native to cool southern hemisphere waters.",["penguins"]],["Ciconiiformes",13,"Long-legged and often long necked birds adapted for wading and capturing animal foods and usually fly by soaring.",["storks"]],["Suliformes",13,"Pelagic piscivores of tropical oceans. They obtain food on the wing and can stay airborne for long periods.",["frigatebirds","gannets","cormorants","darters","totipalmate","shags","anhingas","boobies"]],["Pelecaniformes",13,"Medium to large sized aquatic birds that eat fish or squid and have all four toes webbed. Most members have distensible bare throat patch between the branches of the lower mandible.",["pelicans","herons","ibises","spoonbills","bitterns","hammerkop","shoebills"]],["Telluraves",13,"Core landbirds. The least inclusive crown clade containing the northern sparrowhawk and the house sparrow.",["owls","raptors","mousebirds","kingfishers","woodpeckers","toucans","falcons","parrots","passerines"]],["Afroaves",13,"The least inclusive crown clade containing the northern sparrowhawk, white-backed mousebird and European green woodpecker but not the house sparrow.",["owls","raptors","mousebirds","kingfishers","woodpeckers","toucans"]],["Strigiformes",13,"Solitary, nocturnal birds of prey occupying all regions of earth except Antarctica. Rounded heads with large eyes; upright stance; feathers adapted for silent flight; legs and toes often feathered; hunt mostly small mammals, insects.",["owls"]],["Accipitriformes",13,"Diurnal birds of prey with a sharply hooked bill, wings optimised for souring and sharp curved talons. Female can be up to twice as large. ",["raptors","hawks","eagles","vultures","harriers","kites","ospreys","secretarybirds"]],["Coraciimorphae",13,"A diversified clade of predominantly diurnal and arboreal birds.",["mousebirds","trogons","hornbills","kingfishers","woodpeckers","toucans"]],["Coliiformes",13,"Slender greyish or brown birds with soft, hairlike body feathers with pamprodactyl feet found in sub-Saharan Africa. They are arboreal and scurry through the leaves like rodents, in search of berries, fruit and buds.",["mousebirds"]],["Leptosomiformes",13,"A medium-large sexually dichromatic bird with zygodactyl feet that feeds on vertebrates and insects. It nests in tree cavities and is found in forests and woodlands of Madagascar and the Comoro Islands.",["cuckoo roller"]],["Trogoniformes",13,"Birds that live in tropical forests worldwide that nest in holes dug into trees or termite nests. They feed on insects and fruit, have distinct male and female plumage, and a heterodactyl toe arrangement.",["trogons","quetzals"]],["Bucerotiformes",13,"Medium to large birds many with bright beaks and others with large curved beaks. Some species wall the female into a tree cavity while she incubates the eggs.",["hornbills","hoopoes"]],["Coraciiformes",13,"Colourful birds with syndactyly toes and usually bright plumage often eating either fish or insects. Most nest in cavities or mud banks.",["kingfishers","kookaburras","rollers","bee-eaters","rollers","todies","motmots"]],["Piciformes",13,"Arboreal insectivorous birds with a peculiar arrangement of the tendons of the toes. Nearly all have zygodactyl feet—two with toes forward and two back.",["woodpeckers","honeyguides","toucans","barbets","jacamars","puffbirds","nunbirds"]],["Australaves",13,"The least inclusive crown clade containing the crested seriema and the house sparrow. Members are altricial (young are underdeveloped at the time of birth).",["falcons","parrots","passerines"]],["Cariamiformes",13,"Primarily flightless birds that are basal to the rest of Australaves.",["seriemas","terror birds"]],["Falconiformes",13,"Diurnal birds of prey. Male is often considerably smaller than the female. They are highly adept fliers and hunters.",["falcons","caracaras","kestrels"]],["Psittaciformes",13,"Birds with a strong curved beak, upright stance, and strong zygodactyl feet (two toes facing forward and two back) that are known for their vocal ability and intelligence.",["parrots","parakeets","macaws","cockatoos","lorikeets","budgerigar"]],["Passeriformes",13,"A diverse and rich assemblage of mostly small land birds with strong feet for perching and grabbing branches.",["passerines","sparrows","martins","treecreepers","bowerbirds","wrens","honeyeaters","warblers","babblers","shrikes","larks","ifrits","birds-of-paradise","crows","ravens","jays","magpies"]],["Acanthisittidae",14,"",["New Zealand wrens"]],["Tyranni",14,"Have a simpler syrinx musculature so their vocalizations are more mechanical sounding.",[]],["Eurylaimides",14,"An Old World bird group distributed pantropically.",[]],["Philepittidae",14,"",["asites"]],["Eurylaimidae",14,"",["eurylaimid broadbills"]],["Calyptomenidae",14,"",["African broadbills","green broadbills"]],["Sapayoidae",14,"",["sapayoa"]],["Pittidae",14,"",["pittas"]],["Tyrannides",14,"New World suboscines. Likely originated in South America during the Eocene, about 45 million years ago.",[]],["Furnariida",14,"Neotropical ovenbirds and allies.",["ovenbirds","woodcreepers","antbirds"]],["Melanopareiidae",14,"",["crescentchests"]],["Conopophagidae",14,"",["gnateaters"]],["Thamnophilidae",14,"",["antbirds"]],["Grallariidae",14,"",["antpittas"]],["Rhinocryptidae",14,"",["tapaculos"]],["Formicariidae",14,"",["antthrushes"]],["Furnariidae",14,"",["ovenbirds"]],["Tyrannida",14,"",[]],["Pipridae",14,"",["manakins"]],["Cotingidae",14,"",["cotingas"]],["Tityridae",14,"",["tityras","becards"]],["Tyrannidae",14,"",["tyrant flycatchers"]],["Oxyruncidae",14,"",["sharpbill"]],["Onychorhynchidae",14,"",["royal flycatchers","myiobiuses"]],["Passeri",14,"The song birds. They have a complex syrinx musculature allowing a wide range of songs and other vocalizations.",[]],["Menuridae",15,"",["lyrebirds"]],["Atrichornithidae",15,"",["scrubbirds"]],["Climacteridae",15,"",["Australian treecreepers"]],["Ptilonorhynchidae",15,"",["bowerbirds"]],["Meliphagoidea",15,"Includes some small to mid-sized songbirds widespread in the Austropacific region.",[]],["Maluridae",15,"",["Australasian wrens"]],["Dasyornithidae",15,"",["bristlebirds"]],["Meliphagidae",15,"",["honeyeaters"]],["Acanthizidae",15,"",["Australasian warblers"]],["Pardalotidae",15,"",["pardalotes"]],["Orthonychides",15,"",[]],["Orthonychidae",15,"",["logrunners"]],["Pomatostomidae",15,"",["Australasian babblers"]],["Corvides",15,"",[]],["Cinclosomatidae",15,"",["quail-thrushes","jewel-babblers"]],["Campephagidae",15,"",["cuckooshrikes"]],["Mohouidae",15,"Whitehead & allies.",["whiteheads","pipipis","yellowheads"]],["Neosittidae",15,"",["sittellas"]],["Orioloidea",15,"",[]],["Psophodidae",15,"Whipbirds & allies.",["whipbirds"]],["Eulacestomidae",15,"",["ploughbill"]],["Falcunculidae",15,"",["shriketits"]],["Oreoicidae",15,"",["Australo-Papuan bellbirds"]],["Paramythiidae",15,"",["painted berrypickers"]],["Vireonidae",15,"",["vireos"]],["Oriolidae",15,"",["orioles","figbirds"]],["Pachycephalidae",15,"",["whistlers"]],["Malaconotoidea",15,"Omnivorous and carnivorous songbirds widespread in Africa and Australia, many of which superficially resemble shrikes.",["bushshrikes","helmetshrikes","ioras","vangas","butcherbirds","Australian magpies","currawongs","woodswallows"]],["Machaerirhynchidae",15,"",["boatbills"]],["Artamidae",15,"Native to Australia, the Indo-Pacific region, and Southern Asia.",["woodswallows","currawongs","butcherbirds","Australian magpies"]],["Rhagologidae",15,"",["mottled berryhunter"]],["Malaconotidae",15,"",["bush-shrikes","puffbacks","tchagras","boubous"]],["Aegithinidae",15,"",["ioras"]],["Pityriaseidae",15,"",["bristlehead"]],["Platysteiridae",15,"",["wattle-eyes","batsies"]],["Vangidae",15,"",["vangas"]],["Corvoidea",15,"",[]],["Rhipiduridae",15,"",["fantails"]],["Dicruridae",15,"",["drongos"]],["Monarchidae",15,"",["monarchs"]],["Ifritidae",15,"",["ifrit"]],["Paradisaeidae",15,"",["birds-of-paradise"]],["Corcoracidae",15,"",["Australian mudnesters"]],["Melampittidae",15,"",["melampittas"]],["Corvidae",15,"",["crows","ravens","rooks","true magpies","jackdaws","jays","treepies","choughs","nutcrackers"]],["Laniidae",15,"Known to impale prey onto plant spines within their territories.",["shrikes"]],["Platylophidae",15,"",["crested jays"]],["Passerides",15,"",[]],["Melanocharitidae",15,"",["berrypeckers"]],["Cnemophilidae",15,"",["satinbirds"]],["Petroicida",15,"",[]],["Petroicidae",15,"",["Australian robins"]],["Notiomystidae",15,"",["stitchbird"]],["Callaeidae",15,"",["New Zealand wattlebirds"]],["Eupetida",15,"",[]],["Picathartidae",15,"",["rockfowl"]],["Chaetopidae",15,"",["rock-jumpers"]],["Eupetidae",15,"",["rail-babbler"]],["Core Passerides",15,"",[]],["Paroidea",16,"",[]],["Stenostiridae",16,"",["crested flycatchers"]],["Hyliotidae",16,"",["hyliotas"]],["Remizidae",16,"",["penduline tits"]],["Paridae",16,"",["tits","chickadees"]],["Sylviida",16,"",[]],["Nicatoridae",16,"",["nicators"]],["Panuridae",16,"",["bearded reedling"]],["Alaudidae",16,"",["larks"]],["Macrosphenidae",16,"",["crombecs","African warblers"]],["Cisticolidae",16,"",["cisticolas"]],["Locustelloidea",16,"",[]],["Acrocephalidae",16,"",["acrocephalid warblers"]],["Locustellidae",16,"",["grassbirds"]],["Bernieridae",16,"",["Malagasy warblers"]],["Donacobiidae",16,"",["donacobius"]],["Hirundinidae",16,"",["martins","swallows"]],["Pnoepygidae",16,"",["wren warblers"]],["Aegithaloidea",16,"",[]],["Phylloscopidae",16,"Leaf-warblers and allies.",["leaf-warblers"]],["Hyliidae",16,"",["hylias"]],["Aegithalidae",16,"",["long-tailed tits","bushtits"]],["Erythrocercidae",16,"",["yellow flycatchers"]],["Cettiidae",16,"Cettia bush warblers and allies.",["Cettia bush warblers"]],["Scotocercidae",16,"",["streaked scrub warbler"]],["Sylvioidea",16,"",[]],["Pycnonotidae",16,"",["bulbuls"]],["Paradoxornithidae",16,"",["parrotbills","fulvettas"]],["Sylviidae",16,"",["typical warblers","sylviid babblers"]],["Zosteropidae",16,"",["white-eyes"]],["Timaliidae",16,"",["babblers","tit-babblers","scimitar bablers"]],["Leiothrichidae",16,"",["laughingthrushes"]],["Pellorneidae",16,"",["fulvettas","ground babblers"]],["Muscicapida",16,"",[]],["Bombycilloidea",16,"",[]],["Dulidae",16,"",["palmchat"]],["Bombycillidae",16,"",["waxwings"]],["Ptiliogonatidae",16,"",["silky-flycatchers"]],["Hylocitreidae",16,"",["hylocitrea"]],["Hypocoliidae",16,"",["hypocolius"]],["Muscicapoidea",16,"",[]],["Elachuridae",16,"",["elechura"]],["Cinclidae",16,"",["dippers"]],["Muscicapidae",16,"",["Old World flycatchers","chats"]],["Turdidae",16,"",["thrushes"]],["Buphagidae",16,"",["oxpeckers"]],["Mimidae",16,"",["mockingbirds","thrashers"]],["Sturnidae",16,"",["starlings","mynas"]],["Regulidae",16,"",["kinglets"]],["Certhioidea",16,"",[]],["Tichodromidae",16,"",["wallcreeper"]],["Sittidae",16,"",["nuthatches"]],["Certhiidae",16,"",["treecreepers"]],["Salpornithidae",16,"",["spotted creepers"]],["Polioptilidae",16,"",["gnatcatchers","gnatwrens"]],["Troglodytidae",16,"",["wrens"]],["Passerida",16,"",[]],["Modulatricidae",16,"Dapple-throat & allies.",["dapple-throat"]],["Promeropidae",16,"",["sugarbirds"]],["Dicaeidae",16,"",["flowerpeckers"]],["Nectariniidae",16,"",["sunbirds"]],["Chloropseidae",16,"",["leafbirds"]],["Irenidae",16,"",["fairy bluebirds"]],["Peucedramidae",16,"",["olive warbler"]],["Urocynchramidae",16,"",["Przevalski's finch"]],["Ploceoidea",16,"",[]],["Ploceidae",16,"",["weavers"]],["Estrildidae",16,"",["estrildid finches"]],["Viduidae",16,"",["indigobirds","whydahs"]],["Prunellidae",16,"",["accentors"]],["Passeridae",16,"",["sparrows"]],["Motacillidae",16,"",["wagtails","pipits"]],["Fringillidae",16,"",["finches","euphonias"]],["Emberizoidea",16,"",[]],["Rhodinocichlidae",16,"",["thrush-tanager"]],["Calcariidae",16,"",["longspurs","snow buntings"]],["Emberizidae",16,"",["buntings"]],["Cardinalidae",16,"",["cardinal grosbeaks"]],["Mitrospingidae",16,"Mitrosingus & allies",["mitrosingus"]],["Thraupidae",16,"",["tanagers"]],["Passerellidae",16,"",["American sparrows"]],["Parulidae",16,"",["wood warblers"]],["Icteridae",16,"The New World blackbirds are small to medium-sized, usually with black as a predominant plumage color, often enlivened by yellow, orange, or red.",["New World blackbirds","New World orioles","bobolinks","meadowlarks","grackles","cowbirds","oropendolas","caciques"]],["Icteriidae",16,"",["yellow-breasted chat"]],["Calyptophilidae",16,"",["chat-tanagers"]],["Zeledoniidae",16,"",["wrenthrush"]],["Phaenicophilidae",16,"Hispaniolan tanagers and allies",["Hispaniolan tanagers"]],["Nesospingidae",16,"",["Puerto Rican tanager"]],["Spindalidae",16,"",["spindalises"]],["Monotremata",17,"Nurse their young with milk but still lay eggs.",["platypus","echidnas"]],["Marsupialia",17,"Bear their young within a pouch on the mother's abdomen after a birth in a relatively undeveloped state.",["kangaroos","koalas","opossums","possums","wombats","wallabies","bandicoots"]],["Paucituberculata",17,"",["shrew opossums"]],["Didelphimorphia",17,"",["opossums"]],["Microbiotheria",17,"Small marsupials that look like mice.",["monitos del monte"]],["Eomarsupialia",17,"The Australasian marsupials. They descend from a single dispersal event from South America via Antartica.",["marsupial moles","bandicoots","numbats","Tasmanian devils","kangaroos","possums","koala","wombats"]],["Notoryctidae",17,"",["marsupial moles"]],["Peramelemorphia",17,"",["bandicoots","bilbies"]],["Dasyuromorphia",17,"",["quolls","dunnarts","numbats","Tasmanian devils","Tasmanian tigers"]],["Diprotodontia",17,"",["kangaroos","wallabies","possums","koala","wombats","tree-kangaroos"]],["Placentalia",17,"Carry the fetus in the uterus of the mother to a relatively late stage of development.",[]],["Xenarthra",17,"Primitive placental mammals that are believed to have descended from subterranean diggers. They have single-color vision and low metabolic rates. Females show no clear distinction between the uterus and vagina, and males have testicles inside the body.",["anteaters","sloths","armadillos"]],["Cingulata",17,"",["armadillos"]],["Pilosa",17,"",["anteaters","sloths"]],["Afrotheria",17,"A clade of mammals that evolved to fill niches in Africa while it was an isolated island, before the Cenozoic.",["golden moles","elephant shrews","otter shrews","tenrecs","aardvarks","hyraxes","elephants","sea cows"]],["Paenungulata",17,"Herbivorous near ungulates mammals of African origin. Some have long incisors and others continuously replace their teeth from the back of the jaw.",["hyraxes","sea cows","elephants"]],["Hyracoidea",17,"Small, stout, thickset, herbivorous mammals with multichambered stomachs.",["hyraxes","dassies"]],["Sirenia",17,"Fully aquatic, herbivorous mammals.",["sea cows","dugong","manatees"]],["Proboscidea",17,"Herbivorous mammals that are typically large with extant species having long tusks and strong mobile trunks.",["elephants","mastodons","mammoths","gomphotheres","stegodonts"]],["Tubulidentata",17,"Mammals with tubule-style teeth. Extant species are medium-sized, burrowing, nocturnal mammals native to Africa that feed almost exclusively on termites and ants.",["aardvarks"]],["Macroscelidea",17,"Small quadrupedal insectivorous mammals with scaly tails and long snouts native to Africa that are superficially similar to shrews.",["Elephant shrews","jumping shrews","sengis"]],["Afrosoricida",17,"These small mammals have dirersified into a number of faunivorous niches in Madagascar and Africa so their morphology can vary with some species bearing similarities to hedgehogs, moles, shrews, or miniature otters.",["golden moles","otter shrews","tenrecs"]],["Boreoeutheria",17,"Most males have their testicles in an external pouch.",["primates","cats","dogs","hedgehogs","rodents","moles","true shrews","bats","pangolins","zebras","rhinoceroses","hippopotamuses","deer","cattle","whales"]],["Laurasiatheria",17,"Mammals with ancestors that originated on the northern supercontinent of Laurasia, after it split from Gondwana.",["hedgehogs","moles","true shrews","bats","cats","dogs","pangolins","zebras","rhinoceroses","hippopotamuses","deer","cattle","whales"]],["Eulipotyphla",17,"",["hedgehogs","gymnures","solenodons","moles","shrew-like moles","desmans","true shrews"]],["Chiroptera",17,"The only mammals capable of true and sustained flight. Most are nocturnal, and many roost in caves. Many are insectivores, but some eat fruit, nectar, or blood.",["bats"]],["Ferungulata",17,"A clade of placental mammals that includes carnivores, pangolins, and the hoofed herbivores.",["cats","dogs","pangolins","zebras","rhinoceroses","tapirs","hippopotamuses","deer","camels","cattle","whales"]],["Pholidota",17,"Nocturnal mammals with large, protective keratin scales that live in hollow trees or burrows that mostly feed on ants and termites.",["pangolins","scaly anteaters"]],["Carnivora",17,"An order of placental mammals specialized primarily in eating flesh.",["cats","dogs","hyenas","mongoose","bears","skunks","raccoons"]],["Euungulata",17,"Typically herbivorous mammals that descended from hooved ancestors.",["horses","zebras","rhinoceroses","tapirs","pigs","hippopotamuses","deer","giraffes","camels","sheep","cattle","whales"]],["Perissodactyla",17,"The odd-toed ungulates are herbivores that digest plant cellulose in their intestines in an enlarged cecum.",["horses","asses","zebras","rhinoceroses","tapirs"]],["Artiodactyla",17,"The even-toed ungulates bear weight equally on an even number of their toes and digest plant cellulose in one or more stomach chambers. Many are herbivores, but some are omnivorous, and others are entirely carnivorous.",["pigs","hippopotamuses","antelopes","deer","giraffes","camels","llamas","sheep","cattle","whales","dolphins"]],["Euarchontoglires",17,"The rodents and the primates.",["rodents","lagomorphs","treeshrews","primates","colugos"]],["Scandentia",17,"Omnivorous mammals that live in small family groups, resemble shews and some species live in trees.",["tree shrews","banxrings"]],["Lagomorpha",17,"",["rabbits","hares","pikas"]],["Rodentia",17,"The group is characterized by a single pair of continuously growing incisors in each of the upper and lower jaws.",["mice","rats","bandicoot rat","squirrels","prairie dogs","porcupines","beavers","guinea pigs","hamsters"]],["Dermoptera",17,"",["colugos","flying lemurs"]],["Primates",17,"",["lemurs","galagos","lorisids","monkeys","apes"]],["Feliformia",18,"The 'cat-like' animals.",["cats","hyenas","mongooses","viverrids"]],["Nandiniidae",18,"A small feliform mammal that's nocturnal, largely arboreal, eats fruit and widely distributed in sub-Saharan Africa.",["African palm civet"]],["Viverroidea",18,"Includes viverrids, mongooses and hyaenas.",[]],["Viverridae",18,"Found in Southern Europe, Indomalayan realm, and Africa.",["viverrids","civets","genets","oyans","African linsangs"]],["Herpestidae",18,"Found in the Iberian Peninsula, Africa, the Middle East, the Caucasus, Central Asia, and the Indomalayan realm.",["mongooses","meerkats"]],["Eupleridae",18,"Believed to have evolved from a single raft event from mainland Africa 18–24 million years ago. Found in Madagascar.",["Malagasy mongooses","Malagasy civets","mongoose-like euplerids"]],["Hyaenidae",18,"Found in Africa, the Middle East, the Caucasus, Central Asia, and the Indian subcontinent.",["hyenas"]],["Feloidea",18,"Includes cats and Asiatic linsangs",[]],["Prionodontidae",18,"Tree-dwelling carnivorous mammals that are nocturnal, solitary, and at least partly arboreal. They den in hollows in trees and feed on rodents, frogs and snakes. Native to the Indomalayan realm.",["Asiatic linsangs"]],["Felidae",18,"Found in the Americas, Africa, and Eurasia.",["cats","tigers","leopards","jaguars","lions","cheetahs","ocelots"]],["Caniformia",18,"The 'dog-like' animals.",["dogs","bears","raccoons","mustelids","pinnipeds"]],["Canidae",18,"Found in the Americas, Africa, and Eurasia.",["dogs","wolves","foxes","dingoes","jackals","coyotes"]],["Arctoidea",18,"mostly carnivorous mammals found in all continents from 46 million years ago to the present.",["bears","raccoons","mustelids","pinnipeds"]],["Ursidae",18,"Modern bears include large bodies with stocky legs, long snouts, small rounded ears, shaggy hair, plantigrade paws with five nonretractile claws, and short tails. Found in the Americas and Eurasia. The polar bear is mostly carnivorous, the giant panda is mostly herbivorous, and the remaining species are omnivorous with varying diets.",["brown bears","black bears","panda bears","spectacled bears","polar bear"]],["Pinnipedia",18,"Carnivorous, fin-footed, semiaquatic, mostly marine mammals.",[]],["Phocidae",18,"The earless seals - true seals. Found in the sea and Lake Baikal.",["elephant seals","monk seals","Baikal seals"]],["Otariidae",18,"The Eared seals - fur seals and sea lions. Found in subpolar, temperate, and equatorial waters throughout the Pacific and Southern Oceans and the southern Indian and Atlantic Oceans. Have small but visible external ear flaps.",["fur seals","sea lions"]],["Odobenidae",18,"Found in the North Pole in the Arctic Ocean and subarctic seas of the Northern Hemisphere.",["walruses"]],["Musteloidea",18,"Includes the weasels, raccoons, red pandas, and skunks.",[]],["Mephitidae",18,"Found in the Americas, western Philippines, and Indonesia and Malaysia.",["skunks","stink badgers"]],["Ailuridae",18,"Found in the Eastern Himalayas and southwestern China.",["red panda"]],["Procyonidae",18,"Found in the Americas.",["raccoons","olingos","ringtails","coatis","cacomistles","kinkajous"]],["Mustelidae",18,"Found in the Americas, Africa, and Eurasia.",["weasels","otters","wolverines","polecats","badgers","martens","grisons"]],["Pantherinae",19,"Characterised by an imperfectly ossified hyoid bone with elastic tendons that enable their larynx to be mobile so many species can roar.",[]],["Neofelis",19,"Two extant cat species in Southeast Asia that are the sister taxon to other pantherine cats and can still purr. They have a maximum gape of approximately 90 degrees, the biggest of extant carnivora",["clouded leopards"]],["Panthera",19,"Contains the largest living members of the cat family, native to Africa, Asia and the Americas with humans implicated in the species lost to Europe, North America and Russia. They have a specially adapted larynx with large vocal folds covered in a fibro-elastic pad; these characteristics enable them to roar.",["jaguars","leopards","lions","snow leopards","tigers","† cave lions","† American lions"]],["Felinae",19,"Members have a bony hyoid, so they can purr but not roar, and retractable claws.",[]],["Leptailurus",19,"Contains a wild, slender, medium-sized cat with the longest legs of any cat relative to its body size. Native to Africa. It feeds on rodents. Characterised by a small head, large ears, a golden-yellow to buff coat spotted and striped with black, and a short, black-tipped tail",["servals"]],["Caracal",19,"Two species of medium-sized solitary and nocturnal wild cats native to Africa and Southwestern Asia.",["African golden cats","caracals"]],["Leopardus",19,"The oldest branch of a genetic lineage of small cats in the Americas. Native to Central and Southern America. They have 36 chromosomes, when other felids have 38.",["ocelot","oncillas","Pampas cats","kodkods","margays","Geoffroy's cats","Andean mountain cats","Southern tigrinas"]],["Pardofelis",19,"Contains a single species of small wild cat native from the eastern Himalayas to Southeast Asia.",["marbled cats"]],["Catopuma",19,"Contains two small cat species native to Southeast Asia. Both have solid reddish brown coloration on their backs and darker markings on the head.",["bay cats","Asian golden cats"]],["Lynx",19,"Medium-sized wild cat with a short tail; characteristic tufts of black hair on the tips of their ears; large, padded paws; and long whiskers on the face. Native to the Northern Hemisphere.",["lynxs","bobcats"]],["Acinonyx",19,"The only extant specicies is a large cat and the fastest land animal. It is lightly built, has a slender body, spotted coat, long tail and semi-retractable claws. Native to Africa and Southwestern Asia",["cheetahs"]],["Otocolobus",19,"Contains a single species of small wild cat with long and dense light grey fur, and rounded ears set low on the sides of the head. Native to Central Asia. It finds shelter in rock crevices and burrows, and preys foremost on lagomorphs and rodents.",["Pallas's cats","manuls"]],["Prionailurus",19,"Contains spotted, small wild cats native to Southeastern and Eastern Asia. Forests are their preferred habitat; they feed on small mammals, reptiles and birds, and occasionally aquatic wildlife.",["leopard cats","flat-headed cats","fishing cats","rusty-spotted cats"]],["Felis",19,"Small and medium-sized cat species native to most of Africa and south of 60° latitude in Europe and Asia to Indochina.",["Domestic cats","European wildcats","Jungle cats","African wildcats","Black-footed cats","Sand cats","Chinese mountain cats"]],["Canini",20,"The dog-like canines.",[]],["Canina",20,"The wolf and wolf-like canines.",[]],["Canis",20,"The wolf genus. Distinguished by their moderate to large size, their massive, well-developed skulls and dentition, long legs, and comparatively short ears and tails.",["wolves","dogs","coyotes","golden jackals"]],["Cuon",20,"Contains canid species native Asia.",["dhole"]],["Lycaon",20,"The only extant species is the largest wild canine in Africa. Fur consists entirely of stiff bristle-hairs with no underfur.",["African wild dogs"]],["Lupulella",20,"A genus of canine found in Africa.",["black-backed jackal","side-striped jackal"]],["Cerdocyonina",20,"The South American canines.",[]],["Speothos",20,"A genus of canid found in Central and South America",["bush dogs"]],["Chrysocyon",20,"Contains the largest canine in South America. It has markings resembling a red fox.",["maned wolf"]],["Lycalopex",20,"Contains South American canines that resemble true foxes.",["raposa"]],["Cerdocyon",20,"Contains a medium-sized nocturnal canid endemic to the central part of South America.",["crab-eating fox"]],["Atelocynus",20,"Contains an elusive canid species endemic to the Amazonian basin.",["short-eared dogs"]],["Vulpini",20,"The fox-like canines.",[]],["Otocyon",20,"Contains a single species of fox found on the African savanna.",["bat-eared foxes"]],["Nyctereutes",20,"A fox-like canine that has a face that resembles a racoon.",["racoon dogs"]],["Vulpes",20,"They have a smaller size, longer, bushier tail, and flatter skull. They have black, triangular markings between their eyes and nose, and the tip of their tail is often a different color from the rest of their pelt.",["true foxes"]],["Urocyon",20,"The gray foxes.",["gray foxes","island foxes"]],["Camelidae",21,"Strictly herbivorous animals with slender necks and long legs but with vestigial canine teeth and tusk-like premolars and three-chambered stomachs. They have two-toed feet with toenails and soft foot pads, not hooves. Their red blood cells are elliptical.",["dromedary camels","Bactrian camels","llamas","alpacas","vicuñas","guanacos"]],["Suina",21,"The pigs. Omnivorous, non-ruminant artiodactyl mammals.",[]],["Suidae",21,"",["pigs","hogs","warthogs","babirusas"]],["Tayassuidae",21,"New World pig. Medium-sized animal, with a strong resemblance to a pigs but with tusks that are short and straight that interlock with each other. They have a three chambered stomach and are foregut fermenters.",["javelinas","skunk pigs"]],["Cetruminantia",21,"The ruminants, hippopotamuses and whales.",[]],["Ruminantia",21,"The ruminants. They have a four-chambered stomach, and a paraxonic foot.",["cattle","bovines","goats","sheep","giraffes","deer","gazelles","antelopes"]],["Tragulidae",21,"The smallest hoofed mammals in the world. They have a four-chambered stomach (but the third chamber is poorly developed), and a paraxonic foot.",["mouse-deer"]],["Pecora",21,"The horn bearers. Most species have cranial appendages projecting from their frontal bones but only some are properly called 'horns'. They have a four-chambered stomach, and a paraxonic foot.",[]],["Antilocapridae",21,"",["pronghorns"]],["Giraffidae",21,"",["zebra giraffes","giraffes"]],["Cervidae",21,"",["true deer","muntjac","elk","wapiti","red deer","fallow deer","reindeer","caribou","white-tailed deer","roe deer","moose"]],["Bovidae",21,"",["cattle","bison","buffalo","antelopes","goat-antelopes","sheep","goats"]],["Moschidae",21,"Characterized by long 'saber teeth' instead of horns and a lack of facial glands.",["musk deer"]],["Whippomorpha",21,"The even-toed ungulates that exhibit amphibious and aquatic behaviors possibly the point they now have flippers. They have a dense layer of subcutaneous fat and largely hairless bodies.",["hippopotamuses","whales","dolphins","porpoises"]],["Hippopotamidae",21,"",["hippopotamuses"]],["Cetacea",21,"Have a fully aquatic lifestyle, streamlined body shape, often large size and exclusively carnivorous diet.",["whales","dolphins","porpoises"]],["Mysticeti",22,"The baleen whales. They are all filter feeders. Some skim slow moving prey, some lunch schools, others bottom feed filtering the sand.  They have fused neck vertebrae, and are unable to turn their heads at all. They have a layer of blubber under the skin to keep warm in the cold water.",[]],["Balaenidae",22,"",["right whales","bowhead whales"]],["Cetotheriidae",22,"",["pygmy right whales"]],["Balaenopteridae",22,"",["right whales","grey whales","blue whales","humpback whales","fin whales","sei whales","minke whales"]],["Odontoceti",22,"The toothed whales. They feed largely on fish and squid, but a few feed on mammals. Many species are highly sociable, with some pods reaching over a thousand individuals.",[]],["Kogiidae",22,"Dwarf sperm whales.",[]],["Physeteridae",22,"Sperm whales.",[]],["Platanistidae",22,"The river dolphins of South Asia.",["Ganges river dolphins","Indus river dolphins"]],["Ziphiidae",22,"The beaked whales.",[]],["Delphinida",22,"The modern oceanic dolphins, porpoises, and most river dolphins.",[]],["Inioidea",22,"American River Dolphins.",[]],["Lipotidae",22,"The river dolphins of China. Thought to be newly extinct.",["Yangtze river dolphins."]],["Iniidae",22,"A family of river dolphins living in the Orinoco and Amazon basins (connected through the Casiquiare canal).",["Araguaian river dolphins","Bolivian river dolphins","Amazon river dolphins","Orinoco river dolphins"]],["Pontoporiidae",22,"A river dolphin found in coastal Atlantic waters of southeastern South America in the ocean and saltwater estuaries.",["La Plata dolphins"]],["Delphinoidea",22,"",["oceanic dolphins","porpoises","narwhals","beluga whales"]],["Delphinidae",22,"The true dolphins, or oceanic dolphins.",["false killer whales","pilot whales","Maui's dolphins","orcas","bottlenose dolphins"]],["Monodontidae",22,"Medium-sized whales found at high latitudes in the arctic seas and in most of the major rivers draining into them. They feed mainly near the bottom on fish and invertebrates and are generally found in schools, sometimes more than 100 individuals.",["narwhals","beluga whales"]],["Phocoenidae",22,"",["porpoises"]],["Strepsirrhini",23,"The moist-nosed primates. Native to Africa and Asia.",[]],["Lemuriformes",23,"The extant infraorder of moist-nosed primates. Native to Africa and Asia. Characterized by a toothcomb, a specialized set of teeth in the front, lower part of the mouth mostly used for combing fur during grooming.",["lemurs","lorises","bush babies"]],["Lemuroidea",23,"Small moist-nosed primates native to Madagascar with a pointed snout, large eyes, and a long tail.",["lemurs"]],["Lorisoidea",23,"Nocturnal primates found throughout Africa and Asia.",["lorises","bush babies","pottos"]],["Haplorhini",23,"The 'dry-nosed' primates. Native to Africa, Asia and the Americas.",[]],["Tarsiidae",23,"Small primates with enormous eyes. Native to maritime Southeast Asia. Males do not have a penis bone.",["tarsiers"]],["Simiiformes",23,"The higher primates. Native to Africa, Asia and the Americas.",[]],["Platyrrhini",23,"The New World monkeys, found in the Americas. The noses of New World monkeys are flatter than the narrow noses of Old World monkeys, and have side-facing nostrils.",["marmosets","tamarins","capuchins","squirrel monkeys","night monkeys","titis","sakis","uakaris","howler","spider monkeys","woolly monkeys","woolly spider monkeys"]],["Cercopithecidae",23,"The Old World monkeys, native to Africa and Asia. Most have tails, but they are not adapted for grasping or holding. All species have well developed thumbs. Most species are omnivorous, all species can store food in cheek pouches, some species have rumps will change colour during mating periods.",["baboons","red colobus","macaques"]],["Hominoidea",23,"The Apes. Native to sub-Saharan Africa and Southeast Asia.",[]],["Hylobatidae",23,"Native to the subtropical and tropical forests of Asia. Unlike the great apes they are smaller, exhibit low sexual dimorphism, and don't make nests.",["gibbons "]],["Hominidae",23,"The great apes, or hominids. Native to Africa, Indonesia and Malaysia.",["orangutans","gorillas","chimpanzees","bonobos","humans"]],["Pongo",23,"The most arboreal of the great apes, covered in reddish-brown hair and native to the rainforests of Indonesia and Malaysia.",["orangutans"]],["Gorilla",23,"The largest living primates. They are primarily herbivorous, great apes that inhabit the tropical forests of equatorial Africa",["gorillas"]],["Pan",23,"Chimpanzees and bonobos are equally humanity's closest living relatives. Native to sub-Saharan Africa",["chimpanzees","bonobos"]],["Australopithecina",23,"Bipedal great apes with similar teeth to humans, but with a brain size not much larger than a modern apes.",["Australopithecus","humans","Neanderthals","Denisovans"]],["Homo",23,"",["humans","Neanderthals","Denisovans"]],["Pitheciidae",24,"",["titis","sakis","uakaris"]],["Callicebinae",24,"",["titis"]],["Pitheciinae",24,"",["sakis","uakaris"]],["Atelidae",24,"",["howler monkeys","spider monkeys","woolly spider monkeys","woolly monkeys"]],["Alouattinae",24,"",["howler monkeys"]],["Alouatta",24,"",["howler monkeys"]],["Atelinae",24,"",["spider monkeys","woolly spider monkeys","woolly monkeys"]],["Ateles",24,"",["spider monkeys"]],["Brachyteles",24,"",["muriquis","woolly spider monkeys"]],["Lagothrix",24,"",["woolly monkeys"]],["Cebidae",24,"",["capuchins","squirrel monkeys"]],["Cebinae",24,"",["capuchins"]],["Saimirinae",24,"",["squirrel monkeys"]],["Callitrichidae",24,"",["marmosets","tamarins"]],["Aotidae",24,"The only truly nocturnal monkeys. Native to Central and South America. They have large eyes which improve their vision at night, while their ears are mostly hidden",["night monkeys","owl monkeys"]],["Colobinae",25,"Medium-sized primates with long tails. Most species are arboreal. They are folivorous, though their diet may be supplemented with flowers, fruits and the occasional insect. They have multichambered, complex stomachs, making them the only primates with foregut fermentation.",["black-and-white colobus","large-nosed proboscis monkeys","gray langurs"]],["Colobini",25,"",["black-and-white colobus monkeys","red colobus monkeys","olive colobus monkeys"]],["Colobus",25,"Generally found in high-density forests where they forage on leaves, flowers and fruit. Social groups of colobus are diverse, varying from group to group. Resident-egalitarian and allomothering relationships have been observed among the female population.",["black-and-white colobus monkeys"]],["Piliocolobus",25,"Primarily arboreal and most are restricted to humid forests. Groups often establish a dominance hierarchy determined by aggressive behavior. Food, grooming, and sexual partners are distributed amongst higher-ranking individuals initially, followed by lower-ranking individuals. Diet consists mainly of young leaves, flowers, and unripe fruit. They are known to eat charcoal or clay to help combat the cyanide some leaves contain.",["red colobus monkeys"]],["Procolobus",25,"Rarely observed in its natural habitat because of its cryptic coloration and secretive nature.",["olive colobus"]],["Presbytini",25,"",["black-and-white colobus monkeys","red colobus monkeys","olive colobus monkeys"]],["Trachypithecus",25,"",["lutungs","leaf monkeys"]],["Presbytis",25,"",["surilis"]],["Semnopithecus",25,"Terrestrial, inhabiting forest, open lightly wooded habitats, and urban areas. They mostly walk quadrupedally and spend half of their time on the ground and the other half in trees.",["gray langurs"]],["Pygathrix",25,"",["doucs"]],["Rhinopithecus",25,"Named for the short stump of a nose on their round faces, with nostrils arranged forward. They have relatively multicolored and long fur, particularly at the shoulders and backs.",["snub-nosed monkeys"]],["Nasalis",25,"Has an unusually large nose (or proboscis), a reddish-brown skin color and a long tail. Sexual dimorphism is pronounced.",["proboscis monkeys"]],["Simias",25,"A critically endangered endemic to several small islands off the coast of Sumatra in Indonesia. Little is known of their natural history.",["pig-tailed langur"]],["Cercopithecinae",25,"Diurnal monkeys that live together in social groups. Most species are omnivorous, with diets ranging from fruits, leaves, seeds, buds, and mushrooms to insects, spiders, and smaller vertebrates. All species possess cheek pouches in which they can store food.",["baboons","macaques","vervet monkeys"]],["Cercopithecini",25,"",["vervet monkeys","talapoins","Allen's swamp monkeys","guenons"]],["Allenopithecus",25,"A diurnal monkey that inhabits swampy, water-rich areas and can swim well with its slight webbing on its fingers and toes. Its diet consists of fruits and leaves, as well as beetles and worms.",["Allen's swamp monkeys"]],["Cercopithecus",25,"",["[most] guenons"]],["Miopithecus",25,"Have grey green fur on top and whitish on their underside. Diurnal and arboreal, preferring rain forest or mangroves near water. They are omnivores with a diet mainly of fruits, seeds, aquatic plants, insects, shellfish, bird eggs and small vertebrates. They swim well.",["talapoins"]],["Chlorocebus",25,"",["vervet monkeys","green monkeys"]],["Erythrocebus",25,"",["patas monkeys"]],["Allochrocebus",25,"",["L'Hoest's monkeys","Preuss's monkeys","sun-tailed monkeys"]],["Papionini",25,"",["macaques","baboons","geladas","mangabeys","kipunji","drills","mandrills"]],["Macaca",25,"Principally frugivorous (preferring fruit), although their diet also includes seeds, leaves, flowers, and tree bark. Some species will supplement their diets with small amounts of meat from shellfish, insects, and small mammals. Social groups are arranged around dominant matriarchs.",["macaques"]],["Cercocebus",25,"Characterized by their bare upper eyelids, which are lighter than their facial skin colouring, and the uniformly coloured hairs of the fur.",["white-eyelid mangabeys"]],["Lophocebus",25,"Tend to have dark skin, eyelids that match their facial skin, and crests of hair on their heads.",["crested mangabeys"]],["Rungwecebus",25,"",["highland mangabeys"]],["Papio",25,"",["baboons"]],["Theropithecus",25,"",["gelada"]],["Homo habilis",26,"",[]],["Homo erectus",26,"",[]],["Homo naledi",26,"",[]],["Homo floresiensis",26,"",[]],["Homo heidelbergensis",26,"",[]],["Homo neanderthalensis ",26,"",[]],["Denisovans",26,"",[]],["Homo sapiens",26,"",[]],["Rhodophyta",27,"Characterized by eukaryotic cells without flagella and centrioles, chloroplasts without external endoplasmic reticulum or unstacked (stroma) thylakoids, and use phycobiliproteins as accessory pigments, which give them their red color.",["red alga"]],["Viridiplantae",27,"",[]],["Prasinodermophyta",27,"A proposed basal Viridiplantae clade that includes both unicellular algae and spherical cells in a gelatinous matrix. It's one of the taxa often called prasinophytes, a paraphyletic group of unicellular green algae.",["green alga"]],["Chlorophyta",27,"",["green alga"]],["Streptophyta",27,"",[]],["Charophyta",27,"A paraphyletic grade of freshwater green algae treated here as streptophyta excluding embryophyta. They are an assortment of extant freshwater and terrestrial green algae that display a wide array of unicellular, filamentous, and “parenchymatous” forms. Some have adapted to terrestrial conditions.",["green alga","stoneworts","brittleworts","skunkweeds","musk grasses","desmids","water silks"]],["Embryophyta",27,"The land plants.",[]],["Bryophyta",27,"A clade of early land plants that are dominated by a multicellular haploid gametophyte and lack of true vascular tissue.",[]],["Marchantiophyta",27,"Have a gametophyte-dominant life cycle, in which cells of the plant carry only a single set of genetic information. The division name was derived from the genus name Marchantia, named by French botanist Jean Marchant after his father, also a biologist and together they authored Histoire des plantes.",["liverworts"]],["Anthocerotophyta",27,"The hornworts (refering to the elongated horn-like structure, which is the sporophyte). As in mosses and liverworts, hornworts have a gametophyte-dominant life cycle, in which cells of the plant carry only a single set of genetic information; the flattened, green plant body of a hornwort is the gametophyte stage of the plant.",["hornworts"]],["Bryophytina",27,"The division of mosses, they are small, non-vascular plants that typically form dense green mats or clumps in damp or shaded environments, lack seeds and reproduce through spores. Bryophytina is technically a proposed name as a class.",["mosses"]],["Tracheophyta",27,"The vascular plants with a sporophyte dominated lifecyle; have true roots, leaves, and stems; using phloem to conduct products of photosynthesis and xylem to conconduct water and minerals.",[]],["Lycopodiophyta",27,"A division of plants that includes the clubmoss class, Lycopodiopsida, that have an early vascular system and biflagellate sperm.",["club mosses"]],["Euphyllophyta",27,"Vascular plants that are characterized by the possession of true leaves (megaphylls).",[]],["Polypodiophyta",27,"",["ferns","whisk ferns","horsetails"]],["Lignophytes",27,"Characterised by a bifascial vascular cambium (secondary xylem and secondary phloem), or wood.",[]],["Spermatophyta",27,"Plants that produce seeds.",[]],["Gymnospermae",27,"Early seed plants that don't have their seeds encased in an ovary and often form cones.",[]],["Cycadophyta",27,"Dioecious plants that resemble palms and ferns but have cones for reproduction.",["cycads"]],["Ginkgophyta",27,"",["ginkos"]],["Pinophyta",27,"",["conifers"]],["Gnetophyta",27,"A division of conifers that exhibit some characteristics of flowering plants.",[]],["Angiosperms",27,"Plants that bear flowers and fruits. They have reduced gametophytes and a closed carpel enclosing the ovules.",[]],["Cyanidiophyceae",28,"Unicellular red algae that contain a single plastid, one to three mitochondria, a nucleus, a vacuole, and floridean starch but pyrenoids are absent. Most are extremophiles that inhabit acid hot springs with a pH between 0.2 and 4 with temperatures up to 56 °C.",[]],["Porphyridiophyceae",28,"A microalga with a spherical shape. Instead of a cell wall, the cell is enveloped in secreted sulfur polysaccharides. Cells contain a high percentage of protein including phycoerythrin, that gives red algae their color. They show blue-greenish to reddish color.",[]],["Compsopogonophyceae",28,"Includes microscopic filamentous algae to macroscopic multicellular species. The color of chloroplasts is variable, blue green to red.",[]],["Stylonematophyceae",28,"Characterised by unicellular, colonial, prostrate, and upright filaments. Sometimes microscopic filamentous, pseudofilamentous or unicellular red algae. Most species live in coastal water. The color of chloroplast is reddish to blue-greenish.",[]],["Rhodellophyceae",28,"Unicellular or pseudofilamentous red algae with a single highly lobed plastid that has an eccentric or centric pyrenoid. Reproduction is by cell division.",[]],["Bangiophyceae",28,"Red algae characterized by filamentous or leafy thalli, often found in intertidal and subtidal environments.",["nori","gim","laver"]],["Florideophyceae",28,"One of the most successful algal groups in marine environments. It has a global distribution, ranging from tropical to polar coasts, including some freshwater species and are more abundant along cold and temperate coastal regions. Their life cycles typically involve three generations. Many plastids per cell and no pyrenoids. Pit connections are always present.",["Irish moss","dulse","gulaman","ogonori"]],["Basal Chlorophyta prasinophytes",29,"A number of taxa basal to Chlorophyta that are most of the paraphyletic term prasinophytes. They are unicellular green algae and mainly include marine planktonic species with some freshwater representatives. They are morphologically diverse, including flagellates with one to eight flagella and non-motile unicells, as well as dormant or cyst stage phycoma. The cells of many species are covered with organic body scales; others are naked.",[]],["Chlorophytina",29,"The core chlorophytes.",[]],["Chlorodendrophyceae",29,"Unicellular green algae that's flagellated that have cellular scales of carbohydrates that fuse to form the thecal wall but remain separated on the flagella. It's one of the taxa often called prasinophytes, a paraphyletic group of unicellular green algae.",[]],["Pedinophyceae",29,"A class of single celled, asymmetric uniflagellate green algae that do not have extracellular scales.",[]],["Trebouxiophyceae",29,"Single-celled, colonial, or multicellular and are found in freshwater, terrestrial or marine habitats worldwide. Many taxa form symbiotic relationships with other organisms; in particular they are the main phycobionts within lichens. Others have lost the ability to photosynthesize and have evolved to become parasitic.",["trebouxiophytes"]],["Chlorophyceae",29,"",["globe alga","water net"]],["Ulvophyceae",29,"Common forms include filaments (both unbranched and branched), tubular and blade-like thalli, and siphonous thalli. Siphonous thalli are composed of a single giant cell with thousands of nuclei and chloroplasts. They have a counter-clockwise arrangement of the flagellar basal bodies, cytokinesis by furrowing, a closed persistent mitotic spindle, and the lack of a phycoplast.",["sea lettuces","green sea fingers","dead man's fingers","sea grapes","green caviars","killer alga","green feather alga"]],["Pinopsida",30,"",[]],["Pinales",30,"",[]],["Pinaceae",30,"",[]],["Pinus",30,"Conifers with needles that bundle in clusters.",["pine"]],["Larix",30,"",["larch"]],["Picea",30,"Conifers with four sided leaves that attach to peg like strutures and have cones that point down after polination.",["spruce"]],["Abies",30,"Conifers with upright cones and flat needles that mostly attach on two sides of a branch.",["fir"]],["Cedrus",30,"Note: There are many other plants commonly called cedar.",["cedar"]],["Tsuga",30,"Note: unrelated to the hemlock of the bible but with a similar smell.",["hemlock"]],["Cupressales",30,"",[]],["Cupressaceae",30,"",[]],["Sequoioideae",30,"",["redwood / sequoia"]],["Cupressus",30,"",["cypress"]],["Juniperus",30,"",["juniper"]],["Chamaecyparis",30,"",["false cypress"]],["Taxaceae",30,"",[]],["Taxus",30,"",["yew"]],["Basal angiosperms",31,"A parathyletic grade also known as the ANA grade.",[]],["Amborellales",31,"An order containing a single species of New Caledonia shrub that is a sister group to all other known flowering plants.",[]],["Nymphaeales",31,"An order of aquatic or sub-aquatic, annual or perennial herbs that lack a xylem and phloem.",["water lilies"]],["Austrobaileyales",31,"An order of woody plants growing as trees, shrubs and lianas.",["star anise"]],["Core angiosperms",31,"",[]],["Magnoliid",31,"A group characterized by trimerous flowers, pollen with one pore, and usually branching-veined leaves.",["magnolias","nutmeg","bay laurel","cinnamon","avocado","black pepper","tulip tree"]],["Piperales",31,"An order that necessarily contains the family Piperaceae. Plants have simple leaves, minute flowers in spikes and the perianth is simple or lacking.",["black pepper vines","kava","pepper elder","lizard's tail","birthwort","wild ginger"]],["Canellales",31,"A small group of typically evergreen trees and shrubs with smooth, leathery leaves with aromatic bark that includes the canellas, winter's-bark, and allies.",["horopito"]],["Laurales",31,"A group characterized by woodiness, aromatic parts, and a single strand of conducting tissues continuing from the stem into the leaf.",["bay trees","cinnamon trees","avocado trees","Sassafras","Calycanthus"]],["Magnoliales",31,"An order including magnolia and related aromatic flowers.",["magnolias","tulip trees","custard apples","American pawpaw","cherimoyas","ylang-ylang","soursop fruit","nutmeg"]],["Chloranthales",31,"An early-diverging lineages in the angiosperms of woody or weakly woody plants sometimes lacking petals.",[]],["Monocots",31,"Flowering plants with seeds that contain only one embryonic leaf, flowers parts in multiples of three, single pore pollen, usually parallel-veined leaves, and an atactostele (or scattered vascular tissue).",["grasses","dates","onions","rice","maize","sugarcane","orchids","tulips","daffodils","lilies"]],["Ceratophyllales",31,"A flowering plants aquatic plant found in tropical and in temperate regions with only a single genus.",["coontails"]],["Eudicots",31,"Flowering plants that have two seed leaves (cotyledons) upon germination, 4- or 5-part flowers, 3-pore pollen, and usually branch-veined leaves.",["sunflowers","dandelions","forget-me-nots","cabbages","apples","buttercups","maples","macadamias"]],["Alismatid monocots",32,"The grade that includes the two basal monocot orders.",[]],["Acorales",32,"An order that's sister to all other known monocots.",["sweet flags"]],["Alismatales",32,"An order of monocots often found in aquatic and marshy habitats, and the only known to have green embryos other than the Amaryllidaceae family.",["taros","arrowgrass","surfgrass","seagrass"]],["Lilioid monocots",32,"A grade of monocots that has lily like flowers.",[]],["Petrosaviales",32,"An order of monocots found in low-light montane rainforests with some unable to photosynthesise so instead take their food from fungi.",[]],["Dioscoreales",32,"A monocot order of vines and herbaceous forest floor plants with some unable to photosynthesise so instead take their food from fungi.",["yams","fairy lanterns"]],["Pandanales",32,"A monocot order of the pandans or screw-pines with some unable to photosynthesise so instead take their food from fungi.",["pandan","toquilla palm","palmilla"]],["Liliales",32,"A monocot order that necessarily includes the family Liliaceae that are predominantly perennial erect or twining herbaceous and climbing plants.",["lillies","tulip","greenbrier"]],["Asparagales",32,"A monocot order that necessarily includes the family Asparagaceae.",["dragon trees","black boys","grasstree","joshua trees","iris","agave","spider ivy","aloe"]],["Commelinids",32,"Distinguished by having cell walls containing ferulic acid.",[]],["Arecales",32,"A monocot order that includes the palms and relatives.",["palms","bullanocks","black gins"]],["Poales",32,"A monocot order that includes grasses, sedges, rushes, and bromeliads.",["grasses","rushes","bromeliads","pineapples","Spanish moss","sedges","bamboo","reeds"]],["Zingiberales",32,"A monocot order with a herbaceous arborescent stem, distichous phyllotaxy, large petiolate leaves, and inflorescences of conspicuous colorful bracts.",["gingers","banana","Bird of Paradise","plantains","galangal","arrowroot","cardamom","turmeric"]],["Commelinales",32,"A monocot order with a lack of mycorrhizal associations and tapetal raphides.",["spiderwort","water hyacinth","dayflowers","kangaroo paws"]],["Ranunculales",33,"The order that is sister to all other known Eudicots and includes the buttercups family Ranunculaceae.",["poppies","barberries","hellebores","buttercups"]],["Proteales",33,"An order or eudicots with seeds that have little or no endosperm. Includes the Proteaceae family and a family of aquatic flowering plants that have evolved to be similar to the water lilies.",["sugarbushes","banksias","spider flowers","macadamia","planetree","sacred lotus"]],["Trochodendrales",33,"An order of eudicots that have secondary xylem without vessel elements. Includes the wheel tree genus, Trochodendron.",["wheel trees"]],["Buxales",33,"Includes the box family, Buxaceae.",["common box","cape box"]],["Core eudicots",33,"",[]],["Gunnerales",33,"Includes the Gunneraceae family.",["giant rhubarbs"]],["Dilleniales",33,"Includes the Dilleniaceae family.",["guinea flowers","wild cashew tree","hibbertia"]],["Superrosids",33,"",[]],["Saxifragales",33,"A eudicot order with the saxifrages (Saxifraga) as the type genus.",["saxifrages","blackcurrants","redcurrants","gooseberries","peonies","liquidambars","witch-hazel","Persian ironwood","katsura","jade plant","houseleeks","water milfoil","sweetgums","money trees","houseleeks"]],["Rosids",33,"",[]],["Vitales",33,"A eudicot order of woody plants, most of them tendril-bearing vines that includes the grape genus, Vitis.",["grapes","Virginia creeper"]],["Fabids",33,"",[]],["Fabales",33,"Includes the legume family, Fabaceae.",["legumes","milkworts"]],["Rosales",33,"A eudicot order necessarily including the rose family, Rosaceae.",["roses","strawberries","blackberries","raspberries","apples","pears","plums","peaches","apricots","almonds","elms","figs","mulberries","nettles","hops","cannabis"]],["Fagales",33,"A eudicot order necessarily including the beech family, Fagus.",["beeches","chestnuts","oaks","walnut","pecan","hickory","birches","alders","hazels","hornbeams","she-oaks","southern beeches"]],["Cucurbitales",33,"Includes the gourd family, Cucurbitaceae. Mostly comprised of annual vines with thick pointed petals, many species of which are cultivated for their fruit. Includes some parasitic plants.",["squash","pumpkins","watermelons","cucumbers","melons"]],["Oxalidales",33,"Includes the wood sorrel family, Oxalidaceae. Also includes some carniverous pitcher plants.",["starfruit"]],["Malpighiales",33,"A eudicot order with the type genus Malpighia.",["willows","violets","aspens","poplars","poinsettia","corpse flower","coca plant","cassava","flaxseed","castor bean","Saint John's wort","passionfruit","mangosteen","manchineel tree"]],["Celastrales",33,"Includes the staff-vine family, Celastraceae.",["staff-vine","bittersweet"]],["Zygophyllales",33,"Includes the Zygophyllaceae family.",["bean-caper","caltrop","creosote bush","rhatany"]],["Malvids",33,"",[]],["Geraniales",33,"The type genus are the true geraniums, Geranium.",["geraniums","stork's-bills","honey flowers"]],["Myrtales",33,"Includes the myrtle family, Myrtaceae",["myrtle","pōhutukawa","bay rum tree","clove","guava","acca","allspice","eucalyptus","crape myrtles","henna tree","pomegranate","water caltrop","loosestrifes","cigar plants","evening primroses","fuchsias","willowherbs","white mangrove","leadwood tree","African birch","Koster's curse","velvet tree"]],["Crossosomatales",33,"Includes the family Crossosomataceae.",["guyalone","bladdernut trees"]],["Picramniales",33,"Includes the bitterbush genus, Picramnia.",[]],["Malvales",33,"Includes the mallows family, Malvaceae.",["balsa trees","basswood trees","cacao trees","daphnes","hibiscus","hollyhocks","okra","jute","baobab trees","cotton","kapok","durian"]],["Brassicales",33,"Includes the mustard and cabbage family, Brassicaceae.",["cabbage","cauliflower","Brussels sprout","broccoli","kale","mustard","turnip","bok choy","rapeseed","radish","horseradish","caper","papaya","turtleweed"]],["Huerteales",33,"Woody eudicots  with leaves that alternate and have toothed margins. The inflorescence is cymose.",[]],["Sapindales",33,"Includes the soapberry family, Sapindaceae.",["citrus","maples","horse-chestnuts","lychees","rambutans","mangos","cashews","frankincense","myrrh","mahogany","neem"]],["Superasterids",33,"",[]],["Berberidopsidales",33,"",["olivillo"]],["Santalales",33,"its type genus, Santalum (sandalwood)",["sandalwoods","many mistletoes"]],["Caryophyllales",33,"Includes the carnation family, Caryophyllaceae.",["cacti","carnations","beets","quinoa","spinach","amaranths","pigfaces","oraches","saltbushes","goosefoots","sundews","Venus flytraps","monkey cup pitcher plants","Malabar spinach","bougainvilleas","four o'clock flowers","buckwheat","knotweeds","rhubarb","sorrel","portulacas","jojoba","tamarisks"]],["Asterids",33,"",[]],["Cornales",33,"Includes the dogwood family, Cornaceae.",["Assegai trees","happy trees","dove trees"]],["Ericales",33,"Includes the heather family, Ericaceae",["camellias","persimmon","ebony","blueberry","cranberry","lingonberry","huckleberry","kiwifruit","Brazil nut","argan","sapote","azaleas","rhododendrons","heather","heath","impatiens","phlox","Jacob's ladder","primroses","cyclamens","shea","sapodilla","pouterias","trumpet pitchers"]],["Campanulids",33,"",[]],["Aquifoliales",33,"A eudicot order that includes the holly family, Aquifoliaceae.",["holly"]],["Asterales",33,"an order of dicotyledonous flowering plants that includes the large family Asteraceae known for composite flowers made of florets, and related families. One has evolved to be similar to the water lilies.",["lettuces","sunflowers","artichokes","pot marigold","coneflowers","daisies","fleabane","chrysanthemums","dahlias","zinnias","heleniums","yarrow"]],["Escalloniales",33,"A eudicot order that includes the Escalloniaceae family.",[]],["Bruniales",33,"A eudicot order that includes the Bruniaceae family.",[]],["Apiales",33,"An order of eudicots with the type being the carrot family, Apiaceae.",["carrots","celery","coriander","parsley","parsnips","poison hemlock","ginseng","ivies","pittosporums"]],["Dipsacales",33,"Includes the teasel genus, Dipsacus.",["honeysuckle","elderflowers","elderberrie","viburnum","valerian"]],["Paracryphiales",33,"A eudicot order that includes the Paracryphia family.",[]],["Lamiids",33,"",[]],["Solanales",33,"A eudicot order that includes the nightshades family, Solanaceae.",["potatoes","eggplants","tomatoes","chili peppers","tobacco","petunias","nightshades","morning glory","sweet potato"]],["Lamiales",33,"A eudicot order that includes the mint / sage family, Lamiaceae. Includes some carnivorous and protocarnivorous plants.",["basil","mint","rosemary","sage","savory","marjoram","oregano","hyssop","thyme","lavender","perilla","lemon verbena","catnip","bee balm","wild dagga","oriental motherwort","olives","ash trees","teak","foxgloves","lilacs","jasmine","snapdragons","African violets","Jacarandas","Paulownias","butterfly bushes","sesame","psyllium","bladderworts"]],["Vahliales",33,"A eudicot order that includes the Vahliaceae family.",[]],["Gentianales",33,"A eudicot order that includes the Gentianaceae family.",["oleander","dogbanes","milkweeds","periwinkles","coffee"]],["Boraginales",33,"A eudicot order that includes the forget-me-not family, Boraginaceae.",["alkanet","borage","comfrey","fiddleneck","forget-me-not","geigertree","green alkanet","heliotrope","hound's tongue","lungwort","oysterplant","purple viper's bugloss/Salvation Jane","Siberian bugloss","viper's bugloss"]],["Garryales",33,"A eudicot order that includes the silktassels family, Garryaceae.",["silktassels"]],["Metteniusales",33,"A eudicot order that includes the Metteniusaceae family.",[]],["Icacinales",33,"A eudicot order that includes the white pear family, Icacinaceae.",[]],["Nothofagaceae",34,"The southern beech family. The leaves are toothed or entire, evergreen or deciduous. The fruit is a small, flattened or triangular nut, borne in cupules containing one to seven nuts. ",["false beeches","southern beeches"]],["Fagaceae",34,"The beech family.",["beeches","chestnuts","oaks"]],["Myricaceae",34,"The bayberry family.",[]],["Juglandaceae",34,"The walnut family.",["walnut","pecan","hickory"]],["Ticodendraceae",34,"The ticodendron family with only one species. A tree, 20–30 m tall, superficially resembling an alder in appearance, with alternate, simple leaves 5–12 cm long with a serrated margin. Generally dioecious, with separate male and female plants.",[]],["Betulaceae",34,"The birch family.",["birches","alders","hazels","hornbeams","hazel-hornbeam","hop-hornbeams"]],["Casuarinaceae",34,"The she-oak family. Dicotyledonous flowering trees and shrubs, many of which have a distinctly pinelike aspect when seen from afar. They are naturally distributed in tropical eastern Africa, the Mascarene Islands, Southeast Asia, Malaysia, Australia, and Polynesia.",["she-oaks","Daintree oaks"]],["Alzateaceae",35,"Only one species.",[]],["Combretaceae",35,"The white mangrove family.",[]],["Crypteroniaceae",35,"Native to Indomalaya.",[]],["Lythraceae",35,"The loosestrife and pomegranate family. The leaves generally have an opposite arrangement, but sometimes are whorled or alternate. The flower petals emerge from the rim of the calyx tube and the petals often appear crumpled. Most often herbs, and less often shrubs or trees; the shrubs and trees often have flaky bark.",["loosestrifes","hennas","pomegranates","crape myrtle"]],["Melastomataceae",35,"",[]],["Myrtaceae",35,"The myrtle family. Found mainly in the warmer parts of Australia and America and also Africa and Asia. Usually evergreen woody trees and shrubs with few herbs. The bark is often smooth and flakes off on older trees.",["Myrtles","pōhutukawas","bay rum trees","cloves","guavas","accas","allspices","eucalyptuses","gum trees","paperbarks","honey-myrtles","bottlebrushes","tea-trees"]],["Onagraceae",35,"The evening primrose and Fuchsia family. Characterised by flowers with usually four sepals and petals; in some genera the sepals are as brightly coloured as the petals. Seeds are generally very small. Some genera have tufts of hairs to help with wind dispersal.",["primroses","fuchsias","willowherbs","fireweed "]],["Penaeaceae",35,"",[]],["Vochysiaceae",35,"A family that likely originated in South America with most native to the Neotropics and some native to West and Central Africa. Trees or shrubs with opposite leaves; flowers are zygomorph 1-(3)-5 merous; ovary inferior or superior; one fertile stamen; fruits are capsules or winged achene. ",[]],["Cannabaceae",36,"The hemp family.",[]],["Dirachmaceae",36,"",[]],["Elaeagnaceae",36,"The oleaster/Russian olive family.",[]],["Moraceae",36,"The mulberry family.",["common fig","breadfruit","jackfruit","mulberry"]],["Rhamnaceae",36,"The buckthorn family.",[]],["Rosaceae",36,"The rose family.",[]],["Amygdaloideae",36,"",["plums","cherries","apricots","peaches","almonds","apples","pears","spireas","meadowsweets","steeplebushes","goatsbeards"]],["Rosoideae",36,"",[]],["Dryadoideae",36,"",[]],["Ulmaceae",36,"The elm family.",["elms","zelkovas"]],["Urticaceae",36,"The nettle family.",[]],["Rozellomycota",37,"Micro-organisms that they lack chitinous cell walls at any trophic stage in their lifecycle. Often parasitic.",[]],["Aphelidiomycota",37,"Parasitoids of various algae and diatoms.",[]],["Eumycota",37,"The true fungi. Thalli usually do not posses Plasmodia or pseudoplasmodia. Members are unicellular or filamentous with definite cell wall.",[]],["Neocallimastigomycota",37,"Anaerobic fungi that reproduce in the rumen of ruminants. Their flagellated zoospores are capable of active movement.",[]],["Chytridiomycota",37,"Decomposers of chitin and keratin, that sometimes act as parasites. They have chitin cell walls, a posterior whiplash flagellum, use of glycogen as an energy storage compound, and synthesis of lysine.",["chytrids"]],["Blastocladiomycota",37,"Very similar to the chytrids, and often still colloquially have the same name, but a different genetic tree.",["blastoclads"]],["Amastigomycota",37,"All fungi without flagella or centrioles, and with unstacked Golgi apparatus cisternae. Includes Dikarya and the traditional paraphyletic assemblage 'Zygomycota'. Sometimes known as 'Eufungi'.",[]],["Basidiobolomycota",37,"Cells are uninucleate and their relatively large nuclei contain a nucleolus, but no heterochromatin.",[]],["Zoopagomyceta",37,"May be saprotrophs, gut symbionts or parasites of animals or mycoparasites. Thallus mycelial, mostly separated into cells with complete or uniperforate septa; Some reproduce sexually via zygospores by gametangial conjugation.",[]],["Zoopagomycota",37,"Microscopic and typically obligate parasites of other zygomycete fungi and of microscopic soil animals such as nematodes, rotifers and amoebae.",[]],["Entomophthoromycota",37,"Mostly arthropod pathogens or soil- and litter-borne saprobes.",[]],["Kickxellomycota",37,"Decomposers that may be parasitic on fungi and can form symbiotic associations.",[]],["Mortierellomycota",37,"Parasitic or saprotrophic; fine mycelium, branched (arachnoid); sporangia with 1 or many spores; may form chlamydospores (thick-walled asexual spores); produces garliclike odour.",[]],["Mucoromyceta",37,"A diverse group of various molds.",[]],["Mucoromycota",37,"Saprotrophic, filamentous and developes coenocytic mycelium. Some are parasites of animals. Some are used for fermentation.",["common bread molds"]],["Calcarisporiellomycota",37,"The thallus is branched, with septate hyphae. The vegetative hyphae is hyaline, smooth and thin-walled. It has cultures with no distinctive smell.",[]],["Glomeromycota",37,"Most members are endomycorrhizal fungi with bryophytes and the roots of vascular land plants but at least one species forms an endocytobiotic with a cyanobacteria instead. Some species seem to be able to live independently.",[]],["Dikarya",37,"In general produce dikaryons, may be filamentous or unicellular, but are always without flagella. Sometimes called 'higher fungi'.",["puffballs","bracket fungi","jelly fungi","chanterelles","earth stars","rusts","human pathogenic yeast","morels","truffles","brewers' yeast","bakers' yeast","the majority of lichens","penicillium"]],["Basidiomycota",37,"Filamentous fungi that are usually composed of hyphae and usually reproduce sexually via the formation of specialized club-shaped end cells called basidia that normally bear external meiospores (usually four).",["agarics","puffballs","stinkhorns","bracket fungi","jelly fungi","boletes","chanterelles","earth stars","smuts","bunts","rusts","mirror yeasts","human pathogenic yeast","basidiolichens"]],["Entorrhizomycota",37,"A small group of teliosporic root parasites that form galls on plants in the rush sedge families.",[]],["Ascomycota",37,"Characterized by a saclike structure, the ascus that may forcibly eject the ascospores. Genetically related fungi in the group may not have this structure.",["morels","truffles","brewers' yeast","bakers' yeast","dead man's fingers","cup fungi","ascolichens","penicillium"]],["Agaricomycotina",38,"Contains jelly fungi, yeasts, and mushrooms.",[]],["Tremellomycetes",38,"Includes basidiomycete yeasts, conspicuous jelly fungi, dimorphic taxa, and species that form complex fruiting bodies. Some are human and animal pathogens.",[]],["Agaricomycetes",38,"Includes all the agarics (gilled mushrooms), bracket fungi, clavarioid fungi, corticioid fungi, and gasteroid fungi.",[]],["Cantharellales",38,"Includes the chanterelles, some of the tooth fungi, clavarioid fungi, and corticioid fungi. Some are plant pathogens or symbiotic. Sporocarps (fruit bodies) have false gills.",["chanterelles","black chanterelles","winter chanterelles"]],["Sebacinales",38,"Taxa have a widespread distribution and are mostly terrestrial, many forming mycorrhizas with a wide variety of plants, including orchids.",[]],["Auriculariales",38,"The majority of species produce gelatinous basidiocarps (fruit bodies) on dead wood. In some these are conspicuous and may be ear-shaped, button-shaped, lobed, bracket-like, or effused. Some species produce dry, leathery, or web-like fruit bodies resembling those of the corticioid fungi.",[]],["Phallomycetidae",38,"",[]],["Geastrales",38,"Found under trees, mainly conifers. Spherical or egg-shaped fruiting bodies, some become star-shaped after splitting open to release spores.",["earthstars","shotgun fungus"]],["Hysterangiales",38,"Most are saprotrophic. Resembles puffballs when small, becoming pear-shaped and finally globose when mature. Fruiting body may be pink to vibrant lilac in colour. Mature internal tissue characterized by fetid odour.",["club-shaped stinkhorns"]],["Gomphales",38,"Most are mycorrhizal, some are saprotrophic. Includes some club-shaped and coral-shaped fungi. Spores may be olive-shaped, usually rough.",[]],["Phallales",38,"Stinkhorns and related species. Most start as a truffle-like fungus, or 'egg', but some burst open into a fruiting body that is either club shaped or elaborately shaped, coated in a stinky slime that attracts insects, especially flies, to spread their spores.",["stinkhorns"]],["Hydnodontaceae",38,"They often form crust-like structures on decaying wood or soil.",[]],["Hymenochaetales",38,"Mostly corticioid fungi and poroid fungi, but also including several clavarioid fungi and agarics.",[]],["Thelephorales",38,"Includes corticioid and hydnoid fungi, together with a few polypores and clavarioid species. Most are ectomycorrhizal.",["leathery earthfans","tooth fungi","bleeding tooth fungi"]],["Polyporales",38,"Includes some polypores as well as many corticioid fungi and a few agarics. Many species within the order are saprotrophic, most of them wood-rotters. Some species that attack living tissues and then continue to degrade the wood of their dead hosts.",[]],["Corticiales",38,"Composed of corticioid fungi. Species within the order are generally saprotrophic, most of them wood-rotters, but several are parasitic on grasses or lichens.",[]],["Gloeophyllales",38,"Wood-decay fungi that is characterized by the ability to produce a brown rot of wood.",[]],["Russulales",38,"Includes polypores, some tooth fungi and club fungi. Basidiospores in this group are typically ornamented with amyloid warts or reticulation.",["brittlegills","milk-caps"]],["Agaricomycetidae",38,"",["false chanterelles"]],["Agaricales",38,"The majority are terrestrial. Species are saprotrophic or ectomycorrhizal, occasionally parasitic on plants or other fungi, and sometimes lichenized. A handful form mutualistic symbioses with ants and termites, and a few are important plant pathogens.",["field mushrooms","dung bird's nest","destroying angels","violet coral mushrooms","beefsteak fungi"]],["Boletales",38,"Includes some boletes, earthballs, puffballs, and false truffles. Most members are saprobic, primarily found on the wood of fallen trees or in the soil at the base of trees.",["boletes","prettymouths","earthballs"]],["Amylocorticiales",38,"Form fruit bodies that are effused (stretched out flat like a film-like growth), effused-reflexed (stretched out but with edges curled up) to almost pileate (with a cap), or stipitate (with a stipe). They have smooth hymenophores that can be either merulioid (wrinkled with low, uneven ridges), irpicoid (with 'teeth') or poroid (with pores).",[]],["Lepidostromatales",38,"Lichenized fungi with fruiting bodies that are clavarioid.",[]],["Atheliales",38,"Mostly corticioid fungi with varied ecological diversity. Most species have relatively simple gross morphology and produce crust-like fruiting bodies attached loosely to their substrate.",[]],["Dacrymycetes",38,"All are wood-rotting saprotrophs. Basidiocarps (fruit bodies) are ceraceous to gelatinous and typically yellow to orange.",[]],["Ustilaginomycotina",38,"Includes the true smut fungi. They are mostly plant parasites on vascular plants. They consist of two states: anamorphic yeast state and teleomorphic filamentous smut state.",[]],["Malasseziomycetes",38,"A yeast found on the skin of animals, including humans that requires fat to grow.",[]],["Ustilaginomycetes",38,"The true smut fungi are plant parasites. They have a simple septum with a septal pore cap.",[]],["Exobasidiomycetes",38,"Includes fungi associated with galls on plants and smut fungi.",[]],["Monilielliomycetes",38,"Includes some black, yeast-like fungi. Some species can cause disease in humans and cats.",[]],["Pucciniomycotina",38,"A diverse group of fungi, including rusts, insect parasitic/symbiotic fungi, yeasts, smut-like, jelly-like fungi and a mixture of odd, infrequently seen, or seldom recognized fungi, often parasitic on plants.",[]],["Pezizomycotina",39,"These fungi reproduce by fission rather than budding. It's the largest subphylum and contains all ascomycetes that produce ascocarps (fruiting bodies), except for one genus, Neolecta, in the Taphrinomycotina.",["truffles","ergot","ascolichens","cup fungi","pyrenomycetes","lorchels","caterpillar fungus","powdery mildews","dermatophytic fungi","Laboulbeniales"]],["Orbiliomycetes",39,"Saprobic sac fungi. Some species are carnivorous fungi, and have evolved to trap nematodes.",[]],["Geoglossaceae",39,"The ascocarps of most species in the family Geoglossaceae are terrestrial and are generally small, dark in color, and club-shaped with a height of 2–8 cm",["earth tongues"]],["Pezizomycetes",39,"The operculate discomycetes.",["cup fungi","morels","Elfin saddles","truffles"]],["Pezizales",39,"",[]],["Sarcoscyphaceae",39,"Cup fungi found in both tropical and temperate regions.",["scarlet elf cup"]],["Tuberaceae",39,"",["white truffles","black truffles"]],["Carbomycetaceae",39,"Desert truffles found in Mexico and the USA.",[]],["Ascobolaceae",39,"Most fruiting bodies are round and without conidium. Members have a saprobiontic lifestyle, feeding on decaying and dead matter.",[]],["Glaziellaceae",39,"Includes organge cup fungi.",["orange bladder"]],["Sarcosomataceae",39,"The type genus is Sarcosoma. Most are cup fungi and have a dark brown or black apothecium which is gelatinous or leathery.",[]],["Rhizinaceae",39,"Fungi parasitic on conifer seedlings. The fruit bodies of the fungus are dark purple brown with a bright yellow margin, crust-like and attached to the growing surface by numerous root-like yellow rhizoids.",["doughnut fungi"]],["Chorioactidaceae",39,"Cup fungi with taxa that are saprotrophic, and inhabit temperate and subtropical regions.",["devil's cigars"]],["Caloscyphaceae",39,"Contains cup fungi with a bright to pale orange interior and orange.",["snowbank orange peel fungus"]],["Morchellaceae",39,"The best-known members are the true morels, the thimble morels, and a genus of cup-shaped fungi.",["morels","bleach cups","early morels","thimble morels","Oregon brown truffles"]],["Pezizaceae",39,"They produce mushrooms that tend to grow in the shape of a 'cup'. Spores are formed on the inner surface of the fruit body (ascoma). The cup shape typically serves to focus raindrops into splashing spores out of the cup.",["cup fungi"]],["Ascodesmidaceae",39,"",[]],["Discinaceae",39,"Includes species possessing saddle-shaped apothecia and hypogeous truffles. Members are known to have epigeous and hypogeous species, and are characterized by ascomata composed of an inner layer of interwoven hyphae and an outer layer composed of elongated cells arranged perpendicular to its exterior.",["false morels","pig ear"]],["Helvellaceae",39,"Almost all species have saddle-shaped ascocarps with cupulate or  lobed  caps  on a  disinct  shape,  and ellipsoid ascospores.",["elfin saddles"]],["Pyronemataceae",39,"Morphologically and ecologically highly diverse, comprising saprobic, ectomycorrhizal, bryosymbiotic and parasitic species, occurring in a broad range of habitats.",[]],["Terfeziaceae",39,"Fruit-bodies are large, more or less spherical to cylindrical, don't split open at maturity, thick-walled, and solid. The asci are formed in marbled veins interspersed with sterile tissue.",["desert truffles"]],["Leotiomyceta",39,"Represents all the filamentous ascomycete fungi (Pezizomycotina), excluding the classes Pezizomycetes and Orbiliomycetes.",[]],["Dothideomyceta",39,"",[]],["Dothideomycetes",39,"Have ascolocular development. Mostly produce flask-like structures. Includes some plant pathogens and lichens.",[]],["Lecanoromycetes",39,"The largest class of lichenized fungi.",["sheild lichens","reindeer lichens","cup lichens","mountain lichens","wolf lichens","lungwort lichens"]],["Coniocybales",39,"Lichens that have stalked reproductive structures called apothecia.",[]],["Lichinales",39,"Most species are lichenized.",[]],["Arthoniomycetes",39,"Most of the taxa in these orders are tropical and subtropical lichens.",[]],["Eurotiomycetes",39,"Includes many lichenized species. Many are mostly bitunicate in the formation of asci.",[]],["Sordariomyceta",39,"",[]],["Leotiomycetes",39,"The inoperculate discomycetes. Many cause serious plant diseases.",[]],["Laboulbeniomycetes",39,"A group of fungi that are obligatorily associated with arthropods, either as external parasites or for dispersal.",[]],["Sordariomycetes",39,"The fungi are characterized by a flask-shaped fruiting body (perithecium) that bears saclike structures (asci) and usually has a pore (ostiole) through which ascospores are discharged. Some are parasites to plants, insects and other arthropods.",["stag's horn","dead man's fingers","zombie-ant fungus"]],["Saccharomycotina",39,"Includes most of the ascomycete yeasts. Part of the gut microbiome. Members reproduce by budding and do not produce ascocarps.",["true yeasts","baker's yeast","human thrush"]],["Taphrinomycotina",39,"A disparate and basal group recognized following molecular (DNA) analyses. It includes hyphal fungi, fission yeasts , and the mammalian lung parasite Pneumocystis.",[]],["Schizosaccharomycetes",39,"Yeasts that reproduce by fission rather than budding",[]],["Taphrinomycetes",39,"Dimorphic plant parasites that induce a number of galls. They have both a yeast state and a filamentous (hyphal) state in infected plants. They characteristically infect leaves, catkins, and branches, not roots. Taphrinomycetes form asci but no ascomata.",["witches broom"]],["Neolectomycetes",39,"Form ascomata which specifically grow out of root tips.",["Irregular Earth Tongue","Egg-yellow Earth Tongue"]],["Pneumocystidomycetes",39,"Encompasses one genus of yeasts. One species causes Pneumocystis pneumonia in humans by developing cysts on the lung tissue.",[]]],"words":["0","02","04","1","10","100","12","15","18","2","20","24","3","30","36","38","4","45","46","5","55","56","6","60","8","90","95","a","aardvarks","abdomen","abdomens","abies","ability","able","about","above","absent","abundant","abyssal","acanthisittidae","acanthizidae","acanthomorpha","acanthopterygii","acanthuriformes","acariformes","acca","accas","accentors","accessory","accipitriformes","accomodate","achene","acid","acidic","acids","acinonyx","acipenseriformes","acoelomates","acorales","acquire","acrocephalid","acrocephalidae","acrodonta","acropomatiformes","across","act","actiniaria","actinopterygii","action","active","acts","actual","aculeata","aculifera","adaptated","adaptations","adapted","adaptive","adductor","adept","adhere","adhering","adhesion","adhesive","adipose","adult","adults","advanced","aegithalidae","aegithaloidea","aegithinidae","aegotheliformes","aequornithes","aerobatics","afar","africa","african","afroaves","afrosoricida","afrotheria","after","agamidae","agamids","agaricales","agaricomycetes","agaricomycetidae","agaricomycotina","agarics","agave","age","aggregations","aggressive","agile","agnatha","ago","ailuridae","air","airborne","alarm","alaudidae","albatrosses","albuliformes","alcids","alder","alderflies","alders","alepocephaliformes","alfonsinos","alga","algae","algal","alismatales","alismatid","alkanet","all","allen","allenopithecus","allies","alligators","allochrocebus","allomothering","allowing","allspice","allspices","almonds","almost","aloe","along","alouatta","alouattinae","alpacas","also","alter","alternate","alternating","although","altitudes","altricial","alveolate","always","alzateaceae","amaranths","amaryllidaceae","amastigomycota","amazon","amazonian","amblypygi","amborellales","ambush","ambushing","america","american","americas","amiiformes","amniota","amoebae","amoebas","amoebozoa","among","amongst","amorphea","amounts","amphibia","amphibians","amphibious","amphipoda","amygdaloideae","amylocorticiales","amyloid","an","ana","anabantiformes","anaerobic","anal","analyses","anamorphic","ancestor","ancestors","anchovies","and","andean","anemone","anemonefishes","anemones","anenomes","angel","angelfishes","angels","angelsharks","angiosperms","anglerfish","anglerfishes","anguilliformes","anguimorpha","anguis","anhingas","animal","animalia","animals","anis","anise","annelida","annual","annuli","anostraca","another","anseriformes","ant","antarctica","antartica","antbirds","anteaters","antelopes","antenna","antennae","anterior","anthocerotophyta","anthophila","anthozoa","antilocapridae","antipatharia","antlions","antpittas","ants","antthrushes","anura","anus","any","aotidae","apart","apearance","apes","apex","aphelidiomycota","aphids","apiaceae","apiales","apocrita","apodiformes","apoidea","apothecia","apothecium","apparatus","apparently","appear","appearance","appears","appendages","appendicular","apples","applying","approximately","apricots","apterygiformes","aquatic","aquifoliaceae","aquifoliales","arachnida","arachnids","arachnoid","araguaian","araneae","araneoidea","araneoids","araneomorph","araneomorphae","arboreal","arborescent","archaea","archaeognatha","arched","archosauria","arctic","arctoidea","are","areas","arecales","argan","argentiniformes","arisen","armadillos","armored","armorheads","arms","aromatic","around","arranged","arrangement","array","arrowgrass","arrowroot","artamidae","arthoniomycetes","arthropod","arthropoda","arthropods","artichokes","articulated","artiodactyl","artiodactyla","as","asci","ascobolaceae","ascocarps","ascodesmidaceae","ascolichens","ascolocular","ascoma","ascomata","ascomycete","ascomycetes","ascomycota","ascospores","ascus","asexual","asexually","ash","asia","asian","asiatic","asites","asparagaceae","asparagales","aspect","aspens","assassin","assegai","assemblage","asses","assist","associated","associations","assortment","asteraceae","asterales","asterids","astragalus","asymmetric","asymmetrical","asymmetry","at","atactostele","ateleopodiformes","ateles","atelidae","atelinae","atelocynus","atheliales","atheriniformes","atlantic","atrichornithidae","attach","attached","attaches","attack","attacked","attacks","attracts","auditory","auks","aulopiformes","auriculariales","australasia","australasian","australaves","australia","australian","australo","australopithecina","australopithecus","austrobaileyales","austropacific","autarchoglossans","authored","aves","avocado","avoid","away","axes","axis","axolotls","azaleas","babbler","babblers","babies","babirusas","bablers","baboons","back","backed","backs","backward","bacteria","bactrian","badgers","badids","baikal","bait","baker","bakers","balaenidae","balaenopteridae","baleen","balm","balsa","bamboo","banana","bandfishes","bandicoot","bandicoots","bands","bangiophyceae","banjofish","banks","banksias","banxrings","baobab","barbel","barberries","barbets","bare","bark","barnacles","barrel","basal","basals","base","basic","basidia","basidiobolomycota","basidiocarps","basidiolichens","basidiomycete","basidiomycota","basidiospores","basil","basin","basins","basking","basses","basslets","basswood","bat","batfishes","bathyteuthida","batomorphi","batrachoidiformes","bats","batsies","bay","bayberry","be","beaches","beaded","beads","beak","beaked","beaklike","beaks","bean","bear","bearded","beardfish","bearers","bearing","bears","beavers","becards","because","become","becomes","becoming","bed","bee","beech","beeches","beefsteak","been","bees","beetles","beets","before","behavior","behaviors","behaviour","behind","being","believed","bellbirds","beloniformes","beluga","benthic","benthos","berberidopsidales","bernieridae","berries","berryhunter","berrypeckers","berrypickers","berycids","beryciformes","beside","besides","best","better","betulaceae","between","beyond","bible","bichirs","bifascial","biflagellate","bigeyes","biggest","bilateral","bilaterally","bilateria","bilaterian","bilbies","bill","billed","billfish","bills","bimodal","biological","biologist","bioluminescent","bipedal","birch","birches","bird","birds","birth","birthwort","bison","biting","bitterbush","bitterns","bittersweet","bitunicate","bivalves","bivalvia","black","blackbasses","blackberries","blackberry","blackbirds","blackcurrants","bladder","bladdernut","bladders","bladderworts","blade","blades","blastocladiomycota","blastoclads","blastula","blattodea","bleach","bleeding","blennies","blenniiformes","blenny","blind","blob","blood","blooded","bloodsucking","blubber","blue","blueberry","bluebirds","bluebottle","bluefishes","blunt","boarfishes","boatbills","bobcats","bobolinks","bobtail","bodied","bodies","body","bok","boletales","boletes","bolivian","bombycillidae","bombycilloidea","bonds","bone","bonefishes","bones","bonobos","bony","bonytongues","boobies","book","borage","boraginaceae","boraginales","boreoeutheria","borers","borne","botanist","both","bottlebrushes","bottlenose","bottom","boubous","bougainvilleas","bound","bovidae","bovines","bowerbirds","bowfins","bowhead","box","boxfishes","boys","brachyteles","bracket","bracts","braided","brain","bramble","branch","branched","branches","branching","branchiopoda","brassicaceae","brassicales","brazil","bread","breadfruit","break","breasted","breathe","breathes","breathing","breed","brewers","bright","brightly","bristle","bristlebirds","bristlehead","bristles","bristletails","brittle","brittlegills","brittleworts","broad","broadbills","broccoli","bromeliads","brooch","brood","broom","brotulas","brown","bruniaceae","bruniales","brussels","bryophyta","bryophytes","bryophytina","bryosymbiotic","bubble","buccal","bucerotiformes","buckthorn","buckwheat","budding","budgerigar","buds","buff","buffalo","bug","bugloss","bugs","build","builders","building","built","bulbs","bulbuls","bulging","bullanocks","bullhead","bumblebees","bundle","buntings","bunts","buoyancy","buphagidae","buried","burrowing","burrows","burst","bury","bush","bushes","bushier","bushshrikes","bushtits","bustards","but","butcherbirds","buttercups","butterflies","butterfly","butterflyfishes","button","buxaceae","buxales","by","byssus","c","cabbage","cabbages","cacao","caciques","cacomistles","cacti","caddisflies","caecilians","caenogastropoda","cage","caimans","calcareous","calcariidae","calcarisporiellomycota","calcified","calcium","caledonia","cales","callaeidae","called","callicebinae","callitrichidae","caloscyphaceae","caltrop","calycanthus","calyptomenidae","calyptophilidae","calyx","cambium","camel","camelidae","camellias","camels","camera","camouflage","camouflaged","campanulids","campephagidae","can","canal","canellales","canellas","canid","canidae","caniformia","canina","canine","canines","canini","canis","cannabaceae","cannabis","cannibalism","cannot","cantharellales","cap","capable","cape","caper","caprimulgiformes","caps","capsule","capsules","capture","capturing","capuchins","caracal","caracals","caracaras","carangiformes","carangimopharia","carbohydrates","carbomycetaceae","carbonate","carcharhiniformes","cardamom","cardinal","cardinalfishes","cardinalidae","care","cariamiformes","caribou","carnation","carnations","carniverous","carnivora","carnivores","carnivorous","carp","carpel","carpenter","carpet","carried","carries","carrion","carrot","carrots","carry","cartilages","cartilaginous","caryophyllaceae","caryophyllales","cases","cashew","cashews","casiquiare","cassava","cassowaries","caste","castor","casuariiformes","casuarinaceae","cat","catching","caterpillar","caterpillars","catfish","catkins","catnip","catopuma","cats","catsharks","cattle","caucasus","caudal","caudofoveata","cauliflower","cause","causes","cave","caves","caviars","cavities","cavity","cebidae","cebinae","cecum","cedar","cedrus","celastraceae","celastrales","celery","cell","cellar","celled","cells","cellular","cellulose","cenozoic","center","centipedes","central","centrarchiformes","centric","centrioles","cephalochordata","cephalopoda","cephalothorax","ceraceous","ceraphronoidea","ceratophyllales","cerci","cercocebus","cercopithecidae","cercopithecinae","cercopithecini","cercopithecus","cerdocyon","cerdocyonina","ceriantharia","certhiidae","certhioidea","cervidae","cetacea","cetotheriidae","cetruminantia","cettia","cettiidae","chaetopidae","chain","chalcidoidea","chamaecyparis","chamaeleonidae","chamber","chambered","chambers","chameleons","change","changing","chanterelles","characiformes","characterised","characteristic","characteristically","characteristics","characterized","charadriiformes","charcoal","charophyta","chasing","chat","chats","cheek","cheetahs","chelicerae","chelicerata","chemical","chemolithotrophy","cherimoyas","cherries","chestnuts","chew","chewing","chickadees","chickens","chicks","chiggers","chili","chilopoda","chimaeras","chimpanzees","china","chinese","chiroptera","chitin","chitinous","chitons","chlamydospores","chloranthales","chlorocebus","chlorodendrophyceae","chlorophyceae","chlorophyta","chlorophytes","chlorophytina","chloroplast","chloroplasts","chloropseidae","choanocyte","choanoflagellata","choanoflagellates","chondrichthyes","chordata","chordates","chorioactidaceae","choughs","choy","chromosome","chromosomes","chrysanthemums","chrysidoidea","chrysocyon","chubs","chunks","chyphotid","chytridiomycota","chytrids","cicadas","cichlids","cichliformes","ciconiiformes","cigar","cigars","cilia","ciliary","cinclidae","cinclosomatidae","cingulata","cinnamon","circular","circulate","circulates","circulatory","circumference","cirripedia","cisternae","cisticolas","cisticolidae","citrus","civet","civets","clade","clams","class","classes","classical","clavarioid","claws","clay","cleaning","clear","clearly","cleavage","climacteridae","climates","climb","climbing","clingfishes","clock","clockwise","close","closed","closely","closer","closest","clouded","clove","cloves","clownfishes","club","clubionidae","clubmoss","clubs","clubtails","clumps","clupeiformes","clusters","cm","cnemophilidae","cnidaria","cnidarians","coast","coastal","coasts","coat","coated","coating","coatis","cobweb","coca","cockatoos","cockles","cockroaches","cocoons","cods","coelacanths","coelom","coelomate","coeloms","coenocytic","coffee","coiled","cold","colder","coleoptera","coliiformes","collagen","collar","collectors","colloquially","colobinae","colobini","colobus","colonial","colonies","colony","color","coloration","colored","colorful","colors","colour","coloured","colourful","colouring","colugos","columbiformes","columbimorphae","column","comb","combat","combing","combretaceae","comes","comfrey","commelinales","commelinids","commensal","common","commonly","communicate","communication","comoro","compact","comparatively","compared","complete","complex","components","composed","composite","compound","compressed","comprised","comprising","compsopogonophyceae","concealed","conch","conches","conchifera","conconduct","conditions","conduct","conducting","cone","coneflowers","cones","coneweb","conical","conidium","conifer","conifers","coniocybales","conjugation","connect","connected","connection","connections","conopophagidae","considerably","considered","consist","consisting","consists","conspicuous","constricting","constriction","constrictions","consume","contain","containing","contains","contested","continents","continue","continuing","continuously","contributors","control","converted","convict","cool","coontails","coots","copulatory","coraciiformes","coraciimorphae","coral","corallimorpharia","corallimorpharians","corals","corcoracidae","cord","cordates","cords","core","coriander","corinnid","corinnidae","cormorants","cornaceae","cornales","cornea","corneal","corpse","corticiales","corticioid","corvidae","corvides","corvoidea","costal","cotingas","cotingidae","cotton","cotyledons","couas","coucals","count","counter","country","courtship","cover","covered","covering","covers","cow","cowbirds","cowries","cows","coxotrochanteral","coyotes","crab","crabs","cradles","crakes","cranberry","crane","cranes","cranial","cranium","crape","crawdad","crawlers","crayfish","create","creeper","creepers","creosote","crepuscular","crescentchests","crested","crests","crevices","cribellate","cribellum","crickets","cristae","critically","crocodiles","crocodilia","crocodilians","crombecs","cross","crossed","crossosomataceae","crossosomatales","crossveins","crown","crows","crumpled","crushed","crust","crustaceans","crypteroniaceae","cryptic","cryptically","cryptozoan","ctenophora","ctenophores","cubozoa","cuckoo","cuckoos","cuckooshrikes","cuculiformes","cucumbers","cucurbitaceae","cucurbitales","cultivated","cultures","cuon","cup","cupressaceae","cupressales","cupressus","cups","cupulate","cupules","curled","currawongs","curse","curve","curved","cusk","custard","cut","cutaneous","cuticle","cutlassfish","cuttlebone","cuttlefish","cyanide","cyanidiophyceae","cyanobacteria","cycadophyta","cycads","cyclamens","cycle","cycles","cylindrical","cymose","cynipoidea","cypress","cypriniformes","cyprinodontiformes","cyst","cysts","cytokinesis","dacrymycetes","daddies","daddy","daffodils","dagga","dahlias","daintree","daisies","damp","damselfiles","damselfishes","damselflies","dandelions","daphnes","dapple","dark","darker","darners","darters","dassies","dasyornithidae","dasyuromorphia","dates","day","dayflowers","daytime","dead","debris","decapoda","decapodiformes","decay","decaying","deciduous","decomposers","decrease","deep","deer","defense","defined","defining","definite","deform","degrade","degree","degrees","dehydrate","del","delphinida","delphinidae","delphinoidea","demersal","den","denisovans","denitrification","dense","density","denticulated","dentition","deposit","depositing","depressible","depth","derive","derived","dermal","dermaptera","dermatophytic","dermoptera","des","descend","descendants","descended","descendents","desert","designed","desmans","desmids","destroying","detect","determined","detritivores","detritophagous","detritus","deuterostomes","deuterostomia","develop","developed","developes","developing","development","developmental","develops","devil","devils","dhole","diagonally","diameter","diaphoretickes","diaprioidea","diapsida","diatoms","dicaeidae","dichromatic","dicotyledonous","dicruridae","didelphimorphia","die","diet","diets","different","differentiated","dig","digest","digestive","diggers","dikarya","dikaryons","dilleniaceae","dilleniales","diminished","dimorphic","dimorphism","dingoes","dinoflagellates","dinosauria","dioecious","dionycha","dioscoreales","diploid","diplopoda","dipnoi","dippers","diprotodontia","dipsacales","dipsacus","diptera","dirachmaceae","dirersified","disadvantage","discharge","discharged","discharging","discinaceae","discomycetes","disease","diseases","disinct","disk","disparate","dispersal","display","displays","disposal","distances","distensible","distichous","distinct","distinction","distinctive","distinctly","distinguished","distinguishing","distributed","distribution","diurnal","diverging","divers","diverse","diversified","diversity","divided","division","divisions","dna","do","dobsonflies","dodos","does","dog","dogbanes","dogfish","dogs","dogwood","dollars","dolphin","dolphins","domestic","domesticated","dominance","dominant","dominated","don","donacobiidae","donacobius","dories","dormant","dorsal","dorsolaterally","dothideomyceta","dothideomycetes","dottybacks","doucs","doughnut","dove","doves","down","downwards","drag","dragon","dragonet","dragonfish","dragonflies","dragons","draining","draw","dreamers","drills","drinking","dromedary","drongos","drumfishes","dry","dryadoideae","ducks","due","dug","dugong","dulidae","dulse","dung","dunnarts","durian","during","dust","duster","dwarf","dwellers","dwelling","each","eagles","ear","eared","earless","early","ears","earth","earthballs","earthfans","earthstars","earthworms","earwigflies","earwigs","easily","east","eastern","eat","eaters","eating","eats","ebony","eccentric","ecdysozoa","echidnas","echinodermata","echinorhiniformes","echolocate","ecological","ecologically","ecosystems","ectomycorrhizal","edge","edges","eel","eelpouts","eels","effused","egalitarian","egestion","egg","eggplants","eggs","eight","either","eithern","eject","ejectable","elaborate","elaborately","elachuridae","elaeagnaceae","elasmobranchii","elastic","elbowed","elder","elderberrie","elderflowers","elechura","electric","elegant","elementaves","elements","elephant","elephantfishes","elephants","elf","elfin","elk","ellipsoid","elliptical","elm","elms","elongate","elongated","elopiformes","elopomorpha","elusive","emberizidae","emberizoidea","embioptera","embryo","embryonic","embryophyta","embryos","emerge","emerges","emitting","employ","emu","emus","enable","enables","enabling","encased","enclosed","enclosing","encompasses","end","endangered","endemic","ending","endocytobiotic","endomycorrhizal","endoparasites","endoplasmic","endoskeletons","endosperm","endosternite","endostyle","ends","energy","engulfment","enlarged","enlivened","enormous","enough","entangle","entelegynae","enters","entire","entirely","entomophthoromycota","entorrhizomycota","enveloped","envenomation","environment","environments","eocene","eomarsupialia","ephemeroptera","epibenthic","epicentral","epigeous","epithelia","equal","equally","equatorial","era","erect","erectus","eresidae","ergot","ericaceae","ericales","erythrocebus","erythrocercidae","escalloniaceae","escalloniales","esociformes","especially","establish","estrildid","estrildidae","estuaries","ether","euarchontoglires","eucalyptus","eucalyptuses","eudicot","eudicots","eufungi","eukaryota","eukaryotes","eukaryotic","eulacestomidae","eulipotyphla","eumycota","euopisthobranchia","eupercaria","eupetida","eupetidae","euphausiacea","euphonias","euphyllophyta","eupleridae","euplerids","eurasia","eureptilia","europe","european","eurotiomycetes","eurylaimid","eurylaimidae","eurylaimides","eurypygiformes","eurypygimorphae","eusocial","eusociality","euteleostei","euthyneura","euungulata","evanioidea","even","evening","event","eventually","evergreen","every","evolutionary","evolved","evolving","example","excellent","except","exception","exceptionally","exchange","excluding","exclusively","excreted","excretion","excretory","exhibit","existence","exobasidiomycetes","exoskeleton","expanding","expectancy","expulsion","extant","extend","extended","extending","extends","extensive","exterior","external","extinct","extinction","extra","extracellular","extreme","extremely","extremity","extremophiles","extrude","eye","eyelid","eyelids","eyes","eyesight","fabaceae","fabales","fabids","face","faces","facial","facing","factors","fagaceae","fagales","fagus","fairly","fairy","falconiformes","falcons","falcunculidae","fallen","fallow","false","families","family","fan","fang","fangs","fangtooths","fans","fantails","far","fashion","fast","fastest","fat","fates","father","fatty","faunivorous","feather","feathered","feathers","feature","features","fed","feed","feeders","feeding","feeds","feelers","feet","felidae","felids","feliform","feliformia","felinae","felis","feloidea","female","females","fermentation","fermenters","ferments","ferns","fertile","fertilisation","fertilised","fertilized","ferulic","ferungulata","fetid","fetus","few","fewer","fibers","fibro","fibrous","fiddleneck","field","fields","fig","figbirds","figs","filament","filamentous","filaments","filefishes","fill","film","filter","filtering","fin","finally","finch","finches","finds","fine","finfoots","finger","fingerlike","fingers","finned","fins","fir","fire","firebrat","fireflies","firefly","fireweed","firmness","first","fish","fishes","fishflies","fishing","fission","five","fixation","fixed","flagella","flagellar","flagellate","flagellated","flagellates","flagellum","flags","flakes","flaky","flamingos","flaps","flask","flat","flatfish","flatheads","flattened","flatter","flatworms","flaxseed","fleabane","fleas","flesh","flexible","flexing","fliers","flies","flight","flightless","flippers","floats","floor","floors","floresiensis","florets","floricans","floridean","florideophyceae","flower","flowering","flowerlike","flowerpeckers","flowers","flufftails","flukes","fly","flycatchers","flyers","flying","flyingfishes","flytraps","focus","fold","folded","folding","folds","folivorous","followed","following","food","foods","foot","footed","for","forage","forager","forceps","forcibly","foregut","foremost","forest","forests","forewings","forget","form","formation","formations","formed","formicariidae","formicoidea","forming","forms","forth","forward","foul","found","four","fourth","fowl","fowls","fox","foxes","foxgloves","framework","frankincense","free","french","fresh","freshwater","frigatebirds","frilled","fringed","fringillidae","frog","frogfishes","frogmouths","frogs","from","front","frontal","frontmost","frugivorous","fruit","fruiting","fruits","fuchsia","fuchsias","full","fully","fulvettas","function","functional","fungi","fungivores","fungivorous","fungus","funnel","fur","furnariida","furnariidae","furnished","furrowing","fuse","fused","fusing","gadiformes","galagos","galangal","galaxiiformes","galean","galeomorphi","gall","galleries","galliformes","galloanserae","galls","game","gamefowl","gametangial","gametophyte","gametophytes","ganges","gannets","gape","garden","garliclike","garryaceae","garryales","gars","gas","gasteroid","gastric","gastrodermal","gastrointestinal","gastropoda","gastropods","gaviiformes","gazelles","geastrales","geckos","geese","geigertree","gekkos","gekkota","gelada","geladas","gelatinous","genera","general","generalist","generally","generations","genes","genetic","genetically","genets","geniculate","genital","genitalia","genitals","gentianaceae","gentianales","genus","geoffroy","geoglossaceae","geraniales","geranium","geraniums","germ","germination","gharial","ghost","ghostfish","giant","gibberfishes","gibbons","gill","gilled","gills","gim","ginger","gingers","ginkgophyta","ginkos","gins","ginseng","giraffes","giraffidae","gissus","give","gives","glaciers","gladiators","gland","glands","glass","glassfish","glaziellaceae","glitter","global","globe","globose","gloeophyllales","glomeromycota","glory","glossohyal","glowworms","glycerol","glycogen","gnaphosidae","gnatcatchers","gnateaters","gnathostomata","gnatwrens","gnetophyta","gnomefishes","go","goannas","goat","goatfishes","goats","goatsbeards","gobies","gobiiformes","goblin","goby","golden","golgi","gomphales","gomphotheres","gonad","gondwana","gonorynchiformes","gooseberries","goosefishes","goosefoots","gorilla","gorillas","gourd","grabbing","grackles","grade","gradually","grallariidae","grape","grapes","grasping","grassbirds","grasses","grasshoppers","grasstree","grate","gravel","gray","grazers","grazing","great","grebes","green","greenbrier","greenish","grey","greyish","grind","gripping","grisons","grooming","grosbeaks","gross","ground","group","grouped","groupers","grouping","groups","grouse","grow","growing","grows","growth","grublike","grubs","gruiformes","grunts","grylloblattodea","guanacos","guava","guavas","guenons","guinea","gulaman","gulls","gulper","gum","gunneraceae","gunnerales","gurnards","gut","guyalone","gymnophiona","gymnospermae","gymnotiformes","gymnures","gyrating","habilis","habitat","habitats","habits","had","haemocoel","haemolymph","hagfish","hagfishes","hair","hairless","hairlike","hairs","hairy","half","halfbeaks","halves","hammerhead","hammerkop","hamsters","handful","hangingflies","haploid","haplorhini","happy","hard","hardened","hares","harriers","harvesters","harvestmen","has","hat","hatched","hatching","have","having","hawkfishes","hawks","hazel","hazels","head","headed","heads","headshield","hearing","heart","heath","heather","heavy","hedgehogs","heidelbergensis","height","held","heleniums","heliotrope","hellebores","helmetshrikes","helminthiases","help","helvellaceae","hemiptera","hemisphere","hemlock","hemp","henna","hennas","herbaceous","herbivores","herbivorous","herbivors","herbs","here","hermaphrodites","hermaphroditic","hermatypic","herons","herpestidae","herrings","heterochromatin","heterodactyl","heterodonta","heterodontiformes","hexacorallia","hexanchiformes","hexapoda","hexapods","hibbertia","hibiscus","hickory","hidden","hide","hierarchy","high","higher","highland","highly","himalayas","hind","hindwings","hinge","hinged","hiodontiformes","hippopotamidae","hippopotamuses","hirundinidae","his","hispaniolan","histoire","history","hoatzin","hoest","hogs","holding","hole","holes","hollow","hollows","holly","hollyhocks","holocephali","holometabola","holozoa","hominidae","hominids","hominoidea","homo","honey","honeyeaters","honeyguides","honeysuckle","hood","hooded","hoofed","hooked","hooks","hoopoes","hooved","hooves","hop","hoppers","hops","horizontal","horn","hornbeam","hornbeams","hornbills","hornets","horns","hornwort","hornworts","horopito","horse","horseradish","horses","horseshoe","horsetails","host","hosts","hot","hound","houndsharks","house","houseleeks","howler","hox","huckleberry","huerteales","huge","human","humanity","humans","humid","hummingbirds","humpback","hunt","hunted","hunters","hunting","huntsman","hyacinth","hyaenas","hyaenidae","hyaline","hydnodontaceae","hydnoid","hydra","hydrocorals","hydroids","hydrostatic","hydrothermal","hydrozoa","hyenas","hylias","hyliidae","hyliotas","hyliotidae","hylobatidae","hylocitrea","hylocitreidae","hymenochaetales","hymenophores","hymenoptera","hyoid","hyperthermophilic","hyphae","hyphal","hypocoliidae","hypocolius","hypogeous","hyracoidea","hyraxes","hyssop","hysterangiales","iberian","ibises","icacinaceae","icacinales","ice","ichneumonoidea","iconic","icteridae","icteriidae","identified","idiosepiidae","ie","if","ifrit","ifritidae","ifrits","iguanas","iguania","immature","immune","impale","impatiens","imperfectly","implicated","important","improve","in","inc","incisors","inclined","include","includes","including","inclusive","incomplete","incubates","independently","indeterminate","indian","indigobirds","individual","individuals","indo","indochina","indomalaya","indomalayan","indonesia","induce","indus","infect","infected","inferior","inflate","inflorescence","inflorescences","information","infraorder","infrequently","ingest","ingesting","ingestion","inhabit","inhabiting","inhabits","iniidae","inioidea","initially","inject","injected","ink","inland","inner","inoperculate","insect","insecta","insectivores","insectivorous","insects","inserting","inside","instars","instead","instects","intelligence","intelligent","interior","interlock","intermediate","internal","intersected","interspersed","intertidal","interwoven","intestines","into","invertebrate","invertebrates","involve","inwardly","ioras","irenidae","iris","irish","ironwood","irpicoid","irregular","is","island","islands","isolated","isopoda","isopods","it","its","itself","ivies","ivy","jacamars","jacanas","jacarandas","jackal","jackals","jackdaws","jackfruit","jacks","jacob","jade","jaguars","jane","japanese","jasmine","javelinas","jaw","jawed","jawfishes","jawless","jaws","jays","jean","jellies","jelly","jellyfish","jellyfishes","jellynoses","jewel","jiggers","john","join","joined","joint","jointed","joints","jojoba","joshua","juglandaceae","jumpers","jumping","jumps","junction","jungle","junglefowl","juniper","juniperus","just","jute","k","kagu","kale","kangaroo","kangaroos","kapok","katsura","kava","keep","kelps","keratin","keratinized","kestrels","kickxellomycota","kidneys","kill","killer","killifishes","killing","kingfishers","kinglets","kinkajous","kipunji","kitefin","kites","kiwifruit","kiwis","knifefish","knifejaws","knotweeds","known","koala","koalas","kodkods","koels","kogiidae","komodo","kookaburras","korhaans","koster","krill","l","la","labial","laboulbeniales","laboulbeniomycetes","labriformes","labyrinth","lacewings","lack","lacking","lacks","lacy","ladder","ladybird","ladybugs","ladyfish","lagomorpha","lagomorphs","lagothrix","laid","lake","lakes","lamellibranch","lamiaceae","lamiales","lamiids","lamniformes","lampreys","lampridiformes","lancelets","land","landbirds","landfowl","landhoppers","landscapes","langur","langurs","laniidae","lantern","lanternbellies","lanternfish","lanterns","lapping","larch","large","largely","larger","largest","larix","larks","larva","larvae","larval","larviform","larynx","late","lateral","laterally","laterata","laterigrade","latitude","latitudes","laughingthrushes","laurales","laurasia","laurasiatheria","laurel","lavender","laver","lay","layer","layers","laying","layout","leading","leadwood","leaf","leafbirds","leaffishes","leaflike","leafy","least","leathery","leave","leaves","lecanoromycetes","leeches","leg","legged","legless","legs","legume","legumes","leiothrichidae","lemon","lemuriformes","lemuroidea","lemurs","length","lengths","lens","lensed","leopard","leopards","leopardus","leotiomyceta","leotiomycetes","lepidogalaxiiformes","lepidoptera","lepidosauria","lepidostromatales","lepisosteiformes","leptailurus","leptosomiformes","less","lettuces","lianas","lice","lichen","lichenized","lichens","lichinales","life","lifecycle","lifecyle","lifestyle","lifestyles","ligament","light","lighter","lightly","lignophytes","like","likely","lilac","lilacs","liliaceae","liliales","lilies","lilioid","lillies","lily","limb","limbed","limbless","limbs","limestone","limited","limpets","limpkin","line","lineage","lineages","lingonberry","lining","link","linsangs","lion","lionfish","lions","lipotidae","liquid","liquidambars","liquids","litter","little","live","livebearers","liverworts","lives","living","lizard","lizardfish","lizards","llamas","loach","lobe","lobed","lobes","lobose","lobsters","locomotion","locustellidae","locustelloidea","locusts","loeries","logrunners","long","longer","longest","longitudinally","longspurs","look","looks","loon","loons","loosely","loosestrife","loosestrifes","lophiiformes","lophocebus","lorchels","lorikeets","lorises","lorisids","lorisoidea","losing","lost","lot","lotus","louse","lovebugs","low","lower","lowered","lunch","lung","lungfish","lungfishes","lungs","lungwort","lupulella","lure","lutungs","lycalopex","lycaon","lychees","lycopodiophyta","lycopodiopsida","lycosidae","lynx","lynxs","lyrebirds","lysine","lythraceae","m","macaca","macadamia","macadamias","macaques","macaws","machaerirhynchidae","mackerel","macroscelidea","macroscopic","macrosphenidae","madagascar","made","magnolia","magnoliales","magnolias","magnoliid","magpies","mahogany","main","mainland","mainly","maintain","maize","major","majority","make","making","malabar","malacalcyonacea","malaconotidae","malaconotoidea","malacostraca","malagasy","malasseziomycetes","malaysia","male","males","malkohas","mallows","malpighia","malpighiales","maluridae","malvaceae","malvales","malvids","mammal","mammalia","mammalian","mammals","mammoths","man","manakins","manatees","manchineel","mandible","mandibles","mandibulata","mandrills","mane","maned","maneuvering","mangabeys","mangos","mangosteen","mangrove","mangroves","manipulate","manta","mantidflies","mantis","mantises","mantle","mantodea","mantophasmatodea","manuls","many","maples","marbled","marchant","marchantia","marchantiophyta","margays","margin","margins","marigold","marine","maritime","marjoram","markings","marmosets","marshes","marshy","marsupial","marsupialia","marsupials","martens","martins","mascarene","mass","massive","mastodons","match","material","materials","mating","matriarchs","matrix","mats","matter","mature","maturity","maui","maximize","maximum","may","maybug","mayflies","me","meadowlarks","meadowsweets","measures","meat","mechanical","mechanism","mecoptera","medial","median","medium","medusa","medusae","medusafish","meerkats","meet","megalodon","megaloptera","megaphylls","meiospores","melampittas","melampittidae","melanocharitidae","melanopareiidae","melastomataceae","meliphagidae","meliphagoidea","melons","members","membrane","membranes","membranous","menuridae","mephitidae","merous","merulioid","mesites","mesitornithiformes","mesocoracoid","mesozoic","metabolic","metabolism","metacarpals","metallic","metameric","metamorphosis","methanogens","metteniusaceae","metteniusales","mexico","mice","micro","microalga","microbiome","microbiotheria","microherbivores","microorganisms","microscopic","mid","middle","midges","migrations","migratory","mildews","milfoil","milk","milkfish","milkweeds","milkworts","millimetres","million","millipedes","mimic","mimicking","mimidae","mineralised","minerals","miniature","minke","minnow","mint","minute","miopithecus","mirandornithes","mirror","missing","mistletoes","mites","mitochondria","mitochondrial","mitotic","mitrosingus","mitrospingidae","mixture","mm","moas","mobile","mockingbirds","moderate","modern","modification","modified","modulatricidae","mohouidae","moist","mojarras","molds","molecular","moles","mollusca","molluscs","mollusk","molted","molting","moluscs","monarchidae","monarchs","money","mongoose","mongooses","monilielliomycetes","monitor","monitors","monitos","monk","monkey","monkeys","monkfishes","monocot","monocots","monodontidae","monogamous","monogomous","monoplacophora","monotremata","montane","monte","moon","mooneyes","moose","moraceae","morchellaceae","more","morels","moreton","morning","morphological","morphologically","morphology","mortierellomycota","moschidae","mosquitoes","moss","mosses","most","mostly","motacillidae","mother","motherwort","moths","motile","motion","motmots","mottled","moult","mountain","mountains","mouse","mousebird","mousebirds","mouth","mouthparts","mouths","movable","move","movement","movements","moving","much","mucoromyceta","mucoromycota","mucus","mud","mudbug","mudfishes","mudnesters","mudskippers","mugiliformes","mulberries","mulberry","mullets","multi","multicellular","multichambered","multicolored","multicrustacea","multiple","multiples","muntjac","murexes","muriquis","muscicapida","muscicapidae","muscicapoidea","muscle","muscles","muscular","musculature","mushrooms","musk","musophagiformes","mussels","must","mustard","mustelidae","mustelids","musteloidea","mutualistic","mycelial","mycelium","mycoparasites","mycorrhizal","mycorrhizas","myctophiformes","myelinated","mygalomorphae","myiobiuses","myliobatiformes","mynas","myocytes","myopsida","myriapoda","myricaceae","myrrh","myrtaceae","myrtales","myrtle","myrtles","mysticeti","myxini","nacreous","naked","naledi","name","named","nandiniidae","narrow","narwhals","nasalis","native","natural","naturally","nature","nautilida","nautilus","navigation","neanderthalensis","neanderthals","near","nearly","necessarily","neck","necked","necks","nectar","nectariniidae","nectars","nector","need","needlefishes","needles","neem","nematoda","nematodes","neoaves","neocallimastigomycota","neofelis","neognathae","neolecta","neolectomycetes","neoptera","neopterygii","neosittidae","neoteleostei","neotropical","neotropics","nephridia","neritimorpha","neritomorphs","nerve","nervous","nesospingidae","nest","nested","nesting","nests","net","nettle","nettles","neurons","neuroptera","neurotoxin","new","newly","newts","nicatoridae","nicators","niches","nictitating","night","nightjars","nightshades","nine","nitrogen","no","nocturnal","node","non","none","nonexistent","nonretractile","nori","normally","north","northern","nose","nosed","noses","nostrils","not","notacanthiformes","note","nothofagaceae","notiomystidae","notochord","notocord","notoptera","notoryctidae","notothens","nots","now","nuclei","nucleolus","nucleus","nudibranchs","nudipleura","numbats","number","numerous","nunbirds","nuptial","nurse","nursery","nurseryfishes","nut","nutcrackers","nuthatches","nutmeg","nuts","nyctereutes","nyctibiiformes","nymphaeales","nymphal","nymphs","o","oak","oaks","oarfish","objects","obligate","obligatorily","observed","obtain","occasional","occasionally","occupying","occur","occurring","ocean","oceanic","oceans","ocelli","ocelot","ocelots","octocorallia","octopoda","octopodiformes","octopus","octopuses","ocular","odd","odobenidae","odonata","odontoceti","odorant","odour","oegopsida","of","off","offensive","often","ogonori","oilbirds","okra","old","older","oldest","oleander","oleaster","olingos","olive","olives","olivillo","omnivores","omnivorous","on","onagraceae","once","oncillas","one","ones","onions","only","onto","onychorhynchidae","opah","open","opening","openings","operating","opercula","operculate","ophidiiformes","opiliones","opisthocomiformes","opisthosoma","opisthosomal","opossums","opportunistically","opposing","opposite","optimal","optimised","or","oraches","orange","orangutans","orb","orbiliomycetes","orcas","orchids","order","orders","orectolobiformes","oregano","oregon","oreoicidae","organ","organelles","organge","organic","organism","organisms","organs","orgrans","oriental","orientation","oriented","origin","originated","orinoco","orioles","oriolidae","orioloidea","ornamented","oropendolas","orthonychidae","orthonychides","orthoptera","oscillation","osmeriformes","osmo","ospreys","ossification","ossified","ostariophysi","osteichthyes","osteoglossiformes","osteoglossomorpha","ostiole","ostraciiform","ostriches","otariidae","oten","other","others","otidiformes","otidimorphae","otocephala","otocolobus","otocyon","otter","otters","out","outer","outside","outwards","oval","ovalentariae","ovary","ovenbirds","over","oviducts","ovipositor","ovotestis","ovules","owl","owlet","owls","own","oxalidaceae","oxalidales","oxpeckers","oxygen","oxygenated","oxyruncidae","oyans","oysterplant","oysters","pachycephalidae","pacific","pack","pad","padded","paddlefish","pads","paenungulata","painted","pair","paired","pairs","palaeognathae","palaeoheterodonta","pale","pallas","pallial","palm","palmchat","palmilla","palms","palp","palpal","palpimanoidea","palps","pampas","pamprodactyl","pan","pancrustacea","panda","pandan","pandanales","pandans","pandas","pangolins","panpulmonata","panthera","pantherinae","pantherine","pantropically","panuridae","papaya","paper","paperbarks","papillate","papio","papionini","papuan","parabiosis","paracanthopterygii","paracryphia","paracryphiales","paradisaeidae","paradise","paradoxornithidae","parahox","parahoxozoa","parakeets","parallel","paramythiidae","paraphyletic","parapodia","parasite","parasites","parasitic","parasitiformes","parasitism","parasitoid","parasitoida","parasitoids","parathyletic","paraxonic","pardalotes","pardalotidae","pardofelis","parenchymatous","parental","paridae","paroidea","parrotbills","parrotfishes","parrots","parsley","parsnips","part","particles","particular","particularly","partly","partners","partridges","parts","parulidae","passerellidae","passeri","passerida","passeridae","passerides","passeriformes","passerines","passionfruit","past","patas","patch","patellogastropoda","pathogenic","pathogens","pattern","patterns","paucituberculata","paulownias","pawpaw","paws","peaches","peacocks","pear","pearlfishes","pears","pecan","pecora","pectoral","peculiar","pedicel","pedinophyceae","pedipalp","pedipalps","peel","peg","pelagic","pelecaniformes","pelican","pelicans","pellorneidae","pelt","pen","penaeaceae","pencil","penduline","penguins","penicillium","peninsula","penis","pens","pentamerous","peonies","pepper","peppers","peptidoglycan","per","peramelemorphia","percentage","perch","perches","perching","perciformes","percomorpha","percopsiformes","perennial","perform","performed","perianth","perilla","periodically","periods","perissodactyla","perithecium","periwinkles","permanently","perpendicular","persian","persimmon","persistent","petals","petiolate","petiole","petrels","petroicida","petroicidae","petromyzontida","petrosaviales","petunias","peucedramidae","pezizaceae","pezizales","pezizomycetes","pezizomycotina","ph","phaenicophilidae","phaethontiformes","phagophiles","phalaropes","phallales","phallomycetidae","pharyngeal","pharynx","phasmatodea","pheasants","philepittidae","philippines","philodromid","philodromidae","phloem","phlox","phocidae","phocoenidae","phoenicopteriformes","pholidota","photosynthesis","photosynthesise","photosynthesize","phycobiliproteins","phycobionts","phycoerythrin","phycoma","phycoplast","phyla","phylloscopidae","phyllotaxy","phylogenetic","phylum","physeteridae","picathartidae","picea","piciformes","picramnia","picramniales","piercing","pig","pigeon","pigeons","pigfaces","pigments","pigs","pikas","pike","pileate","piliocolobus","pill","pilosa","pilot","pinaceae","pinales","pincer","pincers","pinching","pine","pineapples","pinecone","pinelike","pines","pink","pinnipedia","pinnipeds","pinophyta","pinopsida","pinus","pipefishes","piperaceae","piperales","pipipis","pipits","pipridae","piranhas","pirate","piscivores","pit","pitcher","pitchers","pitheciidae","pitheciinae","pittas","pittidae","pittosporums","pityriaseidae","placental","placentalia","placozoa","plane","planetree","planktonic","plant","plantae","plantain","plantains","plantes","plantigrade","plants","plasmodia","plastid","plastids","plata","platanistidae","plate","plates","platy","platygastroidea","platyhelminthes","platylophidae","platypus","platyrrhini","platysteiridae","pleated","plecoptera","plectreurid","pleurodonta","ploceidae","ploceoidea","ploughbill","plovers","plumage","plums","pneumocystidomycetes","pneumocystis","pneumonia","pnoepygidae","poales","pockets","podargiformes","podicipediformes","pods","poinsettia","point","pointed","poison","polar","pole","polecats","polination","polioptilidae","pollen","pollinators","poly","polymerases","polymixiiformes","polyneoptera","polynesia","polyp","polyplacophora","polypodiophyta","polyporales","polypores","polyps","polypteriformes","polysaccharides","pomatostomidae","pomegranate","pomegranates","pomfrets","pompiloidea","pond","ponds","pongo","pontoporiidae","ponyfishes","poor","poorly","poplars","poppies","population","porcupinefishes","porcupines","pore","pores","porgies","porifera","poroid","porphyridiophyceae","porpoises","portuguese","portulacas","posses","possess","possessing","possession","possibly","possums","post","postcerebral","posterior","posture","pot","potato","potatoes","potoos","potter","pottos","pouch","pouches","pouterias","powdery","powerful","practice","prairie","prasinodermophyta","prasinophytes","pratincoles","prawn","prawns","predation","predators","predatory","predominant","predominantly","preferred","preferring","premaxilla","premolars","presbytini","presbytis","presence","present","presocial","pressure","prettymouths","preuss","prevent","prey","preying","preys","pricklefishes","prickly","primarily","primary","primates","primitive","primrose","primroses","principally","prionailurus","prionodontidae","prior","pristiformes","pristiophoriformes","proboscidea","proboscis","procellariiformes","processed","procolobus","proctotrupoidea","proctotrupomorpha","procyonidae","produce","producers","produces","producing","production","products","projecting","projection","prolegs","promeropidae","prominent","prominently","pronghorns","pronounced","properly","proposed","propusion","prosoma","prosomal","prostrate","protacanthopterygii","proteaceae","proteales","protected","protection","protective","protein","protists","protobranchia","protocarnivorous","protostomia","protrude","protruding","protrusions","prunellidae","przevalski","pseudocoel","pseudofilamentous","pseudoplasmodia","pseudopods","pseudoscorpiones","pseudoscorpions","psittaciformes","psocodea","psophodidae","psyllium","pteriomorphia","pterocliformes","pteropods","pterygota","ptiliogonatidae","ptilonorhynchidae","pucciniomycotina","puerto","puffbacks","puffballs","puffbirds","pufferfishes","puffins","pump","pumpkins","pupa","pupal","pupfishes","pupils","purple","purr","put","pycnogonida","pycnonotidae","pygathrix","pygmy","pyrenoid","pyrenoids","pyrenomycetes","pyronemataceae","pōhutukawa","pōhutukawas","quadrupedal","quadrupedally","quail","quails","qualities","queensland","quetzals","quickly","quiescent","quinoa","quite","quolls","rabbitfishes","rabbits","raccoons","racoon","radial","radially","radials","radically","radiolarians","radish","radula","raft","ragfishes","ragworms","rail","rails","rain","rainbowfishes","raindrops","rainforest","rainforests","raised","rajiformes","ram","rambutans","ramshorn","range","ranges","ranging","ranking","ranunculaceae","ranunculales","rapeseed","raphides","raphidioptera","raposa","raptorial","raptors","rarely","raspberries","rat","rate","rates","rather","ratio","ratites","rats","ravens","ray","rayed","rays","reach","reaching","realm","rear","recedes","recent","receptors","recluse","reclusive","recognized","red","redback","redcurrants","reddish","reduced","redwood","reedfish","reedling","reeds","reef","reefs","refering","refers","reflecting","reflective","reflexed","regenerate","region","regions","regulated","regulidae","reindeer","related","relationships","relative","relatively","relatives","release","reluctantly","remain","remaining","remains","remizidae","remote","repeated","replace","representatives","represents","reproduce","reproduction","reproductive","reptiles","reptilia","requires","resemblance","resemble","resembles","resembling","resident","respiration","respiratory","rest","restrain","restricted","resulting","reticulation","reticulum","retract","retractable","retracted","retractile","retracting","retreat","retreats","return","rhagologidae","rhamnaceae","rhatany","rheas","rheiformes","rhinoceroses","rhinocryptidae","rhinopithecus","rhipidistia","rhipiduridae","rhizaria","rhizinaceae","rhizoids","rhodellophyceae","rhodinocichlidae","rhododendrons","rhodophyta","rhubarb","rhubarbs","rhynchocephalia","rib","ribbon","ribbonfish","rican","rice","ricefish","rich","ricinulei","ridges","right","rim","ring","rings","ringtails","river","rivers","rivulines","rna","roadrunners","roar","robins","rock","rockfowl","rocks","rodentia","rodents","roe","role","roller","rollers","roly","rooks","roost","root","roots","rosaceae","rosales","rose","rosemary","roses","rosids","rosoideae","rostra","rot","rotifers","rotters","rotting","rough","roughly","round","rounded","rounder","roundworms","row","rows","royal","rozellomycota","rta","rudimentary","rum","rumen","ruminant","ruminantia","ruminants","rumps","run","rungwecebus","runners","running","rush","rushes","russia","russian","russulales","rust","rusts","rusty","s","saber","sac","saccharomycotina","saclike","sacred","sacs","saddle","saddles","sage","sagittally","saharan","saimirinae","saint","sakis","salamanderfish","salamanders","saline","salmon","salmoniformes","salp","salpornithidae","salt","saltbushes","salticidae","saltwater","salvation","same","sand","sandalwood","sandalwoods","sandgrouse","sandhoppers","sandlances","sandperches","sandpipers","sandwiched","sandy","santalales","santalum","sap","sapayoa","sapayoidae","sapiens","sapindaceae","sapindales","sapodilla","sapote","saprobes","saprobic","saprobiontic","saprotrophic","saprotrophs","sar","sarcopterygii","sarcoscyphaceae","sarcosoma","sarcosomataceae","sardines","sassafras","satinbirds","sauria","sauropsida","savanna","savory","saw","sawfish","sawflies","sawsharks","saxifraga","saxifragales","saxifrages","scales","scallops","scaly","scandentia","scaphopoda","scarabs","scarlet","scats","scattered","scavengers","scavenging","schizosaccharomycetes","schools","scimitar","scincomorpha","scincus","scleractinia","scleralcyonacea","scoliid","scolioidea","scombriformes","scopula","scorpion","scorpiones","scorpionfish","scorpionfishes","scorpionflies","scorpionfly","scorpions","scotocercidae","screamers","screw","scrub","scrubbirds","scud","sculpins","scurry","scyphozoa","scyphozoans","sea","seabasses","seabed","seabirds","seacoasts","seadragon","seagrass","seahorses","seals","seamoths","search","searobins","seas","seasonal","seawater","seaweed","sebacinales","second","secondarily","secondary","secretarybirds","secrete","secreted","secretes","secretive","sedentary","sedge","sedges","sediment","see","seed","seedlings","seeds","seedsnipes","seem","seems","seen","segment","segmental","segmented","segments","sei","seize","selachii","seldom","semi","semiaquatic","semnopithecus","sengis","sense","sensory","sepals","separate","separated","sepiida","sepiolida","septa","septal","septate","septum","sequential","sequoia","sequoioideae","seriema","seriemas","series","serious","serpentes","serrated","servals","serve","serves","serving","sesame","sessile","set","setae","sets","seven","several","sex","sexes","sexual","sexually","shaded","shaggy","shags","shape","shaped","shapes","sharing","shark","sharks","sharp","sharpbill","sharply","she","shea","shearwaters","sheathbills","sheddable","sheep","sheet","sheild","shell","shellfish","shells","shelter","shelters","shelves","shews","shield","shoebills","shorebirds","short","shorter","shotgun","shoulders","show","shredders","shrew","shrews","shrikes","shriketits","shrimp","shrub","shrubs","shuffle","shy","siberian","sibling","side","sided","sides","sideways","sight","significant","silent","silk","silken","silks","silktassels","silky","siluriformes","silverfish","silversides","silvery","simias","simiiformes","similar","similarities","simple","simpler","simultaneously","since","single","sinking","siphon","siphonaptera","siphoning","siphonous","sirenia","sister","sittellas","sittidae","six","size","sized","skates","skeletons","skim","skimmers","skin","skinks","skuas","skull","skulls","skunk","skunks","skunkweeds","slater","sleeper","sleepers","slender","slickheads","slight","slightly","slime","slimeheads","slimy","slits","sloths","slow","slowworms","slugs","small","smaller","smallest","smell","smelling","smelt","smelts","smooth","smut","smuts","snails","snake","snakeflies","snakeheads","snakes","snapdragons","snappers","snipes","snout","snouts","snow","snowbank","snub","so","soapberry","soaring","sociable","social","sockets","soft","soil","soils","solanaceae","solanales","soldier","soldierfish","solenia","solenodons","solenogastres","solid","solifugae","solifuges","solitary","some","sometimes","somewhat","song","songbirds","songs","soon","sordariomyceta","sordariomycetes","sorrel","sounding","sounds","source","souring","soursop","south","southeast","southeastern","southern","southwestern","sowbug","spadefishes","spanish","sparassidae","sparrow","sparrowhawk","sparrows","special","specialised","specialize","specialized","specially","specicies","species","specifically","spectacled","spend","speothos","sperm","spermathecae","spermatophyta","spermatozoa","sphecoid","sphenisciformes","sphere","spherical","spider","spiders","spiderwort","spikefishes","spikes","spin","spinach","spindalidae","spindalises","spindle","spines","spinneret","spinnerets","spiny","spiral","spiralia","spireas","spirulida","splashing","split","splitting","sponges","spoonbills","sporangia","spores","sporocarps","sporophyte","spot","spotted","spread","springs","sprout","spruce","spun","squaliformes","squalomorphi","squamata","square","squash","squatiniformes","squid","squids","squirrel","squirrelfish","squirrels","squirt","squirts","staff","stag","stage","stages","stalk","stalked","stalking","stamen","stance","star","starch","starfish","starfruit","stargazers","starlings","stars","start","state","states","staurozoa","stay","steatornithiformes","steeplebushes","stegodonts","stem","stems","stenostiridae","stephanoidea","stereoptic","sterile","stick","sticklebacks","sticks","sticky","stiff","still","stilts","stinger","stingers","stingless","stingrays","stink","stinkbird","stinkhorns","stinky","stipe","stipitate","stitchbird","stocky","stomach","stomachs","stomatopoda","stomiati","stomiiformes","stoneflies","stoneworts","stony","storage","store","stork","storks","stout","straight","stramenopile","strand","strategies","strawberries","streaked","streamlined","streams","strengthened","strepsiptera","strepsirrhini","streptophyta","stretched","stricter","strictly","stridulation","strigiformes","string","striped","strisores","stroma","strong","strongest","strongly","structure","structures","struthioniformes","strutures","studies","stump","stumps","sturdy","sturgeon","sturnidae","style","stylephoriformes","stylonematophyceae","sub","subarctic","subcontinent","subcutaneous","suborbital","suboscines","subphylum","subpolar","subsocially","substance","substrate","substrates","subterranean","subtidal","subtropical","successful","such","suckers","sucking","suction","sugarbirds","sugarbushes","sugarcane","suidae","suina","sulfur","suliformes","sumatra","sun","sunbirds","sunbittern","sundews","sunfish","sunflowers","superasterids","supercontinent","superficially","superior","superorders","superrosids","supplement","supplemented","supported","supports","supraorbital","surface","surfgrass","surfperches","surgeonfishes","surilis","surrounded","survive","survived","sustained","swallow","swallowers","swallows","swamp","swampy","swans","swarms","swathing","sweet","sweetgums","swifts","swim","swimbladder","swimmers","swimming","swims","switched","sylviid","sylviida","sylviidae","sylvioidea","symbionts","symbioses","symbiosis","symbiotic","symmetric","symmetrical","symmetry","symphyta","synapsida","synbranchiformes","syndactyly","syngnathiformes","syngnathomorpharia","synspermia","synspermiata","synthesis","syrinx","system","systems","t","tadpole","tagmata","tail","tailed","tailless","tails","take","talapoins","tall","talons","tamarins","tamarisks","tanager","tanagers","tangle","tapaculos","tapered","tapering","tapetal","tapeworms","taphrinomycetes","taphrinomycotina","tapirs","tarantulas","tardigrades","taros","tarpons","tarsal","tarsi","tarsiers","tarsiidae","tasmanian","tautara","taxa","taxaceae","taxon","taxus","tayassuidae","tchagras","tea","teak","teasel","technically","teeth","teleomorphic","teleostei","teliosporic","telluraves","temperate","temperature","temperatures","ten","tend","tendons","tendril","tenpounders","tenrecs","tent","tentacle","tentacles","terfeziaceae","term","terminal","terminals","termite","termites","termitoidae","terns","terrapins","terrestrial","territories","terror","testicles","testudines","tetraodontiformes","tetrapoda","tetrapods","tetrapulmonata","tetras","texture","thalli","thallus","thamnophilidae","than","that","the","thecal","thecostraca","their","thelephorales","them","themselves","then","there","theropithecus","these","they","thick","thickened","thicker","thickset","thimble","thin","third","this","thomisidae","thoracic","thorax","thorny","those","though","thought","thousand","thousands","thrashers","thraupidae","thread","threadlike","three","thresher","thrips","throat","through","throughout","thrush","thrushes","tht","thumbs","thylakoids","thyme","thynnid","thynnoidea","thyroid","thysanoptera","tibia","tichodromidae","ticks","tickspiders","ticodendraceae","ticodendron","tide","tiger","tigers","tigrinas","till","timaliidae","time","times","tinamiformes","tinamous","tiny","tip","tiphioidea","tipped","tips","tissue","tissues","tit","titanoecidae","titis","tits","tityras","tityridae","to","toadfishes","toads","tobacco","todies","toe","toed","toenails","toes","together","tomatoes","tongue","tongued","tongues","tooth","toothcomb","toothed","top","toquilla","torpediniformes","torrentfish","tortoises","totipalmate","toucans","touch","toxicofera","tracheal","tracheophyta","trachichthyiformes","trachypithecus","tract","tracts","traditional","traditionally","tragulidae","traits","transfering","transferred","transform","transmitted","transparent","trap","trapdoor","travel","treated","trebouxiophyceae","trebouxiophytes","tree","treecreepers","treeless","treepies","trees","treeshrews","treeswifts","tremellomycetes","triangular","triceratops","trichoptera","triggerfishes","trigonaloidea","trimerous","triplespines","triploblastic","trochodendrales","trochodendron","troglodytidae","trogoniformes","trogons","trophic","tropical","tropicbird","tropicbirds","trout","true","truffle","truffles","truly","trumpet","trumpeters","trumpetfishes","trunks","tsuga","tuatara","tube","tubenoses","tuberaceae","tubes","tubeshoulders","tubular","tubule","tubulidentata","tufts","tulip","tulips","tunas","tunicata","turacos","turdidae","turkeys","turmeric","turn","turnip","turrids","turtles","turtleweed","tusk","tusks","twice","twigs","twilight","twining","twisted","two","type","types","typical","typically","tyranni","tyrannida","tyrannidae","tyrannides","tyrant","uakaris","ulmaceae","ulvophyceae","unable","unbranched","uncentralized","uncoiled","under","underdeveloped","underfur","undergo","underground","underneath","underside","undeveloped","undulations","uneven","ungulates","unicells","unicellular","uniflagellate","uniform","uniformly","uninucleate","uniperforate","unique","uniquely","united","unlike","unpigmented","unrelated","unripe","unsegmented","unspecialized","unstacked","until","untwisted","unusual","unusually","up","upon","upper","upright","upside","urban","urchins","urocynchramidae","urocyon","urodela","uropygi","ursidae","urticaceae","usa","use","used","uses","using","ustilaginomycetes","ustilaginomycotina","usual","usually","uterus","vacuole","vagina","vahliaceae","vahliales","valerian","valves","vampire","vampyromorphida","vangas","vangidae","varanus","variable","varied","varies","variety","various","variously","vary","varying","vascular","vegetable","vegetation","vegetative","veined","veins","velvet","velvety","venom","vents","venus","verbena","vertebrae","vertebral","vertebrata","vertebrates","vertibrates","vervet","very","vespoidea","vessel","vestigial","vetigastropoda","vetigastropods","via","vibrant","vibrating","vibrations","viburnum","vicuñas","viduidae","vine","vinegar","vinegaroons","vines","violet","violets","violin","viper","vireonidae","vireos","virginia","viridiplantae","visible","vision","vitales","vitis","viverridae","viverrids","viverroidea","vocal","vocalizations","vochysiaceae","vulpes","vulpini","vultures","w","wading","wagtails","waist","waists","waiting","walk","walking","wall","wallabies","wallcreeper","walled","walls","walnut","walruses","wandering","wapiti","war","warbler","warblers","warm","warmer","warthogs","warts","was","wasp","wasps","waste","water","waterbirds","waterfowl","watermelons","waters","wattle","wattlebirds","waxwings","way","weak","weakly","weasels","weather","weaver","weavers","web","webbed","webbing","webbings","weberian","webs","webspinners","weevils","weight","well","wentletraps","were","west","western","whale","whalefishes","whales","wheel","whelks","when","where","which","while","whip","whipbirds","whiplash","whiplike","whippomorpha","whisk","whiskers","whistlers","white","whitehead","whiteheads","whitish","whorled","whydahs","wide","widely","wider","widespread","widest","widow","wild","wildcats","wildlife","will","willowherbs","willows","wind","wing","winged","wingless","wings","winter","wireworms","wise","witch","witches","with","within","without","wolf","wolverines","wolves","wombats","wood","woodcreepers","wooded","woodiness","woodlands","woodlouse","woodpecker","woodpeckers","woodswallows","woody","woolly","worker","world","worldwide","worm","worms","wort","wounds","wrasses","wreckfishes","wren","wrens","wrenthrush","wrinkled","x","xenarthra","xiphosura","xylem","yabbies","yams","yangtze","yarrow","years","yeast","yeasts","yellow","yellowheads","yellowjackets","yew","ylang","young","zealand","zebra","zebras","zeiformes","zeledoniidae","zelkovas","zero","zingiberales","zinnias","ziphiidae","zoantharia","zoanthids","zodariidae","zombie","zone","zones","zoopagomyceta","zoopagomycota","zoospores","zoraptera","zosteropidae","zygentoma","zygodactyl","zygodactylous","zygomorph","zygomycete","zygomycota","zygophyllaceae","zygophyllales","zygospores"],"word_entries":[[18,31,61,59,605],[49],[110],[60,1,49,1,12,102,676,24],[49,74],[681],[890],[110],[295,305],[60,106,3,3,123,1,478,193],[890],[248,352],[123,9,164,522,83],[890],[624],[624],[123,46,3,602,44],[392],[607],[818,72,11],[18],[774],[110,59,3],[631],[61,105,3,3,795],[619],[43,292],[0,2,5,1,7,1,3,1,1,2,1,1,1,1,1,3,6,7,1,1,2,3,1,1,1,1,2,2,1,1,1,1,2,7,1,1,1,1,1,1,1,1,15,7,1,1,1,3,1,3,5,1,2,1,4,1,1,1,1,1,3,1,1,1,1,1,13,2,9,1,1,1,1,1,1,1,2,1,1,1,4,2,1,2,1,2,2,1,1,1,1,2,1,1,1,6,22,3,9,3,8,8,20,6,6,4,2,1,1,5,1,2,30,9,3,2,3,1,1,4,14,1,2,1,1,2,4,1,2,23,142,8,4,5,4,7,5,9,4,4,19,1,1,1,2,1,2,1,1,8,2,1,2,3,1,1,5,2,1,1,5,1,2,1,4,8,1,6,1,3,10,20,7,1,1,3,2,21,3,2,1,1,1,1,1,3,6,1,1,1,3,2,1,2,1,3,7,2,9,1,1,3,2,1,4,5,2,1,1,1,2,1,1,1,2,7,2,3,1,3,20,2,1,3,2,1,1,1,1,1,1,1,1,4,2,9,16,1,2,6,3,3,1,5,6,3,1,2,3,2,5,1,3,3,6,2,1,2,1,1,3,1,12,1,2,2],[571,5],[95,8,1,2,2,8,1,4,6,1,3,7,24,7,389],[107],[794],[4,3,106,214,55,403,165],[8,22,139,11,749],[18,42,105,227],[123],[774],[780],[30],[384],[417],[260],[268],[294],[161],[855],[898],[537],[751],[371],[114],[901],[774,54],[1],[1],[628],[224],[23],[820],[112],[480],[480],[317],[293],[116],[917],[34],[201],[171],[186,730],[295],[138],[151],[47],[345],[347],[118,4,4,2,4,1,37,164,3,1,16,10,1,5,250,71,65],[196],[78],[381],[276],[67],[182],[62,215],[248],[31,49,32,13,2,3,61],[20,10,76,1,5,4,6,4,2,1,1,1,2,2,1,2,57],[135],[489],[486],[441],[356],[361],[135],[892],[124,193,9,47,63,135,5,1,1,18,2,1,1,1,3,2,11,3,2,1,5,3,5,1,46,1,2,1,2,2,1,2,2,1,195,6,3],[389,88,95,24,2,25,8,5,9,210,24],[369],[578],[571],[115,6,437,22,179,34,148],[317],[315],[953],[936],[952],[934],[931,5,10,2],[827],[228],[18],[718],[187],[193],[392,208,7],[615],[46,57,66,178],[366],[240],[476],[347,14,2],[234],[350],[890],[128],[847,44],[239],[269],[10,3,738,2,1,2,30,1],[67,42,185,459,3,18,1,1,1,1,1,2,2,1,130],[130,650],[821],[819],[882],[15,2,15,83,1,21,14,11,22,3,1,1,13,93,7,4,1,7,5,12,4,32,3,8,229,58,26,37,78,14,13,86,17,22,7,18,3],[729,1],[730],[96,2,15,181,17,28,10,44,32,3,59,4,34,21,8,258],[322],[735],[717],[292,116],[855],[898],[846,62],[15,10,82,69,184,216,379,28],[827],[350,430],[705],[704],[649],[54,72,35,3,6,19,36,129,383,22,46,44,49,48],[4],[860,30,6],[44],[55,682],[177],[379],[12],[167,613,150],[893],[865],[821],[919],[677],[643],[188],[806],[119,67,109],[164],[327,1,20,5,1,8,30,170,58,4,15,1,2,36,36,184,3],[548,72,18,3,34,139],[604,2,2,6,2,1,3,4,63,2,1],[227],[301],[922],[4],[4],[57,10,1,119,530],[718],[3],[737],[297],[300],[662],[87],[908],[955],[951],[18,1,8,1,3,13,51,24,7,5,2,33,6,17,23,28,8,28,19,6,27,3,3,11,41,185,8,6,2,1,30,25,83,30,7,5,10,28,1,1,3,3,1,1,4,1,2,11,1,36,3,16,6,21,12,53],[805],[280],[916],[31,181,13,19,16],[999],[959],[105,201,1,16],[580,6],[238],[0,1,1,2,3,1,7,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,11,1,1,1,8,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,1,15,2,6,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,16,5,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,4,1,1,1,1,1,1,1,1,4,2,1,1,2,1,22,3,4,8,4,4,5,3,4,16,12,6,1,1,5,1,1,3,1,1,6,1,2,2,4,3,1,2,2,3,1,1,1,1,2,2,1,1,3,2,1,1,1,1,1,1,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,10,15,28,2,49,4,63,14,4,3,1,1,1,4,1,1,4,1,1,2,4,1,1,1,2,1,1,1,2,2,2,1,1,1,1,1,2,2,1,1,1,1,1,2,1,1,1,1,1,2,1,5,8,2,3,1,1,1,1,5,1,2,1,4,5,3,1,3,2,1,1,1,1,2,1,1,1,1,1,1,2,17,1,1,1,1,1,1,3,2,1,2,2,2,5,1,1,12,2,3,2,1,1,1,1,1,3,2,1,4,1,3,2,1,1,4,2,6,1,13,1,2,1,1,1,1,2,1,1,3,3,2,3,1,1,1,1,1,25,1,11,8,11,2,4,2,1,2,13,3,1,1,1,2,1,1,3,1,1,2,3,1,1,1,1,1,3,1,1,2,1,1,3,2,1,3,1,1,3,1,1,1,1,1,3,2,1,2,1,1,1,1,3,1,1,1,1,2,4,5,1,1,2],[624],[37],[288],[19,13,2,8],[33],[118,54],[294],[73,880],[216],[773,32,4,6],[295],[295],[236],[314],[314],[366],[17,9,110,25,204,263,24,283],[8],[7,1,7,3,146,28,56,102,245,10,44,272,1,5,33],[346],[808],[24],[807,41],[24],[93],[15,8,89],[334],[179,2,3,813],[370],[562],[393,3],[568,2,14],[588,66,6],[118],[95,12,6,1,2,4,1,1,5,1,2,28,30,1],[78,106,1,1,1,73,35],[760],[160],[32],[657],[35],[126],[397],[133,5,20,21,6,391,8,369],[399],[298],[20,1,8],[54,568,291],[714],[184],[44],[594,98,1,1,1,1,2],[110],[914],[110],[874],[874],[138],[351,6],[159],[982,8],[975],[2,238,679],[128],[0,99,797],[102,24,1,10,753],[162],[28,67,4,3,554],[202],[814,4,28,62],[184],[619],[846,62],[329],[19,56,31,1,3,6,14,204,2,2,29,207,56,32,2,68,75,10,4,13],[870],[870],[102],[26,2,71,67,1],[925],[677],[169],[175],[175],[172],[171],[166,206,1,5,218,7,92,20,3,14],[831],[1],[103],[103],[319],[362,250,69],[607],[1,3,3,1,7,1,2,1,1,3,1,3,1,2,7,6,1,1,4,3,5,3,3,2,2,5,2,1,1,1,1,1,1,17,1,5,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,20,2,1,2,1,1,1,1,2,1,2,1,3,1,2,1,3,1,2,1,1,1,2,4,3,4,23,3,1,3,12,4,28,6,6,7,1,30,9,3,2,2,4,3,1,1,1,1,1,2,7,10,6,1,1,1,3,165,18,7,1,1,5,5,1,15,5,11,11,19,3,4,9,4,12,9,1,2,3,1,17,1,2,1,10,4,5,1,18,2,3,3,10,6,1,4,2,8,31,22,6,32,6,4,3,2,14,1,4,7,2,1,1,4,2,1,1,3,1,4,1,1,2,2,1,1,1,2,1,2,5,1,6,2,1,1,2,1,2,3,6,1,1,3,1],[723,7],[829],[868],[249],[7],[568,1],[172],[293],[53,2,3,5,2],[812,1,1],[54,56,182,3,58,384],[185,540,12,245],[375,3,409,109],[756],[821],[831],[438],[992],[188,735],[28],[123,6,9,25,1,5,1,17,809,1],[871],[198,4],[650],[588],[4,16,6,3,30,16,31,1,3,8,4,6,4,6,25,1,6,11,7,1,23,17,27,39,38,30,8,179,180,21,5,4,1,20,24,3,33,58,18,2,3,22,4,48],[985,8,4,4],[973],[965,2,16,15],[981],[933,32],[988],[980],[982,19,1],[986,12],[965],[933],[933,50,14],[933],[925],[19,11],[879],[438,161,2,18,1,3,2,1,2,1,1,1,4,37,11,1,2,1,1,1,2,1,1,199,6],[626],[284,318,1],[387],[827],[827],[892],[850],[110,62,1],[867],[383,536],[587],[79,93],[962,34],[832,92],[756],[871],[871],[866],[301],[784],[16,95],[68],[18,3,6,3,1,28,51,6,14,47,4,3,2,3,71,16,58,22,23,224,62,16,33,11,188,16,25,31],[816],[257],[707],[703],[706],[643],[957],[287],[611,67],[410],[62,17,714,1],[102,89,91,13,662,19],[44],[244,704],[189],[184],[944],[240],[350],[258],[939],[355,1],[330,84,3,4,141],[379,1],[436,2,454,6],[170,241,25,2,13,9],[431],[698],[698],[808],[413],[314],[759],[324],[810,3],[198],[21,76,247],[33],[170],[299],[868],[466],[383,38,2,73,2,2],[684,2],[651],[498],[691,37,8,5],[108,2,26,31,14,114,49,34,4,190],[369,268],[103,523,99],[178],[0],[649],[614,3],[280],[610],[250],[998],[930,3],[666],[668],[665],[879],[858],[40,790],[831],[294],[592],[558,4,2],[295],[779],[293],[377],[834],[590],[858],[253],[833],[378],[367,371],[109,9,11,51,5,3,549,75,84,2],[91],[184],[52,85,214,29,373,28,6,18,14,180],[225],[107,3,844],[19],[931],[920],[939,19],[931],[935],[931],[951],[879],[643],[677],[210],[294],[288,5],[858],[110,535],[295],[64],[218],[273],[579,1,2],[443],[89,537,184,3,42,43],[888],[7,16,48,37,2,17,3,2,6,24,1,14,83,28,56,27,247,58,39,119,37,50,3,5,1,9,3,1,12],[59],[118],[121],[53,7,50,272],[673],[131],[337,14,25],[850,2],[7,44,129,378,30,20,165,158],[475],[267],[656],[578,265],[585,20,2,1,389],[592],[404],[110,609],[21,84,680,156],[225],[942],[30,80],[377,502],[847,39,1],[847,39,1],[953],[108,609],[133,5,21,1],[136,594],[865],[21,8,38,32,472],[179,539],[662],[172],[295,7,3],[16,45,53,2,45,11,13,1,1,117,570],[7,98,463,32],[431],[285],[679,2],[75,115],[130],[863],[482],[373],[439],[457],[432],[269],[269],[182,180],[98],[187,792],[132,169],[891],[16,45,48,12,2,4,11,24,23,4,36,69,73,201,79,127],[131],[796],[223],[766],[763],[294],[619],[20,33,15],[20,4,3,3],[20],[23],[564],[334,21,16],[358],[281],[340,514],[187],[67],[759],[56,8],[698],[855,36],[847,44],[348,26,12,346,99,122],[132,38,133,2,1,13,4,1,1,1,1,1,1,1,1,2,2,1,1,3,1,1,1,1,1,1,3,1,1,4,1,1,3,5,2,3,1,1,1,2,1,1,1,2,1,1,1,25,42,180],[379,179],[811],[660],[122],[857],[367],[851],[993],[25,54],[75],[35,515,58,14,5,4,6,10,68,1,1,3,90,1,16,2,108,26,8,4],[291],[846],[127],[550],[841],[74,124,42,16,718],[856],[200],[879],[787],[62],[918],[918],[8,21],[120],[979],[947],[288],[288],[283],[121],[18],[109,23,450,67],[109],[110],[665],[39,2,270,357,107,1,1],[868],[530],[46],[275],[4,284],[294],[437],[627],[550],[61],[23,34,61,3,8,198,6,7,1],[15,1,8,51,28,12,4,9,1,2,1,2,2,108,32,12,8,46,266,54,125,148,2,2,2,14,1,1,1,7,8,3,9],[18,1,1,3,2,3,25,1,41,2,1,31,2,3,28,4,3,1,4,120,2,77,195,54,6,36,96,21,161,2,36,17],[859],[954],[931,23],[677],[504],[502],[1,362],[248,370,70],[234],[240,416],[694,3],[200,1,75,345],[231],[347,14,5],[109,57,2,19],[882],[882],[882],[579],[135],[886,37],[759],[19,4,4,47,47,8,2,33,9,14,108,331,127,34,183,31],[898],[680],[295,370,16],[440],[865],[2,14],[660],[654],[383,29],[227],[666],[45,791],[296],[827],[708],[930,1,5,3],[831],[116],[698],[215],[1,54,569,170,24],[127,660,138,3],[355,12,16,618],[810],[92],[859],[859],[176,692],[927],[905],[136],[551],[8],[245],[25,144,18,3,111],[362],[930,3],[376,1,599,2],[899],[24,83,529],[415],[442],[353],[103],[30],[951],[756],[162,822],[388,1],[859],[830],[76],[276,70],[1001],[272],[10,3,159,201,235,18,69,31,224,25,1,3],[873],[873],[859],[758],[929],[761],[984],[73],[64,1],[376],[906],[865],[18,947,33,2],[382],[29,173,171,355],[622],[660],[86],[882],[89,21],[37,148],[177],[16,21,139,7],[28,173,427],[174],[494],[119],[829],[208],[160],[791],[543,1],[931],[60,196],[513],[80],[288,288],[584,45],[944],[75],[440,51,148,45,2,166],[879],[647],[436],[489],[343,2],[16,11,3,3,11,27,6,33,2,3,1,6,1,3,2,23,11,5,14,4,1,2,1,2,3,109,32,14,20,188,25,6,23,10,28,3,3,1,13,22,7,71,5,9,13,100,22,2,9,1,14,2,3,6,46],[436,2],[818,15],[73,35,26],[879],[294],[939],[836],[836],[4,14,1,1,4,2,3,8,2,14,22,20,18,20,1,4,20,11,3,10,2,6,5,6,1,10,64,25,28,11,25,185,42,26,4,12,27,23,34,20,13,7,1,5,2,11,1,1,8,23,3,15,71,22,12,9,8,15,11,6,15,1,2,3],[79],[123,651],[859],[818],[858],[550],[616],[865],[130],[297,3],[70],[301],[322],[37],[543],[928],[69,6],[28],[806],[292],[462],[23,1,4,9,2,5,51,41,1,62,151,306,97,30,12,135,1,59],[701],[713],[978],[852,3],[813],[389],[552],[896],[766],[102,62],[649],[868],[583,3,2,61],[162,34],[114],[276,77,2],[869],[424],[1,7,8,3,4,19,11,4,3,42,8,13,39,1,6,1,6,13,71,17,18,49,22,5,207,40,1,2,70,37,2,194,31,8],[677],[812],[812],[635,4,3,1],[606],[605],[633],[636,1,3,6,3],[632,1,5,3,3],[632],[634],[902],[846],[119],[127],[937],[52,903,6],[187,57,96,242,334],[836],[852,7],[352],[951,32],[111],[901],[128,42,14],[19,346],[690,20,1],[623],[623],[381],[281],[278],[783],[972],[28],[211],[831],[76,469],[277],[545],[277],[380],[659],[40,825],[865],[849],[585,34],[124,40,419],[107,21,61,247,152,15,4,1,1,55,215,87],[242],[773],[172,49],[209],[167],[95],[123,12,30],[874],[874],[567,192,1],[248],[197,1],[865],[865],[130,6],[839],[861],[677],[850],[325,5],[121],[850],[330],[892],[595,24,1,2,3,1,1,1,1,2],[119],[131,834],[134],[245],[1001],[879],[626],[579,1,3,2,10,7,2,15,4,1,1,1,3,1,1,332],[211],[579,1,3,3,2,66,6],[599,2],[225,28],[49],[859],[4,23,936,32],[1003],[105,67,448],[123,40,25,166,228],[787],[374,3],[15,8,2,3,42,306],[710],[711],[587],[795],[795],[851],[851],[874],[1,4,2,7,4,3,151,603,3,2,7,41,85,2,2],[172],[0,784,1],[2,6,7,1,2,1,630,102,2,6,1,15,6,139,1,10,51],[1,782],[14,573,1],[571],[53,83],[26,2,68,1,1],[78,86,163,26,246,2,23,5,10,3,72,187],[291],[778],[751,168],[190],[53],[102,60,7,20],[958],[140],[817],[95,21,7,1],[738],[691],[728],[729],[731],[642],[638],[42],[520],[517],[659],[664],[667],[653],[491],[491],[465],[240],[145],[802],[317],[655],[649,3,2,1,1],[588],[315,2],[57,3,631],[228],[930,1,6,15],[243],[20,6,108,68,416,4,144,11,122],[118,49,460],[1001],[620,152],[29,24,129,2,11,17,117,263,69,23,54,13,13,15,31,3,120,9,8,32,15],[350],[718],[756],[164],[551,1],[511],[691,37],[604,24],[163,1,5,1,1,2],[99],[179],[1],[814],[908],[847,14,26],[188],[112,2,4,10,3,2,3],[472],[333],[348],[102],[878],[97],[199],[694,3],[615,61],[631],[582],[5,23,67,822],[913],[48],[925],[815],[733],[783],[786],[754,27],[782],[782],[777],[751,25,11],[529],[7],[7],[7],[197],[31],[190],[977],[453],[859],[0],[624],[871],[152],[640],[291],[162],[155],[917],[917,1],[110],[283],[283],[365],[855],[977],[15],[18],[510],[423],[569],[810,3],[0],[16],[28],[16,7,3,2],[295],[91],[919],[478],[478],[861],[596],[598,2],[71,1,1,105,25,101,31,8,4,11,3,7,1,3,7,192,12,170,5],[75,1,2],[121,76,2,104,458,2,21,205],[986],[347],[936,1,9,1,9],[182,166,260,13,7],[718],[166],[568],[350],[21,1,4,3],[411],[164],[182],[826],[288],[865],[787],[37,239],[773,14],[37,149],[314],[7,690],[619],[855],[898],[288],[127,636,168,11,1,1,7,16],[183],[763],[65],[107],[761],[238],[791],[49,12,49,13,172,1,594,77],[458],[19,13],[46],[727],[678,99,3],[780],[622,6],[944],[288],[616],[175],[850],[382],[25,50,1],[120,1],[125,41],[266],[202],[29],[24],[21],[927],[881],[54,16,64],[123,43,499,115],[123],[136],[373],[190],[16],[130],[918],[715],[716],[691,24,1,1,1,1,1],[7,32,7,731,8],[158,196],[121],[187,363,18,79,79,25,24,1,1,190],[626,93],[177],[831],[134],[57,3,631,251],[351,387,161],[72,272,33],[738],[589,4],[340],[339],[130,62,2,101],[15,160],[718],[684],[894],[43],[882],[832],[828],[0],[63,42,72,129,1,16,38,426,49,69,22],[23,21,15,8,69,1,658],[124],[244],[374],[342],[634],[45,263],[20,105,796],[16,41,111,6,127,107,307,220],[168],[18,7,1,22,739,144,18,33],[871],[95,12,28,782],[75,213,6,2],[848],[984],[776],[111],[47],[66],[51],[762],[56,700],[762],[813],[67,3],[871],[768,1,24,1],[172],[80,105],[973],[976],[771,1,19,2,1,147],[990],[921],[1,239],[39,94,123,421],[162],[780],[395],[381],[7],[15,1,943],[75,105],[636,82,12],[831,104,4],[301],[109],[24],[8,113,5],[5,9,704,56,1,41,104],[335,23,3,7,1,10,427,22,58],[69,1,25,44,3,152,49,277,2,3,1,3,1,5,5,1,1,1,2,166,123,31,13],[304],[607],[948],[813],[23,549,20],[30],[60],[102],[283],[364],[817],[349],[174],[377],[372],[943,10],[36],[36],[19,13,1,2,1,1,2,1,1,5,248],[451],[31,159],[191],[71],[361,7,99,315,27,28],[874],[185],[185],[366],[867],[867],[54],[64,1],[850],[949],[936,1,2,7,1,1,1,8],[453],[422],[445],[301],[403],[403],[858],[818],[346],[346],[169],[787],[342],[124,225],[134],[245,375,75,86],[54,10,1,55],[163],[213],[550],[70],[571,1,2],[168],[606,28],[180,1,5,2,454],[26,2,32,24,5,10,2],[48],[349],[868],[349],[335,12,2],[656],[192,6,14],[855,41],[89],[122,1],[89],[121,213],[843],[521],[852],[352],[394],[379,76,14,270],[739],[124,5,159,341],[177],[172],[113],[4],[727],[308,11,3],[322],[306,13],[477],[110,61],[68],[856],[856],[126,2],[335,23,3,7,1,10],[383,70],[896],[189],[945,12,19],[82],[895],[719],[351],[165],[15],[15],[45],[374],[343,3],[424],[346],[30,818],[848],[848],[848],[928],[635],[865,68,32,3,2,4,1,2,1,1,1,9],[798],[797],[800],[979],[983],[886],[955],[436,2],[855],[167],[80,106,185,5,6],[272],[814],[137],[245],[26,1,1],[275],[60,1],[25,28,7,1],[718],[774],[929],[769],[769],[868],[44,715,1],[780],[113,1,20,35,816],[860],[143],[800,2],[242],[286],[781],[1003],[787],[958],[172],[162,10],[816],[879],[871],[892],[871],[761],[107],[288],[107],[818],[858],[525],[118,59,562,228,8,1],[626],[107],[290,76],[573],[415],[565],[816],[117,67,169,2],[832],[179],[123,8,656,146,6,9,25,24],[109,21,6],[89],[58],[950],[121,10,4,810,28],[886],[5,912,7],[260],[46,6,4,3,5,14,136,1,20,60],[579,1,3,3,2,66,1,4,2],[244,52],[181],[151],[915],[57],[948],[172],[619],[103],[561],[674],[680],[679],[282],[603],[698,1,50],[1],[629,33,99],[717],[60],[634],[78,51,6],[37],[295],[30],[16],[350,409],[30],[117],[965],[593],[759],[562],[306,1],[568,18],[323],[972,13],[135],[581],[756],[953],[113,131],[718],[161],[121],[104,5],[29],[29],[112,9,8,6],[45,88,1,2,51,165,282,21,36],[927],[1003],[8,12,1,1,7,83,13,442,421],[125],[29,272],[222,95,660],[562,3],[635],[171],[18,166],[9],[146],[304,1],[10,3,901],[527],[374],[871,21],[447],[560],[115,8],[180,484,51,3,12,2,5],[608,120,9],[18,84,8,537,271],[28],[80],[587,1],[16,4,3,4,68,253],[568],[919,11],[930],[839],[839],[301],[295,640,66],[693,33],[606],[10,2],[323],[769,121],[182],[824],[121],[98],[204],[510],[566],[875],[875],[135],[903],[578],[105],[189],[997],[57],[982],[968,27],[4,959],[995],[983],[166],[999],[125,437,337,97],[29,727],[349],[57],[363],[367],[831],[375],[568],[125,33,770],[892],[634,194],[110,3],[19,367,210,122,174],[183,597,158],[371,1,9,347,2,2],[815],[277,85],[46,115,4,127,16,75,334,64,145,38,20],[372],[957],[78],[759,2,2,9,6],[29],[0,999],[0,16,10,80,9,1,10,2,2,166,392,96,131,83],[128],[340],[127],[605,27],[881],[214],[579,1,3,2,7,13,1,28,2,3,4,3],[867],[30],[678],[588,74,2,8,2,1,1,1,1,1,1],[631],[327,6],[718],[737,22,1],[758,4],[693,75,217],[483],[483],[264],[781],[31,31,18,110,35,35,35],[120],[987],[988],[288],[724],[976],[867],[340],[43,93,34,14,609],[80],[260],[317,510],[288],[254],[107],[314],[681],[334],[295],[736],[133,207],[649],[447],[294],[118,46,523,252],[910],[332,2],[186],[375],[574],[503],[780],[135,30,788],[565],[858],[8,12,1,1,7,2,86,7,6,40,138,45,2,37,292,7],[161,4],[24],[670],[105,190],[164,8,155,15,3,1,257],[24,13,2,6,121,23,113,46,244,60],[371],[237,374,328,43],[611,32,2],[610],[1,20,737,5,5,47,164],[608,14,5,2,5,80],[0,347,23,560,1,36,35],[954],[947],[941],[24],[131],[117],[103,55],[599,2],[615,10,5,262],[18,42,20,48,8,52,162,4,1,12,215,136],[344,33],[86,77,3,6,8,9,188,208,57],[596],[868],[778],[26],[557],[30],[215],[354],[5,952],[984],[14],[947,6,31],[128,132],[123,832],[194,50],[290],[194,41,1,8,28,7],[939,16],[717],[23],[4,121,49,767,3,58],[878],[74,47,8,4,1,1,2,139,1,5,43,51,181,175],[39,9,7,2,1,44,64,1,2,16,3,593],[114,9,49,205,567,11,41],[135],[933],[19],[277,72],[944],[509],[904],[198],[618,2],[158],[811],[875],[875],[509],[219,25],[345],[347],[347,488],[571,6,33],[231],[571,1,3],[970],[968,15],[659],[983],[649],[911],[846,65],[163,168],[27,76,4,12,7,2,3,5,108,32,12,71,401,222],[233],[232],[345,298],[544],[541],[115],[21,280],[8,8,4,1,1,7,272,515],[756,1],[20,6,795],[106,790],[174],[59],[170],[330],[325],[125,48,445,2],[108],[182],[768],[75,50],[773],[1003],[80,851],[727],[341,301,1,84],[167],[929],[929],[127],[2,749],[30],[834],[168],[31],[27,76,1],[917],[18],[115,16,42,414],[550],[688],[102],[184],[174],[174],[886],[25,82,69,412,48],[923],[932],[775],[19],[19,116],[1,51,136,573,18,1],[392],[562],[106],[79],[248],[982],[18],[77,1,50],[76,512,109],[611,85],[308],[826],[744],[176],[965],[868],[868],[734],[490],[872],[872],[251],[944],[718],[535],[535],[678],[1],[589],[855],[898],[841,2,3,1,3,20,2,1,3,2,1,1,1,1,1,1,1],[818,15,1,1,2,23,14],[919],[1,1],[7],[751],[429],[581],[915],[73],[289],[463],[466],[88],[540],[764],[600],[600],[604,2,2,9],[304],[598,22,11],[63,306,262],[993],[388],[388],[386],[360],[358],[121,32,5,2],[138],[246],[71],[586],[148],[122,57,409,74],[855,44],[332,230,38],[200],[812,74,12],[30],[172],[105,30,3,62,113,258,29,185,49,37,95],[1,70],[166,129],[57,295],[25,306,4,35,595],[176,8],[162],[80],[756,230],[576,88],[60],[25],[95],[22,150,490,31,79],[334],[962],[28,47,20,41],[301],[60],[80],[25,19,119,30,8,28,75,4,18,249,1,43,9,8,48,72],[116,15],[201,59],[4],[97,198],[126],[982],[27,105,42,54,351,32,140,180,65],[302,1,16,357],[332],[55,47,199],[784],[1,55],[132,48],[301],[774],[169],[169,3,9,15,106,3],[63,675],[738,1],[45,7,2,6,4,1,14,16,12,11,1,2,2,4,8,1,26,1,1,21,1,1,2,76,35,70,73,54,150,38,3,26],[354],[845],[845],[844],[627,19],[725],[661,77,1],[178,204,308],[113],[887],[847],[847],[130,50],[93,437,294],[381],[368,11,2],[430],[954],[659],[36,130,6,120,58,330,122,84,51,15,2,28],[288,29,554,61],[329,261,30,57,134,10,5,1,6,1,2,2,1,6,1,1,1,1,2,1,3,1,2,1,2,4,2,1,2,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,1,2,1,2,1,1,1,4,1,55],[24,103],[99],[169,1,1],[270],[39,1,161],[446],[295],[130,58],[97],[326,302],[662,298],[21],[759],[1],[578],[24,763],[370],[132,227,11,3],[151],[52,58,2],[138],[67,37,2,3,1,5,1,7,3,4,1,5,2,22,4,24,152,4,7,5,1,6,12,201,8,19,27,35,4,12],[16,59,116,474],[27,51,1,30,16,2,1,3,1,57,1,102,41,4,12,3,621],[374,248],[188],[373,1,4,4,1,266],[604],[624],[596],[595],[621],[631],[602],[127,45,2,121,76,4,1,5,336,173],[65,54,2,8,4,4,37,394],[715,212],[652],[348],[46,719,4],[901],[228],[121],[174,102],[828],[583],[942],[567],[76,89,504,229,49,1,5],[33],[190],[620],[42],[882],[953],[244],[905],[434],[846],[103,150],[756,20,1,2,136,12,3,1,28,27,15],[55,1,721,10],[296],[571],[955],[16,59,115,1,146,328],[665],[212,13,19,4,44,3,314,59],[942],[532],[535,5],[629],[925],[349],[331],[4],[730,57,146,64],[201,1,1,32],[201,1,23,35,35],[794],[46],[104],[136],[65],[899],[43],[21,77,16,24,48,3],[23,37,130,3,1,2,1,1,2,1,1,1,26,16,49,73,10,292,12],[268,2,10],[128],[630],[18,947,34,1],[30,100,4,32,23,419],[1],[21],[16,3,732,30,2,136,11],[787],[7],[783,133],[781],[917],[820],[898],[896],[335,1,1],[611],[988,9],[106,10,19,31,66,398,164,161],[281],[290],[23,44,47,6,235,405,126],[647,43],[23],[850],[871],[132],[585],[115,4],[108],[381],[135,809],[105,9,7,234,15,212],[132,193,1,2,1,1,1,7,3,19,4,16],[662],[59],[116,708],[163],[746],[871],[345],[774],[780],[46,135,669,46],[772,34,10,1,1,16,37,21],[44],[527],[344,371,2,1,19,36,37,1,3,2,2,4,12,5,15,11,6,28,2],[349],[23],[135,192,18,20],[405,2,62,21,15,6],[352],[107,250,236],[285],[865],[980],[39,67,10,12],[108,9],[201],[620],[715],[718],[999],[18,5,57,55,26,1,10,8,186,325,27,10,95,1,1],[365],[78,1,570,5,1,1],[173,2,434,22],[14,5,2,1,1,1,1,12,20,3,11,7,2,19,14,1,1,1,2,1,3,4,1,1,4,1,1,1,3,24,1,1,2,14,5,3,1,1,39,8,7,9,7,16,1,15,2,1,6,12,16,5,3,15,13,1,4,1,11,1,301,7,34,44,79,23,56,38,31],[180,537],[354],[117],[933],[200,452,63],[629],[723,9,92],[374,1,255,63,3,21,1],[117,10,6],[818,64],[21,33,22,19,15,48,33,172,398,7,15,2,139,1,7,3,10,8,2,46,1],[931,62],[30],[45,93,842,5],[399],[158],[29,8,901],[0,19,4,95,40,33,565,31,142],[344],[167,4,207,4,343],[333],[1,18,11,26,11,51,6,45,8,9,2,104,44,1,11,2,3,1,2,17,1,224,1,1,1,3,2,1,1,2,1,1,2,1,1,1,20,2,6,33,3,5,4,27,62,6,32,4,2,75,43,13,6,10,2],[43,2,67,56,19,18,162,287,1,1,137,72,34,32],[344],[332],[335],[640,2,2,1,1],[606,35,4,2,1],[879],[37],[861],[7,16,4],[759],[106,22,116],[19,27,20,3,5,1,1,1,152,62,45,420,24,1,4],[347,14,5],[213,104],[111],[540],[191,164],[295],[347,4,4],[297,1,305],[7,1,8,5,2,6,1,13,6,6,11,10,21,8,5,10,1,9,3,1,32,3,7,52,9,40,18,1,54,3,2,207,6,4,8,6,14,7,18,22,9,61,11,9,22,21,33,10,1,1,67,4],[97,13,2,1,2,4,17,37,14,1,1,495],[656],[102],[737],[354,19,2,207,14,121,1,19,77,34,38,51,2,16,3,18,4,5],[935,6,1,2,12,1,8,8,24],[344,371,13,2,2,41,128],[899],[855,44],[16],[42,3,529,90],[495,5],[102],[329],[5,104,27,29,658,1,1,90,1,3,3,2,5,1,1,2,1,1,1,1,2,4,3,1,1,1,1,1,2,3,1,2,2,1,1,1,1,1,2,2,4,1,1,1,1,1,1,6,3,7,1,2],[161],[111],[941,3,21,11,2,19],[170,25],[132,479,18,7,48,41,7,6],[393],[400],[60],[787],[783],[169,29,94,39,334],[295],[266],[594],[831],[250],[207],[207],[143,18],[115],[333],[332],[932,30,39],[333],[333],[921],[758,1,1],[773],[672],[366],[351,4,264],[74,112],[925],[883],[883],[226],[240],[936],[43],[39],[256],[66],[68],[362],[654],[941],[180],[332,2],[882],[310],[310],[742],[736],[19,734,186,19,17],[899],[930],[115],[21,7,50,49,42,15,28,64,19,386,36,173,6,3,50,18],[780],[17],[624,135,1,158],[933],[598],[158],[174],[172],[131],[881],[881],[46,588,3,2,120,58,18,6,2,7,4,3,7,11,90,10,4,24],[624],[967],[854],[854],[854],[16],[818],[322],[199],[191],[4,61,115,428,179,51],[269],[693],[70],[936],[71,5,2,1,1,110,105,642],[779],[811],[831],[770],[770],[829],[874],[586,2,66,4],[658],[234],[126,8,617],[775],[123],[122,2],[166],[162,26,473],[182,132],[284],[974],[104],[780],[786],[942],[950],[929],[878],[248],[136],[1],[917],[184],[522],[395],[196],[522],[772],[293],[125,170,49],[314],[660],[276],[654,6],[908],[277],[277],[172,38],[288],[571,7,44,1,3,8],[2,917],[943],[575],[74],[580],[241],[841],[295],[865],[696],[694,2],[848],[383],[550],[756,49,14,3],[112],[397],[843],[787,56],[167,524],[481],[756,60,14,119],[113],[827],[181],[130],[648,67,8],[130],[165,129],[210,151,332,1,1,1,2],[336,2],[369,20,343,1,20,1,2,4,1,15,5,2,1,3,34,61],[826],[775,2],[629,39,64],[373],[188],[119],[617],[684,34],[545],[957],[124,40,20,143,6,9,3,1,3,151,223],[7,39,6,22,57,2,18,34,47,117,37,206,125,36,30,23,4,2,1,113,6,1,18,13,32,3],[172],[290],[137],[15,62,40,9,11,157,296,127,1,10,9,43],[333],[8,94,30,48,780,20,22],[28,564,216,168],[26],[1,124,830],[138],[136],[349],[294],[123],[649],[855],[898],[729,2],[333,259,247],[780],[335,12,3],[214],[898],[838],[838],[276],[29,892,77],[856],[300],[768],[244],[581],[172],[743],[630,89],[0,177,115,431,62,36,163],[153,139,37],[200],[28],[28],[194],[193],[608,19,68,44],[662],[373],[111,23,48,454,102,161],[130],[75,90,558],[285],[76,1],[211],[367],[592],[953],[131],[758],[687],[867],[33,4,30,28,41],[136],[73,518],[371],[162],[102,60],[23,1,31,1,6,14,26,6,21,8,54,110,327,12,6,80,52,2,42,49,57,69],[46],[135],[135],[0,1,1,5,1,8,1,1,1,1,5,2,1,2,2,1,10,1,1,2,1,6,1,2,1,1,1,1,3,1,2,1,1,1,4,1,1,3,1,15,7,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,2,1,1,3,1,1,1,1,1,1,1,1,1,1,2,13,11,1,1,1,1,2,1,1,1,2,1,4,7,1,1,1,1,5,2,2,3,4,20,3,12,4,16,16,1,5,6,6,1,1,6,3,3,19,4,17,1,18,8,3,7,23,160,4,6,1,21,11,8,1,1,3,2,21,2,3,2,1,1,6,2,1,23,2,1,23,1,2,8,7,7,17,3,1,2,1,5,1,4,10,1,1,2,6,18,7,3,13,1,25,32,4,3,18,1,15,4,1,17,2,4,5,7,2,7,1,5,2,11],[39,74,1,48,10,9,3,1,390,253],[291],[371],[841,50],[847,44],[52,1,11,1,15,15,14,2,9,9,2,3,1,27,1,26,106,327,4,3],[135,495],[119,2,7,1,44,115,52,2,28,295,74],[73],[237,71],[71],[868],[868],[327,6],[578,1,1,1],[747],[967],[130],[871],[882],[833],[436],[27],[15,1,112,590,181],[983],[110],[364,248,15],[796,78],[902],[855],[896],[824,2,5],[115,2,36,430,4,1],[116,44,412,1,1,1,11,22,41,47],[114],[807,89,2],[756],[228],[74],[37],[367],[599],[238],[920],[375],[76],[208],[33],[213],[94],[82],[839],[858],[847,42],[188,526],[117],[718],[177,118,386,36,58],[689,29,212],[740],[1,71,262,18,29,288,109,206],[615,10],[107,5,1,19],[127,1,5,2],[77,1,217],[75],[230],[663],[579,1,3,3,2,65,9,1],[484],[759],[554],[759],[172,555],[347,1],[735],[651],[691],[302],[305,70],[8,23,553],[603],[870],[858],[199],[125],[6],[694],[694],[692],[699,44,1,1,1,1,1,2],[160,694,44],[383,33],[378],[875],[163],[163],[583,72],[355,16],[63,2,68],[376],[586],[649],[891],[110],[846],[136],[59,597,104,237],[891],[847,44],[372,4],[153],[656,5],[760],[760],[812],[861],[859],[586,1],[99,2],[765],[23,104,7],[109,23,1,815],[774],[882],[211],[161,4,111,59,33,1,10],[841],[690,13,1,1],[17],[868],[860],[355],[930,1,4,63],[697],[4,616,74,4,1,261,3,40],[188,530],[335,12,4,6],[668],[164,3,13,4,169,17],[333],[116,56,7,10,163,29],[164,19],[180],[832],[597],[601],[928],[945],[947],[46],[46],[19],[43],[1],[46],[585,10,6],[488],[488],[470],[470],[693],[506],[506],[946],[955],[133],[618,3],[1],[928,3,51],[999,2],[507],[507],[982],[573],[571,1,1],[879],[942],[599],[347,14,6],[885],[885],[122,1],[141],[294],[550],[551],[158],[62],[39],[112],[449],[449],[383],[315,1],[315],[106],[196],[454],[868],[618],[620],[16,937],[714],[0,1,3,1,2,7,4,1,4,3,6,12,9,3,8,1,6,4,1,1,1,1,1,22,1,1,1,1,2,2,1,2,1,1,1,2,5,1,1,2,1,2,5,1,26,2,1,1,1,1,1,2,1,1,1,2,1,7,1,1,2,10,1,13,32,1,31,12,4,3,1,8,4,9,17,3,9,2,3,2,1,2,6,1,10,1,1,2,15,21,23,122,9,4,7,1,3,2,1,2,1,2,2,4,2,1,1,1,2,1,2,1,1,2,1,1,2,1,1,1,2,1,4,5,2,5,1,2,1,15,10,12,1,3,3,6,1,4,22,2,4,4,1,25,6,1,1,7,7,2,2,1,5,6,20,4,1,1,4,2,63,4,2,6,1,2,12,3,14,2,1,6,3,2,7,3,9,2,2,3,2,8,4,1,7,1,8,2],[93],[572,20],[295],[1,16,2,229,360,173,6],[46,24,3,80,50,114,19,77,170,14,5,11,124,16,10,13,36,7,7,1,2,1,3,1,1,1,2,1,4,2,3,1,2,1,3,1,1,1,1,2,4,2,1,2,1,1,1,2,1,2,1,1,1,1,1,1,1,34,16,1,1,6,4,1,3,3,5,3,1,11,8,6,5,5,1],[0,2,30,13,108,44,106,14,458,5,1,33,32,1,91,8,14,4],[335,23,3,7,1,10],[112],[325,51],[7,100,5,817],[29],[601,10],[536],[18],[121,548,12,37],[438],[631],[895],[598,1,4],[614,80,1,32],[1001],[672],[1001],[1001],[901],[296],[860],[831],[759,1],[684],[964],[161],[165],[23,165,88],[163,533,78,203],[52,671],[730],[677],[675],[718],[97,72],[174],[53,4],[350],[237,743,2],[995],[4,126,585,249],[95],[353,229],[107,271,199],[26,2,67,10,2,2,2,7,8,1,4,1,1,25,2,7,13,9,166,1,14,4,1,2,351,4,5,207,53],[133],[135,433],[112],[77,35,23,526,114,48,1,1,104],[114],[382],[57],[28,950],[652],[18,5],[15,13,32,882],[68],[985],[30,749],[982],[71,516],[1,15,26,35,3,49,4,2,1,1,14,18,31,88,87,1,202,103,132,108,23,36],[24],[19,4,34,71,3,5,31,13,170,5,326],[780],[295],[436,5],[530],[827],[780],[841],[955],[1002],[0,26,1,17,15,1,2,3,2,11,1,26,5,4,7,2,2,4,1,3,1,17,11,7,3,2,15,9,47,11,20,16,16,9,11,19,2,25,7,211,16,20,8,11,8,71,1,33,1,14,1,1,1,28,5,22,27,26,12,30,16,6,25],[571,77],[363,11,353,165],[571],[86],[84,2,103],[15,41,81,26,211,197,9,42,6,1,11,113,27,3,145,37,34],[4,17,33,2,3,68,118,102,275,97,11,134,118],[62],[874],[827],[378],[350],[879],[637],[606,28],[453],[905],[281],[868],[841],[604,16],[882],[234],[879],[652],[122,76,94,280],[196,1],[288],[193,1],[128,36,2,7,55,67,297],[383,70,2],[759],[15,28],[15,1,30,884,1,3,1,29],[19,24,2,1],[44],[257],[152,271],[132],[850],[107],[169],[168],[28],[130],[865],[827],[889],[465],[103,10,19,55,390],[187],[121],[631],[335],[801],[801],[67],[858],[332],[358,2],[859],[832],[558,4,4],[858],[841],[811],[665],[10,3],[584,333],[301],[381],[924],[301],[167,3],[680,107],[286],[170],[368,1,3,5],[516],[616],[736],[214],[371],[868],[325,4],[244],[291],[865],[4,55,3,5,8,39,19,5,24,8,6,9,68,76,23,11,19,72,264,9,78,1,14,1,12,38,48,60,3],[562,4],[558],[624],[346],[670],[314],[377],[345],[855],[88],[735],[678],[78],[965],[996],[292],[280],[126],[1,43,7,3,9,1,1,11,41,18,29,20,145,24,308,97,3,26,20,25,81],[172,40,599,4],[52],[126],[116,752],[176],[136],[233],[591],[589,40],[709],[135],[610],[1,115,220,1,1,24],[76,3],[879],[879],[877],[210],[193,2],[261],[31,159],[23,43,3,133,181,245,129,1,171],[335,33],[333],[87],[345],[727],[715,8],[454],[214],[293],[259],[824],[135],[792],[78,1,23,4,1,21,1,4,1,1,18,11,4,2,10,7,2,64,73,4,14,6,1,4,8,4,3,1,3,2,199,9,24,12,2,5,1,6,30,21,29,1,11,105,40,49,65],[340,256,66,7],[0,121,127,47,403],[15,311,294,16,4,56,269,24],[792],[383,93],[125],[30,77,19,2,1,1,1,3,1,1,2,94],[31,94,2,8,56],[127],[618,2],[567],[76,113],[75,213,6,2],[312],[186],[631],[362,319],[499],[813],[580],[580],[810],[879],[779],[137,420],[15,61,105,481,3,317],[16,2],[125,9],[23],[128],[855],[110,8,12,33,25,299,234,92,3],[529],[283],[114],[779],[18,340,3,7,1,10,224,326],[110,2,700,127,8,28],[127],[185,1,158,29,344,1,10,2,7,25,2,29,17,1,1,4,2,13,29,26,4,6,5,100],[989],[24],[97,33,33],[172,193],[127,183],[95,2,1,4,11,1,1,4,11,2,2,28,2,2,1,1,4,1,7,4,2,2,1,148,15,18,238,14,12,15],[845],[845],[499],[879],[684],[685],[593,1,90,1],[61,105,130],[104,191],[54],[45],[630],[604,15,1],[624],[986],[995],[247],[134],[307],[956],[226],[622],[374],[50,61,12,42,60,671,89],[787,84],[808],[109],[109],[953,3,33,2,2],[785,145,19,39,1,1,2],[991],[0,1,43,16,65,213,421,1,20],[913],[762],[664,309],[153],[78],[59,570,194],[738],[201,427,95],[766],[1,15,2,6,13,9,3,1,2,7,38,6,1,1,2,2,5,2,1,3,5,2,4,6,21,8,20,2,1,1,1,4,147,7,6,18,188,20,14,5,5,27,1,11,2,3,111,27,6,29,117,5,1,10,2,6,1,12,12],[392,509],[942],[879],[826],[826],[807,9,18,37],[822],[30,796],[822],[202],[57,148],[300,11],[30,28,57,20,34],[30],[176],[67,2,1],[349],[136,159],[624],[815],[868],[15],[237],[598,4,1],[43],[290],[604,7,9],[676],[189],[841],[162],[118,45,2,23,735],[125,602,107],[4,19,92,1,7,1,4,4,32,8,4,3,1,64,102,29,209,6,138,49,152],[286],[759,1],[80,50],[0,7,9,7,4,41,55,42,123,7,24,301,57,19,1,251],[180,631],[258],[306,1,2,1,1,1,2,1,1,1],[588,61],[242],[202,1],[778,161,44],[202],[4],[84,5],[24,33],[481],[479],[113],[344],[420],[24,32,2,18,27,1,2,1,4,3,1,1,4,2,1,6,1,1,1,1,29,8,2,1,71,9,24,60,9,3,14,2,1,123,83,3,2,31,19,1,1,5,15,12,24,30,10,1,164],[103,11,8,41,1,92,391],[622],[78],[543],[131,45,112,273],[37,154],[361],[347,14,1],[957],[896],[855,41],[295],[739],[965],[382],[684,2],[594],[686],[191],[105,3,243,269,165],[191],[834],[86],[135],[568,61,64,130,132],[18,97,7,8,68,104,6,59,225,92,34],[163],[665],[999,4],[202,2],[203],[168,19,13,5],[882,107],[637],[295],[721],[641],[636],[861],[763],[763],[181],[181,446],[627],[409],[917],[896],[296,594],[737],[834],[818],[691,37,8,1],[382],[437],[275],[577],[776],[477],[341,33,204,22,85],[28,157,5,11,670],[814],[814],[810,4],[810],[383,53,2,15],[861],[16,148,20,601],[600],[19,123,19,27,156,337,37,14,49,117,43],[20],[816],[30,651],[67,134,94,635,9,14],[113,3,14,36,527],[715],[865],[40],[440],[436],[84],[482,118],[960],[614,80,1,197],[61,117,99,18,30,50,6,509],[115,6,6,4,33,10,102,292,11,109],[346],[858],[850],[850],[414],[858],[858],[853],[596],[321],[999],[117,15,3,35,132,68,198,3,1,1,1,1,1,1,1,2,2,1,1,1,1,4,13,4,2,21,20,5,14,68],[575],[46,741,146,64],[402],[574],[850],[134,233],[114,7,1,4,2,1,4,3],[81],[736],[43],[640],[294],[736,2,1,1],[861],[850],[855,39],[732],[173],[222],[126],[85],[119],[25,36,1],[119],[124],[629],[5,11,5,1,5,3,23,4,15,6,33,2,13,2,2,3,27,1,3,1,5,3,7,48,49,17,1,54,1,26,60,146,6,30,51,111,1,4,10,53,16,28,33,13,10,45,2],[818,43],[625,360],[759],[759],[759],[624],[890,86],[78,782],[871],[19,56,4,170,43,2,315,171,1,4],[688],[879],[626,14,7],[690,23],[338],[821],[562,1],[558],[561,1],[617],[383,101],[892],[15,1,5],[634],[575],[739],[8,18,11,84,2,12],[67],[115,10,9,32,525],[737],[753],[761],[131,209,8,625],[172,770],[276,709],[680],[125],[619],[51,14,5,60,8,39,538,206,3,1,5,3,6,3,1],[136],[106],[353,465,64],[550],[908],[18],[737],[385],[108],[131],[103],[187,2],[130,1,207,6,2,4,10,3,4,7,2,174,26,46,1,4,4,11,10,29,34],[15,17,12],[19],[275],[599],[136],[210],[128],[764],[931],[452],[452],[457],[394],[897],[416],[413],[848],[51,28,82,9,78,99,4,16,12,241,1,294,14,25,19,6,3,16],[2,210],[64,237],[110,7,9,3,1,1],[409],[614],[901],[955],[339,2],[341],[248],[308],[568],[1,55],[331],[135],[28],[125],[1],[884],[884],[972],[561,31],[913],[775],[998],[561],[161],[27],[776,1,145],[248,165],[111,51,25,412,2],[135],[349],[360],[965],[841],[557,394],[241],[881],[845],[132],[392,208,7],[96,2,91],[185],[179,2,3],[514],[28,197],[762],[37,541],[668],[242],[879],[811],[732],[336],[931],[123],[864],[102,59,4],[2,772],[4],[787],[546],[546],[964],[18,92,1,55],[325],[129,6,440,43],[514],[634],[323,6,279,66,24],[151],[55,40,18,2,12,6,1,54,107,39],[525],[425],[103,580,1,1],[294],[4,922,1],[73,926],[562,1,8,7,1,1,1],[25],[49,1,2,5,3,15],[59],[26,1],[166],[52],[448],[448],[175,666],[585,15],[595,2,2,1],[963],[314],[314],[561],[610],[730,135],[93,501,96,1,12,1,1,1,1,1,1,1,2,2,1,1,1,1,2,1,4,1,2,1,1,3,1,1],[295],[819,5,1,1,1,2,1,1,1],[816,3,1,1,1,1],[681],[363],[340],[52],[557],[823],[561],[43,27],[230],[659],[905],[979],[33,12,116,64,23,53,84,203,93,99,205],[930,3,35,11,3],[89],[878],[7],[46,735,203],[357,221,379],[925],[661],[135],[110,670,50],[760,1,2],[0,8,6,2,4,7,2,1,27,2,8,1,7,1,19,15,13,2,2,3,6,2,26,15,8,4,37,12,8,46,1,1,10,1,16,12,11,4,14,3,10,202,3,49,25,18,7,10,4,20,3,10,3,43,3,3,1,62,53,5,28,13,1,1,3,1,1,5,3,10,6,2,16,1,6],[23,26,25,43,1,1,12,46,11,1,55,73,8,45,13,201,23,1,1,75,30,9,71,54,73,2,15,8,11,2,29,5],[539],[558,9],[879],[134],[781],[18,283],[377],[439],[28],[177,447,7,358],[123],[170,485],[369],[368,1,3,1],[20,1,8,25,45,35,29,32,33,25,23,18,1,58,331],[95,11,4,1,1,6,9,3,1,4,1],[19,165,92],[228],[8,10,89,18,7,4,156],[916],[16],[97,1,198,369],[295,403],[926],[927],[245],[80,297],[89],[250],[451],[277],[284],[846],[905],[284],[120],[7,9,742,18,9],[573,142],[725],[83],[1,51,86],[816],[659],[70],[708],[501],[511],[508],[25],[54,24,36],[202],[385,23],[728,206,2,17,27],[661,95],[344],[75,1,1,2],[103],[859],[617],[605,2],[613],[0,953],[921],[925,2],[921],[832,111],[938],[259],[196],[170],[407],[222],[515],[8],[63],[96],[888],[861],[855,43],[855],[855,41,2],[855,43],[665],[194],[76],[781],[745],[347,412,2,157],[17,4,1,49,28,11,3,3,121,58,430,34],[596],[80,27,25,6,29,109,414],[679,2],[726],[326,2,1,1,34,74,138,1,26,17,2,1,1,1,1,1,1,1,1,1,4,48,1,1,2,1,1,2,1,1,1,1,2,17,181,6],[295,424,8],[892],[719],[54],[53],[244],[748],[698,1],[107,3,13,5,6,49,158,231,109,51],[78,50,168,82],[811,15,1,19,1],[109,64,144,348],[365],[119,221,2,307],[126,34,422],[528],[134],[133],[198],[285],[791,3],[861],[27],[922,44],[335],[916],[619],[331],[965],[1002],[108],[225],[426],[256],[393],[901],[71],[69],[69],[31,40,119],[16,3,6,20,12],[555],[138,225,12,2,576],[288],[349,5],[125,40,11,198,1,318],[126,660],[912],[846],[196],[126],[296],[121,187,7,1,13,55,8,70,88,102,38,116],[676],[297,2],[474],[474],[571,7],[212],[184,506,24],[351,1,1,3],[878],[118],[1],[19,4,9,15,12,2,19,42,40,1,25,6,4,55,3,312,68,144,54,86,8,73],[114,3,6,1,59,5,1,55,85,22,1,1,1,1,15,206,6,2,12,7,20,19,44,28],[158],[16,93,16,235,290,111,20],[134],[300],[608],[779],[134,797],[362,250,8],[354,14,1,211,32,15],[647,78,1],[683,1,1,2,28,10],[690],[690,35],[0,16,7,3,80,6,3,1,10,1,1,2,21,11,24,4,8,98,39,14,20,252,28,39,3,7,86,98,33,18,65,3],[235],[795,1],[886],[461],[31,159,35],[191],[122],[563],[290],[818],[662],[787,133],[920],[0,2,772],[25,41,6],[72],[562,3],[76,96,406,10,193,220],[976],[378],[121],[209,348],[181],[277],[78,790,18],[453],[519],[810,4],[886],[646],[353],[807],[112],[106,10],[46,819],[892],[847,40,5],[261],[176],[922],[996],[717,2],[366],[715],[180,450,323],[168,202],[29],[984],[30,266,67,249,66],[293,381,5,1],[366,245],[118],[624],[604],[39],[57],[55],[53,4],[25,35],[54],[587,377],[612],[107],[669],[308],[925,17],[65],[4,3,1,7,1,1,1,1,2,2,1,1,1,1,1,5,4,2,7,2,3,1,1,7,2,5,1,4,2,1,1,1,3,15,7,2,3,1,2,2,2,1,1,1,3,1,2,1,2,1,2,1,1,1,1,1,1,1,1,1,13,2,8,1,1,1,1,1,1,1,2,2,2,2,1,1,2,1,1,4,1,1,1,1,7,4,24,12,3,4,4,12,16,1,15,2,1,6,1,4,1,12,4,4,1,1,6,3,2,3,1,7,1,10,4,1,3,1,1,1,1,4,1,1,1,2,25,28,14,117,4,1,6,2,2,1,2,3,4,20,7,1,2,1,1,1,2,2,2,5,1,2,3,3,2,14,1,3,7,4,1,1,3,3,6,3,2,1,21,1,1,4,2,2,3,2,5,1,1,14,3,2,1,1,1,1,1,1,8,3,1,1,3,1,2,1,3,7,2,10,1,1,4,1,2,1,5,1,1,1,1,6,1,2,1,8,5,23,3,18,4,2,1,15,2,1,4,1,4,1,2,1,1,1,5,1,1,9,1,1,4,5,1,4,3,9,3,1,2,2,5,3,1,3,2,3,1,1],[29,698,171],[189],[1,3,24,93,6,3,3,2,29,3,6,11,2,2,3,23,34,40,45,13,6,11,2,5,7,4,169,97,17,54,35,15,11,4,38,75,2,15,5,27,19],[780],[354],[858],[176,210,125,179,1],[898],[624],[881],[904],[616],[531,185,3,1,184,39],[879],[863],[732],[131,305,152,2,18,42,41,37],[0,15,12,3,34,3,28,7,2,1,3,1,1,7,2,4,5,3,1,2,1,1,2,22,4,1,2,6,5,6,1,1,2,1,99,6,8,34,4,8,3,1,1,2,1,7,3,8,1,183,18,4,4,4,15,19,4,1,2,1,15,24,12,36,6,2,5,2,7,44,11,104,26,8,7,6,4,4,1,5,1,2,2,9,3,4,3,20],[899],[313],[624],[1,22,36,38,15,58,4,2,8,5,59,340,165,21,6,1,2,27,6,55,15,4,3,8,28,36,38],[353],[816],[23,3,18,34,28,9,9,2,9,27,8,16,2,1,67,48,4,39,235,46,8,20,58,1,44,1,56,1,4,69,3],[59,395],[407],[261],[28,107,160,47,3,18,360,218,3,41],[23,151],[27,147],[112],[69],[968],[272],[162],[348],[169],[168],[558,1,1],[135,29],[229],[896,5],[123],[45,326],[0,4,12,1,1,1,4,8,2,3,1,10,1,3,1,1,1,8,5,3,2,2,6,25,4,3,2,3,1,5,1,1,1,3,1,2,2,1,1,2,24,3,1,1,5,2,2,9,3,4,20,64,20,4,33,1,1,2,4,9,2,15,6,2,2,173,28,4,2,4,92,11,3,24,8,6,19,10,5,11,1,1,2,4,22,4,4,1,2,7,1,8,52,10,5,14,4,2,2,2,5,7,2,2,3,1,4,2,2,1,1,9,11,8,2,11],[865],[550,408,16,4],[694,1],[175],[966,20],[680],[816,122],[44,284,257,221,1,1,3,3,6,1,2,1,1,1,1,2,1,1,1,1,1,1,6,2,3,1,3,20,1,1,1,1,2,2,1,1,1,1,1,1,1,63,1],[343,476,173],[209],[879],[979],[431],[19,40,3,6,188],[0,2,12],[974],[8,18,78,5,672],[21],[0,2,2,12,8,15,7,739,128],[19,4,1,4,2,22,4,133,119],[135],[879],[170],[186],[572],[392,188,321],[677],[434,116],[434],[427],[63,888],[550],[420],[419],[113],[292],[255],[276],[371],[225],[30,588],[240],[200],[231],[229],[997],[296],[325,1],[611],[117],[4,12,44,7,12,31,3,12,2,3,5,1,2,26,3,3,2,1,1,6,170,58,211,5,28,71,62,10,11,14,1,12,89,31,44],[60,42,8,56,210,196,16,77,116,4],[345],[343],[237],[629],[645],[571,7],[578,39],[21,145,111,678,25,22],[982],[15],[228],[62,58,42],[282],[768,133],[393,7],[106,4,18,3,32,4,502],[65],[129,4,4,14],[74],[773],[714],[356],[368,1,1],[167,32],[849],[849],[513],[8,48],[116],[406],[598],[882],[75,4],[435],[438,173],[123],[620],[627],[224],[649],[572],[350,82],[51,24,20,7,15,4,14,1,26,1,1,3,20,1,1,403],[28,24,13,30,73,37],[95,7,5,19,3,5,52,1,2],[325],[77],[118,860],[629],[70],[596,229],[503],[825],[769,60],[173],[174],[173],[78],[624],[373],[697],[82],[608,7],[825],[825],[825],[613],[579,1,3,1],[74],[620],[618],[619],[386],[475],[859],[153],[898],[78],[741],[736],[431],[295],[262],[876],[876],[450],[383,67,381],[495],[17],[17],[382],[113,57,646],[432],[137,616,3,25,2,136],[24],[161,838],[4,15,4,82,12,15,6,23,5,180,571,4,1,5,5,27,2,35,1,4],[0,23,4,82,18,6,9,23,620,63,65,11,1,24,4,11,12,8],[165],[295],[139],[139],[153,761],[805],[654,1,1],[418],[418],[625],[756],[277],[472],[468],[495],[292],[368,11,3],[874],[874],[53,249,340,42,134,180],[130],[172,613],[136,51,538],[603],[718],[333],[45,79,10,679,3,82],[549],[548],[408],[524],[538],[456,11],[383],[335,33,11,4],[850],[116],[734],[367],[67],[930,1],[923,12,2,16,35],[110,6,10],[134],[559],[879],[814],[608,19,205],[846,62],[333],[166,719,57],[272],[846,62],[847,42],[656],[292,3],[378],[169],[784],[178],[166,23],[978],[793],[366],[367],[361],[347,14,6],[500],[647],[79],[900],[63],[471],[347,14,3],[930,3],[599],[688],[39,2],[30],[841],[810,1],[878],[1],[97,1,682],[564],[775],[291,62],[263,27],[383],[290],[271],[263],[807,19],[135],[134],[811],[879],[26,1],[277,89,325],[587],[997],[66,4,811],[191],[982],[841],[868],[787],[815,33,48,3],[831],[138],[363],[459],[460],[195],[823],[878],[531],[980],[969],[968,18],[965,21],[774],[554],[359],[166],[350],[944],[940],[31],[168],[114],[332,1],[387],[614],[186],[186],[762,4,41],[868],[610],[682],[337],[584],[14,748],[823,1,1],[785],[751],[785],[775],[781],[787],[17],[487],[831],[181,4],[32],[671],[464],[793],[378],[857],[857],[110,1,15,9],[652,75,255],[342],[335,4,1],[865],[751],[586,2,4,58,1,1],[591],[251],[955],[718],[86],[570],[680],[790],[789],[97,2,67],[117,50,22],[171],[791],[830],[270],[892],[825],[337,605],[609],[605,2],[771],[788],[791],[276],[811],[811],[425],[539],[402],[243],[175],[366],[78,702],[849,16],[868],[700],[702],[391],[391],[874],[442],[568,15,2],[567],[18],[136],[834],[781],[110,11,2,13,2,23,24,155,8,106,133,1,171,1,57,24,9,87,16,6,2,27,7,6],[14],[344],[831],[759],[608],[14,120,2,1,49,546,25,1,3,1,1,1,3,1,1,3,1,22,11,2,3,4,1,1,1,6,2,8,9,5,1,6,10,6,8,11,39,3,6,15,6,3,2,33,4],[915],[774,4],[780],[678],[672],[120,54],[48],[68],[144],[23],[455],[557],[690],[443],[128],[116],[172],[316],[534],[533],[429],[350],[337,14,24,2,173],[846,62],[1003],[999,4],[1003],[485],[830],[64,1],[355],[338],[669],[850],[31,139,1,491,131],[30,50,605,163],[874],[608,172],[612],[617],[793],[522],[160,5,645,6,2],[111],[86],[1],[267],[112],[892],[39,5],[48],[765],[948],[947,1,3],[19,13,7,7],[223],[775],[421],[855,41],[896],[275],[154],[74],[336,26],[695],[678],[294],[353],[136,519],[850],[833],[717],[296],[592],[810,6,2,143,36],[16,939],[294],[16],[946,9],[775],[662,2,10,5,3],[46],[865],[915],[4,24,3,97,60,52,488],[982],[182,582],[33,629],[558,4,4],[31],[168],[78,2,40,66,731],[119],[871],[878],[878],[353],[153],[686],[276,282,21],[43,157,491,37],[868],[965],[292,4],[119],[592],[753],[753,28,2],[350],[277],[89],[167],[15,8,74,13,9,7,3,1,23,8,24,1,62,47],[46,61,19,37,2,2],[550],[372,454],[630],[732,5],[228],[649],[720],[722],[25,212,64],[26,88,142,351,173],[172],[43],[954],[735],[167],[19,100,9,35,1,3,3,3,11,4,1,55,32,19,75,1,10,73,211],[173],[629],[269],[215],[4,105,14,44,13,148,1,51,205,111,22,236],[5,9],[579,10,5,89,1,1,1,1,1,1,7,19],[52,16,240,260],[899],[855,13,31],[737],[630],[603],[188],[221],[217],[575],[110,23,1,581,11],[363],[23],[719],[147],[142],[616],[60,122,585,163,9,11,7,8,15,8,10],[14],[74,851],[244],[115],[762],[129,527],[178],[134],[526],[53,68,7,52,22,46],[129],[657],[726],[656],[347,406,8],[45],[169],[168],[777],[248],[834],[834],[135,53,2],[260],[130,171,283],[775],[4],[78],[879],[21],[228],[127],[120],[537],[532],[27],[777,1],[915],[4],[166],[102],[382],[109],[428],[879],[79],[342],[73],[105],[505],[412],[964],[555],[440],[930,1,11,12],[378],[296],[347,3],[334],[848],[125],[112],[286],[60],[882,94],[619,2],[199],[100],[494],[724],[62,605],[778],[774,6],[965],[984],[855],[898],[577],[723],[333,90],[349,1],[351],[202],[375],[180],[125],[865],[176],[565],[294],[591],[585,20,2,6,3],[646],[29,1,13,2],[16,3,23,159],[225],[57],[10,1],[859],[25,28,6,8,13],[600],[275],[24],[466],[349],[180,552],[287],[980],[163],[695,128],[131,32,10],[220],[59],[861],[74],[110,23,33,110,20,5,16,91,576],[177],[49,679,52],[718],[833],[833],[859],[832],[129],[641],[119],[368,1,2],[117,602],[846],[592],[124],[568],[965,35],[225],[331,4],[592],[383,70],[175,26,34,60],[268],[198,20,1,3],[276],[669],[598,1,4],[95,25],[67],[306,1,16],[308],[172],[288],[964,35],[46,119,170,23,192,63,2,25,9,10,32,25,2,2,31,23,1,1,1,1,1],[175],[841],[337,289,69,31,49,2],[52,20,7,35,9,7,643],[799],[223],[475],[830],[16,21,26,225,6],[37],[760],[347],[347],[181],[955],[30],[120,8,202,83,25],[188,182,410,37,153,7],[276],[516],[659,330],[37,149,628,57,62,11],[0,717,68],[162,460],[23,154,163,218,9,158,195,37],[7,195,100,1,16,378,132],[941],[345],[103,174,506],[608],[127],[471],[363],[28],[572],[781],[986],[8,10,1,11,731,155,5,10,34,33,2],[769,9],[95,895],[170,135,325],[303],[960],[652],[121,45,23,12,235,154,51,128],[646,296],[640,250,49],[717],[57,21,167,56],[23,3,69],[21,87,22,225,25,267],[167],[23,319,376],[44],[951],[2,749],[42],[621,7],[260],[56],[4],[184],[185],[67],[439],[906],[852],[325,3],[328],[579,1,3,3,1],[398],[725],[203],[446],[11],[976],[976],[778],[542],[868],[751],[865],[838],[308],[301],[23],[261],[555],[816],[285],[383,347],[163],[955],[666,1,1],[896],[24],[54,222],[616],[672,2,1,1,1,1],[681],[286],[1],[346],[618,2,1],[460],[44,23,57,188,153,164],[464],[67,113,5,6],[592],[373,206,10,14,19,7],[659],[301],[374],[377],[86],[453],[582],[932,44,26],[762,167,72],[846,61],[846],[846,61],[879],[846],[842],[909],[131],[950],[922],[948,1],[165,793],[214,729],[120,215],[725,248],[370,238,21],[61],[26,1],[77,109],[185,1],[407],[913],[178],[79],[855,43],[916],[650],[654],[653,1,262],[691],[184],[740],[326],[186],[932],[830],[620],[904],[951],[161],[930,1,33],[630],[15,6,22,16,1,67,43,4,10,163,185,26,38,28,5,51,17,32,1,5,18,30,4,24,1,8,30,4,1,13,14,51,20,12,12,20,1],[661],[183,2,781],[998],[933,64],[834],[185],[982,1],[968,15],[879],[78],[373,223,96,5],[712],[850],[690,10,2],[247],[297,2],[337],[252],[252],[191],[521],[1],[865],[187],[66,612],[882],[24,43,851],[30,50,50,42,105,354,34],[864],[864],[339,3],[87],[292],[292],[350],[16],[288],[864],[864],[110],[390],[390],[750],[861],[861],[868],[868],[923],[954,12,18],[973],[925,2,15,1,5,1,4,24],[921,37],[10],[202],[970],[975],[975],[238],[813],[458],[306],[302,1],[645],[879],[137],[198,23],[133,4],[217],[841],[841],[841],[104,30,91,63,296,197,2,1],[75,4],[577,7],[590],[80],[136],[970],[294],[816],[98,19,14,22],[109],[1000],[665,16],[498],[311],[314],[37],[41],[157],[157],[275],[186],[189],[167],[290],[292],[131],[131],[102,29,33,2,1,21,1],[492],[334],[825],[492],[410],[87],[290],[373],[43,2],[44],[16,3,6,5,1,1,1,1,3,2,1,1,7,4,4,13,3,1,20,6,1,91,24,20,56,4,276,1,2,36,1,176],[290],[16],[359,4,1],[350],[276],[62,759],[276],[610,1],[276],[163,210],[290],[612,69],[349],[80],[62],[938],[105,58,5],[112],[63,703,69],[371],[27],[775],[62],[719],[138],[932],[830],[75],[64],[768,50],[976],[728,4,5,24,6,1,48,18,65],[350],[929],[7],[892,72],[24,73,1,17],[168],[24,71,23,2,47],[24,4,67,3,7,8,1,13,11,28,2,1],[668],[173],[206],[964],[110,234,284],[609],[723],[577],[352],[95,7,33,28,26],[899],[20,28,126,716],[76,1,706,138],[60],[61],[921],[961],[928],[961],[228],[799],[799],[379],[380],[112,21,65,78],[995],[318],[890],[622],[164],[256,724],[189],[879],[16,3],[53,115,133,328,55,75,1],[182],[24,71],[166,720],[7,170,21,529,219,3],[228],[121],[119,176,398,25,8],[8,11,355,547,10],[761],[608],[366],[4,53,20,109,90,388,111,205,3],[60,7,60,39,15,3,10,106,37,594,8,2,1,1,1,23,12,3,1,14],[114],[172],[210],[198,1,7,1,1,1,1,1,2,1,1,6],[371],[406],[371],[376,471,45],[868],[363],[350],[118],[586,2,66,6],[175],[989],[47,1,2,1,1,2,5,1,8,4,4,1,3],[732,5],[51,16,3,3,2,1,3,1,45],[629],[180],[212],[590],[110,10],[367],[350],[58,49,8,2,3,4,6,197,13,268,14,5,7,9,9,73],[114],[941],[725],[568,207],[130],[559,22],[571,6,1,1,1,1,9],[383,53,4,14],[430],[60,24,1,4,4],[806],[808,4,80,4,2,3],[181],[341],[882],[302,1],[80,109,448,53],[113,680],[629,165],[186,2],[57,295],[25],[370],[115,15,32,2,2,3,8,11],[176,8,1],[756],[883],[505],[245],[104],[287],[104],[727],[689],[44,34,26,27,49,108,289,121,98,38,37,47],[7,571],[23,40,32,716,79,67,4],[172,213],[74],[37,98],[0,51,23,3,28,30,27,140,260,6,24,8,25,4,16,114,1,14,4,6,1,2,19,7,3,1],[198],[57,19],[132],[134],[787],[574],[619,187,14,13],[426],[519],[18,15,12,143,1],[77,1,32,3,17,32,134,33,293,12,13,17,34],[76,52,2,1,117,90,6,2,14,7,46,137,26,46,1,4,4,11,10,29,34],[198,22],[37,165],[665],[107,243],[109,92,44,56,364,61,12,1,221],[180,131],[350],[192,2,98,10,345],[634],[652],[585,28,1],[756],[86],[214],[277],[111,3,15,2,27,182,6,27,249,6,21],[239],[730],[80],[4,190,750],[270],[288],[31],[568,2],[98,198,18,351],[314],[25,41,3,1,2,1,116],[46,4,10,4,14,31,9,9,1,3,1,1,9,21,1,2,3,1,10,60,36,18,6,29,11,1,1,4,4,2,3,1,1,13,13,30,137,11,12,4,1,12,6,12,3,11,2,1,1,3,1,1,54,3,39,5,5,24,51,74,13,33,10,25],[164,84,133,266,46,35],[19,43,593],[796,132],[189],[255],[249],[176,636,86,30,27],[959,2,1,2],[931],[25,41,3,1,3,1],[300],[129],[280],[306,1,2,9,285],[879],[294],[350],[685],[577,31],[123,420,77],[978],[725],[23,89,11,39,133,54,36,193,40,3,202,1,1],[861],[365],[669],[153,564,11,9],[305],[23,2,14,1,1,16,18,43,3,8,222,22,276],[27,96,42,757,1,22,9],[1],[878],[878],[121],[269],[39],[581],[50],[21,140,1,464,359],[164],[164],[153,217,233,20],[1,3,3,9,3,7,1,4,29,4,3,1,1,1,9,23,3,4,1,2,4,1,9,27,8,5,1,5,4,6,2,1,2,1,57,32,11,7,1,42,8,5,25,37,159,6,4,6,2,66,9,4,22,27,19,19,16,8,1,42,1,1,23,1,30,20,2,20,6,2,6,2,2,2,2,1,4,3,3,9,3,22,9],[0,37,82,6,45,9,9,1,10,89,7,32,354,96,38,81,21,2,11,23],[181,160],[408],[413,23],[408],[115],[994],[997],[849,16],[385],[113],[135],[371],[814],[327,1,20,5,1,38,170,69,7,1,1,1,1,30,6,36,187],[619,6,1,62,4,200],[630,48],[124,240,74,160,13,13,223,39],[615,8,5],[172],[294],[830],[180],[335,33,1,10],[368,1],[383,155,10],[189],[14,9,103,210],[173],[19,338,228,99,247],[354,266],[628],[8,13,1,3,1,1,26,11,3,9,26,3,4,2,2,2,8,4,1,2,3,2,3,13,10,1,1,1,1,1,1,5,4,1,2,1,1,1,2,1,2,1,1,40,11,5,32,17,1,9,4,38,3,15,12,199,1,2,12,18,10,1,1,3,2,1,3,2,4,1,7,2,11,13,22,24,13,9,39,1,3,1,25,42,42,3,36,6,4,5,3,1,1,4,4,6,3,1,15,1,1,7,2,10],[58,102,842],[608],[184,539],[639],[74,100,496,1,92],[174],[767],[172],[159],[364],[8],[296,457,22,166,44],[170,520,13,3,1,1,119,7],[99,1,2,62,6,2,1,2,1,3,1,1,2,1,1,1,1,1,540],[832],[296],[811],[166],[865],[556],[556],[787],[180,21,59,194],[184],[164,5,15,1],[268],[22,4],[22],[908],[59],[980],[580,405],[21,920],[7,9],[367],[925],[165,596,164,16,2,1,36],[937],[760,2],[67],[521,101,6,2],[944],[774],[859],[793],[115],[214],[212],[309],[296],[848],[216],[53,6,2,3,1,302,302],[25,31,6,1],[690,20,2],[269],[592],[53],[31,160],[851],[997],[7,25,80,13,2,440,193,21,132],[23,8,75,19],[44],[44,946],[164],[901],[370,12],[808,133],[774],[30],[849],[292],[515],[30,900,1],[944],[558,401,42],[959],[44],[188,178],[354],[908],[575],[813,18],[186,576],[469],[149],[187],[985],[114],[290],[80],[62],[636],[557,62,299],[350],[133,18,16],[131],[160],[222],[110,504],[348],[931,11,2],[944],[955],[955],[461],[338,270],[588,64,2,1,1],[573,76,66],[85],[253],[254],[116],[756],[37],[917],[691,37],[854],[347,14,4],[340,233],[136,34,482],[13],[813],[164],[846],[492],[296,368],[116],[130],[127],[683],[755,1],[955],[185],[649],[164],[370],[121],[622,15],[351],[751],[128,54,200,1,192,77],[67],[67],[25,43,90,4,598,173],[95,8,1,21,13,139,668,43,2,7],[326],[793],[181,4],[725],[353],[342],[224],[515],[196,380],[265],[777],[133,240,223,96,5,110],[362,250],[601],[662],[212],[392],[965],[611],[115],[62,178],[79,45,158,675],[67,221],[188,380],[779],[188,505,284,15],[780],[177,35,710],[60,3,1,1],[110,1,15,9,60,145],[276,16,42],[526],[834],[816],[651],[650],[775],[366],[727],[164,571],[528],[358,2],[865],[291,5],[818,53],[862],[580],[436,141,313],[901],[161,4],[840],[737],[715],[95,24,82,1],[64,1,30],[248],[62,46,76,45,105,642,4],[821],[288],[294],[722],[19,257],[123],[332],[582],[162],[275],[484],[279,450,1],[730],[332,2],[106],[184],[820,58],[841],[335,12,4,6],[15,183,2,40,4,12,474,2],[237],[296],[19,241,104],[15],[165,179],[496],[473],[496],[493],[4,917],[953],[166],[785,139,13,27],[45],[16,3,1,4,3,3,12,183],[20,10,3,6,14],[137],[302,1],[279],[377],[276],[274],[172],[172],[917],[385,23],[19,6,1,1,1,17,12,130,9,44,108,415],[5,11,3,4,45,119],[332,361,75,217],[191],[169],[31,72,1,63,22,87,70,13,263,5,1,19,38,41,85],[327,162,170,68,8],[188],[106,471,31,26,57,24],[102,721,1,1],[729,3],[890],[371],[690,23],[865],[542,13],[547,5,2],[175],[398],[27],[80],[832],[23],[1001],[965,34],[583,3,1],[170],[26],[821],[233],[182],[186],[688],[688],[562,3],[307],[313,440,28,2,2,150,3,39,15],[803],[302,1,316],[804],[652],[440],[898],[879],[875],[761],[76,1,1,111,9,31,19,47,277,4,73,12,23,14,257],[959],[228],[932],[368],[291,3,43,274,169,37,153,7],[123],[123,651],[58],[162,18,108,75,376,241],[378,240],[843],[233],[571,7],[130],[64,1],[19,14,6,3,10,1,1,1,3,2,3,17],[985],[781],[294],[185],[375],[118,2,1,455,8,369],[121],[350],[320],[14,60,36,79,534,33,29,153,15,14],[454],[380],[568,11],[320],[296],[205],[203],[168],[243],[110],[779,8,128],[921,7],[396],[61,49,1,11,1,49,14,62,66,67,300,9,8,40,83,144,35],[0,15,1,1,5,4,1,5,10,2,1,1,8,1,5,13,1,1,3,2,15,2,1,1,4,3,1,1,1,2,1,1,3,1,4,3,2,2,1,2,1,2,2,1,1,20,2,2,2,2,3,1,1,13,1,6,3,6,1,2,37,20,22,13,1,5,26,15,1,1,4,2,1,1,1,1,1,1,1,5,1,4,7,1,5,2,179,7,3,4,1,1,3,3,1,2,1,3,6,7,15,1,22,5,6,10,34,32,2,9,14,3,2,3,2,1,3,1,1,3,1,1,1,3,3,2,1,7,2,1,12,1,4,1,4,2,1,1,2,4,1,2,1,3,1,1,8,17,10,1,1,1,3,2,1,1,1,1,1,1,1,16,12,3,1,7,7,1,1,2,9,4,2,5,1,4,5,12,3,10,6,1,3,1],[4,1,2,1,6,1,1,1,1,1,2,1,1,1,1,1,2,1,1,2,4,1,6,1,1,1,7,1,3,2,1,2,2,1,1,1,1,2,1,2,1,2,1,1,1,1,15,2,1,1,3,1,2,1,1,1,2,2,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,13,7,3,1,1,1,1,2,1,1,1,2,2,2,2,3,1,2,1,1,1,1,1,4,3,1,1,2,1,1,1,4,5,13,4,8,3,4,1,11,4,8,8,1,11,4,2,1,6,1,1,1,2,1,1,7,2,6,2,1,1,2,1,1,1,1,1,1,1,3,4,1,3,1,1,2,1,1,2,3,3,2,3,1,1,1,4,1,2,2,1,1,1,11,16,5,25,112,8,4,5,1,3,1,8,2,1,4,1,1,3,3,4,2,2,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,2,2,1,1,1,1,1,3,1,1,2,2,2,2,1,1,1,2,1,2,3,1,1,1,6,3,4,3,1,1,2,1,1,2,1,2,1,3,2,1,1,1,1,1,1,1,18,1,2,1,5,2,2,11,15,4,2,1,1,1,1,1,9,2,1,1,3,1,1,1,2,2,9,9,6,1,1,2,4,2,4,1,1,2,4,1,1,1,2,1,2,2,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,4,2,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,1,2,1,2,1,1,1,4,1,3,1,2,1,9,1,1,1,1,1,3,1,2,9,1,1,3,1,5,1,1,4,2,1,4,3,1,3,1,5,1,3,3,1,2,2,1,1,4],[783],[90],[0,1,4,9,1,1,8,2,2,1,1,1,6,5,1,9,5,3,3,1,1,3,8,1,3,17,6,1,1,1,8,2,1,6,4,1,4,1,1,1,2,21,4,1,1,2,1,6,6,1,4,2,1,4,8,3,26,1,15,1,8,23,12,4,3,1,6,3,12,12,53,3,69,103,1,14,6,1,8,1,30,8,1,3,4,13,2,7,9,49,1,8,2,2,5,5,1,1,12,17,7,5,43,1,1,23,65,3,4,24,4,9],[947],[126,2,6,39,9,94,344,61,34,36,92,105,1],[75],[71,43,60,774],[18,154,623],[742],[181,18,136,16,227,42,319,26,27],[0,1,3,3,9,2,1,1,1,2,1,3,1,9,6,1,1,7,2,1,2,1,1,1,1,2,1,3,1,6,5,1,15,7,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,2,1,1,1,1,2,1,2,2,4,1,1,20,4,1,1,2,1,1,1,1,1,2,3,1,1,2,3,1,2,1,1,1,7,2,3,43,32,1,11,4,2,1,1,6,6,18,5,9,13,1,1,8,3,7,2,6,27,154,6,35,16,1,1,3,6,17,2,3,2,1,1,6,3,4,12,10,2,3,18,1,2,1,5,2,3,4,24,3,2,12,2,6,4,2,105,21,4,28,10,4,2,19,21],[15,833,77,60],[112,1],[301],[573],[979],[55,146,727],[105,63,163,324],[7,64,37,25,18,11,70,63,18,34,586,18],[186],[105,29],[95,12,2,5,6,1],[317],[116,50,773],[715],[676],[669],[787],[514],[547],[120],[130],[18,77,3,5,1,10,20,30,10,475,3,122,6,36],[210],[111],[253,114,158],[28,32,52,12,1,7,113,128,304,84,236],[19,318,274,75],[542,456],[423,89],[345],[691],[751],[879],[155],[155],[31],[111],[178],[518],[102,63],[163],[890],[890],[67],[211],[565,39,16],[624],[189],[498],[379,344],[7,131],[327],[325,2,4,4],[117],[116,531],[156],[622],[186,441,375],[18,3,9,728,58,126,43,18],[16,797,135],[498],[177],[690,10,1],[471,1,17],[404],[404],[1,3,3,1,7,1,1,6,5,2,14,1,4,13,5,4,8,1,15,7,3,3,2,3,1,7,6,1,1,1,1,1,1,1,1,2,25,3,1,1,2,1,2,1,3,4,2,2,2,2,3,7,4,26,4,5,3,4,4,8,4,16,6,6,4,3,1,6,1,3,1,1,6,9,3,1,1,1,1,4,4,3,1,2,1,1,1,3,5,2,6,1,3,4,5,4,33,25,16,96,17,1,3,5,1,1,22,3,4,11,1,1,2,1,1,1,1,1,1,1,1,1,3,8,1,9,13,11,7,1,1,2,1,1,2,1,1,1,1,2,1,16,3,1,9,1,11,17,4,2,12,1,1,1,3,1,2,2,8,3,10,14,1,2,1,1,8,1,37,15,9,4,2,17,11,12,1,2,4,2,5,2,1,2,6,10,2,2,2,3,12],[273],[295],[878],[377],[344,31],[587,1,61,13],[649],[344,23,3,7,1,4,206,142],[106,66,7,116,433,31,188],[878],[86,143,105,548,120],[311],[967],[937,10,4],[684],[195,474,191,26],[123,165,444],[825],[219],[292],[320],[366],[368,1,3,6],[185],[313],[187],[762],[270],[721],[256],[20],[919],[181],[655],[125,54,33,36],[23],[172],[16],[27,97],[107,125],[966],[170],[180,183],[756],[785],[785],[40,313,21,2,190,24,13,134,73,25,4,11,5,35,28],[383,28,109],[342],[453],[129,217,29,209,6,13,120,85,4,1,1,13,8,6,15,2,9,12,13,4,2,3,40,13],[589],[357],[935],[119,15,41,121,351,239],[323],[130],[296],[150],[810],[296],[20,4],[835],[835],[523],[375],[372,3],[913],[188,106,43,11,18,9,318,3,84,37,75,78,22],[358],[335,12,11,1],[252,11],[0,37,6,2,22,43,25,27,27,47,117,100,126,1,1,1,28,31,6,12,21,78,4,2,90,61,44,2,18,19],[944],[930,3,21,11,3,3,1,7,3,3],[714],[868],[349],[276],[575],[796],[306,1,1],[16,16,10,130,93,631],[363],[971],[39,3,134],[239],[4,23,83,166,511],[576],[576],[182,445,272],[810,4,12],[816],[275],[191],[343,1],[512],[333],[831],[665],[859],[70],[305,15],[859],[80,569],[575,77],[371],[130],[356],[826],[71,56],[15,1,3,26,8,1,1,1,2,2,16,1,18,3,9,11,2,6,3,9,23,4,4,5,8,3,1,1,2,116,43,30,4,237,4,3,23,145,24,1,140],[7,155,679,9,4,10,10,101],[16,2],[61,56,379],[0,69,64,3,439,11,175,19,32,110,29,7,22],[385],[401],[405],[392],[405],[690,10,2],[911],[787],[665,158,1,1],[787],[19],[70],[118,5,6,47,4,5,480,276],[379],[636],[26,99],[176],[98,19,71],[732],[558],[244],[955],[572,15,1,74],[781],[7,746,3,18,3,1,3,2,132,15],[784],[113],[738],[920],[921],[56,4,2,49,121],[337],[172],[79,614],[121],[796],[718],[23],[16],[751,168],[276],[71],[172],[726],[37,43,15,39,39,16,1,150,31,403,181],[818],[18,104,76,94,300,146],[119,234,17,12,395,17],[43],[723],[30],[532],[648],[299],[189],[608],[912],[972],[1,56,71,2,5,2,30,20,1,1,39,1,63,63,396,166],[19,6,35,2,16,32,7,10,2,35,26,38,17,439,243],[78],[14,42,23,45,40,80,518],[961],[959],[169,79],[16,3,8,26,26,16,2,1,13,1,4,5,2,2,4,37,10,9,59,32,12,6,71,12,173,260,6,2,80,1,16,16,12,54],[567,1],[774],[568],[880],[880],[875],[48,27],[56],[56],[436,8],[444],[314],[776],[349,608],[172],[121,13,19,139,646],[914,12],[95],[169,126,283],[347,261,109],[758,3,1,1,1,2,50,113,30],[131],[131],[928],[105,24,681,6,2],[116,10,859],[176,9,670],[176],[60,37,65,7,19,125],[1],[76,789],[879],[248,417],[192,2],[192],[23,144,21,14,3,169,354,4],[31],[728,1,4],[72,53,8,44,3,7,170,542,19],[153],[835],[59,47,543],[68],[68],[174,102,286,359,10],[337,605],[172],[124],[875],[649],[536],[851],[189],[102,87],[811,13,19,5],[953],[850,29],[172],[882],[433],[433],[843],[752,1],[24,587],[187,381,146],[843],[843],[598],[595,2,1],[597],[382,238],[385,23],[901],[647],[644],[371],[60],[365],[539],[133,5],[158],[166],[345,378],[168,20,1],[312,64,399,8,132],[558,8],[518],[925,3,57],[1,4,9,814,85,4],[847,42],[612],[181,4],[659],[46],[492,39],[383,34,60,3,2,3,2,4,5,53],[109,79,149,328],[898],[651],[951],[185,386,188],[133],[133,5,1,3,1,9,1,2,2,2],[57,23],[16,2,25,16,19,2,26,22,2,84,30,33,18,39,6,7,318,65,2,24,6,15,9,21,25,2,7,14,16],[335,3,12,11,1],[334],[848],[350,14,247,67],[443],[462],[504],[21,89,62,123],[352,3],[815],[613,4],[166],[175],[175,359],[170,5,6,3,755],[367],[184,546],[201],[240],[177],[115],[136],[588],[114,2,16,1,1,29,7,17,89,62,296,57,39,2,49,167],[70],[55,253],[901],[614],[198,11],[269],[579,1,3,3,2,65,9,2,1,1,1,1,1,1,1,2,6,1,1],[835],[66],[105,9,16,33,9,17,67,4,364,268,50],[163,11,71,80,392],[28,32,2,16,52,5,28,9,1,9,20,234,278,14,10,13,8,1,88,44,83,22,5],[28,74,64,23,168,19,195,143],[102,86,1],[428],[917],[189],[662],[765],[288,339],[435],[210,40,111,8,128,162,56,1,1,3,18,117,30,9,77],[425],[425],[732],[896],[536],[121,13,161,56,57,348,182],[596],[107,79],[413,23,502],[111],[175],[622,1,2,2,2,1,6,175,28,40],[631],[630],[121,2,47,521,46],[855,44],[850],[164,735],[108,19,9,212,3,1,5,9],[105,13,3,5,775],[112,6,9],[95,10,1,1,1,2,1,1,1,1,1,1,1,1,4,4,2,1,1,1,3,1,1,193,35,7],[812,125],[135],[130],[841],[1001],[1,1,2,11,1,3,1,3,1,1,2,1,11,6,7,1,6,1,1,2,1,8,4,2,2,15,2,1,5,8,1,3,1,2,1,1,1,1,1,1,2,1,1,1,1,1,3,2,17,10,3,1,1,1,3,1,3,3,1,2,1,3,1,2,1,1,1,6,30,48,1,11,4,3,5,4,33,3,2,2,1,1,2,2,1,1,2,1,2,2,5,6,1,2,1,2,1,1,4,1,167,7,16,2,1,1,1,2,4,24,10,2,2,5,2,7,13,3,17,16,3,10,17,10,3,2,2,5,25,12,1,3,3,4,2,4,2,1,2,14,2,4,1,6,1,1,6,1,2,7,7,2,10,14,16,8,1,2,14,4,2,4,3,1,9,9,4,2,2,1,1,4,1,5,9,1,1,5,2,11],[7,104,27,50,14,99,153,104,227,163,1],[63,2,7,46,633,84,84,11,43],[181,452,1,6,349],[617],[606,28],[558,4,4],[118,17,30,15,369,217,83,90,6,3,1,1,4,4],[393],[723],[813],[374],[172],[369],[368,1,3,6],[436,2],[808,7,28,17,38],[177,513,13,3,2,1],[121],[176,139,1,70,6,119,39,102,3,35,1],[183,5,187,410],[49,1,250,12],[23,1,36,129,125,416],[850],[135],[292],[293],[485],[383,1,30,109],[553],[955],[110],[568],[101],[762,4,41,28],[89],[824],[676],[871],[60,332,208,7],[930,1,2,26,1,3,35,3],[931,3,1,29,34,1,1,3],[490,60,1,71,336,18,26],[425],[153],[804],[814],[172,207,178,1,160],[308,21,55,78],[658],[579,1,3,3,1],[264],[553],[911],[95],[831],[871],[673],[38],[38],[179],[997],[30],[337],[921],[922],[916],[118],[497],[104],[374,4,4],[344],[901],[922],[919],[852],[852],[921]],"ngrams":{"100":[5],"aan":[2673],"aar":[28],"aba":[191,599,1017,1,134,997,1485],"abb":[402,1,337,1,1450,1898,1,1417],"abd":[29,1],"abe":[2973,1340,112],"abi":[31,1,372,1,386,1018,447,1,1,1,272,1,1,145,928,820,953],"abl":[33,373,390,363,453,44,1,1,58,1486,1006,315,121,592,70,9],"abo":[34,1,372,1206,1,763,302,1,389,1],"abr":[2681],"abs":[36,1196,3157],"abu":[37,2635],"aby":[38,2644],"aca":[39,1,1,1,1,1,106,74,518,64,1,1,267,385,1127,1,1,323,1,1,1,1,24,3,128,288,248,320,92,1016],"acc":[45,1,1,1,1,1,3851,190,224,80,719],"ace":[160,2,93,20,47,2,17,12,172,94,32,31,53,27,28,22,28,11,28,19,15,71,128,88,64,8,1,12,6,153,19,6,147,92,4,18,7,59,11,3,1,4,263,34,4,33,97,70,7,117,32,152,59,16,113,98,30,14,99,23,93,1,54,37,2,98,84,104,37,107,47,48,10,17,17,1,187,54,45,66,31,10,44,86,11,2,32,249,248,84,26,78,110,38,50,13,69,181],"ach":[51,226,1,1,92,1,1,93,6,106,62,432,391,102,50,1236,66,556,85,113,469,1,325,247,90,1,333,1,1,1],"aci":[52,1,1,1,1,335,352,187,255,1,5,621,1,330,293,36,1,712,334,40,482,398,615],"ack":[374,1,1,32,1,1,1,151,1,1,1,1,1,74,886,665,238,160,1,1,1,1,90,1,1,232,466,176,493,98,634,482,249],"acl":[442,3874,380,310,1],"aco":[57,1,686,775,1,717,102,127,129,346,1,1,124,95,510,162,61,197,335,780],"acq":[59],"acr":[60,1,1,1,1,1263,1592,1,1,348,339,1,708],"acs":[2811,1507],"act":[65,1,1,1,1,1,1,247,1,42,16,35,1,229,103,186,1,1,1,1,49,49,90,189,502,522,1013,235,138,227,258,1,1,1,1,189,538,203,1,400,1],"acu":[72,1,1388,3502,332],"acy":[2687],"ada":[74,1,1,1,920,1099,1,816,1,8],"adb":[674],"add":[78,490,1,1,1,175,582,1,1359,874,1,756,1,599],"ade":[79,394,99,1,380,68,348,824,105,298,139,188,417,503,664,175,290],"adf":[655,4457],"adg":[414],"adh":[80,1,1,1],"adi":[84,216,115,159,1483,87,265,341,860,1,482,1,1,1,1,1,1045,1,227],"adl":[1233,3832],"ado":[395,918,236,1481,1,581],"adp":[4948],"adr":[936,3141,1,175,175],"ads":[302,172,101,101,638,623,362,1,1264,1043,4,20,482,333,69],"adu":[85,1,2108,1905],"adv":[87,1378],"adw":[2751],"ady":[2689,1,1],"aea":[288,1328,1774,303],"aec":[747,174],"aeg":[88,1,1,1],"aei":[758,670,2182],"ael":[922],"aem":[2261,1],"aen":[420,1,327,1689,1,1127,180],"aeo":[289,3281,1],"aeq":[92],"aer":[93,99,767,1958],"aet":[918,1538,1290],"afa":[94],"afb":[2753],"aff":[1330,808,1,615,2000],"afi":[3042],"afl":[2755],"afr":[95,1,1,1,1,4272],"aft":[100,4000],"afy":[2756],"aga":[101,1,1,1,1,1,1,1,233,1,14,1459,1,1106,22,417,1020,1],"age":[109,158,80,184,87,122,1,8,25,1,63,141,1,52,54,364,15,458,1,1,1,1,1,58,1,840,1,880,159,454,62,373,1,54,149,1,292],"agf":[2263,1,1837],"agg":[110,1,1220,3177],"agi":[112,507,1,96,61,62,319,1896,185,447,636,968,1,5],"agl":[1566],"agm":[4949],"agn":[113,1503,1308,1,1,1],"ago":[114,1294,14,113,1,1,1,1,519,634,1,1,361,692,468,213,205,903,1],"agp":[2928],"agr":[3445,984,557],"ags":[1929,2580],"agt":[5372],"agu":[280,1537,780,39,2509],"agw":[4102],"aha":[4323],"ahl":[1332,3965,1],"aho":[2929,684,1,816],"ahs":[943,4506],"aia":[280],"aid":[643,2052],"aig":[4816],"aik":[416],"ail":[115,275,209,70,384,129,651,132,447,376,1198,93,1,23,1,144,380,322,1,1,1,165,254],"aim":[750,997,1,1,2575],"ain":[630,14,275,250,1,1,162,207,1390,1,1,1,261,1,206,165,274,1,264,1,1,1,1,70,1,1,21,123,581],"air":[116,1,1701,1,446,1,1,1,1,1298,1,1,381],"ais":[1334,2776,1263,1],"ait":[417,4729,229],"aiz":[2934],"aji":[4111],"ajo":[2656,279,1],"aka":[5233],"ake":[418,1,57,758,696,766,1,240,333,345,1014,1,1,1,189,133],"aki":[2938,25,1363],"akl":[477,4931],"ako":[5076],"aks":[478,1741,52,1124],"aky":[1931],"ala":[118,1,263,1,1,36,1,1637,1,1,293,161,1,151,1,116,156,1,1,1,1,1,1,1,581,43,1,177,579,1,22,605,565],"alb":[120,1],"alc":[122,629,1,1,1,1,165,900,1,1,1118,1461],"ald":[123,1,1],"ale":[58,45,23,5,36,20,69,20,20,46,12,13,14,9,11,21,91,91,16,32,31,53,20,1,23,14,47,39,20,68,147,21,16,49,4,60,21,6,153,9,6,249,4,95,8,46,1,198,1,17,11,23,4,37,26,67,176,33,13,4,17,147,42,21,39,47,11,16,112,22,1,4,3,122,187,7,14,105,147,13,22,17,20,128,4,8,34,16,17,57,24,124,99,151,37,42,7,25,2,55,212,386,137,124,1,60,68,1,1,98,21],"alf":[127,690,1453,1],"alg":[128,1,1,2951],"ali":[60,1,27,38,5,1,85,168,1,406,26,785,91,59,348,9,266,63,519,1,46,99,142,31,272,1,8,275,248,153,95,360,1,1,23,1,7,19,352,145,28,99],"alk":[133,2816,1809,1,1,616,1],"all":[134,1,1,1,1,1,1,1,1,1,192,200,223,1,1,1,172,156,99,1,68,18,147,102,49,21,107,11,1,2,46,10,52,1,72,167,1,1,1,1,35,4,88,1,144,197,197,133,84,122,104,104,24,47,52,10,54,106,1,23,19,104,29,1,235,69,24,16,2,226,63,121,112,1,1,72,3,166,28,18,1,1,47,34,38,1,115,83,44,22,85,1,1,1,1,105],"alm":[144,1,278,3152,1,1,1,564,188,1,802],"aln":[5383],"alo":[89,57,1,1,1,37,201,1,1,309,64,133,1,1,1353,650,145,1,208,376,1,1111,215,213],"alp":[150,2801,1,627,1,1,1,100,1,649,1],"alr":[5384],"als":[151,67,206,21,362,383,26,609,286,332,68,80,369,46,9,56,34,171,10,444,304,49,12,336,43,18,519],"alt":[152,1,1,1,1,1,606,3571,1,1,1],"alu":[356,2597,1398],"alv":[158,402,1,1711,682,1,1,1382,962],"alw":[159,4182,1],"aly":[194,570,1,1,1,955,1,2663],"alz":[160],"ama":[161,1,1,1,1,756,1,1320,345,263,1477,1,415,215,1],"amb":[166,1,1,1,256,220,123,155,1,1,1913,384,891],"ame":[170,1,1,597,1,1,1,1,153,389,108,119,345,1,1,126,53,1,1,1,1,626,105,270,199,1,230,198,6,329,303,75,82,265,56],"ami":[101,1,71,138,509,1006,1,105,427,340,1,1,212,1,825,1357,183],"aml":[4822],"amm":[2273,1,683,1,1,1,1],"amn":[174,2528,1080,1,433,814],"amo":[175,1,1,1,1,1,1,14,579,1,40,193,2066,86,1272,665],"amp":[182,1,1,1,591,1,558,432,936,1,345,1,533,1,1326,1,390,1],"ams":[1022,314,1,1,937,126,1713,709,685],"amu":[2360],"amy":[186,1,1,779,2650],"ana":[190,1,1,1,1,1,231,353,1333,1,70,54,249,102,204,171,1,625,314,1,746,1,309,1],"anb":[1235],"anc":[87,109,1,1,52,15,381,1,1,1,1,65,765,35,102,116,50,557,358,7,260,408,213,441,167,151,417,100,75,300],"and":[199,1,227,1,1,1,766,143,443,363,1,130,75,189,37,1,11,35,82,1,1,1,1,221,35,1,1,1,143,162,11,1,150,151,1,1,1,1,491,245,1,12,1,1,1,1,1,1,1,1,1,38,431,242,1,324,98,37],"ane":[133,68,1,1,1,77,1,1,1,1,495,1,455,1,68,201,436,656,1,371,1,1,86,1,105,323,238,110,1,740,280,9,10],"ang":[205,1,1,1,1,1,1,1,1,1,92,1,124,378,1,117,1,736,18,90,57,1,1,228,11,3,204,192,169,1,72,1,120,141,1,1,1,1,497,1,13,104,523,1,1,613,232,204,137,1,205,9],"anh":[215,3605],"ani":[216,1,1,1,1,404,158,1,1,1,1,1,1,1,240,209,1,71,1,446,360,1,1,244,63,61,226,265,56,1,50,323,81,1,1,196,162,834,296],"anj":[432],"ank":[433,1,1582,1821,281,521],"ann":[221,1,1,567,1,1,1,1281,95,2206,853,1,1,1],"ano":[224,1,484,269,1,1,332,1449,290,1,8,15,408,98,1200,300,25],"anp":[3593],"ans":[183,43,166,355,3,310,129,71,12,107,23,172,258,125,109,361,246,736,66,17,1,62,35,99,408,16,309,490,222,13,1,1,1,1],"ant":[37,2,1,1,1,1,118,30,36,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,125,198,197,30,115,6,14,39,21,86,124,30,168,68,51,6,84,19,3,1,1,155,48,292,369,220,1,1,1,262,1,1,1,1,1,1,5,1,1,367,64,133,38,1,1,1,10,111,36,84,1,1,1,1,1,1,115,1,59,133,26,118,1,1,52,1,208,412,261,107,17,174,1],"anu":[245,1,530,2210,612,521,1,1185],"anx":[435],"any":[247,2682,58,1230],"anz":[960],"aob":[436],"aod":[5022],"aon":[2901],"aor":[2526,2371],"aot":[248],"apa":[249,547,1803,1000,754,1,609],"apb":[4642],"apd":[4633,520],"ape":[250,1,1,545,1,442,835,121,1,513,890,1,520,389,1,1,452,1,1,1],"aph":[253,1,645,441,84,737,168,1,717,571,504,1,265,580,1],"api":[255,1,2974,1,371,1,1,751,1,1,613,46,370],"apl":[2278,1,709],"apo":[257,1,1,1,1,1094,1,985,1,298,592,28,359,505,234,1,596,68,1],"app":[262,1,1,1,1,1,1,1,1,1,1070,939,438,1086,830],"apr":[239,33,527,626,2935,1,1,1,1],"aps":[800,1,1,624,507,39,2964,487],"apt":[74,1,1,1,196,530,1,588,2733,1,455,958],"apu":[805,2800,1420],"aqu":[274,1,1,2639,1554],"ara":[161,89,12,3,12,1,1,1,1,1,1,1,1,56,1,464,1,1,1,1,120,1,1,1,1,1,1,188,351,194,920,660,357,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,694,66,86,1,208,287,9,213,112],"arb":[286,1,150,1,1,372,1,1,2176,1243,1,640,1,514,1],"arc":[228,60,1,1,1,1,1,99,422,78,45,784,627,371,271,1,1,25,127,1,1221,1,1,1,64,331,90,21],"ard":[28,383,70,1,5,240,88,1,1,1,485,230,472,71,97,75,33,1,286,210,1,1,67,1,1,393,293,95,1,1,738,602],"are":[263,31,1,1,144,43,268,43,25,26,280,443,715,560,166,43,581,1,493,617,407],"arf":[595,967,1834,1369,1],"arg":[297,1,1168,1,1,210,1042,1,1,1,270,1,1,880,892],"arh":[814],"ari":[44,22,37,1,1,1,1,133,59,82,103,268,1,57,10,1,26,3,1,58,12,105,33,1,128,1,414,116,15,266,50,1,71,73,106,423,272,1,1,53,238,5,220,7,16,98,266,78,14,104,128,216,72,60,70,25,1,271,18,1,274,73,1,1,1,1,1,219,2],"arj":[2999],"ark":[28,180,233,420,481,1,1074,308,275,30,571,779,134,1],"arl":[1031,538,1,507,1211,357,29,716,378],"arm":[118,182,1,1,1,2698,1912,477,1],"arn":[442,380,1,1,1,1,1,517,2684],"aro":[304,1,633,1700,1,997,112,567,80,39,539,374],"arp":[323,127,378,1,1,1,2240,1445,1,1,214,242],"arr":[306,1,1,1,1,133,389,1,1,1,1,1,1241,1,205,850,141,362,1,1,1046,1,1,823],"ars":[266,219,370,16,131,508,61,4,119,386,470,37,10,241,164,1,1,1,1,289,44,301,1,34,239,50,805,206,1,1,1,533],"art":[229,20,62,1,1,1,1,1,1,1,1,519,1,506,212,15,1,1,1,1,726,705,1,192,442,1,1,1,1,1,1,1,130,991,622,1,111],"aru":[3650],"arv":[2285,1,440,1,1,1],"arw":[1577,1,1698,1245],"ary":[162,678,1,163,438,1,102,182,1,1,35,966,808,213,1,228,293,20,149,1,5,212,652,1],"asa":[444,1,2832,477],"asc":[321,1,1,1,1,1,1,1,1,1,1,1,1,197,2392,87,2305],"ase":[334,1,111,396,519,110,1,187,655,1517,59,287,812,420],"ash":[336,507,1,991,2890,20,317,376],"asi":[337,1,1,1,42,1,64,1,1,1,1,1,1,1,1,1,1,388,94,640,90,73,38,960,1,508,153,1,217,1,1,1,1,1,1,1,324,1],"ask":[458,1476],"asm":[1617,53,930,385,768,92,192,942],"aso":[4436],"asp":[341,1,1,1,1854,1930,1267,1],"ass":[309,36,1,1,1,1,1,1,1,107,1,1,102,88,1,194,1,176,1,1,282,39,316,485,1,51,1,1,1,743,65,1,640,1,1,1,1,1,1,1,713,53,5,135,120,215,86,512],"ast":[163,190,1,1,1,218,1,1,81,91,100,1,30,1,95,1,85,1,1,517,1,37,218,1,245,1,1,1,1,1,3,667,255,41,251,133,222,3,110,74,1,6,574,229,21,1,209,286,163,1,60,115,1],"asu":[850,1,12,2169],"asy":[357,1,1,988,1,1596],"ata":[72,59,197,33,504,30,50,34,3,25,257,1,325,166,117,291,570,52,182,85,110,258,144,28,67,7,181,1,225,143,152,374,199,7,76,168,8,5,122],"atb":[596],"atc":[853,1115,194,127,1,723,372,276],"ate":[50,7,17,79,5,2,71,40,46,33,12,1,1,1,1,165,3,1,1,1,22,252,2,41,1,125,3,27,1,23,31,12,43,73,51,9,34,8,54,23,11,54,13,25,39,3,7,59,9,21,1,24,1,200,86,1,1,93,1,87,55,40,181,109,12,2,15,20,15,8,1,13,152,1,1,1,1,229,14,36,1,112,126,145,62,38,55,49,60,69,62,28,29,1,8,44,1,77,37,112,1,35,3,3,12,153,100,38,1,5,10,30,70,12,168,1,28,19,44,1,132,137,22,95,3,3,1,6,66,1,68,1,1,1,1],"atf":[463,393,1080,235],"ath":[113,127,49,78,1,96,194,1,1,1180,3,1,1,92,227,139,1,437,17,548,264,58,35,1,115,290,63,390,178,214,25,1,305,165],"ati":[63,12,18,17,22,22,120,30,35,12,471,1,183,60,1,30,24,3,29,227,49,155,106,174,5,52,76,1,100,5,18,134,80,110,8,38,34,120,1,90,1,279,74,39,127,22,6,53,121,37,13,4,373,31,37,3,93,84,1,39,1,1,1,10,13,6,133,34,97,277,60,25,417,68,1,23,1,24],"atk":[857],"atl":[369],"atn":[858],"ato":[138,327,394,41,112,58,114,209,34,275,442,841,106,210,1,32,1,64,234,120,135,14,37,1,17,1,242,501,1,73,30,47,269,46],"atr":[120,250,96,2551,1,113,1749],"ats":[467,1,129,263,1,80,644,367,220,1,85,383,378,24,332,509,251,78,178,1066,21],"att":[148,1,222,1,1,1,1,1,1,200,285,979,97,1,297,784,645,1,726,1011,1],"atu":[262,1584,1,641,533,1,84,130,43,1,1,1716,1],"atw":[1940,225],"aty":[2331,1521,1,1,1,1,1,1],"atz":[2366],"auc":[863,2804],"aud":[119,259,486,1],"aug":[2738],"aui":[3023],"auk":[379],"aul":[380,486,2802],"aun":[1842],"aup":[5063],"aur":[291,90,1070,1288,1,1,1,43,1588,1,399],"aus":[382,1,1,1,1,1,1,1,1,1,97,379,1,869],"aut":[392,1,2889,1,1697],"ava":[846,180,6,1206,1,403,1733],"ave":[97,11,276,10,92,383,1,756,578,87,310,142,1,15,1,543,833,257,1,601,159,257,1],"avi":[502,1,1,367,1,1,1215,204,992,453],"avo":[395,1,3980],"avy":[2305],"awa":[397,3678,1,361],"awb":[4820],"awd":[1241],"awe":[2603,1835],"awf":[2604,1774,1],"awk":[2293,1,2392],"awl":[1242,1363],"awn":[3954,1],"awo":[1298],"awp":[3669],"aws":[1027,1565,14,57,253,754,710],"axa":[4981,1],"axe":[398,2069],"axi":[399,1661,723,241,1,938,418,1,1],"axo":[400,3229,1354],"axs":[1941],"axu":[4984],"axw":[5405],"axy":[3775],"aya":[2353,161,1,1084,1386],"ayb":[470,2557],"aye":[2746,1,1391],"ayf":[1243,108,1677],"ayi":[1358,1390],"ayo":[2749,1604,1],"ays":[159,1319,1129,339,47,1146,418,237],"ayt":[1352],"aza":[401],"aze":[2089,117,89,1,2471],"azi":[653,1496,58],"azo":[164,1],"bab":[402,1,1,1,1,1,29],"bac":[408,1,1,1,1,1,377,522,215,280,516,107,1623,98,288,346,329],"bad":[414,1],"bae":[175],"bag":[740,1],"bai":[390,26,1],"bak":[418,1],"bal":[420,1,1,1,1,368,360,421,235,343,1903],"bam":[425],"ban":[191,235,1,1,1,1,1,1,1,1,1,1071,436,2697,638],"bao":[436],"bar":[437,1,1,1,1,1,1,2395,101,662,631,1,621],"bas":[176,268,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,102,1217,2644],"bat":[93,27,342,1,1,1,1,1,1,642,1343,52,751,119,2103],"bay":[469,1],"bba":[740,1],"bbe":[588,1538,217,3071],"bbi":[2191,1898,1,327,998,1,91],"bbl":[402,1,286],"bbo":[2127,2109,1],"bca":[597],"bco":[4855],"bcu":[4856],"bdo":[29,1],"bea":[472,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1687,46,52,129,1,442],"bec":[487,1,1,1,1,770],"bed":[492,2327,34,1572,989],"bee":[493,1,1,1,1,1,1,1,211],"bef":[501],"beh":[502,1,1,1],"bei":[506],"bel":[437,70,1,1,1,743,1,1461],"ben":[511,1,1184,983,1,740,1775,130],"ber":[438,32,43,1,1,1,1,1,1,1,44,1,23,2,333,1,1,310,49,337,22,1,234,248,59,122,36,79,48,359,228,160,1,4,154,291,461,185,239,90,178,376,221,110],"bes":[521,1,1,1686,645,1506,837,1],"bet":[439,85,1,1],"bey":[527,2446],"bia":[182,1,2495,2404],"bib":[528],"bic":[192,337,3832],"bid":[874,935],"bie":[31,373,134,78,1558,3205,128,26],"bif":[530,1,575,2376],"big":[532,1],"bii":[1519,656,1214],"bil":[32,502,1,1,1,1,1,1,1,1,54,78,1582,146,723,352,160,131,97,652,5,13,194],"bim":[543,564],"bin":[760,115,161,54,1,20,1080,2064,179,981,1],"bio":[184,360,1,1,142,362,595,22,1415,1,523,163,593,566,1,1,1],"bip":[547],"bir":[230,175,103,40,1,1,1,1,1,13,25,43,32,63,497,659,136,178,230,80,180,18,46,155,218,71,1,180,53,108,516,317,45,9,17,93,129,131,5,72,9,299,1,217,5,33],"bis":[554,237,1553,127],"bit":[555,1,1,1,1,726,1,492,479,1,1,272,1,1,1556,1,767,26,14],"biu":[768,752,1735],"biv":[560,1,1763,1,1,758],"bje":[3397],"bla":[347,215,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1659,1958,725,254],"ble":[33,369,1,3,122,50,1,1,1,1,63,44,22,85,591,94,131,44,1,288,875,146,1,22,213,993,1,12,315,121,405,187,70,9,42,31,1],"bli":[583,1075,58,460,56,1166,1,798,356],"blo":[584,1,1,1],"blu":[588,1,1,1,1,1,1],"bly":[166,993,830,1943],"bmo":[1051],"boa":[595,1],"bob":[597,1,1],"bod":[600,1,1],"boh":[811],"bok":[603],"bol":[322,127,149,6,1,1,1771,692,1],"bom":[607,1,204],"bon":[609,1,1,1,1,1,1,198,495,278,541,2109,1],"boo":[407,18,191,1],"bor":[117,50,119,1,331,1,1,1,1,1,990,1,698,2545],"bos":[613,1540,702,1136,1,866],"bot":[592,32,1,1,1,1],"bou":[34,595,1,1,190,1858,1,2476,1],"bov":[35,597,1],"bow":[634,1,1,983,2487],"box":[637,1],"boy":[639],"boz":[177,1102],"bph":[4859],"bpo":[4860],"bra":[640,1,1,1,1,1,1,1,1,1,1,1,1,1,964,116,176,656,1,132,360,1,1,313,562,92,910,300,89,1,1,1,1,9,1,1,180,1],"bre":[654,1,1,1,1,1,1,1,1,450],"bri":[663,1,1,1,1,1,1,1,1,1,682,857,470,1723],"bro":[673,1,1,1,1,1,1,1,1,1198,1],"bru":[626,56,1,1],"bry":[685,1,1,1,958,1,1,1],"bse":[36,3364],"bso":[1502,3359],"bsp":[5419],"bst":[2856,2006,1,1],"bta":[599,454,2348],"bte":[4865],"bti":[4866],"btr":[4867],"bub":[689],"buc":[690,1,1,1],"bud":[694,1,1],"buf":[697,1],"bug":[699,1,1,1989,197,140,185,1469],"bui":[702,1,1,1],"bul":[121,585,1,1,1,1,2258,2231,1,1],"bum":[711],"bun":[37,675,1,1],"buo":[715],"bup":[716],"bur":[717,1,1,1,1,1951,2670],"bus":[139,29,1,387,166,1,1,1,1,1,175,67,123,618,1166,652,266,201,306,34,441,98],"but":[728,1,1,1,1,1,1,443,312,1,2623],"bux":[735,1],"bwe":[1068],"byc":[607,1],"byr":[2682],"bys":[38,700],"byt":[3965,1],"cab":[740,1],"cac":[651,91,1,1,1,963,764,1,439,349,2023],"cad":[395,351,251,316,1,1599,1],"cae":[747,1,680,3272],"cag":[749],"cai":[750],"cal":[103,193,62,186,108,38,61,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,39,1,126,13,79,123,68,41,18,43,142,133,1,41,74,3,1,9,1,383,794,40,94,141,1,128,9,154,130,123,376,288,1,1,309,11,161,66,57,44,146,46,1,137,1],"cam":[768,1,1,1,1,1,1,1,1,1,1810],"can":[39,1,1,1,1,53,75,593,14,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,281,882,631,173,598,248,69,11,1,1,16,314,219,149,172,316,259],"cao":[742,2159],"cap":[239,556,1,1,1,1,1,1,1,1,1,1,550,1,1354,520,1,1,1156],"caq":[2915],"car":[44,279,127,37,264,1,1,53,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,893,266,589,333,87,62,957,361,1,342],"cas":[46,104,22,670,1,1,1,1,1,1,1,1,1,12,796,1743,1,75,449],"cat":[559,38,255,1,1,1,1,1,1,1,1,1,1,258,1,259,134,78,376,194,331,636,205,1,177,267,105,507,1,814,251],"cau":[488,375,1,1,1,1,1],"cav":[869,1,1,1,1,3520,1],"caw":[2916],"cay":[1357,1],"cbi":[5181,1],"cca":[45,1,644,2712,1],"cce":[47,1,1539,3281],"cch":[3901,414,80],"cci":[49,4002],"cco":[50,625,3416,1023],"ccu":[3404,1,1],"cdy":[1588],"cea":[160,2,93,20,47,2,17,12,78,94,94,32,31,53,27,28,22,28,11,28,34,57,1,13,128,23,1,64,64,8,1,12,6,20,133,19,6,147,92,4,25,70,8,144,119,34,4,33,97,70,124,32,152,75,113,98,30,14,99,23,93,1,54,37,2,98,46,1,1,36,104,37,95,12,47,40,18,17,109,96,54,45,97,10,2,42,86,11,2,32,249,202,130,26,78,70,40,38,1,49,13,69,181],"ceb":[139,621,114,1,27,67,741,1166,1425],"cec":[876],"ced":[87,790,1,2861,273,132,10],"cef":[4240],"cei":[3863],"cel":[879,1,1,1,1,1,1,1,1,881,28,909,214,302,26,1,162,1,1,268,313,1258,1],"cen":[47,240,259,342,1,1,1,1,1,1,355,147,1,1,1,188,106,4,319,507,1,1184,124,1,252,60,1093],"ceo":[898,1425,1541],"cep":[60,1,65,769,1,1,872,1,1,217,388,1151,31,588,88],"cer":[236,455,207,1,1,1,1,1,1,1,1,1,1,1,1,1,1,32,1,766,448,1641,1,134,65,220,193,754],"ces":[48,95,53,1,1055,228,250,81,713,267,498,499,206,7,344,523],"cet":[104,1,207,17,1,122,360,101,1,1,1,1,410,143,55,1,220,34,900,81,20,1,163,204,59,59,41,114,55,265,8,119,204,322,273,1,299,197,125,246,9],"cew":[2683],"cha":[288,1,525,104,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,288,224,13,1,1,304,684,461,73,1,1,42,1,16,171,354,325,414,80,591],"chb":[4801],"che":[51,239,35,47,1,78,21,23,54,98,1,81,213,1,1,1,1,1,1,1,1,1,1,120,66,111,649,70,194,127,473,32,1,1,81,25,268,166,49,88,47,151,39,114,1,120,401,2,480,72,23,214,1,99,234],"chi":[529,120,1,111,44,48,39,61,1,1,1,1,1,1,1,1,1,1,1,1,1,173,450,1,1,26,116,451,106,50,173,256,28,120,48,179,35,274,26,26,1,205,91,225,23,91,254,71,471,202,139],"chl":[967,1,1,1,1,1,1,1,1,1,1,21,1,3230],"chm":[1463],"chn":[277,1,1,2196,2515],"cho":[198,93,25,54,22,74,429,83,1,1,1,1,1,1,1,1,496,110,129,1396,1,245,90,781,162,687,85,6,1],"chr":[139,848,1,1,1,1,438,906,2944],"chs":[2037,1,979,128,228,1431],"cht":[981,2534,1624],"chu":[992,1,622,8],"chy":[640,354,1,1,1352,1210,75,1507,226],"cia":[157,30,73,90,1,179,675,510,37,1,59,2157,675,1,43,1,1,1,1,169,28,377],"cib":[1989],"cic":[997,1,1,1,2230,1,1,997,464,361],"cid":[52,1,1,44,24,397,384,17,271,168,352,1420,354,69,180,1,26,230,345,77,693],"cie":[2143,2550,1],"cif":[391,129,234,176,784,1845,153,69,260,654,9],"cig":[1001,1],"cii":[1185,1,2333,307,1],"cil":[607,1,139,256,1,2181,262,61,186,3],"cim":[4397],"cin":[55,333,516,1,100,1,1,1,461,344,623,36,1,1311,218,49,191,156,1,40,419],"cio":[1206,246],"cip":[49,7,3820,109],"ciq":[743],"cir":[1009,1,1,1,1,1],"cis":[1015,1,1,1481,1494],"cit":[1018,1436,1,1212],"ciu":[261,494,2968],"civ":[1019,1,2802],"cka":[953,117,1520,1],"ckb":[563,1,1,1],"ckc":[567],"ckd":[2592],"cke":[375,34,108,1,123,313,301,169,539,955,373,93,167,323,772,224,176,1,220,218,1,30],"ckf":[2593,1664,1241],"ckh":[4607],"cki":[587,2098,417,24,1745],"ckl":[1071,1121,194,36,1555,1,106,701],"cko":[1280,1,1,809,254],"ckr":[1072],"cks":[376,34,299,246,572,23,825,219,92,606,380,381,205,527,1,262,36,1],"ckt":[692],"ckw":[411,282,346],"ckx":[2648],"cky":[4787,15],"cla":[574,1,446,1,1,1,1,1,1,1,287],"cle":[442,587,1,1,1,274,10,1,1482,434,1,136,1,1,271,757,1,295,310,1,13,236],"cli":[1005,28,1,1,1,1,1040,422,1547,270],"clo":[1006,32,1,1,1,1,1,1,1,1,1,1,612,1],"clu":[1049,1,1,1,1,1,1,1,717,1,726,1,1,1,1644,1],"cne":[1058],"cni":[1059,1],"cno":[4067,1],"coa":[937,124,1,1,1,1,1,1,3360],"cob":[322,746,451,1,1075,1173,1],"coc":[323,579,167,1,1,1,1,2599],"cod":[324,750,184,1,1,2782,1044,1],"coe":[57,1018,1,1,1,1,1182,1501,8,265],"cof":[1080,4056],"cog":[2160,1989],"coi":[1081,920,465,108,493,1636,536],"col":[325,1,349,341,1,65,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,485,1,869,1,759,305,266,159,42,407,1],"com":[50,54,1,1,221,1,1,1,1,158,1,1,253,365,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,225,110,192,842,353,606,250,58,627,6,722],"con":[1000,136,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,640,1,655,465,1,863,635,1,1,413,33],"coo":[428,1,644,108,1,1,2908,1],"cop":[903,1,1,1,278,1719,1,16,116,50,76,87,465,31,18,9,2,86,35,471,39],"cor":[58,129,998,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,245,142,72,671,104,624,141,1,41,1,113,49,264,362,1,366,1,1,1,1,1,1],"cos":[332,878,385,642,668,38,1424,1,1,666,172],"cot":[106,57,90,19,59,118,4,121,179,242,216,1,1,1,216,257,1,36,1,7,423,493,509,1,20,31,95,439,308,240,24,98,556,322,246,9],"cou":[1215,1,1,1,1,1],"cov":[1221,1,1,1],"cow":[1225,1,1,1],"cox":[1229],"coy":[1230],"coz":[3834],"cqu":[59],"cra":[1231,1,1,1,1,1,1,1,1,1,1,1,1,2141,398,1],"cre":[1244,1,1,1,1,1,1,1,1,109,414,1,1,1492,1048,97,1,28,1,1,1,1,712,221,100],"cri":[257,996,1,1,1,1],"cro":[60,1,1,1,1,1194,1,1,1,1,1,1,1,1,1,1,1651,1,1,159,1,1,1,1,1,1],"cru":[1269,1,1,1,159,1793,362,830,1],"cry":[1273,1,1,1,51,2281,1,612],"cta":[1612,171,761,749,1,1,12,871,30,488],"cte":[412,519,1,1,1,1,98,122,122,1,34,1165,1,42,18,21,829,634,181,6,620],"cti":[66,1,1,1,159,64,453,239,159,13,1,8,1,1,317,1,309,248,1,502,1,82,709,12,17,23,560,54,2,1,17,1,139,1,25,1,20,1,189,454,18],"ctl":[1486,1006,2338],"cto":[78,215,68,727,508,218,1438,44,12,105,1,1,1,1,65,196,318,1],"ctr":[413,1211,2237],"cts":[70,307,265,1905,5,845,144,463,1138],"ctu":[71,1634,1639,1496,1],"cty":[318,1,2017,1248,138,1216,604,1],"cub":[1279,1226],"cuc":[1280,1,1,1,1,1,1],"cud":[4418],"cul":[72,1,195,49,9,55,628,1,1,1,236,35,4,1,95,439,286,434,594,99,1,182,41,1,184,1,22,12,47,393,1,85,1,213,544,351],"cum":[876,137,271],"cun":[1822],"cuo":[1164,125,4006],"cup":[730,560,1,1,1,1,1,1,2108,513,1],"cur":[567,718,1,11,1,1,1,1,2104,1,746,268],"cus":[136,197,56,517,396,1,158,512,371,514,1,1,251,99,1012,177,71,572,98],"cut":[1304,1,1,1,1,1,3547],"cuñ":[5343],"cya":[1310,1,1],"cyb":[1152],"cyc":[1313,1,1,1,1,1482],"cyl":[1318,1482],"cym":[1319],"cyn":[366,954,3959],"cyo":[907,1,83,1949,589,469,403,879],"cyp":[762,159,400,1,1,3044,54,1],"cys":[1324,1,2544,1],"cyt":[978,101,247,341,1591],"dab":[4523],"dac":[162,156,1,5,660,343,1009,288,925,35,138,634,582,604,1],"dad":[1241,87,1],"dae":[39,1,21,27,2,11,4,10,4,120,9,63,53,6,50,1,93,93,25,84,36,6,3,4,1,4,7,6,35,56,29,7,2,2,3,1,4,55,28,1,11,16,17,8,100,33,7,9,5,135,28,53,3,88,35,61,28,63,5,7,12,6,4,8,74,33,145,24,27,88,22,34,138,26,2,18,59,12,2,1,2,8,14,1,2,4,50,36,100,43,56,67,22,47,12,4,20,12,97,1,1,2,7,1,41,18,10,1,12,15,20,6,46,12,31,20,17,9,14,28,4,54,33,32,16,4,16,33,4,40,12,2,5,14,4,15,1,3,36,45,4,6,5,5,3,3,1,12,4,1,40,7,3,2,18,6,3,5,9,14,16,8,77,11,10,25,10,6,1,18,102,12,33,6,3,5,104,3,18,59,174,97,30,66,69,27,50,52,7,29,16,23,10,20,10,13,4,35,31,32,22,49,4,21,40,9,8,163,5,3,8],"daf":[1330],"dag":[267,1064,1591],"dah":[1332,4117],"dai":[1333,1],"dal":[186,327,30,4,317,1697,989,80,1,446,1,263,1,15,357,1,151],"dam":[815,520,1,1,1,1500,75,1],"dan":[37,1302,58,267,1924,1,1],"dap":[74,1,1,1,1263,1],"dar":[877,182,1,282,1,1,1,200,2330,566,1,226,1,863],"das":[997,349,1,1,749,492,1002],"dat":[50,845,87,1,210,156,2607,1,1],"daw":[2592],"day":[1350,1,1],"dba":[4151],"dbi":[674,2033],"dbu":[3212],"dca":[5457],"dcr":[5480],"dcu":[4152],"dda":[4523],"dde":[568,1,1,1,1775,342,874,980,377],"ddi":[694,52,582,2825],"ddl":[1881,1207,475,756,1],"ddu":[78],"ddy":[1329],"dea":[89,97,14,59,23,11,284,31,291,12,9,70,219,111,33,23,49,124,95,113,104,97,43,235,145,85,9,60,237,87,22,38,23,42,1,70,177,13,257,79,55,117,100,11,42,85,5,46,234,127,82,296,146,152,21,70,163,30],"deb":[1354],"dec":[1355,1,1,1,1,1,1],"ded":[473,8,105,57,402,353,99,290,188,323,90,1174,723,222,48,348,578],"dee":[953,409,1,2808],"def":[1364,1,1,1,1,3314],"deg":[1369,1,1],"deh":[1372],"del":[1339,34,1,1,1,56,875,1921,1053,170],"dem":[1377,288],"den":[970,408,1,1,1,1,1,1,15,677,102,104,64,133,27,1692,32,29,1,127,61,638,1,87,1,26],"deo":[1525,1,433],"dep":[79,1306,1,1,1,1118],"der":[123,1,1,443,1,1,1,132,380,76,1,36,193,1,1,1,1,1,196,30,1,1,228,234,442,162,55,384,1,157,1,148,2,44,1,466,4,335,41,1,212,2,64,101,1,1,182,28,84,82,113,42,1,1,1,1,1,1,139,67],"des":[156,168,198,51,317,318,187,1,1,1,1,1,1,1,1,1,345,636,116,236,363,202,38,95,71,149,246,221,22,412,12,404,259,222,1],"det":[1405,1,1,1,1,1098],"deu":[1410,1],"dev":[1412,1,1,1,1,1,1,1,1,3821,6],"dew":[3092,1465,327],"dfi":[427,55,2366,365,943,956],"dfl":[2980],"dfo":[2708],"dfr":[655],"dfu":[2276],"dge":[414,281,902,1,708,783,559,595,206,1],"dgr":[4343],"dhe":[80,1,1,1],"dho":[1421,1288,1635],"dia":[448,566,408,1,1,1,1,1,717,364,49,480,1,277,304,190,36,192,56,1,1],"dib":[2966,1,1,405],"dic":[53,215,160,1,999,1,1,1,293,1,1955,40,6,150,220],"did":[119,296,1017,285,1,2325,1165],"die":[600,1,727,105,1,1,3217,1,191,271],"dif":[258,104,104,890,80,1,620,647,425,1,285,110,351],"dig":[1438,1,1,1,1068,2463],"dii":[3461],"dik":[1442,1],"dil":[300,958,1,1,70,114,1,2913],"dim":[1446,1,1,2078,767,158],"din":[579,115,10,112,1,1,631,1,1,215,107,9,6,63,125,385,8,133,248,116,408,407,350,198,141,301,350,109,241,111],"dio":[253,196,1,1,1,1,1,120,421,316,141,1,1,326,700,423,1,992,28,173,26],"dip":[84,1371,1,1,1,1,1,1,1,1912,308,1,1673],"dir":[1463,1],"dis":[746,719,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,919,1201,1,487,55,70],"dit":[378,763,1188,1,2813,1],"diu":[1149,342,1548],"div":[1492,1,1,1,1,1,1,1,1011,1],"dko":[2668],"dla":[4345,1138],"dle":[712,521,648,1207,210,1,264,756,1,396],"dli":[4157,297,611,393],"dlo":[5484],"dly":[2568],"dna":[1500,89],"dne":[2649,565],"dno":[2440,1],"dob":[1502,1918],"doc":[907,1,759,846,1522],"dod":[1503,2727],"doe":[1504],"dof":[865,2767,404],"dog":[1505,1,1,1,1,1274,922],"doi":[920,70,559],"dol":[1510,1,1,1992],"dom":[29,1,1483,1,1,1,1,151,846,1,1354,90,1,507],"don":[62,694,458,109,107,29,59,1,1,817,1,20,82,76,496,33,114,262,1,149,291,125,668,122,224,21,502],"doo":[5153],"dop":[513,800,356,1,1114,1253,1,193],"dor":[1521,1,1,1,1588,311],"dos":[967,536,168,1,1,1,1111,1,1253,1],"dot":[1525,1,1,2237],"dou":[1528,1,1895],"dov":[1530,1],"dow":[1532,1,1497,1,2424],"dox":[3612],"dpe":[4346,1139,1],"dpi":[4347],"dpo":[4948],"dra":[811,561,162,1,1,1,1,1,1,1,901,1297,689,205,453,88],"dre":[1542],"dri":[936,45,337,225,1,1425,148,1,1884],"dro":[970,575,1,897,1,1,1,1,1310,1,349,123,853,4,88],"dru":[878,669,2530,1,175],"dry":[1548,1],"dsc":[2710],"dsh":[2300,117],"dsk":[3215],"dsn":[4456],"dsu":[587],"dsw":[5487],"dua":[2194,316,1],"duc":[78,1062,2,1,407,967,1024,458,1,1,1,1,1,150,34,1,1],"due":[1551],"dug":[1552,1],"dui":[5344],"dul":[85,1,1468,1,1576,564,404,732,417],"dun":[1556,1],"duo":[1359],"dur":[1558,1,2665],"dus":[1560,1,957,262,260,1,1],"dva":[28,59,1378],"dwa":[1562,621],"dwe":[1563,1],"dwi":[2355,1993,1144],"dwo":[2751,1404,132],"dyb":[2689,1],"dyf":[2691],"dys":[1588],"dyt":[5176],"eab":[1942,2482,1,1],"eac":[160,312,106,987,2106,1,21,327,120,1,286],"ead":[302,171,1,162,18,1,12,43,643,584,336,24,1,1,1,251,199,1,279,1,1397,179,4,20,105,328,1,380,1,7,62],"eae":[160,2,24,69,20,6,41,2,17,12,78,94,94,32,31,53,27,28,22,28,11,28,91,1,13,128,23,65,64,9,12,6,20,133,19,6,80,67,92,4,95,8,144,119,34,4,33,97,70,124,32,152,75,113,98,44,99,23,93,1,91,2,98,84,104,132,12,47,58,17,109,96,54,45,97,10,2,42,6,80,11,2,116,165,202,130,26,78,70,40,38,1,49,13,69,181],"eaf":[2752,1,1,1,1],"eag":[1566,50,1211,1,1601],"eah":[4430],"eak":[475,1,1,1,18,160,1563,52,2550,167,419,1],"eal":[286,850,67,251,969,967,361,270,121,289,706,383],"eam":[1542,858,1,2013,18,390,1],"ean":[200,279,550,243,473,213,103,547,677,1,121,1,1,27,1429],"eap":[3804],"ear":[250,14,1,1,214,1,1,1,1,1,545,1,536,1,1,1,1,1,1,1,1,1,1,1,595,128,1,541,444,1,385,1,1,468,290,1,87,990],"eas":[295,106,229,27,704,110,1,107,1,1,362,147,667,275,405,317,423,41,217,1,241,1,45,266,420,103,1],"eat":[72,159,427,1,1,33,172,379,338,1,1,1,258,1,1,1,1,316,45,95,1,80,374,275,760,66,325,28,1,309,253,380,90,11,154],"eav":[486,546,1273,454,1,2651,1],"eaw":[4437,1],"eba":[175,1,4263,346],"ebb":[5414,1,1],"ebe":[590,121,1474,24,213,421,2574],"ebi":[591,75,94,114,1,1146,887,289,1,1337,1,868],"ebo":[177,415,716,278,726,2844,1],"ebr":[626,728,555,656,1,1369,1391,1,1,1,192,1],"ebs":[5418,1],"ebu":[139,763,67,741,1166,11,1414,475],"eca":[296,191,1,867,1,1,1,1403,915,11,197,816,334],"ecc":[1587],"ecd":[1588],"ece":[3289,855,1,1,155],"ech":[494,1,1094,1,1,1,31,1139,272,1,1955],"eci":[260,1,127,359,156,1,1,454,93,263,2008,103,1,861,1,1,1,1,1,1,1,411,160],"eck":[517,1364,82,128,1199,1,1,259,1934,1,12],"ecl":[4147,1],"eco":[489,1,1,869,233,1,1,1441,641,128,55,289,291,1,1,261,332],"ecr":[1361,3082,1,1,1,1,712],"ecs":[1261,3743],"ect":[343,745,66,1,1,1,248,191,15,1,12,80,1,78,709,27,1,17,1,5,1,1,1,1,5,7,734,1,1,1,11,1,89,85,196,183,144,1,16,1,1,139,1,532],"ecu":[136,253,487,30,2205,25,543,543,248,572,98],"ecy":[921,1878,1],"eda":[547,330,668,2411,1,1,119,1],"edb":[4151],"edc":[4152],"edd":[4153,370,19],"ede":[890,960,1250,1044,304],"edf":[4156],"edg":[1597,1,708,2143,1],"edi":[579,435,837,706,480,1,1,232,409,1,1,1,126,67,575,679],"edl":[3298,1,858,297],"edo":[756,458,216,2529,1,1564],"edr":[878,2861],"eds":[1852,812,432,714,348,297,1,146],"edu":[3040,1,1,1112],"edw":[4155],"eec":[494,1,2267,2397],"eed":[579,82,1188,1,1,1,60,29,723,432,201,1,1,822,35,1,1,280,15,1,1,1,146,613],"eef":[496,3663,1],"eek":[942,1477],"eel":[1599,1,1,252,1112,719,1476,270],"eem":[3300,1157,1],"een":[422,75,29,1236,448,1,1,763,1107,377],"eep":[1245,1,116,1281,1881,80,1,171,383,2,219,100],"eer":[1363,1680,1128],"ees":[498,213,242,7,411,721,810,62,2198,1,1],"eet":[499,1,58,385,911,1024,153,13,571,910,390,1,75],"eev":[5420],"efe":[1364,2597,1,199,1],"eff":[1602],"efi":[202,391,18,698,56,1,1,523,277,19,472,4,636,265,251,103,60,263,442,28,718],"efl":[1145,765,1,2252,1,1,465,178],"efo":[501,867,701,118,443],"efs":[496,3664],"ega":[110,236,1257,22,1420,1,1,436,1863,1],"ege":[1604,2562,1149,1,1],"egg":[1605,1,1,1157],"egi":[88,1,1,581,3496,1,651],"egl":[2765],"egm":[4460,1,1,1,802],"ego":[91,3334,59,1293],"egr":[1369,1,1,2532,1],"egs":[2766,1241],"egu":[1990,585,192,1,1401,1],"egy":[1683],"eha":[502,1,1],"ehe":[667,3944,20,814,1],"ehi":[505],"eho":[2306],"ehy":[1372],"eic":[3515],"eid":[758,219,451,879,148,1155,80,141,32],"eif":[1055,1732,1432,1304],"eig":[1608,485,215,3113],"eii":[3052],"eil":[4526],"ein":[506,760,2502,257,146,1147,1],"eio":[2769,279],"eir":[3858,1178],"eit":[1609,1],"eiz":[4465],"eja":[2663],"eje":[1611,1],"ekk":[2094,1],"eks":[2419],"ela":[879,1,195,538,1,1,1,1,1,478,1,1,951,1,1,1,1,633,486,1,1,1,1,290,797,18],"elb":[1619,688],"eld":[1620,1,1,260,1,417,9,2158,67],"ele":[361,1,1,277,241,41,4,697,1,1,1,1,1,1,1,41,12,71,27,72,457,109,286,607,375,20,470,415,400,1,44,123,364],"elf":[206,1130,1,1,293,1,952,2166],"eli":[91,130,32,111,1,2,140,169,94,174,1,170,1,223,360,104,1,51,1,1,1,1,1,451,290,318,135,1,188,1,3,1,5,52,327,56,1,117,1188],"elk":[1633,3798,94],"ell":[167,341,23,222,18,9,1,13,88,1,1,1,1,1,42,50,1,273,1,196,113,1,70,1,133,28,127,1,1,1,1,1,161,60,163,4,237,1,55,1,1,1,1,35,50,17,143,1,38,252,21,8,43,189,77,164,11,28,303,40,195,63,236,1,1,57,35,1,373,170,86,1,1,169,92,1,1],"elm":[1636,1,676,1,1540],"elo":[57,175,134,143,567,1,1,334,1,1,1,1,1,1,220,1,1,1,48,172,1195,189,166,1,1829,6,154],"elp":[1374,1,1,56,168,715,329],"els":[207,1,476,88,829,695,351,22,208,295,68,493,831,187,658],"elt":[3691,839,1,92,1],"elu":[510,1132,2536],"elv":[2316,2216,507,281,1],"ely":[271,771,82,490,72,88,24,923,88,63,1255,48,1084,192],"ema":[1862,1,1300,138,1,661,111,105,1,1,92,213,1,365],"emb":[347,1296,1,1,1,1,1,1,1408,1,1,1,1134,1,1,1],"eme":[307,1070,249,1,23,1,44,102,1,1406,1,1688,1,271],"emi":[946,706,13,134,518,1,1864,286,1],"eml":[2319],"emn":[4470],"emo":[201,1,1,744,111,742,191,270,1,508,937,257,219],"emp":[1653,667,2676,1,1],"ems":[1595,2863,321,167,93],"emu":[989,665,1,1116,1,1],"ena":[1656,1,1,779,11,1105,140,1425,207,179],"enb":[2211,1328],"enc":[1013,646,1,1,1,117,239,505,1,29,1080,61,273],"end":[267,1,702,426,1,1,1,264,1,1,1,1,1,1,1,1,1,1,1,1,111,1,1,1,717,237,761,191,31,504,376,91,303,1,1,84,1,87,1],"ene":[51,1625,3,14,188,57,161,1,1,1,1,1,1,1,1,175,727,767,390,658,222],"eng":[1677,460,637,1,921,697,1,77,353],"eni":[420,345,614,1,64,1,314,349,1,1,1,101,98,128,132,109,1,115,126,155,1,343,36,1,206,34,1,1,46,17,1,821,70,50],"enl":[1678,1],"enn":[233,1,346,1,1,1739,1,1393],"eno":[136,68,217,206,121,140,191,198,1,402,1,9,550,216,1,1,1613,1,1,582,1,124,37,378,127],"enp":[5003],"enr":[5004],"ens":[30,26,269,19,107,503,163,198,49,17,1,99,309,165,61,149,142,184,285,1,19,211,68,210,82,61,236,36,382,54,219,117,1,1027],"ent":[36,11,216,24,11,9,45,159,1,34,284,59,1,1,1,1,1,234,45,76,134,1,15,17,1,19,1,150,39,1,50,5,1,1,1,1,1,1,3,1,4,1,63,1,7,96,1,1,21,1,1,223,1,366,27,21,27,249,401,1,143,146,1,1,7,34,97,67,7,17,4,60,43,1,135,5,36,1,26,49,60,41,1,11,61,1,33,94,61,3,9,1,1,1,20,7,70,295,33,5,1,111,1,1,124,20,50,37,24,3,58,100,78,40],"enu":[2114,947,504,1759],"env":[1689,1,1,1],"eoa":[3303],"eoc":[1693,1611],"eoe":[621],"eof":[2115,1190],"eog":[289,1827,1190,210,1,53],"eoh":[3571],"eoi":[282,1,3202,379],"eol":[158,3149,1,63],"eom":[284,1,1240,1,168,368,2930],"eon":[922,4,2776,84,1,1061,53,452],"eop":[362,722,875,195,624,1,1,529,1,582,890,356],"eos":[1247,507,1557,1,1681,361],"eot":[2781,1,530,1,1,1384],"eou":[751,147,407,393,625,142,804,1307,280],"epa":[4474,1,1],"epe":[1245,1,1260,1678,420,1,554,221,100],"eph":[60,1,65,651,118,1,1,731,1,1,65,681,686,253,212,31,676,547,70,186],"epi":[1696,1,1,1,781,303,1,1,1,1,968,722,1,683],"epl":[4185,591],"epo":[126,1259,1],"epp":[3703,1],"epr":[1387,2799,1,1,1,1],"eps":[1988,2837,1],"ept":[79,1309,355,26,1,1,1017,1,916,441,45,1,287,1,1,1,345],"epu":[1248],"epy":[3872],"equ":[92,1608,1,1,825,1666,290,1,1],"era":[73,280,1,180,1,238,125,1,1,44,1,14,4,121,55,20,70,163,2,68,62,121,50,8,363,33,1,1,1,1,14,1,1,127,1,70,31,61,49,11,176,1,86,1,1,50,252,10,58,1,22,182,20,36,93,49,87,113,108,1,44,30,2,30,201,43,234,1,101,79,244,62,109,1,1,83,55,31,1,28,331,12],"erb":[513,43,78,95,892,702,1,1,1,1,757,517,1724,74,61],"erc":[730,171,1,1,1,1,1,805,23,808,917,1,207,41,1,1,1,1,1,1,70,562,67,475,12],"erd":[907,1,4333],"ere":[80,844,5,84,147,62,214,1,227,40,1,1,138,337,137,10,562,28,260,44,166,263,64,220,457,313,13,1,63,182,77,383,9],"erf":[124,86,1,520,1,1,889,504,366,1224,1,231,108,271,240,86,236,119,161,73,15,143],"erg":[1492,158,1,25,31,55,545,2936,1],"erh":[2273],"eri":[56,25,18,41,30,1,1,54,9,120,13,44,9,92,1,22,1,84,74,214,5,17,1,1,1,1,13,85,190,89,77,1,253,1,64,1,31,1,50,103,67,103,406,7,1,43,34,180,6,120,56,55,42,1,58,10,233,1,192,86,1,56,1,1,1,1,1,61,1,1,1,1,1,1,39,15,122,36,10,99,116,325,1,1,1,63,154,77,104,3,75,182,63,89,86,32,59],"erk":[2274,769],"erl":[1903,59,594,1457],"erm":[209,1182,1,1,1,12,184,82,192,1,1,218,36,1,131,77,1,1,115,14,47,50,1168,226,748,1,1,1,239,1,67,1,1,1,1,1,387],"ern":[153,1,360,43,12,446,566,29,63,119,75,691,156,1,1,1,411,225,312,1,1012,1,1,203,132,230,181],"ero":[93,99,44,455,133,449,137,1,284,387,73,4,173,3,1,1,1,725,314,194,130,307,38,1,173,671,151,129,355,14],"erp":[854,1,1108,370,1223,170,764],"err":[438,32,45,1,1,1,46,1,25,359,286,386,564,149,88,407,388,1,743,1,166,363,151,178,45,27,124,1,1,1,129,213,1,1],"ers":[125,106,172,3,8,5,64,3,31,1,40,12,52,40,41,222,31,100,89,6,73,18,4,38,60,1,6,9,17,64,17,6,12,17,1,1,1,46,21,20,39,62,161,5,3,12,13,26,43,4,12,1,4,1,164,10,19,1,38,5,18,51,9,1,99,12,37,126,1,55,10,29,55,38,96,13,6,195,157,1,169,97,43,7,20,6,90,57,23,1,1,72,24,41,134,162,88,3,11,15,1,22,26,16,3,46,21,107,10,9,2,26,26,11,29,74,59,25,78,16,5,17,12,41,16,26,59,23,5,69,30,9,48,143,13,10,7,23,1,37,6],"ert":[910,1,268,221,468,1,1,1,222,250,80,37,88,13,4,1,719,1,766,1274,1,1,1,1],"eru":[1872,1,759,432,2230],"erv":[912,2406,1,81,1092,1,1,1,836],"erw":[571,1991,282,343,1522],"ery":[42,25,206,246,1,361,829,1,52,995,552,71,1,225,163,177,72,29,318,203,763],"esa":[4496],"esb":[3965,1],"esc":[287,259,703,147,1,1,1,313,1,810,1,1561],"ese":[962,438,692,507,1327,41,1,153,65,1,7,1,1,1,846],"esh":[1944,75,1,391,2656,96,35],"esi":[82,1,438,1,804,75,305,100,149,561,549,1,699,1,1,126,305,745],"esm":[324,1078,1],"eso":[1714,1353,1,252,649],"esp":[1715,2484,1,972,161,120],"ess":[48,63,1021,159,1,1,28,66,182,344,37,316,339,160,25,30,469,640,1,1,39,24,503,296,75,84,208,174,131,17],"est":[196,1,326,10,417,94,128,77,1,1,153,35,1,73,1,90,112,1,1,1,11,107,155,1,92,200,1,47,34,161,1,1,33,84,76,78,1,20,43,8,1,340,107,1,1,1,111,108,565,1,92,1,1,417,60,158,179,3,1,314,90,1,28],"esu":[4204],"esw":[5164],"eta":[604,65,143,101,30,169,413,545,307,35,44,325,288,1,1,1,1,1,134,522,713,56,169,298,349,1,1,219],"etc":[4828],"ete":[104,208,17,1,122,153,521,201,78,1,17,47,56,220,29,5,555,1,1,1,166,3,173,81,21,163,204,159,169,94,171,36,91,204,322,49,1,1,223,299,197,24,101,255],"etf":[5190],"etg":[4916],"eth":[1720,1355,671,1245,129],"eti":[105,1319,311,1,40,98,231,1,1161,155,196,10,103,1,18,26,429,1,241,99,116,674,1],"etl":[499],"eto":[914,4,753,106,4,290,1,94,949,58,1419],"etr":[357,1,1,556,492,1,1,1689,251,384,1,1,1,1,99,371,1,1,1,1,1,1,719,1,1,88,1,1,1,1,397],"ets":[439,21,40,520,235,180,521,118,33,206,90,252,50,119,54,123,30,188,396,259,31,595,146,73,631,166],"ett":[524,392,1,1124,750,285,1,249,1,551,93],"etu":[525,1350,1863,476],"etw":[526],"ety":[5309,12],"etz":[4083],"eua":[1721],"euc":[1722,1,2016],"eud":[1724,1,2310,1,1,1,1,1],"euf":[1726],"euk":[1727,1,1],"eul":[1730,1],"eum":[1732,743,1394,1,1],"euo":[1733],"eup":[1734,1,1,1,1,1,1,1],"eur":[1742,1,1,1,1,1,1,1,1,1,4,1573,1,1,44,487,1],"eus":[1752,1,1619,600],"eut":[464,157,789,1,343,1,1633],"euu":[1756],"euv":[2972],"eva":[1757,2277],"eve":[507,905,1,1,1,1,1,1,340,1,1,1,1,1,2210,528,1,739,6,2],"evi":[1252,167,1,4000],"evo":[1764,1,1],"ewa":[4557],"ewe":[662,485,730,35,702,2601],"ewh":[4663],"ewi":[952,1042,689],"ewl":[3332],"ewo":[672,1343,2794,158,501],"ews":[844,2248,1441,11,340,279],"ewt":[3333],"exa":[1767,572,1,1,1],"exc":[1768,1,1,1,1,1,1,1,1,1],"exe":[3228,937,339],"exh":[1778],"exi":[1779,166,1,1132,270],"exo":[1780,1],"exp":[1782,1,1],"ext":[1785,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3226],"exu":[334,1,4170,1],"eya":[390],"eye":[532,1270,1,1,1,1,578,783],"eyg":[2385],"eyi":[2214,1761],"eyo":[527],"eys":[2386,263,54,270,182,356,465,1233],"ezi":[2945,795,1,1,1,1265],"fab":[1807,1,1],"fac":[1810,1,1,1,1,1974,1110],"fag":[1815,1,1,1544],"fai":[1818,1],"fal":[698,1122,1,1,1,1,1],"fam":[1826,1],"fan":[1574,254,1,1,1,1,1],"far":[94,1740],"fas":[530,1305,1,1],"fat":[1838,1,1,1],"fau":[1842],"fba":[4053,1],"fbe":[2271],"fbi":[2753,1302],"fea":[1843,1,1,1,1],"fec":[2492,27,1,279,1],"fed":[1848,541],"fee":[1080,769,1,1,1,1,1],"fef":[2662],"fej":[2663],"fel":[1855,1,1,1,1,1,1,1444,327],"fem":[1862,1],"fen":[1364,2064],"fer":[73,940,126,11,1,285,1,427,1,1,1,1,1,1,1,1,1,648,1401,39,1,94,105,1,117,857,11,1],"fes":[2138,663,1,72],"fet":[1874,1],"few":[1876,1],"fez":[5008],"ffa":[698],"ffb":[4053,1,1],"ffe":[1080,356,1,701,1290,628],"ffi":[2139,615,1303],"ffl":[4550,635,1],"ffo":[1330],"ffr":[2115],"fft":[1965],"ffu":[1602],"fgr":[4899],"fib":[1878,1,1],"fic":[391,989,1749,383,47,1000,136,194],"fid":[1881,258],"fie":[754,710,31,387,1,596,651,383],"fig":[1884,1,1],"fil":[1336,551,1,1,1,1,1,1,1,2142],"fin":[635,730,1,1,265,263,1,1,1,1,1,1,1,1,1,1,1,752,1399],"fir":[1907,1,1,1,1,1,1,1],"fis":[202,4,4,1,216,5,31,19,59,52,2,16,27,95,84,39,181,11,195,64,2,28,170,30,10,82,261,25,1,1,1,1,17,35,55,98,2,22,19,4,15,77,1,29,311,7,1,40,2,8,29,25,38,80,14,45,1,148,53,61,57,85,84,14,167,75,36,140,97,6,60,79,6,27,12,5,50,81,3,87,51,30,1,119,39,86,29,28,40,15,120,16,211,19,38,21,238,70],"fiv":[1920],"fix":[1921,1],"fla":[531,243,1,204,1,470,473,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,581,2731],"fle":[1942,1,1,1,1,2217,1,1,385,635,1],"fli":[124,607,15,592,164,36,39,333,7,30,1,1,1,1,326,478,225,48,1351,31,220,178],"flo":[866,279,206,271,330,1,1,1,1,1,1,1,1,1,1,1,1,559,1,2362],"flu":[1965,1],"fly":[732,1,1178,56,1,1,1,1,1,2439],"fme":[1677],"foc":[1973],"fod":[1330],"foi":[3093],"fol":[275,1,1698,1,1,1,1,1,1],"fon":[127],"foo":[1901,80,1,1,1,203],"for":[43,1,5,7,7,28,30,5,47,18,21,14,32,15,25,64,6,12,86,35,8,11,61,110,93,15,10,5,6,30,42,38,6,63,1,55,30,21,79,98,39,1,33,12,223,49,74,36,70,37,1,127,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,52,3,5,23,87,9,50,19,85,2,18,167,156,21,2,25,42,12,4,2,86,191,150,23,13,4,103,30,26,46,2,19,27,7,3,6,98,33,31,25,2,2,1,29,17,18,94,1,15,9,89,1,3,48,5,62,1,2,108,112,73,162,5,133,37,5,29,32,25,10,9,28,58,2,83,74,34,9,10,28,77,1,2,266],"fou":[2006,1,1,1],"fov":[865],"fow":[2010,1,58,561,78,1549,1143],"fox":[2012,1,1],"fpe":[4900],"fra":[2015,1,510,1845,10,1,1],"fre":[1114,903,1,1,1,507,1378],"fri":[95,1,1925,1,1,1,459,1,1],"fro":[97,1,1,1926,1,1,1,1,1,1,1,83],"fru":[655,1378,1,1,1,557,67,998,1108],"fst":[496],"fta":[1965],"fte":[100,3329],"fts":[4917,247,38],"fuc":[2037,1],"fug":[4658,1],"ful":[1099,4,936,1,1,235,1672,920],"fun":[1726,316,1,1,1,1,1,1],"fur":[2049,1,1,1,1,2825,364],"fus":[1602,452,1,1],"gab":[2973],"gac":[341,1474,1546],"gad":[2057],"gae":[129,4529],"gai":[346,284],"gal":[130,212,14,1247,213,242,1,1,1,1,1,1,1,1,1,716,262,1,208,1128],"gam":[101,1,1966,1,1,1,1,731,357],"gan":[297,1328,448,1,855,156,398,3,1,1,1,1,1,1],"gap":[2075,972],"gar":[103,1,1,1,1,588,306,1,1074,1,1,1,1,558,1,2234,1,1,471,1],"gas":[215,533,463,870,1,1,1,1,1,1,835,22,718,191,803,647,33,1],"gat":[110,28,1015,485,1,382,1263,114,1,670],"gav":[108,1980],"gay":[2993],"gaz":[2089,2678],"gba":[1506],"gbi":[1885,544,697,1539],"gda":[186],"gea":[2090,1661],"gec":[2091],"ged":[306,469,692,211,345,334,407,2700],"gee":[2092],"geh":[2306],"gei":[2093],"gek":[2094,1],"gel":[205,1,1,1,323,448,1,470,473,1,1,1,1,1,168,1,1,623,2532],"gem":[307],"gen":[298,788,1013,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,46,147,246,1,521,267,210,1,110,1,112,390,1375],"geo":[1698,417,1,349,1321,1,1061,53],"ger":[414,281,261,485,223,238,1,1,83,106,24,1,1,1,1,11,1,482,107,142,1529,398,1,168,1,128,1,79],"ges":[267,266,208,97,601,1,158,6,47,422,455,1,1,193,105,37,224,559,468,127,140,67,209,69,29,81],"get":[1995,3125,195,1,1],"gey":[532],"gfa":[3788],"gfi":[1037,470,464,55,237,1,390,239,1,1207],"gfl":[1577,700],"gga":[1331],"gge":[533,423,485,1174,149,2405],"ggp":[1606],"ggr":[110,1],"ggs":[1607],"ggy":[4508],"gha":[2122],"ghb":[3865],"ghe":[2350],"ghi":[2738,213,1],"ghl":[2351,1,1931],"ghn":[1529],"gho":[2123,1,1887,1060],"ghs":[985],"ght":[663,1,944,198,143,1,358,496,1,1,532,1,1,904,314,50,1,207,243,161,55,146],"gia":[2070,55,344,2261,605],"gib":[2126,1,3400],"gic":[544,1049,1,1581,1,510],"gid":[716,61,381,54,1842,67,199,552,343,1089],"gie":[3921,898],"gif":[273,526,10,941,1489,636,957],"gii":[42,25,2603,640,297,412,347],"gil":[112,559,1353,104,1,1,1086],"gim":[810,941,380],"gin":[619,1,88,131,89,540,24,640,1,1,1,1,1,140,717,1,502,1,619,277,896,1,5,59],"gio":[209,222,3736,1],"gir":[2138,1],"gis":[545,1595,2331],"git":[88,1,1,2776,1456],"giv":[2033,12,1,95,1],"gla":[2143,1,1,1,1,1,1,475],"gle":[210,1,1355,116,947,1,25,110,1813,215,169,503],"gli":[1721,429],"glo":[392,308,1314,102,35,1,1,1,1,1,1,1,1358,1,1659],"gly":[2159,1,1545,1134],"gma":[4949],"gme":[3789,671,1,1,1,799,3],"gmo":[2027],"gmy":[4070],"gna":[113,176,1327,545,1,1,1,1,1141,264,1369,1],"gne":[1401,765],"gni":[4149,410],"gno":[2167,640,117,1,1,1],"goa":[2169,1,1,1,1],"gob":[2174,1,1,1,332],"god":[4777,765,1],"goe":[1449],"goi":[3055],"gol":[2178,1,817,596,623],"gom":[163,2017,1,511,1,468,143,2232,1,7,1,1],"gon":[1135,287,113,1,1,1,1,14,629,1,1,645,601,54,565,18,361,205,537,7,1],"goo":[2185,1,1,960,1],"gop":[2134,1291,322,1800,1],"gor":[2188,1],"gos":[1105,441,386,126,916,1,463,2111],"got":[91,1616,987,1354],"gou":[1408,782],"gpi":[2928],"gpl":[1606],"gra":[309,1060,822,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,528,355,1,354,48,350,60,1,525,365,105,73,14],"gre":[110,1,1259,1,391,446,1,1,1,1,1,1],"gri":[2215,1,1,2874],"gro":[2218,1,1,1,1,1,1,1,1,1,1,1,1,1,745,1,1366,901],"gru":[2232,1,1,1,627],"gry":[2236],"gsp":[2867],"gst":[179],"gta":[4248,1124],"gth":[2738,36,1,2049],"gto":[1831],"gtz":[5509],"gua":[280,1957,1,1,247,1,110],"gue":[615,1625,1686,1196,1,1],"gui":[212,1,1,1273,1,753,144,1311],"gul":[1007,670,79,117,369,1,1,331,990,604,1,975,21,84],"gum":[2245,522,1,2148],"gun":[2246,1,2292],"gur":[2248,463,1],"gus":[1817,230,1073],"gut":[1990,259,1226],"guy":[2250],"gwe":[4301],"gwo":[1509,1387,1206],"gym":[2251,1,1,1],"gyn":[1683],"gyr":[2255],"haa":[2673],"hab":[2256,1,1,1,272,1,1],"hac":[762,3605],"had":[2260,1080,1167],"hae":[285,3,1,629,189,79,565,510,1,194,5,456,337,52,84,136,44,175,1],"hag":[716,61,381,250,855,1,790,1,184,508,468,293,1,477],"hai":[919,1346,1,1,1,1],"hal":[60,1,27,1,37,769,1,1,23,48,1212,90,1,1,104,86,814,9,1,105,136,31,190,1,1,484,794,1,398,1,1],"ham":[921,1,1,1,1,1,1347,1,1,947,994,814],"han":[927,1,1,300,399,1,1,142,504,1,713,1,1,42,1,40,1706,250],"hap":[2278,1,1,2230,1,1],"har":[208,32,554,16,4,47,48,21,1,1,1,1,1,1,1,1,250,1,277,1,1,654,159,1,1,1,1,1,131,634,700,1,27,122,414,8,57,15,118,1,1,1,1,1,422,590],"has":[939,1348,662,36,768,67],"hat":[940,1,1347,1,1,1095,191,641,446,369],"hau":[1737],"hav":[502,1,1,1787,1],"haw":[2293,1,2392],"haz":[2295,1],"hba":[1573],"hbi":[3865,657,279],"hco":[5126],"hea":[180,122,334,31,26,17,1227,336,24,1,1,1,1,1,1,1,1,1449,464,302,1,1,85,4,20,46,1,459,308,1,69],"hec":[136,124,1,127,1,514,1,1,1,2205,612,103,1,395,248,230,3,331,1,7,98],"hed":[290,82,275,623,176,41,565,237,17,2042,175,305,95,204,110],"hee":[942,1,1959,1622,1,905],"hei":[2307,1,1911,307,510],"hel":[91,162,114,577,1,754,610,1,1,1,1,1,1,1,561,293,684,673,1,1,1,1,1,505,394],"hem":[946,1,42,706,622,1,1,1,2718,1],"hen":[51,274,126,1870,1,472,1,1,125,446,1337,120,216,392],"heo":[5138],"her":[80,1,18,41,85,143,253,108,185,34,1,660,1,110,120,3,1,1,123,194,19,123,14,5,1,1,1,1,1,1,1,1,1,1,1,16,96,14,194,87,17,325,1,102,1,166,170,1,70,1,1,228,1,307,547,26,1,335,1,20,5,53,290,23,27],"hes":[82,1,9,110,4,5,33,129,54,36,9,23,54,44,2,16,15,12,10,11,64,10,84,133,87,11,24,66,111,88,210,82,261,8,18,55,55,100,41,4,15,78,29,311,8,40,86,16,8,132,108,110,44,57,85,38,46,3,88,47,118,33,3,36,55,1,1,47,40,57,6,28,32,79,6,27,12,5,199,30,11,63,273,28,66,98,26,1,42,100,30,39,57,21,238,43,27],"het":[2335,1,1,1,1233],"hew":[843,1,107,1,3581],"hex":[2339,1,1,1],"hey":[5044],"hfa":[1574],"hfl":[1917],"hia":[1348,84,301,581,637,1,656,1,98,320,18],"hib":[182,1,1,1594,565,1],"hic":[195,316,442,1,1,492,249,649,2018,629,53,1,1,1,91,40,255],"hid":[254,116,94,297,586,178,1,63,757,1,422,148,227,35,274,8,18,26,1,106,243,195,72,1,210,969,229],"hie":[724,1576,48,2186],"hif":[892,247,1045,156,726,186,107,1416,162,2],"hig":[956,1393,1,1,1],"hii":[910,707,1258,742,849,1063],"hil":[237,529,191,1,100,742,660,1285,2,8,1,1,1,1272,405],"him":[959,1,472,921,2696],"hin":[90,79,46,290,144,11,145,9,39,108,1,412,1,1,112,23,1,78,1,327,361,11,64,1,1,1,156,225,59,168,746,91,55,284,79,1,1,503,101,88,136,228,195],"hio":[650,261,924,416,107,2484,258],"hip":[185,1035,1139,1,1813,50,1,1212,1,1,1,1],"hir":[529,434,1398,2690],"his":[39,1409,914,1,1,1,2687,389,1,1],"hit":[964,1,1,2096,2382,1,1,1],"hiz":[40,1556,72,20,1562,1,974,1,1,168],"hla":[967,764,620],"hli":[998,1,333,2897,1068,1],"hlo":[968,1,1,1,1,1,1,1,1,1,2782,1],"hly":[2352,1931],"hma":[1463],"hne":[1340,1135],"hni":[277,1,4712],"hno":[279],"hnu":[1529],"hoa":[978,1,1,1386],"hob":[1733],"hoc":[236,2139,501,587,298,1,472],"hod":[4043,185,1,1,1,852,91,1],"hoe":[2367,44,1352,772],"hof":[3361],"hog":[392,1914,62,561,734,1,1728],"hoi":[466],"hok":[316],"hol":[1421,171,777,1,1,1,1,1,1,1,1,1,797,1,1,587],"hom":[41,2338,1,1,1,2558,113],"hon":[312,669,740,17,645,1,1,1,731,1,387,1,240,834,1,1,1],"hoo":[2387,1,1,1,1,1,1,1,2002],"hop":[42,195,1964,194,1,1,312,798,100,412,325,44,780],"hor":[370,23,299,203,2,85,1,1,293,1,146,263,711,1,1,1,1,1,1,1,1,1,1,1,1,1,1,45,705,201,90,442,95,21,103,316,106,1,1,259,54,186,17,1,1,392],"hos":[291,221,1611,1,37,3,249,1,660,390,1,1233,359,448],"hot":[947,47,1187,234,1350,1,1,772],"hou":[155,830,497,934,1,1,1,713,1408,518,1,1,1,10,127,276],"hov":[198],"how":[2420,2121],"hox":[2421,1192,1],"hoy":[986],"hoz":[238,4183,1],"hpa":[3200],"hra":[2910,2152,1,216,225],"hre":[4542,1,1,520,1,1,1,96],"hri":[725,557,1031,381,75,546,455,299,476,1,1,421,1,99],"hro":[139,174,1,1,584,88,1,441,281,1,618,1,5,902,1832,1,1],"hru":[244,2494,1810,1,523,1,428],"hry":[989,1,1],"hsh":[725],"hsi":[2037,1],"hst":[1575],"hte":[2805],"hth":[981,706,1828,1624],"hti":[726],"htj":[3339],"htl":[664,1286,856,1803],"hts":[3340],"hua":[2623],"hub":[992,3240,1],"huc":[2422],"hue":[2423],"huf":[4550],"hug":[2424],"hum":[2425,1,1,1,1,1,2645],"hun":[516,477,1438,1,1,1,1],"hur":[43,1572,8],"hus":[764],"hut":[4075,1],"hwa":[2020],"hwe":[4680],"hwo":[553,1023],"hya":[2157,279,1,1,1],"hyc":[431,539,1,164,176,648,1599,123,87,1,1,1,1,152,304,624,304,79],"hyd":[811,561,1068,1,1,1,1,1,1,1,3002],"hye":[981,1467,1067],"hyi":[5139],"hyl":[840,1,59,839,415,295,1,1,1,1,1,1,592,571,10,145,1,1,1,1,1082,217,471,1],"hym":[2456,1,1,1175,1444],"hyn":[1755,1162,536,597,184,844,1],"hyo":[2459],"hyp":[994,1466,1,1,1,1,1,2675],"hyr":[2466,1,1457,1156],"hys":[2468,1,1045,264,1303,285],"hyt":[236,228,176,45,1,1,251,34,1,1,21,1,317,80,255,91,332,1,62,32,641,96,89,819,85,55,1,279,470,32,94,108,203,19],"iab":[4644,662],"iac":[255,20,407,591,171,268,25,962,113,2196,289,69],"iad":[676],"iae":[3537],"iag":[1422],"ial":[157,30,69,20,91,14,149,153,406,4,112,33,207,249,8,11,2,37,1,59,258,47,5,347,67,142,1,21,113,112,27,52,1,1,8,1,22,81,129,132,195,35,106,22,46,186,124,1,1,30,358,162,43,1,1,1,1,169,28,128,249,32,37],"iam":[820,603],"ian":[165,18,97,58,45,3,27,124,69,141,162,151,129,7,64,298,45,509,1,12,345,38,284,167,79,680,9,370,210,245,427,187,133,118],"iap":[1424,1,1,1834],"iaq":[4469],"iar":[66,779,26,133,2013,662],"ias":[434,337,561,406,300,276,135,465,12,742,70,93,115,624,958],"iat":[339,11,1,1076,10,707,413,184,365,1700,136],"iba":[792],"ibb":[2126,1,216,1893,1],"ibe":[1253,1,442,182,592,2082,975],"ibi":[182,1,1,1594,566,127,918,1693],"ibl":[528,859,94,464,44,977,1,965,621,804],"ibo":[821],"ibr":[1879,1,818,675,1957,9,1,1],"ibu":[1177,312,1,1478,2374],"ica":[95,1,7,67,1,1,56,1,129,186,15,92,1,281,13,51,28,95,1,27,109,18,43,62,48,86,79,1,41,73,1,248,43,106,366,1,20,541,95,46,1,54,1,1,29,52,21,1,132,45,85,91,1,31,59,317,142,321,136,11,161,66,57,190,26,20,1,57],"icb":[5181,1],"ice":[142,1,617,184,1,307,445,777,319,286,142,46,413,100,169,290,1,927,51,33,1],"ich":[316,9,45,81,78,232,220,17,1,430,53,993,294,25,1,1,1,425,114,179,5,709,12,107,735,56,29,266],"ici":[98,59,30,1018,1,1925,354,212,37,1,46,95,366,94,357,196],"ick":[518,435,1,1,300,169,921,303,454,875,1,106,523,177,1,1,1,258,1,1,1,36,1],"icl":[1306,771,1566,1377],"ico":[104,1,1,166,156,1,571,16,1,413,294,1,276,475,98,504,145,522,18,1323,1,49],"icr":[1431,1649,1,1,1,1,1,1,138,558,1],"ics":[93,14,827,2380],"ict":[1165,1,1,13,1297,1,859,866,626,1],"icu":[268,49,64,783,219,725,1536,1,81,479,1,1137],"ida":[39,1,21,27,2,8,3,4,10,4,43,59,18,9,29,34,13,40,6,50,1,43,49,1,93,25,84,36,6,3,4,1,4,7,6,35,56,29,7,2,2,3,1,4,55,7,21,1,11,16,17,8,1,1,98,33,7,9,5,135,27,1,51,2,3,88,35,61,28,63,5,7,12,5,1,4,8,74,33,145,24,26,1,88,22,34,138,26,2,18,59,12,2,1,2,8,14,1,2,4,50,27,9,100,43,56,67,2,20,46,1,12,4,20,12,97,1,1,2,7,1,41,18,10,1,12,15,20,6,45,1,12,16,15,8,12,17,9,14,28,4,54,5,28,32,16,4,16,28,1,4,4,40,12,2,5,9,5,4,15,1,2,1,36,44,1,1,3,6,5,5,3,3,1,12,4,1,33,7,7,3,2,18,6,3,5,9,14,16,8,77,11,10,25,10,6,1,17,1,102,12,33,6,3,5,104,3,18,20,39,64,1,109,97,30,10,56,69,17,10,49,1,10,42,7,29,16,23,10,20,10,13,4,35,31,32,21,1,49,4,19,2,40,9,8,163,5,3,8],"idd":[1881,465,742],"ide":[89,97,73,23,11,228,1,86,35,256,12,9,70,169,1,48,1,101,10,56,49,7,65,28,1,23,95,105,8,104,97,1,42,306,40,34,4,81,9,4,56,14,223,87,22,38,23,113,177,13,257,4,28,47,55,19,198,11,37,5,85,5,126,76,78,127,82,69,1,1,1,11,139,1,1,72,146,152,6,3,12,70,31,30,15,30,57,30,87,1,1,1,1,38],"idf":[2980],"idg":[3089,559,595],"idi":[53,200,195,1,1,1,1,1,1,12,529,154,162,469,700,224,611,146,64,1,398,199,100,1133],"idn":[1589,1060],"ido":[513,407,70,1793,1,1,1,919,59,105,1586],"ids":[54,48,20,132,24,5,72,60,104,257,220,2,118,287,338,63,5,47,524,64,257,138,41,76,288,235,148,220,225,155,48,473,139,5,184,137,149,169],"idu":[1359,1151,1,1030,683,607,513],"ied":[600,117,37,78,632,31,984,651,383,1794],"iel":[753,1129,1,266,151,849,1385],"iem":[4486,1],"ien":[1955,536,1003,1,1,859],"ier":[514,210,1223,196,68,73,64,830,606,868,1,324],"ies":[31,93,13,61,206,34,30,47,23,26,16,21,15,115,15,87,14,25,77,145,133,101,6,4,8,156,19,17,39,142,107,84,7,31,116,110,11,92,308,24,106,99,2,45,67,52,48,189,485,213,6,160,4,43,251,31,78,85,57,63,1,114,11,1,24,174,97,46,147,71,128],"iet":[1434,1,3874],"iev":[507],"ifa":[530],"ife":[73,1066,11,1,1511,1,135,1,1,1,1,71,1,1048,357,1179],"iff":[1436,1,3351],"ifi":[391,363,626,84,31,984,173,477,1,382,1,46,1000,136],"ifl":[531,335,4387],"ifo":[43,1,5,7,7,28,30,5,47,18,21,14,32,15,2,1,22,64,6,12,86,43,11,61,110,93,15,10,5,6,30,42,38,6,63,1,55,30,21,79,98,39,1,33,235,49,74,36,70,37,1,199,3,5,23,87,9,50,19,85,2,18,323,21,2,25,42,12,4,2,86,191,150,23,13,4,103,30,26,46,2,19,27,7,3,6,98,33,31,25,2,32,17,18,94,1,15,9,89,1,3,48,5,65,108,112,73,162,5,133,37,5,29,32,25,10,9,28,58,2,83,74,34,9,38,77,1,268],"ifr":[2483,1,1,175,1721,1,1],"ift":[4917,247],"ifu":[4658,1],"iga":[138,557,306,1,1019,782,481,114,1,1937,1],"igb":[1885],"ige":[532,907,1,258,395,460,1,1232,1,1302,1],"igf":[1577,2211],"igg":[533,423,485,1174,2554],"igh":[663,1,944,198,143,1,358,41,1,1,1,452,1,1,145,1,386,1,1,904,314,50,1,207,404,55,146],"igi":[3497,1,1334,503],"igm":[3789,1473],"ign":[1401,1406,1752],"igo":[163,2346,487,308,1866],"igr":[2735,355,1,752,1129,119],"igs":[1578,308,1904,1429],"igu":[2486,1],"iid":[752,158,4,3,602,481,50,1,144,255,13,15,2,54,136,31,12,214,125,222,20,227,96,209,84,492,75,447,1,1,52,115,431,5,3],"iif":[173,408,269,86,64,85,100,875,28,87,608,92,514,72,58,372,102,578,236],"iim":[1186],"iin":[3827],"ika":[416,1026,1,2348],"ike":[477,248,557,621,59,115,155,35,46,442,53,1,69,914,14,510,229,1,164,1,354,196,178],"ila":[237,297,1,1,1,301,1,1048,1,1,921,1,1225,536,1,717,1],"ilb":[538,2893],"ild":[702,1,1,1013,1,1374,1434,930,1,1],"ile":[112,278,691,177,78,464,68,22,1235,64,160,398,8,38,398,19,287,63,223,34,134,288,196],"ilf":[3093],"ili":[32,715,19,191,46,1,54,201,1,483,83,43,1,1,385,204,352,1,1,1,334,67,66,180,15,268,11,12,26,92,163,143,710,128,190],"ilk":[3094,1,1,1,1464,1,1,1,1],"ill":[212,88,239,1,1,1,54,11,1,22,41,3,180,1,589,1,98,348,131,2,104,1,1,58,1,213,248,1,1,1,22,141,153,129,1,1,85,256,6,61,69,25,35,60,22,76,70,98,395,159,5,13,194,60,163,140,37,330,1,1],"ilm":[1892],"ilo":[239,719,2799,1,38,1,109,144],"ils":[669,384,129,148,90,413,132,447,945,706,17,24,144,380,21,304,165,254,48],"ilt":[705,1188,1,2896],"ilu":[115,2673,495,703,580],"ilv":[4567,1,1],"ily":[1579,248,990,472,110,580,462],"ima":[216,1,1,53,479,209,74,1,1319,951,166,111,398,1,1,1112],"imb":[1035,1,1782,1,1,1,2098,130],"ime":[1352,1470,176,100,1195,158,159,1,51,432,1,76],"imi":[1446,301,1,1,1074,201,77,1,1,368,511,342,73,173,1,1,1],"imm":[2488,1,1239,866,326,1],"imo":[213,330,267,138,159,79,2,1,243,15,1,303,1565,210],"imp":[960,1530,1,1,1,1,1,329,1,1722,27,1],"imr":[3983,1],"ims":[4922],"imu":[799,2226,1551],"imy":[4612],"ina":[106,43,216,23,231,1,67,73,25,31,1,1,33,24,29,4,7,46,13,116,25,354,46,1,1,342,37,189,36,351,1,34,6,88,196,69,387,245,97,148,55,1,28,58,3,71,1,91,175,70,1,1,17,9,115,274,164,92,41,1,80,5,1,194,5],"inb":[4106,266],"inc":[1005,1,467,10,1,1,1,307,1,103,1,118,481,1,1,1,1,1,1,1,1,1295,1,1,151,32,413,1,178],"ind":[505,78,735,581,316,139,1,151,1,1,1,1,1,1,1,1,1,1,1,1,1589,64,185,1,357,1,1,746],"ine":[546,87,153,1,175,211,153,39,41,494,341,198,60,64,37,18,208,1,1,81,56,32,107,1,236,255,61,38,61,47,1,1,1,1,110,1,91,1,241,78,41,347,105,33,3,30,18,115,151,146,27,1,1,1,128,6],"inf":[1901,618,1,1,1,1,1,1,1,1,1581,1],"ing":[81,59,1,13,15,46,55,165,23,26,7,15,49,24,8,62,11,34,10,4,5,5,86,49,75,11,13,55,22,7,1,29,38,7,23,9,19,3,5,5,36,1,11,135,8,20,18,11,34,19,19,1,4,48,4,15,5,20,68,6,3,5,93,7,7,9,6,25,38,43,8,1,1,14,14,14,15,9,1,5,4,14,8,21,1,11,18,3,76,1,58,7,9,9,2,7,4,26,22,13,2,9,33,21,1,1,12,60,5,68,26,1,1,2,16,78,27,1,1,28,2,33,20,10,2,79,1,16,36,56,34,28,16,86,12,6,1,5,16,32,32,114,3,14,67,2,32,18,1,1,10,243,73,18,128,32,13,27,3,26,86,1,23,16,4,2,17,17,7,7,35,1,1,33,22,91,60,41,18,40,25,1,3,40,21,28,3,51,2,10,23,8,23,1,1,1,39,38,43,7,44,182,74,68,24,27,31,4,2,8,20,10,1,47,1,1,1,61],"inh":[2531,1,1],"ini":[66,24,208,70,420,26,91,186,25,54,152,44,1,7,1,71,94,51,688,82,18,1,154,1,1,110,184,276,162,6,20,310,253,108,86,129,220,346,80,304,91,134,13],"inj":[2537,1],"ink":[598,946,590,1,404,117,175,276,617,84,771,17,199,1,1,1,704],"inl":[2540,391,1],"inn":[1008,189,1,707,636,567,701,1,908,1,700,109],"ino":[55,12,60,712,126,358,53,74,1,139,1,507,283,161,957,182,130,1,139,1,134,134,1,1,7,739,1,321,1],"ins":[457,178,170,52,314,95,246,394,230,1,406,1,1,1,1,1,1,1,1,1,280,131,32,13,187,397,104,2,70,73,37,179,2,122,74,164,15,521,3,58,262,41],"int":[1333,752,229,122,117,1,1,1,1,1,1,1,1,1,1,1,55,1,1,61,251,176,457,288,25,1,445,1142],"inu":[1174,1,1,1934,703,429,1014],"inv":[630,1935,1,1],"inw":[2568],"inx":[4944],"iny":[4720,378],"ioa":[984],"iob":[449,2806,1],"ioc":[450,702,2642],"iod":[318,1,2039,1362,1],"ioe":[1452],"iog":[4049],"ioi":[911,115,180,219,332,778,280,249,1339,82,442,173],"iol":[451,93,1,1,348,1469,1137,1,1,16,213,1,365,381,871,1,1],"iom":[253,59,140,1,121,421,751,34,900,101,1,163,137,67,213,115,568,6,617,1],"ion":[68,7,7,28,131,110,471,1,11,216,47,24,20,12,3,1,9,1,172,41,4,69,31,6,8,1,105,86,74,6,1,5,8,10,41,29,5,50,2,76,1,44,1,60,18,130,274,5,98,205,1,1,22,233,9,30,61,94,118,1,47,12,33,13,4,92,54,111,116,31,15,25,30,1,16,3,9,8,9,7,1,127,1,5,16,10,6,133,24,44,1,1,1,1,1,1,419,11,30,56,215,1,104,68,25,17,7],"iop":[431,219,661,334,1258,1,88,119,403,372,10,28,66,133,1033,1],"ior":[235,267,1,1288,730,34,14,1367,52,902],"ios":[209,245,1000,1026,568,558,1323,1,64],"iot":[174,514,979,644,140,1,317,314,1848],"iou":[184,320,948,3037,821,1],"ipa":[240,3442,1,302,1148],"ipb":[5437],"ipe":[56,491,343,124,1617,1,468,709,1,4,1,1,60,471,109,179,164,35,423,7,88],"iph":[3054,1,1525,1,1,1,517,405,24],"ipi":[49,3768,1,405,1,576],"ipl":[1455,1,1769,1,148,1798,1,183,82,1],"ipn":[1457],"ipo":[84,101,1135,411,1105,706],"ipp":[1458,493,265,143,1,855,541,1345,339],"ipr":[1459,2309,51],"ips":[1460,1,173,2007,532,895,34,102],"ipt":[1462,173,682,2508],"ipu":[2657,321],"iqu":[743,102,1992,1,1,390,2029,1],"ira":[1463,675,1,973,708,1,378,1,521,1],"irb":[117],"irc":[548,1,460,1,1,1,1],"ird":[230,278,42,1,15,25,43,32,63,497,659,136,178,230,80,180,18,46,155,218,71,1,180,53,108,516,317,45,9,17,93,129,131,5,72,9,169,130,1,217,5,33],"ire":[59,1405,221,1,35,187,1,1,1,1,452,206,998,625,391,139,578,52,1,114],"irg":[5355],"irh":[2917],"iri":[2571,1,1286,92,374,456,576],"irl":[1818,448,1],"irm":[1913],"iro":[963,728,1,881],"irp":[2574],"irr":[1014,1561,538,1636,1,1,75],"irs":[529,1385,354,1301,1401],"irt":[552,1,4199,1],"iru":[405,1956,2363],"iry":[1819,450],"isa":[1465,404,1741],"isc":[1466,1,1,1,1,874,1478,882],"ise":[220,79,632,108,94,338,1,398,601,408,103,122,367,140,155,159,185,579,26,417,337],"isf":[746],"ish":[202,4,4,1,216,5,31,19,59,52,2,16,27,95,84,39,181,11,195,64,2,28,109,41,1,19,30,10,82,87,174,25,1,1,1,18,35,55,26,72,2,22,19,4,15,26,2,49,1,29,116,163,32,7,1,40,2,8,29,25,38,80,14,45,1,148,53,61,57,85,84,14,167,75,36,140,97,6,60,79,6,27,9,3,5,47,3,81,3,87,51,30,1,119,39,86,29,1,27,40,15,120,16,211,19,38,21,238,19,51],"isi":[39,1095,200,139,25,1,1381,2173,304,1],"isk":[1474,3485,482,1],"isl":[2577,1],"ism":[131,1,660,656,1587,35,15,405,1,133],"iso":[554,825,838,281,81,1,1,206,94,1000,954],"isp":[753,722,1,1,1,1,839,45],"iss":[1919,221,974,608,1381,1],"ist":[349,196,79,41,1,1,1,1,75,188,1,1,81,1,1,144,1,1,93,224,1,1,1,1,1,1,1,1,1,1,243,46,322,263,1,750,18,113,102,115,1,1,2,262,120,140,1,36,197,362,637,47,104,1,69],"ita":[257,1028,1,317,506,1,1,146,1,1079,1060,263,140,57,40,209,253],"itc":[3824,1,976,122,547,1],"ite":[340,790,237,302,4,656,329,1,164,242,51,133,220,151,1,466,47,878,1,247,184,1,1],"itf":[4089],"ith":[88,1,1,2,44,234,18,1,514,1,1,1,41,400,262,1,89,1367,45,1,500,111,103,1,395,111,137,305,267,98,332,1,1],"iti":[555,317,92,1,176,116,127,2,21,628,295,154,48,4,462,53,11,254,306,1,1,358,99,492,534,36,1,216,15,11,61],"ito":[378,588,442,999,659,51,1,1,31,1,1,28,137,225,83,1,1,1387,4],"itr":[49,712,257,362,1074,1,665,1,221],"its":[726,1310,223,226,48,50,1,1234,272,456,67,495,38],"itt":[39,203,314,1,1,112,1,1,980,498,690,1,208,1,261,444,73,1,1,211,281,264,1,140,156,267],"itu":[156,403,850,1327,1,129,801],"ity":[32,841,509,114,257,46,627,510,86,809,1278,1],"ium":[261,494,13,381,90,879,1,191,729,209,449,26,321],"iur":[1491],"ius":[1520,944,612,1,178],"iva":[560,1,726],"ive":[69,8,6,28,713,195,1,104,265,1,50,45,7,1,1,1,1,146,37,95,16,130,221,1,361,339,1,1,1,166,267,150,11,1,542,42,124,16,10,1,1,10,4,59,1,197,457,1,412,44,1,1],"ivi":[606,891,1,1,1011,1,74,261,595],"ivo":[825,1,1,580,435,136,55,12,1,278,1,1,219,1,538,358,1,379,206],"ivu":[4251],"ivy":[2586],"iwi":[2660,1,1063],"ixa":[1921],"ixe":[1922],"ixi":[3891],"ixt":[3122],"iza":[1596,72,1179,1,1,401,1,489,1,484,1140],"ize":[935,936,775,149,139,90,743,382,316,124,1,100,1,547,28],"izi":[40,1603,2539,44],"izo":[1644,44,710,1344,1,484,168],"jac":[2587,1,1,1,1,1,1,1,1,632,2289],"jad":[2596],"jag":[2597],"jan":[2598],"jap":[2599],"jar":[3134,205],"jas":[2600],"jav":[2601],"jaw":[2602,1,1,1,1,57],"jay":[2607],"jea":[2608],"jec":[1611,1,925,1,859,608,1],"jel":[2609,1,1,1,1],"jew":[2614],"jif":[4111],"jig":[2615],"job":[2622],"jof":[432],"joh":[2616],"joi":[2617,1,1,1,1],"joj":[2622],"jor":[2935,1,63],"jos":[2623],"jou":[2656],"jug":[1153,1471],"jum":[2625,1,1],"jun":[2628,1,1,1,1],"jus":[2633],"jut":[2634],"kab":[2672],"kad":[953],"kag":[2636],"kaj":[2656],"kal":[416,2174,1,46],"kan":[133,2505,1],"kap":[2640],"kar":[1442,1,284,1,1,3504],"kas":[3791],"kat":[1070,1571,402,1548],"kav":[2642],"kaw":[4075,1],"kba":[563],"kbe":[564,1],"kbi":[566,4230],"kcu":[567],"kda":[2592],"ked":[375,34,67,1914,880,21,1468,62,446],"kee":[2643,235,737],"kef":[4630,80],"keh":[4631],"kel":[1671,110,863,165,1783],"ken":[954,3608,484],"ker":[418,1,98,1,825,620,682,1,272,466,167,1319,177,395,43,1,4],"kes":[316,409,509,48,142,506,36,347,334,50,1848,87,79],"ket":[641,614,2619,672,100,870],"key":[3154,1,2054],"kfi":[2293,802,61,2342],"kfo":[4257],"kfr":[2593],"kgo":[2134],"khe":[4607],"kho":[4797],"kic":[2648],"kid":[2649],"kil":[2650,1,1,1],"kim":[4593,1],"kin":[458,129,270,469,218,472,638,1,1,29,140,113,25,37,102,24,933,59,461,16,1,164,111,506],"kip":[2657,558],"kis":[4326],"kit":[2658,1],"kiw":[2660,1],"kko":[2094,1],"kle":[1071,1121,194,36,1302,253,808,717],"kli":[477],"kly":[3978,106,1324],"kni":[2662,1],"kno":[2664,1],"koa":[2666,1],"kod":[2668],"koe":[2669],"kog":[2670],"koh":[2949],"koi":[5076],"kom":[2671],"koo":[1280,1,1,1390],"kop":[2274],"kor":[2345,328],"kos":[2091,3,41,539],"kot":[2095],"kov":[5525],"kra":[3432],"kri":[2675],"kro":[1072],"kse":[5048],"ksi":[434],"ksp":[5085],"kta":[4564],"kth":[692],"kto":[3837],"kua":[4597],"kul":[4598,1],"kun":[4600,1,1],"kwa":[411],"kwe":[3096,1506],"kwh":[693],"kwi":[1039],"kwo":[3097],"kxe":[2648],"lab":[1613,1,1064,1,1,1,1,257,2440],"lac":[322,203,37,1,1,1,1,1,273,235,540,115,413,6,167,367,1,1,1,1,123,1,129,1,1,1,219,8,662,1,1,61,32,192,66,281,1081],"lad":[568,1,1,1,1,1,1,1,446,1075,1,47,544,1,1,1,2228],"lae":[420,1,337,858,1954,1],"lag":[347,184,243,1,63,1,140,1,106,364,473,1,1,1,1,1,1,129,634,1,1,250,742,1567,37,1],"lai":[1747,1,1,946],"lak":[1930,1,765,1,2379],"lal":[167,613,14,47,59,1254,1595,371,188,42,1198],"lam":[967,55,293,572,1,1,43,310,456,1,1,1,1,1,1,146,199,1,986,291,1],"lan":[369,340,897,453,86,1,205,12,177,37,1,46,81,1,1,1,1,1,1,1,1,1,1,1,1,214,120,1,504,279,1,1,1,1,1,1,1,1,1,238,112,151,305,1,705,127,35,2],"lap":[1933,785,2237],"lar":[118,150,58,55,473,1,28,3,123,78,161,262,168,118,128,271,380,144,1,1,1,1,1,1,1,1,1,1,1,300,106,85,14,183,226,1,81,22,134,32,50,29,104,475,1,287,306,33,53,62],"las":[382,1,191,1,1,104,101,98,1,95,1,40,7,1,1,282,310,1,52,264,213,1,41,478,278,108,394,57,69,199,73,1,1,190,549,139,246,202,265],"lat":[158,159,214,3,1,1,1,40,402,1,27,3,1,1,172,69,42,88,67,74,232,117,52,1,1,8,1,1,1,1,1,158,10,128,286,20,37,152,1,1,1,1,1,1,231,10,153,105,224,48,57,37,65,64,117,1,1,1,1,1,1,1,1,1,1,58,253,3,1,1,1,1,29,398,228,417,2,3,10],"lau":[119,2619,1,1,1,1],"lav":[384,642,1717,1],"law":[1027],"lax":[1941,119,723],"lay":[1028,449,1,875,161,1,230,1,1,1,1,197],"laz":[2149],"lba":[120],"lbe":[2307,372,1,537,1],"lbi":[508,30,2893],"lbo":[1619],"lbs":[706],"lbu":[121,586],"lca":[751,1,1],"lci":[122,632,1,165],"lco":[1820,1],"lcr":[5380],"lcu":[1822],"lcy":[2940,1461],"ldc":[5457],"lde":[123,1,1,578,380,537,1,1,353,203,914,342,1,1105,658],"ldi":[704,1013,1,258,393,2283,1],"ldl":[5458],"ldo":[4467],"lds":[1883,94,1158],"ldw":[5492],"lea":[72,329,177,52,399,1,1,1,910,1,118,689,1,1,1,1,1,1,1,1,1,1,676,1,356,66,318,1079],"leb":[626,40,45,597,1004,110,2354,9,619],"lec":[1088,535,1,1137,375,171,1,379,173,1,23,279,1],"led":[540,216,3,125,197,55,78,55,28,133,592,107,860,203,79,1425,255,288,142,67,54,22],"lee":[422,157,1840,343,1842,1],"lef":[1309,581,740,668,265,414,1451],"leg":[671,954,58,1080,1,1,1,1,1,1239],"leh":[667],"lei":[2769,601,872],"lel":[2897,719],"lem":[1626,1,1143,1,1,1,934,1186,1,612],"len":[135,1,444,1,1,45,817,1,323,55,58,429,464,1,1,1,508,252,350,673,46,48,1,1],"leo":[362,560,4,158,670,308,716,1,1,1,1,530,59,1621,1],"lep":[126,1502,1,1,1153,1,1,1,1,1,1,966,1096,186],"ler":[210,1,191,1,3,475,361,321,177,1,112,211,356,231,1612,1,136,1,174,44,680,89,1,54],"les":[58,45,28,36,20,69,13,7,20,46,12,9,4,14,9,52,57,14,91,16,20,12,16,15,53,8,13,23,14,8,39,39,14,6,29,39,103,44,37,49,4,28,25,7,21,6,4,21,19,109,9,6,106,3,88,52,4,87,8,8,47,81,6,129,10,1,23,4,37,26,12,55,19,105,52,33,13,4,132,74,21,39,26,21,4,7,5,11,7,105,23,4,3,12,21,89,60,89,8,30,2,33,28,63,97,13,44,6,39,20,34,81,13,4,6,2,34,16,5,12,57,24,56,68,99,71,5,75,37,12,30,7,25,2,55,181,31,142,159,55,13,17,123,12,2,12,28,84,61,70,36,62,21],"let":[460,144,1,64,457,545,110,723,151,50,86,324,104,327,72,10,762,202,757,1,73],"leu":[3372,2,488],"lew":[672,4543],"lex":[1127,818,1,2219],"ley":[390,3250],"lfb":[2271],"lfi":[206,335,276,519,1,295,2042,854,222],"lfl":[1338],"lfm":[1677],"lfo":[127,2966],"lfu":[4878],"lga":[128,1,1,2951],"lgi":[708,91,1380],"lhe":[710],"lia":[217,58,1,91,18,1,290,71,24,232,1,255,1,72,362,5,44,367,229,110,343,20,1,111,1,1,32,1,46,242,166,161,105,154,359,42,488,575,1],"lib":[2698],"lic":[325,126,309,184,1,927,205,383,33,300,1,1,1,1,272,3,616,1,918],"lid":[60,1,27,74,59,32,111,243,159,4,6,42,180,7,12,41,496,249,1,18,33,1,168,834,61,266,58,1,38,219,48,1,8,92,1,94,19,122,147,137,59,249,179,57,10,306,115,56],"lie":[124,13,370,224,15,592,164,36,39,249,84,7,30,1,329,332,106,99,2,164,48,121,1230,31,220,178],"lif":[73,18,30,5,86,654,133,284,574,1,207,587,146,1,1,1,1,414,830,612,1,82,138,579],"lig":[138,1811,1,603,1,249,1,1,1,1,591,1,1209,1,611],"lii":[1085,1365,13,464,1475,691],"lik":[477,1426,59,115,155,35,488,53,1,997,510,749,196,178],"lil":[2810,1,1,1,1,1,1,1],"lim":[1033,1,1,1,152,1,1629,1,1,1,1,1,1,1,273,206,1306,1,1],"lin":[365,218,15,439,78,1,202,246,94,201,317,263,60,102,52,173,1,1,1,1,1,1,421,185,154,103,190,3,269,40,54,78,125,99,69,146,54,529],"lio":[241,1098,972,140,1,363,18,1,1,229,35,50,107,206,15,317,92,163,354,591],"lip":[1634,1,96,220,885,218,1,45,656,12,1435,1],"liq":[2837,1,1],"lir":[1721],"lis":[131,1,660,924,144,9,1,231,155,814,34,142,31,28,327,1057,26,187],"lit":[32,729,186,656,150,397,690,1,1240,532,47,66,1],"liu":[2464,784,449,347],"liv":[606,1073,299,864,1,1,1,1,593,1,1],"liz":[1871,976,1,1,1841,1,547,28,99],"lka":[133],"lke":[4562,197],"lkf":[3095],"lki":[4760,617],"lko":[2949,2576],"lks":[4563,868],"lkt":[4564],"lkw":[3096,1],"lky":[4565],"lla":[167,364,178,49,22,1,13,46,1,13,1,28,17,79,1,106,1,166,197,60,413,1,1,1,1,222,5,34,1,6,121,534,47,273,277,61,65,4,25,117,30,214,30,365,228,543,124,126,168,1],"llb":[508],"llc":[5380],"lle":[135,1,404,90,129,125,45,159,356,1,118,205,55,199,42,25,40,183,339,568,268,129,271,376,1,355,1,332,429],"llf":[541,3987],"llh":[710],"lli":[137,1,24,50,395,153,1,10,417,1,375,70,1,389,41,274,214,1,55,43,1,45,17,101,42,214,26,1,1,49,36,119,106,3,161,77,46,191,145,11,578,406],"llo":[139,1,1,159,308,145,336,623,1,26,85,155,1,86,170,136,1,275,211,91,228,263,221,28,60,24,1,453,63,94,522,1,1,256,295,1,26,27,1,1],"lls":[142,1,399,54,75,3,211,658,30,494,63,113,159,567,78,590,417,34,434,7,6,64,130,522,131],"llu":[886,1,367,542,132,1210,1,1,81,1774,34,223],"lly":[335,200,398,156,168,18,147,102,70,107,14,46,10,125,144,62,4,88,180,1,161,74,1,1,1,120,133,310,104,71,52,64,130,123,265,93,16,2,226,184,186,3,166,28,101,154,83,44,22,196],"lma":[5133,101],"lmc":[3576],"lme":[2313],"lmi":[2314,1263,277],"lmo":[144,1,3448,737,1,694],"lms":[1637,1941],"lnu":[5383],"loa":[1952,114,785],"lob":[584,506,1,1,1059,1,1,83,217,399,1,1,1,1,626,46,266,201,1178],"loc":[139,48,52,87,40,529,143,1,553,727,57,78,1,101,301,1,1,1,1003,1],"lod":[3045,712,1,1418],"loe":[146,2008,707,898],"log":[544,1,1048,1,1268,313,1,1,485,114,439],"loi":[89,97,2,420,847,406,417,581,386,257,404,1264],"lom":[57,83,309,304,323,1,1,1077,222,271,530,76,496,541,451,423],"lon":[147,362,584,1,1,543,1,73,1,537,613,1,1,1,1,189,994,802,105,444],"loo":[585,1,1,1366,1,914,1,1,1,1,1,1],"lop":[232,148,8,1,507,62,454,1,1,1,1,1,1,38,184,1,48,50,1136,1,24,146,809,373,157,856,6],"loq":[1089],"lor":[968,1,1,1,1,1,1,1,1,1,119,1,1,1,1,855,1,1,1,1,197,123,244,1,353,1,1,1,1,342,467],"los":[300,92,308,62,125,119,34,1,1,1,1,616,1,455,41,725,1,633,1,257,22,1167],"lot":[400,497,1987,1,526,1,218,1,144,22,817],"lou":[148,1,896,56,1,1,1,1782,979,1619,59],"lov":[1046,1,967,873,979],"low":[141,725,182,97,206,271,202,136,1,1,1,1,15,1,178,214,1,515,1,1,60,718,947,1,270,21,1,1,551,1,26,27,1,1],"lox":[3760],"loy":[1653],"loz":[2378],"lpa":[150,3430],"lpe":[2244,3123],"lph":[1374,1,1,56,79,1],"lpi":[2951,1,629,838,949],"lpo":[1600,2733],"lps":[2644,938,101],"lru":[5384],"lsa":[424],"lse":[1555,270],"lsh":[208],"lsi":[1784],"lsk":[4034],"lso":[151],"lsp":[142,1],"lta":[4576],"ltb":[4335],"lte":[152,1,1,1739,1,1247,1389,1],"lth":[155],"lti":[156,1131,1855,78,1,1,1,1,1,1,978,132],"ltr":[157,606],"lts":[86,4538,166],"ltu":[1288,4081],"ltw":[4337],"lub":[588,461,1,1,1,1],"luc":[4178],"lud":[1773,727,1,1],"lue":[589,1,1,1,1],"luf":[1965],"lug":[510,595,3512],"luk":[1966],"lul":[886,1,909,1425,2031],"lum":[546,508,52,1,1,146,674,1849,90,1,338,145,508],"lun":[594,2297,1,1,1,1,1],"lup":[1055,1842],"lur":[115,2673,110,55,1033,580,429],"lus":[356,700,586,132,729,635,1,1,3,140,88,776,1,881],"lut":[1764,1135],"lva":[2954,1,1383],"lve":[158,402,1205,276,231,44,251,1965,35,1,1,470,261,20,1,155,1],"lvi":[561,1205,1190,1968,1,1,1],"lvo":[5235],"lwa":[159],"lwo":[4341,1],"lyc":[764,1204,191,1,740,1,1,1,1,1,800],"lye":[1969],"lyf":[733,1878,1],"lyh":[2375],"lyi":[270,1700,1],"lym":[2262,1628,1],"lyn":[2613,293,1,985,1],"lyp":[166,599,1,956,1,2171,1,1,1,1,1,1],"lyr":[2908],"lys":[194,2715,992],"lyt":[1972,938],"lyx":[767],"lza":[160],"mac":[1033,430,1449,1,1,1,1,1,1,1,1,1,1882,1,430],"mad":[300,2622,1],"mae":[921,1,37,1293],"mag":[2924,1,1,1,1,939],"mah":[2929],"mai":[2930,1,1,1,1,1245,1,1],"maj":[2935,1],"mak":[2937,1],"mal":[216,1,1,1173,471,1,221,269,93,68,1,424,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,391,114,5,547,601,1,1,473],"mam":[2957,1,1,1,1],"man":[750,652,120,720,183,1,1,8,527,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,594,144,602,1,651],"map":[1392,937,1,658],"mar":[161,1,1532,893,402,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,971,1,293,685,1],"mas":[163,2687,159,1,1,1,292,1183],"mat":[57,6,68,1,139,33,24,678,28,43,187,1,128,36,161,100,307,1,166,167,4,153,37,261,199,28,1,1,1,1,1,1,1,1,1,31,110,138,1,331,120,149,79,93,295,331,1,1,41,62,47,28,69,172,12],"mau":[3023],"max":[3024,1,938],"may":[3026,1,1],"maz":[164,1],"mba":[1110,1728,537,2103],"mbe":[923,1,1,336,23,359,1,1175,238,165,154],"mbi":[688,80,268,70,1,4,534,3283,1,1,1,602],"mbl":[166,181,298,66,2109,1374,1,1,1,722,130],"mbo":[167,258],"mbr":[1112,534,1,1,1,1409,1,1,1344],"mbs":[2821,2254],"mbu":[168,1,3944],"mby":[607,1],"mch":[3576],"mea":[3030,1,1,1],"mec":[3034,1,1],"med":[1545,454,558,480,1,1,1,1,1,231,444],"mee":[3043,1],"mef":[2069,98],"meg":[3045,1,1,339,517,1],"meh":[4611],"mei":[3048],"mel":[676,93,1,1,1,154,189,1,682,900,351,1,1,1,1,1,1,1,651,914,1,1,1,541,236],"mem":[3057,1,1,1],"men":[29,1,277,45,413,352,198,101,1,209,1,50,14,1,172,1,1,21,1,1,397,170,1,1,345,258,143,1,298,286,247,257,2,156,9,1,1,1,298,56,76,1,368,3],"mep":[3062],"mer":[170,1,1,601,604,165,108,1,44,460,118,1,789,1,9,304,132,192,189,118,406,180,326,251,39,181],"mes":[43,1,5,7,7,28,30,5,47,18,13,8,14,32,15,25,64,6,12,86,24,19,11,61,110,108,10,5,6,30,42,38,6,52,11,1,55,30,21,7,72,98,39,1,33,54,103,1,77,49,74,36,70,237,3,5,23,87,9,50,19,85,2,18,323,21,2,64,3,12,4,2,33,53,190,1,1,1,148,23,13,4,103,30,26,46,2,19,27,7,9,98,33,31,25,2,32,17,18,94,1,15,9,89,1,3,48,5,65,108,112,73,162,5,91,42,37,5,29,32,25,10,9,28,58,2,83,73,1,34,9,38,346],"met":[357,1,1,1064,647,1,1,241,64,692,1,1,1,1,1,1,1,1,21,1564,270,1,1],"mew":[2015,2648],"mex":[3078],"mfe":[1013],"mfi":[1547],"mfr":[1114,2791],"mia":[784,627,447,841,1,213,1,1115,440,101,236,135,1],"mic":[946,719,5,330,1,1078,1,1,1,1,1,1,1,15,1],"mid":[101,1,209,13,1079,327,17,1,1,610,69,659,1,1,14,636,18,1,144,1181,196],"mif":[820,1969,674,1633],"mig":[3090,1],"mii":[173,2528,1870,236],"mil":[1826,1,1265,1,1,1,1,1,1,1,1,477,995,1],"mim":[3101,1,1],"min":[491,55,369,491,40,69,1,1,415,70,119,97,96,65,1,1,48,78,93,504,1,1,1,1,1,1,744,105,1,49,1,286,1,1,623,89,1],"mio":[3111],"mip":[2317],"mir":[3112,1,1211],"mis":[744,1574,796,1,356,1582],"mit":[1652,147,1024,293,1,1,1,1,1,861,415,615,1,1,136],"mix":[3122,769],"miz":[3024,1158],"mli":[4822],"mlo":[2319],"mly":[5255],"mma":[2488,469,1,1,1],"mme":[357,1,1,756,1,1,1156,1,2320,326,12,1,1],"mmi":[2429,2492],"mmo":[1118,1,1842,767],"mmu":[1120,1,1368],"mna":[4216],"mne":[1913],"mni":[174,2528,740,1,339,1],"mno":[2251,1,1,2217,560],"mnu":[2254],"moa":[3124],"mob":[1617,1508],"moc":[2261,865,743,1],"mod":[50,493,2128,456,1,1,1,1,714,192],"moe":[175,1,1],"moh":[3132],"moi":[3133],"moj":[3134],"mol":[947,1315,873,1,1,1,1,1,1,1,1,821],"mom":[815],"mon":[144,34,1,22,1,1,805,110,1,1356,295,374,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,428,135,143,459,1,694],"moo":[3166,1,1,1457],"mop":[810,248,336,293,113,660,1491],"mor":[41,139,15,18,71,1,16,1,163,642,15,64,2,1,10,149,84,15,1,193,110,311,630,1,381,95,1,1,1,1,1,1,1,1,1,76,62,1,200,9,181,6,284,48,353,344,198,52,310,138,104],"mos":[145,842,1,63,268,672,41,969,178,1,1,1,1,1],"mot":[140,2717,104,224,1,1,1,1,1,1,1,991,249],"mou":[181,593,1,905,347,1133,1,32,1,1,1,1,1,1,1,1,770,1126],"mov":[3202,1,1,1,1],"moy":[948],"mpa":[776,184,163,1,1,537,828,1,1092],"mpb":[2430],"mpe":[777,1715,133,199,2172,1,1,190,1,1],"mph":[182,1,1,1,1995,1,81,1128,1,1,1543],"mpi":[2626,423,1,856,1395],"mpk":[2825,1234],"mpl":[1126,1,142,384,114,726,11,2070,1],"mpo":[1128,1,1,1,229,1134],"mpr":[1132,1,1,1361,208,1,880],"mps":[1054,81,1492,1672,547],"mpy":[4911,391],"mro":[3983,1],"mse":[1336,1,1,3701],"msh":[4114],"mst":[2275],"muc":[3207,1,1,1],"mud":[3211,1,1,1,1],"mug":[3216],"mul":[799,2418,1,1,1,1,1,1,1,1,1,1350],"mum":[989,2036],"mun":[1120,1,1368,738],"mur":[2771,1,1,455,1],"mus":[1655,705,870,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"mut":[3246,1380,1],"myc":[104,1,1,57,90,59,17,1,1,118,3,1,121,179,59,183,332,143,55,1,70,72,19,1,44,14,34,375,493,32,81,20,1,163,204,29,30,1,38,1,1,1,1,1,52,4,169,265,1,7,119,182,22,218,24,80,273,1,299,1,196,125,1,245,1,8,1],"myd":[967],"mye":[3253],"myg":[186,3068],"myi":[3255],"myl":[187,1,3068],"myn":[3257],"myo":[3258,1],"myr":[3260,1,1,1,1,1,1],"mys":[3267,95],"myt":[3617],"myx":[3268],"myz":[3736],"nab":[191,599,1,865,1,1,3578],"nac":[442,177,232,349,269,50,1,96,496,125,235,468,329,529,418,10,175,249,63],"nad":[2182],"nae":[149,43,42,131,395,115,29,111,75,593,176,1736,98,134,497],"nag":[3445,1515,1],"nai":[3986,642,490],"nak":[2963,307,1359,1,1,1],"nal":[193,1,426,159,37,1,1,297,86,221,69,280,21,104,147,42,28,360,85,239,69,405,73,58,1,186,210,637,3,212,359,1,132,1,26],"nam":[195,813,2264,1,230,1593,1],"nan":[426,489,600,1,1758,685,1,336,1,1],"nap":[2161,2420,52,1,302],"nar":[1557,207,286,1,197,896,1,130,1,2228],"nas":[1589,580,153,115,11,38,102,13,191,465,20,1814,114],"nat":[113,40,1,135,524,9,1,694,604,41,1,1,1,342,457,289,25,1,1,1,25,115,77,55,17,23,292,3,15,1,145,890,1,85],"nau":[3282,1],"nav":[3284],"nbe":[1235,1165,1,314,114],"nbi":[2402,976,161,833,357,153,1],"nbo":[4106],"nbr":[2211,2726,300],"nca":[1659],"nce":[87,109,1,53,15,748,123,344,35,264,237,507,1,29,152,741,354,1,166,45,182,151,232,185,100,376],"nch":[198,448,1,1,1,1,487,1,1,478,116,164,1,120,166,156,358,193,26,48,408,80,180,169,225,23,184,703,300,42],"nci":[2498,949,107,140,291],"ncl":[1005,1,654,1,838,1,1,1,1],"nco":[1140,522,842,1449,445,841],"ncr":[3586],"nct":[1473,10,1,1,1,307,1,248,1,585],"ncu":[1822,683,1614,1,279],"ncy":[715,1068],"nda":[37,230,1130,267,925,35,963,1,1,1,1,750,1,14,1,84,1,272,1,223],"ndb":[2707],"nde":[200,996,143,59,1,266,122,719,1,236,542,1,150,735,114,1,41,1,59,219,278,19,100,237,1,1,1,1,1,1,1,138],"ndf":[427,1849,432],"ndg":[4343],"ndh":[2709,1635],"ndi":[268,160,1,712,525,116,6,573,147,1,1,1,455,1,1,306,452,945],"ndl":[712,3633,371],"ndo":[1667,1,1,1,1,1,1,1,838,1,1,1,1,596,392,1497],"ndp":[4346,1],"ndr":[970,11,337,1651,148,1,989,123,772,84,1,87,1],"nds":[144,286,179,1066,114,110,247,271,161,132,1198,764,389,422,13],"ndu":[1140,2,1,1374,1,1177,1553],"ndw":[2183,172,1932,61],"ndy":[4349],"nea":[281,921,1,1038,586,1,457,1,1,1,516,1061,380],"nec":[1154,1,1,1,724,1408,1,1,1,1,1,1,1,509],"ned":[1365,36,5,273,226,33,344,217,119,353,1851,2,82,140,272],"nee":[2965,332,1,1,1],"nef":[202,409,534,2772,891],"neg":[5346,1],"nei":[3690],"nel":[221,559,1,1267,1439,319,227],"nem":[201,1,1,855,2243,1,772,778],"nen":[204,924,45,2552,284,1,845,33],"neo":[282,1,1,1,1020,1998,1,1,1,1,1,1,1,1,1,1,1,578,684,280],"nep":[3315],"ner":[1344,332,423,1,1,1,1,143,1,294,321,242,1,211,1,1,1,328,519,87,49,416,1,700],"nes":[203,343,66,21,154,175,184,91,89,14,166,407,191,412,47,36,460,155,106,1,1,1,1,125,13,195,99,51,86,25,121,212,119,37,310,141,163,151,176,128,6,53],"net":[133,1403,538,31,1,1,59,237,922,1,1,449,60],"neu":[1755,720,497,356,1,1,539,1,1],"nev":[5249],"new":[1147,2184,1,1,1476],"nex":[3348],"ney":[2383,1,1,1,263,497,21],"nfe":[2519,1,1],"nfi":[1048,489,1179,118,1403,171,1,476,16],"nfl":[1502,36,984,1,1,1886,1,475],"nfo":[1901,624,1583,1],"nfr":[2526,1,1131],"nga":[215,996,427,1,420,579,1,334,2330],"ngb":[2429,697,1539],"nge":[205,1,1,1,98,1,620,737,108,130,1,1,119,50,59,1,223,1,171,1,1,334,1,609,14,263,364,1,277,335,63,1,46,626],"ngf":[1037,934,306,377,239,1],"ngh":[4011],"ngi":[209,222,378,1,118,284,514,298,20,1,1,24,207,192,397,255,199,797,277,77,259,574,223],"ngl":[210,1,1471,947,1,25,1923,215,46,123,503],"ngn":[4939,1],"ngo":[1449,97,386,897,145,1,172,1,290,154,317],"ngr":[2976,1,1817],"ngs":[179,256,278,585,532,164,340,21,328,149,35,28,4,101,457,790,207,212,71,31,637,11,50],"ngt":[1831,907,36,1,1473,576,685],"ngu":[212,1,1,401,392,480,1,189,79,117,174,664,1,408,355,90,131,1426,1,1,42,84],"ngw":[2896,1405],"nha":[2531,1,1,1287],"nhi":[215],"nia":[66,99,517,1,73,337,145,35,171,1,267,1,25,379,370,192,427,562,47,23,44,1,88,529,184,70,325,376,173],"nib":[792],"nic":[559,561,1,27,499,461,368,558,300,1,1,1,71,81,140,34,34,48,18,74,1153,216,45,1],"nid":[90,187,1,142,345,17,1,139,128,9,1,56,33,48,1,112,1,63,1,986,18,1,58,132,351,499,342,236,69,782,229,151,1,1,122],"nie":[514,66,514,2608],"nif":[298,70,141,275,30,336,1,171,269,229,842,1,39,985,644,228,187,96,288,47,76,1,1],"nig":[3338,1,1],"nii":[581,419,1534,179,561,20,2230],"nil":[3149],"nim":[216,1,1],"nin":[785,1,1,1,120,121,141,196,174,219,1071,344,167,115,1,147,94,482,123,279,639,35],"nio":[174,138,840,605,606,172,145,770,601],"nip":[858,462,1311,1,346,663,168,1,646,179,577,45],"niq":[5258,1],"nis":[219,1,404,165,590,67,606,160,823,50,382,23,1,208,150,834,21],"nit":[92,278,977,20,13,293,436,1,1,315,110,530,46,38,1,1,190,270,721,442,485],"niu":[1239,879,1,191,766,1],"niv":[824,1,1,1,1015,1600,1,585],"niz":[2646,149,1354],"nje":[2537,1],"nji":[2657],"njo":[432],"nju":[1153],"nka":[2656],"nkb":[4796],"nke":[3107,47,1],"nkf":[3156],"nkg":[2134],"nkh":[4797],"nki":[1544,472,2102,461],"nkl":[3724,1778],"nko":[2135],"nks":[433,1,164,395,3603,5,590],"nkt":[3837],"nkw":[4602],"nky":[4798],"nla":[1678,862,391],"nli":[1679,3582],"nly":[1119,1813,519],"nme":[1691,1],"nna":[233,1,556,1,217,549,612,152,1,2053],"nne":[221,933,1,1,1,748,143,26,172,1,294,321,1391,49,416,1,700],"nni":[580,1,211,405,1,2517,94,1,493,775,150,1,1,1,297],"nno":[793,2315,1971],"nnu":[222,1],"nny":[582],"noa":[4086],"nob":[613,699],"noc":[709,269,101,1377,595,106,1,186,155,721,1,8],"nod":[1323,267,850,719,186,606,36,668],"noe":[3872,1234],"nof":[979,1,470],"nog":[748,2327,85,1,906,589],"noi":[279,620,477,81,924,60,34,1106,490,1,709,298],"nol":[2924,1,1,1],"nom":[204,1486,477,1906,895,1,321,1,31],"non":[55,2185,1106,1,1,1,719],"nop":[67,69,285,714,23,119,1,973,206,1,84,265,245,110,519,130,1,140,270,248,347,213,51],"nor":[1591,89,504,577,589,1,1,1,77,620],"nos":[127,97,403,824,801,361,741,1,1,1,1423,415],"not":[225,568,1460,411,277,1,221,195,1,1,1,1,1,1,1,1,1,1,700],"nou":[839,126,465,251,417,962,952,571,53,1],"now":[2665,443,261,1269,1],"noz":[888],"npi":[5262],"npo":[5003],"npu":[3593],"nre":[3349,1655,259],"nri":[5264],"nsa":[1117,1715],"nse":[56,170,1138,17,635,50,71,406,1,1,1,1,1,229,1101,594,793],"nsf":[5147,1,1],"nsh":[4173],"nsi":[127,1032,1,1,1,1,219,99,309,165,352,242,736,143],"nsl":[4082],"nsm":[5150],"nso":[4473],"nsp":[1164,3777,1,209,115],"nst":[1165,1,1,1383,1,1,2715],"nsu":[1168,2530],"nta":[62,166,1,940,1,1,11,235,48,161,56,151,31,167,306,61,42,493,46,185,30,1,299,1,42,34,63,67,7,124,1,6,1,1,21,324,107,57,1,97,13,545,1,194,155],"ntb":[230],"ntc":[1249],"nte":[231,1,1,1,1,281,314,59,40,243,46,11,454,1,181,220,347,1,120,1,1,1,1,1,1,1,1,1,1,57,94,1,1,1,448,331,7,63,276,38,582,28,404,368,3,202],"ntf":[1629,3502],"nth":[39,1,1,1,1,118,75,1,1,273,1,252,30,115,59,21,86,621,618,122,246,677,235,1,1,11,111,47,1,1,87,165,924,558,29,1],"nti":[191,48,1,58,71,344,177,25,258,1,1,1,147,60,1,53,22,226,1,426,1,225,20,76,45,501,1,1,9,1,167,577,10,97,144,272,38,65,25,96,372,33,134,246],"ntj":[3227],"ntl":[241,22,2243,21,456,742,235,50,168,1245],"ntm":[2032],"nto":[47,1640,1,33,167,676,420,1,437,30,458,126,1505],"ntp":[242],"ntr":[891,1,1,1,283,1,41,114,254,110,1900,1641],"nts":[181,62,324,147,414,45,26,198,2,207,21,3,62,174,23,346,200,186,584,549,15,20,55,308,35,73,38,165,314,151,395],"ntt":[244],"ntu":[1761,3210],"ntw":[5269],"nua":[222],"nub":[4640],"nuc":[3370,1,1,1884],"nud":[3373,1],"nue":[1174],"nui":[1175],"nul":[223,553,2210,1256],"num":[3375,1,1,1965],"nun":[3378,187,554,1],"nuo":[1176],"nup":[3379],"nur":[245,2009,807,319,1,1,216],"nus":[246,120,1748,1699,1457,1,34,19],"nut":[569,381,579,1581,273,1,1,1,1,1996],"nve":[1179,510,1,875,1],"nvi":[630,550,511,1],"nvo":[2567],"nwa":[1533,1035],"nwo":[2405,1,167],"nxr":[435],"nxs":[2907],"nyc":[1453,1935,1,64,52,1],"nyf":[3911],"nym":[3390,1,1],"nyt":[615],"nyx":[55],"nze":[960],"oac":[984,88,1779],"oad":[673,1,3579,859,1],"oak":[3394,1],"oal":[937,1729,1,414,792],"oan":[978,1,1,296,790,103,2253,1108,1],"oap":[4642],"oar":[595,2801,858,389],"oas":[1061,1,1,2061,1303],"oat":[596,468,1,1,1,885,218,1,1,1,193,2703],"oav":[97,3206],"oba":[93,297,46,876,468,371,302,169,634,1858],"obc":[597],"obe":[2152,700,1,1,566,940],"obi":[192,424,474,1,428,1,147,507,1,334,573,1,42,130,227,286,1,486,106,1,72],"obj":[3397],"obl":[2176,60,1162,1,1774],"obo":[322,127,149,15,1540,702,1136,1],"obr":[1617,116,2294],"obs":[1502,1354,544],"obt":[599,2802],"obu":[1092,2436,266,201],"obw":[1068],"oby":[2177],"oca":[239,84,72,55,619,523,1712,724,704,632,1],"occ":[675,2727,1,1,1,1],"oce":[60,1,65,13,97,666,67,724,17,1,665,500,531,1,1,1,1,1,10,105,336,1,129,1,226,14,179],"och":[139,538,218,334,1106,121,57,538,66,1,245,1811,1,191],"oci":[350,1,1363,38,1,701,1,1306,208,260,415,1,216],"ock":[709,329,1,31,1,1,1247,56,181,570,546,202,382,1,1,388,156],"ocl":[574,1,3471],"oco":[187,886,185,1,1,1001,182,20,1,393,210,90,1,206,49,50,36,29,234,32,201,40,7],"ocr":[257,3964],"oct":[3344,69,1,1,1,1,579,1],"ocu":[326,1647,885,1,1,558],"ocy":[366,541,1,70,13,88,73,515,1591,271,340,1,128,1281,1],"oda":[50,135,129,4,1,224,107,98,148,62,397,101,630,250,5,239,680,41,113,170,78,60,153,513,417,218,313,196,10,1],"odc":[5480],"odd":[3419],"ode":[324,253,9,384,620,494,152,152,596,1,142,1,174,43,408,198,91,186,2,29,1,826,1,87,1,106,200],"odi":[258,104,238,1,657,1,1,70,26,973,1,573,1,225,1,285,204,101,125,31,20,141,6,186,129,757,367],"odk":[2668],"odl":[5483,1],"odo":[62,1261,136,44,834,1,20,82,231,341,33,114,261,1,1,1,1,147,291,125,243,1,424,122,245],"odp":[5485,1],"odr":[3757,1,1325],"ods":[315,272,487,908,105,255,239,87,1053,156,161,9,295,682,313,150],"odu":[3131,868,1,1,1,1,1,184,1,1],"ody":[602,4574,312],"oeb":[175,1,1,4358],"oec":[1452,3654],"oed":[5117],"oeg":[3425],"oel":[57,1018,1,1,1,1183,408,1366],"oem":[3759],"oen":[1079,2683,1,1355],"oeo":[2154],"oep":[3872],"oer":[2861,909],"oes":[1449,55,863,25,723,65,760,1179,2],"oeu":[621],"ofa":[3361],"ofe":[2389,916,327,1504],"off":[1080,1035,1312,1],"ofi":[432,3604],"ofl":[979,1,470],"ofo":[865],"oft":[3429,1218],"oga":[748,2035,146,231,502,994],"ogb":[1506],"oge":[2160,305,610,267,321,1,112,1344],"ogf":[1507,519],"ogi":[544,1,1048,1,1076,505,1,1039],"ogl":[392,1329,395,1400,1,188,1471],"ogm":[2027],"ogn":[289,3017,264,579],"ogo":[1135,2026,269,619,18,1110,1],"ogr":[2862],"ogs":[1508,520,278,62,3024],"ogw":[1509],"ogy":[3177],"oha":[2949],"ohe":[3084,487],"ohn":[2616],"oho":[3132],"ohy":[811,1346],"oia":[4484],"oic":[888,2180,417,249,1],"oid":[89,97,2,71,20,3,1,10,103,70,142,291,12,9,70,36,180,3,111,56,49,30,94,85,10,113,104,140,81,196,103,60,3,15,7,9,60,39,198,43,44,22,61,113,9,3,165,13,257,79,44,1,1,9,217,11,42,17,73,75,1,155,49,78,49,82,218,78,146,87,62,3,1,20,70,163,30],"oil":[1081,2012,338,1217,1,590],"oin":[2085,532,1,1,1,1,1257,1,1,1075],"oio":[4485],"oir":[2364],"ois":[3133,748,44,1207],"oja":[3134],"oje":[4005,1],"ojo":[2622],"oka":[2672],"oke":[316,2074],"oki":[1326],"okr":[3432],"oks":[2391,478,1397],"ola":[158,164,694,508,839,14,202,925,227,151,82,133,553,1,209],"old":[1082,1,891,1,1,1,201,191,627,139,298,1,1,1217,1],"ole":[604,1,289,190,337,949,1,765,1,170,1,128,1,63,18,214,151,1,69,54,255,392,1,1,292,347,54,1],"olf":[5475],"olg":[2179],"oli":[275,1,49,126,147,8,69,272,70,68,893,485,1,460,1,1,1,142,1,368,1,1,1,60,91,172,121,1,516,1,75,179,1,1,1,691],"oll":[1086,1,1,1,421,469,1,392,1,1,1,763,1,1,747,1,200,175,1,1225],"olo":[326,74,49,95,1,545,1,1,1,1,1,1,1,1,1,1,1,1,1,1,488,1,1,782,1,1,797,1,1,46,259,20,26,266,201,220],"olp":[1511,1],"ols":[4396],"olt":[3141,1],"olu":[546,559,1,1,1,656,1379,228],"olv":[1765,1,801,2909,1],"oly":[2262,1627,1,1,1,1,1,1,1,1,1,1,1,1,364],"oma":[57,6,241,23,1,678,71,187,1,164,261,4,470,171,179,1,271,267,411,1,306,131,114,1,351,1,434,1,1,31,285,420],"omb":[607,1,501,1,1,1,149,3143,722,352,55],"ome":[29,1,174,285,1,186,89,222,1,125,297,103,1,31,610,12,210,705,821,1,104,653,1,1],"omf":[1114,2791],"omi":[491,253,667,104,1,1,213,488,161,1,1,408,674,294,1,144,57,1,49,1,19,777,1,246,30],"omm":[1115,1,1,1,1,1,1],"omn":[3442,1],"omo":[41,9,90,144,1,180,522,1,134,226,293,46,375,320,289,21,1,164,304,93,63,200,196,284,48,353,344,198,52,310,138,104],"omp":[1123,1,1,1,1,1,1,1,1,1,1,1,1,225,302,518,1,323,1402],"oms":[1078,349,1810],"omy":[104,1,1,57,90,59,17,1,1,118,3,1,121,179,59,183,475,55,1,70,72,19,1,58,34,375,493,32,81,20,1,163,204,29,30,1,95,4,54,115,259,6,1,7,119,182,22,218,24,80,273,1,299,1,196,125,1,245,1,8,1],"ona":[813,609,97,1,244,7,272,139,69,689,204,1,257,1,18,24,148,393,63,352,35,145,444,118,1,26],"onb":[2829,1900],"onc":[1136,1,1,1,1,2306,1],"ond":[144,383,82,372,159,1,1,1,1040,934,1,789,1,532,1,1],"one":[201,1,1,407,1,1,516,16,1,1,1,161,228,714,133,1,1,1,130,306,324,21,180,1,100,1,13,343,234,35,333,401,1,43,682,1],"onf":[1502,35,1,1296,824,579,171,1,1,1,490],"ong":[147,31,1,436,683,248,7,85,1,1224,1,1,1,1,280,1,761,102,653,1,1,62,109,1,1,283,1,1],"oni":[165,147,197,247,152,14,78,50,43,1,54,1,1,1,1,121,374,65,1,25,82,656,673,1,1,1,298,154,25,73,135,34,127,69,264,251,260,335,176,171],"onj":[1153],"onk":[3153,1,1,1],"onl":[1119,2332],"onm":[1691,1],"onn":[1154,1,1,1],"ono":[613,286,236,23,272,754,291,466,1,215,1,1,1,1,1,1,267,557,25,38,18,515],"onr":[3349],"ons":[75,35,17,114,110,56,416,103,40,107,68,16,2,1,1,1,1,1,1,1,1,1,46,125,104,56,40,132,150,177,105,24,90,23,92,503,36,141,44,34,238,122,337,245,8,51,77,5,57,182,180,41,22,302,17,27,177,70,93,6,18,36],"ont":[62,1107,1,1,1,1,1,1,1,1,1,4,141,136,262,309,1,1,305,1,20,40,42,719,5,1,257,30,119,165,10,23,93,48,77,375,415,78,33,40,94],"onv":[1179,1],"onw":[2573],"ony":[55,559,1,480,358,133,1867,52,1,405,899],"oob":[616],"ooc":[677],"ood":[461,124,1,1,91,831,472,1,405,1,185,178,1404,186,1,1137,1,1,1,1,1,1,1,1,1],"oof":[2389],"ook":[617,1773,1,281,196,1,1397],"ool":[1181,3215,1093],"oom":[679,1539,1019],"oon":[407,666,109,1688,1,295,1,924,1,575,62,618],"oop":[2392,3144,1],"oor":[1953,1,1131,827,1,1240],"oos":[1070,211,1,903,1,1,452,233,1,1,273,1,20,773,326,1271],"oot":[310,118,1,754,648,70,82,1,203,2081,1,356,500,1,1],"oov":[2393,1],"opa":[391,1278,1109,1,1,272,197,205,2082,1],"ope":[232,1181,1,275,55,1,566,231,358,555,1,1,1,1,1,44,244,265,1228,6],"oph":[236,1,194,254,1,1,79,44,30,1,59,38,9,23,1,1,1,1,84,77,23,119,1,33,2,80,15,240,39,52,61,159,112,1,62,20,12,85,206,3,347,68,1,27,82,7,170,77,13,209,53,167,64,2,64,44,40,1,28,27,1,38,53,185,3,132,1,337,32,94,25,178,108,18,1,22,56,312,1],"opi":[136,244,8,1,514,1,1,1,12,497,225,93,674,513,166,25,202,1,148,1,1,1,132,177,234,214,248,347,50,175,138,1,1,358],"opl":[975,1,694,1492,610,142,123],"opm":[1416,1],"opo":[63,250,1,1,47,288,98,148,62,177,23,298,185,445,1,272,1,32,188,1,322,1,510,1,51,196,248,104,24,9,341,417,531,1],"opp":[2201,195,313,758,1,1,446,429],"ops":[513,464,441,979,507,355,166,289,98,295,267,11,782],"opt":[42,25,354,542,121,310,251,50,763,326,252,10,263,1,19,36,105,1,36,100,156,97,26,6,127,104,243,416,299,87],"opu":[859,325,2232,1,499,99,390],"opy":[5282],"oqu":[1089,4040],"ora":[58,560,1,1,205,72,71,129,88,1,1,1,1,1,1,8,78,336,1,372,1,352,104,126,430,68,95,7,244,10,50,1,1,202,1,217,2,833,81,226,17,1,202,282],"orb":[3476,1,1380,40],"orc":[1191,797,1,888,293,308,1,438,1],"ord":[895,87,1,209,1,1,1332,837,1,116,1,1187,1,222],"ore":[167,119,1,14,31,61,61,47,120,1,204,141,131,97,83,129,17,30,501,1,34,1,1,1,1,51,267,12,133,66,1,21,503,36,87,1,1,50,219,40,1,1,1,337,76,21,1,188,1,427,195,81,23,703,11],"orf":[1099],"org":[1995,1090,401,1,1,1,1,1,1,1,428],"orh":[302,1289,688,394,780,597],"ori":[98,655,231,212,1,1,323,181,255,1,1,229,1,209,480,1,1,1,55,398,16,49,31,64,1,1,1,1,1,1,1,1,408,12,68,135,726,143,24],"ork":[2015,2798,1,676],"orl":[3913,1535,43,1],"orm":[43,1,5,7,7,28,30,5,47,18,21,14,32,15,25,64,6,12,86,43,11,61,110,93,15,10,5,6,30,42,38,6,63,1,55,30,21,79,14,84,39,1,33,12,154,54,15,49,40,34,36,70,37,1,82,56,1,1,1,1,1,1,1,54,3,5,23,70,17,9,50,19,85,2,18,167,156,21,2,25,42,12,4,2,86,191,150,23,13,4,95,8,30,26,46,2,19,27,7,3,6,98,33,31,25,2,2,1,29,17,18,94,1,15,9,89,1,3,48,5,56,9,108,68,44,73,162,5,45,88,37,5,29,32,25,10,9,28,58,2,28,55,74,34,9,10,28,77,1,213,25,1,29],"orn":[92,25,253,253,69,508,1,1,1,144,1052,1,1,1,1,1,1,1,660,46,62,329,109,78,321,103,219,442,22,259],"oro":[827,142,1,1,1,1,1,1,1,1,145,565,155,136,55,13,279,82,139,215,447,1,234,61,419,105,704,1],"orp":[41,139,15,18,71,1,180,642,79,2,1,15,144,84,15,1,193,110,311,630,1,381,101,1,1,77,62,1,200,9,181,6,211,1,72,42,1,5,353,8,1,1,1,1,1,1,330,198,52,138,172,138,104],"orr":[1596,72,20,1562,1,1419,461],"ors":[47,91,59,306,585,12,77,346,1,290,140,190,182,82,1,1,1,1,86,653,184,553,69,169,20,284],"ort":[187,165,201,18,101,533,1,798,401,1,88,350,52,201,81,9,165,1,114,38,1,1,419,1,610,1,171,100,86,1,236,363],"oru":[3830],"orv":[1207,1,1],"orw":[2005],"ory":[48,330,634,172,593,379,28,161,20,726,275,592,242,176,97],"osa":[291,1160,28,1306,952,59,328,146,1,124],"osb":[2219],"osc":[762,692,1465,1,166,93,329,266,217,1,47,1,327,491],"ose":[84,543,260,153,1,1,1,1,85,190,41,300,493,32,1,1,293,133,242,17,1,1,127,146,1,20,186,1,1,627,1,30,206,52,1,1,655,128,138],"osh":[1282,1341],"osi":[1130,255,1,275,500,721,23,169,46,191,157,1,73,64,669,617,38],"osk":[1671,110],"osm":[3509,1],"oso":[98,889,1,18,241,17,1,1524,675,1,551,1,259,92,1],"osp":[209,123,122,513,705,580,669,127,73,199,191,319,1164,544,11],"osq":[3180],"oss":[64,56,272,308,351,211,1,1,1,1,850,41,63,961,1,284,46,1,3,1,411,1,1,1,1,1],"ost":[145,79,137,849,200,1,262,1,80,237,41,91,1,40,249,1,31,229,112,1,96,60,32,208,1,128,45,157,1,1,1,1,1,1,382,32,1,1,1,81,11,238,10,503,213,42,505],"osu":[5505],"osy":[688,907,2170,1,1],"ota":[163,11,79,78,118,4,121,50,129,242,692,1,39,5,363,60,204,1,91,197,530,7,24,95,55,162,243,11,164,1,79,29,243,1246,9],"otb":[3637],"ote":[1230,17,481,256,1328,48,162,21,87,138,252,1,1,1,1,1,158,176],"otf":[3638],"otg":[4539],"oth":[91,8,41,85,35,1,364,272,17,611,1,305,350,265,248,75,192,122,103,1,1,173,6,156,1,908,182,11,73,427,1,1],"oti":[106,142,440,3,303,217,1,455,62,17,507,199,329,1,54,21,84,178,70,1,172,163,1,105,112,283,25,17,211,36,616,38,164,158],"otl":[400],"otm":[3191],"oto":[236,1223,1483,388,33,1,1,1,1,160,1,1,236,1,1,174,86,1,1,384],"otr":[947,282,1082,852,150,1,682,1,33,1,1,331,1],"ots":[272,157,407,347,542,176,286,971,33,177,44,227,630],"ott":[592,34,1,1,585,314,1665,338,1,411,1,337,1,454],"otu":[680,2205],"otw":[2664],"oty":[1214,216,301],"oua":[148,1,1066],"oub":[629],"ouc":[1216,312,2416,1,1189,1],"oud":[1045],"ouf":[774,1],"oug":[155,475,355,544,152,2184,417,1,775,1,11,1],"oui":[3132],"oul":[2006,673,1,513,1347,658],"oun":[181,124,326,500,86,1,1,788,214,195,1,777,1,817,272,1,1,1,384,1,231,100,241,252,23],"oup":[2222,1,1,1,1],"our":[504,597,1,1,1,116,788,1,181,1234,1249,1,1],"ous":[184,445,122,73,3,12,59,67,199,12,129,54,49,22,22,30,198,18,144,38,8,90,55,13,52,129,96,2,93,1,46,81,110,230,174,3,97,1,35,1,1,71,50,58,66,190,68,327,8,307,146,87,7,273,204,1,36,74,139,1,173,59],"out":[34,1566,427,722,450,1,1,331,1,1,1,411,25,665,1,39,1,1,1,1,58,77,256,112,291],"oux":[5156,1],"ova":[1379,1823,334,1,1,1987],"ove":[35,830,181,1,174,1,1,1,306,1,483,379,1,101,67,325,89,1,226,1,1,334,1,326],"ovi":[198,434,1,2573,335,1],"ovo":[3543],"ovu":[3544],"owa":[847],"owb":[1226,3413,42],"owd":[3947],"owe":[634,232,279,206,268,3,338,1,1,1,1,15,910,1,1058,938,22],"owf":[635,3471],"owg":[309],"owh":[636,4050,774,55],"owi":[141,577,1262,73,176],"owj":[5516],"owl":[2010,1,58,351,210,78,322,515,1,1,710,1143],"own":[681,367,219,265,1,1132,883,120],"owr":[310,917],"ows":[719,509,40,962,143,577,81,1258,398,222,552,26],"owt":[2231],"oww":[2158,2458],"oxa":[3549,1],"oxe":[2013],"oxf":[638],"oxg":[2014],"oxi":[271,3059,1806],"oxo":[1229,2383,2],"oxp":[3551],"oxy":[3552,1,1],"oya":[715,233,2607,735],"oyi":[1404],"oyo":[1230],"oys":[639,2917,1],"oze":[4291],"ozo":[177,61,650,388,3,309,790,69,621,546,220,587,1,280,71],"pab":[796],"pac":[150,241,732,2435,1,1,1403],"pad":[3561,1,1,1,1118],"pae":[3565],"pag":[5536,1],"pah":[3454],"pai":[3566,1,1,1],"pal":[2490,581,499,1,1,1,1,1,1,1,1,1,1,1,1,100,1,302,76,413,659],"pam":[3583,1],"pan":[776,184,822,581,236,986,1,1,1,1,1,1,1,1,1,1,1,1,1,1085],"pap":[3599,1,1,1,1,1,1],"par":[249,13,1,78,1,579,203,1,350,194,1109,1,1,272,148,49,357,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,825,1,208,1,1,1,464],"pas":[1662,1921,68,1,1,1,1,1,1,1,1],"pat":[240,2251,1169,1,1,1,1,1,1],"pau":[3667,1],"paw":[3669,1],"pay":[3599,754,1],"pba":[2430],"pbe":[4128,514],"pbi":[4517,920],"pdo":[5153],"pdr":[4633],"pea":[250,14,1,1,1479,1926,1,1,1,1,509],"pec":[343,174,1198,68,180,1588,125,1,1,1,1009,1,1,1,1,1,1,1,1,570,219,1],"ped":[547,343,124,399,276,534,877,580,1,1,1,126,1,66,201,1,433,323,267,29,111,6],"pee":[3684],"pef":[3814],"peg":[3685],"pei":[1055],"pel":[829,2857,1,1,1,1,1],"pen":[56,211,1,76,486,1676,949,1,1,47,188,1,1,1,1,1,1,1,1,1,25,764,207],"peo":[3702,996],"pep":[777,2926,1,1],"per":[209,589,447,1,212,18,196,62,217,250,23,20,8,144,64,32,50,18,65,6,1,77,506,243,1,1,140,1,102,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,86,1,197,331,2,1,257,1,29,65,1,1,1,185,1,1,1,1,1,8,41,1,22,1,31,1,1,161,98,17,78,28,100],"pes":[232,19,1163,783,136,377,1038,373,335,56,123,590,142],"pet":[831,904,1,1088,906,1,1,1,1,1,1,1,1,1228,222,1,1],"peu":[3739],"pew":[4967],"pex":[252,2648],"pez":[3740,1,1,1],"pfi":[4062],"pha":[41,19,1,65,87,72,431,46,15,33,85,1,1,210,51,28,2,1,219,220,1,1,11,96,14,429,196,85,1,230,293,69,1,184,15,62,74,1,126,9,1,31,155,32,1,1,1,1,1,1,1,1,244,237,133,31,383,159,500],"phe":[180,73,1442,623,603,833,949,1,1,1],"phi":[182,1,1,1,10,42,17,211,301,292,290,26,1,1,56,15,1,63,1,288,262,189,209,415,187,190,209,147,1,98,38,2,8,1,1,1,97,190,77,1,240,379,250,38,70,79,123,227],"phl":[1731,2028,1],"phn":[1340],"pho":[994,283,1,146,314,423,20,276,419,198,88,13,1,1,584,1,1,1,1,1,1,128,95,53,345,33,1,158,1,1,1,268,186,468],"phr":[899,1430,1,985,1653,1],"phs":[2693,624,75,972],"pht":[1687],"phy":[236,195,254,1,1,153,1,59,38,9,23,1,1,1,1,161,176,2,80,255,91,220,112,1,62,20,12,641,96,89,55,467,104,63,87,1,1,1,1,1,1,1,1,1,1,33,85,28,27,1,276,3,470,32,94,25,7,76,203,18,1,78,312,1],"pia":[255,1,1438,1310,1,1],"pib":[1696],"pic":[142,1,375,646,533,634,243,346,166,227,1,283,182,1,1,1,1,1084,313,1,1,44,1],"pid":[918,1865,1,1,1,444,1,543,234,215,1,483,1,1,354,22,455],"pie":[2928,856,131,440,806],"pif":[380,1260],"pig":[1698,1253,1,833,1,1,1,1,1,1472],"pii":[2480,1997],"pik":[3791,1,918,1],"pil":[854,1,2607,140,191,1,1,1,1,109,157,754],"pim":[3581],"pin":[1415,783,18,9,401,92,403,199,436,42,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,104,1,438,1,62,293,1,1,1,1,1,1,1,1,296,156,196,51],"pio":[3603,1,435,1,366,1,1,1,1,1,1,66],"pip":[3814,1,1,1,1,1,528],"pir":[3820,1,378,1,521,1,1,1,246,331],"pis":[1733,1054,676,1,1,352,5],"pit":[49,87,106,146,1,514,1,1,1,793,708,642,1,61,644,63,5,1,1,1,1,1,1,1,1,391,248,330,242,98,246],"pki":[2825,1234],"pla":[975,1,501,1,128,64,1492,394,216,60,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,37,19,123,148,540,631,82],"ple":[269,857,1,142,72,399,1,26,737,484,237,1,148,430,55,1,1,1,202,510,1,201,117,1,278],"pli":[2493,2233,1,712],"plo":[1455,1,197,625,1,1584,1,1,1,1307],"plu":[3867,1],"ply":[270,4248],"pme":[1416,1],"pne":[3869,1,1],"pno":[1457,2415],"poa":[3873],"poc":[126,131,2206,1,1410],"pod":[185,73,55,1,1,47,288,98,148,62,397,1,100,630,1,254,1,238,1,322,1,356,154,1,204,43,213,1,1,19,142,9,311,30,417,218,1,312,1],"poe":[2392],"pog":[1135,1330],"poi":[259,1061,1912,646,1,1,1,44,71,959,378],"pok":[2640],"pol":[3882,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,959,88],"pom":[63,1578,2261,1,1,1,1,91,1443],"pon":[1128,2779,1,1,1,1,817,246,299],"poo":[3912,1,816],"pop":[1158,1201,1,1554,1,1],"por":[332,122,299,214,1527,554,419,363,67,1,12,7,1,1,1,1,1,1,1,1,1,1,406,397,1,1,1,162,1,98,544,11],"pos":[84,1045,1,230,25,1,93,1987,2,1,73,386,1,1,1,1,1,1,1,1,1,77,110],"pot":[260,1,1470,628,1,476,1102,1,1,1,1,1,416,375,1],"pou":[1131,469,2344,1,1,1057],"pow":[3947,1],"ppa":[262,1],"ppe":[264,1,1,1,1,1190,493,250,195,313,506,488,1,640,290,467,173],"ppi":[2216,502,1038,159],"ppl":[269,1,1071,2463,1089,1],"ppo":[2359,1,1107,1,1,1426,1,544],"ppr":[271],"ppy":[2280],"pra":[3949,1,1,1,1,1,1,942],"pre":[1132,159,1,1,28,66,1316,808,445,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,210,1,549,717],"pri":[239,33,527,334,1,188,1,102,1279,1115,158,1,1,1,1,1,1,1,1,1,1,1,1,1,747,538],"pro":[271,1188,1036,1089,184,223,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,156,1,1,170,1,1,1,1,374],"pru":[4033,706],"prz":[4034],"psa":[1460,1],"pse":[977,227,2831,1,1,1,1,1],"psi":[513,913,1478,355,166,289,98,229,333,451,1,110,340],"pso":[1135,499,2408,1],"psu":[801,1],"psy":[4044],"pta":[74,1,2713,1691,1,1],"pte":[42,25,9,197,148,542,121,189,119,2,68,183,50,622,141,326,252,10,263,1,19,36,142,100,156,97,32,8,119,26,1,1,1,75,243,215,244,256,87,371],"pth":[1388],"pti":[77,1197,1,360,108,27,1,1608,91,1,234,181,163,1,141,1,29,561],"pto":[765,1,510,1513,1336,1,20,681],"ptu":[803,1,918,1,2759],"pua":[3605],"puc":[805,3246],"pue":[4052],"puf":[4053,1,1,1,1],"pul":[1184,111,1,488,1113,81,615,323,489,620],"pum":[859,3199,1],"pun":[2657,2083],"pup":[4060,1,1,1],"pur":[2867,1197,1],"pus":[1248,2168,1,439,159],"put":[4066],"pyc":[4067,1],"pyg":[166,1584,1,2121,197,1,1212],"pyi":[3404],"pyr":[4071,1,1,1,1228],"pōh":[4075,1],"qua":[274,1426,1,1,2375,1,1,1,1,388,272,1,1,1,1,1],"que":[743,1784,388,1167,1,400,775,1],"qui":[59,216,1,569,244,1748,1,1,341,49,855,1,1,1,106,554,1,1,1,1,1,1,376],"quo":[92,3996,396,1],"rab":[1159,72,1,959,1415,483,1,299],"rac":[224,53,1,1,74,24,89,174,1,1,164,1,1,71,19,32,1,1,1,1,1,250,1,5,272,333,396,54,220,444,33,124,102,180,35,61,28,46,88,1,1,206,134,142,1,115,1,1,1,1,189,635,19,32,51,1,1,1,1,1,54,11],"rad":[936,297,136,824,1,215,326,875,1,1,231,250,1,1,1,1,1,1,873,171,1],"rae":[944,1122,3260],"raf":[2138,1,1961],"rag":[280,61,1,14,262,1,1,914,1,1,1,1,1,447,1,2114,1,279,1,1,45,205,178,334],"rah":[3613,1],"rai":[643,1,896,2410,153,1,1,1,1,1,1,1,92,614,330],"raj":[4111],"rak":[1234,2381],"ral":[58,296,28,1,1,1,1,1,1,1,145,1,345,11,296,1,1,1,39,295,173,393,10,1,1,93,52,92,104,289,1,6,365,1,174,1,133,203,62,138,81,38,466,101,219,1,315,137,64,89,200],"ram":[645,1370,984,618,90,32,43,1,329,1,1,703,462],"ran":[161,89,15,16,1,1,1,1,21,1,260,79,1,1,1,1,159,1,158,231,36,1,1,1,1,378,116,283,101,1,1,350,120,109,360,1,1,52,261,50,51,1,18,327,83,1,123,88,1,1,1,1,1,32,171,407,88,47,72,34,176,1,1,1,1,77,1,1,1,1,5,68,34],"rao":[2526,2371,125],"rap":[899,341,732,224,1,1421,1,502,1,1,1,1,1,890,7,1,1,127,1,270,116],"rar":[892,1456,1779],"ras":[309,342,1,156,151,710,73,456,1,1,1,1,367,103,68,1,393,115,371,1,1,1,1,1,1,1,263,61,1,176,243,58,255,203,12,87,40,36,47,388,25],"rat":[262,549,89,45,152,27,248,103,138,1,295,194,100,52,310,1,79,1,88,356,1,36,331,170,193,132,65,111,1,1,1,1,1,1,31,33,1,275,1,15,328,44,1,132,1,1,169,90,71,1,1,10,1],"rau":[5063],"rav":[2204,1932,859,159],"raw":[1241,1,56,243,2413,1,865],"rax":[897,1570,1162,1426],"ray":[308,935,962,1932,1,1,655],"raz":[653,1553,1],"rba":[2323,1278,1676],"rbe":[437,1,1,74,1108,3704],"rbi":[634,95,556,1,1038,1,1,758,393,1380,16,24,502],"rbl":[2989,2399,1],"rbo":[117,169,1,524,1,1],"rbs":[2327,1906,1227],"rbu":[556,4318],"rca":[1734,1744,1397],"rce":[1988,1720,965],"rch":[288,1,1,1,101,156,1,265,78,829,627,371,158,113,1,1,25,127,1,25,309,230,1,1,635,87,331,136,378],"rci":[901,810,278,1723,72,629],"rco":[902,1,1,1,1,31,254,2522,1,652,1,1,1,519],"rct":[228,64,1,4561],"rcu":[730,279,1,1,1,1,1529,917,1,207,250,1],"rda":[815,80,87,1,210,2437,1,1037,1],"rde":[481,1595,206,244,954,1,1410,350],"rdf":[482,2366],"rdi":[816,1,1,3552,602,236],"rdl":[2568],"rdo":[907,1,2724],"rds":[230,257,21,43,15,25,43,32,61,2,465,32,307,352,136,152,26,49,181,80,198,46,26,70,59,218,72,180,53,104,4,516,317,45,9,17,93,129,208,9,300,217,5,33],"rdu":[2780],"rdv":[28],"rdy":[4847],"rea":[286,9,359,1,1,1,1,1,1,584,117,93,88,666,246,1686,1,1,1,69,1,201,309,13,85,1,1,241,1,90,298],"reb":[1909,300,699,1027,601,620,1],"rec":[296,1408,1,1777,662,1,1,1,1,1,855,494],"red":[301,92,531,174,4,23,35,62,346,96,180,1046,332,1,345,388,1,1,1,1,1,189,1,1,1,1,1,162,75,150,422,184],"ree":[661,584,1,87,37,1,391,255,76,109,8,1,1,1624,320,1,1,1,1,906,92,1,1,1,1,1,1,216,100],"ref":[1910,1,2050,1,199,1,1,1,1],"reg":[110,1880,585,908,1,682,1,1,1,1],"rei":[2455,597,1119],"rel":[167,276,351,135,757,961,95,176,254,6,473,82,394,45,1,1,1,1,1,1,492,79,1,1,512],"rem":[1797,1,1,1,191,1172,800,1,215,1,1,1,1,982],"ren":[263,750,423,1,581,147,405,439,624,1,81,356,1,1,511,240,307,20,348,1,1],"reo":[621,130,496,2022,216,1297,571,1],"rep":[1248,495,2441,1,1,1,1,1,1,1,1,633,1,1],"req":[2527,1666],"rer":[483,139,842,1379],"res":[111,176,45,122,372,141,165,117,1,1,27,10,3,1,1,28,66,20,299,15,126,108,37,1,26,1,25,136,73,29,29,12,133,66,1,21,487,16,36,14,344,380,76,22,45,1,1,1,1,1,138,1,77,1,6,1,1,1,1,1,1,1,1,1,1,1,452,75,104,6,2,155,19,50,302,169,11],"ret":[1112,312,351,1,1,179,1217,176,556,66,234,1,1,1,1,1,1,1,1,1,229,1,1,1,1,271,1,109],"reu":[3388,473,111],"rev":[1252,2721],"rew":[662,1250,82,2421,128,1,619,305],"rex":[3228],"rey":[1114,1099,1,489,808,463,1,1],"rfa":[4898],"rfe":[2492,2516],"rfg":[4899],"rfi":[210,1,384,1531,1270,660,271,240,86,112,124,280],"rfl":[124,607,1,1,889],"rfo":[3716,1,1540,143],"rfp":[4900],"rfr":[4766],"rfu":[1099,4,2845,1294],"rga":[297,2696,92,401,1,1,1,1,1,1,1275],"rge":[298,1168,1,183,1,27,317,312,413,1,1,1,2125,53],"rgi":[1468,24,1502,1,880,46,1434],"rgo":[1707,3536],"rgr":[1762,1731,1751],"rgy":[1676],"rha":[2673,1542,1,1],"rhe":[302,1971,1945,1],"rhi":[814,777,5,72,20,591,971,1,606,363,1,1,1,1,1,1,1,599],"rho":[4228,1,1,1],"rhu":[4232,1],"rhy":[2917,536,597,184],"ria":[66,33,141,51,90,31,1,123,1,84,189,10,89,150,1,128,1,7,116,139,107,45,99,32,388,348,271,44,229,1,2,66,34,1,142,277,181,113,115,151,28,100,148,179,388,77,149,133,7,111,113],"rib":[821,356,76,1,235,1,2745,1,1],"ric":[95,1,2,5,1,1,1,1,50,13,1,1,100,85,1,12,11,380,132,88,184,1,1,88,63,269,37,84,1,248,126,686,304,58,130,259,457,1,225,35,1,1,1,1,464,123,1,102,1,61,173,1,42],"rid":[115,124,116,66,92,1,481,1,37,398,184,125,1,217,1,518,227,249,108,254,19,264,37,13,5,1,1,123,41,39,3,40,23,300,19,537,51,56,223,103,143,5,1],"rie":[438,77,49,153,36,79,1,14,102,278,294,100,98,345,121,26,73,577,356,277,1,1,454,178,358,1,1,332,198,289,1,1],"rif":[43,1,5,7,170,1154,1301,90,102,1,635,147,107,137,22,68,414,162,285],"rig":[663,1,31,1326,714,261,501,1,746,588,337,1,105],"rii":[752,98,64,22,1064,50,1,144,283,1043,389,83,1539],"rik":[725,557,1031,565,1667,1],"ril":[1543,174,1,304,166,1,486,294,320,68,42,320,260,462,342,119,100],"rim":[799,149,3031,1,1,1,1,1,261,302,624],"rin":[81,59,228,67,49,320,47,253,93,1,25,99,1,221,15,335,67,62,1,191,86,33,348,290,25,297,112,93,96,1,61,113,192,23,176,85,1,1,76,189,130,31,63,96,111,14,7,3,1,122,56,238,91,26],"rio":[235,599,60,90,42,399,366,730,34,945,1,1,12,206,1,215,50,1,1,57,444,179,1,221,420,1],"rip":[1014,1202,2618,234,104,1,91],"riq":[3229],"rir":[2917],"ris":[299,366,1,1,1,1,84,168,10,1,1,1,199,1,122,98,863,354,1,307,1,1,841,267,1,845,124,274],"rit":[257,413,1,1,585,150,1,1,1074,1,1,451,62,24,29,265,1,406,850,445],"riv":[1389,1,2859,1,1],"riw":[3724],"rix":[2694,30,294,1051],"riz":[935,708,1,754],"rjo":[2999],"rka":[3043],"rke":[1343,3866,281],"rki":[3000],"rko":[2274],"rks":[28,180,653,1556,308,305,571,779,135,299],"rld":[5491,1],"rle":[1297,272,697,2124,1058],"rlf":[3674],"rli":[1903,59,115,190,2501],"rlo":[2556],"rly":[1031,539,248,1470,357,268,100],"rma":[300,1091,1,1,129,68,407,1,86,168,77,1,1,115,79,826,374,975,1,1],"rme":[43,1,5,7,7,28,30,5,47,18,21,14,32,15,25,64,6,12,86,43,11,61,110,108,10,5,6,30,42,38,6,63,1,55,30,21,79,98,39,1,33,235,49,74,36,70,44,1,1,133,58,3,5,23,87,9,50,19,85,2,18,199,124,21,2,67,12,4,2,86,191,150,23,13,4,103,30,26,46,2,19,27,7,9,98,33,31,25,2,3,29,17,18,94,1,15,9,89,1,3,48,5,65,108,112,73,162,5,133,37,5,29,32,25,10,9,28,58,2,83,74,34,9,38,33,181,10,122],"rmi":[784,622,452,142,1,1,119,386,2434,1,68,1,1,1,1],"rml":[5255],"rmn":[1913],"rmo":[301,1,897,195,286,780,541,950],"rms":[209,94,1273,364,63,155,1944,185,329,297,54,501,26],"rna":[153,1,288,380,1,192,185,1,290,301,258,1,197,310,786,159,749],"rnb":[2400,1,1,313],"rne":[117,506,579,1,141,1059,1287,1555],"rnf":[2716],"rni":[92,278,144,310,1,1,1,520,326,379,1014,46,62,438,416,305,442,74,363],"rns":[557,1310,537,313,949,345,786,218],"rnu":[569,4773],"rnw":[2405,1],"rny":[5056],"roa":[97,576,1,398,2009,1172,1,815],"rob":[93,99,198,2692,1,908,1,263,105,1,1,72],"roc":[60,1,78,536,294,260,29,1,1,450,1,624,108,1550,1,1,1,1,1,48,210,1,1,474,442,1,104,1],"rod":[62,908,1114,245,1,6,1,1,1233,13,278,137,1,1,1,1,1,184,1,1,69,1,1021],"roe":[4261],"rog":[2025,1,1,1,1314,1834,1,1],"roh":[3084],"roi":[2082,3,359,328,864,98,1,118,70,1157,283],"roj":[4005,1],"rol":[1178,981,1848,255,1,1,1],"rom":[304,372,311,1,273,87,81,116,142,342,126,180,426,25,422,1,527,21,1,250,1,1,305,80,441,247,219],"ron":[899,374,273,145,1,338,1,1,300,241,755,683,1,62,156,607,1,1,248,88],"roo":[310,367,1,1,1539,420,1,446,152,1029,1,1,1,1078],"rop":[63,250,1,1,76,357,15,175,9,16,7,1,1,1,1,1,1,1,718,49,1,341,1,224,96,906,1,15,175,93,65,86,260,5,1,1,32,60,256,1,10,359,134,175,137,1,1,1,100,54,1,203],"ror":[3113,1778,128],"ros":[64,34,22,1142,1,1,1,1,144,1,808,1,225,474,1,1,165,34,1,616,246,1,32,1,1,202,50,1,1,1,1,1,1,1,615,81],"rot":[99,137,444,11,144,1,623,287,700,884,307,1,1,129,251,1,1,1,1,1,1,1,1,1,1,1,1,1,246,1,1,1,82,1],"rou":[305,519,3,1015,38,98,55,13,175,1,1,1,1,1,1,98,221,517,314,66,258,327,254,1,1,1,1,1,56,395,165,167,1,100,12,61],"rov":[2495,481,1],"row":[309,1,371,37,1,548,1,785,175,1,1,1,1044,1013,1,396,1,1,823],"rox":[271],"roy":[1404,711,2175],"roz":[2447,1844,482],"rpa":[3071],"rpb":[4517],"rpe":[829,1,1,1132,370,1393,764,640],"rph":[41,139,15,18,71,1,180,642,79,2,1,159,84,15,1,193,110,311,630,1,381,101,1,1,77,62,1,200,9,181,6,211,73,48,353,344,198,52,310,138,104],"rpi":[854,1,1719,1465,1,366,1,1,1,1,1,1],"rpl":[3556,508,454],"rpo":[3925,1049],"rps":[323,127,754,3528],"rra":[306,1,1,259,731,1374,462,1018,339,374,151],"rre":[443,2132,1386,709,79,1,1,266,114,17],"rrh":[1596,72,20,1562,1,11,595,969],"rri":[438,77,49,268,1,1,115,65,607,564,99,50,883,189,556,166,692,198,195,148,1],"rro":[309,1,408,1,116,1,1217,1060,162,362,1,1,1046,1,1,205,11,116,344,147],"rry":[470,46,1,1,47,25,247,398,843,1,343,407,389,1202,222],"rsa":[1377,99,47,3452],"rse":[1299,195,914,1,1,1,1,147,1,820,1,1,1048],"rsh":[3002,1],"rsi":[1464,31,1,2231,1,1,839,408,1,1,268,37],"rsl":[3640],"rsn":[3641],"rso":[1524,3151],"rsp":[2560],"rst":[720,1194],"rsu":[1694,1310,1,1],"rsw":[558],"rta":[311,2183,769,1,1028],"rte":[1179,166,1078,142,1,441,1531,357,431,1,1,1],"rth":[312,1,1,1,237,1,357,1,661,1,1,1,1,428,5,451,825,1,66,1,152,1,1,1885,112],"rti":[187,42,87,1,1,1,519,1,366,1,662,1,1,1,472,205,13,447,170,465,1,1,134,1505,46],"rtl":[3265,1,380,1568,1],"rtm":[352],"rtn":[3647],"rto":[4052,1080],"rtr":[2093,1555],"rts":[571,101,548,337,849,438,253,103,449,1104,56,87,497],"rtu":[3467,459,1],"rub":[2232,1,2183,1,131,1],"ruc":[4739,101,1],"rud":[1801,2229,1,262],"rue":[5184],"ruf":[5185,1],"rug":[2033],"rui":[655,1379,1,1,198,359,67,998,1108],"rul":[1872,1192,586,1074,463],"rum":[915,354,278,2283,464,1,1,1,1,1,889,1,1],"run":[682,1,1190,362,126,501,692,479,220,47,1,1,1,888],"rup":[3996,1,80,1],"rur":[1431],"rus":[244,161,221,58,194,140,252,1,1,1360,106,50,436,362,400,46,272,1,1,1,1,1,1,1,761,1,221,90,117],"rut":[4842,1],"rva":[2726,1,1,1764],"rve":[1300,1,984,1,1032,82,1093,1,837],"rvi":[912,295,1,1521,1766,409,1],"rvo":[1209,2110],"rwa":[2005,2516],"rwh":[3276],"rwi":[1577,1],"rwo":[571,1991,282,343,1522],"rya":[1442,107,529,1],"ryb":[4443],"ryc":[519,1,2846],"ryf":[3382],"ryg":[42,25,206,3037,297,412,29,318],"ryh":[516],"ryi":[5313],"ryl":[162,1585,1,1,487],"rym":[1327],"ryn":[2184,546,1021,1],"ryo":[685,1,1,1,152,1,602,203,1,1,1,78,1,1],"ryp":[517,1,755,1,1,1,474,1,1857,1,612],"rys":[989,1,1],"ryt":[1710,1,2059],"rze":[4034],"sab":[4313],"sac":[1291,169,1,655,960,825,369,44,1,1,1,1,77],"sad":[1465,2854,1],"sae":[3041,569],"saf":[3042,1329],"sag":[4321,1],"sah":[4323],"sai":[4324,1],"sak":[4326],"sal":[38,406,1,672,175,85,99,3,44,1554,200,994,56,1,1,1,1,1,1,1,1,1,1,1,637],"sam":[4339,157],"san":[392,597,1843,922,586,1,1,1,1,1,1,1,1,1,1,1,709,1,20],"sap":[4352,1,1,1,1,1,1,1,1,1,1,1,1],"sar":[3289,1076,1,1,1,1,1],"sas":[345,60,3966],"sat":[1869,2503],"sau":[291,1160,1334,1588,1],"sav":[846,2891,638,1],"saw":[4377,1,1,1],"sax":[4381,1,1],"sbe":[2173,46],"sbi":[2199],"sby":[3965,1],"sca":[1712,1,997,212,87,129,1246,1,1,1,1,1,1,1,1,1,1],"sce":[287,259,703,147,1,1,1,1124,1,395,1166],"sch":[1466,1,1,1711,1216,1],"sci":[321,209,939,1761,1,1,276,314,169,1,405,1,1,305,154],"scl":[3233,1,1166,1],"sco":[322,1,1,1,1,1,1,1,1,1,1,1122,16,1450,166,688,265,1,362,1,1,1,1,1,1,1,1,1,1,1],"scr":[4414,1,1,1],"scs":[3139,4],"scu":[333,915,1096,891,1,1182,1,1,894],"scy":[762,3605,54,1],"sea":[1471,1,2951,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"seb":[2185,1012,1,1241],"sec":[2543,1,1,1,1,12,1881,1,1,1,1,1,1,1],"sed":[931,110,88,3,1,130,339,57,1,210,185,505,217,327,251,116,523,20,96,338,1,1,1,238,598],"see":[1941,2180,331,1,1,1,1,1,1,1],"sef":[2186,1],"seg":[346,4114,1,1,1,802],"sei":[977,2854,633,1],"sel":[684,358,294,1,1,1081,165,288,368,1226,1,97,425,50,295,75],"sem":[347,3847,1,1,1,76,195,1,1],"sen":[36,263,1838,1830,1,218,1,284,1,1],"sep":[2480,1994,1,1,1,1,1,1,1,1],"seq":[4483,1,1],"ser":[56,170,817,317,40,666,343,139,833,1,18,251,1,1,1,1,1,1,829,1,1,1,1,1,1,1,1,1],"ses":[120,74,154,111,104,279,26,156,20,428,190,61,477,114,46,50,1,60,142,260,1,5,103,166,34,73,101,61,473,35,3,1,1,1,53,236,54,150,6,66,1,218,214,203,63,93,96,113],"set":[2412,589,777,100,620,1,1,548],"seu":[4035,1,1,1,1,1],"sev":[4501,1],"sex":[334,1,4168,1,1,1],"sez":[2945],"sfe":[5147,1],"sfi":[1307,841],"sfl":[746],"sfo":[5149],"sfu":[4868],"sha":[208,653,1556,923,1040,127,1,1,1,1,1,1,1,1,1,1,1],"she":[202,4,5,33,183,36,130,2,16,15,12,85,10,84,26,1,193,11,222,67,109,41,60,82,261,26,55,55,26,74,41,4,15,78,29,311,8,40,2,84,16,140,108,154,57,85,84,256,36,140,97,6,60,79,6,27,12,5,199,30,74,110,1,1,1,1,1,1,1,1,1,1,1,1,1,1,149,28,66,98,27,161,5,6,39,57,21,238,70],"shf":[1917],"shi":[169,555,496,268,347,83,382,1873,361,191],"sho":[2201,210,1703,421,1,1,1,1,1,1,657],"shr":[725,557,1031,924,1305,1,1,1,1,1,1,1,614],"shs":[725],"sht":[726],"shu":[2623,1927],"shw":[2020],"shy":[3003,1548],"sia":[337,1,1,43,1,51,1303,5,295,1,478,224,1,205,781,166,413,1,1059],"sib":[1387,94,2451,620,1,804],"sic":[447,204,1,373],"sid":[448,1,1,1,1,1,1,59,8,1,468,169,1,266,280,74,381,388,331,24,1,354,166,109,278,386,77,99,180,1,1,1,11,116,208,44,117,193,30,7],"sie":[468,866,12,609,3022],"sif":[1464,31,2017,1,3,198],"sig":[1401,405,2752,1],"sii":[4978],"sil":[455,1124,2918,63,1,1,1,1,1,1,1,1,1],"sim":[3728,842,1,1,1,1,1,1],"sin":[127,218,111,1,482,195,339,188,395,826,27,205,6,348,462,21,1,625,1,1,710],"sio":[82,1416,1,285,135,1483,1,255,273,84,17,1326],"sip":[4580,1,1,1,242],"siq":[845],"sir":[4584,242],"sis":[349,812,1,1,163,629,352,767,211,321,123,36,1,819,345,13],"sit":[39,301,790,252,3,1,110,173,1396,1,183,62,158,73,78,1,1,1,1,1,1,1,414,545,1],"siv":[83,28,1531,132,16,713,508,417,720],"six":[4588],"siz":[3767,822,1],"ska":[4591],"ske":[1671,110,2811,850],"ski":[458,2757,819,559,1,1,1],"sks":[4959,258],"sku":[4597,1,1,1,1,1],"sla":[2577,1,1504,521],"sle":[460,3180,964,1,1],"sli":[4607,1,1,1,1,1,1],"slo":[4614,1,1],"slu":[4617],"sly":[1176,3400,735],"sma":[131,1,1270,1033,550,768,865,1,1,359],"sme":[3509,1112,1,1,1],"smi":[324,1079,267,930,2550],"smo":[1617,1893,335,192,588],"sms":[3085,406],"smu":[4626,1],"sna":[4628,1,1,1,1,1,1],"sni":[3641,815,179],"sno":[4636,1,1,1],"snu":[4640],"soa":[4642,1],"soc":[350,1,640,723,38,1,1314,902,73,602,1,1,215],"sod":[3722],"sof":[4647],"soh":[2157],"soi":[1634,1247,1395,372,1],"sol":[1524,1055,2071,1,1,1,1,1,1,1,1,1,1],"som":[987,1,18,258,1,1524,675,1,52,499,1,351,1,292,1,1],"son":[554,948,715,1664,555,228,1,1],"soo":[4667],"sop":[1135,1333,112,1,658,804,632],"sor":[48,50,254,2146,1975,195,1,1,165],"sos":[1264,1,1522,533],"sot":[1247],"sou":[4671,1,1,1,1,1,1,1,1,1],"sov":[1379],"sow":[847,3834],"soz":[1588,1480],"spa":[341,1,1133,888,2319,1,1,1,1,1,464],"spb":[4128],"spe":[209,134,1,1132,196,43,537,308,2128,1,1,1,1,1,1,1,1,1,1,1,1,1,1,239,1,324],"sph":[2318,603,1782,1,1,1],"spi":[142,1,1021,1034,923,199,879,1,507,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,361,87,247],"spl":[1477,1,3247,1,1],"spo":[332,122,299,214,512,1569,782,898,1,1,1,1,1,1,1,259,339,205,11],"spr":[3511,1225,1,1,1,714],"sps":[5396],"spu":[2867,1873],"squ":[3180,1561,1,1,1,1,1,1,1,1,1,1,1,1],"ssa":[38,307,47,454,445,1,824,1173,1082],"ssb":[2199],"sse":[120,226,1,1,111,104,121,340,108,131,399,538,745,237,58,411,1,1,1,1,1,1,271,1,1,1,63,430,140,770,163],"ssf":[1307,841,2720],"ssh":[2201],"ssi":[111,234,4,302,1,373,321,41,532,1092,103,398,1,3,142,272,1,1,374,1,190,187],"ssl":[460],"sso":[48,302,1,1,495,417,1,892,311,1049,205],"sst":[2202],"ssu":[738,555,847,1326,467,37,338,677,118,1],"ssv":[1266],"ssw":[461],"sta":[727,335,148,46,16,31,177,95,141,729,105,674,18,272,72,1168,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,88,44,361],"stc":[3935],"ste":[353,1,1,6,135,161,191,167,41,116,78,231,80,20,14,78,81,25,58,245,193,10,184,82,1,122,113,69,2,1,116,239,29,1,1,67,10,26,89,78,1,1,39,1,172,129,78,649,93,2,95,1,1,1,1,1,1,1,1,104,58,1,47,229,47,128,29,114],"stf":[2124],"sth":[1733,1730,1,1],"sti":[163,769,1,1,82,1,145,278,42,1,1,1,1,1,1,25,1,90,14,467,248,196,1,33,683,21,37,19,39,105,51,25,303,1,2,20,1,119,1,233,557,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,219,153,117,1,44],"stl":[665,1,1,1,1,75,2371,69,2259],"stm":[2286],"stn":[950],"sto":[196,1,377,1,274,561,1,319,434,200,1,457,190,41,849,127,773,1,1,1,1,1,1,1,1,1,1,1,1,1],"str":[224,132,26,1,1,1,1,1,1,1,1,1,357,131,1,285,1,1,237,85,1,227,1,365,1,1,1,1,3,112,445,139,87,1,69,414,162,1,142,191,165,184,1,74,379,160,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,20,1,153,18,301,1],"sts":[976,87,100,86,2,74,668,421,446,464,702,83,201,117,947,139],"stu":[576,1143,2218,907,1,1,1,1,1,172],"sty":[1674,1127,1,1509,539,1,1],"sua":[850,1,4419,1,21,1],"sub":[4853,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"suc":[587,1799,2482,1,1,1,1],"sue":[5103,1],"sug":[4873,1,1,317],"sui":[4876,1,108],"sul":[801,1,2896,506,104,570,1],"sum":[1168,2298,467,947],"sun":[4881,1,1,1,1,1],"sup":[1694,1310,1,1,1881,1,1,1,1,1,1,1,1,1,1],"sur":[2641,391,938,928,1,1,1,1,1,1,1,600],"sus":[738,125,430,847,2766],"sve":[1266],"swa":[4907,1,1,1,1,1,1,1,573],"swe":[558,2473,1884,1],"swi":[4917,1,1,1,1,1,1,241],"swo":[461],"syl":[4044,880,1,1,1],"sym":[357,1,1,329,4240,1,1,1,1,1,1,1],"syn":[3765,1,1,1169,1,1,1,1,1,1,1],"syo":[1347],"syr":[4944],"sys":[1595,3350,1],"syu":[1348],"tab":[1612,104,661,692,1,1138,1107],"tac":[361,10,1,1,1,1,1,436,101,199,152,8,13,1155,613,18,114,39,39,96,227,433,22,33,295,327,310,1,260],"tad":[4948],"tae":[1256,2583,660,857],"taf":[4754],"tag":[1465,2243,1047,1,1,192],"tah":[943],"tai":[599,70,384,116,1,1,11,651,132,447,376,145,261,1,206,439,1,407,658,44,1,1,1,419],"tak":[4954],"tal":[131,473,458,148,55,21,131,614,78,1,1,287,58,330,286,192,230,140,96,102,1,489,28,1,110,19,278,1,1,97,40,58,1,1,9,393],"tam":[311,2048,1,713,1,627,1060,197,1],"tan":[624,681,175,202,101,2,285,424,670,311,374,264,65,39,359,186,94,6,98,1,1,144],"tap":[4963,1,1,1,1,1,1,1],"tar":[228,1,163,335,576,272,28,947,692,51,1,1,219,7,16,756,104,46,5,212,103,1,1,1,1,1,1,1,201,1,1,1,1,1,1,1,2,213],"tas":[242,1799,410,598,611,168,736,415],"tat":[74,1,1789,393,1,187,892,158,444,1,246,295,290,1,28,401,115,1],"tau":[4773,207],"tav":[1626],"tax":[3775,1206,1,1,1],"tay":[4774,211],"tbi":[230,366,3041],"tbu":[4335],"tca":[2162],"tce":[3935],"tch":[729,124,396,719,194,127,1,723,372,276,163,1,976,27,95,63,484,1],"tcr":[3384],"tea":[160,71,265,1667,260,128,1469,1,754,212,1,1],"teb":[2021,544,1,2760,1,1,1],"tec":[1405,1147,1470,1,1,966],"ted":[74,2,241,33,307,408,90,17,7,71,37,96,54,52,25,3,122,136,151,58,448,61,27,18,21,20,41,203,318,112,69,174,2,5,50,13,293,21,142,147,3,12,19,6,236,17,14,15,244,159,1,255,5,67,38,2,1,2,4],"tee":[2964,11,1801,215],"tef":[2658],"teg":[4777,42],"teh":[5445,1],"tei":[1754,1033,525,203,253,90,167,968],"tel":[232,39,90,1,1,1,1,1,274,974,69,71,799,1,304,1,384,1,1,67,350,924,406,1,1,1],"tem":[1595,3183,1,166,1,50,1,1],"ten":[233,1,1043,1,203,298,7,1,1,1,1,148,1069,69,1,271,81,93,207,1051,219,1,1,1,1,1,1,1,1],"teo":[3516,1],"tep":[4781],"ter":[42,25,33,52,1,1,77,4,38,80,1,1,57,9,95,8,10,1,1,1,19,1,1,172,1,1,1,97,24,1,34,40,2,1,1,1,1,28,52,18,23,28,134,11,44,39,33,47,2,12,4,1,12,39,62,37,20,2,62,28,11,11,96,1,73,28,1,45,81,62,68,13,112,10,32,18,1,1,1,46,49,25,11,8,1,29,48,1,1,1,1,1,1,1,112,40,1,1,1,15,1,1,1,49,21,35,16,158,1,5,16,10,168,95,1,19,36,23,49,70,23,1,2,23,1,14,36,58,1,97,15,82,32,8,36,6,4,73,26,1,1,1,75,157,57,29,26,45,84,9,1,7,43,4,18,75,2,102,1,42,4,36,18,4,121,1,1,1,1,1,1,1,1,1,1,1,62,87,21,105,104,1,1,1,1,24,41,72,1],"tes":[57,47,208,18,10,265,81,125,162,7,3,28,23,138,21,37,97,22,101,20,56,143,59,18,34,57,2,88,145,13,244,176,58,3,93,21,81,21,25,138,120,51,33,100,9,50,80,89,66,78,9,112,100,9,18,35,48,29,92,58,3,261,51,44,101,78,103,92,104,45,7,1,136,8,85,40,39,1],"tet":[5022,1,1,1,1],"teu":[464],"tex":[5027],"tfi":[463,393,773,307,188,47,1467,451,1042,59],"tgu":[4539,377],"tha":[88,1,24,127,49,505,115,59,2107,210,1,20,79,185,209,1249,1,1,1,1,498],"thb":[1573,2949],"thc":[5126],"the":[91,1,7,37,4,85,35,1,106,1,20,1,232,37,1,244,1,1,1,8,75,620,1,89,21,120,3,1,1,92,244,123,142,14,281,17,325,28,1,74,1,166,14,156,1,70,1,1,127,42,1,1,59,1,27,278,90,248,207,1,1,21,124,119,90,1,1,1,1,1,1,1,1,1,1,1,76,7,13,270],"thf":[1574],"thi":[39,1,50,280,94,47,149,250,1,436,178,1,170,618,752,293,253,5,716,442,67,72,25,106,1,1,1,1,1,1,1,421,58],"tho":[41,1,113,81,1,1,74,81,119,180,205,50,740,46,431,1197,102,1,1,40,1,1,100,56,1,82,273,679,242,113,1,1,1,1,1,1,1,1,331,82],"thp":[3200],"thr":[244,69,1,1,1395,1,983,44,31,141,860,299,993,1,1,1,1,1,1,1,1,1,1,1,428,3],"ths":[161,914,500,256,196,748,186,227,13,770,461,182],"tht":[5074],"thu":[43,721,4311],"thw":[553,1023,3104],"thy":[464,517,774,1760,113,1448,1,1,1,1,1,58],"tia":[915,1,521,22,653,1,230,193,455,388,499,345,36,38,90,96],"tib":[3389,1693,248],"tic":[93,94,41,1,45,18,12,12,1,22,30,319,244,1,1,82,1,62,126,1,51,17,1,31,77,10,31,5,53,31,1,104,17,32,62,376,1,224,115,674,102,1,1,1,22,21,200,151,4,6,15,1,1,131,173,256,1,130,26,107,313,2,1,1,1,67,77,89,63,1,1,1,1,86,111],"tid":[39,66,27,116,736,10,12,729,1,138,459,119,1,31,77,275,105,39,70,1,11,97,152,51,4,159,1,105,74,31,14,5,24,50,17,1,2,20,118,62,19,153,366,279,222,88],"tie":[872,1619,687,903,492],"tif":[63,128,500,632,930,85,20,121,777,367,123,243,290,509,234],"tig":[163,3141,539,1246,1,1,244,1,1],"tii":[917],"til":[239,599,1,904,125,1,1,1,1318,93,1,66,537,163,1,141,1,18,579,1,302,176,22,1],"tim":[1352,1646,318,154,1,1191,431,1,1],"tin":[66,1,39,43,5,144,257,132,26,251,1,9,92,77,19,3,8,1,1,1,35,1,174,97,1,1,1,1,1,96,68,141,1,241,50,13,157,80,99,95,3,16,15,82,1,362,8,126,181,14,121,285,210,12,40,46,112,41,7,70,34,57,28,327,19,45,1,1,1,1,1,1,1,57,33,81,127,1,1,193,49,35],"tio":[68,7,35,208,1,32,471,1,274,24,20,12,3,1,9,1,213,4,100,6,114,86,56,18,6,1,5,18,70,5,52,76,1,44,1,60,18,404,5,98,153,1,75,135,98,39,61,94,78,133,13,4,6,213,1,153,31,40,34,13,3,17,110,40,16,10,6,133,493,41,271,1,104,68,25,24],"tip":[240,650,2335,1,1573,1,299,1,1,1,31],"tir":[1685,1,3094],"tis":[1067,1914,1,561,81,246,96,60,1077,1,3,253,87],"tit":[156,570,658,1352,1,600,797,412,255,304,1,1,1,1,1],"tiv":[69,8,1047,163,120,33,45,1060,1,732,704,42,140,10,1,1,10,4,257,870],"tja":[3227,112],"tki":[857],"tla":[369,938],"tle":[499,93,34,1,38,1,1,1,1,1,1,1,72,118,446,1,641,891,142,132,77,73,1,60,1,1887,1,188,1,19,20],"tli":[241],"tls":[400],"tly":[263,401,822,1006,14,21,279,378,462,79,235,50,168,431,221],"tme":[352,1934,1100],"tmo":[2032,1159],"tne":[3647],"tni":[858],"tnu":[950],"toa":[5112,1],"tob":[1667,2360,1087],"toc":[574,1,2542,1,245,1,49,9,105,1,1,499,385,389],"tod":[577,882,777,748,1,27,289,1,451,1362],"toe":[3115,65,760,1176,1,1,1,2],"tog":[1721,3399],"toi":[293,2071,578,683,1,1,1387,118],"tok":[1326],"tol":[3482],"tom":[465,163,137,645,1,16,169,91,43,434,889,255,9,585,127,774,1,1,1,1,314,420],"ton":[615,119,232,247,458,110,1041,351,664,755,216,1,1,312,1,1],"too":[1070,761,2110,1184,1,1],"top":[236,530,93,41,18,475,15,663,1,94,819,267,113,49,1,1,1,493,791,104,22,25,276,39],"toq":[5129],"tor":[47,31,60,58,1,181,471,163,76,89,7,504,14,75,37,330,221,701,25,59,1,145,38,1,31,33,143,136,210,69,1,167,1,20,54,575,36,1,1,1,204,112,1,1],"tos":[361,2428,363,613,1,1,63,72,41,86],"tot":[914,2205,248,629,1,1136],"tou":[1888,1745,403,779,319,1],"tox":[3330,1806],"toz":[1276,3426],"tpi":[242],"tra":[224,132,21,5,1,1,1,1,1,1,1,77,413,1,11,1,805,98,1,176,118,853,406,170,499,184,5,1,1,1,1,66,539,1,1,1,1,43,1,16,142,1,1,1,1,9,102,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,84,185],"tre":[1333,464,1,1,1,293,109,252,1,192,451,65,570,103,25,351,1,443,165,1,1,1,1,1,1,1,327,1,1,1,1,1,1,1,1,1,1],"tri":[49,108,200,1,12,43,348,132,1,101,1,169,1,1,10,203,27,1,1,80,1,97,37,93,1,365,790,1,143,1,113,226,163,128,555,626,1,1,1,1,1,1,97,1,84,149,1,1,1,1,1,1,1],"tro":[120,270,1,357,15,184,231,51,175,680,1,1,1,224,475,334,1,192,1,28,255,65,72,1,1,1,116,510,1,472,1,1,1,28,307,1,1,1,1,1,1,1,1,1,153,1],"tru":[915,103,783,2195,1,33,1,1,808,1,1,1,341,1,1,1,1,1,1,1],"try":[359,860,3715],"tsb":[2173],"tse":[2584],"tsh":[861,359,1093,1027],"tsi":[468,3066],"tsm":[2435],"tsu":[2641,2551],"tta":[148,94,129,1,1,1,1,1,1665,1008,779,213,281],"tte":[524,32,1,1,172,1,1,1,1205,1,211,690,180,56,1,453,1,134,1,276,338,112,194,149,148,267],"tth":[244],"tti":[39,110,767,1,735,1398,261,444,74,49,403,306,140],"ttl":[592,34,1,43,1,1,190,446,1,1532,351,134,1,2076,1],"tto":[577,51,106,479,1023,1594,113],"ttr":[377],"ttu":[2791],"tty":[1527,314,2130],"tua":[71,1648,42,1485,1947],"tub":[3667,1527,1,1,1,1,1,1,1],"tuc":[2791],"tud":[156,2580,1,129,1978,177],"tuf":[5202],"tug":[3926],"tuk":[4075,1],"tul":[525,51,104,3247,1044,232,1],"tum":[4482,363,1],"tun":[559,2340,568,271,1467,1],"tur":[803,1,484,558,1,641,533,1,84,16,114,43,1,1,63,593,277,626,1,2,4,1,1,148,1,29,180,1,1,1,1,1,1,1,1,154],"tus":[262,1147,296,17,1,152,1010,2331,1],"twa":[3535,802],"twe":[526,2138],"twi":[5218,1,1,1,1,47],"two":[1940,3283],"twr":[2165],"tyb":[1527],"tyg":[3853],"tyh":[3854],"tyl":[318,1,895,216,244,662,465,1,782,138,133,995,1,1,86,604,1],"tym":[3971],"typ":[1731,600,1525,1368,1,1,1],"tyr":[3831,26,1252,1,118,1,1,1,1],"tys":[3858],"tza":[4083],"tze":[5509],"tzi":[2366],"uad":[4077,1],"uai":[280,3799,1],"uak":[5233],"ual":[71,151,112,1,1365,1,60,433,316,1,735,835,424,1,235,1,528,1,21,1],"uam":[4743],"uan":[2237,249,1,1118],"uar":[850,1,868,2,876,2147],"uas":[1215,3382,148],"uat":[148,1,125,1428,2767,277,447],"uav":[2238,1],"uba":[2505,1727,1,621],"ubb":[588,101,3728],"ubc":[4855,1],"ube":[3667,1527,1,1,1,1],"ubi":[1050],"ubl":[2232],"ubm":[1051],"ubo":[629,650,3578,1],"ubp":[4859,1],"ubs":[992,60,1181,2316,312,1,1,1],"ubt":[1053,3812,1,1],"ubu":[5199,1,1],"uca":[863,353,506,1,3411],"ucc":[690,3361,817],"uce":[691,1826,274,948,260,1,1,153,34,551],"uch":[805,1232,1,1169,737,1,924,266],"uci":[3667,335],"uck":[587,105,1,587,1,1,268,836,36,2448,1],"ucl":[3370,1,1,1884],"uco":[3208,1],"ucs":[1528],"uct":[78,1062,2,1,2398,462,1,174,11,1,650,1,31],"ucu":[1283,1,1,1,1924],"uda":[864],"udb":[3212],"udd":[694],"ude":[156,889,756,699,1,235,1,1293],"udf":[3213],"udg":[695],"udi":[119,259,1346,1,48,729,364,507,1,657,262,551,177],"udn":[3214],"udo":[865,3170,1,1,1,1,1],"uds":[696,2519],"ueb":[590,1,1],"ued":[5123],"uee":[4082],"uef":[593],"uel":[5259],"uen":[2240,287,1956],"uer":[2423,1629],"ues":[615,128,2172,1011,1178,20],"uet":[4083],"uff":[697,1,1267,2088,1,1,1,1,493,635,1],"ufl":[774,1],"uft":[5202],"ufu":[1726],"uga":[510,120,523,3505,215,1,1,317],"uge":[2424,2235],"ugh":[155,830,544,152,1057,1127,417,1,775,1,11,1],"ugi":[2033,1183],"ugl":[700,1924],"ugo":[1105,448],"ugs":[701,1989,197,1730],"ugu":[3926],"uia":[845,244],"uic":[4084],"uid":[2385,452,1,1,293,1615,1,128,109,359],"uie":[4085],"uif":[275,1,1958],"uil":[212,490,1,1,1,4424],"uim":[213],"uin":[1175,1066,1455,390,791],"uir":[59,4134,556,1,1,1,1],"uis":[214,1273,1,1741],"uit":[655,1379,1,1,557,67,520,478,429,679],"uka":[1727,1,1,2346,1],"uke":[1966],"uks":[379],"ula":[268,49,9,55,144,51,104,206,121,2,1,1,1,172,64,47,88,347,26,40,77,235,134,300,33,393,10,153,5,85,14,1,182,41,1,105,79,1,22,31,28,190,11,172,20,1,49,36,103,97,426,140,195,33,49,2,2,62],"ulb":[706,1,1972,1,537,1],"uld":[4540,658],"ule":[72,729,1,494,1601,647,698,958],"ulf":[1677,3201],"ulg":[708,91],"uli":[73,48,102,553,90,417,271,177,91,50,1192,586,29,16,475,81,473,155,266,56,2,1],"ull":[709,1,1329,1,203,976,1379,1],"ulm":[3593,1432,209],"ulo":[380,507,2781,1295],"ulp":[2244,2175,948,1],"uls":[707,848,229,1202],"ult":[85,1,1201,1,1905,27,1,1,1,1,1,1,978,372,793],"ulu":[4206],"ulv":[2041,3194],"uly":[5187],"uma":[859,1566,1,1,1440,1013],"umb":[711,395,1,177,2091,1,1699],"ume":[1168,1599,1,609,918],"umf":[1013,534],"umi":[546,369,1513,1868,1,1],"umm":[2429],"umn":[1108],"umo":[2475,1394,1,1],"ump":[1054,215,1161,195,1,1,1431,1,240,546,1,342,1,1],"ums":[989,1130,191,1156,364,38,65,983],"umy":[1732],"una":[5205,31],"unb":[3378,1504,1,354],"unc":[1822,220,1,585,263,663,458,107,1,1118,1],"und":[37,268,326,81,419,876,214,140,55,1,1867,1,1,1,384,1,212,19,100,237,1,1,1,1,1,1,1,1,248],"une":[2489,1544,1216],"unf":[4885,1],"ung":[1556,170,30,117,171,1,1,1,582,1,262,1,1,1,1,3,666,736,949,269],"uni":[559,123,1,437,1,721,789,1,835,271,1468,45,1,1,1,1,1,1,1,1,1],"unj":[2657],"unk":[993,3607,1,1,589],"unl":[5261],"unn":[1557,491,198,1,615,1391,49,1],"unp":[5262],"unr":[5263,1],"uns":[5265,1,1],"unt":[181,335,78,119,1,503,1,1,1016,196,1,1,1,1,759,1,32,2041,1],"unu":[5270,1],"uoi":[4484,1],"uol":[4088,1207],"uon":[1289],"uop":[1733],"uor":[92],"uou":[1164,12,183],"uoy":[715],"upa":[4060,1],"upe":[1055,679,1,1,487,1,1853,1,809,1,1,1,1,1],"upf":[4062],"uph":[716,1021,1,1],"upi":[1694,531,779,1,1,911,1,145,1000],"upl":[1740,1],"upo":[3996,1,1276],"upp":[4893,1,1,1,378],"upr":[1291,1,1,3604,378],"ups":[730,564,932,3050],"upt":[3379],"upu":[1295,1,1601],"upy":[3404],"ura":[245,1378,119,13,886,98,1,1,538,1,94,1621,212,298],"urb":[1285,1,3991],"urc":[4673,605],"urd":[2190,2657,361],"ure":[803,299,186,455,103,1,407,234,254,156,123,11,74,16,106,8,45,656,33,870,1,2,154,1,29,342],"urf":[1103,3795,1,1],"urg":[4848,53],"uri":[43,72,176,90,336,87,300,327,20,107,1,56,1156,14,168,69,39,168,369,263,363,149,193,108,228],"urk":[5209],"url":[1297],"urm":[5210],"urn":[1491,559,1,1,196,1096,870,635,362,1,130],"uro":[1348,396,1,1,1026,556,1,1,532,512,399,506,1,1,1],"urp":[4064],"urr":[567,151,1,579,755,619,734,659,87,268,483,310],"urs":[720,579,1413,61,94,513,1,1,1293,608],"urt":[1220,789,3205,1,69],"uru":[2788,1198],"urv":[1300,1,3603,1],"ury":[721,1026,1,1,1,1],"usa":[405,2635,1,1,34,1,1983,1,224],"usc":[1248,1890,1,4,87,1,1,1,1,1,1],"use":[488,379,1,734,121,331,1,172,133,58,1,467,310,1,1,57,162,730,196,943,1,1,96,100],"ush":[168,1,75,312,70,96,1,1,1,1,544,1468,499,1067,1,30,441,98,198,1,428],"usi":[1642,95,37,282,447,1512,17,116,1141],"usk":[1302,1838,98,1978,1],"usl":[1176,3400,735],"uso":[1752,1,1486],"uss":[684,2556,732,334,1,1],"ust":[382,1,1,1,1,1,1,1,1,1,336,329,215,1,31,257,1,1072,225,1,1,364,17,1,1,1,1,341,723,1,1,595,384,1],"usu":[5270,1,21,1],"uta":[392,913,2170,638,743,124],"utc":[729,2655],"ute":[1410,1,78,265,880,476,278,145,413,1348],"uth":[393,71,157,1134,272,1172,1,1,184,586,705,1,1,1,1,162],"uti":[1306,184,274,1518,1],"utl":[1307],"utm":[3386],"uto":[1177],"uts":[950,650,1787,147,1093,10],"utt":[730,1,1,1,1,574,1],"utu":[2899,347,829,1,767],"utw":[3535],"uun":[1756],"uve":[2972],"uxa":[735,1],"uxi":[5156,1],"uya":[2250],"uña":[5343],"vab":[3202],"vac":[2954,2341],"vae":[2727],"vag":[1032,4264],"vah":[5297,1],"val":[560,1,2167,227,581,1,497,458,807,1],"vam":[5301,1],"van":[87,1292,86,292,2618,928,1],"var":[28,998,2512,1767,1,1,1,1,1,1,1,1],"vas":[2239,3075,211],"vat":[1287,3051],"vea":[865],"veb":[2843,44],"ved":[507,794,89,375,628,1007,1505],"veg":[5315,1,1],"vei":[1266,4052,1],"vel":[1124,288,1,1,1,1,1,1,271,85,430,112,285,1574,979,87,6,73,1],"vem":[3204,1],"ven":[1679,11,68,1,1,1,801,181,796,434,163,257,1,107,748,73,1,1],"veo":[158],"ver":[486,338,355,42,1,1,1,268,1,1,1,1,266,1,802,1,178,100,128,568,326,383,1,252,65,1,1,756,1,1,1,1,1,1,1,29,1,1,48,1,64],"ves":[97,287,10,166,310,177,484,95,388,128,130,13,1,108,366,85,132,326,137,736,10,308,38,463,44,261,33,1,1,142],"vet":[1019,1,1021,3279,1,10,5,1],"via":[561,45,265,2866,1601],"vib":[5339,1,1,1],"vic":[1180,72,4091],"vid":[632,280,295,1,289,1013,1,445,585,1803],"vie":[198,2387],"vif":[2729],"vig":[3284],"vii":[2088,2836,1,1],"vil":[630,789,1,2021,1979],"vin":[633,1133,526,554,360,1289,850,1,1,1],"vio":[502,1,1,4423,422,1,1],"vip":[3542,1810],"vir":[1691,1,3661,1,1,1],"vis":[1498,1,3858,1],"vit":[872,1,4486,1],"viv":[4904,1,456,1,1],"voc":[395,4969,1,1],"voi":[396,813],"vol":[1764,1,1,801],"vop":[5235],"vor":[825,1,1,580,435,136,55,12,1,278,1,1,219,1,538,358,1,379,206,348],"vot":[3543],"vou":[3319],"vul":[3544,707,1116,1,1],"wad":[5371],"wag":[5372],"wai":[5373,1,1],"wal":[4907,1,1,467,1,1,1,1,1,1,1,1,103],"wam":[4910,1],"wan":[2183,2729,473],"wap":[5386],"war":[411,436,686,29,443,563,967,1378,474,1,1,1,1,1,1],"was":[4076,1318,1,1,1],"wat":[2020,2317,100,84,393,484,1,1,1,1,1,1],"wax":[5405],"way":[159,238,4160,849],"wba":[4639],"wbe":[4820],"wbi":[1226],"wbu":[4681],"wda":[1241],"wde":[3947],"wea":[5407,1,1,1,1,1],"web":[1068,79,4266,1,1,1,1,1,1],"wec":[4301],"wed":[1619,360,624],"wee":[526,32,1354,752,367,65,1342,164,313,1,299,205],"wei":[5421],"wel":[1563,1,1050,2808],"wen":[5423],"wer":[634,28,204,279,206,271,255,83,1,1,1,1,925,1,1058,938,22,516],"wes":[4680,745,1],"wfi":[635,1969,1502,272],"wfl":[4379],"wgr":[309],"wha":[3276,1387,23,741,1,1],"whe":[636,57,4737,1,1,1,27,55],"whi":[5434,1,1,1,1,1,1,1,1,1,1,1,1,1],"who":[5448],"why":[5449],"wic":[4348,870],"wid":[5450,1,1,1,1,1,37],"wif":[2660,2257,247],"wig":[1577,1,3641],"wil":[5220,236,1,1,1,1,1],"wim":[4918,1,1,1,1],"win":[141,577,234,1028,14,59,176,126,328,1041,1497,184,57,1,1,1,1,1],"wir":[5468],"wis":[1039,1622,2561,47,200],"wit":[4923,547,1,1,1,1],"wja":[5516],"wkf":[2293],"wks":[2294],"wla":[3030],"wle":[1242,1178,185,941],"wls":[2011,1536],"wly":[3332],"wnf":[1048],"wni":[3668],"wns":[3955],"wnw":[1533],"wol":[5475,1,1],"wom":[5478],"won":[1298],"woo":[461,1048,1064,178,1404,186,1,1137,1,1,1,1,1,1,1,1,1,1],"wor":[553,18,101,904,364,75,143,247,1,438,52,201,90,915,185,329,93,100,158,501,22,1,1,1,1,1],"wou":[5496],"wov":[2562],"wpa":[3669],"wra":[5497],"wre":[2165,3333,1,1,1],"wri":[1227,4275],"wro":[310],"wsh":[4380],"wsw":[3031],"wth":[2231],"wts":[3333],"wwo":[2158,2458],"xac":[735,1604,2643],"xal":[736,2813,1],"xam":[1767],"xan":[2340],"xap":[2341,1],"xat":[1921],"xce":[1768,1,1,1],"xch":[1772],"xcl":[1773,1],"xcr":[1775,1,1],"xed":[1922,2243],"xel":[2648],"xen":[5504],"xes":[398,1615,454,761,1276],"xfi":[638],"xgl":[2014],"xhi":[1778],"xib":[1945],"xic":[3078,2058],"xif":[4381,1,1],"xii":[2060,723,1108],"xil":[3963],"xim":[271,2753,1],"xin":[1946,1322,62],"xio":[5156,1],"xip":[5505],"xis":[399,1380,1569],"xob":[1780],"xol":[400],"xon":[3629,1354],"xor":[3612],"xos":[1781],"xot":[1229],"xoz":[3614],"xpa":[1782],"xpe":[1783,1768],"xpu":[1784],"xri":[435],"xse":[1941],"xta":[1785],"xte":[1786,1,1,1,1,1,1],"xti":[1793,1],"xtr":[1795,1,1,1,1,1,1],"xtu":[3122,1905],"xua":[334,1,4170,1],"xus":[4984],"xwi":[5405],"xyg":[3552,1],"xyl":[5506],"xyr":[3554],"yab":[5507],"yac":[2078,358],"yad":[1549],"yae":[2437,1],"yal":[390,1689,78,93,189,1851],"yam":[5508],"yan":[715,595,1,1,1203,1040,1954],"yar":[5510],"yas":[948,1405,2632],"yba":[1152,375],"ybe":[470],"ybi":[2689,1754],"ybu":[2690,337],"yca":[764,549,1,654,932,1,804],"yce":[104,1,207,17,1,101,21,360,158,1,164,176,16,143,55,1,220,34,179,200,521,81,20,1,163,204,59,39,1,60,169,81,123,61,8,119,55,149,155,167,273,1,183,116,188,9,70,55,246,9],"ych":[1453,1449,551,52,1],"yci":[519,1,87,1],"ycl":[1315,1,1,1482],"ycn":[4067,1],"yco":[106,57,90,78,118,4,121,179,242,601,72,19,1,44,423,5,488,255,1,1,273,31,40,1,1,53,439,25,1,1,1,1,279,240,24,654,322,246,9],"yct":[3252,114,22,1],"yda":[5449],"ydn":[2440,1],"ydo":[967],"ydr":[811,561,1070,1,1,1,1,1],"yea":[2384,3127,1,1],"yed":[4138],"yel":[1803,1,1449,2261,1,1],"yen":[2448],"yer":[1969,777,1],"yes":[532,449,824,1,1361,348],"yew":[5517],"yfi":[733,510,1368,1,79,691,529],"yfl":[1351,1677],"yga":[3254,599,216],"ygd":[186],"yge":[3552,1,1988],"ygi":[42,25,99,107,1477,1,1559,297,265,147,347,916],"ygm":[4070],"ygo":[4048,1494,1,1,1,1,1,1,1],"ygu":[2385],"yhe":[3854],"yho":[2375],"yhu":[516],"yif":[5139],"yin":[270,1088,46,566,1,777,656,571,1338],"yio":[3255],"yis":[2214],"yla":[319,1428,1,1,1973,51,1303,442],"yle":[1214,216,244,1126,1,1,816,10,1222,1,655],"yli":[1318,1131,1,1,1,804],"yll":[162,678,1,59,839,415,82,811,727,1,269,1503,1],"ylo":[187,1,2265,1,1,1321,79,997,691],"ylu":[3777,1082],"ylv":[4924,1,1,1],"yly":[4938],"yma":[3633],"ymb":[688,4240,1,1,1],"yme":[2456,1,1,1432,1187],"ymi":[3891],"ymm":[357,1,1,4573,1,1],"ymn":[2251,1,1,1],"ymo":[1319,2652],"ymp":[2262,1128,1,1,1543],"ymy":[1327],"yna":[1683,1574,1679],"ynb":[4937],"ync":[2184,733,536,597,184,1045],"ynd":[4938],"yne":[1755,2137,1],"yng":[3751,1188,1],"yni":[1320],"ynn":[5078,1],"yno":[2613],"yns":[4941,1],"ynt":[3765,1,1,1176],"ynu":[366],"ynx":[2730,176,1,845],"yoa":[4353],"yoc":[3258],"yoi":[2459,1895],"yon":[527,380,1,83,452,204,1293,589,469,403,879],"yop":[685,1,1,153,1,807,1611],"yor":[1347],"yos":[688,961],"yot":[1230,497,1,1],"you":[2749,2770],"ypa":[921],"ype":[517,1943,2764,1],"yph":[762,232,737,730,1,1146,1,758,54,1],"ypi":[518,1813,2809,86,1],"ypl":[3895],"ypo":[2463,1,1,1431,1,1],"ypr":[1321,1,1],"yps":[3899],"ypt":[765,1,507,1,1,1,446,1,2177,321],"ypu":[3856],"ypy":[166,1584,1],"yra":[2255,211,1,2642,119,1,1,1,1],"yre":[2908,1163,1,1],"yri":[2682,578,1,570,93,1020,166],"yro":[4074,1006,222],"yrr":[3262,595],"yrt":[3263,1,1,1],"yru":[3554],"ysa":[989,2912,1180],"yse":[194,3584],"ysi":[990,1919,37,568,1852],"yso":[991,597],"yss":[38,700,1730],"yst":[1324,1,270,874,798,95,194,1,301,11,1,1075,1],"ysu":[2386],"yta":[236,449,253,34,341,335,91,395,32,737,89,819,85,55,280,470,126,108,203],"yte":[464,176,46,287,5,1093,1,735,451,694,781,424],"yth":[1710,1,1199,707,153],"yti":[687,287,105,273,41,2572,1,1210],"yto":[615,711,341],"ytr":[995,1,976],"yur":[1348],"yxi":[3268],"yzo":[3736],"zac":[3740],"zal":[401,1195,72,1582,491,342],"zar":[2847,1,1,1376],"zas":[3251],"zat":[160,5205],"zea":[5520],"zeb":[5521,1],"zed":[935,936,775,149,1354,441,101,547,28],"zee":[960],"zei":[5523],"zel":[2089,206,1,1995,1233,1],"zer":[2206,2561,759],"zev":[4034],"zia":[5008],"zid":[40,1603,2539],"zie":[2149],"zil":[653],"zin":[2207,159,1860,1301,1],"zio":[2945],"zip":[5529],"ziz":[3740,1,1,1],"zoa":[177,61,1038,3,309,790,69,1167,220,587,1,280,71,757,1],"zod":[5532],"zoi":[888,756,1424,1159],"zom":[1688,2054,1,1790],"zon":[164,1,2233,1338,1798,1],"zoo":[5536,1,1],"zor":[5539],"zos":[4395,1145],"zyg":[5541,1,1,1,1,1,1,1,1],"ñas":[5343],"ōhu":[4075,1]},"exact":{"African birch":[855],"African broadbills":[389],"African golden cats":[623],"African linsangs":[598],"African palm civet":[596],"African violets":[879],"African warblers":[477],"African wild dogs":[636],"African wildcats":[631],"Allen's swamp monkeys":[729,730],"Amazon river dolphins":[677],"American pawpaw":[814],"American sparrows":[548],"Andean mountain cats":[624],"Araguaian river dolphins":[677],"Asian golden cats":[626],"Asiatic glassfish":[284],"Asiatic linsangs":[603],"Assegai trees":[867],"Australasian babblers":[421],"Australasian warblers":[417],"Australasian wrens":[414],"Australian funnel web spiders":[170],"Australian magpies":[436,438],"Australian mudnesters":[451],"Australian robins":[460],"Australian treecreepers":[411],"Australo-Papuan bellbirds":[431],"Australopithecus":[698],"Bactrian camels":[649],"Baikal seals":[610],"Bird of Paradise":[831],"Black-footed cats":[631],"Bolivian river dolphins":[677],"Brazil nut":[868],"Brussels sprout":[859],"Calycanthus":[813],"Cettia bush warblers":[491],"Chinese mountain cats":[631],"Daintree oaks":[892],"Denisovans":[698,699],"Domestic cats":[631],"Egg-yellow Earth Tongue":[1002],"Elephant shrews":[577],"Elfin saddles":[968],"European common squids":[63],"European wildcats":[631],"Ganges river dolphins":[672],"Geoffroy's cats":[624],"Hispaniolan tanagers":[554],"Indus river dolphins":[672],"Irish moss":[780],"Irregular Earth Tongue":[1002],"Jacarandas":[879],"Jacob's ladder":[868],"Japanese gissus":[234],"Jungle cats":[631],"Koster's curse":[855],"L'Hoest's monkeys":[735],"La Plata dolphins":[678],"Laboulbeniales":[965],"Malabar spinach":[865],"Malagasy civets":[600],"Malagasy mongooses":[600],"Malagasy warblers":[482],"Maui's dolphins":[680],"Maybug":[136],"Moreton Bay bugs":[89],"Myrtles":[898],"Neanderthals":[698,699],"New World blackbirds":[550],"New World lizards":[316],"New World orioles":[550],"New Zealand wattlebirds":[462],"New Zealand wrens":[384],"Old World flycatchers":[511],"Oregon brown truffles":[979],"Orinoco river dolphins":[677],"Pallas's cats":[629],"Pampas cats":[624],"Paulownias":[879],"Persian ironwood":[841],"Portuguese man o' war / bluebottle":[46],"Preuss's monkeys":[735],"Przevalski's finch":[532],"Puerto Rican tanager":[555],"Queensland lungfish":[202],"Saint John's wort":[850],"Sand cats":[631],"Sassafras":[813],"Sawfish":[221],"Siberian bugloss":[882],"Southern tigrinas":[624],"Spanish moss":[830],"Tasmanian devils":[562,565],"Tasmanian tigers":[565],"Tube-eyes":[265],"Venus clams":[76],"Venus flytraps":[865],"Virginia creeper":[843],"Yangtze river dolphins.":[676],"[most] guenons":[731],"aardvarks":[571,576],"abies":[794],"acanthisittidae":[384],"acanthizidae":[417],"acanthomorpha":[260],"acanthopterygii":[268],"acanthuriformes":[294],"acariformes":[161],"acca":[855],"accas":[898],"accentors":[537],"accipitriformes":[371],"acinonyx":[628],"acipenseriformes":[224],"acorales":[820],"acrocephalid warblers":[480],"acrocephalidae":[480],"acrodonta":[317],"acropomatiformes":[293],"actiniaria":[34],"actinopterygii":[201],"aculeata":[151],"aculifera":[47],"aegithalidae":[489],"aegithaloidea":[486],"aegithinidae":[441],"aegotheliformes":[356],"aequornithes":[361],"afroaves":[369],"afrosoricida":[578],"afrotheria":[571],"agaricales":[953],"agaricomycetes":[936],"agaricomycetidae":[952],"agaricomycotina":[934],"agarics":[931],"agave":[827],"agnatha":[193],"ailuridae":[615],"air ferns":[46],"alaudidae":[476],"albatrosses":[347,361,363],"albuliformes":[234],"alcids":[350],"alderflies":[128],"alders":[847,891],"alepocephaliformes":[239],"alfonsinos":[269],"alismatales":[821],"alismatid monocots":[819],"alkanet":[882],"allenopithecus":[730],"allies":[96,98,311],"alligators":[322],"allochrocebus":[735],"allspice":[855],"allspices":[898],"almonds":[846,908],"aloe":[827],"alouatta":[705],"alouattinae":[704],"alpacas":[649],"alveolate":[12],"alzateaceae":[893],"amaranths":[865],"amastigomycota":[919],"amblypygi":[188],"amborellales":[806],"amiiformes":[227],"amniota":[301],"amoebas":[4],"amoebozoa":[4],"amorphea":[3],"amphibia":[297],"amphipoda":[87],"amygdaloideae":[908],"amylocorticiales":[955],"anabantiformes":[280],"anchovies":[238],"anemonefishes":[288],"angel insects":[118],"angel spiders":[172],"angelsharks":[216],"angiosperms":[773],"anglerfishes":[295],"anguilliformes":[236],"anguimorpha":[314],"anhingas":[366],"animalia":[8],"animals":[8],"anis":[346],"annelida":[24],"anostraca":[93],"anseriformes":[334],"ant mimicking crab spiders":[181],"ant spiders":[179],"antbirds":[393,396],"anteaters":[568,570],"antelopes":[588,654,660],"anthocerotophyta":[760],"anthophila":[160],"anthozoa":[32],"antilocapridae":[657],"antipatharia":[35],"antlions":[126],"antpittas":[397],"ants":[133,138,158],"antthrushes":[399],"anura":[298],"aotidae":[714],"apes":[594],"aphelidiomycota":[914],"aphids":[110],"apiales":[874],"apocrita":[138],"apodiformes":[357],"apoidea":[159],"apples":[818,846,908],"apricots":[846,908],"apterygiformes":[329],"aquifoliales":[870],"arachnida":[102],"arachnids":[26,28,99],"araneae":[169],"araneoidea":[175],"araneoids":[175],"araneomorphae":[171],"archaea":[1],"archaeognatha":[103],"archosauria":[319],"arctoidea":[607],"arecales":[829],"argan":[868],"argentiniformes":[249],"armadillos":[568,569],"armored spiders":[172],"armorheads":[293],"arrowgrass":[821],"arrowroot":[831],"artamidae":[438],"arthoniomycetes":[992],"arthropoda":[28],"artichokes":[871],"artiodactyla":[588],"ascobolaceae":[973],"ascodesmidaceae":[981],"ascolichens":[933,965],"ascomycota":[933],"ash trees":[879],"asites":[387],"asparagales":[827],"aspens":[850],"assassin bugs":[110],"assassin spiders":[172,173],"asses":[587],"asterales":[871],"asterids":[866],"ateleopodiformes":[257],"ateles":[707],"atelidae":[703],"atelinae":[706],"atelocynus":[643],"atheliales":[957],"atheriniformes":[287],"atrichornithidae":[410],"auks":[350],"aulopiformes":[258],"auriculariales":[939],"australaves":[379],"australopithecina":[698],"austrobaileyales":[808],"aves":[324],"avocado":[810],"avocado trees":[813],"axolotls":[299],"azaleas":[868],"babblers":[383,498],"babirusas":[651],"baboons":[691,728,736,741],"bacteria":[0],"badgers":[617],"badids":[280],"baker's yeast":[998],"bakers' yeast":[930,933],"balaenidae":[666],"balaenopteridae":[668],"balsa trees":[858],"bamboo":[830],"bamboo corals":[40],"banana":[831],"bandfishes":[294],"bandicoot rat":[592],"bandicoots":[558,562,564],"bangiophyceae":[779],"banjofish":[293],"banksias":[834],"banxrings":[590],"baobab trees":[858],"barberries":[833],"barbets":[378],"bark lice":[109],"barnacles":[91],"basal angiosperms":[805],"basal chlorophyta prasinophytes":[781],"basidiobolomycota":[920],"basidiolichens":[931],"basidiomycota":[931],"basil":[879],"basking sharks":[210],"basslets":[288],"basswood trees":[858],"bat bugs":[110],"bat-eared foxes":[645],"bathyteuthida":[64],"batomorphi":[218],"batrachoidiformes":[273],"bats":[579,580,582],"batsies":[443],"bay cats":[626],"bay laurel":[810],"bay rum tree":[855],"bay rum trees":[898],"bay trees":[813],"bean-caper":[852],"bearded reedling":[475],"beardfish":[267],"bears":[585,605,607],"beavers":[592],"becards":[404],"bed bugs":[110],"bee balm":[879],"bee-eaters":[377],"beeches":[847,887],"beefsteak fungi":[953],"bees":[133,138,159],"beetles":[136],"beets":[865],"beloniformes":[285],"beluga whales":[679,681],"berberidopsidales":[863],"bernieridae":[482],"berrypeckers":[457],"berycids":[269],"beryciformes":[269],"betulaceae":[891],"bichirs":[223],"bigeyes":[294],"bilateria":[20],"bilbies":[564],"billfish":[281],"birches":[847,891],"birds":[305,319,324],"birds-of-paradise":[383,450],"birthwort":[811],"bison":[660],"bitterns":[367],"bittersweet":[851],"bivalves":[25],"bivalvia":[75],"black bears":[608],"black boys":[827],"black chanterelles":[937],"black corals":[35],"black gins":[829],"black pepper":[810],"black pepper vines":[811],"black truffles":[971],"black-and-white colobus":[715],"black-and-white colobus monkeys":[716,717,720],"black-backed jackal":[637],"blackbasses":[291],"blackberries":[846],"blackcurrants":[841],"bladder snails":[74],"bladdernut trees":[856],"bladderworts":[879],"blastocladiomycota":[918],"blastoclads":[918],"blattodea":[120],"bleach cups":[979],"bleeding tooth fungi":[947],"blennies":[288],"blenniiformes":[288],"blue corals":[39,41],"blue whales":[668],"blue-tongued lizards":[311],"blueberry":[868],"bluefishes":[275],"boarfishes":[294],"boatbills":[437],"bobcats":[627],"bobolinks":[550],"bobtail squid":[61],"bok choy":[859],"boletales":[954],"boletes":[931,954],"bombycillidae":[504],"bombycilloidea":[502],"bonefishes":[234],"bonobos":[694,697],"bonytongues":[231],"boobies":[347,361,366],"book lice":[109],"book scorpions":[166],"borage":[882],"boraginales":[882],"boreoeutheria":[579],"bottlebrushes":[898],"bottlenose dolphins":[680],"boubous":[440],"bougainvilleas":[865],"bovidae":[660],"bovines":[654],"bowerbirds":[383,412],"bowfins":[227],"bowhead whales":[666],"box jellyfish":[45],"boxfishes":[296],"brachyteles":[708],"bracket fungi":[930,931],"bramble sharks":[215],"branchiopoda":[92],"brassicales":[859],"breadfruit":[905],"brewers' yeast":[930,933],"bristle worms":[24],"bristlebirds":[415],"bristlehead":[442],"brittle stars":[30],"brittlegills":[951],"brittleworts":[756],"broccoli":[859],"bromeliads":[830],"brooch clams":[76],"brotulas":[272],"brown alga":[10,13],"brown bears":[608],"brown recluse spiders":[172],"bruniales":[873],"bryophyta":[758],"bryophytina":[761],"bubble snails":[73],"bucerotiformes":[376],"buckwheat":[865],"budgerigar":[382],"buffalo":[660],"bulbuls":[494],"bullanocks":[829],"bullhead sharks":[208],"bumblebees":[160],"buntings":[544],"bunts":[931],"buphagidae":[513],"bush babies":[684,686],"bush dogs":[639],"bush-shrikes":[440],"bushshrikes":[436],"bushtits":[489],"bustards":[343,345],"butcherbirds":[436,438],"buttercups":[818,833],"butterflies":[134],"butterfly bushes":[879],"butterflyfishes":[294],"buxales":[836],"cabbage":[859],"cabbages":[818],"cacao trees":[858],"caciques":[550],"cacomistles":[616],"cacti":[865],"caddisflies":[130],"caecilians":[297,300],"caenogastropoda":[70],"caimans":[322],"calcariidae":[543],"calcarisporiellomycota":[928],"cales":[292],"callaeidae":[462],"callicebinae":[701],"callitrichidae":[713],"caloscyphaceae":[978],"caltrop":[852],"calyptomenidae":[389],"calyptophilidae":[552],"camel spiders":[102,164],"camelidae":[649],"camellias":[868],"camels":[583,586,588],"campanulids":[869],"campephagidae":[424],"canellales":[812],"canidae":[606],"caniformia":[605],"canina":[633],"canini":[632],"canis":[634],"cannabaceae":[902],"cannabis":[846],"cantharellales":[937],"cape box":[836],"caper":[859],"caprimulgiformes":[352],"capuchins":[690,710,711],"caracal":[623],"caracals":[623],"caracaras":[381],"carangiformes":[281],"carangimopharia":[278],"carbomycetaceae":[972],"carcharhiniformes":[211],"cardamom":[831],"cardinal grosbeaks":[545],"cardinalfishes":[277],"cardinalidae":[545],"cariamiformes":[380],"caribou":[659],"carnation corals":[40],"carnations":[865],"carnivora":[585],"carp":[242],"carpenter sharks":[221],"carpenter spiders":[172],"carpet sharks":[209],"carrots":[874],"caryophyllales":[865],"cashews":[861],"cassava":[850],"cassowaries":[325,330],"castor bean":[850],"casuariiformes":[330],"casuarinaceae":[892],"caterpillar fungus":[965],"caterpillars":[134],"catfish":[245],"catnip":[879],"catopuma":[626],"cats":[579,580,583,585,595,604],"catsharks":[211],"cattle":[579,580,583,586,588,654,660],"caudofoveata":[49],"cauliflower":[859],"cebidae":[710],"cebinae":[711],"cedar":[795],"cedrus":[795],"celastrales":[851],"celery":[874],"cell spiders":[172],"cellar spiders":[172],"centipedes":[26,28,96,97,98],"centrarchiformes":[291],"cephalochordata":[190],"cephalopoda":[53],"ceraphronoidea":[140],"ceratophyllales":[817],"cercocebus":[738],"cercopithecidae":[691],"cercopithecinae":[728],"cercopithecini":[729],"cercopithecus":[731],"cerdocyon":[642],"cerdocyonina":[638],"ceriantharia":[42],"certhiidae":[520],"certhioidea":[517],"cervidae":[659],"cetacea":[664],"cetotheriidae":[667],"cetruminantia":[653],"cettiidae":[491],"chaetopidae":[465],"chalcidoidea":[145],"chamaecyparis":[802],"chameleons":[317],"chanterelles":[930,931,937],"characiformes":[243],"charadriiformes":[350],"charophyta":[756],"chat-tanagers":[552],"chats":[511],"cheetahs":[604,628],"chelicerata":[99],"cherimoyas":[814],"cherries":[908],"chestnuts":[847,887],"chickadees":[472],"chickens":[333],"chiggers":[102],"chili peppers":[878],"chilopoda":[97],"chimaeras":[199],"chimpanzees":[694,697],"chiroptera":[582],"chitons":[48],"chloranthales":[815],"chlorocebus":[733],"chlorodendrophyceae":[783],"chlorophyceae":[786],"chlorophyta":[754],"chlorophytina":[782],"chloropseidae":[529],"choanoflagellata":[7],"choanoflagellates":[7],"chondrichthyes":[197],"chordata":[31],"chorioactidaceae":[977],"choughs":[453],"chrysanthemums":[871],"chrysidoidea":[152],"chrysocyon":[640],"chyphotid wasps":[155],"chytridiomycota":[917],"chytrids":[917],"cicadas":[110],"cichlids":[283],"cichliformes":[283],"ciconiiformes":[365],"cigar plants":[855],"cinclidae":[510],"cinclosomatidae":[423],"cingulata":[569],"cinnamon":[810],"cinnamon trees":[813],"cirripedia":[91],"cisticolas":[478],"cisticolidae":[478],"citrus":[861],"civets":[598],"clams":[75],"climacteridae":[411],"clingfishes":[288],"clouded leopards":[619],"clove":[855],"cloves":[898],"clownfishes":[288],"club mosses":[763],"club-shaped stinkhorns":[942],"clubionidae":[183],"clubtails":[107],"clupeiformes":[238],"cnemophilidae":[458],"cnidaria":[19],"coatis":[616],"cobweb spiders":[175],"coca plant":[850],"cockatoos":[382],"cockles":[25,75,76],"cockroaches":[120],"cods":[266],"coelacanths":[202],"coffee":[881],"coleoptera":[136],"coliiformes":[373],"colobinae":[715],"colobini":[716],"colobus":[717],"colugos":[589,593],"columbiformes":[340],"columbimorphae":[339],"comb jellies":[15],"comb-footed spiders":[175],"combretaceae":[894],"comfrey":[882],"commelinales":[832],"commelinids":[828],"common box":[836],"common bread molds":[927],"common fig":[905],"compsopogonophyceae":[776],"conches":[66],"conchifera":[51],"cone snails":[70],"coneflowers":[871],"coneweb spiders":[172],"conifers":[771],"coniocybales":[990],"conopophagidae":[395],"convict blenny":[283],"coontails":[817],"coots":[349],"coraciiformes":[377],"coraciimorphae":[372],"corallimorpharia":[36],"corals":[19],"corcoracidae":[451],"core angiosperms":[809],"core eudicots":[837],"core passerides":[467],"coriander":[874],"corinnid sac spiders":[185],"corinnidae":[185],"cormorants":[366],"cornales":[867],"corpse flower":[850],"corticiales":[949],"corvidae":[453],"corvides":[422],"corvoidea":[445],"cotingas":[403],"cotingidae":[403],"cotton":[858],"couas":[346],"coucals":[346],"cow sharks":[213],"cowbirds":[550],"cowries":[70],"coyotes":[606,634],"crab-eating fox":[642],"crabs":[26,28,84,89],"crakes":[349],"cranberry":[868],"cranes":[335,347,349],"crape myrtle":[896],"crape myrtles":[855],"crawdad":[89],"crayfish":[89],"creosote bush":[852],"crescentchests":[394],"crested flycatchers":[469],"crested jays":[455],"crested mangabeys":[739],"crickets":[113],"crocodiles":[319,322],"crocodilia":[322],"crombecs":[477],"crossosomatales":[856],"crows":[383,453],"crustaceans":[82],"crypteroniaceae":[895],"ctenophora":[15],"cubozoa":[45],"cuckoo roller":[374],"cuckoos":[343,346],"cuckooshrikes":[424],"cuculiformes":[346],"cucumbers":[848],"cucurbitales":[848],"cuon":[635],"cup fungi":[933,965,968,980],"cup lichens":[989],"cupressaceae":[798],"cupressales":[797],"cupressus":[800],"currawongs":[436,438],"cusk-eels":[272],"custard apples":[814],"cutlassfish":[275],"cuttlefish":[25,53,60],"cyanidiophyceae":[774],"cycadophyta":[769],"cycads":[769],"cyclamens":[868],"cynipoidea":[143],"cypress":[800],"cypriniformes":[242],"cyprinodontiformes":[286],"dacrymycetes":[958],"daddy long legs":[162],"daddy long-legs spiders":[172],"daffodils":[816],"dahlias":[871],"daisies":[871],"damselfiles":[107],"damselfishes":[288],"dandelions":[818],"daphnes":[858],"dapple-throat":[525],"darners":[107],"darters":[290,366],"dassies":[573],"dasyornithidae":[415],"dasyuromorphia":[565],"dates":[816],"dayflowers":[832],"dead man's fingers":[787,933,997],"decapoda":[89],"decapodiformes":[58],"deep red jellyfish":[46],"deep-sea batfishes":[295],"deer":[579,580,583,586,588,654],"delphinida":[674],"delphinidae":[680],"delphinoidea":[679],"denisovans":[749],"dermaptera":[117],"dermatophytic fungi":[965],"dermoptera":[593],"desert truffles":[985],"desmans":[581],"desmids":[756],"destroying angels":[953],"deuterostomia":[29],"devil rays":[222],"devil's cigars":[977],"dhole":[635],"diaphoretickes":[9],"diaprioidea":[146],"diapsida":[305],"diatoms":[10,13],"dicaeidae":[527],"dicruridae":[447],"didelphimorphia":[560],"dikarya":[930],"dilleniales":[839],"dingoes":[606],"dinoflagellates":[10,12],"dinosauria":[323],"dionycha":[182],"dioscoreales":[824],"diplopoda":[98],"dipnoi":[204],"dippers":[510],"diprotodontia":[566],"dipsacales":[875],"diptera":[135],"dirachmaceae":[903],"discinaceae":[982],"divers":[362],"dobsonflies":[128],"dodos":[340],"dogbanes":[881],"dogfish sharks":[214],"dogs":[579,580,583,585,605,606,634],"dolphins":[588,662,664],"donacobiidae":[483],"donacobius":[483],"dories":[264],"dothideomyceta":[987],"dothideomycetes":[988],"dottybacks":[288],"doucs":[724],"doughnut fungi":[976],"dove trees":[867],"doves":[340],"dragon trees":[827],"dragonfish":[254],"dragonflies":[107],"dreamers":[295],"drills":[736],"dromedary camels":[649],"drongos":[447],"drumfishes":[294],"dryadoideae":[910],"ducks":[332,334],"dugong":[574],"dulidae":[503],"dulse":[780],"dung bird's nest":[953],"dunnarts":[565],"durian":[858],"eagles":[371],"early morels":[979],"earth stars":[930,931],"earth tongues":[967],"earthballs":[954],"earthstars":[941],"earthworms":[24],"earwigflies":[131],"earwigs":[117],"ebony":[868],"ecdysozoa":[26],"echidnas":[557],"echinodermata":[30],"echinorhiniformes":[215],"eelpouts":[290],"eggplants":[878],"elachuridae":[509],"elaeagnaceae":[904],"elasmobranchii":[198],"elderberrie":[875],"elderflowers":[875],"elechura":[509],"electric eels":[244],"electric rays":[219],"elementaves":[347],"elephant seals":[610],"elephant shrews":[571],"elephantfishes":[231],"elephants":[571,572,575],"elfin saddles":[983],"elk":[659],"elms":[846,911],"elopiformes":[233],"elopomorpha":[232],"emberizidae":[544],"emberizoidea":[541],"embioptera":[115],"embryophyta":[757],"emu":[330],"emus":[325],"entelegynae":[174],"entomophthoromycota":[923],"entorrhizomycota":[932],"eomarsupialia":[562],"ephemeroptera":[106],"eresidae":[176],"ergot":[965],"ericales":[868],"erythrocebus":[734],"erythrocercidae":[490],"escalloniales":[872],"esociformes":[251],"estrildid finches":[535],"estrildidae":[535],"euarchontoglires":[589],"eucalyptus":[855],"eucalyptuses":[898],"eudicots":[818],"eukaryota":[2],"eulacestomidae":[429],"eulipotyphla":[581],"eumycota":[915],"euopisthobranchia":[73],"eupercaria":[289],"eupetida":[463],"eupetidae":[466],"euphausiacea":[88],"euphonias":[540],"euphyllophyta":[764],"eupleridae":[600],"eureptilia":[304],"eurotiomycetes":[993],"eurylaimid broadbills":[388],"eurylaimidae":[388],"eurylaimides":[386],"eurypygiformes":[360],"eurypygimorphae":[358],"euteleostei":[246],"euthyneura":[71],"euungulata":[586],"evanioidea":[148],"evening primroses":[855],"exobasidiomycetes":[962],"fabales":[845],"fabids":[844],"fagaceae":[887],"fagales":[847],"fairy bluebirds":[530],"fairy lanterns":[824],"fairy shrimp inc/ sea monkeys":[93],"falconiformes":[381],"falcons":[368,379,381],"falcunculidae":[430],"fallow deer":[659],"false beeches":[886],"false chanterelles":[952],"false corals":[36],"false cypress":[802],"false killer whales":[680],"false morels":[982],"false quails":[350],"false scorpionfishes":[292],"false scorpions":[166],"false violin spiders":[172],"fan worms":[24],"fangtooths":[270],"fantails":[446],"feather duster worms":[24],"felidae":[604],"feliformia":[595],"felinae":[621],"felis":[631],"feloidea":[602],"ferns":[765],"ferungulata":[583],"fiddleneck":[882],"field mushrooms":[953],"figbirds":[434],"figs":[846],"filefishes":[296],"fin whales":[668],"finches":[540],"finfoots":[349],"fir":[794],"fire corals":[46],"firebrat":[104],"fireflies":[136],"firefly squid":[65],"fireweed ":[899],"fishflies":[128],"fishing cats":[630],"flamingos":[335,336,337],"flat-headed cats":[630],"flatfish":[281],"flatheads":[290],"flatworms":[23],"flaxseed":[850],"fleabane":[871],"fleas":[132],"floricans":[345],"florideophyceae":[780],"flower crab spiders":[181],"flower hat jelly":[46],"flowerpeckers":[527],"flufftails":[349],"flukes":[23],"flying lemurs":[593],"flyingfishes":[285],"forget-me-not":[882],"forget-me-nots":[818],"formicariidae":[399],"formicoidea":[158],"four o'clock flowers":[865],"foxes":[606],"foxgloves":[879],"frankincense":[861],"freshwater jellyfish":[46],"freshwater mussels":[76,77],"freshwater sunfish":[291],"frigatebirds":[347,361,366],"frilled sharks":[213],"frilled-neck lizards":[317],"fringillidae":[540],"frogfishes":[295],"frogmouths":[347,351,355],"frogs":[297,298],"fuchsias":[855,899],"fulvettas":[495,500],"fungi":[5],"fur seals":[611],"furnariida":[393],"furnariidae":[400],"gadiformes":[266],"galagos":[594],"galangal":[831],"galaxiiformes":[250],"galeomorphi":[207],"gall mites":[161],"gall wasps":[143],"galliformes":[333],"galloanserae":[332],"gannets":[366],"garden snails":[74],"garryales":[883],"gars":[226],"gastropoda":[66],"gaviiformes":[362],"gazelles":[654],"geastrales":[941],"geese":[332,334],"geigertree":[882],"gekkos":[310],"gekkota":[310],"gelada":[742],"geladas":[736],"genets":[598],"gentianales":[881],"geoglossaceae":[967],"geraniales":[854],"geraniums":[854],"gharial":[322],"ghostfish":[191],"giant amoebas":[4],"giant crab spiders":[180],"giant rhubarbs":[838],"giant squid":[65],"gibberfishes":[269],"gibbons ":[693],"gim":[779],"gingers":[831],"ginkgophyta":[770],"ginkos":[770],"ginseng":[874],"giraffes":[586,588,654,658],"giraffidae":[658],"gladiators":[122,124],"glass lizards":[314],"glaziellaceae":[974],"globe alga":[786],"gloeophyllales":[950],"glomeromycota":[929],"glowworms":[136],"gnaphosidae":[184],"gnatcatchers":[522],"gnateaters":[395],"gnathostomata":[196],"gnatwrens":[522],"gnetophyta":[772],"gnomefishes":[293],"go-away-birds":[344],"goannas":[314],"goat-antelopes":[660],"goatfishes":[276],"goats":[654,660],"goatsbeards":[908],"gobies":[277],"gobiiformes":[277],"goblin shark":[210],"goblin spiders":[172],"golden jackals":[634],"golden moles":[571,578],"gomphales":[943],"gomphotheres":[575],"gonorynchiformes":[241],"gooseberries":[841],"goosefishes":[295],"goosefoots":[865],"gorilla":[696],"gorillas":[694,696],"grackles":[550],"grallariidae":[397],"grapes":[843],"grassbirds":[481],"grasses":[816,830],"grasshoppers":[113],"grasstree":[827],"gray foxes":[648],"gray langurs":[715,723],"great white":[210],"grebes":[336,338],"green alga":[753,754,756],"green alkanet":[882],"green broadbills":[389],"green caviars":[787],"green feather alga":[787],"green monkeys":[733],"green sea fingers":[787],"greenbrier":[826],"grey whales":[668],"grisons":[617],"ground babblers":[500],"ground spiders":[184],"groupers":[290],"grouse":[333],"grubs":[136],"gruiformes":[349],"grunts":[294],"grylloblattodea":[123],"guanacos":[649],"guava":[855],"guavas":[898],"guenons":[729],"guinea flowers":[839],"guinea foul":[333],"guinea pigs":[592],"gulaman":[780],"gulls":[335,347,350],"gulper sharks":[214],"gum trees":[898],"gunnerales":[838],"gurnards":[276],"guyalone":[856],"gymnophiona":[300],"gymnospermae":[768],"gymnotiformes":[244],"gymnures":[581],"gyrating spiders":[172],"hagfish":[194],"hagfishes":[193],"halfbeaks":[285],"hammerhead sharks":[211],"hammerkop":[367],"hamsters":[592],"hangingflies":[131],"haplorhini":[687],"happy trees":[867],"hard corals":[33],"hares":[591],"harriers":[371],"harvesters":[162],"harvestmen":[102,162],"hawkfishes":[291],"hawks":[371],"hazel-hornbeam":[891],"hazels":[847,891],"headshield slugs":[73],"heath":[868],"heather":[868],"hedgehogs":[579,580,581],"heleniums":[871],"heliotrope":[882],"hellebores":[833],"helmetshrikes":[436],"helvellaceae":[983],"hemiptera":[110],"hemlock":[796],"henna tree":[855],"hennas":[896],"herons":[367],"herpestidae":[599],"herrings":[238],"heterodonta":[76],"heterodontiformes":[208],"hexacorallia":[33],"hexanchiformes":[213],"hexapoda":[94],"hexapods":[82],"hibbertia":[839],"hibiscus":[858],"hickory":[847,889],"highland mangabeys":[740],"hiodontiformes":[230],"hippopotamidae":[663],"hippopotamuses":[579,580,583,586,588,662,663],"hirundinidae":[484],"hoatzin":[347,348],"hogs":[651],"holly":[870],"hollyhocks":[858],"holocephali":[199],"holometabola":[125],"holozoa":[6],"hominidae":[694],"hominoidea":[692],"homo":[699],"homo erectus":[744],"homo floresiensis":[746],"homo habilis":[743],"homo heidelbergensis":[747],"homo naledi":[745],"homo neanderthalensis ":[748],"homo sapiens":[750],"honey bees":[160],"honey flowers":[854],"honey-myrtles":[898],"honeyeaters":[383,416],"honeyguides":[378],"honeysuckle":[875],"hooded tickspiders":[163],"hoopoes":[376],"hop-hornbeams":[891],"hops":[846],"hornbeams":[847,891],"hornbills":[372,376],"hornets":[153],"hornworts":[760],"horopito":[812],"horse-chestnuts":[861],"horseradish":[859],"horses":[586,587],"horseshoe crabs":[99,101],"horsetails":[765],"hound's tongue":[882],"houndsharks":[211],"house dust mites":[161],"houseleeks":[841],"howler":[690],"howler monkeys":[703,704,705],"huckleberry":[868],"huerteales":[860],"human pathogenic yeast":[930,931],"human thrush":[998],"humans":[694,698,699],"hummingbirds":[335,347,351,357],"humpback whales":[668],"huntsman spiders":[180],"hyaenidae":[601],"hydnodontaceae":[945],"hydroids":[19],"hydrozoa":[46],"hyenas":[585,595,601],"hylias":[488],"hyliidae":[488],"hyliotas":[470],"hyliotidae":[470],"hylobatidae":[693],"hylocitrea":[506],"hylocitreidae":[506],"hymenochaetales":[946],"hymenoptera":[133],"hypocoliidae":[507],"hypocolius":[507],"hyracoidea":[573],"hyraxes":[571,572,573],"hyssop":[879],"hysterangiales":[942],"ibises":[347,361,367],"icacinales":[885],"ice crawlers":[122,123],"ichneumonoidea":[141],"icteridae":[550],"icteriidae":[551],"idiosepiidae":[62],"ifrit":[449],"ifritidae":[449],"ifrits":[383],"iguanas":[316],"iguania":[315],"impatiens":[868],"indigobirds":[536],"iniidae":[677],"inioidea":[675],"insect-egg slime molds":[4],"insecta":[95],"insects":[26,28],"ioras":[436,441],"irenidae":[530],"iris":[827],"island foxes":[648],"isopoda":[86],"isopods":[84,86],"ivies":[874],"jacamars":[378],"jacanas":[350],"jackals":[606],"jackdaws":[453],"jackfruit":[905],"jacks":[281],"jade plant":[841],"jaguars":[604,620],"jasmine":[879],"javelinas":[652],"jawfishes":[288],"jays":[383,453],"jelly fungi":[930,931],"jellyfish":[19],"jellynoses":[257],"jewel wasps":[152],"jewel-babblers":[423],"jiggers":[132],"jojoba":[865],"joshua trees":[827],"juglandaceae":[889],"jumping bristletails":[103],"jumping shrews":[577],"jumping spiders":[187],"juniper":[801],"juniperus":[801],"jute":[858],"kagu":[358,360],"kale":[859],"kangaroo paws":[832],"kangaroos":[558,562,566],"kapok":[858],"katsura":[841],"kava":[811],"kelps":[10,13],"kestrels":[381],"kickxellomycota":[924],"killer alga":[787],"killifishes":[286],"kingfishers":[368,369,372,377],"kinglets":[516],"kinkajous":[616],"kipunji":[736],"kitefin sharks":[214],"kites":[371],"kiwifruit":[868],"kiwis":[325,329],"knifefish":[244],"knifejaws":[291],"knotweeds":[865],"koala":[562,566],"koalas":[558],"kodkods":[624],"koels":[346],"kogiidae":[670],"komodo dragons":[314],"kookaburras":[377],"korhaans":[345],"krill":[88],"laboulbeniomycetes":[996],"labriformes":[292],"labyrinth fishes":[280],"lacewings":[126],"ladybird spiders":[176],"ladybugs":[136],"ladyfish":[233],"lagomorpha":[591],"lagomorphs":[589],"lagothrix":[709],"lamiales":[879],"lamiids":[877],"lamniformes":[210],"lampreys":[193,195],"lampridiformes":[261],"lancelets":[31,190],"landbirds":[335],"landhoppers":[87],"laniidae":[454],"lantern sharks":[214],"lanternbellies":[293],"lanternfish":[259],"larch":[792],"large-nosed proboscis monkeys":[715],"larix":[792],"larks":[383,476],"laterata":[312],"laughingthrushes":[499],"laurales":[813],"laurasiatheria":[580],"lavender":[879],"laver":[779],"leadwood tree":[855],"leaf hoppers":[110],"leaf monkeys":[721],"leaf-warblers":[487],"leafbirds":[529],"leaffishes":[283],"leathery earthfans":[947],"lecanoromycetes":[989],"leeches":[24],"legless lizards":[310],"legumes":[845],"leiothrichidae":[499],"lemon verbena":[879],"lemuriformes":[684],"lemuroidea":[685],"lemurs":[594,684,685],"leopard cats":[630],"leopards":[604,620],"leopardus":[624],"leotiomyceta":[986],"leotiomycetes":[995],"lepidogalaxiiformes":[247],"lepidoptera":[134],"lepidosauria":[307],"lepidostromatales":[956],"lepisosteiformes":[226],"leptailurus":[622],"leptosomiformes":[374],"lettuces":[871],"lichinales":[991],"lignophytes":[766],"lilacs":[879],"liliales":[826],"lilies":[816],"lilioid monocots":[822],"lillies":[826],"limbless skinks":[311],"limpkin":[349],"lingonberry":[868],"lion's mane jellyfish":[43],"lionfish":[290],"lions":[604,620],"lipotidae":[676],"liquidambars":[841],"livebearers":[286],"liverworts":[759],"lizard's tail":[811],"lizard-eating spiders":[180],"lizardfish":[258],"lizards":[307,309],"llamas":[588,649],"loach":[242],"lobe-finned fish":[202],"lobsters":[84,89],"locustellidae":[481],"locustelloidea":[479],"locusts":[113],"loeries":[344],"logrunners":[420],"long daddies":[172],"long-legged cave spiders":[172],"long-tailed tits":[489],"longspurs":[543],"loons":[347,361,362],"loosestrifes":[855,896],"lophiiformes":[295],"lophocebus":[739],"lorchels":[965],"lorikeets":[382],"lorises":[684,686],"lorisids":[594],"lorisoidea":[686],"lovebugs":[135],"lungfish":[202,204],"lungwort":[882],"lungwort lichens":[989],"lupulella":[637],"lutungs":[721],"lycalopex":[641],"lycaon":[636],"lychees":[861],"lycopodiophyta":[763],"lycosidae":[181],"lynx":[627],"lynx spiders":[181],"lynxs":[627],"lyrebirds":[409],"lythraceae":[896],"macaca":[737],"macadamia":[834],"macadamias":[818],"macaques":[691,728,736,737],"macaws":[382],"machaerirhynchidae":[437],"mackerel":[275],"macroscelidea":[577],"macrosphenidae":[477],"magnoliales":[814],"magnolias":[810,814],"magnoliid":[810],"magpies":[383],"mahogany":[861],"maize":[816],"malacalcyonacea":[40],"malaconotidae":[440],"malaconotoidea":[436],"malacostraca":[84],"malasseziomycetes":[960],"malkohas":[346],"malpighiales":[850],"maluridae":[414],"malvales":[858],"malvids":[853],"mammalia":[321],"mammoths":[575],"manakins":[402],"manatees":[574],"manchineel tree":[850],"mandibulata":[81],"mandrills":[736],"maned wolf":[640],"mangabeys":[736],"mangos":[861],"mangosteen":[850],"manta rays":[222],"mantidflies":[126],"mantis shrimp":[85],"mantises":[119],"mantodea":[119],"mantophasmatodea":[124],"manuls":[629],"many mistletoes":[864],"maples":[818,861],"marbled cats":[625],"marchantiophyta":[759],"margays":[624],"marine angelfishes":[294],"marine mussels":[79],"marine smelts":[249],"marjoram":[879],"marmosets":[690,713],"marsupial moles":[562,563],"marsupialia":[558],"martens":[617],"martins":[383,484],"mastodons":[575],"mayflies":[106],"meadowlarks":[550],"meadowsweets":[908],"mecoptera":[131],"medusafish":[275],"meerkats":[599],"megalodon":[210],"megaloptera":[128],"melampittas":[452],"melampittidae":[452],"melanocharitidae":[457],"melanopareiidae":[394],"melastomataceae":[897],"meliphagidae":[416],"meliphagoidea":[413],"melons":[848],"menuridae":[409],"mephitidae":[614],"mesites":[339,341],"mesitornithiformes":[341],"metallic flat-headed wood borers":[135],"metteniusales":[884],"mice":[592],"microbiotheria":[561],"midges":[135],"milk-caps":[951],"milkfish":[241],"milkweeds":[881],"milkworts":[845],"millipedes":[96,98],"mimidae":[514],"minke whales":[668],"minnow":[242],"mint":[879],"miopithecus":[732],"mirandornithes":[336],"mirror yeasts":[931],"mites":[102,161,165],"mitrosingus":[546],"mitrospingidae":[546],"moas":[325],"mockingbirds":[514],"modulatricidae":[525],"mohouidae":[425],"mojarras":[294],"moles":[579,580,581],"mollusca":[25],"monarchidae":[448],"monarchs":[448],"money spiders":[175],"money trees":[841],"mongoose":[585],"mongoose-like euplerids":[600],"mongooses":[595,599],"monilielliomycetes":[963],"monitors":[314],"monitos del monte":[561],"monk seals":[610],"monkey cup pitcher plants":[865],"monkeys":[594],"monkfishes":[295],"monocots":[816],"monodontidae":[681],"monoplacophora":[52],"monotremata":[557],"moon jellies":[43],"moon snails":[70],"mooneyes":[230],"moose":[659],"moraceae":[905],"morchellaceae":[979],"morels":[930,933,968,979],"morning glory":[878],"mortierellomycota":[925],"moschidae":[661],"mosquitoes":[135],"moss bugs":[110],"mosses":[761],"motacillidae":[539],"moths":[134],"motmots":[377],"mottled berryhunter":[439],"mountain lichens":[989],"mouse spiders":[170],"mouse-deer":[655],"mousebirds":[368,369,372,373],"mucoromyceta":[926],"mucoromycota":[927],"mudbug":[89],"mudfishes":[250],"mudskippers":[277],"mugiliformes":[284],"mulberries":[846],"mulberry":[905],"mullets":[284],"multicrustacea":[83],"muntjac":[659],"murexes":[70],"muriquis":[708],"muscicapida":[501],"muscicapidae":[511],"muscicapoidea":[508],"musk deer":[661],"musk grasses":[756],"musophagiformes":[344],"mussels":[75],"mustard":[859],"mustelidae":[617],"mustelids":[605,607],"musteloidea":[613],"myctophiformes":[259],"mygalomorphae":[170],"myiobiuses":[407],"myliobatiformes":[222],"mynas":[515],"myopsida":[63],"myriapoda":[96],"myricaceae":[888],"myrrh":[861],"myrtaceae":[898],"myrtales":[855],"myrtle":[855],"mysticeti":[665],"myxini":[194],"nandiniidae":[596],"narwhals":[679,681],"nasalis":[726],"nautilida":[54],"nautilus":[53],"nectariniidae":[528],"needlefishes":[285],"neem":[861],"nematoda":[27],"neoaves":[335],"neocallimastigomycota":[916],"neofelis":[619],"neognathae":[331],"neolectomycetes":[1002],"neoptera":[108],"neopterygii":[225],"neosittidae":[426],"neoteleostei":[256],"neritimorpha":[69],"nesospingidae":[555],"nettles":[846],"neuroptera":[126],"newts":[297,299],"nicatoridae":[474],"nicators":[474],"night monkeys":[690,714],"nightjars":[351,352],"nightshades":[878],"nori":[779],"notacanthiformes":[235],"nothofagaceae":[886],"notiomystidae":[461],"notoptera":[122],"notoryctidae":[563],"notothens":[290],"nudibranchs":[25,66,72],"nudipleura":[72],"numbats":[562,565],"nunbirds":[378],"nurse sharks":[209],"nursery web spiders":[181],"nurseryfishes":[277],"nut clams":[78],"nutcrackers":[453],"nuthatches":[519],"nutmeg":[810,814],"nyctereutes":[646],"nyctibiiformes":[353],"nymphaeales":[807],"oaks":[847,887],"oarfish":[261],"ocean sunfish":[296],"oceanic basslets":[293],"oceanic dolphins":[679],"ocelot":[624],"ocelots":[604],"octocorallia":[39],"octopoda":[57],"octopodiformes":[55],"octopus":[53,57],"octopuses":[25],"odobenidae":[612],"odonata":[107],"odontoceti":[669],"oegopsida":[65],"ogonori":[780],"oilbirds":[354],"okra":[858],"oleander":[881],"olingos":[616],"olive colobus":[719],"olive colobus monkeys":[716,720],"olive warbler":[531],"olives":[879],"olivillo":[863],"onagraceae":[899],"oncillas":[624],"onions":[816],"onychorhynchidae":[407],"opah":[261],"ophidiiformes":[272],"opiliones":[162],"opisthocomiformes":[348],"opossums":[558,560],"oraches":[865],"orange bladder":[974],"orangutans":[694,695],"orb-weaver spiders":[175],"orbiliomycetes":[966],"orcas":[680],"orchids":[816],"orectolobiformes":[209],"oregano":[879],"oreoicidae":[431],"oriental motherwort":[879],"orioles":[434],"oriolidae":[434],"orioloidea":[427],"oropendolas":[550],"orthonychidae":[420],"orthonychides":[419],"orthoptera":[113],"osmeriformes":[255],"ospreys":[371],"ostariophysi":[240],"osteichthyes":[200],"osteoglossiformes":[231],"osteoglossomorpha":[229],"ostriches":[325,326],"otariidae":[611],"otidiformes":[345],"otidimorphae":[343],"otocephala":[237],"otocolobus":[629],"otocyon":[645],"otter shrews":[571,578],"otters":[617],"ovalentariae":[282],"ovenbirds":[393,400],"owl monkeys":[714],"owlet-nightjars":[356],"owls":[368,369,370],"oxalidales":[849],"oxpeckers":[513],"oxyruncidae":[406],"oyans":[598],"oysterplant":[882],"oysters":[75,79],"pachycephalidae":[435],"paddlefish":[224],"paenungulata":[572],"painted berrypickers":[432],"painted snipes":[350],"palaeognathae":[325],"palaeoheterodonta":[77],"palmchat":[503],"palmilla":[825],"palms":[829],"palp-footed spiders":[173],"palpimanoidea":[173],"pan":[697],"pancrustacea":[82],"panda bears":[608],"pandan":[825],"pandanales":[825],"pangolins":[579,580,583,584],"panpulmonata":[74],"panthera":[620],"pantherinae":[618],"panuridae":[475],"papaya":[859],"paper wasps":[153],"paperbarks":[898],"papio":[741],"papionini":[736],"paracanthopterygii":[262],"paracryphiales":[876],"paradisaeidae":[450],"paradoxornithidae":[495],"parahoxozoa":[17],"parakeets":[382],"paramythiidae":[432],"parasitic lice":[109],"parasitiformes":[165],"parasitoida":[139],"pardalotes":[418],"pardalotidae":[418],"pardofelis":[625],"paridae":[472],"paroidea":[468],"parrotbills":[495],"parrotfishes":[292],"parrots":[368,379,382],"parsley":[874],"parsnips":[874],"partridges":[333],"parulidae":[549],"passerellidae":[548],"passeri":[408],"passerida":[524],"passeridae":[538],"passerides":[456],"passeriformes":[383],"passerines":[335,368,379,383],"passionfruit":[850],"patas monkeys":[734],"patellogastropoda":[67],"paucituberculata":[559],"peaches":[846,908],"peacocks":[333],"pearlfishes":[272],"pears":[846,908],"pecan":[847,889],"pecora":[656],"pedinophyceae":[784],"pelecaniformes":[367],"pelicans":[347,361,367],"pellorneidae":[500],"pen shells":[79],"penaeaceae":[900],"pencil squids":[63],"penduline tits":[471],"penguins":[347,361,364],"penicillium":[930,933],"peonies":[841],"pepper elder":[811],"peramelemorphia":[564],"perches":[290],"perciformes":[290],"percomorpha":[271],"percopsiformes":[263],"perilla":[879],"perissodactyla":[587],"periwinkles":[66,70,881],"persimmon":[868],"petrels":[363],"petroicida":[459],"petroicidae":[460],"petromyzontida":[195],"petrosaviales":[823],"petunias":[878],"peucedramidae":[531],"pezizaceae":[980],"pezizales":[969],"pezizomycetes":[968],"pezizomycotina":[965],"phaenicophilidae":[554],"phaethontiformes":[359],"phalaropes":[350],"phallales":[944],"phallomycetidae":[940],"phasmatodea":[114],"pheasants":[332,333],"philepittidae":[387],"philodromid crab spiders":[186],"philodromidae":[186],"phlox":[868],"phocidae":[610],"phocoenidae":[682],"phoenicopteriformes":[337],"pholidota":[584],"phylloscopidae":[487],"physeteridae":[671],"picathartidae":[464],"picea":[793],"piciformes":[378],"picramniales":[857],"pig ear":[982],"pig-tailed langur":[727],"pigeons":[335,339,340],"pigfaces":[865],"pigs":[586,588,651],"pikas":[591],"pike":[251],"piliocolobus":[718],"pill bug/slater/roly-poly":[86],"pilosa":[570],"pilot whales":[680],"pinaceae":[790],"pinales":[789],"pine":[791],"pineapples":[830],"pinecone fishes":[270],"pinnipedia":[609],"pinnipeds":[605,607],"pinophyta":[771],"pinopsida":[788],"pinus":[791],"pipefishes":[276],"piperales":[811],"pipipis":[425],"pipits":[539],"pipridae":[402],"piranhas":[243],"pirate spiders":[175],"pitheciidae":[700],"pitheciinae":[702],"pittas":[391],"pittidae":[391],"pittosporums":[874],"pityriaseidae":[442],"placentalia":[567],"placozoa":[18],"planetree":[834],"plant hoppers":[110],"plantae":[14],"plantain-eaters":[344],"plantains":[831],"plants":[14],"platanistidae":[672],"platygastroidea":[144],"platyhelminthes":[23],"platylophidae":[455],"platypus":[557],"platyrrhini":[690],"platysteiridae":[443],"plecoptera":[116],"plectreurid spiders":[172],"pleurodonta":[316],"ploceidae":[534],"ploceoidea":[533],"ploughbill":[429],"plovers":[350],"plums":[846,908],"pneumocystidomycetes":[1003],"pnoepygidae":[485],"poales":[830],"podargiformes":[355],"podicipediformes":[338],"poinsettia":[850],"poison hemlock":[874],"polar bear":[608],"polecats":[617],"polioptilidae":[522],"polymixiiformes":[267],"polyneoptera":[112],"polyplacophora":[48],"polypodiophyta":[765],"polyporales":[948],"polypteriformes":[223],"pomatostomidae":[421],"pomegranate":[855],"pomegranates":[896],"pomfrets":[275],"pompiloidea":[154],"pond snails":[74],"pongo":[695],"pontoporiidae":[678],"ponyfishes":[294],"poor-me-ones":[353],"poplars":[850],"poppies":[833],"porcupinefishes":[296],"porcupines":[592],"porgies":[294],"porifera":[16],"porphyridiophyceae":[775],"porpoises":[662,664,679,682],"portulacas":[865],"possums":[558,562,566],"pot marigold":[871],"potatoes":[878],"potoos":[353],"potter wasps":[153],"pottos":[686],"pouterias":[868],"powdery mildews":[965],"prairie dogs":[592],"prasinodermophyta":[753],"pratincoles":[350],"prawn gobies":[277],"prawns":[89],"presbytini":[720],"presbytis":[722],"prettymouths":[954],"pricklefishes":[269],"prickly sharks":[215],"primates":[579,589,594],"primroses":[868,899],"prionailurus":[630],"prionodontidae":[603],"pristiformes":[221],"pristiophoriformes":[217],"proboscidea":[575],"proboscis monkeys":[726],"procellariiformes":[363],"procolobus":[719],"proctotrupoidea":[147],"proctotrupomorpha":[142],"procyonidae":[616],"promeropidae":[526],"pronghorns":[657],"protacanthopterygii":[248],"proteales":[834],"protobranchia":[78],"protostomia":[21],"prunellidae":[537],"pseudoscorpiones":[166],"pseudoscorpions":[102],"psittaciformes":[382],"psocodea":[109],"psophodidae":[428],"psyllium":[879],"pteriomorphia":[79],"pterocliformes":[342],"pterygota":[105],"ptiliogonatidae":[505],"ptilonorhynchidae":[412],"pucciniomycotina":[964],"puffbacks":[440],"puffballs":[930,931],"puffbirds":[378],"pufferfishes":[296],"puffins":[347,350],"pumpkins":[848],"pupfishes":[286],"purple viper's bugloss/Salvation Jane":[882],"pycnogonida":[100],"pycnonotidae":[494],"pygathrix":[724],"pygmy right whales":[667],"pygmy squids":[62],"pyrenomycetes":[965],"pyronemataceae":[984],"pōhutukawa":[855],"pōhutukawas":[898],"quail":[333],"quail-thrushes":[423],"quails":[349],"quetzals":[375],"quinoa":[865],"quolls":[565],"rabbitfishes":[294],"rabbits":[591],"raccoons":[585,605,607,616],"racoon dogs":[646],"radiolarians":[10,11],"radish":[859],"ragfishes":[275],"ragworms":[24],"rail-babbler":[466],"rails":[349],"rain spiders":[180],"rainbowfishes":[287],"rajiformes":[220],"ram's horn squid":[59],"rambutans":[861],"ramshorn snails":[74],"ranunculales":[833],"rapeseed":[859],"raphidioptera":[129],"raposa":[641],"raptors":[368,369,371],"raspberries":[846],"rats":[592],"ravens":[383,453],"ray spiders":[175],"rays":[198,218],"recluse spiders":[172],"red alga":[751],"red colobus":[691],"red colobus monkeys":[716,718,720],"red deer":[659],"red mites":[165],"red panda":[615],"redback spiders":[175],"redcurrants":[841],"redwood / sequoia":[799],"reedfish":[223],"reeds":[830],"reef squids":[63],"regulidae":[516],"reindeer":[659],"reindeer lichens":[989],"remizidae":[471],"reptiles":[305],"rhagologidae":[439],"rhamnaceae":[906],"rhatany":[852],"rheas":[325,328],"rheiformes":[328],"rhinoceroses":[579,580,583,586,587],"rhinocryptidae":[398],"rhinopithecus":[725],"rhipidistia":[203],"rhipiduridae":[446],"rhizaria":[11],"rhizinaceae":[976],"rhodellophyceae":[778],"rhodinocichlidae":[542],"rhododendrons":[868],"rhodophyta":[751],"rhubarb":[865],"rhynchocephalia":[308],"ribbon worms":[23],"ribbonfish":[261],"rice":[816],"ricefish":[285],"ricinulei":[163],"right whales":[666,668],"ringtails":[616],"rivulines":[286],"roadrunners":[346],"rock lizards":[312],"rock-jumpers":[465],"rockfowl":[464],"rodentia":[592],"rodents":[579,589],"roe deer":[659],"rollers":[377],"rooks":[453],"rosaceae":[907],"rosales":[846],"rosemary":[879],"roses":[846],"rosids":[842],"rosoideae":[909],"rough sharks":[214],"roundworms":[26,27],"royal flycatchers":[407],"rozellomycota":[913],"rta clade":[178],"ruminantia":[654],"rungwecebus":[740],"running crab spiders":[186],"rushes":[830],"russulales":[951],"rust mites":[161],"rusts":[930,931],"rusty-spotted cats":[630],"sac spiders":[183],"saccharomycotina":[998],"sacred lotus":[834],"sage":[879],"saimirinae":[712],"sakis":[690,700,702],"salamanderfish":[247],"salamanders":[297,299],"salmon":[252],"salmoniformes":[252],"salp":[191],"salpornithidae":[521],"saltbushes":[865],"salticidae":[187],"sand dollars":[30],"sand spiders":[172],"sand-divers":[277],"sandalwoods":[864],"sandgrouse":[339,342],"sandhoppers":[87],"sandlances":[292],"sandperches":[292],"sandpipers":[350],"santalales":[864],"sapayoa":[390],"sapayoidae":[390],"sapindales":[861],"sapodilla":[868],"sapote":[868],"sar":[10],"sarcopterygii":[202],"sarcoscyphaceae":[970],"sarcosomataceae":[975],"sardines":[238],"satinbirds":[458],"sauria":[306],"sauropsida":[303],"savory":[879],"sawfish":[198],"sawflies":[133,137],"sawsharks":[217],"saxifragales":[841],"saxifrages":[841],"scallops":[75,79],"scaly anteaters":[584],"scandentia":[590],"scaphopoda":[80],"scarabs":[136],"scarlet elf cup":[970],"scats":[294],"schizosaccharomycetes":[1000],"scimitar bablers":[498],"scincomorpha":[311],"scleractinia":[37],"scleralcyonacea":[41],"scoliid wasps":[157],"scolioidea":[157],"scombriformes":[275],"scorpiones":[167],"scorpionfish":[290],"scorpionflies":[131],"scorpions":[102,167],"scotocercidae":[492],"screamers":[334],"scrubbirds":[410],"scud":[87],"sculpins":[290],"scyphozoa":[43],"sea anemones":[19,34],"sea anenomes":[33],"sea angels":[73],"sea butterflies":[73],"sea chubs":[291],"sea cows":[571,572,574],"sea cradles":[48],"sea cucumbers":[30],"sea fans":[39,40],"sea grapes":[787],"sea hares":[73],"sea lettuces":[787],"sea lillies":[30],"sea lions":[611],"sea pens":[39,41],"sea slugs":[25],"sea spiders":[99,100],"sea sponges":[16],"sea squirts":[31,191],"sea stars":[30],"sea toads":[295],"sea urchins":[30],"seabasses":[290],"seadragon":[276],"seagrass":[821],"seahorses":[276],"seamoths":[276],"searobins":[290],"sebacinales":[938],"secretarybirds":[371],"sedges":[830],"seedsnipes":[350],"sei whales":[668],"selachii":[206],"semnopithecus":[723],"sengis":[577],"sepiida":[60],"sepiolida":[61],"sequoioideae":[799],"seriemas":[380],"serpentes":[318],"servals":[622],"sesame":[879],"shags":[366],"sharks":[198,206],"sharpbill":[406],"she-oaks":[847,892],"shea":[868],"shearwaters":[363],"sheathbills":[350],"sheep":[586,588,654,660],"sheet weavers":[175],"sheild lichens":[989],"shield bugs":[110],"shoebills":[367],"short-eared dogs":[643],"shotgun fungus":[941],"shrew opossums":[559],"shrew-like moles":[581],"shrikes":[383,454],"shriketits":[430],"shrimp":[84,89],"side-striped jackal":[637],"silktassels":[883],"silky-flycatchers":[505],"siluriformes":[245],"silverfish":[104],"silversides":[287],"simias":[727],"simiiformes":[689],"siphonaptera":[132],"sirenia":[574],"sittellas":[426],"sittidae":[519],"skates":[198,220],"skimmers":[107,350],"skinks":[311],"skuas":[350],"skunk pigs":[652],"skunks":[585,614],"skunkweeds":[756],"sleeper sharks":[214],"sleepers":[277],"slickheads":[239],"slime eels":[194],"slimeheads":[270],"sloths":[568,570],"slow worms":[314],"slugs":[66],"smelt":[255],"smuts":[931],"snails":[25,66],"snakeflies":[129],"snakeheads":[280],"snakes":[307,309,318],"snapdragons":[879],"snappers":[294],"snow buntings":[543],"snow leopards":[620],"snowbank orange peel fungus":[978],"snub-nosed monkeys":[725],"soft corals":[39,40,41],"solanales":[878],"soldierfish":[269],"solenodons":[581],"solenogastres":[50],"solifugae":[164],"solifuges":[164],"sordariomyceta":[994],"sordariomycetes":[997],"sorrel":[865],"soursop fruit":[814],"southern beeches":[847,886],"sowbug-eating spiders":[172],"spadefishes":[294],"sparassidae":[180],"sparrows":[383,538],"spectacled bears":[608],"speothos":[639],"spermatophyta":[767],"sphecoid wasps":[159],"sphenisciformes":[364],"spider flowers":[834],"spider ivy":[827],"spider monkeys":[690,703,706,707],"spiders":[102],"spiderwort":[832],"spikefishes":[296],"spinach":[865],"spindalidae":[556],"spindalises":[556],"spiralia":[22],"spireas":[908],"spirulida":[59],"spoonbills":[367],"spotted creepers":[521],"spruce":[793],"squaliformes":[214],"squalomorphi":[212],"squamata":[309],"squash":[848],"squatiniformes":[216],"squid":[53],"squids":[25],"squirrel monkeys":[690,710,712],"squirrelfish":[269],"squirrels":[592],"staff-vine":[851],"stag's horn":[997],"stalked jellyfishes":[44],"star anise":[808],"starfish":[30],"starfruit":[849],"stargazers":[292],"starlings":[515],"staurozoa":[44],"steatornithiformes":[354],"steeplebushes":[908],"stegodonts":[575],"stenostiridae":[469],"stephanoidea":[149],"stick instects":[114],"sticklebacks":[290],"stilts":[350],"stingless bees":[160],"stingrays":[222],"stink badgers":[614],"stink bugs":[110],"stinkbird":[348],"stinkhorns":[931,944],"stitchbird":[461],"stomatopoda":[85],"stomiati":[253],"stomiiformes":[254],"stoneflies":[116],"stoneworts":[756],"stony corals":[37],"stork's-bills":[854],"storks":[347,361,365],"stramenopile":[13],"strawberries":[846],"streaked scrub warbler":[492],"strepsiptera":[127],"strepsirrhini":[683],"streptophyta":[755],"strigiformes":[370],"strisores":[351],"struthioniformes":[326],"sturgeon":[224],"sturnidae":[515],"stylephoriformes":[265],"stylonematophyceae":[777],"sugarbirds":[526],"sugarbushes":[834],"sugarcane":[816],"suidae":[651],"suina":[650],"suliformes":[366],"sun spiders":[164],"sun-tailed monkeys":[735],"sunbirds":[528],"sunbittern":[358,360],"sundews":[865],"sunflowers":[818,871],"superasterids":[862],"superrosids":[840],"surfgrass":[821],"surfperches":[288],"surgeonfishes":[294],"surilis":[722],"swallowers":[275],"swallows":[484],"swamp eels":[279],"swans":[332,334],"sweet flags":[820],"sweet potato":[878],"sweetgums":[841],"swifts":[335,347,351,357],"sylviid babblers":[496],"sylviida":[473],"sylviidae":[496],"sylvioidea":[493],"symphyta":[137],"synapsida":[302],"synbranchiformes":[279],"syngnathiformes":[276],"syngnathomorpharia":[274],"synspermiata":[172],"tailless whip-scorpions":[188],"talapoins":[729,732],"tamarins":[690,713],"tamarisks":[865],"tanagers":[547],"tangle-web spiders":[175],"tapaculos":[398],"tapeworms":[23],"taphrinomycetes":[1001],"taphrinomycotina":[999],"tapirs":[583,586,587],"tarantulas":[170],"tardigrades":[26],"taros":[821],"tarpons":[233],"tarsiers":[688],"tarsiidae":[688],"tautara":[307],"taxaceae":[803],"taxus":[804],"tayassuidae":[652],"tchagras":[440],"tea-trees":[898],"teak":[879],"teleostei":[228],"telluraves":[368],"temperate basses":[294],"temperate perch":[291],"tenpounders":[233],"tenrecs":[571,578],"terfeziaceae":[985],"termites":[120,121],"termitoidae":[121],"terns":[350],"terrapins":[320],"terror birds":[380],"testudines":[320],"tetraodontiformes":[296],"tetrapoda":[205],"tetrapulmonata":[168],"tetras":[243],"thamnophilidae":[396],"the majority of lichens":[930],"thecostraca":[90],"thelephorales":[947],"theropithecus":[742],"thimble morels":[979],"thorny devil":[317],"thrashers":[514],"thraupidae":[547],"thresher sharks":[210],"thrips":[111],"thrush-tanager":[542],"thrushes":[512],"thyme":[879],"thynnid wasps":[155],"thynnoidea":[155],"thysanoptera":[111],"tichodromidae":[518],"ticks":[102,165],"ticodendraceae":[890],"tiger sharks":[211],"tigers":[604,620],"timaliidae":[498],"tinamiformes":[327],"tinamous":[325,327],"tiphioidea":[156],"tit-babblers":[498],"titanoecidae":[177],"titis":[690,700,701],"tits":[472],"tityras":[404],"tityridae":[404],"toadfishes":[273],"tobacco":[878],"todies":[377],"tomatoes":[878],"tongue eating louse":[86],"tooth fungi":[947],"toquilla palm":[825],"torpediniformes":[219],"torrentfish":[292],"tortoises":[320],"totipalmate":[366],"toucans":[368,369,372,378],"toxicofera":[313],"tracheophyta":[762],"trachichthyiformes":[270],"trachypithecus":[721],"tragulidae":[655],"trapdoor spiders":[170],"trebouxiophyceae":[785],"trebouxiophytes":[785],"tree corals":[40],"tree shrews":[590],"tree-kangaroos":[566],"treecreepers":[383,520],"treepies":[453],"treeshrews":[589],"treeswifts":[357],"tremellomycetes":[935],"triangular spiders":[175],"trichoptera":[130],"triggerfishes":[296],"trigonaloidea":[150],"triplespines":[296],"trochodendrales":[835],"troglodytidae":[523],"trogoniformes":[375],"trogons":[372,375],"tropicbirds":[335,347,358,359],"trout":[252],"trout-perches":[263],"true deer":[659],"true eels":[236],"true flies":[135],"true foxes":[647],"true limpets":[67],"true magpies":[453],"true shrews":[579,580,581],"true yeasts":[998],"truffles":[930,933,965,968],"trumpet pitchers":[868],"trumpeters":[349],"trumpetfishes":[276],"tsuga":[796],"tuatara":[308],"tube-dwelling spiders":[172],"tuberaceae":[971],"tubeshoulders":[239],"tubulidentata":[576],"tulip":[826],"tulip tree":[810],"tulip trees":[814],"tulips":[816],"tunas":[275],"tunicata":[191],"turacos":[343,344],"turdidae":[512],"turkeys":[333],"turmeric":[831],"turnip":[859],"turrids":[70],"turtles":[305,320],"turtleweed":[859],"tusk shells":[80],"typical warblers":[496],"tyranni":[385],"tyrannida":[401],"tyrannidae":[405],"tyrannides":[392],"tyrant flycatchers":[405],"uakaris":[690,700,702],"ulmaceae":[911],"ulvophyceae":[787],"upside-down jellyfish":[43],"urocynchramidae":[532],"urocyon":[648],"urodela":[299],"uropygi":[189],"ursidae":[608],"urticaceae":[912],"ustilaginomycetes":[961],"ustilaginomycotina":[959],"vahliales":[880],"valerian":[875],"vampire squids":[56],"vampyromorphida":[56],"vangas":[436,444],"vangidae":[444],"velvet spiders":[176],"velvet tree":[855],"vertebrata":[192],"vertibrates":[31],"vervet monkeys":[728,729,733],"vespoidea":[153],"vetigastropoda":[68],"vibrating spiders":[172],"viburnum":[875],"vicuñas":[649],"viduidae":[536],"vinegaroons":[102,189],"violet coral mushrooms":[953],"violets":[850],"violin spiders":[172],"viper's bugloss":[882],"vireonidae":[433],"vireos":[433],"viridiplantae":[752],"vitales":[843],"viverridae":[598],"viverrids":[595,598],"viverroidea":[597],"vochysiaceae":[901],"vulpes":[647],"vulpini":[644],"vultures":[371],"wagtails":[539],"wall lizards":[312],"wallabies":[558,566],"wallcreeper":[518],"walnut":[847,889],"walruses":[612],"wandering spiders":[181],"wapiti":[659],"warblers":[383],"warthogs":[651],"wasps":[133,138],"water caltrop":[855],"water hyacinth":[832],"water lilies":[807],"water milfoil":[841],"water net":[786],"water silks":[756],"waterbirds":[335],"watermelons":[848],"wattle-eyes":[443],"waxwings":[504],"weasels":[617],"weavers":[534],"webspinners":[115],"weevils":[136],"wentletraps":[70],"whale sharks":[198,209],"whalefishes":[269],"whales":[579,580,583,586,588,662,664],"wheel trees":[835],"whelks":[66],"whip scorpions":[189],"whip spiders":[102],"whip-spiders":[188],"whipbirds":[428],"whippomorpha":[662],"whisk ferns":[765],"whistlers":[435],"white bait":[250],"white mangrove":[855],"white truffles":[971],"white-eyelid mangabeys":[738],"white-eyes":[497],"white-tailed deer":[659],"whiteheads":[425],"whydahs":[536],"widow spiders":[175],"wild cashew tree":[839],"wild dagga":[879],"wild ginger":[811],"willowherbs":[855,899],"willows":[850],"wind scorpions":[164],"winter chanterelles":[937],"wireworms":[135],"witch-hazel":[841],"witches broom":[1001],"wolf lichens":[989],"wolf spiders":[181],"wolverines":[617],"wolves":[606,634],"wombats":[558,562,566],"wood spiders":[180],"wood warblers":[549],"woodcreepers":[393],"woodlouse hunters":[172],"woodpeckers":[368,369,372,378],"woodswallows":[436,438],"woolly monkeys":[690,703,706,709],"woolly spider monkeys":[690,703,706,708],"worm lizards":[312],"wrasses":[292],"wreckfishes":[293],"wren warblers":[485],"wrens":[383,523],"wrenthrush":[553],"xenarthra":[568],"xiphosura":[101],"yabbies":[89],"yams":[824],"yarrow":[871],"yellow flycatchers":[490],"yellow-breasted chat":[551],"yellowheads":[425],"yellowjackets":[153],"yew":[804],"ylang-ylang":[814],"zebra giraffes":[658],"zebras":[579,580,583,586,587],"zeiformes":[264],"zeledoniidae":[553],"zelkovas":[911],"zingiberales":[831],"zinnias":[871],"ziphiidae":[673],"zoantharia":[38],"zoanthids":[38],"zodariidae":[179],"zombie-ant fungus":[997],"zoopagomyceta":[921],"zoopagomycota":[922],"zoraptera":[118],"zosteropidae":[497],"zygentoma":[104],"zygophyllales":[852],"† American lions":[620],"† cave lions":[620]}})